@@ -8,8 +8,128 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "l.pereztato@gmail.com ana.Ortega.Ort@gmail.com"
 
+import re
+import numpy
+from scipy import optimize
 from import_export import NeutralLoadDescription as nld
 from postprocess.reports import graphical_reports
+from miscUtils import LogMessages as lmsg
+
+combTokenRegex= re.compile(r'\s*(?:(?P<number>(?:[0-9]+\.?[0-9]*|\.[0-9]+)(?:[eE][+-]?[0-9]+)?)|(?P<name>[A-Za-z_][\w.]*)|(?P<op>[-+*/()]))')
+
+def tokenizeCombination(expr):
+  '''Return the list of (kind, value) tokens of a combination expression.
+     Raise ValueError if some part of the expression can't be read.
+
+  :param expr: combination expression (i.e. '1.35*(G+Q)').
+  '''
+  retval= list()
+  pos= 0
+  expr= expr.rstrip()
+  while(pos<len(expr)):
+    m= combTokenRegex.match(expr,pos)
+    if(not m):
+      raise ValueError('Unexpected character in combination: \''+expr+'\' at position '+str(pos)+'.')
+    kind= m.lastgroup
+    retval.append((kind,m.group(kind)))
+    pos= m.end()
+  return retval
+
+class CombinationParser(object):
+  '''Parser of the combination expressions. Each (sub)expression
+  is represented by a (constant, factors) pair where factors is a
+  dictionary with the factor of each load case, so products and
+  quotients by numbers can appear anywhere (i.e. '1.35*(G+Q)',
+  '1.5*Q*0.6' or 'G/2').
+
+  :ivar expr: expression to parse.
+  :ivar tokens: tokens of the expression.
+  :ivar pos: index of the next token.
+  '''
+  def __init__(self, expr):
+    self.expr= expr
+    self.tokens= tokenizeCombination(expr)
+    self.pos= 0
+  def error(self, msg):
+    raise ValueError(msg+' in combination: \''+self.expr+'\'.')
+  def peek(self):
+    '''Return the next token without consuming it.'''
+    if(self.pos<len(self.tokens)):
+      return self.tokens[self.pos]
+    return (None, None)
+  def next(self):
+    '''Consume and return the next token.'''
+    retval= self.peek()
+    self.pos+= 1
+    return retval
+  def parse(self):
+    '''Return the dictionary with the factor of each load case.'''
+    if(not self.tokens):
+      self.error('Empty expression')
+    const, factors= self.parseSum()
+    if(self.pos<len(self.tokens)):
+      self.error('Unexpected \''+self.peek()[1]+'\'')
+    if(const!=0.0):
+      self.error('Term without load case')
+    return factors
+  def parseSum(self):
+    const, factors= self.parseProduct()
+    while(self.peek() in [('op','+'),('op','-')]):
+      sign= 1.0 if self.next()[1]=='+' else -1.0
+      c, f= self.parseProduct()
+      const+= sign*c
+      for lc in f:
+        factors[lc]= factors.get(lc,0.0)+sign*f[lc]
+    return const, factors
+  def parseProduct(self):
+    const, factors= self.parseUnary()
+    while(self.peek() in [('op','*'),('op','/')]):
+      op= self.next()[1]
+      c, f= self.parseUnary()
+      if(op=='/'):
+        if(f):
+          self.error('Division by a load case')
+        if(c==0.0):
+          self.error('Division by zero')
+        c= 1.0/c
+      elif(factors and f):
+        self.error('Product of load cases')
+      elif(not factors): # number times expression.
+        const, factors, c, f= c, f, const, factors
+      const*= c
+      factors= dict((lc,factors[lc]*c) for lc in factors)
+    return const, factors
+  def parseUnary(self):
+    if(self.peek() in [('op','+'),('op','-')]):
+      sign= 1.0 if self.next()[1]=='+' else -1.0
+      const, factors= self.parseUnary()
+      return sign*const, dict((lc,sign*factors[lc]) for lc in factors)
+    return self.parsePrimary()
+  def parsePrimary(self):
+    kind, value= self.next()
+    if(kind=='number'):
+      return float(value), dict()
+    elif(kind=='name'):
+      return 0.0, {value:1.0}
+    elif((kind, value)==('op','(')):
+      retval= self.parseSum()
+      if(self.next()!=('op',')')):
+        self.error('Missing \')\'')
+      return retval
+    elif(kind is None):
+      self.error('Unexpected end of expression')
+    else:
+      self.error('Unexpected \''+value+'\'')
+
+def getCombinationFactors(expr):
+  '''Return a dictionary with the factor of each load case in the
+     combination expression (i.e. {'G':1.35, 'Q':1.35} for '1.35*(G+Q)').
+     Raise ValueError if the expression can't be parsed or if it's not
+     a linear combination of load cases.
+
+  :param expr: combination expression.
+  '''
+  return CombinationParser(expr).parse()
 
 
 class CombinationRecord(object):
@@ -20,6 +140,10 @@ class CombinationRecord(object):
   def createCombination(self,xcCombHandler):
     '''Create combination and insert it into the XC combination handler.'''
     xcCombHandler.newLoadCombination(self.name,self.expr)
+  def getFactors(self):
+    '''Return a dictionary with the factor of each load case
+       in the combination (i.e. {'G':1.35, 'Q':1.5}).'''
+    return getCombinationFactors(self.expr)
   def getRecordLoadCaseDisp(self,setsToDispLoads,setsToDispDspRot,setsToDispIntForc, unitsScaleForc= 1e-3, unitsScaleMom= 1e-3, unitsScaleDisp= 1e3, unitsDispl= '[mm]'):
     '''Return a suitable RecordLoadCaseDisp for the combination.
 
@@ -45,6 +169,22 @@ class CombinationRecord(object):
     return retval
     
 
+def isConvexCombination(v, vectors, tol= 1e-9):
+  '''Return true if v is a convex combination of the rows of vectors.
+
+  :param v: vector to check.
+  :param vectors: matrix whose rows are the candidate vectors.
+  :param tol: tolerance.
+  '''
+  for w in vectors:
+    if(numpy.abs(w-v).max()<=tol): # same factors.
+      return True
+  n= len(vectors)
+  A= numpy.vstack([numpy.transpose(vectors),numpy.ones((1,n))])
+  b= numpy.append(v,1.0)
+  res= optimize.linprog(numpy.zeros(n),A_eq= A,b_eq= b,bounds= (0.0,None))
+  return res.status==0 and numpy.abs(numpy.dot(A,res.x)-b).max()<=max(tol,1e-7)
+
 class SituationCombs(dict):
   '''Combinations for a situation (frequent, rare, persistent,...).'''
   def __init__(self, desc):
@@ -65,6 +205,93 @@ class SituationCombs(dict):
     '''Introduces the combinations into the XC combination handler.'''
     for key in self:
       self[key].createCombination(xcCombHandler)
+  def getFactorMatrix(self, loadCaseNames= None):
+    '''Return the combination names, the load case names and a matrix
+       with a row for each combination and a column for each load case
+       containing the corresponding factors.
+
+    :param loadCaseNames: load case names (if None, all the load cases
+                          that appear in the combinations). A ValueError
+                          is raised if some combination contains a load
+                          case that is not in the list.
+    '''
+    combNames= sorted(self.keys())
+    factors= [self[name].getFactors() for name in combNames]
+    usedLoadCases= set().union(*[f.keys() for f in factors])
+    if(loadCaseNames is None):
+      loadCaseNames= sorted(usedLoadCases)
+    else:
+      missing= usedLoadCases.difference(loadCaseNames)
+      if(missing):
+        raise ValueError('Load cases: '+str(sorted(missing))+' appear in the combinations of: \''+self.description+'\' but not in the load case list.')
+    retval= numpy.zeros((len(combNames),len(loadCaseNames)))
+    for i, f in enumerate(factors):
+      for j, lc in enumerate(loadCaseNames):
+        retval[i,j]= f.get(lc,0.0)
+    return combNames, loadCaseNames, retval
+  def getDominatedCombinations(self, tol= 1e-9):
+    '''Return the names of the combinations that cannot govern any
+       result in a linear analysis because their factors are a convex
+       combination of the factors of the other ones (i.e. 1.35*G+0.75*Q
+       when 1.35*G and 1.35*G+1.5*Q are also in the container).
+
+    :param tol: tolerance for the factor comparison.
+    '''
+    combNames, loadCaseNames, F= self.getFactorMatrix()
+    retained= list(range(len(combNames)))
+    retval= list()
+    for i in range(len(combNames)):
+      others= [k for k in retained if k!=i]
+      if(others and isConvexCombination(F[i],F[others],tol)):
+        retained.remove(i)
+        retval.append(combNames[i])
+    return retval
+  def getNonGoverningCombinations(self, loadCaseNames, results, tol= 0.0):
+    '''Return the names of the combinations that don't give the maximum
+       nor the minimum of any of the results obtained by linear
+       superposition of the results of the elementary load cases.
+
+    :param loadCaseNames: names of the elementary load cases (all the
+                          load cases of the combinations must be
+                          in the list).
+    :param results: matrix with a row for each load case (in the same
+                    order of loadCaseNames) and a column for each result
+                    component (internal forces, displacements,...).
+    :param tol: combinations whose results are within tol of the
+                extreme value are also considered governing.
+    '''
+    combNames, loadCaseNames, F= self.getFactorMatrix(loadCaseNames)
+    if(len(combNames)==0):
+      return list()
+    results= numpy.asarray(results,dtype=float)
+    if(results.shape[0]!=len(loadCaseNames)):
+      raise ValueError('The results matrix has '+str(results.shape[0])+' rows but there are '+str(len(loadCaseNames))+' load cases.')
+    R= numpy.dot(F,results)
+    governing= (R>=R.max(axis= 0)-tol) | (R<=R.min(axis= 0)+tol)
+    return [name for name, g in zip(combNames,governing.any(axis= 1)) if not g]
+  def remove(self, combNames):
+    '''Remove the combinations whose names are passed as parameter.'''
+    for name in combNames:
+      del self[name]
+  def pruneDominatedCombinations(self, loadCaseNames= None, results= None, tol= 1e-9):
+    '''Remove the combinations that cannot govern and return their names.
+       If the results of the elementary load cases are given the
+       combinations that don't govern any of them are also removed.
+
+    :param loadCaseNames: names of the elementary load cases.
+    :param results: matrix with the results of the elementary load cases
+                    (see getNonGoverningCombinations).
+    :param tol: tolerance.
+    '''
+    retval= self.getDominatedCombinations(tol)
+    self.remove(retval)
+    if(results is not None):
+      nonGoverning= self.getNonGoverningCombinations(loadCaseNames,results,tol)
+      self.remove(nonGoverning)
+      retval.extend(nonGoverning)
+    if(retval):
+      lmsg.log(self.description+' '+str(len(retval))+' combinations removed: '+str(retval))
+    return retval
   def getRecordLoadCaseDisp(self,combName,setsToDispLoads,setsToDispDspRot,setsToDispIntForc):
     '''Returns a suitable RecordLoadCaseDisp for the combination.
 
@@ -96,6 +323,23 @@ class SituationsSet(object):
     '''Introduces the combinations into the XC combination handler.'''
     for s in self.situations:
       s.dumpCombinations(xcCombHandler)
+  def pruneDominatedCombinations(self, loadCaseNames= None, results= None, tol= 1e-9):
+    '''Remove the combinations that cannot govern from each situation
+       (combinations of different situations are not compared because
+       their checking criteria may differ). Return a dictionary with the
+       removed combination names for each situation.
+
+    :param loadCaseNames: names of the elementary load cases.
+    :param results: matrix with the results of the elementary load cases
+                    (see SituationCombs.getNonGoverningCombinations).
+    :param tol: tolerance.
+    '''
+    retval= dict()
+    for s in self.situations:
+      removed= s.pruneDominatedCombinations(loadCaseNames,results,tol)
+      if(removed):
+        retval[s.description]= removed
+    return retval
   def getRecordLoadCaseDisp(self,combName,setsToDispLoads,setsToDispDspRot,setsToDispIntForc):
     '''Returns a suitable RecordLoadCaseDisp for the combination.
 
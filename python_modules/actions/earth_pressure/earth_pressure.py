@@ -16,6 +16,7 @@ __version__= "3.0"
 __email__= "l.pereztato@gmail.com ana.Ortega.Ort@gmail.com" 
 
 import math
+import numpy
 import xc_base
 import geom
 import xc
@@ -31,9 +32,19 @@ class PressureModelBase(object):
         lsmg.error('Error: getPressure must be overloaded in derived classes.')
         return 0.0
 
+    def getPressures(self,zCoo):
+        '''Return the earth pressures acting on the points at global 
+        coordinates zCoo (overload in derived classes to vectorize the
+        computation).
+
+        :param zCoo: NumPy array with the global coordinates of the points.
+        '''
+        return numpy.array([self.getPressure(z) for z in zCoo],dtype= float)
+
     def appendLoadToCurrentLoadPattern(self,xcSet,vDir,iCoo= 2,delta= 0.0):
         '''Append earth thrust on a set of elements to the current
-        load pattern.
+        load pattern. The pressures are computed for all the element
+        centroids at once and the loads are created in a single call.
 
         :param xcSet: set that contains the elements (shells and/or beams)
         :param vDir: unit xc vector defining pressures direction
@@ -44,18 +55,18 @@ class PressureModelBase(object):
         tanVector= xc.Vector([-vDir[1],vDir[0]]) #iCoo= 1 => 2D
         if(iCoo==2): #3D
           tanVector= xc.Vector([vDir[2],vDir[1],-vDir[0]])
+        elems= xcSet.getElements
+        if(len(elems)==0):
+          return
+        centroids= numpy.array(elems.getCentroidsCoordinates(False))
+        pressures= self.getPressures(centroids[:,iCoo])
+        loadDir= vDir+tanDelta*tanVector
+        loadDir= numpy.array([loadDir[i] for i in range(0,len(vDir))])
+        loads= xc.Matrix(numpy.outer(pressures,loadDir).tolist())
         if(len(vDir)==3): #3D load.
-          for e in xcSet.getElements:
-              presElem=self.getPressure(e.getCooCentroid(False)[iCoo])
-              loadVector= presElem*(vDir+tanDelta*tanVector)
-              if(presElem!=0.0):
-                  e.vector3dUniformLoadGlobal(loadVector)
+          elems.vector3dUniformLoadsGlobal(loads)
         else: #2D load.
-          for e in xcSet.getElements:
-              presElem=self.getPressure(e.getCooCentroid(False)[iCoo])
-              loadVector= presElem*(vDir+tanDelta*tanVector)
-              if(presElem!=0.0):
-                  e.vector2dUniformLoadGlobal(loadVector)
+          elems.vector2dUniformLoadsGlobal(loads)
 
         
 
@@ -95,6 +106,21 @@ class EarthPressureModel(EarthPressureBase):
                 ret_press=self.K*(self.gammaSoil*(self.zGround-self.zWater) + (self.gammaSoil-self.gammaWater)*(self.zWater-z)) + self.gammaWater*(self.zWater-z)
         return ret_press
 
+    def getPressures(self,zCoo):
+        '''Return the earth pressures acting on the points at global 
+        coordinates zCoo.
+
+        :param zCoo: NumPy array with the global coordinates of the points.
+        '''
+        z= numpy.asarray(zCoo,dtype= float)
+        ret_press= numpy.zeros(z.shape)
+        dry= (z<self.zGround) & (z>self.zWater)
+        ret_press[dry]= self.K*self.gammaSoil*(self.zGround-z[dry])
+        wet= (z<self.zGround) & (z<=self.zWater)
+        zw= z[wet]
+        ret_press[wet]= self.K*(self.gammaSoil*(self.zGround-self.zWater) + (self.gammaSoil-self.gammaWater)*(self.zWater-zw)) + self.gammaWater*(self.zWater-zw)
+        return ret_press
+
 class PeckPressureEnvelope(EarthPressureModel):
     ''' Envelope of apparent lateral pressure diagrams for design 
         of cuts in sand. See 10.2 in the book "Principles of Foundation
@@ -116,6 +142,20 @@ class PeckPressureEnvelope(EarthPressureModel):
               lmsg.error('pressures under water table not implemented.''')
         return ret_press
 
+    def getPressures(self,zCoo):
+        '''Return the earth pressures acting on the points at global 
+        coordinates zCoo.
+
+        :param zCoo: NumPy array with the global coordinates of the points.
+        '''
+        z= numpy.asarray(zCoo,dtype= float)
+        ret_press= numpy.zeros(z.shape)
+        loaded= (z<self.zGround)
+        ret_press[loaded]= 0.65*self.K*self.gammaSoil*self.H
+        if(numpy.any(z[loaded]<self.zWater)):
+            lmsg.error('pressures under water table not implemented.''')
+        return ret_press
+
 class UniformLoadOnStem(PressureModelBase):
     '''Uniform lateral earth pressure on a retaining wall.
 
@@ -129,6 +169,14 @@ class UniformLoadOnStem(PressureModelBase):
         '''Return the earth pressure acting on the points at global coordinate z.'''
         return self.qLoad
 
+    def getPressures(self,zCoo):
+        '''Return the earth pressures acting on the points at global 
+        coordinates zCoo.
+
+        :param zCoo: NumPy array with the global coordinates of the points.
+        '''
+        return numpy.ones(numpy.shape(zCoo))*self.getPressure(0.0)
+
 class UniformLoadOnBackfill(UniformLoadOnStem):
     '''Lateral earth pressure on a retaining wall due to a uniform indefinite
        load on the backfill.
@@ -174,6 +222,23 @@ class StripLoadOnBackfill(UniformLoadOnStem):
             ret_press=self.coef*self.qLoad/math.pi*(beta-math.sin(beta)*math.cos(2*omega))
         return ret_press
 
+    def getPressures(self,zCoo):
+        '''Return the earth pressures acting on the points at global 
+        coordinates zCoo.
+
+        :param zCoo: NumPy array with the global coordinates of the points.
+        '''
+        difZ= self.zLoad-numpy.asarray(zCoo,dtype= float)
+        ret_press= numpy.zeros(difZ.shape)
+        loaded= (difZ>0)
+        d= difZ[loaded]
+        bet1= numpy.arctan(self.distWall/d)
+        bet2= numpy.arctan((self.distWall+self.stripWidth)/d)
+        beta= bet2-bet1
+        omega= bet1+beta/2.
+        ret_press[loaded]= self.coef*self.qLoad/math.pi*(beta-numpy.sin(beta)*numpy.cos(2*omega))
+        return ret_press
+
     def appendVerticalLoadToCurrentLoadPattern(self,xcSet,vDir,iXCoo= 0,iZCoo= 2,alph= math.radians(30)):
         '''Append to the current load pattern the vertical pressures on 
            a set of elements due to the strip load. According to
@@ -244,6 +309,20 @@ class LineVerticalLoadOnBackfill(PressureModelBase):
             ret_press=self.qLoad/math.pi/difZ*(math.sin(2*omega))**2
         return ret_press
 
+    def getPressures(self,zCoo):
+        '''Return the earth pressures acting on the points at global 
+        coordinates zCoo.
+
+        :param zCoo: NumPy array with the global coordinates of the points.
+        '''
+        difZ= self.zLoad-numpy.asarray(zCoo,dtype= float)
+        ret_press= numpy.zeros(difZ.shape)
+        loaded= (difZ>0)
+        d= difZ[loaded]
+        omega= numpy.arctan(self.distWall/d)
+        ret_press[loaded]= self.qLoad/math.pi/d*(numpy.sin(2*omega))**2
+        return ret_press
+
     def getMaxMagnitude(self,xcSet):
         '''Return an estimation of the maximum magnitude of the vector loads 
         (it's supposed to occur in a point placed 1/3L from the top)'''
@@ -302,6 +381,18 @@ class HorizontalLoadOnBackfill(PressureModelBase):
             ret_press=self.presmax/(self.zpresmax-self.zpresmin)*(z-self.zpresmin)
         return ret_press
 
+    def getPressures(self,zCoo):
+        '''Return the earth pressures acting on the points at global 
+        coordinates zCoo.
+
+        :param zCoo: NumPy array with the global coordinates of the points.
+        '''
+        z= numpy.asarray(zCoo,dtype= float)
+        ret_press= numpy.zeros(z.shape)
+        loaded= (z<=self.zpresmax) & (z>=self.zpresmin)
+        ret_press[loaded]= self.presmax/(self.zpresmax-self.zpresmin)*(z[loaded]-self.zpresmin)
+        return ret_press
+
     def appendLoadToCurrentLoadPattern(self,xcSet,vDir,iCoo= 2, delta= 0.0):
         '''Append to the current load pattern the earth thrust on a set of 
         elements due to the horizontal load.
@@ -356,3 +447,17 @@ class MononobeOkabePressureDistribution(EarthPressureBase):
             retval= (z-zInf)/(zSup-zInf)*self.max_stress
         return retval
 
+    def getPressures(self,zCoo):
+        '''Return the earth pressures acting on the points at global 
+        coordinates zCoo.
+
+        :param zCoo: NumPy array with the global coordinates of the points.
+        '''
+        zSup= self.zGround
+        zInf= self.zGround-self.H
+        z= numpy.asarray(zCoo,dtype= float)
+        retval= numpy.zeros(z.shape)
+        loaded= (z>=zInf) & (z<=zSup)
+        retval[loaded]= (z[loaded]-zInf)/(zSup-zInf)*self.max_stress
+        return retval
+
@@ -0,0 +1,352 @@
+# -*- coding: utf-8 -*-
+''' Moving loads by means of influence lines and influence surfaces.
+
+The influence ordinates of a group of responses are computed once (one
+unit-load solution for each loaded node, all of them with the same
+factorization of the stiffness matrix); then the vehicles (trains,
+roadway load models,...) are swept along a path adding the product of
+each axle (or wheel) load by the influence ordinate at its position. No
+new analysis is needed for each step of the sweep.
+'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018,  LCPT AO_O "
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+import numpy
+from scipy import interpolate
+import xc_base
+import geom
+import xc
+from miscUtils import LogMessages as lmsg
+
+def getNodeDispResponse(node, dof):
+    '''Return a function that gives the displacement of the node
+       along the degree of freedom argument.
+
+    :param node: node to inquire.
+    :param dof: index of the degree of freedom.
+    '''
+    return lambda: node.getDisp[dof]
+
+def getElementResponse(element, forceName):
+    '''Return a function that gives the internal force of the element
+       whose name is passed as parameter (i.e. 'getM1', 'getV2',...).
+
+    :param element: element to inquire.
+    :param forceName: name of the property that returns the internal force.
+    '''
+    def f():
+        element.getResistingForce()
+        return getattr(element,forceName)
+    return f
+
+class InfluenceBase(object):
+    '''Influence ordinates of a group of responses with respect to
+    a unit load that moves over a set of nodes.
+
+    :ivar nodes: list of loaded nodes.
+    :ivar loadVector: unit load (xc.Vector) applied on each node.
+    :ivar responseNames: names of the responses.
+    :ivar responseFunctions: functions (without arguments) that return the
+                             value of each response after the analysis.
+    :ivar ordinates: numpy array with a row for each loaded node and a column
+                     for each response.
+    '''
+    def __init__(self, loadedNodes, loadVector, responses):
+        '''Constructor.
+
+        :param loadedNodes: iterable over the nodes that will be loaded
+                            (i.e. xcSet.getNodes).
+        :param loadVector: unit load to apply on each node
+                           (i.e. xc.Vector([0,-1,0]).
+        :param responses: list of (name, function) pairs, where function
+                          takes no arguments and returns the value of the
+                          response (see getNodeDispResponse and
+                          getElementResponse).
+        '''
+        self.nodes= list(loadedNodes)
+        self.loadVector= loadVector
+        self.responseNames= [r[0] for r in responses]
+        self.responseFunctions= [r[1] for r in responses]
+        self.ordinates= None
+
+    def getResponseIndex(self, name):
+        '''Return the column that corresponds to the response.'''
+        return self.responseNames.index(name)
+
+    def compute(self, preprocessor, analysis, loadPatternName= 'unit_load', solutionAlgorithm= None):
+        '''Compute the influence ordinates by solving the model once for
+           each loaded node. The current time series of the load pattern
+           container is used.
+
+           The auxiliary load pattern is added to the domain only once
+           and its load is moved from node to node, so the domain doesn't
+           change between the unit-load solutions. If the linear solution
+           algorithm of the analysis is passed as parameter, its tangent
+           is formed and factored only once and each unit load only
+           needs a forward and back substitution.
+
+        :param preprocessor: preprocessor of the problem.
+        :param analysis: linear analysis to use.
+        :param loadPatternName: name of the auxiliary load pattern.
+        :param solutionAlgorithm: linear solution algorithm of the analysis
+                                  (i.e. solProc.solAlgo) whose factorization
+                                  will be reused (see Linear.factorOnce).
+        '''
+        numNodes= len(self.nodes)
+        self.ordinates= numpy.zeros((numNodes,len(self.responseFunctions)))
+        if(numNodes==0):
+            self.setupInterpolation()
+            return self.ordinates
+        if(solutionAlgorithm):
+            factorOnce= solutionAlgorithm.factorOnce
+            solutionAlgorithm.factorOnce= True
+        domain= preprocessor.getDomain
+        lPatterns= preprocessor.getLoadHandler.getLoadPatterns
+        lp= lPatterns.newLoadPattern('default',loadPatternName)
+        preprocessor.resetLoadCase()
+        lp.newNodalLoad(self.nodes[0].tag,self.loadVector)
+        lPatterns.addToDomain(loadPatternName)
+        for i, n in enumerate(self.nodes):
+            if(i>0):
+                lp.clearLoads()
+                lp.newNodalLoad(n.tag,self.loadVector)
+            domain.revertToStart()
+            result= analysis.analyze(1)
+            if(result!=0):
+                lmsg.error('Can\'t solve unit load on node: '+str(n.tag))
+            for j, f in enumerate(self.responseFunctions):
+                self.ordinates[i,j]= f()
+        lp.clearLoads()
+        preprocessor.resetLoadCase()
+        if(solutionAlgorithm):
+            solutionAlgorithm.factorOnce= factorOnce
+        self.setupInterpolation()
+        return self.ordinates
+
+    def setupInterpolation(self):
+        '''Prepare the interpolation of the influence ordinates.'''
+        lmsg.error('setupInterpolation not implemented.')
+
+    def getOrdinates(self, points):
+        '''Return the influence ordinates at the points argument.'''
+        lmsg.error('getOrdinates not implemented.')
+        return None
+
+    def getResponses(self, loadPositions, loads):
+        '''Return the responses for each position of a group of loads.
+
+        :param loadPositions: array with the position of each load for
+                              each step (numSteps x numLoads x ...).
+        :param loads: array with the value of each load.
+        '''
+        numSteps= loadPositions.shape[0]
+        numLoads= loadPositions.shape[1]
+        pts= loadPositions.reshape((numSteps*numLoads,)+loadPositions.shape[2:])
+        eta= self.getOrdinates(pts).reshape((numSteps,numLoads,len(self.responseNames)))
+        return numpy.einsum('ijk,j->ik',eta,numpy.asarray(loads,dtype=float))
+
+class InfluenceLine(InfluenceBase):
+    '''Influence lines along a straight path.
+
+    :ivar pathOrigin: origin of the path (geom.Pos3d).
+    :ivar pathDirection: direction of the path (geom.Vector3d).
+    :ivar abscissae: abscissae of the loaded nodes along the path.
+    '''
+    def __init__(self, loadedNodes, loadVector, responses, pathOrigin, pathDirection):
+        '''Constructor.
+
+        :param loadedNodes: nodes that will be loaded.
+        :param loadVector: unit load to apply on each node.
+        :param responses: list of (name, function) pairs.
+        :param pathOrigin: origin of the path (geom.Pos3d).
+        :param pathDirection: direction of the path (geom.Vector3d).
+        '''
+        super(InfluenceLine,self).__init__(loadedNodes, loadVector, responses)
+        self.pathOrigin= pathOrigin
+        self.pathDirection= pathDirection
+        o= numpy.array([pathOrigin.x,pathOrigin.y,pathOrigin.z])
+        d= numpy.array([pathDirection.x,pathDirection.y,pathDirection.z])
+        d/= numpy.linalg.norm(d)
+        pos= numpy.array([[p.x,p.y,p.z] for p in [n.getInitialPos3d for n in self.nodes]])
+        self.abscissae= numpy.dot(pos-o,d)
+        self.order= numpy.argsort(self.abscissae)
+
+    def setupInterpolation(self):
+        '''Sort the ordinates by abscissa.'''
+        self.sortedAbscissae= self.abscissae[self.order]
+        self.sortedOrdinates= self.ordinates[self.order]
+
+    def getOrdinates(self, points):
+        '''Return the influence ordinates at the abscissae argument (zero
+           outside the loaded nodes range).
+
+        :param points: abscissae along the path.
+        '''
+        s= numpy.asarray(points,dtype=float)
+        retval= numpy.zeros((len(s),len(self.responseNames)))
+        for j in range(len(self.responseNames)):
+            retval[:,j]= numpy.interp(s,self.sortedAbscissae,self.sortedOrdinates[:,j],left=0.0,right=0.0)
+        return retval
+
+    def sweep(self, movingLoad, sStart, sEnd, numSteps):
+        '''Move the load from sStart to sEnd and return the envelope
+           of the responses.
+
+        :param movingLoad: moving load (see MovingLoad class).
+        :param sStart: abscissa of the reference point at the first step.
+        :param sEnd: abscissa of the reference point at the last step.
+        :param numSteps: number of positions of the load.
+        '''
+        steps= numpy.linspace(sStart,sEnd,numSteps)
+        loadPositions= steps[:,None]+movingLoad.localPositions[:,0][None,:]
+        values= self.getResponses(loadPositions,movingLoad.loads)
+        return MovingLoadEnvelope(self.responseNames,steps,values)
+
+class InfluenceSurface(InfluenceBase):
+    '''Influence surfaces over the loaded nodes projected on a plane
+    normal to a global axis.
+
+    :ivar prismAxis: axis normal to the projection plane
+                     ('X': (y,z), 'Y': (x,z), 'Z': (x,y)).
+    :ivar projections: numpy array with the projections of the loaded nodes.
+    '''
+    def __init__(self, loadedNodes, loadVector, responses, prismAxis= 'Z'):
+        '''Constructor.
+
+        :param loadedNodes: nodes that will be loaded.
+        :param loadVector: unit load to apply on each node.
+        :param responses: list of (name, function) pairs.
+        :param prismAxis: axis normal to the projection plane.
+        '''
+        super(InfluenceSurface,self).__init__(loadedNodes, loadVector, responses)
+        self.prismAxis= prismAxis.upper()
+        idx= {'X':(1,2), 'Y':(0,2), 'Z':(0,1)}[self.prismAxis]
+        pos= numpy.array([[p.x,p.y,p.z] for p in [n.getInitialPos3d for n in self.nodes]])
+        self.projections= pos[:,idx]
+        self.interpolator= None
+
+    def setupInterpolation(self):
+        '''Build the (piecewise linear) interpolator of the ordinates.'''
+        self.interpolator= interpolate.LinearNDInterpolator(self.projections,self.ordinates,fill_value=0.0)
+
+    def getOrdinates(self, points):
+        '''Return the influence ordinates at the points argument (zero
+           outside the loaded region).
+
+        :param points: array with the 2D coordinates of the points.
+        '''
+        return self.interpolator(numpy.asarray(points,dtype=float))
+
+    def sweep(self, movingLoad, pathStart, pathEnd, numSteps):
+        '''Move the load along the straight path from pathStart to pathEnd
+           and return the envelope of the responses. The longitudinal
+           axis of the load follows the path and its transversal axis
+           is at the right of the path direction.
+
+        :param movingLoad: moving load (see MovingLoad class).
+        :param pathStart: position (geom.Pos2d) of the reference point
+                          at the first step.
+        :param pathEnd: position (geom.Pos2d) of the reference point
+                        at the last step.
+        :param numSteps: number of positions of the load.
+        '''
+        p0= numpy.array([pathStart.x,pathStart.y])
+        p1= numpy.array([pathEnd.x,pathEnd.y])
+        d= p1-p0
+        d/= numpy.linalg.norm(d)
+        n= numpy.array([d[1],-d[0]])
+        t= numpy.linspace(0.0,1.0,numSteps)
+        steps= p0[None,:]+t[:,None]*(p1-p0)[None,:]
+        local= movingLoad.localPositions
+        offsets= local[:,0][:,None]*d[None,:]+local[:,1][:,None]*n[None,:]
+        loadPositions= steps[:,None,:]+offsets[None,:,:]
+        values= self.getResponses(loadPositions,movingLoad.loads)
+        return MovingLoadEnvelope(self.responseNames,steps,values)
+
+class MovingLoad(object):
+    '''Group of loads that move together.
+
+    :ivar localPositions: numpy array with the (longitudinal, transversal)
+                          position of each load with respect to the
+                          reference point.
+    :ivar loads: numpy array with the value of each load.
+    '''
+    def __init__(self, localPositions, loads):
+        '''Constructor.
+
+        :param localPositions: list of (longitudinal, transversal)
+                               positions of the loads.
+        :param loads: list of load values.
+        '''
+        self.localPositions= numpy.array(localPositions,dtype=float).reshape((len(loads),2))
+        self.loads= numpy.array(loads,dtype=float)
+
+    def getLength(self):
+        '''Return the distance between the first and the last loads.'''
+        x= self.localPositions[:,0]
+        return x.max()-x.min()
+
+    def getReversed(self):
+        '''Return the load moving in the opposite direction.'''
+        return MovingLoad(-self.localPositions,self.loads)
+
+def getTrainMovingLoad(axleLoads):
+    '''Return the moving load corresponding to a train defined
+       as a list of [position, load] pairs (see trenes_reales_av).
+
+    :param axleLoads: list of [position, load] of each axle.
+    '''
+    positions= [[a[0],0.0] for a in axleLoads]
+    loads= [a[1] for a in axleLoads]
+    return MovingLoad(positions,loads)
+
+def getVehicleMovingLoad(loadModel):
+    '''Return the moving load corresponding to a roadway load model
+       (see load_model_base.LoadModel) whose wheel positions are
+       expressed as (transversal, longitudinal).
+
+    :param loadModel: roadway trafic load model.
+    '''
+    positions= [[w.position.y,w.position.x] for w in loadModel.wheelLoads]
+    return MovingLoad(positions,loadModel.getLoads())
+
+class MovingLoadEnvelope(object):
+    '''Responses to a moving load for each of its positions.
+
+    :ivar responseNames: names of the responses.
+    :ivar steps: positions of the reference point of the moving load.
+    :ivar values: numpy array with a row for each step and a column
+                  for each response.
+    '''
+    def __init__(self, responseNames, steps, values):
+        self.responseNames= responseNames
+        self.steps= steps
+        self.values= values
+
+    def getMaxValues(self):
+        '''Return the maximum value of each response.'''
+        return self.values.max(axis= 0)
+
+    def getMinValues(self):
+        '''Return the minimum value of each response.'''
+        return self.values.min(axis= 0)
+
+    def getMax(self, name):
+        '''Return the maximum value of the response and the
+           position of the load that produces it.'''
+        j= self.responseNames.index(name)
+        i= numpy.argmax(self.values[:,j])
+        return self.values[i,j], self.steps[i]
+
+    def getMin(self, name):
+        '''Return the minimum value of the response and the
+           position of the load that produces it.'''
+        j= self.responseNames.index(name)
+        i= numpy.argmin(self.values[:,j])
+        return self.values[i,j], self.steps[i]
@@ -12,7 +12,9 @@ import geom
 import xc
 import re
 from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
 from import_export import BlockTopologyEntities as bte
+from miscUtils import LogMessages as lmsg
 
 def layerToImport(layerName,namesToImport):
   '''Return true if the layer name matches one of the regular expressions
@@ -26,6 +28,40 @@ def layerToImport(layerName,namesToImport):
       return True
   return False
 
+def getKPoints(points, threshold):
+  '''Return the k-points obtained by melting the points that are closer
+     than the threshold distance. The points are visited in order and each
+     one becomes a new k-point unless a previous k-point is within the
+     threshold distance (the neighbors are obtained from a KD-tree
+     built once).
+
+     :param points: list of points (lists of coordinates).
+     :param threshold: distance below which two points are melted.
+  '''
+  retval= []
+  if(points):
+    tree= cKDTree(points)
+    neighbors= tree.query_ball_point(points,threshold)
+    selected= [False]*len(points)
+    for i, p in enumerate(points):
+      if(not any(selected[j] for j in neighbors[i])):
+        selected[i]= True
+        retval.append(p)
+  return retval
+
+def getIndexNearestPoints(kPointsTree, pts):
+  '''Return the indexes of the k-points nearest to the points in
+     the argument (-1 if there are no k-points).
+
+     :param kPointsTree: KD-tree of the k-points (None if there is
+                         no k-points).
+     :param pts: list of points.
+  '''
+  if(kPointsTree is None):
+    lmsg.warning('there are no k-points to search in.')
+    return [-1]*len(pts)
+  return [int(i) for i in kPointsTree.query(pts)[1]]
+
 class DXFImport(object):
   '''Import DXF entities.'''
   def __init__(self,dxfFileName,layerNamesToImport, getRelativeCoo, threshold= 0.01,importLines= True, importSurfaces= True):
@@ -52,10 +88,23 @@ class DXFImport(object):
       self.facesByLayer= {}
     
   def getIndexNearestPoint(self, pt):
-    return cdist([pt], self.kPoints).argmin()
+    '''Return the index of the k-point nearest to the argument
+       (-1 if there are no k-points).'''
+    return self.getIndexNearestPoints([pt])[0]
+
+  def getIndexNearestPoints(self, pts):
+    '''Return the indexes of the k-points nearest to the points
+       in the argument (-1 if there are no k-points).'''
+    return getIndexNearestPoints(self.kPointsTree,pts)
 
   def getNearestPoint(self, pt):
-    return self.kPoints[self.getIndexNearestPoint(pt)]
+    '''Return the k-point nearest to the argument (None if there
+       are no k-points).'''
+    retval= None
+    idx= self.getIndexNearestPoint(pt)
+    if(idx>=0):
+      retval= self.kPoints[idx]
+    return retval
 
   def getLayersToImport(self, namesToImport):
     '''Return the layers names that will be imported according to the
@@ -93,15 +142,11 @@ class DXFImport(object):
   
   def selectKPoints(self):
     '''Selects the k-points to be used in the model. All the points that
-       are closer than the threshold distance are melted into one k-point.
+       are closer than the threshold distance are melted into one k-point
+       (see getKPoints).
     '''
-    points= self.extractPoints()
-    self.kPoints= [points[0]]
-    for p in points:
-      nearestPoint= self.getNearestPoint(p)
-      dist= cdist([p],[nearestPoint])[0][0]
-      if(dist>self.threshold):
-        self.kPoints.append(p)
+    self.kPoints= getKPoints(self.extractPoints(),self.threshold)
+    self.kPointsTree= cKDTree(self.kPoints) if self.kPoints else None
 
   def importPoints(self):
     ''' Import points from DXF.'''
@@ -113,7 +158,7 @@ class DXFImport(object):
         if(type == 'POINT'):
           vertices= [-1]
           p= self.getRelativeCoo(obj.point)
-          vertices[0]= self.getIndexNearestPoint(p,kPoints)
+          vertices[0]= self.getIndexNearestPoint(p)
           retval[obj.handle]= (layerName, vertices)
     return retval
 
@@ -127,12 +172,10 @@ class DXFImport(object):
       layerName= obj.layer
       if(layerName in self.layersToImport):
         if(type == 'LINE'):
-          vertices= [-1,-1]
           p1= self.getRelativeCoo(obj.start)
           p2= self.getRelativeCoo(obj.end)
           length= cdist([p1],[p2])[0][0]
-          vertices[0]= self.getIndexNearestPoint(p1)
-          vertices[1]= self.getIndexNearestPoint(p2)
+          vertices= self.getIndexNearestPoints([p1,p2])
           if(vertices[0]==vertices[1]):
             print 'Error in line ', lineName, ' vertices are equal: ', vertices
           if(length>self.threshold):
@@ -141,11 +184,9 @@ class DXFImport(object):
           else:
             print 'line too short: ', p1, p2, length
         elif(type == 'POLYLINE'):
-          vertices= set()
-          for p in obj.points:
-            rCoo= self.getRelativeCoo(p)
-            vertices.add(self.getIndexNearestPoint(rCoo))
-            self.polylines[lineName]= vertices
+          rCoo= [self.getRelativeCoo(p) for p in obj.points]
+          if(rCoo):
+            self.polylines[lineName]= set(self.getIndexNearestPoints(rCoo))
             self.labelDict[lineName]= [layerName]
             
   def importFaces(self):
@@ -160,11 +201,8 @@ class DXFImport(object):
       if(layerName in self.layersToImport):
         facesDict= self.facesByLayer[layerName]
         if(type == '3DFACE'):
-          vertices= []
-          for pt in obj.points:
-            p= self.getRelativeCoo(pt)
-            idx= self.getIndexNearestPoint(p)
-            vertices.append(idx)
+          pts= [self.getRelativeCoo(pt) for pt in obj.points]
+          vertices= self.getIndexNearestPoints(pts)
           #print layerName, obj.handle
           self.labelDict[obj.handle]= [layerName]
           facesDict[obj.handle]= vertices
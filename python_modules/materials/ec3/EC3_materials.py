@@ -126,7 +126,7 @@ class EC3Shape(object):
         eps=math.sqrt(235e6/steel.fy)
         limits=[33*eps,38*eps,42*eps]
         classif=0
-        while ratioCT>limits[classif]:
+        while (classif<len(limits)) and (ratioCT>limits[classif]):
             classif+=1
         return (classif+1)
     
@@ -143,7 +143,7 @@ class EC3Shape(object):
         eps=math.sqrt(235e6/steel.fy)
         limits=[72*eps,83*eps,124*eps]
         classif=0
-        while ratioCT>limits[classif]:
+        while (classif<len(limits)) and (ratioCT>limits[classif]):
             classif+=1
         return (classif+1)
         
@@ -162,7 +162,7 @@ class EC3Shape(object):
         eps=math.sqrt(235e6/steel.fy)
         limits=[72*eps,83*eps,124*eps]
         classif=0
-        while ratioCT>limits[classif]:
+        while (classif<len(limits)) and (ratioCT>limits[classif]):
             classif+=1
         return (classif+1)
         
@@ -181,7 +181,7 @@ class EC3Shape(object):
         eps=math.sqrt(235e6/steel.fy)
         limits=[9*eps,10*eps,14*eps]
         classif=0
-        while ratioCT>limits[classif]:
+        while (classif<len(limits)) and (ratioCT>limits[classif]):
             classif+=1
         return (classif+1)
     
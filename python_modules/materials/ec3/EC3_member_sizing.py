@@ -0,0 +1,392 @@
+# -*- coding: utf-8 -*-
+''' Automatic sizing of steel members according to Eurocode 3.
+
+The members are organized in groups that must share the same shape
+(i.e. the columns of a storey or the beams of a floor). For each group
+the efficiencies of all the shapes of a catalogue (Arcelor, AISC,...) are
+computed at once (numpy arrays with a row for each candidate shape and
+a column for each internal force sample) and the lightest shape that
+satisfies the criteria is chosen.
+
+Each candidate shape is classified (EC3-1-1 5.5, table 5.2) using the
+classification routines of the EC3 shapes (EC3_materials); the web is
+considered totally compressed if there is some compressive axial force.
+Class 1 and 2 shapes are checked with the plastic section moduli, class
+3 shapes with the elastic ones and class 4 shapes (and those that can't
+be classified) are discarded:
+
+  - cross-section resistance (EC3-1-1 6.2.1(7) linear interaction):
+    N/NRd+ Mz/MzRd+ My/MyRd <= 1
+  - shear resistance (EC3-1-1 6.2.6): Vy/VplRd <= 1
+  - member stability (EC3-1-1 6.3.3 with k_ij= 1):
+    N/(chi_min*NRk/gammaM1)+ Mz/(chiLT*MzRk/gammaM1)+ My/(MyRk/gammaM1) <= 1
+
+Since the internal forces of a hyperstatic structure depend on the
+stiffness of the members, the model is analyzed again only if the
+stiffness of some group changes more than a given tolerance. To ensure
+convergence the shapes are only allowed to grow between iterations.
+'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+import math
+import numpy
+import xc_base
+import geom
+import xc
+from materials.sections import structural_steel
+from solution import predefined_solutions
+from miscUtils import LogMessages as lmsg
+
+class ShapeCatalogue(object):
+    '''Mechanical properties of a set of shapes stored in numpy arrays
+    sorted by weight.
+
+    :ivar names: names of the shapes.
+    :ivar table: dictionary with the properties of the shapes
+                 (i.e. arcelor_metric_shapes.IPE).
+    :ivar shapeClass: EC3 shape class used to classify the shapes
+                      (i.e. EC3_materials.IPEShape).
+    '''
+    def __init__(self, table, shapeClass, names= None):
+        '''Constructor.
+
+        :param table: dictionary with the properties of the shapes
+                      (i.e. arcelor_metric_shapes.IPE).
+        :param shapeClass: EC3 shape class used to classify the shapes
+                           (i.e. EC3_materials.IPEShape).
+        :param names: names of the candidate shapes (defaults to all
+                      the shapes of the table).
+        '''
+        self.table= table
+        self.shapeClass= shapeClass
+        self.sectionClasses= dict()
+        if(names is None):
+            names= table.keys()
+        self.names= sorted(names, key= lambda n: (table[n]['P'],n))
+        self.P= self.getArray('P')
+        self.A= self.getArray('A')
+        self.Iy= self.getArray('Iy')
+        self.Iz= self.getArray('Iz')
+        self.It= self.getArray('It')
+        self.Wypl= self.getArray('Wypl')
+        self.Wzpl= self.getArray('Wzpl')
+        self.Wyel= self.getArray('Wyel')
+        self.Wzel= self.getArray('Wzel')
+        self.Avy= numpy.array([self.getShearArea(n) for n in self.names])
+
+    def getArray(self, code):
+        '''Return a numpy array with the values of the property
+           argument for all the shapes.'''
+        return numpy.array([self.table[n][code] for n in self.names])
+
+    def getShearArea(self, name):
+        '''Return the shear area parallel to the web of the shape. If the
+           table doesn't give it (hollow sections) it's computed according
+           to EC3-1-1 6.2.6(3).'''
+        shape= self.table[name]
+        if('Avy' in shape):
+            retval= shape['Avy']
+        elif(('h' in shape) and ('b' in shape)): # RHS and SHS.
+            retval= shape['A']*shape['h']/(shape['b']+shape['h'])
+        else: # CHS.
+            retval= 2.0*shape['A']/math.pi
+        return retval
+
+    def getIndex(self, name):
+        '''Return the index of the shape whose name is passed as parameter.'''
+        return self.names.index(name)
+
+    def getNumberOfShapes(self):
+        '''Return the number of shapes of the catalogue.'''
+        return len(self.names)
+
+    def getSectionClasses(self, steel, compressedWeb= True):
+        '''Return an array with the cross-section class of each shape.
+
+        :param steel: steel material (i.e. EC3_materials.S275JR).
+        :param compressedWeb: if true the web is considered totally
+                              compressed, otherwise in pure bending.
+        '''
+        key= (steel.fy, compressedWeb)
+        if(key not in self.sectionClasses):
+            self.sectionClasses[key]= numpy.array([getSectionClass(self.shapeClass(steel,n),steel,compressedWeb) for n in self.names])
+        return self.sectionClasses[key]
+
+def getSectionClass(shape, steel, compressedWeb= True):
+    '''Return the cross-section class (EC3-1-1 table 5.2) of the shape
+       (the highest class of its compressed parts) or 4 if the shape
+       doesn't give the width-to-thickness ratios of its parts.
+
+    :param shape: EC3 shape (i.e. EC3_materials.IPEShape).
+    :param steel: steel material (i.e. EC3_materials.S275JR).
+    :param compressedWeb: if true the web is considered totally
+                          compressed, otherwise in pure bending.
+    '''
+    retval= 4
+    if(hasattr(shape,'widthToThicknessWeb')):
+        if(compressedWeb):
+            retval= shape.getClassInternalPartInCompression(steel)
+        else:
+            retval= shape.getClassInternalPartInBending(steel)
+        if(hasattr(shape,'widthToThicknessFlange')):
+            retval= max(retval,shape.getClassOutstandPartInCompression(steel))
+        if(hasattr(shape,'widthToThicknessHorzInt')):
+            retval= max(retval,shape.getClassInternalPartInCompression(steel,shape.widthToThicknessHorzInt()))
+    return retval
+
+def getBucklingReductionFactors(catalogue, steel, Leq, bucklingCurve, I):
+    '''Return the flexural buckling reduction factors (EC3-1-1 6.3.1.2)
+       of all the shapes of the catalogue.
+
+    :param catalogue: shape catalogue.
+    :param steel: steel material (i.e. EC3_materials.S275JR).
+    :param Leq: buckling length.
+    :param bucklingCurve: buckling curve (a0,a,b,c or d).
+    :param I: array with the moments of inertia with respect to the
+              buckling axis.
+    '''
+    alpha= structural_steel.alphaImperfectionFactor(bucklingCurve)
+    lmb= Leq/numpy.sqrt(I/catalogue.A)/steel.getLambda1()
+    phi= 0.5*(1+alpha*(lmb-0.2)+lmb**2)
+    return numpy.minimum(1.0/(phi+numpy.sqrt(phi**2-lmb**2)),1.0)
+
+def getEfficiencies(catalogue, steel, N, My, Mz, Vy, LeqY, LeqZ, bucklingCurveY= 'c', bucklingCurveZ= 'b', chiLT= 1.0):
+    '''Return an array with the efficiency (maximum of the
+       efficiencies of all the checks for all the internal forces)
+       of each shape of the catalogue (infinite for the class 4
+       shapes).
+
+    :param catalogue: shape catalogue.
+    :param steel: steel material (i.e. EC3_materials.S275JR).
+    :param N: numpy array with the axial forces (negative if compression).
+    :param My: numpy array with the bending moments around the weak axis.
+    :param Mz: numpy array with the bending moments around the strong axis.
+    :param Vy: numpy array with the shear forces parallel to the web.
+    :param LeqY: buckling length in XZ buckling plane (weak axis).
+    :param LeqZ: buckling length in XY buckling plane (strong axis).
+    :param bucklingCurveY: buckling curve for the weak axis.
+    :param bucklingCurveZ: buckling curve for the strong axis.
+    :param chiLT: lateral torsional buckling reduction factor.
+    '''
+    fy= steel.fy
+    gammaM0= steel.gammaM0()
+    gammaM1= steel.gammaM1
+    # Section classes.
+    sectionClasses= catalogue.getSectionClasses(steel,bool(numpy.any(N<0.0)))
+    elastic= (sectionClasses==3)
+    # Resistances (a row for each shape).
+    NRk= (catalogue.A*fy)[:,numpy.newaxis]
+    MyRk= (numpy.where(elastic,catalogue.Wyel,catalogue.Wypl)*fy)[:,numpy.newaxis]
+    MzRk= (numpy.where(elastic,catalogue.Wzel,catalogue.Wzpl)*fy)[:,numpy.newaxis]
+    VplRd= (catalogue.Avy*fy/math.sqrt(3)/gammaM0)[:,numpy.newaxis]
+    chiY= getBucklingReductionFactors(catalogue,steel,LeqY,bucklingCurveY,catalogue.Iy)
+    chiZ= getBucklingReductionFactors(catalogue,steel,LeqZ,bucklingCurveZ,catalogue.Iz)
+    chiMin= numpy.minimum(chiY,chiZ)[:,numpy.newaxis]
+    # Internal forces (a column for each sample).
+    absN= numpy.abs(N)[numpy.newaxis,:]
+    absMy= numpy.abs(My)[numpy.newaxis,:]
+    absMz= numpy.abs(Mz)[numpy.newaxis,:]
+    Nc= numpy.maximum(-N,0.0)[numpy.newaxis,:]
+    crossSection= (absN/NRk+absMz/MzRk+absMy/MyRk)*gammaM0
+    shear= numpy.abs(Vy)[numpy.newaxis,:]/VplRd
+    stability= (Nc/(chiMin*NRk)+absMz/(chiLT*MzRk)+absMy/MyRk)*gammaM1
+    retval= numpy.maximum(numpy.maximum(crossSection,shear),stability).max(axis= 1)
+    # No effective properties: class 4 shapes discarded.
+    retval[sectionClasses>3]= numpy.inf
+    return retval
+
+def getElementInternalForces(elem):
+    '''Return the axial forces, bending moments and shear forces at
+       both ends of the element as (N, My, Mz, Vy) lists (My is zero
+       for 2D elements).'''
+    elem.getResistingForce()
+    N= [elem.getN1, elem.getN2]
+    Mz= [elem.getMz1, elem.getMz2]
+    Vy= [elem.getVy1, elem.getVy2]
+    if(hasattr(elem,'getMy1')):
+        My= [elem.getMy1, elem.getMy2]
+    else:
+        My= [0.0, 0.0]
+    return N, My, Mz, Vy
+
+class MemberGroup(object):
+    '''Group of elements that must have the same shape.
+
+    :ivar name: name of the group.
+    :ivar elements: elements of the group.
+    :ivar LeqY: buckling length in XZ buckling plane (weak axis).
+    :ivar LeqZ: buckling length in XY buckling plane (strong axis).
+    :ivar bucklingCurveY: buckling curve for the weak axis.
+    :ivar bucklingCurveZ: buckling curve for the strong axis.
+    :ivar chiLT: lateral torsional buckling reduction factor
+                 (1.0 if the member is laterally restrained).
+    :ivar shapeIndex: index of the shape in the catalogue.
+    '''
+    def __init__(self, name, elements, LeqY, LeqZ, bucklingCurveY= 'c', bucklingCurveZ= 'b', chiLT= 1.0):
+        self.name= name
+        self.elements= elements
+        self.LeqY= LeqY
+        self.LeqZ= LeqZ
+        self.bucklingCurveY= bucklingCurveY
+        self.bucklingCurveZ= bucklingCurveZ
+        self.chiLT= chiLT
+        self.shapeIndex= 0
+        self.resetInternalForces()
+
+    def resetInternalForces(self):
+        '''Clear the internal forces obtained in previous analyses.'''
+        self.N= list()
+        self.My= list()
+        self.Mz= list()
+        self.Vy= list()
+
+    def appendInternalForces(self):
+        '''Append the internal forces of the elements for the current
+           load combination.'''
+        for e in self.elements:
+            N, My, Mz, Vy= getElementInternalForces(e)
+            self.N.extend(N)
+            self.My.extend(My)
+            self.Mz.extend(Mz)
+            self.Vy.extend(Vy)
+
+    def getEfficiencies(self, catalogue, steel):
+        '''Return the efficiencies of all the shapes of the catalogue
+           under the internal forces of the group.'''
+        return getEfficiencies(catalogue,steel,numpy.array(self.N),numpy.array(self.My),numpy.array(self.Mz),numpy.array(self.Vy),self.LeqY,self.LeqZ,self.bucklingCurveY,self.bucklingCurveZ,self.chiLT)
+
+    def getLength(self):
+        '''Return the sum of the lengths of the elements of the group.'''
+        return sum([e.getLineSegment(True).getLength() for e in self.elements])
+
+    def setShape(self, catalogue, index):
+        '''Assign the shape of the catalogue to the elements of the group
+           (the elastic modulus and the shear modulus of the elements
+           are kept).'''
+        self.shapeIndex= index
+        for e in self.elements:
+            sp= e.sectionProperties
+            sp.A= catalogue.A[index]
+            if(isinstance(sp,xc.CrossSectionProperties3d)):
+                sp.Iz= catalogue.Iz[index]
+                sp.Iy= catalogue.Iy[index]
+                sp.J= catalogue.It[index]
+            else:
+                sp.I= catalogue.Iz[index]
+            e.sectionProperties= sp
+
+class SteelMemberSizing(object):
+    '''Search of the lightest shapes of a catalogue that satisfy
+    the EC3 criteria for each group of members.
+
+    :ivar preprocessor: preprocessor of the finite element problem.
+    :ivar steel: steel material (i.e. EC3_materials.S275JR).
+    :ivar catalogue: candidate shapes.
+    :ivar groups: member groups.
+    :ivar combinations: names of the load combinations to check.
+    :ivar analysis: analysis used to solve the combinations.
+    :ivar stiffnessTol: relative change of the stiffness of a group
+                        that requires a new analysis.
+    :ivar maxIter: maximum number of iterations.
+    '''
+    def __init__(self, preprocessor, steel, catalogue, groups, combinations, analysis, stiffnessTol= 0.05, maxIter= 20):
+        self.preprocessor= preprocessor
+        self.steel= steel
+        self.catalogue= catalogue
+        self.groups= groups
+        self.combinations= combinations
+        self.analysis= analysis
+        self.stiffnessTol= stiffnessTol
+        self.maxIter= maxIter
+        self.numAnalyses= 0
+
+    def solveCombinations(self):
+        '''Analyze the model for each load combination and store
+           the internal forces of the groups. Return False if the
+           analysis of some combination fails.'''
+        for g in self.groups:
+            g.resetInternalForces()
+        self.numAnalyses+= 1
+        for comb in self.combinations:
+            result= predefined_solutions.resuelveComb(self.preprocessor,comb,self.analysis,1)
+            if(result!=0):
+                lmsg.error('analysis of combination: '+comb+' failed.')
+                return False
+            for g in self.groups:
+                g.appendInternalForces()
+        return True
+
+    def getStiffnessChange(self, i, j):
+        '''Return the maximum relative change of the section stiffness
+           (A, Iy, Iz) between the shapes i and j of the catalogue.'''
+        c= self.catalogue
+        return max([abs(p[j]-p[i])/p[i] for p in [c.A, c.Iy, c.Iz]])
+
+    def selectShapes(self):
+        '''Select for each group the lightest shape (not lighter than
+           the current one) that satisfies the criteria under the
+           current internal forces. Return the list of groups whose
+           shape has changed and the corresponding previous indexes.'''
+        retval= list()
+        for g in self.groups:
+            eff= g.getEfficiencies(self.catalogue,self.steel)
+            feasible= numpy.nonzero(eff[g.shapeIndex:]<=1.0)[0]
+            if(len(feasible)>0):
+                index= g.shapeIndex+int(feasible[0])
+            else:
+                index= self.catalogue.getNumberOfShapes()-1
+                lmsg.warning('no shape of the catalogue satisfies the criteria for group: '+g.name)
+            if(index!=g.shapeIndex):
+                retval.append((g,g.shapeIndex))
+                g.setShape(self.catalogue,index)
+        return retval
+
+    def run(self, initialShapes= None):
+        '''Size the members and return True if the process converged
+           (False if it didn't or if some analysis failed).
+
+        :param initialShapes: dictionary with the initial shape name
+                              for each group (defaults to the lightest
+                              shape of the catalogue).
+        '''
+        for g in self.groups:
+            index= 0
+            if(initialShapes and (g.name in initialShapes)):
+                index= self.catalogue.getIndex(initialShapes[g.name])
+            g.setShape(self.catalogue,index)
+        retval= False
+        self.numAnalyses= 0
+        for i in range(self.maxIter):
+            if(not self.solveCombinations()):
+                return False
+            changes= self.selectShapes()
+            stiffnessChange= 0.0
+            for g, previous in changes:
+                stiffnessChange= max(stiffnessChange,self.getStiffnessChange(previous,g.shapeIndex))
+            if(stiffnessChange<=self.stiffnessTol):
+                retval= True
+                break
+        if(not retval):
+            lmsg.warning('member sizing did not converge after '+str(self.maxIter)+' iterations.')
+        return retval
+
+    def getShapeNames(self):
+        '''Return a dictionary with the name of the shape assigned
+           to each group.'''
+        return {g.name: self.catalogue.names[g.shapeIndex] for g in self.groups}
+
+    def getEfficiencies(self):
+        '''Return a dictionary with the efficiency of the shape assigned
+           to each group under the last computed internal forces.'''
+        return {g.name: g.getEfficiencies(self.catalogue,self.steel)[g.shapeIndex] for g in self.groups}
+
+    def getTotalWeight(self):
+        '''Return the weight (mass) of the members.'''
+        return sum([self.catalogue.P[g.shapeIndex]*g.getLength() for g in self.groups])
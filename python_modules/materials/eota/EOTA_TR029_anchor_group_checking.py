@@ -0,0 +1,438 @@
+# -*- coding: utf-8 -*-
+''' Checking of the anchor groups of a set of base plates for all the
+load combinations at once according to EOTA TR029.
+
+The basic resistances of each anchor layout are computed with the
+functions of EOTA_TR029_limit_state_checking; the projected areas, the
+edge, eccentricity and thickness factors and the forces in the anchors
+are computed with numpy arrays whose first index corresponds to the
+base plate and the second one to the load combination, so the checking
+of thousands of base plates under hundreds of combinations doesn't need
+loops in Python.
+
+Assumptions:
+
+- the base plate is rigid and the tension forces in the anchors are
+  obtained with a linear distribution over the anchors (the compressed
+  anchors are ignored).
+- the concrete support of each base plate is a rectangle whose sides
+  are parallel to the axes of the plate.
+- the shear force is distributed equally between the anchors and the
+  concrete edge failure is checked for the row of anchors closest to
+  the loaded edge, which is assumed to resist all the shear force.
+- the factors psi_g,Np, psi_re,N and psi_ec,V are taken as 1.0 and the
+  splitting failure is always checked.
+'''
+
+from __future__ import division
+
+__author__= "Ana Ortega (AO_O) and Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2018, AO_O and LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= " ana.Ortega.Ort@gmail.com, l.pereztato@gmail.com"
+
+import numpy
+from materials.eota import EOTA_TR029_limit_state_checking as tr029
+from miscUtils import LogMessages as lmsg
+
+# Names of the checked failure modes (the order corresponds to the last
+# index of the utilization array).
+failureModes= ['steel tension', 'pull-out', 'concrete cone', 'splitting', 'steel shear', 'pry-out', 'concrete edge', 'interaction']
+
+class AnchorGroupLayout(object):
+    '''Anchors of a base plate (all of them of the same type) and
+    concrete of the support.
+
+    :ivar x: x coordinates of the anchors (plate axes).
+    :ivar y: y coordinates of the anchors (plate axes).
+    :ivar d: anchor diameter (m).
+    :ivar hEf: effective anchorage depth (m).
+    :ivar tauRkUcr: characteristic bond resistance for non-cracked
+                    concrete (Pa).
+    :ivar fckCube: characteristic concrete compression strength measured
+                   on cubes with a side length of 150 mm (Pa).
+    :ivar cracked: true if the concrete is cracked.
+    '''
+    def __init__(self, positions, d, As, fuk, hEf, tauRk, tauRkUcr, fckCube, cracked= False):
+        '''Constructor.
+
+        :param positions: positions of the anchors (geom.Pos2d) in the
+                          axes of the base plate.
+        :param d: anchor diameter (m).
+        :param As: stressed cross section of steel (m2).
+        :param fuk: characteristic steel ultimate tensile strength (Pa).
+        :param hEf: effective anchorage depth (m).
+        :param tauRk: characteristic bond resistance (Pa).
+        :param tauRkUcr: characteristic bond resistance for non-cracked
+                         concrete (Pa).
+        :param fckCube: characteristic concrete compression strength
+                        measured on cubes (Pa).
+        :param cracked: true if the concrete is cracked.
+        '''
+        self.x= numpy.array([p.x for p in positions])
+        self.y= numpy.array([p.y for p in positions])
+        self.d= d
+        self.hEf= hEf
+        self.tauRkUcr= tauRkUcr
+        self.fckCube= fckCube
+        self.cracked= cracked
+        k1= 7.2 if cracked else 10.1
+        self.NRks= tr029.axialResistanceSteelFailure(As,fuk)
+        self.VRks= tr029.shearResistanceWithoutLeverArm(As,fuk)
+        self.N0Rkp= tr029.axialInitialResistancePullOut(d,hEf,tauRk)
+        self.N0Rkc= tr029.axialInitialResistanceConeFailure(k1,fckCube,hEf)
+        self.scrNp= tr029.getScrNp(d,hEf,tauRkUcr)
+        self.scrN= tr029.getScrN(hEf)
+
+    def getNumberOfAnchors(self):
+        '''Return the number of anchors of the layout.'''
+        return len(self.x)
+
+    def getShearK1(self):
+        '''Return the factor k1 of expression 5.8a of EOTA TR029.'''
+        return 1.7 if self.cracked else 2.4
+
+def getSortedExtent(coords, mask, cap):
+    '''Return the smallest and the largest coordinates of the anchors
+       selected by the mask and the sum of the distances between
+       consecutive anchors (each one limited to the cap value). The
+       computation is made along the last axis of the arrays.
+
+    :param coords: coordinates of the anchors.
+    :param mask: true for the selected anchors.
+    :param cap: maximum distance between anchors to take into account.
+    '''
+    s= numpy.sort(numpy.where(mask,coords,numpy.inf),axis= -1)
+    gaps= numpy.diff(s,axis= -1)
+    gaps= numpy.where(numpy.isfinite(gaps),gaps,0.0)
+    first= s[...,0]
+    last= numpy.max(numpy.where(mask,coords,-numpy.inf),axis= -1)
+    return first, last, numpy.sum(numpy.minimum(gaps,cap[...,None]),axis= -1)
+
+def getProjectedAreaFactors(x, y, mask, contours, scr):
+    '''Return the ratio between the projected area of the anchors
+       selected by the mask and the area of a single anchor (A/A0) and
+       the smallest edge distance of those anchors.
+
+    :param x: x coordinates of the anchors.
+    :param y: y coordinates of the anchors.
+    :param mask: true for the selected anchors.
+    :param contours: xMin, xMax, yMin and yMax of the concrete support
+                     (one row for each base plate).
+    :param scr: side of the influence area of a single anchor.
+    '''
+    ccr= scr/2.0
+    xFirst, xLast, xGaps= getSortedExtent(x,mask,scr)
+    yFirst, yLast, yGaps= getSortedExtent(y,mask,scr)
+    cx0= xFirst-contours[:,0,None]; cx1= contours[:,1,None]-xLast
+    cy0= yFirst-contours[:,2,None]; cy1= contours[:,3,None]-yLast
+    lx= numpy.minimum(cx0,ccr)+xGaps+numpy.minimum(cx1,ccr)
+    ly= numpy.minimum(cy0,ccr)+yGaps+numpy.minimum(cy1,ccr)
+    anyAnchor= numpy.any(mask,axis= -1)
+    areaRatio= numpy.where(anyAnchor,lx*ly,0.0)/scr**2
+    cMin= numpy.minimum(numpy.minimum(cx0,cx1),numpy.minimum(cy0,cy1))
+    return areaRatio, numpy.where(anyAnchor,cMin,ccr)
+
+def getEdgeFactors(c, ccr):
+    '''Factor that takes into account the influence of the distance to
+       the edge in the stress distribution (see getFactor1N).
+
+    :param c: edge distance.
+    :param ccr: critical distance to the edge.
+    '''
+    return numpy.minimum(0.7+0.3*c/ccr,1.0)
+
+def getEccentricityFactors(e, scr):
+    '''Factor that takes into account the eccentricity of the tension
+       force with respect to the centroid of the tensioned anchors
+       (expression 5.2h of EOTA TR029).
+
+    :param e: eccentricity.
+    :param scr: side of the influence area of a single anchor.
+    '''
+    return 1.0/(1.0+2.0*e/scr)
+
+def getReactionArrays(table, plateIds, combNames):
+    '''Return a dictionary with the arrays of the forces transmitted to
+       the base plates (N, Vx, Vy, Mx, My) whose first index corresponds
+       to the base plate and the second one to the load combination
+       (the missing values are set to zero).
+
+    :param table: rows (plateId, combName, N, Vx, Vy, Mx, My) of the
+                  reaction table.
+    :param plateIds: identifiers of the base plates.
+    :param combNames: names of the load combinations.
+    '''
+    iPlates= dict((p,i) for i, p in enumerate(plateIds))
+    iCombs= dict((c,j) for j, c in enumerate(combNames))
+    shape= (len(plateIds),len(combNames))
+    retval= dict((k,numpy.zeros(shape)) for k in ['N','Vx','Vy','Mx','My'])
+    for row in table:
+        i= iPlates[row[0]]; j= iCombs[row[1]]
+        for k, value in zip(['N','Vx','Vy','Mx','My'],row[2:]):
+            retval[k][i,j]= value
+    return retval
+
+class AnchorGroupCheckResults(object):
+    '''Utilization factors of the anchor groups.
+
+    :ivar utilization: array of utilization factors whose indexes
+                       correspond to the base plate, the load combination
+                       and the failure mode (see failureModes).
+    '''
+    def __init__(self, utilization):
+        self.utilization= utilization
+
+    def getModeUtilization(self, modeName):
+        '''Return the utilization factors of the failure mode argument
+           (one row for each base plate and one column for each
+           combination).'''
+        return self.utilization[:,:,failureModes.index(modeName)]
+
+    def getGoverning(self):
+        '''Return the governing utilization factor of each base plate,
+           the name of the failure mode and the index of the combination
+           that produce it.'''
+        nPlates, nCombs, nModes= self.utilization.shape
+        flat= self.utilization.reshape(nPlates,nCombs*nModes)
+        idx= numpy.argmax(flat,axis= 1)
+        util= flat[numpy.arange(nPlates),idx]
+        modes= [failureModes[i%nModes] for i in idx]
+        return util, modes, idx//nModes
+
+    def getFailedPlates(self):
+        '''Return the indexes of the base plates whose utilization
+           factor is greater than one.'''
+        util, modes, combs= self.getGoverning()
+        return list(numpy.nonzero(util>1.0)[0])
+
+class AnchorGroupChecker(object):
+    '''Checking of the anchor groups of a set of base plates according
+    to EOTA TR029.
+
+    :ivar layouts: anchor layouts.
+    :ivar layoutIndices: index of the layout of each base plate.
+    :ivar contours: xMin, xMax, yMin and yMax of the concrete support of
+                    each base plate (in the axes of the plate).
+    :ivar h: thickness of the concrete support of each base plate.
+    :ivar gammaMs: partial safety factor for steel in tension.
+    :ivar gammaMsV: partial safety factor for steel in shear.
+    :ivar gammaMc: partial safety factor for concrete.
+    :ivar psiReV: factor that takes into account the reinforcement of
+                  the edge (see psiReVFactor).
+    '''
+    def __init__(self, layouts, layoutIndices, contours, h, gammaMs= 1.4, gammaMsV= 1.25, gammaMc= 2.1, psiReV= 1.0, CcrSp= None):
+        '''Constructor.
+
+        :param layouts: anchor layouts.
+        :param layoutIndices: index of the layout of each base plate.
+        :param contours: xMin, xMax, yMin and yMax of the concrete
+                         support of each base plate.
+        :param h: thickness of the concrete support of each base plate.
+        :param gammaMs: partial safety factor for steel in tension.
+        :param gammaMsV: partial safety factor for steel in shear.
+        :param gammaMc: partial safety factor for concrete.
+        :param psiReV: factor that takes into account the reinforcement
+                       of the edge.
+        :param CcrSp: critical edge distance for splitting failure of
+                      each base plate (if None it's computed with
+                      getCcrSpHiltiHY150).
+        '''
+        self.layouts= layouts
+        self.layoutIndices= numpy.array(layoutIndices,dtype= int)
+        self.contours= numpy.array(contours,dtype= float).reshape(-1,4)
+        nPlates= len(self.layoutIndices)
+        self.h= numpy.array(h,dtype= float)*numpy.ones(nPlates)
+        self.gammaMs= gammaMs
+        self.gammaMsV= gammaMsV
+        self.gammaMc= gammaMc
+        self.psiReV= psiReV
+        # Anchor coordinates (the rows of the layouts with less anchors
+        # are padded and masked out).
+        nMax= max([l.getNumberOfAnchors() for l in layouts])
+        self.x= numpy.zeros((nPlates,nMax))
+        self.y= numpy.zeros((nPlates,nMax))
+        self.mask= numpy.zeros((nPlates,nMax),dtype= bool)
+        for i, l in enumerate(layouts):
+            rows= (self.layoutIndices==i)
+            n= l.getNumberOfAnchors()
+            self.x[rows,:n]= l.x
+            self.y[rows,:n]= l.y
+            self.mask[rows,:n]= True
+        self.numAnchors= numpy.sum(self.mask,axis= 1)
+        # Basic resistances of each base plate.
+        def getLayoutValues(name):
+            return numpy.array([getattr(l,name) for l in layouts])[self.layoutIndices]
+        self.NRks= getLayoutValues('NRks')
+        self.VRks= getLayoutValues('VRks')
+        self.N0Rkp= getLayoutValues('N0Rkp')
+        self.N0Rkc= getLayoutValues('N0Rkc')
+        self.scrNp= getLayoutValues('scrNp')
+        self.scrN= getLayoutValues('scrN')
+        self.d= getLayoutValues('d')
+        self.hEf= getLayoutValues('hEf')
+        self.fckCube= getLayoutValues('fckCube')
+        self.k1V= numpy.array([l.getShearK1() for l in layouts])[self.layoutIndices]
+        if(CcrSp is None):
+            CcrSp= [tr029.getCcrSpHiltiHY150(hi,hEfi) for hi, hEfi in zip(self.h,self.hEf)]
+        self.CcrSp= numpy.array(CcrSp,dtype= float)*numpy.ones(nPlates)
+        self.VRdcp= self.computePryOutResistances()
+        self.VRdcEdges= self.computeEdgeResistances()
+
+    def getNumberOfPlates(self):
+        '''Return the number of base plates.'''
+        return len(self.layoutIndices)
+
+    def computePryOutResistances(self):
+        '''Return the design resistance to concrete pry-out failure
+           of the anchor group of each base plate (expression 5.7 of
+           EOTA TR029).'''
+        mask= self.mask[:,None,:]
+        x= self.x[:,None,:]; y= self.y[:,None,:]
+        ApN, cp= getProjectedAreaFactors(x,y,mask,self.contours,self.scrNp[:,None])
+        AcN, cc= getProjectedAreaFactors(x,y,mask,self.contours,self.scrN[:,None])
+        NRkp= self.N0Rkp*ApN[:,0]*getEdgeFactors(cp[:,0],self.scrNp/2.0)
+        NRkc= self.N0Rkc*AcN[:,0]*getEdgeFactors(cc[:,0],self.scrN/2.0)
+        k= numpy.where(self.hEf>=60e-3,2.0,1.0)
+        return k*numpy.minimum(NRkp,NRkc)/self.gammaMc
+
+    def computeEdgeResistance(self, normal, parallel, edge, sign, lo, hi):
+        '''Return the design resistance to concrete edge failure of the
+           row of anchors closest to an edge of the concrete support
+           (clause 5.2.3.4 of EOTA TR029).
+
+        :param normal: coordinates of the anchors normal to the edge.
+        :param parallel: coordinates of the anchors parallel to the edge.
+        :param edge: coordinate of the edge.
+        :param sign: 1 if the edge is on the positive side, -1 otherwise.
+        :param lo: coordinate of the lateral edge on the negative side.
+        :param hi: coordinate of the lateral edge on the positive side.
+        '''
+        dist= numpy.where(self.mask,sign*(edge[:,None]-normal),numpy.inf)
+        c1= numpy.min(dist,axis= 1)
+        row= self.mask & (dist<=c1[:,None]+1e-6)
+        first, last, gaps= getSortedExtent(parallel,row,3.0*c1)
+        c2Lo= first-lo; c2Hi= hi-last
+        hc= numpy.minimum(1.5*c1,self.h)
+        AcV= (numpy.minimum(c2Lo,1.5*c1)+gaps+numpy.minimum(c2Hi,1.5*c1))*hc
+        A0cV= 4.5*c1**2
+        psiSV= numpy.minimum(0.7+0.2*numpy.minimum(c2Lo,c2Hi)/c1,1.0)
+        psiHV= numpy.maximum(numpy.sqrt(1.5*c1/self.h),1.0)
+        # Expression 5.8a (d, lf and c1 in mm, fck in N/mm2).
+        lf= numpy.minimum(self.hEf,8*self.d)
+        alpha= 0.1*numpy.sqrt(lf/c1)
+        beta= 0.1*(self.d/c1)**0.2
+        V0Rkc= self.k1V*(self.d*1e3)**alpha*(lf*1e3)**beta*numpy.sqrt(self.fckCube/1e6)*(c1*1e3)**1.5
+        return V0Rkc*AcV/A0cV*psiSV*psiHV*self.psiReV/self.gammaMc
+
+    def computeEdgeResistances(self):
+        '''Return the design resistances to concrete edge failure for
+           the loads perpendicular to each edge of the concrete support
+           (xMin, xMax, yMin and yMax columns).'''
+        c= self.contours
+        retval= numpy.zeros((self.getNumberOfPlates(),4))
+        retval[:,0]= self.computeEdgeResistance(self.x,self.y,c[:,0],-1.0,c[:,2],c[:,3])
+        retval[:,1]= self.computeEdgeResistance(self.x,self.y,c[:,1],1.0,c[:,2],c[:,3])
+        retval[:,2]= self.computeEdgeResistance(self.y,self.x,c[:,2],-1.0,c[:,0],c[:,1])
+        retval[:,3]= self.computeEdgeResistance(self.y,self.x,c[:,3],1.0,c[:,0],c[:,1])
+        return retval
+
+    def getAnchorTensions(self, N, Mx, My):
+        '''Return the tension forces in the anchors (indexes: base plate,
+           combination and anchor) assuming a rigid base plate.
+
+        :param N: axial forces (positive if they produce tension in the
+                  anchors).
+        :param Mx: moments about the x axis (positive if they produce
+                   tension in the anchors with positive y).
+        :param My: moments about the y axis (positive if they produce
+                   tension in the anchors with positive x).
+        '''
+        n= self.numAnchors
+        dx= (self.x-(numpy.sum(self.x*self.mask,axis= 1)/n)[:,None])*self.mask
+        dy= (self.y-(numpy.sum(self.y*self.mask,axis= 1)/n)[:,None])*self.mask
+        Ix= numpy.sum(dx**2,axis= 1); Iy= numpy.sum(dy**2,axis= 1)
+        kx= numpy.where(Ix>0.0,dx/numpy.where(Ix>0.0,Ix,1.0)[:,None],0.0)
+        ky= numpy.where(Iy>0.0,dy/numpy.where(Iy>0.0,Iy,1.0)[:,None],0.0)
+        retval= N[:,:,None]/n[:,None,None]+My[:,:,None]*kx[:,None,:]+Mx[:,:,None]*ky[:,None,:]
+        return numpy.maximum(retval,0.0)*self.mask[:,None,:]
+
+    def getTensionResistances(self, Nt, scr, ccr, N0Rd):
+        '''Return the design resistance of the tensioned anchors of each
+           base plate for each combination (pull-out, cone or splitting
+           depending on the arguments).
+
+        :param Nt: tension forces in the anchors.
+        :param scr: side of the influence area of a single anchor.
+        :param ccr: critical edge distance.
+        :param N0Rd: design resistance of a single anchor.
+        '''
+        tensioned= (Nt>0.0)
+        x= self.x[:,None,:]; y= self.y[:,None,:]
+        areaRatio, c= getProjectedAreaFactors(x,y,tensioned,self.contours,scr[:,None])
+        Ng= numpy.sum(Nt,axis= 2)
+        nt= numpy.maximum(numpy.sum(tensioned,axis= 2),1)
+        NgSafe= numpy.where(Ng>0.0,Ng,1.0)
+        ex= numpy.abs(numpy.sum(Nt*x,axis= 2)/NgSafe-numpy.sum(tensioned*x,axis= 2)/nt)
+        ey= numpy.abs(numpy.sum(Nt*y,axis= 2)/NgSafe-numpy.sum(tensioned*y,axis= 2)/nt)
+        psiEc= getEccentricityFactors(ex,scr[:,None])*getEccentricityFactors(ey,scr[:,None])
+        return N0Rd[:,None]*areaRatio*getEdgeFactors(c,ccr[:,None])*psiEc
+
+    def getEdgeUtilization(self, V, Vx, Vy):
+        '''Return the utilization factors for concrete edge failure.
+
+        :param V: shear force modulus.
+        :param Vx: shear force component along the x axis.
+        :param Vy: shear force component along the y axis.
+        '''
+        R= self.VRdcEdges
+        VRx= numpy.where(Vx>0.0,R[:,1,None],numpy.where(Vx<0.0,R[:,0,None],numpy.minimum(R[:,0],R[:,1])[:,None]))
+        VRy= numpy.where(Vy>0.0,R[:,3,None],numpy.where(Vy<0.0,R[:,2,None],numpy.minimum(R[:,2],R[:,3])[:,None]))
+        VSafe= numpy.where(V>0.0,V,1.0)
+        cosX= numpy.abs(Vx)/VSafe; cosY= numpy.abs(Vy)/VSafe
+        # Angle between the load and the direction perpendicular to the
+        # edge (expression 5.8g of EOTA TR029).
+        psiAlphaX= numpy.maximum(numpy.sqrt(1.0/(cosX**2+(cosY/2.5)**2+1e-12)),1.0)
+        psiAlphaY= numpy.maximum(numpy.sqrt(1.0/(cosY**2+(cosX/2.5)**2+1e-12)),1.0)
+        return numpy.maximum(V/(VRx*psiAlphaX),V/(VRy*psiAlphaY))
+
+    def check(self, N, Vx, Vy, Mx, My):
+        '''Compute the utilization factors of the anchor groups for each
+           base plate, combination and failure mode. The arguments are
+           arrays with a row for each base plate and a column for each
+           combination (see getReactionArrays).
+
+        :param N: axial forces (positive if they produce tension in the
+                  anchors).
+        :param Vx: shear forces along the x axis.
+        :param Vy: shear forces along the y axis.
+        :param Mx: moments about the x axis (positive if they produce
+                   tension in the anchors with positive y).
+        :param My: moments about the y axis (positive if they produce
+                   tension in the anchors with positive x).
+        '''
+        N, Vx, Vy, Mx, My= [numpy.array(v,dtype= float).reshape(self.getNumberOfPlates(),-1) for v in (N,Vx,Vy,Mx,My)]
+        nCombs= N.shape[1]
+        retval= numpy.zeros((self.getNumberOfPlates(),nCombs,len(failureModes)))
+        # Tension.
+        Nt= self.getAnchorTensions(N,Mx,My)
+        Ng= numpy.sum(Nt,axis= 2)
+        retval[:,:,0]= numpy.max(Nt,axis= 2)/(self.NRks/self.gammaMs)[:,None]
+        NRdp= self.getTensionResistances(Nt,self.scrNp,self.scrNp/2.0,self.N0Rkp/self.gammaMc)
+        NRdc= self.getTensionResistances(Nt,self.scrN,self.scrN/2.0,self.N0Rkc/self.gammaMc)
+        NRdsp= self.getTensionResistances(Nt,2.0*self.CcrSp,self.CcrSp,self.N0Rkc/self.gammaMc)
+        for k, NRd in zip([1,2,3],[NRdp,NRdc,NRdsp]):
+            retval[:,:,k]= numpy.where(Ng>0.0,Ng/numpy.where(NRd>0.0,NRd,1.0),0.0)
+        # Shear.
+        V= numpy.sqrt(Vx**2+Vy**2)
+        retval[:,:,4]= V/self.numAnchors[:,None]/(self.VRks/self.gammaMsV)[:,None]
+        retval[:,:,5]= V/self.VRdcp[:,None]
+        retval[:,:,6]= self.getEdgeUtilization(V,Vx,Vy)
+        # Interaction (expression 5.9 of EOTA TR029).
+        betaN= numpy.max(retval[:,:,0:4],axis= 2)
+        betaV= numpy.max(retval[:,:,4:7],axis= 2)
+        retval[:,:,7]= betaN**1.5+betaV**1.5
+        if(numpy.any(numpy.isnan(retval))):
+            lmsg.warning('AnchorGroupChecker::check; some utilization factors are not defined; check the anchor positions and the contours of the supports.')
+        return AnchorGroupCheckResults(retval)
@@ -153,7 +153,7 @@ def getCcrSpHiltiHY150(h, hEf):
    :param hEf: effective anchorage depth (m).
   '''
   if(h>=2*hEf):
-    return hef 
+    return hEf
   elif(h>1.3*hEf):
     return 4.6*hEf-1.8*h 
   else:
@@ -69,8 +69,7 @@ class PrestressTendon(object):
         '''Return for each point in fineCoordMtr the distance to the preceding 
         point
         '''
-        lseq=[0]+[distance.euclidean((self.fineCoordMtr[0][i],self.fineCoordMtr[1][i],self.fineCoordMtr[2][i]),(self.fineCoordMtr[0][i+1],self.fineCoordMtr[1][i+1],self.fineCoordMtr[2][i+1])) for i in range(len(self.fineCoordMtr[0])-1)]
-        return lseq
+        return np.concatenate(([0.0],np.linalg.norm(np.diff(self.fineCoordMtr,axis=1),axis=0)))
 
     def getCumLength(self):
         '''Return for each point in fineCoordMtr the cumulative lenght of 
@@ -85,17 +84,13 @@ class PrestressTendon(object):
         tendon from its ending point
         '''
         lseq=self.getLengthSequence()
-        lseq.append(lseq.pop(0))
-        lseq.reverse()
-        lcum_back=np.cumsum(lseq)
-        return np.flipud(lcum_back)
+        return np.flipud(np.cumsum(np.append(lseq[1:],0.0)[::-1]))
 
     def getAngleSequence(self):
         '''Return for each point in fineCoordMtr the deviation deviation 
         (angle in rad) with respect to the preceding point
         '''
-        aseq=[0]+ [angle_between((self.fineDerivMtr[0][i], self.fineDerivMtr[1][i], self.fineDerivMtr[2][i]),(self.fineDerivMtr[0][i+1], self.fineDerivMtr[1][i+1], self.fineDerivMtr[2][i+1])) for i in range(len(self.fineDerivMtr[0])-1)]
-        return aseq
+        return np.concatenate(([0.0],angles_between(self.fineDerivMtr[:,:-1],self.fineDerivMtr[:,1:])))
         
     def getCumAngle(self):
         '''Return for each point in fineCoordMtr the cumulative angular 
@@ -109,10 +104,7 @@ class PrestressTendon(object):
         deviation (angle in rad) of the tendon from its ending point
         '''
         aseq=self.getAngleSequence()
-        aseq.append(aseq.pop(0))
-        aseq.reverse()
-        acum_back=np.cumsum(aseq)
-        return np.flipud(acum_back)
+        return np.flipud(np.cumsum(np.append(aseq[1:],0.0)[::-1]))
 
     def creaTendonElements(self,preprocessor,materialName,elemTypeName,crdTransfName,areaTendon,setName):
         '''Creates the nodes and elements of the tendon and appends them to a set. Creates also the attribute lstOrderedElems as a list with the elements of the tendon ordered from left to right.
@@ -173,12 +165,12 @@ class PrestressTendon(object):
         if (sigmaP0_extr1 != 0.0):
             cum_len=self.getCumLength()
             cum_angl=self.getCumAngle()
-            loss_frict_ext1=np.array([sigmaP0_extr1*(1-math.exp(-coefFric*cum_angl[i]-k*cum_len[i])) for i in range(len(cum_angl))])
+            loss_frict_ext1=sigmaP0_extr1*(1-np.exp(-coefFric*cum_angl-k*cum_len))
             self.stressAfterLossFrictionOnlyExtr1=sigmaP0_extr1-loss_frict_ext1
         if (sigmaP0_extr2 != 0.0):
             cum_len=self.getReverseCumLength()
             cum_angl=self.getReverseCumAngle()
-            loss_frict_ext2=np.array([sigmaP0_extr2*(1-math.exp(-coefFric*cum_angl[i]-k*cum_len[i])) for i in range(len(cum_angl))])
+            loss_frict_ext2=sigmaP0_extr2*(1-np.exp(-coefFric*cum_angl-k*cum_len))
             self.stressAfterLossFrictionOnlyExtr2=sigmaP0_extr2-loss_frict_ext2
         if (sigmaP0_extr1 != 0.0) and (sigmaP0_extr2 != 0.0):
             self.lossFriction=np.minimum(loss_frict_ext1,loss_frict_ext2)
@@ -386,6 +378,233 @@ class PrestressTendon(object):
             ax2d.axis('equal')
         return fig,ax2d
 
+class PrestressTendonFamily(object):
+    '''Group of prestressing tendons whose geometry and losses of
+    prestress are computed all at once (the values corresponding to
+    all the points of all the tendons are stored in a single array,
+    tendon after tendon).
+
+    :ivar tendons: list of PrestressTendon objects.
+    :ivar offsets: index of the first point of each tendon in the 
+                   arrays of the family (the last value is the total
+                   number of points).
+    '''
+    def __init__(self,tendons):
+        self.tendons= tendons
+
+    def pntsInterpTendons(self,nPntsFine,smoothness,kgrade=3):
+        '''Interpolates the points of each tendon (see 
+        PrestressTendon.pntsInterpTendon) and computes the geometry
+        of the family.
+        '''
+        for t in self.tendons:
+            t.pntsInterpTendon(nPntsFine,smoothness,kgrade)
+        self.setupGeometry()
+
+    def setupGeometry(self):
+        '''Computes, for all the points of the tendons (that must be 
+        previously interpolated), the cumulative length and angular 
+        deviation from both extremities of its tendon.
+        '''
+        nPnts= np.array([len(t.fineCoordMtr[0]) for t in self.tendons])
+        self.offsets= np.concatenate(([0],np.cumsum(nPnts)))
+        self.tendonIndex= np.repeat(np.arange(len(self.tendons)),nPnts)
+        coords= np.concatenate([t.fineCoordMtr for t in self.tendons],axis=1)
+        derivs= np.concatenate([t.fineDerivMtr for t in self.tendons],axis=1)
+        starts= self.offsets[:-1]
+        # Sequences (zero at the first point of each tendon).
+        lseq= np.concatenate(([0.0],np.linalg.norm(np.diff(coords,axis=1),axis=0)))
+        lseq[starts]= 0.0
+        aseq= np.concatenate(([0.0],angles_between(derivs[:,:-1],derivs[:,1:])))
+        aseq[starts]= 0.0
+        self.lengthSequence= lseq
+        self.cumLength= self.getSegmentedCumSum(lseq)
+        self.cumAngle= self.getSegmentedCumSum(aseq)
+        self.tendonLength= self.cumLength[self.offsets[1:]-1]
+        self.revCumLength= self.tendonLength[self.tendonIndex]-self.cumLength
+        tendonAngle= self.cumAngle[self.offsets[1:]-1]
+        self.revCumAngle= tendonAngle[self.tendonIndex]-self.cumAngle
+        self.projXYcoord= np.concatenate([t.fineProjXYcoord for t in self.tendons])
+
+    def getSegmentedCumSum(self,values):
+        '''Return the cumulative sum of the values restarted at the first
+        point of each tendon.
+        '''
+        cs= np.cumsum(values)
+        cs0= cs[self.offsets[:-1]]-values[self.offsets[:-1]]
+        return cs-cs0[self.tendonIndex]
+
+    def getPointValues(self,tendonValues):
+        '''Return an array with the value of each point from the values
+        for each tendon (scalar or one value per tendon).
+        '''
+        v= np.broadcast_to(np.asarray(tendonValues,dtype=float),(len(self.tendons),))
+        return v[self.tendonIndex]
+
+    def getTendonValues(self,values,iTendon):
+        '''Return the part of the array that corresponds to the tendon
+        whose index is passed as parameter.
+        '''
+        return values[self.offsets[iTendon]:self.offsets[iTendon+1]]
+
+    def calcLossFriction(self,coefFric,k,sigmaP0_extr1=0.0,sigmaP0_extr2=0.0):
+        '''Creates the attributes lossFriction and stressAfterLossFriction
+        (see PrestressTendon.calcLossFriction) for all the tendons of
+        the family.
+
+        :param coefFric: coefficient of friction between the tendons and 
+                         their sheathing (scalar or one value per tendon).
+        :param k: wobble coefficient (scalar or one value per tendon).
+        :param sigmaP0_extr1: maximum stress applied at the extremity 1 of 
+                        the tendons (scalar or one value per tendon). 
+                        Defaults to 0.0 (no prestress applied)
+        :param sigmaP0_extr2: idem for prestress applied at extremity 2.
+        '''
+        mu= self.getPointValues(coefFric)
+        kw= self.getPointValues(k)
+        s1= self.getPointValues(sigmaP0_extr1)
+        s2= self.getPointValues(sigmaP0_extr2)
+        if (not s1.any()) and (not s2.any()):
+            lmsg.warning("No prestressing applied.")
+            return
+        self.stressAfterLossFrictionOnlyExtr1= s1*np.exp(-mu*self.cumAngle-kw*self.cumLength)
+        self.stressAfterLossFrictionOnlyExtr2= s2*np.exp(-mu*self.revCumAngle-kw*self.revCumLength)
+        loss1= s1-self.stressAfterLossFrictionOnlyExtr1
+        loss2= s2-self.stressAfterLossFrictionOnlyExtr2
+        self.lossFriction= np.where((s1!=0.0) & (s2!=0.0),np.minimum(loss1,loss2),np.where(s1!=0.0,loss1,loss2))
+        self.stressAfterLossFriction= np.maximum(self.stressAfterLossFrictionOnlyExtr1,self.stressAfterLossFrictionOnlyExtr2)
+        self.updateTendons(['lossFriction','stressAfterLossFriction','stressAfterLossFrictionOnlyExtr1','stressAfterLossFrictionOnlyExtr2'])
+
+    def getAnchorageLoss(self,sCoord,stress,slip,offsets,tendonIndex):
+        '''Return the loss due to the anchorage slip at the first point of
+        each tendon and the curvilinear coordinate of the point from which
+        the tendon is not affected by the slip.
+
+        The area between the stress diagram and its value in a point is 
+        integrated with the trapezoidal rule and the point where that area
+        equals half the slip (times Ep) is found by linear interpolation,
+        for all the tendons at once.
+
+        :param sCoord: curvilinear coordinate of the points (from the
+                       anchorage).
+        :param stress: stress after the loss due to friction.
+        :param slip: Ep times the anchorage slip in each tendon.
+        :param offsets: index of the first point of each tendon.
+        :param tendonIndex: index of the tendon of each point.
+        '''
+        starts= offsets[:-1]
+        ends= offsets[1:]-1
+        ds= np.concatenate(([0.0],np.diff(sCoord)))
+        ds[starts]= 0.0
+        avgStress= np.concatenate(([0.0],0.5*(stress[1:]+stress[:-1])))
+        inc= avgStress*ds
+        cs= np.cumsum(inc)
+        integral= cs-(cs[starts]-inc[starts])[tendonIndex]
+        f= integral-sCoord*stress-slip[tendonIndex]/2.0
+        # First point of each tendon where f>=0.
+        nPoints= len(sCoord)
+        candidates= np.where(f>=0.0,np.arange(nPoints),nPoints)
+        first= np.minimum.reduceat(candidates,starts)
+        affectsAll= (first>ends) | (slip<=0.0)
+        j= np.where(affectsAll,ends,np.maximum(first,starts+1))
+        i= j-1
+        denom= np.where(f[j]!=f[i],f[j]-f[i],1.0)
+        prop= np.clip(-f[i]/denom,0.0,1.0)
+        sZero= np.where(affectsAll,sCoord[ends],sCoord[i]+prop*(sCoord[j]-sCoord[i]))
+        stressZero= np.where(affectsAll,stress[ends],stress[i]+prop*(stress[j]-stress[i]))
+        tendonLength= sCoord[ends]
+        excess= np.where(affectsAll,-2.0*f[ends]/tendonLength,0.0)
+        loss= np.where(sCoord<=sZero[tendonIndex],2.0*(stress-stressZero[tendonIndex])+excess[tendonIndex],0.0)
+        loss[(slip<=0.0)[tendonIndex]]= 0.0
+        return loss, sZero
+
+    def calcLossAnchor(self,Ep,anc_slip_extr1=0.0,anc_slip_extr2=0.0):
+        '''Creates the attributes lossAnch and stressAfterLossAnch (see 
+        PrestressTendon.calcLossAnchor) for all the tendons of the family.
+        Loss due to friction must be previously calculated.
+
+        :param Ep: elastic modulus of the prestressing steel.
+        :param anc_slip_extr1: anchorage slip at extremity 1 of the 
+                               tendons (scalar or one value per tendon).
+        :param anc_slip_extr2: anchorage slip at extremity 2 of the 
+                               tendons (scalar or one value per tendon).
+        '''
+        nTendons= len(self.tendons)
+        slip1= Ep*np.broadcast_to(np.asarray(anc_slip_extr1,dtype=float),(nTendons,))
+        slip2= Ep*np.broadcast_to(np.asarray(anc_slip_extr2,dtype=float),(nTendons,))
+        lossAnchExtr1, sZero1= self.getAnchorageLoss(self.cumLength,self.stressAfterLossFrictionOnlyExtr1,slip1,self.offsets,self.tendonIndex)
+        # Extremity 2: same computation over the reversed arrays.
+        revOffsets= np.concatenate(([0],np.cumsum(np.diff(self.offsets)[::-1])))
+        revTendonIndex= (nTendons-1)-self.tendonIndex[::-1]
+        lossAnchExtr2, rZero2= self.getAnchorageLoss(self.revCumLength[::-1],self.stressAfterLossFrictionOnlyExtr2[::-1],slip2[::-1],revOffsets,revTendonIndex)
+        lossAnchExtr2= lossAnchExtr2[::-1]
+        sZero2= self.tendonLength-rZero2[::-1]
+        self.lossAnch= lossAnchExtr1+lossAnchExtr2
+        self.stressAfterLossAnch= self.stressAfterLossFriction-self.lossAnch
+        self.updateTendons(['lossAnch','stressAfterLossAnch'])
+        for i, t in enumerate(self.tendons):
+            sCoord= self.getTendonValues(self.cumLength,i)
+            projXY= self.getTendonValues(self.projXYcoord,i)
+            t.projXYcoordZeroAnchLoss= [0,projXY[-1]]
+            if slip1[i]>0.0:
+                t.projXYcoordZeroAnchLoss[0]= np.interp(sZero1[i],sCoord,projXY)
+            if slip2[i]>0.0:
+                t.projXYcoordZeroAnchLoss[1]= np.interp(sZero2[i],sCoord,projXY)
+
+    def calcLossElasticShortening(self,Ep,Ecm,sigmaCp):
+        '''Creates the attributes lossElastShort and stressAfterLossElastShort
+        with the loss of prestress due to the elastic shortening of concrete
+        when the tendons of the family are tensioned one after another
+        (average value: (n-1)/(2n)*Ep/Ecm*sigmaCp). Loss due to anchorage 
+        slip must be previously calculated.
+
+        :param Ep: elastic modulus of the prestressing steel.
+        :param Ecm: elastic modulus of concrete.
+        :param sigmaCp: stress in concrete at the level of the tendons due 
+                        to prestress (scalar, one value per tendon or one 
+                        value per point).
+        '''
+        n= len(self.tendons)
+        sigmaC= np.asarray(sigmaCp,dtype=float)
+        if sigmaC.size!=len(self.cumLength):
+            sigmaC= self.getPointValues(sigmaC)
+        self.lossElastShort= (n-1)/(2.0*n)*Ep/Ecm*sigmaC
+        self.stressAfterLossElastShort= self.stressAfterLossAnch-self.lossElastShort
+        self.updateTendons(['lossElastShort','stressAfterLossElastShort'])
+
+    def updateTendons(self,attributeNames):
+        '''Assigns to each tendon the part of the family arrays that 
+        corresponds to it.'''
+        for name in attributeNames:
+            values= np.split(getattr(self,name),self.offsets[1:-1])
+            for t, v in zip(self.tendons,values):
+                setattr(t,name,v)
+
+    def getElementStresses(self,stress):
+        '''Return the stress of each tendon element as the average of the 
+        stresses at its end points (elements of all the tendons, from the 
+        first to the last one).
+
+        :param stress: array with the stress in each point (i.e. 
+                       stressAfterLossAnch).
+        '''
+        mask= np.ones(len(stress)-1,dtype=bool)
+        mask[self.offsets[1:-1]-1]= False # segments between tendons.
+        return (0.5*(stress[1:]+stress[:-1]))[mask]
+
+    def applyStressToElems(self,stress):
+        '''Initializes the stress in the elements of all the tendons 
+        (created with PrestressTendon.creaTendonElements) from the stress
+        in their points.
+
+        :param stress: array with the stress in each point (i.e. 
+                       stressAfterLossAnch).
+        '''
+        elemStresses= self.getElementStresses(stress)
+        elems= [e for t in self.tendons for e in t.lstOrderedElems]
+        for e, s in zip(elems,elemStresses):
+            e.getMaterial().initialStress= s
+
 def angle_between(a,b):
     '''Return the angle between vectors a and b
     '''
@@ -394,6 +613,13 @@ def angle_between(a,b):
     arccosInput = -1.0 if arccosInput < -1.0 else arccosInput
     return math.acos(arccosInput)
 
+def angles_between(a,b):
+    '''Return the angles between the vectors in the columns of the
+    3*n matrices a and b.
+    '''
+    arccosInput= np.sum(a*b,axis=0)/np.linalg.norm(a,axis=0)/np.linalg.norm(b,axis=0)
+    return np.arccos(np.clip(arccosInput,-1.0,1.0))
+
 def set_axes_equal(ax):
     '''Make axes of 3D plot have equal scale so that spheres appear as spheres,
     cubes as cubes, etc..  This is one possible solution to Matplotlib's
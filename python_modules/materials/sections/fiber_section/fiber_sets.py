@@ -6,6 +6,26 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "l.pereztato@gmail.com" "ana.ortega@ciccp.es"
 
+import numpy
+
+# Methods of the fiber set that return, in one call, the values
+# obtained by calling the fiber method used as key on each fiber.
+bulkGetters= {'getArea':'getAreas', 'getLocY':'getYs', 'getLocZ':'getZs'}
+
+def getFiberSetArrays(fSet):
+    '''Return a dictionary with the strains, stresses, positions, areas
+       and material tags of the fibers of the set as numpy arrays (the
+       i-th component of each array corresponds to the i-th fiber).
+
+    :param fSet: set of fibers.
+    '''
+    return {'strain':numpy.array(fSet.getStrains()),
+            'stress':numpy.array(fSet.getStresses()),
+            'y':numpy.array(fSet.getYs()),
+            'z':numpy.array(fSet.getZs()),
+            'area':numpy.array(fSet.getAreas()),
+            'matTag':numpy.array(fSet.getMaterialTags())}
+
 
 class FiberSet:
     '''This class constructs a set of all the  fibers made of the same material
@@ -21,33 +41,27 @@ class FiberSet:
     def __init__(self,scc,setName,matTag):
         fiberSets= scc.getFiberSets()
         self.fSet= fiberSets.create(setName)
-        fibras= scc.getFibers()
-        for f in fibras:
-            if(f.getMaterial().tag==matTag):
-                self.fSet.insert(f)
+        scc.getFibers().selMatTag(matTag,self.fSet,True)
         self.fSet.updateCenterOfMass()
     def getFiberWithMinStrain(self):
         '''returns the fiber with the minimum strain from the set of fibers
         '''
         retval= None
-        epsMin= 1e9
-        for f in self.fSet:
-            eps= f.getMaterial().getStrain()
-            if(eps<epsMin):
-                retval= f
-                epsMin= eps
+        if(not self.fSet.empty()):
+            retval= self.fSet[self.fSet.getIFiberWithMinStrain()]
         return retval
     def getFiberWithMaxStrain(self):
         '''returns the fiber with the maximum strain from the set of fibers
         '''
         retval= None
-        epsMax= -1e9
-        for f in self.fSet:
-            eps= f.getMaterial().getStrain()
-            if(eps>epsMax):
-                retval= f
-                epsMax= eps
-        return retval     
+        if(not self.fSet.empty()):
+            retval= self.fSet[self.fSet.getIFiberWithMaxStrain()]
+        return retval
+    def getArrays(self):
+        '''returns the strains, stresses, positions, areas and material
+        tags of the fibers of the set as numpy arrays (see getFiberSetArrays).
+        '''
+        return getFiberSetArrays(self.fSet)
 
 class RCSets(object):
     '''This class constructs both the concrete and reinforced steel fiber sets 
@@ -76,9 +90,7 @@ class RCSets(object):
         '''returns a set with those fibers in tension from the total set 
         '''
         self.tensionFibers= scc.getFiberSets().create(tensionFibersSetName)
-        for f in self.reinfFibers.fSet:
-            if(f.getMaterial().getStress()>0.0):
-                self.tensionFibers.insert(f)
+        self.reinfFibers.fSet.selStressGreaterThan(0.0,self.tensionFibers,True)
         self.tensionFibers.updateCenterOfMass()
         return self.tensionFibers
     def getConcreteArea(self,factor):
@@ -140,11 +152,20 @@ def reselTensionFibers(scc,fiberSetName,tensionFibersSetName):
     '''
     fiberSet= scc.getFiberSets()[fiberSetName]
     tensionFibers= scc.getFiberSets().create(tensionFibersSetName)
-    for f in fiberSet:
-        if(f.getMaterial().getStress()>0.0):
-            tensionFibers.insert(f)
+    fiberSet.selStressGreaterThan(0.0,tensionFibers,True)
     return tensionFibers
 
+def reselCompressionFibers(scc,fiberSetName,compressionFibersSetName):
+    '''Returns the fibers under compression included in a set of fibers of a fiber section type
+
+    :param scc:          name identifying the fiber section
+    :param fiberSetName:     name identifying the set of fibers 
+    '''
+    fiberSet= scc.getFiberSets()[fiberSetName]
+    compressionFibers= scc.getFiberSets().create(compressionFibersSetName)
+    fiberSet.selStressSmallerThan(0.0,compressionFibers,True)
+    return compressionFibers
+
 def redefTensStiffConcr(setOfTenStffConcrFibSect,ft,Ets):
     '''Redefine the tension stiffening parameters of the concrete fibers in 
     set passed as parameter.
@@ -180,6 +201,20 @@ def fiberSectionSetupRC3Sets(scc,concrMatTag, concrSetName,reinfMatTag, reinfSet
     sets.reselTensionFibers(scc,"tensionedReinforcement")
     return sets
   
+def getFiberPropValues(fibers,methodName):
+    '''returns a numpy array with the values of a certain property
+    of the fibers of a set. Properties that the set can compute
+    in one call (area and position) don't need a loop over the fibers.
+    Parameters:
+      fibers:     set of fibers
+      methodName: name of the fiber method that returns the property
+    '''
+    if(methodName in bulkGetters):
+        retval= getattr(fibers,bulkGetters[methodName])()
+    else:
+        retval= [getattr(f, methodName)() for f in fibers]
+    return numpy.array(retval)
+
 def getIMaxPropFiber(fibers,methodName):
     '''returns the fiber from a set of fibers where the maximum value of a 
     certain property is reached
@@ -187,19 +222,7 @@ def getIMaxPropFiber(fibers,methodName):
       fibers:     set of fibers
       methodName: name of the method that returns the fiber property searched
     '''
-    retval= 0
-    sz= len(fibers)
-    f= fibers[0]
-    methodToCall= getattr(f, methodName)
-    maxValue= methodToCall()
-    for i in range(1,sz):
-        f= fibers[i]
-        methodToCall= getattr(f, methodName)
-        value= methodToCall()
-        if(value>maxValue):
-            maxValue= value
-            retval= i
-    return retval
+    return int(numpy.argmax(getFiberPropValues(fibers,methodName)))
 
 def getIMinPropFiber(fibers,methodName):
     '''returns the fiber from a set of fibers where the minimum value of a 
@@ -208,18 +231,6 @@ def getIMinPropFiber(fibers,methodName):
       fibers:     set of fibers
       methodName: name of the method that returns the fiber property searched
     '''
-    retval= 0
-    sz= len(fibers)
-    f= fibers[0]
-    methodToCall= getattr(f, methodName)
-    minValue= methodToCall()
-    for i in range(1,sz):
-        f= fibers[i]
-        methodToCall= getattr(f, methodName)
-        value= methodToCall()
-        if(value>minValue):
-            minValue= value
-            retval= i
-    return retval
+    return int(numpy.argmin(getFiberPropValues(fibers,methodName)))
 
 
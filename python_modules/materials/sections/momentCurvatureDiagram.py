@@ -1,8 +1,11 @@
 # -*- coding: utf-8 -*-
 ''' Moment curvature diagram for a section. '''
+import math
+import numpy as np
 import xc_base
 import geom
 import xc
+from miscUtils import LogMessages as lmsg
 from solution import predefined_solutions
 from model import predefined_spaces
 
@@ -56,3 +59,175 @@ def getMomentCurvatureDiagram3D(preprocessor, nmbSecc, esfAxil, maxK, numIncr):
   soluMethods= prb.getSolProc.getAnalysisAggregationContainer
   analysisAggregation= getAnalysisAggregation("analysisAggregation")
   integ= analysisAggregation.newIntegrator("displacement_control_integrator")
+
+
+def getFirstCrossing(x, y, values, threshold):
+  ''' Return the (x,y) point where values reaches the threshold for
+      the first time (linear interpolation between the bracketing rows)
+      or None if it never does.
+
+  :param x: abscissae (i.e. curvatures).
+  :param y: ordinates (i.e. bending moments).
+  :param values: values to compare with the threshold.
+  :param threshold: value to reach (if negative the values must
+                    go below it).
+  '''
+  v= np.asarray(values)*math.copysign(1.0,threshold)
+  t= abs(threshold)
+  idx= np.flatnonzero(v>=t)
+  if(len(idx)==0):
+    return None
+  i= idx[0]
+  if(i==0):
+    return (x[0],y[0])
+  f= (t-v[i-1])/(v[i]-v[i-1])
+  return (x[i-1]+f*(x[i]-x[i-1]),y[i-1]+f*(y[i]-y[i-1]))
+
+class MomentCurvatureDiagram(object):
+  ''' Moment curvature diagram of a fiber section under constant
+      axial force.
+
+  :ivar kappa: curvatures.
+  :ivar eps0: strains at the section origin.
+  :ivar M: bending moments in the bending plane.
+  :ivar Mz: bending moments about z axis.
+  :ivar My: bending moments about y axis.
+  :ivar epsMin: minimum fiber strains.
+  :ivar epsMax: maximum fiber strains.
+  :ivar setStrains: dictionary with the (minimum, maximum) strains
+                    of each fiber set.
+  :ivar converged: true if equilibrium was found for the last row.
+  '''
+  def __init__(self, rows, fiberSetNames= []):
+    ''' Constructor.
+
+    :param rows: rows returned by the getMomentCurvatureDiagram method
+                 of the fiber section.
+    :param fiberSetNames: names of the fiber sets used to compute the
+                          rows.
+    '''
+    converged= [bool(r[-1]) for r in rows]
+    values= np.array([r[:-1] for r in rows if r[-1]],dtype= float).reshape(-1,7+2*len(fiberSetNames))
+    self.kappa= values[:,0]
+    self.eps0= values[:,1]
+    self.M= values[:,2]
+    self.Mz= values[:,3]
+    self.My= values[:,4]
+    self.epsMin= values[:,5]
+    self.epsMax= values[:,6]
+    self.setStrains= dict()
+    for i, name in enumerate(fiberSetNames):
+      self.setStrains[name]= (values[:,7+2*i],values[:,8+2*i])
+    self.converged= (len(converged)>0) and converged[-1]
+
+  def getSetStrains(self, setName):
+    ''' Return the minimum and maximum strains of the fiber set
+        whose name is passed as parameter (all the fibers if None).'''
+    if(setName is None):
+      return (self.epsMin,self.epsMax)
+    return self.setStrains[setName]
+
+  def getCrackingPoint(self, epsCrack, setName= None):
+    ''' Return the (curvature, moment) pair where the maximum tensile
+        strain reaches the cracking strain (None if never reached).
+
+    :param epsCrack: cracking strain of concrete.
+    :param setName: name of the concrete fiber set (all fibers if None).
+    '''
+    epsMax= self.getSetStrains(setName)[1]
+    return getFirstCrossing(self.kappa,self.M,epsMax,abs(epsCrack))
+
+  def getYieldPoint(self, epsYield, reinfSetName):
+    ''' Return the (curvature, moment) pair where the reinforcement
+        reaches the yield strain (None if never reached).
+
+    :param epsYield: yield strain of the reinforcing steel.
+    :param reinfSetName: name of the reinforcement fiber set.
+    '''
+    epsMax= self.getSetStrains(reinfSetName)[1]
+    return getFirstCrossing(self.kappa,self.M,epsMax,abs(epsYield))
+
+  def getUltimatePoint(self, epsCU, concreteSetName= None, epsSU= None, reinfSetName= None):
+    ''' Return the (curvature, moment) pair where the concrete reaches
+        its ultimate compressive strain or the reinforcement reaches its
+        ultimate tensile strain, whichever comes first. If none of them
+        is reached, the last point of the diagram is returned.
+
+    :param epsCU: ultimate compressive strain of concrete.
+    :param concreteSetName: name of the concrete fiber set (all fibers if None).
+    :param epsSU: ultimate tensile strain of the reinforcing steel.
+    :param reinfSetName: name of the reinforcement fiber set.
+    '''
+    candidates= list()
+    epsMin= self.getSetStrains(concreteSetName)[0]
+    candidates.append(getFirstCrossing(self.kappa,self.M,epsMin,-abs(epsCU)))
+    if(epsSU and reinfSetName):
+      epsMax= self.getSetStrains(reinfSetName)[1]
+      candidates.append(getFirstCrossing(self.kappa,self.M,epsMax,abs(epsSU)))
+    candidates= [c for c in candidates if c is not None]
+    if(candidates):
+      return min(candidates)
+    return (self.kappa[-1],self.M[-1])
+
+  def getCurvatureDuctility(self, epsYield, reinfSetName, epsCU, concreteSetName= None, epsSU= None):
+    ''' Return the ratio between the ultimate curvature and the yield
+        curvature (None if the reinforcement doesn't yield).
+
+    :param epsYield: yield strain of the reinforcing steel.
+    :param reinfSetName: name of the reinforcement fiber set.
+    :param epsCU: ultimate compressive strain of concrete.
+    :param concreteSetName: name of the concrete fiber set (all fibers if None).
+    :param epsSU: ultimate tensile strain of the reinforcing steel.
+    '''
+    yieldPoint= self.getYieldPoint(epsYield,reinfSetName)
+    if(yieldPoint is None):
+      return None
+    ultimatePoint= self.getUltimatePoint(epsCU,concreteSetName,epsSU,reinfSetName)
+    return ultimatePoint[0]/yieldPoint[0]
+
+def getSectionMomentCurvatureDiagram(section, N, maxK, numIncr, theta= 0.0, fiberSetNames= [], tol= 1e-6, maxIter= 50):
+  ''' Return the moment curvature diagram of the fiber section
+      computed directly on the section (no finite element model
+      is needed).
+
+  :param section: fiber section.
+  :param N: axial force over the section.
+  :param maxK: maximum curvature to reach in the analysis.
+  :param numIncr: number of increments.
+  :param theta: angle of the curvature vector with the z axis (0: bending
+                about z axis, pi/2: bending about y axis).
+  :param fiberSetNames: names of the fiber sets whose strains will be
+                        stored in the diagram.
+  :param tol: relative tolerance on the axial force.
+  :param maxIter: maximum number of iterations for each increment.
+  '''
+  rows= section.getMomentCurvatureDiagram(N,theta,maxK,numIncr,fiberSetNames,tol,maxIter)
+  retval= MomentCurvatureDiagram(rows,fiberSetNames)
+  if(not retval.converged):
+    lmsg.warning('axial equilibrium not reached for N= '+str(N)+' beyond curvature: '+str(retval.kappa[-1]))
+  return retval
+
+def getMomentCurvatureDiagrams(preprocessor, sectionNames, axialForces, maxK, numIncr, theta= 0.0, fiberSetNames= [], tol= 1e-6, maxIter= 50):
+  ''' Return the moment curvature diagrams of the sections for each
+      of the axial forces in a dictionary whose keys are the
+      (sectionName, N) pairs.
+
+  :param preprocessor: preprocessor that contains the sections.
+  :param sectionNames: names of the fiber sections.
+  :param axialForces: axial forces over the sections.
+  :param maxK: maximum curvature to reach in the analysis.
+  :param numIncr: number of increments.
+  :param theta: angle of the curvature vector with the z axis.
+  :param fiberSetNames: names of the fiber sets whose strains will be
+                        stored in the diagrams.
+  :param tol: relative tolerance on the axial force.
+  :param maxIter: maximum number of iterations for each increment.
+  '''
+  retval= dict()
+  materialHandler= preprocessor.getMaterialHandler
+  for name in sectionNames:
+    section= materialHandler.getMaterial(name)
+    for N in axialForces:
+      retval[(name,N)]= getSectionMomentCurvatureDiagram(section,N,maxK,numIncr,theta,fiberSetNames,tol,maxIter)
+    section.revertToStart()
+  return retval
@@ -2,6 +2,8 @@
 
 ''' AISC's structural steel shapes (metric units).'''
 
+from materials.sections.structural_shapes import shape_table
+
 # Section axis:
 
 #    AISC            XC
@@ -19,937 +21,26 @@
 # (strong axis parallel to z axis) in other words: values for Y and Z axis 
 # are swapped with respect to those in the catalog.
 
-W={}
-
-W['W44X335']={'nmb':'W44X335','P':499,'A':63500e-6,'h':1120e-3,'hDet':1120e-3,'b':404e-3,'bDet':406e-3,'tw':26.2e-3,'twDet':25.4e-3,'tf':45e-3,'tfDet':44.4e-3,'kDes':65e-3,'kDet':66.7e-3,'k1':33.3e-3,'d':990e-3,'Iz':12900e-6,'Wzel':23100e-6,'Wzpl':26500e-6,'iz':452e-3,'Avy':25938e-6,'Iy':499e-6,'Wyel':2460e-6,'Wypl':3870e-6,'iy':88.6e-3,'It':31100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W44X290']={'nmb':'W44X290','P':433,'A':55100e-6,'h':1110e-3,'hDet':1110e-3,'b':401e-3,'bDet':403e-3,'tw':22e-3,'twDet':22.2e-3,'tf':40.1e-3,'tfDet':39.7e-3,'kDes':59.9e-3,'kDet':61.9e-3,'k1':31.8e-3,'d':990.2e-3,'Iz':11200e-6,'Wzel':20300e-6,'Wzpl':23100e-6,'iz':452e-3,'Avy':21784.4e-6,'Iy':433e-6,'Wyel':2160e-6,'Wypl':3360e-6,'iy':88.6e-3,'It':21200e-9,'E':2.1e+11,'nu':0.3}
-
-W['W44X262']={'nmb':'W44X262','P':390,'A':49800e-6,'h':1100e-3,'hDet':1100e-3,'b':401e-3,'bDet':400e-3,'tw':19.9e-3,'twDet':20.6e-3,'tf':36.1e-3,'tfDet':36.5e-3,'kDes':55.9e-3,'kDet':57.2e-3,'k1':30.2e-3,'d':988.2e-3,'Iz':10000e-6,'Wzel':18200e-6,'Wzpl':20800e-6,'iz':450e-3,'Avy':19665.2e-6,'Iy':384e-6,'Wyel':1920e-6,'Wypl':2980e-6,'iy':88.1e-3,'It':15500e-9,'E':2.1e+11,'nu':0.3}
-
-W['W44X230']={'nmb':'W44X230','P':343,'A':43700e-6,'h':1090e-3,'hDet':1090e-3,'b':401e-3,'bDet':400e-3,'tw':18e-3,'twDet':17.5e-3,'tf':31e-3,'tfDet':31.8e-3,'kDes':51.1e-3,'kDet':52.4e-3,'k1':30.2e-3,'d':987.8e-3,'Iz':8660e-6,'Wzel':15900e-6,'Wzpl':18000e-6,'iz':445e-3,'Avy':17780.4e-6,'Iy':331e-6,'Wyel':1660e-6,'Wypl':2570e-6,'iy':87.1e-3,'It':10400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X593']={'nmb':'W40X593','P':883,'A':112000e-6,'h':1090e-3,'hDet':1090e-3,'b':424e-3,'bDet':425e-3,'tw':45.5e-3,'twDet':46e-3,'tf':82e-3,'tfDet':82.6e-3,'kDes':112e-3,'kDet':114e-3,'k1':54e-3,'d':866e-3,'Iz':21000e-6,'Wzel':38300e-6,'Wzpl':45200e-6,'iz':432e-3,'Avy':39403e-6,'Iy':1050e-6,'Wyel':4950e-6,'Wypl':7880e-6,'iy':96.5e-3,'It':185000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X503']={'nmb':'W40X503','P':748,'A':95500e-6,'h':1070e-3,'hDet':1070e-3,'b':417e-3,'bDet':416e-3,'tw':39.1e-3,'twDet':39.7e-3,'tf':70.1e-3,'tfDet':69.8e-3,'kDes':100e-3,'kDet':102e-3,'k1':50.8e-3,'d':870e-3,'Iz':17300e-6,'Wzel':32400e-6,'Wzpl':38000e-6,'iz':427e-3,'Avy':34017e-6,'Iy':849e-6,'Wyel':4080e-6,'Wypl':6460e-6,'iy':94.5e-3,'It':115000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X431']={'nmb':'W40X431','P':642,'A':81900e-6,'h':1050e-3,'hDet':1050e-3,'b':411e-3,'bDet':413e-3,'tw':34e-3,'twDet':33.3e-3,'tf':59.9e-3,'tfDet':60.3e-3,'kDes':89.9e-3,'kDet':92.1e-3,'k1':47.6e-3,'d':870.2e-3,'Iz':14500e-6,'Wzel':27700e-6,'Wzpl':32100e-6,'iz':422e-3,'Avy':29586.8e-6,'Iy':703e-6,'Wyel':3410e-6,'Wypl':5370e-6,'iy':92.7e-3,'It':73700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X397']={'nmb':'W40X397','P':591,'A':75500e-6,'h':1040e-3,'hDet':1040e-3,'b':409e-3,'bDet':410e-3,'tw':31e-3,'twDet':31.8e-3,'tf':55.9e-3,'tfDet':55.6e-3,'kDes':85.9e-3,'kDet':88.9e-3,'k1':46e-3,'d':868.2e-3,'Iz':13300e-6,'Wzel':25600e-6,'Wzpl':29500e-6,'iz':422e-3,'Avy':26914.2e-6,'Iy':641e-6,'Wyel':3130e-6,'Wypl':4920e-6,'iy':92.5e-3,'It':59100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X372']={'nmb':'W40X372','P':554,'A':71000e-6,'h':1030e-3,'hDet':1030e-3,'b':409e-3,'bDet':410e-3,'tw':29.5e-3,'twDet':30.2e-3,'tf':52.1e-3,'tfDet':52.4e-3,'kDes':82e-3,'kDet':84.1e-3,'k1':46e-3,'d':866e-3,'Iz':12300e-6,'Wzel':23900e-6,'Wzpl':27500e-6,'iz':419e-3,'Avy':25547e-6,'Iy':591e-6,'Wyel':2900e-6,'Wypl':4540e-6,'iy':91.4e-3,'It':48300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X362']={'nmb':'W40X362','P':539,'A':68400e-6,'h':1030e-3,'hDet':1030e-3,'b':406e-3,'bDet':406e-3,'tw':28.4e-3,'twDet':28.6e-3,'tf':51.1e-3,'tfDet':50.8e-3,'kDes':81e-3,'kDet':82.6e-3,'k1':44.5e-3,'d':868e-3,'Iz':12000e-6,'Wzel':23300e-6,'Wzpl':26900e-6,'iz':419e-3,'Avy':24651.2e-6,'Iy':574e-6,'Wyel':2830e-6,'Wypl':4420e-6,'iy':91.4e-3,'It':45400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X324']={'nmb':'W40X324','P':483,'A':61500e-6,'h':1020e-3,'hDet':1020e-3,'b':404e-3,'bDet':403e-3,'tw':25.4e-3,'twDet':25.4e-3,'tf':46e-3,'tfDet':46e-3,'kDes':75.9e-3,'kDet':77.8e-3,'k1':42.9e-3,'d':868.2e-3,'Iz':10700e-6,'Wzel':21000e-6,'Wzpl':23900e-6,'iz':417e-3,'Avy':22052.3e-6,'Iy':508e-6,'Wyel':2510e-6,'Wypl':3920e-6,'iy':90.9e-3,'It':33000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X297']={'nmb':'W40X297','P':443,'A':56300e-6,'h':1010e-3,'hDet':1010e-3,'b':401e-3,'bDet':403e-3,'tw':23.6e-3,'twDet':23.8e-3,'tf':41.9e-3,'tfDet':41.3e-3,'kDes':71.9e-3,'kDet':74.6e-3,'k1':42.9e-3,'d':866.2e-3,'Iz':9660e-6,'Wzel':19200e-6,'Wzpl':21800e-6,'iz':414e-3,'Avy':20442.3e-6,'Iy':454e-6,'Wyel':2260e-6,'Wypl':3520e-6,'iy':89.9e-3,'It':25500e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X277']={'nmb':'W40X277','P':412,'A':52600e-6,'h':1010e-3,'hDet':1010e-3,'b':401e-3,'bDet':403e-3,'tw':21.1e-3,'twDet':20.6e-3,'tf':40.1e-3,'tfDet':39.7e-3,'kDes':70.1e-3,'kDet':73e-3,'k1':41.3e-3,'d':869.8e-3,'Iz':9120e-6,'Wzel':18000e-6,'Wzpl':20500e-6,'iz':417e-3,'Avy':18352.8e-6,'Iy':433e-6,'Wyel':2160e-6,'Wypl':3340e-6,'iy':90.9e-3,'It':21400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X249']={'nmb':'W40X249','P':371,'A':47400e-6,'h':1000e-3,'hDet':1000e-3,'b':401e-3,'bDet':400e-3,'tw':19.1e-3,'twDet':19e-3,'tf':36.1e-3,'tfDet':36.5e-3,'kDes':66e-3,'kDet':68.3e-3,'k1':39.7e-3,'d':868e-3,'Iz':8160e-6,'Wzel':16300e-6,'Wzpl':18400e-6,'iz':414e-3,'Avy':16578.8e-6,'Iy':385e-6,'Wyel':1930e-6,'Wypl':2980e-6,'iy':90.2e-3,'It':15900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X215']={'nmb':'W40X215','P':321,'A':41000e-6,'h':991e-3,'hDet':991e-3,'b':401e-3,'bDet':400e-3,'tw':16.5e-3,'twDet':15.9e-3,'tf':31e-3,'tfDet':31.8e-3,'kDes':61e-3,'kDet':63.5e-3,'k1':39.7e-3,'d':869e-3,'Iz':6950e-6,'Wzel':14100e-6,'Wzpl':15800e-6,'iz':411e-3,'Avy':14338.5e-6,'Iy':334e-6,'Wyel':1660e-6,'Wypl':2560e-6,'iy':89.9e-3,'It':10300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X199']={'nmb':'W40X199','P':296,'A':37900e-6,'h':983e-3,'hDet':981e-3,'b':401e-3,'bDet':400e-3,'tw':16.5e-3,'twDet':15.9e-3,'tf':27.2e-3,'tfDet':27e-3,'kDes':57.2e-3,'kDet':58.7e-3,'k1':39.7e-3,'d':868.6e-3,'Iz':6200e-6,'Wzel':12600e-6,'Wzpl':14200e-6,'iz':406e-3,'Avy':14331.9e-6,'Iy':289e-6,'Wyel':1450e-6,'Wypl':2250e-6,'iy':87.6e-3,'It':7620e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X392']={'nmb':'W40X392','P':584,'A':74800e-6,'h':1060e-3,'hDet':1060e-3,'b':315e-3,'bDet':314e-3,'tw':36.1e-3,'twDet':36.5e-3,'tf':64e-3,'tfDet':63.5e-3,'kDes':94e-3,'kDet':96.8e-3,'k1':49.2e-3,'d':872e-3,'Iz':12400e-6,'Wzel':23600e-6,'Wzpl':28000e-6,'iz':409e-3,'Avy':31479.2e-6,'Iy':334e-6,'Wyel':2130e-6,'Wypl':3470e-6,'iy':67.1e-3,'It':71600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X331']={'nmb':'W40X331','P':494,'A':63000e-6,'h':1040e-3,'hDet':1040e-3,'b':310e-3,'bDet':308e-3,'tw':31e-3,'twDet':31.8e-3,'tf':54.1e-3,'tfDet':54e-3,'kDes':84.1e-3,'kDet':85.7e-3,'k1':46e-3,'d':871.8e-3,'Iz':10300e-6,'Wzel':19800e-6,'Wzpl':23400e-6,'iz':404e-3,'Avy':27025.8e-6,'Iy':268e-6,'Wyel':1740e-6,'Wypl':2820e-6,'iy':65.3e-3,'It':43700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X327']={'nmb':'W40X327','P':486,'A':61900e-6,'h':1040e-3,'hDet':1040e-3,'b':307e-3,'bDet':308e-3,'tw':30e-3,'twDet':30.2e-3,'tf':54.1e-3,'tfDet':54e-3,'kDes':84.1e-3,'kDet':85.7e-3,'k1':46e-3,'d':871.8e-3,'Iz':10200e-6,'Wzel':19700e-6,'Wzpl':23100e-6,'iz':406e-3,'Avy':26154e-6,'Iy':266e-6,'Wyel':1720e-6,'Wypl':2790e-6,'iy':65.5e-3,'It':42900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X294']={'nmb':'W40X294','P':438,'A':55600e-6,'h':1030e-3,'hDet':1030e-3,'b':305e-3,'bDet':305e-3,'tw':26.9e-3,'twDet':27e-3,'tf':49e-3,'tfDet':49.2e-3,'kDes':79e-3,'kDet':81e-3,'k1':44.5e-3,'d':872e-3,'Iz':9120e-6,'Wzel':17700e-6,'Wzpl':20800e-6,'iz':404e-3,'Avy':23456.8e-6,'Iy':234e-6,'Wyel':1530e-6,'Wypl':2460e-6,'iy':64.8e-3,'It':31900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X278']={'nmb':'W40X278','P':415,'A':53100e-6,'h':1020e-3,'hDet':1020e-3,'b':305e-3,'bDet':305e-3,'tw':26.2e-3,'twDet':25.4e-3,'tf':46e-3,'tfDet':46e-3,'kDes':75.9e-3,'kDet':77.8e-3,'k1':44.5e-3,'d':868.2e-3,'Iz':8530e-6,'Wzel':16700e-6,'Wzpl':19500e-6,'iz':401e-3,'Avy':22746.8e-6,'Iy':217e-6,'Wyel':1430e-6,'Wypl':2290e-6,'iy':64e-3,'It':27100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X264']={'nmb':'W40X264','P':393,'A':49900e-6,'h':1020e-3,'hDet':1020e-3,'b':302e-3,'bDet':302e-3,'tw':24.4e-3,'twDet':23.8e-3,'tf':43.9e-3,'tfDet':44.4e-3,'kDes':73.9e-3,'kDet':76.2e-3,'k1':42.9e-3,'d':872.2e-3,'Iz':8070e-6,'Wzel':15900e-6,'Wzpl':18500e-6,'iz':401e-3,'Avy':21281.7e-6,'Iy':205e-6,'Wyel':1350e-6,'Wypl':2160e-6,'iy':64e-3,'It':23400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X235']={'nmb':'W40X235','P':350,'A':44600e-6,'h':1010e-3,'hDet':1010e-3,'b':302e-3,'bDet':302e-3,'tw':21.1e-3,'twDet':20.6e-3,'tf':40.1e-3,'tfDet':39.7e-3,'kDes':70.1e-3,'kDet':73e-3,'k1':41.3e-3,'d':869.8e-3,'Iz':7240e-6,'Wzel':14300e-6,'Wzpl':16600e-6,'iz':404e-3,'Avy':18352.8e-6,'Iy':185e-6,'Wyel':1220e-6,'Wypl':1930e-6,'iy':64.5e-3,'It':17200e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X211']={'nmb':'W40X211','P':314,'A':40100e-6,'h':1000e-3,'hDet':1000e-3,'b':300e-3,'bDet':298e-3,'tw':19.1e-3,'twDet':19e-3,'tf':36.1e-3,'tfDet':36.5e-3,'kDes':66e-3,'kDet':68.3e-3,'k1':39.7e-3,'d':868e-3,'Iz':6450e-6,'Wzel':12900e-6,'Wzpl':14800e-6,'iz':401e-3,'Avy':16578.8e-6,'Iy':162e-6,'Wyel':1080e-6,'Wypl':1720e-6,'iy':63.8e-3,'It':12700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X183']={'nmb':'W40X183','P':272,'A':34400e-6,'h':991e-3,'hDet':991e-3,'b':300e-3,'bDet':298e-3,'tw':16.5e-3,'twDet':15.9e-3,'tf':30.5e-3,'tfDet':30.2e-3,'kDes':60.5e-3,'kDet':63.5e-3,'k1':39.7e-3,'d':870e-3,'Iz':5490e-6,'Wzel':11100e-6,'Wzpl':12700e-6,'iz':399e-3,'Avy':14355e-6,'Iy':138e-6,'Wyel':918e-6,'Wypl':1450e-6,'iy':63.2e-3,'It':8030e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X167']={'nmb':'W40X167','P':249,'A':31800e-6,'h':980e-3,'hDet':981e-3,'b':300e-3,'bDet':298e-3,'tw':16.5e-3,'twDet':15.9e-3,'tf':26.2e-3,'tfDet':25.4e-3,'kDes':56.1e-3,'kDet':58.7e-3,'k1':39.7e-3,'d':867.8e-3,'Iz':4830e-6,'Wzel':9830e-6,'Wzpl':11400e-6,'iz':389e-3,'Avy':14318.7e-6,'Iy':118e-6,'Wyel':785e-6,'Wypl':1250e-6,'iy':61e-3,'It':5830e-9,'E':2.1e+11,'nu':0.3}
-
-W['W40X149']={'nmb':'W40X149','P':222,'A':28300e-6,'h':970e-3,'hDet':972e-3,'b':300e-3,'bDet':298e-3,'tw':16e-3,'twDet':15.9e-3,'tf':21.1e-3,'tfDet':20.6e-3,'kDes':51.1e-3,'kDet':54e-3,'k1':38.1e-3,'d':867.8e-3,'Iz':4080e-6,'Wzel':8410e-6,'Wzpl':9800e-6,'iz':381e-3,'Avy':13884.8e-6,'Iy':95.3e-6,'Wyel':636e-6,'Wypl':1020e-6,'iy':58.2e-3,'It':3900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X652']={'nmb':'W36X652','P':970,'A':124000e-6,'h':1040e-3,'hDet':1040e-3,'b':447e-3,'bDet':448e-3,'tw':50e-3,'twDet':50.8e-3,'tf':89.9e-3,'tfDet':90.5e-3,'kDes':114e-3,'kDet':122e-3,'k1':55.6e-3,'d':812e-3,'Iz':21100e-6,'Wzel':40300e-6,'Wzpl':47700e-6,'iz':411e-3,'Avy':40600e-6,'Iy':1340e-6,'Wyel':6010e-6,'Wypl':9520e-6,'iy':104e-3,'It':247000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X529']={'nmb':'W36X529','P':787,'A':101000e-6,'h':1010e-3,'hDet':1010e-3,'b':437e-3,'bDet':438e-3,'tw':40.9e-3,'twDet':41.3e-3,'tf':73.9e-3,'tfDet':74.6e-3,'kDes':98e-3,'kDet':106e-3,'k1':50.8e-3,'d':814e-3,'Iz':16500e-6,'Wzel':32600e-6,'Wzpl':38200e-6,'iz':406e-3,'Avy':33292.6e-6,'Iy':1040e-6,'Wyel':4740e-6,'Wypl':7440e-6,'iy':102e-3,'It':136000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X487']={'nmb':'W36X487','P':725,'A':92300e-6,'h':998e-3,'hDet':1000e-3,'b':434e-3,'bDet':435e-3,'tw':38.1e-3,'twDet':38.1e-3,'tf':68.1e-3,'tfDet':68.3e-3,'kDes':92.2e-3,'kDet':102e-3,'k1':47.6e-3,'d':813.6e-3,'Iz':15000e-6,'Wzel':30000e-6,'Wzpl':34900e-6,'iz':401e-3,'Avy':30998.2e-6,'Iy':937e-6,'Wyel':4310e-6,'Wypl':6750e-6,'iy':101e-3,'It':107000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X441']={'nmb':'W36X441','P':656,'A':83900e-6,'h':988e-3,'hDet':987e-3,'b':432e-3,'bDet':432e-3,'tw':34.5e-3,'twDet':34.9e-3,'tf':62e-3,'tfDet':61.9e-3,'kDes':86.1e-3,'kDet':95.3e-3,'k1':47.6e-3,'d':815.8e-3,'Iz':13400e-6,'Wzel':27000e-6,'Wzpl':31300e-6,'iz':399e-3,'Avy':28145.1e-6,'Iy':828e-6,'Wyel':3850e-6,'Wypl':6030e-6,'iy':99.6e-3,'It':80700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X395']={'nmb':'W36X395','P':588,'A':74800e-6,'h':975e-3,'hDet':975e-3,'b':427e-3,'bDet':429e-3,'tw':31e-3,'twDet':31.8e-3,'tf':55.9e-3,'tfDet':55.6e-3,'kDes':80e-3,'kDet':87.3e-3,'k1':46e-3,'d':815e-3,'Iz':11900e-6,'Wzel':24400e-6,'Wzpl':28000e-6,'iz':399e-3,'Avy':25265e-6,'Iy':728e-6,'Wyel':3410e-6,'Wypl':5330e-6,'iy':98.6e-3,'It':59100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X361']={'nmb':'W36X361','P':537,'A':68400e-6,'h':965e-3,'hDet':965e-3,'b':424e-3,'bDet':425e-3,'tw':28.4e-3,'twDet':28.6e-3,'tf':51.1e-3,'tfDet':50.8e-3,'kDes':75.2e-3,'kDet':84.1e-3,'k1':44.5e-3,'d':814.6e-3,'Iz':10700e-6,'Wzel':22100e-6,'Wzpl':25400e-6,'iz':396e-3,'Avy':23134.6e-6,'Iy':653e-6,'Wyel':3080e-6,'Wypl':4800e-6,'iy':97.8e-3,'It':45400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X330']={'nmb':'W36X330','P':491,'A':62500e-6,'h':958e-3,'hDet':956e-3,'b':422e-3,'bDet':422e-3,'tw':25.9e-3,'twDet':25.4e-3,'tf':47e-3,'tfDet':47.6e-3,'kDes':71.1e-3,'kDet':79.4e-3,'k1':44.5e-3,'d':815.8e-3,'Iz':9700e-6,'Wzel':20300e-6,'Wzpl':23100e-6,'iz':394e-3,'Avy':21129.2e-6,'Iy':591e-6,'Wyel':2800e-6,'Wypl':4340e-6,'iy':97.3e-3,'It':35100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X302']={'nmb':'W36X302','P':449,'A':57400e-6,'h':947e-3,'hDet':949e-3,'b':424e-3,'bDet':422e-3,'tw':24e-3,'twDet':23.8e-3,'tf':42.7e-3,'tfDet':42.9e-3,'kDes':66.8e-3,'kDet':76.2e-3,'k1':42.9e-3,'d':813.4e-3,'Iz':8780e-6,'Wzel':18500e-6,'Wzpl':21000e-6,'iz':391e-3,'Avy':19521.6e-6,'Iy':541e-6,'Wyel':2560e-6,'Wypl':3950e-6,'iy':97e-3,'It':26800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X282']={'nmb':'W36X282','P':420,'A':53500e-6,'h':942e-3,'hDet':943e-3,'b':422e-3,'bDet':422e-3,'tw':22.5e-3,'twDet':22.2e-3,'tf':39.9e-3,'tfDet':39.7e-3,'kDes':64e-3,'kDet':73e-3,'k1':41.3e-3,'d':814e-3,'Iz':8160e-6,'Wzel':17200e-6,'Wzpl':19500e-6,'iz':391e-3,'Avy':18315e-6,'Iy':499e-6,'Wyel':2360e-6,'Wypl':3650e-6,'iy':96.5e-3,'It':21900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X262']={'nmb':'W36X262','P':390,'A':49800e-6,'h':937e-3,'hDet':937e-3,'b':422e-3,'bDet':419e-3,'tw':21.3e-3,'twDet':20.6e-3,'tf':36.6e-3,'tfDet':36.5e-3,'kDes':60.7e-3,'kDet':69.9e-3,'k1':41.3e-3,'d':815.6e-3,'Iz':7450e-6,'Wzel':15900e-6,'Wzpl':18000e-6,'iz':389e-3,'Avy':17372.3e-6,'Iy':454e-6,'Wyel':2160e-6,'Wypl':3340e-6,'iy':95.5e-3,'It':17300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X247']={'nmb':'W36X247','P':368,'A':46800e-6,'h':932e-3,'hDet':930e-3,'b':419e-3,'bDet':419e-3,'tw':20.3e-3,'twDet':20.6e-3,'tf':34.3e-3,'tfDet':34.9e-3,'kDes':58.4e-3,'kDet':66.7e-3,'k1':41.3e-3,'d':815.2e-3,'Iz':6950e-6,'Wzel':15000e-6,'Wzpl':16900e-6,'iz':386e-3,'Avy':16548.6e-6,'Iy':420e-6,'Wyel':2020e-6,'Wypl':3110e-6,'iy':95e-3,'It':14400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X231']={'nmb':'W36X231','P':344,'A':44000e-6,'h':927e-3,'hDet':927e-3,'b':419e-3,'bDet':419e-3,'tw':19.3e-3,'twDet':19e-3,'tf':32e-3,'tfDet':31.8e-3,'kDes':56.1e-3,'kDet':65.1e-3,'k1':39.7e-3,'d':814.8e-3,'Iz':6490e-6,'Wzel':14000e-6,'Wzpl':15800e-6,'iz':384e-3,'Avy':15725.6e-6,'Iy':391e-6,'Wyel':1870e-6,'Wypl':2880e-6,'iy':94.2e-3,'It':11900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X256']={'nmb':'W36X256','P':381,'A':48600e-6,'h':951e-3,'hDet':949e-3,'b':310e-3,'bDet':311e-3,'tw':24.4e-3,'twDet':23.8e-3,'tf':43.9e-3,'tfDet':44.4e-3,'kDes':63e-3,'kDet':66.7e-3,'k1':33.3e-3,'d':825e-3,'Iz':6990e-6,'Wzel':14700e-6,'Wzpl':17000e-6,'iz':378e-3,'Avy':20130e-6,'Iy':220e-6,'Wyel':1420e-6,'Wypl':2250e-6,'iy':67.3e-3,'It':22000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X232']={'nmb':'W36X232','P':345,'A':43900e-6,'h':943e-3,'hDet':943e-3,'b':307e-3,'bDet':308e-3,'tw':22.1e-3,'twDet':22.2e-3,'tf':39.9e-3,'tfDet':39.7e-3,'kDes':58.9e-3,'kDet':61.9e-3,'k1':31.8e-3,'d':825.2e-3,'Iz':6240e-6,'Wzel':13300e-6,'Wzpl':15300e-6,'iz':376e-3,'Avy':18236.9e-6,'Iy':195e-6,'Wyel':1270e-6,'Wypl':2000e-6,'iy':66.5e-3,'It':16500e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X210']={'nmb':'W36X210','P':313,'A':39900e-6,'h':932e-3,'hDet':933e-3,'b':310e-3,'bDet':308e-3,'tw':21.1e-3,'twDet':20.6e-3,'tf':34.5e-3,'tfDet':34.9e-3,'kDes':53.6e-3,'kDet':58.7e-3,'k1':31.8e-3,'d':824.8e-3,'Iz':5490e-6,'Wzel':11800e-6,'Wzpl':13700e-6,'iz':371e-3,'Avy':17403.3e-6,'Iy':171e-6,'Wyel':1110e-6,'Wypl':1750e-6,'iy':65.5e-3,'It':11700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X194']={'nmb':'W36X194','P':289,'A':36800e-6,'h':927e-3,'hDet':927e-3,'b':307e-3,'bDet':308e-3,'tw':19.4e-3,'twDet':19e-3,'tf':32e-3,'tfDet':31.8e-3,'kDes':51.1e-3,'kDet':55.6e-3,'k1':30.2e-3,'d':824.8e-3,'Iz':5040e-6,'Wzel':10900e-6,'Wzpl':12600e-6,'iz':371e-3,'Avy':16001.1e-6,'Iy':156e-6,'Wyel':1010e-6,'Wypl':1600e-6,'iy':65e-3,'It':9240e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X182']={'nmb':'W36X182','P':271,'A':34600e-6,'h':922e-3,'hDet':924e-3,'b':307e-3,'bDet':308e-3,'tw':18.4e-3,'twDet':19e-3,'tf':30e-3,'tfDet':30.2e-3,'kDes':49e-3,'kDet':54e-3,'k1':30.2e-3,'d':824e-3,'Iz':4700e-6,'Wzel':10200e-6,'Wzpl':11800e-6,'iz':368e-3,'Avy':15161.6e-6,'Iy':144e-6,'Wyel':944e-6,'Wypl':1490e-6,'iy':64.8e-3,'It':7700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X170']={'nmb':'W36X170','P':253,'A':32300e-6,'h':919e-3,'hDet':918e-3,'b':305e-3,'bDet':305e-3,'tw':17.3e-3,'twDet':17.5e-3,'tf':27.9e-3,'tfDet':28.6e-3,'kDes':47e-3,'kDet':50.8e-3,'k1':30.2e-3,'d':825e-3,'Iz':4370e-6,'Wzel':9520e-6,'Wzpl':10900e-6,'iz':368e-3,'Avy':14272.5e-6,'Iy':133e-6,'Wyel':872e-6,'Wypl':1370e-6,'iy':64.3e-3,'It':6290e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X160']={'nmb':'W36X160','P':238,'A':30300e-6,'h':914e-3,'hDet':914e-3,'b':305e-3,'bDet':305e-3,'tw':16.5e-3,'twDet':15.9e-3,'tf':25.9e-3,'tfDet':25.4e-3,'kDes':45e-3,'kDet':49.2e-3,'k1':28.6e-3,'d':824e-3,'Iz':4060e-6,'Wzel':8880e-6,'Wzpl':10200e-6,'iz':366e-3,'Avy':13596e-6,'Iy':123e-6,'Wyel':805e-6,'Wypl':1270e-6,'iy':63.5e-3,'It':5160e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X150']={'nmb':'W36X150','P':223,'A':28600e-6,'h':912e-3,'hDet':911e-3,'b':305e-3,'bDet':305e-3,'tw':15.9e-3,'twDet':15.9e-3,'tf':23.9e-3,'tfDet':23.8e-3,'kDes':42.9e-3,'kDet':47.6e-3,'k1':28.6e-3,'d':826.2e-3,'Iz':3760e-6,'Wzel':8260e-6,'Wzpl':9520e-6,'iz':363e-3,'Avy':13136.6e-6,'Iy':112e-6,'Wyel':739e-6,'Wypl':1160e-6,'iy':62.7e-3,'It':4200e-9,'E':2.1e+11,'nu':0.3}
-
-W['W36X135']={'nmb':'W36X135','P':201,'A':25700e-6,'h':904e-3,'hDet':902e-3,'b':305e-3,'bDet':305e-3,'tw':15.2e-3,'twDet':15.9e-3,'tf':20.1e-3,'tfDet':20.6e-3,'kDes':39.1e-3,'kDet':42.9e-3,'k1':28.6e-3,'d':825.8e-3,'Iz':3250e-6,'Wzel':7190e-6,'Wzpl':8340e-6,'iz':356e-3,'Avy':12552.2e-6,'Iy':93.7e-6,'Wyel':618e-6,'Wypl':978e-6,'iy':60.5e-3,'It':2910e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X387']={'nmb':'W33X387','P':576,'A':73500e-6,'h':914e-3,'hDet':914e-3,'b':411e-3,'bDet':413e-3,'tw':32e-3,'twDet':31.8e-3,'tf':57.9e-3,'tfDet':57.2e-3,'kDes':78e-3,'kDet':81e-3,'k1':36.5e-3,'d':758e-3,'Iz':10100e-6,'Wzel':22100e-6,'Wzpl':25600e-6,'iz':371e-3,'Avy':24256e-6,'Iy':674e-6,'Wyel':3280e-6,'Wypl':5110e-6,'iy':95.8e-3,'It':61600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X354']={'nmb':'W33X354','P':527,'A':67100e-6,'h':904e-3,'hDet':902e-3,'b':409e-3,'bDet':410e-3,'tw':29.5e-3,'twDet':30.2e-3,'tf':53.1e-3,'tfDet':52.4e-3,'kDes':73.2e-3,'kDet':74.6e-3,'k1':34.9e-3,'d':757.6e-3,'Iz':9160e-6,'Wzel':20300e-6,'Wzpl':23300e-6,'iz':368e-3,'Avy':22349.2e-6,'Iy':608e-6,'Wyel':2970e-6,'Wypl':4620e-6,'iy':95e-3,'It':47900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X318']={'nmb':'W33X318','P':473,'A':60500e-6,'h':894e-3,'hDet':892e-3,'b':406e-3,'bDet':406e-3,'tw':26.4e-3,'twDet':27e-3,'tf':48e-3,'tfDet':47.6e-3,'kDes':68.1e-3,'kDet':69.9e-3,'k1':33.3e-3,'d':757.8e-3,'Iz':8120e-6,'Wzel':18200e-6,'Wzpl':20800e-6,'iz':368e-3,'Avy':20005.9e-6,'Iy':537e-6,'Wyel':2640e-6,'Wypl':4100e-6,'iy':94.2e-3,'It':35100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X291']={'nmb':'W33X291','P':433,'A':55200e-6,'h':884e-3,'hDet':886e-3,'b':404e-3,'bDet':403e-3,'tw':24.4e-3,'twDet':23.8e-3,'tf':43.9e-3,'tfDet':44.4e-3,'kDes':64e-3,'kDet':66.7e-3,'k1':33.3e-3,'d':756e-3,'Iz':7370e-6,'Wzel':16700e-6,'Wzpl':19000e-6,'iz':366e-3,'Avy':18446.4e-6,'Iy':483e-6,'Wyel':2390e-6,'Wypl':3700e-6,'iy':93.5e-3,'It':27100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X263']={'nmb':'W33X263','P':392,'A':49900e-6,'h':876e-3,'hDet':876e-3,'b':401e-3,'bDet':400e-3,'tw':22.1e-3,'twDet':22.2e-3,'tf':39.9e-3,'tfDet':39.7e-3,'kDes':59.9e-3,'kDet':61.9e-3,'k1':31.8e-3,'d':756.2e-3,'Iz':6620e-6,'Wzel':15100e-6,'Wzpl':17000e-6,'iz':363e-3,'Avy':16712e-6,'Iy':433e-6,'Wyel':2150e-6,'Wypl':3310e-6,'iy':93e-3,'It':20300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X241']={'nmb':'W33X241','P':359,'A':45900e-6,'h':869e-3,'hDet':867e-3,'b':404e-3,'bDet':403e-3,'tw':21.1e-3,'twDet':20.6e-3,'tf':35.6e-3,'tfDet':34.9e-3,'kDes':55.6e-3,'kDet':57.2e-3,'k1':31.8e-3,'d':757.8e-3,'Iz':5910e-6,'Wzel':13600e-6,'Wzpl':15400e-6,'iz':358e-3,'Avy':15989.6e-6,'Iy':388e-6,'Wyel':1930e-6,'Wypl':2980e-6,'iy':91.9e-3,'It':15100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X221']={'nmb':'W33X221','P':329,'A':42100e-6,'h':861e-3,'hDet':860e-3,'b':401e-3,'bDet':400e-3,'tw':19.7e-3,'twDet':19e-3,'tf':32.5e-3,'tfDet':31.8e-3,'kDes':52.3e-3,'kDet':54e-3,'k1':30.2e-3,'d':756.4e-3,'Iz':5370e-6,'Wzel':12400e-6,'Wzpl':14000e-6,'iz':358e-3,'Avy':14901.1e-6,'Iy':350e-6,'Wyel':1740e-6,'Wypl':2690e-6,'iy':91.2e-3,'It':11600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X201']={'nmb':'W33X201','P':299,'A':38100e-6,'h':856e-3,'hDet':854e-3,'b':399e-3,'bDet':400e-3,'tw':18.2e-3,'twDet':17.5e-3,'tf':29.2e-3,'tfDet':28.6e-3,'kDes':49.3e-3,'kDet':50.8e-3,'k1':30.2e-3,'d':757.4e-3,'Iz':4830e-6,'Wzel':11200e-6,'Wzpl':12700e-6,'iz':356e-3,'Avy':13784.7e-6,'Iy':312e-6,'Wyel':1560e-6,'Wypl':2410e-6,'iy':90.4e-3,'It':8660e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X169']={'nmb':'W33X169','P':251,'A':31900e-6,'h':859e-3,'hDet':860e-3,'b':292e-3,'bDet':292e-3,'tw':17e-3,'twDet':17.5e-3,'tf':31e-3,'tfDet':31.8e-3,'kDes':48.8e-3,'kDet':54e-3,'k1':30.2e-3,'d':761.4e-3,'Iz':3870e-6,'Wzel':9000e-6,'Wzpl':10300e-6,'iz':348e-3,'Avy':12943.8e-6,'Iy':129e-6,'Wyel':883e-6,'Wypl':1380e-6,'iy':63.5e-3,'It':7370e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X152']={'nmb':'W33X152','P':226,'A':29000e-6,'h':851e-3,'hDet':851e-3,'b':295e-3,'bDet':295e-3,'tw':16.1e-3,'twDet':15.9e-3,'tf':26.9e-3,'tfDet':27e-3,'kDes':44.7e-3,'kDet':49.2e-3,'k1':28.6e-3,'d':761.6e-3,'Iz':3400e-6,'Wzel':7980e-6,'Wzpl':9160e-6,'iz':343e-3,'Avy':12261.8e-6,'Iy':114e-6,'Wyel':773e-6,'Wypl':1210e-6,'iy':62.7e-3,'It':5160e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X141']={'nmb':'W33X141','P':210,'A':26800e-6,'h':846e-3,'hDet':845e-3,'b':292e-3,'bDet':292e-3,'tw':15.4e-3,'twDet':15.9e-3,'tf':24.4e-3,'tfDet':23.8e-3,'kDes':42.2e-3,'kDet':46e-3,'k1':28.6e-3,'d':761.6e-3,'Iz':3100e-6,'Wzel':7340e-6,'Wzpl':8420e-6,'iz':340e-3,'Avy':11728.6e-6,'Iy':102e-6,'Wyel':700e-6,'Wypl':1100e-6,'iy':61.7e-3,'It':4040e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X130']={'nmb':'W33X130','P':193,'A':24700e-6,'h':841e-3,'hDet':841e-3,'b':292e-3,'bDet':292e-3,'tw':14.7e-3,'twDet':14.3e-3,'tf':21.7e-3,'tfDet':22.2e-3,'kDes':39.6e-3,'kDet':44.5e-3,'k1':28.6e-3,'d':761.8e-3,'Iz':2790e-6,'Wzel':6650e-6,'Wzpl':7650e-6,'iz':335e-3,'Avy':11198.5e-6,'Iy':90.7e-6,'Wyel':621e-6,'Wypl':975e-6,'iy':60.7e-3,'It':3070e-9,'E':2.1e+11,'nu':0.3}
-
-W['W33X118']={'nmb':'W33X118','P':176,'A':22400e-6,'h':836e-3,'hDet':835e-3,'b':292e-3,'bDet':292e-3,'tw':14e-3,'twDet':14.3e-3,'tf':18.8e-3,'tfDet':19e-3,'kDes':36.6e-3,'kDet':41.3e-3,'k1':28.6e-3,'d':762.8e-3,'Iz':2460e-6,'Wzel':5880e-6,'Wzpl':6800e-6,'iz':330e-3,'Avy':10679.2e-6,'Iy':77.8e-6,'Wyel':534e-6,'Wypl':841e-6,'iy':58.9e-3,'It':2210e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X391']={'nmb':'W30X391','P':582,'A':74200e-6,'h':843e-3,'hDet':845e-3,'b':396e-3,'bDet':397e-3,'tw':34.5e-3,'twDet':34.9e-3,'tf':62e-3,'tfDet':61.9e-3,'kDes':82e-3,'kDet':85.7e-3,'k1':38.1e-3,'d':679e-3,'Iz':8620e-6,'Wzel':20500e-6,'Wzpl':23800e-6,'iz':340e-3,'Avy':23425.5e-6,'Iy':645e-6,'Wyel':3240e-6,'Wypl':5080e-6,'iy':93.2e-3,'It':72000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X357']={'nmb':'W30X357','P':531,'A':67700e-6,'h':833e-3,'hDet':832e-3,'b':394e-3,'bDet':394e-3,'tw':31.5e-3,'twDet':31.8e-3,'tf':56.9e-3,'tfDet':57.2e-3,'kDes':77e-3,'kDet':79.4e-3,'k1':36.5e-3,'d':679e-3,'Iz':7780e-6,'Wzel':18700e-6,'Wzpl':21600e-6,'iz':338e-3,'Avy':21388.5e-6,'Iy':579e-6,'Wyel':2930e-6,'Wypl':4570e-6,'iy':92.5e-3,'It':55800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X326']={'nmb':'W30X326','P':484,'A':61900e-6,'h':823e-3,'hDet':822e-3,'b':391e-3,'bDet':391e-3,'tw':29e-3,'twDet':28.6e-3,'tf':52.1e-3,'tfDet':52.4e-3,'kDes':72.1e-3,'kDet':74.6e-3,'k1':34.9e-3,'d':678.8e-3,'Iz':6990e-6,'Wzel':17000e-6,'Wzpl':19500e-6,'iz':335e-3,'Avy':19685.2e-6,'Iy':516e-6,'Wyel':2650e-6,'Wypl':4130e-6,'iy':91.4e-3,'It':42900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X292']={'nmb':'W30X292','P':434,'A':55500e-6,'h':813e-3,'hDet':813e-3,'b':389e-3,'bDet':387e-3,'tw':25.9e-3,'twDet':25.4e-3,'tf':47e-3,'tfDet':47.6e-3,'kDes':67.1e-3,'kDet':69.9e-3,'k1':33.3e-3,'d':678.8e-3,'Iz':6200e-6,'Wzel':15200e-6,'Wzpl':17400e-6,'iz':335e-3,'Avy':17580.9e-6,'Iy':458e-6,'Wyel':2360e-6,'Wypl':3650e-6,'iy':90.9e-3,'It':31300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X261']={'nmb':'W30X261','P':389,'A':49700e-6,'h':803e-3,'hDet':803e-3,'b':386e-3,'bDet':384e-3,'tw':23.6e-3,'twDet':23.8e-3,'tf':41.9e-3,'tfDet':41.3e-3,'kDes':62e-3,'kDet':65.1e-3,'k1':33.3e-3,'d':679e-3,'Iz':5450e-6,'Wzel':13600e-6,'Wzpl':15500e-6,'iz':333e-3,'Avy':16024.4e-6,'Iy':399e-6,'Wyel':2080e-6,'Wypl':3210e-6,'iy':89.7e-3,'It':22500e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X235']={'nmb':'W30X235','P':350,'A':44700e-6,'h':795e-3,'hDet':794e-3,'b':384e-3,'bDet':381e-3,'tw':21.1e-3,'twDet':20.6e-3,'tf':38.1e-3,'tfDet':38.1e-3,'kDes':58.2e-3,'kDet':60.3e-3,'k1':31.8e-3,'d':678.6e-3,'Iz':4870e-6,'Wzel':12300e-6,'Wzpl':13900e-6,'iz':330e-3,'Avy':14318.5e-6,'Iy':356e-6,'Wyel':1870e-6,'Wypl':2870e-6,'iy':89.2e-3,'It':16800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X211']={'nmb':'W30X211','P':314,'A':40200e-6,'h':785e-3,'hDet':787e-3,'b':384e-3,'bDet':384e-3,'tw':19.7e-3,'twDet':19e-3,'tf':33.5e-3,'tfDet':33.3e-3,'kDes':53.3e-3,'kDet':57.2e-3,'k1':30.2e-3,'d':678.4e-3,'Iz':4290e-6,'Wzel':10900e-6,'Wzpl':12300e-6,'iz':328e-3,'Avy':13364.5e-6,'Iy':315e-6,'Wyel':1640e-6,'Wypl':2540e-6,'iy':88.6e-3,'It':11800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X191']={'nmb':'W30X191','P':284,'A':36200e-6,'h':780e-3,'hDet':778e-3,'b':381e-3,'bDet':381e-3,'tw':18e-3,'twDet':17.5e-3,'tf':30.2e-3,'tfDet':30.2e-3,'kDes':50e-3,'kDet':52.4e-3,'k1':30.2e-3,'d':680e-3,'Iz':3830e-6,'Wzel':9830e-6,'Wzpl':11100e-6,'iz':325e-3,'Avy':12240e-6,'Iy':280e-6,'Wyel':1470e-6,'Wypl':2260e-6,'iy':87.9e-3,'It':8740e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X173']={'nmb':'W30X173','P':257,'A':32800e-6,'h':772e-3,'hDet':775e-3,'b':381e-3,'bDet':381e-3,'tw':16.6e-3,'twDet':15.9e-3,'tf':27.2e-3,'tfDet':27e-3,'kDes':47e-3,'kDet':50.8e-3,'k1':28.6e-3,'d':678e-3,'Iz':3430e-6,'Wzel':8870e-6,'Wzpl':9950e-6,'iz':323e-3,'Avy':11254.8e-6,'Iy':249e-6,'Wyel':1310e-6,'Wypl':2020e-6,'iy':86.9e-3,'It':6490e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X148']={'nmb':'W30X148','P':220,'A':28100e-6,'h':780e-3,'hDet':778e-3,'b':267e-3,'bDet':267e-3,'tw':16.5e-3,'twDet':15.9e-3,'tf':30e-3,'tfDet':30.2e-3,'kDes':46.5e-3,'kDet':52.4e-3,'k1':28.6e-3,'d':687e-3,'Iz':2780e-6,'Wzel':7140e-6,'Wzpl':8190e-6,'iz':315e-3,'Avy':11335.5e-6,'Iy':94.5e-6,'Wyel':710e-6,'Wypl':1110e-6,'iy':57.9e-3,'It':6040e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X132']={'nmb':'W30X132','P':196,'A':25000e-6,'h':770e-3,'hDet':768e-3,'b':267e-3,'bDet':267e-3,'tw':15.6e-3,'twDet':15.9e-3,'tf':25.4e-3,'tfDet':25.4e-3,'kDes':41.9e-3,'kDet':47.6e-3,'k1':28.6e-3,'d':686.2e-3,'Iz':2400e-6,'Wzel':6230e-6,'Wzpl':7160e-6,'iz':310e-3,'Avy':10704.7e-6,'Iy':81.6e-6,'Wyel':610e-6,'Wypl':957e-6,'iy':57.2e-3,'It':4050e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X124']={'nmb':'W30X124','P':185,'A':23500e-6,'h':767e-3,'hDet':765e-3,'b':267e-3,'bDet':267e-3,'tw':14.9e-3,'twDet':14.3e-3,'tf':23.6e-3,'tfDet':23.8e-3,'kDes':40.1e-3,'kDet':46e-3,'k1':28.6e-3,'d':686.8e-3,'Iz':2230e-6,'Wzel':5820e-6,'Wzpl':6690e-6,'iz':307e-3,'Avy':10233.3e-6,'Iy':75.3e-6,'Wyel':564e-6,'Wypl':885e-6,'iy':56.6e-3,'It':3330e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X116']={'nmb':'W30X116','P':173,'A':22100e-6,'h':762e-3,'hDet':762e-3,'b':267e-3,'bDet':267e-3,'tw':14.4e-3,'twDet':14.3e-3,'tf':21.6e-3,'tfDet':22.2e-3,'kDes':38.1e-3,'kDet':44.5e-3,'k1':28.6e-3,'d':685.8e-3,'Iz':2050e-6,'Wzel':5390e-6,'Wzpl':6190e-6,'iz':305e-3,'Avy':9875.52e-6,'Iy':68.3e-6,'Wyel':513e-6,'Wypl':806e-6,'iy':55.6e-3,'It':2680e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X108']={'nmb':'W30X108','P':161,'A':20500e-6,'h':757e-3,'hDet':759e-3,'b':267e-3,'bDet':267e-3,'tw':13.8e-3,'twDet':14.3e-3,'tf':19.3e-3,'tfDet':19e-3,'kDes':35.8e-3,'kDet':42.9e-3,'k1':28.6e-3,'d':685.4e-3,'Iz':1860e-6,'Wzel':4900e-6,'Wzpl':5670e-6,'iz':302e-3,'Avy':9458.52e-6,'Iy':60.8e-6,'Wyel':457e-6,'Wypl':719e-6,'iy':54.6e-3,'It':2080e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X99']={'nmb':'W30X99','P':147,'A':18700e-6,'h':754e-3,'hDet':752e-3,'b':267e-3,'bDet':267e-3,'tw':13.2e-3,'twDet':12.7e-3,'tf':17e-3,'tfDet':17.5e-3,'kDes':33.5e-3,'kDet':39.7e-3,'k1':27e-3,'d':687e-3,'Iz':1660e-6,'Wzel':4410e-6,'Wzpl':5110e-6,'iz':297e-3,'Avy':9068.4e-6,'Iy':53.3e-6,'Wyel':401e-6,'Wypl':633e-6,'iy':53.3e-3,'It':1570e-9,'E':2.1e+11,'nu':0.3}
-
-W['W30X90']={'nmb':'W30X90','P':134,'A':17000e-6,'h':749e-3,'hDet':749e-3,'b':264e-3,'bDet':264e-3,'tw':11.9e-3,'twDet':12.7e-3,'tf':15.5e-3,'tfDet':15.9e-3,'kDes':32e-3,'kDet':38.1e-3,'k1':27e-3,'d':685e-3,'Iz':1500e-6,'Wzel':4010e-6,'Wzpl':4640e-6,'iz':297e-3,'Avy':8151.5e-6,'Iy':47.9e-6,'Wyel':362e-6,'Wypl':569e-6,'iy':53.1e-3,'It':1180e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X539']={'nmb':'W27X539','P':802,'A':103000e-6,'h':826e-3,'hDet':826e-3,'b':389e-3,'bDet':387e-3,'tw':50e-3,'twDet':50.8e-3,'tf':89.9e-3,'tfDet':90.5e-3,'kDes':110e-3,'kDet':113e-3,'k1':46e-3,'d':606e-3,'Iz':10700e-6,'Wzel':25700e-6,'Wzpl':31000e-6,'iz':323e-3,'Avy':30300e-6,'Iy':878e-6,'Wyel':4540e-6,'Wypl':7160e-6,'iy':92.7e-3,'It':206000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X368']={'nmb':'W27X368','P':548,'A':70300e-6,'h':772e-3,'hDet':772e-3,'b':373e-3,'bDet':371e-3,'tw':35.1e-3,'twDet':34.9e-3,'tf':63e-3,'tfDet':63.5e-3,'kDes':83.1e-3,'kDet':85.7e-3,'k1':38.1e-3,'d':605.8e-3,'Iz':6740e-6,'Wzel':17400e-6,'Wzpl':20300e-6,'iz':310e-3,'Avy':21263.6e-6,'Iy':545e-6,'Wyel':2930e-6,'Wypl':4570e-6,'iy':88.4e-3,'It':70800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X336']={'nmb':'W27X336','P':500,'A':64000e-6,'h':762e-3,'hDet':762e-3,'b':371e-3,'bDet':368e-3,'tw':32e-3,'twDet':31.8e-3,'tf':57.9e-3,'tfDet':57.2e-3,'kDes':78e-3,'kDet':81e-3,'k1':36.5e-3,'d':606e-3,'Iz':6080e-6,'Wzel':15900e-6,'Wzpl':18500e-6,'iz':307e-3,'Avy':19392e-6,'Iy':491e-6,'Wyel':2650e-6,'Wypl':4130e-6,'iy':87.6e-3,'It':54500e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X307']={'nmb':'W27X307','P':457,'A':58200e-6,'h':752e-3,'hDet':752e-3,'b':366e-3,'bDet':368e-3,'tw':29.5e-3,'twDet':30.2e-3,'tf':53.1e-3,'tfDet':52.4e-3,'kDes':73.2e-3,'kDet':76.2e-3,'k1':36.5e-3,'d':605.6e-3,'Iz':5450e-6,'Wzel':14500e-6,'Wzpl':16900e-6,'iz':305e-3,'Avy':17865.2e-6,'Iy':437e-6,'Wyel':2390e-6,'Wypl':3720e-6,'iy':86.6e-3,'It':42000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X281']={'nmb':'W27X281','P':419,'A':53600e-6,'h':744e-3,'hDet':743e-3,'b':366e-3,'bDet':365e-3,'tw':26.9e-3,'twDet':27e-3,'tf':49e-3,'tfDet':49.2e-3,'kDes':69.1e-3,'kDet':71.4e-3,'k1':34.9e-3,'d':605.8e-3,'Iz':4950e-6,'Wzel':13300e-6,'Wzpl':15300e-6,'iz':305e-3,'Avy':16296e-6,'Iy':397e-6,'Wyel':2180e-6,'Wypl':3380e-6,'iy':86.1e-3,'It':33100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X258']={'nmb':'W27X258','P':384,'A':49100e-6,'h':737e-3,'hDet':737e-3,'b':363e-3,'bDet':362e-3,'tw':24.9e-3,'twDet':25.4e-3,'tf':45e-3,'tfDet':44.4e-3,'kDes':65e-3,'kDet':68.3e-3,'k1':33.3e-3,'d':607e-3,'Iz':4500e-6,'Wzel':12200e-6,'Wzpl':14000e-6,'iz':302e-3,'Avy':15114.3e-6,'Iy':358e-6,'Wyel':1970e-6,'Wypl':3060e-6,'iy':85.3e-3,'It':25600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X235']={'nmb':'W27X235','P':350,'A':44800e-6,'h':729e-3,'hDet':727e-3,'b':361e-3,'bDet':362e-3,'tw':23.1e-3,'twDet':23.8e-3,'tf':40.9e-3,'tfDet':41.3e-3,'kDes':61e-3,'kDet':63.5e-3,'k1':33.3e-3,'d':607e-3,'Iz':4040e-6,'Wzel':11100e-6,'Wzpl':12700e-6,'iz':300e-3,'Avy':14021.7e-6,'Iy':320e-6,'Wyel':1770e-6,'Wypl':2750e-6,'iy':84.6e-3,'It':19600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X217']={'nmb':'W27X217','P':323,'A':41200e-6,'h':721e-3,'hDet':721e-3,'b':358e-3,'bDet':359e-3,'tw':21.1e-3,'twDet':20.6e-3,'tf':38.1e-3,'tfDet':38.1e-3,'kDes':58.2e-3,'kDet':60.3e-3,'k1':31.8e-3,'d':604.6e-3,'Iz':3710e-6,'Wzel':10300e-6,'Wzpl':11700e-6,'iz':300e-3,'Avy':12757.1e-6,'Iy':293e-6,'Wyel':1640e-6,'Wypl':2520e-6,'iy':84.3e-3,'It':15700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X194']={'nmb':'W27X194','P':389,'A':36800e-6,'h':714e-3,'hDet':714e-3,'b':356e-3,'bDet':356e-3,'tw':19.1e-3,'twDet':19e-3,'tf':34e-3,'tfDet':33.3e-3,'kDes':54.1e-3,'kDet':57.2e-3,'k1':30.2e-3,'d':605.8e-3,'Iz':3270e-6,'Wzel':9160e-6,'Wzpl':10300e-6,'iz':297e-3,'Avy':11570.8e-6,'Iy':258e-6,'Wyel':1440e-6,'Wypl':2230e-6,'iy':83.6e-3,'It':11300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X178']={'nmb':'W27X178','P':365,'A':33900e-6,'h':706e-3,'hDet':705e-3,'b':358e-3,'bDet':359e-3,'tw':18.4e-3,'twDet':19e-3,'tf':30.2e-3,'tfDet':30.2e-3,'kDes':50.3e-3,'kDet':52.4e-3,'k1':30.2e-3,'d':605.4e-3,'Iz':2920e-6,'Wzel':8280e-6,'Wzpl':9340e-6,'iz':295e-3,'Avy':11139.4e-6,'Iy':231e-6,'Wyel':1290e-6,'Wypl':2000e-6,'iy':82.6e-3,'It':8370e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X161']={'nmb':'W27X161','P':240,'A':30700e-6,'h':701e-3,'hDet':702e-3,'b':356e-3,'bDet':356e-3,'tw':16.8e-3,'twDet':17.5e-3,'tf':27.4e-3,'tfDet':27e-3,'kDes':47.5e-3,'kDet':50.8e-3,'k1':30.2e-3,'d':606e-3,'Iz':2630e-6,'Wzel':7510e-6,'Wzpl':8440e-6,'iz':292e-3,'Avy':10180.8e-6,'Iy':207e-6,'Wyel':1160e-6,'Wypl':1790e-6,'iy':82e-3,'It':6290e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X146']={'nmb':'W27X146','P':217,'A':27900e-6,'h':696e-3,'hDet':695e-3,'b':356e-3,'bDet':356e-3,'tw':15.4e-3,'twDet':15.9e-3,'tf':24.8e-3,'tfDet':25.4e-3,'kDes':44.7e-3,'kDet':47.6e-3,'k1':28.6e-3,'d':606.6e-3,'Iz':2360e-6,'Wzel':6780e-6,'Wzpl':7600e-6,'iz':292e-3,'Avy':9341.64e-6,'Iy':184e-6,'Wyel':1040e-6,'Wypl':1600e-6,'iy':81.3e-3,'It':4700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X129']={'nmb':'W27X129','P':192,'A':24400e-6,'h':701e-3,'hDet':702e-3,'b':254e-3,'bDet':254e-3,'tw':15.5e-3,'twDet':15.9e-3,'tf':27.9e-3,'tfDet':28.6e-3,'kDes':43.2e-3,'kDet':50.8e-3,'k1':28.6e-3,'d':614.6e-3,'Iz':1980e-6,'Wzel':5650e-6,'Wzpl':6470e-6,'iz':284e-3,'Avy':9526.3e-6,'Iy':76.6e-6,'Wyel':603e-6,'Wypl':944e-6,'iy':56.1e-3,'It':4620e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X114']={'nmb':'W27X114','P':170,'A':21700e-6,'h':693e-3,'hDet':692e-3,'b':257e-3,'bDet':257e-3,'tw':14.5e-3,'twDet':14.3e-3,'tf':23.6e-3,'tfDet':23.8e-3,'kDes':38.9e-3,'kDet':46e-3,'k1':28.6e-3,'d':615.2e-3,'Iz':1700e-6,'Wzel':4900e-6,'Wzpl':5620e-6,'iz':279e-3,'Avy':8920.4e-6,'Iy':66.2e-6,'Wyel':516e-6,'Wypl':808e-6,'iy':55.4e-3,'It':3050e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X102']={'nmb':'W27X102','P':152,'A':19400e-6,'h':688e-3,'hDet':689e-3,'b':254e-3,'bDet':254e-3,'tw':13.1e-3,'twDet':12.7e-3,'tf':21.1e-3,'tfDet':20.6e-3,'kDes':36.3e-3,'kDet':44.5e-3,'k1':27e-3,'d':615.4e-3,'Iz':1510e-6,'Wzel':4380e-6,'Wzpl':5000e-6,'iz':279e-3,'Avy':8061.74e-6,'Iy':57.9e-6,'Wyel':456e-6,'Wypl':711e-6,'iy':54.6e-3,'It':2200e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X94']={'nmb':'W27X94','P':140,'A':17800e-6,'h':683e-3,'hDet':683e-3,'b':254e-3,'bDet':254e-3,'tw':12.4e-3,'twDet':12.7e-3,'tf':18.9e-3,'tfDet':19e-3,'kDes':34e-3,'kDet':41.3e-3,'k1':27e-3,'d':615e-3,'Iz':1360e-6,'Wzel':3980e-6,'Wzpl':4560e-6,'iz':277e-3,'Avy':7626e-6,'Iy':51.6e-6,'Wyel':406e-6,'Wypl':636e-6,'iy':53.8e-3,'It':1680e-9,'E':2.1e+11,'nu':0.3}
-
-W['W27X84']={'nmb':'W27X84','P':125,'A':15900e-6,'h':678e-3,'hDet':679e-3,'b':254e-3,'bDet':254e-3,'tw':11.7e-3,'twDet':11.1e-3,'tf':16.3e-3,'tfDet':15.9e-3,'kDes':31.5e-3,'kDet':39.7e-3,'k1':27e-3,'d':615e-3,'Iz':1190e-6,'Wzel':3490e-6,'Wzpl':4000e-6,'iz':272e-3,'Avy':7195.5e-6,'Iy':44.1e-6,'Wyel':347e-6,'Wypl':544e-6,'iy':52.6e-3,'It':1170e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X370']={'nmb':'W24X370','P':551,'A':70300e-6,'h':711e-3,'hDet':711e-3,'b':348e-3,'bDet':346e-3,'tw':38.6e-3,'twDet':38.1e-3,'tf':69.1e-3,'tfDet':69.8e-3,'kDes':81.8e-3,'kDet':92.1e-3,'k1':39.7e-3,'d':547.4e-3,'Iz':5580e-6,'Wzel':15700e-6,'Wzpl':18500e-6,'iz':282e-3,'Avy':21129.6e-6,'Iy':483e-6,'Wyel':2790e-6,'Wypl':4380e-6,'iy':83.1e-3,'It':83700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X335']={'nmb':'W24X335','P':498,'A':63400e-6,'h':699e-3,'hDet':698e-3,'b':343e-3,'bDet':343e-3,'tw':35.1e-3,'twDet':34.9e-3,'tf':63e-3,'tfDet':63.5e-3,'kDes':75.7e-3,'kDet':85.7e-3,'k1':38.1e-3,'d':547.6e-3,'Iz':4950e-6,'Wzel':14200e-6,'Wzpl':16700e-6,'iz':279e-3,'Avy':19220.8e-6,'Iy':429e-6,'Wyel':2490e-6,'Wypl':3900e-6,'iy':82e-3,'It':63300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X306']={'nmb':'W24X306','P':455,'A':57900e-6,'h':688e-3,'hDet':689e-3,'b':340e-3,'bDet':340e-3,'tw':32e-3,'twDet':31.8e-3,'tf':57.9e-3,'tfDet':57.2e-3,'kDes':70.6e-3,'kDet':81e-3,'k1':36.5e-3,'d':546.8e-3,'Iz':4450e-6,'Wzel':12900e-6,'Wzpl':15100e-6,'iz':277e-3,'Avy':17497.6e-6,'Iy':383e-6,'Wyel':2250e-6,'Wypl':3510e-6,'iy':81.3e-3,'It':48700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X279']={'nmb':'W24X279','P':415,'A':52800e-6,'h':678e-3,'hDet':679e-3,'b':338e-3,'bDet':337e-3,'tw':29.5e-3,'twDet':30.2e-3,'tf':53.1e-3,'tfDet':52.4e-3,'kDes':65.8e-3,'kDet':76.2e-3,'k1':36.5e-3,'d':546.4e-3,'Iz':4000e-6,'Wzel':11800e-6,'Wzpl':13700e-6,'iz':274e-3,'Avy':16118.8e-6,'Iy':343e-6,'Wyel':2030e-6,'Wypl':3160e-6,'iy':80.5e-3,'It':37700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X250']={'nmb':'W24X250','P':372,'A':47400e-6,'h':668e-3,'hDet':670e-3,'b':335e-3,'bDet':333e-3,'tw':26.4e-3,'twDet':27e-3,'tf':48e-3,'tfDet':47.6e-3,'kDes':60.7e-3,'kDet':71.4e-3,'k1':34.9e-3,'d':546.6e-3,'Iz':3530e-6,'Wzel':10600e-6,'Wzpl':12200e-6,'iz':272e-3,'Avy':14430.2e-6,'Iy':301e-6,'Wyel':1800e-6,'Wypl':2800e-6,'iy':79.8e-3,'It':27700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X229']={'nmb':'W24X229','P':341,'A':43400e-6,'h':660e-3,'hDet':660e-3,'b':333e-3,'bDet':333e-3,'tw':24.4e-3,'twDet':23.8e-3,'tf':43.9e-3,'tfDet':44.4e-3,'kDes':56.6e-3,'kDet':66.7e-3,'k1':33.3e-3,'d':546.8e-3,'Iz':3180e-6,'Wzel':9640e-6,'Wzpl':11100e-6,'iz':272e-3,'Avy':13341.9e-6,'Iy':271e-6,'Wyel':1630e-6,'Wypl':2520e-6,'iy':79e-3,'It':21400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X207']={'nmb':'W24X207','P':307,'A':39200e-6,'h':653e-3,'hDet':654e-3,'b':330e-3,'bDet':330e-3,'tw':22.1e-3,'twDet':22.2e-3,'tf':39.9e-3,'tfDet':39.7e-3,'kDes':52.6e-3,'kDet':63.5e-3,'k1':31.8e-3,'d':547.8e-3,'Iz':2840e-6,'Wzel':8700e-6,'Wzpl':9930e-6,'iz':269e-3,'Avy':12106.4e-6,'Iy':241e-6,'Wyel':1460e-6,'Wypl':2250e-6,'iy':78.2e-3,'It':15900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X192']={'nmb':'W24X192','P':285,'A':36500e-6,'h':648e-3,'hDet':648e-3,'b':330e-3,'bDet':330e-3,'tw':20.6e-3,'twDet':20.6e-3,'tf':37.1e-3,'tfDet':36.5e-3,'kDes':49.8e-3,'kDet':60.3e-3,'k1':31.8e-3,'d':548.4e-3,'Iz':2610e-6,'Wzel':8050e-6,'Wzpl':9160e-6,'iz':267e-3,'Avy':11297e-6,'Iy':221e-6,'Wyel':1340e-6,'Wypl':2060e-6,'iy':78e-3,'It':12800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X176']={'nmb':'W24X176','P':262,'A':33400e-6,'h':640e-3,'hDet':641e-3,'b':328e-3,'bDet':327e-3,'tw':19.1e-3,'twDet':19e-3,'tf':34e-3,'tfDet':33.3e-3,'kDes':46.7e-3,'kDet':57.2e-3,'k1':30.2e-3,'d':546.6e-3,'Iz':2360e-6,'Wzel':7370e-6,'Wzpl':8370e-6,'iz':267e-3,'Avy':10440.1e-6,'Iy':199e-6,'Wyel':1220e-6,'Wypl':1880e-6,'iy':77.2e-3,'It':9950e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X162']={'nmb':'W24X162','P':241,'A':30800e-6,'h':635e-3,'hDet':635e-3,'b':330e-3,'bDet':330e-3,'tw':17.9e-3,'twDet':17.5e-3,'tf':31e-3,'tfDet':31.8e-3,'kDes':43.7e-3,'kDet':54e-3,'k1':30.2e-3,'d':547.6e-3,'Iz':2150e-6,'Wzel':6780e-6,'Wzpl':7670e-6,'iz':264e-3,'Avy':9802.04e-6,'Iy':184e-6,'Wyel':1120e-6,'Wypl':1720e-6,'iy':77.5e-3,'It':7700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X146']={'nmb':'W24X146','P':217,'A':27700e-6,'h':627e-3,'hDet':629e-3,'b':328e-3,'bDet':327e-3,'tw':16.5e-3,'twDet':15.9e-3,'tf':27.7e-3,'tfDet':27e-3,'kDes':40.4e-3,'kDet':50.8e-3,'k1':28.6e-3,'d':546.2e-3,'Iz':1910e-6,'Wzel':6080e-6,'Wzpl':6850e-6,'iz':262e-3,'Avy':9012.3e-6,'Iy':163e-6,'Wyel':991e-6,'Wypl':1530e-6,'iy':76.5e-3,'It':5580e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X131']={'nmb':'W24X131','P':195,'A':24900e-6,'h':622e-3,'hDet':622e-3,'b':328e-3,'bDet':327e-3,'tw':15.4e-3,'twDet':15.9e-3,'tf':24.4e-3,'tfDet':23.8e-3,'kDes':37.1e-3,'kDet':47.6e-3,'k1':28.6e-3,'d':547.8e-3,'Iz':1670e-6,'Wzel':5390e-6,'Wzpl':6060e-6,'iz':259e-3,'Avy':8436.12e-6,'Iy':142e-6,'Wyel':869e-6,'Wypl':1340e-6,'iy':75.4e-3,'It':3950e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X117']={'nmb':'W24X117','P':174,'A':22200e-6,'h':617e-3,'hDet':616e-3,'b':325e-3,'bDet':324e-3,'tw':14e-3,'twDet':14.3e-3,'tf':21.6e-3,'tfDet':22.2e-3,'kDes':34.3e-3,'kDet':44.5e-3,'k1':28.6e-3,'d':548.4e-3,'Iz':1470e-6,'Wzel':4770e-6,'Wzpl':5360e-6,'iz':257e-3,'Avy':7677.6e-6,'Iy':124e-6,'Wyel':762e-6,'Wypl':1170e-6,'iy':74.7e-3,'It':2800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X104']={'nmb':'W24X104','P':155,'A':19800e-6,'h':612e-3,'hDet':610e-3,'b':325e-3,'bDet':324e-3,'tw':12.7e-3,'twDet':12.7e-3,'tf':19.1e-3,'tfDet':19e-3,'kDes':31.8e-3,'kDet':41.3e-3,'k1':27e-3,'d':548.4e-3,'Iz':1290e-6,'Wzel':4230e-6,'Wzpl':4740e-6,'iz':257e-3,'Avy':6964.68e-6,'Iy':108e-6,'Wyel':667e-6,'Wypl':1020e-6,'iy':73.9e-3,'It':1960e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X103']={'nmb':'W24X103','P':153,'A':19500e-6,'h':622e-3,'hDet':622e-3,'b':229e-3,'bDet':229e-3,'tw':14e-3,'twDet':14.3e-3,'tf':24.9e-3,'tfDet':25.4e-3,'kDes':37.6e-3,'kDet':47.6e-3,'k1':28.6e-3,'d':546.8e-3,'Iz':1250e-6,'Wzel':4010e-6,'Wzpl':4590e-6,'iz':254e-3,'Avy':7655.2e-6,'Iy':49.5e-6,'Wyel':434e-6,'Wypl':680e-6,'iy':50.5e-3,'It':2940e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X94']={'nmb':'W24X94','P':140,'A':17900e-6,'h':617e-3,'hDet':616e-3,'b':230e-3,'bDet':232e-3,'tw':13.1e-3,'twDet':12.7e-3,'tf':22.2e-3,'tfDet':22.2e-3,'kDes':35.1e-3,'kDet':44.5e-3,'k1':27e-3,'d':546.8e-3,'Iz':1120e-6,'Wzel':3640e-6,'Wzpl':4160e-6,'iz':251e-3,'Avy':7163.08e-6,'Iy':45.4e-6,'Wyel':393e-6,'Wypl':615e-6,'iy':50.3e-3,'It':2190e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X84']={'nmb':'W24X84','P':125,'A':15900e-6,'h':612e-3,'hDet':613e-3,'b':229e-3,'bDet':229e-3,'tw':11.9e-3,'twDet':12.7e-3,'tf':19.6e-3,'tfDet':19e-3,'kDes':32.3e-3,'kDet':42.9e-3,'k1':27e-3,'d':547.4e-3,'Iz':986e-6,'Wzel':3210e-6,'Wzpl':3670e-6,'iz':249e-3,'Avy':6514.06e-6,'Iy':39.3e-6,'Wyel':342e-6,'Wypl':534e-6,'iy':49.5e-3,'It':1540e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X76']={'nmb':'W24X76','P':113,'A':14500e-6,'h':607e-3,'hDet':606e-3,'b':228e-3,'bDet':229e-3,'tw':11.2e-3,'twDet':11.1e-3,'tf':17.3e-3,'tfDet':17.5e-3,'kDes':30e-3,'kDet':39.7e-3,'k1':27e-3,'d':547e-3,'Iz':874e-6,'Wzel':2880e-6,'Wzpl':3280e-6,'iz':246e-3,'Avy':6126.4e-6,'Iy':34.3e-6,'Wyel':302e-6,'Wypl':469e-6,'iy':48.8e-3,'It':1120e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X68']={'nmb':'W24X68','P':101,'A':13000e-6,'h':602e-3,'hDet':603e-3,'b':228e-3,'bDet':229e-3,'tw':10.5e-3,'twDet':11.1e-3,'tf':14.9e-3,'tfDet':14.3e-3,'kDes':27.7e-3,'kDet':38.1e-3,'k1':27e-3,'d':546.6e-3,'Iz':762e-6,'Wzel':2520e-6,'Wzpl':2900e-6,'iz':243e-3,'Avy':5739.3e-6,'Iy':29.3e-6,'Wyel':257e-6,'Wypl':401e-6,'iy':47.5e-3,'It':778e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X62']={'nmb':'W24X62','P':92,'A':11700e-6,'h':602e-3,'hDet':603e-3,'b':179e-3,'bDet':178e-3,'tw':10.9e-3,'twDet':11.1e-3,'tf':15e-3,'tfDet':14.3e-3,'kDes':27.7e-3,'kDet':38.1e-3,'k1':27e-3,'d':546.6e-3,'Iz':645e-6,'Wzel':2150e-6,'Wzpl':2510e-6,'iz':234e-3,'Avy':5957.94e-6,'Iy':14.4e-6,'Wyel':161e-6,'Wypl':257e-6,'iy':35.1e-3,'It':712e-9,'E':2.1e+11,'nu':0.3}
-
-W['W24X55']={'nmb':'W24X55','P':82,'A':10500e-6,'h':599e-3,'hDet':600e-3,'b':178e-3,'bDet':178e-3,'tw':10e-3,'twDet':9.52e-3,'tf':12.8e-3,'tfDet':12.7e-3,'kDes':25.7e-3,'kDet':36.5e-3,'k1':25.4e-3,'d':547.6e-3,'Iz':562e-6,'Wzel':1870e-6,'Wzpl':2200e-6,'iz':231e-3,'Avy':5476e-6,'Iy':12.1e-6,'Wyel':136e-6,'Wypl':218e-6,'iy':34e-3,'It':491e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X201']={'nmb':'W21X201','P':300,'A':38300e-6,'h':584e-3,'hDet':584e-3,'b':320e-3,'bDet':321e-3,'tw':23.1e-3,'twDet':23.8e-3,'tf':41.4e-3,'tfDet':41.3e-3,'kDes':54.1e-3,'kDet':63.5e-3,'k1':33.3e-3,'d':475.8e-3,'Iz':2210e-6,'Wzel':7550e-6,'Wzpl':8690e-6,'iz':241e-3,'Avy':10991e-6,'Iy':226e-6,'Wyel':1410e-6,'Wypl':2180e-6,'iy':76.7e-3,'It':17000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X182']={'nmb':'W21X182','P':272,'A':34600e-6,'h':577e-3,'hDet':578e-3,'b':318e-3,'bDet':318e-3,'tw':21.1e-3,'twDet':20.6e-3,'tf':37.6e-3,'tfDet':38.1e-3,'kDes':50.3e-3,'kDet':60.3e-3,'k1':31.8e-3,'d':476.4e-3,'Iz':1970e-6,'Wzel':6830e-6,'Wzpl':7800e-6,'iz':239e-3,'Avy':10052e-6,'Iy':201e-6,'Wyel':1270e-6,'Wypl':1950e-6,'iy':76.2e-3,'It':12800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X166']={'nmb':'W21X166','P':248,'A':31500e-6,'h':572e-3,'hDet':572e-3,'b':315e-3,'bDet':314e-3,'tw':19.1e-3,'twDet':19e-3,'tf':34.5e-3,'tfDet':34.9e-3,'kDes':47.2e-3,'kDet':57.2e-3,'k1':30.2e-3,'d':477.6e-3,'Iz':1780e-6,'Wzel':6230e-6,'Wzpl':7080e-6,'iz':238e-3,'Avy':9122.16e-6,'Iy':181e-6,'Wyel':1150e-6,'Wypl':1770e-6,'iy':75.9e-3,'It':9820e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X147']={'nmb':'W21X147','P':219,'A':27900e-6,'h':561e-3,'hDet':559e-3,'b':318e-3,'bDet':318e-3,'tw':18.3e-3,'twDet':19e-3,'tf':29.2e-3,'tfDet':28.6e-3,'kDes':41.9e-3,'kDet':50.8e-3,'k1':30.2e-3,'d':477.2e-3,'Iz':1510e-6,'Wzel':5390e-6,'Wzpl':6110e-6,'iz':233e-3,'Avy':8732.76e-6,'Iy':157e-6,'Wyel':985e-6,'Wypl':1520e-6,'iy':74.9e-3,'It':6410e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X132']={'nmb':'W21X132','P':196,'A':25000e-6,'h':554e-3,'hDet':556e-3,'b':315e-3,'bDet':318e-3,'tw':16.5e-3,'twDet':15.9e-3,'tf':26.4e-3,'tfDet':27e-3,'kDes':39.1e-3,'kDet':49.2e-3,'k1':28.6e-3,'d':475.8e-3,'Iz':1340e-6,'Wzel':4830e-6,'Wzpl':5460e-6,'iz':232e-3,'Avy':7850.7e-6,'Iy':139e-6,'Wyel':877e-6,'Wypl':1350e-6,'iy':74.4e-3,'It':4700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X122']={'nmb':'W21X122','P':182,'A':23200e-6,'h':551e-3,'hDet':549e-3,'b':315e-3,'bDet':314e-3,'tw':15.2e-3,'twDet':15.9e-3,'tf':24.4e-3,'tfDet':23.8e-3,'kDes':37.1e-3,'kDet':46e-3,'k1':28.6e-3,'d':476.8e-3,'Iz':1230e-6,'Wzel':4470e-6,'Wzpl':5030e-6,'iz':231e-3,'Avy':7247.36e-6,'Iy':127e-6,'Wyel':806e-6,'Wypl':1240e-6,'iy':74.2e-3,'It':3740e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X111']={'nmb':'W21X111','P':165,'A':21000e-6,'h':546e-3,'hDet':546e-3,'b':312e-3,'bDet':314e-3,'tw':14e-3,'twDet':14.3e-3,'tf':22.2e-3,'tfDet':22.2e-3,'kDes':35.1e-3,'kDet':44.5e-3,'k1':28.6e-3,'d':475.8e-3,'Iz':1110e-6,'Wzel':4080e-6,'Wzpl':4570e-6,'iz':230e-3,'Avy':6661.2e-6,'Iy':114e-6,'Wyel':729e-6,'Wypl':1120e-6,'iy':73.7e-3,'It':2840e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X101']={'nmb':'W21X101','P':150,'A':19200e-6,'h':544e-3,'hDet':543e-3,'b':312e-3,'bDet':311e-3,'tw':12.7e-3,'twDet':12.7e-3,'tf':20.3e-3,'tfDet':20.6e-3,'kDes':33e-3,'kDet':42.9e-3,'k1':27e-3,'d':478e-3,'Iz':1010e-6,'Wzel':3720e-6,'Wzpl':4150e-6,'iz':229e-3,'Avy':6070.6e-6,'Iy':103e-6,'Wyel':660e-6,'Wypl':1010e-6,'iy':73.4e-3,'It':2170e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X93']={'nmb':'W21X93','P':138,'A':17600e-6,'h':549e-3,'hDet':549e-3,'b':214e-3,'bDet':213e-3,'tw':14.7e-3,'twDet':14.3e-3,'tf':23.6e-3,'tfDet':23.8e-3,'kDes':36.3e-3,'kDet':41.3e-3,'k1':23.8e-3,'d':476.4e-3,'Iz':862e-6,'Wzel':3150e-6,'Wzpl':3620e-6,'iz':221e-3,'Avy':7003.08e-6,'Iy':38.7e-6,'Wyel':362e-6,'Wypl':569e-6,'iy':46.7e-3,'It':2510e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X83']={'nmb':'W21X83','P':123,'A':15700e-6,'h':544e-3,'hDet':543e-3,'b':212e-3,'bDet':213e-3,'tw':13.1e-3,'twDet':12.7e-3,'tf':21.2e-3,'tfDet':20.6e-3,'kDes':34e-3,'kDet':38.1e-3,'k1':22.2e-3,'d':476e-3,'Iz':762e-6,'Wzel':2800e-6,'Wzpl':3210e-6,'iz':220e-3,'Avy':6235.6e-6,'Iy':33.9e-6,'Wyel':320e-6,'Wypl':500e-6,'iy':46.5e-3,'It':1810e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X73']={'nmb':'W21X73','P':109,'A':13900e-6,'h':538e-3,'hDet':540e-3,'b':211e-3,'bDet':210e-3,'tw':11.6e-3,'twDet':11.1e-3,'tf':18.8e-3,'tfDet':19e-3,'kDes':31.5e-3,'kDet':36.5e-3,'k1':22.2e-3,'d':475e-3,'Iz':666e-6,'Wzel':2470e-6,'Wzpl':2820e-6,'iz':219e-3,'Avy':5510e-6,'Iy':29.4e-6,'Wyel':279e-6,'Wypl':436e-6,'iy':46e-3,'It':1260e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X68']={'nmb':'W21X68','P':101,'A':12900e-6,'h':536e-3,'hDet':537e-3,'b':210e-3,'bDet':210e-3,'tw':10.9e-3,'twDet':11.1e-3,'tf':17.4e-3,'tfDet':17.5e-3,'kDes':30.2e-3,'kDet':34.9e-3,'k1':22.2e-3,'d':475.6e-3,'Iz':616e-6,'Wzel':2290e-6,'Wzpl':2620e-6,'iz':218e-3,'Avy':5184.04e-6,'Iy':26.9e-6,'Wyel':257e-6,'Wypl':400e-6,'iy':45.7e-3,'It':1020e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X62']={'nmb':'W21X62','P':92,'A':11800e-6,'h':533e-3,'hDet':533e-3,'b':209e-3,'bDet':210e-3,'tw':10.2e-3,'twDet':9.52e-3,'tf':15.6e-3,'tfDet':15.9e-3,'kDes':28.4e-3,'kDet':33.3e-3,'k1':20.6e-3,'d':476.2e-3,'Iz':554e-6,'Wzel':2080e-6,'Wzpl':2360e-6,'iz':217e-3,'Avy':4857.24e-6,'Iy':23.9e-6,'Wyel':229e-6,'Wypl':356e-6,'iy':45e-3,'It':762e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X55']={'nmb':'W21X55','P':82,'A':10500e-6,'h':528e-3,'hDet':527e-3,'b':209e-3,'bDet':210e-3,'tw':9.53e-3,'twDet':9.52e-3,'tf':13.3e-3,'tfDet':12.7e-3,'kDes':25.9e-3,'kDet':30.2e-3,'k1':20.6e-3,'d':476.2e-3,'Iz':475e-6,'Wzel':1800e-6,'Wzpl':2060e-6,'iz':213e-3,'Avy':4538.19e-6,'Iy':20.1e-6,'Wyel':193e-6,'Wypl':302e-6,'iy':43.9e-3,'It':516e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X48']={'nmb':'W21X48','P':72,'A':9100e-6,'h':523e-3,'hDet':524e-3,'b':207e-3,'bDet':206e-3,'tw':8.89e-3,'twDet':9.52e-3,'tf':10.9e-3,'tfDet':11.1e-3,'kDes':23.6e-3,'kDet':28.6e-3,'k1':20.6e-3,'d':475.8e-3,'Iz':399e-6,'Wzel':1520e-6,'Wzpl':1750e-6,'iz':209e-3,'Avy':4229.86e-6,'Iy':16.1e-6,'Wyel':156e-6,'Wypl':244e-6,'iy':42.2e-3,'It':334e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X57']={'nmb':'W21X57','P':85,'A':10800e-6,'h':536e-3,'hDet':533e-3,'b':167e-3,'bDet':165e-3,'tw':10.3e-3,'twDet':9.52e-3,'tf':16.5e-3,'tfDet':15.9e-3,'kDes':29.2e-3,'kDet':33.3e-3,'k1':20.6e-3,'d':477.6e-3,'Iz':487e-6,'Wzel':1820e-6,'Wzpl':2110e-6,'iz':212e-3,'Avy':4919.28e-6,'Iy':12.7e-6,'Wyel':153e-6,'Wypl':243e-6,'iy':34.3e-3,'It':737e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X50']={'nmb':'W21X50','P':74,'A':9480e-6,'h':528e-3,'hDet':530e-3,'b':166e-3,'bDet':165e-3,'tw':9.65e-3,'twDet':9.52e-3,'tf':13.6e-3,'tfDet':14.3e-3,'kDes':26.4e-3,'kDet':31.8e-3,'k1':20.6e-3,'d':475.2e-3,'Iz':410e-6,'Wzel':1550e-6,'Wzpl':1800e-6,'iz':208e-3,'Avy':4585.68e-6,'Iy':10.4e-6,'Wyel':125e-6,'Wypl':200e-6,'iy':33e-3,'It':475e-9,'E':2.1e+11,'nu':0.3}
-
-W['W21X44']={'nmb':'W21X44','P':66,'A':8390e-6,'h':526e-3,'hDet':524e-3,'b':165e-3,'bDet':165e-3,'tw':8.89e-3,'twDet':9.52e-3,'tf':11.4e-3,'tfDet':11.1e-3,'kDes':24.1e-3,'kDet':28.6e-3,'k1':20.6e-3,'d':477.8e-3,'Iz':351e-6,'Wzel':1340e-6,'Wzpl':1560e-6,'iz':205e-3,'Avy':4247.64e-6,'Iy':8.62e-6,'Wyel':104e-6,'Wypl':167e-6,'iy':32e-3,'It':320e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X311']={'nmb':'W18X311','P':464,'A':59100e-6,'h':566e-3,'hDet':568e-3,'b':305e-3,'bDet':305e-3,'tw':38.6e-3,'twDet':38.1e-3,'tf':69.6e-3,'tfDet':69.8e-3,'kDes':82.3e-3,'kDet':87.3e-3,'k1':34.9e-3,'d':401.4e-3,'Iz':2900e-6,'Wzel':10200e-6,'Wzpl':12400e-6,'iz':221e-3,'Avy':15494e-6,'Iy':331e-6,'Wyel':2160e-6,'Wypl':3390e-6,'iy':74.9e-3,'It':73300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X283']={'nmb':'W18X283','P':421,'A':53700e-6,'h':556e-3,'hDet':556e-3,'b':302e-3,'bDet':302e-3,'tw':35.6e-3,'twDet':34.9e-3,'tf':63.5e-3,'tfDet':63.5e-3,'kDes':76.2e-3,'kDet':81e-3,'k1':33.3e-3,'d':403.6e-3,'Iz':2570e-6,'Wzel':9260e-6,'Wzpl':11100e-6,'iz':219e-3,'Avy':14368.2e-6,'Iy':293e-6,'Wyel':1930e-6,'Wypl':3030e-6,'iy':73.9e-3,'It':55800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X258']={'nmb':'W18X258','P':384,'A':49000e-6,'h':546e-3,'hDet':546e-3,'b':300e-3,'bDet':298e-3,'tw':32.5e-3,'twDet':31.8e-3,'tf':58.4e-3,'tfDet':58.7e-3,'kDes':68.6e-3,'kDet':76.2e-3,'k1':31.8e-3,'d':408.8e-3,'Iz':2290e-6,'Wzel':8420e-6,'Wzpl':10000e-6,'iz':217e-3,'Avy':13286e-6,'Iy':261e-6,'Wyel':1750e-6,'Wypl':2720e-6,'iy':73.2e-3,'It':42900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X234']={'nmb':'W18X234','P':349,'A':44300e-6,'h':536e-3,'hDet':533e-3,'b':297e-3,'bDet':295e-3,'tw':29.5e-3,'twDet':30.2e-3,'tf':53.6e-3,'tfDet':54e-3,'kDes':63.8e-3,'kDet':69.9e-3,'k1':30.2e-3,'d':408.4e-3,'Iz':2040e-6,'Wzel':7640e-6,'Wzpl':9000e-6,'iz':214e-3,'Avy':12047.8e-6,'Iy':232e-6,'Wyel':1570e-6,'Wypl':2440e-6,'iy':72.4e-3,'It':32800e-9,'E':2.1e+11,'nu':0.3}
 
-W['W18X211']={'nmb':'W18X211','P':315,'A':40200e-6,'h':526e-3,'hDet':524e-3,'b':295e-3,'bDet':292e-3,'tw':26.9e-3,'twDet':27e-3,'tf':48.5e-3,'tfDet':49.2e-3,'kDes':58.7e-3,'kDet':65.1e-3,'k1':30.2e-3,'d':408.6e-3,'Iz':1800e-6,'Wzel':6870e-6,'Wzpl':8030e-6,'iz':212e-3,'Avy':10991.3e-6,'Iy':205e-6,'Wyel':1400e-6,'Wypl':2160e-6,'iy':71.6e-3,'It':24400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X192']={'nmb':'W18X192','P':286,'A':36300e-6,'h':518e-3,'hDet':518e-3,'b':292e-3,'bDet':292e-3,'tw':24.4e-3,'twDet':23.8e-3,'tf':44.5e-3,'tfDet':44.4e-3,'kDes':54.6e-3,'kDet':61.9e-3,'k1':28.6e-3,'d':408.8e-3,'Iz':1610e-6,'Wzel':6230e-6,'Wzpl':7240e-6,'iz':210e-3,'Avy':9974.72e-6,'Iy':183e-6,'Wyel':1260e-6,'Wypl':1950e-6,'iy':70.9e-3,'It':18600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X175']={'nmb':'W18X175','P':260,'A':33200e-6,'h':508e-3,'hDet':508e-3,'b':290e-3,'bDet':289e-3,'tw':22.6e-3,'twDet':22.2e-3,'tf':40.4e-3,'tfDet':39.7e-3,'kDes':50.5e-3,'kDet':61.9e-3,'k1':31.8e-3,'d':407e-3,'Iz':1440e-6,'Wzel':5640e-6,'Wzpl':6520e-6,'iz':208e-3,'Avy':9198.2e-6,'Iy':163e-6,'Wyel':1130e-6,'Wypl':1740e-6,'iy':70.1e-3,'It':14100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X158']={'nmb':'W18X158','P':235,'A':29900e-6,'h':500e-3,'hDet':502e-3,'b':287e-3,'bDet':286e-3,'tw':20.6e-3,'twDet':20.6e-3,'tf':36.6e-3,'tfDet':36.5e-3,'kDes':46.7e-3,'kDet':60.3e-3,'k1':31.8e-3,'d':406.6e-3,'Iz':1270e-6,'Wzel':5080e-6,'Wzpl':5830e-6,'iz':206e-3,'Avy':8375.96e-6,'Iy':144e-6,'Wyel':1010e-6,'Wypl':1550e-6,'iy':69.6e-3,'It':10500e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X143']={'nmb':'W18X143','P':213,'A':27100e-6,'h':495e-3,'hDet':495e-3,'b':284e-3,'bDet':286e-3,'tw':18.5e-3,'twDet':19e-3,'tf':33.5e-3,'tfDet':33.3e-3,'kDes':43.7e-3,'kDet':55.6e-3,'k1':30.2e-3,'d':407.6e-3,'Iz':1140e-6,'Wzel':4620e-6,'Wzpl':5280e-6,'iz':205e-3,'Avy':7540.6e-6,'Iy':129e-6,'Wyel':909e-6,'Wypl':1400e-6,'iy':69.1e-3,'It':7990e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X130']={'nmb':'W18X130','P':193,'A':24700e-6,'h':490e-3,'hDet':489e-3,'b':284e-3,'bDet':283e-3,'tw':17e-3,'twDet':17.5e-3,'tf':30.5e-3,'tfDet':30.2e-3,'kDes':40.6e-3,'kDet':52.4e-3,'k1':30.2e-3,'d':408.8e-3,'Iz':1020e-6,'Wzel':4200e-6,'Wzpl':4750e-6,'iz':204e-3,'Avy':6949.6e-6,'Iy':116e-6,'Wyel':818e-6,'Wypl':1260e-6,'iy':68.6e-3,'It':6040e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X119']={'nmb':'W18X119','P':177,'A':22600e-6,'h':483e-3,'hDet':483e-3,'b':287e-3,'bDet':286e-3,'tw':16.6e-3,'twDet':15.9e-3,'tf':26.9e-3,'tfDet':27e-3,'kDes':37.1e-3,'kDet':49.2e-3,'k1':30.2e-3,'d':408.8e-3,'Iz':912e-6,'Wzel':3790e-6,'Wzpl':4290e-6,'iz':201e-3,'Avy':6786.08e-6,'Iy':105e-6,'Wyel':736e-6,'Wypl':1130e-6,'iy':68.3e-3,'It':4410e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X106']={'nmb':'W18X106','P':158,'A':20100e-6,'h':475e-3,'hDet':476e-3,'b':284e-3,'bDet':286e-3,'tw':15e-3,'twDet':14.3e-3,'tf':23.9e-3,'tfDet':23.8e-3,'kDes':34e-3,'kDet':46e-3,'k1':28.6e-3,'d':407e-3,'Iz':795e-6,'Wzel':3340e-6,'Wzpl':3770e-6,'iz':199e-3,'Avy':6105e-6,'Iy':91.6e-6,'Wyel':646e-6,'Wypl':991e-6,'iy':67.6e-3,'It':3110e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X97']={'nmb':'W18X97','P':144,'A':18400e-6,'h':472e-3,'hDet':473e-3,'b':282e-3,'bDet':283e-3,'tw':13.6e-3,'twDet':14.3e-3,'tf':22.1e-3,'tfDet':22.2e-3,'kDes':32.3e-3,'kDet':44.5e-3,'k1':28.6e-3,'d':407.4e-3,'Iz':728e-6,'Wzel':3080e-6,'Wzpl':3460e-6,'iz':199e-3,'Avy':5540.64e-6,'Iy':83.7e-6,'Wyel':592e-6,'Wypl':906e-6,'iy':67.3e-3,'It':2440e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X86']={'nmb':'W18X86','P':128,'A':16300e-6,'h':467e-3,'hDet':467e-3,'b':282e-3,'bDet':283e-3,'tw':12.2e-3,'twDet':12.7e-3,'tf':19.6e-3,'tfDet':19e-3,'kDes':29.7e-3,'kDet':41.3e-3,'k1':27e-3,'d':407.6e-3,'Iz':637e-6,'Wzel':2720e-6,'Wzpl':3050e-6,'iz':197e-3,'Avy':4972.72e-6,'Iy':72.8e-6,'Wyel':518e-6,'Wypl':793e-6,'iy':66.8e-3,'It':1710e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X76']={'nmb':'W18X76','P':113,'A':14400e-6,'h':462e-3,'hDet':464e-3,'b':279e-3,'bDet':279e-3,'tw':10.8e-3,'twDet':11.1e-3,'tf':17.3e-3,'tfDet':17.5e-3,'kDes':27.4e-3,'kDet':39.7e-3,'k1':27e-3,'d':407.2e-3,'Iz':554e-6,'Wzel':2390e-6,'Wzpl':2670e-6,'iz':196e-3,'Avy':4397.76e-6,'Iy':63.3e-6,'Wyel':452e-6,'Wypl':692e-6,'iy':66.3e-3,'It':1180e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X71']={'nmb':'W18X71','P':106,'A':13500e-6,'h':470e-3,'hDet':470e-3,'b':194e-3,'bDet':194e-3,'tw':12.6e-3,'twDet':12.7e-3,'tf':20.6e-3,'tfDet':20.6e-3,'kDes':30.7e-3,'kDet':38.1e-3,'k1':22.2e-3,'d':408.6e-3,'Iz':487e-6,'Wzel':2080e-6,'Wzpl':2390e-6,'iz':191e-3,'Avy':5148.36e-6,'Iy':25.1e-6,'Wyel':259e-6,'Wypl':405e-6,'iy':43.2e-3,'It':1450e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X65']={'nmb':'W18X65','P':97,'A':12300e-6,'h':467e-3,'hDet':467e-3,'b':193e-3,'bDet':194e-3,'tw':11.4e-3,'twDet':11.1e-3,'tf':19.1e-3,'tfDet':19e-3,'kDes':29.2e-3,'kDet':36.5e-3,'k1':22.2e-3,'d':408.6e-3,'Iz':445e-6,'Wzel':1920e-6,'Wzpl':2180e-6,'iz':190e-3,'Avy':4658.04e-6,'Iy':22.8e-6,'Wyel':236e-6,'Wypl':369e-6,'iy':42.9e-3,'It':1140e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X60']={'nmb':'W18X60','P':89,'A':11400e-6,'h':462e-3,'hDet':464e-3,'b':192e-3,'bDet':190e-3,'tw':10.5e-3,'twDet':11.1e-3,'tf':17.7e-3,'tfDet':17.5e-3,'kDes':27.9e-3,'kDet':34.9e-3,'k1':20.6e-3,'d':406.2e-3,'Iz':410e-6,'Wzel':1770e-6,'Wzpl':2020e-6,'iz':190e-3,'Avy':4265.1e-6,'Iy':20.9e-6,'Wyel':218e-6,'Wypl':338e-6,'iy':42.7e-3,'It':903e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X55']={'nmb':'W18X55','P':82,'A':10500e-6,'h':460e-3,'hDet':460e-3,'b':191e-3,'bDet':190e-3,'tw':9.91e-3,'twDet':9.52e-3,'tf':16e-3,'tfDet':15.9e-3,'kDes':26.2e-3,'kDet':33.3e-3,'k1':20.6e-3,'d':407.6e-3,'Iz':370e-6,'Wzel':1610e-6,'Wzpl':1840e-6,'iz':188e-3,'Avy':4039.32e-6,'Iy':18.7e-6,'Wyel':195e-6,'Wypl':303e-6,'iy':42.4e-3,'It':691e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X50']={'nmb':'W18X50','P':74,'A':9480e-6,'h':457e-3,'hDet':457e-3,'b':191e-3,'bDet':190e-3,'tw':9.02e-3,'twDet':9.52e-3,'tf':14.5e-3,'tfDet':14.3e-3,'kDes':24.7e-3,'kDet':31.8e-3,'k1':20.6e-3,'d':407.6e-3,'Iz':333e-6,'Wzel':1460e-6,'Wzpl':1660e-6,'iz':187e-3,'Avy':3676.55e-6,'Iy':16.7e-6,'Wyel':175e-6,'Wypl':272e-6,'iy':41.9e-3,'It':516e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X46']={'nmb':'W18X46','P':68,'A':8710e-6,'h':460e-3,'hDet':457e-3,'b':154e-3,'bDet':152e-3,'tw':9.14e-3,'twDet':9.52e-3,'tf':15.4e-3,'tfDet':15.9e-3,'kDes':25.7e-3,'kDet':31.8e-3,'k1':20.6e-3,'d':408.6e-3,'Iz':296e-6,'Wzel':1290e-6,'Wzpl':1490e-6,'iz':184e-3,'Avy':3734.6e-6,'Iy':9.37e-6,'Wyel':122e-6,'Wypl':192e-6,'iy':32.8e-3,'It':508e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X40']={'nmb':'W18X40','P':60,'A':7610e-6,'h':455e-3,'hDet':454e-3,'b':153e-3,'bDet':152e-3,'tw':8e-3,'twDet':7.94e-3,'tf':13.3e-3,'tfDet':12.7e-3,'kDes':23.5e-3,'kDet':30.2e-3,'k1':20.6e-3,'d':408e-3,'Iz':255e-6,'Wzel':1120e-6,'Wzpl':1280e-6,'iz':183e-3,'Avy':3264e-6,'Iy':7.95e-6,'Wyel':104e-6,'Wypl':164e-6,'iy':32.3e-3,'It':337e-9,'E':2.1e+11,'nu':0.3}
-
-W['W18X35']={'nmb':'W18X35','P':52,'A':6650e-6,'h':450e-3,'hDet':451e-3,'b':152e-3,'bDet':152e-3,'tw':7.62e-3,'twDet':7.94e-3,'tf':10.8e-3,'tfDet':11.1e-3,'kDes':21e-3,'kDet':28.6e-3,'k1':19.1e-3,'d':408e-3,'Iz':212e-6,'Wzel':944e-6,'Wzpl':1090e-6,'iz':179e-3,'Avy':3108.96e-6,'Iy':6.37e-6,'Wyel':83.9e-6,'Wypl':132e-6,'iy':31e-3,'It':211e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X100']={'nmb':'W16X100','P':149,'A':19000e-6,'h':432e-3,'hDet':432e-3,'b':264e-3,'bDet':264e-3,'tw':14.9e-3,'twDet':14.3e-3,'tf':25e-3,'tfDet':25.4e-3,'kDes':35.3e-3,'kDet':47.6e-3,'k1':28.6e-3,'d':361.4e-3,'Iz':620e-6,'Wzel':2870e-6,'Wzpl':3240e-6,'iz':180e-3,'Avy':5384.86e-6,'Iy':77.4e-6,'Wyel':585e-6,'Wypl':900e-6,'iy':63.8e-3,'It':3220e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X89']={'nmb':'W16X89','P':132,'A':16900e-6,'h':427e-3,'hDet':425e-3,'b':264e-3,'bDet':264e-3,'tw':13.3e-3,'twDet':12.7e-3,'tf':22.2e-3,'tfDet':22.2e-3,'kDes':32.5e-3,'kDet':44.5e-3,'k1':27e-3,'d':362e-3,'Iz':541e-6,'Wzel':2540e-6,'Wzpl':2870e-6,'iz':179e-3,'Avy':4814.6e-6,'Iy':67.8e-6,'Wyel':515e-6,'Wypl':788e-6,'iy':63.2e-3,'It':2270e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X77']={'nmb':'W16X77','P':114,'A':14600e-6,'h':419e-3,'hDet':419e-3,'b':262e-3,'bDet':260e-3,'tw':11.6e-3,'twDet':11.1e-3,'tf':19.3e-3,'tfDet':19e-3,'kDes':29.5e-3,'kDet':41.3e-3,'k1':27e-3,'d':360e-3,'Iz':462e-6,'Wzel':2200e-6,'Wzpl':2460e-6,'iz':178e-3,'Avy':4176e-6,'Iy':57.4e-6,'Wyel':441e-6,'Wypl':674e-6,'iy':62.7e-3,'It':1490e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X67']={'nmb':'W16X67','P':100,'A':12600e-6,'h':414e-3,'hDet':416e-3,'b':259e-3,'bDet':260e-3,'tw':10e-3,'twDet':9.52e-3,'tf':16.9e-3,'tfDet':17.5e-3,'kDes':27.2e-3,'kDet':39.7e-3,'k1':25.4e-3,'d':359.6e-3,'Iz':397e-6,'Wzel':1920e-6,'Wzpl':2130e-6,'iz':177e-3,'Avy':3596e-6,'Iy':49.5e-6,'Wyel':380e-6,'Wypl':582e-6,'iy':62.5e-3,'It':995e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X57']={'nmb':'W16X57','P':85,'A':10800e-6,'h':417e-3,'hDet':416e-3,'b':181e-3,'bDet':181e-3,'tw':10.9e-3,'twDet':11.1e-3,'tf':18.2e-3,'tfDet':17.5e-3,'kDes':28.4e-3,'kDet':34.9e-3,'k1':22.2e-3,'d':360.2e-3,'Iz':316e-6,'Wzel':1510e-6,'Wzpl':1720e-6,'iz':171e-3,'Avy':3926.18e-6,'Iy':17.9e-6,'Wyel':198e-6,'Wypl':310e-6,'iy':40.6e-3,'It':924e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X50']={'nmb':'W16X50','P':75,'A':9480e-6,'h':414e-3,'hDet':413e-3,'b':180e-3,'bDet':181e-3,'tw':9.65e-3,'twDet':9.52e-3,'tf':16e-3,'tfDet':15.9e-3,'kDes':26.2e-3,'kDet':33.3e-3,'k1':20.6e-3,'d':361.6e-3,'Iz':274e-6,'Wzel':1330e-6,'Wzpl':1510e-6,'iz':170e-3,'Avy':3489.44e-6,'Iy':15.5e-6,'Wyel':172e-6,'Wypl':267e-6,'iy':40.4e-3,'It':633e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X45']={'nmb':'W16X45','P':67,'A':8580e-6,'h':409e-3,'hDet':410e-3,'b':179e-3,'bDet':178e-3,'tw':8.76e-3,'twDet':9.52e-3,'tf':14.4e-3,'tfDet':14.3e-3,'kDes':24.6e-3,'kDet':31.8e-3,'k1':20.6e-3,'d':359.8e-3,'Iz':244e-6,'Wzel':1190e-6,'Wzpl':1350e-6,'iz':169e-3,'Avy':3151.85e-6,'Iy':13.7e-6,'Wyel':153e-6,'Wypl':238e-6,'iy':39.9e-3,'It':462e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X40']={'nmb':'W16X40','P':60,'A':7610e-6,'h':406e-3,'hDet':406e-3,'b':178e-3,'bDet':178e-3,'tw':7.75e-3,'twDet':7.94e-3,'tf':12.8e-3,'tfDet':12.7e-3,'kDes':23e-3,'kDet':30.2e-3,'k1':20.6e-3,'d':360e-3,'Iz':216e-6,'Wzel':1060e-6,'Wzpl':1200e-6,'iz':168e-3,'Avy':2790e-6,'Iy':12e-6,'Wyel':135e-6,'Wypl':208e-6,'iy':39.9e-3,'It':330e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X36']={'nmb':'W16X36','P':53,'A':6840e-6,'h':404e-3,'hDet':403e-3,'b':178e-3,'bDet':178e-3,'tw':7.49e-3,'twDet':7.94e-3,'tf':10.9e-3,'tfDet':11.1e-3,'kDes':21.1e-3,'kDet':28.6e-3,'k1':19.1e-3,'d':361.8e-3,'Iz':186e-6,'Wzel':926e-6,'Wzpl':1050e-6,'iz':165e-3,'Avy':2709.88e-6,'Iy':10.2e-6,'Wyel':115e-6,'Wypl':177e-6,'iy':38.6e-3,'It':227e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X31']={'nmb':'W16X31','P':46.1,'A':5890e-6,'h':404e-3,'hDet':403e-3,'b':140e-3,'bDet':140e-3,'tw':6.99e-3,'twDet':6.35e-3,'tf':11.2e-3,'tfDet':11.1e-3,'kDes':21.4e-3,'kDet':28.6e-3,'k1':19.1e-3,'d':361.2e-3,'Iz':156e-6,'Wzel':773e-6,'Wzpl':885e-6,'iz':163e-3,'Avy':2524.79e-6,'Iy':5.16e-6,'Wyel':73.6e-6,'Wypl':115e-6,'iy':29.7e-3,'It':192e-9,'E':2.1e+11,'nu':0.3}
-
-W['W16X26']={'nmb':'W16X26','P':38.8,'A':4950e-6,'h':399e-3,'hDet':400e-3,'b':140e-3,'bDet':140e-3,'tw':6.35e-3,'twDet':6.35e-3,'tf':8.76e-3,'tfDet':9.52e-3,'kDes':19e-3,'kDet':27e-3,'k1':19.1e-3,'d':361e-3,'Iz':125e-6,'Wzel':629e-6,'Wzpl':724e-6,'iz':159e-3,'Avy':2292.35e-6,'Iy':3.99e-6,'Wyel':57.2e-6,'Wypl':89.8e-6,'iy':28.4e-3,'It':109e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X730']={'nmb':'W14X730','P':1090,'A':139000e-6,'h':569e-3,'hDet':568e-3,'b':455e-3,'bDet':454e-3,'tw':78e-3,'twDet':77.8e-3,'tf':125e-3,'tfDet':125e-3,'kDes':140e-3,'kDet':157e-3,'k1':69.9e-3,'d':289e-3,'Iz':5950e-6,'Wzel':21000e-6,'Wzpl':27200e-6,'iz':208e-3,'Avy':22542e-6,'Iy':1960e-6,'Wyel':8640e-6,'Wypl':13400e-6,'iy':119e-3,'It':604000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X665']={'nmb':'W14X665','P':990,'A':126000e-6,'h':549e-3,'hDet':549e-3,'b':450e-3,'bDet':448e-3,'tw':71.9e-3,'twDet':71.4e-3,'tf':115e-3,'tfDet':114e-3,'kDes':130e-3,'kDet':148e-3,'k1':66.7e-3,'d':289e-3,'Iz':5160e-6,'Wzel':18800e-6,'Wzpl':24300e-6,'iz':203e-3,'Avy':20779.1e-6,'Iy':1740e-6,'Wyel':7730e-6,'Wypl':12000e-6,'iy':117e-3,'It':466000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X605']={'nmb':'W14X605','P':900,'A':115000e-6,'h':531e-3,'hDet':530e-3,'b':442e-3,'bDet':441e-3,'tw':66e-3,'twDet':66.7e-3,'tf':106e-3,'tfDet':106e-3,'kDes':121e-3,'kDet':138e-3,'k1':63.5e-3,'d':289e-3,'Iz':4500e-6,'Wzel':17000e-6,'Wzpl':21600e-6,'iz':198e-3,'Avy':19074e-6,'Iy':1530e-6,'Wyel':6930e-6,'Wypl':10700e-6,'iy':116e-3,'It':362000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X550']={'nmb':'W14X550','P':818,'A':105000e-6,'h':513e-3,'hDet':514e-3,'b':437e-3,'bDet':438e-3,'tw':60.5e-3,'twDet':60.3e-3,'tf':97e-3,'tfDet':96.8e-3,'kDes':112e-3,'kDet':130e-3,'k1':60.3e-3,'d':289e-3,'Iz':3930e-6,'Wzel':15300e-6,'Wzpl':19300e-6,'iz':194e-3,'Avy':17484.5e-6,'Iy':1350e-6,'Wyel':6190e-6,'Wypl':9550e-6,'iy':114e-3,'It':278000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X500']={'nmb':'W14X500','P':744,'A':94800e-6,'h':498e-3,'hDet':498e-3,'b':432e-3,'bDet':432e-3,'tw':55.6e-3,'twDet':55.6e-3,'tf':88.9e-3,'tfDet':88.9e-3,'kDes':104e-3,'kDet':122e-3,'k1':58.7e-3,'d':290e-3,'Iz':3420e-6,'Wzel':13700e-6,'Wzpl':17200e-6,'iz':190e-3,'Avy':16124e-6,'Iy':1200e-6,'Wyel':5560e-6,'Wypl':8550e-6,'iy':113e-3,'It':214000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X455']={'nmb':'W14X455','P':677,'A':86500e-6,'h':483e-3,'hDet':483e-3,'b':427e-3,'bDet':429e-3,'tw':51.3e-3,'twDet':50.8e-3,'tf':81.5e-3,'tfDet':81e-3,'kDes':96.8e-3,'kDet':114e-3,'k1':57.2e-3,'d':289.4e-3,'Iz':2990e-6,'Wzel':12400e-6,'Wzpl':15300e-6,'iz':186e-3,'Avy':14846.2e-6,'Iy':1070e-6,'Wyel':4980e-6,'Wypl':7670e-6,'iy':111e-3,'It':164000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X426']={'nmb':'W14X426','P':634,'A':80600e-6,'h':475e-3,'hDet':473e-3,'b':424e-3,'bDet':425e-3,'tw':47.8e-3,'twDet':47.6e-3,'tf':77.2e-3,'tfDet':77.8e-3,'kDes':92.2e-3,'kDet':110e-3,'k1':54e-3,'d':290.6e-3,'Iz':2750e-6,'Wzel':11600e-6,'Wzpl':14200e-6,'iz':184e-3,'Avy':13890.7e-6,'Iy':982e-6,'Wyel':4640e-6,'Wypl':7110e-6,'iy':110e-3,'It':138000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X398']={'nmb':'W14X398','P':592,'A':75500e-6,'h':465e-3,'hDet':464e-3,'b':422e-3,'bDet':422e-3,'tw':45e-3,'twDet':44.4e-3,'tf':72.4e-3,'tfDet':73e-3,'kDes':87.4e-3,'kDet':105e-3,'k1':54e-3,'d':290.2e-3,'Iz':2500e-6,'Wzel':10700e-6,'Wzpl':13100e-6,'iz':182e-3,'Avy':13059e-6,'Iy':903e-6,'Wyel':4290e-6,'Wypl':6590e-6,'iy':109e-3,'It':114000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X370']={'nmb':'W14X370','P':551,'A':70300e-6,'h':455e-3,'hDet':454e-3,'b':419e-3,'bDet':419e-3,'tw':42.2e-3,'twDet':42.9e-3,'tf':67.6e-3,'tfDet':68.3e-3,'kDes':82.8e-3,'kDet':100e-3,'k1':52.4e-3,'d':289.4e-3,'Iz':2260e-6,'Wzel':9950e-6,'Wzpl':12100e-6,'iz':180e-3,'Avy':12212.7e-6,'Iy':828e-6,'Wyel':3950e-6,'Wypl':6060e-6,'iy':108e-3,'It':92400e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X342']={'nmb':'W14X342','P':509,'A':65200e-6,'h':445e-3,'hDet':444e-3,'b':417e-3,'bDet':416e-3,'tw':39.1e-3,'twDet':39.7e-3,'tf':62.7e-3,'tfDet':63.5e-3,'kDes':78e-3,'kDet':95.3e-3,'k1':50.8e-3,'d':289e-3,'Iz':2040e-6,'Wzel':9140e-6,'Wzpl':11000e-6,'iz':177e-3,'Avy':11299.9e-6,'Iy':753e-6,'Wyel':3620e-6,'Wypl':5540e-6,'iy':108e-3,'It':74100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X311']={'nmb':'W14X311','P':463,'A':59000e-6,'h':434e-3,'hDet':435e-3,'b':411e-3,'bDet':413e-3,'tw':35.8e-3,'twDet':36.5e-3,'tf':57.4e-3,'tfDet':57.2e-3,'kDes':72.6e-3,'kDet':90.5e-3,'k1':49.2e-3,'d':288.8e-3,'Iz':1800e-6,'Wzel':8290e-6,'Wzpl':9880e-6,'iz':175e-3,'Avy':10339e-6,'Iy':670e-6,'Wyel':3260e-6,'Wypl':4980e-6,'iy':107e-3,'It':56600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X283']={'nmb':'W14X283','P':421,'A':53700e-6,'h':424e-3,'hDet':425e-3,'b':409e-3,'bDet':410e-3,'tw':32.8e-3,'twDet':33.3e-3,'tf':52.6e-3,'tfDet':52.4e-3,'kDes':67.8e-3,'kDet':85.7e-3,'k1':47.6e-3,'d':288.4e-3,'Iz':1600e-6,'Wzel':7520e-6,'Wzpl':8880e-6,'iz':172e-3,'Avy':9459.52e-6,'Iy':599e-6,'Wyel':2930e-6,'Wypl':4490e-6,'iy':106e-3,'It':43300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X257']={'nmb':'W14X257','P':382,'A':48800e-6,'h':417e-3,'hDet':416e-3,'b':406e-3,'bDet':406e-3,'tw':30e-3,'twDet':30.2e-3,'tf':48e-3,'tfDet':47.6e-3,'kDes':63.2e-3,'kDet':81e-3,'k1':46e-3,'d':290.6e-3,'Iz':1420e-6,'Wzel':6800e-6,'Wzpl':7980e-6,'iz':170e-3,'Avy':8718e-6,'Iy':537e-6,'Wyel':2640e-6,'Wypl':4030e-6,'iy':105e-3,'It':32900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X233']={'nmb':'W14X233','P':347,'A':44200e-6,'h':406e-3,'hDet':406e-3,'b':404e-3,'bDet':403e-3,'tw':27.2e-3,'twDet':27e-3,'tf':43.7e-3,'tfDet':44.4e-3,'kDes':58.9e-3,'kDet':76.2e-3,'k1':44.5e-3,'d':288.2e-3,'Iz':1250e-6,'Wzel':6150e-6,'Wzpl':7140e-6,'iz':168e-3,'Avy':7839.04e-6,'Iy':479e-6,'Wyel':2380e-6,'Wypl':3620e-6,'iy':104e-3,'It':24800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X211']={'nmb':'W14X211','P':314,'A':40000e-6,'h':399e-3,'hDet':400e-3,'b':401e-3,'bDet':400e-3,'tw':24.9e-3,'twDet':25.4e-3,'tf':39.6e-3,'tfDet':39.7e-3,'kDes':54.9e-3,'kDet':73e-3,'k1':42.9e-3,'d':289.2e-3,'Iz':1110e-6,'Wzel':5540e-6,'Wzpl':6390e-6,'iz':166e-3,'Avy':7201.08e-6,'Iy':429e-6,'Wyel':2130e-6,'Wypl':3240e-6,'iy':103e-3,'It':18600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X193']={'nmb':'W14X193','P':287,'A':36600e-6,'h':394e-3,'hDet':394e-3,'b':399e-3,'bDet':400e-3,'tw':22.6e-3,'twDet':22.2e-3,'tf':36.6e-3,'tfDet':36.5e-3,'kDes':51.8e-3,'kDet':69.9e-3,'k1':42.9e-3,'d':290.4e-3,'Iz':999e-6,'Wzel':5080e-6,'Wzpl':5820e-6,'iz':165e-3,'Avy':6563.04e-6,'Iy':388e-6,'Wyel':1950e-6,'Wypl':2950e-6,'iy':103e-3,'It':14500e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X176']={'nmb':'W14X176','P':262,'A':33400e-6,'h':386e-3,'hDet':387e-3,'b':399e-3,'bDet':397e-3,'tw':21.1e-3,'twDet':20.6e-3,'tf':33.3e-3,'tfDet':33.3e-3,'kDes':48.5e-3,'kDet':66.7e-3,'k1':41.3e-3,'d':289e-3,'Iz':891e-6,'Wzel':4600e-6,'Wzpl':5240e-6,'iz':163e-3,'Avy':6097.9e-6,'Iy':349e-6,'Wyel':1750e-6,'Wypl':2670e-6,'iy':102e-3,'It':11000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X159']={'nmb':'W14X159','P':237,'A':30100e-6,'h':381e-3,'hDet':381e-3,'b':396e-3,'bDet':397e-3,'tw':18.9e-3,'twDet':19e-3,'tf':30.2e-3,'tfDet':30.2e-3,'kDes':45.5e-3,'kDet':63.5e-3,'k1':39.7e-3,'d':290e-3,'Iz':791e-6,'Wzel':4160e-6,'Wzpl':4700e-6,'iz':162e-3,'Avy':5481e-6,'Iy':311e-6,'Wyel':1580e-6,'Wypl':2390e-6,'iy':102e-3,'It':8200e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X145']={'nmb':'W14X145','P':216,'A':27500e-6,'h':376e-3,'hDet':375e-3,'b':394e-3,'bDet':394e-3,'tw':17.3e-3,'twDet':17.5e-3,'tf':27.7e-3,'tfDet':27e-3,'kDes':42.9e-3,'kDet':60.3e-3,'k1':39.7e-3,'d':290.2e-3,'Iz':712e-6,'Wzel':3800e-6,'Wzpl':4260e-6,'iz':161e-3,'Avy':5020.46e-6,'Iy':282e-6,'Wyel':1430e-6,'Wypl':2180e-6,'iy':101e-3,'It':6330e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X132']={'nmb':'W14X132','P':196,'A':25000e-6,'h':373e-3,'hDet':371e-3,'b':373e-3,'bDet':375e-3,'tw':16.4e-3,'twDet':15.9e-3,'tf':26.2e-3,'tfDet':25.4e-3,'kDes':41.4e-3,'kDet':58.7e-3,'k1':39.7e-3,'d':290.2e-3,'Iz':637e-6,'Wzel':3420e-6,'Wzpl':3830e-6,'iz':160e-3,'Avy':4759.28e-6,'Iy':228e-6,'Wyel':1220e-6,'Wypl':1850e-6,'iy':95.5e-3,'It':5120e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X120']={'nmb':'W14X120','P':179,'A':22800e-6,'h':368e-3,'hDet':368e-3,'b':373e-3,'bDet':371e-3,'tw':15e-3,'twDet':14.3e-3,'tf':23.9e-3,'tfDet':23.8e-3,'kDes':39.1e-3,'kDet':57.2e-3,'k1':38.1e-3,'d':289.8e-3,'Iz':574e-6,'Wzel':3110e-6,'Wzpl':3470e-6,'iz':158e-3,'Avy':4347e-6,'Iy':206e-6,'Wyel':1110e-6,'Wypl':1670e-6,'iy':95e-3,'It':3900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X109']={'nmb':'W14X109','P':162,'A':20600e-6,'h':363e-3,'hDet':365e-3,'b':371e-3,'bDet':371e-3,'tw':13.3e-3,'twDet':12.7e-3,'tf':21.8e-3,'tfDet':22.2e-3,'kDes':37.1e-3,'kDet':55.6e-3,'k1':38.1e-3,'d':288.8e-3,'Iz':516e-6,'Wzel':2830e-6,'Wzpl':3150e-6,'iz':158e-3,'Avy':3841.04e-6,'Iy':186e-6,'Wyel':1000e-6,'Wypl':1520e-6,'iy':94.7e-3,'It':2960e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X99']={'nmb':'W14X99','P':147,'A':18800e-6,'h':361e-3,'hDet':359e-3,'b':371e-3,'bDet':371e-3,'tw':12.3e-3,'twDet':12.7e-3,'tf':19.8e-3,'tfDet':19e-3,'kDes':35.1e-3,'kDet':52.4e-3,'k1':36.5e-3,'d':290.8e-3,'Iz':462e-6,'Wzel':2570e-6,'Wzpl':2830e-6,'iz':157e-3,'Avy':3576.84e-6,'Iy':167e-6,'Wyel':905e-6,'Wypl':1370e-6,'iy':94.2e-3,'It':2240e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X90']={'nmb':'W14X90','P':134,'A':17100e-6,'h':356e-3,'hDet':356e-3,'b':368e-3,'bDet':368e-3,'tw':11.2e-3,'twDet':11.1e-3,'tf':18e-3,'tfDet':17.5e-3,'kDes':33.3e-3,'kDet':50.8e-3,'k1':36.5e-3,'d':289.4e-3,'Iz':416e-6,'Wzel':2340e-6,'Wzpl':2570e-6,'iz':156e-3,'Avy':3241.28e-6,'Iy':151e-6,'Wyel':818e-6,'Wypl':1240e-6,'iy':94e-3,'It':1690e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X82']={'nmb':'W14X82','P':122,'A':15500e-6,'h':363e-3,'hDet':362e-3,'b':257e-3,'bDet':257e-3,'tw':13e-3,'twDet':12.7e-3,'tf':21.7e-3,'tfDet':22.2e-3,'kDes':36.8e-3,'kDet':42.9e-3,'k1':27e-3,'d':289.4e-3,'Iz':367e-6,'Wzel':2020e-6,'Wzpl':2280e-6,'iz':154e-3,'Avy':3762.2e-6,'Iy':61.6e-6,'Wyel':480e-6,'Wypl':734e-6,'iy':63e-3,'It':2110e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X74']={'nmb':'W14X74','P':110,'A':14100e-6,'h':361e-3,'hDet':359e-3,'b':257e-3,'bDet':257e-3,'tw':11.4e-3,'twDet':11.1e-3,'tf':19.9e-3,'tfDet':20.6e-3,'kDes':35.1e-3,'kDet':41.3e-3,'k1':27e-3,'d':290.8e-3,'Iz':331e-6,'Wzel':1840e-6,'Wzpl':2060e-6,'iz':153e-3,'Avy':3315.12e-6,'Iy':55.8e-6,'Wyel':436e-6,'Wypl':664e-6,'iy':63e-3,'It':1610e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X68']={'nmb':'W14X68','P':101,'A':12900e-6,'h':356e-3,'hDet':356e-3,'b':254e-3,'bDet':254e-3,'tw':10.5e-3,'twDet':11.1e-3,'tf':18.3e-3,'tfDet':19e-3,'kDes':33.3e-3,'kDet':39.7e-3,'k1':27e-3,'d':289.4e-3,'Iz':301e-6,'Wzel':1690e-6,'Wzpl':1880e-6,'iz':153e-3,'Avy':3038.7e-6,'Iy':50.4e-6,'Wyel':397e-6,'Wypl':605e-6,'iy':62.5e-3,'It':1250e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X61']={'nmb':'W14X61','P':91,'A':11500e-6,'h':353e-3,'hDet':352e-3,'b':254e-3,'bDet':254e-3,'tw':9.53e-3,'twDet':9.52e-3,'tf':16.4e-3,'tfDet':15.9e-3,'kDes':31.5e-3,'kDet':38.1e-3,'k1':25.4e-3,'d':290e-3,'Iz':266e-6,'Wzel':1510e-6,'Wzpl':1670e-6,'iz':152e-3,'Avy':2763.7e-6,'Iy':44.5e-6,'Wyel':352e-6,'Wypl':537e-6,'iy':62.2e-3,'It':912e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X53']={'nmb':'W14X53','P':79,'A':10100e-6,'h':353e-3,'hDet':352e-3,'b':205e-3,'bDet':203e-3,'tw':9.4e-3,'twDet':9.52e-3,'tf':16.8e-3,'tfDet':17.5e-3,'kDes':31.8e-3,'kDet':38.1e-3,'k1':25.4e-3,'d':289.4e-3,'Iz':225e-6,'Wzel':1270e-6,'Wzpl':1430e-6,'iz':150e-3,'Avy':2720.36e-6,'Iy':24e-6,'Wyel':234e-6,'Wypl':361e-6,'iy':48.8e-3,'It':807e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X48']={'nmb':'W14X48','P':72,'A':9100e-6,'h':351e-3,'hDet':349e-3,'b':204e-3,'bDet':203e-3,'tw':8.64e-3,'twDet':7.94e-3,'tf':15.1e-3,'tfDet':15.9e-3,'kDes':30.2e-3,'kDet':36.5e-3,'k1':25.4e-3,'d':290.6e-3,'Iz':201e-6,'Wzel':1150e-6,'Wzpl':1280e-6,'iz':149e-3,'Avy':2510.78e-6,'Iy':21.4e-6,'Wyel':210e-6,'Wypl':321e-6,'iy':48.5e-3,'It':604e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X43']={'nmb':'W14X43','P':64,'A':8130e-6,'h':348e-3,'hDet':346e-3,'b':203e-3,'bDet':203e-3,'tw':7.75e-3,'twDet':7.94e-3,'tf':13.5e-3,'tfDet':12.7e-3,'kDes':28.4e-3,'kDet':34.9e-3,'k1':25.4e-3,'d':291.2e-3,'Iz':178e-6,'Wzel':1030e-6,'Wzpl':1140e-6,'iz':148e-3,'Avy':2256.8e-6,'Iy':18.8e-6,'Wyel':185e-6,'Wypl':283e-6,'iy':48e-3,'It':437e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X38']={'nmb':'W14X38','P':57.8,'A':7230e-6,'h':358e-3,'hDet':359e-3,'b':172e-3,'bDet':171e-3,'tw':7.87e-3,'twDet':7.94e-3,'tf':13.1e-3,'tfDet':12.7e-3,'kDes':23.2e-3,'kDet':31.8e-3,'k1':20.6e-3,'d':311.6e-3,'Iz':160e-6,'Wzel':895e-6,'Wzpl':1010e-6,'iz':149e-3,'Avy':2452.29e-6,'Iy':11.1e-6,'Wyel':129e-6,'Wypl':198e-6,'iy':39.4e-3,'It':332e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X34']={'nmb':'W14X34','P':51,'A':6450e-6,'h':356e-3,'hDet':356e-3,'b':171e-3,'bDet':171e-3,'tw':7.24e-3,'twDet':7.94e-3,'tf':11.6e-3,'tfDet':11.1e-3,'kDes':21.7e-3,'kDet':30.2e-3,'k1':19.1e-3,'d':312.6e-3,'Iz':142e-6,'Wzel':796e-6,'Wzpl':895e-6,'iz':148e-3,'Avy':2263.22e-6,'Iy':9.7e-6,'Wyel':113e-6,'Wypl':174e-6,'iy':38.9e-3,'It':237e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X30']={'nmb':'W14X30','P':44,'A':5710e-6,'h':351e-3,'hDet':352e-3,'b':171e-3,'bDet':171e-3,'tw':6.86e-3,'twDet':6.35e-3,'tf':9.78e-3,'tfDet':9.52e-3,'kDes':19.9e-3,'kDet':28.6e-3,'k1':19.1e-3,'d':311.2e-3,'Iz':121e-6,'Wzel':688e-6,'Wzpl':775e-6,'iz':146e-3,'Avy':2134.83e-6,'Iy':8.16e-6,'Wyel':95.4e-6,'Wypl':147e-6,'iy':37.8e-3,'It':158e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X26']={'nmb':'W14X26','P':39,'A':4960e-6,'h':353e-3,'hDet':352e-3,'b':128e-3,'bDet':127e-3,'tw':6.48e-3,'twDet':6.35e-3,'tf':10.7e-3,'tfDet':11.1e-3,'kDes':20.8e-3,'kDet':28.6e-3,'k1':19.1e-3,'d':311.4e-3,'Iz':102e-6,'Wzel':578e-6,'Wzpl':659e-6,'iz':144e-3,'Avy':2017.87e-6,'Iy':3.71e-6,'Wyel':58.2e-6,'Wypl':90.8e-6,'iy':27.4e-3,'It':149e-9,'E':2.1e+11,'nu':0.3}
-
-W['W14X22']={'nmb':'W14X22','P':32.9,'A':4190e-6,'h':348e-3,'hDet':349e-3,'b':127e-3,'bDet':127e-3,'tw':5.84e-3,'twDet':6.35e-3,'tf':8.51e-3,'tfDet':7.94e-3,'kDes':18.7e-3,'kDet':27e-3,'k1':19.1e-3,'d':310.6e-3,'Iz':82.8e-6,'Wzel':475e-6,'Wzpl':544e-6,'iz':141e-3,'Avy':1813.9e-6,'Iy':2.91e-6,'Wyel':45.9e-6,'Wypl':71.9e-6,'iy':26.4e-3,'It':86.6e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X336']={'nmb':'W12X336','P':500,'A':63800e-6,'h':427e-3,'hDet':429e-3,'b':340e-3,'bDet':340e-3,'tw':45.2e-3,'twDet':44.4e-3,'tf':75.2e-3,'tfDet':74.6e-3,'kDes':90.2e-3,'kDet':98.4e-3,'k1':42.9e-3,'d':246.6e-3,'Iz':1690e-6,'Wzel':7910e-6,'Wzpl':9880e-6,'iz':163e-3,'Avy':11146.3e-6,'Iy':495e-6,'Wyel':2900e-6,'Wypl':4490e-6,'iy':88.1e-3,'It':101000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X305']={'nmb':'W12X305','P':454,'A':57700e-6,'h':414e-3,'hDet':416e-3,'b':335e-3,'bDet':337e-3,'tw':41.4e-3,'twDet':41.3e-3,'tf':68.8e-3,'tfDet':68.3e-3,'kDes':83.8e-3,'kDet':92.1e-3,'k1':41.3e-3,'d':246.4e-3,'Iz':1480e-6,'Wzel':7130e-6,'Wzpl':8800e-6,'iz':160e-3,'Avy':10201e-6,'Iy':437e-6,'Wyel':2610e-6,'Wypl':4000e-6,'iy':86.9e-3,'It':77000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X279']={'nmb':'W12X279','P':415,'A':52800e-6,'h':404e-3,'hDet':403e-3,'b':333e-3,'bDet':333e-3,'tw':38.9e-3,'twDet':38.1e-3,'tf':62.7e-3,'tfDet':63.5e-3,'kDes':78e-3,'kDet':85.7e-3,'k1':41.3e-3,'d':248e-3,'Iz':1290e-6,'Wzel':6440e-6,'Wzpl':7880e-6,'iz':156e-3,'Avy':9647.2e-6,'Iy':390e-6,'Wyel':2340e-6,'Wypl':3610e-6,'iy':85.9e-3,'It':59500e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X252']={'nmb':'W12X252','P':375,'A':47800e-6,'h':391e-3,'hDet':391e-3,'b':330e-3,'bDet':330e-3,'tw':35.6e-3,'twDet':34.9e-3,'tf':57.2e-3,'tfDet':57.2e-3,'kDes':72.4e-3,'kDet':79.4e-3,'k1':38.1e-3,'d':246.2e-3,'Iz':1130e-6,'Wzel':5780e-6,'Wzpl':7010e-6,'iz':154e-3,'Avy':8764.72e-6,'Iy':345e-6,'Wyel':2080e-6,'Wypl':3210e-6,'iy':84.8e-3,'It':45000e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X230']={'nmb':'W12X230','P':342,'A':43700e-6,'h':384e-3,'hDet':381e-3,'b':328e-3,'bDet':327e-3,'tw':32.8e-3,'twDet':33.3e-3,'tf':52.6e-3,'tfDet':52.4e-3,'kDes':67.8e-3,'kDet':74.6e-3,'k1':38.1e-3,'d':248.4e-3,'Iz':1010e-6,'Wzel':5260e-6,'Wzpl':6330e-6,'iz':152e-3,'Avy':8147.52e-6,'Iy':309e-6,'Wyel':1880e-6,'Wypl':2900e-6,'iy':84.1e-3,'It':34900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X210']={'nmb':'W12X210','P':313,'A':39900e-6,'h':373e-3,'hDet':375e-3,'b':325e-3,'bDet':324e-3,'tw':30e-3,'twDet':30.2e-3,'tf':48.3e-3,'tfDet':47.6e-3,'kDes':63.5e-3,'kDet':71.4e-3,'k1':36.5e-3,'d':246e-3,'Iz':891e-6,'Wzel':4790e-6,'Wzpl':5700e-6,'iz':150e-3,'Avy':7380e-6,'Iy':276e-6,'Wyel':1700e-6,'Wypl':2610e-6,'iy':83.3e-3,'It':26900e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X190']={'nmb':'W12X190','P':283,'A':36100e-6,'h':366e-3,'hDet':365e-3,'b':323e-3,'bDet':321e-3,'tw':26.9e-3,'twDet':27e-3,'tf':44.2e-3,'tfDet':44.4e-3,'kDes':59.2e-3,'kDet':66.7e-3,'k1':34.9e-3,'d':247.6e-3,'Iz':787e-6,'Wzel':4310e-6,'Wzpl':5100e-6,'iz':148e-3,'Avy':6660.44e-6,'Iy':245e-6,'Wyel':1520e-6,'Wypl':2340e-6,'iy':82.6e-3,'It':20300e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X170']={'nmb':'W12X170','P':253,'A':32300e-6,'h':356e-3,'hDet':356e-3,'b':320e-3,'bDet':321e-3,'tw':24.4e-3,'twDet':23.8e-3,'tf':39.6e-3,'tfDet':39.7e-3,'kDes':54.9e-3,'kDet':61.9e-3,'k1':33.3e-3,'d':246.2e-3,'Iz':687e-6,'Wzel':3850e-6,'Wzpl':4510e-6,'iz':146e-3,'Avy':6007.28e-6,'Iy':215e-6,'Wyel':1350e-6,'Wypl':2060e-6,'iy':81.8e-3,'It':14800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X152']={'nmb':'W12X152','P':226,'A':28800e-6,'h':348e-3,'hDet':349e-3,'b':318e-3,'bDet':318e-3,'tw':22.1e-3,'twDet':22.2e-3,'tf':35.6e-3,'tfDet':34.9e-3,'kDes':50.8e-3,'kDet':58.7e-3,'k1':31.8e-3,'d':246.4e-3,'Iz':595e-6,'Wzel':3420e-6,'Wzpl':3980e-6,'iz':144e-3,'Avy':5445.44e-6,'Iy':189e-6,'Wyel':1190e-6,'Wypl':1820e-6,'iy':81e-3,'It':10700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X136']={'nmb':'W12X136','P':202,'A':25700e-6,'h':340e-3,'hDet':340e-3,'b':315e-3,'bDet':314e-3,'tw':20.1e-3,'twDet':20.6e-3,'tf':31.8e-3,'tfDet':31.8e-3,'kDes':47e-3,'kDet':54e-3,'k1':31.8e-3,'d':246e-3,'Iz':516e-6,'Wzel':3050e-6,'Wzpl':3510e-6,'iz':142e-3,'Avy':4944.6e-6,'Iy':166e-6,'Wyel':1050e-6,'Wypl':1610e-6,'iy':80.3e-3,'It':7700e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X120']={'nmb':'W12X120','P':179,'A':22700e-6,'h':333e-3,'hDet':333e-3,'b':312e-3,'bDet':314e-3,'tw':18e-3,'twDet':17.5e-3,'tf':28.2e-3,'tfDet':28.6e-3,'kDes':43.2e-3,'kDet':50.8e-3,'k1':30.2e-3,'d':246.6e-3,'Iz':445e-6,'Wzel':2670e-6,'Wzpl':3050e-6,'iz':140e-3,'Avy':4438.8e-6,'Iy':144e-6,'Wyel':918e-6,'Wypl':1400e-6,'iy':79.5e-3,'It':5370e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X106']={'nmb':'W12X106','P':158,'A':20100e-6,'h':328e-3,'hDet':327e-3,'b':310e-3,'bDet':311e-3,'tw':15.5e-3,'twDet':15.9e-3,'tf':25.1e-3,'tfDet':25.4e-3,'kDes':40.4e-3,'kDet':47.6e-3,'k1':28.6e-3,'d':247.2e-3,'Iz':388e-6,'Wzel':2380e-6,'Wzpl':2690e-6,'iz':139e-3,'Avy':3831.6e-6,'Iy':125e-6,'Wyel':808e-6,'Wypl':1230e-6,'iy':79e-3,'It':3800e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X96']={'nmb':'W12X96','P':143,'A':18200e-6,'h':323e-3,'hDet':324e-3,'b':310e-3,'bDet':308e-3,'tw':14e-3,'twDet':14.3e-3,'tf':22.9e-3,'tfDet':22.2e-3,'kDes':38.1e-3,'kDet':46e-3,'k1':28.6e-3,'d':246.8e-3,'Iz':347e-6,'Wzel':2150e-6,'Wzpl':2410e-6,'iz':138e-3,'Avy':3455.2e-6,'Iy':112e-6,'Wyel':728e-6,'Wypl':1110e-6,'iy':78.5e-3,'It':2850e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X87']={'nmb':'W12X87','P':129,'A':16500e-6,'h':318e-3,'hDet':318e-3,'b':307e-3,'bDet':308e-3,'tw':13.1e-3,'twDet':12.7e-3,'tf':20.6e-3,'tfDet':20.6e-3,'kDes':35.8e-3,'kDet':42.9e-3,'k1':27e-3,'d':246.4e-3,'Iz':308e-6,'Wzel':1930e-6,'Wzpl':2160e-6,'iz':137e-3,'Avy':3227.84e-6,'Iy':100e-6,'Wyel':651e-6,'Wypl':990e-6,'iy':78e-3,'It':2120e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X79']={'nmb':'W12X79','P':117,'A':15000e-6,'h':315e-3,'hDet':314e-3,'b':307e-3,'bDet':308e-3,'tw':11.9e-3,'twDet':12.7e-3,'tf':18.7e-3,'tfDet':19e-3,'kDes':33.8e-3,'kDet':41.3e-3,'k1':27e-3,'d':247.4e-3,'Iz':276e-6,'Wzel':1750e-6,'Wzpl':1950e-6,'iz':136e-3,'Avy':2944.06e-6,'Iy':89.9e-6,'Wyel':587e-6,'Wypl':890e-6,'iy':77.5e-3,'It':1600e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X72']={'nmb':'W12X72','P':107,'A':13600e-6,'h':312e-3,'hDet':311e-3,'b':305e-3,'bDet':305e-3,'tw':10.9e-3,'twDet':11.1e-3,'tf':17e-3,'tfDet':17.5e-3,'kDes':32.3e-3,'kDet':39.7e-3,'k1':27e-3,'d':247.4e-3,'Iz':248e-6,'Wzel':1600e-6,'Wzpl':1770e-6,'iz':135e-3,'Avy':2696.66e-6,'Iy':81.2e-6,'Wyel':531e-6,'Wypl':806e-6,'iy':77.2e-3,'It':1220e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X65']={'nmb':'W12X65','P':97,'A':12300e-6,'h':307e-3,'hDet':308e-3,'b':305e-3,'bDet':305e-3,'tw':9.91e-3,'twDet':9.52e-3,'tf':15.4e-3,'tfDet':15.9e-3,'kDes':30.5e-3,'kDet':38.1e-3,'k1':25.4e-3,'d':246e-3,'Iz':222e-6,'Wzel':1440e-6,'Wzpl':1590e-6,'iz':134e-3,'Avy':2437.86e-6,'Iy':72.4e-6,'Wyel':477e-6,'Wypl':723e-6,'iy':76.7e-3,'It':907e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X58']={'nmb':'W12X58','P':86,'A':11000e-6,'h':310e-3,'hDet':311e-3,'b':254e-3,'bDet':254e-3,'tw':9.14e-3,'twDet':9.52e-3,'tf':16.3e-3,'tfDet':15.9e-3,'kDes':31.5e-3,'kDet':38.1e-3,'k1':23.8e-3,'d':247e-3,'Iz':198e-6,'Wzel':1280e-6,'Wzpl':1420e-6,'iz':134e-3,'Avy':2257.58e-6,'Iy':44.5e-6,'Wyel':351e-6,'Wypl':533e-6,'iy':63.8e-3,'It':874e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X53']={'nmb':'W12X53','P':79,'A':10100e-6,'h':307e-3,'hDet':305e-3,'b':254e-3,'bDet':254e-3,'tw':8.76e-3,'twDet':9.52e-3,'tf':14.6e-3,'tfDet':14.3e-3,'kDes':30e-3,'kDet':34.9e-3,'k1':23.8e-3,'d':247e-3,'Iz':177e-6,'Wzel':1160e-6,'Wzpl':1280e-6,'iz':133e-3,'Avy':2163.72e-6,'Iy':39.9e-6,'Wyel':315e-6,'Wypl':477e-6,'iy':63e-3,'It':658e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X50']={'nmb':'W12X50','P':74,'A':9420e-6,'h':310e-3,'hDet':311e-3,'b':205e-3,'bDet':206e-3,'tw':9.4e-3,'twDet':9.52e-3,'tf':16.3e-3,'tfDet':15.9e-3,'kDes':29e-3,'kDet':38.1e-3,'k1':23.8e-3,'d':252e-3,'Iz':163e-6,'Wzel':1050e-6,'Wzpl':1180e-6,'iz':132e-3,'Avy':2368.8e-6,'Iy':23.4e-6,'Wyel':228e-6,'Wypl':349e-6,'iy':49.8e-3,'It':712e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X45']={'nmb':'W12X45','P':67,'A':8450e-6,'h':307e-3,'hDet':305e-3,'b':204e-3,'bDet':203e-3,'tw':8.51e-3,'twDet':7.94e-3,'tf':14.6e-3,'tfDet':14.3e-3,'kDes':27.4e-3,'kDet':34.9e-3,'k1':23.8e-3,'d':252.2e-3,'Iz':145e-6,'Wzel':946e-6,'Wzpl':1050e-6,'iz':131e-3,'Avy':2146.22e-6,'Iy':20.8e-6,'Wyel':203e-6,'Wypl':311e-6,'iy':49.5e-3,'It':524e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X40']={'nmb':'W12X40','P':60,'A':7550e-6,'h':302e-3,'hDet':305e-3,'b':203e-3,'bDet':203e-3,'tw':7.49e-3,'twDet':7.94e-3,'tf':13.1e-3,'tfDet':12.7e-3,'kDes':25.9e-3,'kDet':34.9e-3,'k1':22.2e-3,'d':250.2e-3,'Iz':128e-6,'Wzel':844e-6,'Wzpl':934e-6,'iz':130e-3,'Avy':1874e-6,'Iy':18.4e-6,'Wyel':180e-6,'Wypl':275e-6,'iy':49.3e-3,'It':377e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X35']={'nmb':'W12X35','P':52,'A':6650e-6,'h':318e-3,'hDet':318e-3,'b':167e-3,'bDet':165e-3,'tw':7.62e-3,'twDet':7.94e-3,'tf':13.2e-3,'tfDet':12.7e-3,'kDes':20.8e-3,'kDet':30.2e-3,'k1':19.1e-3,'d':276.4e-3,'Iz':119e-6,'Wzel':747e-6,'Wzpl':839e-6,'iz':133e-3,'Avy':2106.17e-6,'Iy':10.2e-6,'Wyel':122e-6,'Wypl':188e-6,'iy':39.1e-3,'It':308e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X30']={'nmb':'W12X30','P':44.5,'A':5670e-6,'h':312e-3,'hDet':314e-3,'b':166e-3,'bDet':165e-3,'tw':6.6e-3,'twDet':6.35e-3,'tf':11.2e-3,'tfDet':11.1e-3,'kDes':18.8e-3,'kDet':28.6e-3,'k1':19.1e-3,'d':274.4e-3,'Iz':99.1e-6,'Wzel':633e-6,'Wzpl':706e-6,'iz':132e-3,'Avy':1811.04e-6,'Iy':8.45e-6,'Wyel':102e-6,'Wypl':157e-6,'iy':38.6e-3,'It':190e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X26']={'nmb':'W12X26','P':38.7,'A':4940e-6,'h':310e-3,'hDet':311e-3,'b':165e-3,'bDet':165e-3,'tw':5.84e-3,'twDet':6.35e-3,'tf':9.65e-3,'tfDet':9.52e-3,'kDes':17.3e-3,'kDet':27e-3,'k1':19.1e-3,'d':275.4e-3,'Iz':84.9e-6,'Wzel':547e-6,'Wzpl':610e-6,'iz':131e-3,'Avy':1608.34e-6,'Iy':7.2e-6,'Wyel':87.5e-6,'Wypl':134e-6,'iy':38.4e-3,'It':125e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X22']={'nmb':'W12X22','P':32.7,'A':4180e-6,'h':312e-3,'hDet':311e-3,'b':102e-3,'bDet':102e-3,'tw':6.6e-3,'twDet':6.35e-3,'tf':10.8e-3,'tfDet':11.1e-3,'kDes':18.4e-3,'kDet':23.8e-3,'k1':15.9e-3,'d':275.2e-3,'Iz':64.9e-6,'Wzel':416e-6,'Wzpl':480e-6,'iz':125e-3,'Avy':1816.32e-6,'Iy':1.94e-6,'Wyel':37.9e-6,'Wypl':60e-6,'iy':21.5e-3,'It':122e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X19']={'nmb':'W12X19','P':28.3,'A':3590e-6,'h':310e-3,'hDet':308e-3,'b':102e-3,'bDet':102e-3,'tw':5.97e-3,'twDet':6.35e-3,'tf':8.89e-3,'tfDet':9.52e-3,'kDes':16.5e-3,'kDet':22.2e-3,'k1':14.3e-3,'d':277e-3,'Iz':54.1e-6,'Wzel':349e-6,'Wzpl':405e-6,'iz':122e-3,'Avy':1653.69e-6,'Iy':1.57e-6,'Wyel':30.8e-6,'Wypl':48.8e-6,'iy':20.9e-3,'It':74.9e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X16']={'nmb':'W12X16','P':23.8,'A':3040e-6,'h':305e-3,'hDet':305e-3,'b':101e-3,'bDet':102e-3,'tw':5.59e-3,'twDet':6.35e-3,'tf':6.73e-3,'tfDet':6.35e-3,'kDes':14.4e-3,'kDet':20.6e-3,'k1':14.3e-3,'d':276.2e-3,'Iz':42.9e-6,'Wzel':280e-6,'Wzpl':329e-6,'iz':119e-3,'Avy':1543.96e-6,'Iy':1.17e-6,'Wyel':23.1e-6,'Wypl':37e-6,'iy':19.6e-3,'It':42.9e-9,'E':2.1e+11,'nu':0.3}
-
-W['W12X14']={'nmb':'W12X14','P':21,'A':2680e-6,'h':302e-3,'hDet':302e-3,'b':101e-3,'bDet':102e-3,'tw':5.08e-3,'twDet':4.76e-3,'tf':5.72e-3,'tfDet':6.35e-3,'kDes':13.3e-3,'kDet':19.1e-3,'k1':14.3e-3,'d':275.4e-3,'Iz':36.9e-6,'Wzel':244e-6,'Wzpl':285e-6,'iz':117e-3,'Avy':1399.03e-6,'Iy':0.982e-6,'Wyel':19.5e-6,'Wypl':31.1e-6,'iy':19.1e-3,'It':29.3e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X112']={'nmb':'W10X112','P':167,'A':21200e-6,'h':290e-3,'hDet':289e-3,'b':264e-3,'bDet':264e-3,'tw':19.2e-3,'twDet':19e-3,'tf':31.8e-3,'tfDet':31.8e-3,'kDes':44.5e-3,'kDet':49.2e-3,'k1':25.4e-3,'d':201e-3,'Iz':298e-6,'Wzel':2060e-6,'Wzpl':2410e-6,'iz':118e-3,'Avy':3859.2e-6,'Iy':98.2e-6,'Wyel':742e-6,'Wypl':1130e-6,'iy':68.1e-3,'It':6290e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X100']={'nmb':'W10X100','P':149,'A':18900e-6,'h':282e-3,'hDet':283e-3,'b':262e-3,'bDet':264e-3,'tw':17.3e-3,'twDet':17.5e-3,'tf':28.4e-3,'tfDet':28.6e-3,'kDes':41.1e-3,'kDet':46e-3,'k1':25.4e-3,'d':199.8e-3,'Iz':259e-6,'Wzel':1840e-6,'Wzpl':2130e-6,'iz':117e-3,'Avy':3456.54e-6,'Iy':86.2e-6,'Wyel':655e-6,'Wypl':1000e-6,'iy':67.3e-3,'It':4540e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X88']={'nmb':'W10X88','P':131,'A':16800e-6,'h':274e-3,'hDet':276e-3,'b':262e-3,'bDet':260e-3,'tw':15.4e-3,'twDet':15.9e-3,'tf':25.1e-3,'tfDet':25.4e-3,'kDes':37.8e-3,'kDet':42.9e-3,'k1':23.8e-3,'d':198.4e-3,'Iz':222e-6,'Wzel':1610e-6,'Wzpl':1850e-6,'iz':115e-3,'Avy':3055.36e-6,'Iy':74.5e-6,'Wyel':570e-6,'Wypl':870e-6,'iy':66.8e-3,'It':3130e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X77']={'nmb':'W10X77','P':115,'A':14600e-6,'h':269e-3,'hDet':270e-3,'b':259e-3,'bDet':260e-3,'tw':13.5e-3,'twDet':12.7e-3,'tf':22.1e-3,'tfDet':22.2e-3,'kDes':34.8e-3,'kDet':39.7e-3,'k1':22.2e-3,'d':199.4e-3,'Iz':189e-6,'Wzel':1410e-6,'Wzpl':1600e-6,'iz':114e-3,'Avy':2691.9e-6,'Iy':64.1e-6,'Wyel':493e-6,'Wypl':752e-6,'iy':66e-3,'It':2130e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X68']={'nmb':'W10X68','P':101,'A':12800e-6,'h':264e-3,'hDet':264e-3,'b':257e-3,'bDet':257e-3,'tw':11.9e-3,'twDet':12.7e-3,'tf':19.6e-3,'tfDet':19e-3,'kDes':32.3e-3,'kDet':36.5e-3,'k1':22.2e-3,'d':199.4e-3,'Iz':164e-6,'Wzel':1240e-6,'Wzpl':1400e-6,'iz':113e-3,'Avy':2372.86e-6,'Iy':55.8e-6,'Wyel':433e-6,'Wypl':657e-6,'iy':65.8e-3,'It':1480e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X60']={'nmb':'W10X60','P':89,'A':11400e-6,'h':259e-3,'hDet':260e-3,'b':257e-3,'bDet':257e-3,'tw':10.7e-3,'twDet':11.1e-3,'tf':17.3e-3,'tfDet':17.5e-3,'kDes':30e-3,'kDet':34.9e-3,'k1':20.6e-3,'d':199e-3,'Iz':142e-6,'Wzel':1090e-6,'Wzpl':1220e-6,'iz':112e-3,'Avy':2129.3e-6,'Iy':48.3e-6,'Wyel':377e-6,'Wypl':574e-6,'iy':65.3e-3,'It':1030e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X54']={'nmb':'W10X54','P':80,'A':10200e-6,'h':257e-3,'hDet':257e-3,'b':254e-3,'bDet':254e-3,'tw':9.4e-3,'twDet':9.52e-3,'tf':15.6e-3,'tfDet':15.9e-3,'kDes':28.4e-3,'kDet':33.3e-3,'k1':20.6e-3,'d':200.2e-3,'Iz':126e-6,'Wzel':983e-6,'Wzpl':1090e-6,'iz':111e-3,'Avy':1881.88e-6,'Iy':42.9e-6,'Wyel':338e-6,'Wypl':513e-6,'iy':65e-3,'It':758e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X49']={'nmb':'W10X49','P':73,'A':9290e-6,'h':254e-3,'hDet':254e-3,'b':254e-3,'bDet':254e-3,'tw':8.64e-3,'twDet':7.94e-3,'tf':14.2e-3,'tfDet':14.3e-3,'kDes':26.9e-3,'kDet':31.8e-3,'k1':20.6e-3,'d':200.2e-3,'Iz':113e-6,'Wzel':895e-6,'Wzpl':990e-6,'iz':110e-3,'Avy':1729.73e-6,'Iy':38.9e-6,'Wyel':306e-6,'Wypl':464e-6,'iy':64.5e-3,'It':579e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X45']={'nmb':'W10X45','P':67,'A':8580e-6,'h':257e-3,'hDet':257e-3,'b':204e-3,'bDet':203e-3,'tw':8.89e-3,'twDet':9.52e-3,'tf':15.7e-3,'tfDet':15.9e-3,'kDes':28.4e-3,'kDet':33.3e-3,'k1':20.6e-3,'d':200.2e-3,'Iz':103e-6,'Wzel':805e-6,'Wzpl':900e-6,'iz':110e-3,'Avy':1779.78e-6,'Iy':22.2e-6,'Wyel':218e-6,'Wypl':333e-6,'iy':51.1e-3,'It':629e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X39']={'nmb':'W10X39','P':58,'A':7420e-6,'h':252e-3,'hDet':251e-3,'b':203e-3,'bDet':203e-3,'tw':8e-3,'twDet':7.94e-3,'tf':13.5e-3,'tfDet':12.7e-3,'kDes':26.2e-3,'kDet':30.2e-3,'k1':20.6e-3,'d':199.6e-3,'Iz':87e-6,'Wzel':690e-6,'Wzpl':767e-6,'iz':108e-3,'Avy':1596.8e-6,'Iy':18.7e-6,'Wyel':185e-6,'Wypl':282e-6,'iy':50.3e-3,'It':406e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X33']={'nmb':'W10X33','P':49.1,'A':6260e-6,'h':247e-3,'hDet':248e-3,'b':202e-3,'bDet':203e-3,'tw':7.37e-3,'twDet':7.94e-3,'tf':11e-3,'tfDet':11.1e-3,'kDes':23.7e-3,'kDet':28.6e-3,'k1':19.1e-3,'d':199.6e-3,'Iz':71.2e-6,'Wzel':574e-6,'Wzpl':636e-6,'iz':106e-3,'Avy':1471.05e-6,'Iy':15.2e-6,'Wyel':151e-6,'Wypl':229e-6,'iy':49.3e-3,'It':243e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X30']={'nmb':'W10X30','P':44.8,'A':5700e-6,'h':267e-3,'hDet':267e-3,'b':148e-3,'bDet':146e-3,'tw':7.62e-3,'twDet':7.94e-3,'tf':13e-3,'tfDet':12.7e-3,'kDes':20.6e-3,'kDet':28.6e-3,'k1':17.5e-3,'d':225.8e-3,'Iz':70.8e-6,'Wzel':531e-6,'Wzpl':600e-6,'iz':111e-3,'Avy':1720.6e-6,'Iy':6.95e-6,'Wyel':94.2e-6,'Wypl':145e-6,'iy':34.8e-3,'It':259e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X26']={'nmb':'W10X26','P':38.5,'A':4910e-6,'h':262e-3,'hDet':264e-3,'b':147e-3,'bDet':146e-3,'tw':6.6e-3,'twDet':6.35e-3,'tf':11.2e-3,'tfDet':11.1e-3,'kDes':18.8e-3,'kDet':27e-3,'k1':17.5e-3,'d':224.4e-3,'Iz':59.9e-6,'Wzel':457e-6,'Wzpl':513e-6,'iz':110e-3,'Avy':1481.04e-6,'Iy':5.87e-6,'Wyel':80.1e-6,'Wypl':123e-6,'iy':34.5e-3,'It':167e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X22']={'nmb':'W10X22','P':32.7,'A':4190e-6,'h':259e-3,'hDet':257e-3,'b':146e-3,'bDet':146e-3,'tw':6.1e-3,'twDet':6.35e-3,'tf':9.14e-3,'tfDet':9.52e-3,'kDes':16.8e-3,'kDet':23.8e-3,'k1':15.9e-3,'d':225.4e-3,'Iz':49.1e-6,'Wzel':380e-6,'Wzpl':426e-6,'iz':108e-3,'Avy':1374.94e-6,'Iy':4.75e-6,'Wyel':65.1e-6,'Wypl':100e-6,'iy':33.8e-3,'It':99.5e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X19']={'nmb':'W10X19','P':28.4,'A':3630e-6,'h':259e-3,'hDet':260e-3,'b':102e-3,'bDet':102e-3,'tw':6.35e-3,'twDet':6.35e-3,'tf':10e-3,'tfDet':9.5e-3,'kDes':17.7e-3,'kDet':23.8e-3,'k1':15.9e-3,'d':223.6e-3,'Iz':40.1e-6,'Wzel':308e-6,'Wzpl':354e-6,'iz':105e-3,'Avy':1419.86e-6,'Iy':1.79e-6,'Wyel':35.1e-6,'Wypl':54.9e-6,'iy':22.2e-3,'It':97e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X17']={'nmb':'W10X17','P':25.3,'A':3220e-6,'h':257e-3,'hDet':257e-3,'b':102e-3,'bDet':102e-3,'tw':6.1e-3,'twDet':6.35e-3,'tf':8.38e-3,'tfDet':7.94e-3,'kDes':16e-3,'kDet':22.2e-3,'k1':14.3e-3,'d':225e-3,'Iz':34.1e-6,'Wzel':265e-6,'Wzpl':306e-6,'iz':103e-3,'Avy':1372.5e-6,'Iy':1.48e-6,'Wyel':29.2e-6,'Wypl':45.9e-6,'iy':21.5e-3,'It':64.9e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X15']={'nmb':'W10X15','P':22.3,'A':2850e-6,'h':254e-3,'hDet':254e-3,'b':102e-3,'bDet':102e-3,'tw':5.84e-3,'twDet':6.35e-3,'tf':6.86e-3,'tfDet':6.35e-3,'kDes':14.5e-3,'kDet':20.6e-3,'k1':14.3e-3,'d':225e-3,'Iz':28.7e-6,'Wzel':226e-6,'Wzpl':262e-6,'iz':100e-3,'Avy':1314e-6,'Iy':1.2e-6,'Wyel':23.8e-6,'Wypl':37.7e-6,'iy':20.6e-3,'It':43.3e-9,'E':2.1e+11,'nu':0.3}
-
-W['W10X12']={'nmb':'W10X12','P':17.9,'A':2280e-6,'h':251e-3,'hDet':251e-3,'b':101e-3,'bDet':102e-3,'tw':4.83e-3,'twDet':4.76e-3,'tf':5.33e-3,'tfDet':4.76e-3,'kDes':13e-3,'kDet':19.1e-3,'k1':14.3e-3,'d':225e-3,'Iz':22.4e-6,'Wzel':179e-6,'Wzpl':206e-6,'iz':99.1e-3,'Avy':1086.75e-6,'Iy':0.907e-6,'Wyel':18e-6,'Wypl':28.5e-6,'iy':19.9e-3,'It':22.8e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X67']={'nmb':'W8X67','P':100,'A':12700e-6,'h':229e-3,'hDet':229e-3,'b':210e-3,'bDet':210e-3,'tw':14.5e-3,'twDet':14.3e-3,'tf':23.7e-3,'tfDet':23.8e-3,'kDes':33.8e-3,'kDet':41.3e-3,'k1':23.8e-3,'d':161.4e-3,'Iz':113e-6,'Wzel':990e-6,'Wzpl':1150e-6,'iz':94.5e-3,'Avy':2340.3e-6,'Iy':36.9e-6,'Wyel':351e-6,'Wypl':536e-6,'iy':53.8e-3,'It':2100e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X58']={'nmb':'W8X58','P':86,'A':11000e-6,'h':222e-3,'hDet':222e-3,'b':209e-3,'bDet':210e-3,'tw':13e-3,'twDet':12.7e-3,'tf':20.6e-3,'tfDet':20.6e-3,'kDes':30.5e-3,'kDet':38.1e-3,'k1':22.2e-3,'d':161e-3,'Iz':94.9e-6,'Wzel':852e-6,'Wzpl':980e-6,'iz':92.7e-3,'Avy':2093e-6,'Iy':31.3e-6,'Wyel':300e-6,'Wypl':457e-6,'iy':53.3e-3,'It':1390e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X48']={'nmb':'W8X48','P':71,'A':9100e-6,'h':216e-3,'hDet':216e-3,'b':206e-3,'bDet':206e-3,'tw':10.2e-3,'twDet':9.52e-3,'tf':17.4e-3,'tfDet':17.5e-3,'kDes':27.4e-3,'kDet':34.9e-3,'k1':20.6e-3,'d':161.2e-3,'Iz':76.6e-6,'Wzel':708e-6,'Wzpl':803e-6,'iz':91.7e-3,'Avy':1644.24e-6,'Iy':25.3e-6,'Wyel':246e-6,'Wypl':375e-6,'iy':52.8e-3,'It':816e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X40']={'nmb':'W8X40','P':59,'A':7550e-6,'h':210e-3,'hDet':210e-3,'b':205e-3,'bDet':206e-3,'tw':9.14e-3,'twDet':9.52e-3,'tf':14.2e-3,'tfDet':14.3e-3,'kDes':24.2e-3,'kDet':31.8e-3,'k1':20.6e-3,'d':161.6e-3,'Iz':60.8e-6,'Wzel':582e-6,'Wzpl':652e-6,'iz':89.7e-3,'Avy':1477.02e-6,'Iy':20.4e-6,'Wyel':200e-6,'Wypl':303e-6,'iy':51.8e-3,'It':466e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X35']={'nmb':'W8X35','P':52,'A':6650e-6,'h':206e-3,'hDet':206e-3,'b':204e-3,'bDet':203e-3,'tw':7.87e-3,'twDet':7.94e-3,'tf':12.6e-3,'tfDet':12.7e-3,'kDes':22.6e-3,'kDet':30.2e-3,'k1':20.6e-3,'d':160.8e-3,'Iz':52.9e-6,'Wzel':511e-6,'Wzpl':569e-6,'iz':89.2e-3,'Avy':1265.5e-6,'Iy':17.7e-6,'Wyel':174e-6,'Wypl':264e-6,'iy':51.6e-3,'It':320e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X31']={'nmb':'W8X31','P':46.1,'A':5890e-6,'h':203e-3,'hDet':203e-3,'b':203e-3,'bDet':203e-3,'tw':7.24e-3,'twDet':7.94e-3,'tf':11e-3,'tfDet':11.1e-3,'kDes':21.1e-3,'kDet':28.6e-3,'k1':19.1e-3,'d':160.8e-3,'Iz':45.8e-6,'Wzel':451e-6,'Wzpl':498e-6,'iz':88.1e-3,'Avy':1164.19e-6,'Iy':15.4e-6,'Wyel':152e-6,'Wypl':231e-6,'iy':51.3e-3,'It':223e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X28']={'nmb':'W8X28','P':41.7,'A':5320e-6,'h':205e-3,'hDet':203e-3,'b':166e-3,'bDet':165e-3,'tw':7.24e-3,'twDet':7.94e-3,'tf':11.8e-3,'tfDet':11.1e-3,'kDes':21.8e-3,'kDet':23.8e-3,'k1':15.9e-3,'d':161.4e-3,'Iz':40.8e-6,'Wzel':398e-6,'Wzpl':446e-6,'iz':87.6e-3,'Avy':1168.54e-6,'Iy':9.03e-6,'Wyel':109e-6,'Wypl':166e-6,'iy':41.1e-3,'It':224e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X24']={'nmb':'W8X24','P':35.9,'A':4570e-6,'h':201e-3,'hDet':200e-3,'b':165e-3,'bDet':165e-3,'tw':6.22e-3,'twDet':6.35e-3,'tf':10.2e-3,'tfDet':9.5e-3,'kDes':20.2e-3,'kDet':22.2e-3,'k1':14.3e-3,'d':160.6e-3,'Iz':34.4e-6,'Wzel':342e-6,'Wzpl':379e-6,'iz':86.9e-3,'Avy':998.932e-6,'Iy':7.62e-6,'Wyel':92.3e-6,'Wypl':140e-6,'iy':40.9e-3,'It':144e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X21']={'nmb':'W8X21','P':31.3,'A':3970e-6,'h':210e-3,'hDet':210e-3,'b':134e-3,'bDet':133e-3,'tw':6.35e-3,'twDet':6.35e-3,'tf':10.2e-3,'tfDet':9.5e-3,'kDes':17.8e-3,'kDet':22.2e-3,'k1':14.3e-3,'d':174.4e-3,'Iz':31.3e-6,'Wzel':298e-6,'Wzpl':334e-6,'iz':88.6e-3,'Avy':1107.44e-6,'Iy':4.07e-6,'Wyel':60.8e-6,'Wypl':93.2e-6,'iy':32e-3,'It':117e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X18']={'nmb':'W8X18','P':26.6,'A':3390e-6,'h':207e-3,'hDet':206e-3,'b':133e-3,'bDet':133e-3,'tw':5.84e-3,'twDet':6.35e-3,'tf':8.38e-3,'tfDet':7.94e-3,'kDes':16e-3,'kDet':20.6e-3,'k1':14.3e-3,'d':175e-3,'Iz':25.8e-6,'Wzel':249e-6,'Wzpl':279e-6,'iz':87.1e-3,'Avy':1022e-6,'Iy':3.32e-6,'Wyel':49.8e-6,'Wypl':76.4e-6,'iy':31.2e-3,'It':71.6e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X15']={'nmb':'W8X15','P':22.5,'A':2860e-6,'h':206e-3,'hDet':206e-3,'b':102e-3,'bDet':102e-3,'tw':6.22e-3,'twDet':6.35e-3,'tf':8e-3,'tfDet':7.94e-3,'kDes':15.6e-3,'kDet':20.6e-3,'k1':14.3e-3,'d':174.8e-3,'Iz':20e-6,'Wzel':193e-6,'Wzpl':223e-6,'iz':83.6e-3,'Avy':1087.26e-6,'Iy':1.42e-6,'Wyel':27.9e-6,'Wypl':43.8e-6,'iy':22.3e-3,'It':57e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X13']={'nmb':'W8X13','P':19.3,'A':2480e-6,'h':203e-3,'hDet':203e-3,'b':102e-3,'bDet':102e-3,'tw':5.84e-3,'twDet':6.35e-3,'tf':6.48e-3,'tfDet':6.35e-3,'kDes':14.1e-3,'kDet':19.1e-3,'k1':14.3e-3,'d':174.8e-3,'Iz':16.5e-6,'Wzel':162e-6,'Wzpl':187e-6,'iz':81.5e-3,'Avy':1020.83e-6,'Iy':1.14e-6,'Wyel':22.5e-6,'Wypl':35.2e-6,'iy':21.4e-3,'It':36.3e-9,'E':2.1e+11,'nu':0.3}
-
-W['W8X10']={'nmb':'W8X10','P':15,'A':1910e-6,'h':200e-3,'hDet':200e-3,'b':100e-3,'bDet':102e-3,'tw':4.32e-3,'twDet':4.76e-3,'tf':5.21e-3,'tfDet':4.76e-3,'kDes':12.8e-3,'kDet':17.5e-3,'k1':12.7e-3,'d':174.4e-3,'Iz':12.8e-6,'Wzel':128e-6,'Wzpl':145e-6,'iz':81.8e-3,'Avy':753.408e-6,'Iy':0.87e-6,'Wyel':17.4e-6,'Wypl':27.2e-6,'iy':21.4e-3,'It':17.7e-9,'E':2.1e+11,'nu':0.3}
-
-W['W6X25']={'nmb':'W6X25','P':37.1,'A':4740e-6,'h':162e-3,'hDet':162e-3,'b':154e-3,'bDet':156e-3,'tw':8.13e-3,'twDet':7.94e-3,'tf':11.6e-3,'tfDet':11.1e-3,'kDes':17.9e-3,'kDet':23.8e-3,'k1':14.3e-3,'d':126.2e-3,'Iz':22.2e-6,'Wzel':274e-6,'Wzpl':310e-6,'iz':68.6e-3,'Avy':1026.01e-6,'Iy':7.12e-6,'Wyel':91.9e-6,'Wypl':140e-6,'iy':38.6e-3,'It':192e-9,'E':2.1e+11,'nu':0.3}
-
-W['W6X20']={'nmb':'W6X20','P':29.8,'A':3790e-6,'h':157e-3,'hDet':159e-3,'b':153e-3,'bDet':152e-3,'tw':6.6e-3,'twDet':6.35e-3,'tf':9.27e-3,'tfDet':9.52e-3,'kDes':15.6e-3,'kDet':22.2e-3,'k1':14.3e-3,'d':125.8e-3,'Iz':17.2e-6,'Wzel':220e-6,'Wzpl':246e-6,'iz':67.6e-3,'Avy':830.28e-6,'Iy':5.54e-6,'Wyel':72.3e-6,'Wypl':110e-6,'iy':38.1e-3,'It':99.9e-9,'E':2.1e+11,'nu':0.3}
-
-W['W6X15']={'nmb':'W6X15','P':22.5,'A':2860e-6,'h':152e-3,'hDet':152e-3,'b':152e-3,'bDet':152e-3,'tw':5.84e-3,'twDet':6.35e-3,'tf':6.6e-3,'tfDet':6.35e-3,'kDes':13e-3,'kDet':19.1e-3,'k1':14.3e-3,'d':126e-3,'Iz':12.1e-6,'Wzel':159e-6,'Wzpl':177e-6,'iz':65e-3,'Avy':735.84e-6,'Iy':3.88e-6,'Wyel':51e-6,'Wypl':77.8e-6,'iy':36.8e-3,'It':42e-9,'E':2.1e+11,'nu':0.3}
-
-W['W6X16']={'nmb':'W6X16','P':24,'A':3060e-6,'h':160e-3,'hDet':159e-3,'b':102e-3,'bDet':102e-3,'tw':6.6e-3,'twDet':6.35e-3,'tf':10.3e-3,'tfDet':9.5e-3,'kDes':16.6e-3,'kDet':22.2e-3,'k1':14.3e-3,'d':126.8e-3,'Iz':13.4e-6,'Wzel':167e-6,'Wzpl':192e-6,'iz':66e-3,'Avy':836.88e-6,'Iy':1.84e-6,'Wyel':36.1e-6,'Wypl':55.6e-6,'iy':24.6e-3,'It':92.8e-9,'E':2.1e+11,'nu':0.3}
-
-W['W6X12']={'nmb':'W6X12','P':18,'A':2290e-6,'h':153e-3,'hDet':152e-3,'b':102e-3,'bDet':102e-3,'tw':5.84e-3,'twDet':6.35e-3,'tf':7.11e-3,'tfDet':6.35e-3,'kDes':13.5e-3,'kDet':19.1e-3,'k1':14.3e-3,'d':126e-3,'Iz':9.2e-6,'Wzel':120e-6,'Wzpl':136e-6,'iz':63.2e-3,'Avy':735.84e-6,'Iy':1.24e-6,'Wyel':24.6e-6,'Wypl':38e-6,'iy':23.3e-3,'It':37.6e-9,'E':2.1e+11,'nu':0.3}
-
-W['W6X9']={'nmb':'W6X9','P':13.5,'A':1730e-6,'h':150e-3,'hDet':149e-3,'b':100e-3,'bDet':102e-3,'tw':4.32e-3,'twDet':4.76e-3,'tf':5.46e-3,'tfDet':4.76e-3,'kDes':11.8e-3,'kDet':17.5e-3,'k1':12.7e-3,'d':126.4e-3,'Iz':6.83e-6,'Wzel':91.1e-6,'Wzpl':102e-6,'iz':62.7e-3,'Avy':546.048e-6,'Iy':0.916e-6,'Wyel':18.2e-6,'Wypl':28.2e-6,'iy':23e-3,'It':16.9e-9,'E':2.1e+11,'nu':0.3}
-
-W['W6X8.5']={'nmb':'W6X8.5','P':13,'A':1630e-6,'h':148e-3,'hDet':149e-3,'b':100e-3,'bDet':102e-3,'tw':4.32e-3,'twDet':4.76e-3,'tf':4.95e-3,'tfDet':4.76e-3,'kDes':11.3e-3,'kDet':17.5e-3,'k1':12.7e-3,'d':125.4e-3,'Iz':6.2e-6,'Wzel':83.6e-6,'Wzpl':93.9e-6,'iz':61.7e-3,'Avy':541.728e-6,'Iy':0.828e-6,'Wyel':16.6e-6,'Wypl':25.6e-6,'iy':22.6e-3,'It':13.9e-9,'E':2.1e+11,'nu':0.3}
-
-W['W5X19']={'nmb':'W5X19','P':28.1,'A':3590e-6,'h':131e-3,'hDet':130e-3,'b':128e-3,'bDet':127e-3,'tw':6.86e-3,'twDet':6.35e-3,'tf':10.9e-3,'tfDet':11.1e-3,'kDes':18.5e-3,'kDet':20.6e-3,'k1':11.1e-3,'d':94e-3,'Iz':10.9e-6,'Wzel':167e-6,'Wzpl':190e-6,'iz':55.1e-3,'Avy':644.84e-6,'Iy':3.8e-6,'Wyel':59.5e-6,'Wypl':90.6e-6,'iy':32.5e-3,'It':132e-9,'E':2.1e+11,'nu':0.3}
-
-W['W5X16']={'nmb':'W5X16','P':23.8,'A':3040e-6,'h':127e-3,'hDet':127e-3,'b':127e-3,'bDet':127e-3,'tw':6.1e-3,'twDet':6.35e-3,'tf':9.14e-3,'tfDet':9.52e-3,'kDes':16.8e-3,'kDet':19.1e-3,'k1':11.1e-3,'d':93.4e-3,'Iz':8.91e-6,'Wzel':140e-6,'Wzpl':158e-6,'iz':54.1e-3,'Avy':569.74e-6,'Iy':3.13e-6,'Wyel':49.2e-6,'Wypl':75.1e-6,'iy':32e-3,'It':79.9e-9,'E':2.1e+11,'nu':0.3}
-
-W['W4X13']={'nmb':'W4X13','P':19.3,'A':2470e-6,'h':106e-3,'hDet':105e-3,'b':103e-3,'bDet':102e-3,'tw':7.11e-3,'twDet':6.35e-3,'tf':8.76e-3,'tfDet':9.52e-3,'kDes':15.1e-3,'kDet':19.1e-3,'k1':12.7e-3,'d':75.8e-3,'Iz':4.7e-6,'Wzel':89.5e-6,'Wzpl':103e-6,'iz':43.7e-3,'Avy':538.938e-6,'Iy':1.61e-6,'Wyel':31.1e-6,'Wypl':47.9e-6,'iy':25.4e-3,'It':62.9e-9,'E':2.1e+11,'nu':0.3}
-
-for item in W:
-  shape= W[item]
+def setWDerivedValues(shape):
+  '''Compute the properties of the W shapes that are not in the table.'''
   shape['alpha']= shape['Avy']/shape['A']
   shape['G']= shape['E']/(2*(1+shape['nu']))
   shape['AreaQz']= 2*shape['b']*shape['tf']
   shape['AreaQy']= shape['A']-shape['AreaQz']
 
+W= shape_table.ShapeTable('aisc_W',setWDerivedValues)
+
 # *************************************************************************
 # AISC Hollow Structural Sections.
 # *************************************************************************
-HSS={}
 
-HSS['HSS20X12X_625']= {'nmb':'HSS20X12X_625', 'P':189, 'A':22600e-6, 'h':508e-3, 'b':305e-3, 'e':15.9e-3, 'Iz':783e-6, 'Wzel':3080e-6, 'Wzpl':3770e-6, 'iz':186e-3, 'Iy':354e-6, 'Wyel':2330e-6, 'Wypl':2650e-6, 'iy':125e-3, 'It':787000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X12X_500']= {'nmb':'HSS20X12X_500', 'P':153, 'A':18300e-6, 'h':508e-3, 'b':305e-3, 'e':12.7e-3, 'Iz':645e-6, 'Wzel':2540e-6, 'Wzpl':3080e-6, 'iz':188e-3, 'Iy':293e-6, 'Wyel':1920e-6, 'Wypl':2160e-6, 'iy':127e-3, 'It':641000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X12X_375']= {'nmb':'HSS20X12X_375', 'P':117, 'A':13900e-6, 'h':508e-3, 'b':305e-3, 'e':9.53e-3, 'Iz':499e-6, 'Wzel':1970e-6, 'Wzpl':2360e-6, 'iz':189e-3, 'Iy':228e-6, 'Wyel':1490e-6, 'Wypl':1670e-6, 'iy':128e-3, 'It':491000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X12X_313']= {'nmb':'HSS20X12X_313', 'P':97.9, 'A':11700e-6, 'h':508e-3, 'b':305e-3, 'e':7.94e-3, 'Iz':420e-6, 'Wzel':1660e-6, 'Wzpl':2000e-6, 'iz':190e-3, 'Iy':193e-6, 'Wyel':1270e-6, 'Wypl':1410e-6, 'iy':129e-3, 'It':415000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X8X_625']= {'nmb':'HSS20X8X_625', 'P':164, 'A':19500e-6, 'h':508e-3, 'b':203e-3, 'e':15.9e-3, 'Iz':599e-6, 'Wzel':2360e-6, 'Wzpl':3030e-6, 'iz':175e-3, 'Iy':141e-6, 'Wyel':1390e-6, 'Wypl':1580e-6, 'iy':84.8e-3, 'It':381000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X8X_500']= {'nmb':'HSS20X8X_500', 'P':133, 'A':15900e-6, 'h':508e-3, 'b':203e-3, 'e':12.7e-3, 'Iz':495e-6, 'Wzel':1950e-6, 'Wzpl':2490e-6, 'iz':177e-3, 'Iy':118e-6, 'Wyel':1160e-6, 'Wypl':1300e-6, 'iy':86.1e-3, 'It':315000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X8X_375']= {'nmb':'HSS20X8X_375', 'P':102, 'A':12100e-6, 'h':508e-3, 'b':203e-3, 'e':9.53e-3, 'Iz':385e-6, 'Wzel':1520e-6, 'Wzpl':1920e-6, 'iz':179e-3, 'Iy':92.4e-6, 'Wyel':911e-6, 'Wypl':1010e-6, 'iy':87.4e-3, 'It':244000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X8X_313']= {'nmb':'HSS20X8X_313', 'P':85.3, 'A':10100e-6, 'h':508e-3, 'b':203e-3, 'e':7.94e-3, 'Iz':327e-6, 'Wzel':1290e-6, 'Wzpl':1620e-6, 'iz':180e-3, 'Iy':78.7e-6, 'Wyel':777e-6, 'Wypl':852e-6, 'iy':88.1e-3, 'It':206000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X4X_500']= {'nmb':'HSS20X4X_500', 'P':113, 'A':13500e-6, 'h':508e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':349e-6, 'Wzel':1370e-6, 'Wzpl':1880e-6, 'iz':161e-3, 'Iy':24.4e-6, 'Wyel':480e-6, 'Wypl':557e-6, 'iy':42.7e-3, 'It':81200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X4X_375']= {'nmb':'HSS20X4X_375', 'P':86.4, 'A':10300e-6, 'h':508e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':273e-6, 'Wzel':1080e-6, 'Wzpl':1460e-6, 'iz':163e-3, 'Iy':19.8e-6, 'Wyel':390e-6, 'Wypl':439e-6, 'iy':43.9e-3, 'It':64900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X4X_313']= {'nmb':'HSS20X4X_313', 'P':72.7, 'A':8650e-6, 'h':508e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':233e-6, 'Wzel':918e-6, 'Wzpl':1240e-6, 'iz':164e-3, 'Iy':17.1e-6, 'Wyel':338e-6, 'Wypl':375e-6, 'iy':44.5e-3, 'It':55800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS20X4X_250']= {'nmb':'HSS20X4X_250', 'P':58.7, 'A':6970e-6, 'h':508e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':191e-6, 'Wzel':751e-6, 'Wzpl':1010e-6, 'iz':165e-3, 'Iy':14.3e-6, 'Wyel':280e-6, 'Wypl':306e-6, 'iy':45.2e-3, 'It':46200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS18X6X_625']= {'nmb':'HSS18X6X_625', 'P':139, 'A':16600e-6, 'h':457e-3, 'b':152e-3, 'e':15.9e-3, 'Iz':384e-6, 'Wzel':1690e-6, 'Wzpl':2210e-6, 'iz':152e-3, 'Iy':65.8e-6, 'Wyel':864e-6, 'Wypl':1000e-6, 'iy':63e-3, 'It':192000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS18X6X_500']= {'nmb':'HSS18X6X_500', 'P':113, 'A':13500e-6, 'h':457e-3, 'b':152e-3, 'e':12.7e-3, 'Iz':320e-6, 'Wzel':1400e-6, 'Wzpl':1840e-6, 'iz':154e-3, 'Iy':55.8e-6, 'Wyel':731e-6, 'Wypl':831e-6, 'iy':64.3e-3, 'It':161000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS18X6X_375']= {'nmb':'HSS18X6X_375', 'P':86.4, 'A':10300e-6, 'h':457e-3, 'b':152e-3, 'e':9.53e-3, 'Iz':251e-6, 'Wzel':1100e-6, 'Wzpl':1420e-6, 'iz':156e-3, 'Iy':44.1e-6, 'Wyel':582e-6, 'Wypl':647e-6, 'iy':65.5e-3, 'It':126000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS18X6X_313']= {'nmb':'HSS18X6X_313', 'P':72.7, 'A':8650e-6, 'h':457e-3, 'b':152e-3, 'e':7.94e-3, 'Iz':214e-6, 'Wzel':934e-6, 'Wzpl':1200e-6, 'iz':157e-3, 'Iy':38e-6, 'Wyel':498e-6, 'Wypl':549e-6, 'iy':66.3e-3, 'It':107000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS18X6X_250']= {'nmb':'HSS18X6X_250', 'P':58.7, 'A':6970e-6, 'h':457e-3, 'b':152e-3, 'e':6.35e-3, 'Iz':174e-6, 'Wzel':762e-6, 'Wzpl':973e-6, 'iz':158e-3, 'Iy':31.3e-6, 'Wyel':410e-6, 'Wypl':447e-6, 'iy':66.8e-3, 'It':87400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X16X_625']= {'nmb':'HSS16X16X_625', 'P':189, 'A':22600e-6, 'h':406e-3, 'b':406e-3, 'e':15.9e-3, 'Iz':570e-6, 'Wzel':2800e-6, 'Wzpl':3280e-6, 'iz':159e-3, 'Iy':570e-6, 'Wyel':2800e-6, 'Wypl':3280e-6, 'iy':159e-3, 'It':903000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X16X_500']= {'nmb':'HSS16X16X_500', 'P':153, 'A':18300e-6, 'h':406e-3, 'b':406e-3, 'e':12.7e-3, 'Iz':470e-6, 'Wzel':2310e-6, 'Wzpl':2690e-6, 'iz':160e-3, 'Iy':470e-6, 'Wyel':2310e-6, 'Wypl':2690e-6, 'iy':160e-3, 'It':737000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X16X_375']= {'nmb':'HSS16X16X_375', 'P':117, 'A':13900e-6, 'h':406e-3, 'b':406e-3, 'e':9.53e-3, 'Iz':363e-6, 'Wzel':1790e-6, 'Wzpl':2060e-6, 'iz':162e-3, 'Iy':363e-6, 'Wyel':1790e-6, 'Wypl':2060e-6, 'iy':162e-3, 'It':562000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X16X_313']= {'nmb':'HSS16X16X_313', 'P':97.9, 'A':11700e-6, 'h':406e-3, 'b':406e-3, 'e':7.94e-3, 'Iz':308e-6, 'Wzel':1510e-6, 'Wzpl':1740e-6, 'iz':162e-3, 'Iy':308e-6, 'Wyel':1510e-6, 'Wypl':1740e-6, 'iy':162e-3, 'It':475000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X12X_625']= {'nmb':'HSS16X12X_625', 'P':164, 'A':19500e-6, 'h':406e-3, 'b':305e-3, 'e':15.9e-3, 'Iz':454e-6, 'Wzel':2230e-6, 'Wzpl':2700e-6, 'iz':152e-3, 'Iy':291e-6, 'Wyel':1920e-6, 'Wypl':2210e-6, 'iy':122e-3, 'It':570000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X12X_500']= {'nmb':'HSS16X12X_500', 'P':133, 'A':15900e-6, 'h':406e-3, 'b':305e-3, 'e':12.7e-3, 'Iz':376e-6, 'Wzel':1850e-6, 'Wzpl':2210e-6, 'iz':154e-3, 'Iy':242e-6, 'Wyel':1590e-6, 'Wypl':1820e-6, 'iy':123e-3, 'It':466000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X12X_375']= {'nmb':'HSS16X12X_375', 'P':102, 'A':12100e-6, 'h':406e-3, 'b':305e-3, 'e':9.53e-3, 'Iz':292e-6, 'Wzel':1440e-6, 'Wzpl':1700e-6, 'iz':155e-3, 'Iy':188e-6, 'Wyel':1230e-6, 'Wypl':1400e-6, 'iy':125e-3, 'It':359000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X12X_313']= {'nmb':'HSS16X12X_313', 'P':85.4, 'A':10100e-6, 'h':406e-3, 'b':305e-3, 'e':7.94e-3, 'Iz':248e-6, 'Wzel':1220e-6, 'Wzpl':1440e-6, 'iz':156e-3, 'Iy':160e-6, 'Wyel':1050e-6, 'Wypl':1180e-6, 'iy':125e-3, 'It':303000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X8X_625']= {'nmb':'HSS16X8X_625', 'P':139, 'A':16600e-6, 'h':406e-3, 'b':203e-3, 'e':15.9e-3, 'Iz':339e-6, 'Wzel':1670e-6, 'Wzpl':2110e-6, 'iz':143e-3, 'Iy':114e-6, 'Wyel':1120e-6, 'Wypl':1300e-6, 'iy':83.1e-3, 'It':283000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X8X_500']= {'nmb':'HSS16X8X_500', 'P':113, 'A':13500e-6, 'h':406e-3, 'b':203e-3, 'e':12.7e-3, 'Iz':283e-6, 'Wzel':1390e-6, 'Wzpl':1740e-6, 'iz':145e-3, 'Iy':95.7e-6, 'Wyel':944e-6, 'Wypl':1070e-6, 'iy':84.3e-3, 'It':234000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X8X_375']= {'nmb':'HSS16X8X_375', 'P':86.4, 'A':10300e-6, 'h':406e-3, 'b':203e-3, 'e':9.53e-3, 'Iz':221e-6, 'Wzel':1090e-6, 'Wzpl':1350e-6, 'iz':147e-3, 'Iy':75.3e-6, 'Wyel':742e-6, 'Wypl':832e-6, 'iy':85.6e-3, 'It':181000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X8X_313']= {'nmb':'HSS16X8X_313', 'P':72.7, 'A':8650e-6, 'h':406e-3, 'b':203e-3, 'e':7.94e-3, 'Iz':188e-6, 'Wzel':924e-6, 'Wzpl':1140e-6, 'iz':147e-3, 'Iy':64.5e-6, 'Wyel':634e-6, 'Wypl':705e-6, 'iy':86.4e-3, 'It':154000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X8X_250']= {'nmb':'HSS16X8X_250', 'P':58.7, 'A':6970e-6, 'h':406e-3, 'b':203e-3, 'e':6.35e-3, 'Iz':153e-6, 'Wzel':755e-6, 'Wzpl':924e-6, 'iz':148e-3, 'Iy':52.9e-6, 'Wyel':519e-6, 'Wypl':574e-6, 'iy':86.9e-3, 'It':125000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X4X_625']= {'nmb':'HSS16X4X_625', 'P':113, 'A':13500e-6, 'h':406e-3, 'b':102e-3, 'e':15.9e-3, 'Iz':224e-6, 'Wzel':1100e-6, 'Wzpl':1520e-6, 'iz':129e-3, 'Iy':22.5e-6, 'Wyel':442e-6, 'Wypl':533e-6, 'iy':40.6e-3, 'It':72400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X4X_500']= {'nmb':'HSS16X4X_500', 'P':92.7, 'A':11100e-6, 'h':406e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':189e-6, 'Wzel':932e-6, 'Wzpl':1270e-6, 'iz':131e-3, 'Iy':19.6e-6, 'Wyel':385e-6, 'Wypl':449e-6, 'iy':41.9e-3, 'It':62400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X4X_375']= {'nmb':'HSS16X4X_375', 'P':71.2, 'A':8520e-6, 'h':406e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':150e-6, 'Wzel':737e-6, 'Wzpl':987e-6, 'iz':133e-3, 'Iy':15.9e-6, 'Wyel':313e-6, 'Wypl':356e-6, 'iy':43.4e-3, 'It':49900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X4X_313']= {'nmb':'HSS16X4X_313', 'P':60, 'A':7160e-6, 'h':406e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':128e-6, 'Wzel':631e-6, 'Wzpl':837e-6, 'iz':134e-3, 'Iy':13.8e-6, 'Wyel':272e-6, 'Wypl':303e-6, 'iy':43.9e-3, 'It':42900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X4X_250']= {'nmb':'HSS16X4X_250', 'P':48.6, 'A':5780e-6, 'h':406e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':105e-6, 'Wzel':518e-6, 'Wzpl':683e-6, 'iz':135e-3, 'Iy':11.5e-6, 'Wyel':226e-6, 'Wypl':249e-6, 'iy':44.7e-3, 'It':35500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS16X4X_188']= {'nmb':'HSS16X4X_188', 'P':36.7, 'A':4360e-6, 'h':406e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':80.3e-6, 'Wzel':397e-6, 'Wzpl':519e-6, 'iz':136e-3, 'Iy':8.95e-6, 'Wyel':177e-6, 'Wypl':192e-6, 'iy':45.2e-3, 'It':27300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X14X_625']= {'nmb':'HSS14X14X_625', 'P':164, 'A':19500e-6, 'h':356e-3, 'b':356e-3, 'e':15.9e-3, 'Iz':373e-6, 'Wzel':2100e-6, 'Wzpl':2470e-6, 'iz':138e-3, 'Iy':373e-6, 'Wyel':2100e-6, 'Wypl':2470e-6, 'iy':138e-3, 'It':595000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X14X_500']= {'nmb':'HSS14X14X_500', 'P':133, 'A':15900e-6, 'h':356e-3, 'b':356e-3, 'e':12.7e-3, 'Iz':309e-6, 'Wzel':1740e-6, 'Wzpl':2030e-6, 'iz':139e-3, 'Iy':309e-6, 'Wyel':1740e-6, 'Wypl':2030e-6, 'iy':139e-3, 'It':487000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X14X_375']= {'nmb':'HSS14X14X_375', 'P':102, 'A':12100e-6, 'h':356e-3, 'b':356e-3, 'e':9.53e-3, 'Iz':240e-6, 'Wzel':1350e-6, 'Wzpl':1560e-6, 'iz':141e-3, 'Iy':240e-6, 'Wyel':1350e-6, 'Wypl':1560e-6, 'iy':141e-3, 'It':375000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X14X_313']= {'nmb':'HSS14X14X_313', 'P':85.3, 'A':10100e-6, 'h':356e-3, 'b':356e-3, 'e':7.94e-3, 'Iz':204e-6, 'Wzel':1150e-6, 'Wzpl':1320e-6, 'iz':142e-3, 'Iy':204e-6, 'Wyel':1150e-6, 'Wypl':1320e-6, 'iy':142e-3, 'It':316000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X10X_625']= {'nmb':'HSS14X10X_625', 'P':139, 'A':16600e-6, 'h':356e-3, 'b':254e-3, 'e':15.9e-3, 'Iz':286e-6, 'Wzel':1610e-6, 'Wzpl':1970e-6, 'iz':131e-3, 'Iy':169e-6, 'Wyel':1340e-6, 'Wypl':1560e-6, 'iy':101e-3, 'It':346000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X10X_500']= {'nmb':'HSS14X10X_500', 'P':113, 'A':13500e-6, 'h':356e-3, 'b':254e-3, 'e':12.7e-3, 'Iz':239e-6, 'Wzel':1340e-6, 'Wzpl':1620e-6, 'iz':133e-3, 'Iy':142e-6, 'Wyel':1120e-6, 'Wypl':1290e-6, 'iy':103e-3, 'It':285000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X10X_375']= {'nmb':'HSS14X10X_375', 'P':86.4, 'A':10300e-6, 'h':356e-3, 'b':254e-3, 'e':9.53e-3, 'Iz':186e-6, 'Wzel':1050e-6, 'Wzpl':1250e-6, 'iz':134e-3, 'Iy':111e-6, 'Wyel':875e-6, 'Wypl':995e-6, 'iy':104e-3, 'It':220000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X10X_313']= {'nmb':'HSS14X10X_313', 'P':72.7, 'A':8650e-6, 'h':356e-3, 'b':254e-3, 'e':7.94e-3, 'Iz':158e-6, 'Wzel':890e-6, 'Wzpl':1060e-6, 'iz':135e-3, 'Iy':94.5e-6, 'Wyel':746e-6, 'Wypl':842e-6, 'iy':105e-3, 'It':186000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X10X_250']= {'nmb':'HSS14X10X_250', 'P':58.7, 'A':6970e-6, 'h':356e-3, 'b':254e-3, 'e':6.35e-3, 'Iz':129e-6, 'Wzel':726e-6, 'Wzpl':859e-6, 'iz':136e-3, 'Iy':77.4e-6, 'Wyel':610e-6, 'Wypl':685e-6, 'iy':105e-3, 'It':151000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X6X_625']= {'nmb':'HSS14X6X_625', 'P':113, 'A':13500e-6, 'h':356e-3, 'b':152e-3, 'e':15.9e-3, 'Iz':199e-6, 'Wzel':1120e-6, 'Wzpl':1450e-6, 'iz':121e-3, 'Iy':51.6e-6, 'Wyel':675e-6, 'Wypl':793e-6, 'iy':61.7e-3, 'It':139000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X6X_500']= {'nmb':'HSS14X6X_500', 'P':92.7, 'A':11100e-6, 'h':356e-3, 'b':152e-3, 'e':12.7e-3, 'Iz':167e-6, 'Wzel':941e-6, 'Wzpl':1210e-6, 'iz':123e-3, 'Iy':43.7e-6, 'Wyel':575e-6, 'Wypl':662e-6, 'iy':63e-3, 'It':116000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X6X_375']= {'nmb':'HSS14X6X_375', 'P':71.2, 'A':8520e-6, 'h':356e-3, 'b':152e-3, 'e':9.53e-3, 'Iz':132e-6, 'Wzel':742e-6, 'Wzpl':939e-6, 'iz':125e-3, 'Iy':35e-6, 'Wyel':459e-6, 'Wypl':518e-6, 'iy':64.3e-3, 'It':91200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X6X_313']= {'nmb':'HSS14X6X_313', 'P':60, 'A':7160e-6, 'h':356e-3, 'b':152e-3, 'e':7.94e-3, 'Iz':113e-6, 'Wzel':634e-6, 'Wzpl':796e-6, 'iz':125e-3, 'Iy':30.1e-6, 'Wyel':395e-6, 'Wypl':441e-6, 'iy':64.8e-3, 'It':77400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X6X_250']= {'nmb':'HSS14X6X_250', 'P':48.6, 'A':5780e-6, 'h':356e-3, 'b':152e-3, 'e':6.35e-3, 'Iz':92.4e-6, 'Wzel':519e-6, 'Wzpl':649e-6, 'iz':126e-3, 'Iy':24.8e-6, 'Wyel':326e-6, 'Wypl':361e-6, 'iy':65.5e-3, 'It':63300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X6X_188']= {'nmb':'HSS14X6X_188', 'P':36.7, 'A':4360e-6, 'h':356e-3, 'b':152e-3, 'e':4.76e-3, 'Iz':70.8e-6, 'Wzel':398e-6, 'Wzpl':493e-6, 'iz':127e-3, 'Iy':19.1e-6, 'Wyel':251e-6, 'Wypl':274e-6, 'iy':66.3e-3, 'It':48300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X4X_625']= {'nmb':'HSS14X4X_625', 'P':101, 'A':12100e-6, 'h':356e-3, 'b':102e-3, 'e':15.9e-3, 'Iz':155e-6, 'Wzel':873e-6, 'Wzpl':1200e-6, 'iz':114e-3, 'Iy':19.6e-6, 'Wyel':387e-6, 'Wypl':467e-6, 'iy':40.4e-3, 'It':61600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X4X_500']= {'nmb':'HSS14X4X_500', 'P':82.6, 'A':9870e-6, 'h':356e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':132e-6, 'Wzel':742e-6, 'Wzpl':1000e-6, 'iz':116e-3, 'Iy':17.1e-6, 'Wyel':338e-6, 'Wypl':395e-6, 'iy':41.7e-3, 'It':52900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X4X_375']= {'nmb':'HSS14X4X_375', 'P':63.6, 'A':7610e-6, 'h':356e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':105e-6, 'Wzel':590e-6, 'Wzpl':783e-6, 'iz':118e-3, 'Iy':14e-6, 'Wyel':275e-6, 'Wypl':313e-6, 'iy':42.9e-3, 'It':42500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X4X_313']= {'nmb':'HSS14X4X_313', 'P':53.7, 'A':6400e-6, 'h':356e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':89.9e-6, 'Wzel':506e-6, 'Wzpl':665e-6, 'iz':119e-3, 'Iy':12.2e-6, 'Wyel':239e-6, 'Wypl':269e-6, 'iy':43.7e-3, 'It':36500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X4X_250']= {'nmb':'HSS14X4X_250', 'P':43.5, 'A':5180e-6, 'h':356e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':74.1e-6, 'Wzel':416e-6, 'Wzpl':544e-6, 'iz':120e-3, 'Iy':10.2e-6, 'Wyel':200e-6, 'Wypl':221e-6, 'iy':44.2e-3, 'It':30100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS14X4X_188']= {'nmb':'HSS14X4X_188', 'P':32.9, 'A':3910e-6, 'h':356e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':57e-6, 'Wzel':320e-6, 'Wzpl':415e-6, 'iz':120e-3, 'Iy':7.91e-6, 'Wyel':155e-6, 'Wypl':169e-6, 'iy':45e-3, 'It':23200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X12X_625']= {'nmb':'HSS12X12X_625', 'P':139, 'A':16600e-6, 'h':305e-3, 'b':305e-3, 'e':15.9e-3, 'Iz':228e-6, 'Wzel':1500e-6, 'Wzpl':1790e-6, 'iz':117e-3, 'Iy':228e-6, 'Wyel':1500e-6, 'Wypl':1790e-6, 'iy':117e-3, 'It':368000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X12X_500']= {'nmb':'HSS12X12X_500', 'P':113, 'A':13500e-6, 'h':305e-3, 'b':305e-3, 'e':12.7e-3, 'Iz':190e-6, 'Wzel':1250e-6, 'Wzpl':1470e-6, 'iz':119e-3, 'Iy':190e-6, 'Wyel':1250e-6, 'Wypl':1470e-6, 'iy':119e-3, 'It':303000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X12X_375']= {'nmb':'HSS12X12X_375', 'P':86.3, 'A':10300e-6, 'h':305e-3, 'b':305e-3, 'e':9.53e-3, 'Iz':149e-6, 'Wzel':975e-6, 'Wzpl':1130e-6, 'iz':120e-3, 'Iy':149e-6, 'Wyel':975e-6, 'Wypl':1130e-6, 'iy':120e-3, 'It':234000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X12X_313']= {'nmb':'HSS12X12X_313', 'P':72.6, 'A':8650e-6, 'h':305e-3, 'b':305e-3, 'e':7.94e-3, 'Iz':127e-6, 'Wzel':831e-6, 'Wzpl':960e-6, 'iz':121e-3, 'Iy':127e-6, 'Wyel':831e-6, 'Wypl':960e-6, 'iy':121e-3, 'It':197000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X12X_250']= {'nmb':'HSS12X12X_250', 'P':58.6, 'A':6970e-6, 'h':305e-3, 'b':305e-3, 'e':6.35e-3, 'Iz':103e-6, 'Wzel':678e-6, 'Wzpl':780e-6, 'iz':122e-3, 'Iy':103e-6, 'Wyel':678e-6, 'Wypl':780e-6, 'iy':122e-3, 'It':160000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X12X_188']= {'nmb':'HSS12X12X_188', 'P':44.4, 'A':5260e-6, 'h':305e-3, 'b':305e-3, 'e':4.76e-3, 'Iz':78.7e-6, 'Wzel':516e-6, 'Wzpl':590e-6, 'iz':122e-3, 'Iy':78.7e-6, 'Wyel':516e-6, 'Wypl':590e-6, 'iy':122e-3, 'It':121000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X10X_500']= {'nmb':'HSS12X10X_500', 'P':103, 'A':12300e-6, 'h':305e-3, 'b':254e-3, 'e':12.7e-3, 'Iz':164e-6, 'Wzel':1080e-6, 'Wzpl':1290e-6, 'iz':116e-3, 'Iy':124e-6, 'Wyel':978e-6, 'Wypl':1140e-6, 'iy':101e-3, 'It':227000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X10X_375']= {'nmb':'HSS12X10X_375', 'P':78.8, 'A':9420e-6, 'h':305e-3, 'b':254e-3, 'e':9.53e-3, 'Iz':129e-6, 'Wzel':846e-6, 'Wzpl':1000e-6, 'iz':117e-3, 'Iy':97.4e-6, 'Wyel':769e-6, 'Wypl':885e-6, 'iy':102e-3, 'It':175000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X10X_313']= {'nmb':'HSS12X10X_313', 'P':66.4, 'A':7870e-6, 'h':305e-3, 'b':254e-3, 'e':7.94e-3, 'Iz':110e-6, 'Wzel':721e-6, 'Wzpl':847e-6, 'iz':118e-3, 'Iy':83.2e-6, 'Wyel':655e-6, 'Wypl':749e-6, 'iy':103e-3, 'It':148000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X10X_250']= {'nmb':'HSS12X10X_250', 'P':53.6, 'A':6390e-6, 'h':305e-3, 'b':254e-3, 'e':6.35e-3, 'Iz':89.9e-6, 'Wzel':590e-6, 'Wzpl':690e-6, 'iz':119e-3, 'Iy':68.3e-6, 'Wyel':536e-6, 'Wypl':610e-6, 'iy':103e-3, 'It':120000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X8X_625']= {'nmb':'HSS12X8X_625', 'P':113, 'A':13500e-6, 'h':305e-3, 'b':203e-3, 'e':15.9e-3, 'Iz':165e-6, 'Wzel':1080e-6, 'Wzpl':1350e-6, 'iz':110e-3, 'Iy':87.4e-6, 'Wyel':860e-6, 'Wypl':1010e-6, 'iy':80.3e-3, 'It':189000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X8X_500']= {'nmb':'HSS12X8X_500', 'P':92.7, 'A':11100e-6, 'h':305e-3, 'b':203e-3, 'e':12.7e-3, 'Iz':139e-6, 'Wzel':911e-6, 'Wzpl':1120e-6, 'iz':112e-3, 'Iy':74.1e-6, 'Wyel':728e-6, 'Wypl':844e-6, 'iy':81.5e-3, 'It':157000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X8X_375']= {'nmb':'HSS12X8X_375', 'P':71.2, 'A':8520e-6, 'h':305e-3, 'b':203e-3, 'e':9.53e-3, 'Iz':109e-6, 'Wzel':716e-6, 'Wzpl':869e-6, 'iz':114e-3, 'Iy':58.3e-6, 'Wyel':575e-6, 'Wypl':657e-6, 'iy':83.1e-3, 'It':122000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X8X_313']= {'nmb':'HSS12X8X_313', 'P':60.1, 'A':7160e-6, 'h':305e-3, 'b':203e-3, 'e':7.94e-3, 'Iz':93.2e-6, 'Wzel':613e-6, 'Wzpl':736e-6, 'iz':114e-3, 'Iy':49.9e-6, 'Wyel':493e-6, 'Wypl':559e-6, 'iy':83.6e-3, 'It':103000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X8X_250']= {'nmb':'HSS12X8X_250', 'P':48.5, 'A':5780e-6, 'h':305e-3, 'b':203e-3, 'e':6.35e-3, 'Iz':76.6e-6, 'Wzel':501e-6, 'Wzpl':600e-6, 'iz':115e-3, 'Iy':41.1e-6, 'Wyel':405e-6, 'Wypl':456e-6, 'iy':84.3e-3, 'It':84100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X8X_188']= {'nmb':'HSS12X8X_188', 'P':36.9, 'A':4360e-6, 'h':305e-3, 'b':203e-3, 'e':4.77e-3, 'Iz':58.3e-6, 'Wzel':383e-6, 'Wzpl':456e-6, 'iz':116e-3, 'Iy':31.5e-6, 'Wyel':310e-6, 'Wypl':346e-6, 'iy':85.1e-3, 'It':63700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X6X_625']= {'nmb':'HSS12X6X_625', 'P':101, 'A':12100e-6, 'h':305e-3, 'b':152e-3, 'e':15.9e-3, 'Iz':134e-6, 'Wzel':875e-6, 'Wzpl':1130e-6, 'iz':105e-3, 'Iy':44.5e-6, 'Wyel':582e-6, 'Wypl':690e-6, 'iy':60.7e-3, 'It':113000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X6X_500']= {'nmb':'HSS12X6X_500', 'P':82.6, 'A':9870e-6, 'h':305e-3, 'b':152e-3, 'e':12.7e-3, 'Iz':113e-6, 'Wzel':741e-6, 'Wzpl':941e-6, 'iz':107e-3, 'Iy':37.9e-6, 'Wyel':498e-6, 'Wypl':577e-6, 'iy':62e-3, 'It':94500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X6X_375']= {'nmb':'HSS12X6X_375', 'P':63.6, 'A':7610e-6, 'h':305e-3, 'b':152e-3, 'e':9.53e-3, 'Iz':89.5e-6, 'Wzel':588e-6, 'Wzpl':734e-6, 'iz':109e-3, 'Iy':30.3e-6, 'Wyel':398e-6, 'Wypl':454e-6, 'iy':63.2e-3, 'It':74100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X6X_313']= {'nmb':'HSS12X6X_313', 'P':53.7, 'A':6400e-6, 'h':305e-3, 'b':152e-3, 'e':7.94e-3, 'Iz':76.6e-6, 'Wzel':503e-6, 'Wzpl':624e-6, 'iz':109e-3, 'Iy':26.1e-6, 'Wyel':342e-6, 'Wypl':387e-6, 'iy':64e-3, 'It':63300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X6X_250']= {'nmb':'HSS12X6X_250', 'P':43.4, 'A':5180e-6, 'h':305e-3, 'b':152e-3, 'e':6.35e-3, 'Iz':62.9e-6, 'Wzel':413e-6, 'Wzpl':510e-6, 'iz':110e-3, 'Iy':21.6e-6, 'Wyel':283e-6, 'Wypl':316e-6, 'iy':64.5e-3, 'It':51600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X6X_188']= {'nmb':'HSS12X6X_188', 'P':33.1, 'A':3910e-6, 'h':305e-3, 'b':152e-3, 'e':4.76e-3, 'Iz':48.3e-6, 'Wzel':318e-6, 'Wzpl':388e-6, 'iz':111e-3, 'Iy':16.6e-6, 'Wyel':218e-6, 'Wypl':241e-6, 'iy':65.3e-3, 'It':39400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X4X_625']= {'nmb':'HSS12X4X_625', 'P':88, 'A':10600e-6, 'h':305e-3, 'b':102e-3, 'e':15.9e-3, 'Iz':102e-6, 'Wzel':669e-6, 'Wzpl':909e-6, 'iz':98.3e-3, 'Iy':16.8e-6, 'Wyel':331e-6, 'Wypl':401e-6, 'iy':39.9e-3, 'It':50800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X4X_500']= {'nmb':'HSS12X4X_500', 'P':72.5, 'A':8710e-6, 'h':305e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':87.4e-6, 'Wzel':572e-6, 'Wzpl':765e-6, 'iz':100e-3, 'Iy':14.7e-6, 'Wyel':290e-6, 'Wypl':342e-6, 'iy':41.1e-3, 'It':43700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X4X_375']= {'nmb':'HSS12X4X_375', 'P':56, 'A':6710e-6, 'h':305e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':69.9e-6, 'Wzel':459e-6, 'Wzpl':601e-6, 'iz':102e-3, 'Iy':12e-6, 'Wyel':238e-6, 'Wypl':272e-6, 'iy':42.4e-3, 'It':35000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X4X_313']= {'nmb':'HSS12X4X_313', 'P':47.4, 'A':5650e-6, 'h':305e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':59.9e-6, 'Wzel':395e-6, 'Wzpl':513e-6, 'iz':103e-3, 'Iy':10.5e-6, 'Wyel':206e-6, 'Wypl':233e-6, 'iy':43.2e-3, 'It':30100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X4X_250']= {'nmb':'HSS12X4X_250', 'P':38.4, 'A':4580e-6, 'h':305e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':49.5e-6, 'Wzel':326e-6, 'Wzpl':420e-6, 'iz':104e-3, 'Iy':8.74e-6, 'Wyel':172e-6, 'Wypl':192e-6, 'iy':43.7e-3, 'It':24900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X4X_188']= {'nmb':'HSS12X4X_188', 'P':29.3, 'A':3460e-6, 'h':305e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':38.2e-6, 'Wzel':251e-6, 'Wzpl':321e-6, 'iz':105e-3, 'Iy':6.83e-6, 'Wyel':134e-6, 'Wypl':147e-6, 'iy':44.5e-3, 'It':19200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X3-1/2X_375']= {'nmb':'HSS12X3-1/2X_375', 'P':54.1, 'A':6450e-6, 'h':305e-3, 'b':88.9e-3, 'e':9.53e-3, 'Iz':64.9e-6, 'Wzel':426e-6, 'Wzpl':569e-6, 'iz':100e-3, 'Iy':8.87e-6, 'Wyel':200e-6, 'Wypl':229e-6, 'iy':37.1e-3, 'It':26900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X3-1/2X_313']= {'nmb':'HSS12X3-1/2X_313', 'P':45.8, 'A':5460e-6, 'h':305e-3, 'b':88.9e-3, 'e':7.94e-3, 'Iz':55.8e-6, 'Wzel':367e-6, 'Wzpl':485e-6, 'iz':101e-3, 'Iy':7.74e-6, 'Wyel':174e-6, 'Wypl':198e-6, 'iy':37.6e-3, 'It':23300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X3X_313']= {'nmb':'HSS12X3X_313', 'P':44.2, 'A':5270e-6, 'h':305e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':51.6e-6, 'Wzel':339e-6, 'Wzpl':457e-6, 'iz':99.1e-3, 'Iy':5.45e-6, 'Wyel':143e-6, 'Wypl':164e-6, 'iy':32.3e-3, 'It':17200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X3X_250']= {'nmb':'HSS12X3X_250', 'P':35.8, 'A':4280e-6, 'h':305e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':42.9e-6, 'Wzel':282e-6, 'Wzpl':375e-6, 'iz':100e-3, 'Iy':4.62e-6, 'Wyel':121e-6, 'Wypl':136e-6, 'iy':32.8e-3, 'It':14400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X3X_188']= {'nmb':'HSS12X3X_188', 'P':27.4, 'A':3240e-6, 'h':305e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':33.1e-6, 'Wzel':218e-6, 'Wzpl':287e-6, 'iz':101e-3, 'Iy':3.63e-6, 'Wyel':95.2e-6, 'Wypl':105e-6, 'iy':33.5e-3, 'It':11200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X2X_313']= {'nmb':'HSS12X2X_313', 'P':41, 'A':4900e-6, 'h':305e-3, 'b':50.8e-3, 'e':7.94e-3, 'Iz':43.3e-6, 'Wzel':285e-6, 'Wzpl':401e-6, 'iz':94.2e-3, 'Iy':2.12e-6, 'Wyel':83.6e-6, 'Wypl':99.1e-6, 'iy':20.8e-3, 'It':7330e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X2X_250']= {'nmb':'HSS12X2X_250', 'P':33.3, 'A':3980e-6, 'h':305e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':36.2e-6, 'Wzel':238e-6, 'Wzpl':329e-6, 'iz':95.3e-3, 'Iy':1.84e-6, 'Wyel':72.3e-6, 'Wypl':83.2e-6, 'iy':21.5e-3, 'It':6290e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS12X2X_188']= {'nmb':'HSS12X2X_188', 'P':25.4, 'A':3010e-6, 'h':305e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':28.1e-6, 'Wzel':184e-6, 'Wzpl':254e-6, 'iz':96.5e-3, 'Iy':1.48e-6, 'Wyel':58.2e-6, 'Wypl':65.1e-6, 'iy':22.1e-3, 'It':4990e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X10X_625']= {'nmb':'HSS10X10X_625', 'P':113, 'A':13500e-6, 'h':254e-3, 'b':254e-3, 'e':15.9e-3, 'Iz':127e-6, 'Wzel':996e-6, 'Wzpl':1200e-6, 'iz':96.5e-3, 'Iy':127e-6, 'Wyel':996e-6, 'Wypl':1200e-6, 'iy':96.5e-3, 'It':207000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X10X_500']= {'nmb':'HSS10X10X_500', 'P':92.7, 'A':11100e-6, 'h':254e-3, 'b':254e-3, 'e':12.7e-3, 'Iz':107e-6, 'Wzel':839e-6, 'Wzpl':995e-6, 'iz':98e-3, 'Iy':107e-6, 'Wyel':839e-6, 'Wypl':995e-6, 'iy':98e-3, 'It':171000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X10X_375']= {'nmb':'HSS10X10X_375', 'P':71.2, 'A':8520e-6, 'h':254e-3, 'b':254e-3, 'e':9.53e-3, 'Iz':84.1e-6, 'Wzel':662e-6, 'Wzpl':773e-6, 'iz':99.6e-3, 'Iy':84.1e-6, 'Wyel':662e-6, 'Wypl':773e-6, 'iy':99.6e-3, 'It':133000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X10X_313']= {'nmb':'HSS10X10X_313', 'P':60, 'A':7160e-6, 'h':254e-3, 'b':254e-3, 'e':7.94e-3, 'Iz':71.6e-6, 'Wzel':565e-6, 'Wzpl':657e-6, 'iz':100e-3, 'Iy':71.6e-6, 'Wyel':565e-6, 'Wypl':657e-6, 'iy':100e-3, 'It':113000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X10X_250']= {'nmb':'HSS10X10X_250', 'P':48.5, 'A':5780e-6, 'h':254e-3, 'b':254e-3, 'e':6.35e-3, 'Iz':58.7e-6, 'Wzel':464e-6, 'Wzpl':536e-6, 'iz':101e-3, 'Iy':58.7e-6, 'Wyel':464e-6, 'Wypl':536e-6, 'iy':101e-3, 'It':91600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X10X_188']= {'nmb':'HSS10X10X_188', 'P':36.8, 'A':4360e-6, 'h':254e-3, 'b':254e-3, 'e':4.76e-3, 'Iz':45e-6, 'Wzel':354e-6, 'Wzpl':406e-6, 'iz':102e-3, 'Iy':45e-6, 'Wyel':354e-6, 'Wypl':406e-6, 'iy':102e-3, 'It':69500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X8X_625']= {'nmb':'HSS10X8X_625', 'P':101, 'A':12100e-6, 'h':254e-3, 'b':203e-3, 'e':15.9e-3, 'Iz':105e-6, 'Wzel':828e-6, 'Wzpl':1020e-6, 'iz':93.5e-3, 'Iy':74.1e-6, 'Wyel':729e-6, 'Wypl':873e-6, 'iy':78.5e-3, 'It':144000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X8X_500']= {'nmb':'HSS10X8X_500', 'P':82.6, 'A':9870e-6, 'h':254e-3, 'b':203e-3, 'e':12.7e-3, 'Iz':89.1e-6, 'Wzel':700e-6, 'Wzpl':850e-6, 'iz':94.7e-3, 'Iy':62.9e-6, 'Wyel':619e-6, 'Wypl':729e-6, 'iy':79.8e-3, 'It':120000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X8X_375']= {'nmb':'HSS10X8X_375', 'P':63.6, 'A':7610e-6, 'h':254e-3, 'b':203e-3, 'e':9.53e-3, 'Iz':70.3e-6, 'Wzel':556e-6, 'Wzpl':664e-6, 'iz':96.3e-3, 'Iy':49.9e-6, 'Wyel':492e-6, 'Wypl':570e-6, 'iy':81e-3, 'It':93200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X8X_313']= {'nmb':'HSS10X8X_313', 'P':53.7, 'A':6400e-6, 'h':254e-3, 'b':203e-3, 'e':7.94e-3, 'Iz':60.4e-6, 'Wzel':475e-6, 'Wzpl':564e-6, 'iz':97e-3, 'Iy':42.9e-6, 'Wyel':421e-6, 'Wypl':485e-6, 'iy':81.8e-3, 'It':79100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X8X_250']= {'nmb':'HSS10X8X_250', 'P':43.4, 'A':5180e-6, 'h':254e-3, 'b':203e-3, 'e':6.35e-3, 'Iz':49.5e-6, 'Wzel':390e-6, 'Wzpl':460e-6, 'iz':97.8e-3, 'Iy':35.3e-6, 'Wyel':347e-6, 'Wypl':397e-6, 'iy':82.6e-3, 'It':64500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X8X_188']= {'nmb':'HSS10X8X_188', 'P':33.1, 'A':3910e-6, 'h':254e-3, 'b':203e-3, 'e':4.76e-3, 'Iz':38e-6, 'Wzel':300e-6, 'Wzpl':351e-6, 'iz':98.6e-3, 'Iy':27.1e-6, 'Wyel':267e-6, 'Wypl':302e-6, 'iy':83.3e-3, 'It':49100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X6X_625']= {'nmb':'HSS10X6X_625', 'P':88, 'A':10600e-6, 'h':254e-3, 'b':152e-3, 'e':15.9e-3, 'Iz':83.7e-6, 'Wzel':659e-6, 'Wzpl':841e-6, 'iz':88.9e-3, 'Iy':37.2e-6, 'Wyel':488e-6, 'Wypl':587e-6, 'iy':59.4e-3, 'It':87000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X6X_500']= {'nmb':'HSS10X6X_500', 'P':72.5, 'A':8710e-6, 'h':254e-3, 'b':152e-3, 'e':12.7e-3, 'Iz':71.2e-6, 'Wzel':562e-6, 'Wzpl':705e-6, 'iz':90.7e-3, 'Iy':32e-6, 'Wyel':420e-6, 'Wypl':493e-6, 'iy':60.7e-3, 'It':73300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X6X_375']= {'nmb':'HSS10X6X_375', 'P':56, 'A':6710e-6, 'h':254e-3, 'b':152e-3, 'e':9.53e-3, 'Iz':57e-6, 'Wzel':449e-6, 'Wzpl':554e-6, 'iz':92.2e-3, 'Iy':25.7e-6, 'Wyel':338e-6, 'Wypl':388e-6, 'iy':62e-3, 'It':57900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X6X_313']= {'nmb':'HSS10X6X_313', 'P':47.4, 'A':5650e-6, 'h':254e-3, 'b':152e-3, 'e':7.94e-3, 'Iz':49.1e-6, 'Wzel':385e-6, 'Wzpl':472e-6, 'iz':93e-3, 'Iy':22.2e-6, 'Wyel':292e-6, 'Wypl':331e-6, 'iy':62.7e-3, 'It':49100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X6X_250']= {'nmb':'HSS10X6X_250', 'P':38.4, 'A':4580e-6, 'h':254e-3, 'b':152e-3, 'e':6.35e-3, 'Iz':40.3e-6, 'Wzel':318e-6, 'Wzpl':387e-6, 'iz':93.7e-3, 'Iy':18.4e-6, 'Wyel':241e-6, 'Wypl':272e-6, 'iy':63.2e-3, 'It':40200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X6X_188']= {'nmb':'HSS10X6X_188', 'P':29.3, 'A':3460e-6, 'h':254e-3, 'b':152e-3, 'e':4.76e-3, 'Iz':31.1e-6, 'Wzel':244e-6, 'Wzpl':295e-6, 'iz':94.7e-3, 'Iy':14.2e-6, 'Wyel':187e-6, 'Wypl':208e-6, 'iy':64e-3, 'It':30700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X5X_375']= {'nmb':'HSS10X5X_375', 'P':52.2, 'A':6240e-6, 'h':254e-3, 'b':127e-3, 'e':9.53e-3, 'Iz':49.9e-6, 'Wzel':395e-6, 'Wzpl':498e-6, 'iz':89.7e-3, 'Iy':16.9e-6, 'Wyel':265e-6, 'Wypl':306e-6, 'iy':52.1e-3, 'It':41600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X5X_313']= {'nmb':'HSS10X5X_313', 'P':44.2, 'A':5270e-6, 'h':254e-3, 'b':127e-3, 'e':7.94e-3, 'Iz':43.3e-6, 'Wzel':341e-6, 'Wzpl':426e-6, 'iz':90.4e-3, 'Iy':14.7e-6, 'Wyel':231e-6, 'Wypl':262e-6, 'iy':52.6e-3, 'It':35800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X5X_250']= {'nmb':'HSS10X5X_250', 'P':35.8, 'A':4280e-6, 'h':254e-3, 'b':127e-3, 'e':6.35e-3, 'Iz':35.7e-6, 'Wzel':282e-6, 'Wzpl':349e-6, 'iz':91.4e-3, 'Iy':12.2e-6, 'Wyel':192e-6, 'Wypl':216e-6, 'iy':53.3e-3, 'It':29400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X5X_188']= {'nmb':'HSS10X5X_188', 'P':27.4, 'A':3240e-6, 'h':254e-3, 'b':127e-3, 'e':4.76e-3, 'Iz':27.6e-6, 'Wzel':216e-6, 'Wzpl':267e-6, 'iz':92.2e-3, 'Iy':9.45e-6, 'Wyel':149e-6, 'Wypl':166e-6, 'iy':54.1e-3, 'It':22500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X4X_625']= {'nmb':'HSS10X4X_625', 'P':75.3, 'A':9030e-6, 'h':254e-3, 'b':102e-3, 'e':15.9e-3, 'Iz':62e-6, 'Wzel':490e-6, 'Wzpl':660e-6, 'iz':82.8e-3, 'Iy':13.9e-6, 'Wyel':275e-6, 'Wypl':338e-6, 'iy':39.1e-3, 'It':39800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X4X_500']= {'nmb':'HSS10X4X_500', 'P':62.4, 'A':7480e-6, 'h':254e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':53.7e-6, 'Wzel':423e-6, 'Wzpl':559e-6, 'iz':84.8e-3, 'Iy':12.3e-6, 'Wyel':241e-6, 'Wypl':288e-6, 'iy':40.4e-3, 'It':34400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X4X_375']= {'nmb':'HSS10X4X_375', 'P':48.4, 'A':5790e-6, 'h':254e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':43.3e-6, 'Wzel':341e-6, 'Wzpl':442e-6, 'iz':86.6e-3, 'Iy':10.1e-6, 'Wyel':198e-6, 'Wypl':229e-6, 'iy':41.7e-3, 'It':27700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X4X_313']= {'nmb':'HSS10X4X_313', 'P':41, 'A':4900e-6, 'h':254e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':37.5e-6, 'Wzel':295e-6, 'Wzpl':379e-6, 'iz':87.4e-3, 'Iy':8.82e-6, 'Wyel':174e-6, 'Wypl':198e-6, 'iy':42.4e-3, 'It':23900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X4X_250']= {'nmb':'HSS10X4X_250', 'P':33.3, 'A':3980e-6, 'h':254e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':31.1e-6, 'Wzel':244e-6, 'Wzpl':311e-6, 'iz':88.4e-3, 'Iy':7.37e-6, 'Wyel':145e-6, 'Wypl':164e-6, 'iy':43.2e-3, 'It':19700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X4X_188']= {'nmb':'HSS10X4X_188', 'P':25.4, 'A':3010e-6, 'h':254e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':24.1e-6, 'Wzel':190e-6, 'Wzpl':239e-6, 'iz':89.4e-3, 'Iy':5.79e-6, 'Wyel':114e-6, 'Wypl':126e-6, 'iy':43.7e-3, 'It':15200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X4X_125']= {'nmb':'HSS10X4X_125', 'P':17.2, 'A':2040e-6, 'h':254e-3, 'b':102e-3, 'e':3.18e-3, 'Iz':16.6e-6, 'Wzel':131e-6, 'Wzpl':164e-6, 'iz':90.2e-3, 'Iy':4.02e-6, 'Wyel':79.1e-6, 'Wypl':86.2e-6, 'iy':44.5e-3, 'It':10400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3-1/2X_500']= {'nmb':'HSS10X3-1/2X_500', 'P':59.8, 'A':7160e-6, 'h':254e-3, 'b':88.9e-3, 'e':12.7e-3, 'Iz':49.1e-6, 'Wzel':388e-6, 'Wzpl':523e-6, 'iz':82.8e-3, 'Iy':8.91e-6, 'Wyel':200e-6, 'Wypl':241e-6, 'iy':35.3e-3, 'It':26300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3-1/2X_375']= {'nmb':'HSS10X3-1/2X_375', 'P':46.5, 'A':5560e-6, 'h':254e-3, 'b':88.9e-3, 'e':9.53e-3, 'Iz':40e-6, 'Wzel':315e-6, 'Wzpl':415e-6, 'iz':84.8e-3, 'Iy':7.41e-6, 'Wyel':167e-6, 'Wypl':193e-6, 'iy':36.6e-3, 'It':21400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3-1/2X_313']= {'nmb':'HSS10X3-1/2X_313', 'P':39.5, 'A':4710e-6, 'h':254e-3, 'b':88.9e-3, 'e':7.94e-3, 'Iz':34.6e-6, 'Wzel':272e-6, 'Wzpl':356e-6, 'iz':85.9e-3, 'Iy':6.49e-6, 'Wyel':146e-6, 'Wypl':167e-6, 'iy':37.1e-3, 'It':18600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3-1/2X_250']= {'nmb':'HSS10X3-1/2X_250', 'P':32, 'A':3830e-6, 'h':254e-3, 'b':88.9e-3, 'e':6.35e-3, 'Iz':28.8e-6, 'Wzel':226e-6, 'Wzpl':293e-6, 'iz':86.6e-3, 'Iy':5.45e-6, 'Wyel':123e-6, 'Wypl':138e-6, 'iy':37.8e-3, 'It':15400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3-1/2X_188']= {'nmb':'HSS10X3-1/2X_188', 'P':24.5, 'A':2900e-6, 'h':254e-3, 'b':88.9e-3, 'e':4.76e-3, 'Iz':22.3e-6, 'Wzel':175e-6, 'Wzpl':225e-6, 'iz':87.6e-3, 'Iy':4.29e-6, 'Wyel':96.5e-6, 'Wypl':107e-6, 'iy':38.4e-3, 'It':11900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3-1/2X_125']= {'nmb':'HSS10X3-1/2X_125', 'P':16.6, 'A':1960e-6, 'h':254e-3, 'b':88.9e-3, 'e':3.18e-3, 'Iz':15.4e-6, 'Wzel':121e-6, 'Wzpl':154e-6, 'iz':88.6e-3, 'Iy':3.01e-6, 'Wyel':67.5e-6, 'Wypl':73.4e-6, 'iy':39.1e-3, 'It':8240e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3X_375']= {'nmb':'HSS10X3X_375', 'P':44.6, 'A':5340e-6, 'h':254e-3, 'b':76.2e-3, 'e':9.53e-3, 'Iz':36.6e-6, 'Wzel':288e-6, 'Wzpl':388e-6, 'iz':82.8e-3, 'Iy':5.16e-6, 'Wyel':136e-6, 'Wypl':159e-6, 'iy':31e-3, 'It':15700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3X_313']= {'nmb':'HSS10X3X_313', 'P':37.9, 'A':4520e-6, 'h':254e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':31.8e-6, 'Wzel':251e-6, 'Wzpl':333e-6, 'iz':83.8e-3, 'Iy':4.58e-6, 'Wyel':120e-6, 'Wypl':138e-6, 'iy':31.8e-3, 'It':13700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3X_250']= {'nmb':'HSS10X3X_250', 'P':30.8, 'A':3680e-6, 'h':254e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':26.5e-6, 'Wzel':208e-6, 'Wzpl':274e-6, 'iz':84.8e-3, 'Iy':3.86e-6, 'Wyel':101e-6, 'Wypl':115e-6, 'iy':32.5e-3, 'It':11500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3X_188']= {'nmb':'HSS10X3X_188', 'P':23.5, 'A':2790e-6, 'h':254e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':20.6e-6, 'Wzel':162e-6, 'Wzpl':210e-6, 'iz':85.9e-3, 'Iy':3.05e-6, 'Wyel':80.1e-6, 'Wypl':88.7e-6, 'iy':33e-3, 'It':8950e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X3X_125']= {'nmb':'HSS10X3X_125', 'P':15.9, 'A':1890e-6, 'h':254e-3, 'b':76.2e-3, 'e':3.18e-3, 'Iz':14.2e-6, 'Wzel':112e-6, 'Wzpl':144e-6, 'iz':86.9e-3, 'Iy':2.15e-6, 'Wyel':56.4e-6, 'Wypl':61.3e-6, 'iy':33.8e-3, 'It':6200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X2X_375']= {'nmb':'HSS10X2X_375', 'P':40.8, 'A':4890e-6, 'h':254e-3, 'b':50.8e-3, 'e':9.53e-3, 'Iz':29.8e-6, 'Wzel':234e-6, 'Wzpl':333e-6, 'iz':78.2e-3, 'Iy':1.96e-6, 'Wyel':77e-6, 'Wypl':94.4e-6, 'iy':20e-3, 'It':6620e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X2X_313']= {'nmb':'HSS10X2X_313', 'P':34.7, 'A':4150e-6, 'h':254e-3, 'b':50.8e-3, 'e':7.94e-3, 'Iz':26.1e-6, 'Wzel':205e-6, 'Wzpl':287e-6, 'iz':79.2e-3, 'Iy':1.76e-6, 'Wyel':69.5e-6, 'Wypl':82.9e-6, 'iy':20.6e-3, 'It':5910e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X2X_250']= {'nmb':'HSS10X2X_250', 'P':28.3, 'A':3380e-6, 'h':254e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':21.9e-6, 'Wzel':172e-6, 'Wzpl':236e-6, 'iz':80.5e-3, 'Iy':1.53e-6, 'Wyel':60.1e-6, 'Wypl':69.8e-6, 'iy':21.3e-3, 'It':5080e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X2X_188']= {'nmb':'HSS10X2X_188', 'P':21.6, 'A':2570e-6, 'h':254e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':17.1e-6, 'Wzel':134e-6, 'Wzpl':182e-6, 'iz':81.5e-3, 'Iy':1.24e-6, 'Wyel':48.7e-6, 'Wypl':54.7e-6, 'iy':21.9e-3, 'It':4050e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS10X2X_125']= {'nmb':'HSS10X2X_125', 'P':14.7, 'A':1740e-6, 'h':254e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':11.9e-6, 'Wzel':93.4e-6, 'Wzpl':125e-6, 'iz':82.6e-3, 'Iy':0.891e-6, 'Wyel':35.1e-6, 'Wypl':38.2e-6, 'iy':22.6e-3, 'It':2870e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X9X_625']= {'nmb':'HSS9X9X_625', 'P':101, 'A':12100e-6, 'h':229e-3, 'b':229e-3, 'e':15.9e-3, 'Iz':89.9e-6, 'Wzel':785e-6, 'Wzpl':952e-6, 'iz':86.4e-3, 'Iy':89.9e-6, 'Wyel':785e-6, 'Wypl':952e-6, 'iy':86.4e-3, 'It':148000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X9X_500']= {'nmb':'HSS9X9X_500', 'P':82.6, 'A':9870e-6, 'h':229e-3, 'b':229e-3, 'e':12.7e-3, 'Iz':76.2e-6, 'Wzel':665e-6, 'Wzpl':793e-6, 'iz':87.6e-3, 'Iy':76.2e-6, 'Wyel':665e-6, 'Wypl':793e-6, 'iy':87.6e-3, 'It':123000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X9X_375']= {'nmb':'HSS9X9X_375', 'P':63.6, 'A':7610e-6, 'h':229e-3, 'b':229e-3, 'e':9.53e-3, 'Iz':60.4e-6, 'Wzel':528e-6, 'Wzpl':619e-6, 'iz':89.2e-3, 'Iy':60.4e-6, 'Wyel':528e-6, 'Wypl':619e-6, 'iy':89.2e-3, 'It':96100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X9X_313']= {'nmb':'HSS9X9X_313', 'P':53.6, 'A':6400e-6, 'h':229e-3, 'b':229e-3, 'e':7.94e-3, 'Iz':51.6e-6, 'Wzel':452e-6, 'Wzpl':526e-6, 'iz':89.9e-3, 'Iy':51.6e-6, 'Wyel':452e-6, 'Wypl':526e-6, 'iy':89.9e-3, 'It':81600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X9X_250']= {'nmb':'HSS9X9X_250', 'P':43.4, 'A':5180e-6, 'h':229e-3, 'b':229e-3, 'e':6.35e-3, 'Iz':42.5e-6, 'Wzel':372e-6, 'Wzpl':429e-6, 'iz':90.4e-3, 'Iy':42.5e-6, 'Wyel':372e-6, 'Wypl':429e-6, 'iy':90.4e-3, 'It':66200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X9X_188']= {'nmb':'HSS9X9X_188', 'P':33, 'A':3910e-6, 'h':229e-3, 'b':229e-3, 'e':4.76e-3, 'Iz':32.5e-6, 'Wzel':285e-6, 'Wzpl':328e-6, 'iz':91.2e-3, 'Iy':32.5e-6, 'Wyel':285e-6, 'Wypl':328e-6, 'iy':91.2e-3, 'It':50400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X9X_125']= {'nmb':'HSS9X9X_125', 'P':22.3, 'A':2640e-6, 'h':229e-3, 'b':229e-3, 'e':3.18e-3, 'Iz':22.3e-6, 'Wzel':195e-6, 'Wzpl':223e-6, 'iz':91.9e-3, 'Iy':22.3e-6, 'Wyel':195e-6, 'Wypl':223e-6, 'iy':91.9e-3, 'It':34100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X7X_625']= {'nmb':'HSS9X7X_625', 'P':88, 'A':10600e-6, 'h':229e-3, 'b':178e-3, 'e':15.9e-3, 'Iz':72.4e-6, 'Wzel':634e-6, 'Wzpl':791e-6, 'iz':82.8e-3, 'Iy':48.7e-6, 'Wyel':549e-6, 'Wypl':664e-6, 'iy':68.1e-3, 'It':97800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X7X_500']= {'nmb':'HSS9X7X_500', 'P':72.5, 'A':8710e-6, 'h':229e-3, 'b':178e-3, 'e':12.7e-3, 'Iz':62e-6, 'Wzel':541e-6, 'Wzpl':664e-6, 'iz':84.3e-3, 'Iy':41.6e-6, 'Wyel':470e-6, 'Wypl':557e-6, 'iy':69.3e-3, 'It':82000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X7X_375']= {'nmb':'HSS9X7X_375', 'P':56, 'A':6710e-6, 'h':229e-3, 'b':178e-3, 'e':9.53e-3, 'Iz':49.5e-6, 'Wzel':433e-6, 'Wzpl':521e-6, 'iz':85.9e-3, 'Iy':33.5e-6, 'Wyel':377e-6, 'Wypl':438e-6, 'iy':70.6e-3, 'It':64100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X7X_313']= {'nmb':'HSS9X7X_313', 'P':47.4, 'A':5650e-6, 'h':229e-3, 'b':178e-3, 'e':7.94e-3, 'Iz':42.5e-6, 'Wzel':370e-6, 'Wzpl':444e-6, 'iz':86.6e-3, 'Iy':28.8e-6, 'Wyel':324e-6, 'Wypl':374e-6, 'iy':71.4e-3, 'It':54500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X7X_250']= {'nmb':'HSS9X7X_250', 'P':38.4, 'A':4580e-6, 'h':229e-3, 'b':178e-3, 'e':6.35e-3, 'Iz':35e-6, 'Wzel':306e-6, 'Wzpl':364e-6, 'iz':87.4e-3, 'Iy':23.8e-6, 'Wyel':267e-6, 'Wypl':306e-6, 'iy':72.1e-3, 'It':44500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X7X_188']= {'nmb':'HSS9X7X_188', 'P':29.3, 'A':3460e-6, 'h':229e-3, 'b':178e-3, 'e':4.76e-3, 'Iz':26.9e-6, 'Wzel':236e-6, 'Wzpl':277e-6, 'iz':88.1e-3, 'Iy':18.4e-6, 'Wyel':206e-6, 'Wypl':234e-6, 'iy':72.9e-3, 'It':34000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X5X_625']= {'nmb':'HSS9X5X_625', 'P':75.3, 'A':9030e-6, 'h':229e-3, 'b':127e-3, 'e':15.9e-3, 'Iz':55.4e-6, 'Wzel':485e-6, 'Wzpl':631e-6, 'iz':78.2e-3, 'Iy':21.6e-6, 'Wyel':341e-6, 'Wypl':415e-6, 'iy':48.8e-3, 'It':53300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X5X_500']= {'nmb':'HSS9X5X_500', 'P':62.4, 'A':7480e-6, 'h':229e-3, 'b':127e-3, 'e':12.7e-3, 'Iz':47.9e-6, 'Wzel':418e-6, 'Wzpl':533e-6, 'iz':79.8e-3, 'Iy':18.8e-6, 'Wyel':297e-6, 'Wypl':352e-6, 'iy':50e-3, 'It':45400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X5X_375']= {'nmb':'HSS9X5X_375', 'P':48.4, 'A':5790e-6, 'h':229e-3, 'b':127e-3, 'e':9.53e-3, 'Iz':38.5e-6, 'Wzel':336e-6, 'Wzpl':421e-6, 'iz':81.5e-3, 'Iy':15.3e-6, 'Wyel':241e-6, 'Wypl':280e-6, 'iy':51.6e-3, 'It':36200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X5X_313']= {'nmb':'HSS9X5X_313', 'P':41, 'A':4900e-6, 'h':229e-3, 'b':127e-3, 'e':7.94e-3, 'Iz':33.2e-6, 'Wzel':290e-6, 'Wzpl':361e-6, 'iz':82.3e-3, 'Iy':13.3e-6, 'Wyel':210e-6, 'Wypl':239e-6, 'iy':52.1e-3, 'It':31000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X5X_250']= {'nmb':'HSS9X5X_250', 'P':33.3, 'A':3980e-6, 'h':229e-3, 'b':127e-3, 'e':6.35e-3, 'Iz':27.5e-6, 'Wzel':241e-6, 'Wzpl':297e-6, 'iz':83.1e-3, 'Iy':11.1e-6, 'Wyel':174e-6, 'Wypl':197e-6, 'iy':52.8e-3, 'It':25500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X5X_188']= {'nmb':'HSS9X5X_188', 'P':25.4, 'A':3010e-6, 'h':229e-3, 'b':127e-3, 'e':4.76e-3, 'Iz':21.3e-6, 'Wzel':187e-6, 'Wzpl':226e-6, 'iz':84.1e-3, 'Iy':8.62e-6, 'Wyel':136e-6, 'Wypl':152e-6, 'iy':53.3e-3, 'It':19500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X3X_500']= {'nmb':'HSS9X3X_500', 'P':52.2, 'A':6280e-6, 'h':229e-3, 'b':76.2e-3, 'e':12.7e-3, 'Iz':33.6e-6, 'Wzel':295e-6, 'Wzpl':403e-6, 'iz':73.2e-3, 'Iy':5.49e-6, 'Wyel':144e-6, 'Wypl':177e-6, 'iy':29.7e-3, 'It':16600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X3X_375']= {'nmb':'HSS9X3X_375', 'P':40.8, 'A':4890e-6, 'h':229e-3, 'b':76.2e-3, 'e':9.53e-3, 'Iz':27.6e-6, 'Wzel':241e-6, 'Wzpl':323e-6, 'iz':75.2e-3, 'Iy':4.66e-6, 'Wyel':122e-6, 'Wypl':144e-6, 'iy':30.7e-3, 'It':13800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X3X_313']= {'nmb':'HSS9X3X_313', 'P':34.7, 'A':4150e-6, 'h':229e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':24e-6, 'Wzel':210e-6, 'Wzpl':277e-6, 'iz':76.2e-3, 'Iy':4.11e-6, 'Wyel':108e-6, 'Wypl':125e-6, 'iy':31.5e-3, 'It':12000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X3X_250']= {'nmb':'HSS9X3X_250', 'P':28.3, 'A':3380e-6, 'h':229e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':20.1e-6, 'Wzel':175e-6, 'Wzpl':229e-6, 'iz':77.2e-3, 'Iy':3.49e-6, 'Wyel':91.6e-6, 'Wypl':104e-6, 'iy':32.3e-3, 'It':10100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS9X3X_188']= {'nmb':'HSS9X3X_188', 'P':21.6, 'A':2570e-6, 'h':229e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':15.7e-6, 'Wzel':137e-6, 'Wzpl':177e-6, 'iz':78e-3, 'Iy':2.76e-6, 'Wyel':72.4e-6, 'Wypl':80.6e-6, 'iy':32.8e-3, 'It':7870e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X8X_625']= {'nmb':'HSS8X8X_625', 'P':88, 'A':10600e-6, 'h':203e-3, 'b':203e-3, 'e':15.9e-3, 'Iz':60.8e-6, 'Wzel':598e-6, 'Wzpl':733e-6, 'iz':75.9e-3, 'Iy':60.8e-6, 'Wyel':598e-6, 'Wypl':733e-6, 'iy':75.9e-3, 'It':102000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X8X_500']= {'nmb':'HSS8X8X_500', 'P':72.5, 'A':8710e-6, 'h':203e-3, 'b':203e-3, 'e':12.7e-3, 'Iz':52e-6, 'Wzel':511e-6, 'Wzpl':615e-6, 'iz':77.2e-3, 'Iy':52e-6, 'Wyel':511e-6, 'Wypl':615e-6, 'iy':77.2e-3, 'It':84900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X8X_375']= {'nmb':'HSS8X8X_375', 'P':56, 'A':6710e-6, 'h':203e-3, 'b':203e-3, 'e':9.53e-3, 'Iz':41.6e-6, 'Wzel':408e-6, 'Wzpl':482e-6, 'iz':78.7e-3, 'Iy':41.6e-6, 'Wyel':408e-6, 'Wypl':482e-6, 'iy':78.7e-3, 'It':66600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X8X_313']= {'nmb':'HSS8X8X_313', 'P':47.3, 'A':5650e-6, 'h':203e-3, 'b':203e-3, 'e':7.94e-3, 'Iz':35.6e-6, 'Wzel':351e-6, 'Wzpl':411e-6, 'iz':79.5e-3, 'Iy':35.6e-6, 'Wyel':351e-6, 'Wypl':411e-6, 'iy':79.5e-3, 'It':56600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X8X_250']= {'nmb':'HSS8X8X_250', 'P':38.4, 'A':4580e-6, 'h':203e-3, 'b':203e-3, 'e':6.35e-3, 'Iz':29.4e-6, 'Wzel':290e-6, 'Wzpl':336e-6, 'iz':80e-3, 'Iy':29.4e-6, 'Wyel':290e-6, 'Wypl':336e-6, 'iy':80e-3, 'It':46200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X8X_188']= {'nmb':'HSS8X8X_188', 'P':29.2, 'A':3460e-6, 'h':203e-3, 'b':203e-3, 'e':4.76e-3, 'Iz':22.6e-6, 'Wzel':223e-6, 'Wzpl':257e-6, 'iz':80.8e-3, 'Iy':22.6e-6, 'Wyel':223e-6, 'Wypl':257e-6, 'iy':80.8e-3, 'It':35200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X8X_125']= {'nmb':'HSS8X8X_125', 'P':19.7, 'A':2340e-6, 'h':203e-3, 'b':203e-3, 'e':3.18e-3, 'Iz':15.6e-6, 'Wzel':153e-6, 'Wzpl':175e-6, 'iz':81.5e-3, 'Iy':15.6e-6, 'Wyel':153e-6, 'Wypl':175e-6, 'iy':81.5e-3, 'It':23900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X6X_625']= {'nmb':'HSS8X6X_625', 'P':75.3, 'A':9030e-6, 'h':203e-3, 'b':152e-3, 'e':15.9e-3, 'Iz':47.5e-6, 'Wzel':467e-6, 'Wzpl':592e-6, 'iz':72.4e-3, 'Iy':30.1e-6, 'Wyel':395e-6, 'Wypl':483e-6, 'iy':57.7e-3, 'It':62400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X6X_500']= {'nmb':'HSS8X6X_500', 'P':62.4, 'A':7480e-6, 'h':203e-3, 'b':152e-3, 'e':12.7e-3, 'Iz':40.9e-6, 'Wzel':403e-6, 'Wzpl':500e-6, 'iz':73.9e-3, 'Iy':26e-6, 'Wyel':341e-6, 'Wypl':408e-6, 'iy':58.9e-3, 'It':52900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X6X_375']= {'nmb':'HSS8X6X_375', 'P':48.4, 'A':5790e-6, 'h':203e-3, 'b':152e-3, 'e':9.53e-3, 'Iz':32.9e-6, 'Wzel':324e-6, 'Wzpl':395e-6, 'iz':75.4e-3, 'Iy':21.1e-6, 'Wyel':277e-6, 'Wypl':324e-6, 'iy':60.5e-3, 'It':41600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X6X_313']= {'nmb':'HSS8X6X_313', 'P':41, 'A':4900e-6, 'h':203e-3, 'b':152e-3, 'e':7.94e-3, 'Iz':28.4e-6, 'Wzel':280e-6, 'Wzpl':338e-6, 'iz':76.2e-3, 'Iy':18.2e-6, 'Wyel':239e-6, 'Wypl':277e-6, 'iy':61e-3, 'It':35700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X6X_250']= {'nmb':'HSS8X6X_250', 'P':33.3, 'A':3980e-6, 'h':203e-3, 'b':152e-3, 'e':6.35e-3, 'Iz':23.6e-6, 'Wzel':233e-6, 'Wzpl':277e-6, 'iz':77e-3, 'Iy':15.2e-6, 'Wyel':198e-6, 'Wypl':228e-6, 'iy':61.7e-3, 'It':29300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X6X_188']= {'nmb':'HSS8X6X_188', 'P':25.4, 'A':3010e-6, 'h':203e-3, 'b':152e-3, 'e':4.76e-3, 'Iz':18.2e-6, 'Wzel':179e-6, 'Wzpl':213e-6, 'iz':77.7e-3, 'Iy':11.7e-6, 'Wyel':154e-6, 'Wypl':175e-6, 'iy':62.5e-3, 'It':22400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X4X_625']= {'nmb':'HSS8X4X_625', 'P':62.6, 'A':7550e-6, 'h':203e-3, 'b':102e-3, 'e':15.9e-3, 'Iz':34.1e-6, 'Wzel':336e-6, 'Wzpl':449e-6, 'iz':67.1e-3, 'Iy':11.1e-6, 'Wyel':218e-6, 'Wypl':272e-6, 'iy':38.4e-3, 'It':29300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X4X_500']= {'nmb':'HSS8X4X_500', 'P':52.2, 'A':6280e-6, 'h':203e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':29.9e-6, 'Wzel':293e-6, 'Wzpl':385e-6, 'iz':68.8e-3, 'Iy':9.82e-6, 'Wyel':193e-6, 'Wypl':234e-6, 'iy':39.6e-3, 'It':25400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X4X_375']= {'nmb':'HSS8X4X_375', 'P':40.8, 'A':4890e-6, 'h':203e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':24.4e-6, 'Wzel':241e-6, 'Wzpl':308e-6, 'iz':70.6e-3, 'Iy':8.16e-6, 'Wyel':161e-6, 'Wypl':188e-6, 'iy':40.9e-3, 'It':20500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X4X_313']= {'nmb':'HSS8X4X_313', 'P':34.7, 'A':4150e-6, 'h':203e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':21.2e-6, 'Wzel':210e-6, 'Wzpl':264e-6, 'iz':71.6e-3, 'Iy':7.16e-6, 'Wyel':141e-6, 'Wypl':162e-6, 'iy':41.4e-3, 'It':17700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X4X_250']= {'nmb':'HSS8X4X_250', 'P':28.3, 'A':3380e-6, 'h':203e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':17.7e-6, 'Wzel':174e-6, 'Wzpl':218e-6, 'iz':72.4e-3, 'Iy':5.99e-6, 'Wyel':118e-6, 'Wypl':134e-6, 'iy':42.2e-3, 'It':14700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X4X_188']= {'nmb':'HSS8X4X_188', 'P':21.6, 'A':2570e-6, 'h':203e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':13.8e-6, 'Wzel':136e-6, 'Wzpl':167e-6, 'iz':73.2e-3, 'Iy':4.7e-6, 'Wyel':92.6e-6, 'Wypl':104e-6, 'iy':42.9e-3, 'It':11300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X4X_125']= {'nmb':'HSS8X4X_125', 'P':14.7, 'A':1740e-6, 'h':203e-3, 'b':102e-3, 'e':3.18e-3, 'Iz':9.53e-6, 'Wzel':93.9e-6, 'Wzpl':115e-6, 'iz':74.2e-3, 'Iy':3.29e-6, 'Wyel':64.7e-6, 'Wypl':71.4e-6, 'iy':43.4e-3, 'It':7780e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X3X_500']= {'nmb':'HSS8X3X_500', 'P':47.2, 'A':5680e-6, 'h':203e-3, 'b':76.2e-3, 'e':12.7e-3, 'Iz':24.4e-6, 'Wzel':239e-6, 'Wzpl':328e-6, 'iz':65.5e-3, 'Iy':4.87e-6, 'Wyel':128e-6, 'Wypl':158e-6, 'iy':29.2e-3, 'It':14300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X3X_375']= {'nmb':'HSS8X3X_375', 'P':37, 'A':4440e-6, 'h':203e-3, 'b':76.2e-3, 'e':9.53e-3, 'Iz':20.2e-6, 'Wzel':198e-6, 'Wzpl':264e-6, 'iz':67.3e-3, 'Iy':4.16e-6, 'Wyel':109e-6, 'Wypl':129e-6, 'iy':30.5e-3, 'It':11900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X3X_313']= {'nmb':'HSS8X3X_313', 'P':31.5, 'A':3770e-6, 'h':203e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':17.6e-6, 'Wzel':174e-6, 'Wzpl':228e-6, 'iz':68.3e-3, 'Iy':3.67e-6, 'Wyel':96.2e-6, 'Wypl':112e-6, 'iy':31.2e-3, 'It':10400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X3X_250']= {'nmb':'HSS8X3X_250', 'P':25.7, 'A':3080e-6, 'h':203e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':14.8e-6, 'Wzel':146e-6, 'Wzpl':188e-6, 'iz':69.3e-3, 'Iy':3.12e-6, 'Wyel':81.8e-6, 'Wypl':93.4e-6, 'iy':31.8e-3, 'It':8660e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X3X_188']= {'nmb':'HSS8X3X_188', 'P':19.7, 'A':2340e-6, 'h':203e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':11.6e-6, 'Wzel':114e-6, 'Wzpl':145e-6, 'iz':70.4e-3, 'Iy':2.47e-6, 'Wyel':64.9e-6, 'Wypl':72.6e-6, 'iy':32.5e-3, 'It':6740e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X3X_125']= {'nmb':'HSS8X3X_125', 'P':13.4, 'A':1590e-6, 'h':203e-3, 'b':76.2e-3, 'e':3.18e-3, 'Iz':8.03e-6, 'Wzel':79.1e-6, 'Wzpl':100e-6, 'iz':71.1e-3, 'Iy':1.75e-6, 'Wyel':45.9e-6, 'Wypl':50.3e-6, 'iy':33.3e-3, 'It':4700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X2X_375']= {'nmb':'HSS8X2X_375', 'P':33.2, 'A':3990e-6, 'h':203e-3, 'b':50.8e-3, 'e':9.53e-3, 'Iz':15.9e-6, 'Wzel':157e-6, 'Wzpl':220e-6, 'iz':63.2e-3, 'Iy':1.55e-6, 'Wyel':61.1e-6, 'Wypl':75.5e-6, 'iy':19.7e-3, 'It':5040e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X2X_313']= {'nmb':'HSS8X2X_313', 'P':28.4, 'A':3390e-6, 'h':203e-3, 'b':50.8e-3, 'e':7.94e-3, 'Iz':14e-6, 'Wzel':138e-6, 'Wzpl':190e-6, 'iz':64.3e-3, 'Iy':1.41e-6, 'Wyel':55.4e-6, 'Wypl':66.5e-6, 'iy':20.4e-3, 'It':4540e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X2X_250']= {'nmb':'HSS8X2X_250', 'P':23.2, 'A':2770e-6, 'h':203e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':11.9e-6, 'Wzel':117e-6, 'Wzpl':159e-6, 'iz':65.3e-3, 'Iy':1.22e-6, 'Wyel':48.2e-6, 'Wypl':56.2e-6, 'iy':21e-3, 'It':3900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X2X_188']= {'nmb':'HSS8X2X_188', 'P':17.8, 'A':2120e-6, 'h':203e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':9.32e-6, 'Wzel':91.9e-6, 'Wzpl':123e-6, 'iz':66.3e-3, 'Iy':0.995e-6, 'Wyel':39.2e-6, 'Wypl':44.2e-6, 'iy':21.7e-3, 'It':3110e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS8X2X_125']= {'nmb':'HSS8X2X_125', 'P':12.1, 'A':1440e-6, 'h':203e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':6.53e-6, 'Wzel':64.4e-6, 'Wzpl':85e-6, 'iz':67.3e-3, 'Iy':0.716e-6, 'Wyel':28.2e-6, 'Wypl':31.1e-6, 'iy':22.3e-3, 'It':2210e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X7X_625']= {'nmb':'HSS7X7X_625', 'P':75.3, 'A':9030e-6, 'h':178e-3, 'b':178e-3, 'e':15.9e-3, 'Iz':38.9e-6, 'Wzel':438e-6, 'Wzpl':542e-6, 'iz':65.5e-3, 'Iy':38.9e-6, 'Wyel':438e-6, 'Wypl':542e-6, 'iy':65.5e-3, 'It':65800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X7X_500']= {'nmb':'HSS7X7X_500', 'P':62.4, 'A':7480e-6, 'h':178e-3, 'b':178e-3, 'e':12.7e-3, 'Iz':33.5e-6, 'Wzel':377e-6, 'Wzpl':457e-6, 'iz':66.8e-3, 'Iy':33.5e-6, 'Wyel':377e-6, 'Wypl':457e-6, 'iy':66.8e-3, 'It':55400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X7X_375']= {'nmb':'HSS7X7X_375', 'P':48.4, 'A':5790e-6, 'h':178e-3, 'b':178e-3, 'e':9.53e-3, 'Iz':27.1e-6, 'Wzel':305e-6, 'Wzpl':362e-6, 'iz':68.3e-3, 'Iy':27.1e-6, 'Wyel':305e-6, 'Wypl':362e-6, 'iy':68.3e-3, 'It':43700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X7X_313']= {'nmb':'HSS7X7X_313', 'P':41, 'A':4900e-6, 'h':178e-3, 'b':178e-3, 'e':7.94e-3, 'Iz':23.4e-6, 'Wzel':262e-6, 'Wzpl':310e-6, 'iz':69.1e-3, 'Iy':23.4e-6, 'Wyel':262e-6, 'Wypl':310e-6, 'iy':69.1e-3, 'It':37300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X7X_250']= {'nmb':'HSS7X7X_250', 'P':33.3, 'A':3980e-6, 'h':178e-3, 'b':178e-3, 'e':6.35e-3, 'Iz':19.4e-6, 'Wzel':218e-6, 'Wzpl':254e-6, 'iz':69.9e-3, 'Iy':19.4e-6, 'Wyel':218e-6, 'Wypl':254e-6, 'iy':69.9e-3, 'It':30600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X7X_188']= {'nmb':'HSS7X7X_188', 'P':25.4, 'A':3010e-6, 'h':178e-3, 'b':178e-3, 'e':4.76e-3, 'Iz':15e-6, 'Wzel':169e-6, 'Wzpl':195e-6, 'iz':70.4e-3, 'Iy':15e-6, 'Wyel':169e-6, 'Wypl':195e-6, 'iy':70.4e-3, 'It':23400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X7X_125']= {'nmb':'HSS7X7X_125', 'P':17.2, 'A':2040e-6, 'h':178e-3, 'b':178e-3, 'e':3.18e-3, 'Iz':10.3e-6, 'Wzel':116e-6, 'Wzpl':133e-6, 'iz':71.1e-3, 'Iy':10.3e-6, 'Wyel':116e-6, 'Wypl':133e-6, 'iy':71.1e-3, 'It':15900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X5X_500']= {'nmb':'HSS7X5X_500', 'P':52.2, 'A':6280e-6, 'h':178e-3, 'b':127e-3, 'e':12.7e-3, 'Iz':25.2e-6, 'Wzel':283e-6, 'Wzpl':359e-6, 'iz':63.5e-3, 'Iy':14.8e-6, 'Wyel':233e-6, 'Wypl':283e-6, 'iy':48.5e-3, 'It':31600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X5X_375']= {'nmb':'HSS7X5X_375', 'P':40.8, 'A':4890e-6, 'h':178e-3, 'b':127e-3, 'e':9.53e-3, 'Iz':20.6e-6, 'Wzel':231e-6, 'Wzpl':287e-6, 'iz':65e-3, 'Iy':12.2e-6, 'Wyel':192e-6, 'Wypl':226e-6, 'iy':50e-3, 'It':25200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X5X_313']= {'nmb':'HSS7X5X_313', 'P':34.7, 'A':4150e-6, 'h':178e-3, 'b':127e-3, 'e':7.94e-3, 'Iz':17.9e-6, 'Wzel':202e-6, 'Wzpl':246e-6, 'iz':65.8e-3, 'Iy':10.6e-6, 'Wyel':167e-6, 'Wypl':195e-6, 'iy':50.5e-3, 'It':21700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X5X_250']= {'nmb':'HSS7X5X_250', 'P':28.3, 'A':3380e-6, 'h':178e-3, 'b':127e-3, 'e':6.35e-3, 'Iz':14.9e-6, 'Wzel':167e-6, 'Wzpl':203e-6, 'iz':66.5e-3, 'Iy':8.87e-6, 'Wyel':140e-6, 'Wypl':161e-6, 'iy':51.3e-3, 'It':17900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X5X_188']= {'nmb':'HSS7X5X_188', 'P':21.6, 'A':2570e-6, 'h':178e-3, 'b':127e-3, 'e':4.76e-3, 'Iz':11.6e-6, 'Wzel':130e-6, 'Wzpl':156e-6, 'iz':67.3e-3, 'Iy':6.91e-6, 'Wyel':109e-6, 'Wypl':124e-6, 'iy':52.1e-3, 'It':13700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X5X_125']= {'nmb':'HSS7X5X_125', 'P':14.7, 'A':1740e-6, 'h':178e-3, 'b':127e-3, 'e':3.18e-3, 'Iz':8.03e-6, 'Wzel':90.5e-6, 'Wzpl':107e-6, 'iz':68.1e-3, 'Iy':4.83e-6, 'Wyel':75.9e-6, 'Wypl':85.2e-6, 'iy':52.6e-3, 'It':9370e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X4X_500']= {'nmb':'HSS7X4X_500', 'P':47.2, 'A':5680e-6, 'h':178e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':21.1e-6, 'Wzel':238e-6, 'Wzpl':308e-6, 'iz':61e-3, 'Iy':8.62e-6, 'Wyel':170e-6, 'Wypl':206e-6, 'iy':38.9e-3, 'It':21000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X4X_375']= {'nmb':'HSS7X4X_375', 'P':37, 'A':4440e-6, 'h':178e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':17.4e-6, 'Wzel':195e-6, 'Wzpl':247e-6, 'iz':62.5e-3, 'Iy':7.2e-6, 'Wyel':141e-6, 'Wypl':167e-6, 'iy':40.1e-3, 'It':17100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X4X_313']= {'nmb':'HSS7X4X_313', 'P':31.5, 'A':3770e-6, 'h':178e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':15.2e-6, 'Wzel':170e-6, 'Wzpl':215e-6, 'iz':63.5e-3, 'Iy':6.33e-6, 'Wyel':124e-6, 'Wypl':145e-6, 'iy':40.9e-3, 'It':14700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X4X_250']= {'nmb':'HSS7X4X_250', 'P':25.7, 'A':3080e-6, 'h':178e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':12.7e-6, 'Wzel':143e-6, 'Wzpl':177e-6, 'iz':64.3e-3, 'Iy':5.33e-6, 'Wyel':105e-6, 'Wypl':120e-6, 'iy':41.7e-3, 'It':12200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X4X_188']= {'nmb':'HSS7X4X_188', 'P':19.7, 'A':2340e-6, 'h':178e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':9.91e-6, 'Wzel':112e-6, 'Wzpl':137e-6, 'iz':65e-3, 'Iy':4.16e-6, 'Wyel':82.3e-6, 'Wypl':92.9e-6, 'iy':42.2e-3, 'It':9450e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X4X_125']= {'nmb':'HSS7X4X_125', 'P':13.4, 'A':1590e-6, 'h':178e-3, 'b':102e-3, 'e':3.18e-3, 'Iz':6.91e-6, 'Wzel':77.5e-6, 'Wzpl':93.9e-6, 'iz':65.8e-3, 'Iy':2.93e-6, 'Wyel':57.5e-6, 'Wypl':64.1e-6, 'iy':42.9e-3, 'It':6490e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X3X_500']= {'nmb':'HSS7X3X_500', 'P':42.1, 'A':5080e-6, 'h':178e-3, 'b':76.2e-3, 'e':12.7e-3, 'Iz':16.9e-6, 'Wzel':190e-6, 'Wzpl':259e-6, 'iz':57.7e-3, 'Iy':4.25e-6, 'Wyel':111e-6, 'Wypl':139e-6, 'iy':29e-3, 'It':11900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X3X_375']= {'nmb':'HSS7X3X_375', 'P':33.2, 'A':3990e-6, 'h':178e-3, 'b':76.2e-3, 'e':9.53e-3, 'Iz':14.2e-6, 'Wzel':159e-6, 'Wzpl':210e-6, 'iz':59.7e-3, 'Iy':3.63e-6, 'Wyel':95.2e-6, 'Wypl':114e-6, 'iy':30.2e-3, 'It':9950e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X3X_313']= {'nmb':'HSS7X3X_313', 'P':28.4, 'A':3390e-6, 'h':178e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':12.4e-6, 'Wzel':140e-6, 'Wzpl':182e-6, 'iz':60.5e-3, 'Iy':3.22e-6, 'Wyel':84.6e-6, 'Wypl':99.1e-6, 'iy':30.7e-3, 'It':8700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X3X_250']= {'nmb':'HSS7X3X_250', 'P':23.2, 'A':2770e-6, 'h':178e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':10.5e-6, 'Wzel':118e-6, 'Wzpl':151e-6, 'iz':61.5e-3, 'Iy':2.75e-6, 'Wyel':72.1e-6, 'Wypl':82.9e-6, 'iy':31.5e-3, 'It':7280e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X3X_188']= {'nmb':'HSS7X3X_188', 'P':17.8, 'A':2120e-6, 'h':178e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':8.24e-6, 'Wzel':92.6e-6, 'Wzpl':117e-6, 'iz':62.2e-3, 'Iy':2.18e-6, 'Wyel':57.4e-6, 'Wypl':64.6e-6, 'iy':32e-3, 'It':5700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X3X_125']= {'nmb':'HSS7X3X_125', 'P':12.1, 'A':1440e-6, 'h':178e-3, 'b':76.2e-3, 'e':3.18e-3, 'Iz':5.74e-6, 'Wzel':64.7e-6, 'Wzpl':80.8e-6, 'iz':63.2e-3, 'Iy':1.54e-6, 'Wyel':40.6e-6, 'Wypl':44.7e-6, 'iy':32.8e-3, 'It':3950e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X2X_250']= {'nmb':'HSS7X2X_250', 'P':20.7, 'A':2480e-6, 'h':178e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':8.24e-6, 'Wzel':92.9e-6, 'Wzpl':125e-6, 'iz':57.7e-3, 'Iy':1.07e-6, 'Wyel':42.3e-6, 'Wypl':49.5e-6, 'iy':20.8e-3, 'It':3310e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X2X_188']= {'nmb':'HSS7X2X_188', 'P':15.9, 'A':1890e-6, 'h':178e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':6.53e-6, 'Wzel':73.6e-6, 'Wzpl':97.5e-6, 'iz':58.7e-3, 'Iy':0.874e-6, 'Wyel':34.4e-6, 'Wypl':39.2e-6, 'iy':21.5e-3, 'It':2640e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS7X2X_125']= {'nmb':'HSS7X2X_125', 'P':10.9, 'A':1290e-6, 'h':178e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':4.62e-6, 'Wzel':51.8e-6, 'Wzpl':67.7e-6, 'iz':59.7e-3, 'Iy':0.633e-6, 'Wyel':24.9e-6, 'Wypl':27.5e-6, 'iy':22.1e-3, 'It':1880e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X6X_625']= {'nmb':'HSS6X6X_625', 'P':62.6, 'A':7550e-6, 'h':152e-3, 'b':152e-3, 'e':15.9e-3, 'Iz':23e-6, 'Wzel':302e-6, 'Wzpl':380e-6, 'iz':55.1e-3, 'Iy':23e-6, 'Wyel':302e-6, 'Wypl':380e-6, 'iy':55.1e-3, 'It':39500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X6X_500']= {'nmb':'HSS6X6X_500', 'P':52.2, 'A':6280e-6, 'h':152e-3, 'b':152e-3, 'e':12.7e-3, 'Iz':20.1e-6, 'Wzel':264e-6, 'Wzpl':324e-6, 'iz':56.6e-3, 'Iy':20.1e-6, 'Wyel':264e-6, 'Wypl':324e-6, 'iy':56.6e-3, 'It':33800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X6X_375']= {'nmb':'HSS6X6X_375', 'P':40.8, 'A':4890e-6, 'h':152e-3, 'b':152e-3, 'e':9.53e-3, 'Iz':16.4e-6, 'Wzel':216e-6, 'Wzpl':259e-6, 'iz':57.9e-3, 'Iy':16.4e-6, 'Wyel':216e-6, 'Wypl':259e-6, 'iy':57.9e-3, 'It':26900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X6X_313']= {'nmb':'HSS6X6X_313', 'P':34.6, 'A':4150e-6, 'h':152e-3, 'b':152e-3, 'e':7.94e-3, 'Iz':14.3e-6, 'Wzel':187e-6, 'Wzpl':223e-6, 'iz':58.7e-3, 'Iy':14.3e-6, 'Wyel':187e-6, 'Wypl':223e-6, 'iy':58.7e-3, 'It':23100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X6X_250']= {'nmb':'HSS6X6X_250', 'P':28.3, 'A':3380e-6, 'h':152e-3, 'b':152e-3, 'e':6.35e-3, 'Iz':11.9e-6, 'Wzel':156e-6, 'Wzpl':184e-6, 'iz':59.4e-3, 'Iy':11.9e-6, 'Wyel':156e-6, 'Wypl':184e-6, 'iy':59.4e-3, 'It':19000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X6X_188']= {'nmb':'HSS6X6X_188', 'P':21.6, 'A':2570e-6, 'h':152e-3, 'b':152e-3, 'e':4.76e-3, 'Iz':9.28e-6, 'Wzel':122e-6, 'Wzpl':141e-6, 'iz':60.2e-3, 'Iy':9.28e-6, 'Wyel':122e-6, 'Wypl':141e-6, 'iy':60.2e-3, 'It':14600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X6X_125']= {'nmb':'HSS6X6X_125', 'P':14.7, 'A':1740e-6, 'h':152e-3, 'b':152e-3, 'e':3.18e-3, 'Iz':6.45e-6, 'Wzel':84.4e-6, 'Wzpl':97e-6, 'iz':60.7e-3, 'Iy':6.45e-6, 'Wyel':84.4e-6, 'Wypl':97e-6, 'iy':60.7e-3, 'It':9950e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X5X_500']= {'nmb':'HSS6X5X_500', 'P':47.2, 'A':5680e-6, 'h':152e-3, 'b':127e-3, 'e':12.7e-3, 'Iz':17.1e-6, 'Wzel':225e-6, 'Wzpl':282e-6, 'iz':54.9e-3, 'Iy':12.8e-6, 'Wyel':202e-6, 'Wypl':249e-6, 'iy':47.5e-3, 'It':24900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X5X_375']= {'nmb':'HSS6X5X_375', 'P':37, 'A':4440e-6, 'h':152e-3, 'b':127e-3, 'e':9.53e-3, 'Iz':14.1e-6, 'Wzel':185e-6, 'Wzpl':226e-6, 'iz':56.4e-3, 'Iy':10.6e-6, 'Wyel':167e-6, 'Wypl':200e-6, 'iy':48.8e-3, 'It':20000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X5X_313']= {'nmb':'HSS6X5X_313', 'P':31.5, 'A':3770e-6, 'h':152e-3, 'b':127e-3, 'e':7.94e-3, 'Iz':12.3e-6, 'Wzel':161e-6, 'Wzpl':195e-6, 'iz':57.2e-3, 'Iy':9.28e-6, 'Wyel':146e-6, 'Wypl':172e-6, 'iy':49.5e-3, 'It':17200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X5X_250']= {'nmb':'HSS6X5X_250', 'P':25.7, 'A':3080e-6, 'h':152e-3, 'b':127e-3, 'e':6.35e-3, 'Iz':10.3e-6, 'Wzel':135e-6, 'Wzpl':162e-6, 'iz':57.9e-3, 'Iy':7.78e-6, 'Wyel':122e-6, 'Wypl':143e-6, 'iy':50.3e-3, 'It':14200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X5X_188']= {'nmb':'HSS6X5X_188', 'P':19.7, 'A':2340e-6, 'h':152e-3, 'b':127e-3, 'e':4.76e-3, 'Iz':8.03e-6, 'Wzel':106e-6, 'Wzpl':125e-6, 'iz':58.7e-3, 'Iy':6.08e-6, 'Wyel':95.7e-6, 'Wypl':110e-6, 'iy':51.1e-3, 'It':10900e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X5X_125']= {'nmb':'HSS6X5X_125', 'P':13.4, 'A':1590e-6, 'h':152e-3, 'b':127e-3, 'e':3.18e-3, 'Iz':5.58e-6, 'Wzel':73.4e-6, 'Wzpl':85.9e-6, 'iz':59.4e-3, 'Iy':4.25e-6, 'Wyel':66.7e-6, 'Wypl':75.9e-6, 'iy':51.6e-3, 'It':7490e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X4X_500']= {'nmb':'HSS6X4X_500', 'P':42.1, 'A':5080e-6, 'h':152e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':14.2e-6, 'Wzel':185e-6, 'Wzpl':239e-6, 'iz':52.8e-3, 'Iy':7.41e-6, 'Wyel':146e-6, 'Wypl':180e-6, 'iy':38.1e-3, 'It':16800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X4X_375']= {'nmb':'HSS6X4X_375', 'P':33.2, 'A':3990e-6, 'h':152e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':11.8e-6, 'Wzel':155e-6, 'Wzpl':195e-6, 'iz':54.4e-3, 'Iy':6.2e-6, 'Wyel':122e-6, 'Wypl':147e-6, 'iy':39.4e-3, 'It':13700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X4X_313']= {'nmb':'HSS6X4X_313', 'P':28.4, 'A':3390e-6, 'h':152e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':10.3e-6, 'Wzel':136e-6, 'Wzpl':169e-6, 'iz':55.1e-3, 'Iy':5.49e-6, 'Wyel':108e-6, 'Wypl':127e-6, 'iy':40.1e-3, 'It':11800e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X4X_250']= {'nmb':'HSS6X4X_250', 'P':23.2, 'A':2770e-6, 'h':152e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':8.7e-6, 'Wzel':114e-6, 'Wzpl':140e-6, 'iz':55.9e-3, 'Iy':4.62e-6, 'Wyel':91.1e-6, 'Wypl':106e-6, 'iy':40.9e-3, 'It':9820e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X4X_188']= {'nmb':'HSS6X4X_188', 'P':17.8, 'A':2120e-6, 'h':152e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':6.83e-6, 'Wzel':89.5e-6, 'Wzpl':108e-6, 'iz':56.6e-3, 'Iy':3.65e-6, 'Wyel':71.8e-6, 'Wypl':81.9e-6, 'iy':41.4e-3, 'It':7580e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X4X_125']= {'nmb':'HSS6X4X_125', 'P':12.1, 'A':1440e-6, 'h':152e-3, 'b':102e-3, 'e':3.18e-3, 'Iz':4.75e-6, 'Wzel':62.4e-6, 'Wzpl':74.7e-6, 'iz':57.4e-3, 'Iy':2.56e-6, 'Wyel':50.5e-6, 'Wypl':56.7e-6, 'iy':42.2e-3, 'It':5240e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X3X_500']= {'nmb':'HSS6X3X_500', 'P':37.1, 'A':4480e-6, 'h':152e-3, 'b':76.2e-3, 'e':12.7e-3, 'Iz':11.2e-6, 'Wzel':147e-6, 'Wzpl':198e-6, 'iz':50e-3, 'Iy':3.62e-6, 'Wyel':94.9e-6, 'Wypl':119e-6, 'iy':28.4e-3, 'It':9610e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X3X_375']= {'nmb':'HSS6X3X_375', 'P':29.4, 'A':3540e-6, 'h':152e-3, 'b':76.2e-3, 'e':9.53e-3, 'Iz':9.45e-6, 'Wzel':124e-6, 'Wzpl':162e-6, 'iz':51.8e-3, 'Iy':3.11e-6, 'Wyel':81.8e-6, 'Wypl':98.8e-6, 'iy':29.7e-3, 'It':8030e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X3X_313']= {'nmb':'HSS6X3X_313', 'P':25.2, 'A':3020e-6, 'h':152e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':8.37e-6, 'Wzel':110e-6, 'Wzpl':141e-6, 'iz':52.6e-3, 'Iy':2.78e-6, 'Wyel':72.9e-6, 'Wypl':86.4e-6, 'iy':30.2e-3, 'It':7030e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X3X_250']= {'nmb':'HSS6X3X_250', 'P':20.7, 'A':2480e-6, 'h':152e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':7.08e-6, 'Wzel':92.8e-6, 'Wzpl':118e-6, 'iz':53.3e-3, 'Iy':2.37e-6, 'Wyel':62.3e-6, 'Wypl':72.3e-6, 'iy':31e-3, 'It':5910e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X3X_188']= {'nmb':'HSS6X3X_188', 'P':15.9, 'A':1890e-6, 'h':152e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':5.58e-6, 'Wzel':73.3e-6, 'Wzpl':91.6e-6, 'iz':54.4e-3, 'Iy':1.89e-6, 'Wyel':49.7e-6, 'Wypl':56.5e-6, 'iy':31.8e-3, 'It':4620e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X3X_125']= {'nmb':'HSS6X3X_125', 'P':10.9, 'A':1290e-6, 'h':152e-3, 'b':76.2e-3, 'e':3.18e-3, 'Iz':3.93e-6, 'Wzel':51.5e-6, 'Wzpl':63.4e-6, 'iz':55.1e-3, 'Iy':1.34e-6, 'Wyel':35.2e-6, 'Wypl':39.3e-6, 'iy':32.3e-3, 'It':3220e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X2X_375']= {'nmb':'HSS6X2X_375', 'P':25.6, 'A':3080e-6, 'h':152e-3, 'b':50.8e-3, 'e':9.53e-3, 'Iz':7.12e-6, 'Wzel':93.6e-6, 'Wzpl':130e-6, 'iz':48e-3, 'Iy':1.15e-6, 'Wyel':45.4e-6, 'Wypl':56.7e-6, 'iy':19.3e-3, 'It':3500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X2X_313']= {'nmb':'HSS6X2X_313', 'P':22, 'A':2650e-6, 'h':152e-3, 'b':50.8e-3, 'e':7.94e-3, 'Iz':6.37e-6, 'Wzel':83.7e-6, 'Wzpl':114e-6, 'iz':49e-3, 'Iy':1.05e-6, 'Wyel':41.3e-6, 'Wypl':50.3e-6, 'iy':19.9e-3, 'It':3160e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X2X_250']= {'nmb':'HSS6X2X_250', 'P':18.1, 'A':2170e-6, 'h':152e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':5.45e-6, 'Wzel':71.6e-6, 'Wzpl':95.7e-6, 'iz':50e-3, 'Iy':0.92e-6, 'Wyel':36.2e-6, 'Wypl':42.8e-6, 'iy':20.6e-3, 'It':2730e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X2X_188']= {'nmb':'HSS6X2X_188', 'P':14, 'A':1660e-6, 'h':152e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':4.37e-6, 'Wzel':57.2e-6, 'Wzpl':75.1e-6, 'iz':51.1e-3, 'Iy':0.749e-6, 'Wyel':29.5e-6, 'Wypl':33.9e-6, 'iy':21.2e-3, 'It':2180e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS6X2X_125']= {'nmb':'HSS6X2X_125', 'P':9.59, 'A':1140e-6, 'h':152e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':3.09e-6, 'Wzel':40.5e-6, 'Wzpl':52.3e-6, 'iz':52.1e-3, 'Iy':0.545e-6, 'Wyel':21.5e-6, 'Wypl':23.9e-6, 'iy':21.9e-3, 'It':1550e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5-1/2X5-1/2X_375']= {'nmb':'HSS5-1/2X5-1/2X_375', 'P':37, 'A':4440e-6, 'h':140e-3, 'b':140e-3, 'e':9.53e-3, 'Iz':12.4e-6, 'Wzel':177e-6, 'Wzpl':215e-6, 'iz':52.8e-3, 'Iy':12.4e-6, 'Wyel':177e-6, 'Wypl':215e-6, 'iy':52.8e-3, 'It':20400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5-1/2X5-1/2X_313']= {'nmb':'HSS5-1/2X5-1/2X_313', 'P':31.5, 'A':3770e-6, 'h':140e-3, 'b':140e-3, 'e':7.94e-3, 'Iz':10.8e-6, 'Wzel':155e-6, 'Wzpl':185e-6, 'iz':53.6e-3, 'Iy':10.8e-6, 'Wyel':155e-6, 'Wypl':185e-6, 'iy':53.6e-3, 'It':17600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5-1/2X5-1/2X_250']= {'nmb':'HSS5-1/2X5-1/2X_250', 'P':25.7, 'A':3080e-6, 'h':140e-3, 'b':140e-3, 'e':6.35e-3, 'Iz':9.03e-6, 'Wzel':129e-6, 'Wzpl':153e-6, 'iz':54.1e-3, 'Iy':9.03e-6, 'Wyel':129e-6, 'Wypl':153e-6, 'iy':54.1e-3, 'It':14500e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5-1/2X5-1/2X_188']= {'nmb':'HSS5-1/2X5-1/2X_188', 'P':19.7, 'A':2340e-6, 'h':140e-3, 'b':140e-3, 'e':4.76e-3, 'Iz':7.08e-6, 'Wzel':101e-6, 'Wzpl':118e-6, 'iz':54.9e-3, 'Iy':7.08e-6, 'Wyel':101e-6, 'Wypl':118e-6, 'iy':54.9e-3, 'It':11100e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5-1/2X5-1/2X_125']= {'nmb':'HSS5-1/2X5-1/2X_125', 'P':13.4, 'A':1590e-6, 'h':140e-3, 'b':140e-3, 'e':3.18e-3, 'Iz':4.91e-6, 'Wzel':70.5e-6, 'Wzpl':81.1e-6, 'iz':55.6e-3, 'Iy':4.91e-6, 'Wyel':70.5e-6, 'Wypl':81.1e-6, 'iy':55.6e-3, 'It':7620e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X5X_500']= {'nmb':'HSS5X5X_500', 'P':42.1, 'A':5080e-6, 'h':127e-3, 'b':127e-3, 'e':12.7e-3, 'Iz':10.8e-6, 'Wzel':170e-6, 'Wzpl':215e-6, 'iz':46.2e-3, 'Iy':10.8e-6, 'Wyel':170e-6, 'Wypl':215e-6, 'iy':46.2e-3, 'It':18600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X5X_375']= {'nmb':'HSS5X5X_375', 'P':33.2, 'A':3990e-6, 'h':127e-3, 'b':127e-3, 'e':9.53e-3, 'Iz':9.03e-6, 'Wzel':142e-6, 'Wzpl':174e-6, 'iz':47.5e-3, 'Iy':9.03e-6, 'Wyel':142e-6, 'Wypl':174e-6, 'iy':47.5e-3, 'It':15000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X5X_313']= {'nmb':'HSS5X5X_313', 'P':28.3, 'A':3390e-6, 'h':127e-3, 'b':127e-3, 'e':7.94e-3, 'Iz':7.91e-6, 'Wzel':125e-6, 'Wzpl':150e-6, 'iz':48.3e-3, 'Iy':7.91e-6, 'Wyel':125e-6, 'Wypl':150e-6, 'iy':48.3e-3, 'It':13000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X5X_250']= {'nmb':'HSS5X5X_250', 'P':23.2, 'A':2770e-6, 'h':127e-3, 'b':127e-3, 'e':6.35e-3, 'Iz':6.66e-6, 'Wzel':105e-6, 'Wzpl':125e-6, 'iz':49e-3, 'Iy':6.66e-6, 'Wyel':105e-6, 'Wypl':125e-6, 'iy':49e-3, 'It':10700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X5X_188']= {'nmb':'HSS5X5X_188', 'P':17.8, 'A':2120e-6, 'h':127e-3, 'b':127e-3, 'e':4.76e-3, 'Iz':5.24e-6, 'Wzel':82.4e-6, 'Wzpl':96.5e-6, 'iz':49.8e-3, 'Iy':5.24e-6, 'Wyel':82.4e-6, 'Wypl':96.5e-6, 'iy':49.8e-3, 'It':8280e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X5X_125']= {'nmb':'HSS5X5X_125', 'P':12.1, 'A':1440e-6, 'h':127e-3, 'b':127e-3, 'e':3.18e-3, 'Iz':3.66e-6, 'Wzel':57.7e-6, 'Wzpl':66.7e-6, 'iz':50.5e-3, 'Iy':3.66e-6, 'Wyel':57.7e-6, 'Wypl':66.7e-6, 'iy':50.5e-3, 'It':5700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X4X_500']= {'nmb':'HSS5X4X_500', 'P':37.1, 'A':4480e-6, 'h':127e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':8.82e-6, 'Wzel':139e-6, 'Wzpl':179e-6, 'iz':44.5e-3, 'Iy':6.2e-6, 'Wyel':122e-6, 'Wypl':153e-6, 'iy':37.1e-3, 'It':12600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X4X_375']= {'nmb':'HSS5X4X_375', 'P':29.4, 'A':3540e-6, 'h':127e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':7.45e-6, 'Wzel':117e-6, 'Wzpl':147e-6, 'iz':46e-3, 'Iy':5.24e-6, 'Wyel':103e-6, 'Wypl':126e-6, 'iy':38.6e-3, 'It':10400e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X4X_313']= {'nmb':'HSS5X4X_313', 'P':25.2, 'A':3020e-6, 'h':127e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':6.58e-6, 'Wzel':104e-6, 'Wzpl':128e-6, 'iz':46.7e-3, 'Iy':4.62e-6, 'Wyel':91.3e-6, 'Wypl':109e-6, 'iy':39.1e-3, 'It':9030e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X4X_250']= {'nmb':'HSS5X4X_250', 'P':20.7, 'A':2480e-6, 'h':127e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':5.58e-6, 'Wzel':87.7e-6, 'Wzpl':106e-6, 'iz':47.5e-3, 'Iy':3.94e-6, 'Wyel':77.5e-6, 'Wypl':91.3e-6, 'iy':39.9e-3, 'It':7490e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X4X_188']= {'nmb':'HSS5X4X_188', 'P':15.9, 'A':1890e-6, 'h':127e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':4.41e-6, 'Wzel':69.2e-6, 'Wzpl':82.8e-6, 'iz':48.3e-3, 'Iy':3.11e-6, 'Wyel':61.3e-6, 'Wypl':71.1e-6, 'iy':40.6e-3, 'It':5830e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X4X_125']= {'nmb':'HSS5X4X_125', 'P':10.9, 'A':1290e-6, 'h':127e-3, 'b':102e-3, 'e':3.18e-3, 'Iz':3.09e-6, 'Wzel':48.7e-6, 'Wzpl':57.4e-6, 'iz':49e-3, 'Iy':2.19e-6, 'Wyel':43.3e-6, 'Wypl':49.3e-6, 'iy':41.1e-3, 'It':4020e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X3X_500']= {'nmb':'HSS5X3X_500', 'P':32, 'A':3880e-6, 'h':127e-3, 'b':76.2e-3, 'e':12.7e-3, 'Iz':6.83e-6, 'Wzel':108e-6, 'Wzpl':145e-6, 'iz':41.9e-3, 'Iy':2.99e-6, 'Wyel':78.3e-6, 'Wypl':100e-6, 'iy':27.7e-3, 'It':7330e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X3X_375']= {'nmb':'HSS5X3X_375', 'P':25.6, 'A':3080e-6, 'h':127e-3, 'b':76.2e-3, 'e':9.53e-3, 'Iz':5.87e-6, 'Wzel':92.6e-6, 'Wzpl':120e-6, 'iz':43.7e-3, 'Iy':2.6e-6, 'Wyel':68.2e-6, 'Wypl':83.6e-6, 'iy':29e-3, 'It':6200e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X3X_313']= {'nmb':'HSS5X3X_313', 'P':22, 'A':2650e-6, 'h':127e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':5.24e-6, 'Wzel':82.4e-6, 'Wzpl':105e-6, 'iz':44.5e-3, 'Iy':2.33e-6, 'Wyel':61.1e-6, 'Wypl':73.4e-6, 'iy':29.7e-3, 'It':5450e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X3X_250']= {'nmb':'HSS5X3X_250', 'P':18.1, 'A':2170e-6, 'h':127e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':4.45e-6, 'Wzel':70.3e-6, 'Wzpl':88.2e-6, 'iz':45.2e-3, 'Iy':2e-6, 'Wyel':52.6e-6, 'Wypl':61.8e-6, 'iy':30.2e-3, 'It':4580e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X3X_188']= {'nmb':'HSS5X3X_188', 'P':14, 'A':1660e-6, 'h':127e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':3.55e-6, 'Wzel':55.9e-6, 'Wzpl':69e-6, 'iz':46.2e-3, 'Iy':1.6e-6, 'Wyel':42.1e-6, 'Wypl':48.5e-6, 'iy':31e-3, 'It':3600e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X3X_125']= {'nmb':'HSS5X3X_125', 'P':9.59, 'A':1140e-6, 'h':127e-3, 'b':76.2e-3, 'e':3.18e-3, 'Iz':2.51e-6, 'Wzel':39.5e-6, 'Wzpl':48e-6, 'iz':47e-3, 'Iy':1.14e-6, 'Wyel':30e-6, 'Wypl':33.9e-6, 'iy':31.8e-3, 'It':2510e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X2-1/2X_250']= {'nmb':'HSS5X2-1/2X_250', 'P':16.9, 'A':2030e-6, 'h':127e-3, 'b':63.5e-3, 'e':6.35e-3, 'Iz':3.91e-6, 'Wzel':61.6e-6, 'Wzpl':79.1e-6, 'iz':43.9e-3, 'Iy':1.3e-6, 'Wyel':41e-6, 'Wypl':48.3e-6, 'iy':25.4e-3, 'It':3300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X2-1/2X_188']= {'nmb':'HSS5X2-1/2X_188', 'P':13.1, 'A':1550e-6, 'h':127e-3, 'b':63.5e-3, 'e':4.76e-3, 'Iz':3.13e-6, 'Wzel':49.3e-6, 'Wzpl':62.1e-6, 'iz':45e-3, 'Iy':1.05e-6, 'Wyel':33.3e-6, 'Wypl':38.2e-6, 'iy':25.9e-3, 'It':2610e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X2-1/2X_125']= {'nmb':'HSS5X2-1/2X_125', 'P':8.96, 'A':1060e-6, 'h':127e-3, 'b':63.5e-3, 'e':3.18e-3, 'Iz':2.22e-6, 'Wzel':35.1e-6, 'Wzpl':43.4e-6, 'iz':45.7e-3, 'Iy':0.758e-6, 'Wyel':23.9e-6, 'Wypl':26.9e-6, 'iy':26.7e-3, 'It':1830e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X2X_375']= {'nmb':'HSS5X2X_375', 'P':21.8, 'A':2640e-6, 'h':127e-3, 'b':50.8e-3, 'e':9.53e-3, 'Iz':4.33e-6, 'Wzel':67.8e-6, 'Wzpl':93.6e-6, 'iz':40.4e-3, 'Iy':0.949e-6, 'Wyel':37.4e-6, 'Wypl':47.2e-6, 'iy':19e-3, 'It':2750e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X2X_313']= {'nmb':'HSS5X2X_313', 'P':18.8, 'A':2270e-6, 'h':127e-3, 'b':50.8e-3, 'e':7.94e-3, 'Iz':3.89e-6, 'Wzel':61.3e-6, 'Wzpl':82.8e-6, 'iz':41.4e-3, 'Iy':0.874e-6, 'Wyel':34.4e-6, 'Wypl':42.1e-6, 'iy':19.6e-3, 'It':2490e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X2X_250']= {'nmb':'HSS5X2X_250', 'P':15.6, 'A':1880e-6, 'h':127e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':3.36e-6, 'Wzel':52.9e-6, 'Wzpl':70e-6, 'iz':42.4e-3, 'Iy':0.766e-6, 'Wyel':30.2e-6, 'Wypl':36.1e-6, 'iy':20.2e-3, 'It':2150e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X2X_188']= {'nmb':'HSS5X2X_188', 'P':12.1, 'A':1450e-6, 'h':127e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':2.71e-6, 'Wzel':42.6e-6, 'Wzpl':55.2e-6, 'iz':43.2e-3, 'Iy':0.629e-6, 'Wyel':24.7e-6, 'Wypl':28.7e-6, 'iy':20.9e-3, 'It':1730e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS5X2X_125']= {'nmb':'HSS5X2X_125', 'P':8.33, 'A':994e-6, 'h':127e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':1.94e-6, 'Wzel':30.5e-6, 'Wzpl':38.8e-6, 'iz':44.2e-3, 'Iy':0.458e-6, 'Wyel':18e-6, 'Wypl':20.3e-6, 'iy':21.5e-3, 'It':1230e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4-1/2X4-1/2X_500']= {'nmb':'HSS4-1/2X4-1/2X_500', 'P':37.1, 'A':4480e-6, 'h':114e-3, 'b':114e-3, 'e':12.7e-3, 'Iz':7.53e-6, 'Wzel':132e-6, 'Wzpl':167e-6, 'iz':40.9e-3, 'Iy':7.53e-6, 'Wyel':132e-6, 'Wypl':167e-6, 'iy':40.9e-3, 'It':13000e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4-1/2X4-1/2X_375']= {'nmb':'HSS4-1/2X4-1/2X_375', 'P':29.4, 'A':3540e-6, 'h':114e-3, 'b':114e-3, 'e':9.53e-3, 'Iz':6.37e-6, 'Wzel':111e-6, 'Wzpl':137e-6, 'iz':42.4e-3, 'Iy':6.37e-6, 'Wyel':111e-6, 'Wypl':137e-6, 'iy':42.4e-3, 'It':10700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4-1/2X4-1/2X_313']= {'nmb':'HSS4-1/2X4-1/2X_313', 'P':25.2, 'A':3020e-6, 'h':114e-3, 'b':114e-3, 'e':7.94e-3, 'Iz':5.62e-6, 'Wzel':98.3e-6, 'Wzpl':119e-6, 'iz':43.2e-3, 'Iy':5.62e-6, 'Wyel':98.3e-6, 'Wypl':119e-6, 'iy':43.2e-3, 'It':9280e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4-1/2X4-1/2X_250']= {'nmb':'HSS4-1/2X4-1/2X_250', 'P':20.7, 'A':2480e-6, 'h':114e-3, 'b':114e-3, 'e':6.35e-3, 'Iz':4.75e-6, 'Wzel':83.2e-6, 'Wzpl':99.3e-6, 'iz':43.9e-3, 'Iy':4.75e-6, 'Wyel':83.2e-6, 'Wypl':99.3e-6, 'iy':43.9e-3, 'It':7700e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4-1/2X4-1/2X_188']= {'nmb':'HSS4-1/2X4-1/2X_188', 'P':15.9, 'A':1890e-6, 'h':114e-3, 'b':114e-3, 'e':4.76e-3, 'Iz':3.75e-6, 'Wzel':65.7e-6, 'Wzpl':77.2e-6, 'iz':44.5e-3, 'Iy':3.75e-6, 'Wyel':65.7e-6, 'Wypl':77.2e-6, 'iy':44.5e-3, 'It':5990e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4-1/2X4-1/2X_125']= {'nmb':'HSS4-1/2X4-1/2X_125', 'P':10.9, 'A':1290e-6, 'h':114e-3, 'b':114e-3, 'e':3.18e-3, 'Iz':2.64e-6, 'Wzel':46.2e-6, 'Wzpl':53.6e-6, 'iz':45.2e-3, 'Iy':2.64e-6, 'Wyel':46.2e-6, 'Wypl':53.6e-6, 'iy':45.2e-3, 'It':4130e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X4X_500']= {'nmb':'HSS4X4X_500', 'P':32, 'A':3880e-6, 'h':102e-3, 'b':102e-3, 'e':12.7e-3, 'Iz':4.95e-6, 'Wzel':97.8e-6, 'Wzpl':126e-6, 'iz':35.8e-3, 'Iy':4.95e-6, 'Wyel':97.8e-6, 'Wypl':126e-6, 'iy':35.8e-3, 'It':8740e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X4X_375']= {'nmb':'HSS4X4X_375', 'P':25.6, 'A':3080e-6, 'h':102e-3, 'b':102e-3, 'e':9.53e-3, 'Iz':4.29e-6, 'Wzel':84.1e-6, 'Wzpl':105e-6, 'iz':37.3e-3, 'Iy':4.29e-6, 'Wyel':84.1e-6, 'Wypl':105e-6, 'iy':37.3e-3, 'It':7280e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X4X_313']= {'nmb':'HSS4X4X_313', 'P':22, 'A':2650e-6, 'h':102e-3, 'b':102e-3, 'e':7.94e-3, 'Iz':3.8e-6, 'Wzel':74.9e-6, 'Wzpl':91.6e-6, 'iz':37.8e-3, 'Iy':3.8e-6, 'Wyel':74.9e-6, 'Wypl':91.6e-6, 'iy':37.8e-3, 'It':6370e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X4X_250']= {'nmb':'HSS4X4X_250', 'P':18.1, 'A':2170e-6, 'h':102e-3, 'b':102e-3, 'e':6.35e-3, 'Iz':3.25e-6, 'Wzel':63.9e-6, 'Wzpl':76.9e-6, 'iz':38.6e-3, 'Iy':3.25e-6, 'Wyel':63.9e-6, 'Wypl':76.9e-6, 'iy':38.6e-3, 'It':5330e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X4X_188']= {'nmb':'HSS4X4X_188', 'P':14, 'A':1660e-6, 'h':102e-3, 'b':102e-3, 'e':4.76e-3, 'Iz':2.58e-6, 'Wzel':50.8e-6, 'Wzpl':60.1e-6, 'iz':39.4e-3, 'Iy':2.58e-6, 'Wyel':50.8e-6, 'Wypl':60.1e-6, 'iy':39.4e-3, 'It':4160e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X4X_125']= {'nmb':'HSS4X4X_125', 'P':9.59, 'A':1140e-6, 'h':102e-3, 'b':102e-3, 'e':3.18e-3, 'Iz':1.83e-6, 'Wzel':36.1e-6, 'Wzpl':42e-6, 'iz':40.1e-3, 'Iy':1.83e-6, 'Wyel':36.1e-6, 'Wypl':42e-6, 'iy':40.1e-3, 'It':2880e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X3X_375']= {'nmb':'HSS4X3X_375', 'P':21.8, 'A':2640e-6, 'h':102e-3, 'b':76.2e-3, 'e':9.53e-3, 'Iz':3.3e-6, 'Wzel':65.1e-6, 'Wzpl':83.9e-6, 'iz':35.3e-3, 'Iy':2.09e-6, 'Wyel':54.7e-6, 'Wypl':68.5e-6, 'iy':28.2e-3, 'It':4410e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X3X_313']= {'nmb':'HSS4X3X_313', 'P':18.8, 'A':2270e-6, 'h':102e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':2.97e-6, 'Wzel':58.5e-6, 'Wzpl':73.9e-6, 'iz':36.1e-3, 'Iy':1.88e-6, 'Wyel':49.5e-6, 'Wypl':60.5e-6, 'iy':28.7e-3, 'It':3920e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X3X_250']= {'nmb':'HSS4X3X_250', 'P':15.6, 'A':1880e-6, 'h':102e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':2.56e-6, 'Wzel':50.3e-6, 'Wzpl':62.4e-6, 'iz':36.8e-3, 'Iy':1.63e-6, 'Wyel':42.8e-6, 'Wypl':51.1e-6, 'iy':29.5e-3, 'It':3310e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X3X_188']= {'nmb':'HSS4X3X_188', 'P':12.1, 'A':1450e-6, 'h':102e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':2.05e-6, 'Wzel':40.5e-6, 'Wzpl':49.2e-6, 'iz':37.8e-3, 'Iy':1.32e-6, 'Wyel':34.4e-6, 'Wypl':40.3e-6, 'iy':30.2e-3, 'It':2610e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X3X_125']= {'nmb':'HSS4X3X_125', 'P':8.33, 'A':994e-6, 'h':102e-3, 'b':76.2e-3, 'e':3.18e-3, 'Iz':1.47e-6, 'Wzel':28.8e-6, 'Wzpl':34.6e-6, 'iz':38.6e-3, 'Iy':0.945e-6, 'Wyel':24.7e-6, 'Wypl':28.3e-6, 'iy':30.7e-3, 'It':1820e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2-1/2X_375']= {'nmb':'HSS4X2-1/2X_375', 'P':19.9, 'A':2410e-6, 'h':102e-3, 'b':63.5e-3, 'e':9.53e-3, 'Iz':2.82e-6, 'Wzel':55.4e-6, 'Wzpl':73.4e-6, 'iz':34.3e-3, 'Iy':1.32e-6, 'Wyel':41.6e-6, 'Wypl':52.4e-6, 'iy':23.4e-3, 'It':3150e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2-1/2X_313']= {'nmb':'HSS4X2-1/2X_313', 'P':17.3, 'A':2080e-6, 'h':102e-3, 'b':63.5e-3, 'e':7.94e-3, 'Iz':2.55e-6, 'Wzel':50.3e-6, 'Wzpl':65.1e-6, 'iz':35.1e-3, 'Iy':1.2e-6, 'Wyel':38e-6, 'Wypl':46.7e-6, 'iy':24.1e-3, 'It':2820e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2-1/2X_250']= {'nmb':'HSS4X2-1/2X_250', 'P':14.3, 'A':1720e-6, 'h':102e-3, 'b':63.5e-3, 'e':6.35e-3, 'Iz':2.21e-6, 'Wzel':43.6e-6, 'Wzpl':55.4e-6, 'iz':35.8e-3, 'Iy':1.05e-6, 'Wyel':33.1e-6, 'Wypl':39.8e-6, 'iy':24.7e-3, 'It':2410e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2-1/2X_188']= {'nmb':'HSS4X2-1/2X_188', 'P':11.2, 'A':1330e-6, 'h':102e-3, 'b':63.5e-3, 'e':4.76e-3, 'Iz':1.79e-6, 'Wzel':35.2e-6, 'Wzpl':43.8e-6, 'iz':36.6e-3, 'Iy':0.857e-6, 'Wyel':27e-6, 'Wypl':31.6e-6, 'iy':25.4e-3, 'It':1910e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2-1/2X_125']= {'nmb':'HSS4X2-1/2X_125', 'P':7.7, 'A':916e-6, 'h':102e-3, 'b':63.5e-3, 'e':3.18e-3, 'Iz':1.29e-6, 'Wzel':25.2e-6, 'Wzpl':30.8e-6, 'iz':37.3e-3, 'Iy':0.62e-6, 'Wyel':19.5e-6, 'Wypl':22.3e-6, 'iy':26.2e-3, 'It':1340e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2X_375']= {'nmb':'HSS4X2X_375', 'P':18, 'A':2190e-6, 'h':102e-3, 'b':50.8e-3, 'e':9.53e-3, 'Iz':2.33e-6, 'Wzel':45.9e-6, 'Wzpl':62.9e-6, 'iz':32.8e-3, 'Iy':0.749e-6, 'Wyel':29.5e-6, 'Wypl':37.9e-6, 'iy':18.5e-3, 'It':2010e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2X_313']= {'nmb':'HSS4X2X_313', 'P':15.7, 'A':1900e-6, 'h':102e-3, 'b':50.8e-3, 'e':7.94e-3, 'Iz':2.14e-6, 'Wzel':42e-6, 'Wzpl':56.2e-6, 'iz':33.5e-3, 'Iy':0.695e-6, 'Wyel':27.4e-6, 'Wypl':34.1e-6, 'iy':19.2e-3, 'It':1830e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2X_250']= {'nmb':'HSS4X2X_250', 'P':13.1, 'A':1570e-6, 'h':102e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':1.87e-6, 'Wzel':36.9e-6, 'Wzpl':48.2e-6, 'iz':34.5e-3, 'Iy':0.616e-6, 'Wyel':24.3e-6, 'Wypl':29.3e-6, 'iy':19.8e-3, 'It':1590e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2X_188']= {'nmb':'HSS4X2X_188', 'P':10.2, 'A':1220e-6, 'h':102e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':1.52e-6, 'Wzel':30e-6, 'Wzpl':38.3e-6, 'iz':35.3e-3, 'Iy':0.508e-6, 'Wyel':20e-6, 'Wypl':23.4e-6, 'iy':20.4e-3, 'It':1280e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS4X2X_125']= {'nmb':'HSS4X2X_125', 'P':7.06, 'A':839e-6, 'h':102e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':1.1e-6, 'Wzel':21.6e-6, 'Wzpl':27.2e-6, 'iz':36.3e-3, 'Iy':0.374e-6, 'Wyel':14.7e-6, 'Wypl':16.7e-6, 'iy':21.1e-3, 'It':916e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X3-1/2X_375']= {'nmb':'HSS3-1/2X3-1/2X_375', 'P':21.8, 'A':2640e-6, 'h':88.9e-3, 'b':88.9e-3, 'e':9.53e-3, 'Iz':2.7e-6, 'Wzel':60.8e-6, 'Wzpl':76.9e-6, 'iz':32e-3, 'Iy':2.7e-6, 'Wyel':60.8e-6, 'Wypl':76.9e-6, 'iy':32e-3, 'It':4660e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X3-1/2X_313']= {'nmb':'HSS3-1/2X3-1/2X_313', 'P':18.8, 'A':2270e-6, 'h':88.9e-3, 'b':88.9e-3, 'e':7.94e-3, 'Iz':2.43e-6, 'Wzel':54.7e-6, 'Wzpl':67.8e-6, 'iz':32.8e-3, 'Iy':2.43e-6, 'Wyel':54.7e-6, 'Wypl':67.8e-6, 'iy':32.8e-3, 'It':4120e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X3-1/2X_250']= {'nmb':'HSS3-1/2X3-1/2X_250', 'P':15.6, 'A':1880e-6, 'h':88.9e-3, 'b':88.9e-3, 'e':6.35e-3, 'Iz':2.1e-6, 'Wzel':47.2e-6, 'Wzpl':57.4e-6, 'iz':33.5e-3, 'Iy':2.1e-6, 'Wyel':47.2e-6, 'Wypl':57.4e-6, 'iy':33.5e-3, 'It':3480e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X3-1/2X188']= {'nmb':'HSS3-1/2X3-1/2X188', 'P':12.1, 'A':1450e-6, 'h':88.9e-3, 'b':88.9e-3, 'e':4.76e-3, 'Iz':1.69e-6, 'Wzel':37.9e-6, 'Wzpl':45.2e-6, 'iz':34.3e-3, 'Iy':1.69e-6, 'Wyel':37.9e-6, 'Wypl':45.2e-6, 'iy':34.3e-3, 'It':2730e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X3-1/2X_125']= {'nmb':'HSS3-1/2X3-1/2X_125', 'P':8.33, 'A':994e-6, 'h':88.9e-3, 'b':88.9e-3, 'e':3.18e-3, 'Iz':1.21e-6, 'Wzel':27.2e-6, 'Wzpl':31.6e-6, 'iz':34.8e-3, 'Iy':1.21e-6, 'Wyel':27.2e-6, 'Wypl':31.6e-6, 'iy':34.8e-3, 'It':1910e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X2-1/2X_375']= {'nmb':'HSS3-1/2X2-1/2X_375', 'P':18, 'A':2190e-6, 'h':88.9e-3, 'b':63.5e-3, 'e':9.53e-3, 'Iz':1.98e-6, 'Wzel':44.5e-6, 'Wzpl':58.8e-6, 'iz':30.1e-3, 'Iy':1.15e-6, 'Wyel':36.3e-6, 'Wypl':46.3e-6, 'iy':23e-3, 'It':2560e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X2-1/2X_313']= {'nmb':'HSS3-1/2X2-1/2X_313', 'P':15.6, 'A':1900e-6, 'h':88.9e-3, 'b':63.5e-3, 'e':7.94e-3, 'Iz':1.81e-6, 'Wzel':40.7e-6, 'Wzpl':52.5e-6, 'iz':30.9e-3, 'Iy':1.06e-6, 'Wyel':33.3e-6, 'Wypl':41.4e-6, 'iy':23.6e-3, 'It':2300e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X2-1/2X_250']= {'nmb':'HSS3-1/2X2-1/2X_250', 'P':13.1, 'A':1570e-6, 'h':88.9e-3, 'b':63.5e-3, 'e':6.35e-3, 'Iz':1.58e-6, 'Wzel':35.5e-6, 'Wzpl':44.8e-6, 'iz':31.7e-3, 'Iy':0.928e-6, 'Wyel':29.2e-6, 'Wypl':35.4e-6, 'iy':24.3e-3, 'It':1980e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X2-1/2X_188']= {'nmb':'HSS3-1/2X2-1/2X_188', 'P':10.2, 'A':1220e-6, 'h':88.9e-3, 'b':63.5e-3, 'e':4.76e-3, 'Iz':1.29e-6, 'Wzel':28.9e-6, 'Wzpl':35.7e-6, 'iz':32.5e-3, 'Iy':0.76e-6, 'Wyel':23.9e-6, 'Wypl':28.3e-6, 'iy':25e-3, 'It':1570e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X2-1/2X_125']= {'nmb':'HSS3-1/2X2-1/2X_125', 'P':7.07, 'A':839e-6, 'h':88.9e-3, 'b':63.5e-3, 'e':3.18e-3, 'Iz':0.929e-6, 'Wzel':20.9e-6, 'Wzpl':25.3e-6, 'iz':33.2e-3, 'Iy':0.553e-6, 'Wyel':17.4e-6, 'Wypl':20.1e-6, 'iy':25.6e-3, 'It':1110e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X2X_250']= {'nmb':'HSS3-1/2X2X_250', 'P':11.8, 'A':1430e-6, 'h':88.9e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':1.32e-6, 'Wzel':29.7e-6, 'Wzpl':38.7e-6, 'iz':30.5e-3, 'Iy':0.541e-6, 'Wyel':21.3e-6, 'Wypl':25.9e-6, 'iy':19.5e-3, 'It':1320e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X2X_188']= {'nmb':'HSS3-1/2X2X_188', 'P':9.27, 'A':1100e-6, 'h':88.9e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':1.09e-6, 'Wzel':24.4e-6, 'Wzpl':31e-6, 'iz':31.2e-3, 'Iy':0.45e-6, 'Wyel':17.7e-6, 'Wypl':20.8e-6, 'iy':20.1e-3, 'It':1060e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X2X_125']= {'nmb':'HSS3-1/2X2X_125', 'P':6.43, 'A':768e-6, 'h':88.9e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':0.791e-6, 'Wzel':17.9e-6, 'Wzpl':22e-6, 'iz':32.3e-3, 'Iy':0.331e-6, 'Wyel':13e-6, 'Wypl':14.9e-6, 'iy':20.8e-3, 'It':762e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X1-1/2X_250']= {'nmb':'HSS3-1/2X1-1/2X_250', 'P':10.5, 'A':1270e-6, 'h':88.9e-3, 'b':38.1e-3, 'e':6.35e-3, 'Iz':1.06e-6, 'Wzel':23.9e-6, 'Wzpl':32.4e-6, 'iz':29e-3, 'Iy':0.266e-6, 'Wyel':13.9e-6, 'Wypl':17.4e-6, 'iy':14.5e-3, 'It':745e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X1-1/2X_188']= {'nmb':'HSS3-1/2X1-1/2X_188', 'P':8.31, 'A':994e-6, 'h':88.9e-3, 'b':38.1e-3, 'e':4.76e-3, 'Iz':0.882e-6, 'Wzel':19.8e-6, 'Wzpl':26.2e-6, 'iz':29.7e-3, 'Iy':0.226e-6, 'Wyel':11.9e-6, 'Wypl':14.2e-6, 'iy':15.1e-3, 'It':620e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3-1/2X1-1/2X_125']= {'nmb':'HSS3-1/2X1-1/2X_125', 'P':5.8, 'A':690e-6, 'h':88.9e-3, 'b':38.1e-3, 'e':3.18e-3, 'Iz':0.653e-6, 'Wzel':14.7e-6, 'Wzpl':18.8e-6, 'iz':30.7e-3, 'Iy':0.171e-6, 'Wyel':8.98e-6, 'Wypl':10.3e-6, 'iy':15.7e-3, 'It':454e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X3X_375']= {'nmb':'HSS3X3X_375', 'P':18, 'A':2190e-6, 'h':76.2e-3, 'b':76.2e-3, 'e':9.53e-3, 'Iz':1.57e-6, 'Wzel':41.3e-6, 'Wzpl':53.3e-6, 'iz':26.9e-3, 'Iy':1.57e-6, 'Wyel':41.3e-6, 'Wypl':53.3e-6, 'iy':26.9e-3, 'It':2760e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X3X_313']= {'nmb':'HSS3X3X_313', 'P':15.7, 'A':1900e-6, 'h':76.2e-3, 'b':76.2e-3, 'e':7.94e-3, 'Iz':1.44e-6, 'Wzel':37.7e-6, 'Wzpl':47.5e-6, 'iz':27.4e-3, 'Iy':1.44e-6, 'Wyel':37.7e-6, 'Wypl':47.5e-6, 'iy':27.4e-3, 'It':2470e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X3X_250']= {'nmb':'HSS3X3X_250', 'P':13.1, 'A':1570e-6, 'h':76.2e-3, 'b':76.2e-3, 'e':6.35e-3, 'Iz':1.26e-6, 'Wzel':32.9e-6, 'Wzpl':40.6e-6, 'iz':28.2e-3, 'Iy':1.26e-6, 'Wyel':32.9e-6, 'Wypl':40.6e-6, 'iy':28.2e-3, 'It':2110e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X3X_188']= {'nmb':'HSS3X3X_188', 'P':10.2, 'A':1220e-6, 'h':76.2e-3, 'b':76.2e-3, 'e':4.76e-3, 'Iz':1.02e-6, 'Wzel':26.9e-6, 'Wzpl':32.3e-6, 'iz':29e-3, 'Iy':1.02e-6, 'Wyel':26.9e-6, 'Wypl':32.3e-6, 'iy':29e-3, 'It':1680e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X3X_125']= {'nmb':'HSS3X3X_125', 'P':7.06, 'A':839e-6, 'h':76.2e-3, 'b':76.2e-3, 'e':3.18e-3, 'Iz':0.741e-6, 'Wzel':19.5e-6, 'Wzpl':22.9e-6, 'iz':29.7e-3, 'Iy':0.741e-6, 'Wyel':19.5e-6, 'Wypl':22.9e-6, 'iy':29.7e-3, 'It':1180e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X2-1/2X_313']= {'nmb':'HSS3X2-1/2X_313', 'P':14.1, 'A':1700e-6, 'h':76.2e-3, 'b':63.5e-3, 'e':7.94e-3, 'Iz':1.22e-6, 'Wzel':31.8e-6, 'Wzpl':41.1e-6, 'iz':26.7e-3, 'Iy':0.907e-6, 'Wyel':28.5e-6, 'Wypl':36.1e-6, 'iy':23.1e-3, 'It':1810e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X2-1/2X_250']= {'nmb':'HSS3X2-1/2X_250', 'P':11.8, 'A':1430e-6, 'h':76.2e-3, 'b':63.5e-3, 'e':6.35e-3, 'Iz':1.07e-6, 'Wzel':28.2e-6, 'Wzpl':35.4e-6, 'iz':27.4e-3, 'Iy':0.803e-6, 'Wyel':25.2e-6, 'Wypl':31.1e-6, 'iy':23.7e-3, 'It':1560e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X2-1/2X_188']= {'nmb':'HSS3X2-1/2X_188', 'P':9.27, 'A':1100e-6, 'h':76.2e-3, 'b':63.5e-3, 'e':4.76e-3, 'Iz':0.878e-6, 'Wzel':23.1e-6, 'Wzpl':28.3e-6, 'iz':28.2e-3, 'Iy':0.662e-6, 'Wyel':20.8e-6, 'Wypl':24.9e-6, 'iy':24.5e-3, 'It':1250e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X2-1/2X_125']= {'nmb':'HSS3X2-1/2X_125', 'P':6.43, 'A':768e-6, 'h':76.2e-3, 'b':63.5e-3, 'e':3.18e-3, 'Iz':0.641e-6, 'Wzel':16.9e-6, 'Wzpl':20.2e-6, 'iz':29e-3, 'Iy':0.483e-6, 'Wyel':15.3e-6, 'Wypl':17.9e-6, 'iy':25.1e-3, 'It':887e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X2X_313']= {'nmb':'HSS3X2X_313', 'P':12.5, 'A':1520e-6, 'h':76.2e-3, 'b':50.8e-3, 'e':7.94e-3, 'Iz':0.991e-6, 'Wzel':26.1e-6, 'Wzpl':34.6e-6, 'iz':25.7e-3, 'Iy':0.516e-6, 'Wyel':20.3e-6, 'Wypl':25.9e-6, 'iy':18.4e-3, 'It':1190e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X2X_250']= {'nmb':'HSS3X2X_250', 'P':10.5, 'A':1270e-6, 'h':76.2e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':0.887e-6, 'Wzel':23.3e-6, 'Wzpl':30e-6, 'iz':26.4e-3, 'Iy':0.462e-6, 'Wyel':18.2e-6, 'Wypl':22.6e-6, 'iy':19.1e-3, 'It':1050e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X2X_188']= {'nmb':'HSS3X2X_188', 'P':8.31, 'A':994e-6, 'h':76.2e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':0.737e-6, 'Wzel':19.3e-6, 'Wzpl':24.3e-6, 'iz':27.2e-3, 'Iy':0.388e-6, 'Wyel':15.3e-6, 'Wypl':18.4e-6, 'iy':19.8e-3, 'It':853e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X2X_125']= {'nmb':'HSS3X2X_125', 'P':5.8, 'A':690e-6, 'h':76.2e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':0.541e-6, 'Wzel':14.2e-6, 'Wzpl':17.4e-6, 'iz':27.9e-3, 'Iy':0.288e-6, 'Wyel':11.3e-6, 'Wypl':13.2e-6, 'iy':20.4e-3, 'It':612e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X1-1/2X_250']= {'nmb':'HSS3X1-1/2X_250', 'P':9.26, 'A':1120e-6, 'h':76.2e-3, 'b':38.1e-3, 'e':6.35e-3, 'Iz':0.699e-6, 'Wzel':18.4e-6, 'Wzpl':24.7e-6, 'iz':24.9e-3, 'Iy':0.226e-6, 'Wyel':11.9e-6, 'Wypl':14.9e-6, 'iy':14.2e-3, 'It':599e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X1-1/2X_188']= {'nmb':'HSS3X1-1/2X_188', 'P':7.36, 'A':884e-6, 'h':76.2e-3, 'b':38.1e-3, 'e':4.76e-3, 'Iz':0.591e-6, 'Wzel':15.5e-6, 'Wzpl':20.3e-6, 'iz':25.9e-3, 'Iy':0.194e-6, 'Wyel':10.2e-6, 'Wypl':12.3e-6, 'iy':14.8e-3, 'It':504e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X1-1/2X_125']= {'nmb':'HSS3X1-1/2X_125', 'P':5.16, 'A':617e-6, 'h':76.2e-3, 'b':38.1e-3, 'e':3.18e-3, 'Iz':0.441e-6, 'Wzel':11.6e-6, 'Wzpl':14.7e-6, 'iz':26.7e-3, 'Iy':0.148e-6, 'Wyel':7.77e-6, 'Wypl':9.01e-6, 'iy':15.5e-3, 'It':369e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X1X_188']= {'nmb':'HSS3X1X_188', 'P':6.41, 'A':768e-6, 'h':76.2e-3, 'b':25.4e-3, 'e':4.76e-3, 'Iz':0.445e-6, 'Wzel':11.7e-6, 'Wzpl':16.2e-6, 'iz':24.1e-3, 'Iy':0.072e-6, 'Wyel':5.65e-6, 'Wypl':7.08e-6, 'iy':9.65e-3, 'It':219e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS3X1X_125']= {'nmb':'HSS3X1X_125', 'P':4.53, 'A':542e-6, 'h':76.2e-3, 'b':25.4e-3, 'e':3.18e-3, 'Iz':0.34e-6, 'Wzel':8.93e-6, 'Wzpl':11.9e-6, 'iz':25.1e-3, 'Iy':0.0574e-6, 'Wyel':4.52e-6, 'Wypl':5.33e-6, 'iy':10.3e-3, 'It':170e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X2-1/2X_313']= {'nmb':'HSS2-1/2X2-1/2X_313', 'P':12.5, 'A':1520e-6, 'h':63.5e-3, 'b':63.5e-3, 'e':7.94e-3, 'Iz':0.758e-6, 'Wzel':23.9e-6, 'Wzpl':30.8e-6, 'iz':22.4e-3, 'Iy':0.758e-6, 'Wyel':23.9e-6, 'Wypl':30.8e-6, 'iy':22.4e-3, 'It':1330e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X2-1/2X_250']= {'nmb':'HSS2-1/2X2-1/2X_250', 'P':10.5, 'A':1270e-6, 'h':63.5e-3, 'b':63.5e-3, 'e':6.35e-3, 'Iz':0.678e-6, 'Wzel':21.3e-6, 'Wzpl':26.7e-6, 'iz':23.1e-3, 'Iy':0.678e-6, 'Wyel':21.3e-6, 'Wypl':26.7e-6, 'iy':23.1e-3, 'It':1160e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X2-1/2X_188']= {'nmb':'HSS2-1/2X2-1/2X_188', 'P':8.3, 'A':994e-6, 'h':63.5e-3, 'b':63.5e-3, 'e':4.76e-3, 'Iz':0.562e-6, 'Wzel':17.7e-6, 'Wzpl':21.6e-6, 'iz':23.8e-3, 'Iy':0.562e-6, 'Wyel':17.7e-6, 'Wypl':21.6e-6, 'iy':23.8e-3, 'It':937e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X2-1/2X_125']= {'nmb':'HSS2-1/2X2-1/2X_125', 'P':5.8, 'A':690e-6, 'h':63.5e-3, 'b':63.5e-3, 'e':3.18e-3, 'Iz':0.415e-6, 'Wzel':13.1e-6, 'Wzpl':15.5e-6, 'iz':24.5e-3, 'Iy':0.415e-6, 'Wyel':13.1e-6, 'Wypl':15.5e-6, 'iy':24.5e-3, 'It':670e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X2X_250']= {'nmb':'HSS2-1/2X2X_250', 'P':9.26, 'A':1120e-6, 'h':63.5e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':0.554e-6, 'Wzel':17.4e-6, 'Wzpl':22.5e-6, 'iz':22.2e-3, 'Iy':0.387e-6, 'Wyel':15.2e-6, 'Wypl':19.2e-6, 'iy':18.6e-3, 'It':791e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X2X_188']= {'nmb':'HSS2-1/2X2X_188', 'P':7.36, 'A':884e-6, 'h':63.5e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':0.466e-6, 'Wzel':14.7e-6, 'Wzpl':18.4e-6, 'iz':23e-3, 'Iy':0.327e-6, 'Wyel':12.9e-6, 'Wypl':15.7e-6, 'iy':19.3e-3, 'It':645e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X2X_125']= {'nmb':'HSS2-1/2X2X_125', 'P':5.16, 'A':617e-6, 'h':63.5e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':0.347e-6, 'Wzel':10.9e-6, 'Wzpl':13.3e-6, 'iz':23.7e-3, 'Iy':0.245e-6, 'Wyel':9.65e-6, 'Wypl':11.4e-6, 'iy':19.9e-3, 'It':466e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X1-1/2X_250']= {'nmb':'HSS2-1/2X1-1/2X_250', 'P':8, 'A':974e-6, 'h':63.5e-3, 'b':38.1e-3, 'e':6.35e-3, 'Iz':0.429e-6, 'Wzel':13.5e-6, 'Wzpl':18.2e-6, 'iz':21e-3, 'Iy':0.187e-6, 'Wyel':9.82e-6, 'Wypl':12.5e-6, 'iy':13.9e-3, 'It':458e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X1-1/2X_188']= {'nmb':'HSS2-1/2X1-1/2X_188', 'P':6.41, 'A':768e-6, 'h':63.5e-3, 'b':38.1e-3, 'e':4.76e-3, 'Iz':0.367e-6, 'Wzel':11.6e-6, 'Wzpl':15e-6, 'iz':21.8e-3, 'Iy':0.162e-6, 'Wyel':8.52e-6, 'Wypl':10.4e-6, 'iy':14.5e-3, 'It':387e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X1-1/2X_125']= {'nmb':'HSS2-1/2X1-1/2X_125', 'P':4.53, 'A':542e-6, 'h':63.5e-3, 'b':38.1e-3, 'e':3.18e-3, 'Iz':0.278e-6, 'Wzel':8.77e-6, 'Wzpl':11e-6, 'iz':22.7e-3, 'Iy':0.125e-6, 'Wyel':6.54e-6, 'Wypl':7.69e-6, 'iy':15.2e-3, 'It':286e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X1X_188']= {'nmb':'HSS2-1/2X1X_188', 'P':5.46, 'A':658e-6, 'h':63.5e-3, 'b':25.4e-3, 'e':4.76e-3, 'Iz':0.269e-6, 'Wzel':8.47e-6, 'Wzpl':11.7e-6, 'iz':20.2e-3, 'Iy':0.0595e-6, 'Wyel':4.67e-6, 'Wypl':5.9e-6, 'iy':9.5e-3, 'It':171e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/2X1X_125']= {'nmb':'HSS2-1/2X1X_125', 'P':3.9, 'A':467e-6, 'h':63.5e-3, 'b':25.4e-3, 'e':3.18e-3, 'Iz':0.209e-6, 'Wzel':6.6e-6, 'Wzpl':8.72e-6, 'iz':21.2e-3, 'Iy':0.0479e-6, 'Wyel':3.77e-6, 'Wypl':4.49e-6, 'iy':10.1e-3, 'It':134e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/4X2-1/4X_250']= {'nmb':'HSS2-1/4X2-1/4X_250', 'P':9.26, 'A':1120e-6, 'h':57.2e-3, 'b':57.2e-3, 'e':6.35e-3, 'Iz':0.47e-6, 'Wzel':16.6e-6, 'Wzpl':21e-6, 'iz':20.5e-3, 'Iy':0.47e-6, 'Wyel':16.6e-6, 'Wypl':21e-6, 'iy':20.5e-3, 'It':816e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/4X2-1/4X_188']= {'nmb':'HSS2-1/4X2-1/4X_188', 'P':7.35, 'A':884e-6, 'h':57.2e-3, 'b':57.2e-3, 'e':4.76e-3, 'Iz':0.397e-6, 'Wzel':13.9e-6, 'Wzpl':17e-6, 'iz':21.2e-3, 'Iy':0.397e-6, 'Wyel':13.9e-6, 'Wypl':17e-6, 'iy':21.2e-3, 'It':666e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/4X2-1/4X_125']= {'nmb':'HSS2-1/4X2-1/4X_125', 'P':5.16, 'A':617e-6, 'h':57.2e-3, 'b':57.2e-3, 'e':3.18e-3, 'Iz':0.296e-6, 'Wzel':10.4e-6, 'Wzpl':12.4e-6, 'iz':21.9e-3, 'Iy':0.296e-6, 'Wyel':10.4e-6, 'Wypl':12.4e-6, 'iy':21.9e-3, 'It':479e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/4X2X_188']= {'nmb':'HSS2-1/4X2X_188', 'P':6.89, 'A':826e-6, 'h':57.2e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':0.358e-6, 'Wzel':12.5e-6, 'Wzpl':15.6e-6, 'iz':20.8e-3, 'Iy':0.297e-6, 'Wyel':11.7e-6, 'Wypl':14.4e-6, 'iy':19e-3, 'It':549e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2-1/4X2X_125']= {'nmb':'HSS2-1/4X2X_125', 'P':4.85, 'A':579e-6, 'h':57.2e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':0.269e-6, 'Wzel':9.41e-6, 'Wzpl':11.4e-6, 'iz':21.5e-3, 'Iy':0.224e-6, 'Wyel':8.82e-6, 'Wypl':10.5e-6, 'iy':19.7e-3, 'It':398e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2X2X_250']= {'nmb':'HSS2X2X_250', 'P':8, 'A':974e-6, 'h':50.8e-3, 'b':50.8e-3, 'e':6.35e-3, 'Iz':0.311e-6, 'Wzel':12.2e-6, 'Wzpl':15.8e-6, 'iz':17.9e-3, 'Iy':0.311e-6, 'Wyel':12.2e-6, 'Wypl':15.8e-6, 'iy':17.9e-3, 'It':545e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2X2X_188']= {'nmb':'HSS2X2X_188', 'P':6.4, 'A':768e-6, 'h':50.8e-3, 'b':50.8e-3, 'e':4.76e-3, 'Iz':0.267e-6, 'Wzel':10.5e-6, 'Wzpl':13.1e-6, 'iz':18.6e-3, 'Iy':0.267e-6, 'Wyel':10.5e-6, 'Wypl':13.1e-6, 'iy':18.6e-3, 'It':454e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2X2X_125']= {'nmb':'HSS2X2X_125', 'P':4.53, 'A':542e-6, 'h':50.8e-3, 'b':50.8e-3, 'e':3.18e-3, 'Iz':0.202e-6, 'Wzel':7.96e-6, 'Wzpl':9.57e-6, 'iz':19.3e-3, 'Iy':0.202e-6, 'Wyel':7.96e-6, 'Wypl':9.57e-6, 'iy':19.3e-3, 'It':331e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2X1-1/2X_188']= {'nmb':'HSS2X1-1/2X_188', 'P':5.46, 'A':658e-6, 'h':50.8e-3, 'b':38.1e-3, 'e':4.76e-3, 'Iz':0.206e-6, 'Wzel':8.11e-6, 'Wzpl':10.5e-6, 'iz':17.7e-3, 'Iy':0.13e-6, 'Wyel':6.83e-6, 'Wypl':8.54e-6, 'iy':14.1e-3, 'It':276e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2X1-1/2X_125']= {'nmb':'HSS2X1-1/2X_125', 'P':3.9, 'A':467e-6, 'h':50.8e-3, 'b':38.1e-3, 'e':3.18e-3, 'Iz':0.159e-6, 'Wzel':6.28e-6, 'Wzpl':7.78e-6, 'iz':18.5e-3, 'Iy':0.102e-6, 'Wyel':5.33e-6, 'Wypl':6.37e-6, 'iy':14.8e-3, 'It':206e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2X1X_188']= {'nmb':'HSS2X1X_188', 'P':4.51, 'A':545e-6, 'h':50.8e-3, 'b':25.4e-3, 'e':4.76e-3, 'Iz':0.146e-6, 'Wzel':5.74e-6, 'Wzpl':7.87e-6, 'iz':16.3e-3, 'Iy':0.0466e-6, 'Wyel':3.69e-6, 'Wypl':4.72e-6, 'iy':9.27e-3, 'It':125e-9, 'E':2.1e+11, 'nu':0.3}
-HSS['HSS2X1X_125']= {'nmb':'HSS2X1X_125', 'P':3.26, 'A':392e-6, 'h':50.8e-3, 'b':25.4e-3, 'e':3.18e-3, 'Iz':0.117e-6, 'Wzel':4.59e-6, 'Wzpl':6e-6, 'iz':17.2e-3, 'Iy':0.0384e-6, 'Wyel':3.02e-6, 'Wypl':3.65e-6, 'iy':9.91e-3, 'It':99.1e-9, 'E':2.1e+11, 'nu':0.3}
 
-for item in HSS:
-  shape= HSS[item]
+def setHSSDerivedValues(shape):
+  '''Compute the properties of the HSS shapes that are not in the table.'''
   shape['alpha']= 5/12
   shape['G']= shape['E']/(2*(1+shape['nu']))
   shape['AreaQz']= 2*0.7*shape['h']*shape['e']
   shape['AreaQy']= shape['AreaQz']
+
+HSS= shape_table.ShapeTable('aisc_HSS',setHSSDerivedValues)
@@ -8,6 +8,8 @@ __email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
 
 import math
 
+from materials.sections.structural_shapes import shape_table
+
 ''' ARCELOR's structural steel shapes (metric units).'''
 
 # European I beams
@@ -54,62 +56,9 @@ import math
     nu: modulus of Poisson
 '''
 
-IPE= {}
-
-IPE['IPE_A_100']= {'nmb':'IPE_A_100', 'P':6.9, 'h':98e-3, 'b':55e-3, 'tw':3.6e-3, 'tf':4.7e-3, 'r':7e-3, 'A':8.78e-4, 'hi':88.6e-3, 'd':74.6e-3, 'FI':'-', 'Pmin':0e-3, 'Pmax':0e-3, 'AL':0.397, 'AG':57.57, 'Iz':141.2e-8, 'Wzel':28.81e-6, 'Wzpl':32.98e-6, 'iz':4.01e-2, 'Avy':4.44e-4, 'Iy':13.12e-8, 'Wyel':4.77e-6, 'Wypl':7.54e-6, 'iy':1.22e-2, 'Ss':21.2e-3, 'It':0.77e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_100']= {'nmb':'IPE_100', 'P':8.1, 'h':100e-3, 'b':55e-3, 'tw':4.1e-3, 'tf':5.7e-3, 'r':7e-3, 'A':10.32e-4, 'hi':88.6e-3, 'd':74.6e-3, 'FI':'-', 'Pmin':0e-3, 'Pmax':0e-3, 'AL':0.4, 'AG':49.33, 'Iz':171e-8, 'Wzel':34.2e-6, 'Wzpl':39.41e-6, 'iz':4.07e-2, 'Avy':5.08e-4, 'Iy':15.92e-8, 'Wyel':5.79e-6, 'Wypl':9.15e-6, 'iy':1.24e-2, 'Ss':23.7e-3, 'It':1.2e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_120']= {'nmb':'IPE_A_120', 'P':8.7, 'h':117.6e-3, 'b':64e-3, 'tw':3.8e-3, 'tf':5.1e-3, 'r':7e-3, 'A':11.03e-4, 'hi':107.4e-3, 'd':93.4e-3, 'FI':'-', 'Pmin':0e-3, 'Pmax':0e-3, 'AL':0.472, 'AG':54.47, 'Iz':257.4e-8, 'Wzel':43.77e-6, 'Wzpl':49.87e-6, 'iz':4.83e-2, 'Avy':5.41e-4, 'Iy':22.39e-8, 'Wyel':7e-6, 'Wypl':10.98e-6, 'iy':1.42e-2, 'Ss':22.2e-3, 'It':1.04e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_120']= {'nmb':'IPE_120', 'P':10.4, 'h':120e-3, 'b':64e-3, 'tw':4.4e-3, 'tf':6.3e-3, 'r':7e-3, 'A':13.21e-4, 'hi':107.4e-3, 'd':93.4e-3, 'FI':'-', 'Pmin':0e-3, 'Pmax':0e-3, 'AL':0.475, 'AG':45.82, 'Iz':317.8e-8, 'Wzel':52.96e-6, 'Wzpl':60.73e-6, 'iz':4.9e-2, 'Avy':6.31e-4, 'Iy':27.67e-8, 'Wyel':8.65e-6, 'Wypl':13.58e-6, 'iy':1.45e-2, 'Ss':25.2e-3, 'It':1.74e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_140']= {'nmb':'IPE_A_140', 'P':10.5, 'h':137.4e-3, 'b':73e-3, 'tw':3.8e-3, 'tf':5.6e-3, 'r':7e-3, 'A':13.39e-4, 'hi':126.2e-3, 'd':112.2e-3, 'FI':'-', 'Pmin':0e-3, 'Pmax':0e-3, 'AL':0.547, 'AG':52.05, 'Iz':434.9e-8, 'Wzel':63.3e-6, 'Wzpl':71.6e-6, 'iz':5.7e-2, 'Avy':6.21e-4, 'Iy':36.42e-8, 'Wyel':9.98e-6, 'Wypl':15.52e-6, 'iy':1.65e-2, 'Ss':23.2e-3, 'It':1.36e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_140']= {'nmb':'IPE_140', 'P':12.9, 'h':140e-3, 'b':73e-3, 'tw':4.7e-3, 'tf':6.9e-3, 'r':7e-3, 'A':16.43e-4, 'hi':126.2e-3, 'd':112.2e-3, 'FI':'-', 'Pmin':0e-3, 'Pmax':0e-3, 'AL':0.551, 'AG':42.7, 'Iz':541.2e-8, 'Wzel':77.32e-6, 'Wzpl':88.34e-6, 'iz':5.74e-2, 'Avy':7.64e-4, 'Iy':44.92e-8, 'Wyel':12.31e-6, 'Wypl':19.25e-6, 'iy':1.65e-2, 'Ss':26.7e-3, 'It':2.45e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_160']= {'nmb':'IPE_A_160', 'P':12.7, 'h':157e-3, 'b':82e-3, 'tw':4e-3, 'tf':5.9e-3, 'r':9e-3, 'A':16.18e-4, 'hi':145.2e-3, 'd':127.2e-3, 'FI':'-', 'Pmin':0e-3, 'Pmax':0e-3, 'AL':0.619, 'AG':48.7, 'Iz':689.3e-8, 'Wzel':87.81e-6, 'Wzpl':99.09e-6, 'iz':6.53e-2, 'Avy':7.8e-4, 'Iy':54.43e-8, 'Wyel':13.27e-6, 'Wypl':20.7e-6, 'iy':1.83e-2, 'Ss':26.34e-3, 'It':1.96e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_160']= {'nmb':'IPE_160', 'P':15.8, 'h':160e-3, 'b':82e-3, 'tw':5e-3, 'tf':7.4e-3, 'r':9e-3, 'A':20.09e-4, 'hi':145.2e-3, 'd':127.2e-3, 'FI':'-', 'Pmin':0e-3, 'Pmax':0e-3, 'AL':0.623, 'AG':39.47, 'Iz':869.3e-8, 'Wzel':108.7e-6, 'Wzpl':123.9e-6, 'iz':6.58e-2, 'Avy':9.66e-4, 'Iy':68.31e-8, 'Wyel':16.66e-6, 'Wypl':26.1e-6, 'iy':1.84e-2, 'Ss':30.34e-3, 'It':3.6e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_180']= {'nmb':'IPE_A_180', 'P':15.4, 'h':177e-3, 'b':91e-3, 'tw':4.3e-3, 'tf':6.5e-3, 'r':9e-3, 'A':19.58e-4, 'hi':164e-3, 'd':146e-3, 'FI':'M10', 'Pmin':48e-3, 'Pmax':48e-3, 'AL':0.694, 'AG':45.15, 'Iz':1063e-8, 'Wzel':120.1e-6, 'Wzpl':135.3e-6, 'iz':7.37e-2, 'Avy':9.2e-4, 'Iy':81.89e-8, 'Wyel':18e-6, 'Wypl':27.96e-6, 'iy':2.05e-2, 'Ss':27.84e-3, 'It':2.7e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_180']= {'nmb':'IPE_180', 'P':18.8, 'h':180e-3, 'b':91e-3, 'tw':5.3e-3, 'tf':8e-3, 'r':9e-3, 'A':23.95e-4, 'hi':164e-3, 'd':146e-3, 'FI':'M10', 'Pmin':48e-3, 'Pmax':48e-3, 'AL':0.698, 'AG':37.13, 'Iz':1317e-8, 'Wzel':146.3e-6, 'Wzpl':166.4e-6, 'iz':7.42e-2, 'Avy':11.25e-4, 'Iy':100.9e-8, 'Wyel':22.16e-6, 'Wypl':34.6e-6, 'iy':2.05e-2, 'Ss':31.84e-3, 'It':4.79e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_180+']= {'nmb':'IPE_O_180+', 'P':21.3, 'h':182e-3, 'b':92e-3, 'tw':6e-3, 'tf':9e-3, 'r':9e-3, 'A':27.1e-4, 'hi':164e-3, 'd':146e-3, 'FI':'M10', 'Pmin':50e-3, 'Pmax':50e-3, 'AL':0.705, 'AG':33.12, 'Iz':1505e-8, 'Wzel':165.4e-6, 'Wzpl':189.1e-6, 'iz':7.45e-2, 'Avy':12.7e-4, 'Iy':117.3e-8, 'Wyel':25.5e-6, 'Wypl':39.91e-6, 'iy':2.08e-2, 'Ss':34.54e-3, 'It':6.76e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_200']= {'nmb':'IPE_A_200', 'P':18.4, 'h':197e-3, 'b':100e-3, 'tw':4.5e-3, 'tf':7e-3, 'r':12e-3, 'A':23.47e-4, 'hi':183e-3, 'd':159e-3, 'FI':'M10', 'Pmin':54e-3, 'Pmax':58e-3, 'AL':0.764, 'AG':41.49, 'Iz':1591e-8, 'Wzel':161.6e-6, 'Wzpl':181.7e-6, 'iz':8.23e-2, 'Avy':11.47e-4, 'Iy':117.2e-8, 'Wyel':23.43e-6, 'Wypl':36.54e-6, 'iy':2.23e-2, 'Ss':32.56e-3, 'It':4.11e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_200']= {'nmb':'IPE_200', 'P':22.4, 'h':200e-3, 'b':100e-3, 'tw':5.6e-3, 'tf':8.5e-3, 'r':12e-3, 'A':28.48e-4, 'hi':183e-3, 'd':159e-3, 'FI':'M10', 'Pmin':54e-3, 'Pmax':58e-3, 'AL':0.768, 'AG':34.36, 'Iz':1943e-8, 'Wzel':194.3e-6, 'Wzpl':220.6e-6, 'iz':8.26e-2, 'Avy':14e-4, 'Iy':142.4e-8, 'Wyel':28.47e-6, 'Wypl':44.61e-6, 'iy':2.24e-2, 'Ss':36.66e-3, 'It':6.98e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_200+']= {'nmb':'IPE_O_200+', 'P':25.1, 'h':202e-3, 'b':102e-3, 'tw':6.2e-3, 'tf':9.5e-3, 'r':12e-3, 'A':31.96e-4, 'hi':183e-3, 'd':159e-3, 'FI':'M10', 'Pmin':56e-3, 'Pmax':60e-3, 'AL':0.779, 'AG':31.05, 'Iz':2211e-8, 'Wzel':218.9e-6, 'Wzpl':249.4e-6, 'iz':8.32e-2, 'Avy':15.45e-4, 'Iy':168.9e-8, 'Wyel':33.11e-6, 'Wypl':51.89e-6, 'iy':2.3e-2, 'Ss':39.26e-3, 'It':9.45e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_220']= {'nmb':'IPE_A_220', 'P':22.2, 'h':217e-3, 'b':110e-3, 'tw':5e-3, 'tf':7.7e-3, 'r':12e-3, 'A':28.26e-4, 'hi':201.6e-3, 'd':177.6e-3, 'FI':'M12', 'Pmin':60e-3, 'Pmax':62e-3, 'AL':0.843, 'AG':38.02, 'Iz':2317e-8, 'Wzel':213.5e-6, 'Wzpl':240.2e-6, 'iz':9.05e-2, 'Avy':13.55e-4, 'Iy':171.4e-8, 'Wyel':31.17e-6, 'Wypl':48.49e-6, 'iy':2.46e-2, 'Ss':34.46e-3, 'It':5.69e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_220']= {'nmb':'IPE_220', 'P':26.2, 'h':220e-3, 'b':110e-3, 'tw':5.9e-3, 'tf':9.2e-3, 'r':12e-3, 'A':33.37e-4, 'hi':201.6e-3, 'd':177.6e-3, 'FI':'M12', 'Pmin':60e-3, 'Pmax':62e-3, 'AL':0.848, 'AG':32.36, 'Iz':2772e-8, 'Wzel':252e-6, 'Wzpl':285.4e-6, 'iz':9.11e-2, 'Avy':15.88e-4, 'Iy':204.9e-8, 'Wyel':37.25e-6, 'Wypl':58.11e-6, 'iy':2.48e-2, 'Ss':38.36e-3, 'It':9.07e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_220+']= {'nmb':'IPE_O_220+', 'P':29.4, 'h':222e-3, 'b':112e-3, 'tw':6.6e-3, 'tf':10.2e-3, 'r':12e-3, 'A':37.39e-4, 'hi':201.6e-3, 'd':177.6e-3, 'FI':'M10', 'Pmin':58e-3, 'Pmax':66e-3, 'AL':0.858, 'AG':29.24, 'Iz':3134e-8, 'Wzel':282.3e-6, 'Wzpl':321.1e-6, 'iz':9.16e-2, 'Avy':17.66e-4, 'Iy':239.8e-8, 'Wyel':42.83e-6, 'Wypl':66.91e-6, 'iy':2.53e-2, 'Ss':41.06e-3, 'It':12.27e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_240']= {'nmb':'IPE_A_240', 'P':26.2, 'h':237e-3, 'b':120e-3, 'tw':5.2e-3, 'tf':8.3e-3, 'r':15e-3, 'A':33.31e-4, 'hi':220.4e-3, 'd':190.4e-3, 'FI':'M12', 'Pmin':64e-3, 'Pmax':68e-3, 'AL':0.918, 'AG':35.1, 'Iz':3290e-8, 'Wzel':277.7e-6, 'Wzpl':311.6e-6, 'iz':9.94e-2, 'Avy':16.31e-4, 'Iy':240.1e-8, 'Wyel':40.02e-6, 'Wypl':62.4e-6, 'iy':2.68e-2, 'Ss':39.37e-3, 'It':8.35e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_240']= {'nmb':'IPE_240', 'P':30.7, 'h':240e-3, 'b':120e-3, 'tw':6.2e-3, 'tf':9.8e-3, 'r':15e-3, 'A':39.12e-4, 'hi':220.4e-3, 'd':190.4e-3, 'FI':'M12', 'Pmin':66e-3, 'Pmax':68e-3, 'AL':0.922, 'AG':30.02, 'Iz':3892e-8, 'Wzel':324.3e-6, 'Wzpl':366.6e-6, 'iz':9.97e-2, 'Avy':19.14e-4, 'Iy':283.6e-8, 'Wyel':47.27e-6, 'Wypl':73.92e-6, 'iy':2.69e-2, 'Ss':43.37e-3, 'It':12.88e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_240+']= {'nmb':'IPE_O_240+', 'P':34.3, 'h':242e-3, 'b':122e-3, 'tw':7e-3, 'tf':10.8e-3, 'r':15e-3, 'A':43.71e-4, 'hi':220.4e-3, 'd':190.4e-3, 'FI':'M12', 'Pmin':66e-3, 'Pmax':70e-3, 'AL':0.932, 'AG':27.17, 'Iz':4369e-8, 'Wzel':361.1e-6, 'Wzpl':410.3e-6, 'iz':10e-2, 'Avy':21.36e-4, 'Iy':328.5e-8, 'Wyel':53.86e-6, 'Wypl':84.4e-6, 'iy':2.74e-2, 'Ss':46.17e-3, 'It':17.18e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_270']= {'nmb':'IPE_A_270', 'P':30.7, 'h':267e-3, 'b':135e-3, 'tw':5.5e-3, 'tf':8.7e-3, 'r':15e-3, 'A':39.15e-4, 'hi':249.6e-3, 'd':219.6e-3, 'FI':'M16', 'Pmin':70e-3, 'Pmax':72e-3, 'AL':1.037, 'AG':33.75, 'Iz':4917e-8, 'Wzel':368.3e-6, 'Wzpl':412.5e-6, 'iz':11.21e-2, 'Avy':18.75e-4, 'Iy':358e-8, 'Wyel':53.03e-6, 'Wypl':82.34e-6, 'iy':3.02e-2, 'Ss':40.47e-3, 'It':10.3e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_270']= {'nmb':'IPE_270', 'P':36.1, 'h':270e-3, 'b':135e-3, 'tw':6.6e-3, 'tf':10.2e-3, 'r':15e-3, 'A':45.95e-4, 'hi':249.6e-3, 'd':219.6e-3, 'FI':'M16', 'Pmin':72e-3, 'Pmax':72e-3, 'AL':1.041, 'AG':28.86, 'Iz':5790e-8, 'Wzel':428.9e-6, 'Wzpl':484e-6, 'iz':11.23e-2, 'Avy':22.14e-4, 'Iy':419.9e-8, 'Wyel':62.2e-6, 'Wypl':96.95e-6, 'iy':3.02e-2, 'Ss':44.57e-3, 'It':15.94e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_270+']= {'nmb':'IPE_O_270+', 'P':42.3, 'h':274e-3, 'b':136e-3, 'tw':7.5e-3, 'tf':12.2e-3, 'r':15e-3, 'A':53.84e-4, 'hi':249.6e-3, 'd':219.6e-3, 'FI':'M16', 'Pmin':72e-3, 'Pmax':72e-3, 'AL':1.051, 'AG':24.88, 'Iz':6947e-8, 'Wzel':507.1e-6, 'Wzpl':574.6e-6, 'iz':11.36e-2, 'Avy':25.23e-4, 'Iy':513.5e-8, 'Wyel':75.51e-6, 'Wypl':117.7e-6, 'iy':3.09e-2, 'Ss':49.47e-3, 'It':24.9e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_300']= {'nmb':'IPE_A_300', 'P':36.5, 'h':297e-3, 'b':150e-3, 'tw':6.1e-3, 'tf':9.2e-3, 'r':15e-3, 'A':46.53e-4, 'hi':278.6e-3, 'd':248.6e-3, 'FI':'M16', 'Pmin':72e-3, 'Pmax':86e-3, 'AL':1.156, 'AG':31.65, 'Iz':7173e-8, 'Wzel':483.1e-6, 'Wzpl':541.8e-6, 'iz':12.42e-2, 'Avy':22.25e-4, 'Iy':519e-8, 'Wyel':69.2e-6, 'Wypl':107.3e-6, 'iy':3.34e-2, 'Ss':42.07e-3, 'It':13.43e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_300']= {'nmb':'IPE_300', 'P':42.2, 'h':300e-3, 'b':150e-3, 'tw':7.1e-3, 'tf':10.7e-3, 'r':15e-3, 'A':53.81e-4, 'hi':278.6e-3, 'd':248.6e-3, 'FI':'M16', 'Pmin':72e-3, 'Pmax':86e-3, 'AL':1.16, 'AG':27.46, 'Iz':8356e-8, 'Wzel':557.1e-6, 'Wzpl':628.4e-6, 'iz':12.46e-2, 'Avy':25.68e-4, 'Iy':603.8e-8, 'Wyel':80.5e-6, 'Wypl':125.2e-6, 'iy':3.35e-2, 'Ss':46.07e-3, 'It':20.12e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_300+']= {'nmb':'IPE_O_300+', 'P':49.3, 'h':304e-3, 'b':152e-3, 'tw':8e-3, 'tf':12.7e-3, 'r':15e-3, 'A':62.83e-4, 'hi':278.6e-3, 'd':248.6e-3, 'FI':'M16', 'Pmin':74e-3, 'Pmax':88e-3, 'AL':1.174, 'AG':23.81, 'Iz':9994e-8, 'Wzel':657.5e-6, 'Wzpl':743.8e-6, 'iz':12.61e-2, 'Avy':29.05e-4, 'Iy':745.7e-8, 'Wyel':98.12e-6, 'Wypl':152.6e-6, 'iy':3.45e-2, 'Ss':50.97e-3, 'It':31.06e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_330']= {'nmb':'IPE_A_330', 'P':43, 'h':327e-3, 'b':160e-3, 'tw':6.5e-3, 'tf':10e-3, 'r':18e-3, 'A':54.74e-4, 'hi':307e-3, 'd':271e-3, 'FI':'M16', 'Pmin':78e-3, 'Pmax':96e-3, 'AL':1.25, 'AG':29.09, 'Iz':10230e-8, 'Wzel':625.7e-6, 'Wzpl':701.9e-6, 'iz':13.67e-2, 'Avy':26.99e-4, 'Iy':685.2e-8, 'Wyel':85.64e-6, 'Wypl':133.3e-6, 'iy':3.54e-2, 'Ss':47.59e-3, 'It':19.57e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_330']= {'nmb':'IPE_330', 'P':49.1, 'h':330e-3, 'b':160e-3, 'tw':7.5e-3, 'tf':11.5e-3, 'r':18e-3, 'A':62.61e-4, 'hi':307e-3, 'd':271e-3, 'FI':'M16', 'Pmin':78e-3, 'Pmax':96e-3, 'AL':1.254, 'AG':25.52, 'Iz':11770e-8, 'Wzel':713.1e-6, 'Wzpl':804.3e-6, 'iz':13.71e-2, 'Avy':30.81e-4, 'Iy':788.1e-8, 'Wyel':98.52e-6, 'Wypl':153.7e-6, 'iy':3.55e-2, 'Ss':51.59e-3, 'It':28.15e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_330+']= {'nmb':'IPE_O_330+', 'P':57, 'h':334e-3, 'b':162e-3, 'tw':8.5e-3, 'tf':13.5e-3, 'r':18e-3, 'A':72.62e-4, 'hi':307e-3, 'd':271e-3, 'FI':'M16', 'Pmin':80e-3, 'Pmax':98e-3, 'AL':1.268, 'AG':22.24, 'Iz':13910e-8, 'Wzel':833e-6, 'Wzpl':942.8e-6, 'iz':13.84e-2, 'Avy':34.88e-4, 'Iy':960.4e-8, 'Wyel':118.6e-6, 'Wypl':185e-6, 'iy':3.64e-2, 'Ss':56.59e-3, 'It':42.15e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_360']= {'nmb':'IPE_A_360', 'P':50.2, 'h':357.6e-3, 'b':170e-3, 'tw':6.6e-3, 'tf':11.5e-3, 'r':18e-3, 'A':63.96e-4, 'hi':334.6e-3, 'd':298.6e-3, 'FI':'M22', 'Pmin':86e-3, 'Pmax':88e-3, 'AL':1.351, 'AG':26.91, 'Iz':14520e-8, 'Wzel':811.8e-6, 'Wzpl':906.8e-6, 'iz':15.06e-2, 'Avy':29.76e-4, 'Iy':944.3e-8, 'Wyel':111.1e-6, 'Wypl':171.9e-6, 'iy':3.84e-2, 'Ss':50.69e-3, 'It':26.51e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_360']= {'nmb':'IPE_360', 'P':57.1, 'h':360e-3, 'b':170e-3, 'tw':8e-3, 'tf':12.7e-3, 'r':18e-3, 'A':72.73e-4, 'hi':334.6e-3, 'd':298.6e-3, 'FI':'M22', 'Pmin':88e-3, 'Pmax':88e-3, 'AL':1.353, 'AG':23.7, 'Iz':16270e-8, 'Wzel':903.6e-6, 'Wzpl':1019e-6, 'iz':14.95e-2, 'Avy':35.14e-4, 'Iy':1043e-8, 'Wyel':122.8e-6, 'Wypl':191.1e-6, 'iy':3.79e-2, 'Ss':54.49e-3, 'It':37.32e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_360+']= {'nmb':'IPE_O_360+', 'P':66, 'h':364e-3, 'b':172e-3, 'tw':9.2e-3, 'tf':14.7e-3, 'r':18e-3, 'A':84.13e-4, 'hi':334.6e-3, 'd':298.6e-3, 'FI':'M22', 'Pmin':90e-3, 'Pmax':90e-3, 'AL':1.367, 'AG':20.69, 'Iz':19050e-8, 'Wzel':1047e-6, 'Wzpl':1186e-6, 'iz':15.05e-2, 'Avy':40.21e-4, 'Iy':1251e-8, 'Wyel':145.5e-6, 'Wypl':226.9e-6, 'iy':3.86e-2, 'Ss':59.69e-3, 'It':55.76e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_400']= {'nmb':'IPE_A_400', 'P':57.4, 'h':397e-3, 'b':180e-3, 'tw':7e-3, 'tf':12e-3, 'r':21e-3, 'A':73.1e-4, 'hi':373e-3, 'd':331e-3, 'FI':'M22', 'Pmin':94e-3, 'Pmax':98e-3, 'AL':1.464, 'AG':25.51, 'Iz':20290e-8, 'Wzel':1022e-6, 'Wzpl':1144e-6, 'iz':16.66e-2, 'Avy':35.78e-4, 'Iy':1171e-8, 'Wyel':130.1e-6, 'Wypl':202.1e-6, 'iy':4e-2, 'Ss':55.6e-3, 'It':34.79e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_400']= {'nmb':'IPE_400', 'P':66.3, 'h':400e-3, 'b':180e-3, 'tw':8.6e-3, 'tf':13.5e-3, 'r':21e-3, 'A':84.46e-4, 'hi':373e-3, 'd':331e-3, 'FI':'M22', 'Pmin':96e-3, 'Pmax':98e-3, 'AL':1.467, 'AG':22.12, 'Iz':23130e-8, 'Wzel':1156e-6, 'Wzpl':1307e-6, 'iz':16.55e-2, 'Avy':42.69e-4, 'Iy':1318e-8, 'Wyel':146.4e-6, 'Wypl':229e-6, 'iy':3.95e-2, 'Ss':60.2e-3, 'It':51.08e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_400+']= {'nmb':'IPE_O_400+', 'P':75.7, 'h':404e-3, 'b':182e-3, 'tw':9.7e-3, 'tf':15.5e-3, 'r':21e-3, 'A':96.39e-4, 'hi':373e-3, 'd':331e-3, 'FI':'M22', 'Pmin':96e-3, 'Pmax':100e-3, 'AL':1.481, 'AG':19.57, 'Iz':26750e-8, 'Wzel':1324e-6, 'Wzpl':1502e-6, 'iz':16.66e-2, 'Avy':47.98e-4, 'Iy':1564e-8, 'Wyel':171.9e-6, 'Wypl':269.1e-6, 'iy':4.03e-2, 'Ss':65.3e-3, 'It':73.1e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_450']= {'nmb':'IPE_A_450', 'P':67.2, 'h':447e-3, 'b':190e-3, 'tw':7.6e-3, 'tf':13.1e-3, 'r':21e-3, 'A':85.55e-4, 'hi':420.8e-3, 'd':378.8e-3, 'FI':'M24', 'Pmin':100e-3, 'Pmax':102e-3, 'AL':1.603, 'AG':23.87, 'Iz':29760e-8, 'Wzel':1331e-6, 'Wzpl':1494e-6, 'iz':18.65e-2, 'Avy':42.26e-4, 'Iy':1502e-8, 'Wyel':158.1e-6, 'Wypl':245.7e-6, 'iy':4.19e-2, 'Ss':58.4e-3, 'It':45.67e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_450']= {'nmb':'IPE_450', 'P':77.6, 'h':450e-3, 'b':190e-3, 'tw':9.4e-3, 'tf':14.6e-3, 'r':21e-3, 'A':98.82e-4, 'hi':420.8e-3, 'd':378.8e-3, 'FI':'M24', 'Pmin':100e-3, 'Pmax':102e-3, 'AL':1.605, 'AG':20.69, 'Iz':33740e-8, 'Wzel':1500e-6, 'Wzpl':1702e-6, 'iz':18.48e-2, 'Avy':50.85e-4, 'Iy':1676e-8, 'Wyel':176.4e-6, 'Wypl':276.4e-6, 'iy':4.12e-2, 'Ss':63.2e-3, 'It':66.87e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_450+']= {'nmb':'IPE_O_450+', 'P':92.4, 'h':456e-3, 'b':192e-3, 'tw':11e-3, 'tf':17.6e-3, 'r':21e-3, 'A':117.7e-4, 'hi':420.8e-3, 'd':378.8e-3, 'FI':'M24', 'Pmin':102e-3, 'Pmax':104e-3, 'AL':1.622, 'AG':17.56, 'Iz':40920e-8, 'Wzel':1795e-6, 'Wzpl':2046e-6, 'iz':18.65e-2, 'Avy':59.4e-4, 'Iy':2085e-8, 'Wyel':217.2e-6, 'Wypl':341e-6, 'iy':4.21e-2, 'Ss':70.8e-3, 'It':109e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_500']= {'nmb':'IPE_A_500', 'P':79.4, 'h':497e-3, 'b':200e-3, 'tw':8.4e-3, 'tf':14.5e-3, 'r':21e-3, 'A':101.1e-4, 'hi':468e-3, 'd':426e-3, 'FI':'M24', 'Pmin':100e-3, 'Pmax':112e-3, 'AL':1.741, 'AG':21.94, 'Iz':42930e-8, 'Wzel':1728e-6, 'Wzpl':1946e-6, 'iz':20.61e-2, 'Avy':50.41e-4, 'Iy':1939e-8, 'Wyel':193.9e-6, 'Wypl':301.6e-6, 'iy':4.38e-2, 'Ss':62e-3, 'It':62.78e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_500']= {'nmb':'IPE_500', 'P':90.7, 'h':500e-3, 'b':200e-3, 'tw':10.2e-3, 'tf':16e-3, 'r':21e-3, 'A':115.5e-4, 'hi':468e-3, 'd':426e-3, 'FI':'M24', 'Pmin':102e-3, 'Pmax':112e-3, 'AL':1.744, 'AG':19.23, 'Iz':48200e-8, 'Wzel':1928e-6, 'Wzpl':2194e-6, 'iz':20.43e-2, 'Avy':59.87e-4, 'Iy':2142e-8, 'Wyel':214.2e-6, 'Wypl':335.9e-6, 'iy':4.31e-2, 'Ss':66.8e-3, 'It':89.29e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_500+']= {'nmb':'IPE_O_500+', 'P':107, 'h':506e-3, 'b':202e-3, 'tw':12e-3, 'tf':19e-3, 'r':21e-3, 'A':136.7e-4, 'hi':468e-3, 'd':426e-3, 'FI':'M24', 'Pmin':104e-3, 'Pmax':114e-3, 'AL':1.76, 'AG':16.4, 'Iz':57780e-8, 'Wzel':2284e-6, 'Wzpl':2613e-6, 'iz':20.56e-2, 'Avy':70.21e-4, 'Iy':2622e-8, 'Wyel':259.6e-6, 'Wypl':408.5e-6, 'iy':4.38e-2, 'Ss':74.6e-3, 'It':143.5e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_550']= {'nmb':'IPE_A_550', 'P':92.1, 'h':547e-3, 'b':210e-3, 'tw':9e-3, 'tf':15.7e-3, 'r':24e-3, 'A':117.3e-4, 'hi':515.6e-3, 'd':467.6e-3, 'FI':'M24', 'Pmin':106e-3, 'Pmax':122e-3, 'AL':1.875, 'AG':20.36, 'Iz':59980e-8, 'Wzel':2193e-6, 'Wzpl':2475e-6, 'iz':22.61e-2, 'Avy':60.3e-4, 'Iy':2432e-8, 'Wyel':231.6e-6, 'Wypl':361.5e-6, 'iy':4.55e-2, 'Ss':68.52e-3, 'It':86.53e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_550']= {'nmb':'IPE_550', 'P':106, 'h':550e-3, 'b':210e-3, 'tw':11.1e-3, 'tf':17.2e-3, 'r':24e-3, 'A':134.4e-4, 'hi':515.6e-3, 'd':467.6e-3, 'FI':'M24', 'Pmin':110e-3, 'Pmax':122e-3, 'AL':1.877, 'AG':17.78, 'Iz':67120e-8, 'Wzel':2441e-6, 'Wzpl':2787e-6, 'iz':22.35e-2, 'Avy':72.34e-4, 'Iy':2668e-8, 'Wyel':254.1e-6, 'Wypl':400.5e-6, 'iy':4.45e-2, 'Ss':73.62e-3, 'It':123.2e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_550+']= {'nmb':'IPE_O_550+', 'P':123, 'h':556e-3, 'b':212e-3, 'tw':12.7e-3, 'tf':20.2e-3, 'r':24e-3, 'A':156.1e-4, 'hi':515.6e-3, 'd':467.6e-3, 'FI':'M24', 'Pmin':110e-3, 'Pmax':122e-3, 'AL':1.893, 'AG':15.45, 'Iz':79160e-8, 'Wzel':2847e-6, 'Wzpl':3263e-6, 'iz':22.52e-2, 'Avy':82.69e-4, 'Iy':3224e-8, 'Wyel':304.2e-6, 'Wypl':480.5e-6, 'iy':4.55e-2, 'Ss':81.22e-3, 'It':187.5e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_A_600']= {'nmb':'IPE_A_600', 'P':108, 'h':597e-3, 'b':220e-3, 'tw':9.8e-3, 'tf':17.5e-3, 'r':24e-3, 'A':137e-4, 'hi':562e-3, 'd':514e-3, 'FI':'M27', 'Pmin':114e-3, 'Pmax':118e-3, 'AL':2.013, 'AG':18.72, 'Iz':82920e-8, 'Wzel':2778e-6, 'Wzpl':3141e-6, 'iz':24.6e-2, 'Avy':70.14e-4, 'Iy':3116e-8, 'Wyel':283.3e-6, 'Wypl':442.1e-6, 'iy':4.77e-2, 'Ss':72.92e-3, 'It':118.8e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_600']= {'nmb':'IPE_600', 'P':122, 'h':600e-3, 'b':220e-3, 'tw':12e-3, 'tf':19e-3, 'r':24e-3, 'A':156e-4, 'hi':562e-3, 'd':514e-3, 'FI':'M27', 'Pmin':116e-3, 'Pmax':118e-3, 'AL':2.015, 'AG':16.45, 'Iz':92080e-8, 'Wzel':3069e-6, 'Wzpl':3512e-6, 'iz':24.3e-2, 'Avy':83.78e-4, 'Iy':3387e-8, 'Wyel':307.9e-6, 'Wypl':485.6e-6, 'iy':4.66e-2, 'Ss':78.12e-3, 'It':165.4e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_O_600+']= {'nmb':'IPE_O_600+', 'P':154, 'h':610e-3, 'b':224e-3, 'tw':15e-3, 'tf':24e-3, 'r':24e-3, 'A':196.8e-4, 'hi':562e-3, 'd':514e-3, 'FI':'M27', 'Pmin':118e-3, 'Pmax':122e-3, 'AL':2.045, 'AG':13.24, 'Iz':118300e-8, 'Wzel':3879e-6, 'Wzpl':4471e-6, 'iz':24.52e-2, 'Avy':104.4e-4, 'Iy':4521e-8, 'Wyel':403.6e-6, 'Wypl':640.1e-6, 'iy':4.79e-2, 'Ss':91.12e-3, 'It':318.1e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_750x147']= {'nmb':'IPE_750x147', 'P':147, 'h':753e-3, 'b':265e-3, 'tw':13.2e-3, 'tf':17e-3, 'r':17e-3, 'A':187.5e-4, 'hi':719e-3, 'd':685e-3, 'FI':'M27', 'Pmin':104e-3, 'Pmax':164e-3, 'AL':2.51, 'AG':17.06, 'Iz':166100e-8, 'Wzel':4411e-6, 'Wzpl':5110e-6, 'iz':29.76e-2, 'Avy':105.4e-4, 'Iy':5289e-8, 'Wyel':399.2e-6, 'Wypl':630.8e-6, 'iy':5.31e-2, 'Ss':67.12e-3, 'It':161.5e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_750x173+']= {'nmb':'IPE_750x173+', 'P':173, 'h':762e-3, 'b':267e-3, 'tw':14.4e-3, 'tf':21.6e-3, 'r':17e-3, 'A':221.3e-4, 'hi':718.8e-3, 'd':684.8e-3, 'FI':'M27', 'Pmin':104e-3, 'Pmax':166e-3, 'AL':2.534, 'AG':14.58, 'Iz':205800e-8, 'Wzel':5402e-6, 'Wzpl':6218e-6, 'iz':30.49e-2, 'Avy':116.4e-4, 'Iy':6873e-8, 'Wyel':514.9e-6, 'Wypl':809.9e-6, 'iy':5.57e-2, 'Ss':77.52e-3, 'It':273.6e-8, 'E':2.1e+11, 'nu':0.3}
-IPE['IPE_750x196+']= {'nmb':'IPE_750x196+', 'P':196, 'h':770e-3, 'b':268e-3, 'tw':15.6e-3, 'tf':25.4e-3, 'r':17e-3, 'A':250.8e-4, 'hi':719.2e-3, 'd':685.2e-3, 'FI':'M27', 'Pmin':106e-3, 'Pmax':166e-3, 'AL':2.552, 'AG':12.96, 'Iz':240300e-8, 'Wzel':6241e-6, 'Wzpl':7174e-6, 'iz':30.95e-2, 'Avy':127.3e-4, 'Iy':8175e-8, 'Wyel':610.1e-6, 'Wypl':958.8e-6, 'iy':5.71e-2, 'Ss':86.32e-3, 'It':408.9e-8, 'E':2.1e+11, 'nu':0.3}
-
-
-for item in IPE:
-    shape= IPE[item]
+
+def setIPEDerivedValues(shape):
+    '''Compute the properties of the IPE shapes that are not in the table.'''
     Avy= shape['Avy']
     A= shape['A']
     E= shape['E']
@@ -126,6 +75,8 @@ for item in IPE:
     shape['G']= E/(2*(1+nu))
     shape['AreaQy']= A-2*b*tf+(tw+2*r)*tf
     shape['AreaQz']= A-hi*tw
+
+IPE= shape_table.ShapeTable('arcelor_IPE',setIPEDerivedValues)
 # Arcelor IPN steel shapes.
 
 # Section axis:
@@ -153,52 +104,8 @@ for item in IPE:
 #   alpha-> alphaY,alphaZ}
 
 
-IPN={}
-
-IPN['IPN_80']= {'nmb':'IPN_80','P':5.9,'h':80e-3,'b':42e-3,'tw':3.9e-3,'tf':5.9e-3,'r1':3.9e-3,'r2':2.3e-3,'A':7.58e-4,'d':59e-3,'FI':'-','Pmin':0e-3,'Pmax':0e-3,'AL':0.304,'AG':51.09,'Iz':77.8e-8,'Wzel':19.5e-6,'Wzpl':22.8e-6,'iz':3.2e-2,'Avy':3.41e-4,'Iy':6.29e-8,'Wyel':3e-6,'Wypl':5e-6,'iy':0.91e-2,'Ss':21.6e-3,'It':0.87e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_100']= {'nmb':'IPN_100','P':8.3,'h':100e-3,'b':50e-3,'tw':4.5e-3,'tf':6.8e-3,'r1':4.5e-3,'r2':2.7e-3,'A':10.6e-4,'d':75.7e-3,'FI':'-','Pmin':0e-3,'Pmax':0e-3,'AL':0.37,'AG':44.47,'Iz':171e-8,'Wzel':34.2e-6,'Wzpl':39.8e-6,'iz':4.01e-2,'Avy':4.85e-4,'Iy':12.2e-8,'Wyel':4.88e-6,'Wypl':8.1e-6,'iy':1.07e-2,'Ss':25e-3,'It':1.6e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_120']= {'nmb':'IPN_120','P':11.1,'h':120e-3,'b':58e-3,'tw':5.1e-3,'tf':7.7e-3,'r1':5.1e-3,'r2':3.1e-3,'A':14.2e-4,'d':92.4e-3,'FI':'-','Pmin':0e-3,'Pmax':0e-3,'AL':0.439,'AG':39.38,'Iz':328e-8,'Wzel':54.7e-6,'Wzpl':63.6e-6,'iz':4.81e-2,'Avy':6.63e-4,'Iy':21.5e-8,'Wyel':7.41e-6,'Wypl':12.4e-6,'iy':1.23e-2,'Ss':28.4e-3,'It':2.71e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_140']= {'nmb':'IPN_140','P':14.3,'h':140e-3,'b':66e-3,'tw':5.7e-3,'tf':8.6e-3,'r1':5.7e-3,'r2':3.4e-3,'A':18.3e-4,'d':109.1e-3,'FI':'-','Pmin':0e-3,'Pmax':0e-3,'AL':0.502,'AG':34.94,'Iz':573e-8,'Wzel':81.9e-6,'Wzpl':95.4e-6,'iz':5.61e-2,'Avy':8.65e-4,'Iy':35.2e-8,'Wyel':10.7e-6,'Wypl':17.9e-6,'iy':1.4e-2,'Ss':31.8e-3,'It':4.32e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_160']= {'nmb':'IPN_160','P':17.9,'h':160e-3,'b':74e-3,'tw':6.3e-3,'tf':9.5e-3,'r1':6.3e-3,'r2':3.8e-3,'A':22.8e-4,'d':125.8e-3,'FI':'-','Pmin':0e-3,'Pmax':0e-3,'AL':0.575,'AG':32.13,'Iz':935e-8,'Wzel':117e-6,'Wzpl':136e-6,'iz':6.4e-2,'Avy':10.83e-4,'Iy':54.7e-8,'Wyel':14.8e-6,'Wypl':24.9e-6,'iy':1.55e-2,'Ss':35.2e-3,'It':6.57e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_180']= {'nmb':'IPN_180','P':21.9,'h':180e-3,'b':82e-3,'tw':6.9e-3,'tf':10.4e-3,'r1':6.9e-3,'r2':4.1e-3,'A':27.9e-4,'d':142.4e-3,'FI':'-','Pmin':0e-3,'Pmax':0e-3,'AL':0.64,'AG':29.22,'Iz':1450e-8,'Wzel':161e-6,'Wzpl':187e-6,'iz':7.2e-2,'Avy':13.35e-4,'Iy':81.3e-8,'Wyel':19.8e-6,'Wypl':33.2e-6,'iy':1.71e-2,'Ss':38.6e-3,'It':9.58e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_200']= {'nmb':'IPN_200','P':26.2,'h':200e-3,'b':90e-3,'tw':7.5e-3,'tf':11.3e-3,'r1':7.5e-3,'r2':4.5e-3,'A':33.4e-4,'d':159.1e-3,'FI':'-','Pmin':0e-3,'Pmax':0e-3,'AL':0.709,'AG':27.04,'Iz':2140e-8,'Wzel':214e-6,'Wzpl':250e-6,'iz':8e-2,'Avy':16.03e-4,'Iy':117e-8,'Wyel':26e-6,'Wypl':43.5e-6,'iy':1.87e-2,'Ss':42e-3,'It':13.5e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_220']= {'nmb':'IPN_220','P':31.1,'h':220e-3,'b':98e-3,'tw':8.1e-3,'tf':12.2e-3,'r1':8.1e-3,'r2':4.9e-3,'A':39.5e-4,'d':175.8e-3,'FI':'M 10','Pmin':50e-3,'Pmax':56e-3,'AL':0.775,'AG':24.99,'Iz':3060e-8,'Wzel':278e-6,'Wzpl':324e-6,'iz':8.8e-2,'Avy':19.06e-4,'Iy':162e-8,'Wyel':33.1e-6,'Wypl':55.7e-6,'iy':2.02e-2,'Ss':45.4e-3,'It':18.6e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_240']= {'nmb':'IPN_240','P':36.2,'h':240e-3,'b':106e-3,'tw':8.7e-3,'tf':13.1e-3,'r1':8.7e-3,'r2':5.2e-3,'A':46.1e-4,'d':192.5e-3,'FI':'M 10','Pmin':54e-3,'Pmax':60e-3,'AL':0.844,'AG':23.32,'Iz':4250e-8,'Wzel':354e-6,'Wzpl':412e-6,'iz':9.59e-2,'Avy':22.33e-4,'Iy':221e-8,'Wyel':41.7e-6,'Wypl':70e-6,'iy':2.2e-2,'Ss':48.9e-3,'It':25e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_260']= {'nmb':'IPN_260','P':41.9,'h':260e-3,'b':113e-3,'tw':9.4e-3,'tf':14.1e-3,'r1':9.4e-3,'r2':5.6e-3,'A':53.3e-4,'d':208.9e-3,'FI':'M 12','Pmin':62e-3,'Pmax':62e-3,'AL':0.906,'AG':21.65,'Iz':5740e-8,'Wzel':442e-6,'Wzpl':514e-6,'iz':10.4e-2,'Avy':26.08e-4,'Iy':288e-8,'Wyel':51e-6,'Wypl':85.9e-6,'iy':2.32e-2,'Ss':52.6e-3,'It':33.5e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_280']= {'nmb':'IPN_280','P':47.9,'h':280e-3,'b':119e-3,'tw':10.1e-3,'tf':15.2e-3,'r1':10.1e-3,'r2':6.1e-3,'A':61e-4,'d':225.1e-3,'FI':'M 12','Pmin':68e-3,'Pmax':68e-3,'AL':0.966,'AG':20.17,'Iz':7590e-8,'Wzel':542e-6,'Wzpl':632e-6,'iz':11.1e-2,'Avy':30.18e-4,'Iy':364e-8,'Wyel':61.2e-6,'Wypl':103e-6,'iy':2.45e-2,'Ss':56.4e-3,'It':44.2e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_300']= {'nmb':'IPN_300','P':54.2,'h':300e-3,'b':125e-3,'tw':10.8e-3,'tf':16.2e-3,'r1':10.8e-3,'r2':6.5e-3,'A':69e-4,'d':241.6e-3,'FI':'M 12','Pmin':70e-3,'Pmax':74e-3,'AL':1.03,'AG':19.02,'Iz':9800e-8,'Wzel':653e-6,'Wzpl':762e-6,'iz':11.9e-2,'Avy':34.58e-4,'Iy':451e-8,'Wyel':72.2e-6,'Wypl':121e-6,'iy':2.56e-2,'Ss':60.1e-3,'It':56.8e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_320']= {'nmb':'IPN_320','P':61,'h':320e-3,'b':131e-3,'tw':11.5e-3,'tf':17.3e-3,'r1':11.5e-3,'r2':6.9e-3,'A':77.7e-4,'d':257.9e-3,'FI':'M 12','Pmin':70e-3,'Pmax':80e-3,'AL':1.09,'AG':17.87,'Iz':12510e-8,'Wzel':782e-6,'Wzpl':914e-6,'iz':12.7e-2,'Avy':39.26e-4,'Iy':555e-8,'Wyel':84.7e-6,'Wypl':143e-6,'iy':2.67e-2,'Ss':63.9e-3,'It':72.5e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_340']= {'nmb':'IPN_340','P':68,'h':340e-3,'b':137e-3,'tw':12.2e-3,'tf':18.3e-3,'r1':12.2e-3,'r2':7.3e-3,'A':86.7e-4,'d':274.3e-3,'FI':'M 12','Pmin':78e-3,'Pmax':86e-3,'AL':1.15,'AG':16.9,'Iz':15700e-8,'Wzel':923e-6,'Wzpl':1080e-6,'iz':13.5e-2,'Avy':44.27e-4,'Iy':674e-8,'Wyel':98.4e-6,'Wypl':166e-6,'iy':2.8e-2,'Ss':67.6e-3,'It':90.4e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_360']= {'nmb':'IPN_360','P':76.1,'h':360e-3,'b':143e-3,'tw':13e-3,'tf':19.5e-3,'r1':13e-3,'r2':7.8e-3,'A':97e-4,'d':290.2e-3,'FI':'M 12','Pmin':78e-3,'Pmax':92e-3,'AL':1.21,'AG':15.89,'Iz':19610e-8,'Wzel':1090e-6,'Wzpl':1276e-6,'iz':14.2e-2,'Avy':49.95e-4,'Iy':818e-8,'Wyel':114e-6,'Wypl':194e-6,'iy':2.9e-2,'Ss':71.8e-3,'It':115e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_380']= {'nmb':'IPN_380','P':84,'h':380e-3,'b':149e-3,'tw':13.7e-3,'tf':20.5e-3,'r1':13.7e-3,'r2':8.2e-3,'A':107e-4,'d':306.7e-3,'FI':'M 16','Pmin':84e-3,'Pmax':86e-3,'AL':1.27,'AG':15.12,'Iz':24010e-8,'Wzel':1260e-6,'Wzpl':1482e-6,'iz':15e-2,'Avy':55.55e-4,'Iy':975e-8,'Wyel':131e-6,'Wypl':221e-6,'iy':3.02e-2,'Ss':75.4e-3,'It':141e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_400']= {'nmb':'IPN_400','P':92.4,'h':400e-3,'b':155e-3,'tw':14.4e-3,'tf':21.6e-3,'r1':14.4e-3,'r2':8.6e-3,'A':118e-4,'d':322.9e-3,'FI':'M 16','Pmin':86e-3,'Pmax':92e-3,'AL':1.33,'AG':14.36,'Iz':29210e-8,'Wzel':1460e-6,'Wzpl':1714e-6,'iz':15.7e-2,'Avy':61.69e-4,'Iy':1160e-8,'Wyel':149e-6,'Wypl':253e-6,'iy':3.13e-2,'Ss':79.3e-3,'It':170e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_450']= {'nmb':'IPN_450','P':115,'h':450e-3,'b':170e-3,'tw':16.2e-3,'tf':24.3e-3,'r1':16.2e-3,'r2':9.7e-3,'A':147e-4,'d':363.6e-3,'FI':'M 16','Pmin':92e-3,'Pmax':106e-3,'AL':1.48,'AG':12.83,'Iz':45850e-8,'Wzel':2040e-6,'Wzpl':2400e-6,'iz':17.7e-2,'Avy':77.79e-4,'Iy':1730e-8,'Wyel':203e-6,'Wypl':345e-6,'iy':3.43e-2,'Ss':88.9e-3,'It':267e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_500']= {'nmb':'IPN_500','P':141,'h':500e-3,'b':185e-3,'tw':18e-3,'tf':27e-3,'r1':18e-3,'r2':10.8e-3,'A':179e-4,'d':404.3e-3,'FI':'M 20','Pmin':102e-3,'Pmax':110e-3,'AL':1.63,'AG':11.6,'Iz':68740e-8,'Wzel':2750e-6,'Wzpl':3240e-6,'iz':19.6e-2,'Avy':95.6e-4,'Iy':2480e-8,'Wyel':268e-6,'Wypl':456e-6,'iy':3.72e-2,'Ss':98.5e-3,'It':402e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_550']= {'nmb':'IPN_550','P':166,'h':550e-3,'b':200e-3,'tw':19e-3,'tf':30e-3,'r1':19e-3,'r2':11.9e-3,'A':212e-4,'d':445.6e-3,'FI':'M 22','Pmin':112e-3,'Pmax':118e-3,'AL':1.8,'AG':10.8,'Iz':99180e-8,'Wzel':3610e-6,'Wzpl':4240e-6,'iz':21.6e-2,'Avy':111.3e-4,'Iy':3490e-8,'Wyel':349e-6,'Wypl':592e-6,'iy':4.02e-2,'Ss':107.3e-3,'It':544e-8,'E':2.1e+11,'nu':0.3}
-
-IPN['IPN_600']= {'nmb':'IPN_600','P':199,'h':600e-3,'b':215e-3,'tw':21.6e-3,'tf':32.4e-3,'r1':21.6e-3,'r2':13e-3,'A':254e-4,'d':485.8e-3,'FI':'M 24','Pmin':126e-3,'Pmax':128e-3,'AL':1.97,'AG':9.89,'Iz':138800e-8,'Wzel':4627e-6,'Wzpl':5452e-6,'iz':23.39e-2,'Avy':138e-4,'Iy':4674e-8,'Wyel':435e-6,'Wypl':752e-6,'iy':4.29e-2,'Ss':117.6e-3,'It':787e-8,'E':2.1e+11,'nu':0.3}
-
-for item in IPN:
-    shape= IPN[item]
+def setIPNDerivedValues(shape):
+    '''Compute the properties of the IPN shapes that are not in the table.'''
     Avy= shape['Avy']
     A= shape['A']
     E= shape['E']
@@ -214,7 +121,9 @@ for item in IPN:
     shape['alpha']= Avy/A
     shape['G']= E/(2*(1+nu))
     shape['AreaQy']= 2*b*tf+(tw+2*r1)*tf
-    shape['AreaQz']= A-d*tw
+    shape['AreaQz']= A-shape['d']*tw
+
+IPN= shape_table.ShapeTable('arcelor_IPN',setIPNDerivedValues)
 # Arcelor HE steel shapes.
 
 # Axis of the section:
@@ -240,151 +149,9 @@ for item in IPN:
 # XXX Control shear distortion constants:
 #    alpha-> alphaY,alphaZ
 
-HE={}
-
-HE['HE_100_AAdot']= {'nmb':'HE_100_AAdot', 'P':12.2, 'h':91e-3, 'b':100e-3, 'tw':4.2e-3, 'tf':5.5e-3, 'r':12e-3, 'A':15.6e-4, 'hi':80e-3, 'd':56e-3, 'FI':'M 10', 'Pmin':54e-3, 'Pmax':58e-3, 'AL':0.553, 'AG':45.17, 'Iz':236.5e-8, 'Wzel':51.98e-6, 'Wzpl':58.36e-6, 'iz':3.89e-2, 'Avy':6.15e-4, 'Iy':92.06e-8, 'Wyel':18.41e-6, 'Wypl':28.44e-6, 'iy':2.43e-2, 'Ss':29.26e-3, 'It':2.51e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_100_A']= {'nmb':'HE_100_A', 'P':16.7, 'h':96e-3, 'b':100e-3, 'tw':5e-3, 'tf':8e-3, 'r':12e-3, 'A':21.2e-4, 'hi':80e-3, 'd':56e-3, 'FI':'M 10', 'Pmin':54e-3, 'Pmax':58e-3, 'AL':0.561, 'AG':33.68, 'Iz':349.2e-8, 'Wzel':72.76e-6, 'Wzpl':83.01e-6, 'iz':4.06e-2, 'Avy':7.56e-4, 'Iy':133.8e-8, 'Wyel':26.76e-6, 'Wypl':41.14e-6, 'iy':2.51e-2, 'Ss':35.06e-3, 'It':5.24e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_100_B']= {'nmb':'HE_100_B', 'P':20.4, 'h':100e-3, 'b':100e-3, 'tw':6e-3, 'tf':10e-3, 'r':12e-3, 'A':26e-4, 'hi':80e-3, 'd':56e-3, 'FI':'M 10', 'Pmin':56e-3, 'Pmax':58e-3, 'AL':0.567, 'AG':27.76, 'Iz':449.5e-8, 'Wzel':89.91e-6, 'Wzpl':104.2e-6, 'iz':4.16e-2, 'Avy':9.04e-4, 'Iy':167.3e-8, 'Wyel':33.45e-6, 'Wypl':51.42e-6, 'iy':2.53e-2, 'Ss':40.06e-3, 'It':9.25e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_100_M']= {'nmb':'HE_100_M', 'P':41.8, 'h':120e-3, 'b':106e-3, 'tw':12e-3, 'tf':20e-3, 'r':12e-3, 'A':53.2e-4, 'hi':80e-3, 'd':56e-3, 'FI':'M 10', 'Pmin':62e-3, 'Pmax':64e-3, 'AL':0.619, 'AG':14.82, 'Iz':1143e-8, 'Wzel':190.4e-6, 'Wzpl':235.8e-6, 'iz':4.63e-2, 'Avy':18.04e-4, 'Iy':399.2e-8, 'Wyel':75.31e-6, 'Wypl':116.3e-6, 'iy':2.74e-2, 'Ss':66.06e-3, 'It':68.21e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_120_AAdot']= {'nmb':'HE_120_AAdot', 'P':14.6, 'h':109e-3, 'b':120e-3, 'tw':4.2e-3, 'tf':5.5e-3, 'r':12e-3, 'A':18.6e-4, 'hi':98e-3, 'd':74e-3, 'FI':'M 12', 'Pmin':58e-3, 'Pmax':68e-3, 'AL':0.669, 'AG':45.94, 'Iz':413.4e-8, 'Wzel':75.85e-6, 'Wzpl':84.12e-6, 'iz':4.72e-2, 'Avy':6.9e-4, 'Iy':158.8e-8, 'Wyel':26.47e-6, 'Wypl':40.62e-6, 'iy':2.93e-2, 'Ss':29.26e-3, 'It':2.78e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_120_A']= {'nmb':'HE_120_A', 'P':19.9, 'h':114e-3, 'b':120e-3, 'tw':5e-3, 'tf':8e-3, 'r':12e-3, 'A':25.3e-4, 'hi':98e-3, 'd':74e-3, 'FI':'M 12', 'Pmin':58e-3, 'Pmax':68e-3, 'AL':0.677, 'AG':34.06, 'Iz':606.2e-8, 'Wzel':106.3e-6, 'Wzpl':119.5e-6, 'iz':4.89e-2, 'Avy':8.46e-4, 'Iy':230.9e-8, 'Wyel':38.48e-6, 'Wypl':58.85e-6, 'iy':3.02e-2, 'Ss':35.06e-3, 'It':5.99e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_120_B']= {'nmb':'HE_120_B', 'P':26.7, 'h':120e-3, 'b':120e-3, 'tw':6.5e-3, 'tf':11e-3, 'r':12e-3, 'A':34e-4, 'hi':98e-3, 'd':74e-3, 'FI':'M 12', 'Pmin':60e-3, 'Pmax':68e-3, 'AL':0.686, 'AG':25.71, 'Iz':864.4e-8, 'Wzel':144.1e-6, 'Wzpl':165.2e-6, 'iz':5.04e-2, 'Avy':10.96e-4, 'Iy':317.5e-8, 'Wyel':52.92e-6, 'Wypl':80.97e-6, 'iy':3.06e-2, 'Ss':42.56e-3, 'It':13.84e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_120_M']= {'nmb':'HE_120_M', 'P':52.1, 'h':140e-3, 'b':126e-3, 'tw':12.5e-3, 'tf':21e-3, 'r':12e-3, 'A':66.4e-4, 'hi':98e-3, 'd':74e-3, 'FI':'M 12', 'Pmin':66e-3, 'Pmax':74e-3, 'AL':0.738, 'AG':14.16, 'Iz':2018e-8, 'Wzel':288.2e-6, 'Wzpl':350.6e-6, 'iz':5.51e-2, 'Avy':21.15e-4, 'Iy':702.8e-8, 'Wyel':111.6e-6, 'Wypl':171.6e-6, 'iy':3.25e-2, 'Ss':68.56e-3, 'It':91.66e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_140_AAdot']= {'nmb':'HE_140_AAdot', 'P':18.1, 'h':128e-3, 'b':140e-3, 'tw':4.3e-3, 'tf':6e-3, 'r':12e-3, 'A':23e-4, 'hi':116e-3, 'd':92e-3, 'FI':'M 16', 'Pmin':64e-3, 'Pmax':76e-3, 'AL':0.787, 'AG':43.53, 'Iz':719.5e-8, 'Wzel':112.4e-6, 'Wzpl':123.8e-6, 'iz':5.59e-2, 'Avy':7.92e-4, 'Iy':274.8e-8, 'Wyel':39.26e-6, 'Wypl':59.93e-6, 'iy':3.45e-2, 'Ss':30.36e-3, 'It':3.54e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_140_A']= {'nmb':'HE_140_A', 'P':24.7, 'h':133e-3, 'b':140e-3, 'tw':5.5e-3, 'tf':8.5e-3, 'r':12e-3, 'A':31.4e-4, 'hi':116e-3, 'd':92e-3, 'FI':'M 16', 'Pmin':64e-3, 'Pmax':76e-3, 'AL':0.794, 'AG':32.21, 'Iz':1033e-8, 'Wzel':155.4e-6, 'Wzpl':173.5e-6, 'iz':5.73e-2, 'Avy':10.12e-4, 'Iy':389.3e-8, 'Wyel':55.62e-6, 'Wypl':84.85e-6, 'iy':3.52e-2, 'Ss':36.56e-3, 'It':8.13e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_140_B']= {'nmb':'HE_140_B', 'P':33.7, 'h':140e-3, 'b':140e-3, 'tw':7e-3, 'tf':12e-3, 'r':12e-3, 'A':43e-4, 'hi':116e-3, 'd':92e-3, 'FI':'M 16', 'Pmin':66e-3, 'Pmax':76e-3, 'AL':0.805, 'AG':23.88, 'Iz':1509e-8, 'Wzel':215.6e-6, 'Wzpl':245.4e-6, 'iz':5.93e-2, 'Avy':13.08e-4, 'Iy':549.7e-8, 'Wyel':78.52e-6, 'Wypl':119.8e-6, 'iy':3.58e-2, 'Ss':45.06e-3, 'It':20.06e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_140_M']= {'nmb':'HE_140_M', 'P':63.2, 'h':160e-3, 'b':146e-3, 'tw':13e-3, 'tf':22e-3, 'r':12e-3, 'A':80.6e-4, 'hi':116e-3, 'd':92e-3, 'FI':'M 16', 'Pmin':72e-3, 'Pmax':82e-3, 'AL':0.857, 'AG':13.56, 'Iz':3291e-8, 'Wzel':411.4e-6, 'Wzpl':493.8e-6, 'iz':6.39e-2, 'Avy':24.46e-4, 'Iy':1144e-8, 'Wyel':156.8e-6, 'Wypl':240.5e-6, 'iy':3.77e-2, 'Ss':71.06e-3, 'It':120e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_160_AAdot']= {'nmb':'HE_160_AAdot', 'P':23.8, 'h':148e-3, 'b':160e-3, 'tw':4.5e-3, 'tf':7e-3, 'r':15e-3, 'A':30.4e-4, 'hi':134e-3, 'd':104e-3, 'FI':'M 20', 'Pmin':76e-3, 'Pmax':84e-3, 'AL':0.901, 'AG':37.81, 'Iz':1283e-8, 'Wzel':173.4e-6, 'Wzpl':190.4e-6, 'iz':6.50e-2, 'Avy':10.38e-4, 'Iy':478.7e-8, 'Wyel':59.84e-6, 'Wypl':91.36e-6, 'iy':3.97e-2, 'Ss':36.07e-3, 'It':6.33e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_160_A']= {'nmb':'HE_160_A', 'P':30.4, 'h':152e-3, 'b':160e-3, 'tw':6e-3, 'tf':9e-3, 'r':15e-3, 'A':38.8e-4, 'hi':134e-3, 'd':104e-3, 'FI':'M 20', 'Pmin':78e-3, 'Pmax':84e-3, 'AL':0.906, 'AG':29.78, 'Iz':1673e-8, 'Wzel':220.1e-6, 'Wzpl':245.1e-6, 'iz':6.57e-2, 'Avy':13.21e-4, 'Iy':615.6e-8, 'Wyel':76.95e-6, 'Wypl':117.6e-6, 'iy':3.98e-2, 'Ss':41.57e-3, 'It':12.19e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_160_B']= {'nmb':'HE_160_B', 'P':42.6, 'h':160e-3, 'b':160e-3, 'tw':8e-3, 'tf':13e-3, 'r':15e-3, 'A':54.3e-4, 'hi':134e-3, 'd':104e-3, 'FI':'M 20', 'Pmin':80e-3, 'Pmax':84e-3, 'AL':0.918, 'AG':21.56, 'Iz':2492e-8, 'Wzel':311.5e-6, 'Wzpl':354e-6, 'iz':6.78e-2, 'Avy':17.59e-4, 'Iy':889.2e-8, 'Wyel':111.2e-6, 'Wypl':170e-6, 'iy':4.05e-2, 'Ss':51.57e-3, 'It':31.24e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_160_M']= {'nmb':'HE_160_M', 'P':76.2, 'h':180e-3, 'b':166e-3, 'tw':14e-3, 'tf':23e-3, 'r':15e-3, 'A':97.1e-4, 'hi':134e-3, 'd':104e-3, 'FI':'M 20', 'Pmin':86e-3, 'Pmax':90e-3, 'AL':0.97, 'AG':12.74, 'Iz':5098e-8, 'Wzel':566.5e-6, 'Wzpl':674.6e-6, 'iz':7.25e-2, 'Avy':30.81e-4, 'Iy':1759e-8, 'Wyel':211.9e-6, 'Wypl':325.5e-6, 'iy':4.26e-2, 'Ss':77.57e-3, 'It':162.4e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_180_AAdot']= {'nmb':'HE_180_AAdot', 'P':28.7, 'h':167e-3, 'b':180e-3, 'tw':5e-3, 'tf':7.5e-3, 'r':15e-3, 'A':36.5e-4, 'hi':152e-3, 'd':122e-3, 'FI':'M 24', 'Pmin':84e-3, 'Pmax':92e-3, 'AL':1.018, 'AG':35.51, 'Iz':1967e-8, 'Wzel':235.6e-6, 'Wzpl':258.2e-6, 'iz':7.34e-2, 'Avy':12.16e-4, 'Iy':730e-8, 'Wyel':81.11e-6, 'Wypl':123.6e-6, 'iy':4.47e-2, 'Ss':37.57e-3, 'It':8.33e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_180_A']= {'nmb':'HE_180_A', 'P':35.5, 'h':171e-3, 'b':180e-3, 'tw':6e-3, 'tf':9.5e-3, 'r':15e-3, 'A':45.3e-4, 'hi':152e-3, 'd':122e-3, 'FI':'M 24', 'Pmin':86e-3, 'Pmax':92e-3, 'AL':1.024, 'AG':28.83, 'Iz':2510e-8, 'Wzel':293.6e-6, 'Wzpl':324.9e-6, 'iz':7.45e-2, 'Avy':14.47e-4, 'Iy':924.6e-8, 'Wyel':102.7e-6, 'Wypl':156.5e-6, 'iy':4.52e-2, 'Ss':42.57e-3, 'It':14.8e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_180_B']= {'nmb':'HE_180_B', 'P':51.2, 'h':180e-3, 'b':180e-3, 'tw':8.5e-3, 'tf':14e-3, 'r':15e-3, 'A':65.3e-4, 'hi':152e-3, 'd':122e-3, 'FI':'M 24', 'Pmin':88e-3, 'Pmax':92e-3, 'AL':1.037, 'AG':20.25, 'Iz':3831e-8, 'Wzel':425.7e-6, 'Wzpl':481.4e-6, 'iz':7.66e-2, 'Avy':20.24e-4, 'Iy':1363e-8, 'Wyel':151.4e-6, 'Wypl':231e-6, 'iy':4.57e-2, 'Ss':54.07e-3, 'It':42.16e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_180_M']= {'nmb':'HE_180_M', 'P':88.9, 'h':200e-3, 'b':186e-3, 'tw':14.5e-3, 'tf':24e-3, 'r':15e-3, 'A':113.3e-4, 'hi':152e-3, 'd':122e-3, 'FI':'M 24', 'Pmin':94e-3, 'Pmax':98e-3, 'AL':1.089, 'AG':12.25, 'Iz':7483e-8, 'Wzel':748.3e-6, 'Wzpl':883.4e-6, 'iz':8.13e-2, 'Avy':34.65e-4, 'Iy':2580e-8, 'Wyel':277.4e-6, 'Wypl':425.2e-6, 'iy':4.77e-2, 'Ss':80.07e-3, 'It':203.3e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_200_AAdot']= {'nmb':'HE_200_AAdot', 'P':34.6, 'h':186e-3, 'b':200e-3, 'tw':5.5e-3, 'tf':8e-3, 'r':18e-3, 'A':44.1e-4, 'hi':170e-3, 'd':134e-3, 'FI':'M 27', 'Pmin':96e-3, 'Pmax':100e-3, 'AL':1.13, 'AG':32.62, 'Iz':2944e-8, 'Wzel':316.6e-6, 'Wzpl':347.1e-6, 'iz':8.17e-2, 'Avy':15.45e-4, 'Iy':1068e-8, 'Wyel':106.8e-6, 'Wypl':163.2e-6, 'iy':4.92e-2, 'Ss':42.59e-3, 'It':12.69e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_200_A']= {'nmb':'HE_200_A', 'P':42.3, 'h':190e-3, 'b':200e-3, 'tw':6.5e-3, 'tf':10e-3, 'r':18e-3, 'A':53.8e-4, 'hi':170e-3, 'd':134e-3, 'FI':'M 27', 'Pmin':98e-3, 'Pmax':100e-3, 'AL':1.136, 'AG':26.89, 'Iz':3692e-8, 'Wzel':388.6e-6, 'Wzpl':429.5e-6, 'iz':8.28e-2, 'Avy':18.08e-4, 'Iy':1336e-8, 'Wyel':133.6e-6, 'Wypl':203.8e-6, 'iy':4.98e-2, 'Ss':47.59e-3, 'It':20.98e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_200_B']= {'nmb':'HE_200_B', 'P':61.3, 'h':200e-3, 'b':200e-3, 'tw':9e-3, 'tf':15e-3, 'r':18e-3, 'A':78.1e-4, 'hi':170e-3, 'd':134e-3, 'FI':'M 27', 'Pmin':100e-3, 'Pmax':100e-3, 'AL':1.151, 'AG':18.78, 'Iz':5696e-8, 'Wzel':569.6e-6, 'Wzpl':642.5e-6, 'iz':8.54e-2, 'Avy':24.83e-4, 'Iy':2003e-8, 'Wyel':200.3e-6, 'Wypl':305.8e-6, 'iy':5.07e-2, 'Ss':60.09e-3, 'It':59.28e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_200_M']= {'nmb':'HE_200_M', 'P':103, 'h':220e-3, 'b':206e-3, 'tw':15e-3, 'tf':25e-3, 'r':18e-3, 'A':131.3e-4, 'hi':170e-3, 'd':134e-3, 'FI':'M 27', 'Pmin':106e-3, 'Pmax':106e-3, 'AL':1.203, 'AG':11.67, 'Iz':10640e-8, 'Wzel':967.4e-6, 'Wzpl':1135e-6, 'iz':9e-2, 'Avy':41.03e-4, 'Iy':3651e-8, 'Wyel':354.5e-6, 'Wypl':543.2e-6, 'iy':5.27e-2, 'Ss':86.09e-3, 'It':259.4e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_220_AAdot']= {'nmb':'HE_220_AAdot', 'P':40.4, 'h':205e-3, 'b':220e-3, 'tw':6e-3, 'tf':8.5e-3, 'r':18e-3, 'A':51.5e-4, 'hi':188e-3, 'd':152e-3, 'FI':'M 27', 'Pmin':98e-3, 'Pmax':118e-3, 'AL':1.247, 'AG':30.87, 'Iz':4170e-8, 'Wzel':406.9e-6, 'Wzpl':445.5e-6, 'iz':9e-2, 'Avy':17.63e-4, 'Iy':1510e-8, 'Wyel':137.3e-6, 'Wypl':209.3e-6, 'iy':5.42e-2, 'Ss':44.09e-3, 'It':15.93e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_220_A']= {'nmb':'HE_220_A', 'P':50.5, 'h':210e-3, 'b':220e-3, 'tw':7e-3, 'tf':11e-3, 'r':18e-3, 'A':64.3e-4, 'hi':188e-3, 'd':152e-3, 'FI':'M 27', 'Pmin':98e-3, 'Pmax':118e-3, 'AL':1.255, 'AG':24.85, 'Iz':5410e-8, 'Wzel':515.2e-6, 'Wzpl':568.5e-6, 'iz':9.17e-2, 'Avy':20.67e-4, 'Iy':1955e-8, 'Wyel':177.7e-6, 'Wypl':270.6e-6, 'iy':5.51e-2, 'Ss':50.09e-3, 'It':28.46e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_220_B']= {'nmb':'HE_220_B', 'P':71.5, 'h':220e-3, 'b':220e-3, 'tw':9.5e-3, 'tf':16e-3, 'r':18e-3, 'A':91e-4, 'hi':188e-3, 'd':152e-3, 'FI':'M 27', 'Pmin':100e-3, 'Pmax':118e-3, 'AL':1.27, 'AG':17.77, 'Iz':8091e-8, 'Wzel':735.5e-6, 'Wzpl':827e-6, 'iz':9.43e-2, 'Avy':27.92e-4, 'Iy':2843e-8, 'Wyel':258.5e-6, 'Wypl':393.9e-6, 'iy':5.59e-2, 'Ss':62.59e-3, 'It':76.57e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_220_M']= {'nmb':'HE_220_M', 'P':117, 'h':240e-3, 'b':226e-3, 'tw':15.5e-3, 'tf':26e-3, 'r':18e-3, 'A':149.4e-4, 'hi':188e-3, 'd':152e-3, 'FI':'M 27', 'Pmin':108e-3, 'Pmax':124e-3, 'AL':1.322, 'AG':11.27, 'Iz':14600e-8, 'Wzel':1217e-6, 'Wzpl':1419e-6, 'iz':9.89e-2, 'Avy':45.31e-4, 'Iy':5012e-8, 'Wyel':443.5e-6, 'Wypl':678.6e-6, 'iy':5.79e-2, 'Ss':88.59e-3, 'It':315.3e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_240_AAdot']= {'nmb':'HE_240_AAdot', 'P':47.4, 'h':224e-3, 'b':240e-3, 'tw':6.5e-3, 'tf':9e-3, 'r':21e-3, 'A':60.4e-4, 'hi':206e-3, 'd':164e-3, 'FI':'M 27', 'Pmin':104e-3, 'Pmax':138e-3, 'AL':1.359, 'AG':28.67, 'Iz':5835e-8, 'Wzel':521e-6, 'Wzpl':570.6e-6, 'iz':9.83e-2, 'Avy':21.54e-4, 'Iy':2077e-8, 'Wyel':173.1e-6, 'Wypl':264.4e-6, 'iy':5.87e-2, 'Ss':49.1e-3, 'It':22.98e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_240_A']= {'nmb':'HE_240_A', 'P':60.3, 'h':230e-3, 'b':240e-3, 'tw':7.5e-3, 'tf':12e-3, 'r':21e-3, 'A':76.8e-4, 'hi':206e-3, 'd':164e-3, 'FI':'M 27', 'Pmin':104e-3, 'Pmax':138e-3, 'AL':1.369, 'AG':22.7, 'Iz':7763e-8, 'Wzel':675.1e-6, 'Wzpl':744.6e-6, 'iz':10.05e-2, 'Avy':25.18e-4, 'Iy':2769e-8, 'Wyel':230.7e-6, 'Wypl':351.7e-6, 'iy':6e-2, 'Ss':56.1e-3, 'It':41.55e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_240_B']= {'nmb':'HE_240_B', 'P':83.2, 'h':240e-3, 'b':240e-3, 'tw':10e-3, 'tf':17e-3, 'r':21e-3, 'A':106e-4, 'hi':206e-3, 'd':164e-3, 'FI':'M 27', 'Pmin':108e-3, 'Pmax':138e-3, 'AL':1.384, 'AG':16.63, 'Iz':11260e-8, 'Wzel':938.3e-6, 'Wzpl':1053e-6, 'iz':10.31e-2, 'Avy':33.23e-4, 'Iy':3923e-8, 'Wyel':326.9e-6, 'Wypl':498.4e-6, 'iy':6.08e-2, 'Ss':68.6e-3, 'It':102.7e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_240_M']= {'nmb':'HE_240_M', 'P':157, 'h':270e-3, 'b':248e-3, 'tw':18e-3, 'tf':32e-3, 'r':21e-3, 'A':199.6e-4, 'hi':206e-3, 'd':164e-3, 'FI':'M 27', 'Pmin':116e-3, 'Pmax':146e-3, 'AL':1.46, 'AG':9.318, 'Iz':24290e-8, 'Wzel':1799e-6, 'Wzpl':2117e-6, 'iz':11.03e-2, 'Avy':60.07e-4, 'Iy':8153e-8, 'Wyel':657.5e-6, 'Wypl':1006e-6, 'iy':6.39e-2, 'Ss':106.6e-3, 'It':627.9e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_260_AAdot']= {'nmb':'HE_260_AAdot', 'P':54.1, 'h':244e-3, 'b':260e-3, 'tw':6.5e-3, 'tf':9.5e-3, 'r':24e-3, 'A':69e-4, 'hi':225e-3, 'd':177e-3, 'FI':'M 27', 'Pmin':110e-3, 'Pmax':158e-3, 'AL':1.474, 'AG':27.22, 'Iz':7981e-8, 'Wzel':654.1e-6, 'Wzpl':714.5e-6, 'iz':10.76e-2, 'Avy':24.75e-4, 'Iy':2788e-8, 'Wyel':214.5e-6, 'Wypl':327.7e-6, 'iy':6.36e-2, 'Ss':53.62e-3, 'It':30.31e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_260_A']= {'nmb':'HE_260_A', 'P':68.2, 'h':250e-3, 'b':260e-3, 'tw':7.5e-3, 'tf':12.5e-3, 'r':24e-3, 'A':86.8e-4, 'hi':225e-3, 'd':177e-3, 'FI':'M 27', 'Pmin':110e-3, 'Pmax':158e-3, 'AL':1.484, 'AG':21.77, 'Iz':10450e-8, 'Wzel':836.4e-6, 'Wzpl':919.8e-6, 'iz':10.97e-2, 'Avy':28.76e-4, 'Iy':3668e-8, 'Wyel':282.1e-6, 'Wypl':430.2e-6, 'iy':6.5e-2, 'Ss':60.62e-3, 'It':52.37e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_260_B']= {'nmb':'HE_260_B', 'P':93, 'h':260e-3, 'b':260e-3, 'tw':10e-3, 'tf':17.5e-3, 'r':24e-3, 'A':118.4e-4, 'hi':225e-3, 'd':177e-3, 'FI':'M 27', 'Pmin':114e-3, 'Pmax':158e-3, 'AL':1.499, 'AG':16.12, 'Iz':14920e-8, 'Wzel':1148e-6, 'Wzpl':1283e-6, 'iz':11.22e-2, 'Avy':37.59e-4, 'Iy':5135e-8, 'Wyel':395e-6, 'Wypl':602.2e-6, 'iy':6.58e-2, 'Ss':73.12e-3, 'It':123.8e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_260_M']= {'nmb':'HE_260_M', 'P':172, 'h':290e-3, 'b':268e-3, 'tw':18e-3, 'tf':32.5e-3, 'r':24e-3, 'A':219.6e-4, 'hi':225e-3, 'd':177e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':166e-3, 'AL':1.575, 'AG':9.133, 'Iz':31310e-8, 'Wzel':2159e-6, 'Wzpl':2524e-6, 'iz':11.94e-2, 'Avy':66.89e-4, 'Iy':10450e-8, 'Wyel':779.7e-6, 'Wypl':1192e-6, 'iy':6.9e-2, 'Ss':111.1e-3, 'It':719e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_280_AAdot']= {'nmb':'HE_280_AAdot', 'P':61.2, 'h':264e-3, 'b':280e-3, 'tw':7e-3, 'tf':10e-3, 'r':24e-3, 'A':78e-4, 'hi':244e-3, 'd':196e-3, 'FI':'M 27', 'Pmin':110e-3, 'Pmax':178e-3, 'AL':1.593, 'AG':26.01, 'Iz':10560e-8, 'Wzel':799.8e-6, 'Wzpl':873.1e-6, 'iz':11.63e-2, 'Avy':27.52e-4, 'Iy':3664e-8, 'Wyel':261.7e-6, 'Wypl':399.4e-6, 'iy':6.85e-2, 'Ss':55.12e-3, 'It':36.22e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_280_A']= {'nmb':'HE_280_A', 'P':76.4, 'h':270e-3, 'b':280e-3, 'tw':8e-3, 'tf':13e-3, 'r':24e-3, 'A':97.3e-4, 'hi':244e-3, 'd':196e-3, 'FI':'M 27', 'Pmin':112e-3, 'Pmax':178e-3, 'AL':1.603, 'AG':20.99, 'Iz':13670e-8, 'Wzel':1013e-6, 'Wzpl':1112e-6, 'iz':11.86e-2, 'Avy':31.74e-4, 'Iy':4763e-8, 'Wyel':340.2e-6, 'Wypl':518.1e-6, 'iy':7e-2, 'Ss':62.12e-3, 'It':62.1e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_280_B']= {'nmb':'HE_280_B', 'P':103, 'h':280e-3, 'b':280e-3, 'tw':10.5e-3, 'tf':18e-3, 'r':24e-3, 'A':131.4e-4, 'hi':244e-3, 'd':196e-3, 'FI':'M 27', 'Pmin':114e-3, 'Pmax':178e-3, 'AL':1.618, 'AG':15.69, 'Iz':19270e-8, 'Wzel':1376e-6, 'Wzpl':1534e-6, 'iz':12.11e-2, 'Avy':41.09e-4, 'Iy':6595e-8, 'Wyel':471e-6, 'Wypl':717.6e-6, 'iy':7.09e-2, 'Ss':74.62e-3, 'It':143.7e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_280_M']= {'nmb':'HE_280_M', 'P':189, 'h':310e-3, 'b':288e-3, 'tw':18.5e-3, 'tf':33e-3, 'r':24e-3, 'A':240.2e-4, 'hi':244e-3, 'd':196e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':186e-3, 'AL':1.694, 'AG':8.984, 'Iz':39550e-8, 'Wzel':2551e-6, 'Wzpl':2966e-6, 'iz':12.83e-2, 'Avy':72.03e-4, 'Iy':13160e-8, 'Wyel':914.1e-6, 'Wypl':1397e-6, 'iy':7.4e-2, 'Ss':112.6e-3, 'It':807.3e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_300_AAdot']= {'nmb':'HE_300_AAdot', 'P':69.8, 'h':283e-3, 'b':300e-3, 'tw':7.5e-3, 'tf':10.5e-3, 'r':27e-3, 'A':88.9e-4, 'hi':262e-3, 'd':208e-3, 'FI':'M 27', 'Pmin':116e-3, 'Pmax':198e-3, 'AL':1.705, 'AG':24.42, 'Iz':13800e-8, 'Wzel':975.6e-6, 'Wzpl':1065e-6, 'iz':12.46e-2, 'Avy':32.37e-4, 'Iy':4734e-8, 'Wyel':315.6e-6, 'Wypl':482.3e-6, 'iy':7.3e-2, 'Ss':60.13e-3, 'It':49.35e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_300_A']= {'nmb':'HE_300_A', 'P':88.3, 'h':290e-3, 'b':300e-3, 'tw':8.5e-3, 'tf':14e-3, 'r':27e-3, 'A':112.5e-4, 'hi':262e-3, 'd':208e-3, 'FI':'M 27', 'Pmin':118e-3, 'Pmax':198e-3, 'AL':1.717, 'AG':19.43, 'Iz':18260e-8, 'Wzel':1260e-6, 'Wzpl':1383e-6, 'iz':12.74e-2, 'Avy':37.28e-4, 'Iy':6310e-8, 'Wyel':420.6e-6, 'Wypl':641.2e-6, 'iy':7.49e-2, 'Ss':68.13e-3, 'It':85.17e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_300_B']= {'nmb':'HE_300_B', 'P':117, 'h':300e-3, 'b':300e-3, 'tw':11e-3, 'tf':19e-3, 'r':27e-3, 'A':149.1e-4, 'hi':262e-3, 'd':208e-3, 'FI':'M 27', 'Pmin':120e-3, 'Pmax':198e-3, 'AL':1.732, 'AG':14.8, 'Iz':25170e-8, 'Wzel':1678e-6, 'Wzpl':1869e-6, 'iz':12.99e-2, 'Avy':47.43e-4, 'Iy':8563e-8, 'Wyel':570.9e-6, 'Wypl':870.1e-6, 'iy':7.58e-2, 'Ss':80.63e-3, 'It':185e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_300_M']= {'nmb':'HE_300_M', 'P':238, 'h':340e-3, 'b':310e-3, 'tw':21e-3, 'tf':39e-3, 'r':27e-3, 'A':303.1e-4, 'hi':262e-3, 'd':208e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':208e-3, 'AL':1.832, 'AG':7.699, 'Iz':59200e-8, 'Wzel':3482e-6, 'Wzpl':4078e-6, 'iz':13.98e-2, 'Avy':90.53e-4, 'Iy':19400e-8, 'Wyel':1252e-6, 'Wypl':1913e-6, 'iy':8e-2, 'Ss':130.6e-3, 'It':1408e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_320_AAdot']= {'nmb':'HE_320_AAdot', 'P':74.2, 'h':301e-3, 'b':300e-3, 'tw':8e-3, 'tf':11e-3, 'r':27e-3, 'A':94.6e-4, 'hi':279e-3, 'd':225e-3, 'FI':'M 27', 'Pmin':118e-3, 'Pmax':198e-3, 'AL':1.74, 'AG':23.43, 'Iz':16450e-8, 'Wzel':1093e-6, 'Wzpl':1196e-6, 'iz':13.19e-2, 'Avy':35.4e-4, 'Iy':4959e-8, 'Wyel':330.6e-6, 'Wypl':505.7e-6, 'iy':7.24e-2, 'Ss':61.63e-3, 'It':55.87e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_320_A']= {'nmb':'HE_320_A', 'P':97.6, 'h':310e-3, 'b':300e-3, 'tw':9e-3, 'tf':15.5e-3, 'r':27e-3, 'A':124.4e-4, 'hi':279e-3, 'd':225e-3, 'FI':'M 27', 'Pmin':118e-3, 'Pmax':198e-3, 'AL':1.756, 'AG':17.98, 'Iz':22930e-8, 'Wzel':1479e-6, 'Wzpl':1628e-6, 'iz':13.58e-2, 'Avy':41.13e-4, 'Iy':6985e-8, 'Wyel':465.7e-6, 'Wypl':709.7e-6, 'iy':7.49e-2, 'Ss':71.63e-3, 'It':108e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_320_B']= {'nmb':'HE_320_B', 'P':127, 'h':320e-3, 'b':300e-3, 'tw':11.5e-3, 'tf':20.5e-3, 'r':27e-3, 'A':161.3e-4, 'hi':279e-3, 'd':225e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':1.771, 'AG':13.98, 'Iz':30820e-8, 'Wzel':1926e-6, 'Wzpl':2149e-6, 'iz':13.82e-2, 'Avy':51.77e-4, 'Iy':9239e-8, 'Wyel':615.9e-6, 'Wypl':939.1e-6, 'iy':7.57e-2, 'Ss':84.13e-3, 'It':225.1e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_320_M']= {'nmb':'HE_320_M', 'P':245, 'h':359e-3, 'b':309e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':312e-4, 'hi':279e-3, 'd':225e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':204e-3, 'AL':1.866, 'AG':7.616, 'Iz':68130e-8, 'Wzel':3796e-6, 'Wzpl':4435e-6, 'iz':14.78e-2, 'Avy':94.85e-4, 'Iy':19710e-8, 'Wyel':1276e-6, 'Wypl':1951e-6, 'iy':7.95e-2, 'Ss':132.6e-3, 'It':1501e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_340_AAdot']= {'nmb':'HE_340_AAdot', 'P':78.9, 'h':320e-3, 'b':300e-3, 'tw':8.5e-3, 'tf':11.5e-3, 'r':27e-3, 'A':100.5e-4, 'hi':297e-3, 'd':243e-3, 'FI':'M 27', 'Pmin':118e-3, 'Pmax':198e-3, 'AL':1.777, 'AG':22.52, 'Iz':19550e-8, 'Wzel':1222e-6, 'Wzpl':1341e-6, 'iz':13.95e-2, 'Avy':38.69e-4, 'Iy':5185e-8, 'Wyel':345.6e-6, 'Wypl':529.3e-6, 'iy':7.18e-2, 'Ss':63.13e-3, 'It':63.07e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_340_A']= {'nmb':'HE_340_A', 'P':105, 'h':330e-3, 'b':300e-3, 'tw':9.5e-3, 'tf':16.5e-3, 'r':27e-3, 'A':133.5e-4, 'hi':297e-3, 'd':243e-3, 'FI':'M 27', 'Pmin':118e-3, 'Pmax':198e-3, 'AL':1.795, 'AG':17.13, 'Iz':27690e-8, 'Wzel':1678e-6, 'Wzpl':1850e-6, 'iz':14.4e-2, 'Avy':44.95e-4, 'Iy':7436e-8, 'Wyel':495.7e-6, 'Wypl':755.9e-6, 'iy':7.46e-2, 'Ss':74.13e-3, 'It':127.2e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_340_B']= {'nmb':'HE_340_B', 'P':134, 'h':340e-3, 'b':300e-3, 'tw':12e-3, 'tf':21.5e-3, 'r':27e-3, 'A':170.9e-4, 'hi':297e-3, 'd':243e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':1.81, 'AG':13.49, 'Iz':36660e-8, 'Wzel':2156e-6, 'Wzpl':2408e-6, 'iz':14.65e-2, 'Avy':56.09e-4, 'Iy':9690e-8, 'Wyel':646e-6, 'Wypl':985.7e-6, 'iy':7.53e-2, 'Ss':86.63e-3, 'It':257.2e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_340_M']= {'nmb':'HE_340_M', 'P':248, 'h':377e-3, 'b':309e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':315.8e-4, 'hi':297e-3, 'd':243e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':204e-3, 'AL':1.902, 'AG':7.67, 'Iz':76370e-8, 'Wzel':4052e-6, 'Wzpl':4718e-6, 'iz':15.55e-2, 'Avy':98.63e-4, 'Iy':19710e-8, 'Wyel':1276e-6, 'Wypl':1953e-6, 'iy':7.9e-2, 'Ss':132.6e-3, 'It':1506e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_360_AAdot']= {'nmb':'HE_360_AAdot', 'P':83.7, 'h':339e-3, 'b':300e-3, 'tw':9e-3, 'tf':12e-3, 'r':27e-3, 'A':106.6e-4, 'hi':315e-3, 'd':261e-3, 'FI':'M 27', 'Pmin':118e-3, 'Pmax':198e-3, 'AL':1.814, 'AG':21.67, 'Iz':23040e-8, 'Wzel':1359e-6, 'Wzpl':1495e-6, 'iz':14.7e-2, 'Avy':42.17e-4, 'Iy':5410e-8, 'Wyel':360.7e-6, 'Wypl':553e-6, 'iy':7.12e-2, 'Ss':64.63e-3, 'It':70.99e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_360_A']= {'nmb':'HE_360_A', 'P':112, 'h':350e-3, 'b':300e-3, 'tw':10e-3, 'tf':17.5e-3, 'r':27e-3, 'A':142.8e-4, 'hi':315e-3, 'd':261e-3, 'FI':'M 27', 'Pmin':120e-3, 'Pmax':198e-3, 'AL':1.834, 'AG':16.36, 'Iz':33090e-8, 'Wzel':1891e-6, 'Wzpl':2088e-6, 'iz':15.22e-2, 'Avy':48.96e-4, 'Iy':7887e-8, 'Wyel':525.8e-6, 'Wypl':802.3e-6, 'iy':7.43e-2, 'Ss':76.63e-3, 'It':148.8e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_360_B']= {'nmb':'HE_360_B', 'P':142, 'h':360e-3, 'b':300e-3, 'tw':12.5e-3, 'tf':22.5e-3, 'r':27e-3, 'A':180.6e-4, 'hi':315e-3, 'd':261e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':1.849, 'AG':13.04, 'Iz':43190e-8, 'Wzel':2400e-6, 'Wzpl':2683e-6, 'iz':15.46e-2, 'Avy':60.6e-4, 'Iy':10140e-8, 'Wyel':676.1e-6, 'Wypl':1032e-6, 'iy':7.49e-2, 'Ss':89.13e-3, 'It':292.5e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_360_M']= {'nmb':'HE_360_M', 'P':250, 'h':395e-3, 'b':308e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':318.8e-4, 'hi':315e-3, 'd':261e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':204e-3, 'AL':1.934, 'AG':7.73, 'Iz':84870e-8, 'Wzel':4297e-6, 'Wzpl':4989e-6, 'iz':16.32e-2, 'Avy':102.4e-4, 'Iy':19520e-8, 'Wyel':1268e-6, 'Wypl':1942e-6, 'iy':7.83e-2, 'Ss':132.6e-3, 'It':1507e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_400_AAdot']= {'nmb':'HE_400_AAdot', 'P':92.4, 'h':378e-3, 'b':300e-3, 'tw':9.5e-3, 'tf':13e-3, 'r':27e-3, 'A':117.7e-4, 'hi':352e-3, 'd':298e-3, 'FI':'M 27', 'Pmin':118e-3, 'Pmax':198e-3, 'AL':1.891, 'AG':20.46, 'Iz':31250e-8, 'Wzel':1654e-6, 'Wzpl':1824e-6, 'iz':16.3e-2, 'Avy':47.95e-4, 'Iy':5861e-8, 'Wyel':390.8e-6, 'Wypl':599.7e-6, 'iy':7.06e-2, 'Ss':67.13e-3, 'It':84.69e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_400_A']= {'nmb':'HE_400_A', 'P':125, 'h':390e-3, 'b':300e-3, 'tw':11e-3, 'tf':19e-3, 'r':27e-3, 'A':159e-4, 'hi':352e-3, 'd':298e-3, 'FI':'M 27', 'Pmin':120e-3, 'Pmax':198e-3, 'AL':1.912, 'AG':15.32, 'Iz':45070e-8, 'Wzel':2311e-6, 'Wzpl':2562e-6, 'iz':16.84e-2, 'Avy':57.33e-4, 'Iy':8564e-8, 'Wyel':570.9e-6, 'Wypl':872.9e-6, 'iy':7.34e-2, 'Ss':80.63e-3, 'It':189e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_400_B']= {'nmb':'HE_400_B', 'P':155, 'h':400e-3, 'b':300e-3, 'tw':13.5e-3, 'tf':24e-3, 'r':27e-3, 'A':197.8e-4, 'hi':352e-3, 'd':298e-3, 'FI':'M 27', 'Pmin':124e-3, 'Pmax':198e-3, 'AL':1.927, 'AG':12.41, 'Iz':57680e-8, 'Wzel':2884e-6, 'Wzpl':3232e-6, 'iz':17.08e-2, 'Avy':69.98e-4, 'Iy':10820e-8, 'Wyel':721.3e-6, 'Wypl':1104e-6, 'iy':7.4e-2, 'Ss':93.13e-3, 'It':355.7e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_400_M']= {'nmb':'HE_400_M', 'P':256, 'h':432e-3, 'b':307e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':325.8e-4, 'hi':352e-3, 'd':298e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':202e-3, 'AL':2.004, 'AG':7.835, 'Iz':104100e-8, 'Wzel':4820e-6, 'Wzpl':5571e-6, 'iz':17.88e-2, 'Avy':110.2e-4, 'Iy':19340e-8, 'Wyel':1260e-6, 'Wypl':1934e-6, 'iy':7.7e-2, 'Ss':132.6e-3, 'It':1515e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_450_AAdot']= {'nmb':'HE_450_AAdot', 'P':99.7, 'h':425e-3, 'b':300e-3, 'tw':10e-3, 'tf':13.5e-3, 'r':27e-3, 'A':127.1e-4, 'hi':398e-3, 'd':344e-3, 'FI':'M 27', 'Pmin':120e-3, 'Pmax':198e-3, 'AL':1.984, 'AG':19.89, 'Iz':41890e-8, 'Wzel':1971e-6, 'Wzpl':2183e-6, 'iz':18.16e-2, 'Avy':54.7e-4, 'Iy':6088e-8, 'Wyel':405.8e-6, 'Wypl':624.4e-6, 'iy':6.92e-2, 'Ss':68.63e-3, 'It':95.61e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_450_A']= {'nmb':'HE_450_A', 'P':140, 'h':440e-3, 'b':300e-3, 'tw':11.5e-3, 'tf':21e-3, 'r':27e-3, 'A':178e-4, 'hi':398e-3, 'd':344e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':2.011, 'AG':14.39, 'Iz':63720e-8, 'Wzel':2896e-6, 'Wzpl':3216e-6, 'iz':18.92e-2, 'Avy':65.78e-4, 'Iy':9465e-8, 'Wyel':631e-6, 'Wypl':965.5e-6, 'iy':7.29e-2, 'Ss':85.13e-3, 'It':243.8e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_450_B']= {'nmb':'HE_450_B', 'P':171, 'h':450e-3, 'b':300e-3, 'tw':14e-3, 'tf':26e-3, 'r':27e-3, 'A':218e-4, 'hi':398e-3, 'd':344e-3, 'FI':'M 27', 'Pmin':124e-3, 'Pmax':198e-3, 'AL':2.026, 'AG':11.84, 'Iz':79890e-8, 'Wzel':3551e-6, 'Wzpl':3982e-6, 'iz':19.14e-2, 'Avy':79.66e-4, 'Iy':11720e-8, 'Wyel':781.4e-6, 'Wypl':1198e-6, 'iy':7.33e-2, 'Ss':97.63e-3, 'It':440.5e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_450_M']= {'nmb':'HE_450_M', 'P':263, 'h':478e-3, 'b':307e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':335.4e-4, 'hi':398e-3, 'd':344e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':202e-3, 'AL':2.096, 'AG':7.959, 'Iz':131500e-8, 'Wzel':5501e-6, 'Wzpl':6331e-6, 'iz':19.8e-2, 'Avy':119.8e-4, 'Iy':19340e-8, 'Wyel':1260e-6, 'Wypl':1939e-6, 'iy':7.59e-2, 'Ss':132.6e-3, 'It':1529e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_500_AAdot']= {'nmb':'HE_500_AAdot', 'P':107, 'h':472e-3, 'b':300e-3, 'tw':10.5e-3, 'tf':14e-3, 'r':27e-3, 'A':136.9e-4, 'hi':444e-3, 'd':390e-3, 'FI':'M 27', 'Pmin':120e-3, 'Pmax':198e-3, 'AL':2.077, 'AG':19.33, 'Iz':54640e-8, 'Wzel':2315e-6, 'Wzpl':2576e-6, 'iz':19.98e-2, 'Avy':61.91e-4, 'Iy':6314e-8, 'Wyel':420.9e-6, 'Wypl':649.3e-6, 'iy':6.79e-2, 'Ss':70.13e-3, 'It':107.7e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_500_A']= {'nmb':'HE_500_A', 'P':155, 'h':490e-3, 'b':300e-3, 'tw':12e-3, 'tf':23e-3, 'r':27e-3, 'A':197.5e-4, 'hi':444e-3, 'd':390e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':2.11, 'AG':13.6, 'Iz':86970e-8, 'Wzel':3550e-6, 'Wzpl':3949e-6, 'iz':20.98e-2, 'Avy':74.72e-4, 'Iy':10370e-8, 'Wyel':691.1e-6, 'Wypl':1059e-6, 'iy':7.24e-2, 'Ss':89.63e-3, 'It':309.3e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_500_B']= {'nmb':'HE_500_B', 'P':187, 'h':500e-3, 'b':300e-3, 'tw':14.5e-3, 'tf':28e-3, 'r':27e-3, 'A':238.6e-4, 'hi':444e-3, 'd':390e-3, 'FI':'M 27', 'Pmin':124e-3, 'Pmax':198e-3, 'AL':2.125, 'AG':11.34, 'Iz':107200e-8, 'Wzel':4287e-6, 'Wzpl':4815e-6, 'iz':21.19e-2, 'Avy':89.82e-4, 'Iy':12620e-8, 'Wyel':841.6e-6, 'Wypl':1292e-6, 'iy':7.27e-2, 'Ss':102.1e-3, 'It':538.4e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_500_M']= {'nmb':'HE_500_M', 'P':270, 'h':524e-3, 'b':306e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':344.3e-4, 'hi':444e-3, 'd':390e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':202e-3, 'AL':2.184, 'AG':8.079, 'Iz':161900e-8, 'Wzel':6180e-6, 'Wzpl':7094e-6, 'iz':21.69e-2, 'Avy':129.5e-4, 'Iy':19150e-8, 'Wyel':1252e-6, 'Wypl':1932e-6, 'iy':7.46e-2, 'Ss':132.6e-3, 'It':1539e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_550_AAdot']= {'nmb':'HE_550_AAdot', 'P':120, 'h':522e-3, 'b':300e-3, 'tw':11.5e-3, 'tf':15e-3, 'r':27e-3, 'A':152.8e-4, 'hi':492e-3, 'd':438e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':2.175, 'AG':18.13, 'Iz':72870e-8, 'Wzel':2792e-6, 'Wzpl':3128e-6, 'iz':21.84e-2, 'Avy':72.66e-4, 'Iy':6767e-8, 'Wyel':451.1e-6, 'Wypl':698.6e-6, 'iy':6.65e-2, 'Ss':73.13e-3, 'It':133.7e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_550_A']= {'nmb':'HE_550_A', 'P':166, 'h':540e-3, 'b':300e-3, 'tw':12.5e-3, 'tf':24e-3, 'r':27e-3, 'A':211.8e-4, 'hi':492e-3, 'd':438e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':2.209, 'AG':13.29, 'Iz':111900e-8, 'Wzel':4146e-6, 'Wzpl':4622e-6, 'iz':22.99e-2, 'Avy':83.72e-4, 'Iy':10820e-8, 'Wyel':721.3e-6, 'Wypl':1107e-6, 'iy':7.15e-2, 'Ss':92.13e-3, 'It':351.5e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_550_B']= {'nmb':'HE_550_B', 'P':199, 'h':550e-3, 'b':300e-3, 'tw':15e-3, 'tf':29e-3, 'r':27e-3, 'A':254.1e-4, 'hi':492e-3, 'd':438e-3, 'FI':'M 27', 'Pmin':124e-3, 'Pmax':198e-3, 'AL':2.224, 'AG':11.15, 'Iz':136700e-8, 'Wzel':4971e-6, 'Wzpl':5591e-6, 'iz':23.2e-2, 'Avy':100.1e-4, 'Iy':13080e-8, 'Wyel':871.8e-6, 'Wypl':1341e-6, 'iy':7.17e-2, 'Ss':104.6e-3, 'It':600.3e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_550_M']= {'nmb':'HE_550_M', 'P':278, 'h':572e-3, 'b':306e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':354.4e-4, 'hi':492e-3, 'd':438e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':202e-3, 'AL':2.28, 'AG':8.195, 'Iz':198000e-8, 'Wzel':6923e-6, 'Wzpl':7933e-6, 'iz':23.64e-2, 'Avy':139.6e-4, 'Iy':19160e-8, 'Wyel':1252e-6, 'Wypl':1937e-6, 'iy':7.35e-2, 'Ss':132.6e-3, 'It':1554e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_600_AAdot']= {'nmb':'HE_600_AAdot', 'P':129, 'h':571e-3, 'b':300e-3, 'tw':12e-3, 'tf':15.5e-3, 'r':27e-3, 'A':164.1e-4, 'hi':540e-3, 'd':486e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':2.272, 'AG':17.64, 'Iz':91900e-8, 'Wzel':3218e-6, 'Wzpl':3623e-6, 'iz':23.66e-2, 'Avy':81.29e-4, 'Iy':6993e-8, 'Wyel':466.2e-6, 'Wypl':724.5e-6, 'iy':6.53e-2, 'Ss':74.63e-3, 'It':149.8e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_600_A']= {'nmb':'HE_600_A', 'P':178, 'h':590e-3, 'b':300e-3, 'tw':13e-3, 'tf':25e-3, 'r':27e-3, 'A':226.5e-4, 'hi':540e-3, 'd':486e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':2.308, 'AG':12.98, 'Iz':141200e-8, 'Wzel':4787e-6, 'Wzpl':5350e-6, 'iz':24.97e-2, 'Avy':93.21e-4, 'Iy':11270e-8, 'Wyel':751.4e-6, 'Wypl':1156e-6, 'iy':7.05e-2, 'Ss':94.63e-3, 'It':397.8e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_600_B']= {'nmb':'HE_600_B', 'P':212, 'h':600e-3, 'b':300e-3, 'tw':15.5e-3, 'tf':30e-3, 'r':27e-3, 'A':270e-4, 'hi':540e-3, 'd':486e-3, 'FI':'M 27', 'Pmin':126e-3, 'Pmax':198e-3, 'AL':2.323, 'AG':10.96, 'Iz':171000e-8, 'Wzel':5701e-6, 'Wzpl':6425e-6, 'iz':25.17e-2, 'Avy':110.8e-4, 'Iy':13530e-8, 'Wyel':902e-6, 'Wypl':1391e-6, 'iy':7.08e-2, 'Ss':107.1e-3, 'It':667.2e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_600_M']= {'nmb':'HE_600_M', 'P':285, 'h':620e-3, 'b':305e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':363.7e-4, 'hi':540e-3, 'd':486e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':200e-3, 'AL':2.372, 'AG':8.308, 'Iz':237400e-8, 'Wzel':7660e-6, 'Wzpl':8772e-6, 'iz':25.55e-2, 'Avy':149.7e-4, 'Iy':18980e-8, 'Wyel':1244e-6, 'Wypl':1930e-6, 'iy':7.22e-2, 'Ss':132.6e-3, 'It':1564e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_600_x_337dot']= {'nmb':'HE_600_x_337dot', 'P':337, 'h':632e-3, 'b':310e-3, 'tw':25.5e-3, 'tf':46e-3, 'r':27e-3, 'A':429.2e-4, 'hi':540e-3, 'd':486e-3, 'FI':'M 27', 'Pmin':138e-3, 'Pmax':202e-3, 'AL':2.407, 'AG':7.144, 'Iz':283200e-8, 'Wzel':8961e-6, 'Wzpl':10380e-6, 'iz':25.69e-2, 'Avy':180.5e-4, 'Iy':22940e-8, 'Wyel':1480e-6, 'Wypl':2310e-6, 'iy':7.31e-2, 'Ss':149.1e-3, 'It':2451e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_600_x_399dot']= {'nmb':'HE_600_x_399dot', 'P':399, 'h':648e-3, 'b':315e-3, 'tw':30e-3, 'tf':54e-3, 'r':27e-3, 'A':508.5e-4, 'hi':540e-3, 'd':486e-3, 'FI':'M 27', 'Pmin':142e-3, 'Pmax':208e-3, 'AL':2.45, 'AG':6.137, 'Iz':344600e-8, 'Wzel':10640e-6, 'Wzpl':12460e-6, 'iz':26.03e-2, 'Avy':213.6e-4, 'Iy':28280e-8, 'Wyel':1796e-6, 'Wypl':2814e-6, 'iy':7.46e-2, 'Ss':169.6e-3, 'It':3966e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_650_AAdot']= {'nmb':'HE_650_AAdot', 'P':138, 'h':620e-3, 'b':300e-3, 'tw':12.5e-3, 'tf':16e-3, 'r':27e-3, 'A':175.8e-4, 'hi':588e-3, 'd':534e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':2.369, 'AG':17.17, 'Iz':113900e-8, 'Wzel':3676e-6, 'Wzpl':4160e-6, 'iz':25.46e-2, 'Avy':90.4e-4, 'Iy':7221e-8, 'Wyel':481.4e-6, 'Wypl':750.7e-6, 'iy':6.41e-2, 'Ss':76.13e-3, 'It':167.5e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_650_A']= {'nmb':'HE_650_A', 'P':190, 'h':640e-3, 'b':300e-3, 'tw':13.5e-3, 'tf':26e-3, 'r':27e-3, 'A':241.6e-4, 'hi':588e-3, 'd':534e-3, 'FI':'M 27', 'Pmin':124e-3, 'Pmax':198e-3, 'AL':2.407, 'AG':12.69, 'Iz':175200e-8, 'Wzel':5474e-6, 'Wzpl':6136e-6, 'iz':26.93e-2, 'Avy':103.2e-4, 'Iy':11720e-8, 'Wyel':781.6e-6, 'Wypl':1205e-6, 'iy':6.97e-2, 'Ss':97.13e-3, 'It':448.3e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_650_B']= {'nmb':'HE_650_B', 'P':225, 'h':650e-3, 'b':300e-3, 'tw':16e-3, 'tf':31e-3, 'r':27e-3, 'A':286.3e-4, 'hi':588e-3, 'd':534e-3, 'FI':'M 27', 'Pmin':126e-3, 'Pmax':198e-3, 'AL':2.422, 'AG':10.77, 'Iz':210600e-8, 'Wzel':6480e-6, 'Wzpl':7320e-6, 'iz':27.12e-2, 'Avy':122e-4, 'Iy':13980e-8, 'Wyel':932.3e-6, 'Wypl':1441e-6, 'iy':6.99e-2, 'Ss':109.6e-3, 'It':739.2e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_650_M']= {'nmb':'HE_650_M', 'P':293, 'h':668e-3, 'b':305e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':373.7e-4, 'hi':588e-3, 'd':534e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':200e-3, 'AL':2.468, 'AG':8.411, 'Iz':281700e-8, 'Wzel':8433e-6, 'Wzpl':9657e-6, 'iz':27.45e-2, 'Avy':159.7e-4, 'Iy':18980e-8, 'Wyel':1245e-6, 'Wypl':1936e-6, 'iy':7.13e-2, 'Ss':132.6e-3, 'It':1579e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_650_x_343dot']= {'nmb':'HE_650_x_343dot', 'P':343, 'h':680e-3, 'b':309e-3, 'tw':25e-3, 'tf':46e-3, 'r':27e-3, 'A':437.5e-4, 'hi':588e-3, 'd':534e-3, 'FI':'M 27', 'Pmin':138e-3, 'Pmax':202e-3, 'AL':2.5, 'AG':7.278, 'Iz':333700e-8, 'Wzel':9815e-6, 'Wzpl':11350e-6, 'iz':27.62e-2, 'Avy':189.6e-4, 'Iy':22720e-8, 'Wyel':1470e-6, 'Wypl':2300e-6, 'iy':7.21e-2, 'Ss':148.6e-3, 'It':2442e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_650_x_407dot']= {'nmb':'HE_650_x_407dot', 'P':407, 'h':696e-3, 'b':314e-3, 'tw':29.5e-3, 'tf':54e-3, 'r':27e-3, 'A':518.8e-4, 'hi':588e-3, 'd':534e-3, 'FI':'M 27', 'Pmin':142e-3, 'Pmax':206e-3, 'AL':2.543, 'AG':6.243, 'Iz':405400e-8, 'Wzel':11650e-6, 'Wzpl':13620e-6, 'iz':27.95e-2, 'Avy':224.8e-4, 'Iy':28020e-8, 'Wyel':1785e-6, 'Wypl':2803e-6, 'iy':7.35e-2, 'Ss':169.1e-3, 'It':3958e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_700_AAdot']= {'nmb':'HE_700_AAdot', 'P':150, 'h':670e-3, 'b':300e-3, 'tw':13e-3, 'tf':17e-3, 'r':27e-3, 'A':190.9e-4, 'hi':636e-3, 'd':582e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':198e-3, 'AL':2.468, 'AG':16.46, 'Iz':142700e-8, 'Wzel':4260e-6, 'Wzpl':4840e-6, 'iz':27.34e-2, 'Avy':100.3e-4, 'Iy':7673e-8, 'Wyel':511.5e-6, 'Wypl':799.7e-6, 'iy':6.34e-2, 'Ss':78.63e-3, 'It':195.2e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_700_A']= {'nmb':'HE_700_A', 'P':204, 'h':690e-3, 'b':300e-3, 'tw':14.5e-3, 'tf':27e-3, 'r':27e-3, 'A':260.5e-4, 'hi':636e-3, 'd':582e-3, 'FI':'M 27', 'Pmin':124e-3, 'Pmax':198e-3, 'AL':2.505, 'AG':12.25, 'Iz':215300e-8, 'Wzel':6241e-6, 'Wzpl':7032e-6, 'iz':28.75e-2, 'Avy':117e-4, 'Iy':12180e-8, 'Wyel':811.9e-6, 'Wypl':1257e-6, 'iy':6.84e-2, 'Ss':100.1e-3, 'It':513.9e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_700_B']= {'nmb':'HE_700_B', 'P':241, 'h':700e-3, 'b':300e-3, 'tw':17e-3, 'tf':32e-3, 'r':27e-3, 'A':306.4e-4, 'hi':636e-3, 'd':582e-3, 'FI':'M 27', 'Pmin':126e-3, 'Pmax':198e-3, 'AL':2.52, 'AG':10.48, 'Iz':256900e-8, 'Wzel':7340e-6, 'Wzpl':8327e-6, 'iz':28.96e-2, 'Avy':137.1e-4, 'Iy':14440e-8, 'Wyel':962.7e-6, 'Wypl':1495e-6, 'iy':6.87e-2, 'Ss':112.6e-3, 'It':830.9e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_700_M']= {'nmb':'HE_700_M', 'P':301, 'h':716e-3, 'b':304e-3, 'tw':21e-3, 'tf':40e-3, 'r':27e-3, 'A':383e-4, 'hi':636e-3, 'd':582e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':200e-3, 'AL':2.56, 'AG':8.513, 'Iz':329300e-8, 'Wzel':9198e-6, 'Wzpl':10540e-6, 'iz':29.32e-2, 'Avy':169.8e-4, 'Iy':18800e-8, 'Wyel':1237e-6, 'Wypl':1929e-6, 'iy':7.01e-2, 'Ss':132.6e-3, 'It':1589e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_700_x_352dot']= {'nmb':'HE_700_x_352dot', 'P':352, 'h':728e-3, 'b':308e-3, 'tw':25e-3, 'tf':46e-3, 'r':27e-3, 'A':448.6e-4, 'hi':636e-3, 'd':582e-3, 'FI':'M 27', 'Pmin':138e-3, 'Pmax':200e-3, 'AL':2.592, 'AG':7.359, 'Iz':389700e-8, 'Wzel':10710e-6, 'Wzpl':12390e-6, 'iz':29.47e-2, 'Avy':201.6e-4, 'Iy':22510e-8, 'Wyel':1461e-6, 'Wypl':2293e-6, 'iy':7.08e-2, 'Ss':148.6e-3, 'It':2461e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_700_x_418dot']= {'nmb':'HE_700_x_418dot', 'P':418, 'h':744e-3, 'b':313e-3, 'tw':29.5e-3, 'tf':54e-3, 'r':27e-3, 'A':531.9e-4, 'hi':636e-3, 'd':582e-3, 'FI':'M 27', 'Pmin':142e-3, 'Pmax':206e-3, 'AL':2.635, 'AG':6.31, 'Iz':472500e-8, 'Wzel':12700e-6, 'Wzpl':14840e-6, 'iz':29.8e-2, 'Avy':239e-4, 'Iy':27760e-8, 'Wyel':1774e-6, 'Wypl':2797e-6, 'iy':7.22e-2, 'Ss':169.1e-3, 'It':3989e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_800_AAdot']= {'nmb':'HE_800_AAdot', 'P':172, 'h':770e-3, 'b':300e-3, 'tw':14e-3, 'tf':18e-3, 'r':30e-3, 'A':218.5e-4, 'hi':734e-3, 'd':674e-3, 'FI':'M 27', 'Pmin':130e-3, 'Pmax':198e-3, 'AL':2.66, 'AG':15.51, 'Iz':208900e-8, 'Wzel':5426e-6, 'Wzpl':6225e-6, 'iz':30.92e-2, 'Avy':123.8e-4, 'Iy':8134e-8, 'Wyel':542.2e-6, 'Wypl':856.6e-6, 'iy':6.1e-2, 'Ss':85.15e-3, 'It':256.8e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_800_A']= {'nmb':'HE_800_A', 'P':224, 'h':790e-3, 'b':300e-3, 'tw':15e-3, 'tf':28e-3, 'r':30e-3, 'A':285.8e-4, 'hi':734e-3, 'd':674e-3, 'FI':'M 27', 'Pmin':130e-3, 'Pmax':198e-3, 'AL':2.698, 'AG':12.03, 'Iz':303400e-8, 'Wzel':7682e-6, 'Wzpl':8699e-6, 'iz':32.58e-2, 'Avy':138.8e-4, 'Iy':12640e-8, 'Wyel':842.6e-6, 'Wypl':1312e-6, 'iy':6.65e-2, 'Ss':106.1e-3, 'It':596.9e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_800_B']= {'nmb':'HE_800_B', 'P':262, 'h':800e-3, 'b':300e-3, 'tw':17.5e-3, 'tf':33e-3, 'r':30e-3, 'A':334.2e-4, 'hi':734e-3, 'd':674e-3, 'FI':'M 27', 'Pmin':134e-3, 'Pmax':198e-3, 'AL':2.713, 'AG':10.34, 'Iz':359100e-8, 'Wzel':8977e-6, 'Wzpl':10230e-6, 'iz':32.78e-2, 'Avy':161.8e-4, 'Iy':14900e-8, 'Wyel':993.6e-6, 'Wypl':1553e-6, 'iy':6.68e-2, 'Ss':118.6e-3, 'It':946e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_800_M']= {'nmb':'HE_800_M', 'P':317, 'h':814e-3, 'b':303e-3, 'tw':21e-3, 'tf':40e-3, 'r':30e-3, 'A':404.3e-4, 'hi':734e-3, 'd':674e-3, 'FI':'M 27', 'Pmin':138e-3, 'Pmax':198e-3, 'AL':2.746, 'AG':8.655, 'Iz':442600e-8, 'Wzel':10870e-6, 'Wzpl':12490e-6, 'iz':33.09e-2, 'Avy':194.3e-4, 'Iy':18630e-8, 'Wyel':1230e-6, 'Wypl':1930e-6, 'iy':6.79e-2, 'Ss':136.1e-3, 'It':1646e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_800_x_373dot']= {'nmb':'HE_800_x_373dot', 'P':373, 'h':826e-3, 'b':308e-3, 'tw':25e-3, 'tf':46e-3, 'r':30e-3, 'A':474.6e-4, 'hi':734e-3, 'd':674e-3, 'FI':'M 27', 'Pmin':144e-3, 'Pmax':200e-3, 'AL':2.782, 'AG':7.469, 'Iz':523900e-8, 'Wzel':12690e-6, 'Wzpl':14700e-6, 'iz':33.23e-2, 'Avy':230.3e-4, 'Iy':22530e-8, 'Wyel':1463e-6, 'Wypl':2311e-6, 'iy':6.89e-2, 'Ss':152.1e-3, 'It':2554e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_800_x_444dot']= {'nmb':'HE_800_x_444dot', 'P':444, 'h':842e-3, 'b':313e-3, 'tw':30e-3, 'tf':54e-3, 'r':30e-3, 'A':566e-4, 'hi':734e-3, 'd':674e-3, 'FI':'M 27', 'Pmin':148e-3, 'Pmax':206e-3, 'AL':2.824, 'AG':6.357, 'Iz':634500e-8, 'Wzel':15070e-6, 'Wzpl':17640e-6, 'iz':33.48e-2, 'Avy':276.5e-4, 'Iy':27800e-8, 'Wyel':1776e-6, 'Wypl':2827e-6, 'iy':7.01e-2, 'Ss':173.1e-3, 'It':4180e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_900_AAdot']= {'nmb':'HE_900_AAdot', 'P':198, 'h':870e-3, 'b':300e-3, 'tw':15e-3, 'tf':20e-3, 'r':30e-3, 'A':252.2e-4, 'hi':830e-3, 'd':770e-3, 'FI':'M 27', 'Pmin':130e-3, 'Pmax':198e-3, 'AL':2.858, 'AG':14.44, 'Iz':301100e-8, 'Wzel':6923e-6, 'Wzpl':7999e-6, 'iz':34.55e-2, 'Avy':147.2e-4, 'Iy':9041e-8, 'Wyel':602.8e-6, 'Wypl':957.7e-6, 'iy':5.99e-2, 'Ss':90.15e-3, 'It':334.9e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_900_A']= {'nmb':'HE_900_A', 'P':252, 'h':890e-3, 'b':300e-3, 'tw':16e-3, 'tf':30e-3, 'r':30e-3, 'A':320.5e-4, 'hi':830e-3, 'd':770e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':198e-3, 'AL':2.896, 'AG':11.51, 'Iz':422100e-8, 'Wzel':9485e-6, 'Wzpl':10810e-6, 'iz':36.29e-2, 'Avy':163.3e-4, 'Iy':13550e-8, 'Wyel':903.2e-6, 'Wypl':1414e-6, 'iy':6.5e-2, 'Ss':111.1e-3, 'It':736.8e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_900_B']= {'nmb':'HE_900_B', 'P':291, 'h':900e-3, 'b':300e-3, 'tw':18.5e-3, 'tf':35e-3, 'r':30e-3, 'A':371.3e-4, 'hi':830e-3, 'd':770e-3, 'FI':'M 27', 'Pmin':134e-3, 'Pmax':198e-3, 'AL':2.911, 'AG':9.99, 'Iz':494100e-8, 'Wzel':10980e-6, 'Wzpl':12580e-6, 'iz':36.48e-2, 'Avy':188.8e-4, 'Iy':15820e-8, 'Wyel':1054e-6, 'Wypl':1658e-6, 'iy':6.53e-2, 'Ss':123.6e-3, 'It':1137e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_900_M']= {'nmb':'HE_900_M', 'P':333, 'h':910e-3, 'b':302e-3, 'tw':21e-3, 'tf':40e-3, 'r':30e-3, 'A':423.6e-4, 'hi':830e-3, 'd':770e-3, 'FI':'M 27', 'Pmin':138e-3, 'Pmax':198e-3, 'AL':2.934, 'AG':8.824, 'Iz':570400e-8, 'Wzel':12540e-6, 'Wzpl':14440e-6, 'iz':36.7e-2, 'Avy':214.4e-4, 'Iy':18450e-8, 'Wyel':1222e-6, 'Wypl':1929e-6, 'iy':6.6e-2, 'Ss':136.1e-3, 'It':1671e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_900_x_391dot']= {'nmb':'HE_900_x_391dot', 'P':391, 'h':922e-3, 'b':307e-3, 'tw':25e-3, 'tf':46e-3, 'r':30e-3, 'A':497.7e-4, 'hi':830e-3, 'd':770e-3, 'FI':'M 27', 'Pmin':144e-3, 'Pmax':200e-3, 'AL':2.97, 'AG':7.604, 'Iz':674300e-8, 'Wzel':14630e-6, 'Wzpl':16990e-6, 'iz':36.81e-2, 'Avy':254.3e-4, 'Iy':22320e-8, 'Wyel':1454e-6, 'Wypl':2312e-6, 'iy':6.7e-2, 'Ss':152.1e-3, 'It':2597e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_900_x_466dot']= {'nmb':'HE_900_x_466dot', 'P':466, 'h':938e-3, 'b':312e-3, 'tw':30e-3, 'tf':54e-3, 'r':30e-3, 'A':593.7e-4, 'hi':830e-3, 'd':770e-3, 'FI':'M 27', 'Pmin':148e-3, 'Pmax':204e-3, 'AL':3.012, 'AG':6.464, 'Iz':814900e-8, 'Wzel':17380e-6, 'Wzpl':20380e-6, 'iz':37.05e-2, 'Avy':305.3e-4, 'Iy':27560e-8, 'Wyel':1767e-6, 'Wypl':2832e-6, 'iy':6.81e-2, 'Ss':173.1e-3, 'It':4256e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_AAdot']= {'nmb':'HE_1000_AAdot', 'P':222, 'h':970e-3, 'b':300e-3, 'tw':16e-3, 'tf':21e-3, 'r':30e-3, 'A':282.2e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':198e-3, 'AL':3.056, 'AG':13.8, 'Iz':406500e-8, 'Wzel':8380e-6, 'Wzpl':9777e-6, 'iz':37.95e-2, 'Avy':172.2e-4, 'Iy':9501e-8, 'Wyel':633.4e-6, 'Wypl':1016e-6, 'iy':5.8e-2, 'Ss':93.15e-3, 'It':403.4e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_x_249dot']= {'nmb':'HE_1000_x_249dot', 'P':249, 'h':980e-3, 'b':300e-3, 'tw':16.5e-3, 'tf':26e-3, 'r':30e-3, 'A':316.8e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':134e-3, 'Pmax':194e-3, 'AL':3.08, 'AG':12.37, 'Iz':481100e-8, 'Wzel':9818e-6, 'Wzpl':11350e-6, 'iz':38.97e-2, 'Avy':180.7e-4, 'Iy':11750e-8, 'Wyel':784e-6, 'Wypl':1245e-6, 'iy':6.09e-2, 'Ss':103.6e-3, 'It':584.4e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_A']= {'nmb':'HE_1000_A', 'P':272, 'h':990e-3, 'b':300e-3, 'tw':16.5e-3, 'tf':31e-3, 'r':30e-3, 'A':346.8e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':132e-3, 'Pmax':198e-3, 'AL':3.095, 'AG':11.37, 'Iz':553800e-8, 'Wzel':11190e-6, 'Wzpl':12820e-6, 'iz':39.96e-2, 'Avy':184.6e-4, 'Iy':14000e-8, 'Wyel':933.6e-6, 'Wypl':1470e-6, 'iy':6.35e-2, 'Ss':113.6e-3, 'It':822.4e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_B']= {'nmb':'HE_1000_B', 'P':314, 'h':1000e-3, 'b':300e-3, 'tw':19e-3, 'tf':36e-3, 'r':30e-3, 'A':400e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':134e-3, 'Pmax':198e-3, 'AL':3.11, 'AG':9.905, 'Iz':644700e-8, 'Wzel':12890e-6, 'Wzpl':14860e-6, 'iz':40.15e-2, 'Avy':212.5e-4, 'Iy':16280e-8, 'Wyel':1085e-6, 'Wypl':1716e-6, 'iy':6.38e-2, 'Ss':126.1e-3, 'It':1254e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_M']= {'nmb':'HE_1000_M', 'P':349, 'h':1008e-3, 'b':302e-3, 'tw':21e-3, 'tf':40e-3, 'r':30e-3, 'A':444.2e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':138e-3, 'Pmax':198e-3, 'AL':3.13, 'AG':8.978, 'Iz':722300e-8, 'Wzel':14330e-6, 'Wzpl':16570e-6, 'iz':40.32e-2, 'Avy':235e-4, 'Iy':18460e-8, 'Wyel':1222e-6, 'Wypl':1940e-6, 'iy':6.45e-2, 'Ss':136.1e-3, 'It':1701e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_x_393dot']= {'nmb':'HE_1000_x_393dot', 'P':393, 'h':1016e-3, 'b':303e-3, 'tw':24.4e-3, 'tf':43.9e-3, 'r':30e-3, 'A':500.2e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':142e-3, 'Pmax':198e-3, 'AL':3.14, 'AG':8.01, 'Iz':807700e-8, 'Wzel':15900e-6, 'Wzpl':18540e-6, 'iz':40.18e-2, 'Avy':271.3e-4, 'Iy':20500e-8, 'Wyel':1353e-6, 'Wypl':2168e-6, 'iy':6.4e-2, 'Ss':147.3e-3, 'It':2332e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_x_415dot']= {'nmb':'HE_1000_x_415dot', 'P':415, 'h':1020e-3, 'b':304e-3, 'tw':26e-3, 'tf':46e-3, 'r':30e-3, 'A':528.7e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':144e-3, 'Pmax':198e-3, 'AL':3.15, 'AG':7.6, 'Iz':853100e-8, 'Wzel':16728e-6, 'Wzpl':19571e-6, 'iz':40.17e-2, 'Avy':288.6e-4, 'Iy':21710e-8, 'Wyel':1428e-6, 'Wypl':2298e-6, 'iy':6.41e-2, 'Ss':153.1e-3, 'It':2713e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_x_438dot']= {'nmb':'HE_1000_x_438dot', 'P':437, 'h':1026e-3, 'b':305e-3, 'tw':26.9e-3, 'tf':49e-3, 'r':30e-3, 'A':557.2e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':146e-3, 'Pmax':198e-3, 'AL':3.17, 'AG':7.24, 'Iz':909800e-8, 'Wzel':17740e-6, 'Wzpl':20770e-6, 'iz':40.41e-2, 'Avy':300.9e-4, 'Iy':23360e-8, 'Wyel':1532e-6, 'Wypl':2464e-6, 'iy':6.47e-2, 'Ss':160.1e-3, 'It':3200e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_x_494dot']= {'nmb':'HE_1000_x_494dot', 'P':494, 'h':1036e-3, 'b':309e-3, 'tw':31e-3, 'tf':54e-3, 'r':30e-3, 'A':629.1e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':148e-3, 'Pmax':204e-3, 'AL':3.19, 'AG':6.47, 'Iz':1028000e-8, 'Wzel':19845e-6, 'Wzpl':23413e-6, 'iz':40.42e-2, 'Avy':344.5e-4, 'Iy':26820e-8, 'Wyel':1736e-6, 'Wypl':2818e-6, 'iy':6.53e-2, 'Ss':174.1e-3, 'It':4433e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HE_1000_x_584dot']= {'nmb':'HE_1000_x_584dot', 'P':584, 'h':1056e-3, 'b':314e-3, 'tw':36e-3, 'tf':64e-3, 'r':30e-3, 'A':743.7e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':154e-3, 'Pmax':208e-3, 'AL':3.24, 'AG':5.56, 'Iz':1246100e-8, 'Wzel':23600e-6, 'Wzpl':28039e-6, 'iz':40.93e-2, 'Avy':403.2e-4, 'Iy':33430e-8, 'Wyel':2130e-6, 'Wypl':3475e-6, 'iy':6.7e-2, 'Ss':199.1e-3, 'It':7230e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_345w']= {'nmb':'HL_920_x_345w', 'P':345, 'h':927e-3, 'b':418e-3, 'tw':19.3e-3, 'tf':32e-3, 'r':19e-3, 'A':437.2e-4, 'hi':863e-3, 'd':825e-3, 'FI':'M27', 'Pmin':126e-3, 'Pmax':312e-3, 'AL':3.45, 'AG':10.07, 'Iz':645000e-8, 'Wzel':13920e-6, 'Wzpl':15700e-6, 'iz':38.41e-2, 'Avy':188e-4, 'Iy':39010e-8, 'Wyel':1867e-6, 'Wypl':2880e-6, 'iy':9.45e-2, 'Ss':105.6e-3, 'It':1159e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_368w']= {'nmb':'HL_920_x_368w', 'P':368, 'h':931e-3, 'b':419e-3, 'tw':20.3e-3, 'tf':34.3e-3, 'r':19e-3, 'A':465.6e-4, 'hi':862.4e-3, 'd':824.4e-3, 'FI':'M27', 'Pmin':128e-3, 'Pmax':314e-3, 'AL':3.46, 'AG':9.48, 'Iz':692200e-8, 'Wzel':14870e-6, 'Wzpl':16790e-6, 'iz':38.56e-2, 'Avy':198.2e-4, 'Iy':42120e-8, 'Wyel':2010e-6, 'Wypl':3104e-6, 'iy':9.51e-2, 'Ss':111.2e-3, 'It':1408e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_390w']= {'nmb':'HL_920_x_390w', 'P':390, 'h':936e-3, 'b':420e-3, 'tw':21.3e-3, 'tf':36.6e-3, 'r':19e-3, 'A':494.3e-4, 'hi':862.8e-3, 'd':824.8e-3, 'FI':'M27', 'Pmin':128e-3, 'Pmax':314e-3, 'AL':3.48, 'AG':8.96, 'Iz':741700e-8, 'Wzel':15850e-6, 'Wzpl':17920e-6, 'iz':38.74e-2, 'Avy':208.6e-4, 'Iy':45270e-8, 'Wyel':2156e-6, 'Wypl':3331e-6, 'iy':9.57e-2, 'Ss':116.8e-3, 'It':1691e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_420w']= {'nmb':'HL_920_x_420w', 'P':420, 'h':943e-3, 'b':422e-3, 'tw':22.5e-3, 'tf':39.9e-3, 'r':19e-3, 'A':534.1e-4, 'hi':863.2e-3, 'd':825.2e-3, 'FI':'M27', 'Pmin':130e-3, 'Pmax':316e-3, 'AL':3.5, 'AG':8.34, 'Iz':813300e-8, 'Wzel':17250e-6, 'Wzpl':19530e-6, 'iz':39.02e-2, 'Avy':221.5e-4, 'Iy':50070e-8, 'Wyel':2373e-6, 'Wypl':3667e-6, 'iy':9.68e-2, 'Ss':124.6e-3, 'It':2151e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_449w']= {'nmb':'HL_920_x_449w', 'P':449, 'h':948e-3, 'b':423e-3, 'tw':24e-3, 'tf':42.7e-3, 'r':19e-3, 'A':571.4e-4, 'hi':862.6e-3, 'd':824.6e-3, 'FI':'M27', 'Pmin':130e-3, 'Pmax':318e-3, 'AL':3.51, 'AG':7.82, 'Iz':874700e-8, 'Wzel':18450e-6, 'Wzpl':20950e-6, 'iz':39.13e-2, 'Avy':236.6e-4, 'Iy':53970e-8, 'Wyel':2552e-6, 'Wypl':3949e-6, 'iy':9.72e-2, 'Ss':131.7e-3, 'It':2627e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_491w']= {'nmb':'HL_920_x_491w', 'P':491, 'h':957e-3, 'b':422e-3, 'tw':25.9e-3, 'tf':47e-3, 'r':19e-3, 'A':623.3e-4, 'hi':863e-3, 'd':825e-3, 'FI':'M27', 'Pmin':132e-3, 'Pmax':316e-3, 'AL':3.52, 'AG':7.19, 'Iz':966300e-8, 'Wzel':20200e-6, 'Wzpl':23000e-6, 'iz':39.37e-2, 'Avy':256.6e-4, 'Iy':59000e-8, 'Wyel':2796e-6, 'Wypl':4335e-6, 'iy':9.73e-2, 'Ss':142.2e-3, 'It':3441e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_537w']= {'nmb':'HL_920_x_537w', 'P':537, 'h':965e-3, 'b':425e-3, 'tw':28.4e-3, 'tf':51.1e-3, 'r':19e-3, 'A':682.5e-4, 'hi':862.8e-3, 'd':824.8e-3, 'FI':'M27', 'Pmin':136e-3, 'Pmax':320e-3, 'AL':3.54, 'AG':6.61, 'Iz':1066000e-8, 'Wzel':22080e-6, 'Wzpl':25270e-6, 'iz':39.51e-2, 'Avy':282.1e-4, 'Iy':65550e-8, 'Wyel':3085e-6, 'Wypl':4795e-6, 'iy':9.8e-2, 'Ss':152.9e-3, 'It':4447e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_588w']= {'nmb':'HL_920_x_588w', 'P':588, 'h':976e-3, 'b':427e-3, 'tw':31e-3, 'tf':55.9e-3, 'r':19e-3, 'A':748.4e-4, 'hi':864.2e-3, 'd':826.2e-3, 'FI':'M27', 'Pmin':138e-3, 'Pmax':322e-3, 'AL':3.57, 'AG':6.07, 'Iz':1184000e-8, 'Wzel':24260e-6, 'Wzpl':27880e-6, 'iz':39.78e-2, 'Avy':309.6e-4, 'Iy':72760e-8, 'Wyel':3408e-6, 'Wypl':5310e-6, 'iy':9.86e-2, 'Ss':165.1e-3, 'It':5808e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_656w']= {'nmb':'HL_920_x_656w', 'P':656, 'h':987e-3, 'b':431e-3, 'tw':34.5e-3, 'tf':62e-3, 'r':19e-3, 'A':835.3e-4, 'hi':863e-3, 'd':825e-3, 'FI':'M27', 'Pmin':144e-3, 'Pmax':320e-3, 'AL':3.6, 'AG':5.48, 'Iz':1335000e-8, 'Wzel':27060e-6, 'Wzpl':31270e-6, 'iz':39.98e-2, 'Avy':345.8e-4, 'Iy':83040e-8, 'Wyel':3853e-6, 'Wypl':6022e-6, 'iy':9.97e-2, 'Ss':180.8e-3, 'It':7950e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_725w']= {'nmb':'HL_920_x_725w', 'P':725, 'h':999e-3, 'b':434e-3, 'tw':38.1e-3, 'tf':68.1e-3, 'r':19e-3, 'A':922.9e-4, 'hi':862.8e-3, 'd':824.8e-3, 'FI':'M27', 'Pmin':148e-3, 'Pmax':323e-3, 'AL':3.63, 'AG':5, 'Iz':1492000e-8, 'Wzel':29880e-6, 'Wzpl':34740e-6, 'iz':40.21e-2, 'Avy':383.6e-4, 'Iy':93200e-8, 'Wyel':4295e-6, 'Wypl':6734e-6, 'iy':10.05e-2, 'Ss':196.6e-3, 'It':10570e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_787w']= {'nmb':'HL_920_x_787w', 'P':787, 'h':1011e-3, 'b':437e-3, 'tw':40.9e-3, 'tf':73.9e-3, 'r':19e-3, 'A':1002e-4, 'hi':863.2e-3, 'd':825.2e-3, 'FI':'M27', 'Pmin':152e-3, 'Pmax':326e-3, 'AL':3.66, 'AG':4.65, 'Iz':1646000e-8, 'Wzel':32560e-6, 'Wzpl':38010e-6, 'iz':40.53e-2, 'Avy':414.5e-4, 'Iy':103300e-8, 'Wyel':4728e-6, 'Wypl':7425e-6, 'iy':10.15e-2, 'Ss':211e-3, 'It':13430e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_920_x_970w']= {'nmb':'HL_920_x_970w', 'P':970, 'h':1043e-3, 'b':446e-3, 'tw':50e-3, 'tf':89.9e-3, 'r':19e-3, 'A':1236.6e-4, 'hi':863.2e-3, 'd':825.2e-3, 'FI':'M27', 'Pmin':160e-3, 'Pmax':334e-3, 'AL':3.74, 'AG':3.85, 'Iz':2100000e-8, 'Wzel':40270e-6, 'Wzpl':47660e-6, 'iz':41.21e-2, 'Avy':513.8e-4, 'Iy':133900e-8, 'Wyel':6002e-6, 'Wypl':9490e-6, 'iy':10.4e-2, 'Ss':252.1e-3, 'It':24320e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_AAdot']= {'nmb':'HL_1000_AAdot', 'P':296, 'h':982e-3, 'b':400e-3, 'tw':16.5e-3, 'tf':27e-3, 'r':30e-3, 'A':376.8e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':134e-3, 'Pmax':294e-3, 'AL':3.479, 'AG':11.76, 'Iz':618700e-8, 'Wzel':12600e-6, 'Wzpl':14220e-6, 'iz':40.52e-2, 'Avy':181.5e-4, 'Iy':28850e-8, 'Wyel':1443e-6, 'Wypl':2235e-6, 'iy':8.75e-2, 'Ss':105.6e-3, 'It':756.9e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_Adot']= {'nmb':'HL_1000_Adot', 'P':321, 'h':990e-3, 'b':400e-3, 'tw':16.5e-3, 'tf':31e-3, 'r':30e-3, 'A':408.8e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':134e-3, 'Pmax':294e-3, 'AL':3.495, 'AG':10.89, 'Iz':696400e-8, 'Wzel':14070e-6, 'Wzpl':15800e-6, 'iz':41.27e-2, 'Avy':184.6e-4, 'Iy':33120e-8, 'Wyel':1656e-6, 'Wypl':2555e-6, 'iy':9e-2, 'Ss':113.6e-3, 'It':1021e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_Bdot']= {'nmb':'HL_1000_Bdot', 'P':371, 'h':1000e-3, 'b':400e-3, 'tw':19e-3, 'tf':36e-3, 'r':30e-3, 'A':472e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':136e-3, 'Pmax':294e-3, 'AL':3.51, 'AG':9.474, 'Iz':812100e-8, 'Wzel':16240e-6, 'Wzpl':18330e-6, 'iz':41.48e-2, 'Avy':212.5e-4, 'Iy':38480e-8, 'Wyel':1924e-6, 'Wypl':2976e-6, 'iy':9.03e-2, 'Ss':126.1e-3, 'It':1565e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_Mdot']= {'nmb':'HL_1000_Mdot', 'P':412, 'h':1008e-3, 'b':402e-3, 'tw':21e-3, 'tf':40e-3, 'r':30e-3, 'A':524.2e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':142e-3, 'Pmax':290e-3, 'AL':3.53, 'AG':8.58, 'Iz':909800e-8, 'Wzel':18050e-6, 'Wzpl':20440e-6, 'iz':41.66e-2, 'Avy':235e-4, 'Iy':43410e-8, 'Wyel':2160e-6, 'Wypl':3348e-6, 'iy':9.1e-2, 'Ss':136.1e-3, 'It':2128e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_x_443dot']= {'nmb':'HL_1000_x_443dot', 'P':443, 'h':1012e-3, 'b':402e-3, 'tw':23.6e-3, 'tf':41.9e-3, 'r':30e-3, 'A':563.7e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M27', 'Pmin':142e-3, 'Pmax':296e-3, 'AL':3.53, 'AG':7.99, 'Iz':966510e-8, 'Wzel':19101e-6, 'Wzpl':21777e-6, 'iz':41.41e-2, 'Avy':261.8e-4, 'Iy':45500e-8, 'Wyel':2264e-6, 'Wypl':3529e-6, 'iy':8.98e-2, 'Ss':142.5e-3, 'It':2545e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_x_483dot']= {'nmb':'HL_1000_x_483dot', 'P':483, 'h':1020e-3, 'b':404e-3, 'tw':25.4e-3, 'tf':46e-3, 'r':30e-3, 'A':615.1e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':144e-3, 'Pmax':298e-3, 'AL':3.55, 'AG':7.36, 'Iz':1067480e-8, 'Wzel':20931e-6, 'Wzpl':23923e-6, 'iz':41.66e-2, 'Avy':282.7e-4, 'Iy':50710e-8, 'Wyel':2510e-6, 'Wypl':3919e-6, 'iy':9.08e-2, 'Ss':152.5e-3, 'It':3311e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_x_539dot']= {'nmb':'HL_1000_x_539dot', 'P':539, 'h':1030e-3, 'b':407e-3, 'tw':28.4e-3, 'tf':51.1e-3, 'r':30e-3, 'A':687.2e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':146e-3, 'Pmax':302e-3, 'AL':3.58, 'AG':6.64, 'Iz':1202540e-8, 'Wzel':23350e-6, 'Wzpl':26824e-6, 'iz':41.83e-2, 'Avy':316.4e-4, 'Iy':57630e-8, 'Wyel':2832e-6, 'Wypl':4436e-6, 'iy':9.16e-2, 'Ss':165.7e-3, 'It':4546e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_x_554dot']= {'nmb':'HL_1000_x_554dot', 'P':554, 'h':1032e-3, 'b':408e-3, 'tw':29.5e-3, 'tf':52e-3, 'r':30e-3, 'A':705.8e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':150e-3, 'Pmax':296e-3, 'AL':3.59, 'AG':6.47, 'Iz':1232000e-8, 'Wzel':23880e-6, 'Wzpl':27500e-6, 'iz':41.79e-2, 'Avy':328e-4, 'Iy':59100e-8, 'Wyel':2897e-6, 'Wypl':4547e-6, 'iy':9.15e-2, 'Ss':168.6e-3, 'It':4860e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_x_591dot']= {'nmb':'HL_1000_x_591dot', 'P':591, 'h':1040e-3, 'b':409e-3, 'tw':31e-3, 'tf':55.9e-3, 'r':30e-3, 'A':752.7e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':148e-3, 'Pmax':304e-3, 'AL':3.6, 'AG':6.1, 'Iz':1331040e-8, 'Wzel':25597e-6, 'Wzpl':29530e-6, 'iz':42.05e-2, 'Avy':346.3e-4, 'Iy':64010e-8, 'Wyel':3130e-6, 'Wypl':4916e-6, 'iy':9.22e-2, 'Ss':177.9e-3, 'It':5927e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_x_642dot']= {'nmb':'HL_1000_x_642dot', 'P':642, 'h':1048e-3, 'b':412e-3, 'tw':34e-3, 'tf':60e-3, 'r':30e-3, 'A':817.6e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':154e-3, 'Pmax':300e-3, 'AL':3.62, 'AG':5.65, 'Iz':1451000e-8, 'Wzel':27680e-6, 'Wzpl':32100e-6, 'iz':42.12e-2, 'Avy':379.6e-4, 'Iy':70280e-8, 'Wyel':3412e-6, 'Wypl':5379e-6, 'iy':9.27e-2, 'Ss':189.1e-3, 'It':7440e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_x_748dot']= {'nmb':'HL_1000_x_748dot', 'P':748, 'h':1068e-3, 'b':417e-3, 'tw':39e-3, 'tf':70e-3, 'r':30e-3, 'A':953.4e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':160e-3, 'Pmax':304e-3, 'AL':3.67, 'AG':4.91, 'Iz':1732000e-8, 'Wzel':32430e-6, 'Wzpl':37880e-6, 'iz':42.62e-2, 'Avy':438.9e-4, 'Iy':85111e-8, 'Wyel':4082e-6, 'Wypl':6459e-6, 'iy':9.45e-2, 'Ss':214.1e-3, 'It':11670e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1000_x_883dot']= {'nmb':'HL_1000_x_883dot', 'P':883, 'h':1092e-3, 'b':424e-3, 'tw':45.5e-3, 'tf':82e-3, 'r':30e-3, 'A':1125.3e-4, 'hi':928e-3, 'd':868e-3, 'FI':'M 27', 'Pmin':166e-3, 'Pmax':312e-3, 'AL':3.74, 'AG':4.23, 'Iz':2096000e-8, 'Wzel':38390e-6, 'Wzpl':45260e-6, 'iz':43.16e-2, 'Avy':516.5e-4, 'Iy':105000e-8, 'Wyel':4952e-6, 'Wypl':7874e-6, 'iy':9.66e-2, 'Ss':244.6e-3, 'It':18750e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1100_Adot']= {'nmb':'HL_1100_Adot', 'P':343, 'h':1090e-3, 'b':400e-3, 'tw':18e-3, 'tf':31e-3, 'r':20e-3, 'A':436.5e-4, 'hi':1028e-3, 'd':988e-3, 'FI':'M 27', 'Pmin':116e-3, 'Pmax':294e-3, 'AL':3.71, 'AG':10.83, 'Iz':867400e-8, 'Wzel':15920e-6, 'Wzpl':18060e-6, 'iz':44.58e-2, 'Avy':206.5e-4, 'Iy':33120e-8, 'Wyel':1656e-6, 'Wypl':2568e-6, 'iy':8.71e-2, 'Ss':103.4e-3, 'It':1037e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1100_Bdot']= {'nmb':'HL_1100_Bdot', 'P':390, 'h':1100e-3, 'b':400e-3, 'tw':20e-3, 'tf':36e-3, 'r':20e-3, 'A':497e-4, 'hi':1028e-3, 'd':988e-3, 'FI':'M 27', 'Pmin':118e-3, 'Pmax':294e-3, 'AL':3.726, 'AG':9.549, 'Iz':1005000e-8, 'Wzel':18280e-6, 'Wzpl':20780e-6, 'iz':44.98e-2, 'Avy':230.6e-4, 'Iy':38480e-8, 'Wyel':1924e-6, 'Wypl':2988e-6, 'iy':8.8e-2, 'Ss':115.4e-3, 'It':1564e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1100_Mdot']= {'nmb':'HL_1100_Mdot', 'P':433, 'h':1108e-3, 'b':402e-3, 'tw':22e-3, 'tf':40e-3, 'r':20e-3, 'A':551.2e-4, 'hi':1028e-3, 'd':988e-3, 'FI':'M 27', 'Pmin':122e-3, 'Pmax':290e-3, 'AL':3.746, 'AG':8.657, 'Iz':1126000e-8, 'Wzel':20320e-6, 'Wzpl':23160e-6, 'iz':45.19e-2, 'Avy':254.4e-4, 'Iy':43410e-8, 'Wyel':2160e-6, 'Wypl':3362e-6, 'iy':8.87e-2, 'Ss':125.4e-3, 'It':2130e-8, 'E':2.1e+11, 'nu':0.3}
-HE['HL_1100_Rdot']= {'nmb':'HL_1100_Rdot', 'P':499, 'h':1118e-3, 'b':405e-3, 'tw':26e-3, 'tf':45e-3, 'r':20e-3, 'A':635.2e-4, 'hi':1028e-3, 'd':988e-3, 'FI':'M 27', 'Pmin':126e-3, 'Pmax':294e-3, 'AL':3.77, 'AG':7.56, 'Iz':1294000e-8, 'Wzel':23150e-6, 'Wzpl':26600e-6, 'iz':45.14e-2, 'Avy':300.4e-4, 'Iy':49980e-8, 'Wyel':2468e-6, 'Wypl':3870e-6, 'iy':8.87e-2, 'Ss':139.4e-3, 'It':3135e-8, 'E':2.1e+11, 'nu':0.3}
-
-for item in HE:
-    shape= HE[item]
+
+def setHEDerivedValues(shape):
+    '''Compute the properties of the HE shapes that are not in the table.'''
     Avy= shape['Avy']
     A= shape['A']
     E= shape['E']
@@ -402,6 +169,8 @@ for item in HE:
     shape['AreaQy']= A-2*b*tf+(tw+2*r)*tf
     shape['AreaQz']= A-hi*tw
 
+HE= shape_table.ShapeTable('arcelor_HE',setHEDerivedValues)
+
 # Arcelor UPN steel shapes.
 
 # Cross section axis:
@@ -425,27 +194,8 @@ for item in HE:
 # are swapped with respect to those in the catalog.
 
 
-UPN= {}
-
-UPN['UPN_80']= {'nmb':'UPN_80', 'P':8.65, 'h':80e-3, 'b':45e-3, 'tw':6e-3, 'tf':8e-3, 'r1':8e-3, 'r2':4e-3, 'A':11.02e-4, 'd':47e-3, 'FI':'-', 'Pmin': None, 'Pmax': None, 'AL':0.321, 'AG':37.1, 'Iz':106e-8, 'Wzel':26.6e-6, 'Wzpl':32.3e-6, 'iz':3.1e-2, 'Avy':4.9e-4, 'Iy':19.4e-8, 'Wyel':6.38e-6, 'Wypl':11.9e-6, 'iy':1.33e-2, 'Ss':19.4e-3, 'It':2.2e-8, 'Iw':0.18e-16, 'zs':1.42e-2, 'zm':2.65e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_100']= {'nmb':'UPN_100', 'P':10.6, 'h':100e-3, 'b':50e-3, 'tw':6e-3, 'tf':8.5e-3, 'r1':8.5e-3, 'r2':4.5e-3, 'A':13.5e-4, 'd':64e-3, 'FI':'-', 'Pmin': None, 'Pmax': None, 'AL':0.372, 'AG':35.1, 'Iz':206e-8, 'Wzel':41.2e-6, 'Wzpl':49e-6, 'iz':3.91e-2, 'Avy':6.46e-4, 'Iy':29.3e-8, 'Wyel':8.49e-6, 'Wypl':16.2e-6, 'iy':1.47e-2, 'Ss':20.3e-3, 'It':2.81e-8, 'Iw':0.41e-16, 'zs':1.55e-2, 'zm':2.93e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_120']= {'nmb':'UPN_120', 'P':13.4, 'h':120e-3, 'b':55e-3, 'tw':7e-3, 'tf':9e-3, 'r1':9e-3, 'r2':4.5e-3, 'A':17e-4, 'd':82e-3, 'FI':'-', 'Pmin': None, 'Pmax': None, 'AL':0.434, 'AG':32.52, 'Iz':364e-8, 'Wzel':60.7e-6, 'Wzpl':72.6e-6, 'iz':4.62e-2, 'Avy':8.8e-4, 'Iy':43.2e-8, 'Wyel':11.1e-6, 'Wypl':21.2e-6, 'iy':1.59e-2, 'Ss':22.2e-3, 'It':4.15e-8, 'Iw':0.9e-16, 'zs':1.6e-2, 'zm':3.03e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_140']= {'nmb':'UPN_140', 'P':16, 'h':140e-3, 'b':60e-3, 'tw':7e-3, 'tf':10e-3, 'r1':10e-3, 'r2':5e-3, 'A':20.4e-4, 'd':98e-3, 'FI':'M 12', 'Pmin':33e-3, 'Pmax':37e-3, 'AL':0.489, 'AG':30.54, 'Iz':605e-8, 'Wzel':86.4e-6, 'Wzpl':103e-6, 'iz':5.45e-2, 'Avy':10.41e-4, 'Iy':62.7e-8, 'Wyel':14.8e-6, 'Wypl':28.3e-6, 'iy':1.75e-2, 'Ss':23.9e-3, 'It':5.68e-8, 'Iw':1.8e-16, 'zs':1.75e-2, 'zm':3.37e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_160']= {'nmb':'UPN_160', 'P':18.8, 'h':160e-3, 'b':65e-3, 'tw':7.5e-3, 'tf':10.5e-3, 'r1':10.5e-3, 'r2':5.5e-3, 'A':24e-4, 'd':115e-3, 'FI':'M 12', 'Pmin':34e-3, 'Pmax':42e-3, 'AL':0.546, 'AG':28.98, 'Iz':925e-8, 'Wzel':116e-6, 'Wzpl':138e-6, 'iz':6.21e-2, 'Avy':12.6e-4, 'Iy':85.3e-8, 'Wyel':18.3e-6, 'Wypl':35.2e-6, 'iy':1.89e-2, 'Ss':25.3e-3, 'It':7.39e-8, 'Iw':3.26e-16, 'zs':1.84e-2, 'zm':3.56e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_180']= {'nmb':'UPN_180', 'P':22, 'h':180e-3, 'b':70e-3, 'tw':8e-3, 'tf':11e-3, 'r1':11e-3, 'r2':5.5e-3, 'A':28e-4, 'd':133e-3, 'FI':'M 16', 'Pmin':38e-3, 'Pmax':41e-3, 'AL':0.611, 'AG':27.8, 'Iz':1350e-8, 'Wzel':150e-6, 'Wzpl':179e-6, 'iz':6.95e-2, 'Avy':15.09e-4, 'Iy':114e-8, 'Wyel':22.4e-6, 'Wypl':42.9e-6, 'iy':2.02e-2, 'Ss':26.7e-3, 'It':9.55e-8, 'Iw':5.57e-16, 'zs':1.92e-2, 'zm':3.75e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_200']= {'nmb':'UPN_200', 'P':25.3, 'h':200e-3, 'b':75e-3, 'tw':8.5e-3, 'tf':11.5e-3, 'r1':11.5e-3, 'r2':6e-3, 'A':32.2e-4, 'd':151e-3, 'FI':'M 16', 'Pmin':39e-3, 'Pmax':46e-3, 'AL':0.661, 'AG':26.15, 'Iz':1910e-8, 'Wzel':191e-6, 'Wzpl':228e-6, 'iz':7.7e-2, 'Avy':17.71e-4, 'Iy':148e-8, 'Wyel':27e-6, 'Wypl':51.8e-6, 'iy':2.14e-2, 'Ss':28.1e-3, 'It':11.9e-8, 'Iw':9.07e-16, 'zs':2.01e-2, 'zm':3.94e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_220']= {'nmb':'UPN_220', 'P':29.4, 'h':220e-3, 'b':80e-3, 'tw':9e-3, 'tf':12.5e-3, 'r1':12.5e-3, 'r2':6.5e-3, 'A':37.4e-4, 'd':167e-3, 'FI':'M 16', 'Pmin':40e-3, 'Pmax':51e-3, 'AL':0.718, 'AG':24.46, 'Iz':2690e-8, 'Wzel':245e-6, 'Wzpl':292e-6, 'iz':8.48e-2, 'Avy':20.62e-4, 'Iy':197e-8, 'Wyel':33.6e-6, 'Wypl':64.1e-6, 'iy':2.3e-2, 'Ss':30.3e-3, 'It':16e-8, 'Iw':14.6e-16, 'zs':2.14e-2, 'zm':4.2e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_240']= {'nmb':'UPN_240', 'P':33.2, 'h':240e-3, 'b':85e-3, 'tw':9.5e-3, 'tf':13e-3, 'r1':13e-3, 'r2':6.5e-3, 'A':42.3e-4, 'd':184e-3, 'FI':'M 20', 'Pmin':46e-3, 'Pmax':50e-3, 'AL':0.775, 'AG':23.34, 'Iz':3600e-8, 'Wzel':300e-6, 'Wzpl':358e-6, 'iz':9.22e-2, 'Avy':23.71e-4, 'Iy':248e-8, 'Wyel':39.6e-6, 'Wypl':75.7e-6, 'iy':2.42e-2, 'Ss':31.7e-3, 'It':19.7e-8, 'Iw':22.1e-16, 'zs':2.23e-2, 'zm':4.39e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_260']= {'nmb':'UPN_260', 'P':37.9, 'h':260e-3, 'b':90e-3, 'tw':10e-3, 'tf':14e-3, 'r1':14e-3, 'r2':7e-3, 'A':48.3e-4, 'd':200e-3, 'FI':'M 22', 'Pmin':50e-3, 'Pmax':52e-3, 'AL':0.834, 'AG':22, 'Iz':4820e-8, 'Wzel':371e-6, 'Wzpl':442e-6, 'iz':9.99e-2, 'Avy':27.12e-4, 'Iy':317e-8, 'Wyel':47.7e-6, 'Wypl':91.6e-6, 'iy':2.56e-2, 'Ss':33.9e-3, 'It':25.5e-8, 'Iw':33.3e-16, 'zs':2.36e-2, 'zm':4.66e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_280']= {'nmb':'UPN_280', 'P':41.8, 'h':280e-3, 'b':95e-3, 'tw':10e-3, 'tf':15e-3, 'r1':15e-3, 'r2':7.5e-3, 'A':53.3e-4, 'd':216e-3, 'FI':'M 22', 'Pmin':52e-3, 'Pmax':57e-3, 'AL':0.89, 'AG':21.27, 'Iz':6280e-8, 'Wzel':448e-6, 'Wzpl':532e-6, 'iz':10.9e-2, 'Avy':29.28e-4, 'Iy':399e-8, 'Wyel':57.2e-6, 'Wypl':109e-6, 'iy':2.74e-2, 'Ss':35.6e-3, 'It':31e-8, 'Iw':48.5e-16, 'zs':2.53e-2, 'zm':5.02e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_300']= {'nmb':'UPN_300', 'P':46.2, 'h':300e-3, 'b':100e-3, 'tw':10e-3, 'tf':16e-3, 'r1':16e-3, 'r2':8e-3, 'A':58.8e-4, 'd':232e-3, 'FI':'M 24', 'Pmin':55e-3, 'Pmax':59e-3, 'AL':0.95, 'AG':20.58, 'Iz':8030e-8, 'Wzel':535e-6, 'Wzpl':632e-6, 'iz':11.7e-2, 'Avy':31.77e-4, 'Iy':495e-8, 'Wyel':67.8e-6, 'Wypl':130e-6, 'iy':2.9e-2, 'Ss':37.3e-3, 'It':37.4e-8, 'Iw':69.1e-16, 'zs':2.7e-2, 'zm':5.41e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_320']= {'nmb':'UPN_320', 'P':59.5, 'h':320e-3, 'b':100e-3, 'tw':14e-3, 'tf':17.5e-3, 'r1':17.5e-3, 'r2':8.75e-3, 'A':75.8e-4, 'd':246e-3, 'FI':'M 22', 'Pmin':58e-3, 'Pmax':62e-3, 'AL':0.982, 'AG':16.5, 'Iz':10870e-8, 'Wzel':679e-6, 'Wzpl':826e-6, 'iz':12.1e-2, 'Avy':47.11e-4, 'Iy':597e-8, 'Wyel':80.6e-6, 'Wypl':152e-6, 'iy':2.81e-2, 'Ss':43e-3, 'It':66.7e-8, 'Iw':96.1e-16, 'zs':2.6e-2, 'zm':4.82e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_350']= {'nmb':'UPN_350', 'P':60.6, 'h':350e-3, 'b':100e-3, 'tw':14e-3, 'tf':16e-3, 'r1':16e-3, 'r2':8e-3, 'A':77.3e-4, 'd':282e-3, 'FI':'M 22', 'Pmin':56e-3, 'Pmax':62e-3, 'AL':1.047, 'AG':17.25, 'Iz':12840e-8, 'Wzel':734e-6, 'Wzpl':918e-6, 'iz':12.9e-2, 'Avy':50.84e-4, 'Iy':570e-8, 'Wyel':75e-6, 'Wypl':143e-6, 'iy':2.72e-2, 'Ss':40.7e-3, 'It':61.2e-8, 'Iw':114e-16, 'zs':2.4e-2, 'zm':4.45e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_380']= {'nmb':'UPN_380', 'P':63.1, 'h':380e-3, 'b':102e-3, 'tw':13.5e-3, 'tf':16e-3, 'r1':16e-3, 'r2':8e-3, 'A':80.4e-4, 'd':313e-3, 'FI':'M 24', 'Pmin':59e-3, 'Pmax':60e-3, 'AL':1.11, 'AG':17.59, 'Iz':15760e-8, 'Wzel':829e-6, 'Wzpl':1014e-6, 'iz':14e-2, 'Avy':53.23e-4, 'Iy':615e-8, 'Wyel':78.7e-6, 'Wypl':148e-6, 'iy':2.77e-2, 'Ss':40.3e-3, 'It':59.1e-8, 'Iw':146e-16, 'zs':2.38e-2, 'zm':4.58e-2, 'E':2.1e+11, 'nu':0.3}
-UPN['UPN_400']= {'nmb':'UPN_400', 'P':71.8, 'h':400e-3, 'b':110e-3, 'tw':14e-3, 'tf':18e-3, 'r1':18e-3, 'r2':9e-3, 'A':91.5e-4, 'd':324e-3, 'FI':'M 27', 'Pmin':61e-3, 'Pmax':62e-3, 'AL':1.182, 'AG':16.46, 'Iz':20350e-8, 'Wzel':1020e-6, 'Wzpl':1240e-6, 'iz':14.9e-2, 'Avy':58.55e-4, 'Iy':846e-8, 'Wyel':102e-6, 'Wypl':190e-6, 'iy':3.04e-2, 'Ss':44e-3, 'It':81.6e-8, 'Iw':221e-16, 'zs':2.65e-2, 'zm':5.11e-2, 'E':2.1e+11, 'nu':0.3}
-
-for item in UPN:
-    shape= UPN[item]
+def setUPNDerivedValues(shape):
+    '''Compute the properties of the UPN shapes that are not in the table.'''
     Avy= shape['Avy']
     A= shape['A']
     E= shape['E']
@@ -460,93 +210,13 @@ for item in UPN:
     shape['AreaQy']= A-2*b*tf+(tw+r1)*tf
     shape['AreaQz']= A-d*tw
 
+UPN= shape_table.ShapeTable('arcelor_UPN',setUPNDerivedValues)
+
 # Arcelor L steel shapes.
 
-L= {}
-
-L['L20x20x3']= {'nmb':'L20x20x3', 'P':0.882, 'h':20e-3, 'b':20e-3, 't':3e-3, 'r1':3.5e-3, 'r2':2e-3, 'A':1.12e-4, 'zs':0.6e-3, 'ys':0.6e-3, 'v':1.41e-2, 'u1':0.84e-2, 'u2':0.7e-2, 'AL':0.08, 'AG':87.4, 'Iy':0.39e-8, 'Iz':0.39e-8, 'Iyz':-0.23e-8, 'Wzel':0.28e-6, 'Wyel':0.28e-6, 'iz':0.59e-2, 'iy':0.59e-2, 'Iu':0.61e-8, 'iu':0.74e-2, 'Iv':0.16e-8, 'iv':0.38e-2, 'E':2.1e+11, 'nu':0.3}
-L['L25x25x3']= {'nmb':'L25x25x3', 'P':1.12, 'h':25e-3, 'b':25e-3, 't':3e-3, 'r1':3.5e-3, 'r2':2e-3, 'A':1.42e-4, 'zs':0.72e-3, 'ys':0.72e-3, 'v':1.77e-2, 'u1':1.02e-2, 'u2':0.88e-2, 'AL':0.1, 'AG':86.88, 'Iy':0.8e-8, 'Iz':0.8e-8, 'Iyz':-0.47e-8, 'Wzel':0.45e-6, 'Wyel':0.45e-6, 'iz':0.75e-2, 'iy':0.75e-2, 'Iu':1.26e-8, 'iu':0.94e-2, 'Iv':0.33e-8, 'iv':0.48e-2, 'E':2.1e+11, 'nu':0.3}
-L['L25x25x4']= {'nmb':'L25x25x4', 'P':1.45, 'h':25e-3, 'b':25e-3, 't':4e-3, 'r1':3.5e-3, 'r2':2e-3, 'A':1.85e-4, 'zs':0.76e-3, 'ys':0.76e-3, 'v':1.77e-2, 'u1':1.08e-2, 'u2':0.89e-2, 'AL':0.1, 'AG':66.67, 'Iy':1.01e-8, 'Iz':1.01e-8, 'Iyz':-0.59e-8, 'Wzel':0.58e-6, 'Wyel':0.58e-6, 'iz':0.74e-2, 'iy':0.74e-2, 'Iu':1.6e-8, 'iu':0.93e-2, 'Iv':0.43e-8, 'iv':0.48e-2, 'E':2.1e+11, 'nu':0.3}
-L['L30x30x3']= {'nmb':'L30x30x3', 'P':1.36, 'h':30e-3, 'b':30e-3, 't':3e-3, 'r1':5e-3, 'r2':2.5e-3, 'A':1.74e-4, 'zs':0.84e-3, 'ys':0.84e-3, 'v':2.12e-2, 'u1':1.18e-2, 'u2':1.05e-2, 'AL':0.12, 'AG':84.87, 'Iy':1.4e-8, 'Iz':1.4e-8, 'Iyz':-0.83e-8, 'Wzel':0.65e-6, 'Wyel':0.65e-6, 'iz':0.9e-2, 'iy':0.9e-2, 'Iu':2.23e-8, 'iu':1.13e-2, 'Iv':0.58e-8, 'iv':0.58e-2, 'E':2.1e+11, 'nu':0.3}
-L['L30x30x4']= {'nmb':'L30x30x4', 'P':1.78, 'h':30e-3, 'b':30e-3, 't':4e-3, 'r1':5e-3, 'r2':2.5e-3, 'A':2.27e-4, 'zs':0.88e-3, 'ys':0.88e-3, 'v':2.12e-2, 'u1':1.24e-2, 'u2':1.06e-2, 'AL':0.12, 'AG':65.02, 'Iy':1.8e-8, 'Iz':1.8e-8, 'Iyz':-1.05e-8, 'Wzel':0.85e-6, 'Wyel':0.85e-6, 'iz':0.89e-2, 'iy':0.89e-2, 'Iu':2.86e-8, 'iu':1.12e-2, 'Iv':0.75e-8, 'iv':0.57e-2, 'E':2.1e+11, 'nu':0.3}
-L['L35x35x4']= {'nmb':'L35x35x4', 'P':2.09, 'h':35e-3, 'b':35e-3, 't':4e-3, 'r1':5e-3, 'r2':2.5e-3, 'A':2.67e-4, 'zs':1e-3, 'ys':1e-3, 'v':2.47e-2, 'u1':1.42e-2, 'u2':1.24e-2, 'AL':0.14, 'AG':64.82, 'Iy':2.95e-8, 'Iz':2.95e-8, 'Iyz':-1.73e-8, 'Wzel':1.18e-6, 'Wyel':1.18e-6, 'iz':1.05e-2, 'iy':1.05e-2, 'Iu':4.69e-8, 'iu':1.33e-2, 'Iv':1.22e-8, 'iv':0.68e-2, 'E':2.1e+11, 'nu':0.3}
-L['L40x40x4']= {'nmb':'L40x40x4', 'P':2.42, 'h':40e-3, 'b':40e-3, 't':4e-3, 'r1':6e-3, 'r2':3e-3, 'A':3.08e-4, 'zs':1.12e-3, 'ys':1.12e-3, 'v':2.83e-2, 'u1':1.58e-2, 'u2':1.4e-2, 'AL':0.15, 'AG':64.07, 'Iy':4.47e-8, 'Iz':4.47e-8, 'Iyz':-2.63e-8, 'Wzel':1.55e-6, 'Wyel':1.55e-6, 'iz':1.21e-2, 'iy':1.21e-2, 'Iu':7.1e-8, 'iu':1.52e-2, 'Iv':1.84e-8, 'iv':0.77e-2, 'E':2.1e+11, 'nu':0.3}
-L['L40x40x5']= {'nmb':'L40x40x5', 'P':2.97, 'h':40e-3, 'b':40e-3, 't':5e-3, 'r1':6e-3, 'r2':3e-3, 'A':3.79e-4, 'zs':1.16e-3, 'ys':1.16e-3, 'v':2.83e-2, 'u1':1.64e-2, 'u2':1.41e-2, 'AL':0.15, 'AG':52.07, 'Iy':5.43e-8, 'Iz':5.43e-8, 'Iyz':-3.18e-8, 'Wzel':1.91e-6, 'Wyel':1.91e-6, 'iz':1.2e-2, 'iy':1.2e-2, 'Iu':8.61e-8, 'iu':1.51e-2, 'Iv':2.25e-8, 'iv':0.77e-2, 'E':2.1e+11, 'nu':0.3}
-L['L45x45x4.5']= {'nmb':'L45x45x4.5', 'P':3.06, 'h':45e-3, 'b':45e-3, 't':4.5e-3, 'r1':7e-3, 'r2':3.5e-3, 'A':3.9e-4, 'zs':1.26e-3, 'ys':1.26e-3, 'v':3.18e-2, 'u1':1.78e-2, 'u2':1.58e-2, 'AL':0.17, 'AG':56.83, 'Iy':7.15e-8, 'Iz':7.15e-8, 'Iyz':-4.2e-8, 'Wzel':2.2e-6, 'Wyel':2.2e-6, 'iz':1.35e-2, 'iy':1.35e-2, 'Iu':11.35e-8, 'iu':1.71e-2, 'Iv':2.94e-8, 'iv':0.87e-2, 'E':2.1e+11, 'nu':0.3}
-L['L50x50x4']= {'nmb':'L50x50x4', 'P':3.06, 'h':50e-3, 'b':50e-3, 't':4e-3, 'r1':7e-3, 'r2':3.5e-3, 'A':3.89e-4, 'zs':1.36e-3, 'ys':1.36e-3, 'v':3.54e-2, 'u1':1.92e-2, 'u2':1.75e-2, 'AL':0.19, 'AG':63.49, 'Iy':8.97e-8, 'Iz':8.97e-8, 'Iyz':-5.28e-8, 'Wzel':2.46e-6, 'Wyel':2.46e-6, 'iz':1.52e-2, 'iy':1.52e-2, 'Iu':14.25e-8, 'iu':1.91e-2, 'Iv':3.69e-8, 'iv':0.97e-2, 'E':2.1e+11, 'nu':0.3}
-L['L50x50x5']= {'nmb':'L50x50x5', 'P':3.77, 'h':50e-3, 'b':50e-3, 't':5e-3, 'r1':7e-3, 'r2':3.5e-3, 'A':4.8e-4, 'zs':1.4e-3, 'ys':1.4e-3, 'v':3.54e-2, 'u1':1.99e-2, 'u2':1.76e-2, 'AL':0.19, 'AG':51.46, 'Iy':10.96e-8, 'Iz':10.96e-8, 'Iyz':-6.45e-8, 'Wzel':3.05e-6, 'Wyel':3.05e-6, 'iz':1.51e-2, 'iy':1.51e-2, 'Iu':17.42e-8, 'iu':1.9e-2, 'Iv':4.51e-8, 'iv':0.97e-2, 'E':2.1e+11, 'nu':0.3}
-L['L50x50x6']= {'nmb':'L50x50x6', 'P':4.47, 'h':50e-3, 'b':50e-3, 't':6e-3, 'r1':7e-3, 'r2':3.5e-3, 'A':5.69e-4, 'zs':1.45e-3, 'ys':1.45e-3, 'v':3.54e-2, 'u1':2.04e-2, 'u2':1.77e-2, 'AL':0.19, 'AG':43.41, 'Iy':12.84e-8, 'Iz':12.84e-8, 'Iyz':-7.53e-8, 'Wzel':3.61e-6, 'Wyel':3.61e-6, 'iz':1.5e-2, 'iy':1.5e-2, 'Iu':20.37e-8, 'iu':1.89e-2, 'Iv':5.31e-8, 'iv':0.97e-2, 'E':2.1e+11, 'nu':0.3}
-L['L60x60x5']= {'nmb':'L60x60x5', 'P':4.57, 'h':60e-3, 'b':60e-3, 't':5e-3, 'r1':8e-3, 'r2':4e-3, 'A':5.82e-4, 'zs':1.64e-3, 'ys':1.64e-3, 'v':4.24e-2, 'u1':2.32e-2, 'u2':2.11e-2, 'AL':0.23, 'AG':51.04, 'Iy':19.37e-8, 'Iz':19.37e-8, 'Iyz':-11.41e-8, 'Wzel':4.45e-6, 'Wyel':4.45e-6, 'iz':1.82e-2, 'iy':1.82e-2, 'Iu':30.78e-8, 'iu':2.3e-2, 'Iv':7.97e-8, 'iv':1.17e-2, 'E':2.1e+11, 'nu':0.3}
-L['L60x60x6']= {'nmb':'L60x60x6', 'P':5.42, 'h':60e-3, 'b':60e-3, 't':6e-3, 'r1':8e-3, 'r2':4e-3, 'A':6.91e-4, 'zs':1.69e-3, 'ys':1.69e-3, 'v':4.24e-2, 'u1':2.39e-2, 'u2':2.11e-2, 'AL':0.23, 'AG':42.99, 'Iy':22.79e-8, 'Iz':22.79e-8, 'Iyz':-13.41e-8, 'Wzel':5.29e-6, 'Wyel':5.29e-6, 'iz':1.82e-2, 'iy':1.82e-2, 'Iu':36.21e-8, 'iu':2.29e-2, 'Iv':9.38e-8, 'iv':1.17e-2, 'E':2.1e+11, 'nu':0.3}
-L['L60x60x8']= {'nmb':'L60x60x8', 'P':7.09, 'h':60e-3, 'b':60e-3, 't':8e-3, 'r1':8e-3, 'r2':4e-3, 'A':9.03e-4, 'zs':1.77e-3, 'ys':1.77e-3, 'v':4.24e-2, 'u1':2.5e-2, 'u2':2.14e-2, 'AL':0.23, 'AG':32.89, 'Iy':29.15e-8, 'Iz':29.15e-8, 'Iyz':-17.04e-8, 'Wzel':6.89e-6, 'Wyel':6.89e-6, 'iz':1.8e-2, 'iy':1.8e-2, 'Iu':46.2e-8, 'iu':2.26e-2, 'Iv':12.11e-8, 'iv':1.16e-2, 'E':2.1e+11, 'nu':0.3}
-L['L65x65x7']= {'nmb':'L65x65x7', 'P':6.83, 'h':65e-3, 'b':65e-3, 't':7e-3, 'r1':9e-3, 'r2':4.5e-3, 'A':8.7e-4, 'zs':1.85e-3, 'ys':1.85e-3, 'v':4.6e-2, 'u1':2.61e-2, 'u2':2.29e-2, 'AL':0.25, 'AG':36.95, 'Iy':33.43e-8, 'Iz':33.43e-8, 'Iyz':-19.65e-8, 'Wzel':7.18e-6, 'Wyel':7.18e-6, 'iz':1.96e-2, 'iy':1.96e-2, 'Iu':53.09e-8, 'iu':2.47e-2, 'Iv':13.78e-8, 'iv':1.26e-2, 'E':2.1e+11, 'nu':0.3}
-L['L70x70x6']= {'nmb':'L70x70x6', 'P':6.38, 'h':70e-3, 'b':70e-3, 't':6e-3, 'r1':9e-3, 'r2':4.5e-3, 'A':8.13e-4, 'zs':1.93e-3, 'ys':1.93e-3, 'v':4.95e-2, 'u1':2.73e-2, 'u2':2.46e-2, 'AL':0.27, 'AG':42.68, 'Iy':36.88e-8, 'Iz':36.88e-8, 'Iyz':-21.73e-8, 'Wzel':7.27e-6, 'Wyel':7.27e-6, 'iz':2.13e-2, 'iy':2.13e-2, 'Iu':58.61e-8, 'iu':2.69e-2, 'Iv':15.16e-8, 'iv':1.37e-2, 'E':2.1e+11, 'nu':0.3}
-L['L70x70x7']= {'nmb':'L70x70x7', 'P':7.38, 'h':70e-3, 'b':70e-3, 't':7e-3, 'r1':9e-3, 'r2':4.5e-3, 'A':9.4e-4, 'zs':1.97e-3, 'ys':1.97e-3, 'v':4.95e-2, 'u1':2.79e-2, 'u2':2.47e-2, 'AL':0.27, 'AG':36.91, 'Iy':42.3e-8, 'Iz':42.3e-8, 'Iyz':-24.9e-8, 'Wzel':8.41e-6, 'Wyel':8.41e-6, 'iz':2.12e-2, 'iy':2.12e-2, 'Iu':67.19e-8, 'iu':2.67e-2, 'Iv':17.4e-8, 'iv':1.36e-2, 'E':2.1e+11, 'nu':0.3}
-L['L75x75x6']= {'nmb':'L75x75x6', 'P':6.85, 'h':75e-3, 'b':75e-3, 't':6e-3, 'r1':10e-3, 'r2':5e-3, 'A':8.73e-4, 'zs':2.04e-3, 'ys':2.04e-3, 'v':5.3e-2, 'u1':2.89e-2, 'u2':2.63e-2, 'AL':0.29, 'AG':42.44, 'Iy':45.57e-8, 'Iz':45.57e-8, 'Iyz':-26.83e-8, 'Wzel':8.35e-6, 'Wyel':8.35e-6, 'iz':2.28e-2, 'iy':2.28e-2, 'Iu':72.4e-8, 'iu':2.88e-2, 'Iv':18.74e-8, 'iv':1.46e-2, 'E':2.1e+11, 'nu':0.3}
-L['L75x75x8']= {'nmb':'L75x75x8', 'P':8.99, 'h':75e-3, 'b':75e-3, 't':8e-3, 'r1':10e-3, 'r2':5e-3, 'A':11.4e-4, 'zs':2.13e-3, 'ys':2.13e-3, 'v':5.3e-2, 'u1':3.01e-2, 'u2':2.65e-2, 'AL':0.29, 'AG':32.37, 'Iy':58.87e-8, 'Iz':58.87e-8, 'Iyz':-34.62e-8, 'Wzel':10.96e-6, 'Wyel':10.96e-6, 'iz':2.27e-2, 'iy':2.27e-2, 'Iu':93.49e-8, 'iu':2.86e-2, 'Iv':24.25e-8, 'iv':1.45e-2, 'E':2.1e+11, 'nu':0.3}
-L['L80x80x8']= {'nmb':'L80x80x8', 'P':9.63, 'h':80e-3, 'b':80e-3, 't':8e-3, 'r1':10e-3, 'r2':5e-3, 'A':12.3e-4, 'zs':2.26e-3, 'ys':2.26e-3, 'v':5.66e-2, 'u1':3.19e-2, 'u2':2.83e-2, 'AL':0.31, 'AG':32.34, 'Iy':72.25e-8, 'Iz':72.25e-8, 'Iyz':-42.53e-8, 'Wzel':12.58e-6, 'Wyel':12.58e-6, 'iz':2.43e-2, 'iy':2.43e-2, 'Iu':114.8e-8, 'iu':3.06e-2, 'Iv':29.72e-8, 'iv':1.56e-2, 'E':2.1e+11, 'nu':0.3}
-L['L80x80x10']= {'nmb':'L80x80x10', 'P':11.9, 'h':80e-3, 'b':80e-3, 't':10e-3, 'r1':10e-3, 'r2':5e-3, 'A':15.1e-4, 'zs':2.34e-3, 'ys':2.34e-3, 'v':5.66e-2, 'u1':3.3e-2, 'u2':2.85e-2, 'AL':0.31, 'AG':26.26, 'Iy':87.5e-8, 'Iz':87.5e-8, 'Iyz':-51.27e-8, 'Wzel':15.45e-6, 'Wyel':15.45e-6, 'iz':2.41e-2, 'iy':2.41e-2, 'Iu':138.8e-8, 'iu':3.03e-2, 'Iv':36.23e-8, 'iv':1.55e-2, 'E':2.1e+11, 'nu':0.3}
-L['L90x90x7']= {'nmb':'L90x90x7', 'P':9.61, 'h':90e-3, 'b':90e-3, 't':7e-3, 'r1':11e-3, 'r2':5.5e-3, 'A':12.2e-4, 'zs':2.45e-3, 'ys':2.45e-3, 'v':6.36e-2, 'u1':3.47e-2, 'u2':3.16e-2, 'AL':0.35, 'AG':36.48, 'Iy':92.55e-8, 'Iz':92.55e-8, 'Iyz':-54.53e-8, 'Wzel':14.13e-6, 'Wyel':14.13e-6, 'iz':2.75e-2, 'iy':2.75e-2, 'Iu':147.1e-8, 'iu':3.47e-2, 'Iv':38.02e-8, 'iv':1.76e-2, 'E':2.1e+11, 'nu':0.3}
-L['L90x90x8']= {'nmb':'L90x90x8', 'P':10.9, 'h':90e-3, 'b':90e-3, 't':8e-3, 'r1':11e-3, 'r2':5.5e-3, 'A':13.9e-4, 'zs':2.5e-3, 'ys':2.5e-3, 'v':6.36e-2, 'u1':3.53e-2, 'u2':3.17e-2, 'AL':0.35, 'AG':32.15, 'Iy':104.4e-8, 'Iz':104.4e-8, 'Iyz':-61.51e-8, 'Wzel':16.05e-6, 'Wyel':16.05e-6, 'iz':2.74e-2, 'iy':2.74e-2, 'Iu':165.9e-8, 'iu':3.46e-2, 'Iv':42.87e-8, 'iv':1.76e-2, 'E':2.1e+11, 'nu':0.3}
-L['L90x90x9']= {'nmb':'L90x90x9', 'P':12.2, 'h':90e-3, 'b':90e-3, 't':9e-3, 'r1':11e-3, 'r2':5.5e-3, 'A':15.5e-4, 'zs':2.54e-3, 'ys':2.54e-3, 'v':6.36e-2, 'u1':3.59e-2, 'u2':3.18e-2, 'AL':0.35, 'AG':28.77, 'Iy':115.8e-8, 'Iz':115.8e-8, 'Iyz':-68.2e-8, 'Wzel':17.93e-6, 'Wyel':17.93e-6, 'iz':2.73e-2, 'iy':2.73e-2, 'Iu':184e-8, 'iu':3.44e-2, 'Iv':47.63e-8, 'iv':1.75e-2, 'E':2.1e+11, 'nu':0.3}
-L['L90x90x10']= {'nmb':'L90x90x10', 'P':13.4, 'h':90e-3, 'b':90e-3, 't':10e-3, 'r1':11e-3, 'r2':5.5e-3, 'A':17.1e-4, 'zs':2.58e-3, 'ys':2.58e-3, 'v':6.36e-2, 'u1':3.65e-2, 'u2':3.19e-2, 'AL':0.35, 'AG':26.07, 'Iy':126.9e-8, 'Iz':126.9e-8, 'Iyz':-74.6e-8, 'Wzel':19.77e-6, 'Wyel':19.77e-6, 'iz':2.72e-2, 'iy':2.72e-2, 'Iu':201.5e-8, 'iu':3.43e-2, 'Iv':52.32e-8, 'iv':1.75e-2, 'E':2.1e+11, 'nu':0.3}
-L['L100x100x8']= {'nmb':'L100x100x8', 'P':12.2, 'h':100e-3, 'b':100e-3, 't':8e-3, 'r1':12e-3, 'r2':6e-3, 'A':15.5e-4, 'zs':2.74e-3, 'ys':2.74e-3, 'v':7.07e-2, 'u1':3.87e-2, 'u2':3.52e-2, 'AL':0.39, 'AG':32, 'Iy':144.8e-8, 'Iz':144.8e-8, 'Iyz':-85.37e-8, 'Wzel':19.94e-6, 'Wyel':19.94e-6, 'iz':3.06e-2, 'iy':3.06e-2, 'Iu':230.2e-8, 'iu':3.85e-2, 'Iv':59.47e-8, 'iv':1.96e-2, 'E':2.1e+11, 'nu':0.3}
-L['L100x100x10']= {'nmb':'L100x100x10', 'P':15, 'h':100e-3, 'b':100e-3, 't':10e-3, 'r1':12e-3, 'r2':6e-3, 'A':19.2e-4, 'zs':2.82e-3, 'ys':2.82e-3, 'v':7.07e-2, 'u1':3.99e-2, 'u2':3.54e-2, 'AL':0.39, 'AG':25.92, 'Iy':176.7e-8, 'Iz':176.7e-8, 'Iyz':-104e-8, 'Wzel':24.62e-6, 'Wyel':24.62e-6, 'iz':3.04e-2, 'iy':3.04e-2, 'Iu':280.7e-8, 'iu':3.83e-2, 'Iv':72.65e-8, 'iv':1.95e-2, 'E':2.1e+11, 'nu':0.3}
-L['L100x100x12']= {'nmb':'L100x100x12', 'P':17.8, 'h':100e-3, 'b':100e-3, 't':12e-3, 'r1':12e-3, 'r2':6e-3, 'A':22.7e-4, 'zs':2.9e-3, 'ys':2.9e-3, 'v':7.07e-2, 'u1':4.11e-2, 'u2':3.57e-2, 'AL':0.39, 'AG':21.86, 'Iy':206.7e-8, 'Iz':206.7e-8, 'Iyz':-121.3e-8, 'Wzel':29.12e-6, 'Wyel':29.12e-6, 'iz':3.02e-2, 'iy':3.02e-2, 'Iu':328e-8, 'iu':3.8e-2, 'Iv':85.42e-8, 'iv':1.94e-2, 'E':2.1e+11, 'nu':0.3}
-L['L110x110x10']= {'nmb':'L110x110x10', 'P':16.6, 'h':110e-3, 'b':110e-3, 't':10e-3, 'r1':13e-3, 'r2':6.5e-3, 'A':21.2e-4, 'zs':3.06e-3, 'ys':3.06e-3, 'v':7.78e-2, 'u1':4.33e-2, 'u2':3.88e-2, 'AL':0.429, 'AG':25.79, 'Iy':238e-8, 'Iz':238e-8, 'Iyz':-140.3e-8, 'Wzel':29.99e-6, 'Wyel':29.99e-6, 'iz':3.35e-2, 'iy':3.35e-2, 'Iu':378.2e-8, 'iu':4.23e-2, 'Iv':97.72e-8, 'iv':2.15e-2, 'E':2.1e+11, 'nu':0.3}
-L['L110x110x12']= {'nmb':'L110x110x12', 'P':19.7, 'h':110e-3, 'b':110e-3, 't':12e-3, 'r1':13e-3, 'r2':6.5e-3, 'A':25.1e-4, 'zs':3.15e-3, 'ys':3.15e-3, 'v':7.78e-2, 'u1':4.45e-2, 'u2':3.91e-2, 'AL':0.429, 'AG':21.73, 'Iy':279.1e-8, 'Iz':279.1e-8, 'Iyz':-164.1e-8, 'Wzel':35.54e-6, 'Wyel':35.54e-6, 'iz':3.33e-2, 'iy':3.33e-2, 'Iu':443.3e-8, 'iu':4.2e-2, 'Iv':115e-8, 'iv':2.14e-2, 'E':2.1e+11, 'nu':0.3}
-L['L120x120x10']= {'nmb':'L120x120x10', 'P':18.2, 'h':120e-3, 'b':120e-3, 't':10e-3, 'r1':13e-3, 'r2':6.5e-3, 'A':23.2e-4, 'zs':3.31e-3, 'ys':3.31e-3, 'v':8.49e-2, 'u1':4.69e-2, 'u2':4.24e-2, 'AL':0.469, 'AG':25.76, 'Iy':312.9e-8, 'Iz':312.9e-8, 'Iyz':-184.6e-8, 'Wzel':36.03e-6, 'Wyel':36.03e-6, 'iz':3.67e-2, 'iy':3.67e-2, 'Iu':497.6e-8, 'iu':4.63e-2, 'Iv':128.3e-8, 'iv':2.35e-2, 'E':2.1e+11, 'nu':0.3}
-L['L120x120x11']= {'nmb':'L120x120x11', 'P':19.9, 'h':120e-3, 'b':120e-3, 't':11e-3, 'r1':13e-3, 'r2':6.5e-3, 'A':25.4e-4, 'zs':3.36e-3, 'ys':3.36e-3, 'v':8.49e-2, 'u1':4.75e-2, 'u2':4.25e-2, 'AL':0.469, 'AG':23.54, 'Iy':340.6e-8, 'Iz':340.6e-8, 'Iyz':-200.9e-8, 'Wzel':39.41e-6, 'Wyel':39.41e-6, 'iz':3.66e-2, 'iy':3.66e-2, 'Iu':541.5e-8, 'iu':4.62e-2, 'Iv':139.8e-8, 'iv':2.35e-2, 'E':2.1e+11, 'nu':0.3}
-L['L120x120x12']= {'nmb':'L120x120x12', 'P':21.6, 'h':120e-3, 'b':120e-3, 't':12e-3, 'r1':13e-3, 'r2':6.5e-3, 'A':27.5e-4, 'zs':3.4e-3, 'ys':3.4e-3, 'v':8.49e-2, 'u1':4.8e-2, 'u2':4.26e-2, 'AL':0.469, 'AG':21.69, 'Iy':367.7e-8, 'Iz':367.7e-8, 'Iyz':-216.6e-8, 'Wzel':42.73e-6, 'Wyel':42.73e-6, 'iz':3.65e-2, 'iy':3.65e-2, 'Iu':584.3e-8, 'iu':4.61e-2, 'Iv':151e-8, 'iv':2.34e-2, 'E':2.1e+11, 'nu':0.3}
-L['L120x120x13']= {'nmb':'L120x120x13', 'P':23.3, 'h':120e-3, 'b':120e-3, 't':13e-3, 'r1':13e-3, 'r2':6.5e-3, 'A':29.7e-4, 'zs':3.44e-3, 'ys':3.44e-3, 'v':8.49e-2, 'u1':4.86e-2, 'u2':4.28e-2, 'AL':0.469, 'AG':20.12, 'Iy':394e-8, 'Iz':394e-8, 'Iyz':-231.8e-8, 'Wzel':46.01e-6, 'Wyel':46.01e-6, 'iz':3.64e-2, 'iy':3.64e-2, 'Iu':625.9e-8, 'iu':4.59e-2, 'Iv':162.2e-8, 'iv':2.34e-2, 'E':2.1e+11, 'nu':0.3}
-L['L120x120x15']= {'nmb':'L120x120x15', 'P':26.6, 'h':120e-3, 'b':120e-3, 't':15e-3, 'r1':13e-3, 'r2':6.5e-3, 'A':33.9e-4, 'zs':3.51e-3, 'ys':3.51e-3, 'v':8.49e-2, 'u1':4.97e-2, 'u2':4.31e-2, 'AL':0.469, 'AG':17.6, 'Iy':444.9e-8, 'Iz':444.9e-8, 'Iyz':-260.7e-8, 'Wzel':52.43e-6, 'Wyel':52.43e-6, 'iz':3.62e-2, 'iy':3.62e-2, 'Iu':705.6e-8, 'iu':4.56e-2, 'Iv':184.2e-8, 'iv':2.33e-2, 'E':2.1e+11, 'nu':0.3}
-L['L130x130x12']= {'nmb':'L130x130x12', 'P':23.6, 'h':130e-3, 'b':130e-3, 't':12e-3, 'r1':14e-3, 'r2':7e-3, 'A':30e-4, 'zs':3.64e-3, 'ys':3.64e-3, 'v':9.19e-2, 'u1':5.15e-2, 'u2':4.6e-2, 'AL':0.508, 'AG':21.59, 'Iy':472.2e-8, 'Iz':472.2e-8, 'Iyz':-278.5e-8, 'Wzel':50.44e-6, 'Wyel':50.44e-6, 'iz':3.97e-2, 'iy':3.97e-2, 'Iu':750.6e-8, 'iu':5e-2, 'Iv':193.7e-8, 'iv':2.54e-2, 'E':2.1e+11, 'nu':0.3}
-L['L150x150x10']= {'nmb':'L150x150x10', 'P':23, 'h':150e-3, 'b':150e-3, 't':10e-3, 'r1':16e-3, 'r2':8e-3, 'A':29.3e-4, 'zs':4.03e-3, 'ys':4.03e-3, 'v':10.61e-2, 'u1':5.71e-2, 'u2':5.28e-2, 'AL':0.586, 'AG':25.51, 'Iy':624e-8, 'Iz':624e-8, 'Iyz':-368e-8, 'Wzel':56.91e-6, 'Wyel':56.91e-6, 'iz':4.62e-2, 'iy':4.62e-2, 'Iu':992e-8, 'iu':5.82e-2, 'Iv':256e-8, 'iv':2.96e-2, 'E':2.1e+11, 'nu':0.3}
-L['L150x150x12']= {'nmb':'L150x150x12', 'P':27.3, 'h':150e-3, 'b':150e-3, 't':12e-3, 'r1':16e-3, 'r2':8e-3, 'A':34.8e-4, 'zs':4.12e-3, 'ys':4.12e-3, 'v':10.61e-2, 'u1':5.83e-2, 'u2':5.29e-2, 'AL':0.586, 'AG':21.44, 'Iy':736.9e-8, 'Iz':736.9e-8, 'Iyz':-434.9e-8, 'Wzel':67.75e-6, 'Wyel':67.75e-6, 'iz':4.6e-2, 'iy':4.6e-2, 'Iu':1172e-8, 'iu':5.8e-2, 'Iv':302e-8, 'iv':2.94e-2, 'E':2.1e+11, 'nu':0.3}
-L['L150x150x14']= {'nmb':'L150x150x14', 'P':31.6, 'h':150e-3, 'b':150e-3, 't':14e-3, 'r1':16e-3, 'r2':8e-3, 'A':40.3e-4, 'zs':4.21e-3, 'ys':4.21e-3, 'v':10.61e-2, 'u1':5.95e-2, 'u2':5.32e-2, 'AL':0.586, 'AG':18.53, 'Iy':845.4e-8, 'Iz':845.4e-8, 'Iyz':-498.5e-8, 'Wzel':78.33e-6, 'Wyel':78.33e-6, 'iz':4.58e-2, 'iy':4.58e-2, 'Iu':1344e-8, 'iu':5.77e-2, 'Iv':346.9e-8, 'iv':2.93e-2, 'E':2.1e+11, 'nu':0.3}
-L['L150x150x15']= {'nmb':'L150x150x15', 'P':33.8, 'h':150e-3, 'b':150e-3, 't':15e-3, 'r1':16e-3, 'r2':8e-3, 'A':43e-4, 'zs':4.25e-3, 'ys':4.25e-3, 'v':10.61e-2, 'u1':6.01e-2, 'u2':5.33e-2, 'AL':0.586, 'AG':17.36, 'Iy':898.1e-8, 'Iz':898.1e-8, 'Iyz':-529.1e-8, 'Wzel':83.52e-6, 'Wyel':83.52e-6, 'iz':4.57e-2, 'iy':4.57e-2, 'Iu':1427e-8, 'iu':5.76e-2, 'Iv':368.9e-8, 'iv':2.93e-2, 'E':2.1e+11, 'nu':0.3}
-L['L150x150x18']= {'nmb':'L150x150x18', 'P':40.1, 'h':150e-3, 'b':150e-3, 't':18e-3, 'r1':16e-3, 'r2':8e-3, 'A':51e-4, 'zs':4.37e-3, 'ys':4.37e-3, 'v':10.61e-2, 'u1':6.17e-2, 'u2':5.37e-2, 'AL':0.586, 'AG':14.63, 'Iy':1050e-8, 'Iz':1050e-8, 'Iyz':-616.2e-8, 'Wzel':98.74e-6, 'Wyel':98.74e-6, 'iz':4.54e-2, 'iy':4.54e-2, 'Iu':1666e-8, 'iu':5.71e-2, 'Iv':433.8e-8, 'iv':2.92e-2, 'E':2.1e+11, 'nu':0.3}
-L['L160x160x14']= {'nmb':'L160x160x14', 'P':33.9, 'h':160e-3, 'b':160e-3, 't':14e-3, 'r1':17e-3, 'r2':8.5e-3, 'A':43.2e-4, 'zs':4.45e-3, 'ys':4.45e-3, 'v':11.31e-2, 'u1':6.29e-2, 'u2':5.66e-2, 'AL':0.625, 'AG':18.46, 'Iy':1034e-8, 'Iz':1034e-8, 'Iyz':-610e-8, 'Wzel':89.5e-6, 'Wyel':89.5e-6, 'iz':4.89e-2, 'iy':4.89e-2, 'Iu':1644e-8, 'iu':6.17e-2, 'Iv':423.8e-8, 'iv':3.13e-2, 'E':2.1e+11, 'nu':0.3}
-L['L160x160x15']= {'nmb':'L160x160x15', 'P':36.2, 'h':160e-3, 'b':160e-3, 't':15e-3, 'r1':17e-3, 'r2':8.5e-3, 'A':46.1e-4, 'zs':4.49e-3, 'ys':4.49e-3, 'v':11.31e-2, 'u1':6.35e-2, 'u2':5.67e-2, 'AL':0.625, 'AG':17.3, 'Iy':1099e-8, 'Iz':1099e-8, 'Iyz':-648e-8, 'Wzel':95.5e-6, 'Wyel':95.5e-6, 'iz':4.88e-2, 'iy':4.88e-2, 'Iu':1747e-8, 'iu':6.16e-2, 'Iv':450.8e-8, 'iv':3.13e-2, 'E':2.1e+11, 'nu':0.3}
-L['L160x160x16']= {'nmb':'L160x160x16', 'P':38.4, 'h':160e-3, 'b':160e-3, 't':16e-3, 'r1':17e-3, 'r2':8.5e-3, 'A':49e-4, 'zs':4.53e-3, 'ys':4.53e-3, 'v':11.31e-2, 'u1':6.41e-2, 'u2':5.69e-2, 'AL':0.625, 'AG':16.28, 'Iy':1163e-8, 'Iz':1163e-8, 'Iyz':-685.1e-8, 'Wzel':101.4e-6, 'Wyel':101.4e-6, 'iz':4.87e-2, 'iy':4.87e-2, 'Iu':1848e-8, 'iu':6.14e-2, 'Iv':477.6e-8, 'iv':3.12e-2, 'E':2.1e+11, 'nu':0.3}
-L['L160x160x17']= {'nmb':'L160x160x17', 'P':40.7, 'h':160e-3, 'b':160e-3, 't':17e-3, 'r1':17e-3, 'r2':8.5e-3, 'A':51.8e-4, 'zs':4.57e-3, 'ys':4.57e-3, 'v':11.31e-2, 'u1':6.46e-2, 'u2':5.7e-2, 'AL':0.625, 'AG':15.37, 'Iy':1225e-8, 'Iz':1225e-8, 'Iyz':-721.3e-8, 'Wzel':107.2e-6, 'Wyel':107.2e-6, 'iz':4.86e-2, 'iy':4.86e-2, 'Iu':1947e-8, 'iu':6.13e-2, 'Iv':504.1e-8, 'iv':3.12e-2, 'E':2.1e+11, 'nu':0.3}
-L['L180x180x13']= {'nmb':'L180x180x13', 'P':35.7, 'h':180e-3, 'b':180e-3, 't':13e-3, 'r1':18e-3, 'r2':9e-3, 'A':45.5e-4, 'zs':4.9e-3, 'ys':4.9e-3, 'v':12.73e-2, 'u1':6.93e-2, 'u2':6.35e-2, 'AL':0.705, 'AG':19.74, 'Iy':1396e-8, 'Iz':1396e-8, 'Iyz':-824.5e-8, 'Wzel':106.5e-6, 'Wyel':106.5e-6, 'iz':5.54e-2, 'iy':5.54e-2, 'Iu':2221e-8, 'iu':6.99e-2, 'Iv':571.6e-8, 'iv':3.55e-2, 'E':2.1e+11, 'nu':0.3}
-L['L180x180x14']= {'nmb':'L180x180x14', 'P':38.3, 'h':180e-3, 'b':180e-3, 't':14e-3, 'r1':18e-3, 'r2':9e-3, 'A':48.8e-4, 'zs':4.94e-3, 'ys':4.94e-3, 'v':12.73e-2, 'u1':6.99e-2, 'u2':6.36e-2, 'AL':0.705, 'AG':18.4, 'Iy':1493e-8, 'Iz':1493e-8, 'Iyz':-882e-8, 'Wzel':114.3e-6, 'Wyel':114.3e-6, 'iz':5.53e-2, 'iy':5.53e-2, 'Iu':2375e-8, 'iu':6.98e-2, 'Iv':611.3e-8, 'iv':3.54e-2, 'E':2.1e+11, 'nu':0.3}
-L['L180x180x15']= {'nmb':'L180x180x15', 'P':40.9, 'h':180e-3, 'b':180e-3, 't':15e-3, 'r1':18e-3, 'r2':9e-3, 'A':52.1e-4, 'zs':4.98e-3, 'ys':4.98e-3, 'v':12.73e-2, 'u1':7.05e-2, 'u2':6.37e-2, 'AL':0.705, 'AG':17.23, 'Iy':1589e-8, 'Iz':1589e-8, 'Iyz':-938e-8, 'Wzel':122e-6, 'Wyel':122e-6, 'iz':5.52e-2, 'iy':5.52e-2, 'Iu':2527e-8, 'iu':6.96e-2, 'Iv':650.5e-8, 'iv':3.53e-2, 'E':2.1e+11, 'nu':0.3}
-L['L180x180x16']= {'nmb':'L180x180x16', 'P':43.5, 'h':180e-3, 'b':180e-3, 't':16e-3, 'r1':18e-3, 'r2':9e-3, 'A':55.4e-4, 'zs':5.02e-3, 'ys':5.02e-3, 'v':12.73e-2, 'u1':7.1e-2, 'u2':6.38e-2, 'AL':0.705, 'AG':16.2, 'Iy':1682e-8, 'Iz':1682e-8, 'Iyz':-993e-8, 'Wzel':129.7e-6, 'Wyel':129.7e-6, 'iz':5.51e-2, 'iy':5.51e-2, 'Iu':2675e-8, 'iu':6.95e-2, 'Iv':689.4e-8, 'iv':3.53e-2, 'E':2.1e+11, 'nu':0.3}
-L['L180x180x17']= {'nmb':'L180x180x17', 'P':46, 'h':180e-3, 'b':180e-3, 't':17e-3, 'r1':18e-3, 'r2':9e-3, 'A':58.7e-4, 'zs':5.06e-3, 'ys':5.06e-3, 'v':12.73e-2, 'u1':7.16e-2, 'u2':6.4e-2, 'AL':0.705, 'AG':15.3, 'Iy':1775e-8, 'Iz':1775e-8, 'Iyz':-1047e-8, 'Wzel':137.2e-6, 'Wyel':137.2e-6, 'iz':5.5e-2, 'iy':5.5e-2, 'Iu':2822e-8, 'iu':6.94e-2, 'Iv':727.8e-8, 'iv':3.52e-2, 'E':2.1e+11, 'nu':0.3}
-L['L180x180x18']= {'nmb':'L180x180x18', 'P':48.6, 'h':180e-3, 'b':180e-3, 't':18e-3, 'r1':18e-3, 'r2':9e-3, 'A':61.9e-4, 'zs':5.1e-3, 'ys':5.1e-3, 'v':12.73e-2, 'u1':7.22e-2, 'u2':6.41e-2, 'AL':0.705, 'AG':14.5, 'Iy':1866e-8, 'Iz':1866e-8, 'Iyz':-1100e-8, 'Wzel':144.7e-6, 'Wyel':144.7e-6, 'iz':5.49e-2, 'iy':5.49e-2, 'Iu':2965e-8, 'iu':6.92e-2, 'Iv':766e-8, 'iv':3.52e-2, 'E':2.1e+11, 'nu':0.3}
-L['L180x180x19']= {'nmb':'L180x180x19', 'P':51.1, 'h':180e-3, 'b':180e-3, 't':19e-3, 'r1':18e-3, 'r2':9e-3, 'A':65.1e-4, 'zs':5.14e-3, 'ys':5.14e-3, 'v':12.73e-2, 'u1':7.27e-2, 'u2':6.42e-2, 'AL':0.705, 'AG':13.78, 'Iy':1955e-8, 'Iz':1955e-8, 'Iyz':-1151e-8, 'Wzel':152.1e-6, 'Wyel':152.1e-6, 'iz':5.48e-2, 'iy':5.48e-2, 'Iu':3106e-8, 'iu':6.91e-2, 'Iv':803.8e-8, 'iv':3.51e-2, 'E':2.1e+11, 'nu':0.3}
-L['L180x180x20']= {'nmb':'L180x180x20', 'P':53.7, 'h':180e-3, 'b':180e-3, 't':20e-3, 'r1':18e-3, 'r2':9e-3, 'A':68.4e-4, 'zs':5.18e-3, 'ys':5.18e-3, 'v':12.73e-2, 'u1':7.33e-2, 'u2':6.44e-2, 'AL':0.705, 'AG':13.13, 'Iy':2043e-8, 'Iz':2043e-8, 'Iyz':-1202e-8, 'Wzel':159.4e-6, 'Wyel':159.4e-6, 'iz':5.47e-2, 'iy':5.47e-2, 'Iu':3244e-8, 'iu':6.89e-2, 'Iv':841.3e-8, 'iv':3.51e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x15']= {'nmb':'L200x200x15', 'P':45.6, 'h':200e-3, 'b':200e-3, 't':15e-3, 'r1':18e-3, 'r2':9e-3, 'A':58.1e-4, 'zs':5.48e-3, 'ys':5.48e-3, 'v':14.14e-2, 'u1':7.75e-2, 'u2':7.08e-2, 'AL':0.785, 'AG':17.2, 'Iy':2209e-8, 'Iz':2209e-8, 'Iyz':-1306e-8, 'Wzel':152.2e-6, 'Wyel':152.2e-6, 'iz':6.17e-2, 'iy':6.17e-2, 'Iu':3516e-8, 'iu':7.78e-2, 'Iv':903e-8, 'iv':3.94e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x16']= {'nmb':'L200x200x16', 'P':48.5, 'h':200e-3, 'b':200e-3, 't':16e-3, 'r1':18e-3, 'r2':9e-3, 'A':61.8e-4, 'zs':5.52e-3, 'ys':5.52e-3, 'v':14.14e-2, 'u1':7.81e-2, 'u2':7.09e-2, 'AL':0.785, 'AG':16.18, 'Iy':2341e-8, 'Iz':2341e-8, 'Iyz':-1384e-8, 'Wzel':161.7e-6, 'Wyel':161.7e-6, 'iz':6.16e-2, 'iy':6.16e-2, 'Iu':3726e-8, 'iu':7.77e-2, 'Iv':957e-8, 'iv':3.94e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x17']= {'nmb':'L200x200x17', 'P':51.4, 'h':200e-3, 'b':200e-3, 't':17e-3, 'r1':18e-3, 'r2':9e-3, 'A':65.5e-4, 'zs':5.56e-3, 'ys':5.56e-3, 'v':14.14e-2, 'u1':7.87e-2, 'u2':7.1e-2, 'AL':0.785, 'AG':15.27, 'Iy':2472e-8, 'Iz':2472e-8, 'Iyz':-1461e-8, 'Wzel':171.2e-6, 'Wyel':171.2e-6, 'iz':6.14e-2, 'iy':6.14e-2, 'Iu':3932e-8, 'iu':7.75e-2, 'Iv':1011e-8, 'iv':3.93e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x18']= {'nmb':'L200x200x18', 'P':54.3, 'h':200e-3, 'b':200e-3, 't':18e-3, 'r1':18e-3, 'r2':9e-3, 'A':69.1e-4, 'zs':5.6e-3, 'ys':5.6e-3, 'v':14.14e-2, 'u1':7.93e-2, 'u2':7.12e-2, 'AL':0.785, 'AG':14.46, 'Iy':2600e-8, 'Iz':2600e-8, 'Iyz':-1536e-8, 'Wzel':180.6e-6, 'Wyel':180.6e-6, 'iz':6.13e-2, 'iy':6.13e-2, 'Iu':4135e-8, 'iu':7.74e-2, 'Iv':1064e-8, 'iv':3.92e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x19']= {'nmb':'L200x200x19', 'P':57.1, 'h':200e-3, 'b':200e-3, 't':19e-3, 'r1':18e-3, 'r2':9e-3, 'A':72.7e-4, 'zs':5.64e-3, 'ys':5.64e-3, 'v':14.14e-2, 'u1':7.98e-2, 'u2':7.13e-2, 'AL':0.785, 'AG':13.74, 'Iy':2726e-8, 'Iz':2726e-8, 'Iyz':-1609e-8, 'Wzel':189.9e-6, 'Wyel':189.9e-6, 'iz':6.12e-2, 'iy':6.12e-2, 'Iu':4335e-8, 'iu':7.72e-2, 'Iv':1117e-8, 'iv':3.92e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x20']= {'nmb':'L200x200x20', 'P':59.9, 'h':200e-3, 'b':200e-3, 't':20e-3, 'r1':18e-3, 'r2':9e-3, 'A':76.3e-4, 'zs':5.68e-3, 'ys':5.68e-3, 'v':14.14e-2, 'u1':8.04e-2, 'u2':7.15e-2, 'AL':0.785, 'AG':13.09, 'Iy':2851e-8, 'Iz':2851e-8, 'Iyz':-1681e-8, 'Wzel':199.1e-6, 'Wyel':199.1e-6, 'iz':6.11e-2, 'iy':6.11e-2, 'Iu':4532e-8, 'iu':7.7e-2, 'Iv':1169e-8, 'iv':3.91e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x21']= {'nmb':'L200x200x21', 'P':62.8, 'h':200e-3, 'b':200e-3, 't':21e-3, 'r1':18e-3, 'r2':9e-3, 'A':79.9e-4, 'zs':5.72e-3, 'ys':5.72e-3, 'v':14.14e-2, 'u1':8.09e-2, 'u2':7.16e-2, 'AL':0.785, 'AG':12.5, 'Iy':2973e-8, 'Iz':2973e-8, 'Iyz':-1752e-8, 'Wzel':208.2e-6, 'Wyel':208.2e-6, 'iz':6.1e-2, 'iy':6.1e-2, 'Iu':4725e-8, 'iu':7.69e-2, 'Iv':1221e-8, 'iv':3.91e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x22']= {'nmb':'L200x200x22', 'P':65.6, 'h':200e-3, 'b':200e-3, 't':22e-3, 'r1':18e-3, 'r2':9e-3, 'A':83.5e-4, 'zs':5.76e-3, 'ys':5.76e-3, 'v':14.14e-2, 'u1':8.15e-2, 'u2':7.18e-2, 'AL':0.785, 'AG':11.97, 'Iy':3094e-8, 'Iz':3094e-8, 'Iyz':-1821e-8, 'Wzel':217.3e-6, 'Wyel':217.3e-6, 'iz':6.09e-2, 'iy':6.09e-2, 'Iu':4915e-8, 'iu':7.67e-2, 'Iv':1273e-8, 'iv':3.9e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x23']= {'nmb':'L200x200x23', 'P':68.3, 'h':200e-3, 'b':200e-3, 't':23e-3, 'r1':18e-3, 'r2':9e-3, 'A':87.1e-4, 'zs':5.8e-3, 'ys':5.8e-3, 'v':14.14e-2, 'u1':8.2e-2, 'u2':7.19e-2, 'AL':0.785, 'AG':11.48, 'Iy':3213e-8, 'Iz':3213e-8, 'Iyz':-1889e-8, 'Wzel':226.3e-6, 'Wyel':226.3e-6, 'iz':6.08e-2, 'iy':6.08e-2, 'Iu':5102e-8, 'iu':7.66e-2, 'Iv':1324e-8, 'iv':3.9e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x24']= {'nmb':'L200x200x24', 'P':71.1, 'h':200e-3, 'b':200e-3, 't':24e-3, 'r1':18e-3, 'r2':9e-3, 'A':91e-4, 'zs':5.84e-3, 'ys':5.84e-3, 'v':14.14e-2, 'u1':8.26e-2, 'u2':7.21e-2, 'AL':0.785, 'AG':11.03, 'Iy':3331e-8, 'Iz':3331e-8, 'Iyz':-1955e-8, 'Wzel':235.2e-6, 'Wyel':235.2e-6, 'iz':6.06e-2, 'iy':6.06e-2, 'Iu':5286e-8, 'iu':7.64e-2, 'Iv':1375e-8, 'iv':3.9e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x25']= {'nmb':'L200x200x25', 'P':73.9, 'h':200e-3, 'b':200e-3, 't':25e-3, 'r1':18e-3, 'r2':9e-3, 'A':94.1e-4, 'zs':5.88e-3, 'ys':5.88e-3, 'v':14.14e-2, 'u1':8.31e-2, 'u2':7.23e-2, 'AL':0.785, 'AG':10.62, 'Iy':3446e-8, 'Iz':3446e-8, 'Iyz':-2020e-8, 'Wzel':244e-6, 'Wyel':244e-6, 'iz':6.05e-2, 'iy':6.05e-2, 'Iu':5467e-8, 'iu':7.62e-2, 'Iv':1426e-8, 'iv':3.89e-2, 'E':2.1e+11, 'nu':0.3}
-L['L200x200x26']= {'nmb':'L200x200x26', 'P':76.6, 'h':200e-3, 'b':200e-3, 't':26e-3, 'r1':18e-3, 'r2':9e-3, 'A':97.6e-4, 'zs':5.91e-3, 'ys':5.91e-3, 'v':14.14e-2, 'u1':8.36e-2, 'u2':7.25e-2, 'AL':0.785, 'AG':10.24, 'Iy':3560e-8, 'Iz':3560e-8, 'Iyz':-2084e-8, 'Wzel':252.7e-6, 'Wyel':252.7e-6, 'iz':6.04e-2, 'iy':6.04e-2, 'Iu':5645e-8, 'iu':7.61e-2, 'Iv':1476e-8, 'iv':3.89e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x20']= {'nmb':'L250x250x20', 'P':75.6, 'h':250e-3, 'b':250e-3, 't':20e-3, 'r1':18e-3, 'r2':9e-3, 'A':96.4e-4, 'zs':6.93e-3, 'ys':6.93e-3, 'v':17.68e-2, 'u1':9.81e-2, 'u2':8.91e-2, 'AL':0.985, 'AG':13.02, 'Iy':5743e-8, 'Iz':5743e-8, 'Iyz':-3401e-8, 'Wzel':317.9e-6, 'Wyel':317.9e-6, 'iz':7.72e-2, 'iy':7.72e-2, 'Iu':9144e-8, 'iu':9.74e-2, 'Iv':2341e-8, 'iv':4.93e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x21']= {'nmb':'L250x250x21', 'P':79.2, 'h':250e-3, 'b':250e-3, 't':21e-3, 'r1':18e-3, 'r2':9e-3, 'A':101e-4, 'zs':6.97e-3, 'ys':6.97e-3, 'v':17.68e-2, 'u1':9.86e-2, 'u2':8.93e-2, 'AL':0.985, 'AG':12.43, 'Iy':5997e-8, 'Iz':5997e-8, 'Iyz':-3550e-8, 'Wzel':332.7e-6, 'Wyel':332.7e-6, 'iz':7.71e-2, 'iy':7.71e-2, 'Iu':9548e-8, 'iu':9.73e-2, 'Iv':2447e-8, 'iv':4.92e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x22']= {'nmb':'L250x250x22', 'P':82.8, 'h':250e-3, 'b':250e-3, 't':22e-3, 'r1':18e-3, 'r2':9e-3, 'A':106e-4, 'zs':7.01e-3, 'ys':7.01e-3, 'v':17.68e-2, 'u1':9.92e-2, 'u2':8.94e-2, 'AL':0.985, 'AG':11.89, 'Iy':6249e-8, 'Iz':6249e-8, 'Iyz':-3697e-8, 'Wzel':347.4e-6, 'Wyel':347.4e-6, 'iz':7.7e-2, 'iy':7.7e-2, 'Iu':9946e-8, 'iu':9.71e-2, 'Iv':2551e-8, 'iv':4.92e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x23']= {'nmb':'L250x250x23', 'P':86.4, 'h':250e-3, 'b':250e-3, 't':23e-3, 'r1':18e-3, 'r2':9e-3, 'A':110e-4, 'zs':7.05e-3, 'ys':7.05e-3, 'v':17.68e-2, 'u1':9.97e-2, 'u2':8.96e-2, 'AL':0.985, 'AG':11.4, 'Iy':6497e-8, 'Iz':6497e-8, 'Iyz':-3842e-8, 'Wzel':362e-6, 'Wyel':362e-6, 'iz':7.68e-2, 'iy':7.68e-2, 'Iu':10339e-8, 'iu':9.69e-2, 'Iv':2655e-8, 'iv':4.91e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x24']= {'nmb':'L250x250x24', 'P':90, 'h':250e-3, 'b':250e-3, 't':24e-3, 'r1':18e-3, 'r2':9e-3, 'A':115e-4, 'zs':7.09e-3, 'ys':7.09e-3, 'v':17.68e-2, 'u1':10.03e-2, 'u2':8.98e-2, 'AL':0.985, 'AG':10.95, 'Iy':6743e-8, 'Iz':6743e-8, 'Iyz':-3984e-8, 'Wzel':376.5e-6, 'Wyel':376.5e-6, 'iz':7.67e-2, 'iy':7.67e-2, 'Iu':10727e-8, 'iu':9.68e-2, 'Iv':2759e-8, 'iv':4.91e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x25']= {'nmb':'L250x250x25', 'P':93.5, 'h':250e-3, 'b':250e-3, 't':25e-3, 'r1':18e-3, 'r2':9e-3, 'A':119e-4, 'zs':7.13e-3, 'ys':7.13e-3, 'v':17.68e-2, 'u1':10.08e-2, 'u2':8.99e-2, 'AL':0.985, 'AG':10.53, 'Iy':6986e-8, 'Iz':6986e-8, 'Iyz':-4124e-8, 'Wzel':390.9e-6, 'Wyel':390.9e-6, 'iz':7.66e-2, 'iy':7.66e-2, 'Iu':11110e-8, 'iu':9.66e-2, 'Iv':2861e-8, 'iv':4.9e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x26']= {'nmb':'L250x250x26', 'P':97, 'h':250e-3, 'b':250e-3, 't':26e-3, 'r1':18e-3, 'r2':9e-3, 'A':124e-4, 'zs':7.17e-3, 'ys':7.17e-3, 'v':17.68e-2, 'u1':10.13e-2, 'u2':9.01e-2, 'AL':0.985, 'AG':10.15, 'Iy':7226e-8, 'Iz':7226e-8, 'Iyz':-4262e-8, 'Wzel':405.2e-6, 'Wyel':405.2e-6, 'iz':7.65e-2, 'iy':7.65e-2, 'Iu':11488e-8, 'iu':9.64e-2, 'Iv':2963e-8, 'iv':4.9e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x27']= {'nmb':'L250x250x27', 'P':101, 'h':250e-3, 'b':250e-3, 't':27e-3, 'r1':18e-3, 'r2':9e-3, 'A':128e-4, 'zs':7.2e-3, 'ys':7.2e-3, 'v':17.68e-2, 'u1':10.19e-2, 'u2':9.03e-2, 'AL':0.985, 'AG':9.79, 'Iy':7463e-8, 'Iz':7463e-8, 'Iyz':-4398e-8, 'Wzel':419.3e-6, 'Wyel':419.3e-6, 'iz':7.63e-2, 'iy':7.63e-2, 'Iu':11861e-8, 'iu':9.62e-2, 'Iv':3065e-8, 'iv':4.89e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x28']= {'nmb':'L250x250x28', 'P':104, 'h':250e-3, 'b':250e-3, 't':28e-3, 'r1':18e-3, 'r2':9e-3, 'A':133e-4, 'zs':7.24e-3, 'ys':7.24e-3, 'v':17.68e-2, 'u1':10.24e-2, 'u2':9.04e-2, 'AL':0.985, 'AG':9.47, 'Iy':7697e-8, 'Iz':7697e-8, 'Iyz':-4532e-8, 'Wzel':433.4e-6, 'Wyel':433.4e-6, 'iz':7.62e-2, 'iy':7.62e-2, 'Iu':12229e-8, 'iu':9.61e-2, 'Iv':3166e-8, 'iv':4.89e-2, 'E':2.1e+11, 'nu':0.3}
-L['L250x250x35']= {'nmb':'L250x250x35', 'P':128, 'h':250e-3, 'b':250e-3, 't':35e-3, 'r1':18e-3, 'r2':9e-3, 'A':163e-4, 'zs':7.5e-3, 'ys':7.5e-3, 'v':17.68e-2, 'u1':10.61e-2, 'u2':9.17e-2, 'AL':0.985, 'AG':7.69, 'Iy':9264e-8, 'Iz':9264e-8, 'Iyz':-5405e-8, 'Wzel':529.4e-6, 'Wyel':529.4e-6, 'iz':7.54e-2, 'iy':7.54e-2, 'Iu':14669e-8, 'iu':9.48e-2, 'Iv':3859e-8, 'iv':4.86e-2, 'E':2.1e+11, 'nu':0.3}
-L['L203x203x19']= {'nmb':'L203x203x19', 'P':57.9, 'h':203e-3, 'b':203e-3, 't':19e-3, 'r1':8e-3, 'r2':4e-3, 'A':73.6e-4, 'zs':5.76e-3, 'ys':5.76e-3, 'v':14.35e-2, 'u1':8.15e-2, 'u2':7.38e-2, 'AL':0.805, 'AG':13.94, 'Iy':2881e-8, 'Iz':2881e-8, 'Iyz':-1707e-8, 'Wzel':198.2e-6, 'Wyel':198.2e-6, 'iz':6.26e-2, 'iy':6.26e-2, 'Iu':4588e-8, 'iu':7.9e-2, 'Iv':1174e-8, 'iv':3.99e-2, 'E':2.1e+11, 'nu':0.3}
-L['L203x203x22.2']= {'nmb':'L203x203x22.2', 'P':67, 'h':203e-3, 'b':203e-3, 't':22.2e-3, 'r1':8e-3, 'r2':4e-3, 'A':85e-4, 'zs':5.88e-3, 'ys':5.88e-3, 'v':14.35e-2, 'u1':8.32e-2, 'u2':7.44e-2, 'AL':0.805, 'AG':12.03, 'Iy':3293e-8, 'Iz':3293e-8, 'Iyz':-1943e-8, 'Wzel':228.4e-6, 'Wyel':228.4e-6, 'iz':6.21e-2, 'iy':6.21e-2, 'Iu':5236e-8, 'iu':7.84e-2, 'Iv':1350e-8, 'iv':3.98e-2, 'E':2.1e+11, 'nu':0.3}
-L['L203x203x25.4']= {'nmb':'L203x203x25.4', 'P':75.9, 'h':203e-3, 'b':203e-3, 't':25.4e-3, 'r1':8e-3, 'r2':4e-3, 'A':96.8e-4, 'zs':6e-3, 'ys':6e-3, 'v':14.35e-2, 'u1':8.48e-2, 'u2':7.5e-2, 'AL':0.805, 'AG':10.6, 'Iy':3686e-8, 'Iz':3686e-8, 'Iyz':-2164e-8, 'Wzel':257.7e-6, 'Wyel':257.7e-6, 'iz':6.17e-2, 'iy':6.17e-2, 'Iu':5850e-8, 'iu':7.78e-2, 'Iv':1522e-8, 'iv':3.97e-2, 'E':2.1e+11, 'nu':0.3}
-L['L203x203x28.6']= {'nmb':'L203x203x28.6', 'P':84.7, 'h':203e-3, 'b':203e-3, 't':28.6e-3, 'r1':8e-3, 'r2':4e-3, 'A':108e-4, 'zs':6.11e-3, 'ys':6.11e-3, 'v':14.35e-2, 'u1':8.65e-2, 'u2':7.57e-2, 'AL':0.805, 'AG':9.5, 'Iy':4062e-8, 'Iz':4062e-8, 'Iyz':-2370e-8, 'Wzel':286.3e-6, 'Wyel':286.3e-6, 'iz':6.13e-2, 'iy':6.13e-2, 'Iu':6432e-8, 'iu':7.72e-2, 'Iv':1692e-8, 'iv':3.96e-2, 'E':2.1e+11, 'nu':0.3}
-
-for item in L:
-    shape= L[item]
+
+def setLDerivedValues(shape):
+    '''Compute the properties of the L shapes that are not in the table.'''
     A= shape['A']
     E= shape['E']
     nu= shape['nu']
@@ -559,6 +229,8 @@ for item in L:
     shape['It']= 2/3.0*b*t*t*t
     shape['alpha']= shape['AreaQy']/A
 
+L= shape_table.ShapeTable('arcelor_L',setLDerivedValues)
+
 # Arcelor U shaped sheet pile.
 
 # Cross section axis:
@@ -584,15 +256,6 @@ for item in L:
 # Warning: area in m2/m, inertia in m4/m, Wz in m3/m and so on
 
 
-AU={}
-
-AU['AU_14']= {'nmb':'AU_14', 'P':77.9, 'h':408e-3, 'b':750e-3, 's':8.3e-3, 't':10.0e-3, 'A':132.3e-4, 'Iz':28880e-8, 'Wzel':1405e-6, 'Wzpl':1663e-8, 'Szel':820e-6, 'E':2.1e+11, 'nu':0.3}
-AU['AU_16']= {'nmb':'AU_16', 'P':86.3, 'h':411e-3, 'b':750e-3, 's':9.3e-3, 't':11.5e-3, 'A':146.5e-4, 'Iz':32850e-8, 'Wzel':1600e-6, 'Wzpl':1891e-8, 'Szel':935e-6, 'E':2.1e+11, 'nu':0.3}
-AU['AU_18']= {'nmb':'AU_18', 'P':88.5, 'h':441e-3, 'b':750e-3, 's':9.1e-3, 't':10.5e-3, 'A':150.3e-4, 'Iz':39300e-8, 'Wzel':1780e-6, 'Wzpl':2082e-8, 'Szel':1030e-6, 'E':2.1e+11, 'nu':0.3}
-AU['AU_20']= {'nmb':'AU_20', 'P':96.9, 'h':444e-3, 'b':750e-3, 's':10.0e-3, 't':12.0e-3, 'A':164.6e-4, 'Iz':44440e-8, 'Wzel':2000e-6, 'Wzpl':2339e-8, 'Szel':1155e-6, 'E':2.1e+11, 'nu':0.3}
-AU['AU_23']= {'nmb':'AU_23', 'P':102.1, 'h':447e-3, 'b':750e-3, 's':9.5e-3, 't':13.0e-3, 'A':173.4e-4, 'Iz':50700e-8, 'Wzel':2270e-6, 'Wzpl':2600e-8, 'Szel':1285e-6, 'E':2.1e+11, 'nu':0.3}
-AU['AU_25']= {'nmb':'AU_25', 'P':110.4, 'h':450e-3, 'b':750e-3, 's':10.2e-3, 't':14.5e-3, 'A':187.5e-4, 'Iz':56240e-8, 'Wzel':2500e-6, 'Wzpl':2866e-8, 'Szel':1420e-6, 'E':2.1e+11, 'nu':0.3}
-
 #Code to import data.
 # dataList= [('P',6,''),('h',2,'e-3'),('b',1,'e-3'),('s',4,'e-3'),('t',3,'e-3'),('A',5,'e-4'),('Iz',8,'e-8'),('Wzel',9,'e-6'),('Wzpl',11,'e-8'),('Szel',10,'e-6')]
 # import csv
@@ -610,8 +273,8 @@ AU['AU_25']= {'nmb':'AU_25', 'P':110.4, 'h':450e-3, 'b':750e-3, 's':10.2e-3, 't'
 # finally:
 #     f.close()
 
-for item in AU:
-    shape= AU[item]
+def setAUDerivedValues(shape):
+    '''Compute the properties of the AU shapes that are not in the table.'''
     h= shape['h'] #Height
     tf= shape['t'] #Flange thickness
     tw= shape['s'] #Web thickness
@@ -624,6 +287,8 @@ for item in AU:
     shape['alpha']= Avy/A
     shape['G']= E/(2*(1+nu))
 
+AU= shape_table.ShapeTable('arcelor_AU',setAUDerivedValues)
+
 # Arcelor square hollow tubes.
 # Cross section axis:
 
@@ -650,90 +315,13 @@ for item in AU:
 # values are identical: no need to exchange.
 
 
-SHS={}
-
 '''
 XXX Control shear distortion constants
    alpha-> alphaZ,alphaY
 '''
-SHS['SHS50x50x2_5']= {'nmb':'SHS50x50x2.5', 'b':0.05, 'h':0.05, 'e':2.5e-3, 'P':3.54, 'A':4.51e-4, 'Iz':17.9e-8, 'Iy':17.9e-8, 'Wzel':7.16e-6, 'Wzpl':8.47e-6, 'iz':1.99e-2, 'iy':1.99e-2, 'It':26.8e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS50x50x3']= {'nmb':'SHS50x50x3', 'b':0.05, 'h':0.05, 'e':3e-3, 'P':4.22, 'A':5.37e-4, 'Iz':20.8e-8, 'Iy':20.8e-8, 'Wzel':8.34e-6, 'Wzpl':9.95e-6, 'iz':1.97e-2, 'iy':1.97e-2, 'It':31.1e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS50x50x4']= {'nmb':'SHS50x50x4', 'b':0.05, 'h':0.05, 'e':4e-3, 'P':5.52, 'A':7.03e-4, 'Iz':26.2e-8, 'Iy':26.2e-8, 'Wzel':10.46e-6, 'Wzpl':12.73e-6, 'iz':1.93e-2, 'iy':1.93e-2, 'It':38.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS50x50x5']= {'nmb':'SHS50x50x5', 'b':0.05, 'h':0.05, 'e':5e-3, 'P':6.78, 'A':8.64e-4, 'Iz':30.8e-8, 'Iy':30.8e-8, 'Wzel':12.3e-6, 'Wzpl':15.25e-6, 'iz':1.89e-2, 'iy':1.89e-2, 'It':45.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS60x60x2']= {'nmb':'SHS60x60x2', 'b':0.06, 'h':0.06, 'e':2e-3, 'P':3.6, 'A':4.58e-4, 'Iz':26e-8, 'Iy':26e-8, 'Wzel':8.68e-6, 'Wzpl':10.1e-6, 'iz':2.38e-2, 'iy':2.38e-2, 'It':39e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS60x60x3']= {'nmb':'SHS60x60x3', 'b':0.06, 'h':0.06, 'e':3e-3, 'P':5.32, 'A':6.78e-4, 'Iz':37.1e-8, 'Iy':37.1e-8, 'Wzel':12.38e-6, 'Wzpl':14.63e-6, 'iz':2.34e-2, 'iy':2.34e-2, 'It':55.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS60x60x4']= {'nmb':'SHS60x60x4', 'b':0.06, 'h':0.06, 'e':4e-3, 'P':7, 'A':8.92e-4, 'Iz':47.1e-8, 'Iy':47.1e-8, 'Wzel':15.69e-6, 'Wzpl':18.85e-6, 'iz':2.3e-2, 'iy':2.3e-2, 'It':70.2e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS60x60x5']= {'nmb':'SHS60x60x5', 'b':0.06, 'h':0.06, 'e':5e-3, 'P':8.63, 'A':10.99e-4, 'Iz':55.9e-8, 'Iy':55.9e-8, 'Wzel':18.64e-6, 'Wzpl':22.75e-6, 'iz':2.26e-2, 'iy':2.26e-2, 'It':83.2e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS70x70x2']= {'nmb':'SHS70x70x2', 'b':0.07, 'h':0.07, 'e':2e-3, 'P':4.34, 'A':5.53e-4, 'Iz':42e-8, 'Iy':42e-8, 'Wzel':11.99e-6, 'Wzpl':13.88e-6, 'iz':2.76e-2, 'iy':2.76e-2, 'It':62.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS70x70x3']= {'nmb':'SHS70x70x3', 'b':0.07, 'h':0.07, 'e':3e-3, 'P':6.43, 'A':8.2e-4, 'Iz':60.3e-8, 'Iy':60.3e-8, 'Wzel':17.22e-6, 'Wzpl':20.21e-6, 'iz':2.71e-2, 'iy':2.71e-2, 'It':90.2e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS70x70x4']= {'nmb':'SHS70x70x4', 'b':0.07, 'h':0.07, 'e':4e-3, 'P':8.48, 'A':10.8e-4, 'Iz':76.9e-8, 'Iy':76.9e-8, 'Wzel':21.98e-6, 'Wzpl':26.17e-6, 'iz':2.67e-2, 'iy':2.67e-2, 'It':115e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS70x70x5']= {'nmb':'SHS70x70x5', 'b':0.07, 'h':0.07, 'e':5e-3, 'P':10.48, 'A':13.35e-4, 'Iz':92.1e-8, 'Iy':92.1e-8, 'Wzel':26.31e-6, 'Wzpl':31.75e-6, 'iz':2.63e-2, 'iy':2.63e-2, 'It':137.3e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS75x75x2']= {'nmb':'SHS75x75x2', 'b':0.075, 'h':0.075, 'e':2e-3, 'P':4.54, 'A':5.78e-4, 'Iz':51.9e-8, 'Iy':51.9e-8, 'Wzel':13.84e-6, 'Wzpl':15.99e-6, 'iz':3e-2, 'iy':3e-2, 'It':77.8e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS75x75x3']= {'nmb':'SHS75x75x3', 'b':0.075, 'h':0.075, 'e':3e-3, 'P':6.73, 'A':8.57e-4, 'Iz':74.8e-8, 'Iy':74.8e-8, 'Wzel':19.94e-6, 'Wzpl':23.34e-6, 'iz':2.95e-2, 'iy':2.95e-2, 'It':112e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS75x75x4']= {'nmb':'SHS75x75x4', 'b':0.075, 'h':0.075, 'e':4e-3, 'P':8.87, 'A':11.3e-4, 'Iz':95.7e-8, 'Iy':95.7e-8, 'Wzel':25.53e-6, 'Wzpl':30.28e-6, 'iz':2.91e-2, 'iy':2.91e-2, 'It':143.2e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS75x75x5']= {'nmb':'SHS75x75x5', 'b':0.075, 'h':0.075, 'e':5e-3, 'P':10.97, 'A':13.97e-4, 'Iz':114.9e-8, 'Iy':114.9e-8, 'Wzel':30.64e-6, 'Wzpl':36.81e-6, 'iz':2.87e-2, 'iy':2.87e-2, 'It':171.5e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS80x80x2']= {'nmb':'SHS80x80x2', 'b':0.08, 'h':0.08, 'e':2e-3, 'P':4.83, 'A':6.15e-4, 'Iz':63.3e-8, 'Iy':63.3e-8, 'Wzel':15.83e-6, 'Wzpl':18.26e-6, 'iz':3.21e-2, 'iy':3.21e-2, 'It':94.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS80x80x3']= {'nmb':'SHS80x80x3', 'b':0.08, 'h':0.08, 'e':3e-3, 'P':7.17, 'A':9.14e-4, 'Iz':91.4e-8, 'Iy':91.4e-8, 'Wzel':22.86e-6, 'Wzpl':26.69e-6, 'iz':3.16e-2, 'iy':3.16e-2, 'It':137e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS80x80x4']= {'nmb':'SHS80x80x4', 'b':0.08, 'h':0.08, 'e':4e-3, 'P':9.47, 'A':12.06e-4, 'Iz':117.4e-8, 'Iy':117.4e-8, 'Wzel':29.35e-6, 'Wzpl':34.69e-6, 'iz':3.12e-2, 'iy':3.12e-2, 'It':175.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS80x80x5']= {'nmb':'SHS80x80x5', 'b':0.08, 'h':0.08, 'e':5e-3, 'P':11.71, 'A':14.92e-4, 'Iz':141.3e-8, 'Iy':141.3e-8, 'Wzel':35.31e-6, 'Wzpl':42.25e-6, 'iz':3.08e-2, 'iy':3.08e-2, 'It':210.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS80x80x6']= {'nmb':'SHS80x80x6', 'b':0.08, 'h':0.08, 'e':6e-3, 'P':13.9, 'A':17.71e-4, 'Iz':163.2e-8, 'Iy':163.2e-8, 'Wzel':40.79e-6, 'Wzpl':49.39e-6, 'iz':3.04e-2, 'iy':3.04e-2, 'It':243.1e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS90x90x2']= {'nmb':'SHS90x90x2', 'b':0.09, 'h':0.09, 'e':2e-3, 'P':5.57, 'A':7.1e-4, 'Iz':90.9e-8, 'Iy':90.9e-8, 'Wzel':20.2e-6, 'Wzpl':23.24e-6, 'iz':3.58e-2, 'iy':3.58e-2, 'It':136.3e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS90x90x3']= {'nmb':'SHS90x90x3', 'b':0.09, 'h':0.09, 'e':3e-3, 'P':8.28, 'A':10.55e-4, 'Iz':131.9e-8, 'Iy':131.9e-8, 'Wzel':29.3e-6, 'Wzpl':34.07e-6, 'iz':3.54e-2, 'iy':3.54e-2, 'It':197.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS90x90x4']= {'nmb':'SHS90x90x4', 'b':0.09, 'h':0.09, 'e':4e-3, 'P':10.94, 'A':13.94e-4, 'Iz':170e-8, 'Iy':170e-8, 'Wzel':37.77e-6, 'Wzpl':44.41e-6, 'iz':3.49e-2, 'iy':3.49e-2, 'It':254.4e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS90x90x5']= {'nmb':'SHS90x90x5', 'b':0.09, 'h':0.09, 'e':5e-3, 'P':13.56, 'A':17.27e-4, 'Iz':205.4e-8, 'Iy':205.4e-8, 'Wzel':45.65e-6, 'Wzpl':54.25e-6, 'iz':3.45e-2, 'iy':3.45e-2, 'It':307.1e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS90x90x6']= {'nmb':'SHS90x90x6', 'b':0.09, 'h':0.09, 'e':6e-3, 'P':16.12, 'A':20.54e-4, 'Iz':238.3e-8, 'Iy':238.3e-8, 'Wzel':52.95e-6, 'Wzpl':63.61e-6, 'iz':3.41e-2, 'iy':3.41e-2, 'It':355.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS100x100x3']= {'nmb':'SHS100x100x3', 'b':0.1, 'h':0.1, 'e':3e-3, 'P':9.02, 'A':11.49e-4, 'Iz':182.7e-8, 'Iy':182.7e-8, 'Wzel':36.54e-6, 'Wzpl':42.35e-6, 'iz':3.99e-2, 'iy':3.99e-2, 'It':273.8e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS100x100x4']= {'nmb':'SHS100x100x4', 'b':0.1, 'h':0.1, 'e':4e-3, 'P':11.93, 'A':15.2e-4, 'Iz':236.3e-8, 'Iy':236.3e-8, 'Wzel':47.27e-6, 'Wzpl':55.33e-6, 'iz':3.94e-2, 'iy':3.94e-2, 'It':353.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS100x100x5']= {'nmb':'SHS100x100x5', 'b':0.1, 'h':0.1, 'e':5e-3, 'P':14.79, 'A':18.84e-4, 'Iz':286.6e-8, 'Iy':286.6e-8, 'Wzel':57.32e-6, 'Wzpl':67.75e-6, 'iz':3.9e-2, 'iy':3.9e-2, 'It':428.7e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS100x100x6']= {'nmb':'SHS100x100x6', 'b':0.1, 'h':0.1, 'e':6e-3, 'P':17.6, 'A':22.42e-4, 'Iz':333.6e-8, 'Iy':333.6e-8, 'Wzel':66.72e-6, 'Wzpl':79.63e-6, 'iz':3.86e-2, 'iy':3.86e-2, 'It':498.4e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS100x100x7']= {'nmb':'SHS100x100x7', 'b':0.1, 'h':0.1, 'e':7e-3, 'P':20.36, 'A':25.94e-4, 'Iz':377.5e-8, 'Iy':377.5e-8, 'Wzel':75.5e-6, 'Wzpl':90.99e-6, 'iz':3.82e-2, 'iy':3.82e-2, 'It':563e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS110x110x3']= {'nmb':'SHS110x110x3', 'b':0.11, 'h':0.11, 'e':3e-3, 'P':9.76, 'A':12.43e-4, 'Iz':245.2e-8, 'Iy':245.2e-8, 'Wzel':44.58e-6, 'Wzpl':51.53e-6, 'iz':4.44e-2, 'iy':4.44e-2, 'It':367.5e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS110x110x4']= {'nmb':'SHS110x110x4', 'b':0.11, 'h':0.11, 'e':4e-3, 'P':12.92, 'A':16.45e-4, 'Iz':318.1e-8, 'Iy':318.1e-8, 'Wzel':57.83e-6, 'Wzpl':67.45e-6, 'iz':4.4e-2, 'iy':4.4e-2, 'It':476.4e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS110x110x5']= {'nmb':'SHS110x110x5', 'b':0.11, 'h':0.11, 'e':5e-3, 'P':16.02, 'A':20.41e-4, 'Iz':386.8e-8, 'Iy':386.8e-8, 'Wzel':70.32e-6, 'Wzpl':82.75e-6, 'iz':4.35e-2, 'iy':4.35e-2, 'It':578.8e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS110x110x6']= {'nmb':'SHS110x110x6', 'b':0.11, 'h':0.11, 'e':6e-3, 'P':19.08, 'A':24.3e-4, 'Iz':451.4e-8, 'Iy':451.4e-8, 'Wzel':82.08e-6, 'Wzpl':97.45e-6, 'iz':4.31e-2, 'iy':4.31e-2, 'It':674.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS110x110x7']= {'nmb':'SHS110x110x7', 'b':0.11, 'h':0.11, 'e':7e-3, 'P':22.09, 'A':28.13e-4, 'Iz':512.3e-8, 'Iy':512.3e-8, 'Wzel':93.14e-6, 'Wzpl':111.57e-6, 'iz':4.27e-2, 'iy':4.27e-2, 'It':764.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS120x120x3']= {'nmb':'SHS120x120x3', 'b':0.12, 'h':0.12, 'e':3e-3, 'P':10.87, 'A':13.85e-4, 'Iz':320.5e-8, 'Iy':320.5e-8, 'Wzel':53.42e-6, 'Wzpl':61.61e-6, 'iz':4.81e-2, 'iy':4.81e-2, 'It':480.5e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS120x120x4']= {'nmb':'SHS120x120x4', 'b':0.12, 'h':0.12, 'e':4e-3, 'P':14.4, 'A':18.34e-4, 'Iz':416.7e-8, 'Iy':416.7e-8, 'Wzel':69.46e-6, 'Wzpl':80.77e-6, 'iz':4.77e-2, 'iy':4.77e-2, 'It':624.4e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS120x120x5']= {'nmb':'SHS120x120x5', 'b':0.12, 'h':0.12, 'e':5e-3, 'P':17.87, 'A':22.77e-4, 'Iz':507.9e-8, 'Iy':507.9e-8, 'Wzel':84.65e-6, 'Wzpl':99.25e-6, 'iz':4.72e-2, 'iy':4.72e-2, 'It':760.4e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS120x120x6']= {'nmb':'SHS120x120x6', 'b':0.12, 'h':0.12, 'e':6e-3, 'P':21.3, 'A':27.13e-4, 'Iz':594.3e-8, 'Iy':594.3e-8, 'Wzel':99.04e-6, 'Wzpl':117.07e-6, 'iz':4.68e-2, 'iy':4.68e-2, 'It':888.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS120x120x7']= {'nmb':'SHS120x120x7', 'b':0.12, 'h':0.12, 'e':7e-3, 'P':24.67, 'A':31.43e-4, 'Iz':675.9e-8, 'Iy':675.9e-8, 'Wzel':112.66e-6, 'Wzpl':134.25e-6, 'iz':4.64e-2, 'iy':4.64e-2, 'It':1010e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS125x125x3']= {'nmb':'SHS125x125x3', 'b':0.125, 'h':0.125, 'e':3e-3, 'P':11.24, 'A':14.32e-4, 'Iz':363.4e-8, 'Iy':363.4e-8, 'Wzel':58.14e-6, 'Wzpl':66.99e-6, 'iz':5.04e-2, 'iy':5.04e-2, 'It':544.8e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS125x125x4']= {'nmb':'SHS125x125x4', 'b':0.125, 'h':0.125, 'e':4e-3, 'P':14.89, 'A':18.97e-4, 'Iz':472.9e-8, 'Iy':472.9e-8, 'Wzel':75.67e-6, 'Wzpl':87.88e-6, 'iz':4.99e-2, 'iy':4.99e-2, 'It':708.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS125x125x5']= {'nmb':'SHS125x125x5', 'b':0.125, 'h':0.125, 'e':5e-3, 'P':18.49, 'A':23.55e-4, 'Iz':577e-8, 'Iy':577e-8, 'Wzel':92.32e-6, 'Wzpl':108.06e-6, 'iz':4.95e-2, 'iy':4.95e-2, 'It':864e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS125x125x6']= {'nmb':'SHS125x125x6', 'b':0.125, 'h':0.125, 'e':6e-3, 'P':22.04, 'A':28.07e-4, 'Iz':675.8e-8, 'Iy':675.8e-8, 'Wzel':108.12e-6, 'Wzpl':127.56e-6, 'iz':4.91e-2, 'iy':4.91e-2, 'It':1011.1e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS125x125x7']= {'nmb':'SHS125x125x7', 'b':0.125, 'h':0.125, 'e':7e-3, 'P':25.54, 'A':32.53e-4, 'Iz':769.4e-8, 'Iy':769.4e-8, 'Wzel':123.11e-6, 'Wzpl':146.37e-6, 'iz':4.86e-2, 'iy':4.86e-2, 'It':1150.1e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS127x127x3']= {'nmb':'SHS127x127x3', 'b':0.127, 'h':0.127, 'e':3e-3, 'P':11.54, 'A':14.7e-4, 'Iz':381.5e-8, 'Iy':381.5e-8, 'Wzel':60.09e-6, 'Wzpl':69.21e-6, 'iz':5.1e-2, 'iy':5.1e-2, 'It':572e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS127x127x4']= {'nmb':'SHS127x127x4', 'b':0.127, 'h':0.127, 'e':4e-3, 'P':15.28, 'A':19.47e-4, 'Iz':496.8e-8, 'Iy':496.8e-8, 'Wzel':78.23e-6, 'Wzpl':90.81e-6, 'iz':5.05e-2, 'iy':5.05e-2, 'It':744.3e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS127x127x5']= {'nmb':'SHS127x127x5', 'b':0.127, 'h':0.127, 'e':5e-3, 'P':18.98, 'A':24.18e-4, 'Iz':606.3e-8, 'Iy':606.3e-8, 'Wzel':95.48e-6, 'Wzpl':111.69e-6, 'iz':5.01e-2, 'iy':5.01e-2, 'It':907.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS127x127x6']= {'nmb':'SHS127x127x6', 'b':0.127, 'h':0.127, 'e':6e-3, 'P':22.63, 'A':28.83e-4, 'Iz':710.4e-8, 'Iy':710.4e-8, 'Wzel':111.87e-6, 'Wzpl':131.88e-6, 'iz':4.96e-2, 'iy':4.96e-2, 'It':1062.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS127x127x7']= {'nmb':'SHS127x127x7', 'b':0.127, 'h':0.127, 'e':7e-3, 'P':26.23, 'A':33.41e-4, 'Iz':809.1e-8, 'Iy':809.1e-8, 'Wzel':127.42e-6, 'Wzpl':151.37e-6, 'iz':4.92e-2, 'iy':4.92e-2, 'It':1209.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS135x135x3']= {'nmb':'SHS135x135x3', 'b':0.135, 'h':0.135, 'e':3e-3, 'P':11.98, 'A':15.26e-4, 'Iz':460.2e-8, 'Iy':460.2e-8, 'Wzel':68.18e-6, 'Wzpl':78.42e-6, 'iz':5.49e-2, 'iy':5.49e-2, 'It':690e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS135x135x4']= {'nmb':'SHS135x135x4', 'b':0.135, 'h':0.135, 'e':4e-3, 'P':15.87, 'A':20.22e-4, 'Iz':600e-8, 'Iy':600e-8, 'Wzel':88.9e-6, 'Wzpl':103e-6, 'iz':5.45e-2, 'iy':5.45e-2, 'It':899.2e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS135x135x5']= {'nmb':'SHS135x135x5', 'b':0.135, 'h':0.135, 'e':5e-3, 'P':19.72, 'A':25.12e-4, 'Iz':733.4e-8, 'Iy':733.4e-8, 'Wzel':108.65e-6, 'Wzpl':126.81e-6, 'iz':5.4e-2, 'iy':5.4e-2, 'It':1098.5e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS135x135x6']= {'nmb':'SHS135x135x6', 'b':0.135, 'h':0.135, 'e':6e-3, 'P':23.52, 'A':29.96e-4, 'Iz':860.5e-8, 'Iy':860.5e-8, 'Wzel':127.49e-6, 'Wzpl':149.88e-6, 'iz':5.36e-2, 'iy':5.36e-2, 'It':1288e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS135x135x7']= {'nmb':'SHS135x135x7', 'b':0.135, 'h':0.135, 'e':7e-3, 'P':27.26, 'A':34.73e-4, 'Iz':981.6e-8, 'Iy':981.6e-8, 'Wzel':145.42e-6, 'Wzpl':172.2e-6, 'iz':5.32e-2, 'iy':5.32e-2, 'It':1468e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS140x140x4']= {'nmb':'SHS140x140x4', 'b':0.14, 'h':0.14, 'e':4e-3, 'P':16.86, 'A':21.48e-4, 'Iz':671.4e-8, 'Iy':671.4e-8, 'Wzel':95.91e-6, 'Wzpl':111.01e-6, 'iz':5.59e-2, 'iy':5.59e-2, 'It':1006.2e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS140x140x5']= {'nmb':'SHS140x140x5', 'b':0.14, 'h':0.14, 'e':5e-3, 'P':20.95, 'A':26.69e-4, 'Iz':821.3e-8, 'Iy':821.3e-8, 'Wzel':117.32e-6, 'Wzpl':136.75e-6, 'iz':5.55e-2, 'iy':5.55e-2, 'It':1230.2e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS140x140x6']= {'nmb':'SHS140x140x6', 'b':0.14, 'h':0.14, 'e':6e-3, 'P':25, 'A':31.84e-4, 'Iz':964.4e-8, 'Iy':964.4e-8, 'Wzel':137.77e-6, 'Wzpl':161.71e-6, 'iz':5.5e-2, 'iy':5.5e-2, 'It':1443.7e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS140x140x7']= {'nmb':'SHS140x140x7', 'b':0.14, 'h':0.14, 'e':7e-3, 'P':28.99, 'A':36.93e-4, 'Iz':1100.9e-8, 'Iy':1100.9e-8, 'Wzel':157.28e-6, 'Wzpl':185.91e-6, 'iz':5.46e-2, 'iy':5.46e-2, 'It':1646.8e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS140x140x8']= {'nmb':'SHS140x140x8', 'b':0.14, 'h':0.14, 'e':8e-3, 'P':32.93, 'A':41.95e-4, 'Iz':1231.2e-8, 'Iy':1231.2e-8, 'Wzel':175.88e-6, 'Wzpl':209.34e-6, 'iz':5.42e-2, 'iy':5.42e-2, 'It':1840e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS150x150x4']= {'nmb':'SHS150x150x4', 'b':0.15, 'h':0.15, 'e':4e-3, 'P':18.14, 'A':23.11e-4, 'Iz':830.5e-8, 'Iy':830.5e-8, 'Wzel':110.74e-6, 'Wzpl':127.93e-6, 'iz':5.99e-2, 'iy':5.99e-2, 'It':1244.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS150x150x5']= {'nmb':'SHS150x150x5', 'b':0.15, 'h':0.15, 'e':5e-3, 'P':22.55, 'A':28.73e-4, 'Iz':1017.4e-8, 'Iy':1017.4e-8, 'Wzel':135.66e-6, 'Wzpl':157.75e-6, 'iz':5.95e-2, 'iy':5.95e-2, 'It':1524.3e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS150x150x6']= {'nmb':'SHS150x150x6', 'b':0.15, 'h':0.15, 'e':6e-3, 'P':26.92, 'A':34.29e-4, 'Iz':1196.5e-8, 'Iy':1196.5e-8, 'Wzel':159.53e-6, 'Wzpl':186.73e-6, 'iz':5.91e-2, 'iy':5.91e-2, 'It':1791.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS150x150x7']= {'nmb':'SHS150x150x7', 'b':0.15, 'h':0.15, 'e':7e-3, 'P':31.23, 'A':39.78e-4, 'Iz':1367.9e-8, 'Iy':1367.9e-8, 'Wzel':182.39e-6, 'Wzpl':214.89e-6, 'iz':5.86e-2, 'iy':5.86e-2, 'It':2046.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS150x150x8']= {'nmb':'SHS150x150x8', 'b':0.15, 'h':0.15, 'e':8e-3, 'P':35.5, 'A':45.22e-4, 'Iz':1531.9e-8, 'Iy':1531.9e-8, 'Wzel':204.26e-6, 'Wzpl':242.22e-6, 'iz':5.82e-2, 'iy':5.82e-2, 'It':2290.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS160x160x4']= {'nmb':'SHS160x160x4', 'b':0.16, 'h':0.16, 'e':4e-3, 'P':19.33, 'A':24.62e-4, 'Iz':1013e-8, 'Iy':1013e-8, 'Wzel':126.63e-6, 'Wzpl':146.05e-6, 'iz':6.41e-2, 'iy':6.41e-2, 'It':1518.6e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS160x160x5']= {'nmb':'SHS160x160x5', 'b':0.16, 'h':0.16, 'e':5e-3, 'P':24.03, 'A':30.62e-4, 'Iz':1242.6e-8, 'Iy':1242.6e-8, 'Wzel':155.32e-6, 'Wzpl':180.25e-6, 'iz':6.37e-2, 'iy':6.37e-2, 'It':1861.9e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS160x160x6']= {'nmb':'SHS160x160x6', 'b':0.16, 'h':0.16, 'e':6e-3, 'P':28.69, 'A':36.55e-4, 'Iz':1463.1e-8, 'Iy':1463.1e-8, 'Wzel':182.89e-6, 'Wzpl':213.55e-6, 'iz':6.33e-2, 'iy':6.33e-2, 'It':2191.4e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS160x160x7']= {'nmb':'SHS160x160x7', 'b':0.16, 'h':0.16, 'e':7e-3, 'P':33.3, 'A':42.42e-4, 'Iz':1674.9e-8, 'Iy':1674.9e-8, 'Wzel':209.36e-6, 'Wzpl':245.97e-6, 'iz':6.28e-2, 'iy':6.28e-2, 'It':2507.1e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS160x160x8']= {'nmb':'SHS160x160x8', 'b':0.16, 'h':0.16, 'e':8e-3, 'P':37.86, 'A':48.23e-4, 'Iz':1878.2e-8, 'Iy':1878.2e-8, 'Wzel':234.77e-6, 'Wzpl':277.5e-6, 'iz':6.24e-2, 'iy':6.24e-2, 'It':2809.4e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS175x175x5']= {'nmb':'SHS175x175x5', 'b':0.175, 'h':0.175, 'e':5e-3, 'P':26.39, 'A':33.61e-4, 'Iz':1639.1e-8, 'Iy':1639.1e-8, 'Wzel':187.32e-6, 'Wzpl':216.81e-6, 'iz':6.98e-2, 'iy':6.98e-2, 'It':2456.5e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS175x175x6']= {'nmb':'SHS175x175x6', 'b':0.175, 'h':0.175, 'e':6e-3, 'P':31.52, 'A':40.15e-4, 'Iz':1933.2e-8, 'Iy':1933.2e-8, 'Wzel':220.93e-6, 'Wzpl':257.16e-6, 'iz':6.94e-2, 'iy':6.94e-2, 'It':2896.1e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS175x175x7']= {'nmb':'SHS175x175x7', 'b':0.175, 'h':0.175, 'e':7e-3, 'P':36.6, 'A':46.62e-4, 'Iz':2216.6e-8, 'Iy':2216.6e-8, 'Wzel':253.33e-6, 'Wzpl':296.52e-6, 'iz':6.9e-2, 'iy':6.9e-2, 'It':3319.1e-8, 'E':210000e6, 'nu':0.3}
-SHS['SHS175x175x8']= {'nmb':'SHS175x175x8', 'b':0.175, 'h':0.175, 'e':8e-3, 'P':41.63, 'A':53.03e-4, 'Iz':2489.7e-8, 'Iy':2489.7e-8, 'Wzel':284.53e-6, 'Wzpl':334.92e-6, 'iz':6.85e-2, 'iy':6.85e-2, 'It':3726e-8, 'E':210000e6, 'nu':0.3}
-
-for item in SHS:
-    shape= SHS[item]
+
+def setSHSDerivedValues(shape):
+    '''Compute the properties of the SHS shapes that are not in the table.'''
     A= shape['A']
     E= shape['E']
     nu= shape['nu']
@@ -747,222 +335,13 @@ for item in SHS:
     shape['Wyel']= shape['Wzel']
     shape['Wypl']= shape['Wzpl']
 
+SHS= shape_table.ShapeTable('arcelor_SHS',setSHSDerivedValues)
+
 # Arcelor rectangular hollow tubes.
 
-RHS={}
-
-RHS['RHS50x30x2_5']= {'nmb':'50x30x2_5', 'b':30e-3, 'h':50e-3, 'e':2.5e-3, 'P':2.817, 'A':3.59e-4, 'Iz':11.3e-8, 'Wzel':4.52e-6, 'Wzpl':5.7e-6, 'iz':1.77e-2, 'Iy':5.05e-8, 'Wyel':3.37e-6, 'Wypl':3.98e-6, 'iy':1.19e-2, 'It':11.74e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS50x30x3']= {'nmb':'50x30x3', 'b':30e-3, 'h':50e-3, 'e':3e-3, 'P':3.303, 'A':4.21e-4, 'Iz':12.83e-8, 'Wzel':5.13e-6, 'Wzpl':6.57e-6, 'iz':1.75e-2, 'Iy':5.7e-8, 'Wyel':3.8e-6, 'Wypl':4.58e-6, 'iy':1.16e-2, 'It':13.53e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS50x30x4']= {'nmb':'50x30x4', 'b':30e-3, 'h':50e-3, 'e':4e-3, 'P':4.198, 'A':5.35e-4, 'Iz':15.25e-8, 'Wzel':6.1e-6, 'Wzpl':8.05e-6, 'iz':1.69e-2, 'Iy':6.69e-8, 'Wyel':4.46e-6, 'Wypl':5.58e-6, 'iy':1.12e-2, 'It':16.53e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS60x20x2_5']= {'nmb':'60x20x2_5', 'b':20e-3, 'h':60e-3, 'e':2.5e-3, 'P':2.817, 'A':3.59e-4, 'Iz':13.8e-8, 'Wzel':4.6e-6, 'Wzpl':6.18e-6, 'iz':1.96e-2, 'Iy':2.31e-8, 'Wyel':2.31e-6, 'Wypl':2.75e-6, 'iy':0.8e-2, 'It':6.96e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS60x20x3']= {'nmb':'60x20x3', 'b':20e-3, 'h':60e-3, 'e':3e-3, 'P':3.303, 'A':4.21e-4, 'Iz':15.62e-8, 'Wzel':5.21e-6, 'Wzpl':7.11e-6, 'iz':1.93e-2, 'Iy':2.56e-8, 'Wyel':2.56e-6, 'Wypl':3.14e-6, 'iy':0.78e-2, 'It':7.87e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS60x20x4']= {'nmb':'60x20x4', 'b':20e-3, 'h':60e-3, 'e':4e-3, 'P':4.198, 'A':5.35e-4, 'Iz':18.42e-8, 'Wzel':6.14e-6, 'Wzpl':8.68e-6, 'iz':1.86e-2, 'Iy':2.9e-8, 'Wyel':2.9e-6, 'Wypl':3.75e-6, 'iy':0.74e-2, 'It':9.24e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS60x40x2_5']= {'nmb':'60x40x2_5', 'b':40e-3, 'h':60e-3, 'e':2.5e-3, 'P':3.602, 'A':4.59e-4, 'Iz':22.07e-8, 'Wzel':7.36e-6, 'Wzpl':9.06e-6, 'iz':2.19e-2, 'Iy':11.74e-8, 'Wyel':5.87e-6, 'Wypl':6.84e-6, 'iy':1.6e-2, 'It':25.14e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS60x40x3']= {'nmb':'60x40x3', 'b':40e-3, 'h':60e-3, 'e':3e-3, 'P':4.245, 'A':5.41e-4, 'Iz':25.38e-8, 'Wzel':8.46e-6, 'Wzpl':10.53e-6, 'iz':2.17e-2, 'Iy':13.44e-8, 'Wyel':6.72e-6, 'Wypl':7.94e-6, 'iy':1.58e-2, 'It':29.28e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS60x40x4']= {'nmb':'60x40x4', 'b':40e-3, 'h':60e-3, 'e':4e-3, 'P':5.454, 'A':6.95e-4, 'Iz':30.99e-8, 'Wzel':10.33e-6, 'Wzpl':13.16e-6, 'iz':2.11e-2, 'Iy':16.28e-8, 'Wyel':8.14e-6, 'Wypl':9.89e-6, 'iy':1.53e-2, 'It':36.67e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS60x40x5']= {'nmb':'60x40x5', 'b':40e-3, 'h':60e-3, 'e':5e-3, 'P':6.56, 'A':8.36e-4, 'Iz':35.33e-8, 'Wzel':11.78e-6, 'Wzpl':15.38e-6, 'iz':2.06e-2, 'Iy':18.43e-8, 'Wyel':9.21e-6, 'Wypl':11.52e-6, 'iy':1.48e-2, 'It':42.85e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS70x30x2_5']= {'nmb':'70x30x2_5', 'b':30e-3, 'h':70e-3, 'e':2.5e-3, 'P':3.602, 'A':4.59e-4, 'Iz':26.62e-8, 'Wzel':7.61e-6, 'Wzpl':9.79e-6, 'iz':2.41e-2, 'Iy':6.95e-8, 'Wyel':4.63e-6, 'Wypl':5.36e-6, 'iy':1.23e-2, 'It':18.62e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS70x30x3']= {'nmb':'70x30x3', 'b':30e-3, 'h':70e-3, 'e':3e-3, 'P':4.245, 'A':5.41e-4, 'Iz':30.57e-8, 'Wzel':8.74e-6, 'Wzpl':11.38e-6, 'iz':2.38e-2, 'Iy':7.9e-8, 'Wyel':5.26e-6, 'Wypl':6.2e-6, 'iy':1.21e-2, 'It':21.53e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS70x30x4']= {'nmb':'70x30x4', 'b':30e-3, 'h':70e-3, 'e':4e-3, 'P':5.454, 'A':6.95e-4, 'Iz':37.23e-8, 'Wzel':10.64e-6, 'Wzpl':14.2e-6, 'iz':2.31e-2, 'Iy':9.42e-8, 'Wyel':6.28e-6, 'Wypl':7.66e-6, 'iy':1.16e-2, 'It':26.53e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS70x30x5']= {'nmb':'70x30x5', 'b':30e-3, 'h':70e-3, 'e':5e-3, 'P':6.56, 'A':8.36e-4, 'Iz':42.3e-8, 'Wzel':12.08e-6, 'Wzpl':16.56e-6, 'iz':2.25e-2, 'Iy':10.49e-8, 'Wyel':6.99e-6, 'Wypl':8.84e-6, 'iy':1.12e-2, 'It':30.45e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS70x50x2']= {'nmb':'70x50x2', 'b':50e-3, 'h':70e-3, 'e':2e-3, 'P':3.562, 'A':4.54e-4, 'Iz':31.48e-8, 'Wzel':8.99e-6, 'Wzpl':10.8e-6, 'iz':2.63e-2, 'Iy':18.76e-8, 'Wyel':7.5e-6, 'Wypl':8.58e-6, 'iy':2.03e-2, 'It':37.45e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS70x50x3']= {'nmb':'70x50x3', 'b':50e-3, 'h':70e-3, 'e':3e-3, 'P':5.187, 'A':6.61e-4, 'Iz':44.05e-8, 'Wzel':12.59e-6, 'Wzpl':15.4e-6, 'iz':2.58e-2, 'Iy':26.1e-8, 'Wyel':10.44e-6, 'Wypl':12.21e-6, 'iy':1.99e-2, 'It':53.62e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS70x50x4']= {'nmb':'70x50x4', 'b':50e-3, 'h':70e-3, 'e':4e-3, 'P':6.71, 'A':8.55e-4, 'Iz':54.67e-8, 'Wzel':15.62e-6, 'Wzpl':19.48e-6, 'iz':2.53e-2, 'Iy':32.22e-8, 'Wyel':12.89e-6, 'Wypl':15.41e-6, 'iy':1.94e-2, 'It':68.07e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS70x50x5']= {'nmb':'70x50x5', 'b':50e-3, 'h':70e-3, 'e':5e-3, 'P':8.13, 'A':10.36e-4, 'Iz':63.46e-8, 'Wzel':18.13e-6, 'Wzpl':23.06e-6, 'iz':2.48e-2, 'Iy':37.2e-8, 'Wyel':14.88e-6, 'Wypl':18.2e-6, 'iy':1.9e-2, 'It':80.77e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x40x2']= {'nmb':'80x40x2', 'b':40e-3, 'h':80e-3, 'e':2e-3, 'P':3.562, 'A':4.54e-4, 'Iz':37.36e-8, 'Wzel':9.34e-6, 'Wzpl':11.61e-6, 'iz':2.87e-2, 'Iy':12.72e-8, 'Wyel':6.36e-6, 'Wypl':7.17e-6, 'iy':1.67e-2, 'It':30.88e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x40x3']= {'nmb':'80x40x3', 'b':40e-3, 'h':80e-3, 'e':3e-3, 'P':5.187, 'A':6.61e-4, 'Iz':52.25e-8, 'Wzel':13.06e-6, 'Wzpl':16.54e-6, 'iz':2.81e-2, 'Iy':17.56e-8, 'Wyel':8.78e-6, 'Wypl':10.16e-6, 'iy':1.63e-2, 'It':43.88e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x40x4']= {'nmb':'80x40x4', 'b':40e-3, 'h':80e-3, 'e':4e-3, 'P':6.71, 'A':8.55e-4, 'Iz':64.79e-8, 'Wzel':16.2e-6, 'Wzpl':20.91e-6, 'iz':2.75e-2, 'Iy':21.49e-8, 'Wyel':10.74e-6, 'Wypl':12.77e-6, 'iy':1.59e-2, 'It':55.24e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x40x5']= {'nmb':'80x40x5', 'b':40e-3, 'h':80e-3, 'e':5e-3, 'P':8.13, 'A':10.36e-4, 'Iz':75.11e-8, 'Wzel':18.78e-6, 'Wzpl':24.74e-6, 'iz':2.69e-2, 'Iy':24.59e-8, 'Wyel':12.3e-6, 'Wypl':15.02e-6, 'iy':1.54e-2, 'It':64.97e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x60x2']= {'nmb':'80x60x2', 'b':60e-3, 'h':80e-3, 'e':2e-3, 'P':4.19, 'A':5.34e-4, 'Iz':49.53e-8, 'Wzel':12.38e-6, 'Wzpl':14.73e-6, 'iz':3.05e-2, 'Iy':31.87e-8, 'Wyel':10.62e-6, 'Wypl':12.11e-6, 'iy':2.44e-2, 'It':61.22e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x60x3']= {'nmb':'80x60x3', 'b':60e-3, 'h':80e-3, 'e':3e-3, 'P':6.129, 'A':7.81e-4, 'Iz':70.05e-8, 'Wzel':17.51e-6, 'Wzpl':21.16e-6, 'iz':3e-2, 'Iy':44.89e-8, 'Wyel':14.96e-6, 'Wypl':17.37e-6, 'iy':2.4e-2, 'It':88.35e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x60x4']= {'nmb':'80x60x4', 'b':60e-3, 'h':80e-3, 'e':4e-3, 'P':7.966, 'A':10.15e-4, 'Iz':87.92e-8, 'Wzel':21.98e-6, 'Wzpl':26.99e-6, 'iz':2.94e-2, 'Iy':56.12e-8, 'Wyel':18.71e-6, 'Wypl':22.12e-6, 'iy':2.35e-2, 'It':113.12e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x60x5']= {'nmb':'80x60x5', 'b':60e-3, 'h':80e-3, 'e':5e-3, 'P':9.7, 'A':12.36e-4, 'Iz':103.28e-8, 'Wzel':25.82e-6, 'Wzpl':32.24e-6, 'iz':2.89e-2, 'Iy':65.66e-8, 'Wyel':21.89e-6, 'Wypl':26.38e-6, 'iy':2.31e-2, 'It':135.53e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x70x2']= {'nmb':'80x70x2', 'b':70e-3, 'h':80e-3, 'e':2e-3, 'P':4.504, 'A':5.7e-4, 'Iz':55.61e-8, 'Wzel':13.9e-6, 'Wzpl':16.29e-6, 'iz':3.11e-2, 'Iy':45.35e-8, 'Wyel':12.96e-6, 'Wypl':14.88e-6, 'iy':2.81e-2, 'It':78.31e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x70x3']= {'nmb':'80x70x3', 'b':70e-3, 'h':80e-3, 'e':3e-3, 'P':6.6, 'A':8.4e-4, 'Iz':78.94e-8, 'Wzel':19.74e-6, 'Wzpl':23.47e-6, 'iz':3.06e-2, 'Iy':64.26e-8, 'Wyel':18.36e-6, 'Wypl':21.43e-6, 'iy':2.76e-2, 'It':113.44e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x70x4']= {'nmb':'80x70x4', 'b':70e-3, 'h':80e-3, 'e':4e-3, 'P':8.594, 'A':10.9e-4, 'Iz':99.48e-8, 'Wzel':24.87e-6, 'Wzpl':30.03e-6, 'iz':3.01e-2, 'Iy':80.84e-8, 'Wyel':23.1e-6, 'Wypl':27.4e-6, 'iy':2.72e-2, 'It':145.86e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS80x70x5']= {'nmb':'80x70x5', 'b':70e-3, 'h':80e-3, 'e':5e-3, 'P':10.485, 'A':13.4e-4, 'Iz':117.36e-8, 'Wzel':29.34e-6, 'Wzpl':35.99e-6, 'iz':2.96e-2, 'Iy':95.21e-8, 'Wyel':27.2e-6, 'Wypl':32.81e-6, 'iy':2.67e-2, 'It':175.54e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x50x2']= {'nmb':'90x50x2', 'b':50e-3, 'h':90e-3, 'e':2e-3, 'P':4.19, 'A':5.34e-4, 'Iz':57.88e-8, 'Wzel':12.86e-6, 'Wzpl':15.74e-6, 'iz':3.29e-2, 'Iy':23.37e-8, 'Wyel':9.35e-6, 'Wypl':10.5e-6, 'iy':2.09e-2, 'It':53.37e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x50x3']= {'nmb':'90x50x3', 'b':50e-3, 'h':90e-3, 'e':3e-3, 'P':6.129, 'A':7.81e-4, 'Iz':81.85e-8, 'Wzel':18.19e-6, 'Wzpl':22.6e-6, 'iz':3.24e-2, 'Iy':32.74e-8, 'Wyel':13.1e-6, 'Wypl':15.03e-6, 'iy':2.05e-2, 'It':76.67e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x50x4']= {'nmb':'90x50x4', 'b':50e-3, 'h':90e-3, 'e':4e-3, 'P':7.966, 'A':10.15e-4, 'Iz':102.71e-8, 'Wzel':22.82e-6, 'Wzpl':28.82e-6, 'iz':3.18e-2, 'Iy':40.71e-8, 'Wyel':16.28e-6, 'Wypl':19.09e-6, 'iy':2e-2, 'It':97.7e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x50x5']= {'nmb':'90x50x5', 'b':50e-3, 'h':90e-3, 'e':5e-3, 'P':9.7, 'A':12.36e-4, 'Iz':120.6e-8, 'Wzel':26.8e-6, 'Wzpl':34.41e-6, 'iz':3.12e-2, 'Iy':47.37e-8, 'Wyel':18.95e-6, 'Wypl':22.7e-6, 'iy':1.96e-2, 'It':116.47e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x60x2']= {'nmb':'90x60x2', 'b':60e-3, 'h':90e-3, 'e':2e-3, 'P':4.504, 'A':5.74e-4, 'Iz':65.62e-8, 'Wzel':14.58e-6, 'Wzpl':17.5e-6, 'iz':3.38e-2, 'Iy':35.24e-8, 'Wyel':11.75e-6, 'Wypl':13.27e-6, 'iy':2.48e-2, 'It':72.51e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x60x3']= {'nmb':'90x60x3', 'b':60e-3, 'h':90e-3, 'e':3e-3, 'P':6.6, 'A':8.41e-4, 'Iz':93.21e-8, 'Wzel':20.71e-6, 'Wzpl':25.21e-6, 'iz':3.33e-2, 'Iy':49.77e-8, 'Wyel':16.59e-6, 'Wypl':19.08e-6, 'iy':2.43e-2, 'It':104.81e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x60x4']= {'nmb':'90x60x4', 'b':60e-3, 'h':90e-3, 'e':4e-3, 'P':8.594, 'A':10.95e-4, 'Iz':117.51e-8, 'Wzel':26.11e-6, 'Wzpl':32.26e-6, 'iz':3.28e-2, 'Iy':62.4e-8, 'Wyel':20.8e-6, 'Wypl':24.36e-6, 'iy':2.39e-2, 'It':134.44e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x60x5']= {'nmb':'90x60x5', 'b':60e-3, 'h':90e-3, 'e':5e-3, 'P':10.485, 'A':13.36e-4, 'Iz':138.68e-8, 'Wzel':30.82e-6, 'Wzpl':38.66e-6, 'iz':3.22e-2, 'Iy':73.24e-8, 'Wyel':24.41e-6, 'Wypl':29.13e-6, 'iy':2.34e-2, 'It':161.39e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x70x2']= {'nmb':'90x70x2', 'b':70e-3, 'h':90e-3, 'e':2e-3, 'P':4.818, 'A':6.14e-4, 'Iz':73.37e-8, 'Wzel':16.3e-6, 'Wzpl':19.26e-6, 'iz':3.46e-2, 'Iy':49.98e-8, 'Wyel':14.28e-6, 'Wypl':16.24e-6, 'iy':2.85e-2, 'It':93.2e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x70x3']= {'nmb':'90x70x3', 'b':70e-3, 'h':90e-3, 'e':3e-3, 'P':7.071, 'A':9.01e-4, 'Iz':104.57e-8, 'Wzel':23.24e-6, 'Wzpl':27.82e-6, 'iz':3.41e-2, 'Iy':71e-8, 'Wyel':20.29e-6, 'Wypl':23.44e-6, 'iy':2.81e-2, 'It':135.25e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x70x4']= {'nmb':'90x70x4', 'b':70e-3, 'h':90e-3, 'e':4e-3, 'P':9.222, 'A':11.75e-4, 'Iz':132.32e-8, 'Wzel':29.4e-6, 'Wzpl':35.7e-6, 'iz':3.36e-2, 'Iy':89.57e-8, 'Wyel':25.59e-6, 'Wypl':30.04e-6, 'iy':2.76e-2, 'It':174.23e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x70x5']= {'nmb':'90x70x5', 'b':70e-3, 'h':90e-3, 'e':5e-3, 'P':11.27, 'A':14.36e-4, 'Iz':156.77e-8, 'Wzel':34.84e-6, 'Wzpl':42.91e-6, 'iz':3.3e-2, 'Iy':105.8e-8, 'Wyel':30.23e-6, 'Wypl':36.06e-6, 'iy':2.71e-2, 'It':210.13e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS90x70x6']= {'nmb':'90x70x6', 'b':70e-3, 'h':90e-3, 'e':6e-3, 'P':13.214, 'A':16.83e-4, 'Iz':178.07e-8, 'Wzel':39.57e-6, 'Wzpl':49.46e-6, 'iz':3.25e-2, 'Iy':119.82e-8, 'Wyel':34.23e-6, 'Wypl':41.51e-6, 'iy':2.67e-2, 'It':242.91e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x40x2']= {'nmb':'100x40x2', 'b':40e-3, 'h':100e-3, 'e':2e-3, 'P':4.19, 'A':5.34e-4, 'Iz':65.38e-8, 'Wzel':13.08e-6, 'Wzpl':16.54e-6, 'iz':3.5e-2, 'Iy':15.61e-8, 'Wyel':7.81e-6, 'Wypl':8.69e-6, 'iy':1.71e-2, 'It':41.47e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x40x3']= {'nmb':'100x40x3', 'b':40e-3, 'h':100e-3, 'e':3e-3, 'P':6.129, 'A':7.81e-4, 'Iz':92.34e-8, 'Wzel':18.47e-6, 'Wzpl':23.75e-6, 'iz':3.44e-2, 'Iy':21.67e-8, 'Wyel':10.84e-6, 'Wypl':12.38e-6, 'iy':1.67e-2, 'It':59.05e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x40x4']= {'nmb':'100x40x4', 'b':40e-3, 'h':100e-3, 'e':4e-3, 'P':7.966, 'A':10.15e-4, 'Iz':115.7e-8, 'Wzel':23.14e-6, 'Wzpl':30.26e-6, 'iz':3.38e-2, 'Iy':26.69e-8, 'Wyel':13.35e-6, 'Wypl':15.65e-6, 'iy':1.62e-2, 'It':74.53e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x40x5']= {'nmb':'100x40x5', 'b':40e-3, 'h':100e-3, 'e':5e-3, 'P':9.7, 'A':12.36e-4, 'Iz':135.6e-8, 'Wzel':27.12e-6, 'Wzpl':36.09e-6, 'iz':3.31e-2, 'Iy':30.76e-8, 'Wyel':15.38e-6, 'Wypl':18.52e-6, 'iy':1.58e-2, 'It':87.92e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x50x2']= {'nmb':'100x50x2', 'b':50e-3, 'h':100e-3, 'e':2e-3, 'P':4.504, 'A':5.74e-4, 'Iz':74.98e-8, 'Wzel':15e-6, 'Wzpl':18.5e-6, 'iz':3.62e-2, 'Iy':25.67e-8, 'Wyel':10.27e-6, 'Wypl':11.46e-6, 'iy':2.12e-2, 'It':61.59e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x50x3']= {'nmb':'100x50x3', 'b':50e-3, 'h':100e-3, 'e':3e-3, 'P':6.6, 'A':8.41e-4, 'Iz':106.46e-8, 'Wzel':21.29e-6, 'Wzpl':26.66e-6, 'iz':3.56e-2, 'Iy':36.06e-8, 'Wyel':14.42e-6, 'Wypl':16.44e-6, 'iy':2.07e-2, 'It':88.56e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x50x4']= {'nmb':'100x50x4', 'b':50e-3, 'h':100e-3, 'e':4e-3, 'P':8.594, 'A':10.95e-4, 'Iz':134.14e-8, 'Wzel':26.83e-6, 'Wzpl':34.1e-6, 'iz':3.5e-2, 'Iy':44.95e-8, 'Wyel':17.98e-6, 'Wypl':20.93e-6, 'iy':2.03e-2, 'It':112.99e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x50x5']= {'nmb':'100x50x5', 'b':50e-3, 'h':100e-3, 'e':5e-3, 'P':10.485, 'A':13.36e-4, 'Iz':158.19e-8, 'Wzel':31.64e-6, 'Wzpl':40.84e-6, 'iz':3.44e-2, 'Iy':52.45e-8, 'Wyel':20.98e-6, 'Wypl':24.95e-6, 'iy':1.98e-2, 'It':134.87e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x60x2']= {'nmb':'100x60x2', 'b':60e-3, 'h':100e-3, 'e':2e-3, 'P':4.818, 'A':6.14e-4, 'Iz':84.59e-8, 'Wzel':16.92e-6, 'Wzpl':20.46e-6, 'iz':3.71e-2, 'Iy':38.6e-8, 'Wyel':12.87e-6, 'Wypl':14.43e-6, 'iy':2.51e-2, 'It':84.08e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x60x3']= {'nmb':'100x60x3', 'b':60e-3, 'h':100e-3, 'e':3e-3, 'P':7.071, 'A':9.01e-4, 'Iz':120.57e-8, 'Wzel':24.11e-6, 'Wzpl':29.57e-6, 'iz':3.66e-2, 'Iy':54.65e-8, 'Wyel':18.22e-6, 'Wypl':20.79e-6, 'iy':2.46e-2, 'It':121.67e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x60x4']= {'nmb':'100x60x4', 'b':60e-3, 'h':100e-3, 'e':4e-3, 'P':9.222, 'A':11.75e-4, 'Iz':152.58e-8, 'Wzel':30.52e-6, 'Wzpl':37.94e-6, 'iz':3.6e-2, 'Iy':68.68e-8, 'Wyel':22.89e-6, 'Wypl':26.6e-6, 'iy':2.42e-2, 'It':156.27e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x60x5']= {'nmb':'100x60x5', 'b':60e-3, 'h':100e-3, 'e':5e-3, 'P':11.27, 'A':14.36e-4, 'Iz':180.77e-8, 'Wzel':36.15e-6, 'Wzpl':45.59e-6, 'iz':3.55e-2, 'Iy':80.83e-8, 'Wyel':26.94e-6, 'Wypl':31.88e-6, 'iy':2.37e-2, 'It':187.86e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x60x6']= {'nmb':'100x60x6', 'b':60e-3, 'h':100e-3, 'e':6e-3, 'P':13.214, 'A':16.83e-4, 'Iz':205.3e-8, 'Wzel':41.06e-6, 'Wzpl':52.54e-6, 'iz':3.49e-2, 'Iy':91.2e-8, 'Wyel':30.4e-6, 'Wypl':36.64e-6, 'iy':2.33e-2, 'It':216.44e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x80x2']= {'nmb':'100x80x2', 'b':80e-3, 'h':100e-3, 'e':2e-3, 'P':5.446, 'A':6.94e-4, 'Iz':103.8e-8, 'Wzel':20.76e-6, 'Wzpl':24.38e-6, 'iz':3.87e-2, 'Iy':73.87e-8, 'Wyel':18.47e-6, 'Wypl':20.97e-6, 'iy':3.26e-2, 'It':134.59e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x80x3']= {'nmb':'100x80x3', 'b':80e-3, 'h':100e-3, 'e':3e-3, 'P':8.013, 'A':10.21e-4, 'Iz':148.81e-8, 'Wzel':29.76e-6, 'Wzpl':35.39e-6, 'iz':3.82e-2, 'Iy':105.64e-8, 'Wyel':26.41e-6, 'Wypl':30.4e-6, 'iy':3.22e-2, 'It':196.12e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x80x4']= {'nmb':'100x80x4', 'b':80e-3, 'h':100e-3, 'e':4e-3, 'P':10.478, 'A':13.35e-4, 'Iz':189.47e-8, 'Wzel':37.89e-6, 'Wzpl':45.62e-6, 'iz':3.77e-2, 'Iy':134.17e-8, 'Wyel':33.54e-6, 'Wypl':39.15e-6, 'iy':3.17e-2, 'It':253.79e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x80x5']= {'nmb':'100x80x5', 'b':80e-3, 'h':100e-3, 'e':5e-3, 'P':12.84, 'A':16.36e-4, 'Iz':225.94e-8, 'Wzel':45.19e-6, 'Wzpl':55.09e-6, 'iz':3.72e-2, 'Iy':159.61e-8, 'Wyel':39.9e-6, 'Wypl':47.24e-6, 'iy':3.12e-2, 'It':307.55e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS100x80x6']= {'nmb':'100x80x6', 'b':80e-3, 'h':100e-3, 'e':6e-3, 'P':15.098, 'A':19.23e-4, 'Iz':258.39e-8, 'Wzel':51.68e-6, 'Wzpl':63.82e-6, 'iz':3.67e-2, 'Iy':182.1e-8, 'Wyel':45.53e-6, 'Wypl':54.67e-6, 'iy':3.08e-2, 'It':357.38e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS110x70x3']= {'nmb':'110x70x3', 'b':70e-3, 'h':110e-3, 'e':3e-3, 'P':8.013, 'A':10.21e-4, 'Iz':169.62e-8, 'Wzel':30.84e-6, 'Wzpl':37.43e-6, 'iz':4.08e-2, 'Iy':84.48e-8, 'Wyel':24.14e-6, 'Wypl':27.46e-6, 'iy':2.88e-2, 'It':180.67e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS110x70x4']= {'nmb':'110x70x4', 'b':70e-3, 'h':110e-3, 'e':4e-3, 'P':10.478, 'A':13.35e-4, 'Iz':216.01e-8, 'Wzel':39.27e-6, 'Wzpl':48.25e-6, 'iz':4.02e-2, 'Iy':107.01e-8, 'Wyel':30.57e-6, 'Wypl':35.32e-6, 'iy':2.83e-2, 'It':233.32e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS110x70x5']= {'nmb':'110x70x5', 'b':70e-3, 'h':110e-3, 'e':5e-3, 'P':12.84, 'A':16.36e-4, 'Iz':257.62e-8, 'Wzel':46.84e-6, 'Wzpl':58.27e-6, 'iz':3.97e-2, 'Iy':126.96e-8, 'Wyel':36.28e-6, 'Wypl':42.56e-6, 'iy':2.79e-2, 'It':282.14e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS110x70x6']= {'nmb':'110x70x6', 'b':70e-3, 'h':110e-3, 'e':6e-3, 'P':15.098, 'A':19.23e-4, 'Iz':294.63e-8, 'Wzel':53.57e-6, 'Wzpl':67.5e-6, 'iz':3.91e-2, 'Iy':144.47e-8, 'Wyel':41.28e-6, 'Wypl':49.19e-6, 'iy':2.74e-2, 'It':327.11e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x40x2']= {'nmb':'120x40x2', 'b':40e-3, 'h':120e-3, 'e':2e-3, 'P':4.818, 'A':6.14e-4, 'Iz':104.07e-8, 'Wzel':17.34e-6, 'Wzpl':22.28e-6, 'iz':4.12e-2, 'Iy':18.5e-8, 'Wyel':9.25e-6, 'Wypl':10.21e-6, 'iy':1.74e-2, 'It':52.32e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x40x3']= {'nmb':'120x40x3', 'b':40e-3, 'h':120e-3, 'e':3e-3, 'P':7.071, 'A':9.01e-4, 'Iz':148.04e-8, 'Wzel':24.67e-6, 'Wzpl':32.16e-6, 'iz':4.05e-2, 'Iy':25.79e-8, 'Wyel':12.89e-6, 'Wypl':14.6e-6, 'iy':1.69e-2, 'It':74.56e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x40x4']= {'nmb':'120x40x4', 'b':40e-3, 'h':120e-3, 'e':4e-3, 'P':9.222, 'A':11.75e-4, 'Iz':186.89e-8, 'Wzel':31.15e-6, 'Wzpl':41.21e-6, 'iz':3.99e-2, 'Iy':31.9e-8, 'Wyel':15.95e-6, 'Wypl':18.53e-6, 'iy':1.65e-2, 'It':94.23e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x40x5']= {'nmb':'120x40x5', 'b':40e-3, 'h':120e-3, 'e':5e-3, 'P':11.27, 'A':14.36e-4, 'Iz':220.81e-8, 'Wzel':36.8e-6, 'Wzpl':49.45e-6, 'iz':3.92e-2, 'Iy':36.93e-8, 'Wyel':18.46e-6, 'Wypl':22.02e-6, 'iy':1.6e-2, 'It':111.35e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x40x6']= {'nmb':'120x40x6', 'b':40e-3, 'h':120e-3, 'e':6e-3, 'P':13.214, 'A':16.83e-4, 'Iz':249.97e-8, 'Wzel':41.66e-6, 'Wzpl':56.89e-6, 'iz':3.85e-2, 'Iy':40.97e-8, 'Wyel':20.49e-6, 'Wypl':25.08e-6, 'iy':1.56e-2, 'It':125.97e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x60x2']= {'nmb':'120x60x2', 'b':60e-3, 'h':120e-3, 'e':2e-3, 'P':5.446, 'A':6.94e-4, 'Iz':131.92e-8, 'Wzel':21.99e-6, 'Wzpl':27e-6, 'iz':4.36e-2, 'Iy':45.33e-8, 'Wyel':15.11e-6, 'Wypl':16.75e-6, 'iy':2.56e-2, 'It':107.88e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x60x3']= {'nmb':'120x60x3', 'b':60e-3, 'h':120e-3, 'e':3e-3, 'P':8.013, 'A':10.21e-4, 'Iz':189.12e-8, 'Wzel':31.52e-6, 'Wzpl':39.18e-6, 'iz':4.3e-2, 'Iy':64.4e-8, 'Wyel':21.47e-6, 'Wypl':24.21e-6, 'iy':2.51e-2, 'It':156.34e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x60x4']= {'nmb':'120x60x4', 'b':60e-3, 'h':120e-3, 'e':4e-3, 'P':10.478, 'A':13.35e-4, 'Iz':240.74e-8, 'Wzel':40.12e-6, 'Wzpl':50.49e-6, 'iz':4.25e-2, 'Iy':81.25e-8, 'Wyel':27.08e-6, 'Wypl':31.08e-6, 'iy':2.47e-2, 'It':201.12e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x60x5']= {'nmb':'120x60x5', 'b':60e-3, 'h':120e-3, 'e':5e-3, 'P':12.84, 'A':16.36e-4, 'Iz':286.97e-8, 'Wzel':47.83e-6, 'Wzpl':60.95e-6, 'iz':4.19e-2, 'Iy':95.99e-8, 'Wyel':32e-6, 'Wypl':37.38e-6, 'iy':2.42e-2, 'It':242.23e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x60x6']= {'nmb':'120x60x6', 'b':60e-3, 'h':120e-3, 'e':6e-3, 'P':15.098, 'A':19.23e-4, 'Iz':328.01e-8, 'Wzel':54.67e-6, 'Wzpl':70.57e-6, 'iz':4.13e-2, 'Iy':108.77e-8, 'Wyel':36.26e-6, 'Wypl':43.12e-6, 'iy':2.38e-2, 'It':279.67e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x80x3']= {'nmb':'120x80x3', 'b':80e-3, 'h':120e-3, 'e':3e-3, 'P':8.955, 'A':11.41e-4, 'Iz':230.2e-8, 'Wzel':38.37e-6, 'Wzpl':46.2e-6, 'iz':4.49e-2, 'Iy':123.43e-8, 'Wyel':30.86e-6, 'Wypl':35.02e-6, 'iy':3.29e-2, 'It':255.47e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x80x4']= {'nmb':'120x80x4', 'b':80e-3, 'h':120e-3, 'e':4e-3, 'P':11.734, 'A':14.95e-4, 'Iz':294.59e-8, 'Wzel':49.1e-6, 'Wzpl':59.77e-6, 'iz':4.44e-2, 'Iy':157.29e-8, 'Wyel':39.32e-6, 'Wypl':45.23e-6, 'iy':3.24e-2, 'It':331.24e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x80x5']= {'nmb':'120x80x5', 'b':80e-3, 'h':120e-3, 'e':5e-3, 'P':14.41, 'A':18.36e-4, 'Iz':353.14e-8, 'Wzel':58.86e-6, 'Wzpl':72.45e-6, 'iz':4.39e-2, 'Iy':187.78e-8, 'Wyel':46.94e-6, 'Wypl':54.74e-6, 'iy':3.2e-2, 'It':402.27e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x80x6']= {'nmb':'120x80x6', 'b':80e-3, 'h':120e-3, 'e':6e-3, 'P':16.982, 'A':21.63e-4, 'Iz':406.06e-8, 'Wzel':67.68e-6, 'Wzpl':84.25e-6, 'iz':4.33e-2, 'Iy':215.03e-8, 'Wyel':53.76e-6, 'Wypl':63.55e-6, 'iy':3.15e-2, 'It':468.54e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x80x7']= {'nmb':'120x80x7', 'b':80e-3, 'h':120e-3, 'e':7e-3, 'P':19.121, 'A':24.36e-4, 'Iz':438.27e-8, 'Wzel':73.04e-6, 'Wzpl':92.65e-6, 'iz':4.24e-2, 'Iy':232.45e-8, 'Wyel':58.11e-6, 'Wypl':69.98e-6, 'iy':3.09e-2, 'It':529.42e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x100x3']= {'nmb':'120x100x3', 'b':100e-3, 'h':120e-3, 'e':3e-3, 'P':9.897, 'A':12.61e-4, 'Iz':271.27e-8, 'Wzel':45.21e-6, 'Wzpl':53.22e-6, 'iz':4.64e-2, 'Iy':205.28e-8, 'Wyel':41.06e-6, 'Wypl':47.03e-6, 'iy':4.04e-2, 'It':367.01e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x100x4']= {'nmb':'120x100x4', 'b':100e-3, 'h':120e-3, 'e':4e-3, 'P':12.99, 'A':16.55e-4, 'Iz':348.43e-8, 'Wzel':58.07e-6, 'Wzpl':69.05e-6, 'iz':4.59e-2, 'Iy':263.24e-8, 'Wyel':52.65e-6, 'Wypl':60.98e-6, 'iy':3.99e-2, 'It':477.84e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x100x5']= {'nmb':'120x100x5', 'b':100e-3, 'h':120e-3, 'e':5e-3, 'P':15.98, 'A':20.36e-4, 'Iz':419.31e-8, 'Wzel':69.88e-6, 'Wzpl':83.95e-6, 'iz':4.54e-2, 'Iy':316.27e-8, 'Wyel':63.25e-6, 'Wypl':74.09e-6, 'iy':3.94e-2, 'It':582.86e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x100x6']= {'nmb':'120x100x6', 'b':100e-3, 'h':120e-3, 'e':6e-3, 'P':18.866, 'A':24.03e-4, 'Iz':484.11e-8, 'Wzel':80.68e-6, 'Wzpl':97.93e-6, 'iz':4.49e-2, 'Iy':364.56e-8, 'Wyel':72.91e-6, 'Wypl':86.38e-6, 'iy':3.89e-2, 'It':682.04e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS120x100x7']= {'nmb':'120x100x7', 'b':100e-3, 'h':120e-3, 'e':7e-3, 'P':21.319, 'A':27.16e-4, 'Iz':527.77e-8, 'Wzel':87.96e-6, 'Wzpl':108.47e-6, 'iz':4.41e-2, 'Iy':397.7e-8, 'Wyel':79.54e-6, 'Wypl':95.74e-6, 'iy':3.83e-2, 'It':776.17e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x60x3']= {'nmb':'140x60x3', 'b':60e-3, 'h':140e-3, 'e':3e-3, 'P':8.955, 'A':11.41e-4, 'Iz':278.08e-8, 'Wzel':39.73e-6, 'Wzpl':49.98e-6, 'iz':4.94e-2, 'Iy':74.16e-8, 'Wyel':24.72e-6, 'Wypl':27.63e-6, 'iy':2.55e-2, 'It':191.92e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x60x4']= {'nmb':'140x60x4', 'b':60e-3, 'h':140e-3, 'e':4e-3, 'P':11.734, 'A':14.95e-4, 'Iz':355.59e-8, 'Wzel':50.8e-6, 'Wzpl':64.63e-6, 'iz':4.88e-2, 'Iy':93.81e-8, 'Wyel':31.27e-6, 'Wypl':35.56e-6, 'iy':2.51e-2, 'It':247.13e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x60x5']= {'nmb':'140x60x5', 'b':60e-3, 'h':140e-3, 'e':5e-3, 'P':14.41, 'A':18.36e-4, 'Iz':425.89e-8, 'Wzel':60.84e-6, 'Wzpl':78.3e-6, 'iz':4.82e-2, 'Iy':111.16e-8, 'Wyel':37.05e-6, 'Wypl':42.88e-6, 'iy':2.46e-2, 'It':297.97e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x60x6']= {'nmb':'140x60x6', 'b':60e-3, 'h':140e-3, 'e':6e-3, 'P':16.982, 'A':21.63e-4, 'Iz':489.19e-8, 'Wzel':69.88e-6, 'Wzpl':91.01e-6, 'iz':4.76e-2, 'Iy':126.34e-8, 'Wyel':42.11e-6, 'Wypl':49.6e-6, 'iy':2.42e-2, 'It':344.46e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x60x7']= {'nmb':'140x60x7', 'b':60e-3, 'h':140e-3, 'e':7e-3, 'P':19.121, 'A':24.36e-4, 'Iz':524.93e-8, 'Wzel':74.99e-6, 'Wzpl':99.79e-6, 'iz':4.64e-2, 'Iy':135.69e-8, 'Wyel':45.23e-6, 'Wypl':54.44e-6, 'iy':2.36e-2, 'It':384.95e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x80x3']= {'nmb':'140x80x3', 'b':80e-3, 'h':140e-3, 'e':3e-3, 'P':9.897, 'A':12.61e-4, 'Iz':334.4e-8, 'Wzel':47.77e-6, 'Wzpl':58.2e-6, 'iz':5.15e-2, 'Iy':141.23e-8, 'Wyel':35.31e-6, 'Wypl':39.64e-6, 'iy':3.35e-2, 'It':317.07e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x80x4']= {'nmb':'140x80x4', 'b':80e-3, 'h':140e-3, 'e':4e-3, 'P':12.99, 'A':16.55e-4, 'Iz':429.6e-8, 'Wzel':61.37e-6, 'Wzpl':75.51e-6, 'iz':5.1e-2, 'Iy':180.42e-8, 'Wyel':45.1e-6, 'Wypl':51.31e-6, 'iy':3.3e-2, 'It':411.6e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x80x5']= {'nmb':'140x80x5', 'b':80e-3, 'h':140e-3, 'e':5e-3, 'P':15.98, 'A':20.36e-4, 'Iz':517.06e-8, 'Wzel':73.87e-6, 'Wzpl':91.8e-6, 'iz':5.04e-2, 'Iy':215.94e-8, 'Wyel':53.99e-6, 'Wypl':62.24e-6, 'iy':3.26e-2, 'It':500.51e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x80x6']= {'nmb':'140x80x6', 'b':80e-3, 'h':140e-3, 'e':6e-3, 'P':18.866, 'A':24.03e-4, 'Iz':597e-8, 'Wzel':85.29e-6, 'Wzpl':107.09e-6, 'iz':4.98e-2, 'Iy':247.96e-8, 'Wyel':61.99e-6, 'Wypl':72.43e-6, 'iy':3.21e-2, 'It':583.8e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x80x7']= {'nmb':'140x80x7', 'b':80e-3, 'h':140e-3, 'e':7e-3, 'P':21.319, 'A':27.16e-4, 'Iz':648.87e-8, 'Wzel':92.7e-6, 'Wzpl':118.41e-6, 'iz':4.89e-2, 'Iy':269.87e-8, 'Wyel':67.47e-6, 'Wypl':80.2e-6, 'iy':3.15e-2, 'It':661.38e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x100x3']= {'nmb':'140x100x3', 'b':100e-3, 'h':140e-3, 'e':3e-3, 'P':10.839, 'A':13.81e-4, 'Iz':390.71e-8, 'Wzel':55.82e-6, 'Wzpl':66.42e-6, 'iz':5.32e-2, 'Iy':233.52e-8, 'Wyel':46.7e-6, 'Wypl':52.85e-6, 'iy':4.11e-2, 'It':459.63e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x100x4']= {'nmb':'140x100x4', 'b':100e-3, 'h':140e-3, 'e':4e-3, 'P':14.246, 'A':18.15e-4, 'Iz':503.61e-8, 'Wzel':71.94e-6, 'Wzpl':86.39e-6, 'iz':5.27e-2, 'Iy':300.12e-8, 'Wyel':60.02e-6, 'Wypl':68.66e-6, 'iy':4.07e-2, 'It':599.26e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x100x5']= {'nmb':'140x100x5', 'b':100e-3, 'h':140e-3, 'e':5e-3, 'P':17.55, 'A':22.36e-4, 'Iz':608.23e-8, 'Wzel':86.89e-6, 'Wzpl':105.3e-6, 'iz':5.22e-2, 'Iy':361.44e-8, 'Wyel':72.29e-6, 'Wypl':83.59e-6, 'iy':4.02e-2, 'It':732.06e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x100x6']= {'nmb':'140x100x6', 'b':100e-3, 'h':140e-3, 'e':6e-3, 'P':20.75, 'A':26.43e-4, 'Iz':704.81e-8, 'Wzel':100.69e-6, 'Wzpl':123.17e-6, 'iz':5.16e-2, 'Iy':417.65e-8, 'Wyel':83.53e-6, 'Wypl':97.66e-6, 'iy':3.97e-2, 'It':857.99e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS140x100x7']= {'nmb':'140x100x7', 'b':100e-3, 'h':140e-3, 'e':7e-3, 'P':23.517, 'A':29.96e-4, 'Iz':772.81e-8, 'Wzel':110.4e-6, 'Wzpl':137.03e-6, 'iz':5.08e-2, 'Iy':458.36e-8, 'Wyel':91.67e-6, 'Wypl':108.76e-6, 'iy':3.91e-2, 'It':978.81e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x50x3']= {'nmb':'150x50x3', 'b':50e-3, 'h':150e-3, 'e':3e-3, 'P':8.955, 'A':11.41e-4, 'Iz':298.55e-8, 'Wzel':39.81e-6, 'Wzpl':51.43e-6, 'iz':5.12e-2, 'Iy':52.65e-8, 'Wyel':21.06e-6, 'Wypl':23.49e-6, 'iy':2.15e-2, 'It':150.22e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x50x4']= {'nmb':'150x50x4', 'b':50e-3, 'h':150e-3, 'e':4e-3, 'P':11.734, 'A':14.95e-4, 'Iz':381.39e-8, 'Wzel':50.85e-6, 'Wzpl':66.47e-6, 'iz':5.05e-2, 'Iy':66.16e-8, 'Wyel':26.47e-6, 'Wypl':30.13e-6, 'iy':2.1e-2, 'It':192.14e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x50x5']= {'nmb':'150x50x5', 'b':50e-3, 'h':150e-3, 'e':5e-3, 'P':14.41, 'A':18.36e-4, 'Iz':456.29e-8, 'Wzel':60.84e-6, 'Wzpl':80.48e-6, 'iz':4.99e-2, 'Iy':77.87e-8, 'Wyel':31.15e-6, 'Wypl':36.2e-6, 'iy':2.06e-2, 'It':230.05e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x50x6']= {'nmb':'150x50x6', 'b':50e-3, 'h':150e-3, 'e':6e-3, 'P':16.982, 'A':21.63e-4, 'Iz':523.47e-8, 'Wzel':69.8e-6, 'Wzpl':93.48e-6, 'iz':4.92e-2, 'Iy':87.89e-8, 'Wyel':35.16e-6, 'Wypl':41.72e-6, 'iy':2.02e-2, 'It':263.99e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x50x7']= {'nmb':'150x50x7', 'b':50e-3, 'h':150e-3, 'e':7e-3, 'P':19.121, 'A':24.36e-4, 'Iz':559.3e-8, 'Wzel':74.57e-6, 'Wzpl':102.31e-6, 'iz':4.79e-2, 'Iy':93.75e-8, 'Wyel':37.5e-6, 'Wypl':45.62e-6, 'iy':1.96e-2, 'It':291.81e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x70x3']= {'nmb':'150x70x3', 'b':70e-3, 'h':150e-3, 'e':3e-3, 'P':9.897, 'A':12.61e-4, 'Iz':363.39e-8, 'Wzel':48.45e-6, 'Wzpl':60.25e-6, 'iz':5.37e-2, 'Iy':111.43e-8, 'Wyel':31.84e-6, 'Wypl':35.5e-6, 'iy':2.97e-2, 'It':276.37e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x70x4']= {'nmb':'150x70x4', 'b':70e-3, 'h':150e-3, 'e':4e-3, 'P':12.99, 'A':16.55e-4, 'Iz':466.68e-8, 'Wzel':62.22e-6, 'Wzpl':78.15e-6, 'iz':5.31e-2, 'Iy':141.9e-8, 'Wyel':40.54e-6, 'Wypl':45.88e-6, 'iy':2.93e-2, 'It':357.69e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x70x5']= {'nmb':'150x70x5', 'b':70e-3, 'h':150e-3, 'e':5e-3, 'P':15.98, 'A':20.36e-4, 'Iz':561.45e-8, 'Wzel':74.86e-6, 'Wzpl':94.98e-6, 'iz':5.25e-2, 'Iy':169.3e-8, 'Wyel':48.37e-6, 'Wypl':55.56e-6, 'iy':2.88e-2, 'It':433.62e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x70x6']= {'nmb':'150x70x6', 'b':70e-3, 'h':150e-3, 'e':6e-3, 'P':18.866, 'A':24.03e-4, 'Iz':647.95e-8, 'Wzel':86.39e-6, 'Wzpl':110.76e-6, 'iz':5.19e-2, 'Iy':193.76e-8, 'Wyel':55.36e-6, 'Wypl':64.55e-6, 'iy':2.84e-2, 'It':504.14e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x70x7']= {'nmb':'150x70x7', 'b':70e-3, 'h':150e-3, 'e':7e-3, 'P':21.319, 'A':27.16e-4, 'Iz':702.56e-8, 'Wzel':93.67e-6, 'Wzpl':122.33e-6, 'iz':5.09e-2, 'Iy':210.29e-8, 'Wyel':60.08e-6, 'Wypl':71.38e-6, 'iy':2.78e-2, 'It':568.52e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x100x4']= {'nmb':'150x100x4', 'b':100e-3, 'h':150e-3, 'e':4e-3, 'P':14.874, 'A':18.95e-4, 'Iz':594.6e-8, 'Wzel':79.28e-6, 'Wzpl':95.67e-6, 'iz':5.6e-2, 'Iy':318.57e-8, 'Wyel':63.71e-6, 'Wypl':72.5e-6, 'iy':4.1e-2, 'It':661.63e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x100x5']= {'nmb':'150x100x5', 'b':100e-3, 'h':150e-3, 'e':5e-3, 'P':18.335, 'A':23.36e-4, 'Iz':719.2e-8, 'Wzel':95.89e-6, 'Wzpl':116.73e-6, 'iz':5.55e-2, 'Iy':384.02e-8, 'Wyel':76.8e-6, 'Wypl':88.34e-6, 'iy':4.05e-2, 'It':808.68e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x100x6']= {'nmb':'150x100x6', 'b':100e-3, 'h':150e-3, 'e':6e-3, 'P':21.692, 'A':27.63e-4, 'Iz':834.69e-8, 'Wzel':111.29e-6, 'Wzpl':136.68e-6, 'iz':5.5e-2, 'Iy':444.19e-8, 'Wyel':88.84e-6, 'Wypl':103.3e-6, 'iy':4.01e-2, 'It':948.34e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x100x7']= {'nmb':'150x100x7', 'b':100e-3, 'h':150e-3, 'e':7e-3, 'P':24.616, 'A':31.36e-4, 'Iz':917.44e-8, 'Wzel':122.33e-6, 'Wzpl':152.36e-6, 'iz':5.41e-2, 'Iy':488.68e-8, 'Wyel':97.74e-6, 'Wypl':115.27e-6, 'iy':3.95e-2, 'It':1082.81e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x100x8']= {'nmb':'150x100x8', 'b':100e-3, 'h':150e-3, 'e':8e-3, 'P':27.665, 'A':35.24e-4, 'Iz':1008.13e-8, 'Wzel':134.42e-6, 'Wzpl':169.16e-6, 'iz':5.35e-2, 'Iy':535.65e-8, 'Wyel':107.13e-6, 'Wypl':127.85e-6, 'iy':3.9e-2, 'It':1205.89e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x120x4']= {'nmb':'150x120x4', 'b':120e-3, 'h':150e-3, 'e':4e-3, 'P':16.13, 'A':20.55e-4, 'Iz':679.89e-8, 'Wzel':90.65e-6, 'Wzpl':107.35e-6, 'iz':5.75e-2, 'Iy':483.04e-8, 'Wyel':80.51e-6, 'Wypl':92.25e-6, 'iy':4.85e-2, 'It':891.21e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x120x5']= {'nmb':'150x120x5', 'b':120e-3, 'h':150e-3, 'e':5e-3, 'P':19.905, 'A':25.36e-4, 'Iz':824.37e-8, 'Wzel':109.92e-6, 'Wzpl':131.23e-6, 'iz':5.7e-2, 'Iy':584.72e-8, 'Wyel':97.45e-6, 'Wypl':112.7e-6, 'iy':4.8e-2, 'It':1092.37e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x120x6']= {'nmb':'150x120x6', 'b':120e-3, 'h':150e-3, 'e':6e-3, 'P':23.576, 'A':30.03e-4, 'Iz':959.17e-8, 'Wzel':127.89e-6, 'Wzpl':153.96e-6, 'iz':5.65e-2, 'Iy':679.23e-8, 'Wyel':113.2e-6, 'Wypl':132.13e-6, 'iy':4.76e-2, 'It':1284.79e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x120x7']= {'nmb':'150x120x7', 'b':120e-3, 'h':150e-3, 'e':7e-3, 'P':26.814, 'A':34.16e-4, 'Iz':1060.7e-8, 'Wzel':141.43e-6, 'Wzpl':172.38e-6, 'iz':5.57e-2, 'Iy':751.51e-8, 'Wyel':125.25e-6, 'Wypl':148.02e-6, 'iy':4.69e-2, 'It':1472.84e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS150x120x8']= {'nmb':'150x120x8', 'b':120e-3, 'h':150e-3, 'e':8e-3, 'P':30.177, 'A':38.44e-4, 'Iz':1169.61e-8, 'Wzel':155.95e-6, 'Wzpl':191.88e-6, 'iz':5.52e-2, 'Iy':827.66e-8, 'Wyel':137.94e-6, 'Wypl':164.69e-6, 'iy':4.64e-2, 'It':1646.36e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x60x3']= {'nmb':'160x60x3', 'b':60e-3, 'h':160e-3, 'e':3e-3, 'P':9.897, 'A':12.61e-4, 'Iz':389.86e-8, 'Wzel':48.73e-6, 'Wzpl':61.99e-6, 'iz':5.56e-2, 'Iy':83.91e-8, 'Wyel':27.97e-6, 'Wypl':31.05e-6, 'iy':2.58e-2, 'It':228.15e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x60x4']= {'nmb':'160x60x4', 'b':60e-3, 'h':160e-3, 'e':4e-3, 'P':12.99, 'A':16.55e-4, 'Iz':500.35e-8, 'Wzel':62.54e-6, 'Wzpl':80.38e-6, 'iz':5.5e-2, 'Iy':106.38e-8, 'Wyel':35.46e-6, 'Wypl':40.04e-6, 'iy':2.54e-2, 'It':293.96e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x60x5']= {'nmb':'160x60x5', 'b':60e-3, 'h':160e-3, 'e':5e-3, 'P':15.98, 'A':20.36e-4, 'Iz':601.52e-8, 'Wzel':75.19e-6, 'Wzpl':97.66e-6, 'iz':5.44e-2, 'Iy':126.33e-8, 'Wyel':42.11e-6, 'Wypl':48.38e-6, 'iy':2.49e-2, 'It':354.68e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x60x6']= {'nmb':'160x60x6', 'b':60e-3, 'h':160e-3, 'e':6e-3, 'P':18.866, 'A':24.03e-4, 'Iz':693.64e-8, 'Wzel':86.71e-6, 'Wzpl':113.84e-6, 'iz':5.37e-2, 'Iy':143.91e-8, 'Wyel':47.97e-6, 'Wypl':56.08e-6, 'iy':2.45e-2, 'It':410.35e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x60x7']= {'nmb':'160x60x7', 'b':60e-3, 'h':160e-3, 'e':7e-3, 'P':21.319, 'A':27.16e-4, 'Iz':749.81e-8, 'Wzel':93.73e-6, 'Wzpl':125.55e-6, 'iz':5.25e-2, 'Iy':155.47e-8, 'Wyel':51.82e-6, 'Wypl':61.86e-6, 'iy':2.39e-2, 'It':459.52e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x80x3']= {'nmb':'160x80x3', 'b':80e-3, 'h':160e-3, 'e':3e-3, 'P':10.839, 'A':13.81e-4, 'Iz':463.81e-8, 'Wzel':57.98e-6, 'Wzpl':71.41e-6, 'iz':5.8e-2, 'Iy':159.03e-8, 'Wyel':39.76e-6, 'Wypl':44.26e-6, 'iy':3.39e-2, 'It':380.34e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x80x4']= {'nmb':'160x80x4', 'b':80e-3, 'h':160e-3, 'e':4e-3, 'P':14.246, 'A':18.15e-4, 'Iz':597.71e-8, 'Wzel':74.71e-6, 'Wzpl':92.86e-6, 'iz':5.74e-2, 'Iy':203.54e-8, 'Wyel':50.89e-6, 'Wypl':57.39e-6, 'iy':3.35e-2, 'It':494.1e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x80x5']= {'nmb':'160x80x5', 'b':80e-3, 'h':160e-3, 'e':5e-3, 'P':17.55, 'A':22.36e-4, 'Iz':721.69e-8, 'Wzel':90.21e-6, 'Wzpl':113.16e-6, 'iz':5.68e-2, 'Iy':244.11e-8, 'Wyel':61.03e-6, 'Wypl':69.74e-6, 'iy':3.3e-2, 'It':601.34e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x80x6']= {'nmb':'160x80x6', 'b':80e-3, 'h':160e-3, 'e':6e-3, 'P':20.75, 'A':26.43e-4, 'Iz':836.01e-8, 'Wzel':104.5e-6, 'Wzpl':132.32e-6, 'iz':5.62e-2, 'Iy':280.89e-8, 'Wyel':70.22e-6, 'Wypl':81.31e-6, 'iy':3.26e-2, 'It':702.06e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x80x7']= {'nmb':'160x80x7', 'b':80e-3, 'h':160e-3, 'e':7e-3, 'P':23.517, 'A':29.96e-4, 'Iz':913.78e-8, 'Wzel':114.22e-6, 'Wzpl':146.97e-6, 'iz':5.52e-2, 'Iy':307.28e-8, 'Wyel':76.82e-6, 'Wypl':90.42e-6, 'iy':3.2e-2, 'It':796.66e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x90x3']= {'nmb':'160x90x3', 'b':90e-3, 'h':160e-3, 'e':3e-3, 'P':11.31, 'A':14.41e-4, 'Iz':500.79e-8, 'Wzel':62.6e-6, 'Wzpl':76.12e-6, 'iz':5.9e-2, 'Iy':206.79e-8, 'Wyel':45.95e-6, 'Wypl':51.31e-6, 'iy':3.79e-2, 'It':465.4e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x90x4']= {'nmb':'160x90x4', 'b':90e-3, 'h':160e-3, 'e':4e-3, 'P':14.874, 'A':18.95e-4, 'Iz':646.39e-8, 'Wzel':80.8e-6, 'Wzpl':99.1e-6, 'iz':5.84e-2, 'Iy':265.54e-8, 'Wyel':59.01e-6, 'Wypl':66.66e-6, 'iy':3.74e-2, 'It':606.16e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x90x5']= {'nmb':'160x90x5', 'b':90e-3, 'h':160e-3, 'e':5e-3, 'P':18.335, 'A':23.36e-4, 'Iz':781.77e-8, 'Wzel':97.72e-6, 'Wzpl':120.91e-6, 'iz':5.79e-2, 'Iy':319.52e-8, 'Wyel':71e-6, 'Wypl':81.16e-6, 'iy':3.7e-2, 'It':739.7e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x90x6']= {'nmb':'160x90x6', 'b':90e-3, 'h':160e-3, 'e':6e-3, 'P':21.692, 'A':27.63e-4, 'Iz':907.19e-8, 'Wzel':113.4e-6, 'Wzpl':141.56e-6, 'iz':5.73e-2, 'Iy':368.91e-8, 'Wyel':81.98e-6, 'Wypl':94.82e-6, 'iy':3.65e-2, 'It':866.01e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x90x7']= {'nmb':'160x90x7', 'b':90e-3, 'h':160e-3, 'e':7e-3, 'P':24.616, 'A':31.36e-4, 'Iz':995.77e-8, 'Wzel':124.47e-6, 'Wzpl':157.68e-6, 'iz':5.64e-2, 'Iy':405.31e-8, 'Wyel':90.07e-6, 'Wypl':105.75e-6, 'iy':3.6e-2, 'It':986.57e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x120x4']= {'nmb':'160x120x4', 'b':120e-3, 'h':160e-3, 'e':4e-3, 'P':16.758, 'A':21.35e-4, 'Iz':792.44e-8, 'Wzel':99.06e-6, 'Wzpl':117.82e-6, 'iz':6.09e-2, 'Iy':509.97e-8, 'Wyel':84.99e-6, 'Wypl':96.89e-6, 'iy':4.89e-2, 'It':979.51e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x120x5']= {'nmb':'160x120x5', 'b':120e-3, 'h':160e-3, 'e':5e-3, 'P':20.69, 'A':26.36e-4, 'Iz':962.02e-8, 'Wzel':120.25e-6, 'Wzpl':144.16e-6, 'iz':6.04e-2, 'Iy':617.81e-8, 'Wyel':102.97e-6, 'Wypl':118.45e-6, 'iy':4.84e-2, 'It':1201.2e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x120x6']= {'nmb':'160x120x6', 'b':120e-3, 'h':160e-3, 'e':6e-3, 'P':24.518, 'A':31.23e-4, 'Iz':1120.75e-8, 'Wzel':140.09e-6, 'Wzpl':169.28e-6, 'iz':5.99e-2, 'Iy':718.25e-8, 'Wyel':119.71e-6, 'Wypl':138.97e-6, 'iy':4.8e-2, 'It':1413.54e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x120x7']= {'nmb':'160x120x7', 'b':120e-3, 'h':160e-3, 'e':7e-3, 'P':27.913, 'A':35.56e-4, 'Iz':1241.74e-8, 'Wzel':155.22e-6, 'Wzpl':189.81e-6, 'iz':5.91e-2, 'Iy':796.26e-8, 'Wyel':132.71e-6, 'Wypl':155.93e-6, 'iy':4.73e-2, 'It':1621.54e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS160x120x8']= {'nmb':'160x120x8', 'b':120e-3, 'h':160e-3, 'e':8e-3, 'P':31.433, 'A':40.04e-4, 'Iz':1371.23e-8, 'Wzel':171.4e-6, 'Wzpl':211.5e-6, 'iz':5.85e-2, 'Iy':877.92e-8, 'Wyel':146.32e-6, 'Wypl':173.65e-6, 'iy':4.68e-2, 'It':1813.87e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x80x3']= {'nmb':'170x80x3', 'b':80e-3, 'h':170e-3, 'e':3e-3, 'P':11.31, 'A':14.41e-4, 'Iz':538.73e-8, 'Wzel':63.38e-6, 'Wzpl':78.47e-6, 'iz':6.11e-2, 'Iy':167.92e-8, 'Wyel':41.98e-6, 'Wypl':46.57e-6, 'iy':3.41e-2, 'It':412.46e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x80x4']= {'nmb':'170x80x4', 'b':80e-3, 'h':170e-3, 'e':4e-3, 'P':14.874, 'A':18.95e-4, 'Iz':695.18e-8, 'Wzel':81.79e-6, 'Wzpl':102.14e-6, 'iz':6.06e-2, 'Iy':215.11e-8, 'Wyel':53.78e-6, 'Wypl':60.43e-6, 'iy':3.37e-2, 'It':535.98e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x80x5']= {'nmb':'170x80x5', 'b':80e-3, 'h':170e-3, 'e':5e-3, 'P':18.335, 'A':23.36e-4, 'Iz':840.52e-8, 'Wzel':98.88e-6, 'Wzpl':124.59e-6, 'iz':6e-2, 'Iy':258.19e-8, 'Wyel':64.55e-6, 'Wypl':73.49e-6, 'iy':3.32e-2, 'It':652.51e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x80x6']= {'nmb':'170x80x6', 'b':80e-3, 'h':170e-3, 'e':6e-3, 'P':21.692, 'A':27.63e-4, 'Iz':975.04e-8, 'Wzel':114.71e-6, 'Wzpl':145.84e-6, 'iz':5.94e-2, 'Iy':297.35e-8, 'Wyel':74.34e-6, 'Wypl':85.75e-6, 'iy':3.28e-2, 'It':762.06e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x80x7']= {'nmb':'170x80x7', 'b':80e-3, 'h':170e-3, 'e':7e-3, 'P':24.616, 'A':31.36e-4, 'Iz':1068.36e-8, 'Wzel':125.69e-6, 'Wzpl':162.3e-6, 'iz':5.84e-2, 'Iy':325.99e-8, 'Wyel':81.5e-6, 'Wypl':95.53e-6, 'iy':3.22e-2, 'It':865.26e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x100x3']= {'nmb':'170x100x3', 'b':100e-3, 'h':170e-3, 'e':3e-3, 'P':12.252, 'A':15.61e-4, 'Iz':622.41e-8, 'Wzel':73.22e-6, 'Wzpl':88.49e-6, 'iz':6.31e-2, 'Iy':275.87e-8, 'Wyel':55.17e-6, 'Wypl':61.58e-6, 'iy':4.2e-2, 'It':604.41e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x100x4']= {'nmb':'170x100x4', 'b':100e-3, 'h':170e-3, 'e':4e-3, 'P':16.13, 'A':20.55e-4, 'Iz':805.42e-8, 'Wzel':94.76e-6, 'Wzpl':115.42e-6, 'iz':6.26e-2, 'Iy':355.45e-8, 'Wyel':71.09e-6, 'Wypl':80.18e-6, 'iy':4.16e-2, 'It':789.02e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x100x5']= {'nmb':'170x100x5', 'b':100e-3, 'h':170e-3, 'e':5e-3, 'P':19.905, 'A':25.36e-4, 'Iz':976.69e-8, 'Wzel':114.9e-6, 'Wzpl':141.09e-6, 'iz':6.21e-2, 'Iy':429.19e-8, 'Wyel':85.84e-6, 'Wypl':97.84e-6, 'iy':4.11e-2, 'It':965.17e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x100x6']= {'nmb':'170x100x6', 'b':100e-3, 'h':170e-3, 'e':6e-3, 'P':23.576, 'A':30.03e-4, 'Iz':1136.49e-8, 'Wzel':133.7e-6, 'Wzpl':165.52e-6, 'iz':6.15e-2, 'Iy':497.28e-8, 'Wyel':99.46e-6, 'Wypl':114.58e-6, 'iy':4.07e-2, 'It':1132.83e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS170x100x7']= {'nmb':'170x100x7', 'b':100e-3, 'h':170e-3, 'e':7e-3, 'P':26.814, 'A':34.16e-4, 'Iz':1254.46e-8, 'Wzel':147.58e-6, 'Wzpl':185.12e-6, 'iz':6.06e-2, 'Iy':549.34e-8, 'Wyel':109.87e-6, 'Wypl':128.29e-6, 'iy':4.01e-2, 'It':1295.06e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x70x3']= {'nmb':'180x70x3', 'b':70e-3, 'h':180e-3, 'e':3e-3, 'P':11.31, 'A':14.41e-4, 'Iz':573.85e-8, 'Wzel':63.76e-6, 'Wzpl':80.51e-6, 'iz':6.31e-2, 'Iy':131.64e-8, 'Wyel':37.61e-6, 'Wypl':41.53e-6, 'iy':3.02e-2, 'It':350.79e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x70x4']= {'nmb':'180x70x4', 'b':70e-3, 'h':180e-3, 'e':4e-3, 'P':14.874, 'A':18.95e-4, 'Iz':740.15e-8, 'Wzel':82.24e-6, 'Wzpl':104.77e-6, 'iz':6.25e-2, 'Iy':168.07e-8, 'Wyel':48.02e-6, 'Wypl':53.8e-6, 'iy':2.98e-2, 'It':454.34e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x70x5']= {'nmb':'180x70x5', 'b':70e-3, 'h':180e-3, 'e':5e-3, 'P':18.335, 'A':23.36e-4, 'Iz':894.45e-8, 'Wzel':99.38e-6, 'Wzpl':127.77e-6, 'iz':6.19e-2, 'Iy':201.05e-8, 'Wyel':57.44e-6, 'Wypl':65.31e-6, 'iy':2.93e-2, 'It':551.24e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x70x6']= {'nmb':'180x70x6', 'b':70e-3, 'h':180e-3, 'e':6e-3, 'P':21.692, 'A':27.63e-4, 'Iz':1037.02e-8, 'Wzel':115.22e-6, 'Wzpl':149.51e-6, 'iz':6.13e-2, 'Iy':230.74e-8, 'Wyel':65.92e-6, 'Wypl':76.07e-6, 'iy':2.89e-2, 'It':641.51e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x70x7']= {'nmb':'180x70x7', 'b':70e-3, 'h':180e-3, 'e':7e-3, 'P':24.616, 'A':31.36e-4, 'Iz':1133.8e-8, 'Wzel':125.98e-6, 'Wzpl':166.22e-6, 'iz':6.01e-2, 'Iy':252.13e-8, 'Wyel':72.04e-6, 'Wypl':84.61e-6, 'iy':2.84e-2, 'It':724.86e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x90x3']= {'nmb':'180x90x3', 'b':90e-3, 'h':180e-3, 'e':3e-3, 'P':12.252, 'A':15.61e-4, 'Iz':667.85e-8, 'Wzel':74.21e-6, 'Wzpl':91.13e-6, 'iz':6.54e-2, 'Iy':229.5e-8, 'Wyel':51e-6, 'Wypl':56.53e-6, 'iy':3.83e-2, 'It':546.17e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x90x4']= {'nmb':'180x90x4', 'b':90e-3, 'h':180e-3, 'e':4e-3, 'P':16.13, 'A':20.55e-4, 'Iz':864.08e-8, 'Wzel':96.01e-6, 'Wzpl':118.85e-6, 'iz':6.48e-2, 'Iy':295.14e-8, 'Wyel':65.59e-6, 'Wypl':73.54e-6, 'iy':3.79e-2, 'It':711.75e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x90x5']= {'nmb':'180x90x5', 'b':90e-3, 'h':180e-3, 'e':5e-3, 'P':19.905, 'A':25.36e-4, 'Iz':1047.62e-8, 'Wzel':116.4e-6, 'Wzpl':145.27e-6, 'iz':6.43e-2, 'Iy':355.68e-8, 'Wyel':79.04e-6, 'Wypl':89.66e-6, 'iy':3.75e-2, 'It':869.09e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x90x6']= {'nmb':'180x90x6', 'b':90e-3, 'h':180e-3, 'e':6e-3, 'P':23.576, 'A':30.03e-4, 'Iz':1218.75e-8, 'Wzel':135.42e-6, 'Wzpl':170.39e-6, 'iz':6.37e-2, 'Iy':411.31e-8, 'Wyel':91.4e-6, 'Wypl':104.9e-6, 'iy':3.7e-2, 'It':1018.17e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x90x7']= {'nmb':'180x90x7', 'b':90e-3, 'h':180e-3, 'e':7e-3, 'P':26.814, 'A':34.16e-4, 'Iz':1343.42e-8, 'Wzel':149.27e-6, 'Wzpl':190.44e-6, 'iz':6.27e-2, 'Iy':453.65e-8, 'Wyel':100.81e-6, 'Wypl':117.37e-6, 'iy':3.64e-2, 'It':1161.11e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x100x4']= {'nmb':'180x100x4', 'b':100e-3, 'h':180e-3, 'e':4e-3, 'P':16.758, 'A':21.35e-4, 'Iz':926.04e-8, 'Wzel':102.89e-6, 'Wzpl':125.89e-6, 'iz':6.59e-2, 'Iy':373.89e-8, 'Wyel':74.78e-6, 'Wypl':84.02e-6, 'iy':4.18e-2, 'It':853.85e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x100x5']= {'nmb':'180x100x5', 'b':100e-3, 'h':180e-3, 'e':5e-3, 'P':20.69, 'A':26.36e-4, 'Iz':1124.2e-8, 'Wzel':124.91e-6, 'Wzpl':154.02e-6, 'iz':6.53e-2, 'Iy':451.77e-8, 'Wyel':90.35e-6, 'Wypl':102.59e-6, 'iy':4.14e-2, 'It':1044.79e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x100x6']= {'nmb':'180x100x6', 'b':100e-3, 'h':180e-3, 'e':6e-3, 'P':24.518, 'A':31.23e-4, 'Iz':1309.61e-8, 'Wzel':145.51e-6, 'Wzpl':180.83e-6, 'iz':6.48e-2, 'Iy':523.83e-8, 'Wyel':104.77e-6, 'Wypl':120.22e-6, 'iy':4.1e-2, 'It':1226.68e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x100x7']= {'nmb':'180x100x7', 'b':100e-3, 'h':180e-3, 'e':7e-3, 'P':27.913, 'A':35.56e-4, 'Iz':1448.23e-8, 'Wzel':160.91e-6, 'Wzpl':202.55e-6, 'iz':6.38e-2, 'Iy':579.67e-8, 'Wyel':115.93e-6, 'Wypl':134.8e-6, 'iy':4.04e-2, 'It':1402.99e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x100x8']= {'nmb':'180x100x8', 'b':100e-3, 'h':180e-3, 'e':8e-3, 'P':31.433, 'A':40.04e-4, 'Iz':1598.49e-8, 'Wzel':177.61e-6, 'Wzpl':225.62e-6, 'iz':6.32e-2, 'Iy':637.47e-8, 'Wyel':127.49e-6, 'Wypl':149.93e-6, 'iy':3.99e-2, 'It':1565.24e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x120x4']= {'nmb':'180x120x4', 'b':120e-3, 'h':180e-3, 'e':4e-3, 'P':18.014, 'A':22.95e-4, 'Iz':1049.97e-8, 'Wzel':116.66e-6, 'Wzpl':139.97e-6, 'iz':6.76e-2, 'Iy':563.81e-8, 'Wyel':93.97e-6, 'Wypl':106.17e-6, 'iy':4.96e-2, 'It':1160.17e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x120x5']= {'nmb':'180x120x5', 'b':120e-3, 'h':180e-3, 'e':5e-3, 'P':22.26, 'A':28.36e-4, 'Iz':1277.37e-8, 'Wzel':141.93e-6, 'Wzpl':171.52e-6, 'iz':6.71e-2, 'Iy':683.97e-8, 'Wyel':114e-6, 'Wypl':129.95e-6, 'iy':4.91e-2, 'It':1423.83e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x120x6']= {'nmb':'180x120x6', 'b':120e-3, 'h':180e-3, 'e':6e-3, 'P':26.402, 'A':33.63e-4, 'Iz':1491.34e-8, 'Wzel':165.7e-6, 'Wzpl':201.71e-6, 'iz':6.66e-2, 'Iy':796.3e-8, 'Wyel':132.72e-6, 'Wypl':152.65e-6, 'iy':4.87e-2, 'It':1676.88e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x120x7']= {'nmb':'180x120x7', 'b':120e-3, 'h':180e-3, 'e':7e-3, 'P':30.111, 'A':38.36e-4, 'Iz':1657.85e-8, 'Wzel':184.21e-6, 'Wzpl':226.77e-6, 'iz':6.57e-2, 'Iy':885.76e-8, 'Wyel':147.63e-6, 'Wypl':171.75e-6, 'iy':4.81e-2, 'It':1925.58e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x120x8']= {'nmb':'180x120x8', 'b':120e-3, 'h':180e-3, 'e':8e-3, 'P':33.945, 'A':43.24e-4, 'Iz':1835.33e-8, 'Wzel':203.93e-6, 'Wzpl':253.14e-6, 'iz':6.51e-2, 'Iy':978.44e-8, 'Wyel':163.07e-6, 'Wypl':191.57e-6, 'iy':4.76e-2, 'It':2156.35e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x140x4']= {'nmb':'180x140x4', 'b':140e-3, 'h':180e-3, 'e':4e-3, 'P':19.27, 'A':24.55e-4, 'Iz':1173.89e-8, 'Wzel':130.43e-6, 'Wzpl':154.05e-6, 'iz':6.92e-2, 'Iy':799.63e-8, 'Wyel':114.23e-6, 'Wypl':129.91e-6, 'iy':5.71e-2, 'It':1491.17e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x140x5']= {'nmb':'180x140x5', 'b':140e-3, 'h':180e-3, 'e':5e-3, 'P':23.83, 'A':30.36e-4, 'Iz':1430.53e-8, 'Wzel':158.95e-6, 'Wzpl':189.02e-6, 'iz':6.86e-2, 'Iy':972.89e-8, 'Wyel':138.98e-6, 'Wypl':159.3e-6, 'iy':5.66e-2, 'It':1833.66e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x140x6']= {'nmb':'180x140x6', 'b':140e-3, 'h':180e-3, 'e':6e-3, 'P':28.286, 'A':36.03e-4, 'Iz':1673.07e-8, 'Wzel':185.9e-6, 'Wzpl':222.59e-6, 'iz':6.81e-2, 'Iy':1136.04e-8, 'Wyel':162.29e-6, 'Wypl':187.49e-6, 'iy':5.61e-2, 'It':2163.94e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x140x7']= {'nmb':'180x140x7', 'b':140e-3, 'h':180e-3, 'e':7e-3, 'P':32.309, 'A':41.16e-4, 'Iz':1867.46e-8, 'Wzel':207.5e-6, 'Wzpl':250.99e-6, 'iz':6.74e-2, 'Iy':1268.55e-8, 'Wyel':181.22e-6, 'Wypl':211.51e-6, 'iy':5.55e-2, 'It':2491.16e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS180x140x8']= {'nmb':'180x140x8', 'b':140e-3, 'h':180e-3, 'e':8e-3, 'P':36.457, 'A':46.44e-4, 'Iz':2072.18e-8, 'Wzel':230.24e-6, 'Wzpl':280.66e-6, 'iz':6.68e-2, 'Iy':1405.9e-8, 'Wyel':200.84e-6, 'Wypl':236.42e-6, 'iy':5.5e-2, 'It':2796.55e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x70x3']= {'nmb':'200x70x3', 'b':70e-3, 'h':200e-3, 'e':3e-3, 'P':12.252, 'A':15.61e-4, 'Iz':749.68e-8, 'Wzel':74.97e-6, 'Wzpl':95.52e-6, 'iz':6.93e-2, 'Iy':145.12e-8, 'Wyel':41.46e-6, 'Wypl':45.55e-6, 'iy':3.05e-2, 'It':401.23e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x70x4']= {'nmb':'200x70x4', 'b':70e-3, 'h':200e-3, 'e':4e-3, 'P':16.13, 'A':20.55e-4, 'Iz':969.18e-8, 'Wzel':96.92e-6, 'Wzpl':124.52e-6, 'iz':6.87e-2, 'Iy':185.51e-8, 'Wyel':53e-6, 'Wypl':59.08e-6, 'iy':3e-2, 'It':519.82e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x70x5']= {'nmb':'200x70x5', 'b':70e-3, 'h':200e-3, 'e':5e-3, 'P':19.905, 'A':25.36e-4, 'Iz':1174e-8, 'Wzel':117.4e-6, 'Wzpl':152.12e-6, 'iz':6.8e-2, 'Iy':222.21e-8, 'Wyel':63.49e-6, 'Wypl':71.81e-6, 'iy':2.96e-2, 'It':630.89e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x70x6']= {'nmb':'200x70x6', 'b':70e-3, 'h':200e-3, 'e':6e-3, 'P':23.576, 'A':30.03e-4, 'Iz':1364.48e-8, 'Wzel':136.45e-6, 'Wzpl':178.35e-6, 'iz':6.74e-2, 'Iy':255.38e-8, 'Wyel':72.97e-6, 'Wypl':83.75e-6, 'iy':2.92e-2, 'It':734.49e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x70x7']= {'nmb':'200x70x7', 'b':70e-3, 'h':200e-3, 'e':7e-3, 'P':26.814, 'A':34.16e-4, 'Iz':1498.53e-8, 'Wzel':149.85e-6, 'Wzpl':198.97e-6, 'iz':6.62e-2, 'Iy':280.03e-8, 'Wyel':80.01e-6, 'Wypl':93.43e-6, 'iy':2.86e-2, 'It':830.6e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x80x4']= {'nmb':'200x80x4', 'b':80e-3, 'h':200e-3, 'e':4e-3, 'P':16.758, 'A':21.35e-4, 'Iz':1046.02e-8, 'Wzel':104.6e-6, 'Wzpl':132.36e-6, 'iz':7e-2, 'Iy':249.8e-8, 'Wyel':62.45e-6, 'Wypl':69.55e-6, 'iy':3.42e-2, 'It':663.6e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x80x5']= {'nmb':'200x80x5', 'b':80e-3, 'h':200e-3, 'e':5e-3, 'P':20.69, 'A':26.36e-4, 'Iz':1269.09e-8, 'Wzel':126.91e-6, 'Wzpl':161.87e-6, 'iz':6.94e-2, 'Iy':300.44e-8, 'Wyel':75.11e-6, 'Wypl':84.74e-6, 'iy':3.38e-2, 'It':808.38e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x80x6']= {'nmb':'200x80x6', 'b':80e-3, 'h':200e-3, 'e':6e-3, 'P':24.518, 'A':31.23e-4, 'Iz':1477.42e-8, 'Wzel':147.74e-6, 'Wzpl':189.99e-6, 'iz':6.88e-2, 'Iy':346.74e-8, 'Wyel':86.69e-6, 'Wypl':99.07e-6, 'iy':3.33e-2, 'It':944.77e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x80x7']= {'nmb':'200x80x7', 'b':80e-3, 'h':200e-3, 'e':7e-3, 'P':27.913, 'A':35.56e-4, 'Iz':1628.96e-8, 'Wzel':162.9e-6, 'Wzpl':212.48e-6, 'iz':6.77e-2, 'Iy':382.12e-8, 'Wyel':95.53e-6, 'Wypl':110.86e-6, 'iy':3.28e-2, 'It':1074e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x80x8']= {'nmb':'200x80x8', 'b':80e-3, 'h':200e-3, 'e':8e-3, 'P':31.433, 'A':40.04e-4, 'Iz':1795.76e-8, 'Wzel':179.58e-6, 'Wzpl':236.54e-6, 'iz':6.7e-2, 'Iy':418.23e-8, 'Wyel':104.56e-6, 'Wypl':123.01e-6, 'iy':3.23e-2, 'It':1191.77e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x100x4']= {'nmb':'200x100x4', 'b':100e-3, 'h':200e-3, 'e':4e-3, 'P':18.014, 'A':22.95e-4, 'Iz':1199.71e-8, 'Wzel':119.97e-6, 'Wzpl':148.04e-6, 'iz':7.23e-2, 'Iy':410.78e-8, 'Wyel':82.16e-6, 'Wypl':91.7e-6, 'iy':4.23e-2, 'It':985.38e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x100x5']= {'nmb':'200x100x5', 'b':100e-3, 'h':200e-3, 'e':5e-3, 'P':22.26, 'A':28.36e-4, 'Iz':1459.25e-8, 'Wzel':145.93e-6, 'Wzpl':181.37e-6, 'iz':7.17e-2, 'Iy':496.94e-8, 'Wyel':99.39e-6, 'Wypl':112.09e-6, 'iy':4.19e-2, 'It':1206.29e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x100x6']= {'nmb':'200x100x6', 'b':100e-3, 'h':200e-3, 'e':6e-3, 'P':26.402, 'A':33.63e-4, 'Iz':1703.31e-8, 'Wzel':170.33e-6, 'Wzpl':213.27e-6, 'iz':7.12e-2, 'Iy':576.91e-8, 'Wyel':115.38e-6, 'Wypl':131.5e-6, 'iy':4.14e-2, 'It':1417.03e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x100x7']= {'nmb':'200x100x7', 'b':100e-3, 'h':200e-3, 'e':7e-3, 'P':30.111, 'A':38.36e-4, 'Iz':1889.81e-8, 'Wzel':188.98e-6, 'Wzpl':239.5e-6, 'iz':7.02e-2, 'Iy':640.33e-8, 'Wyel':128.07e-6, 'Wypl':147.82e-6, 'iy':4.09e-2, 'It':1621.76e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x100x8']= {'nmb':'200x100x8', 'b':100e-3, 'h':200e-3, 'e':8e-3, 'P':33.945, 'A':43.24e-4, 'Iz':2090.84e-8, 'Wzel':209.08e-6, 'Wzpl':267.26e-6, 'iz':6.95e-2, 'Iy':705.36e-8, 'Wyel':141.07e-6, 'Wypl':164.65e-6, 'iy':4.04e-2, 'It':1810.72e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x120x4']= {'nmb':'200x120x4', 'b':120e-3, 'h':200e-3, 'e':4e-3, 'P':19.27, 'A':24.55e-4, 'Iz':1353.39e-8, 'Wzel':135.34e-6, 'Wzpl':163.72e-6, 'iz':7.43e-2, 'Iy':617.66e-8, 'Wyel':102.94e-6, 'Wypl':115.45e-6, 'iy':5.02e-2, 'It':1345.35e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x120x5']= {'nmb':'200x120x5', 'b':120e-3, 'h':200e-3, 'e':5e-3, 'P':23.83, 'A':30.36e-4, 'Iz':1649.42e-8, 'Wzel':164.94e-6, 'Wzpl':200.87e-6, 'iz':7.37e-2, 'Iy':750.14e-8, 'Wyel':125.02e-6, 'Wypl':141.45e-6, 'iy':4.97e-2, 'It':1652e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x120x6']= {'nmb':'200x120x6', 'b':120e-3, 'h':200e-3, 'e':6e-3, 'P':28.286, 'A':36.03e-4, 'Iz':1929.2e-8, 'Wzel':192.92e-6, 'Wzpl':236.55e-6, 'iz':7.32e-2, 'Iy':874.35e-8, 'Wyel':145.72e-6, 'Wypl':166.33e-6, 'iy':4.93e-2, 'It':1946.73e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x120x7']= {'nmb':'200x120x7', 'b':120e-3, 'h':200e-3, 'e':7e-3, 'P':32.309, 'A':41.16e-4, 'Iz':2150.67e-8, 'Wzel':215.07e-6, 'Wzpl':266.52e-6, 'iz':7.23e-2, 'Iy':975.25e-8, 'Wyel':162.54e-6, 'Wypl':187.57e-6, 'iy':4.87e-2, 'It':2236.96e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x120x8']= {'nmb':'200x120x8', 'b':120e-3, 'h':200e-3, 'e':8e-3, 'P':36.457, 'A':46.44e-4, 'Iz':2385.92e-8, 'Wzel':238.59e-6, 'Wzpl':297.98e-6, 'iz':7.17e-2, 'Iy':1078.97e-8, 'Wyel':179.83e-6, 'Wypl':209.49e-6, 'iy':4.82e-2, 'It':2507.04e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x150x5']= {'nmb':'200x150x5', 'b':150e-3, 'h':200e-3, 'e':5e-3, 'P':26.185, 'A':33.36e-4, 'Iz':1934.67e-8, 'Wzel':193.47e-6, 'Wzpl':230.12e-6, 'iz':7.62e-2, 'Iy':1245.04e-8, 'Wyel':166e-6, 'Wypl':189.23e-6, 'iy':6.11e-2, 'It':2391.38e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x150x6']= {'nmb':'200x150x6', 'b':150e-3, 'h':200e-3, 'e':6e-3, 'P':31.112, 'A':39.63e-4, 'Iz':2268.03e-8, 'Wzel':226.8e-6, 'Wzpl':271.47e-6, 'iz':7.56e-2, 'Iy':1457.13e-8, 'Wyel':194.28e-6, 'Wypl':223.08e-6, 'iy':6.06e-2, 'It':2826.19e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x150x7']= {'nmb':'200x150x7', 'b':150e-3, 'h':200e-3, 'e':7e-3, 'P':35.606, 'A':45.36e-4, 'Iz':2541.96e-8, 'Wzel':254.2e-6, 'Wzpl':307.05e-6, 'iz':7.49e-2, 'Iy':1633.73e-8, 'Wyel':217.83e-6, 'Wypl':252.46e-6, 'iy':6e-2, 'It':3258.9e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS200x150x8']= {'nmb':'200x150x8', 'b':150e-3, 'h':200e-3, 'e':8e-3, 'P':40.225, 'A':51.24e-4, 'Iz':2828.55e-8, 'Wzel':282.85e-6, 'Wzpl':344.06e-6, 'iz':7.43e-2, 'Iy':1815.54e-8, 'Wyel':242.07e-6, 'Wypl':282.76e-6, 'iy':5.95e-2, 'It':3664.86e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS220x80x4']= {'nmb':'220x80x4', 'b':80e-3, 'h':220e-3, 'e':4e-3, 'P':18.014, 'A':22.95e-4, 'Iz':1332.62e-8, 'Wzel':121.15e-6, 'Wzpl':154.51e-6, 'iz':7.62e-2, 'Iy':272.92e-8, 'Wyel':68.23e-6, 'Wypl':75.63e-6, 'iy':3.45e-2, 'It':749.97e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS220x80x5']= {'nmb':'220x80x5', 'b':80e-3, 'h':220e-3, 'e':5e-3, 'P':22.26, 'A':28.36e-4, 'Iz':1619.86e-8, 'Wzel':147.26e-6, 'Wzpl':189.23e-6, 'iz':7.56e-2, 'Iy':328.61e-8, 'Wyel':82.15e-6, 'Wypl':92.24e-6, 'iy':3.4e-2, 'It':913.84e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS220x80x6']= {'nmb':'220x80x6', 'b':80e-3, 'h':220e-3, 'e':6e-3, 'P':26.402, 'A':33.63e-4, 'Iz':1889.42e-8, 'Wzel':171.77e-6, 'Wzpl':222.42e-6, 'iz':7.5e-2, 'Iy':379.67e-8, 'Wyel':94.92e-6, 'Wypl':107.95e-6, 'iy':3.36e-2, 'It':1068.34e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS220x80x7']= {'nmb':'220x80x7', 'b':80e-3, 'h':220e-3, 'e':7e-3, 'P':30.111, 'A':38.36e-4, 'Iz':2090.42e-8, 'Wzel':190.04e-6, 'Wzpl':249.44e-6, 'iz':7.38e-2, 'Iy':419.54e-8, 'Wyel':104.88e-6, 'Wypl':121.08e-6, 'iy':3.31e-2, 'It':1215.08e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS220x80x8']= {'nmb':'220x80x8', 'b':80e-3, 'h':220e-3, 'e':8e-3, 'P':33.945, 'A':43.24e-4, 'Iz':2309.95e-8, 'Wzel':210e-6, 'Wzpl':278.18e-6, 'iz':7.31e-2, 'Iy':459.88e-8, 'Wyel':114.97e-6, 'Wypl':134.53e-6, 'iy':3.26e-2, 'It':1349.12e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS250x100x5']= {'nmb':'250x100x5', 'b':100e-3, 'h':250e-3, 'e':5e-3, 'P':26.185, 'A':33.36e-4, 'Iz':2553.76e-8, 'Wzel':204.3e-6, 'Wzpl':258.51e-6, 'iz':8.75e-2, 'Iy':609.85e-8, 'Wyel':121.97e-6, 'Wypl':135.84e-6, 'iy':4.28e-2, 'It':1620.11e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS250x100x6']= {'nmb':'250x100x6', 'b':100e-3, 'h':250e-3, 'e':6e-3, 'P':31.112, 'A':39.63e-4, 'Iz':2992.34e-8, 'Wzel':239.39e-6, 'Wzpl':304.85e-6, 'iz':8.69e-2, 'Iy':709.63e-8, 'Wyel':141.93e-6, 'Wypl':159.7e-6, 'iy':4.23e-2, 'It':1904.54e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS250x100x7']= {'nmb':'250x100x7', 'b':100e-3, 'h':250e-3, 'e':7e-3, 'P':35.606, 'A':45.36e-4, 'Iz':3341.65e-8, 'Wzel':267.33e-6, 'Wzpl':344.15e-6, 'iz':8.58e-2, 'Iy':791.97e-8, 'Wyel':158.39e-6, 'Wypl':180.37e-6, 'iy':4.18e-2, 'It':2181.58e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS250x100x8']= {'nmb':'250x100x8', 'b':100e-3, 'h':250e-3, 'e':8e-3, 'P':40.225, 'A':51.24e-4, 'Iz':3714.08e-8, 'Wzel':297.13e-6, 'Wzpl':385.37e-6, 'iz':8.51e-2, 'Iy':875.06e-8, 'Wyel':175.01e-6, 'Wypl':201.45e-6, 'iy':4.13e-2, 'It':2438.66e-8, 'E':210000e6, 'nu':0.3}
-RHS['RHS250x150x16']= {'nmb':'250x150x16', 'b':150e-3, 'h':250e-3, 'e':16e-3, 'P':90.300, 'A':115.0e-4, 'Iz':8880.00e-8, 'Wzel':710.00e-6, 'Wzpl':906.00e-6, 'iz':8.79e-2, 'Iy':3870.0e-8, 'Wyel':516.00e-6, 'Wypl':625.00e-6, 'iy':5.80e-2, 'It':8870.00e-8, 'E':210000e6, 'nu':0.3}   #Tata profile
-
-for item in RHS:
-    shape= RHS[item]
+
+def setRHSDerivedValues(shape):
+    '''Compute the properties of the RHS shapes that are not in the table.'''
     A= shape['A']
     E= shape['E']
     nu= shape['nu']
@@ -974,181 +353,13 @@ for item in RHS:
     shape['AreaQy']= 2*0.7*h*e
     shape['AreaQz']= 2*0.7*b*e
 
+RHS= shape_table.ShapeTable('arcelor_RHS',setRHSDerivedValues)
+
 # Tata steel circular hollow tubes.
 
-CHS={}
-
-CHS['CHS_21.3_2.6']= {'nmb':'CHS_21.3_2.6', 'D':21.3e-3, 't':2.6e-3, 'P':1.20, 'A':1.53e-4, 'Iz':0.681e-8, 'iz':0.668e-2, 'Wzel':0.639e-6, 'Wzpl':0.915e-6, 'Iy':0.681e-8, 'iy':0.668e-2, 'Wyel':0.639e-6, 'Wypl':0.915e-6, 'It':1.36e-8, 'C':1.28e-6, 'AL':0.067, 'AG':55.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_21.3_2.9']= {'nmb':'CHS_21.3_2.9', 'D':21.3e-3, 't':2.9e-3, 'P':1.32, 'A':1.68e-4, 'Iz':0.727e-8, 'iz':0.659e-2, 'Wzel':0.683e-6, 'Wzpl':0.990e-6, 'Iy':0.727e-8, 'iy':0.659e-2, 'Wyel':0.683e-6, 'Wypl':0.990e-6, 'It':1.45e-8, 'C':1.37e-6, 'AL':0.067, 'AG':50.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_21.3_3.2']= {'nmb':'CHS_21.3_3.2', 'D':21.3e-3, 't':3.2e-3, 'P':1.43, 'A':1.82e-4, 'Iz':0.768e-8, 'iz':0.650e-2, 'Wzel':0.722e-6, 'Wzpl':1.06e-6, 'Iy':0.768e-8, 'iy':0.650e-2, 'Wyel':0.722e-6, 'Wypl':1.06e-6, 'It':1.54e-8, 'C':1.44e-6, 'AL':0.067, 'AG':46.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_26.9_2.6']= {'nmb':'CHS_26.9_2.6', 'D':26.9e-3, 't':2.6e-3, 'P':1.56, 'A':1.98e-4, 'Iz':1.48e-8, 'iz':0.864e-2, 'Wzel':1.10e-6, 'Wzpl':1.54e-6, 'Iy':1.48e-8, 'iy':0.864e-2, 'Wyel':1.10e-6, 'Wypl':1.54e-6, 'It':2.96e-8, 'C':2.20e-6, 'AL':0.085, 'AG':54.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_26.9_2.9']= {'nmb':'CHS_26.9_2.9', 'D':26.9e-3, 't':2.9e-3, 'P':1.72, 'A':2.19e-4, 'Iz':1.60e-8, 'iz':0.855e-2, 'Wzel':1.19e-6, 'Wzpl':1.68e-6, 'Iy':1.60e-8, 'iy':0.855e-2, 'Wyel':1.19e-6, 'Wypl':1.68e-6, 'It':3.19e-8, 'C':2.38e-6, 'AL':0.085, 'AG':49.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_26.9_3.2']= {'nmb':'CHS_26.9_3.2', 'D':26.9e-3, 't':3.2e-3, 'P':1.87, 'A':2.38e-4, 'Iz':1.70e-8, 'iz':0.846e-2, 'Wzel':1.27e-6, 'Wzpl':1.81e-6, 'Iy':1.70e-8, 'iy':0.846e-2, 'Wyel':1.27e-6, 'Wypl':1.81e-6, 'It':3.41e-8, 'C':2.53e-6, 'AL':0.085, 'AG':45.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_26.9_3.6']= {'nmb':'CHS_26.9_3.6', 'D':26.9e-3, 't':3.6e-3, 'P':2.07, 'A':2.64e-4, 'Iz':1.83e-8, 'iz':0.834e-2, 'Wzel':1.36e-6, 'Wzpl':1.97e-6, 'Iy':1.83e-8, 'iy':0.834e-2, 'Wyel':1.36e-6, 'Wypl':1.97e-6, 'It':3.66e-8, 'C':2.72e-6, 'AL':0.085, 'AG':41.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_33.7_2.6']= {'nmb':'CHS_33.7_2.6', 'D':33.7e-3, 't':2.6e-3, 'P':1.99, 'A':2.54e-4, 'Iz':3.09e-8, 'iz':1.10e-2, 'Wzel':1.84e-6, 'Wzpl':2.52e-6, 'Iy':3.09e-8, 'iy':1.10e-2, 'Wyel':1.84e-6, 'Wypl':2.52e-6, 'It':6.19e-8, 'C':3.67e-6, 'AL':0.106, 'AG':53.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_33.7_2.9']= {'nmb':'CHS_33.7_2.9', 'D':33.7e-3, 't':2.9e-3, 'P':2.20, 'A':2.81e-4, 'Iz':3.36e-8, 'iz':1.09e-2, 'Wzel':1.99e-6, 'Wzpl':2.76e-6, 'Iy':3.36e-8, 'iy':1.09e-2, 'Wyel':1.99e-6, 'Wypl':2.76e-6, 'It':6.71e-8, 'C':3.98e-6, 'AL':0.106, 'AG':48.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_33.7_3.2']= {'nmb':'CHS_33.7_3.2', 'D':33.7e-3, 't':3.2e-3, 'P':2.41, 'A':3.07e-4, 'Iz':3.60e-8, 'iz':1.08e-2, 'Wzel':2.14e-6, 'Wzpl':2.99e-6, 'Iy':3.60e-8, 'iy':1.08e-2, 'Wyel':2.14e-6, 'Wypl':2.99e-6, 'It':7.21e-8, 'C':4.28e-6, 'AL':0.106, 'AG':44.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_33.7_3.6']= {'nmb':'CHS_33.7_3.6', 'D':33.7e-3, 't':3.6e-3, 'P':2.67, 'A':3.40e-4, 'Iz':3.91e-8, 'iz':1.07e-2, 'Wzel':2.32e-6, 'Wzpl':3.28e-6, 'Iy':3.91e-8, 'iy':1.07e-2, 'Wyel':2.32e-6, 'Wypl':3.28e-6, 'It':7.82e-8, 'C':4.64e-6, 'AL':0.106, 'AG':39.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_33.7_4.0']= {'nmb':'CHS_33.7_4.0', 'D':33.7e-3, 't':4.0e-3, 'P':2.93, 'A':3.73e-4, 'Iz':4.19e-8, 'iz':1.06e-2, 'Wzel':2.49e-6, 'Wzpl':3.55e-6, 'Iy':4.19e-8, 'iy':1.06e-2, 'Wyel':2.49e-6, 'Wypl':3.55e-6, 'It':8.38e-8, 'C':4.97e-6, 'AL':0.106, 'AG':36.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_33.7_4.5']= {'nmb':'CHS_33.7_4.5', 'D':33.7e-3, 't':4.5e-3, 'P':3.24, 'A':4.13e-4, 'Iz':4.50e-8, 'iz':1.04e-2, 'Wzel':2.67e-6, 'Wzpl':3.87e-6, 'Iy':4.50e-8, 'iy':1.04e-2, 'Wyel':2.67e-6, 'Wypl':3.87e-6, 'It':9.01e-8, 'C':5.35e-6, 'AL':0.106, 'AG':32.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_42.4_2.6']= {'nmb':'CHS_42.4_2.6', 'D':42.4e-3, 't':2.6e-3, 'P':2.55, 'A':3.25e-4, 'Iz':6.46e-8, 'iz':1.41e-2, 'Wzel':3.05e-6, 'Wzpl':4.12e-6, 'Iy':6.46e-8, 'iy':1.41e-2, 'Wyel':3.05e-6, 'Wypl':4.12e-6, 'It':12.9e-8, 'C':6.10e-6, 'AL':0.133, 'AG':52.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_42.4_2.9']= {'nmb':'CHS_42.4_2.9', 'D':42.4e-3, 't':2.9e-3, 'P':2.82, 'A':3.60e-4, 'Iz':7.06e-8, 'iz':1.40e-2, 'Wzel':3.33e-6, 'Wzpl':4.53e-6, 'Iy':7.06e-8, 'iy':1.40e-2, 'Wyel':3.33e-6, 'Wypl':4.53e-6, 'It':14.1e-8, 'C':6.66e-6, 'AL':0.133, 'AG':47.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_42.4_3.2']= {'nmb':'CHS_42.4_3.2', 'D':42.4e-3, 't':3.2e-3, 'P':3.09, 'A':3.94e-4, 'Iz':7.62e-8, 'iz':1.39e-2, 'Wzel':3.59e-6, 'Wzpl':4.93e-6, 'Iy':7.62e-8, 'iy':1.39e-2, 'Wyel':3.59e-6, 'Wypl':4.93e-6, 'It':15.2e-8, 'C':7.19e-6, 'AL':0.133, 'AG':43.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_42.4_3.6']= {'nmb':'CHS_42.4_3.6', 'D':42.4e-3, 't':3.6e-3, 'P':3.44, 'A':4.39e-4, 'Iz':8.33e-8, 'iz':1.38e-2, 'Wzel':3.93e-6, 'Wzpl':5.44e-6, 'Iy':8.33e-8, 'iy':1.38e-2, 'Wyel':3.93e-6, 'Wypl':5.44e-6, 'It':16.7e-8, 'C':7.86e-6, 'AL':0.133, 'AG':38.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_42.4_4.0']= {'nmb':'CHS_42.4_4.0', 'D':42.4e-3, 't':4.0e-3, 'P':3.79, 'A':4.83e-4, 'Iz':8.99e-8, 'iz':1.36e-2, 'Wzel':4.24e-6, 'Wzpl':5.92e-6, 'Iy':8.99e-8, 'iy':1.36e-2, 'Wyel':4.24e-6, 'Wypl':5.92e-6, 'It':18.0e-8, 'C':8.48e-6, 'AL':0.133, 'AG':35.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_42.4_4.5']= {'nmb':'CHS_42.4_4.5', 'D':42.4e-3, 't':4.5e-3, 'P':4.21, 'A':5.36e-4, 'Iz':9.76e-8, 'iz':1.35e-2, 'Wzel':4.60e-6, 'Wzpl':6.49e-6, 'Iy':9.76e-8, 'iy':1.35e-2, 'Wyel':4.60e-6, 'Wypl':6.49e-6, 'It':19.5e-8, 'C':9.20e-6, 'AL':0.133, 'AG':31.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_2.6']= {'nmb':'CHS_48.3_2.6', 'D':48.3e-3, 't':2.6e-3, 'P':2.93, 'A':3.73e-4, 'Iz':9.78e-8, 'iz':1.62e-2, 'Wzel':4.05e-6, 'Wzpl':5.44e-6, 'Iy':9.78e-8, 'iy':1.62e-2, 'Wyel':4.05e-6, 'Wypl':5.44e-6, 'It':19.6e-8, 'C':8.10e-6, 'AL':0.152, 'AG':51.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_2.9']= {'nmb':'CHS_48.3_2.9', 'D':48.3e-3, 't':2.9e-3, 'P':3.25, 'A':4.14e-4, 'Iz':10.7e-8, 'iz':1.61e-2, 'Wzel':4.43e-6, 'Wzpl':5.99e-6, 'Iy':10.7e-8, 'iy':1.61e-2, 'Wyel':4.43e-6, 'Wypl':5.99e-6, 'It':21.4e-8, 'C':8.86e-6, 'AL':0.152, 'AG':46.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_3.2']= {'nmb':'CHS_48.3_3.2', 'D':48.3e-3, 't':3.2e-3, 'P':3.56, 'A':4.53e-4, 'Iz':11.6e-8, 'iz':1.60e-2, 'Wzel':4.80e-6, 'Wzpl':6.52e-6, 'Iy':11.6e-8, 'iy':1.60e-2, 'Wyel':4.80e-6, 'Wypl':6.52e-6, 'It':23.2e-8, 'C':9.59e-6, 'AL':0.152, 'AG':42.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_3.6']= {'nmb':'CHS_48.3_3.6', 'D':48.3e-3, 't':3.6e-3, 'P':3.97, 'A':5.06e-4, 'Iz':12.7e-8, 'iz':1.59e-2, 'Wzel':5.26e-6, 'Wzpl':7.21e-6, 'Iy':12.7e-8, 'iy':1.59e-2, 'Wyel':5.26e-6, 'Wypl':7.21e-6, 'It':25.4e-8, 'C':10.5e-6, 'AL':0.152, 'AG':38.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_4.0']= {'nmb':'CHS_48.3_4.0', 'D':48.3e-3, 't':4.0e-3, 'P':4.37, 'A':5.57e-4, 'Iz':13.8e-8, 'iz':1.57e-2, 'Wzel':5.70e-6, 'Wzpl':7.87e-6, 'Iy':13.8e-8, 'iy':1.57e-2, 'Wyel':5.70e-6, 'Wypl':7.87e-6, 'It':27.5e-8, 'C':11.4e-6, 'AL':0.152, 'AG':34.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_4.5']= {'nmb':'CHS_48.3_4.5', 'D':48.3e-3, 't':4.5e-3, 'P':4.86, 'A':6.19e-4, 'Iz':15.0e-8, 'iz':1.56e-2, 'Wzel':6.21e-6, 'Wzpl':8.66e-6, 'Iy':15.0e-8, 'iy':1.56e-2, 'Wyel':6.21e-6, 'Wypl':8.66e-6, 'It':30.0e-8, 'C':12.4e-6, 'AL':0.152, 'AG':31.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_5.0']= {'nmb':'CHS_48.3_5.0', 'D':48.3e-3, 't':5.0e-3, 'P':5.34, 'A':6.80e-4, 'Iz':16.2e-8, 'iz':1.54e-2, 'Wzel':6.69e-6, 'Wzpl':9.42e-6, 'Iy':16.2e-8, 'iy':1.54e-2, 'Wyel':6.69e-6, 'Wypl':9.42e-6, 'It':32.3e-8, 'C':13.4e-6, 'AL':0.152, 'AG':28.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_5.6']= {'nmb':'CHS_48.3_5.6', 'D':48.3e-3, 't':5.6e-3, 'P':5.90, 'A':7.51e-4, 'Iz':17.4e-8, 'iz':1.52e-2, 'Wzel':7.21e-6, 'Wzpl':10.3e-6, 'Iy':17.4e-8, 'iy':1.52e-2, 'Wyel':7.21e-6, 'Wypl':10.3e-6, 'It':34.8e-8, 'C':14.4e-6, 'AL':0.152, 'AG':25.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_48.3_6.3']= {'nmb':'CHS_48.3_6.3', 'D':48.3e-3, 't':6.3e-3, 'P':6.53, 'A':8.31e-4, 'Iz':18.7e-8, 'iz':1.50e-2, 'Wzel':7.76e-6, 'Wzpl':11.2e-6, 'Iy':18.7e-8, 'iy':1.50e-2, 'Wyel':7.76e-6, 'Wypl':11.2e-6, 'It':37.5e-8, 'C':15.5e-6, 'AL':0.152, 'AG':23.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_2.6']= {'nmb':'CHS_60.3_2.6', 'D':60.3e-3, 't':2.6e-3, 'P':3.70, 'A':4.71e-4, 'Iz':19.7e-8, 'iz':2.04e-2, 'Wzel':6.52e-6, 'Wzpl':8.66e-6, 'Iy':19.7e-8, 'iy':2.04e-2, 'Wyel':6.52e-6, 'Wypl':8.66e-6, 'It':39.3e-8, 'C':13.0e-6, 'AL':0.189, 'AG':51.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_2.9']= {'nmb':'CHS_60.3_2.9', 'D':60.3e-3, 't':2.9e-3, 'P':4.11, 'A':5.23e-4, 'Iz':21.6e-8, 'iz':2.03e-2, 'Wzel':7.16e-6, 'Wzpl':9.56e-6, 'Iy':21.6e-8, 'iy':2.03e-2, 'Wyel':7.16e-6, 'Wypl':9.56e-6, 'It':43.2e-8, 'C':14.3e-6, 'AL':0.189, 'AG':46.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_3.2']= {'nmb':'CHS_60.3_3.2', 'D':60.3e-3, 't':3.2e-3, 'P':4.51, 'A':5.74e-4, 'Iz':23.5e-8, 'iz':2.02e-2, 'Wzel':7.78e-6, 'Wzpl':10.4e-6, 'Iy':23.5e-8, 'iy':2.02e-2, 'Wyel':7.78e-6, 'Wypl':10.4e-6, 'It':46.9e-8, 'C':15.6e-6, 'AL':0.189, 'AG':41.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_3.6']= {'nmb':'CHS_60.3_3.6', 'D':60.3e-3, 't':3.6e-3, 'P':5.03, 'A':6.41e-4, 'Iz':25.9e-8, 'iz':2.01e-2, 'Wzel':8.58e-6, 'Wzpl':11.6e-6, 'Iy':25.9e-8, 'iy':2.01e-2, 'Wyel':8.58e-6, 'Wypl':11.6e-6, 'It':51.7e-8, 'C':17.2e-6, 'AL':0.189, 'AG':37.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_4.0']= {'nmb':'CHS_60.3_4.0', 'D':60.3e-3, 't':4.0e-3, 'P':5.55, 'A':7.07e-4, 'Iz':28.2e-8, 'iz':2.00e-2, 'Wzel':9.34e-6, 'Wzpl':12.7e-6, 'Iy':28.2e-8, 'iy':2.00e-2, 'Wyel':9.34e-6, 'Wypl':12.7e-6, 'It':56.3e-8, 'C':18.7e-6, 'AL':0.189, 'AG':34.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_4.5']= {'nmb':'CHS_60.3_4.5', 'D':60.3e-3, 't':4.5e-3, 'P':6.19, 'A':7.89e-4, 'Iz':30.9e-8, 'iz':1.98e-2, 'Wzel':10.2e-6, 'Wzpl':14.0e-6, 'Iy':30.9e-8, 'iy':1.98e-2, 'Wyel':10.2e-6, 'Wypl':14.0e-6, 'It':61.8e-8, 'C':20.5e-6, 'AL':0.189, 'AG':30.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_5.0']= {'nmb':'CHS_60.3_5.0', 'D':60.3e-3, 't':5.0e-3, 'P':6.82, 'A':8.69e-4, 'Iz':33.5e-8, 'iz':1.96e-2, 'Wzel':11.1e-6, 'Wzpl':15.3e-6, 'Iy':33.5e-8, 'iy':1.96e-2, 'Wyel':11.1e-6, 'Wypl':15.3e-6, 'It':67.0e-8, 'C':22.2e-6, 'AL':0.189, 'AG':27.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_5.6']= {'nmb':'CHS_60.3_5.6', 'D':60.3e-3, 't':5.6e-3, 'P':7.55, 'A':9.62e-4, 'Iz':36.4e-8, 'iz':1.94e-2, 'Wzel':12.1e-6, 'Wzpl':16.8e-6, 'Iy':36.4e-8, 'iy':1.94e-2, 'Wyel':12.1e-6, 'Wypl':16.8e-6, 'It':72.7e-8, 'C':24.1e-6, 'AL':0.189, 'AG':25.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_6.3']= {'nmb':'CHS_60.3_6.3', 'D':60.3e-3, 't':6.3e-3, 'P':8.39, 'A':10.7e-4, 'Iz':39.5e-8, 'iz':1.92e-2, 'Wzel':13.1e-6, 'Wzpl':18.5e-6, 'Iy':39.5e-8, 'iy':1.92e-2, 'Wyel':13.1e-6, 'Wypl':18.5e-6, 'It':79.0e-8, 'C':26.2e-6, 'AL':0.189, 'AG':22.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_7.1']= {'nmb':'CHS_60.3_7.1', 'D':60.3e-3, 't':7.1e-3, 'P':9.32, 'A':11.9e-4, 'Iz':42.7e-8, 'iz':1.90e-2, 'Wzel':14.2e-6, 'Wzpl':20.2e-6, 'Iy':42.7e-8, 'iy':1.90e-2, 'Wyel':14.2e-6, 'Wypl':20.2e-6, 'It':85.5e-8, 'C':28.3e-6, 'AL':0.189, 'AG':20.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_60.3_8.0']= {'nmb':'CHS_60.3_8.0', 'D':60.3e-3, 't':8.0e-3, 'P':10.3, 'A':13.1e-4, 'Iz':46.0e-8, 'iz':1.87e-2, 'Wzel':15.3e-6, 'Wzpl':22.1e-6, 'Iy':46.0e-8, 'iy':1.87e-2, 'Wyel':15.3e-6, 'Wypl':22.1e-6, 'It':92.0e-8, 'C':30.5e-6, 'AL':0.189, 'AG':18.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_2.9']= {'nmb':'CHS_76.1_2.9', 'D':76.1e-3, 't':2.9e-3, 'P':5.24, 'A':6.67e-4, 'Iz':44.7e-8, 'iz':2.59e-2, 'Wzel':11.8e-6, 'Wzpl':15.5e-6, 'Iy':44.7e-8, 'iy':2.59e-2, 'Wyel':11.8e-6, 'Wypl':15.5e-6, 'It':89.5e-8, 'C':23.5e-6, 'AL':0.239, 'AG':45.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_3.2']= {'nmb':'CHS_76.1_3.2', 'D':76.1e-3, 't':3.2e-3, 'P':5.75, 'A':7.33e-4, 'Iz':48.8e-8, 'iz':2.58e-2, 'Wzel':12.8e-6, 'Wzpl':17.0e-6, 'Iy':48.8e-8, 'iy':2.58e-2, 'Wyel':12.8e-6, 'Wypl':17.0e-6, 'It':97.6e-8, 'C':25.6e-6, 'AL':0.239, 'AG':41.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_3.6']= {'nmb':'CHS_76.1_3.6', 'D':76.1e-3, 't':3.6e-3, 'P':6.44, 'A':8.20e-4, 'Iz':54.0e-8, 'iz':2.57e-2, 'Wzel':14.2e-6, 'Wzpl':18.9e-6, 'Iy':54.0e-8, 'iy':2.57e-2, 'Wyel':14.2e-6, 'Wypl':18.9e-6, 'It':108e-8, 'C':28.4e-6, 'AL':0.239, 'AG':37.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_4.0']= {'nmb':'CHS_76.1_4.0', 'D':76.1e-3, 't':4.0e-3, 'P':7.11, 'A':9.06e-4, 'Iz':59.1e-8, 'iz':2.55e-2, 'Wzel':15.5e-6, 'Wzpl':20.8e-6, 'Iy':59.1e-8, 'iy':2.55e-2, 'Wyel':15.5e-6, 'Wypl':20.8e-6, 'It':118e-8, 'C':31.0e-6, 'AL':0.239, 'AG':33.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_4.5']= {'nmb':'CHS_76.1_4.5', 'D':76.1e-3, 't':4.5e-3, 'P':7.95, 'A':10.1e-4, 'Iz':65.1e-8, 'iz':2.54e-2, 'Wzel':17.1e-6, 'Wzpl':23.1e-6, 'Iy':65.1e-8, 'iy':2.54e-2, 'Wyel':17.1e-6, 'Wypl':23.1e-6, 'It':130e-8, 'C':34.2e-6, 'AL':0.239, 'AG':30.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_5.0']= {'nmb':'CHS_76.1_5.0', 'D':76.1e-3, 't':5.0e-3, 'P':8.77, 'A':11.2e-4, 'Iz':70.9e-8, 'iz':2.52e-2, 'Wzel':18.6e-6, 'Wzpl':25.3e-6, 'Iy':70.9e-8, 'iy':2.52e-2, 'Wyel':18.6e-6, 'Wypl':25.3e-6, 'It':142e-8, 'C':37.3e-6, 'AL':0.239, 'AG':27.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_5.6']= {'nmb':'CHS_76.1_5.6', 'D':76.1e-3, 't':5.6e-3, 'P':9.74, 'A':12.4e-4, 'Iz':77.5e-8, 'iz':2.50e-2, 'Wzel':20.4e-6, 'Wzpl':27.9e-6, 'Iy':77.5e-8, 'iy':2.50e-2, 'Wyel':20.4e-6, 'Wypl':27.9e-6, 'It':155e-8, 'C':40.8e-6, 'AL':0.239, 'AG':24.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_6.3']= {'nmb':'CHS_76.1_6.3', 'D':76.1e-3, 't':6.3e-3, 'P':10.8, 'A':13.8e-4, 'Iz':84.8e-8, 'iz':2.48e-2, 'Wzel':22.3e-6, 'Wzpl':30.8e-6, 'Iy':84.8e-8, 'iy':2.48e-2, 'Wyel':22.3e-6, 'Wypl':30.8e-6, 'It':170e-8, 'C':44.6e-6, 'AL':0.239, 'AG':22.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_7.1']= {'nmb':'CHS_76.1_7.1', 'D':76.1e-3, 't':7.1e-3, 'P':12.1, 'A':15.4e-4, 'Iz':92.6e-8, 'iz':2.45e-2, 'Wzel':24.3e-6, 'Wzpl':33.9e-6, 'Iy':92.6e-8, 'iy':2.45e-2, 'Wyel':24.3e-6, 'Wypl':33.9e-6, 'It':185e-8, 'C':48.7e-6, 'AL':0.239, 'AG':19.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_76.1_8.0']= {'nmb':'CHS_76.1_8.0', 'D':76.1e-3, 't':8.0e-3, 'P':13.4, 'A':17.1e-4, 'Iz':101e-8, 'iz':2.42e-2, 'Wzel':26.4e-6, 'Wzpl':37.3e-6, 'Iy':101e-8, 'iy':2.42e-2, 'Wyel':26.4e-6, 'Wypl':37.3e-6, 'It':201e-8, 'C':52.9e-6, 'AL':0.239, 'AG':17.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_3.2']= {'nmb':'CHS_88.9_3.2', 'D':88.9e-3, 't':3.2e-3, 'P':6.76, 'A':8.62e-4, 'Iz':79.2e-8, 'iz':3.03e-2, 'Wzel':17.8e-6, 'Wzpl':23.5e-6, 'Iy':79.2e-8, 'iy':3.03e-2, 'Wyel':17.8e-6, 'Wypl':23.5e-6, 'It':158e-8, 'C':35.6e-6, 'AL':0.279, 'AG':41.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_3.6']= {'nmb':'CHS_88.9_3.6', 'D':88.9e-3, 't':3.6e-3, 'P':7.57, 'A':9.65e-4, 'Iz':87.9e-8, 'iz':3.02e-2, 'Wzel':19.8e-6, 'Wzpl':26.2e-6, 'Iy':87.9e-8, 'iy':3.02e-2, 'Wyel':19.8e-6, 'Wypl':26.2e-6, 'It':176e-8, 'C':39.5e-6, 'AL':0.279, 'AG':36.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_4.0']= {'nmb':'CHS_88.9_4.0', 'D':88.9e-3, 't':4.0e-3, 'P':8.38, 'A':10.7e-4, 'Iz':96.3e-8, 'iz':3.00e-2, 'Wzel':21.7e-6, 'Wzpl':28.9e-6, 'Iy':96.3e-8, 'iy':3.00e-2, 'Wyel':21.7e-6, 'Wypl':28.9e-6, 'It':193e-8, 'C':43.3e-6, 'AL':0.279, 'AG':33.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_4.5']= {'nmb':'CHS_88.9_4.5', 'D':88.9e-3, 't':4.5e-3, 'P':9.37, 'A':11.9e-4, 'Iz':107e-8, 'iz':2.99e-2, 'Wzel':24.0e-6, 'Wzpl':32.1e-6, 'Iy':107e-8, 'iy':2.99e-2, 'Wyel':24.0e-6, 'Wypl':32.1e-6, 'It':213e-8, 'C':47.9e-6, 'AL':0.279, 'AG':29.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_5.0']= {'nmb':'CHS_88.9_5.0', 'D':88.9e-3, 't':5.0e-3, 'P':10.3, 'A':13.2e-4, 'Iz':116e-8, 'iz':2.97e-2, 'Wzel':26.2e-6, 'Wzpl':35.2e-6, 'Iy':116e-8, 'iy':2.97e-2, 'Wyel':26.2e-6, 'Wypl':35.2e-6, 'It':233e-8, 'C':52.4e-6, 'AL':0.279, 'AG':27.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_5.6']= {'nmb':'CHS_88.9_5.6', 'D':88.9e-3, 't':5.6e-3, 'P':11.5, 'A':14.7e-4, 'Iz':128e-8, 'iz':2.95e-2, 'Wzel':28.7e-6, 'Wzpl':38.9e-6, 'Iy':128e-8, 'iy':2.95e-2, 'Wyel':28.7e-6, 'Wypl':38.9e-6, 'It':255e-8, 'C':57.5e-6, 'AL':0.279, 'AG':24.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_6.3']= {'nmb':'CHS_88.9_6.3', 'D':88.9e-3, 't':6.3e-3, 'P':12.8, 'A':16.3e-4, 'Iz':140e-8, 'iz':2.93e-2, 'Wzel':31.5e-6, 'Wzpl':43.1e-6, 'Iy':140e-8, 'iy':2.93e-2, 'Wyel':31.5e-6, 'Wypl':43.1e-6, 'It':280e-8, 'C':63.1e-6, 'AL':0.279, 'AG':21.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_7.1']= {'nmb':'CHS_88.9_7.1', 'D':88.9e-3, 't':7.1e-3, 'P':14.3, 'A':18.2e-4, 'Iz':154e-8, 'iz':2.90e-2, 'Wzel':34.6e-6, 'Wzpl':47.6e-6, 'Iy':154e-8, 'iy':2.90e-2, 'Wyel':34.6e-6, 'Wypl':47.6e-6, 'It':308e-8, 'C':69.2e-6, 'AL':0.279, 'AG':19.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_8.0']= {'nmb':'CHS_88.9_8.0', 'D':88.9e-3, 't':8.0e-3, 'P':16.0, 'A':20.3e-4, 'Iz':168e-8, 'iz':2.87e-2, 'Wzel':37.8e-6, 'Wzpl':52.5e-6, 'Iy':168e-8, 'iy':2.87e-2, 'Wyel':37.8e-6, 'Wypl':52.5e-6, 'It':336e-8, 'C':75.6e-6, 'AL':0.279, 'AG':17.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_88.9_10.0']= {'nmb':'CHS_88.9_10.0', 'D':88.9e-3, 't':10.0e-3, 'P':19.5, 'A':24.8e-4, 'Iz':196e-8, 'iz':2.81e-2, 'Wzel':44.1e-6, 'Wzpl':62.6e-6, 'Iy':196e-8, 'iy':2.81e-2, 'Wyel':44.1e-6, 'Wypl':62.6e-6, 'It':392e-8, 'C':88.2e-6, 'AL':0.279, 'AG':14.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_3.6']= {'nmb':'CHS_101.6_3.6', 'D':101.6e-3, 't':3.6e-3, 'P':8.70, 'A':11.1e-4, 'Iz':133e-8, 'iz':3.47e-2, 'Wzel':26.2e-6, 'Wzpl':34.6e-6, 'Iy':133e-8, 'iy':3.47e-2, 'Wyel':26.2e-6, 'Wypl':34.6e-6, 'It':266e-8, 'C':52.5e-6, 'AL':0.319, 'AG':36.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_4.0']= {'nmb':'CHS_101.6_4.0', 'D':101.6e-3, 't':4.0e-3, 'P':9.63, 'A':12.3e-4, 'Iz':146e-8, 'iz':3.45e-2, 'Wzel':28.8e-6, 'Wzpl':38.1e-6, 'Iy':146e-8, 'iy':3.45e-2, 'Wyel':28.8e-6, 'Wypl':38.1e-6, 'It':293e-8, 'C':57.6e-6, 'AL':0.319, 'AG':33.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_4.5']= {'nmb':'CHS_101.6_4.5', 'D':101.6e-3, 't':4.5e-3, 'P':10.8, 'A':13.7e-4, 'Iz':162e-8, 'iz':3.44e-2, 'Wzel':31.9e-6, 'Wzpl':42.5e-6, 'Iy':162e-8, 'iy':3.44e-2, 'Wyel':31.9e-6, 'Wypl':42.5e-6, 'It':324e-8, 'C':63.8e-6, 'AL':0.319, 'AG':29.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_5.0']= {'nmb':'CHS_101.6_5.0', 'D':101.6e-3, 't':5.0e-3, 'P':11.9, 'A':15.2e-4, 'Iz':177e-8, 'iz':3.42e-2, 'Wzel':34.9e-6, 'Wzpl':46.7e-6, 'Iy':177e-8, 'iy':3.42e-2, 'Wyel':34.9e-6, 'Wypl':46.7e-6, 'It':355e-8, 'C':69.9e-6, 'AL':0.319, 'AG':26.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_5.6']= {'nmb':'CHS_101.6_5.6', 'D':101.6e-3, 't':5.6e-3, 'P':13.3, 'A':16.9e-4, 'Iz':195e-8, 'iz':3.40e-2, 'Wzel':38.4e-6, 'Wzpl':51.7e-6, 'Iy':195e-8, 'iy':3.40e-2, 'Wyel':38.4e-6, 'Wypl':51.7e-6, 'It':390e-8, 'C':76.9e-6, 'AL':0.319, 'AG':24.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_6.3']= {'nmb':'CHS_101.6_6.3', 'D':101.6e-3, 't':6.3e-3, 'P':14.8, 'A':18.9e-4, 'Iz':215e-8, 'iz':3.38e-2, 'Wzel':42.3e-6, 'Wzpl':57.3e-6, 'Iy':215e-8, 'iy':3.38e-2, 'Wyel':42.3e-6, 'Wypl':57.3e-6, 'It':430e-8, 'C':84.7e-6, 'AL':0.319, 'AG':21.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_7.1']= {'nmb':'CHS_101.6_7.1', 'D':101.6e-3, 't':7.1e-3, 'P':16.5, 'A':21.1e-4, 'Iz':237e-8, 'iz':3.35e-2, 'Wzel':46.6e-6, 'Wzpl':63.5e-6, 'Iy':237e-8, 'iy':3.35e-2, 'Wyel':46.6e-6, 'Wypl':63.5e-6, 'It':473e-8, 'C':93.2e-6, 'AL':0.319, 'AG':19.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_8.0']= {'nmb':'CHS_101.6_8.0', 'D':101.6e-3, 't':8.0e-3, 'P':18.5, 'A':23.5e-4, 'Iz':260e-8, 'iz':3.32e-2, 'Wzel':51.1e-6, 'Wzpl':70.3e-6, 'Iy':260e-8, 'iy':3.32e-2, 'Wyel':51.1e-6, 'Wypl':70.3e-6, 'It':519e-8, 'C':102e-6, 'AL':0.319, 'AG':17.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_101.6_10.0']= {'nmb':'CHS_101.6_10.0', 'D':101.6e-3, 't':10.0e-3, 'P':22.6, 'A':28.8e-4, 'Iz':305e-8, 'iz':3.26e-2, 'Wzel':60.1e-6, 'Wzpl':84.2e-6, 'Iy':305e-8, 'iy':3.26e-2, 'Wyel':60.1e-6, 'Wypl':84.2e-6, 'It':611e-8, 'C':120e-6, 'AL':0.319, 'AG':14.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_3.6']= {'nmb':'CHS_114.3_3.6', 'D':114.3e-3, 't':3.6e-3, 'P':9.83, 'A':12.5e-4, 'Iz':192e-8, 'iz':3.92e-2, 'Wzel':33.6e-6, 'Wzpl':44.1e-6, 'Iy':192e-8, 'iy':3.92e-2, 'Wyel':33.6e-6, 'Wypl':44.1e-6, 'It':384e-8, 'C':67.2e-6, 'AL':0.359, 'AG':36.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_4.0']= {'nmb':'CHS_114.3_4.0', 'D':114.3e-3, 't':4.0e-3, 'P':10.9, 'A':13.9e-4, 'Iz':211e-8, 'iz':3.90e-2, 'Wzel':36.9e-6, 'Wzpl':48.7e-6, 'Iy':211e-8, 'iy':3.90e-2, 'Wyel':36.9e-6, 'Wypl':48.7e-6, 'It':422e-8, 'C':73.9e-6, 'AL':0.359, 'AG':32.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_4.5']= {'nmb':'CHS_114.3_4.5', 'D':114.3e-3, 't':4.5e-3, 'P':12.2, 'A':15.5e-4, 'Iz':234e-8, 'iz':3.89e-2, 'Wzel':41.0e-6, 'Wzpl':54.3e-6, 'Iy':234e-8, 'iy':3.89e-2, 'Wyel':41.0e-6, 'Wypl':54.3e-6, 'It':469e-8, 'C':82.0e-6, 'AL':0.359, 'AG':29.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_5.0']= {'nmb':'CHS_114.3_5.0', 'D':114.3e-3, 't':5.0e-3, 'P':13.5, 'A':17.2e-4, 'Iz':257e-8, 'iz':3.87e-2, 'Wzel':45.0e-6, 'Wzpl':59.8e-6, 'Iy':257e-8, 'iy':3.87e-2, 'Wyel':45.0e-6, 'Wypl':59.8e-6, 'It':514e-8, 'C':89.9e-6, 'AL':0.359, 'AG':26.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_5.6']= {'nmb':'CHS_114.3_5.6', 'D':114.3e-3, 't':5.6e-3, 'P':15.0, 'A':19.1e-4, 'Iz':283e-8, 'iz':3.85e-2, 'Wzel':49.6e-6, 'Wzpl':66.2e-6, 'Iy':283e-8, 'iy':3.85e-2, 'Wyel':49.6e-6, 'Wypl':66.2e-6, 'It':566e-8, 'C':99.1e-6, 'AL':0.359, 'AG':23.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_6.3']= {'nmb':'CHS_114.3_6.3', 'D':114.3e-3, 't':6.3e-3, 'P':16.8, 'A':21.4e-4, 'Iz':313e-8, 'iz':3.82e-2, 'Wzel':54.7e-6, 'Wzpl':73.6e-6, 'Iy':313e-8, 'iy':3.82e-2, 'Wyel':54.7e-6, 'Wypl':73.6e-6, 'It':625e-8, 'C':109e-6, 'AL':0.359, 'AG':21.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_7.1']= {'nmb':'CHS_114.3_7.1', 'D':114.3e-3, 't':7.1e-3, 'P':18.8, 'A':23.9e-4, 'Iz':345e-8, 'iz':3.80e-2, 'Wzel':60.4e-6, 'Wzpl':81.7e-6, 'Iy':345e-8, 'iy':3.80e-2, 'Wyel':60.4e-6, 'Wypl':81.7e-6, 'It':690e-8, 'C':121e-6, 'AL':0.359, 'AG':19.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_8.0']= {'nmb':'CHS_114.3_8.0', 'D':114.3e-3, 't':8.0e-3, 'P':21.0, 'A':26.7e-4, 'Iz':379e-8, 'iz':3.77e-2, 'Wzel':66.4e-6, 'Wzpl':90.6e-6, 'Iy':379e-8, 'iy':3.77e-2, 'Wyel':66.4e-6, 'Wypl':90.6e-6, 'It':759e-8, 'C':133e-6, 'AL':0.359, 'AG':17.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_114.3_10.0']= {'nmb':'CHS_114.3_10.0', 'D':114.3e-3, 't':10.0e-3, 'P':25.7, 'A':32.8e-4, 'Iz':450e-8, 'iz':3.70e-2, 'Wzel':78.7e-6, 'Wzpl':109e-6, 'Iy':450e-8, 'iy':3.70e-2, 'Wyel':78.7e-6, 'Wypl':109e-6, 'It':899e-8, 'C':157e-6, 'AL':0.359, 'AG':14.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_3.6']= {'nmb':'CHS_139.7_3.6', 'D':139.7e-3, 't':3.6e-3, 'P':12.1, 'A':15.4e-4, 'Iz':357e-8, 'iz':4.81e-2, 'Wzel':51.1e-6, 'Wzpl':66.7e-6, 'Iy':357e-8, 'iy':4.81e-2, 'Wyel':51.1e-6, 'Wypl':66.7e-6, 'It':713e-8, 'C':102e-6, 'AL':0.439, 'AG':36.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_4.0']= {'nmb':'CHS_139.7_4.0', 'D':139.7e-3, 't':4.0e-3, 'P':13.4, 'A':17.1e-4, 'Iz':393e-8, 'iz':4.80e-2, 'Wzel':56.2e-6, 'Wzpl':73.7e-6, 'Iy':393e-8, 'iy':4.80e-2, 'Wyel':56.2e-6, 'Wypl':73.7e-6, 'It':786e-8, 'C':112e-6, 'AL':0.439, 'AG':32.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_4.5']= {'nmb':'CHS_139.7_4.5', 'D':139.7e-3, 't':4.5e-3, 'P':15.0, 'A':19.1e-4, 'Iz':437e-8, 'iz':4.78e-2, 'Wzel':62.6e-6, 'Wzpl':82.3e-6, 'Iy':437e-8, 'iy':4.78e-2, 'Wyel':62.6e-6, 'Wypl':82.3e-6, 'It':874e-8, 'C':125e-6, 'AL':0.439, 'AG':29.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_5.0']= {'nmb':'CHS_139.7_5.0', 'D':139.7e-3, 't':5.0e-3, 'P':16.6, 'A':21.2e-4, 'Iz':481e-8, 'iz':4.77e-2, 'Wzel':68.8e-6, 'Wzpl':90.8e-6, 'Iy':481e-8, 'iy':4.77e-2, 'Wyel':68.8e-6, 'Wypl':90.8e-6, 'It':961e-8, 'C':138e-6, 'AL':0.439, 'AG':26.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_5.6']= {'nmb':'CHS_139.7_5.6', 'D':139.7e-3, 't':5.6e-3, 'P':18.5, 'A':23.6e-4, 'Iz':531e-8, 'iz':4.75e-2, 'Wzel':76.1e-6, 'Wzpl':101e-6, 'Iy':531e-8, 'iy':4.75e-2, 'Wyel':76.1e-6, 'Wypl':101e-6, 'It':1060e-8, 'C':152e-6, 'AL':0.439, 'AG':23.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_6.3']= {'nmb':'CHS_139.7_6.3', 'D':139.7e-3, 't':6.3e-3, 'P':20.7, 'A':26.4e-4, 'Iz':589e-8, 'iz':4.72e-2, 'Wzel':84.3e-6, 'Wzpl':112e-6, 'Iy':589e-8, 'iy':4.72e-2, 'Wyel':84.3e-6, 'Wypl':112e-6, 'It':1180e-8, 'C':169e-6, 'AL':0.439, 'AG':21.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_7.1']= {'nmb':'CHS_139.7_7.1', 'D':139.7e-3, 't':7.1e-3, 'P':23.2, 'A':29.6e-4, 'Iz':652e-8, 'iz':4.69e-2, 'Wzel':93.3e-6, 'Wzpl':125e-6, 'Iy':652e-8, 'iy':4.69e-2, 'Wyel':93.3e-6, 'Wypl':125e-6, 'It':1300e-8, 'C':187e-6, 'AL':0.439, 'AG':18.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_8.0']= {'nmb':'CHS_139.7_8.0', 'D':139.7e-3, 't':8.0e-3, 'P':26.0, 'A':33.1e-4, 'Iz':720e-8, 'iz':4.66e-2, 'Wzel':103e-6, 'Wzpl':139e-6, 'Iy':720e-8, 'iy':4.66e-2, 'Wyel':103e-6, 'Wypl':139e-6, 'It':1440e-8, 'C':206e-6, 'AL':0.439, 'AG':16.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_139.7_10.0']= {'nmb':'CHS_139.7_10.0', 'D':139.7e-3, 't':10.0e-3, 'P':32.0, 'A':40.7e-4, 'Iz':862e-8, 'iz':4.60e-2, 'Wzel':123e-6, 'Wzpl':169e-6, 'Iy':862e-8, 'iy':4.60e-2, 'Wyel':123e-6, 'Wypl':169e-6, 'It':1720e-8, 'C':247e-6, 'AL':0.439, 'AG':13.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_168.3_5.0']= {'nmb':'CHS_168.3_5.0', 'D':168.3e-3, 't':5.0e-3, 'P':20.1, 'A':25.7e-4, 'Iz':856e-8, 'iz':5.78e-2, 'Wzel':102e-6, 'Wzpl':133e-6, 'Iy':856e-8, 'iy':5.78e-2, 'Wyel':102e-6, 'Wypl':133e-6, 'It':1710e-8, 'C':203e-6, 'AL':0.529, 'AG':26.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_168.3_5.6']= {'nmb':'CHS_168.3_5.6', 'D':168.3e-3, 't':5.6e-3, 'P':22.5, 'A':28.6e-4, 'Iz':948e-8, 'iz':5.76e-2, 'Wzel':113e-6, 'Wzpl':148e-6, 'Iy':948e-8, 'iy':5.76e-2, 'Wyel':113e-6, 'Wypl':148e-6, 'It':1900e-8, 'C':225e-6, 'AL':0.529, 'AG':23.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_168.3_6.3']= {'nmb':'CHS_168.3_6.3', 'D':168.3e-3, 't':6.3e-3, 'P':25.2, 'A':32.1e-4, 'Iz':1050e-8, 'iz':5.73e-2, 'Wzel':125e-6, 'Wzpl':165e-6, 'Iy':1050e-8, 'iy':5.73e-2, 'Wyel':125e-6, 'Wypl':165e-6, 'It':2110e-8, 'C':250e-6, 'AL':0.529, 'AG':21.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_168.3_7.1']= {'nmb':'CHS_168.3_7.1', 'D':168.3e-3, 't':7.1e-3, 'P':28.2, 'A':36.0e-4, 'Iz':1170e-8, 'iz':5.70e-2, 'Wzel':139e-6, 'Wzpl':185e-6, 'Iy':1170e-8, 'iy':5.70e-2, 'Wyel':139e-6, 'Wypl':185e-6, 'It':2340e-8, 'C':278e-6, 'AL':0.529, 'AG':18.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_168.3_8.0']= {'nmb':'CHS_168.3_8.0', 'D':168.3e-3, 't':8.0e-3, 'P':31.6, 'A':40.3e-4, 'Iz':1300e-8, 'iz':5.67e-2, 'Wzel':154e-6, 'Wzpl':206e-6, 'Iy':1300e-8, 'iy':5.67e-2, 'Wyel':154e-6, 'Wypl':206e-6, 'It':2600e-8, 'C':308e-6, 'AL':0.529, 'AG':16.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_168.3_10.0']= {'nmb':'CHS_168.3_10.0', 'D':168.3e-3, 't':10.0e-3, 'P':39.0, 'A':49.7e-4, 'Iz':1560e-8, 'iz':5.61e-2, 'Wzel':186e-6, 'Wzpl':251e-6, 'Iy':1560e-8, 'iy':5.61e-2, 'Wyel':186e-6, 'Wypl':251e-6, 'It':3130e-8, 'C':372e-6, 'AL':0.529, 'AG':13.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_168.3_11.0']= {'nmb':'CHS_168.3_11.0', 'D':168.3e-3, 't':11.0e-3, 'P':42.7, 'A':54.4e-4, 'Iz':1690e-8, 'iz':5.57e-2, 'Wzel':201e-6, 'Wzpl':273e-6, 'Iy':1690e-8, 'iy':5.57e-2, 'Wyel':201e-6, 'Wypl':273e-6, 'It':3380e-8, 'C':402e-6, 'AL':0.529, 'AG':12.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_168.3_12.5']= {'nmb':'CHS_168.3_12.5', 'D':168.3e-3, 't':12.5e-3, 'P':48.0, 'A':61.2e-4, 'Iz':1870e-8, 'iz':5.53e-2, 'Wzel':222e-6, 'Wzpl':304e-6, 'Iy':1870e-8, 'iy':5.53e-2, 'Wyel':222e-6, 'Wypl':304e-6, 'It':3740e-8, 'C':444e-6, 'AL':0.529, 'AG':11.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_5.0']= {'nmb':'CHS_193.7_5.0', 'D':193.7e-3, 't':5.0e-3, 'P':23.3, 'A':29.6e-4, 'Iz':1320e-8, 'iz':6.67e-2, 'Wzel':136e-6, 'Wzpl':178e-6, 'Iy':1320e-8, 'iy':6.67e-2, 'Wyel':136e-6, 'Wypl':178e-6, 'It':2640e-8, 'C':273e-6, 'AL':0.609, 'AG':26.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_5.6']= {'nmb':'CHS_193.7_5.6', 'D':193.7e-3, 't':5.6e-3, 'P':26.0, 'A':33.1e-4, 'Iz':1460e-8, 'iz':6.65e-2, 'Wzel':151e-6, 'Wzpl':198e-6, 'Iy':1460e-8, 'iy':6.65e-2, 'Wyel':151e-6, 'Wypl':198e-6, 'It':2930e-8, 'C':303e-6, 'AL':0.609, 'AG':23.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_6.3']= {'nmb':'CHS_193.7_6.3', 'D':193.7e-3, 't':6.3e-3, 'P':29.1, 'A':37.1e-4, 'Iz':1630e-8, 'iz':6.63e-2, 'Wzel':168e-6, 'Wzpl':221e-6, 'Iy':1630e-8, 'iy':6.63e-2, 'Wyel':168e-6, 'Wypl':221e-6, 'It':3260e-8, 'C':337e-6, 'AL':0.609, 'AG':20.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_7.1']= {'nmb':'CHS_193.7_7.1', 'D':193.7e-3, 't':7.1e-3, 'P':32.7, 'A':41.6e-4, 'Iz':1810e-8, 'iz':6.60e-2, 'Wzel':187e-6, 'Wzpl':247e-6, 'Iy':1810e-8, 'iy':6.60e-2, 'Wyel':187e-6, 'Wypl':247e-6, 'It':3630e-8, 'C':375e-6, 'AL':0.609, 'AG':18.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_8.0']= {'nmb':'CHS_193.7_8.0', 'D':193.7e-3, 't':8.0e-3, 'P':36.6, 'A':46.7e-4, 'Iz':2020e-8, 'iz':6.57e-2, 'Wzel':208e-6, 'Wzpl':276e-6, 'Iy':2020e-8, 'iy':6.57e-2, 'Wyel':208e-6, 'Wypl':276e-6, 'It':4030e-8, 'C':416e-6, 'AL':0.609, 'AG':16.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_10.0']= {'nmb':'CHS_193.7_10.0', 'D':193.7e-3, 't':10.0e-3, 'P':45.3, 'A':57.7e-4, 'Iz':2440e-8, 'iz':6.50e-2, 'Wzel':252e-6, 'Wzpl':338e-6, 'Iy':2440e-8, 'iy':6.50e-2, 'Wyel':252e-6, 'Wypl':338e-6, 'It':4880e-8, 'C':504e-6, 'AL':0.609, 'AG':13.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_11.0']= {'nmb':'CHS_193.7_11.0', 'D':193.7e-3, 't':11.0e-3, 'P':49.6, 'A':63.1e-4, 'Iz':2640e-8, 'iz':6.47e-2, 'Wzel':273e-6, 'Wzpl':368e-6, 'Iy':2640e-8, 'iy':6.47e-2, 'Wyel':273e-6, 'Wypl':368e-6, 'It':5290e-8, 'C':546e-6, 'AL':0.609, 'AG':12.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_12.5']= {'nmb':'CHS_193.7_12.5', 'D':193.7e-3, 't':12.5e-3, 'P':55.9, 'A':71.2e-4, 'Iz':2930e-8, 'iz':6.42e-2, 'Wzel':303e-6, 'Wzpl':411e-6, 'Iy':2930e-8, 'iy':6.42e-2, 'Wyel':303e-6, 'Wypl':411e-6, 'It':5870e-8, 'C':606e-6, 'AL':0.609, 'AG':10.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_14.2']= {'nmb':'CHS_193.7_14.2', 'D':193.7e-3, 't':14.2e-3, 'P':62.9, 'A':80.1e-4, 'Iz':3240e-8, 'iz':6.37e-2, 'Wzel':335e-6, 'Wzpl':458e-6, 'Iy':3240e-8, 'iy':6.37e-2, 'Wyel':335e-6, 'Wypl':458e-6, 'It':6490e-8, 'C':670e-6, 'AL':0.609, 'AG':9.68, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_193.7_16.0']= {'nmb':'CHS_193.7_16.0', 'D':193.7e-3, 't':16.0e-3, 'P':70.1, 'A':89.3e-4, 'Iz':3550e-8, 'iz':6.31e-2, 'Wzel':367e-6, 'Wzpl':507e-6, 'Iy':3550e-8, 'iy':6.31e-2, 'Wyel':367e-6, 'Wypl':507e-6, 'It':7110e-8, 'C':734e-6, 'AL':0.609, 'AG':8.69, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_4.5']= {'nmb':'CHS_219.1_4.5', 'D':219.1e-3, 't':4.5e-3, 'P':23.8, 'A':30.3e-4, 'Iz':1750e-8, 'iz':7.59e-2, 'Wzel':159e-6, 'Wzpl':207e-6, 'Iy':1750e-8, 'iy':7.59e-2, 'Wyel':159e-6, 'Wypl':207e-6, 'It':3490e-8, 'C':319e-6, 'AL':0.688, 'AG':28.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_5.0']= {'nmb':'CHS_219.1_5.0', 'D':219.1e-3, 't':5.0e-3, 'P':26.4, 'A':33.6e-4, 'Iz':1930e-8, 'iz':7.57e-2, 'Wzel':176e-6, 'Wzpl':229e-6, 'Iy':1930e-8, 'iy':7.57e-2, 'Wyel':176e-6, 'Wypl':229e-6, 'It':3860e-8, 'C':352e-6, 'AL':0.688, 'AG':26.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_5.6']= {'nmb':'CHS_219.1_5.6', 'D':219.1e-3, 't':5.6e-3, 'P':29.5, 'A':37.6e-4, 'Iz':2140e-8, 'iz':7.55e-2, 'Wzel':195e-6, 'Wzpl':255e-6, 'Iy':2140e-8, 'iy':7.55e-2, 'Wyel':195e-6, 'Wypl':255e-6, 'It':4280e-8, 'C':391e-6, 'AL':0.688, 'AG':23.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_6.3']= {'nmb':'CHS_219.1_6.3', 'D':219.1e-3, 't':6.3e-3, 'P':33.1, 'A':42.1e-4, 'Iz':2390e-8, 'iz':7.53e-2, 'Wzel':218e-6, 'Wzpl':285e-6, 'Iy':2390e-8, 'iy':7.53e-2, 'Wyel':218e-6, 'Wypl':285e-6, 'It':4770e-8, 'C':436e-6, 'AL':0.688, 'AG':20.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_7.1']= {'nmb':'CHS_219.1_7.1', 'D':219.1e-3, 't':7.1e-3, 'P':37.1, 'A':47.3e-4, 'Iz':2660e-8, 'iz':7.50e-2, 'Wzel':243e-6, 'Wzpl':319e-6, 'Iy':2660e-8, 'iy':7.50e-2, 'Wyel':243e-6, 'Wypl':319e-6, 'It':5320e-8, 'C':486e-6, 'AL':0.688, 'AG':18.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_8.0']= {'nmb':'CHS_219.1_8.0', 'D':219.1e-3, 't':8.0e-3, 'P':41.6, 'A':53.1e-4, 'Iz':2960e-8, 'iz':7.47e-2, 'Wzel':270e-6, 'Wzpl':357e-6, 'Iy':2960e-8, 'iy':7.47e-2, 'Wyel':270e-6, 'Wypl':357e-6, 'It':5920e-8, 'C':540e-6, 'AL':0.688, 'AG':16.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_10.0']= {'nmb':'CHS_219.1_10.0', 'D':219.1e-3, 't':10.0e-3, 'P':51.6, 'A':65.7e-4, 'Iz':3600e-8, 'iz':7.40e-2, 'Wzel':328e-6, 'Wzpl':438e-6, 'Iy':3600e-8, 'iy':7.40e-2, 'Wyel':328e-6, 'Wypl':438e-6, 'It':7200e-8, 'C':657e-6, 'AL':0.688, 'AG':13.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_11.0']= {'nmb':'CHS_219.1_11.0', 'D':219.1e-3, 't':11.0e-3, 'P':56.5, 'A':71.9e-4, 'Iz':3900e-8, 'iz':7.37e-2, 'Wzel':356e-6, 'Wzpl':477e-6, 'Iy':3900e-8, 'iy':7.37e-2, 'Wyel':356e-6, 'Wypl':477e-6, 'It':7810e-8, 'C':713e-6, 'AL':0.688, 'AG':12.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_12.5']= {'nmb':'CHS_219.1_12.5', 'D':219.1e-3, 't':12.5e-3, 'P':63.7, 'A':81.1e-4, 'Iz':4340e-8, 'iz':7.32e-2, 'Wzel':397e-6, 'Wzpl':534e-6, 'Iy':4340e-8, 'iy':7.32e-2, 'Wyel':397e-6, 'Wypl':534e-6, 'It':8690e-8, 'C':793e-6, 'AL':0.688, 'AG':10.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_14.2']= {'nmb':'CHS_219.1_14.2', 'D':219.1e-3, 't':14.2e-3, 'P':71.8, 'A':91.4e-4, 'Iz':4820e-8, 'iz':7.26e-2, 'Wzel':440e-6, 'Wzpl':597e-6, 'Iy':4820e-8, 'iy':7.26e-2, 'Wyel':440e-6, 'Wypl':597e-6, 'It':9640e-8, 'C':880e-6, 'AL':0.688, 'AG':9.58, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_219.1_16.0']= {'nmb':'CHS_219.1_16.0', 'D':219.1e-3, 't':16.0e-3, 'P':80.1, 'A':102e-4, 'Iz':5300e-8, 'iz':7.20e-2, 'Wzel':483e-6, 'Wzpl':661e-6, 'Iy':5300e-8, 'iy':7.20e-2, 'Wyel':483e-6, 'Wypl':661e-6, 'It':10600e-8, 'C':967e-6, 'AL':0.688, 'AG':8.59, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_5.0']= {'nmb':'CHS_244.5_5.0', 'D':244.5e-3, 't':5.0e-3, 'P':29.5, 'A':37.6e-4, 'Iz':2700e-8, 'iz':8.47e-2, 'Wzel':221e-6, 'Wzpl':287e-6, 'Iy':2700e-8, 'iy':8.47e-2, 'Wyel':221e-6, 'Wypl':287e-6, 'It':5400e-8, 'C':441e-6, 'AL':0.768, 'AG':26.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_5.6']= {'nmb':'CHS_244.5_5.6', 'D':244.5e-3, 't':5.6e-3, 'P':33.0, 'A':42.0e-4, 'Iz':3000e-8, 'iz':8.45e-2, 'Wzel':245e-6, 'Wzpl':320e-6, 'Iy':3000e-8, 'iy':8.45e-2, 'Wyel':245e-6, 'Wypl':320e-6, 'It':6000e-8, 'C':491e-6, 'AL':0.768, 'AG':23.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_6.3']= {'nmb':'CHS_244.5_6.3', 'D':244.5e-3, 't':6.3e-3, 'P':37.0, 'A':47.1e-4, 'Iz':3350e-8, 'iz':8.42e-2, 'Wzel':274e-6, 'Wzpl':358e-6, 'Iy':3350e-8, 'iy':8.42e-2, 'Wyel':274e-6, 'Wypl':358e-6, 'It':6690e-8, 'C':547e-6, 'AL':0.768, 'AG':20.8, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_7.1']= {'nmb':'CHS_244.5_7.1', 'D':244.5e-3, 't':7.1e-3, 'P':41.6, 'A':53.0e-4, 'Iz':3730e-8, 'iz':8.40e-2, 'Wzel':305e-6, 'Wzpl':400e-6, 'Iy':3730e-8, 'iy':8.40e-2, 'Wyel':305e-6, 'Wypl':400e-6, 'It':7470e-8, 'C':611e-6, 'AL':0.768, 'AG':18.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_8.0']= {'nmb':'CHS_244.5_8.0', 'D':244.5e-3, 't':8.0e-3, 'P':46.7, 'A':59.4e-4, 'Iz':4160e-8, 'iz':8.37e-2, 'Wzel':340e-6, 'Wzpl':448e-6, 'Iy':4160e-8, 'iy':8.37e-2, 'Wyel':340e-6, 'Wypl':448e-6, 'It':8320e-8, 'C':681e-6, 'AL':0.768, 'AG':16.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_10.0']= {'nmb':'CHS_244.5_10.0', 'D':244.5e-3, 't':10.0e-3, 'P':57.8, 'A':73.7e-4, 'Iz':5070e-8, 'iz':8.30e-2, 'Wzel':415e-6, 'Wzpl':550e-6, 'Iy':5070e-8, 'iy':8.30e-2, 'Wyel':415e-6, 'Wypl':550e-6, 'It':10100e-8, 'C':830e-6, 'AL':0.768, 'AG':13.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_11.0']= {'nmb':'CHS_244.5_11.0', 'D':244.5e-3, 't':11.0e-3, 'P':63.3, 'A':80.7e-4, 'Iz':5510e-8, 'iz':8.26e-2, 'Wzel':451e-6, 'Wzpl':600e-6, 'Iy':5510e-8, 'iy':8.26e-2, 'Wyel':451e-6, 'Wypl':600e-6, 'It':11000e-8, 'C':902e-6, 'AL':0.768, 'AG':12.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_12.5']= {'nmb':'CHS_244.5_12.5', 'D':244.5e-3, 't':12.5e-3, 'P':71.5, 'A':91.1e-4, 'Iz':6150e-8, 'iz':8.21e-2, 'Wzel':503e-6, 'Wzpl':673e-6, 'Iy':6150e-8, 'iy':8.21e-2, 'Wyel':503e-6, 'Wypl':673e-6, 'It':12300e-8, 'C':1010e-6, 'AL':0.768, 'AG':10.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_14.2']= {'nmb':'CHS_244.5_14.2', 'D':244.5e-3, 't':14.2e-3, 'P':80.6, 'A':103e-4, 'Iz':6840e-8, 'iz':8.16e-2, 'Wzel':559e-6, 'Wzpl':754e-6, 'Iy':6840e-8, 'iy':8.16e-2, 'Wyel':559e-6, 'Wypl':754e-6, 'It':13700e-8, 'C':1120e-6, 'AL':0.768, 'AG':9.53, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_244.5_16.0']= {'nmb':'CHS_244.5_16.0', 'D':244.5e-3, 't':16.0e-3, 'P':90.2, 'A':115e-4, 'Iz':7530e-8, 'iz':8.10e-2, 'Wzel':616e-6, 'Wzpl':837e-6, 'Iy':7530e-8, 'iy':8.10e-2, 'Wyel':616e-6, 'Wypl':837e-6, 'It':15100e-8, 'C':1230e-6, 'AL':0.768, 'AG':8.51, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_5.0']= {'nmb':'CHS_273.0_5.0', 'D':273.0e-3, 't':5.0e-3, 'P':33.0, 'A':42.1e-4, 'Iz':3780e-8, 'iz':9.48e-2, 'Wzel':277e-6, 'Wzpl':359e-6, 'Iy':3780e-8, 'iy':9.48e-2, 'Wyel':277e-6, 'Wypl':359e-6, 'It':7560e-8, 'C':554e-6, 'AL':0.858, 'AG':26.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_5.6']= {'nmb':'CHS_273.0_5.6', 'D':273.0e-3, 't':5.6e-3, 'P':36.9, 'A':47.0e-4, 'Iz':4210e-8, 'iz':9.46e-2, 'Wzel':308e-6, 'Wzpl':400e-6, 'Iy':4210e-8, 'iy':9.46e-2, 'Wyel':308e-6, 'Wypl':400e-6, 'It':8410e-8, 'C':616e-6, 'AL':0.858, 'AG':23.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_6.3']= {'nmb':'CHS_273.0_6.3', 'D':273.0e-3, 't':6.3e-3, 'P':41.4, 'A':52.8e-4, 'Iz':4700e-8, 'iz':9.43e-2, 'Wzel':344e-6, 'Wzpl':448e-6, 'Iy':4700e-8, 'iy':9.43e-2, 'Wyel':344e-6, 'Wypl':448e-6, 'It':9390e-8, 'C':688e-6, 'AL':0.858, 'AG':20.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_7.1']= {'nmb':'CHS_273.0_7.1', 'D':273.0e-3, 't':7.1e-3, 'P':46.6, 'A':59.3e-4, 'Iz':5240e-8, 'iz':9.40e-2, 'Wzel':384e-6, 'Wzpl':502e-6, 'Iy':5240e-8, 'iy':9.40e-2, 'Wyel':384e-6, 'Wypl':502e-6, 'It':10500e-8, 'C':769e-6, 'AL':0.858, 'AG':18.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_8.0']= {'nmb':'CHS_273.0_8.0', 'D':273.0e-3, 't':8.0e-3, 'P':52.3, 'A':66.6e-4, 'Iz':5850e-8, 'iz':9.37e-2, 'Wzel':429e-6, 'Wzpl':562e-6, 'Iy':5850e-8, 'iy':9.37e-2, 'Wyel':429e-6, 'Wypl':562e-6, 'It':11700e-8, 'C':857e-6, 'AL':0.858, 'AG':16.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_10.0']= {'nmb':'CHS_273.0_10.0', 'D':273.0e-3, 't':10.0e-3, 'P':64.9, 'A':82.6e-4, 'Iz':7150e-8, 'iz':9.31e-2, 'Wzel':524e-6, 'Wzpl':692e-6, 'Iy':7150e-8, 'iy':9.31e-2, 'Wyel':524e-6, 'Wypl':692e-6, 'It':14300e-8, 'C':1050e-6, 'AL':0.858, 'AG':13.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_11.0']= {'nmb':'CHS_273.0_11.0', 'D':273.0e-3, 't':11.0e-3, 'P':71.1, 'A':90.5e-4, 'Iz':7780e-8, 'iz':9.27e-2, 'Wzel':570e-6, 'Wzpl':756e-6, 'Iy':7780e-8, 'iy':9.27e-2, 'Wyel':570e-6, 'Wypl':756e-6, 'It':15600e-8, 'C':1140e-6, 'AL':0.858, 'AG':12.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_12.5']= {'nmb':'CHS_273.0_12.5', 'D':273.0e-3, 't':12.5e-3, 'P':80.3, 'A':102e-4, 'Iz':8700e-8, 'iz':9.22e-2, 'Wzel':637e-6, 'Wzpl':849e-6, 'Iy':8700e-8, 'iy':9.22e-2, 'Wyel':637e-6, 'Wypl':849e-6, 'It':17400e-8, 'C':1270e-6, 'AL':0.858, 'AG':10.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_14.2']= {'nmb':'CHS_273.0_14.2', 'D':273.0e-3, 't':14.2e-3, 'P':90.6, 'A':115e-4, 'Iz':9700e-8, 'iz':9.16e-2, 'Wzel':710e-6, 'Wzpl':952e-6, 'Iy':9700e-8, 'iy':9.16e-2, 'Wyel':710e-6, 'Wypl':952e-6, 'It':19400e-8, 'C':1420e-6, 'AL':0.858, 'AG':9.47, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_273.0_16.0']= {'nmb':'CHS_273.0_16.0', 'D':273.0e-3, 't':16.0e-3, 'P':101, 'A':129e-4, 'Iz':10700e-8, 'iz':9.10e-2, 'Wzel':784e-6, 'Wzpl':1060e-6, 'Iy':10700e-8, 'iy':9.10e-2, 'Wyel':784e-6, 'Wypl':1060e-6, 'It':21400e-8, 'C':1570e-6, 'AL':0.858, 'AG':8.50, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_5.0']= {'nmb':'CHS_323.9_5.0', 'D':323.9e-3, 't':5.0e-3, 'P':39.3, 'A':50.1e-4, 'Iz':6370e-8, 'iz':11.3e-2, 'Wzel':393e-6, 'Wzpl':509e-6, 'Iy':6370e-8, 'iy':11.3e-2, 'Wyel':393e-6, 'Wypl':509e-6, 'It':12700e-8, 'C':787e-6, 'AL':1.02, 'AG':26.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_5.6']= {'nmb':'CHS_323.9_5.6', 'D':323.9e-3, 't':5.6e-3, 'P':44.0, 'A':56.0e-4, 'Iz':7090e-8, 'iz':11.3e-2, 'Wzel':438e-6, 'Wzpl':567e-6, 'Iy':7090e-8, 'iy':11.3e-2, 'Wyel':438e-6, 'Wypl':567e-6, 'It':14200e-8, 'C':876e-6, 'AL':1.02, 'AG':23.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_6.3']= {'nmb':'CHS_323.9_6.3', 'D':323.9e-3, 't':6.3e-3, 'P':49.3, 'A':62.9e-4, 'Iz':7930e-8, 'iz':11.2e-2, 'Wzel':490e-6, 'Wzpl':636e-6, 'Iy':7930e-8, 'iy':11.2e-2, 'Wyel':490e-6, 'Wypl':636e-6, 'It':15900e-8, 'C':979e-6, 'AL':1.02, 'AG':20.7, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_7.1']= {'nmb':'CHS_323.9_7.1', 'D':323.9e-3, 't':7.1e-3, 'P':55.5, 'A':70.7e-4, 'Iz':8870e-8, 'iz':11.2e-2, 'Wzel':548e-6, 'Wzpl':713e-6, 'Iy':8870e-8, 'iy':11.2e-2, 'Wyel':548e-6, 'Wypl':713e-6, 'It':17700e-8, 'C':1100e-6, 'AL':1.02, 'AG':18.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_8.0']= {'nmb':'CHS_323.9_8.0', 'D':323.9e-3, 't':8.0e-3, 'P':62.3, 'A':79.4e-4, 'Iz':9910e-8, 'iz':11.2e-2, 'Wzel':612e-6, 'Wzpl':799e-6, 'Iy':9910e-8, 'iy':11.2e-2, 'Wyel':612e-6, 'Wypl':799e-6, 'It':19800e-8, 'C':1220e-6, 'AL':1.02, 'AG':16.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_10.0']= {'nmb':'CHS_323.9_10.0', 'D':323.9e-3, 't':10.0e-3, 'P':77.4, 'A':98.6e-4, 'Iz':12200e-8, 'iz':11.1e-2, 'Wzel':751e-6, 'Wzpl':986e-6, 'Iy':12200e-8, 'iy':11.1e-2, 'Wyel':751e-6, 'Wypl':986e-6, 'It':24300e-8, 'C':1500e-6, 'AL':1.02, 'AG':13.2, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_11.0']= {'nmb':'CHS_323.9_11.0', 'D':323.9e-3, 't':11.0e-3, 'P':84.9, 'A':108e-4, 'Iz':13200e-8, 'iz':11.1e-2, 'Wzel':818e-6, 'Wzpl':1080e-6, 'Iy':13200e-8, 'iy':11.1e-2, 'Wyel':818e-6, 'Wypl':1080e-6, 'It':26500e-8, 'C':1640e-6, 'AL':1.02, 'AG':12.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_12.5']= {'nmb':'CHS_323.9_12.5', 'D':323.9e-3, 't':12.5e-3, 'P':96.0, 'A':122e-4, 'Iz':14800e-8, 'iz':11.0e-2, 'Wzel':917e-6, 'Wzpl':1210e-6, 'Iy':14800e-8, 'iy':11.0e-2, 'Wyel':917e-6, 'Wypl':1210e-6, 'It':29700e-8, 'C':1830e-6, 'AL':1.02, 'AG':10.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_14.2']= {'nmb':'CHS_323.9_14.2', 'D':323.9e-3, 't':14.2e-3, 'P':108, 'A':138e-4, 'Iz':16600e-8, 'iz':11.0e-2, 'Wzel':1020e-6, 'Wzpl':1360e-6, 'Iy':16600e-8, 'iy':11.0e-2, 'Wyel':1020e-6, 'Wypl':1360e-6, 'It':33200e-8, 'C':2050e-6, 'AL':1.02, 'AG':9.44, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_323.9_16.0']= {'nmb':'CHS_323.9_16.0', 'D':323.9e-3, 't':16.0e-3, 'P':121, 'A':155e-4, 'Iz':18400e-8, 'iz':10.9e-2, 'Wzel':1140e-6, 'Wzpl':1520e-6, 'Iy':18400e-8, 'iy':10.9e-2, 'Wyel':1140e-6, 'Wypl':1520e-6, 'It':36800e-8, 'C':2270e-6, 'AL':1.02, 'AG':8.43, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_355.6_6.3']= {'nmb':'CHS_355.6_6.3', 'D':355.6e-3, 't':6.3e-3, 'P':54.3, 'A':69.1e-4, 'Iz':10500e-8, 'iz':12.4e-2, 'Wzel':593e-6, 'Wzpl':769e-6, 'Iy':10500e-8, 'iy':12.4e-2, 'Wyel':593e-6, 'Wypl':769e-6, 'It':21100e-8, 'C':1190e-6, 'AL':1.12, 'AG':20.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_355.6_7.1']= {'nmb':'CHS_355.6_7.1', 'D':355.6e-3, 't':7.1e-3, 'P':61.0, 'A':77.7e-4, 'Iz':11800e-8, 'iz':12.3e-2, 'Wzel':664e-6, 'Wzpl':862e-6, 'Iy':11800e-8, 'iy':12.3e-2, 'Wyel':664e-6, 'Wypl':862e-6, 'It':23600e-8, 'C':1330e-6, 'AL':1.12, 'AG':18.4, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_355.6_8.0']= {'nmb':'CHS_355.6_8.0', 'D':355.6e-3, 't':8.0e-3, 'P':68.6, 'A':87.4e-4, 'Iz':13200e-8, 'iz':12.3e-2, 'Wzel':742e-6, 'Wzpl':967e-6, 'Iy':13200e-8, 'iy':12.3e-2, 'Wyel':742e-6, 'Wypl':967e-6, 'It':26400e-8, 'C':1480e-6, 'AL':1.12, 'AG':16.3, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_355.6_10.0']= {'nmb':'CHS_355.6_10.0', 'D':355.6e-3, 't':10.0e-3, 'P':85.2, 'A':109e-4, 'Iz':16200e-8, 'iz':12.2e-2, 'Wzel':912e-6, 'Wzpl':1200e-6, 'Iy':16200e-8, 'iy':12.2e-2, 'Wyel':912e-6, 'Wypl':1200e-6, 'It':32400e-8, 'C':1820e-6, 'AL':1.12, 'AG':13.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_355.6_11.0']= {'nmb':'CHS_355.6_11.0', 'D':355.6e-3, 't':11.0e-3, 'P':93.5, 'A':119e-4, 'Iz':17700e-8, 'iz':12.2e-2, 'Wzel':995e-6, 'Wzpl':1310e-6, 'Iy':17700e-8, 'iy':12.2e-2, 'Wyel':995e-6, 'Wypl':1310e-6, 'It':35400e-8, 'C':1990e-6, 'AL':1.12, 'AG':12.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_355.6_12.5']= {'nmb':'CHS_355.6_12.5', 'D':355.6e-3, 't':12.5e-3, 'P':106, 'A':135e-4, 'Iz':19900e-8, 'iz':12.1e-2, 'Wzel':1120e-6, 'Wzpl':1470e-6, 'Iy':19900e-8, 'iy':12.1e-2, 'Wyel':1120e-6, 'Wypl':1470e-6, 'It':39700e-8, 'C':2230e-6, 'AL':1.12, 'AG':10.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_355.6_14.2']= {'nmb':'CHS_355.6_14.2', 'D':355.6e-3, 't':14.2e-3, 'P':120, 'A':152e-4, 'Iz':22200e-8, 'iz':12.1e-2, 'Wzel':1250e-6, 'Wzpl':1660e-6, 'Iy':22200e-8, 'iy':12.1e-2, 'Wyel':1250e-6, 'Wypl':1660e-6, 'It':44500e-8, 'C':2500e-6, 'AL':1.12, 'AG':9.33, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_355.6_16.0']= {'nmb':'CHS_355.6_16.0', 'D':355.6e-3, 't':16.0e-3, 'P':134, 'A':171e-4, 'Iz':24700e-8, 'iz':12.0e-2, 'Wzel':1390e-6, 'Wzpl':1850e-6, 'Iy':24700e-8, 'iy':12.0e-2, 'Wyel':1390e-6, 'Wypl':1850e-6, 'It':49300e-8, 'C':2770e-6, 'AL':1.12, 'AG':8.36, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_406.4_10.0']= {'nmb':'CHS_406.4_10.0', 'D':406.4e-3, 't':10.0e-3, 'P':97.8, 'A':125e-4, 'Iz':24500e-8, 'iz':14.0e-2, 'Wzel':1200e-6, 'Wzpl':1570e-6, 'Iy':24500e-8, 'iy':14.0e-2, 'Wyel':1200e-6, 'Wypl':1570e-6, 'It':49000e-8, 'C':2410e-6, 'AL':1.28, 'AG':13.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_406.4_11.0']= {'nmb':'CHS_406.4_11.0', 'D':406.4e-3, 't':11.0e-3, 'P':107, 'A':137e-4, 'Iz':26700e-8, 'iz':14.0e-2, 'Wzel':1320e-6, 'Wzpl':1720e-6, 'Iy':26700e-8, 'iy':14.0e-2, 'Wyel':1320e-6, 'Wypl':1720e-6, 'It':53400e-8, 'C':2630e-6, 'AL':1.28, 'AG':12.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_406.4_12.5']= {'nmb':'CHS_406.4_12.5', 'D':406.4e-3, 't':12.5e-3, 'P':121, 'A':155e-4, 'Iz':30000e-8, 'iz':13.9e-2, 'Wzel':1480e-6, 'Wzpl':1940e-6, 'Iy':30000e-8, 'iy':13.9e-2, 'Wyel':1480e-6, 'Wypl':1940e-6, 'It':60100e-8, 'C':2960e-6, 'AL':1.28, 'AG':10.6, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_406.4_14.2']= {'nmb':'CHS_406.4_14.2', 'D':406.4e-3, 't':14.2e-3, 'P':137, 'A':175e-4, 'Iz':33700e-8, 'iz':13.9e-2, 'Wzel':1660e-6, 'Wzpl':2180e-6, 'Iy':33700e-8, 'iy':13.9e-2, 'Wyel':1660e-6, 'Wypl':2180e-6, 'It':67400e-8, 'C':3320e-6, 'AL':1.28, 'AG':9.34, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_406.4_16.0']= {'nmb':'CHS_406.4_16.0', 'D':406.4e-3, 't':16.0e-3, 'P':154, 'A':196e-4, 'Iz':37400e-8, 'iz':13.8e-2, 'Wzel':1840e-6, 'Wzpl':2440e-6, 'Iy':37400e-8, 'iy':13.8e-2, 'Wyel':1840e-6, 'Wypl':2440e-6, 'It':74900e-8, 'C':3690e-6, 'AL':1.28, 'AG':8.31, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_457.0_10.0']= {'nmb':'CHS_457.0_10.0', 'D':457.0e-3, 't':10.0e-3, 'P':110, 'A':140e-4, 'Iz':35100e-8, 'iz':15.8e-2, 'Wzel':1540e-6, 'Wzpl':2000e-6, 'Iy':35100e-8, 'iy':15.8e-2, 'Wyel':1540e-6, 'Wypl':2000e-6, 'It':70200e-8, 'C':3070e-6, 'AL':1.44, 'AG':13.1, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_457.0_11.0']= {'nmb':'CHS_457.0_11.0', 'D':457.0e-3, 't':11.0e-3, 'P':121, 'A':154e-4, 'Iz':38300e-8, 'iz':15.8e-2, 'Wzel':1680e-6, 'Wzpl':2190e-6, 'Iy':38300e-8, 'iy':15.8e-2, 'Wyel':1680e-6, 'Wypl':2190e-6, 'It':76700e-8, 'C':3360e-6, 'AL':1.44, 'AG':11.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_457.0_12.5']= {'nmb':'CHS_457.0_12.5', 'D':457.0e-3, 't':12.5e-3, 'P':137, 'A':175e-4, 'Iz':43100e-8, 'iz':15.7e-2, 'Wzel':1890e-6, 'Wzpl':2470e-6, 'Iy':43100e-8, 'iy':15.7e-2, 'Wyel':1890e-6, 'Wypl':2470e-6, 'It':86300e-8, 'C':3780e-6, 'AL':1.44, 'AG':10.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_457.0_14.2']= {'nmb':'CHS_457.0_14.2', 'D':457.0e-3, 't':14.2e-3, 'P':155, 'A':198e-4, 'Iz':48500e-8, 'iz':15.7e-2, 'Wzel':2120e-6, 'Wzpl':2780e-6, 'Iy':48500e-8, 'iy':15.7e-2, 'Wyel':2120e-6, 'Wypl':2780e-6, 'It':96900e-8, 'C':4240e-6, 'AL':1.44, 'AG':9.29, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_457.0_16.0']= {'nmb':'CHS_457.0_16.0', 'D':457.0e-3, 't':16.0e-3, 'P':174, 'A':222e-4, 'Iz':54000e-8, 'iz':15.6e-2, 'Wzel':2360e-6, 'Wzpl':3110e-6, 'Iy':54000e-8, 'iy':15.6e-2, 'Wyel':2360e-6, 'Wypl':3110e-6, 'It':108000e-8, 'C':4720e-6, 'AL':1.44, 'AG':8.28, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_508.0_10.0']= {'nmb':'CHS_508.0_10.0', 'D':508.0e-3, 't':10.0e-3, 'P':123, 'A':156e-4, 'Iz':48500e-8, 'iz':17.6e-2, 'Wzel':1910e-6, 'Wzpl':2480e-6, 'Iy':48500e-8, 'iy':17.6e-2, 'Wyel':1910e-6, 'Wypl':2480e-6, 'It':97000e-8, 'C':3820e-6, 'AL':1.60, 'AG':13.0, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_508.0_11.0']= {'nmb':'CHS_508.0_11.0', 'D':508.0e-3, 't':11.0e-3, 'P':135, 'A':172e-4, 'Iz':53100e-8, 'iz':17.6e-2, 'Wzel':2090e-6, 'Wzpl':2720e-6, 'Iy':53100e-8, 'iy':17.6e-2, 'Wyel':2090e-6, 'Wypl':2720e-6, 'It':106000e-8, 'C':4180e-6, 'AL':1.60, 'AG':11.9, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_508.0_12.5']= {'nmb':'CHS_508.0_12.5', 'D':508.0e-3, 't':12.5e-3, 'P':153, 'A':195e-4, 'Iz':59800e-8, 'iz':17.5e-2, 'Wzel':2350e-6, 'Wzpl':3070e-6, 'Iy':59800e-8, 'iy':17.5e-2, 'Wyel':2350e-6, 'Wypl':3070e-6, 'It':120000e-8, 'C':4700e-6, 'AL':1.60, 'AG':10.5, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_508.0_14.2']= {'nmb':'CHS_508.0_14.2', 'D':508.0e-3, 't':14.2e-3, 'P':173, 'A':220e-4, 'Iz':67200e-8, 'iz':17.5e-2, 'Wzel':2650e-6, 'Wzpl':3460e-6, 'Iy':67200e-8, 'iy':17.5e-2, 'Wyel':2650e-6, 'Wypl':3460e-6, 'It':134000e-8, 'C':5290e-6, 'AL':1.60, 'AG':9.25, 'E': 210000e6, 'nu': 0.3 }
-CHS['CHS_508.0_16.0']= {'nmb':'CHS_508.0_16.0', 'D':508.0e-3, 't':16.0e-3, 'P':194, 'A':247e-4, 'Iz':74900e-8, 'iz':17.4e-2, 'Wzel':2950e-6, 'Wzpl':3870e-6, 'Iy':74900e-8, 'iy':17.4e-2, 'Wyel':2950e-6, 'Wypl':3870e-6, 'It':150000e-8, 'C':5900e-6, 'AL':1.60, 'AG':8.25, 'E': 210000e6, 'nu': 0.3 }
-
-for item in CHS:
-    shape= CHS[item]
+
+def setCHSDerivedValues(shape):
+    '''Compute the properties of the CHS shapes that are not in the table.'''
     A= shape['A']
     E= shape['E']
     nu= shape['nu']
@@ -1156,79 +367,14 @@ for item in CHS:
     shape['G']= E/(2*(1+nu))
     shape['AreaQy']= 0.5*A
     shape['AreaQz']= 0.5*A
+
+CHS= shape_table.ShapeTable('arcelor_CHS',setCHSDerivedValues)
   
 # ARCELOR's hot rolled round steel bars.
 
-R={}
-
-R['R10']= {'nmb': "R10", 'd': 10e-3, 'r': 5e-3, 'P': 0.617, 'A': 0.785e-4, 'E': 210000e6, 'nu': 0.3}
-R['R12']= {'nmb': "R12", 'd': 12e-3, 'r': 6e-3, 'P': 0.888, 'A': 1.13e-4, 'E': 210000e6, 'nu': 0.3}
-R['R14']= {'nmb': "R14", 'd': 14e-3, 'r': 7e-3, 'P': 1.21, 'A': 1.54e-4, 'E': 210000e6, 'nu': 0.3}
-R['R16']= {'nmb': "R16", 'd': 16e-3, 'r': 8e-3, 'P': 1.58, 'A': 2.01e-4, 'E': 210000e6, 'nu': 0.3}
-R['R18']= {'nmb': "R18", 'd': 18e-3, 'r': 9e-3, 'P': 2, 'A': 2.54e-4, 'E': 210000e6, 'nu': 0.3}
-R['R20']= {'nmb': "R20", 'd': 20e-3, 'r': 10e-3, 'P': 2.47, 'A': 3.14e-4, 'E': 210000e6, 'nu': 0.3}
-R['R22']= {'nmb': "R22", 'd': 22e-3, 'r': 11e-3, 'P': 2.98, 'A': 3.8e-4, 'E': 210000e6, 'nu': 0.3}
-R['R22_25']= {'nmb': "R22_25", 'd': 22.25e-3, 'r': 11.125e-3, 'P': 3.05, 'A': 3.89e-4, 'E': 210000e6, 'nu': 0.3}
-R['R23_6']= {'nmb': "R23_6", 'd': 23.6e-3, 'r': 11.8e-3, 'P': 3.43, 'A': 4.37e-4, 'E': 210000e6, 'nu': 0.3}
-R['R24']= {'nmb': "R24", 'd': 24e-3, 'r': 12e-3, 'P': 3.55, 'A': 4.52e-4, 'E': 210000e6, 'nu': 0.3}
-R['R24_5']= {'nmb': "R24_5", 'd': 24.5e-3, 'r': 12.25e-3, 'P': 3.7, 'A': 4.71e-4, 'E': 210000e6, 'nu': 0.3}
-R['R25']= {'nmb': "R25", 'd': 25e-3, 'r': 12.5e-3, 'P': 3.85, 'A': 4.91e-4, 'E': 210000e6, 'nu': 0.3}
-R['R26']= {'nmb': "R26", 'd': 26e-3, 'r': 13e-3, 'P': 4.17, 'A': 5.31e-4, 'E': 210000e6, 'nu': 0.3}
-R['R26_7']= {'nmb': "R26_7", 'd': 26.7e-3, 'r': 13.35e-3, 'P': 4.4, 'A': 5.6e-4, 'E': 210000e6, 'nu': 0.3}
-R['R27']= {'nmb': "R27", 'd': 27e-3, 'r': 13.5e-3, 'P': 4.49, 'A': 5.73e-4, 'E': 210000e6, 'nu': 0.3}
-R['R28']= {'nmb': "R28", 'd': 28e-3, 'r': 14e-3, 'P': 4.83, 'A': 6.16e-4, 'E': 210000e6, 'nu': 0.3}
-R['R29']= {'nmb': "R29", 'd': 29e-3, 'r': 14.5e-3, 'P': 5.19, 'A': 6.61e-4, 'E': 210000e6, 'nu': 0.3}
-R['R29_5']= {'nmb': "R29_5", 'd': 29.5e-3, 'r': 14.75e-3, 'P': 5.37, 'A': 6.83e-4, 'E': 210000e6, 'nu': 0.3}
-R['R29_7']= {'nmb': "R29_7", 'd': 29.7e-3, 'r': 14.85e-3, 'P': 5.44, 'A': 6.93e-4, 'E': 210000e6, 'nu': 0.3}
-R['R30']= {'nmb': "R30", 'd': 30e-3, 'r': 15e-3, 'P': 5.55, 'A': 7.07e-4, 'E': 210000e6, 'nu': 0.3}
-R['R31']= {'nmb': "R31", 'd': 31e-3, 'r': 15.5e-3, 'P': 5.92, 'A': 7.55e-4, 'E': 210000e6, 'nu': 0.3}
-R['R32']= {'nmb': "R32", 'd': 32e-3, 'r': 16e-3, 'P': 6.31, 'A': 8.04e-4, 'E': 210000e6, 'nu': 0.3}
-R['R34']= {'nmb': "R34", 'd': 34e-3, 'r': 17e-3, 'P': 7.13, 'A': 9.08e-4, 'E': 210000e6, 'nu': 0.3}
-R['R34_4']= {'nmb': "R34_4", 'd': 34.4e-3, 'r': 17.2e-3, 'P': 7.3, 'A': 9.29e-4, 'E': 210000e6, 'nu': 0.3}
-R['R35']= {'nmb': "R35", 'd': 35e-3, 'r': 17.5e-3, 'P': 7.55, 'A': 9.62e-4, 'E': 210000e6, 'nu': 0.3}
-R['R35_7']= {'nmb': "R35_7", 'd': 35.7e-3, 'r': 17.85e-3, 'P': 7.86, 'A': 10e-4, 'E': 210000e6, 'nu': 0.3}
-R['R36']= {'nmb': "R36", 'd': 36e-3, 'r': 18e-3, 'P': 7.99, 'A': 10.2e-4, 'E': 210000e6, 'nu': 0.3}
-R['R37']= {'nmb': "R37", 'd': 37e-3, 'r': 18.5e-3, 'P': 8.44, 'A': 10.8e-4, 'E': 210000e6, 'nu': 0.3}
-R['R38']= {'nmb': "R38", 'd': 38e-3, 'r': 19e-3, 'P': 8.9, 'A': 11.3e-4, 'E': 210000e6, 'nu': 0.3}
-R['R39']= {'nmb': "R39", 'd': 39e-3, 'r': 19.5e-3, 'P': 9.38, 'A': 11.9e-4, 'E': 210000e6, 'nu': 0.3}
-R['R39_2']= {'nmb': "R39_2", 'd': 39.2e-3, 'r': 19.6e-3, 'P': 9.47, 'A': 12.1e-4, 'E': 210000e6, 'nu': 0.3}
-R['R40']= {'nmb': "R40", 'd': 40e-3, 'r': 20e-3, 'P': 9.86, 'A': 12.6e-4, 'E': 210000e6, 'nu': 0.3}
-R['R42']= {'nmb': "R42", 'd': 42e-3, 'r': 21e-3, 'P': 10.9, 'A': 13.9e-4, 'E': 210000e6, 'nu': 0.3}
-R['R44']= {'nmb': "R44", 'd': 44e-3, 'r': 22e-3, 'P': 11.9, 'A': 15.2e-4, 'E': 210000e6, 'nu': 0.3}
-R['R45']= {'nmb': "R45", 'd': 45e-3, 'r': 22.5e-3, 'P': 12.5, 'A': 15.9e-4, 'E': 210000e6, 'nu': 0.3}
-R['R46']= {'nmb': "R46", 'd': 46e-3, 'r': 23e-3, 'P': 13, 'A': 16.6e-4, 'E': 210000e6, 'nu': 0.3}
-R['R47']= {'nmb': "R47", 'd': 47e-3, 'r': 23.5e-3, 'P': 13.6, 'A': 17.3e-4, 'E': 210000e6, 'nu': 0.3}
-R['R48']= {'nmb': "R48", 'd': 48e-3, 'r': 24e-3, 'P': 14.2, 'A': 18.1e-4, 'E': 210000e6, 'nu': 0.3}
-R['R49_2']= {'nmb': "R49_2", 'd': 49.2e-3, 'r': 24.6e-3, 'P': 14.9, 'A': 19e-4, 'E': 210000e6, 'nu': 0.3}
-R['R50']= {'nmb': "R50", 'd': 50e-3, 'r': 25e-3, 'P': 15.4, 'A': 19.6e-4, 'E': 210000e6, 'nu': 0.3}
-R['R51']= {'nmb': "R51", 'd': 51e-3, 'r': 25.5e-3, 'P': 16, 'A': 20.4e-4, 'E': 210000e6, 'nu': 0.3}
-R['R52']= {'nmb': "R52", 'd': 52e-3, 'r': 26e-3, 'P': 16.7, 'A': 21.2e-4, 'E': 210000e6, 'nu': 0.3}
-R['R53']= {'nmb': "R53", 'd': 53e-3, 'r': 26.5e-3, 'P': 17.3, 'A': 22.1e-4, 'E': 210000e6, 'nu': 0.3}
-R['R54']= {'nmb': "R54", 'd': 54e-3, 'r': 27e-3, 'P': 18, 'A': 22.9e-4, 'E': 210000e6, 'nu': 0.3}
-R['R55']= {'nmb': "R55", 'd': 55e-3, 'r': 27.5e-3, 'P': 18.7, 'A': 23.8e-4, 'E': 210000e6, 'nu': 0.3}
-R['R55_8']= {'nmb': "R55_8", 'd': 55.8e-3, 'r': 27.9e-3, 'P': 19.2, 'A': 24.5e-4, 'E': 210000e6, 'nu': 0.3}
-R['R56']= {'nmb': "R56", 'd': 56e-3, 'r': 28e-3, 'P': 19.3, 'A': 24.6e-4, 'E': 210000e6, 'nu': 0.3}
-R['R57']= {'nmb': "R57", 'd': 57e-3, 'r': 28.5e-3, 'P': 20, 'A': 25.5e-4, 'E': 210000e6, 'nu': 0.3}
-R['R58']= {'nmb': "R58", 'd': 58e-3, 'r': 29e-3, 'P': 20.7, 'A': 26.4e-4, 'E': 210000e6, 'nu': 0.3}
-R['R59']= {'nmb': "R59", 'd': 59e-3, 'r': 29.5e-3, 'P': 21.5, 'A': 27.3e-4, 'E': 210000e6, 'nu': 0.3}
-R['R60']= {'nmb': "R60", 'd': 60e-3, 'r': 30e-3, 'P': 22.2, 'A': 28.3e-4, 'E': 210000e6, 'nu': 0.3}
-R['R62']= {'nmb': "R62", 'd': 62e-3, 'r': 31e-3, 'P': 23.7, 'A': 30.2e-4, 'E': 210000e6, 'nu': 0.3}
-R['R63']= {'nmb': "R63", 'd': 63e-3, 'r': 31.5e-3, 'P': 24.5, 'A': 31.2e-4, 'E': 210000e6, 'nu': 0.3}
-R['R65']= {'nmb': "R65", 'd': 65e-3, 'r': 32.5e-3, 'P': 26, 'A': 33.2e-4, 'E': 210000e6, 'nu': 0.3}
-R['R70']= {'nmb': "R70", 'd': 70e-3, 'r': 35e-3, 'P': 30.2, 'A': 38.5e-4, 'E': 210000e6, 'nu': 0.3}
-R['R75']= {'nmb': "R75", 'd': 75e-3, 'r': 37.5e-3, 'P': 34.7, 'A': 44.2e-4, 'E': 210000e6, 'nu': 0.3}
-R['R80']= {'nmb': "R80", 'd': 80e-3, 'r': 40e-3, 'P': 39.5, 'A': 50.3e-4, 'E': 210000e6, 'nu': 0.3}
-R['R85']= {'nmb': "R85", 'd': 85e-3, 'r': 42.5e-3, 'P': 44.5, 'A': 56.7e-4, 'E': 210000e6, 'nu': 0.3}
-R['R90']= {'nmb': "R90", 'd': 90e-3, 'r': 45e-3, 'P': 49.9, 'A': 63.6e-4, 'E': 210000e6, 'nu': 0.3}
-R['R95']= {'nmb': "R95", 'd': 95e-3, 'r': 47.5e-3, 'P': 55.6, 'A': 70.9e-4, 'E': 210000e6, 'nu': 0.3}
-R['R100']= {'nmb': "R100", 'd': 100e-3, 'r': 50e-3, 'P': 61.7, 'A': 78.5e-4, 'E': 210000e6, 'nu': 0.3}
-R['R105']= {'nmb': "R105", 'd': 105e-3, 'r': 52.5e-3, 'P': 68, 'A': 86.6e-4, 'E': 210000e6, 'nu': 0.3}
-R['R110']= {'nmb': "R110", 'd': 110e-3, 'r': 55e-3, 'P': 74.6, 'A': 95e-4, 'E': 210000e6, 'nu': 0.3}
-R['R120']= {'nmb': "R120", 'd': 120e-3, 'r': 60e-3, 'P': 88.8, 'A': 113e-4, 'E': 210000e6, 'nu': 0.3}
-R['R130']= {'nmb': "R130", 'd': 130e-3, 'r': 65e-3, 'P': 104, 'A': 133e-4, 'E': 210000e6, 'nu': 0.3}
-
-for item in R:
-    shape= R[item]
+
+def setRDerivedValues(shape):
+    '''Compute the properties of the R shapes that are not in the table.'''
     A= shape['A']
     E= shape['E']
     nu= shape['nu']
@@ -1249,8 +395,9 @@ for item in R:
     shape['Wzpl']= 4.0*r**3/3.0
     shape['J']= math.pi*r**4/2.0
 
+R= shape_table.ShapeTable('arcelor_R',setRDerivedValues)
+
 
-  
 import xc_base
 import geom
 from materials.sections import structural_steel
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+''' Catalogue of structural steel shapes loaded on demand.
+
+The values of the shapes are stored as tuples in the modules of the
+tables package (one module for each family of shapes). The module
+is imported the first time the catalogue is accessed, so the scripts
+that don't use a family of shapes don't pay its loading cost. The
+sorted indexes used to answer range queries (e.g. all the IPE shapes
+whose plastic modulus is greater than a given value) are also built
+on demand, one for each property.
+'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+import bisect
+import importlib
+try:
+    from collections.abc import MutableMapping
+except ImportError:
+    from collections import MutableMapping
+
+tablesPackage= 'materials.sections.structural_shapes.tables'
+
+class ShapeTable(MutableMapping):
+    '''Dictionary of shapes (shape name -> dictionary of properties)
+    whose values are read from a table module the first time they
+    are needed.
+
+    :ivar tableName: name of the module of the tables package that
+                     contains the values (i.e. 'arcelor_IPE').
+    :ivar setDerivedValues: function that computes the properties of
+                            a shape that are not in the table.
+    '''
+    def __init__(self, tableName, setDerivedValues= None):
+        '''Constructor.
+
+        :param tableName: name of the module of the tables package that
+                          contains the values (i.e. 'arcelor_IPE').
+        :param setDerivedValues: function that computes the properties of
+                                 a shape that are not in the table.
+        '''
+        self.tableName= tableName
+        self.setDerivedValues= setDerivedValues
+        self._shapes= None
+        self._indexes= dict()
+        self._ranks= dict()
+
+    def isLoaded(self):
+        '''Return true if the table has been already read.'''
+        return self._shapes is not None
+
+    def getShapes(self):
+        '''Return the dictionary of shapes, reading the table if needed.'''
+        if(self._shapes is None):
+            table= importlib.import_module(tablesPackage+'.'+self.tableName)
+            shapes= dict()
+            for row in table.rows:
+                shape= dict(zip(table.fields,row[1:]))
+                if(self.setDerivedValues):
+                    self.setDerivedValues(shape)
+                shapes[row[0]]= shape
+            self._shapes= shapes
+        return self._shapes
+
+    def __getitem__(self, name):
+        return self.getShapes()[name]
+
+    def __setitem__(self, name, shape):
+        self.getShapes()[name]= shape
+        self.clearIndexes()
+
+    def __delitem__(self, name):
+        del self.getShapes()[name]
+        self.clearIndexes()
+
+    def __iter__(self):
+        return iter(self.getShapes())
+
+    def __len__(self):
+        return len(self.getShapes())
+
+    def __contains__(self, name):
+        return name in self.getShapes()
+
+    def clearIndexes(self):
+        '''Remove the property indexes (they are built again when
+           needed).'''
+        self._indexes= dict()
+        self._ranks= dict()
+
+    def getIndex(self, code):
+        '''Return the values of the property argument sorted in
+           ascending order and the names of the corresponding shapes.
+
+        :param code: name of the property (i.e. 'Wzpl').
+        '''
+        if(code not in self._indexes):
+            shapes= self.getShapes()
+            pairs= sorted([(shape[code],name) for name, shape in shapes.items() if code in shape])
+            self._indexes[code]= ([p[0] for p in pairs], [p[1] for p in pairs])
+        return self._indexes[code]
+
+    def getRank(self, code):
+        '''Return a dictionary with the position of each shape
+           when they are sorted by the value of the property argument.
+
+        :param code: name of the property (i.e. 'P').
+        '''
+        if(code not in self._ranks):
+            values, names= self.getIndex(code)
+            self._ranks[code]= dict((n,i) for i, n in enumerate(names))
+        return self._ranks[code]
+
+    def getShapesInRange(self, code, minValue= None, maxValue= None, sortBy= 'P'):
+        '''Return the names of the shapes whose value of the property
+           code is in the interval [minValue, maxValue] sorted by the
+           value of the property sortBy (by weight by default).
+
+           i.e. IPE.getShapesInRange('Wzpl', minValue= 500e-6) returns
+           the IPE shapes whose plastic modulus about the strong axis
+           is not less than 500 cm3, the lightest first.
+
+        :param code: name of the property (i.e. 'Wzpl').
+        :param minValue: lower bound of the property (no bound if None).
+        :param maxValue: upper bound of the property (no bound if None).
+        :param sortBy: property used to sort the results (if None the
+                       results are sorted by the value of code).
+        '''
+        values, names= self.getIndex(code)
+        first= 0
+        if(minValue is not None):
+            first= bisect.bisect_left(values,minValue)
+        last= len(values)
+        if(maxValue is not None):
+            last= bisect.bisect_right(values,maxValue)
+        retval= names[first:last]
+        if(sortBy and (sortBy!=code)):
+            rank= self.getRank(sortBy)
+            retval= sorted(retval, key= lambda n: rank[n])
+        return retval
+
+    def getLightestShape(self, code, minValue, sortBy= 'P'):
+        '''Return the name of the lightest shape (or the one with the
+           smallest value of the property sortBy) whose value of the
+           property code is not less than minValue (None if there
+           is no such shape).
+
+        :param code: name of the property (i.e. 'Wzpl').
+        :param minValue: lower bound of the property.
+        :param sortBy: property to minimize.
+        '''
+        names= self.getShapesInRange(code, minValue= minValue, sortBy= sortBy)
+        retval= None
+        if(names):
+            retval= names[0]
+        return retval
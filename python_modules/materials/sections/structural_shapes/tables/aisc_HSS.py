@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+''' AISC HSS shapes (see aisc_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'P', 'A', 'h', 'b', 'e', 'Iz', 'Wzel', 'Wzpl', 'iz', 'Iy', 'Wyel', 'Wypl', 'iy', 'It', 'E', 'nu')
+
+rows= (
+    ('HSS20X12X_625', 'HSS20X12X_625', 189, 22600e-6, 508e-3, 305e-3, 15.9e-3, 783e-6, 3080e-6, 3770e-6, 186e-3, 354e-6, 2330e-6, 2650e-6, 125e-3, 787000e-9, 2.1e+11, 0.3),
+    ('HSS20X12X_500', 'HSS20X12X_500', 153, 18300e-6, 508e-3, 305e-3, 12.7e-3, 645e-6, 2540e-6, 3080e-6, 188e-3, 293e-6, 1920e-6, 2160e-6, 127e-3, 641000e-9, 2.1e+11, 0.3),
+    ('HSS20X12X_375', 'HSS20X12X_375', 117, 13900e-6, 508e-3, 305e-3, 9.53e-3, 499e-6, 1970e-6, 2360e-6, 189e-3, 228e-6, 1490e-6, 1670e-6, 128e-3, 491000e-9, 2.1e+11, 0.3),
+    ('HSS20X12X_313', 'HSS20X12X_313', 97.9, 11700e-6, 508e-3, 305e-3, 7.94e-3, 420e-6, 1660e-6, 2000e-6, 190e-3, 193e-6, 1270e-6, 1410e-6, 129e-3, 415000e-9, 2.1e+11, 0.3),
+    ('HSS20X8X_625', 'HSS20X8X_625', 164, 19500e-6, 508e-3, 203e-3, 15.9e-3, 599e-6, 2360e-6, 3030e-6, 175e-3, 141e-6, 1390e-6, 1580e-6, 84.8e-3, 381000e-9, 2.1e+11, 0.3),
+    ('HSS20X8X_500', 'HSS20X8X_500', 133, 15900e-6, 508e-3, 203e-3, 12.7e-3, 495e-6, 1950e-6, 2490e-6, 177e-3, 118e-6, 1160e-6, 1300e-6, 86.1e-3, 315000e-9, 2.1e+11, 0.3),
+    ('HSS20X8X_375', 'HSS20X8X_375', 102, 12100e-6, 508e-3, 203e-3, 9.53e-3, 385e-6, 1520e-6, 1920e-6, 179e-3, 92.4e-6, 911e-6, 1010e-6, 87.4e-3, 244000e-9, 2.1e+11, 0.3),
+    ('HSS20X8X_313', 'HSS20X8X_313', 85.3, 10100e-6, 508e-3, 203e-3, 7.94e-3, 327e-6, 1290e-6, 1620e-6, 180e-3, 78.7e-6, 777e-6, 852e-6, 88.1e-3, 206000e-9, 2.1e+11, 0.3),
+    ('HSS20X4X_500', 'HSS20X4X_500', 113, 13500e-6, 508e-3, 102e-3, 12.7e-3, 349e-6, 1370e-6, 1880e-6, 161e-3, 24.4e-6, 480e-6, 557e-6, 42.7e-3, 81200e-9, 2.1e+11, 0.3),
+    ('HSS20X4X_375', 'HSS20X4X_375', 86.4, 10300e-6, 508e-3, 102e-3, 9.53e-3, 273e-6, 1080e-6, 1460e-6, 163e-3, 19.8e-6, 390e-6, 439e-6, 43.9e-3, 64900e-9, 2.1e+11, 0.3),
+    ('HSS20X4X_313', 'HSS20X4X_313', 72.7, 8650e-6, 508e-3, 102e-3, 7.94e-3, 233e-6, 918e-6, 1240e-6, 164e-3, 17.1e-6, 338e-6, 375e-6, 44.5e-3, 55800e-9, 2.1e+11, 0.3),
+    ('HSS20X4X_250', 'HSS20X4X_250', 58.7, 6970e-6, 508e-3, 102e-3, 6.35e-3, 191e-6, 751e-6, 1010e-6, 165e-3, 14.3e-6, 280e-6, 306e-6, 45.2e-3, 46200e-9, 2.1e+11, 0.3),
+    ('HSS18X6X_625', 'HSS18X6X_625', 139, 16600e-6, 457e-3, 152e-3, 15.9e-3, 384e-6, 1690e-6, 2210e-6, 152e-3, 65.8e-6, 864e-6, 1000e-6, 63e-3, 192000e-9, 2.1e+11, 0.3),
+    ('HSS18X6X_500', 'HSS18X6X_500', 113, 13500e-6, 457e-3, 152e-3, 12.7e-3, 320e-6, 1400e-6, 1840e-6, 154e-3, 55.8e-6, 731e-6, 831e-6, 64.3e-3, 161000e-9, 2.1e+11, 0.3),
+    ('HSS18X6X_375', 'HSS18X6X_375', 86.4, 10300e-6, 457e-3, 152e-3, 9.53e-3, 251e-6, 1100e-6, 1420e-6, 156e-3, 44.1e-6, 582e-6, 647e-6, 65.5e-3, 126000e-9, 2.1e+11, 0.3),
+    ('HSS18X6X_313', 'HSS18X6X_313', 72.7, 8650e-6, 457e-3, 152e-3, 7.94e-3, 214e-6, 934e-6, 1200e-6, 157e-3, 38e-6, 498e-6, 549e-6, 66.3e-3, 107000e-9, 2.1e+11, 0.3),
+    ('HSS18X6X_250', 'HSS18X6X_250', 58.7, 6970e-6, 457e-3, 152e-3, 6.35e-3, 174e-6, 762e-6, 973e-6, 158e-3, 31.3e-6, 410e-6, 447e-6, 66.8e-3, 87400e-9, 2.1e+11, 0.3),
+    ('HSS16X16X_625', 'HSS16X16X_625', 189, 22600e-6, 406e-3, 406e-3, 15.9e-3, 570e-6, 2800e-6, 3280e-6, 159e-3, 570e-6, 2800e-6, 3280e-6, 159e-3, 903000e-9, 2.1e+11, 0.3),
+    ('HSS16X16X_500', 'HSS16X16X_500', 153, 18300e-6, 406e-3, 406e-3, 12.7e-3, 470e-6, 2310e-6, 2690e-6, 160e-3, 470e-6, 2310e-6, 2690e-6, 160e-3, 737000e-9, 2.1e+11, 0.3),
+    ('HSS16X16X_375', 'HSS16X16X_375', 117, 13900e-6, 406e-3, 406e-3, 9.53e-3, 363e-6, 1790e-6, 2060e-6, 162e-3, 363e-6, 1790e-6, 2060e-6, 162e-3, 562000e-9, 2.1e+11, 0.3),
+    ('HSS16X16X_313', 'HSS16X16X_313', 97.9, 11700e-6, 406e-3, 406e-3, 7.94e-3, 308e-6, 1510e-6, 1740e-6, 162e-3, 308e-6, 1510e-6, 1740e-6, 162e-3, 475000e-9, 2.1e+11, 0.3),
+    ('HSS16X12X_625', 'HSS16X12X_625', 164, 19500e-6, 406e-3, 305e-3, 15.9e-3, 454e-6, 2230e-6, 2700e-6, 152e-3, 291e-6, 1920e-6, 2210e-6, 122e-3, 570000e-9, 2.1e+11, 0.3),
+    ('HSS16X12X_500', 'HSS16X12X_500', 133, 15900e-6, 406e-3, 305e-3, 12.7e-3, 376e-6, 1850e-6, 2210e-6, 154e-3, 242e-6, 1590e-6, 1820e-6, 123e-3, 466000e-9, 2.1e+11, 0.3),
+    ('HSS16X12X_375', 'HSS16X12X_375', 102, 12100e-6, 406e-3, 305e-3, 9.53e-3, 292e-6, 1440e-6, 1700e-6, 155e-3, 188e-6, 1230e-6, 1400e-6, 125e-3, 359000e-9, 2.1e+11, 0.3),
+    ('HSS16X12X_313', 'HSS16X12X_313', 85.4, 10100e-6, 406e-3, 305e-3, 7.94e-3, 248e-6, 1220e-6, 1440e-6, 156e-3, 160e-6, 1050e-6, 1180e-6, 125e-3, 303000e-9, 2.1e+11, 0.3),
+    ('HSS16X8X_625', 'HSS16X8X_625', 139, 16600e-6, 406e-3, 203e-3, 15.9e-3, 339e-6, 1670e-6, 2110e-6, 143e-3, 114e-6, 1120e-6, 1300e-6, 83.1e-3, 283000e-9, 2.1e+11, 0.3),
+    ('HSS16X8X_500', 'HSS16X8X_500', 113, 13500e-6, 406e-3, 203e-3, 12.7e-3, 283e-6, 1390e-6, 1740e-6, 145e-3, 95.7e-6, 944e-6, 1070e-6, 84.3e-3, 234000e-9, 2.1e+11, 0.3),
+    ('HSS16X8X_375', 'HSS16X8X_375', 86.4, 10300e-6, 406e-3, 203e-3, 9.53e-3, 221e-6, 1090e-6, 1350e-6, 147e-3, 75.3e-6, 742e-6, 832e-6, 85.6e-3, 181000e-9, 2.1e+11, 0.3),
+    ('HSS16X8X_313', 'HSS16X8X_313', 72.7, 8650e-6, 406e-3, 203e-3, 7.94e-3, 188e-6, 924e-6, 1140e-6, 147e-3, 64.5e-6, 634e-6, 705e-6, 86.4e-3, 154000e-9, 2.1e+11, 0.3),
+    ('HSS16X8X_250', 'HSS16X8X_250', 58.7, 6970e-6, 406e-3, 203e-3, 6.35e-3, 153e-6, 755e-6, 924e-6, 148e-3, 52.9e-6, 519e-6, 574e-6, 86.9e-3, 125000e-9, 2.1e+11, 0.3),
+    ('HSS16X4X_625', 'HSS16X4X_625', 113, 13500e-6, 406e-3, 102e-3, 15.9e-3, 224e-6, 1100e-6, 1520e-6, 129e-3, 22.5e-6, 442e-6, 533e-6, 40.6e-3, 72400e-9, 2.1e+11, 0.3),
+    ('HSS16X4X_500', 'HSS16X4X_500', 92.7, 11100e-6, 406e-3, 102e-3, 12.7e-3, 189e-6, 932e-6, 1270e-6, 131e-3, 19.6e-6, 385e-6, 449e-6, 41.9e-3, 62400e-9, 2.1e+11, 0.3),
+    ('HSS16X4X_375', 'HSS16X4X_375', 71.2, 8520e-6, 406e-3, 102e-3, 9.53e-3, 150e-6, 737e-6, 987e-6, 133e-3, 15.9e-6, 313e-6, 356e-6, 43.4e-3, 49900e-9, 2.1e+11, 0.3),
+    ('HSS16X4X_313', 'HSS16X4X_313', 60, 7160e-6, 406e-3, 102e-3, 7.94e-3, 128e-6, 631e-6, 837e-6, 134e-3, 13.8e-6, 272e-6, 303e-6, 43.9e-3, 42900e-9, 2.1e+11, 0.3),
+    ('HSS16X4X_250', 'HSS16X4X_250', 48.6, 5780e-6, 406e-3, 102e-3, 6.35e-3, 105e-6, 518e-6, 683e-6, 135e-3, 11.5e-6, 226e-6, 249e-6, 44.7e-3, 35500e-9, 2.1e+11, 0.3),
+    ('HSS16X4X_188', 'HSS16X4X_188', 36.7, 4360e-6, 406e-3, 102e-3, 4.76e-3, 80.3e-6, 397e-6, 519e-6, 136e-3, 8.95e-6, 177e-6, 192e-6, 45.2e-3, 27300e-9, 2.1e+11, 0.3),
+    ('HSS14X14X_625', 'HSS14X14X_625', 164, 19500e-6, 356e-3, 356e-3, 15.9e-3, 373e-6, 2100e-6, 2470e-6, 138e-3, 373e-6, 2100e-6, 2470e-6, 138e-3, 595000e-9, 2.1e+11, 0.3),
+    ('HSS14X14X_500', 'HSS14X14X_500', 133, 15900e-6, 356e-3, 356e-3, 12.7e-3, 309e-6, 1740e-6, 2030e-6, 139e-3, 309e-6, 1740e-6, 2030e-6, 139e-3, 487000e-9, 2.1e+11, 0.3),
+    ('HSS14X14X_375', 'HSS14X14X_375', 102, 12100e-6, 356e-3, 356e-3, 9.53e-3, 240e-6, 1350e-6, 1560e-6, 141e-3, 240e-6, 1350e-6, 1560e-6, 141e-3, 375000e-9, 2.1e+11, 0.3),
+    ('HSS14X14X_313', 'HSS14X14X_313', 85.3, 10100e-6, 356e-3, 356e-3, 7.94e-3, 204e-6, 1150e-6, 1320e-6, 142e-3, 204e-6, 1150e-6, 1320e-6, 142e-3, 316000e-9, 2.1e+11, 0.3),
+    ('HSS14X10X_625', 'HSS14X10X_625', 139, 16600e-6, 356e-3, 254e-3, 15.9e-3, 286e-6, 1610e-6, 1970e-6, 131e-3, 169e-6, 1340e-6, 1560e-6, 101e-3, 346000e-9, 2.1e+11, 0.3),
+    ('HSS14X10X_500', 'HSS14X10X_500', 113, 13500e-6, 356e-3, 254e-3, 12.7e-3, 239e-6, 1340e-6, 1620e-6, 133e-3, 142e-6, 1120e-6, 1290e-6, 103e-3, 285000e-9, 2.1e+11, 0.3),
+    ('HSS14X10X_375', 'HSS14X10X_375', 86.4, 10300e-6, 356e-3, 254e-3, 9.53e-3, 186e-6, 1050e-6, 1250e-6, 134e-3, 111e-6, 875e-6, 995e-6, 104e-3, 220000e-9, 2.1e+11, 0.3),
+    ('HSS14X10X_313', 'HSS14X10X_313', 72.7, 8650e-6, 356e-3, 254e-3, 7.94e-3, 158e-6, 890e-6, 1060e-6, 135e-3, 94.5e-6, 746e-6, 842e-6, 105e-3, 186000e-9, 2.1e+11, 0.3),
+    ('HSS14X10X_250', 'HSS14X10X_250', 58.7, 6970e-6, 356e-3, 254e-3, 6.35e-3, 129e-6, 726e-6, 859e-6, 136e-3, 77.4e-6, 610e-6, 685e-6, 105e-3, 151000e-9, 2.1e+11, 0.3),
+    ('HSS14X6X_625', 'HSS14X6X_625', 113, 13500e-6, 356e-3, 152e-3, 15.9e-3, 199e-6, 1120e-6, 1450e-6, 121e-3, 51.6e-6, 675e-6, 793e-6, 61.7e-3, 139000e-9, 2.1e+11, 0.3),
+    ('HSS14X6X_500', 'HSS14X6X_500', 92.7, 11100e-6, 356e-3, 152e-3, 12.7e-3, 167e-6, 941e-6, 1210e-6, 123e-3, 43.7e-6, 575e-6, 662e-6, 63e-3, 116000e-9, 2.1e+11, 0.3),
+    ('HSS14X6X_375', 'HSS14X6X_375', 71.2, 8520e-6, 356e-3, 152e-3, 9.53e-3, 132e-6, 742e-6, 939e-6, 125e-3, 35e-6, 459e-6, 518e-6, 64.3e-3, 91200e-9, 2.1e+11, 0.3),
+    ('HSS14X6X_313', 'HSS14X6X_313', 60, 7160e-6, 356e-3, 152e-3, 7.94e-3, 113e-6, 634e-6, 796e-6, 125e-3, 30.1e-6, 395e-6, 441e-6, 64.8e-3, 77400e-9, 2.1e+11, 0.3),
+    ('HSS14X6X_250', 'HSS14X6X_250', 48.6, 5780e-6, 356e-3, 152e-3, 6.35e-3, 92.4e-6, 519e-6, 649e-6, 126e-3, 24.8e-6, 326e-6, 361e-6, 65.5e-3, 63300e-9, 2.1e+11, 0.3),
+    ('HSS14X6X_188', 'HSS14X6X_188', 36.7, 4360e-6, 356e-3, 152e-3, 4.76e-3, 70.8e-6, 398e-6, 493e-6, 127e-3, 19.1e-6, 251e-6, 274e-6, 66.3e-3, 48300e-9, 2.1e+11, 0.3),
+    ('HSS14X4X_625', 'HSS14X4X_625', 101, 12100e-6, 356e-3, 102e-3, 15.9e-3, 155e-6, 873e-6, 1200e-6, 114e-3, 19.6e-6, 387e-6, 467e-6, 40.4e-3, 61600e-9, 2.1e+11, 0.3),
+    ('HSS14X4X_500', 'HSS14X4X_500', 82.6, 9870e-6, 356e-3, 102e-3, 12.7e-3, 132e-6, 742e-6, 1000e-6, 116e-3, 17.1e-6, 338e-6, 395e-6, 41.7e-3, 52900e-9, 2.1e+11, 0.3),
+    ('HSS14X4X_375', 'HSS14X4X_375', 63.6, 7610e-6, 356e-3, 102e-3, 9.53e-3, 105e-6, 590e-6, 783e-6, 118e-3, 14e-6, 275e-6, 313e-6, 42.9e-3, 42500e-9, 2.1e+11, 0.3),
+    ('HSS14X4X_313', 'HSS14X4X_313', 53.7, 6400e-6, 356e-3, 102e-3, 7.94e-3, 89.9e-6, 506e-6, 665e-6, 119e-3, 12.2e-6, 239e-6, 269e-6, 43.7e-3, 36500e-9, 2.1e+11, 0.3),
+    ('HSS14X4X_250', 'HSS14X4X_250', 43.5, 5180e-6, 356e-3, 102e-3, 6.35e-3, 74.1e-6, 416e-6, 544e-6, 120e-3, 10.2e-6, 200e-6, 221e-6, 44.2e-3, 30100e-9, 2.1e+11, 0.3),
+    ('HSS14X4X_188', 'HSS14X4X_188', 32.9, 3910e-6, 356e-3, 102e-3, 4.76e-3, 57e-6, 320e-6, 415e-6, 120e-3, 7.91e-6, 155e-6, 169e-6, 45e-3, 23200e-9, 2.1e+11, 0.3),
+    ('HSS12X12X_625', 'HSS12X12X_625', 139, 16600e-6, 305e-3, 305e-3, 15.9e-3, 228e-6, 1500e-6, 1790e-6, 117e-3, 228e-6, 1500e-6, 1790e-6, 117e-3, 368000e-9, 2.1e+11, 0.3),
+    ('HSS12X12X_500', 'HSS12X12X_500', 113, 13500e-6, 305e-3, 305e-3, 12.7e-3, 190e-6, 1250e-6, 1470e-6, 119e-3, 190e-6, 1250e-6, 1470e-6, 119e-3, 303000e-9, 2.1e+11, 0.3),
+    ('HSS12X12X_375', 'HSS12X12X_375', 86.3, 10300e-6, 305e-3, 305e-3, 9.53e-3, 149e-6, 975e-6, 1130e-6, 120e-3, 149e-6, 975e-6, 1130e-6, 120e-3, 234000e-9, 2.1e+11, 0.3),
+    ('HSS12X12X_313', 'HSS12X12X_313', 72.6, 8650e-6, 305e-3, 305e-3, 7.94e-3, 127e-6, 831e-6, 960e-6, 121e-3, 127e-6, 831e-6, 960e-6, 121e-3, 197000e-9, 2.1e+11, 0.3),
+    ('HSS12X12X_250', 'HSS12X12X_250', 58.6, 6970e-6, 305e-3, 305e-3, 6.35e-3, 103e-6, 678e-6, 780e-6, 122e-3, 103e-6, 678e-6, 780e-6, 122e-3, 160000e-9, 2.1e+11, 0.3),
+    ('HSS12X12X_188', 'HSS12X12X_188', 44.4, 5260e-6, 305e-3, 305e-3, 4.76e-3, 78.7e-6, 516e-6, 590e-6, 122e-3, 78.7e-6, 516e-6, 590e-6, 122e-3, 121000e-9, 2.1e+11, 0.3),
+    ('HSS12X10X_500', 'HSS12X10X_500', 103, 12300e-6, 305e-3, 254e-3, 12.7e-3, 164e-6, 1080e-6, 1290e-6, 116e-3, 124e-6, 978e-6, 1140e-6, 101e-3, 227000e-9, 2.1e+11, 0.3),
+    ('HSS12X10X_375', 'HSS12X10X_375', 78.8, 9420e-6, 305e-3, 254e-3, 9.53e-3, 129e-6, 846e-6, 1000e-6, 117e-3, 97.4e-6, 769e-6, 885e-6, 102e-3, 175000e-9, 2.1e+11, 0.3),
+    ('HSS12X10X_313', 'HSS12X10X_313', 66.4, 7870e-6, 305e-3, 254e-3, 7.94e-3, 110e-6, 721e-6, 847e-6, 118e-3, 83.2e-6, 655e-6, 749e-6, 103e-3, 148000e-9, 2.1e+11, 0.3),
+    ('HSS12X10X_250', 'HSS12X10X_250', 53.6, 6390e-6, 305e-3, 254e-3, 6.35e-3, 89.9e-6, 590e-6, 690e-6, 119e-3, 68.3e-6, 536e-6, 610e-6, 103e-3, 120000e-9, 2.1e+11, 0.3),
+    ('HSS12X8X_625', 'HSS12X8X_625', 113, 13500e-6, 305e-3, 203e-3, 15.9e-3, 165e-6, 1080e-6, 1350e-6, 110e-3, 87.4e-6, 860e-6, 1010e-6, 80.3e-3, 189000e-9, 2.1e+11, 0.3),
+    ('HSS12X8X_500', 'HSS12X8X_500', 92.7, 11100e-6, 305e-3, 203e-3, 12.7e-3, 139e-6, 911e-6, 1120e-6, 112e-3, 74.1e-6, 728e-6, 844e-6, 81.5e-3, 157000e-9, 2.1e+11, 0.3),
+    ('HSS12X8X_375', 'HSS12X8X_375', 71.2, 8520e-6, 305e-3, 203e-3, 9.53e-3, 109e-6, 716e-6, 869e-6, 114e-3, 58.3e-6, 575e-6, 657e-6, 83.1e-3, 122000e-9, 2.1e+11, 0.3),
+    ('HSS12X8X_313', 'HSS12X8X_313', 60.1, 7160e-6, 305e-3, 203e-3, 7.94e-3, 93.2e-6, 613e-6, 736e-6, 114e-3, 49.9e-6, 493e-6, 559e-6, 83.6e-3, 103000e-9, 2.1e+11, 0.3),
+    ('HSS12X8X_250', 'HSS12X8X_250', 48.5, 5780e-6, 305e-3, 203e-3, 6.35e-3, 76.6e-6, 501e-6, 600e-6, 115e-3, 41.1e-6, 405e-6, 456e-6, 84.3e-3, 84100e-9, 2.1e+11, 0.3),
+    ('HSS12X8X_188', 'HSS12X8X_188', 36.9, 4360e-6, 305e-3, 203e-3, 4.77e-3, 58.3e-6, 383e-6, 456e-6, 116e-3, 31.5e-6, 310e-6, 346e-6, 85.1e-3, 63700e-9, 2.1e+11, 0.3),
+    ('HSS12X6X_625', 'HSS12X6X_625', 101, 12100e-6, 305e-3, 152e-3, 15.9e-3, 134e-6, 875e-6, 1130e-6, 105e-3, 44.5e-6, 582e-6, 690e-6, 60.7e-3, 113000e-9, 2.1e+11, 0.3),
+    ('HSS12X6X_500', 'HSS12X6X_500', 82.6, 9870e-6, 305e-3, 152e-3, 12.7e-3, 113e-6, 741e-6, 941e-6, 107e-3, 37.9e-6, 498e-6, 577e-6, 62e-3, 94500e-9, 2.1e+11, 0.3),
+    ('HSS12X6X_375', 'HSS12X6X_375', 63.6, 7610e-6, 305e-3, 152e-3, 9.53e-3, 89.5e-6, 588e-6, 734e-6, 109e-3, 30.3e-6, 398e-6, 454e-6, 63.2e-3, 74100e-9, 2.1e+11, 0.3),
+    ('HSS12X6X_313', 'HSS12X6X_313', 53.7, 6400e-6, 305e-3, 152e-3, 7.94e-3, 76.6e-6, 503e-6, 624e-6, 109e-3, 26.1e-6, 342e-6, 387e-6, 64e-3, 63300e-9, 2.1e+11, 0.3),
+    ('HSS12X6X_250', 'HSS12X6X_250', 43.4, 5180e-6, 305e-3, 152e-3, 6.35e-3, 62.9e-6, 413e-6, 510e-6, 110e-3, 21.6e-6, 283e-6, 316e-6, 64.5e-3, 51600e-9, 2.1e+11, 0.3),
+    ('HSS12X6X_188', 'HSS12X6X_188', 33.1, 3910e-6, 305e-3, 152e-3, 4.76e-3, 48.3e-6, 318e-6, 388e-6, 111e-3, 16.6e-6, 218e-6, 241e-6, 65.3e-3, 39400e-9, 2.1e+11, 0.3),
+    ('HSS12X4X_625', 'HSS12X4X_625', 88, 10600e-6, 305e-3, 102e-3, 15.9e-3, 102e-6, 669e-6, 909e-6, 98.3e-3, 16.8e-6, 331e-6, 401e-6, 39.9e-3, 50800e-9, 2.1e+11, 0.3),
+    ('HSS12X4X_500', 'HSS12X4X_500', 72.5, 8710e-6, 305e-3, 102e-3, 12.7e-3, 87.4e-6, 572e-6, 765e-6, 100e-3, 14.7e-6, 290e-6, 342e-6, 41.1e-3, 43700e-9, 2.1e+11, 0.3),
+    ('HSS12X4X_375', 'HSS12X4X_375', 56, 6710e-6, 305e-3, 102e-3, 9.53e-3, 69.9e-6, 459e-6, 601e-6, 102e-3, 12e-6, 238e-6, 272e-6, 42.4e-3, 35000e-9, 2.1e+11, 0.3),
+    ('HSS12X4X_313', 'HSS12X4X_313', 47.4, 5650e-6, 305e-3, 102e-3, 7.94e-3, 59.9e-6, 395e-6, 513e-6, 103e-3, 10.5e-6, 206e-6, 233e-6, 43.2e-3, 30100e-9, 2.1e+11, 0.3),
+    ('HSS12X4X_250', 'HSS12X4X_250', 38.4, 4580e-6, 305e-3, 102e-3, 6.35e-3, 49.5e-6, 326e-6, 420e-6, 104e-3, 8.74e-6, 172e-6, 192e-6, 43.7e-3, 24900e-9, 2.1e+11, 0.3),
+    ('HSS12X4X_188', 'HSS12X4X_188', 29.3, 3460e-6, 305e-3, 102e-3, 4.76e-3, 38.2e-6, 251e-6, 321e-6, 105e-3, 6.83e-6, 134e-6, 147e-6, 44.5e-3, 19200e-9, 2.1e+11, 0.3),
+    ('HSS12X3-1/2X_375', 'HSS12X3-1/2X_375', 54.1, 6450e-6, 305e-3, 88.9e-3, 9.53e-3, 64.9e-6, 426e-6, 569e-6, 100e-3, 8.87e-6, 200e-6, 229e-6, 37.1e-3, 26900e-9, 2.1e+11, 0.3),
+    ('HSS12X3-1/2X_313', 'HSS12X3-1/2X_313', 45.8, 5460e-6, 305e-3, 88.9e-3, 7.94e-3, 55.8e-6, 367e-6, 485e-6, 101e-3, 7.74e-6, 174e-6, 198e-6, 37.6e-3, 23300e-9, 2.1e+11, 0.3),
+    ('HSS12X3X_313', 'HSS12X3X_313', 44.2, 5270e-6, 305e-3, 76.2e-3, 7.94e-3, 51.6e-6, 339e-6, 457e-6, 99.1e-3, 5.45e-6, 143e-6, 164e-6, 32.3e-3, 17200e-9, 2.1e+11, 0.3),
+    ('HSS12X3X_250', 'HSS12X3X_250', 35.8, 4280e-6, 305e-3, 76.2e-3, 6.35e-3, 42.9e-6, 282e-6, 375e-6, 100e-3, 4.62e-6, 121e-6, 136e-6, 32.8e-3, 14400e-9, 2.1e+11, 0.3),
+    ('HSS12X3X_188', 'HSS12X3X_188', 27.4, 3240e-6, 305e-3, 76.2e-3, 4.76e-3, 33.1e-6, 218e-6, 287e-6, 101e-3, 3.63e-6, 95.2e-6, 105e-6, 33.5e-3, 11200e-9, 2.1e+11, 0.3),
+    ('HSS12X2X_313', 'HSS12X2X_313', 41, 4900e-6, 305e-3, 50.8e-3, 7.94e-3, 43.3e-6, 285e-6, 401e-6, 94.2e-3, 2.12e-6, 83.6e-6, 99.1e-6, 20.8e-3, 7330e-9, 2.1e+11, 0.3),
+    ('HSS12X2X_250', 'HSS12X2X_250', 33.3, 3980e-6, 305e-3, 50.8e-3, 6.35e-3, 36.2e-6, 238e-6, 329e-6, 95.3e-3, 1.84e-6, 72.3e-6, 83.2e-6, 21.5e-3, 6290e-9, 2.1e+11, 0.3),
+    ('HSS12X2X_188', 'HSS12X2X_188', 25.4, 3010e-6, 305e-3, 50.8e-3, 4.76e-3, 28.1e-6, 184e-6, 254e-6, 96.5e-3, 1.48e-6, 58.2e-6, 65.1e-6, 22.1e-3, 4990e-9, 2.1e+11, 0.3),
+    ('HSS10X10X_625', 'HSS10X10X_625', 113, 13500e-6, 254e-3, 254e-3, 15.9e-3, 127e-6, 996e-6, 1200e-6, 96.5e-3, 127e-6, 996e-6, 1200e-6, 96.5e-3, 207000e-9, 2.1e+11, 0.3),
+    ('HSS10X10X_500', 'HSS10X10X_500', 92.7, 11100e-6, 254e-3, 254e-3, 12.7e-3, 107e-6, 839e-6, 995e-6, 98e-3, 107e-6, 839e-6, 995e-6, 98e-3, 171000e-9, 2.1e+11, 0.3),
+    ('HSS10X10X_375', 'HSS10X10X_375', 71.2, 8520e-6, 254e-3, 254e-3, 9.53e-3, 84.1e-6, 662e-6, 773e-6, 99.6e-3, 84.1e-6, 662e-6, 773e-6, 99.6e-3, 133000e-9, 2.1e+11, 0.3),
+    ('HSS10X10X_313', 'HSS10X10X_313', 60, 7160e-6, 254e-3, 254e-3, 7.94e-3, 71.6e-6, 565e-6, 657e-6, 100e-3, 71.6e-6, 565e-6, 657e-6, 100e-3, 113000e-9, 2.1e+11, 0.3),
+    ('HSS10X10X_250', 'HSS10X10X_250', 48.5, 5780e-6, 254e-3, 254e-3, 6.35e-3, 58.7e-6, 464e-6, 536e-6, 101e-3, 58.7e-6, 464e-6, 536e-6, 101e-3, 91600e-9, 2.1e+11, 0.3),
+    ('HSS10X10X_188', 'HSS10X10X_188', 36.8, 4360e-6, 254e-3, 254e-3, 4.76e-3, 45e-6, 354e-6, 406e-6, 102e-3, 45e-6, 354e-6, 406e-6, 102e-3, 69500e-9, 2.1e+11, 0.3),
+    ('HSS10X8X_625', 'HSS10X8X_625', 101, 12100e-6, 254e-3, 203e-3, 15.9e-3, 105e-6, 828e-6, 1020e-6, 93.5e-3, 74.1e-6, 729e-6, 873e-6, 78.5e-3, 144000e-9, 2.1e+11, 0.3),
+    ('HSS10X8X_500', 'HSS10X8X_500', 82.6, 9870e-6, 254e-3, 203e-3, 12.7e-3, 89.1e-6, 700e-6, 850e-6, 94.7e-3, 62.9e-6, 619e-6, 729e-6, 79.8e-3, 120000e-9, 2.1e+11, 0.3),
+    ('HSS10X8X_375', 'HSS10X8X_375', 63.6, 7610e-6, 254e-3, 203e-3, 9.53e-3, 70.3e-6, 556e-6, 664e-6, 96.3e-3, 49.9e-6, 492e-6, 570e-6, 81e-3, 93200e-9, 2.1e+11, 0.3),
+    ('HSS10X8X_313', 'HSS10X8X_313', 53.7, 6400e-6, 254e-3, 203e-3, 7.94e-3, 60.4e-6, 475e-6, 564e-6, 97e-3, 42.9e-6, 421e-6, 485e-6, 81.8e-3, 79100e-9, 2.1e+11, 0.3),
+    ('HSS10X8X_250', 'HSS10X8X_250', 43.4, 5180e-6, 254e-3, 203e-3, 6.35e-3, 49.5e-6, 390e-6, 460e-6, 97.8e-3, 35.3e-6, 347e-6, 397e-6, 82.6e-3, 64500e-9, 2.1e+11, 0.3),
+    ('HSS10X8X_188', 'HSS10X8X_188', 33.1, 3910e-6, 254e-3, 203e-3, 4.76e-3, 38e-6, 300e-6, 351e-6, 98.6e-3, 27.1e-6, 267e-6, 302e-6, 83.3e-3, 49100e-9, 2.1e+11, 0.3),
+    ('HSS10X6X_625', 'HSS10X6X_625', 88, 10600e-6, 254e-3, 152e-3, 15.9e-3, 83.7e-6, 659e-6, 841e-6, 88.9e-3, 37.2e-6, 488e-6, 587e-6, 59.4e-3, 87000e-9, 2.1e+11, 0.3),
+    ('HSS10X6X_500', 'HSS10X6X_500', 72.5, 8710e-6, 254e-3, 152e-3, 12.7e-3, 71.2e-6, 562e-6, 705e-6, 90.7e-3, 32e-6, 420e-6, 493e-6, 60.7e-3, 73300e-9, 2.1e+11, 0.3),
+    ('HSS10X6X_375', 'HSS10X6X_375', 56, 6710e-6, 254e-3, 152e-3, 9.53e-3, 57e-6, 449e-6, 554e-6, 92.2e-3, 25.7e-6, 338e-6, 388e-6, 62e-3, 57900e-9, 2.1e+11, 0.3),
+    ('HSS10X6X_313', 'HSS10X6X_313', 47.4, 5650e-6, 254e-3, 152e-3, 7.94e-3, 49.1e-6, 385e-6, 472e-6, 93e-3, 22.2e-6, 292e-6, 331e-6, 62.7e-3, 49100e-9, 2.1e+11, 0.3),
+    ('HSS10X6X_250', 'HSS10X6X_250', 38.4, 4580e-6, 254e-3, 152e-3, 6.35e-3, 40.3e-6, 318e-6, 387e-6, 93.7e-3, 18.4e-6, 241e-6, 272e-6, 63.2e-3, 40200e-9, 2.1e+11, 0.3),
+    ('HSS10X6X_188', 'HSS10X6X_188', 29.3, 3460e-6, 254e-3, 152e-3, 4.76e-3, 31.1e-6, 244e-6, 295e-6, 94.7e-3, 14.2e-6, 187e-6, 208e-6, 64e-3, 30700e-9, 2.1e+11, 0.3),
+    ('HSS10X5X_375', 'HSS10X5X_375', 52.2, 6240e-6, 254e-3, 127e-3, 9.53e-3, 49.9e-6, 395e-6, 498e-6, 89.7e-3, 16.9e-6, 265e-6, 306e-6, 52.1e-3, 41600e-9, 2.1e+11, 0.3),
+    ('HSS10X5X_313', 'HSS10X5X_313', 44.2, 5270e-6, 254e-3, 127e-3, 7.94e-3, 43.3e-6, 341e-6, 426e-6, 90.4e-3, 14.7e-6, 231e-6, 262e-6, 52.6e-3, 35800e-9, 2.1e+11, 0.3),
+    ('HSS10X5X_250', 'HSS10X5X_250', 35.8, 4280e-6, 254e-3, 127e-3, 6.35e-3, 35.7e-6, 282e-6, 349e-6, 91.4e-3, 12.2e-6, 192e-6, 216e-6, 53.3e-3, 29400e-9, 2.1e+11, 0.3),
+    ('HSS10X5X_188', 'HSS10X5X_188', 27.4, 3240e-6, 254e-3, 127e-3, 4.76e-3, 27.6e-6, 216e-6, 267e-6, 92.2e-3, 9.45e-6, 149e-6, 166e-6, 54.1e-3, 22500e-9, 2.1e+11, 0.3),
+    ('HSS10X4X_625', 'HSS10X4X_625', 75.3, 9030e-6, 254e-3, 102e-3, 15.9e-3, 62e-6, 490e-6, 660e-6, 82.8e-3, 13.9e-6, 275e-6, 338e-6, 39.1e-3, 39800e-9, 2.1e+11, 0.3),
+    ('HSS10X4X_500', 'HSS10X4X_500', 62.4, 7480e-6, 254e-3, 102e-3, 12.7e-3, 53.7e-6, 423e-6, 559e-6, 84.8e-3, 12.3e-6, 241e-6, 288e-6, 40.4e-3, 34400e-9, 2.1e+11, 0.3),
+    ('HSS10X4X_375', 'HSS10X4X_375', 48.4, 5790e-6, 254e-3, 102e-3, 9.53e-3, 43.3e-6, 341e-6, 442e-6, 86.6e-3, 10.1e-6, 198e-6, 229e-6, 41.7e-3, 27700e-9, 2.1e+11, 0.3),
+    ('HSS10X4X_313', 'HSS10X4X_313', 41, 4900e-6, 254e-3, 102e-3, 7.94e-3, 37.5e-6, 295e-6, 379e-6, 87.4e-3, 8.82e-6, 174e-6, 198e-6, 42.4e-3, 23900e-9, 2.1e+11, 0.3),
+    ('HSS10X4X_250', 'HSS10X4X_250', 33.3, 3980e-6, 254e-3, 102e-3, 6.35e-3, 31.1e-6, 244e-6, 311e-6, 88.4e-3, 7.37e-6, 145e-6, 164e-6, 43.2e-3, 19700e-9, 2.1e+11, 0.3),
+    ('HSS10X4X_188', 'HSS10X4X_188', 25.4, 3010e-6, 254e-3, 102e-3, 4.76e-3, 24.1e-6, 190e-6, 239e-6, 89.4e-3, 5.79e-6, 114e-6, 126e-6, 43.7e-3, 15200e-9, 2.1e+11, 0.3),
+    ('HSS10X4X_125', 'HSS10X4X_125', 17.2, 2040e-6, 254e-3, 102e-3, 3.18e-3, 16.6e-6, 131e-6, 164e-6, 90.2e-3, 4.02e-6, 79.1e-6, 86.2e-6, 44.5e-3, 10400e-9, 2.1e+11, 0.3),
+    ('HSS10X3-1/2X_500', 'HSS10X3-1/2X_500', 59.8, 7160e-6, 254e-3, 88.9e-3, 12.7e-3, 49.1e-6, 388e-6, 523e-6, 82.8e-3, 8.91e-6, 200e-6, 241e-6, 35.3e-3, 26300e-9, 2.1e+11, 0.3),
+    ('HSS10X3-1/2X_375', 'HSS10X3-1/2X_375', 46.5, 5560e-6, 254e-3, 88.9e-3, 9.53e-3, 40e-6, 315e-6, 415e-6, 84.8e-3, 7.41e-6, 167e-6, 193e-6, 36.6e-3, 21400e-9, 2.1e+11, 0.3),
+    ('HSS10X3-1/2X_313', 'HSS10X3-1/2X_313', 39.5, 4710e-6, 254e-3, 88.9e-3, 7.94e-3, 34.6e-6, 272e-6, 356e-6, 85.9e-3, 6.49e-6, 146e-6, 167e-6, 37.1e-3, 18600e-9, 2.1e+11, 0.3),
+    ('HSS10X3-1/2X_250', 'HSS10X3-1/2X_250', 32, 3830e-6, 254e-3, 88.9e-3, 6.35e-3, 28.8e-6, 226e-6, 293e-6, 86.6e-3, 5.45e-6, 123e-6, 138e-6, 37.8e-3, 15400e-9, 2.1e+11, 0.3),
+    ('HSS10X3-1/2X_188', 'HSS10X3-1/2X_188', 24.5, 2900e-6, 254e-3, 88.9e-3, 4.76e-3, 22.3e-6, 175e-6, 225e-6, 87.6e-3, 4.29e-6, 96.5e-6, 107e-6, 38.4e-3, 11900e-9, 2.1e+11, 0.3),
+    ('HSS10X3-1/2X_125', 'HSS10X3-1/2X_125', 16.6, 1960e-6, 254e-3, 88.9e-3, 3.18e-3, 15.4e-6, 121e-6, 154e-6, 88.6e-3, 3.01e-6, 67.5e-6, 73.4e-6, 39.1e-3, 8240e-9, 2.1e+11, 0.3),
+    ('HSS10X3X_375', 'HSS10X3X_375', 44.6, 5340e-6, 254e-3, 76.2e-3, 9.53e-3, 36.6e-6, 288e-6, 388e-6, 82.8e-3, 5.16e-6, 136e-6, 159e-6, 31e-3, 15700e-9, 2.1e+11, 0.3),
+    ('HSS10X3X_313', 'HSS10X3X_313', 37.9, 4520e-6, 254e-3, 76.2e-3, 7.94e-3, 31.8e-6, 251e-6, 333e-6, 83.8e-3, 4.58e-6, 120e-6, 138e-6, 31.8e-3, 13700e-9, 2.1e+11, 0.3),
+    ('HSS10X3X_250', 'HSS10X3X_250', 30.8, 3680e-6, 254e-3, 76.2e-3, 6.35e-3, 26.5e-6, 208e-6, 274e-6, 84.8e-3, 3.86e-6, 101e-6, 115e-6, 32.5e-3, 11500e-9, 2.1e+11, 0.3),
+    ('HSS10X3X_188', 'HSS10X3X_188', 23.5, 2790e-6, 254e-3, 76.2e-3, 4.76e-3, 20.6e-6, 162e-6, 210e-6, 85.9e-3, 3.05e-6, 80.1e-6, 88.7e-6, 33e-3, 8950e-9, 2.1e+11, 0.3),
+    ('HSS10X3X_125', 'HSS10X3X_125', 15.9, 1890e-6, 254e-3, 76.2e-3, 3.18e-3, 14.2e-6, 112e-6, 144e-6, 86.9e-3, 2.15e-6, 56.4e-6, 61.3e-6, 33.8e-3, 6200e-9, 2.1e+11, 0.3),
+    ('HSS10X2X_375', 'HSS10X2X_375', 40.8, 4890e-6, 254e-3, 50.8e-3, 9.53e-3, 29.8e-6, 234e-6, 333e-6, 78.2e-3, 1.96e-6, 77e-6, 94.4e-6, 20e-3, 6620e-9, 2.1e+11, 0.3),
+    ('HSS10X2X_313', 'HSS10X2X_313', 34.7, 4150e-6, 254e-3, 50.8e-3, 7.94e-3, 26.1e-6, 205e-6, 287e-6, 79.2e-3, 1.76e-6, 69.5e-6, 82.9e-6, 20.6e-3, 5910e-9, 2.1e+11, 0.3),
+    ('HSS10X2X_250', 'HSS10X2X_250', 28.3, 3380e-6, 254e-3, 50.8e-3, 6.35e-3, 21.9e-6, 172e-6, 236e-6, 80.5e-3, 1.53e-6, 60.1e-6, 69.8e-6, 21.3e-3, 5080e-9, 2.1e+11, 0.3),
+    ('HSS10X2X_188', 'HSS10X2X_188', 21.6, 2570e-6, 254e-3, 50.8e-3, 4.76e-3, 17.1e-6, 134e-6, 182e-6, 81.5e-3, 1.24e-6, 48.7e-6, 54.7e-6, 21.9e-3, 4050e-9, 2.1e+11, 0.3),
+    ('HSS10X2X_125', 'HSS10X2X_125', 14.7, 1740e-6, 254e-3, 50.8e-3, 3.18e-3, 11.9e-6, 93.4e-6, 125e-6, 82.6e-3, 0.891e-6, 35.1e-6, 38.2e-6, 22.6e-3, 2870e-9, 2.1e+11, 0.3),
+    ('HSS9X9X_625', 'HSS9X9X_625', 101, 12100e-6, 229e-3, 229e-3, 15.9e-3, 89.9e-6, 785e-6, 952e-6, 86.4e-3, 89.9e-6, 785e-6, 952e-6, 86.4e-3, 148000e-9, 2.1e+11, 0.3),
+    ('HSS9X9X_500', 'HSS9X9X_500', 82.6, 9870e-6, 229e-3, 229e-3, 12.7e-3, 76.2e-6, 665e-6, 793e-6, 87.6e-3, 76.2e-6, 665e-6, 793e-6, 87.6e-3, 123000e-9, 2.1e+11, 0.3),
+    ('HSS9X9X_375', 'HSS9X9X_375', 63.6, 7610e-6, 229e-3, 229e-3, 9.53e-3, 60.4e-6, 528e-6, 619e-6, 89.2e-3, 60.4e-6, 528e-6, 619e-6, 89.2e-3, 96100e-9, 2.1e+11, 0.3),
+    ('HSS9X9X_313', 'HSS9X9X_313', 53.6, 6400e-6, 229e-3, 229e-3, 7.94e-3, 51.6e-6, 452e-6, 526e-6, 89.9e-3, 51.6e-6, 452e-6, 526e-6, 89.9e-3, 81600e-9, 2.1e+11, 0.3),
+    ('HSS9X9X_250', 'HSS9X9X_250', 43.4, 5180e-6, 229e-3, 229e-3, 6.35e-3, 42.5e-6, 372e-6, 429e-6, 90.4e-3, 42.5e-6, 372e-6, 429e-6, 90.4e-3, 66200e-9, 2.1e+11, 0.3),
+    ('HSS9X9X_188', 'HSS9X9X_188', 33, 3910e-6, 229e-3, 229e-3, 4.76e-3, 32.5e-6, 285e-6, 328e-6, 91.2e-3, 32.5e-6, 285e-6, 328e-6, 91.2e-3, 50400e-9, 2.1e+11, 0.3),
+    ('HSS9X9X_125', 'HSS9X9X_125', 22.3, 2640e-6, 229e-3, 229e-3, 3.18e-3, 22.3e-6, 195e-6, 223e-6, 91.9e-3, 22.3e-6, 195e-6, 223e-6, 91.9e-3, 34100e-9, 2.1e+11, 0.3),
+    ('HSS9X7X_625', 'HSS9X7X_625', 88, 10600e-6, 229e-3, 178e-3, 15.9e-3, 72.4e-6, 634e-6, 791e-6, 82.8e-3, 48.7e-6, 549e-6, 664e-6, 68.1e-3, 97800e-9, 2.1e+11, 0.3),
+    ('HSS9X7X_500', 'HSS9X7X_500', 72.5, 8710e-6, 229e-3, 178e-3, 12.7e-3, 62e-6, 541e-6, 664e-6, 84.3e-3, 41.6e-6, 470e-6, 557e-6, 69.3e-3, 82000e-9, 2.1e+11, 0.3),
+    ('HSS9X7X_375', 'HSS9X7X_375', 56, 6710e-6, 229e-3, 178e-3, 9.53e-3, 49.5e-6, 433e-6, 521e-6, 85.9e-3, 33.5e-6, 377e-6, 438e-6, 70.6e-3, 64100e-9, 2.1e+11, 0.3),
+    ('HSS9X7X_313', 'HSS9X7X_313', 47.4, 5650e-6, 229e-3, 178e-3, 7.94e-3, 42.5e-6, 370e-6, 444e-6, 86.6e-3, 28.8e-6, 324e-6, 374e-6, 71.4e-3, 54500e-9, 2.1e+11, 0.3),
+    ('HSS9X7X_250', 'HSS9X7X_250', 38.4, 4580e-6, 229e-3, 178e-3, 6.35e-3, 35e-6, 306e-6, 364e-6, 87.4e-3, 23.8e-6, 267e-6, 306e-6, 72.1e-3, 44500e-9, 2.1e+11, 0.3),
+    ('HSS9X7X_188', 'HSS9X7X_188', 29.3, 3460e-6, 229e-3, 178e-3, 4.76e-3, 26.9e-6, 236e-6, 277e-6, 88.1e-3, 18.4e-6, 206e-6, 234e-6, 72.9e-3, 34000e-9, 2.1e+11, 0.3),
+    ('HSS9X5X_625', 'HSS9X5X_625', 75.3, 9030e-6, 229e-3, 127e-3, 15.9e-3, 55.4e-6, 485e-6, 631e-6, 78.2e-3, 21.6e-6, 341e-6, 415e-6, 48.8e-3, 53300e-9, 2.1e+11, 0.3),
+    ('HSS9X5X_500', 'HSS9X5X_500', 62.4, 7480e-6, 229e-3, 127e-3, 12.7e-3, 47.9e-6, 418e-6, 533e-6, 79.8e-3, 18.8e-6, 297e-6, 352e-6, 50e-3, 45400e-9, 2.1e+11, 0.3),
+    ('HSS9X5X_375', 'HSS9X5X_375', 48.4, 5790e-6, 229e-3, 127e-3, 9.53e-3, 38.5e-6, 336e-6, 421e-6, 81.5e-3, 15.3e-6, 241e-6, 280e-6, 51.6e-3, 36200e-9, 2.1e+11, 0.3),
+    ('HSS9X5X_313', 'HSS9X5X_313', 41, 4900e-6, 229e-3, 127e-3, 7.94e-3, 33.2e-6, 290e-6, 361e-6, 82.3e-3, 13.3e-6, 210e-6, 239e-6, 52.1e-3, 31000e-9, 2.1e+11, 0.3),
+    ('HSS9X5X_250', 'HSS9X5X_250', 33.3, 3980e-6, 229e-3, 127e-3, 6.35e-3, 27.5e-6, 241e-6, 297e-6, 83.1e-3, 11.1e-6, 174e-6, 197e-6, 52.8e-3, 25500e-9, 2.1e+11, 0.3),
+    ('HSS9X5X_188', 'HSS9X5X_188', 25.4, 3010e-6, 229e-3, 127e-3, 4.76e-3, 21.3e-6, 187e-6, 226e-6, 84.1e-3, 8.62e-6, 136e-6, 152e-6, 53.3e-3, 19500e-9, 2.1e+11, 0.3),
+    ('HSS9X3X_500', 'HSS9X3X_500', 52.2, 6280e-6, 229e-3, 76.2e-3, 12.7e-3, 33.6e-6, 295e-6, 403e-6, 73.2e-3, 5.49e-6, 144e-6, 177e-6, 29.7e-3, 16600e-9, 2.1e+11, 0.3),
+    ('HSS9X3X_375', 'HSS9X3X_375', 40.8, 4890e-6, 229e-3, 76.2e-3, 9.53e-3, 27.6e-6, 241e-6, 323e-6, 75.2e-3, 4.66e-6, 122e-6, 144e-6, 30.7e-3, 13800e-9, 2.1e+11, 0.3),
+    ('HSS9X3X_313', 'HSS9X3X_313', 34.7, 4150e-6, 229e-3, 76.2e-3, 7.94e-3, 24e-6, 210e-6, 277e-6, 76.2e-3, 4.11e-6, 108e-6, 125e-6, 31.5e-3, 12000e-9, 2.1e+11, 0.3),
+    ('HSS9X3X_250', 'HSS9X3X_250', 28.3, 3380e-6, 229e-3, 76.2e-3, 6.35e-3, 20.1e-6, 175e-6, 229e-6, 77.2e-3, 3.49e-6, 91.6e-6, 104e-6, 32.3e-3, 10100e-9, 2.1e+11, 0.3),
+    ('HSS9X3X_188', 'HSS9X3X_188', 21.6, 2570e-6, 229e-3, 76.2e-3, 4.76e-3, 15.7e-6, 137e-6, 177e-6, 78e-3, 2.76e-6, 72.4e-6, 80.6e-6, 32.8e-3, 7870e-9, 2.1e+11, 0.3),
+    ('HSS8X8X_625', 'HSS8X8X_625', 88, 10600e-6, 203e-3, 203e-3, 15.9e-3, 60.8e-6, 598e-6, 733e-6, 75.9e-3, 60.8e-6, 598e-6, 733e-6, 75.9e-3, 102000e-9, 2.1e+11, 0.3),
+    ('HSS8X8X_500', 'HSS8X8X_500', 72.5, 8710e-6, 203e-3, 203e-3, 12.7e-3, 52e-6, 511e-6, 615e-6, 77.2e-3, 52e-6, 511e-6, 615e-6, 77.2e-3, 84900e-9, 2.1e+11, 0.3),
+    ('HSS8X8X_375', 'HSS8X8X_375', 56, 6710e-6, 203e-3, 203e-3, 9.53e-3, 41.6e-6, 408e-6, 482e-6, 78.7e-3, 41.6e-6, 408e-6, 482e-6, 78.7e-3, 66600e-9, 2.1e+11, 0.3),
+    ('HSS8X8X_313', 'HSS8X8X_313', 47.3, 5650e-6, 203e-3, 203e-3, 7.94e-3, 35.6e-6, 351e-6, 411e-6, 79.5e-3, 35.6e-6, 351e-6, 411e-6, 79.5e-3, 56600e-9, 2.1e+11, 0.3),
+    ('HSS8X8X_250', 'HSS8X8X_250', 38.4, 4580e-6, 203e-3, 203e-3, 6.35e-3, 29.4e-6, 290e-6, 336e-6, 80e-3, 29.4e-6, 290e-6, 336e-6, 80e-3, 46200e-9, 2.1e+11, 0.3),
+    ('HSS8X8X_188', 'HSS8X8X_188', 29.2, 3460e-6, 203e-3, 203e-3, 4.76e-3, 22.6e-6, 223e-6, 257e-6, 80.8e-3, 22.6e-6, 223e-6, 257e-6, 80.8e-3, 35200e-9, 2.1e+11, 0.3),
+    ('HSS8X8X_125', 'HSS8X8X_125', 19.7, 2340e-6, 203e-3, 203e-3, 3.18e-3, 15.6e-6, 153e-6, 175e-6, 81.5e-3, 15.6e-6, 153e-6, 175e-6, 81.5e-3, 23900e-9, 2.1e+11, 0.3),
+    ('HSS8X6X_625', 'HSS8X6X_625', 75.3, 9030e-6, 203e-3, 152e-3, 15.9e-3, 47.5e-6, 467e-6, 592e-6, 72.4e-3, 30.1e-6, 395e-6, 483e-6, 57.7e-3, 62400e-9, 2.1e+11, 0.3),
+    ('HSS8X6X_500', 'HSS8X6X_500', 62.4, 7480e-6, 203e-3, 152e-3, 12.7e-3, 40.9e-6, 403e-6, 500e-6, 73.9e-3, 26e-6, 341e-6, 408e-6, 58.9e-3, 52900e-9, 2.1e+11, 0.3),
+    ('HSS8X6X_375', 'HSS8X6X_375', 48.4, 5790e-6, 203e-3, 152e-3, 9.53e-3, 32.9e-6, 324e-6, 395e-6, 75.4e-3, 21.1e-6, 277e-6, 324e-6, 60.5e-3, 41600e-9, 2.1e+11, 0.3),
+    ('HSS8X6X_313', 'HSS8X6X_313', 41, 4900e-6, 203e-3, 152e-3, 7.94e-3, 28.4e-6, 280e-6, 338e-6, 76.2e-3, 18.2e-6, 239e-6, 277e-6, 61e-3, 35700e-9, 2.1e+11, 0.3),
+    ('HSS8X6X_250', 'HSS8X6X_250', 33.3, 3980e-6, 203e-3, 152e-3, 6.35e-3, 23.6e-6, 233e-6, 277e-6, 77e-3, 15.2e-6, 198e-6, 228e-6, 61.7e-3, 29300e-9, 2.1e+11, 0.3),
+    ('HSS8X6X_188', 'HSS8X6X_188', 25.4, 3010e-6, 203e-3, 152e-3, 4.76e-3, 18.2e-6, 179e-6, 213e-6, 77.7e-3, 11.7e-6, 154e-6, 175e-6, 62.5e-3, 22400e-9, 2.1e+11, 0.3),
+    ('HSS8X4X_625', 'HSS8X4X_625', 62.6, 7550e-6, 203e-3, 102e-3, 15.9e-3, 34.1e-6, 336e-6, 449e-6, 67.1e-3, 11.1e-6, 218e-6, 272e-6, 38.4e-3, 29300e-9, 2.1e+11, 0.3),
+    ('HSS8X4X_500', 'HSS8X4X_500', 52.2, 6280e-6, 203e-3, 102e-3, 12.7e-3, 29.9e-6, 293e-6, 385e-6, 68.8e-3, 9.82e-6, 193e-6, 234e-6, 39.6e-3, 25400e-9, 2.1e+11, 0.3),
+    ('HSS8X4X_375', 'HSS8X4X_375', 40.8, 4890e-6, 203e-3, 102e-3, 9.53e-3, 24.4e-6, 241e-6, 308e-6, 70.6e-3, 8.16e-6, 161e-6, 188e-6, 40.9e-3, 20500e-9, 2.1e+11, 0.3),
+    ('HSS8X4X_313', 'HSS8X4X_313', 34.7, 4150e-6, 203e-3, 102e-3, 7.94e-3, 21.2e-6, 210e-6, 264e-6, 71.6e-3, 7.16e-6, 141e-6, 162e-6, 41.4e-3, 17700e-9, 2.1e+11, 0.3),
+    ('HSS8X4X_250', 'HSS8X4X_250', 28.3, 3380e-6, 203e-3, 102e-3, 6.35e-3, 17.7e-6, 174e-6, 218e-6, 72.4e-3, 5.99e-6, 118e-6, 134e-6, 42.2e-3, 14700e-9, 2.1e+11, 0.3),
+    ('HSS8X4X_188', 'HSS8X4X_188', 21.6, 2570e-6, 203e-3, 102e-3, 4.76e-3, 13.8e-6, 136e-6, 167e-6, 73.2e-3, 4.7e-6, 92.6e-6, 104e-6, 42.9e-3, 11300e-9, 2.1e+11, 0.3),
+    ('HSS8X4X_125', 'HSS8X4X_125', 14.7, 1740e-6, 203e-3, 102e-3, 3.18e-3, 9.53e-6, 93.9e-6, 115e-6, 74.2e-3, 3.29e-6, 64.7e-6, 71.4e-6, 43.4e-3, 7780e-9, 2.1e+11, 0.3),
+    ('HSS8X3X_500', 'HSS8X3X_500', 47.2, 5680e-6, 203e-3, 76.2e-3, 12.7e-3, 24.4e-6, 239e-6, 328e-6, 65.5e-3, 4.87e-6, 128e-6, 158e-6, 29.2e-3, 14300e-9, 2.1e+11, 0.3),
+    ('HSS8X3X_375', 'HSS8X3X_375', 37, 4440e-6, 203e-3, 76.2e-3, 9.53e-3, 20.2e-6, 198e-6, 264e-6, 67.3e-3, 4.16e-6, 109e-6, 129e-6, 30.5e-3, 11900e-9, 2.1e+11, 0.3),
+    ('HSS8X3X_313', 'HSS8X3X_313', 31.5, 3770e-6, 203e-3, 76.2e-3, 7.94e-3, 17.6e-6, 174e-6, 228e-6, 68.3e-3, 3.67e-6, 96.2e-6, 112e-6, 31.2e-3, 10400e-9, 2.1e+11, 0.3),
+    ('HSS8X3X_250', 'HSS8X3X_250', 25.7, 3080e-6, 203e-3, 76.2e-3, 6.35e-3, 14.8e-6, 146e-6, 188e-6, 69.3e-3, 3.12e-6, 81.8e-6, 93.4e-6, 31.8e-3, 8660e-9, 2.1e+11, 0.3),
+    ('HSS8X3X_188', 'HSS8X3X_188', 19.7, 2340e-6, 203e-3, 76.2e-3, 4.76e-3, 11.6e-6, 114e-6, 145e-6, 70.4e-3, 2.47e-6, 64.9e-6, 72.6e-6, 32.5e-3, 6740e-9, 2.1e+11, 0.3),
+    ('HSS8X3X_125', 'HSS8X3X_125', 13.4, 1590e-6, 203e-3, 76.2e-3, 3.18e-3, 8.03e-6, 79.1e-6, 100e-6, 71.1e-3, 1.75e-6, 45.9e-6, 50.3e-6, 33.3e-3, 4700e-9, 2.1e+11, 0.3),
+    ('HSS8X2X_375', 'HSS8X2X_375', 33.2, 3990e-6, 203e-3, 50.8e-3, 9.53e-3, 15.9e-6, 157e-6, 220e-6, 63.2e-3, 1.55e-6, 61.1e-6, 75.5e-6, 19.7e-3, 5040e-9, 2.1e+11, 0.3),
+    ('HSS8X2X_313', 'HSS8X2X_313', 28.4, 3390e-6, 203e-3, 50.8e-3, 7.94e-3, 14e-6, 138e-6, 190e-6, 64.3e-3, 1.41e-6, 55.4e-6, 66.5e-6, 20.4e-3, 4540e-9, 2.1e+11, 0.3),
+    ('HSS8X2X_250', 'HSS8X2X_250', 23.2, 2770e-6, 203e-3, 50.8e-3, 6.35e-3, 11.9e-6, 117e-6, 159e-6, 65.3e-3, 1.22e-6, 48.2e-6, 56.2e-6, 21e-3, 3900e-9, 2.1e+11, 0.3),
+    ('HSS8X2X_188', 'HSS8X2X_188', 17.8, 2120e-6, 203e-3, 50.8e-3, 4.76e-3, 9.32e-6, 91.9e-6, 123e-6, 66.3e-3, 0.995e-6, 39.2e-6, 44.2e-6, 21.7e-3, 3110e-9, 2.1e+11, 0.3),
+    ('HSS8X2X_125', 'HSS8X2X_125', 12.1, 1440e-6, 203e-3, 50.8e-3, 3.18e-3, 6.53e-6, 64.4e-6, 85e-6, 67.3e-3, 0.716e-6, 28.2e-6, 31.1e-6, 22.3e-3, 2210e-9, 2.1e+11, 0.3),
+    ('HSS7X7X_625', 'HSS7X7X_625', 75.3, 9030e-6, 178e-3, 178e-3, 15.9e-3, 38.9e-6, 438e-6, 542e-6, 65.5e-3, 38.9e-6, 438e-6, 542e-6, 65.5e-3, 65800e-9, 2.1e+11, 0.3),
+    ('HSS7X7X_500', 'HSS7X7X_500', 62.4, 7480e-6, 178e-3, 178e-3, 12.7e-3, 33.5e-6, 377e-6, 457e-6, 66.8e-3, 33.5e-6, 377e-6, 457e-6, 66.8e-3, 55400e-9, 2.1e+11, 0.3),
+    ('HSS7X7X_375', 'HSS7X7X_375', 48.4, 5790e-6, 178e-3, 178e-3, 9.53e-3, 27.1e-6, 305e-6, 362e-6, 68.3e-3, 27.1e-6, 305e-6, 362e-6, 68.3e-3, 43700e-9, 2.1e+11, 0.3),
+    ('HSS7X7X_313', 'HSS7X7X_313', 41, 4900e-6, 178e-3, 178e-3, 7.94e-3, 23.4e-6, 262e-6, 310e-6, 69.1e-3, 23.4e-6, 262e-6, 310e-6, 69.1e-3, 37300e-9, 2.1e+11, 0.3),
+    ('HSS7X7X_250', 'HSS7X7X_250', 33.3, 3980e-6, 178e-3, 178e-3, 6.35e-3, 19.4e-6, 218e-6, 254e-6, 69.9e-3, 19.4e-6, 218e-6, 254e-6, 69.9e-3, 30600e-9, 2.1e+11, 0.3),
+    ('HSS7X7X_188', 'HSS7X7X_188', 25.4, 3010e-6, 178e-3, 178e-3, 4.76e-3, 15e-6, 169e-6, 195e-6, 70.4e-3, 15e-6, 169e-6, 195e-6, 70.4e-3, 23400e-9, 2.1e+11, 0.3),
+    ('HSS7X7X_125', 'HSS7X7X_125', 17.2, 2040e-6, 178e-3, 178e-3, 3.18e-3, 10.3e-6, 116e-6, 133e-6, 71.1e-3, 10.3e-6, 116e-6, 133e-6, 71.1e-3, 15900e-9, 2.1e+11, 0.3),
+    ('HSS7X5X_500', 'HSS7X5X_500', 52.2, 6280e-6, 178e-3, 127e-3, 12.7e-3, 25.2e-6, 283e-6, 359e-6, 63.5e-3, 14.8e-6, 233e-6, 283e-6, 48.5e-3, 31600e-9, 2.1e+11, 0.3),
+    ('HSS7X5X_375', 'HSS7X5X_375', 40.8, 4890e-6, 178e-3, 127e-3, 9.53e-3, 20.6e-6, 231e-6, 287e-6, 65e-3, 12.2e-6, 192e-6, 226e-6, 50e-3, 25200e-9, 2.1e+11, 0.3),
+    ('HSS7X5X_313', 'HSS7X5X_313', 34.7, 4150e-6, 178e-3, 127e-3, 7.94e-3, 17.9e-6, 202e-6, 246e-6, 65.8e-3, 10.6e-6, 167e-6, 195e-6, 50.5e-3, 21700e-9, 2.1e+11, 0.3),
+    ('HSS7X5X_250', 'HSS7X5X_250', 28.3, 3380e-6, 178e-3, 127e-3, 6.35e-3, 14.9e-6, 167e-6, 203e-6, 66.5e-3, 8.87e-6, 140e-6, 161e-6, 51.3e-3, 17900e-9, 2.1e+11, 0.3),
+    ('HSS7X5X_188', 'HSS7X5X_188', 21.6, 2570e-6, 178e-3, 127e-3, 4.76e-3, 11.6e-6, 130e-6, 156e-6, 67.3e-3, 6.91e-6, 109e-6, 124e-6, 52.1e-3, 13700e-9, 2.1e+11, 0.3),
+    ('HSS7X5X_125', 'HSS7X5X_125', 14.7, 1740e-6, 178e-3, 127e-3, 3.18e-3, 8.03e-6, 90.5e-6, 107e-6, 68.1e-3, 4.83e-6, 75.9e-6, 85.2e-6, 52.6e-3, 9370e-9, 2.1e+11, 0.3),
+    ('HSS7X4X_500', 'HSS7X4X_500', 47.2, 5680e-6, 178e-3, 102e-3, 12.7e-3, 21.1e-6, 238e-6, 308e-6, 61e-3, 8.62e-6, 170e-6, 206e-6, 38.9e-3, 21000e-9, 2.1e+11, 0.3),
+    ('HSS7X4X_375', 'HSS7X4X_375', 37, 4440e-6, 178e-3, 102e-3, 9.53e-3, 17.4e-6, 195e-6, 247e-6, 62.5e-3, 7.2e-6, 141e-6, 167e-6, 40.1e-3, 17100e-9, 2.1e+11, 0.3),
+    ('HSS7X4X_313', 'HSS7X4X_313', 31.5, 3770e-6, 178e-3, 102e-3, 7.94e-3, 15.2e-6, 170e-6, 215e-6, 63.5e-3, 6.33e-6, 124e-6, 145e-6, 40.9e-3, 14700e-9, 2.1e+11, 0.3),
+    ('HSS7X4X_250', 'HSS7X4X_250', 25.7, 3080e-6, 178e-3, 102e-3, 6.35e-3, 12.7e-6, 143e-6, 177e-6, 64.3e-3, 5.33e-6, 105e-6, 120e-6, 41.7e-3, 12200e-9, 2.1e+11, 0.3),
+    ('HSS7X4X_188', 'HSS7X4X_188', 19.7, 2340e-6, 178e-3, 102e-3, 4.76e-3, 9.91e-6, 112e-6, 137e-6, 65e-3, 4.16e-6, 82.3e-6, 92.9e-6, 42.2e-3, 9450e-9, 2.1e+11, 0.3),
+    ('HSS7X4X_125', 'HSS7X4X_125', 13.4, 1590e-6, 178e-3, 102e-3, 3.18e-3, 6.91e-6, 77.5e-6, 93.9e-6, 65.8e-3, 2.93e-6, 57.5e-6, 64.1e-6, 42.9e-3, 6490e-9, 2.1e+11, 0.3),
+    ('HSS7X3X_500', 'HSS7X3X_500', 42.1, 5080e-6, 178e-3, 76.2e-3, 12.7e-3, 16.9e-6, 190e-6, 259e-6, 57.7e-3, 4.25e-6, 111e-6, 139e-6, 29e-3, 11900e-9, 2.1e+11, 0.3),
+    ('HSS7X3X_375', 'HSS7X3X_375', 33.2, 3990e-6, 178e-3, 76.2e-3, 9.53e-3, 14.2e-6, 159e-6, 210e-6, 59.7e-3, 3.63e-6, 95.2e-6, 114e-6, 30.2e-3, 9950e-9, 2.1e+11, 0.3),
+    ('HSS7X3X_313', 'HSS7X3X_313', 28.4, 3390e-6, 178e-3, 76.2e-3, 7.94e-3, 12.4e-6, 140e-6, 182e-6, 60.5e-3, 3.22e-6, 84.6e-6, 99.1e-6, 30.7e-3, 8700e-9, 2.1e+11, 0.3),
+    ('HSS7X3X_250', 'HSS7X3X_250', 23.2, 2770e-6, 178e-3, 76.2e-3, 6.35e-3, 10.5e-6, 118e-6, 151e-6, 61.5e-3, 2.75e-6, 72.1e-6, 82.9e-6, 31.5e-3, 7280e-9, 2.1e+11, 0.3),
+    ('HSS7X3X_188', 'HSS7X3X_188', 17.8, 2120e-6, 178e-3, 76.2e-3, 4.76e-3, 8.24e-6, 92.6e-6, 117e-6, 62.2e-3, 2.18e-6, 57.4e-6, 64.6e-6, 32e-3, 5700e-9, 2.1e+11, 0.3),
+    ('HSS7X3X_125', 'HSS7X3X_125', 12.1, 1440e-6, 178e-3, 76.2e-3, 3.18e-3, 5.74e-6, 64.7e-6, 80.8e-6, 63.2e-3, 1.54e-6, 40.6e-6, 44.7e-6, 32.8e-3, 3950e-9, 2.1e+11, 0.3),
+    ('HSS7X2X_250', 'HSS7X2X_250', 20.7, 2480e-6, 178e-3, 50.8e-3, 6.35e-3, 8.24e-6, 92.9e-6, 125e-6, 57.7e-3, 1.07e-6, 42.3e-6, 49.5e-6, 20.8e-3, 3310e-9, 2.1e+11, 0.3),
+    ('HSS7X2X_188', 'HSS7X2X_188', 15.9, 1890e-6, 178e-3, 50.8e-3, 4.76e-3, 6.53e-6, 73.6e-6, 97.5e-6, 58.7e-3, 0.874e-6, 34.4e-6, 39.2e-6, 21.5e-3, 2640e-9, 2.1e+11, 0.3),
+    ('HSS7X2X_125', 'HSS7X2X_125', 10.9, 1290e-6, 178e-3, 50.8e-3, 3.18e-3, 4.62e-6, 51.8e-6, 67.7e-6, 59.7e-3, 0.633e-6, 24.9e-6, 27.5e-6, 22.1e-3, 1880e-9, 2.1e+11, 0.3),
+    ('HSS6X6X_625', 'HSS6X6X_625', 62.6, 7550e-6, 152e-3, 152e-3, 15.9e-3, 23e-6, 302e-6, 380e-6, 55.1e-3, 23e-6, 302e-6, 380e-6, 55.1e-3, 39500e-9, 2.1e+11, 0.3),
+    ('HSS6X6X_500', 'HSS6X6X_500', 52.2, 6280e-6, 152e-3, 152e-3, 12.7e-3, 20.1e-6, 264e-6, 324e-6, 56.6e-3, 20.1e-6, 264e-6, 324e-6, 56.6e-3, 33800e-9, 2.1e+11, 0.3),
+    ('HSS6X6X_375', 'HSS6X6X_375', 40.8, 4890e-6, 152e-3, 152e-3, 9.53e-3, 16.4e-6, 216e-6, 259e-6, 57.9e-3, 16.4e-6, 216e-6, 259e-6, 57.9e-3, 26900e-9, 2.1e+11, 0.3),
+    ('HSS6X6X_313', 'HSS6X6X_313', 34.6, 4150e-6, 152e-3, 152e-3, 7.94e-3, 14.3e-6, 187e-6, 223e-6, 58.7e-3, 14.3e-6, 187e-6, 223e-6, 58.7e-3, 23100e-9, 2.1e+11, 0.3),
+    ('HSS6X6X_250', 'HSS6X6X_250', 28.3, 3380e-6, 152e-3, 152e-3, 6.35e-3, 11.9e-6, 156e-6, 184e-6, 59.4e-3, 11.9e-6, 156e-6, 184e-6, 59.4e-3, 19000e-9, 2.1e+11, 0.3),
+    ('HSS6X6X_188', 'HSS6X6X_188', 21.6, 2570e-6, 152e-3, 152e-3, 4.76e-3, 9.28e-6, 122e-6, 141e-6, 60.2e-3, 9.28e-6, 122e-6, 141e-6, 60.2e-3, 14600e-9, 2.1e+11, 0.3),
+    ('HSS6X6X_125', 'HSS6X6X_125', 14.7, 1740e-6, 152e-3, 152e-3, 3.18e-3, 6.45e-6, 84.4e-6, 97e-6, 60.7e-3, 6.45e-6, 84.4e-6, 97e-6, 60.7e-3, 9950e-9, 2.1e+11, 0.3),
+    ('HSS6X5X_500', 'HSS6X5X_500', 47.2, 5680e-6, 152e-3, 127e-3, 12.7e-3, 17.1e-6, 225e-6, 282e-6, 54.9e-3, 12.8e-6, 202e-6, 249e-6, 47.5e-3, 24900e-9, 2.1e+11, 0.3),
+    ('HSS6X5X_375', 'HSS6X5X_375', 37, 4440e-6, 152e-3, 127e-3, 9.53e-3, 14.1e-6, 185e-6, 226e-6, 56.4e-3, 10.6e-6, 167e-6, 200e-6, 48.8e-3, 20000e-9, 2.1e+11, 0.3),
+    ('HSS6X5X_313', 'HSS6X5X_313', 31.5, 3770e-6, 152e-3, 127e-3, 7.94e-3, 12.3e-6, 161e-6, 195e-6, 57.2e-3, 9.28e-6, 146e-6, 172e-6, 49.5e-3, 17200e-9, 2.1e+11, 0.3),
+    ('HSS6X5X_250', 'HSS6X5X_250', 25.7, 3080e-6, 152e-3, 127e-3, 6.35e-3, 10.3e-6, 135e-6, 162e-6, 57.9e-3, 7.78e-6, 122e-6, 143e-6, 50.3e-3, 14200e-9, 2.1e+11, 0.3),
+    ('HSS6X5X_188', 'HSS6X5X_188', 19.7, 2340e-6, 152e-3, 127e-3, 4.76e-3, 8.03e-6, 106e-6, 125e-6, 58.7e-3, 6.08e-6, 95.7e-6, 110e-6, 51.1e-3, 10900e-9, 2.1e+11, 0.3),
+    ('HSS6X5X_125', 'HSS6X5X_125', 13.4, 1590e-6, 152e-3, 127e-3, 3.18e-3, 5.58e-6, 73.4e-6, 85.9e-6, 59.4e-3, 4.25e-6, 66.7e-6, 75.9e-6, 51.6e-3, 7490e-9, 2.1e+11, 0.3),
+    ('HSS6X4X_500', 'HSS6X4X_500', 42.1, 5080e-6, 152e-3, 102e-3, 12.7e-3, 14.2e-6, 185e-6, 239e-6, 52.8e-3, 7.41e-6, 146e-6, 180e-6, 38.1e-3, 16800e-9, 2.1e+11, 0.3),
+    ('HSS6X4X_375', 'HSS6X4X_375', 33.2, 3990e-6, 152e-3, 102e-3, 9.53e-3, 11.8e-6, 155e-6, 195e-6, 54.4e-3, 6.2e-6, 122e-6, 147e-6, 39.4e-3, 13700e-9, 2.1e+11, 0.3),
+    ('HSS6X4X_313', 'HSS6X4X_313', 28.4, 3390e-6, 152e-3, 102e-3, 7.94e-3, 10.3e-6, 136e-6, 169e-6, 55.1e-3, 5.49e-6, 108e-6, 127e-6, 40.1e-3, 11800e-9, 2.1e+11, 0.3),
+    ('HSS6X4X_250', 'HSS6X4X_250', 23.2, 2770e-6, 152e-3, 102e-3, 6.35e-3, 8.7e-6, 114e-6, 140e-6, 55.9e-3, 4.62e-6, 91.1e-6, 106e-6, 40.9e-3, 9820e-9, 2.1e+11, 0.3),
+    ('HSS6X4X_188', 'HSS6X4X_188', 17.8, 2120e-6, 152e-3, 102e-3, 4.76e-3, 6.83e-6, 89.5e-6, 108e-6, 56.6e-3, 3.65e-6, 71.8e-6, 81.9e-6, 41.4e-3, 7580e-9, 2.1e+11, 0.3),
+    ('HSS6X4X_125', 'HSS6X4X_125', 12.1, 1440e-6, 152e-3, 102e-3, 3.18e-3, 4.75e-6, 62.4e-6, 74.7e-6, 57.4e-3, 2.56e-6, 50.5e-6, 56.7e-6, 42.2e-3, 5240e-9, 2.1e+11, 0.3),
+    ('HSS6X3X_500', 'HSS6X3X_500', 37.1, 4480e-6, 152e-3, 76.2e-3, 12.7e-3, 11.2e-6, 147e-6, 198e-6, 50e-3, 3.62e-6, 94.9e-6, 119e-6, 28.4e-3, 9610e-9, 2.1e+11, 0.3),
+    ('HSS6X3X_375', 'HSS6X3X_375', 29.4, 3540e-6, 152e-3, 76.2e-3, 9.53e-3, 9.45e-6, 124e-6, 162e-6, 51.8e-3, 3.11e-6, 81.8e-6, 98.8e-6, 29.7e-3, 8030e-9, 2.1e+11, 0.3),
+    ('HSS6X3X_313', 'HSS6X3X_313', 25.2, 3020e-6, 152e-3, 76.2e-3, 7.94e-3, 8.37e-6, 110e-6, 141e-6, 52.6e-3, 2.78e-6, 72.9e-6, 86.4e-6, 30.2e-3, 7030e-9, 2.1e+11, 0.3),
+    ('HSS6X3X_250', 'HSS6X3X_250', 20.7, 2480e-6, 152e-3, 76.2e-3, 6.35e-3, 7.08e-6, 92.8e-6, 118e-6, 53.3e-3, 2.37e-6, 62.3e-6, 72.3e-6, 31e-3, 5910e-9, 2.1e+11, 0.3),
+    ('HSS6X3X_188', 'HSS6X3X_188', 15.9, 1890e-6, 152e-3, 76.2e-3, 4.76e-3, 5.58e-6, 73.3e-6, 91.6e-6, 54.4e-3, 1.89e-6, 49.7e-6, 56.5e-6, 31.8e-3, 4620e-9, 2.1e+11, 0.3),
+    ('HSS6X3X_125', 'HSS6X3X_125', 10.9, 1290e-6, 152e-3, 76.2e-3, 3.18e-3, 3.93e-6, 51.5e-6, 63.4e-6, 55.1e-3, 1.34e-6, 35.2e-6, 39.3e-6, 32.3e-3, 3220e-9, 2.1e+11, 0.3),
+    ('HSS6X2X_375', 'HSS6X2X_375', 25.6, 3080e-6, 152e-3, 50.8e-3, 9.53e-3, 7.12e-6, 93.6e-6, 130e-6, 48e-3, 1.15e-6, 45.4e-6, 56.7e-6, 19.3e-3, 3500e-9, 2.1e+11, 0.3),
+    ('HSS6X2X_313', 'HSS6X2X_313', 22, 2650e-6, 152e-3, 50.8e-3, 7.94e-3, 6.37e-6, 83.7e-6, 114e-6, 49e-3, 1.05e-6, 41.3e-6, 50.3e-6, 19.9e-3, 3160e-9, 2.1e+11, 0.3),
+    ('HSS6X2X_250', 'HSS6X2X_250', 18.1, 2170e-6, 152e-3, 50.8e-3, 6.35e-3, 5.45e-6, 71.6e-6, 95.7e-6, 50e-3, 0.92e-6, 36.2e-6, 42.8e-6, 20.6e-3, 2730e-9, 2.1e+11, 0.3),
+    ('HSS6X2X_188', 'HSS6X2X_188', 14, 1660e-6, 152e-3, 50.8e-3, 4.76e-3, 4.37e-6, 57.2e-6, 75.1e-6, 51.1e-3, 0.749e-6, 29.5e-6, 33.9e-6, 21.2e-3, 2180e-9, 2.1e+11, 0.3),
+    ('HSS6X2X_125', 'HSS6X2X_125', 9.59, 1140e-6, 152e-3, 50.8e-3, 3.18e-3, 3.09e-6, 40.5e-6, 52.3e-6, 52.1e-3, 0.545e-6, 21.5e-6, 23.9e-6, 21.9e-3, 1550e-9, 2.1e+11, 0.3),
+    ('HSS5-1/2X5-1/2X_375', 'HSS5-1/2X5-1/2X_375', 37, 4440e-6, 140e-3, 140e-3, 9.53e-3, 12.4e-6, 177e-6, 215e-6, 52.8e-3, 12.4e-6, 177e-6, 215e-6, 52.8e-3, 20400e-9, 2.1e+11, 0.3),
+    ('HSS5-1/2X5-1/2X_313', 'HSS5-1/2X5-1/2X_313', 31.5, 3770e-6, 140e-3, 140e-3, 7.94e-3, 10.8e-6, 155e-6, 185e-6, 53.6e-3, 10.8e-6, 155e-6, 185e-6, 53.6e-3, 17600e-9, 2.1e+11, 0.3),
+    ('HSS5-1/2X5-1/2X_250', 'HSS5-1/2X5-1/2X_250', 25.7, 3080e-6, 140e-3, 140e-3, 6.35e-3, 9.03e-6, 129e-6, 153e-6, 54.1e-3, 9.03e-6, 129e-6, 153e-6, 54.1e-3, 14500e-9, 2.1e+11, 0.3),
+    ('HSS5-1/2X5-1/2X_188', 'HSS5-1/2X5-1/2X_188', 19.7, 2340e-6, 140e-3, 140e-3, 4.76e-3, 7.08e-6, 101e-6, 118e-6, 54.9e-3, 7.08e-6, 101e-6, 118e-6, 54.9e-3, 11100e-9, 2.1e+11, 0.3),
+    ('HSS5-1/2X5-1/2X_125', 'HSS5-1/2X5-1/2X_125', 13.4, 1590e-6, 140e-3, 140e-3, 3.18e-3, 4.91e-6, 70.5e-6, 81.1e-6, 55.6e-3, 4.91e-6, 70.5e-6, 81.1e-6, 55.6e-3, 7620e-9, 2.1e+11, 0.3),
+    ('HSS5X5X_500', 'HSS5X5X_500', 42.1, 5080e-6, 127e-3, 127e-3, 12.7e-3, 10.8e-6, 170e-6, 215e-6, 46.2e-3, 10.8e-6, 170e-6, 215e-6, 46.2e-3, 18600e-9, 2.1e+11, 0.3),
+    ('HSS5X5X_375', 'HSS5X5X_375', 33.2, 3990e-6, 127e-3, 127e-3, 9.53e-3, 9.03e-6, 142e-6, 174e-6, 47.5e-3, 9.03e-6, 142e-6, 174e-6, 47.5e-3, 15000e-9, 2.1e+11, 0.3),
+    ('HSS5X5X_313', 'HSS5X5X_313', 28.3, 3390e-6, 127e-3, 127e-3, 7.94e-3, 7.91e-6, 125e-6, 150e-6, 48.3e-3, 7.91e-6, 125e-6, 150e-6, 48.3e-3, 13000e-9, 2.1e+11, 0.3),
+    ('HSS5X5X_250', 'HSS5X5X_250', 23.2, 2770e-6, 127e-3, 127e-3, 6.35e-3, 6.66e-6, 105e-6, 125e-6, 49e-3, 6.66e-6, 105e-6, 125e-6, 49e-3, 10700e-9, 2.1e+11, 0.3),
+    ('HSS5X5X_188', 'HSS5X5X_188', 17.8, 2120e-6, 127e-3, 127e-3, 4.76e-3, 5.24e-6, 82.4e-6, 96.5e-6, 49.8e-3, 5.24e-6, 82.4e-6, 96.5e-6, 49.8e-3, 8280e-9, 2.1e+11, 0.3),
+    ('HSS5X5X_125', 'HSS5X5X_125', 12.1, 1440e-6, 127e-3, 127e-3, 3.18e-3, 3.66e-6, 57.7e-6, 66.7e-6, 50.5e-3, 3.66e-6, 57.7e-6, 66.7e-6, 50.5e-3, 5700e-9, 2.1e+11, 0.3),
+    ('HSS5X4X_500', 'HSS5X4X_500', 37.1, 4480e-6, 127e-3, 102e-3, 12.7e-3, 8.82e-6, 139e-6, 179e-6, 44.5e-3, 6.2e-6, 122e-6, 153e-6, 37.1e-3, 12600e-9, 2.1e+11, 0.3),
+    ('HSS5X4X_375', 'HSS5X4X_375', 29.4, 3540e-6, 127e-3, 102e-3, 9.53e-3, 7.45e-6, 117e-6, 147e-6, 46e-3, 5.24e-6, 103e-6, 126e-6, 38.6e-3, 10400e-9, 2.1e+11, 0.3),
+    ('HSS5X4X_313', 'HSS5X4X_313', 25.2, 3020e-6, 127e-3, 102e-3, 7.94e-3, 6.58e-6, 104e-6, 128e-6, 46.7e-3, 4.62e-6, 91.3e-6, 109e-6, 39.1e-3, 9030e-9, 2.1e+11, 0.3),
+    ('HSS5X4X_250', 'HSS5X4X_250', 20.7, 2480e-6, 127e-3, 102e-3, 6.35e-3, 5.58e-6, 87.7e-6, 106e-6, 47.5e-3, 3.94e-6, 77.5e-6, 91.3e-6, 39.9e-3, 7490e-9, 2.1e+11, 0.3),
+    ('HSS5X4X_188', 'HSS5X4X_188', 15.9, 1890e-6, 127e-3, 102e-3, 4.76e-3, 4.41e-6, 69.2e-6, 82.8e-6, 48.3e-3, 3.11e-6, 61.3e-6, 71.1e-6, 40.6e-3, 5830e-9, 2.1e+11, 0.3),
+    ('HSS5X4X_125', 'HSS5X4X_125', 10.9, 1290e-6, 127e-3, 102e-3, 3.18e-3, 3.09e-6, 48.7e-6, 57.4e-6, 49e-3, 2.19e-6, 43.3e-6, 49.3e-6, 41.1e-3, 4020e-9, 2.1e+11, 0.3),
+    ('HSS5X3X_500', 'HSS5X3X_500', 32, 3880e-6, 127e-3, 76.2e-3, 12.7e-3, 6.83e-6, 108e-6, 145e-6, 41.9e-3, 2.99e-6, 78.3e-6, 100e-6, 27.7e-3, 7330e-9, 2.1e+11, 0.3),
+    ('HSS5X3X_375', 'HSS5X3X_375', 25.6, 3080e-6, 127e-3, 76.2e-3, 9.53e-3, 5.87e-6, 92.6e-6, 120e-6, 43.7e-3, 2.6e-6, 68.2e-6, 83.6e-6, 29e-3, 6200e-9, 2.1e+11, 0.3),
+    ('HSS5X3X_313', 'HSS5X3X_313', 22, 2650e-6, 127e-3, 76.2e-3, 7.94e-3, 5.24e-6, 82.4e-6, 105e-6, 44.5e-3, 2.33e-6, 61.1e-6, 73.4e-6, 29.7e-3, 5450e-9, 2.1e+11, 0.3),
+    ('HSS5X3X_250', 'HSS5X3X_250', 18.1, 2170e-6, 127e-3, 76.2e-3, 6.35e-3, 4.45e-6, 70.3e-6, 88.2e-6, 45.2e-3, 2e-6, 52.6e-6, 61.8e-6, 30.2e-3, 4580e-9, 2.1e+11, 0.3),
+    ('HSS5X3X_188', 'HSS5X3X_188', 14, 1660e-6, 127e-3, 76.2e-3, 4.76e-3, 3.55e-6, 55.9e-6, 69e-6, 46.2e-3, 1.6e-6, 42.1e-6, 48.5e-6, 31e-3, 3600e-9, 2.1e+11, 0.3),
+    ('HSS5X3X_125', 'HSS5X3X_125', 9.59, 1140e-6, 127e-3, 76.2e-3, 3.18e-3, 2.51e-6, 39.5e-6, 48e-6, 47e-3, 1.14e-6, 30e-6, 33.9e-6, 31.8e-3, 2510e-9, 2.1e+11, 0.3),
+    ('HSS5X2-1/2X_250', 'HSS5X2-1/2X_250', 16.9, 2030e-6, 127e-3, 63.5e-3, 6.35e-3, 3.91e-6, 61.6e-6, 79.1e-6, 43.9e-3, 1.3e-6, 41e-6, 48.3e-6, 25.4e-3, 3300e-9, 2.1e+11, 0.3),
+    ('HSS5X2-1/2X_188', 'HSS5X2-1/2X_188', 13.1, 1550e-6, 127e-3, 63.5e-3, 4.76e-3, 3.13e-6, 49.3e-6, 62.1e-6, 45e-3, 1.05e-6, 33.3e-6, 38.2e-6, 25.9e-3, 2610e-9, 2.1e+11, 0.3),
+    ('HSS5X2-1/2X_125', 'HSS5X2-1/2X_125', 8.96, 1060e-6, 127e-3, 63.5e-3, 3.18e-3, 2.22e-6, 35.1e-6, 43.4e-6, 45.7e-3, 0.758e-6, 23.9e-6, 26.9e-6, 26.7e-3, 1830e-9, 2.1e+11, 0.3),
+    ('HSS5X2X_375', 'HSS5X2X_375', 21.8, 2640e-6, 127e-3, 50.8e-3, 9.53e-3, 4.33e-6, 67.8e-6, 93.6e-6, 40.4e-3, 0.949e-6, 37.4e-6, 47.2e-6, 19e-3, 2750e-9, 2.1e+11, 0.3),
+    ('HSS5X2X_313', 'HSS5X2X_313', 18.8, 2270e-6, 127e-3, 50.8e-3, 7.94e-3, 3.89e-6, 61.3e-6, 82.8e-6, 41.4e-3, 0.874e-6, 34.4e-6, 42.1e-6, 19.6e-3, 2490e-9, 2.1e+11, 0.3),
+    ('HSS5X2X_250', 'HSS5X2X_250', 15.6, 1880e-6, 127e-3, 50.8e-3, 6.35e-3, 3.36e-6, 52.9e-6, 70e-6, 42.4e-3, 0.766e-6, 30.2e-6, 36.1e-6, 20.2e-3, 2150e-9, 2.1e+11, 0.3),
+    ('HSS5X2X_188', 'HSS5X2X_188', 12.1, 1450e-6, 127e-3, 50.8e-3, 4.76e-3, 2.71e-6, 42.6e-6, 55.2e-6, 43.2e-3, 0.629e-6, 24.7e-6, 28.7e-6, 20.9e-3, 1730e-9, 2.1e+11, 0.3),
+    ('HSS5X2X_125', 'HSS5X2X_125', 8.33, 994e-6, 127e-3, 50.8e-3, 3.18e-3, 1.94e-6, 30.5e-6, 38.8e-6, 44.2e-3, 0.458e-6, 18e-6, 20.3e-6, 21.5e-3, 1230e-9, 2.1e+11, 0.3),
+    ('HSS4-1/2X4-1/2X_500', 'HSS4-1/2X4-1/2X_500', 37.1, 4480e-6, 114e-3, 114e-3, 12.7e-3, 7.53e-6, 132e-6, 167e-6, 40.9e-3, 7.53e-6, 132e-6, 167e-6, 40.9e-3, 13000e-9, 2.1e+11, 0.3),
+    ('HSS4-1/2X4-1/2X_375', 'HSS4-1/2X4-1/2X_375', 29.4, 3540e-6, 114e-3, 114e-3, 9.53e-3, 6.37e-6, 111e-6, 137e-6, 42.4e-3, 6.37e-6, 111e-6, 137e-6, 42.4e-3, 10700e-9, 2.1e+11, 0.3),
+    ('HSS4-1/2X4-1/2X_313', 'HSS4-1/2X4-1/2X_313', 25.2, 3020e-6, 114e-3, 114e-3, 7.94e-3, 5.62e-6, 98.3e-6, 119e-6, 43.2e-3, 5.62e-6, 98.3e-6, 119e-6, 43.2e-3, 9280e-9, 2.1e+11, 0.3),
+    ('HSS4-1/2X4-1/2X_250', 'HSS4-1/2X4-1/2X_250', 20.7, 2480e-6, 114e-3, 114e-3, 6.35e-3, 4.75e-6, 83.2e-6, 99.3e-6, 43.9e-3, 4.75e-6, 83.2e-6, 99.3e-6, 43.9e-3, 7700e-9, 2.1e+11, 0.3),
+    ('HSS4-1/2X4-1/2X_188', 'HSS4-1/2X4-1/2X_188', 15.9, 1890e-6, 114e-3, 114e-3, 4.76e-3, 3.75e-6, 65.7e-6, 77.2e-6, 44.5e-3, 3.75e-6, 65.7e-6, 77.2e-6, 44.5e-3, 5990e-9, 2.1e+11, 0.3),
+    ('HSS4-1/2X4-1/2X_125', 'HSS4-1/2X4-1/2X_125', 10.9, 1290e-6, 114e-3, 114e-3, 3.18e-3, 2.64e-6, 46.2e-6, 53.6e-6, 45.2e-3, 2.64e-6, 46.2e-6, 53.6e-6, 45.2e-3, 4130e-9, 2.1e+11, 0.3),
+    ('HSS4X4X_500', 'HSS4X4X_500', 32, 3880e-6, 102e-3, 102e-3, 12.7e-3, 4.95e-6, 97.8e-6, 126e-6, 35.8e-3, 4.95e-6, 97.8e-6, 126e-6, 35.8e-3, 8740e-9, 2.1e+11, 0.3),
+    ('HSS4X4X_375', 'HSS4X4X_375', 25.6, 3080e-6, 102e-3, 102e-3, 9.53e-3, 4.29e-6, 84.1e-6, 105e-6, 37.3e-3, 4.29e-6, 84.1e-6, 105e-6, 37.3e-3, 7280e-9, 2.1e+11, 0.3),
+    ('HSS4X4X_313', 'HSS4X4X_313', 22, 2650e-6, 102e-3, 102e-3, 7.94e-3, 3.8e-6, 74.9e-6, 91.6e-6, 37.8e-3, 3.8e-6, 74.9e-6, 91.6e-6, 37.8e-3, 6370e-9, 2.1e+11, 0.3),
+    ('HSS4X4X_250', 'HSS4X4X_250', 18.1, 2170e-6, 102e-3, 102e-3, 6.35e-3, 3.25e-6, 63.9e-6, 76.9e-6, 38.6e-3, 3.25e-6, 63.9e-6, 76.9e-6, 38.6e-3, 5330e-9, 2.1e+11, 0.3),
+    ('HSS4X4X_188', 'HSS4X4X_188', 14, 1660e-6, 102e-3, 102e-3, 4.76e-3, 2.58e-6, 50.8e-6, 60.1e-6, 39.4e-3, 2.58e-6, 50.8e-6, 60.1e-6, 39.4e-3, 4160e-9, 2.1e+11, 0.3),
+    ('HSS4X4X_125', 'HSS4X4X_125', 9.59, 1140e-6, 102e-3, 102e-3, 3.18e-3, 1.83e-6, 36.1e-6, 42e-6, 40.1e-3, 1.83e-6, 36.1e-6, 42e-6, 40.1e-3, 2880e-9, 2.1e+11, 0.3),
+    ('HSS4X3X_375', 'HSS4X3X_375', 21.8, 2640e-6, 102e-3, 76.2e-3, 9.53e-3, 3.3e-6, 65.1e-6, 83.9e-6, 35.3e-3, 2.09e-6, 54.7e-6, 68.5e-6, 28.2e-3, 4410e-9, 2.1e+11, 0.3),
+    ('HSS4X3X_313', 'HSS4X3X_313', 18.8, 2270e-6, 102e-3, 76.2e-3, 7.94e-3, 2.97e-6, 58.5e-6, 73.9e-6, 36.1e-3, 1.88e-6, 49.5e-6, 60.5e-6, 28.7e-3, 3920e-9, 2.1e+11, 0.3),
+    ('HSS4X3X_250', 'HSS4X3X_250', 15.6, 1880e-6, 102e-3, 76.2e-3, 6.35e-3, 2.56e-6, 50.3e-6, 62.4e-6, 36.8e-3, 1.63e-6, 42.8e-6, 51.1e-6, 29.5e-3, 3310e-9, 2.1e+11, 0.3),
+    ('HSS4X3X_188', 'HSS4X3X_188', 12.1, 1450e-6, 102e-3, 76.2e-3, 4.76e-3, 2.05e-6, 40.5e-6, 49.2e-6, 37.8e-3, 1.32e-6, 34.4e-6, 40.3e-6, 30.2e-3, 2610e-9, 2.1e+11, 0.3),
+    ('HSS4X3X_125', 'HSS4X3X_125', 8.33, 994e-6, 102e-3, 76.2e-3, 3.18e-3, 1.47e-6, 28.8e-6, 34.6e-6, 38.6e-3, 0.945e-6, 24.7e-6, 28.3e-6, 30.7e-3, 1820e-9, 2.1e+11, 0.3),
+    ('HSS4X2-1/2X_375', 'HSS4X2-1/2X_375', 19.9, 2410e-6, 102e-3, 63.5e-3, 9.53e-3, 2.82e-6, 55.4e-6, 73.4e-6, 34.3e-3, 1.32e-6, 41.6e-6, 52.4e-6, 23.4e-3, 3150e-9, 2.1e+11, 0.3),
+    ('HSS4X2-1/2X_313', 'HSS4X2-1/2X_313', 17.3, 2080e-6, 102e-3, 63.5e-3, 7.94e-3, 2.55e-6, 50.3e-6, 65.1e-6, 35.1e-3, 1.2e-6, 38e-6, 46.7e-6, 24.1e-3, 2820e-9, 2.1e+11, 0.3),
+    ('HSS4X2-1/2X_250', 'HSS4X2-1/2X_250', 14.3, 1720e-6, 102e-3, 63.5e-3, 6.35e-3, 2.21e-6, 43.6e-6, 55.4e-6, 35.8e-3, 1.05e-6, 33.1e-6, 39.8e-6, 24.7e-3, 2410e-9, 2.1e+11, 0.3),
+    ('HSS4X2-1/2X_188', 'HSS4X2-1/2X_188', 11.2, 1330e-6, 102e-3, 63.5e-3, 4.76e-3, 1.79e-6, 35.2e-6, 43.8e-6, 36.6e-3, 0.857e-6, 27e-6, 31.6e-6, 25.4e-3, 1910e-9, 2.1e+11, 0.3),
+    ('HSS4X2-1/2X_125', 'HSS4X2-1/2X_125', 7.7, 916e-6, 102e-3, 63.5e-3, 3.18e-3, 1.29e-6, 25.2e-6, 30.8e-6, 37.3e-3, 0.62e-6, 19.5e-6, 22.3e-6, 26.2e-3, 1340e-9, 2.1e+11, 0.3),
+    ('HSS4X2X_375', 'HSS4X2X_375', 18, 2190e-6, 102e-3, 50.8e-3, 9.53e-3, 2.33e-6, 45.9e-6, 62.9e-6, 32.8e-3, 0.749e-6, 29.5e-6, 37.9e-6, 18.5e-3, 2010e-9, 2.1e+11, 0.3),
+    ('HSS4X2X_313', 'HSS4X2X_313', 15.7, 1900e-6, 102e-3, 50.8e-3, 7.94e-3, 2.14e-6, 42e-6, 56.2e-6, 33.5e-3, 0.695e-6, 27.4e-6, 34.1e-6, 19.2e-3, 1830e-9, 2.1e+11, 0.3),
+    ('HSS4X2X_250', 'HSS4X2X_250', 13.1, 1570e-6, 102e-3, 50.8e-3, 6.35e-3, 1.87e-6, 36.9e-6, 48.2e-6, 34.5e-3, 0.616e-6, 24.3e-6, 29.3e-6, 19.8e-3, 1590e-9, 2.1e+11, 0.3),
+    ('HSS4X2X_188', 'HSS4X2X_188', 10.2, 1220e-6, 102e-3, 50.8e-3, 4.76e-3, 1.52e-6, 30e-6, 38.3e-6, 35.3e-3, 0.508e-6, 20e-6, 23.4e-6, 20.4e-3, 1280e-9, 2.1e+11, 0.3),
+    ('HSS4X2X_125', 'HSS4X2X_125', 7.06, 839e-6, 102e-3, 50.8e-3, 3.18e-3, 1.1e-6, 21.6e-6, 27.2e-6, 36.3e-3, 0.374e-6, 14.7e-6, 16.7e-6, 21.1e-3, 916e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X3-1/2X_375', 'HSS3-1/2X3-1/2X_375', 21.8, 2640e-6, 88.9e-3, 88.9e-3, 9.53e-3, 2.7e-6, 60.8e-6, 76.9e-6, 32e-3, 2.7e-6, 60.8e-6, 76.9e-6, 32e-3, 4660e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X3-1/2X_313', 'HSS3-1/2X3-1/2X_313', 18.8, 2270e-6, 88.9e-3, 88.9e-3, 7.94e-3, 2.43e-6, 54.7e-6, 67.8e-6, 32.8e-3, 2.43e-6, 54.7e-6, 67.8e-6, 32.8e-3, 4120e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X3-1/2X_250', 'HSS3-1/2X3-1/2X_250', 15.6, 1880e-6, 88.9e-3, 88.9e-3, 6.35e-3, 2.1e-6, 47.2e-6, 57.4e-6, 33.5e-3, 2.1e-6, 47.2e-6, 57.4e-6, 33.5e-3, 3480e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X3-1/2X188', 'HSS3-1/2X3-1/2X188', 12.1, 1450e-6, 88.9e-3, 88.9e-3, 4.76e-3, 1.69e-6, 37.9e-6, 45.2e-6, 34.3e-3, 1.69e-6, 37.9e-6, 45.2e-6, 34.3e-3, 2730e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X3-1/2X_125', 'HSS3-1/2X3-1/2X_125', 8.33, 994e-6, 88.9e-3, 88.9e-3, 3.18e-3, 1.21e-6, 27.2e-6, 31.6e-6, 34.8e-3, 1.21e-6, 27.2e-6, 31.6e-6, 34.8e-3, 1910e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X2-1/2X_375', 'HSS3-1/2X2-1/2X_375', 18, 2190e-6, 88.9e-3, 63.5e-3, 9.53e-3, 1.98e-6, 44.5e-6, 58.8e-6, 30.1e-3, 1.15e-6, 36.3e-6, 46.3e-6, 23e-3, 2560e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X2-1/2X_313', 'HSS3-1/2X2-1/2X_313', 15.6, 1900e-6, 88.9e-3, 63.5e-3, 7.94e-3, 1.81e-6, 40.7e-6, 52.5e-6, 30.9e-3, 1.06e-6, 33.3e-6, 41.4e-6, 23.6e-3, 2300e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X2-1/2X_250', 'HSS3-1/2X2-1/2X_250', 13.1, 1570e-6, 88.9e-3, 63.5e-3, 6.35e-3, 1.58e-6, 35.5e-6, 44.8e-6, 31.7e-3, 0.928e-6, 29.2e-6, 35.4e-6, 24.3e-3, 1980e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X2-1/2X_188', 'HSS3-1/2X2-1/2X_188', 10.2, 1220e-6, 88.9e-3, 63.5e-3, 4.76e-3, 1.29e-6, 28.9e-6, 35.7e-6, 32.5e-3, 0.76e-6, 23.9e-6, 28.3e-6, 25e-3, 1570e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X2-1/2X_125', 'HSS3-1/2X2-1/2X_125', 7.07, 839e-6, 88.9e-3, 63.5e-3, 3.18e-3, 0.929e-6, 20.9e-6, 25.3e-6, 33.2e-3, 0.553e-6, 17.4e-6, 20.1e-6, 25.6e-3, 1110e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X2X_250', 'HSS3-1/2X2X_250', 11.8, 1430e-6, 88.9e-3, 50.8e-3, 6.35e-3, 1.32e-6, 29.7e-6, 38.7e-6, 30.5e-3, 0.541e-6, 21.3e-6, 25.9e-6, 19.5e-3, 1320e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X2X_188', 'HSS3-1/2X2X_188', 9.27, 1100e-6, 88.9e-3, 50.8e-3, 4.76e-3, 1.09e-6, 24.4e-6, 31e-6, 31.2e-3, 0.45e-6, 17.7e-6, 20.8e-6, 20.1e-3, 1060e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X2X_125', 'HSS3-1/2X2X_125', 6.43, 768e-6, 88.9e-3, 50.8e-3, 3.18e-3, 0.791e-6, 17.9e-6, 22e-6, 32.3e-3, 0.331e-6, 13e-6, 14.9e-6, 20.8e-3, 762e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X1-1/2X_250', 'HSS3-1/2X1-1/2X_250', 10.5, 1270e-6, 88.9e-3, 38.1e-3, 6.35e-3, 1.06e-6, 23.9e-6, 32.4e-6, 29e-3, 0.266e-6, 13.9e-6, 17.4e-6, 14.5e-3, 745e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X1-1/2X_188', 'HSS3-1/2X1-1/2X_188', 8.31, 994e-6, 88.9e-3, 38.1e-3, 4.76e-3, 0.882e-6, 19.8e-6, 26.2e-6, 29.7e-3, 0.226e-6, 11.9e-6, 14.2e-6, 15.1e-3, 620e-9, 2.1e+11, 0.3),
+    ('HSS3-1/2X1-1/2X_125', 'HSS3-1/2X1-1/2X_125', 5.8, 690e-6, 88.9e-3, 38.1e-3, 3.18e-3, 0.653e-6, 14.7e-6, 18.8e-6, 30.7e-3, 0.171e-6, 8.98e-6, 10.3e-6, 15.7e-3, 454e-9, 2.1e+11, 0.3),
+    ('HSS3X3X_375', 'HSS3X3X_375', 18, 2190e-6, 76.2e-3, 76.2e-3, 9.53e-3, 1.57e-6, 41.3e-6, 53.3e-6, 26.9e-3, 1.57e-6, 41.3e-6, 53.3e-6, 26.9e-3, 2760e-9, 2.1e+11, 0.3),
+    ('HSS3X3X_313', 'HSS3X3X_313', 15.7, 1900e-6, 76.2e-3, 76.2e-3, 7.94e-3, 1.44e-6, 37.7e-6, 47.5e-6, 27.4e-3, 1.44e-6, 37.7e-6, 47.5e-6, 27.4e-3, 2470e-9, 2.1e+11, 0.3),
+    ('HSS3X3X_250', 'HSS3X3X_250', 13.1, 1570e-6, 76.2e-3, 76.2e-3, 6.35e-3, 1.26e-6, 32.9e-6, 40.6e-6, 28.2e-3, 1.26e-6, 32.9e-6, 40.6e-6, 28.2e-3, 2110e-9, 2.1e+11, 0.3),
+    ('HSS3X3X_188', 'HSS3X3X_188', 10.2, 1220e-6, 76.2e-3, 76.2e-3, 4.76e-3, 1.02e-6, 26.9e-6, 32.3e-6, 29e-3, 1.02e-6, 26.9e-6, 32.3e-6, 29e-3, 1680e-9, 2.1e+11, 0.3),
+    ('HSS3X3X_125', 'HSS3X3X_125', 7.06, 839e-6, 76.2e-3, 76.2e-3, 3.18e-3, 0.741e-6, 19.5e-6, 22.9e-6, 29.7e-3, 0.741e-6, 19.5e-6, 22.9e-6, 29.7e-3, 1180e-9, 2.1e+11, 0.3),
+    ('HSS3X2-1/2X_313', 'HSS3X2-1/2X_313', 14.1, 1700e-6, 76.2e-3, 63.5e-3, 7.94e-3, 1.22e-6, 31.8e-6, 41.1e-6, 26.7e-3, 0.907e-6, 28.5e-6, 36.1e-6, 23.1e-3, 1810e-9, 2.1e+11, 0.3),
+    ('HSS3X2-1/2X_250', 'HSS3X2-1/2X_250', 11.8, 1430e-6, 76.2e-3, 63.5e-3, 6.35e-3, 1.07e-6, 28.2e-6, 35.4e-6, 27.4e-3, 0.803e-6, 25.2e-6, 31.1e-6, 23.7e-3, 1560e-9, 2.1e+11, 0.3),
+    ('HSS3X2-1/2X_188', 'HSS3X2-1/2X_188', 9.27, 1100e-6, 76.2e-3, 63.5e-3, 4.76e-3, 0.878e-6, 23.1e-6, 28.3e-6, 28.2e-3, 0.662e-6, 20.8e-6, 24.9e-6, 24.5e-3, 1250e-9, 2.1e+11, 0.3),
+    ('HSS3X2-1/2X_125', 'HSS3X2-1/2X_125', 6.43, 768e-6, 76.2e-3, 63.5e-3, 3.18e-3, 0.641e-6, 16.9e-6, 20.2e-6, 29e-3, 0.483e-6, 15.3e-6, 17.9e-6, 25.1e-3, 887e-9, 2.1e+11, 0.3),
+    ('HSS3X2X_313', 'HSS3X2X_313', 12.5, 1520e-6, 76.2e-3, 50.8e-3, 7.94e-3, 0.991e-6, 26.1e-6, 34.6e-6, 25.7e-3, 0.516e-6, 20.3e-6, 25.9e-6, 18.4e-3, 1190e-9, 2.1e+11, 0.3),
+    ('HSS3X2X_250', 'HSS3X2X_250', 10.5, 1270e-6, 76.2e-3, 50.8e-3, 6.35e-3, 0.887e-6, 23.3e-6, 30e-6, 26.4e-3, 0.462e-6, 18.2e-6, 22.6e-6, 19.1e-3, 1050e-9, 2.1e+11, 0.3),
+    ('HSS3X2X_188', 'HSS3X2X_188', 8.31, 994e-6, 76.2e-3, 50.8e-3, 4.76e-3, 0.737e-6, 19.3e-6, 24.3e-6, 27.2e-3, 0.388e-6, 15.3e-6, 18.4e-6, 19.8e-3, 853e-9, 2.1e+11, 0.3),
+    ('HSS3X2X_125', 'HSS3X2X_125', 5.8, 690e-6, 76.2e-3, 50.8e-3, 3.18e-3, 0.541e-6, 14.2e-6, 17.4e-6, 27.9e-3, 0.288e-6, 11.3e-6, 13.2e-6, 20.4e-3, 612e-9, 2.1e+11, 0.3),
+    ('HSS3X1-1/2X_250', 'HSS3X1-1/2X_250', 9.26, 1120e-6, 76.2e-3, 38.1e-3, 6.35e-3, 0.699e-6, 18.4e-6, 24.7e-6, 24.9e-3, 0.226e-6, 11.9e-6, 14.9e-6, 14.2e-3, 599e-9, 2.1e+11, 0.3),
+    ('HSS3X1-1/2X_188', 'HSS3X1-1/2X_188', 7.36, 884e-6, 76.2e-3, 38.1e-3, 4.76e-3, 0.591e-6, 15.5e-6, 20.3e-6, 25.9e-3, 0.194e-6, 10.2e-6, 12.3e-6, 14.8e-3, 504e-9, 2.1e+11, 0.3),
+    ('HSS3X1-1/2X_125', 'HSS3X1-1/2X_125', 5.16, 617e-6, 76.2e-3, 38.1e-3, 3.18e-3, 0.441e-6, 11.6e-6, 14.7e-6, 26.7e-3, 0.148e-6, 7.77e-6, 9.01e-6, 15.5e-3, 369e-9, 2.1e+11, 0.3),
+    ('HSS3X1X_188', 'HSS3X1X_188', 6.41, 768e-6, 76.2e-3, 25.4e-3, 4.76e-3, 0.445e-6, 11.7e-6, 16.2e-6, 24.1e-3, 0.072e-6, 5.65e-6, 7.08e-6, 9.65e-3, 219e-9, 2.1e+11, 0.3),
+    ('HSS3X1X_125', 'HSS3X1X_125', 4.53, 542e-6, 76.2e-3, 25.4e-3, 3.18e-3, 0.34e-6, 8.93e-6, 11.9e-6, 25.1e-3, 0.0574e-6, 4.52e-6, 5.33e-6, 10.3e-3, 170e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X2-1/2X_313', 'HSS2-1/2X2-1/2X_313', 12.5, 1520e-6, 63.5e-3, 63.5e-3, 7.94e-3, 0.758e-6, 23.9e-6, 30.8e-6, 22.4e-3, 0.758e-6, 23.9e-6, 30.8e-6, 22.4e-3, 1330e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X2-1/2X_250', 'HSS2-1/2X2-1/2X_250', 10.5, 1270e-6, 63.5e-3, 63.5e-3, 6.35e-3, 0.678e-6, 21.3e-6, 26.7e-6, 23.1e-3, 0.678e-6, 21.3e-6, 26.7e-6, 23.1e-3, 1160e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X2-1/2X_188', 'HSS2-1/2X2-1/2X_188', 8.3, 994e-6, 63.5e-3, 63.5e-3, 4.76e-3, 0.562e-6, 17.7e-6, 21.6e-6, 23.8e-3, 0.562e-6, 17.7e-6, 21.6e-6, 23.8e-3, 937e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X2-1/2X_125', 'HSS2-1/2X2-1/2X_125', 5.8, 690e-6, 63.5e-3, 63.5e-3, 3.18e-3, 0.415e-6, 13.1e-6, 15.5e-6, 24.5e-3, 0.415e-6, 13.1e-6, 15.5e-6, 24.5e-3, 670e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X2X_250', 'HSS2-1/2X2X_250', 9.26, 1120e-6, 63.5e-3, 50.8e-3, 6.35e-3, 0.554e-6, 17.4e-6, 22.5e-6, 22.2e-3, 0.387e-6, 15.2e-6, 19.2e-6, 18.6e-3, 791e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X2X_188', 'HSS2-1/2X2X_188', 7.36, 884e-6, 63.5e-3, 50.8e-3, 4.76e-3, 0.466e-6, 14.7e-6, 18.4e-6, 23e-3, 0.327e-6, 12.9e-6, 15.7e-6, 19.3e-3, 645e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X2X_125', 'HSS2-1/2X2X_125', 5.16, 617e-6, 63.5e-3, 50.8e-3, 3.18e-3, 0.347e-6, 10.9e-6, 13.3e-6, 23.7e-3, 0.245e-6, 9.65e-6, 11.4e-6, 19.9e-3, 466e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X1-1/2X_250', 'HSS2-1/2X1-1/2X_250', 8, 974e-6, 63.5e-3, 38.1e-3, 6.35e-3, 0.429e-6, 13.5e-6, 18.2e-6, 21e-3, 0.187e-6, 9.82e-6, 12.5e-6, 13.9e-3, 458e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X1-1/2X_188', 'HSS2-1/2X1-1/2X_188', 6.41, 768e-6, 63.5e-3, 38.1e-3, 4.76e-3, 0.367e-6, 11.6e-6, 15e-6, 21.8e-3, 0.162e-6, 8.52e-6, 10.4e-6, 14.5e-3, 387e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X1-1/2X_125', 'HSS2-1/2X1-1/2X_125', 4.53, 542e-6, 63.5e-3, 38.1e-3, 3.18e-3, 0.278e-6, 8.77e-6, 11e-6, 22.7e-3, 0.125e-6, 6.54e-6, 7.69e-6, 15.2e-3, 286e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X1X_188', 'HSS2-1/2X1X_188', 5.46, 658e-6, 63.5e-3, 25.4e-3, 4.76e-3, 0.269e-6, 8.47e-6, 11.7e-6, 20.2e-3, 0.0595e-6, 4.67e-6, 5.9e-6, 9.5e-3, 171e-9, 2.1e+11, 0.3),
+    ('HSS2-1/2X1X_125', 'HSS2-1/2X1X_125', 3.9, 467e-6, 63.5e-3, 25.4e-3, 3.18e-3, 0.209e-6, 6.6e-6, 8.72e-6, 21.2e-3, 0.0479e-6, 3.77e-6, 4.49e-6, 10.1e-3, 134e-9, 2.1e+11, 0.3),
+    ('HSS2-1/4X2-1/4X_250', 'HSS2-1/4X2-1/4X_250', 9.26, 1120e-6, 57.2e-3, 57.2e-3, 6.35e-3, 0.47e-6, 16.6e-6, 21e-6, 20.5e-3, 0.47e-6, 16.6e-6, 21e-6, 20.5e-3, 816e-9, 2.1e+11, 0.3),
+    ('HSS2-1/4X2-1/4X_188', 'HSS2-1/4X2-1/4X_188', 7.35, 884e-6, 57.2e-3, 57.2e-3, 4.76e-3, 0.397e-6, 13.9e-6, 17e-6, 21.2e-3, 0.397e-6, 13.9e-6, 17e-6, 21.2e-3, 666e-9, 2.1e+11, 0.3),
+    ('HSS2-1/4X2-1/4X_125', 'HSS2-1/4X2-1/4X_125', 5.16, 617e-6, 57.2e-3, 57.2e-3, 3.18e-3, 0.296e-6, 10.4e-6, 12.4e-6, 21.9e-3, 0.296e-6, 10.4e-6, 12.4e-6, 21.9e-3, 479e-9, 2.1e+11, 0.3),
+    ('HSS2-1/4X2X_188', 'HSS2-1/4X2X_188', 6.89, 826e-6, 57.2e-3, 50.8e-3, 4.76e-3, 0.358e-6, 12.5e-6, 15.6e-6, 20.8e-3, 0.297e-6, 11.7e-6, 14.4e-6, 19e-3, 549e-9, 2.1e+11, 0.3),
+    ('HSS2-1/4X2X_125', 'HSS2-1/4X2X_125', 4.85, 579e-6, 57.2e-3, 50.8e-3, 3.18e-3, 0.269e-6, 9.41e-6, 11.4e-6, 21.5e-3, 0.224e-6, 8.82e-6, 10.5e-6, 19.7e-3, 398e-9, 2.1e+11, 0.3),
+    ('HSS2X2X_250', 'HSS2X2X_250', 8, 974e-6, 50.8e-3, 50.8e-3, 6.35e-3, 0.311e-6, 12.2e-6, 15.8e-6, 17.9e-3, 0.311e-6, 12.2e-6, 15.8e-6, 17.9e-3, 545e-9, 2.1e+11, 0.3),
+    ('HSS2X2X_188', 'HSS2X2X_188', 6.4, 768e-6, 50.8e-3, 50.8e-3, 4.76e-3, 0.267e-6, 10.5e-6, 13.1e-6, 18.6e-3, 0.267e-6, 10.5e-6, 13.1e-6, 18.6e-3, 454e-9, 2.1e+11, 0.3),
+    ('HSS2X2X_125', 'HSS2X2X_125', 4.53, 542e-6, 50.8e-3, 50.8e-3, 3.18e-3, 0.202e-6, 7.96e-6, 9.57e-6, 19.3e-3, 0.202e-6, 7.96e-6, 9.57e-6, 19.3e-3, 331e-9, 2.1e+11, 0.3),
+    ('HSS2X1-1/2X_188', 'HSS2X1-1/2X_188', 5.46, 658e-6, 50.8e-3, 38.1e-3, 4.76e-3, 0.206e-6, 8.11e-6, 10.5e-6, 17.7e-3, 0.13e-6, 6.83e-6, 8.54e-6, 14.1e-3, 276e-9, 2.1e+11, 0.3),
+    ('HSS2X1-1/2X_125', 'HSS2X1-1/2X_125', 3.9, 467e-6, 50.8e-3, 38.1e-3, 3.18e-3, 0.159e-6, 6.28e-6, 7.78e-6, 18.5e-3, 0.102e-6, 5.33e-6, 6.37e-6, 14.8e-3, 206e-9, 2.1e+11, 0.3),
+    ('HSS2X1X_188', 'HSS2X1X_188', 4.51, 545e-6, 50.8e-3, 25.4e-3, 4.76e-3, 0.146e-6, 5.74e-6, 7.87e-6, 16.3e-3, 0.0466e-6, 3.69e-6, 4.72e-6, 9.27e-3, 125e-9, 2.1e+11, 0.3),
+    ('HSS2X1X_125', 'HSS2X1X_125', 3.26, 392e-6, 50.8e-3, 25.4e-3, 3.18e-3, 0.117e-6, 4.59e-6, 6e-6, 17.2e-3, 0.0384e-6, 3.02e-6, 3.65e-6, 9.91e-3, 99.1e-9, 2.1e+11, 0.3),
+    )
@@ -0,0 +1,288 @@
+# -*- coding: utf-8 -*-
+''' AISC W shapes (see aisc_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'P', 'A', 'h', 'hDet', 'b', 'bDet', 'tw', 'twDet', 'tf', 'tfDet', 'kDes', 'kDet', 'k1', 'd', 'Iz', 'Wzel', 'Wzpl', 'iz', 'Avy', 'Iy', 'Wyel', 'Wypl', 'iy', 'It', 'E', 'nu')
+
+rows= (
+    ('W44X335', 'W44X335', 499, 63500e-6, 1120e-3, 1120e-3, 404e-3, 406e-3, 26.2e-3, 25.4e-3, 45e-3, 44.4e-3, 65e-3, 66.7e-3, 33.3e-3, 990e-3, 12900e-6, 23100e-6, 26500e-6, 452e-3, 25938e-6, 499e-6, 2460e-6, 3870e-6, 88.6e-3, 31100e-9, 2.1e+11, 0.3),
+    ('W44X290', 'W44X290', 433, 55100e-6, 1110e-3, 1110e-3, 401e-3, 403e-3, 22e-3, 22.2e-3, 40.1e-3, 39.7e-3, 59.9e-3, 61.9e-3, 31.8e-3, 990.2e-3, 11200e-6, 20300e-6, 23100e-6, 452e-3, 21784.4e-6, 433e-6, 2160e-6, 3360e-6, 88.6e-3, 21200e-9, 2.1e+11, 0.3),
+    ('W44X262', 'W44X262', 390, 49800e-6, 1100e-3, 1100e-3, 401e-3, 400e-3, 19.9e-3, 20.6e-3, 36.1e-3, 36.5e-3, 55.9e-3, 57.2e-3, 30.2e-3, 988.2e-3, 10000e-6, 18200e-6, 20800e-6, 450e-3, 19665.2e-6, 384e-6, 1920e-6, 2980e-6, 88.1e-3, 15500e-9, 2.1e+11, 0.3),
+    ('W44X230', 'W44X230', 343, 43700e-6, 1090e-3, 1090e-3, 401e-3, 400e-3, 18e-3, 17.5e-3, 31e-3, 31.8e-3, 51.1e-3, 52.4e-3, 30.2e-3, 987.8e-3, 8660e-6, 15900e-6, 18000e-6, 445e-3, 17780.4e-6, 331e-6, 1660e-6, 2570e-6, 87.1e-3, 10400e-9, 2.1e+11, 0.3),
+    ('W40X593', 'W40X593', 883, 112000e-6, 1090e-3, 1090e-3, 424e-3, 425e-3, 45.5e-3, 46e-3, 82e-3, 82.6e-3, 112e-3, 114e-3, 54e-3, 866e-3, 21000e-6, 38300e-6, 45200e-6, 432e-3, 39403e-6, 1050e-6, 4950e-6, 7880e-6, 96.5e-3, 185000e-9, 2.1e+11, 0.3),
+    ('W40X503', 'W40X503', 748, 95500e-6, 1070e-3, 1070e-3, 417e-3, 416e-3, 39.1e-3, 39.7e-3, 70.1e-3, 69.8e-3, 100e-3, 102e-3, 50.8e-3, 870e-3, 17300e-6, 32400e-6, 38000e-6, 427e-3, 34017e-6, 849e-6, 4080e-6, 6460e-6, 94.5e-3, 115000e-9, 2.1e+11, 0.3),
+    ('W40X431', 'W40X431', 642, 81900e-6, 1050e-3, 1050e-3, 411e-3, 413e-3, 34e-3, 33.3e-3, 59.9e-3, 60.3e-3, 89.9e-3, 92.1e-3, 47.6e-3, 870.2e-3, 14500e-6, 27700e-6, 32100e-6, 422e-3, 29586.8e-6, 703e-6, 3410e-6, 5370e-6, 92.7e-3, 73700e-9, 2.1e+11, 0.3),
+    ('W40X397', 'W40X397', 591, 75500e-6, 1040e-3, 1040e-3, 409e-3, 410e-3, 31e-3, 31.8e-3, 55.9e-3, 55.6e-3, 85.9e-3, 88.9e-3, 46e-3, 868.2e-3, 13300e-6, 25600e-6, 29500e-6, 422e-3, 26914.2e-6, 641e-6, 3130e-6, 4920e-6, 92.5e-3, 59100e-9, 2.1e+11, 0.3),
+    ('W40X372', 'W40X372', 554, 71000e-6, 1030e-3, 1030e-3, 409e-3, 410e-3, 29.5e-3, 30.2e-3, 52.1e-3, 52.4e-3, 82e-3, 84.1e-3, 46e-3, 866e-3, 12300e-6, 23900e-6, 27500e-6, 419e-3, 25547e-6, 591e-6, 2900e-6, 4540e-6, 91.4e-3, 48300e-9, 2.1e+11, 0.3),
+    ('W40X362', 'W40X362', 539, 68400e-6, 1030e-3, 1030e-3, 406e-3, 406e-3, 28.4e-3, 28.6e-3, 51.1e-3, 50.8e-3, 81e-3, 82.6e-3, 44.5e-3, 868e-3, 12000e-6, 23300e-6, 26900e-6, 419e-3, 24651.2e-6, 574e-6, 2830e-6, 4420e-6, 91.4e-3, 45400e-9, 2.1e+11, 0.3),
+    ('W40X324', 'W40X324', 483, 61500e-6, 1020e-3, 1020e-3, 404e-3, 403e-3, 25.4e-3, 25.4e-3, 46e-3, 46e-3, 75.9e-3, 77.8e-3, 42.9e-3, 868.2e-3, 10700e-6, 21000e-6, 23900e-6, 417e-3, 22052.3e-6, 508e-6, 2510e-6, 3920e-6, 90.9e-3, 33000e-9, 2.1e+11, 0.3),
+    ('W40X297', 'W40X297', 443, 56300e-6, 1010e-3, 1010e-3, 401e-3, 403e-3, 23.6e-3, 23.8e-3, 41.9e-3, 41.3e-3, 71.9e-3, 74.6e-3, 42.9e-3, 866.2e-3, 9660e-6, 19200e-6, 21800e-6, 414e-3, 20442.3e-6, 454e-6, 2260e-6, 3520e-6, 89.9e-3, 25500e-9, 2.1e+11, 0.3),
+    ('W40X277', 'W40X277', 412, 52600e-6, 1010e-3, 1010e-3, 401e-3, 403e-3, 21.1e-3, 20.6e-3, 40.1e-3, 39.7e-3, 70.1e-3, 73e-3, 41.3e-3, 869.8e-3, 9120e-6, 18000e-6, 20500e-6, 417e-3, 18352.8e-6, 433e-6, 2160e-6, 3340e-6, 90.9e-3, 21400e-9, 2.1e+11, 0.3),
+    ('W40X249', 'W40X249', 371, 47400e-6, 1000e-3, 1000e-3, 401e-3, 400e-3, 19.1e-3, 19e-3, 36.1e-3, 36.5e-3, 66e-3, 68.3e-3, 39.7e-3, 868e-3, 8160e-6, 16300e-6, 18400e-6, 414e-3, 16578.8e-6, 385e-6, 1930e-6, 2980e-6, 90.2e-3, 15900e-9, 2.1e+11, 0.3),
+    ('W40X215', 'W40X215', 321, 41000e-6, 991e-3, 991e-3, 401e-3, 400e-3, 16.5e-3, 15.9e-3, 31e-3, 31.8e-3, 61e-3, 63.5e-3, 39.7e-3, 869e-3, 6950e-6, 14100e-6, 15800e-6, 411e-3, 14338.5e-6, 334e-6, 1660e-6, 2560e-6, 89.9e-3, 10300e-9, 2.1e+11, 0.3),
+    ('W40X199', 'W40X199', 296, 37900e-6, 983e-3, 981e-3, 401e-3, 400e-3, 16.5e-3, 15.9e-3, 27.2e-3, 27e-3, 57.2e-3, 58.7e-3, 39.7e-3, 868.6e-3, 6200e-6, 12600e-6, 14200e-6, 406e-3, 14331.9e-6, 289e-6, 1450e-6, 2250e-6, 87.6e-3, 7620e-9, 2.1e+11, 0.3),
+    ('W40X392', 'W40X392', 584, 74800e-6, 1060e-3, 1060e-3, 315e-3, 314e-3, 36.1e-3, 36.5e-3, 64e-3, 63.5e-3, 94e-3, 96.8e-3, 49.2e-3, 872e-3, 12400e-6, 23600e-6, 28000e-6, 409e-3, 31479.2e-6, 334e-6, 2130e-6, 3470e-6, 67.1e-3, 71600e-9, 2.1e+11, 0.3),
+    ('W40X331', 'W40X331', 494, 63000e-6, 1040e-3, 1040e-3, 310e-3, 308e-3, 31e-3, 31.8e-3, 54.1e-3, 54e-3, 84.1e-3, 85.7e-3, 46e-3, 871.8e-3, 10300e-6, 19800e-6, 23400e-6, 404e-3, 27025.8e-6, 268e-6, 1740e-6, 2820e-6, 65.3e-3, 43700e-9, 2.1e+11, 0.3),
+    ('W40X327', 'W40X327', 486, 61900e-6, 1040e-3, 1040e-3, 307e-3, 308e-3, 30e-3, 30.2e-3, 54.1e-3, 54e-3, 84.1e-3, 85.7e-3, 46e-3, 871.8e-3, 10200e-6, 19700e-6, 23100e-6, 406e-3, 26154e-6, 266e-6, 1720e-6, 2790e-6, 65.5e-3, 42900e-9, 2.1e+11, 0.3),
+    ('W40X294', 'W40X294', 438, 55600e-6, 1030e-3, 1030e-3, 305e-3, 305e-3, 26.9e-3, 27e-3, 49e-3, 49.2e-3, 79e-3, 81e-3, 44.5e-3, 872e-3, 9120e-6, 17700e-6, 20800e-6, 404e-3, 23456.8e-6, 234e-6, 1530e-6, 2460e-6, 64.8e-3, 31900e-9, 2.1e+11, 0.3),
+    ('W40X278', 'W40X278', 415, 53100e-6, 1020e-3, 1020e-3, 305e-3, 305e-3, 26.2e-3, 25.4e-3, 46e-3, 46e-3, 75.9e-3, 77.8e-3, 44.5e-3, 868.2e-3, 8530e-6, 16700e-6, 19500e-6, 401e-3, 22746.8e-6, 217e-6, 1430e-6, 2290e-6, 64e-3, 27100e-9, 2.1e+11, 0.3),
+    ('W40X264', 'W40X264', 393, 49900e-6, 1020e-3, 1020e-3, 302e-3, 302e-3, 24.4e-3, 23.8e-3, 43.9e-3, 44.4e-3, 73.9e-3, 76.2e-3, 42.9e-3, 872.2e-3, 8070e-6, 15900e-6, 18500e-6, 401e-3, 21281.7e-6, 205e-6, 1350e-6, 2160e-6, 64e-3, 23400e-9, 2.1e+11, 0.3),
+    ('W40X235', 'W40X235', 350, 44600e-6, 1010e-3, 1010e-3, 302e-3, 302e-3, 21.1e-3, 20.6e-3, 40.1e-3, 39.7e-3, 70.1e-3, 73e-3, 41.3e-3, 869.8e-3, 7240e-6, 14300e-6, 16600e-6, 404e-3, 18352.8e-6, 185e-6, 1220e-6, 1930e-6, 64.5e-3, 17200e-9, 2.1e+11, 0.3),
+    ('W40X211', 'W40X211', 314, 40100e-6, 1000e-3, 1000e-3, 300e-3, 298e-3, 19.1e-3, 19e-3, 36.1e-3, 36.5e-3, 66e-3, 68.3e-3, 39.7e-3, 868e-3, 6450e-6, 12900e-6, 14800e-6, 401e-3, 16578.8e-6, 162e-6, 1080e-6, 1720e-6, 63.8e-3, 12700e-9, 2.1e+11, 0.3),
+    ('W40X183', 'W40X183', 272, 34400e-6, 991e-3, 991e-3, 300e-3, 298e-3, 16.5e-3, 15.9e-3, 30.5e-3, 30.2e-3, 60.5e-3, 63.5e-3, 39.7e-3, 870e-3, 5490e-6, 11100e-6, 12700e-6, 399e-3, 14355e-6, 138e-6, 918e-6, 1450e-6, 63.2e-3, 8030e-9, 2.1e+11, 0.3),
+    ('W40X167', 'W40X167', 249, 31800e-6, 980e-3, 981e-3, 300e-3, 298e-3, 16.5e-3, 15.9e-3, 26.2e-3, 25.4e-3, 56.1e-3, 58.7e-3, 39.7e-3, 867.8e-3, 4830e-6, 9830e-6, 11400e-6, 389e-3, 14318.7e-6, 118e-6, 785e-6, 1250e-6, 61e-3, 5830e-9, 2.1e+11, 0.3),
+    ('W40X149', 'W40X149', 222, 28300e-6, 970e-3, 972e-3, 300e-3, 298e-3, 16e-3, 15.9e-3, 21.1e-3, 20.6e-3, 51.1e-3, 54e-3, 38.1e-3, 867.8e-3, 4080e-6, 8410e-6, 9800e-6, 381e-3, 13884.8e-6, 95.3e-6, 636e-6, 1020e-6, 58.2e-3, 3900e-9, 2.1e+11, 0.3),
+    ('W36X652', 'W36X652', 970, 124000e-6, 1040e-3, 1040e-3, 447e-3, 448e-3, 50e-3, 50.8e-3, 89.9e-3, 90.5e-3, 114e-3, 122e-3, 55.6e-3, 812e-3, 21100e-6, 40300e-6, 47700e-6, 411e-3, 40600e-6, 1340e-6, 6010e-6, 9520e-6, 104e-3, 247000e-9, 2.1e+11, 0.3),
+    ('W36X529', 'W36X529', 787, 101000e-6, 1010e-3, 1010e-3, 437e-3, 438e-3, 40.9e-3, 41.3e-3, 73.9e-3, 74.6e-3, 98e-3, 106e-3, 50.8e-3, 814e-3, 16500e-6, 32600e-6, 38200e-6, 406e-3, 33292.6e-6, 1040e-6, 4740e-6, 7440e-6, 102e-3, 136000e-9, 2.1e+11, 0.3),
+    ('W36X487', 'W36X487', 725, 92300e-6, 998e-3, 1000e-3, 434e-3, 435e-3, 38.1e-3, 38.1e-3, 68.1e-3, 68.3e-3, 92.2e-3, 102e-3, 47.6e-3, 813.6e-3, 15000e-6, 30000e-6, 34900e-6, 401e-3, 30998.2e-6, 937e-6, 4310e-6, 6750e-6, 101e-3, 107000e-9, 2.1e+11, 0.3),
+    ('W36X441', 'W36X441', 656, 83900e-6, 988e-3, 987e-3, 432e-3, 432e-3, 34.5e-3, 34.9e-3, 62e-3, 61.9e-3, 86.1e-3, 95.3e-3, 47.6e-3, 815.8e-3, 13400e-6, 27000e-6, 31300e-6, 399e-3, 28145.1e-6, 828e-6, 3850e-6, 6030e-6, 99.6e-3, 80700e-9, 2.1e+11, 0.3),
+    ('W36X395', 'W36X395', 588, 74800e-6, 975e-3, 975e-3, 427e-3, 429e-3, 31e-3, 31.8e-3, 55.9e-3, 55.6e-3, 80e-3, 87.3e-3, 46e-3, 815e-3, 11900e-6, 24400e-6, 28000e-6, 399e-3, 25265e-6, 728e-6, 3410e-6, 5330e-6, 98.6e-3, 59100e-9, 2.1e+11, 0.3),
+    ('W36X361', 'W36X361', 537, 68400e-6, 965e-3, 965e-3, 424e-3, 425e-3, 28.4e-3, 28.6e-3, 51.1e-3, 50.8e-3, 75.2e-3, 84.1e-3, 44.5e-3, 814.6e-3, 10700e-6, 22100e-6, 25400e-6, 396e-3, 23134.6e-6, 653e-6, 3080e-6, 4800e-6, 97.8e-3, 45400e-9, 2.1e+11, 0.3),
+    ('W36X330', 'W36X330', 491, 62500e-6, 958e-3, 956e-3, 422e-3, 422e-3, 25.9e-3, 25.4e-3, 47e-3, 47.6e-3, 71.1e-3, 79.4e-3, 44.5e-3, 815.8e-3, 9700e-6, 20300e-6, 23100e-6, 394e-3, 21129.2e-6, 591e-6, 2800e-6, 4340e-6, 97.3e-3, 35100e-9, 2.1e+11, 0.3),
+    ('W36X302', 'W36X302', 449, 57400e-6, 947e-3, 949e-3, 424e-3, 422e-3, 24e-3, 23.8e-3, 42.7e-3, 42.9e-3, 66.8e-3, 76.2e-3, 42.9e-3, 813.4e-3, 8780e-6, 18500e-6, 21000e-6, 391e-3, 19521.6e-6, 541e-6, 2560e-6, 3950e-6, 97e-3, 26800e-9, 2.1e+11, 0.3),
+    ('W36X282', 'W36X282', 420, 53500e-6, 942e-3, 943e-3, 422e-3, 422e-3, 22.5e-3, 22.2e-3, 39.9e-3, 39.7e-3, 64e-3, 73e-3, 41.3e-3, 814e-3, 8160e-6, 17200e-6, 19500e-6, 391e-3, 18315e-6, 499e-6, 2360e-6, 3650e-6, 96.5e-3, 21900e-9, 2.1e+11, 0.3),
+    ('W36X262', 'W36X262', 390, 49800e-6, 937e-3, 937e-3, 422e-3, 419e-3, 21.3e-3, 20.6e-3, 36.6e-3, 36.5e-3, 60.7e-3, 69.9e-3, 41.3e-3, 815.6e-3, 7450e-6, 15900e-6, 18000e-6, 389e-3, 17372.3e-6, 454e-6, 2160e-6, 3340e-6, 95.5e-3, 17300e-9, 2.1e+11, 0.3),
+    ('W36X247', 'W36X247', 368, 46800e-6, 932e-3, 930e-3, 419e-3, 419e-3, 20.3e-3, 20.6e-3, 34.3e-3, 34.9e-3, 58.4e-3, 66.7e-3, 41.3e-3, 815.2e-3, 6950e-6, 15000e-6, 16900e-6, 386e-3, 16548.6e-6, 420e-6, 2020e-6, 3110e-6, 95e-3, 14400e-9, 2.1e+11, 0.3),
+    ('W36X231', 'W36X231', 344, 44000e-6, 927e-3, 927e-3, 419e-3, 419e-3, 19.3e-3, 19e-3, 32e-3, 31.8e-3, 56.1e-3, 65.1e-3, 39.7e-3, 814.8e-3, 6490e-6, 14000e-6, 15800e-6, 384e-3, 15725.6e-6, 391e-6, 1870e-6, 2880e-6, 94.2e-3, 11900e-9, 2.1e+11, 0.3),
+    ('W36X256', 'W36X256', 381, 48600e-6, 951e-3, 949e-3, 310e-3, 311e-3, 24.4e-3, 23.8e-3, 43.9e-3, 44.4e-3, 63e-3, 66.7e-3, 33.3e-3, 825e-3, 6990e-6, 14700e-6, 17000e-6, 378e-3, 20130e-6, 220e-6, 1420e-6, 2250e-6, 67.3e-3, 22000e-9, 2.1e+11, 0.3),
+    ('W36X232', 'W36X232', 345, 43900e-6, 943e-3, 943e-3, 307e-3, 308e-3, 22.1e-3, 22.2e-3, 39.9e-3, 39.7e-3, 58.9e-3, 61.9e-3, 31.8e-3, 825.2e-3, 6240e-6, 13300e-6, 15300e-6, 376e-3, 18236.9e-6, 195e-6, 1270e-6, 2000e-6, 66.5e-3, 16500e-9, 2.1e+11, 0.3),
+    ('W36X210', 'W36X210', 313, 39900e-6, 932e-3, 933e-3, 310e-3, 308e-3, 21.1e-3, 20.6e-3, 34.5e-3, 34.9e-3, 53.6e-3, 58.7e-3, 31.8e-3, 824.8e-3, 5490e-6, 11800e-6, 13700e-6, 371e-3, 17403.3e-6, 171e-6, 1110e-6, 1750e-6, 65.5e-3, 11700e-9, 2.1e+11, 0.3),
+    ('W36X194', 'W36X194', 289, 36800e-6, 927e-3, 927e-3, 307e-3, 308e-3, 19.4e-3, 19e-3, 32e-3, 31.8e-3, 51.1e-3, 55.6e-3, 30.2e-3, 824.8e-3, 5040e-6, 10900e-6, 12600e-6, 371e-3, 16001.1e-6, 156e-6, 1010e-6, 1600e-6, 65e-3, 9240e-9, 2.1e+11, 0.3),
+    ('W36X182', 'W36X182', 271, 34600e-6, 922e-3, 924e-3, 307e-3, 308e-3, 18.4e-3, 19e-3, 30e-3, 30.2e-3, 49e-3, 54e-3, 30.2e-3, 824e-3, 4700e-6, 10200e-6, 11800e-6, 368e-3, 15161.6e-6, 144e-6, 944e-6, 1490e-6, 64.8e-3, 7700e-9, 2.1e+11, 0.3),
+    ('W36X170', 'W36X170', 253, 32300e-6, 919e-3, 918e-3, 305e-3, 305e-3, 17.3e-3, 17.5e-3, 27.9e-3, 28.6e-3, 47e-3, 50.8e-3, 30.2e-3, 825e-3, 4370e-6, 9520e-6, 10900e-6, 368e-3, 14272.5e-6, 133e-6, 872e-6, 1370e-6, 64.3e-3, 6290e-9, 2.1e+11, 0.3),
+    ('W36X160', 'W36X160', 238, 30300e-6, 914e-3, 914e-3, 305e-3, 305e-3, 16.5e-3, 15.9e-3, 25.9e-3, 25.4e-3, 45e-3, 49.2e-3, 28.6e-3, 824e-3, 4060e-6, 8880e-6, 10200e-6, 366e-3, 13596e-6, 123e-6, 805e-6, 1270e-6, 63.5e-3, 5160e-9, 2.1e+11, 0.3),
+    ('W36X150', 'W36X150', 223, 28600e-6, 912e-3, 911e-3, 305e-3, 305e-3, 15.9e-3, 15.9e-3, 23.9e-3, 23.8e-3, 42.9e-3, 47.6e-3, 28.6e-3, 826.2e-3, 3760e-6, 8260e-6, 9520e-6, 363e-3, 13136.6e-6, 112e-6, 739e-6, 1160e-6, 62.7e-3, 4200e-9, 2.1e+11, 0.3),
+    ('W36X135', 'W36X135', 201, 25700e-6, 904e-3, 902e-3, 305e-3, 305e-3, 15.2e-3, 15.9e-3, 20.1e-3, 20.6e-3, 39.1e-3, 42.9e-3, 28.6e-3, 825.8e-3, 3250e-6, 7190e-6, 8340e-6, 356e-3, 12552.2e-6, 93.7e-6, 618e-6, 978e-6, 60.5e-3, 2910e-9, 2.1e+11, 0.3),
+    ('W33X387', 'W33X387', 576, 73500e-6, 914e-3, 914e-3, 411e-3, 413e-3, 32e-3, 31.8e-3, 57.9e-3, 57.2e-3, 78e-3, 81e-3, 36.5e-3, 758e-3, 10100e-6, 22100e-6, 25600e-6, 371e-3, 24256e-6, 674e-6, 3280e-6, 5110e-6, 95.8e-3, 61600e-9, 2.1e+11, 0.3),
+    ('W33X354', 'W33X354', 527, 67100e-6, 904e-3, 902e-3, 409e-3, 410e-3, 29.5e-3, 30.2e-3, 53.1e-3, 52.4e-3, 73.2e-3, 74.6e-3, 34.9e-3, 757.6e-3, 9160e-6, 20300e-6, 23300e-6, 368e-3, 22349.2e-6, 608e-6, 2970e-6, 4620e-6, 95e-3, 47900e-9, 2.1e+11, 0.3),
+    ('W33X318', 'W33X318', 473, 60500e-6, 894e-3, 892e-3, 406e-3, 406e-3, 26.4e-3, 27e-3, 48e-3, 47.6e-3, 68.1e-3, 69.9e-3, 33.3e-3, 757.8e-3, 8120e-6, 18200e-6, 20800e-6, 368e-3, 20005.9e-6, 537e-6, 2640e-6, 4100e-6, 94.2e-3, 35100e-9, 2.1e+11, 0.3),
+    ('W33X291', 'W33X291', 433, 55200e-6, 884e-3, 886e-3, 404e-3, 403e-3, 24.4e-3, 23.8e-3, 43.9e-3, 44.4e-3, 64e-3, 66.7e-3, 33.3e-3, 756e-3, 7370e-6, 16700e-6, 19000e-6, 366e-3, 18446.4e-6, 483e-6, 2390e-6, 3700e-6, 93.5e-3, 27100e-9, 2.1e+11, 0.3),
+    ('W33X263', 'W33X263', 392, 49900e-6, 876e-3, 876e-3, 401e-3, 400e-3, 22.1e-3, 22.2e-3, 39.9e-3, 39.7e-3, 59.9e-3, 61.9e-3, 31.8e-3, 756.2e-3, 6620e-6, 15100e-6, 17000e-6, 363e-3, 16712e-6, 433e-6, 2150e-6, 3310e-6, 93e-3, 20300e-9, 2.1e+11, 0.3),
+    ('W33X241', 'W33X241', 359, 45900e-6, 869e-3, 867e-3, 404e-3, 403e-3, 21.1e-3, 20.6e-3, 35.6e-3, 34.9e-3, 55.6e-3, 57.2e-3, 31.8e-3, 757.8e-3, 5910e-6, 13600e-6, 15400e-6, 358e-3, 15989.6e-6, 388e-6, 1930e-6, 2980e-6, 91.9e-3, 15100e-9, 2.1e+11, 0.3),
+    ('W33X221', 'W33X221', 329, 42100e-6, 861e-3, 860e-3, 401e-3, 400e-3, 19.7e-3, 19e-3, 32.5e-3, 31.8e-3, 52.3e-3, 54e-3, 30.2e-3, 756.4e-3, 5370e-6, 12400e-6, 14000e-6, 358e-3, 14901.1e-6, 350e-6, 1740e-6, 2690e-6, 91.2e-3, 11600e-9, 2.1e+11, 0.3),
+    ('W33X201', 'W33X201', 299, 38100e-6, 856e-3, 854e-3, 399e-3, 400e-3, 18.2e-3, 17.5e-3, 29.2e-3, 28.6e-3, 49.3e-3, 50.8e-3, 30.2e-3, 757.4e-3, 4830e-6, 11200e-6, 12700e-6, 356e-3, 13784.7e-6, 312e-6, 1560e-6, 2410e-6, 90.4e-3, 8660e-9, 2.1e+11, 0.3),
+    ('W33X169', 'W33X169', 251, 31900e-6, 859e-3, 860e-3, 292e-3, 292e-3, 17e-3, 17.5e-3, 31e-3, 31.8e-3, 48.8e-3, 54e-3, 30.2e-3, 761.4e-3, 3870e-6, 9000e-6, 10300e-6, 348e-3, 12943.8e-6, 129e-6, 883e-6, 1380e-6, 63.5e-3, 7370e-9, 2.1e+11, 0.3),
+    ('W33X152', 'W33X152', 226, 29000e-6, 851e-3, 851e-3, 295e-3, 295e-3, 16.1e-3, 15.9e-3, 26.9e-3, 27e-3, 44.7e-3, 49.2e-3, 28.6e-3, 761.6e-3, 3400e-6, 7980e-6, 9160e-6, 343e-3, 12261.8e-6, 114e-6, 773e-6, 1210e-6, 62.7e-3, 5160e-9, 2.1e+11, 0.3),
+    ('W33X141', 'W33X141', 210, 26800e-6, 846e-3, 845e-3, 292e-3, 292e-3, 15.4e-3, 15.9e-3, 24.4e-3, 23.8e-3, 42.2e-3, 46e-3, 28.6e-3, 761.6e-3, 3100e-6, 7340e-6, 8420e-6, 340e-3, 11728.6e-6, 102e-6, 700e-6, 1100e-6, 61.7e-3, 4040e-9, 2.1e+11, 0.3),
+    ('W33X130', 'W33X130', 193, 24700e-6, 841e-3, 841e-3, 292e-3, 292e-3, 14.7e-3, 14.3e-3, 21.7e-3, 22.2e-3, 39.6e-3, 44.5e-3, 28.6e-3, 761.8e-3, 2790e-6, 6650e-6, 7650e-6, 335e-3, 11198.5e-6, 90.7e-6, 621e-6, 975e-6, 60.7e-3, 3070e-9, 2.1e+11, 0.3),
+    ('W33X118', 'W33X118', 176, 22400e-6, 836e-3, 835e-3, 292e-3, 292e-3, 14e-3, 14.3e-3, 18.8e-3, 19e-3, 36.6e-3, 41.3e-3, 28.6e-3, 762.8e-3, 2460e-6, 5880e-6, 6800e-6, 330e-3, 10679.2e-6, 77.8e-6, 534e-6, 841e-6, 58.9e-3, 2210e-9, 2.1e+11, 0.3),
+    ('W30X391', 'W30X391', 582, 74200e-6, 843e-3, 845e-3, 396e-3, 397e-3, 34.5e-3, 34.9e-3, 62e-3, 61.9e-3, 82e-3, 85.7e-3, 38.1e-3, 679e-3, 8620e-6, 20500e-6, 23800e-6, 340e-3, 23425.5e-6, 645e-6, 3240e-6, 5080e-6, 93.2e-3, 72000e-9, 2.1e+11, 0.3),
+    ('W30X357', 'W30X357', 531, 67700e-6, 833e-3, 832e-3, 394e-3, 394e-3, 31.5e-3, 31.8e-3, 56.9e-3, 57.2e-3, 77e-3, 79.4e-3, 36.5e-3, 679e-3, 7780e-6, 18700e-6, 21600e-6, 338e-3, 21388.5e-6, 579e-6, 2930e-6, 4570e-6, 92.5e-3, 55800e-9, 2.1e+11, 0.3),
+    ('W30X326', 'W30X326', 484, 61900e-6, 823e-3, 822e-3, 391e-3, 391e-3, 29e-3, 28.6e-3, 52.1e-3, 52.4e-3, 72.1e-3, 74.6e-3, 34.9e-3, 678.8e-3, 6990e-6, 17000e-6, 19500e-6, 335e-3, 19685.2e-6, 516e-6, 2650e-6, 4130e-6, 91.4e-3, 42900e-9, 2.1e+11, 0.3),
+    ('W30X292', 'W30X292', 434, 55500e-6, 813e-3, 813e-3, 389e-3, 387e-3, 25.9e-3, 25.4e-3, 47e-3, 47.6e-3, 67.1e-3, 69.9e-3, 33.3e-3, 678.8e-3, 6200e-6, 15200e-6, 17400e-6, 335e-3, 17580.9e-6, 458e-6, 2360e-6, 3650e-6, 90.9e-3, 31300e-9, 2.1e+11, 0.3),
+    ('W30X261', 'W30X261', 389, 49700e-6, 803e-3, 803e-3, 386e-3, 384e-3, 23.6e-3, 23.8e-3, 41.9e-3, 41.3e-3, 62e-3, 65.1e-3, 33.3e-3, 679e-3, 5450e-6, 13600e-6, 15500e-6, 333e-3, 16024.4e-6, 399e-6, 2080e-6, 3210e-6, 89.7e-3, 22500e-9, 2.1e+11, 0.3),
+    ('W30X235', 'W30X235', 350, 44700e-6, 795e-3, 794e-3, 384e-3, 381e-3, 21.1e-3, 20.6e-3, 38.1e-3, 38.1e-3, 58.2e-3, 60.3e-3, 31.8e-3, 678.6e-3, 4870e-6, 12300e-6, 13900e-6, 330e-3, 14318.5e-6, 356e-6, 1870e-6, 2870e-6, 89.2e-3, 16800e-9, 2.1e+11, 0.3),
+    ('W30X211', 'W30X211', 314, 40200e-6, 785e-3, 787e-3, 384e-3, 384e-3, 19.7e-3, 19e-3, 33.5e-3, 33.3e-3, 53.3e-3, 57.2e-3, 30.2e-3, 678.4e-3, 4290e-6, 10900e-6, 12300e-6, 328e-3, 13364.5e-6, 315e-6, 1640e-6, 2540e-6, 88.6e-3, 11800e-9, 2.1e+11, 0.3),
+    ('W30X191', 'W30X191', 284, 36200e-6, 780e-3, 778e-3, 381e-3, 381e-3, 18e-3, 17.5e-3, 30.2e-3, 30.2e-3, 50e-3, 52.4e-3, 30.2e-3, 680e-3, 3830e-6, 9830e-6, 11100e-6, 325e-3, 12240e-6, 280e-6, 1470e-6, 2260e-6, 87.9e-3, 8740e-9, 2.1e+11, 0.3),
+    ('W30X173', 'W30X173', 257, 32800e-6, 772e-3, 775e-3, 381e-3, 381e-3, 16.6e-3, 15.9e-3, 27.2e-3, 27e-3, 47e-3, 50.8e-3, 28.6e-3, 678e-3, 3430e-6, 8870e-6, 9950e-6, 323e-3, 11254.8e-6, 249e-6, 1310e-6, 2020e-6, 86.9e-3, 6490e-9, 2.1e+11, 0.3),
+    ('W30X148', 'W30X148', 220, 28100e-6, 780e-3, 778e-3, 267e-3, 267e-3, 16.5e-3, 15.9e-3, 30e-3, 30.2e-3, 46.5e-3, 52.4e-3, 28.6e-3, 687e-3, 2780e-6, 7140e-6, 8190e-6, 315e-3, 11335.5e-6, 94.5e-6, 710e-6, 1110e-6, 57.9e-3, 6040e-9, 2.1e+11, 0.3),
+    ('W30X132', 'W30X132', 196, 25000e-6, 770e-3, 768e-3, 267e-3, 267e-3, 15.6e-3, 15.9e-3, 25.4e-3, 25.4e-3, 41.9e-3, 47.6e-3, 28.6e-3, 686.2e-3, 2400e-6, 6230e-6, 7160e-6, 310e-3, 10704.7e-6, 81.6e-6, 610e-6, 957e-6, 57.2e-3, 4050e-9, 2.1e+11, 0.3),
+    ('W30X124', 'W30X124', 185, 23500e-6, 767e-3, 765e-3, 267e-3, 267e-3, 14.9e-3, 14.3e-3, 23.6e-3, 23.8e-3, 40.1e-3, 46e-3, 28.6e-3, 686.8e-3, 2230e-6, 5820e-6, 6690e-6, 307e-3, 10233.3e-6, 75.3e-6, 564e-6, 885e-6, 56.6e-3, 3330e-9, 2.1e+11, 0.3),
+    ('W30X116', 'W30X116', 173, 22100e-6, 762e-3, 762e-3, 267e-3, 267e-3, 14.4e-3, 14.3e-3, 21.6e-3, 22.2e-3, 38.1e-3, 44.5e-3, 28.6e-3, 685.8e-3, 2050e-6, 5390e-6, 6190e-6, 305e-3, 9875.52e-6, 68.3e-6, 513e-6, 806e-6, 55.6e-3, 2680e-9, 2.1e+11, 0.3),
+    ('W30X108', 'W30X108', 161, 20500e-6, 757e-3, 759e-3, 267e-3, 267e-3, 13.8e-3, 14.3e-3, 19.3e-3, 19e-3, 35.8e-3, 42.9e-3, 28.6e-3, 685.4e-3, 1860e-6, 4900e-6, 5670e-6, 302e-3, 9458.52e-6, 60.8e-6, 457e-6, 719e-6, 54.6e-3, 2080e-9, 2.1e+11, 0.3),
+    ('W30X99', 'W30X99', 147, 18700e-6, 754e-3, 752e-3, 267e-3, 267e-3, 13.2e-3, 12.7e-3, 17e-3, 17.5e-3, 33.5e-3, 39.7e-3, 27e-3, 687e-3, 1660e-6, 4410e-6, 5110e-6, 297e-3, 9068.4e-6, 53.3e-6, 401e-6, 633e-6, 53.3e-3, 1570e-9, 2.1e+11, 0.3),
+    ('W30X90', 'W30X90', 134, 17000e-6, 749e-3, 749e-3, 264e-3, 264e-3, 11.9e-3, 12.7e-3, 15.5e-3, 15.9e-3, 32e-3, 38.1e-3, 27e-3, 685e-3, 1500e-6, 4010e-6, 4640e-6, 297e-3, 8151.5e-6, 47.9e-6, 362e-6, 569e-6, 53.1e-3, 1180e-9, 2.1e+11, 0.3),
+    ('W27X539', 'W27X539', 802, 103000e-6, 826e-3, 826e-3, 389e-3, 387e-3, 50e-3, 50.8e-3, 89.9e-3, 90.5e-3, 110e-3, 113e-3, 46e-3, 606e-3, 10700e-6, 25700e-6, 31000e-6, 323e-3, 30300e-6, 878e-6, 4540e-6, 7160e-6, 92.7e-3, 206000e-9, 2.1e+11, 0.3),
+    ('W27X368', 'W27X368', 548, 70300e-6, 772e-3, 772e-3, 373e-3, 371e-3, 35.1e-3, 34.9e-3, 63e-3, 63.5e-3, 83.1e-3, 85.7e-3, 38.1e-3, 605.8e-3, 6740e-6, 17400e-6, 20300e-6, 310e-3, 21263.6e-6, 545e-6, 2930e-6, 4570e-6, 88.4e-3, 70800e-9, 2.1e+11, 0.3),
+    ('W27X336', 'W27X336', 500, 64000e-6, 762e-3, 762e-3, 371e-3, 368e-3, 32e-3, 31.8e-3, 57.9e-3, 57.2e-3, 78e-3, 81e-3, 36.5e-3, 606e-3, 6080e-6, 15900e-6, 18500e-6, 307e-3, 19392e-6, 491e-6, 2650e-6, 4130e-6, 87.6e-3, 54500e-9, 2.1e+11, 0.3),
+    ('W27X307', 'W27X307', 457, 58200e-6, 752e-3, 752e-3, 366e-3, 368e-3, 29.5e-3, 30.2e-3, 53.1e-3, 52.4e-3, 73.2e-3, 76.2e-3, 36.5e-3, 605.6e-3, 5450e-6, 14500e-6, 16900e-6, 305e-3, 17865.2e-6, 437e-6, 2390e-6, 3720e-6, 86.6e-3, 42000e-9, 2.1e+11, 0.3),
+    ('W27X281', 'W27X281', 419, 53600e-6, 744e-3, 743e-3, 366e-3, 365e-3, 26.9e-3, 27e-3, 49e-3, 49.2e-3, 69.1e-3, 71.4e-3, 34.9e-3, 605.8e-3, 4950e-6, 13300e-6, 15300e-6, 305e-3, 16296e-6, 397e-6, 2180e-6, 3380e-6, 86.1e-3, 33100e-9, 2.1e+11, 0.3),
+    ('W27X258', 'W27X258', 384, 49100e-6, 737e-3, 737e-3, 363e-3, 362e-3, 24.9e-3, 25.4e-3, 45e-3, 44.4e-3, 65e-3, 68.3e-3, 33.3e-3, 607e-3, 4500e-6, 12200e-6, 14000e-6, 302e-3, 15114.3e-6, 358e-6, 1970e-6, 3060e-6, 85.3e-3, 25600e-9, 2.1e+11, 0.3),
+    ('W27X235', 'W27X235', 350, 44800e-6, 729e-3, 727e-3, 361e-3, 362e-3, 23.1e-3, 23.8e-3, 40.9e-3, 41.3e-3, 61e-3, 63.5e-3, 33.3e-3, 607e-3, 4040e-6, 11100e-6, 12700e-6, 300e-3, 14021.7e-6, 320e-6, 1770e-6, 2750e-6, 84.6e-3, 19600e-9, 2.1e+11, 0.3),
+    ('W27X217', 'W27X217', 323, 41200e-6, 721e-3, 721e-3, 358e-3, 359e-3, 21.1e-3, 20.6e-3, 38.1e-3, 38.1e-3, 58.2e-3, 60.3e-3, 31.8e-3, 604.6e-3, 3710e-6, 10300e-6, 11700e-6, 300e-3, 12757.1e-6, 293e-6, 1640e-6, 2520e-6, 84.3e-3, 15700e-9, 2.1e+11, 0.3),
+    ('W27X194', 'W27X194', 389, 36800e-6, 714e-3, 714e-3, 356e-3, 356e-3, 19.1e-3, 19e-3, 34e-3, 33.3e-3, 54.1e-3, 57.2e-3, 30.2e-3, 605.8e-3, 3270e-6, 9160e-6, 10300e-6, 297e-3, 11570.8e-6, 258e-6, 1440e-6, 2230e-6, 83.6e-3, 11300e-9, 2.1e+11, 0.3),
+    ('W27X178', 'W27X178', 365, 33900e-6, 706e-3, 705e-3, 358e-3, 359e-3, 18.4e-3, 19e-3, 30.2e-3, 30.2e-3, 50.3e-3, 52.4e-3, 30.2e-3, 605.4e-3, 2920e-6, 8280e-6, 9340e-6, 295e-3, 11139.4e-6, 231e-6, 1290e-6, 2000e-6, 82.6e-3, 8370e-9, 2.1e+11, 0.3),
+    ('W27X161', 'W27X161', 240, 30700e-6, 701e-3, 702e-3, 356e-3, 356e-3, 16.8e-3, 17.5e-3, 27.4e-3, 27e-3, 47.5e-3, 50.8e-3, 30.2e-3, 606e-3, 2630e-6, 7510e-6, 8440e-6, 292e-3, 10180.8e-6, 207e-6, 1160e-6, 1790e-6, 82e-3, 6290e-9, 2.1e+11, 0.3),
+    ('W27X146', 'W27X146', 217, 27900e-6, 696e-3, 695e-3, 356e-3, 356e-3, 15.4e-3, 15.9e-3, 24.8e-3, 25.4e-3, 44.7e-3, 47.6e-3, 28.6e-3, 606.6e-3, 2360e-6, 6780e-6, 7600e-6, 292e-3, 9341.64e-6, 184e-6, 1040e-6, 1600e-6, 81.3e-3, 4700e-9, 2.1e+11, 0.3),
+    ('W27X129', 'W27X129', 192, 24400e-6, 701e-3, 702e-3, 254e-3, 254e-3, 15.5e-3, 15.9e-3, 27.9e-3, 28.6e-3, 43.2e-3, 50.8e-3, 28.6e-3, 614.6e-3, 1980e-6, 5650e-6, 6470e-6, 284e-3, 9526.3e-6, 76.6e-6, 603e-6, 944e-6, 56.1e-3, 4620e-9, 2.1e+11, 0.3),
+    ('W27X114', 'W27X114', 170, 21700e-6, 693e-3, 692e-3, 257e-3, 257e-3, 14.5e-3, 14.3e-3, 23.6e-3, 23.8e-3, 38.9e-3, 46e-3, 28.6e-3, 615.2e-3, 1700e-6, 4900e-6, 5620e-6, 279e-3, 8920.4e-6, 66.2e-6, 516e-6, 808e-6, 55.4e-3, 3050e-9, 2.1e+11, 0.3),
+    ('W27X102', 'W27X102', 152, 19400e-6, 688e-3, 689e-3, 254e-3, 254e-3, 13.1e-3, 12.7e-3, 21.1e-3, 20.6e-3, 36.3e-3, 44.5e-3, 27e-3, 615.4e-3, 1510e-6, 4380e-6, 5000e-6, 279e-3, 8061.74e-6, 57.9e-6, 456e-6, 711e-6, 54.6e-3, 2200e-9, 2.1e+11, 0.3),
+    ('W27X94', 'W27X94', 140, 17800e-6, 683e-3, 683e-3, 254e-3, 254e-3, 12.4e-3, 12.7e-3, 18.9e-3, 19e-3, 34e-3, 41.3e-3, 27e-3, 615e-3, 1360e-6, 3980e-6, 4560e-6, 277e-3, 7626e-6, 51.6e-6, 406e-6, 636e-6, 53.8e-3, 1680e-9, 2.1e+11, 0.3),
+    ('W27X84', 'W27X84', 125, 15900e-6, 678e-3, 679e-3, 254e-3, 254e-3, 11.7e-3, 11.1e-3, 16.3e-3, 15.9e-3, 31.5e-3, 39.7e-3, 27e-3, 615e-3, 1190e-6, 3490e-6, 4000e-6, 272e-3, 7195.5e-6, 44.1e-6, 347e-6, 544e-6, 52.6e-3, 1170e-9, 2.1e+11, 0.3),
+    ('W24X370', 'W24X370', 551, 70300e-6, 711e-3, 711e-3, 348e-3, 346e-3, 38.6e-3, 38.1e-3, 69.1e-3, 69.8e-3, 81.8e-3, 92.1e-3, 39.7e-3, 547.4e-3, 5580e-6, 15700e-6, 18500e-6, 282e-3, 21129.6e-6, 483e-6, 2790e-6, 4380e-6, 83.1e-3, 83700e-9, 2.1e+11, 0.3),
+    ('W24X335', 'W24X335', 498, 63400e-6, 699e-3, 698e-3, 343e-3, 343e-3, 35.1e-3, 34.9e-3, 63e-3, 63.5e-3, 75.7e-3, 85.7e-3, 38.1e-3, 547.6e-3, 4950e-6, 14200e-6, 16700e-6, 279e-3, 19220.8e-6, 429e-6, 2490e-6, 3900e-6, 82e-3, 63300e-9, 2.1e+11, 0.3),
+    ('W24X306', 'W24X306', 455, 57900e-6, 688e-3, 689e-3, 340e-3, 340e-3, 32e-3, 31.8e-3, 57.9e-3, 57.2e-3, 70.6e-3, 81e-3, 36.5e-3, 546.8e-3, 4450e-6, 12900e-6, 15100e-6, 277e-3, 17497.6e-6, 383e-6, 2250e-6, 3510e-6, 81.3e-3, 48700e-9, 2.1e+11, 0.3),
+    ('W24X279', 'W24X279', 415, 52800e-6, 678e-3, 679e-3, 338e-3, 337e-3, 29.5e-3, 30.2e-3, 53.1e-3, 52.4e-3, 65.8e-3, 76.2e-3, 36.5e-3, 546.4e-3, 4000e-6, 11800e-6, 13700e-6, 274e-3, 16118.8e-6, 343e-6, 2030e-6, 3160e-6, 80.5e-3, 37700e-9, 2.1e+11, 0.3),
+    ('W24X250', 'W24X250', 372, 47400e-6, 668e-3, 670e-3, 335e-3, 333e-3, 26.4e-3, 27e-3, 48e-3, 47.6e-3, 60.7e-3, 71.4e-3, 34.9e-3, 546.6e-3, 3530e-6, 10600e-6, 12200e-6, 272e-3, 14430.2e-6, 301e-6, 1800e-6, 2800e-6, 79.8e-3, 27700e-9, 2.1e+11, 0.3),
+    ('W24X229', 'W24X229', 341, 43400e-6, 660e-3, 660e-3, 333e-3, 333e-3, 24.4e-3, 23.8e-3, 43.9e-3, 44.4e-3, 56.6e-3, 66.7e-3, 33.3e-3, 546.8e-3, 3180e-6, 9640e-6, 11100e-6, 272e-3, 13341.9e-6, 271e-6, 1630e-6, 2520e-6, 79e-3, 21400e-9, 2.1e+11, 0.3),
+    ('W24X207', 'W24X207', 307, 39200e-6, 653e-3, 654e-3, 330e-3, 330e-3, 22.1e-3, 22.2e-3, 39.9e-3, 39.7e-3, 52.6e-3, 63.5e-3, 31.8e-3, 547.8e-3, 2840e-6, 8700e-6, 9930e-6, 269e-3, 12106.4e-6, 241e-6, 1460e-6, 2250e-6, 78.2e-3, 15900e-9, 2.1e+11, 0.3),
+    ('W24X192', 'W24X192', 285, 36500e-6, 648e-3, 648e-3, 330e-3, 330e-3, 20.6e-3, 20.6e-3, 37.1e-3, 36.5e-3, 49.8e-3, 60.3e-3, 31.8e-3, 548.4e-3, 2610e-6, 8050e-6, 9160e-6, 267e-3, 11297e-6, 221e-6, 1340e-6, 2060e-6, 78e-3, 12800e-9, 2.1e+11, 0.3),
+    ('W24X176', 'W24X176', 262, 33400e-6, 640e-3, 641e-3, 328e-3, 327e-3, 19.1e-3, 19e-3, 34e-3, 33.3e-3, 46.7e-3, 57.2e-3, 30.2e-3, 546.6e-3, 2360e-6, 7370e-6, 8370e-6, 267e-3, 10440.1e-6, 199e-6, 1220e-6, 1880e-6, 77.2e-3, 9950e-9, 2.1e+11, 0.3),
+    ('W24X162', 'W24X162', 241, 30800e-6, 635e-3, 635e-3, 330e-3, 330e-3, 17.9e-3, 17.5e-3, 31e-3, 31.8e-3, 43.7e-3, 54e-3, 30.2e-3, 547.6e-3, 2150e-6, 6780e-6, 7670e-6, 264e-3, 9802.04e-6, 184e-6, 1120e-6, 1720e-6, 77.5e-3, 7700e-9, 2.1e+11, 0.3),
+    ('W24X146', 'W24X146', 217, 27700e-6, 627e-3, 629e-3, 328e-3, 327e-3, 16.5e-3, 15.9e-3, 27.7e-3, 27e-3, 40.4e-3, 50.8e-3, 28.6e-3, 546.2e-3, 1910e-6, 6080e-6, 6850e-6, 262e-3, 9012.3e-6, 163e-6, 991e-6, 1530e-6, 76.5e-3, 5580e-9, 2.1e+11, 0.3),
+    ('W24X131', 'W24X131', 195, 24900e-6, 622e-3, 622e-3, 328e-3, 327e-3, 15.4e-3, 15.9e-3, 24.4e-3, 23.8e-3, 37.1e-3, 47.6e-3, 28.6e-3, 547.8e-3, 1670e-6, 5390e-6, 6060e-6, 259e-3, 8436.12e-6, 142e-6, 869e-6, 1340e-6, 75.4e-3, 3950e-9, 2.1e+11, 0.3),
+    ('W24X117', 'W24X117', 174, 22200e-6, 617e-3, 616e-3, 325e-3, 324e-3, 14e-3, 14.3e-3, 21.6e-3, 22.2e-3, 34.3e-3, 44.5e-3, 28.6e-3, 548.4e-3, 1470e-6, 4770e-6, 5360e-6, 257e-3, 7677.6e-6, 124e-6, 762e-6, 1170e-6, 74.7e-3, 2800e-9, 2.1e+11, 0.3),
+    ('W24X104', 'W24X104', 155, 19800e-6, 612e-3, 610e-3, 325e-3, 324e-3, 12.7e-3, 12.7e-3, 19.1e-3, 19e-3, 31.8e-3, 41.3e-3, 27e-3, 548.4e-3, 1290e-6, 4230e-6, 4740e-6, 257e-3, 6964.68e-6, 108e-6, 667e-6, 1020e-6, 73.9e-3, 1960e-9, 2.1e+11, 0.3),
+    ('W24X103', 'W24X103', 153, 19500e-6, 622e-3, 622e-3, 229e-3, 229e-3, 14e-3, 14.3e-3, 24.9e-3, 25.4e-3, 37.6e-3, 47.6e-3, 28.6e-3, 546.8e-3, 1250e-6, 4010e-6, 4590e-6, 254e-3, 7655.2e-6, 49.5e-6, 434e-6, 680e-6, 50.5e-3, 2940e-9, 2.1e+11, 0.3),
+    ('W24X94', 'W24X94', 140, 17900e-6, 617e-3, 616e-3, 230e-3, 232e-3, 13.1e-3, 12.7e-3, 22.2e-3, 22.2e-3, 35.1e-3, 44.5e-3, 27e-3, 546.8e-3, 1120e-6, 3640e-6, 4160e-6, 251e-3, 7163.08e-6, 45.4e-6, 393e-6, 615e-6, 50.3e-3, 2190e-9, 2.1e+11, 0.3),
+    ('W24X84', 'W24X84', 125, 15900e-6, 612e-3, 613e-3, 229e-3, 229e-3, 11.9e-3, 12.7e-3, 19.6e-3, 19e-3, 32.3e-3, 42.9e-3, 27e-3, 547.4e-3, 986e-6, 3210e-6, 3670e-6, 249e-3, 6514.06e-6, 39.3e-6, 342e-6, 534e-6, 49.5e-3, 1540e-9, 2.1e+11, 0.3),
+    ('W24X76', 'W24X76', 113, 14500e-6, 607e-3, 606e-3, 228e-3, 229e-3, 11.2e-3, 11.1e-3, 17.3e-3, 17.5e-3, 30e-3, 39.7e-3, 27e-3, 547e-3, 874e-6, 2880e-6, 3280e-6, 246e-3, 6126.4e-6, 34.3e-6, 302e-6, 469e-6, 48.8e-3, 1120e-9, 2.1e+11, 0.3),
+    ('W24X68', 'W24X68', 101, 13000e-6, 602e-3, 603e-3, 228e-3, 229e-3, 10.5e-3, 11.1e-3, 14.9e-3, 14.3e-3, 27.7e-3, 38.1e-3, 27e-3, 546.6e-3, 762e-6, 2520e-6, 2900e-6, 243e-3, 5739.3e-6, 29.3e-6, 257e-6, 401e-6, 47.5e-3, 778e-9, 2.1e+11, 0.3),
+    ('W24X62', 'W24X62', 92, 11700e-6, 602e-3, 603e-3, 179e-3, 178e-3, 10.9e-3, 11.1e-3, 15e-3, 14.3e-3, 27.7e-3, 38.1e-3, 27e-3, 546.6e-3, 645e-6, 2150e-6, 2510e-6, 234e-3, 5957.94e-6, 14.4e-6, 161e-6, 257e-6, 35.1e-3, 712e-9, 2.1e+11, 0.3),
+    ('W24X55', 'W24X55', 82, 10500e-6, 599e-3, 600e-3, 178e-3, 178e-3, 10e-3, 9.52e-3, 12.8e-3, 12.7e-3, 25.7e-3, 36.5e-3, 25.4e-3, 547.6e-3, 562e-6, 1870e-6, 2200e-6, 231e-3, 5476e-6, 12.1e-6, 136e-6, 218e-6, 34e-3, 491e-9, 2.1e+11, 0.3),
+    ('W21X201', 'W21X201', 300, 38300e-6, 584e-3, 584e-3, 320e-3, 321e-3, 23.1e-3, 23.8e-3, 41.4e-3, 41.3e-3, 54.1e-3, 63.5e-3, 33.3e-3, 475.8e-3, 2210e-6, 7550e-6, 8690e-6, 241e-3, 10991e-6, 226e-6, 1410e-6, 2180e-6, 76.7e-3, 17000e-9, 2.1e+11, 0.3),
+    ('W21X182', 'W21X182', 272, 34600e-6, 577e-3, 578e-3, 318e-3, 318e-3, 21.1e-3, 20.6e-3, 37.6e-3, 38.1e-3, 50.3e-3, 60.3e-3, 31.8e-3, 476.4e-3, 1970e-6, 6830e-6, 7800e-6, 239e-3, 10052e-6, 201e-6, 1270e-6, 1950e-6, 76.2e-3, 12800e-9, 2.1e+11, 0.3),
+    ('W21X166', 'W21X166', 248, 31500e-6, 572e-3, 572e-3, 315e-3, 314e-3, 19.1e-3, 19e-3, 34.5e-3, 34.9e-3, 47.2e-3, 57.2e-3, 30.2e-3, 477.6e-3, 1780e-6, 6230e-6, 7080e-6, 238e-3, 9122.16e-6, 181e-6, 1150e-6, 1770e-6, 75.9e-3, 9820e-9, 2.1e+11, 0.3),
+    ('W21X147', 'W21X147', 219, 27900e-6, 561e-3, 559e-3, 318e-3, 318e-3, 18.3e-3, 19e-3, 29.2e-3, 28.6e-3, 41.9e-3, 50.8e-3, 30.2e-3, 477.2e-3, 1510e-6, 5390e-6, 6110e-6, 233e-3, 8732.76e-6, 157e-6, 985e-6, 1520e-6, 74.9e-3, 6410e-9, 2.1e+11, 0.3),
+    ('W21X132', 'W21X132', 196, 25000e-6, 554e-3, 556e-3, 315e-3, 318e-3, 16.5e-3, 15.9e-3, 26.4e-3, 27e-3, 39.1e-3, 49.2e-3, 28.6e-3, 475.8e-3, 1340e-6, 4830e-6, 5460e-6, 232e-3, 7850.7e-6, 139e-6, 877e-6, 1350e-6, 74.4e-3, 4700e-9, 2.1e+11, 0.3),
+    ('W21X122', 'W21X122', 182, 23200e-6, 551e-3, 549e-3, 315e-3, 314e-3, 15.2e-3, 15.9e-3, 24.4e-3, 23.8e-3, 37.1e-3, 46e-3, 28.6e-3, 476.8e-3, 1230e-6, 4470e-6, 5030e-6, 231e-3, 7247.36e-6, 127e-6, 806e-6, 1240e-6, 74.2e-3, 3740e-9, 2.1e+11, 0.3),
+    ('W21X111', 'W21X111', 165, 21000e-6, 546e-3, 546e-3, 312e-3, 314e-3, 14e-3, 14.3e-3, 22.2e-3, 22.2e-3, 35.1e-3, 44.5e-3, 28.6e-3, 475.8e-3, 1110e-6, 4080e-6, 4570e-6, 230e-3, 6661.2e-6, 114e-6, 729e-6, 1120e-6, 73.7e-3, 2840e-9, 2.1e+11, 0.3),
+    ('W21X101', 'W21X101', 150, 19200e-6, 544e-3, 543e-3, 312e-3, 311e-3, 12.7e-3, 12.7e-3, 20.3e-3, 20.6e-3, 33e-3, 42.9e-3, 27e-3, 478e-3, 1010e-6, 3720e-6, 4150e-6, 229e-3, 6070.6e-6, 103e-6, 660e-6, 1010e-6, 73.4e-3, 2170e-9, 2.1e+11, 0.3),
+    ('W21X93', 'W21X93', 138, 17600e-6, 549e-3, 549e-3, 214e-3, 213e-3, 14.7e-3, 14.3e-3, 23.6e-3, 23.8e-3, 36.3e-3, 41.3e-3, 23.8e-3, 476.4e-3, 862e-6, 3150e-6, 3620e-6, 221e-3, 7003.08e-6, 38.7e-6, 362e-6, 569e-6, 46.7e-3, 2510e-9, 2.1e+11, 0.3),
+    ('W21X83', 'W21X83', 123, 15700e-6, 544e-3, 543e-3, 212e-3, 213e-3, 13.1e-3, 12.7e-3, 21.2e-3, 20.6e-3, 34e-3, 38.1e-3, 22.2e-3, 476e-3, 762e-6, 2800e-6, 3210e-6, 220e-3, 6235.6e-6, 33.9e-6, 320e-6, 500e-6, 46.5e-3, 1810e-9, 2.1e+11, 0.3),
+    ('W21X73', 'W21X73', 109, 13900e-6, 538e-3, 540e-3, 211e-3, 210e-3, 11.6e-3, 11.1e-3, 18.8e-3, 19e-3, 31.5e-3, 36.5e-3, 22.2e-3, 475e-3, 666e-6, 2470e-6, 2820e-6, 219e-3, 5510e-6, 29.4e-6, 279e-6, 436e-6, 46e-3, 1260e-9, 2.1e+11, 0.3),
+    ('W21X68', 'W21X68', 101, 12900e-6, 536e-3, 537e-3, 210e-3, 210e-3, 10.9e-3, 11.1e-3, 17.4e-3, 17.5e-3, 30.2e-3, 34.9e-3, 22.2e-3, 475.6e-3, 616e-6, 2290e-6, 2620e-6, 218e-3, 5184.04e-6, 26.9e-6, 257e-6, 400e-6, 45.7e-3, 1020e-9, 2.1e+11, 0.3),
+    ('W21X62', 'W21X62', 92, 11800e-6, 533e-3, 533e-3, 209e-3, 210e-3, 10.2e-3, 9.52e-3, 15.6e-3, 15.9e-3, 28.4e-3, 33.3e-3, 20.6e-3, 476.2e-3, 554e-6, 2080e-6, 2360e-6, 217e-3, 4857.24e-6, 23.9e-6, 229e-6, 356e-6, 45e-3, 762e-9, 2.1e+11, 0.3),
+    ('W21X55', 'W21X55', 82, 10500e-6, 528e-3, 527e-3, 209e-3, 210e-3, 9.53e-3, 9.52e-3, 13.3e-3, 12.7e-3, 25.9e-3, 30.2e-3, 20.6e-3, 476.2e-3, 475e-6, 1800e-6, 2060e-6, 213e-3, 4538.19e-6, 20.1e-6, 193e-6, 302e-6, 43.9e-3, 516e-9, 2.1e+11, 0.3),
+    ('W21X48', 'W21X48', 72, 9100e-6, 523e-3, 524e-3, 207e-3, 206e-3, 8.89e-3, 9.52e-3, 10.9e-3, 11.1e-3, 23.6e-3, 28.6e-3, 20.6e-3, 475.8e-3, 399e-6, 1520e-6, 1750e-6, 209e-3, 4229.86e-6, 16.1e-6, 156e-6, 244e-6, 42.2e-3, 334e-9, 2.1e+11, 0.3),
+    ('W21X57', 'W21X57', 85, 10800e-6, 536e-3, 533e-3, 167e-3, 165e-3, 10.3e-3, 9.52e-3, 16.5e-3, 15.9e-3, 29.2e-3, 33.3e-3, 20.6e-3, 477.6e-3, 487e-6, 1820e-6, 2110e-6, 212e-3, 4919.28e-6, 12.7e-6, 153e-6, 243e-6, 34.3e-3, 737e-9, 2.1e+11, 0.3),
+    ('W21X50', 'W21X50', 74, 9480e-6, 528e-3, 530e-3, 166e-3, 165e-3, 9.65e-3, 9.52e-3, 13.6e-3, 14.3e-3, 26.4e-3, 31.8e-3, 20.6e-3, 475.2e-3, 410e-6, 1550e-6, 1800e-6, 208e-3, 4585.68e-6, 10.4e-6, 125e-6, 200e-6, 33e-3, 475e-9, 2.1e+11, 0.3),
+    ('W21X44', 'W21X44', 66, 8390e-6, 526e-3, 524e-3, 165e-3, 165e-3, 8.89e-3, 9.52e-3, 11.4e-3, 11.1e-3, 24.1e-3, 28.6e-3, 20.6e-3, 477.8e-3, 351e-6, 1340e-6, 1560e-6, 205e-3, 4247.64e-6, 8.62e-6, 104e-6, 167e-6, 32e-3, 320e-9, 2.1e+11, 0.3),
+    ('W18X311', 'W18X311', 464, 59100e-6, 566e-3, 568e-3, 305e-3, 305e-3, 38.6e-3, 38.1e-3, 69.6e-3, 69.8e-3, 82.3e-3, 87.3e-3, 34.9e-3, 401.4e-3, 2900e-6, 10200e-6, 12400e-6, 221e-3, 15494e-6, 331e-6, 2160e-6, 3390e-6, 74.9e-3, 73300e-9, 2.1e+11, 0.3),
+    ('W18X283', 'W18X283', 421, 53700e-6, 556e-3, 556e-3, 302e-3, 302e-3, 35.6e-3, 34.9e-3, 63.5e-3, 63.5e-3, 76.2e-3, 81e-3, 33.3e-3, 403.6e-3, 2570e-6, 9260e-6, 11100e-6, 219e-3, 14368.2e-6, 293e-6, 1930e-6, 3030e-6, 73.9e-3, 55800e-9, 2.1e+11, 0.3),
+    ('W18X258', 'W18X258', 384, 49000e-6, 546e-3, 546e-3, 300e-3, 298e-3, 32.5e-3, 31.8e-3, 58.4e-3, 58.7e-3, 68.6e-3, 76.2e-3, 31.8e-3, 408.8e-3, 2290e-6, 8420e-6, 10000e-6, 217e-3, 13286e-6, 261e-6, 1750e-6, 2720e-6, 73.2e-3, 42900e-9, 2.1e+11, 0.3),
+    ('W18X234', 'W18X234', 349, 44300e-6, 536e-3, 533e-3, 297e-3, 295e-3, 29.5e-3, 30.2e-3, 53.6e-3, 54e-3, 63.8e-3, 69.9e-3, 30.2e-3, 408.4e-3, 2040e-6, 7640e-6, 9000e-6, 214e-3, 12047.8e-6, 232e-6, 1570e-6, 2440e-6, 72.4e-3, 32800e-9, 2.1e+11, 0.3),
+    ('W18X211', 'W18X211', 315, 40200e-6, 526e-3, 524e-3, 295e-3, 292e-3, 26.9e-3, 27e-3, 48.5e-3, 49.2e-3, 58.7e-3, 65.1e-3, 30.2e-3, 408.6e-3, 1800e-6, 6870e-6, 8030e-6, 212e-3, 10991.3e-6, 205e-6, 1400e-6, 2160e-6, 71.6e-3, 24400e-9, 2.1e+11, 0.3),
+    ('W18X192', 'W18X192', 286, 36300e-6, 518e-3, 518e-3, 292e-3, 292e-3, 24.4e-3, 23.8e-3, 44.5e-3, 44.4e-3, 54.6e-3, 61.9e-3, 28.6e-3, 408.8e-3, 1610e-6, 6230e-6, 7240e-6, 210e-3, 9974.72e-6, 183e-6, 1260e-6, 1950e-6, 70.9e-3, 18600e-9, 2.1e+11, 0.3),
+    ('W18X175', 'W18X175', 260, 33200e-6, 508e-3, 508e-3, 290e-3, 289e-3, 22.6e-3, 22.2e-3, 40.4e-3, 39.7e-3, 50.5e-3, 61.9e-3, 31.8e-3, 407e-3, 1440e-6, 5640e-6, 6520e-6, 208e-3, 9198.2e-6, 163e-6, 1130e-6, 1740e-6, 70.1e-3, 14100e-9, 2.1e+11, 0.3),
+    ('W18X158', 'W18X158', 235, 29900e-6, 500e-3, 502e-3, 287e-3, 286e-3, 20.6e-3, 20.6e-3, 36.6e-3, 36.5e-3, 46.7e-3, 60.3e-3, 31.8e-3, 406.6e-3, 1270e-6, 5080e-6, 5830e-6, 206e-3, 8375.96e-6, 144e-6, 1010e-6, 1550e-6, 69.6e-3, 10500e-9, 2.1e+11, 0.3),
+    ('W18X143', 'W18X143', 213, 27100e-6, 495e-3, 495e-3, 284e-3, 286e-3, 18.5e-3, 19e-3, 33.5e-3, 33.3e-3, 43.7e-3, 55.6e-3, 30.2e-3, 407.6e-3, 1140e-6, 4620e-6, 5280e-6, 205e-3, 7540.6e-6, 129e-6, 909e-6, 1400e-6, 69.1e-3, 7990e-9, 2.1e+11, 0.3),
+    ('W18X130', 'W18X130', 193, 24700e-6, 490e-3, 489e-3, 284e-3, 283e-3, 17e-3, 17.5e-3, 30.5e-3, 30.2e-3, 40.6e-3, 52.4e-3, 30.2e-3, 408.8e-3, 1020e-6, 4200e-6, 4750e-6, 204e-3, 6949.6e-6, 116e-6, 818e-6, 1260e-6, 68.6e-3, 6040e-9, 2.1e+11, 0.3),
+    ('W18X119', 'W18X119', 177, 22600e-6, 483e-3, 483e-3, 287e-3, 286e-3, 16.6e-3, 15.9e-3, 26.9e-3, 27e-3, 37.1e-3, 49.2e-3, 30.2e-3, 408.8e-3, 912e-6, 3790e-6, 4290e-6, 201e-3, 6786.08e-6, 105e-6, 736e-6, 1130e-6, 68.3e-3, 4410e-9, 2.1e+11, 0.3),
+    ('W18X106', 'W18X106', 158, 20100e-6, 475e-3, 476e-3, 284e-3, 286e-3, 15e-3, 14.3e-3, 23.9e-3, 23.8e-3, 34e-3, 46e-3, 28.6e-3, 407e-3, 795e-6, 3340e-6, 3770e-6, 199e-3, 6105e-6, 91.6e-6, 646e-6, 991e-6, 67.6e-3, 3110e-9, 2.1e+11, 0.3),
+    ('W18X97', 'W18X97', 144, 18400e-6, 472e-3, 473e-3, 282e-3, 283e-3, 13.6e-3, 14.3e-3, 22.1e-3, 22.2e-3, 32.3e-3, 44.5e-3, 28.6e-3, 407.4e-3, 728e-6, 3080e-6, 3460e-6, 199e-3, 5540.64e-6, 83.7e-6, 592e-6, 906e-6, 67.3e-3, 2440e-9, 2.1e+11, 0.3),
+    ('W18X86', 'W18X86', 128, 16300e-6, 467e-3, 467e-3, 282e-3, 283e-3, 12.2e-3, 12.7e-3, 19.6e-3, 19e-3, 29.7e-3, 41.3e-3, 27e-3, 407.6e-3, 637e-6, 2720e-6, 3050e-6, 197e-3, 4972.72e-6, 72.8e-6, 518e-6, 793e-6, 66.8e-3, 1710e-9, 2.1e+11, 0.3),
+    ('W18X76', 'W18X76', 113, 14400e-6, 462e-3, 464e-3, 279e-3, 279e-3, 10.8e-3, 11.1e-3, 17.3e-3, 17.5e-3, 27.4e-3, 39.7e-3, 27e-3, 407.2e-3, 554e-6, 2390e-6, 2670e-6, 196e-3, 4397.76e-6, 63.3e-6, 452e-6, 692e-6, 66.3e-3, 1180e-9, 2.1e+11, 0.3),
+    ('W18X71', 'W18X71', 106, 13500e-6, 470e-3, 470e-3, 194e-3, 194e-3, 12.6e-3, 12.7e-3, 20.6e-3, 20.6e-3, 30.7e-3, 38.1e-3, 22.2e-3, 408.6e-3, 487e-6, 2080e-6, 2390e-6, 191e-3, 5148.36e-6, 25.1e-6, 259e-6, 405e-6, 43.2e-3, 1450e-9, 2.1e+11, 0.3),
+    ('W18X65', 'W18X65', 97, 12300e-6, 467e-3, 467e-3, 193e-3, 194e-3, 11.4e-3, 11.1e-3, 19.1e-3, 19e-3, 29.2e-3, 36.5e-3, 22.2e-3, 408.6e-3, 445e-6, 1920e-6, 2180e-6, 190e-3, 4658.04e-6, 22.8e-6, 236e-6, 369e-6, 42.9e-3, 1140e-9, 2.1e+11, 0.3),
+    ('W18X60', 'W18X60', 89, 11400e-6, 462e-3, 464e-3, 192e-3, 190e-3, 10.5e-3, 11.1e-3, 17.7e-3, 17.5e-3, 27.9e-3, 34.9e-3, 20.6e-3, 406.2e-3, 410e-6, 1770e-6, 2020e-6, 190e-3, 4265.1e-6, 20.9e-6, 218e-6, 338e-6, 42.7e-3, 903e-9, 2.1e+11, 0.3),
+    ('W18X55', 'W18X55', 82, 10500e-6, 460e-3, 460e-3, 191e-3, 190e-3, 9.91e-3, 9.52e-3, 16e-3, 15.9e-3, 26.2e-3, 33.3e-3, 20.6e-3, 407.6e-3, 370e-6, 1610e-6, 1840e-6, 188e-3, 4039.32e-6, 18.7e-6, 195e-6, 303e-6, 42.4e-3, 691e-9, 2.1e+11, 0.3),
+    ('W18X50', 'W18X50', 74, 9480e-6, 457e-3, 457e-3, 191e-3, 190e-3, 9.02e-3, 9.52e-3, 14.5e-3, 14.3e-3, 24.7e-3, 31.8e-3, 20.6e-3, 407.6e-3, 333e-6, 1460e-6, 1660e-6, 187e-3, 3676.55e-6, 16.7e-6, 175e-6, 272e-6, 41.9e-3, 516e-9, 2.1e+11, 0.3),
+    ('W18X46', 'W18X46', 68, 8710e-6, 460e-3, 457e-3, 154e-3, 152e-3, 9.14e-3, 9.52e-3, 15.4e-3, 15.9e-3, 25.7e-3, 31.8e-3, 20.6e-3, 408.6e-3, 296e-6, 1290e-6, 1490e-6, 184e-3, 3734.6e-6, 9.37e-6, 122e-6, 192e-6, 32.8e-3, 508e-9, 2.1e+11, 0.3),
+    ('W18X40', 'W18X40', 60, 7610e-6, 455e-3, 454e-3, 153e-3, 152e-3, 8e-3, 7.94e-3, 13.3e-3, 12.7e-3, 23.5e-3, 30.2e-3, 20.6e-3, 408e-3, 255e-6, 1120e-6, 1280e-6, 183e-3, 3264e-6, 7.95e-6, 104e-6, 164e-6, 32.3e-3, 337e-9, 2.1e+11, 0.3),
+    ('W18X35', 'W18X35', 52, 6650e-6, 450e-3, 451e-3, 152e-3, 152e-3, 7.62e-3, 7.94e-3, 10.8e-3, 11.1e-3, 21e-3, 28.6e-3, 19.1e-3, 408e-3, 212e-6, 944e-6, 1090e-6, 179e-3, 3108.96e-6, 6.37e-6, 83.9e-6, 132e-6, 31e-3, 211e-9, 2.1e+11, 0.3),
+    ('W16X100', 'W16X100', 149, 19000e-6, 432e-3, 432e-3, 264e-3, 264e-3, 14.9e-3, 14.3e-3, 25e-3, 25.4e-3, 35.3e-3, 47.6e-3, 28.6e-3, 361.4e-3, 620e-6, 2870e-6, 3240e-6, 180e-3, 5384.86e-6, 77.4e-6, 585e-6, 900e-6, 63.8e-3, 3220e-9, 2.1e+11, 0.3),
+    ('W16X89', 'W16X89', 132, 16900e-6, 427e-3, 425e-3, 264e-3, 264e-3, 13.3e-3, 12.7e-3, 22.2e-3, 22.2e-3, 32.5e-3, 44.5e-3, 27e-3, 362e-3, 541e-6, 2540e-6, 2870e-6, 179e-3, 4814.6e-6, 67.8e-6, 515e-6, 788e-6, 63.2e-3, 2270e-9, 2.1e+11, 0.3),
+    ('W16X77', 'W16X77', 114, 14600e-6, 419e-3, 419e-3, 262e-3, 260e-3, 11.6e-3, 11.1e-3, 19.3e-3, 19e-3, 29.5e-3, 41.3e-3, 27e-3, 360e-3, 462e-6, 2200e-6, 2460e-6, 178e-3, 4176e-6, 57.4e-6, 441e-6, 674e-6, 62.7e-3, 1490e-9, 2.1e+11, 0.3),
+    ('W16X67', 'W16X67', 100, 12600e-6, 414e-3, 416e-3, 259e-3, 260e-3, 10e-3, 9.52e-3, 16.9e-3, 17.5e-3, 27.2e-3, 39.7e-3, 25.4e-3, 359.6e-3, 397e-6, 1920e-6, 2130e-6, 177e-3, 3596e-6, 49.5e-6, 380e-6, 582e-6, 62.5e-3, 995e-9, 2.1e+11, 0.3),
+    ('W16X57', 'W16X57', 85, 10800e-6, 417e-3, 416e-3, 181e-3, 181e-3, 10.9e-3, 11.1e-3, 18.2e-3, 17.5e-3, 28.4e-3, 34.9e-3, 22.2e-3, 360.2e-3, 316e-6, 1510e-6, 1720e-6, 171e-3, 3926.18e-6, 17.9e-6, 198e-6, 310e-6, 40.6e-3, 924e-9, 2.1e+11, 0.3),
+    ('W16X50', 'W16X50', 75, 9480e-6, 414e-3, 413e-3, 180e-3, 181e-3, 9.65e-3, 9.52e-3, 16e-3, 15.9e-3, 26.2e-3, 33.3e-3, 20.6e-3, 361.6e-3, 274e-6, 1330e-6, 1510e-6, 170e-3, 3489.44e-6, 15.5e-6, 172e-6, 267e-6, 40.4e-3, 633e-9, 2.1e+11, 0.3),
+    ('W16X45', 'W16X45', 67, 8580e-6, 409e-3, 410e-3, 179e-3, 178e-3, 8.76e-3, 9.52e-3, 14.4e-3, 14.3e-3, 24.6e-3, 31.8e-3, 20.6e-3, 359.8e-3, 244e-6, 1190e-6, 1350e-6, 169e-3, 3151.85e-6, 13.7e-6, 153e-6, 238e-6, 39.9e-3, 462e-9, 2.1e+11, 0.3),
+    ('W16X40', 'W16X40', 60, 7610e-6, 406e-3, 406e-3, 178e-3, 178e-3, 7.75e-3, 7.94e-3, 12.8e-3, 12.7e-3, 23e-3, 30.2e-3, 20.6e-3, 360e-3, 216e-6, 1060e-6, 1200e-6, 168e-3, 2790e-6, 12e-6, 135e-6, 208e-6, 39.9e-3, 330e-9, 2.1e+11, 0.3),
+    ('W16X36', 'W16X36', 53, 6840e-6, 404e-3, 403e-3, 178e-3, 178e-3, 7.49e-3, 7.94e-3, 10.9e-3, 11.1e-3, 21.1e-3, 28.6e-3, 19.1e-3, 361.8e-3, 186e-6, 926e-6, 1050e-6, 165e-3, 2709.88e-6, 10.2e-6, 115e-6, 177e-6, 38.6e-3, 227e-9, 2.1e+11, 0.3),
+    ('W16X31', 'W16X31', 46.1, 5890e-6, 404e-3, 403e-3, 140e-3, 140e-3, 6.99e-3, 6.35e-3, 11.2e-3, 11.1e-3, 21.4e-3, 28.6e-3, 19.1e-3, 361.2e-3, 156e-6, 773e-6, 885e-6, 163e-3, 2524.79e-6, 5.16e-6, 73.6e-6, 115e-6, 29.7e-3, 192e-9, 2.1e+11, 0.3),
+    ('W16X26', 'W16X26', 38.8, 4950e-6, 399e-3, 400e-3, 140e-3, 140e-3, 6.35e-3, 6.35e-3, 8.76e-3, 9.52e-3, 19e-3, 27e-3, 19.1e-3, 361e-3, 125e-6, 629e-6, 724e-6, 159e-3, 2292.35e-6, 3.99e-6, 57.2e-6, 89.8e-6, 28.4e-3, 109e-9, 2.1e+11, 0.3),
+    ('W14X730', 'W14X730', 1090, 139000e-6, 569e-3, 568e-3, 455e-3, 454e-3, 78e-3, 77.8e-3, 125e-3, 125e-3, 140e-3, 157e-3, 69.9e-3, 289e-3, 5950e-6, 21000e-6, 27200e-6, 208e-3, 22542e-6, 1960e-6, 8640e-6, 13400e-6, 119e-3, 604000e-9, 2.1e+11, 0.3),
+    ('W14X665', 'W14X665', 990, 126000e-6, 549e-3, 549e-3, 450e-3, 448e-3, 71.9e-3, 71.4e-3, 115e-3, 114e-3, 130e-3, 148e-3, 66.7e-3, 289e-3, 5160e-6, 18800e-6, 24300e-6, 203e-3, 20779.1e-6, 1740e-6, 7730e-6, 12000e-6, 117e-3, 466000e-9, 2.1e+11, 0.3),
+    ('W14X605', 'W14X605', 900, 115000e-6, 531e-3, 530e-3, 442e-3, 441e-3, 66e-3, 66.7e-3, 106e-3, 106e-3, 121e-3, 138e-3, 63.5e-3, 289e-3, 4500e-6, 17000e-6, 21600e-6, 198e-3, 19074e-6, 1530e-6, 6930e-6, 10700e-6, 116e-3, 362000e-9, 2.1e+11, 0.3),
+    ('W14X550', 'W14X550', 818, 105000e-6, 513e-3, 514e-3, 437e-3, 438e-3, 60.5e-3, 60.3e-3, 97e-3, 96.8e-3, 112e-3, 130e-3, 60.3e-3, 289e-3, 3930e-6, 15300e-6, 19300e-6, 194e-3, 17484.5e-6, 1350e-6, 6190e-6, 9550e-6, 114e-3, 278000e-9, 2.1e+11, 0.3),
+    ('W14X500', 'W14X500', 744, 94800e-6, 498e-3, 498e-3, 432e-3, 432e-3, 55.6e-3, 55.6e-3, 88.9e-3, 88.9e-3, 104e-3, 122e-3, 58.7e-3, 290e-3, 3420e-6, 13700e-6, 17200e-6, 190e-3, 16124e-6, 1200e-6, 5560e-6, 8550e-6, 113e-3, 214000e-9, 2.1e+11, 0.3),
+    ('W14X455', 'W14X455', 677, 86500e-6, 483e-3, 483e-3, 427e-3, 429e-3, 51.3e-3, 50.8e-3, 81.5e-3, 81e-3, 96.8e-3, 114e-3, 57.2e-3, 289.4e-3, 2990e-6, 12400e-6, 15300e-6, 186e-3, 14846.2e-6, 1070e-6, 4980e-6, 7670e-6, 111e-3, 164000e-9, 2.1e+11, 0.3),
+    ('W14X426', 'W14X426', 634, 80600e-6, 475e-3, 473e-3, 424e-3, 425e-3, 47.8e-3, 47.6e-3, 77.2e-3, 77.8e-3, 92.2e-3, 110e-3, 54e-3, 290.6e-3, 2750e-6, 11600e-6, 14200e-6, 184e-3, 13890.7e-6, 982e-6, 4640e-6, 7110e-6, 110e-3, 138000e-9, 2.1e+11, 0.3),
+    ('W14X398', 'W14X398', 592, 75500e-6, 465e-3, 464e-3, 422e-3, 422e-3, 45e-3, 44.4e-3, 72.4e-3, 73e-3, 87.4e-3, 105e-3, 54e-3, 290.2e-3, 2500e-6, 10700e-6, 13100e-6, 182e-3, 13059e-6, 903e-6, 4290e-6, 6590e-6, 109e-3, 114000e-9, 2.1e+11, 0.3),
+    ('W14X370', 'W14X370', 551, 70300e-6, 455e-3, 454e-3, 419e-3, 419e-3, 42.2e-3, 42.9e-3, 67.6e-3, 68.3e-3, 82.8e-3, 100e-3, 52.4e-3, 289.4e-3, 2260e-6, 9950e-6, 12100e-6, 180e-3, 12212.7e-6, 828e-6, 3950e-6, 6060e-6, 108e-3, 92400e-9, 2.1e+11, 0.3),
+    ('W14X342', 'W14X342', 509, 65200e-6, 445e-3, 444e-3, 417e-3, 416e-3, 39.1e-3, 39.7e-3, 62.7e-3, 63.5e-3, 78e-3, 95.3e-3, 50.8e-3, 289e-3, 2040e-6, 9140e-6, 11000e-6, 177e-3, 11299.9e-6, 753e-6, 3620e-6, 5540e-6, 108e-3, 74100e-9, 2.1e+11, 0.3),
+    ('W14X311', 'W14X311', 463, 59000e-6, 434e-3, 435e-3, 411e-3, 413e-3, 35.8e-3, 36.5e-3, 57.4e-3, 57.2e-3, 72.6e-3, 90.5e-3, 49.2e-3, 288.8e-3, 1800e-6, 8290e-6, 9880e-6, 175e-3, 10339e-6, 670e-6, 3260e-6, 4980e-6, 107e-3, 56600e-9, 2.1e+11, 0.3),
+    ('W14X283', 'W14X283', 421, 53700e-6, 424e-3, 425e-3, 409e-3, 410e-3, 32.8e-3, 33.3e-3, 52.6e-3, 52.4e-3, 67.8e-3, 85.7e-3, 47.6e-3, 288.4e-3, 1600e-6, 7520e-6, 8880e-6, 172e-3, 9459.52e-6, 599e-6, 2930e-6, 4490e-6, 106e-3, 43300e-9, 2.1e+11, 0.3),
+    ('W14X257', 'W14X257', 382, 48800e-6, 417e-3, 416e-3, 406e-3, 406e-3, 30e-3, 30.2e-3, 48e-3, 47.6e-3, 63.2e-3, 81e-3, 46e-3, 290.6e-3, 1420e-6, 6800e-6, 7980e-6, 170e-3, 8718e-6, 537e-6, 2640e-6, 4030e-6, 105e-3, 32900e-9, 2.1e+11, 0.3),
+    ('W14X233', 'W14X233', 347, 44200e-6, 406e-3, 406e-3, 404e-3, 403e-3, 27.2e-3, 27e-3, 43.7e-3, 44.4e-3, 58.9e-3, 76.2e-3, 44.5e-3, 288.2e-3, 1250e-6, 6150e-6, 7140e-6, 168e-3, 7839.04e-6, 479e-6, 2380e-6, 3620e-6, 104e-3, 24800e-9, 2.1e+11, 0.3),
+    ('W14X211', 'W14X211', 314, 40000e-6, 399e-3, 400e-3, 401e-3, 400e-3, 24.9e-3, 25.4e-3, 39.6e-3, 39.7e-3, 54.9e-3, 73e-3, 42.9e-3, 289.2e-3, 1110e-6, 5540e-6, 6390e-6, 166e-3, 7201.08e-6, 429e-6, 2130e-6, 3240e-6, 103e-3, 18600e-9, 2.1e+11, 0.3),
+    ('W14X193', 'W14X193', 287, 36600e-6, 394e-3, 394e-3, 399e-3, 400e-3, 22.6e-3, 22.2e-3, 36.6e-3, 36.5e-3, 51.8e-3, 69.9e-3, 42.9e-3, 290.4e-3, 999e-6, 5080e-6, 5820e-6, 165e-3, 6563.04e-6, 388e-6, 1950e-6, 2950e-6, 103e-3, 14500e-9, 2.1e+11, 0.3),
+    ('W14X176', 'W14X176', 262, 33400e-6, 386e-3, 387e-3, 399e-3, 397e-3, 21.1e-3, 20.6e-3, 33.3e-3, 33.3e-3, 48.5e-3, 66.7e-3, 41.3e-3, 289e-3, 891e-6, 4600e-6, 5240e-6, 163e-3, 6097.9e-6, 349e-6, 1750e-6, 2670e-6, 102e-3, 11000e-9, 2.1e+11, 0.3),
+    ('W14X159', 'W14X159', 237, 30100e-6, 381e-3, 381e-3, 396e-3, 397e-3, 18.9e-3, 19e-3, 30.2e-3, 30.2e-3, 45.5e-3, 63.5e-3, 39.7e-3, 290e-3, 791e-6, 4160e-6, 4700e-6, 162e-3, 5481e-6, 311e-6, 1580e-6, 2390e-6, 102e-3, 8200e-9, 2.1e+11, 0.3),
+    ('W14X145', 'W14X145', 216, 27500e-6, 376e-3, 375e-3, 394e-3, 394e-3, 17.3e-3, 17.5e-3, 27.7e-3, 27e-3, 42.9e-3, 60.3e-3, 39.7e-3, 290.2e-3, 712e-6, 3800e-6, 4260e-6, 161e-3, 5020.46e-6, 282e-6, 1430e-6, 2180e-6, 101e-3, 6330e-9, 2.1e+11, 0.3),
+    ('W14X132', 'W14X132', 196, 25000e-6, 373e-3, 371e-3, 373e-3, 375e-3, 16.4e-3, 15.9e-3, 26.2e-3, 25.4e-3, 41.4e-3, 58.7e-3, 39.7e-3, 290.2e-3, 637e-6, 3420e-6, 3830e-6, 160e-3, 4759.28e-6, 228e-6, 1220e-6, 1850e-6, 95.5e-3, 5120e-9, 2.1e+11, 0.3),
+    ('W14X120', 'W14X120', 179, 22800e-6, 368e-3, 368e-3, 373e-3, 371e-3, 15e-3, 14.3e-3, 23.9e-3, 23.8e-3, 39.1e-3, 57.2e-3, 38.1e-3, 289.8e-3, 574e-6, 3110e-6, 3470e-6, 158e-3, 4347e-6, 206e-6, 1110e-6, 1670e-6, 95e-3, 3900e-9, 2.1e+11, 0.3),
+    ('W14X109', 'W14X109', 162, 20600e-6, 363e-3, 365e-3, 371e-3, 371e-3, 13.3e-3, 12.7e-3, 21.8e-3, 22.2e-3, 37.1e-3, 55.6e-3, 38.1e-3, 288.8e-3, 516e-6, 2830e-6, 3150e-6, 158e-3, 3841.04e-6, 186e-6, 1000e-6, 1520e-6, 94.7e-3, 2960e-9, 2.1e+11, 0.3),
+    ('W14X99', 'W14X99', 147, 18800e-6, 361e-3, 359e-3, 371e-3, 371e-3, 12.3e-3, 12.7e-3, 19.8e-3, 19e-3, 35.1e-3, 52.4e-3, 36.5e-3, 290.8e-3, 462e-6, 2570e-6, 2830e-6, 157e-3, 3576.84e-6, 167e-6, 905e-6, 1370e-6, 94.2e-3, 2240e-9, 2.1e+11, 0.3),
+    ('W14X90', 'W14X90', 134, 17100e-6, 356e-3, 356e-3, 368e-3, 368e-3, 11.2e-3, 11.1e-3, 18e-3, 17.5e-3, 33.3e-3, 50.8e-3, 36.5e-3, 289.4e-3, 416e-6, 2340e-6, 2570e-6, 156e-3, 3241.28e-6, 151e-6, 818e-6, 1240e-6, 94e-3, 1690e-9, 2.1e+11, 0.3),
+    ('W14X82', 'W14X82', 122, 15500e-6, 363e-3, 362e-3, 257e-3, 257e-3, 13e-3, 12.7e-3, 21.7e-3, 22.2e-3, 36.8e-3, 42.9e-3, 27e-3, 289.4e-3, 367e-6, 2020e-6, 2280e-6, 154e-3, 3762.2e-6, 61.6e-6, 480e-6, 734e-6, 63e-3, 2110e-9, 2.1e+11, 0.3),
+    ('W14X74', 'W14X74', 110, 14100e-6, 361e-3, 359e-3, 257e-3, 257e-3, 11.4e-3, 11.1e-3, 19.9e-3, 20.6e-3, 35.1e-3, 41.3e-3, 27e-3, 290.8e-3, 331e-6, 1840e-6, 2060e-6, 153e-3, 3315.12e-6, 55.8e-6, 436e-6, 664e-6, 63e-3, 1610e-9, 2.1e+11, 0.3),
+    ('W14X68', 'W14X68', 101, 12900e-6, 356e-3, 356e-3, 254e-3, 254e-3, 10.5e-3, 11.1e-3, 18.3e-3, 19e-3, 33.3e-3, 39.7e-3, 27e-3, 289.4e-3, 301e-6, 1690e-6, 1880e-6, 153e-3, 3038.7e-6, 50.4e-6, 397e-6, 605e-6, 62.5e-3, 1250e-9, 2.1e+11, 0.3),
+    ('W14X61', 'W14X61', 91, 11500e-6, 353e-3, 352e-3, 254e-3, 254e-3, 9.53e-3, 9.52e-3, 16.4e-3, 15.9e-3, 31.5e-3, 38.1e-3, 25.4e-3, 290e-3, 266e-6, 1510e-6, 1670e-6, 152e-3, 2763.7e-6, 44.5e-6, 352e-6, 537e-6, 62.2e-3, 912e-9, 2.1e+11, 0.3),
+    ('W14X53', 'W14X53', 79, 10100e-6, 353e-3, 352e-3, 205e-3, 203e-3, 9.4e-3, 9.52e-3, 16.8e-3, 17.5e-3, 31.8e-3, 38.1e-3, 25.4e-3, 289.4e-3, 225e-6, 1270e-6, 1430e-6, 150e-3, 2720.36e-6, 24e-6, 234e-6, 361e-6, 48.8e-3, 807e-9, 2.1e+11, 0.3),
+    ('W14X48', 'W14X48', 72, 9100e-6, 351e-3, 349e-3, 204e-3, 203e-3, 8.64e-3, 7.94e-3, 15.1e-3, 15.9e-3, 30.2e-3, 36.5e-3, 25.4e-3, 290.6e-3, 201e-6, 1150e-6, 1280e-6, 149e-3, 2510.78e-6, 21.4e-6, 210e-6, 321e-6, 48.5e-3, 604e-9, 2.1e+11, 0.3),
+    ('W14X43', 'W14X43', 64, 8130e-6, 348e-3, 346e-3, 203e-3, 203e-3, 7.75e-3, 7.94e-3, 13.5e-3, 12.7e-3, 28.4e-3, 34.9e-3, 25.4e-3, 291.2e-3, 178e-6, 1030e-6, 1140e-6, 148e-3, 2256.8e-6, 18.8e-6, 185e-6, 283e-6, 48e-3, 437e-9, 2.1e+11, 0.3),
+    ('W14X38', 'W14X38', 57.8, 7230e-6, 358e-3, 359e-3, 172e-3, 171e-3, 7.87e-3, 7.94e-3, 13.1e-3, 12.7e-3, 23.2e-3, 31.8e-3, 20.6e-3, 311.6e-3, 160e-6, 895e-6, 1010e-6, 149e-3, 2452.29e-6, 11.1e-6, 129e-6, 198e-6, 39.4e-3, 332e-9, 2.1e+11, 0.3),
+    ('W14X34', 'W14X34', 51, 6450e-6, 356e-3, 356e-3, 171e-3, 171e-3, 7.24e-3, 7.94e-3, 11.6e-3, 11.1e-3, 21.7e-3, 30.2e-3, 19.1e-3, 312.6e-3, 142e-6, 796e-6, 895e-6, 148e-3, 2263.22e-6, 9.7e-6, 113e-6, 174e-6, 38.9e-3, 237e-9, 2.1e+11, 0.3),
+    ('W14X30', 'W14X30', 44, 5710e-6, 351e-3, 352e-3, 171e-3, 171e-3, 6.86e-3, 6.35e-3, 9.78e-3, 9.52e-3, 19.9e-3, 28.6e-3, 19.1e-3, 311.2e-3, 121e-6, 688e-6, 775e-6, 146e-3, 2134.83e-6, 8.16e-6, 95.4e-6, 147e-6, 37.8e-3, 158e-9, 2.1e+11, 0.3),
+    ('W14X26', 'W14X26', 39, 4960e-6, 353e-3, 352e-3, 128e-3, 127e-3, 6.48e-3, 6.35e-3, 10.7e-3, 11.1e-3, 20.8e-3, 28.6e-3, 19.1e-3, 311.4e-3, 102e-6, 578e-6, 659e-6, 144e-3, 2017.87e-6, 3.71e-6, 58.2e-6, 90.8e-6, 27.4e-3, 149e-9, 2.1e+11, 0.3),
+    ('W14X22', 'W14X22', 32.9, 4190e-6, 348e-3, 349e-3, 127e-3, 127e-3, 5.84e-3, 6.35e-3, 8.51e-3, 7.94e-3, 18.7e-3, 27e-3, 19.1e-3, 310.6e-3, 82.8e-6, 475e-6, 544e-6, 141e-3, 1813.9e-6, 2.91e-6, 45.9e-6, 71.9e-6, 26.4e-3, 86.6e-9, 2.1e+11, 0.3),
+    ('W12X336', 'W12X336', 500, 63800e-6, 427e-3, 429e-3, 340e-3, 340e-3, 45.2e-3, 44.4e-3, 75.2e-3, 74.6e-3, 90.2e-3, 98.4e-3, 42.9e-3, 246.6e-3, 1690e-6, 7910e-6, 9880e-6, 163e-3, 11146.3e-6, 495e-6, 2900e-6, 4490e-6, 88.1e-3, 101000e-9, 2.1e+11, 0.3),
+    ('W12X305', 'W12X305', 454, 57700e-6, 414e-3, 416e-3, 335e-3, 337e-3, 41.4e-3, 41.3e-3, 68.8e-3, 68.3e-3, 83.8e-3, 92.1e-3, 41.3e-3, 246.4e-3, 1480e-6, 7130e-6, 8800e-6, 160e-3, 10201e-6, 437e-6, 2610e-6, 4000e-6, 86.9e-3, 77000e-9, 2.1e+11, 0.3),
+    ('W12X279', 'W12X279', 415, 52800e-6, 404e-3, 403e-3, 333e-3, 333e-3, 38.9e-3, 38.1e-3, 62.7e-3, 63.5e-3, 78e-3, 85.7e-3, 41.3e-3, 248e-3, 1290e-6, 6440e-6, 7880e-6, 156e-3, 9647.2e-6, 390e-6, 2340e-6, 3610e-6, 85.9e-3, 59500e-9, 2.1e+11, 0.3),
+    ('W12X252', 'W12X252', 375, 47800e-6, 391e-3, 391e-3, 330e-3, 330e-3, 35.6e-3, 34.9e-3, 57.2e-3, 57.2e-3, 72.4e-3, 79.4e-3, 38.1e-3, 246.2e-3, 1130e-6, 5780e-6, 7010e-6, 154e-3, 8764.72e-6, 345e-6, 2080e-6, 3210e-6, 84.8e-3, 45000e-9, 2.1e+11, 0.3),
+    ('W12X230', 'W12X230', 342, 43700e-6, 384e-3, 381e-3, 328e-3, 327e-3, 32.8e-3, 33.3e-3, 52.6e-3, 52.4e-3, 67.8e-3, 74.6e-3, 38.1e-3, 248.4e-3, 1010e-6, 5260e-6, 6330e-6, 152e-3, 8147.52e-6, 309e-6, 1880e-6, 2900e-6, 84.1e-3, 34900e-9, 2.1e+11, 0.3),
+    ('W12X210', 'W12X210', 313, 39900e-6, 373e-3, 375e-3, 325e-3, 324e-3, 30e-3, 30.2e-3, 48.3e-3, 47.6e-3, 63.5e-3, 71.4e-3, 36.5e-3, 246e-3, 891e-6, 4790e-6, 5700e-6, 150e-3, 7380e-6, 276e-6, 1700e-6, 2610e-6, 83.3e-3, 26900e-9, 2.1e+11, 0.3),
+    ('W12X190', 'W12X190', 283, 36100e-6, 366e-3, 365e-3, 323e-3, 321e-3, 26.9e-3, 27e-3, 44.2e-3, 44.4e-3, 59.2e-3, 66.7e-3, 34.9e-3, 247.6e-3, 787e-6, 4310e-6, 5100e-6, 148e-3, 6660.44e-6, 245e-6, 1520e-6, 2340e-6, 82.6e-3, 20300e-9, 2.1e+11, 0.3),
+    ('W12X170', 'W12X170', 253, 32300e-6, 356e-3, 356e-3, 320e-3, 321e-3, 24.4e-3, 23.8e-3, 39.6e-3, 39.7e-3, 54.9e-3, 61.9e-3, 33.3e-3, 246.2e-3, 687e-6, 3850e-6, 4510e-6, 146e-3, 6007.28e-6, 215e-6, 1350e-6, 2060e-6, 81.8e-3, 14800e-9, 2.1e+11, 0.3),
+    ('W12X152', 'W12X152', 226, 28800e-6, 348e-3, 349e-3, 318e-3, 318e-3, 22.1e-3, 22.2e-3, 35.6e-3, 34.9e-3, 50.8e-3, 58.7e-3, 31.8e-3, 246.4e-3, 595e-6, 3420e-6, 3980e-6, 144e-3, 5445.44e-6, 189e-6, 1190e-6, 1820e-6, 81e-3, 10700e-9, 2.1e+11, 0.3),
+    ('W12X136', 'W12X136', 202, 25700e-6, 340e-3, 340e-3, 315e-3, 314e-3, 20.1e-3, 20.6e-3, 31.8e-3, 31.8e-3, 47e-3, 54e-3, 31.8e-3, 246e-3, 516e-6, 3050e-6, 3510e-6, 142e-3, 4944.6e-6, 166e-6, 1050e-6, 1610e-6, 80.3e-3, 7700e-9, 2.1e+11, 0.3),
+    ('W12X120', 'W12X120', 179, 22700e-6, 333e-3, 333e-3, 312e-3, 314e-3, 18e-3, 17.5e-3, 28.2e-3, 28.6e-3, 43.2e-3, 50.8e-3, 30.2e-3, 246.6e-3, 445e-6, 2670e-6, 3050e-6, 140e-3, 4438.8e-6, 144e-6, 918e-6, 1400e-6, 79.5e-3, 5370e-9, 2.1e+11, 0.3),
+    ('W12X106', 'W12X106', 158, 20100e-6, 328e-3, 327e-3, 310e-3, 311e-3, 15.5e-3, 15.9e-3, 25.1e-3, 25.4e-3, 40.4e-3, 47.6e-3, 28.6e-3, 247.2e-3, 388e-6, 2380e-6, 2690e-6, 139e-3, 3831.6e-6, 125e-6, 808e-6, 1230e-6, 79e-3, 3800e-9, 2.1e+11, 0.3),
+    ('W12X96', 'W12X96', 143, 18200e-6, 323e-3, 324e-3, 310e-3, 308e-3, 14e-3, 14.3e-3, 22.9e-3, 22.2e-3, 38.1e-3, 46e-3, 28.6e-3, 246.8e-3, 347e-6, 2150e-6, 2410e-6, 138e-3, 3455.2e-6, 112e-6, 728e-6, 1110e-6, 78.5e-3, 2850e-9, 2.1e+11, 0.3),
+    ('W12X87', 'W12X87', 129, 16500e-6, 318e-3, 318e-3, 307e-3, 308e-3, 13.1e-3, 12.7e-3, 20.6e-3, 20.6e-3, 35.8e-3, 42.9e-3, 27e-3, 246.4e-3, 308e-6, 1930e-6, 2160e-6, 137e-3, 3227.84e-6, 100e-6, 651e-6, 990e-6, 78e-3, 2120e-9, 2.1e+11, 0.3),
+    ('W12X79', 'W12X79', 117, 15000e-6, 315e-3, 314e-3, 307e-3, 308e-3, 11.9e-3, 12.7e-3, 18.7e-3, 19e-3, 33.8e-3, 41.3e-3, 27e-3, 247.4e-3, 276e-6, 1750e-6, 1950e-6, 136e-3, 2944.06e-6, 89.9e-6, 587e-6, 890e-6, 77.5e-3, 1600e-9, 2.1e+11, 0.3),
+    ('W12X72', 'W12X72', 107, 13600e-6, 312e-3, 311e-3, 305e-3, 305e-3, 10.9e-3, 11.1e-3, 17e-3, 17.5e-3, 32.3e-3, 39.7e-3, 27e-3, 247.4e-3, 248e-6, 1600e-6, 1770e-6, 135e-3, 2696.66e-6, 81.2e-6, 531e-6, 806e-6, 77.2e-3, 1220e-9, 2.1e+11, 0.3),
+    ('W12X65', 'W12X65', 97, 12300e-6, 307e-3, 308e-3, 305e-3, 305e-3, 9.91e-3, 9.52e-3, 15.4e-3, 15.9e-3, 30.5e-3, 38.1e-3, 25.4e-3, 246e-3, 222e-6, 1440e-6, 1590e-6, 134e-3, 2437.86e-6, 72.4e-6, 477e-6, 723e-6, 76.7e-3, 907e-9, 2.1e+11, 0.3),
+    ('W12X58', 'W12X58', 86, 11000e-6, 310e-3, 311e-3, 254e-3, 254e-3, 9.14e-3, 9.52e-3, 16.3e-3, 15.9e-3, 31.5e-3, 38.1e-3, 23.8e-3, 247e-3, 198e-6, 1280e-6, 1420e-6, 134e-3, 2257.58e-6, 44.5e-6, 351e-6, 533e-6, 63.8e-3, 874e-9, 2.1e+11, 0.3),
+    ('W12X53', 'W12X53', 79, 10100e-6, 307e-3, 305e-3, 254e-3, 254e-3, 8.76e-3, 9.52e-3, 14.6e-3, 14.3e-3, 30e-3, 34.9e-3, 23.8e-3, 247e-3, 177e-6, 1160e-6, 1280e-6, 133e-3, 2163.72e-6, 39.9e-6, 315e-6, 477e-6, 63e-3, 658e-9, 2.1e+11, 0.3),
+    ('W12X50', 'W12X50', 74, 9420e-6, 310e-3, 311e-3, 205e-3, 206e-3, 9.4e-3, 9.52e-3, 16.3e-3, 15.9e-3, 29e-3, 38.1e-3, 23.8e-3, 252e-3, 163e-6, 1050e-6, 1180e-6, 132e-3, 2368.8e-6, 23.4e-6, 228e-6, 349e-6, 49.8e-3, 712e-9, 2.1e+11, 0.3),
+    ('W12X45', 'W12X45', 67, 8450e-6, 307e-3, 305e-3, 204e-3, 203e-3, 8.51e-3, 7.94e-3, 14.6e-3, 14.3e-3, 27.4e-3, 34.9e-3, 23.8e-3, 252.2e-3, 145e-6, 946e-6, 1050e-6, 131e-3, 2146.22e-6, 20.8e-6, 203e-6, 311e-6, 49.5e-3, 524e-9, 2.1e+11, 0.3),
+    ('W12X40', 'W12X40', 60, 7550e-6, 302e-3, 305e-3, 203e-3, 203e-3, 7.49e-3, 7.94e-3, 13.1e-3, 12.7e-3, 25.9e-3, 34.9e-3, 22.2e-3, 250.2e-3, 128e-6, 844e-6, 934e-6, 130e-3, 1874e-6, 18.4e-6, 180e-6, 275e-6, 49.3e-3, 377e-9, 2.1e+11, 0.3),
+    ('W12X35', 'W12X35', 52, 6650e-6, 318e-3, 318e-3, 167e-3, 165e-3, 7.62e-3, 7.94e-3, 13.2e-3, 12.7e-3, 20.8e-3, 30.2e-3, 19.1e-3, 276.4e-3, 119e-6, 747e-6, 839e-6, 133e-3, 2106.17e-6, 10.2e-6, 122e-6, 188e-6, 39.1e-3, 308e-9, 2.1e+11, 0.3),
+    ('W12X30', 'W12X30', 44.5, 5670e-6, 312e-3, 314e-3, 166e-3, 165e-3, 6.6e-3, 6.35e-3, 11.2e-3, 11.1e-3, 18.8e-3, 28.6e-3, 19.1e-3, 274.4e-3, 99.1e-6, 633e-6, 706e-6, 132e-3, 1811.04e-6, 8.45e-6, 102e-6, 157e-6, 38.6e-3, 190e-9, 2.1e+11, 0.3),
+    ('W12X26', 'W12X26', 38.7, 4940e-6, 310e-3, 311e-3, 165e-3, 165e-3, 5.84e-3, 6.35e-3, 9.65e-3, 9.52e-3, 17.3e-3, 27e-3, 19.1e-3, 275.4e-3, 84.9e-6, 547e-6, 610e-6, 131e-3, 1608.34e-6, 7.2e-6, 87.5e-6, 134e-6, 38.4e-3, 125e-9, 2.1e+11, 0.3),
+    ('W12X22', 'W12X22', 32.7, 4180e-6, 312e-3, 311e-3, 102e-3, 102e-3, 6.6e-3, 6.35e-3, 10.8e-3, 11.1e-3, 18.4e-3, 23.8e-3, 15.9e-3, 275.2e-3, 64.9e-6, 416e-6, 480e-6, 125e-3, 1816.32e-6, 1.94e-6, 37.9e-6, 60e-6, 21.5e-3, 122e-9, 2.1e+11, 0.3),
+    ('W12X19', 'W12X19', 28.3, 3590e-6, 310e-3, 308e-3, 102e-3, 102e-3, 5.97e-3, 6.35e-3, 8.89e-3, 9.52e-3, 16.5e-3, 22.2e-3, 14.3e-3, 277e-3, 54.1e-6, 349e-6, 405e-6, 122e-3, 1653.69e-6, 1.57e-6, 30.8e-6, 48.8e-6, 20.9e-3, 74.9e-9, 2.1e+11, 0.3),
+    ('W12X16', 'W12X16', 23.8, 3040e-6, 305e-3, 305e-3, 101e-3, 102e-3, 5.59e-3, 6.35e-3, 6.73e-3, 6.35e-3, 14.4e-3, 20.6e-3, 14.3e-3, 276.2e-3, 42.9e-6, 280e-6, 329e-6, 119e-3, 1543.96e-6, 1.17e-6, 23.1e-6, 37e-6, 19.6e-3, 42.9e-9, 2.1e+11, 0.3),
+    ('W12X14', 'W12X14', 21, 2680e-6, 302e-3, 302e-3, 101e-3, 102e-3, 5.08e-3, 4.76e-3, 5.72e-3, 6.35e-3, 13.3e-3, 19.1e-3, 14.3e-3, 275.4e-3, 36.9e-6, 244e-6, 285e-6, 117e-3, 1399.03e-6, 0.982e-6, 19.5e-6, 31.1e-6, 19.1e-3, 29.3e-9, 2.1e+11, 0.3),
+    ('W10X112', 'W10X112', 167, 21200e-6, 290e-3, 289e-3, 264e-3, 264e-3, 19.2e-3, 19e-3, 31.8e-3, 31.8e-3, 44.5e-3, 49.2e-3, 25.4e-3, 201e-3, 298e-6, 2060e-6, 2410e-6, 118e-3, 3859.2e-6, 98.2e-6, 742e-6, 1130e-6, 68.1e-3, 6290e-9, 2.1e+11, 0.3),
+    ('W10X100', 'W10X100', 149, 18900e-6, 282e-3, 283e-3, 262e-3, 264e-3, 17.3e-3, 17.5e-3, 28.4e-3, 28.6e-3, 41.1e-3, 46e-3, 25.4e-3, 199.8e-3, 259e-6, 1840e-6, 2130e-6, 117e-3, 3456.54e-6, 86.2e-6, 655e-6, 1000e-6, 67.3e-3, 4540e-9, 2.1e+11, 0.3),
+    ('W10X88', 'W10X88', 131, 16800e-6, 274e-3, 276e-3, 262e-3, 260e-3, 15.4e-3, 15.9e-3, 25.1e-3, 25.4e-3, 37.8e-3, 42.9e-3, 23.8e-3, 198.4e-3, 222e-6, 1610e-6, 1850e-6, 115e-3, 3055.36e-6, 74.5e-6, 570e-6, 870e-6, 66.8e-3, 3130e-9, 2.1e+11, 0.3),
+    ('W10X77', 'W10X77', 115, 14600e-6, 269e-3, 270e-3, 259e-3, 260e-3, 13.5e-3, 12.7e-3, 22.1e-3, 22.2e-3, 34.8e-3, 39.7e-3, 22.2e-3, 199.4e-3, 189e-6, 1410e-6, 1600e-6, 114e-3, 2691.9e-6, 64.1e-6, 493e-6, 752e-6, 66e-3, 2130e-9, 2.1e+11, 0.3),
+    ('W10X68', 'W10X68', 101, 12800e-6, 264e-3, 264e-3, 257e-3, 257e-3, 11.9e-3, 12.7e-3, 19.6e-3, 19e-3, 32.3e-3, 36.5e-3, 22.2e-3, 199.4e-3, 164e-6, 1240e-6, 1400e-6, 113e-3, 2372.86e-6, 55.8e-6, 433e-6, 657e-6, 65.8e-3, 1480e-9, 2.1e+11, 0.3),
+    ('W10X60', 'W10X60', 89, 11400e-6, 259e-3, 260e-3, 257e-3, 257e-3, 10.7e-3, 11.1e-3, 17.3e-3, 17.5e-3, 30e-3, 34.9e-3, 20.6e-3, 199e-3, 142e-6, 1090e-6, 1220e-6, 112e-3, 2129.3e-6, 48.3e-6, 377e-6, 574e-6, 65.3e-3, 1030e-9, 2.1e+11, 0.3),
+    ('W10X54', 'W10X54', 80, 10200e-6, 257e-3, 257e-3, 254e-3, 254e-3, 9.4e-3, 9.52e-3, 15.6e-3, 15.9e-3, 28.4e-3, 33.3e-3, 20.6e-3, 200.2e-3, 126e-6, 983e-6, 1090e-6, 111e-3, 1881.88e-6, 42.9e-6, 338e-6, 513e-6, 65e-3, 758e-9, 2.1e+11, 0.3),
+    ('W10X49', 'W10X49', 73, 9290e-6, 254e-3, 254e-3, 254e-3, 254e-3, 8.64e-3, 7.94e-3, 14.2e-3, 14.3e-3, 26.9e-3, 31.8e-3, 20.6e-3, 200.2e-3, 113e-6, 895e-6, 990e-6, 110e-3, 1729.73e-6, 38.9e-6, 306e-6, 464e-6, 64.5e-3, 579e-9, 2.1e+11, 0.3),
+    ('W10X45', 'W10X45', 67, 8580e-6, 257e-3, 257e-3, 204e-3, 203e-3, 8.89e-3, 9.52e-3, 15.7e-3, 15.9e-3, 28.4e-3, 33.3e-3, 20.6e-3, 200.2e-3, 103e-6, 805e-6, 900e-6, 110e-3, 1779.78e-6, 22.2e-6, 218e-6, 333e-6, 51.1e-3, 629e-9, 2.1e+11, 0.3),
+    ('W10X39', 'W10X39', 58, 7420e-6, 252e-3, 251e-3, 203e-3, 203e-3, 8e-3, 7.94e-3, 13.5e-3, 12.7e-3, 26.2e-3, 30.2e-3, 20.6e-3, 199.6e-3, 87e-6, 690e-6, 767e-6, 108e-3, 1596.8e-6, 18.7e-6, 185e-6, 282e-6, 50.3e-3, 406e-9, 2.1e+11, 0.3),
+    ('W10X33', 'W10X33', 49.1, 6260e-6, 247e-3, 248e-3, 202e-3, 203e-3, 7.37e-3, 7.94e-3, 11e-3, 11.1e-3, 23.7e-3, 28.6e-3, 19.1e-3, 199.6e-3, 71.2e-6, 574e-6, 636e-6, 106e-3, 1471.05e-6, 15.2e-6, 151e-6, 229e-6, 49.3e-3, 243e-9, 2.1e+11, 0.3),
+    ('W10X30', 'W10X30', 44.8, 5700e-6, 267e-3, 267e-3, 148e-3, 146e-3, 7.62e-3, 7.94e-3, 13e-3, 12.7e-3, 20.6e-3, 28.6e-3, 17.5e-3, 225.8e-3, 70.8e-6, 531e-6, 600e-6, 111e-3, 1720.6e-6, 6.95e-6, 94.2e-6, 145e-6, 34.8e-3, 259e-9, 2.1e+11, 0.3),
+    ('W10X26', 'W10X26', 38.5, 4910e-6, 262e-3, 264e-3, 147e-3, 146e-3, 6.6e-3, 6.35e-3, 11.2e-3, 11.1e-3, 18.8e-3, 27e-3, 17.5e-3, 224.4e-3, 59.9e-6, 457e-6, 513e-6, 110e-3, 1481.04e-6, 5.87e-6, 80.1e-6, 123e-6, 34.5e-3, 167e-9, 2.1e+11, 0.3),
+    ('W10X22', 'W10X22', 32.7, 4190e-6, 259e-3, 257e-3, 146e-3, 146e-3, 6.1e-3, 6.35e-3, 9.14e-3, 9.52e-3, 16.8e-3, 23.8e-3, 15.9e-3, 225.4e-3, 49.1e-6, 380e-6, 426e-6, 108e-3, 1374.94e-6, 4.75e-6, 65.1e-6, 100e-6, 33.8e-3, 99.5e-9, 2.1e+11, 0.3),
+    ('W10X19', 'W10X19', 28.4, 3630e-6, 259e-3, 260e-3, 102e-3, 102e-3, 6.35e-3, 6.35e-3, 10e-3, 9.5e-3, 17.7e-3, 23.8e-3, 15.9e-3, 223.6e-3, 40.1e-6, 308e-6, 354e-6, 105e-3, 1419.86e-6, 1.79e-6, 35.1e-6, 54.9e-6, 22.2e-3, 97e-9, 2.1e+11, 0.3),
+    ('W10X17', 'W10X17', 25.3, 3220e-6, 257e-3, 257e-3, 102e-3, 102e-3, 6.1e-3, 6.35e-3, 8.38e-3, 7.94e-3, 16e-3, 22.2e-3, 14.3e-3, 225e-3, 34.1e-6, 265e-6, 306e-6, 103e-3, 1372.5e-6, 1.48e-6, 29.2e-6, 45.9e-6, 21.5e-3, 64.9e-9, 2.1e+11, 0.3),
+    ('W10X15', 'W10X15', 22.3, 2850e-6, 254e-3, 254e-3, 102e-3, 102e-3, 5.84e-3, 6.35e-3, 6.86e-3, 6.35e-3, 14.5e-3, 20.6e-3, 14.3e-3, 225e-3, 28.7e-6, 226e-6, 262e-6, 100e-3, 1314e-6, 1.2e-6, 23.8e-6, 37.7e-6, 20.6e-3, 43.3e-9, 2.1e+11, 0.3),
+    ('W10X12', 'W10X12', 17.9, 2280e-6, 251e-3, 251e-3, 101e-3, 102e-3, 4.83e-3, 4.76e-3, 5.33e-3, 4.76e-3, 13e-3, 19.1e-3, 14.3e-3, 225e-3, 22.4e-6, 179e-6, 206e-6, 99.1e-3, 1086.75e-6, 0.907e-6, 18e-6, 28.5e-6, 19.9e-3, 22.8e-9, 2.1e+11, 0.3),
+    ('W8X67', 'W8X67', 100, 12700e-6, 229e-3, 229e-3, 210e-3, 210e-3, 14.5e-3, 14.3e-3, 23.7e-3, 23.8e-3, 33.8e-3, 41.3e-3, 23.8e-3, 161.4e-3, 113e-6, 990e-6, 1150e-6, 94.5e-3, 2340.3e-6, 36.9e-6, 351e-6, 536e-6, 53.8e-3, 2100e-9, 2.1e+11, 0.3),
+    ('W8X58', 'W8X58', 86, 11000e-6, 222e-3, 222e-3, 209e-3, 210e-3, 13e-3, 12.7e-3, 20.6e-3, 20.6e-3, 30.5e-3, 38.1e-3, 22.2e-3, 161e-3, 94.9e-6, 852e-6, 980e-6, 92.7e-3, 2093e-6, 31.3e-6, 300e-6, 457e-6, 53.3e-3, 1390e-9, 2.1e+11, 0.3),
+    ('W8X48', 'W8X48', 71, 9100e-6, 216e-3, 216e-3, 206e-3, 206e-3, 10.2e-3, 9.52e-3, 17.4e-3, 17.5e-3, 27.4e-3, 34.9e-3, 20.6e-3, 161.2e-3, 76.6e-6, 708e-6, 803e-6, 91.7e-3, 1644.24e-6, 25.3e-6, 246e-6, 375e-6, 52.8e-3, 816e-9, 2.1e+11, 0.3),
+    ('W8X40', 'W8X40', 59, 7550e-6, 210e-3, 210e-3, 205e-3, 206e-3, 9.14e-3, 9.52e-3, 14.2e-3, 14.3e-3, 24.2e-3, 31.8e-3, 20.6e-3, 161.6e-3, 60.8e-6, 582e-6, 652e-6, 89.7e-3, 1477.02e-6, 20.4e-6, 200e-6, 303e-6, 51.8e-3, 466e-9, 2.1e+11, 0.3),
+    ('W8X35', 'W8X35', 52, 6650e-6, 206e-3, 206e-3, 204e-3, 203e-3, 7.87e-3, 7.94e-3, 12.6e-3, 12.7e-3, 22.6e-3, 30.2e-3, 20.6e-3, 160.8e-3, 52.9e-6, 511e-6, 569e-6, 89.2e-3, 1265.5e-6, 17.7e-6, 174e-6, 264e-6, 51.6e-3, 320e-9, 2.1e+11, 0.3),
+    ('W8X31', 'W8X31', 46.1, 5890e-6, 203e-3, 203e-3, 203e-3, 203e-3, 7.24e-3, 7.94e-3, 11e-3, 11.1e-3, 21.1e-3, 28.6e-3, 19.1e-3, 160.8e-3, 45.8e-6, 451e-6, 498e-6, 88.1e-3, 1164.19e-6, 15.4e-6, 152e-6, 231e-6, 51.3e-3, 223e-9, 2.1e+11, 0.3),
+    ('W8X28', 'W8X28', 41.7, 5320e-6, 205e-3, 203e-3, 166e-3, 165e-3, 7.24e-3, 7.94e-3, 11.8e-3, 11.1e-3, 21.8e-3, 23.8e-3, 15.9e-3, 161.4e-3, 40.8e-6, 398e-6, 446e-6, 87.6e-3, 1168.54e-6, 9.03e-6, 109e-6, 166e-6, 41.1e-3, 224e-9, 2.1e+11, 0.3),
+    ('W8X24', 'W8X24', 35.9, 4570e-6, 201e-3, 200e-3, 165e-3, 165e-3, 6.22e-3, 6.35e-3, 10.2e-3, 9.5e-3, 20.2e-3, 22.2e-3, 14.3e-3, 160.6e-3, 34.4e-6, 342e-6, 379e-6, 86.9e-3, 998.932e-6, 7.62e-6, 92.3e-6, 140e-6, 40.9e-3, 144e-9, 2.1e+11, 0.3),
+    ('W8X21', 'W8X21', 31.3, 3970e-6, 210e-3, 210e-3, 134e-3, 133e-3, 6.35e-3, 6.35e-3, 10.2e-3, 9.5e-3, 17.8e-3, 22.2e-3, 14.3e-3, 174.4e-3, 31.3e-6, 298e-6, 334e-6, 88.6e-3, 1107.44e-6, 4.07e-6, 60.8e-6, 93.2e-6, 32e-3, 117e-9, 2.1e+11, 0.3),
+    ('W8X18', 'W8X18', 26.6, 3390e-6, 207e-3, 206e-3, 133e-3, 133e-3, 5.84e-3, 6.35e-3, 8.38e-3, 7.94e-3, 16e-3, 20.6e-3, 14.3e-3, 175e-3, 25.8e-6, 249e-6, 279e-6, 87.1e-3, 1022e-6, 3.32e-6, 49.8e-6, 76.4e-6, 31.2e-3, 71.6e-9, 2.1e+11, 0.3),
+    ('W8X15', 'W8X15', 22.5, 2860e-6, 206e-3, 206e-3, 102e-3, 102e-3, 6.22e-3, 6.35e-3, 8e-3, 7.94e-3, 15.6e-3, 20.6e-3, 14.3e-3, 174.8e-3, 20e-6, 193e-6, 223e-6, 83.6e-3, 1087.26e-6, 1.42e-6, 27.9e-6, 43.8e-6, 22.3e-3, 57e-9, 2.1e+11, 0.3),
+    ('W8X13', 'W8X13', 19.3, 2480e-6, 203e-3, 203e-3, 102e-3, 102e-3, 5.84e-3, 6.35e-3, 6.48e-3, 6.35e-3, 14.1e-3, 19.1e-3, 14.3e-3, 174.8e-3, 16.5e-6, 162e-6, 187e-6, 81.5e-3, 1020.83e-6, 1.14e-6, 22.5e-6, 35.2e-6, 21.4e-3, 36.3e-9, 2.1e+11, 0.3),
+    ('W8X10', 'W8X10', 15, 1910e-6, 200e-3, 200e-3, 100e-3, 102e-3, 4.32e-3, 4.76e-3, 5.21e-3, 4.76e-3, 12.8e-3, 17.5e-3, 12.7e-3, 174.4e-3, 12.8e-6, 128e-6, 145e-6, 81.8e-3, 753.408e-6, 0.87e-6, 17.4e-6, 27.2e-6, 21.4e-3, 17.7e-9, 2.1e+11, 0.3),
+    ('W6X25', 'W6X25', 37.1, 4740e-6, 162e-3, 162e-3, 154e-3, 156e-3, 8.13e-3, 7.94e-3, 11.6e-3, 11.1e-3, 17.9e-3, 23.8e-3, 14.3e-3, 126.2e-3, 22.2e-6, 274e-6, 310e-6, 68.6e-3, 1026.01e-6, 7.12e-6, 91.9e-6, 140e-6, 38.6e-3, 192e-9, 2.1e+11, 0.3),
+    ('W6X20', 'W6X20', 29.8, 3790e-6, 157e-3, 159e-3, 153e-3, 152e-3, 6.6e-3, 6.35e-3, 9.27e-3, 9.52e-3, 15.6e-3, 22.2e-3, 14.3e-3, 125.8e-3, 17.2e-6, 220e-6, 246e-6, 67.6e-3, 830.28e-6, 5.54e-6, 72.3e-6, 110e-6, 38.1e-3, 99.9e-9, 2.1e+11, 0.3),
+    ('W6X15', 'W6X15', 22.5, 2860e-6, 152e-3, 152e-3, 152e-3, 152e-3, 5.84e-3, 6.35e-3, 6.6e-3, 6.35e-3, 13e-3, 19.1e-3, 14.3e-3, 126e-3, 12.1e-6, 159e-6, 177e-6, 65e-3, 735.84e-6, 3.88e-6, 51e-6, 77.8e-6, 36.8e-3, 42e-9, 2.1e+11, 0.3),
+    ('W6X16', 'W6X16', 24, 3060e-6, 160e-3, 159e-3, 102e-3, 102e-3, 6.6e-3, 6.35e-3, 10.3e-3, 9.5e-3, 16.6e-3, 22.2e-3, 14.3e-3, 126.8e-3, 13.4e-6, 167e-6, 192e-6, 66e-3, 836.88e-6, 1.84e-6, 36.1e-6, 55.6e-6, 24.6e-3, 92.8e-9, 2.1e+11, 0.3),
+    ('W6X12', 'W6X12', 18, 2290e-6, 153e-3, 152e-3, 102e-3, 102e-3, 5.84e-3, 6.35e-3, 7.11e-3, 6.35e-3, 13.5e-3, 19.1e-3, 14.3e-3, 126e-3, 9.2e-6, 120e-6, 136e-6, 63.2e-3, 735.84e-6, 1.24e-6, 24.6e-6, 38e-6, 23.3e-3, 37.6e-9, 2.1e+11, 0.3),
+    ('W6X9', 'W6X9', 13.5, 1730e-6, 150e-3, 149e-3, 100e-3, 102e-3, 4.32e-3, 4.76e-3, 5.46e-3, 4.76e-3, 11.8e-3, 17.5e-3, 12.7e-3, 126.4e-3, 6.83e-6, 91.1e-6, 102e-6, 62.7e-3, 546.048e-6, 0.916e-6, 18.2e-6, 28.2e-6, 23e-3, 16.9e-9, 2.1e+11, 0.3),
+    ('W6X8.5', 'W6X8.5', 13, 1630e-6, 148e-3, 149e-3, 100e-3, 102e-3, 4.32e-3, 4.76e-3, 4.95e-3, 4.76e-3, 11.3e-3, 17.5e-3, 12.7e-3, 125.4e-3, 6.2e-6, 83.6e-6, 93.9e-6, 61.7e-3, 541.728e-6, 0.828e-6, 16.6e-6, 25.6e-6, 22.6e-3, 13.9e-9, 2.1e+11, 0.3),
+    ('W5X19', 'W5X19', 28.1, 3590e-6, 131e-3, 130e-3, 128e-3, 127e-3, 6.86e-3, 6.35e-3, 10.9e-3, 11.1e-3, 18.5e-3, 20.6e-3, 11.1e-3, 94e-3, 10.9e-6, 167e-6, 190e-6, 55.1e-3, 644.84e-6, 3.8e-6, 59.5e-6, 90.6e-6, 32.5e-3, 132e-9, 2.1e+11, 0.3),
+    ('W5X16', 'W5X16', 23.8, 3040e-6, 127e-3, 127e-3, 127e-3, 127e-3, 6.1e-3, 6.35e-3, 9.14e-3, 9.52e-3, 16.8e-3, 19.1e-3, 11.1e-3, 93.4e-3, 8.91e-6, 140e-6, 158e-6, 54.1e-3, 569.74e-6, 3.13e-6, 49.2e-6, 75.1e-6, 32e-3, 79.9e-9, 2.1e+11, 0.3),
+    ('W4X13', 'W4X13', 19.3, 2470e-6, 106e-3, 105e-3, 103e-3, 102e-3, 7.11e-3, 6.35e-3, 8.76e-3, 9.52e-3, 15.1e-3, 19.1e-3, 12.7e-3, 75.8e-3, 4.7e-6, 89.5e-6, 103e-6, 43.7e-3, 538.938e-6, 1.61e-6, 31.1e-6, 47.9e-6, 25.4e-3, 62.9e-9, 2.1e+11, 0.3),
+    )
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR AU shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'P', 'h', 'b', 's', 't', 'A', 'Iz', 'Wzel', 'Wzpl', 'Szel', 'E', 'nu')
+
+rows= (
+    ('AU_14', 'AU_14', 77.9, 408e-3, 750e-3, 8.3e-3, 10.0e-3, 132.3e-4, 28880e-8, 1405e-6, 1663e-8, 820e-6, 2.1e+11, 0.3),
+    ('AU_16', 'AU_16', 86.3, 411e-3, 750e-3, 9.3e-3, 11.5e-3, 146.5e-4, 32850e-8, 1600e-6, 1891e-8, 935e-6, 2.1e+11, 0.3),
+    ('AU_18', 'AU_18', 88.5, 441e-3, 750e-3, 9.1e-3, 10.5e-3, 150.3e-4, 39300e-8, 1780e-6, 2082e-8, 1030e-6, 2.1e+11, 0.3),
+    ('AU_20', 'AU_20', 96.9, 444e-3, 750e-3, 10.0e-3, 12.0e-3, 164.6e-4, 44440e-8, 2000e-6, 2339e-8, 1155e-6, 2.1e+11, 0.3),
+    ('AU_23', 'AU_23', 102.1, 447e-3, 750e-3, 9.5e-3, 13.0e-3, 173.4e-4, 50700e-8, 2270e-6, 2600e-8, 1285e-6, 2.1e+11, 0.3),
+    ('AU_25', 'AU_25', 110.4, 450e-3, 750e-3, 10.2e-3, 14.5e-3, 187.5e-4, 56240e-8, 2500e-6, 2866e-8, 1420e-6, 2.1e+11, 0.3),
+    )
@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR CHS shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'D', 't', 'P', 'A', 'Iz', 'iz', 'Wzel', 'Wzpl', 'Iy', 'iy', 'Wyel', 'Wypl', 'It', 'C', 'AL', 'AG', 'E', 'nu')
+
+rows= (
+    ('CHS_21.3_2.6', 'CHS_21.3_2.6', 21.3e-3, 2.6e-3, 1.20, 1.53e-4, 0.681e-8, 0.668e-2, 0.639e-6, 0.915e-6, 0.681e-8, 0.668e-2, 0.639e-6, 0.915e-6, 1.36e-8, 1.28e-6, 0.067, 55.8, 210000e6, 0.3),
+    ('CHS_21.3_2.9', 'CHS_21.3_2.9', 21.3e-3, 2.9e-3, 1.32, 1.68e-4, 0.727e-8, 0.659e-2, 0.683e-6, 0.990e-6, 0.727e-8, 0.659e-2, 0.683e-6, 0.990e-6, 1.45e-8, 1.37e-6, 0.067, 50.8, 210000e6, 0.3),
+    ('CHS_21.3_3.2', 'CHS_21.3_3.2', 21.3e-3, 3.2e-3, 1.43, 1.82e-4, 0.768e-8, 0.650e-2, 0.722e-6, 1.06e-6, 0.768e-8, 0.650e-2, 0.722e-6, 1.06e-6, 1.54e-8, 1.44e-6, 0.067, 46.9, 210000e6, 0.3),
+    ('CHS_26.9_2.6', 'CHS_26.9_2.6', 26.9e-3, 2.6e-3, 1.56, 1.98e-4, 1.48e-8, 0.864e-2, 1.10e-6, 1.54e-6, 1.48e-8, 0.864e-2, 1.10e-6, 1.54e-6, 2.96e-8, 2.20e-6, 0.085, 54.5, 210000e6, 0.3),
+    ('CHS_26.9_2.9', 'CHS_26.9_2.9', 26.9e-3, 2.9e-3, 1.72, 2.19e-4, 1.60e-8, 0.855e-2, 1.19e-6, 1.68e-6, 1.60e-8, 0.855e-2, 1.19e-6, 1.68e-6, 3.19e-8, 2.38e-6, 0.085, 49.4, 210000e6, 0.3),
+    ('CHS_26.9_3.2', 'CHS_26.9_3.2', 26.9e-3, 3.2e-3, 1.87, 2.38e-4, 1.70e-8, 0.846e-2, 1.27e-6, 1.81e-6, 1.70e-8, 0.846e-2, 1.27e-6, 1.81e-6, 3.41e-8, 2.53e-6, 0.085, 45.5, 210000e6, 0.3),
+    ('CHS_26.9_3.6', 'CHS_26.9_3.6', 26.9e-3, 3.6e-3, 2.07, 2.64e-4, 1.83e-8, 0.834e-2, 1.36e-6, 1.97e-6, 1.83e-8, 0.834e-2, 1.36e-6, 1.97e-6, 3.66e-8, 2.72e-6, 0.085, 41.1, 210000e6, 0.3),
+    ('CHS_33.7_2.6', 'CHS_33.7_2.6', 33.7e-3, 2.6e-3, 1.99, 2.54e-4, 3.09e-8, 1.10e-2, 1.84e-6, 2.52e-6, 3.09e-8, 1.10e-2, 1.84e-6, 2.52e-6, 6.19e-8, 3.67e-6, 0.106, 53.3, 210000e6, 0.3),
+    ('CHS_33.7_2.9', 'CHS_33.7_2.9', 33.7e-3, 2.9e-3, 2.20, 2.81e-4, 3.36e-8, 1.09e-2, 1.99e-6, 2.76e-6, 3.36e-8, 1.09e-2, 1.99e-6, 2.76e-6, 6.71e-8, 3.98e-6, 0.106, 48.2, 210000e6, 0.3),
+    ('CHS_33.7_3.2', 'CHS_33.7_3.2', 33.7e-3, 3.2e-3, 2.41, 3.07e-4, 3.60e-8, 1.08e-2, 2.14e-6, 2.99e-6, 3.60e-8, 1.08e-2, 2.14e-6, 2.99e-6, 7.21e-8, 4.28e-6, 0.106, 44.0, 210000e6, 0.3),
+    ('CHS_33.7_3.6', 'CHS_33.7_3.6', 33.7e-3, 3.6e-3, 2.67, 3.40e-4, 3.91e-8, 1.07e-2, 2.32e-6, 3.28e-6, 3.91e-8, 1.07e-2, 2.32e-6, 3.28e-6, 7.82e-8, 4.64e-6, 0.106, 39.7, 210000e6, 0.3),
+    ('CHS_33.7_4.0', 'CHS_33.7_4.0', 33.7e-3, 4.0e-3, 2.93, 3.73e-4, 4.19e-8, 1.06e-2, 2.49e-6, 3.55e-6, 4.19e-8, 1.06e-2, 2.49e-6, 3.55e-6, 8.38e-8, 4.97e-6, 0.106, 36.2, 210000e6, 0.3),
+    ('CHS_33.7_4.5', 'CHS_33.7_4.5', 33.7e-3, 4.5e-3, 3.24, 4.13e-4, 4.50e-8, 1.04e-2, 2.67e-6, 3.87e-6, 4.50e-8, 1.04e-2, 2.67e-6, 3.87e-6, 9.01e-8, 5.35e-6, 0.106, 32.7, 210000e6, 0.3),
+    ('CHS_42.4_2.6', 'CHS_42.4_2.6', 42.4e-3, 2.6e-3, 2.55, 3.25e-4, 6.46e-8, 1.41e-2, 3.05e-6, 4.12e-6, 6.46e-8, 1.41e-2, 3.05e-6, 4.12e-6, 12.9e-8, 6.10e-6, 0.133, 52.2, 210000e6, 0.3),
+    ('CHS_42.4_2.9', 'CHS_42.4_2.9', 42.4e-3, 2.9e-3, 2.82, 3.60e-4, 7.06e-8, 1.40e-2, 3.33e-6, 4.53e-6, 7.06e-8, 1.40e-2, 3.33e-6, 4.53e-6, 14.1e-8, 6.66e-6, 0.133, 47.2, 210000e6, 0.3),
+    ('CHS_42.4_3.2', 'CHS_42.4_3.2', 42.4e-3, 3.2e-3, 3.09, 3.94e-4, 7.62e-8, 1.39e-2, 3.59e-6, 4.93e-6, 7.62e-8, 1.39e-2, 3.59e-6, 4.93e-6, 15.2e-8, 7.19e-6, 0.133, 43.0, 210000e6, 0.3),
+    ('CHS_42.4_3.6', 'CHS_42.4_3.6', 42.4e-3, 3.6e-3, 3.44, 4.39e-4, 8.33e-8, 1.38e-2, 3.93e-6, 5.44e-6, 8.33e-8, 1.38e-2, 3.93e-6, 5.44e-6, 16.7e-8, 7.86e-6, 0.133, 38.7, 210000e6, 0.3),
+    ('CHS_42.4_4.0', 'CHS_42.4_4.0', 42.4e-3, 4.0e-3, 3.79, 4.83e-4, 8.99e-8, 1.36e-2, 4.24e-6, 5.92e-6, 8.99e-8, 1.36e-2, 4.24e-6, 5.92e-6, 18.0e-8, 8.48e-6, 0.133, 35.1, 210000e6, 0.3),
+    ('CHS_42.4_4.5', 'CHS_42.4_4.5', 42.4e-3, 4.5e-3, 4.21, 5.36e-4, 9.76e-8, 1.35e-2, 4.60e-6, 6.49e-6, 9.76e-8, 1.35e-2, 4.60e-6, 6.49e-6, 19.5e-8, 9.20e-6, 0.133, 31.6, 210000e6, 0.3),
+    ('CHS_48.3_2.6', 'CHS_48.3_2.6', 48.3e-3, 2.6e-3, 2.93, 3.73e-4, 9.78e-8, 1.62e-2, 4.05e-6, 5.44e-6, 9.78e-8, 1.62e-2, 4.05e-6, 5.44e-6, 19.6e-8, 8.10e-6, 0.152, 51.9, 210000e6, 0.3),
+    ('CHS_48.3_2.9', 'CHS_48.3_2.9', 48.3e-3, 2.9e-3, 3.25, 4.14e-4, 10.7e-8, 1.61e-2, 4.43e-6, 5.99e-6, 10.7e-8, 1.61e-2, 4.43e-6, 5.99e-6, 21.4e-8, 8.86e-6, 0.152, 46.8, 210000e6, 0.3),
+    ('CHS_48.3_3.2', 'CHS_48.3_3.2', 48.3e-3, 3.2e-3, 3.56, 4.53e-4, 11.6e-8, 1.60e-2, 4.80e-6, 6.52e-6, 11.6e-8, 1.60e-2, 4.80e-6, 6.52e-6, 23.2e-8, 9.59e-6, 0.152, 42.7, 210000e6, 0.3),
+    ('CHS_48.3_3.6', 'CHS_48.3_3.6', 48.3e-3, 3.6e-3, 3.97, 5.06e-4, 12.7e-8, 1.59e-2, 5.26e-6, 7.21e-6, 12.7e-8, 1.59e-2, 5.26e-6, 7.21e-6, 25.4e-8, 10.5e-6, 0.152, 38.3, 210000e6, 0.3),
+    ('CHS_48.3_4.0', 'CHS_48.3_4.0', 48.3e-3, 4.0e-3, 4.37, 5.57e-4, 13.8e-8, 1.57e-2, 5.70e-6, 7.87e-6, 13.8e-8, 1.57e-2, 5.70e-6, 7.87e-6, 27.5e-8, 11.4e-6, 0.152, 34.8, 210000e6, 0.3),
+    ('CHS_48.3_4.5', 'CHS_48.3_4.5', 48.3e-3, 4.5e-3, 4.86, 6.19e-4, 15.0e-8, 1.56e-2, 6.21e-6, 8.66e-6, 15.0e-8, 1.56e-2, 6.21e-6, 8.66e-6, 30.0e-8, 12.4e-6, 0.152, 31.3, 210000e6, 0.3),
+    ('CHS_48.3_5.0', 'CHS_48.3_5.0', 48.3e-3, 5.0e-3, 5.34, 6.80e-4, 16.2e-8, 1.54e-2, 6.69e-6, 9.42e-6, 16.2e-8, 1.54e-2, 6.69e-6, 9.42e-6, 32.3e-8, 13.4e-6, 0.152, 28.5, 210000e6, 0.3),
+    ('CHS_48.3_5.6', 'CHS_48.3_5.6', 48.3e-3, 5.6e-3, 5.90, 7.51e-4, 17.4e-8, 1.52e-2, 7.21e-6, 10.3e-6, 17.4e-8, 1.52e-2, 7.21e-6, 10.3e-6, 34.8e-8, 14.4e-6, 0.152, 25.8, 210000e6, 0.3),
+    ('CHS_48.3_6.3', 'CHS_48.3_6.3', 48.3e-3, 6.3e-3, 6.53, 8.31e-4, 18.7e-8, 1.50e-2, 7.76e-6, 11.2e-6, 18.7e-8, 1.50e-2, 7.76e-6, 11.2e-6, 37.5e-8, 15.5e-6, 0.152, 23.3, 210000e6, 0.3),
+    ('CHS_60.3_2.6', 'CHS_60.3_2.6', 60.3e-3, 2.6e-3, 3.70, 4.71e-4, 19.7e-8, 2.04e-2, 6.52e-6, 8.66e-6, 19.7e-8, 2.04e-2, 6.52e-6, 8.66e-6, 39.3e-8, 13.0e-6, 0.189, 51.1, 210000e6, 0.3),
+    ('CHS_60.3_2.9', 'CHS_60.3_2.9', 60.3e-3, 2.9e-3, 4.11, 5.23e-4, 21.6e-8, 2.03e-2, 7.16e-6, 9.56e-6, 21.6e-8, 2.03e-2, 7.16e-6, 9.56e-6, 43.2e-8, 14.3e-6, 0.189, 46.0, 210000e6, 0.3),
+    ('CHS_60.3_3.2', 'CHS_60.3_3.2', 60.3e-3, 3.2e-3, 4.51, 5.74e-4, 23.5e-8, 2.02e-2, 7.78e-6, 10.4e-6, 23.5e-8, 2.02e-2, 7.78e-6, 10.4e-6, 46.9e-8, 15.6e-6, 0.189, 41.9, 210000e6, 0.3),
+    ('CHS_60.3_3.6', 'CHS_60.3_3.6', 60.3e-3, 3.6e-3, 5.03, 6.41e-4, 25.9e-8, 2.01e-2, 8.58e-6, 11.6e-6, 25.9e-8, 2.01e-2, 8.58e-6, 11.6e-6, 51.7e-8, 17.2e-6, 0.189, 37.6, 210000e6, 0.3),
+    ('CHS_60.3_4.0', 'CHS_60.3_4.0', 60.3e-3, 4.0e-3, 5.55, 7.07e-4, 28.2e-8, 2.00e-2, 9.34e-6, 12.7e-6, 28.2e-8, 2.00e-2, 9.34e-6, 12.7e-6, 56.3e-8, 18.7e-6, 0.189, 34.1, 210000e6, 0.3),
+    ('CHS_60.3_4.5', 'CHS_60.3_4.5', 60.3e-3, 4.5e-3, 6.19, 7.89e-4, 30.9e-8, 1.98e-2, 10.2e-6, 14.0e-6, 30.9e-8, 1.98e-2, 10.2e-6, 14.0e-6, 61.8e-8, 20.5e-6, 0.189, 30.5, 210000e6, 0.3),
+    ('CHS_60.3_5.0', 'CHS_60.3_5.0', 60.3e-3, 5.0e-3, 6.82, 8.69e-4, 33.5e-8, 1.96e-2, 11.1e-6, 15.3e-6, 33.5e-8, 1.96e-2, 11.1e-6, 15.3e-6, 67.0e-8, 22.2e-6, 0.189, 27.7, 210000e6, 0.3),
+    ('CHS_60.3_5.6', 'CHS_60.3_5.6', 60.3e-3, 5.6e-3, 7.55, 9.62e-4, 36.4e-8, 1.94e-2, 12.1e-6, 16.8e-6, 36.4e-8, 1.94e-2, 12.1e-6, 16.8e-6, 72.7e-8, 24.1e-6, 0.189, 25.0, 210000e6, 0.3),
+    ('CHS_60.3_6.3', 'CHS_60.3_6.3', 60.3e-3, 6.3e-3, 8.39, 10.7e-4, 39.5e-8, 1.92e-2, 13.1e-6, 18.5e-6, 39.5e-8, 1.92e-2, 13.1e-6, 18.5e-6, 79.0e-8, 26.2e-6, 0.189, 22.5, 210000e6, 0.3),
+    ('CHS_60.3_7.1', 'CHS_60.3_7.1', 60.3e-3, 7.1e-3, 9.32, 11.9e-4, 42.7e-8, 1.90e-2, 14.2e-6, 20.2e-6, 42.7e-8, 1.90e-2, 14.2e-6, 20.2e-6, 85.5e-8, 28.3e-6, 0.189, 20.3, 210000e6, 0.3),
+    ('CHS_60.3_8.0', 'CHS_60.3_8.0', 60.3e-3, 8.0e-3, 10.3, 13.1e-4, 46.0e-8, 1.87e-2, 15.3e-6, 22.1e-6, 46.0e-8, 1.87e-2, 15.3e-6, 22.1e-6, 92.0e-8, 30.5e-6, 0.189, 18.3, 210000e6, 0.3),
+    ('CHS_76.1_2.9', 'CHS_76.1_2.9', 76.1e-3, 2.9e-3, 5.24, 6.67e-4, 44.7e-8, 2.59e-2, 11.8e-6, 15.5e-6, 44.7e-8, 2.59e-2, 11.8e-6, 15.5e-6, 89.5e-8, 23.5e-6, 0.239, 45.6, 210000e6, 0.3),
+    ('CHS_76.1_3.2', 'CHS_76.1_3.2', 76.1e-3, 3.2e-3, 5.75, 7.33e-4, 48.8e-8, 2.58e-2, 12.8e-6, 17.0e-6, 48.8e-8, 2.58e-2, 12.8e-6, 17.0e-6, 97.6e-8, 25.6e-6, 0.239, 41.6, 210000e6, 0.3),
+    ('CHS_76.1_3.6', 'CHS_76.1_3.6', 76.1e-3, 3.6e-3, 6.44, 8.20e-4, 54.0e-8, 2.57e-2, 14.2e-6, 18.9e-6, 54.0e-8, 2.57e-2, 14.2e-6, 18.9e-6, 108e-8, 28.4e-6, 0.239, 37.1, 210000e6, 0.3),
+    ('CHS_76.1_4.0', 'CHS_76.1_4.0', 76.1e-3, 4.0e-3, 7.11, 9.06e-4, 59.1e-8, 2.55e-2, 15.5e-6, 20.8e-6, 59.1e-8, 2.55e-2, 15.5e-6, 20.8e-6, 118e-8, 31.0e-6, 0.239, 33.6, 210000e6, 0.3),
+    ('CHS_76.1_4.5', 'CHS_76.1_4.5', 76.1e-3, 4.5e-3, 7.95, 10.1e-4, 65.1e-8, 2.54e-2, 17.1e-6, 23.1e-6, 65.1e-8, 2.54e-2, 17.1e-6, 23.1e-6, 130e-8, 34.2e-6, 0.239, 30.1, 210000e6, 0.3),
+    ('CHS_76.1_5.0', 'CHS_76.1_5.0', 76.1e-3, 5.0e-3, 8.77, 11.2e-4, 70.9e-8, 2.52e-2, 18.6e-6, 25.3e-6, 70.9e-8, 2.52e-2, 18.6e-6, 25.3e-6, 142e-8, 37.3e-6, 0.239, 27.3, 210000e6, 0.3),
+    ('CHS_76.1_5.6', 'CHS_76.1_5.6', 76.1e-3, 5.6e-3, 9.74, 12.4e-4, 77.5e-8, 2.50e-2, 20.4e-6, 27.9e-6, 77.5e-8, 2.50e-2, 20.4e-6, 27.9e-6, 155e-8, 40.8e-6, 0.239, 24.5, 210000e6, 0.3),
+    ('CHS_76.1_6.3', 'CHS_76.1_6.3', 76.1e-3, 6.3e-3, 10.8, 13.8e-4, 84.8e-8, 2.48e-2, 22.3e-6, 30.8e-6, 84.8e-8, 2.48e-2, 22.3e-6, 30.8e-6, 170e-8, 44.6e-6, 0.239, 22.1, 210000e6, 0.3),
+    ('CHS_76.1_7.1', 'CHS_76.1_7.1', 76.1e-3, 7.1e-3, 12.1, 15.4e-4, 92.6e-8, 2.45e-2, 24.3e-6, 33.9e-6, 92.6e-8, 2.45e-2, 24.3e-6, 33.9e-6, 185e-8, 48.7e-6, 0.239, 19.8, 210000e6, 0.3),
+    ('CHS_76.1_8.0', 'CHS_76.1_8.0', 76.1e-3, 8.0e-3, 13.4, 17.1e-4, 101e-8, 2.42e-2, 26.4e-6, 37.3e-6, 101e-8, 2.42e-2, 26.4e-6, 37.3e-6, 201e-8, 52.9e-6, 0.239, 17.8, 210000e6, 0.3),
+    ('CHS_88.9_3.2', 'CHS_88.9_3.2', 88.9e-3, 3.2e-3, 6.76, 8.62e-4, 79.2e-8, 3.03e-2, 17.8e-6, 23.5e-6, 79.2e-8, 3.03e-2, 17.8e-6, 23.5e-6, 158e-8, 35.6e-6, 0.279, 41.3, 210000e6, 0.3),
+    ('CHS_88.9_3.6', 'CHS_88.9_3.6', 88.9e-3, 3.6e-3, 7.57, 9.65e-4, 87.9e-8, 3.02e-2, 19.8e-6, 26.2e-6, 87.9e-8, 3.02e-2, 19.8e-6, 26.2e-6, 176e-8, 39.5e-6, 0.279, 36.9, 210000e6, 0.3),
+    ('CHS_88.9_4.0', 'CHS_88.9_4.0', 88.9e-3, 4.0e-3, 8.38, 10.7e-4, 96.3e-8, 3.00e-2, 21.7e-6, 28.9e-6, 96.3e-8, 3.00e-2, 21.7e-6, 28.9e-6, 193e-8, 43.3e-6, 0.279, 33.3, 210000e6, 0.3),
+    ('CHS_88.9_4.5', 'CHS_88.9_4.5', 88.9e-3, 4.5e-3, 9.37, 11.9e-4, 107e-8, 2.99e-2, 24.0e-6, 32.1e-6, 107e-8, 2.99e-2, 24.0e-6, 32.1e-6, 213e-8, 47.9e-6, 0.279, 29.8, 210000e6, 0.3),
+    ('CHS_88.9_5.0', 'CHS_88.9_5.0', 88.9e-3, 5.0e-3, 10.3, 13.2e-4, 116e-8, 2.97e-2, 26.2e-6, 35.2e-6, 116e-8, 2.97e-2, 26.2e-6, 35.2e-6, 233e-8, 52.4e-6, 0.279, 27.1, 210000e6, 0.3),
+    ('CHS_88.9_5.6', 'CHS_88.9_5.6', 88.9e-3, 5.6e-3, 11.5, 14.7e-4, 128e-8, 2.95e-2, 28.7e-6, 38.9e-6, 128e-8, 2.95e-2, 28.7e-6, 38.9e-6, 255e-8, 57.5e-6, 0.279, 24.3, 210000e6, 0.3),
+    ('CHS_88.9_6.3', 'CHS_88.9_6.3', 88.9e-3, 6.3e-3, 12.8, 16.3e-4, 140e-8, 2.93e-2, 31.5e-6, 43.1e-6, 140e-8, 2.93e-2, 31.5e-6, 43.1e-6, 280e-8, 63.1e-6, 0.279, 21.8, 210000e6, 0.3),
+    ('CHS_88.9_7.1', 'CHS_88.9_7.1', 88.9e-3, 7.1e-3, 14.3, 18.2e-4, 154e-8, 2.90e-2, 34.6e-6, 47.6e-6, 154e-8, 2.90e-2, 34.6e-6, 47.6e-6, 308e-8, 69.2e-6, 0.279, 19.5, 210000e6, 0.3),
+    ('CHS_88.9_8.0', 'CHS_88.9_8.0', 88.9e-3, 8.0e-3, 16.0, 20.3e-4, 168e-8, 2.87e-2, 37.8e-6, 52.5e-6, 168e-8, 2.87e-2, 37.8e-6, 52.5e-6, 336e-8, 75.6e-6, 0.279, 17.4, 210000e6, 0.3),
+    ('CHS_88.9_10.0', 'CHS_88.9_10.0', 88.9e-3, 10.0e-3, 19.5, 24.8e-4, 196e-8, 2.81e-2, 44.1e-6, 62.6e-6, 196e-8, 2.81e-2, 44.1e-6, 62.6e-6, 392e-8, 88.2e-6, 0.279, 14.3, 210000e6, 0.3),
+    ('CHS_101.6_3.6', 'CHS_101.6_3.6', 101.6e-3, 3.6e-3, 8.70, 11.1e-4, 133e-8, 3.47e-2, 26.2e-6, 34.6e-6, 133e-8, 3.47e-2, 26.2e-6, 34.6e-6, 266e-8, 52.5e-6, 0.319, 36.7, 210000e6, 0.3),
+    ('CHS_101.6_4.0', 'CHS_101.6_4.0', 101.6e-3, 4.0e-3, 9.63, 12.3e-4, 146e-8, 3.45e-2, 28.8e-6, 38.1e-6, 146e-8, 3.45e-2, 28.8e-6, 38.1e-6, 293e-8, 57.6e-6, 0.319, 33.1, 210000e6, 0.3),
+    ('CHS_101.6_4.5', 'CHS_101.6_4.5', 101.6e-3, 4.5e-3, 10.8, 13.7e-4, 162e-8, 3.44e-2, 31.9e-6, 42.5e-6, 162e-8, 3.44e-2, 31.9e-6, 42.5e-6, 324e-8, 63.8e-6, 0.319, 29.5, 210000e6, 0.3),
+    ('CHS_101.6_5.0', 'CHS_101.6_5.0', 101.6e-3, 5.0e-3, 11.9, 15.2e-4, 177e-8, 3.42e-2, 34.9e-6, 46.7e-6, 177e-8, 3.42e-2, 34.9e-6, 46.7e-6, 355e-8, 69.9e-6, 0.319, 26.8, 210000e6, 0.3),
+    ('CHS_101.6_5.6', 'CHS_101.6_5.6', 101.6e-3, 5.6e-3, 13.3, 16.9e-4, 195e-8, 3.40e-2, 38.4e-6, 51.7e-6, 195e-8, 3.40e-2, 38.4e-6, 51.7e-6, 390e-8, 76.9e-6, 0.319, 24.0, 210000e6, 0.3),
+    ('CHS_101.6_6.3', 'CHS_101.6_6.3', 101.6e-3, 6.3e-3, 14.8, 18.9e-4, 215e-8, 3.38e-2, 42.3e-6, 57.3e-6, 215e-8, 3.38e-2, 42.3e-6, 57.3e-6, 430e-8, 84.7e-6, 0.319, 21.6, 210000e6, 0.3),
+    ('CHS_101.6_7.1', 'CHS_101.6_7.1', 101.6e-3, 7.1e-3, 16.5, 21.1e-4, 237e-8, 3.35e-2, 46.6e-6, 63.5e-6, 237e-8, 3.35e-2, 46.6e-6, 63.5e-6, 473e-8, 93.2e-6, 0.319, 19.3, 210000e6, 0.3),
+    ('CHS_101.6_8.0', 'CHS_101.6_8.0', 101.6e-3, 8.0e-3, 18.5, 23.5e-4, 260e-8, 3.32e-2, 51.1e-6, 70.3e-6, 260e-8, 3.32e-2, 51.1e-6, 70.3e-6, 519e-8, 102e-6, 0.319, 17.2, 210000e6, 0.3),
+    ('CHS_101.6_10.0', 'CHS_101.6_10.0', 101.6e-3, 10.0e-3, 22.6, 28.8e-4, 305e-8, 3.26e-2, 60.1e-6, 84.2e-6, 305e-8, 3.26e-2, 60.1e-6, 84.2e-6, 611e-8, 120e-6, 0.319, 14.1, 210000e6, 0.3),
+    ('CHS_114.3_3.6', 'CHS_114.3_3.6', 114.3e-3, 3.6e-3, 9.83, 12.5e-4, 192e-8, 3.92e-2, 33.6e-6, 44.1e-6, 192e-8, 3.92e-2, 33.6e-6, 44.1e-6, 384e-8, 67.2e-6, 0.359, 36.5, 210000e6, 0.3),
+    ('CHS_114.3_4.0', 'CHS_114.3_4.0', 114.3e-3, 4.0e-3, 10.9, 13.9e-4, 211e-8, 3.90e-2, 36.9e-6, 48.7e-6, 211e-8, 3.90e-2, 36.9e-6, 48.7e-6, 422e-8, 73.9e-6, 0.359, 32.9, 210000e6, 0.3),
+    ('CHS_114.3_4.5', 'CHS_114.3_4.5', 114.3e-3, 4.5e-3, 12.2, 15.5e-4, 234e-8, 3.89e-2, 41.0e-6, 54.3e-6, 234e-8, 3.89e-2, 41.0e-6, 54.3e-6, 469e-8, 82.0e-6, 0.359, 29.4, 210000e6, 0.3),
+    ('CHS_114.3_5.0', 'CHS_114.3_5.0', 114.3e-3, 5.0e-3, 13.5, 17.2e-4, 257e-8, 3.87e-2, 45.0e-6, 59.8e-6, 257e-8, 3.87e-2, 45.0e-6, 59.8e-6, 514e-8, 89.9e-6, 0.359, 26.6, 210000e6, 0.3),
+    ('CHS_114.3_5.6', 'CHS_114.3_5.6', 114.3e-3, 5.6e-3, 15.0, 19.1e-4, 283e-8, 3.85e-2, 49.6e-6, 66.2e-6, 283e-8, 3.85e-2, 49.6e-6, 66.2e-6, 566e-8, 99.1e-6, 0.359, 23.9, 210000e6, 0.3),
+    ('CHS_114.3_6.3', 'CHS_114.3_6.3', 114.3e-3, 6.3e-3, 16.8, 21.4e-4, 313e-8, 3.82e-2, 54.7e-6, 73.6e-6, 313e-8, 3.82e-2, 54.7e-6, 73.6e-6, 625e-8, 109e-6, 0.359, 21.4, 210000e6, 0.3),
+    ('CHS_114.3_7.1', 'CHS_114.3_7.1', 114.3e-3, 7.1e-3, 18.8, 23.9e-4, 345e-8, 3.80e-2, 60.4e-6, 81.7e-6, 345e-8, 3.80e-2, 60.4e-6, 81.7e-6, 690e-8, 121e-6, 0.359, 19.1, 210000e6, 0.3),
+    ('CHS_114.3_8.0', 'CHS_114.3_8.0', 114.3e-3, 8.0e-3, 21.0, 26.7e-4, 379e-8, 3.77e-2, 66.4e-6, 90.6e-6, 379e-8, 3.77e-2, 66.4e-6, 90.6e-6, 759e-8, 133e-6, 0.359, 17.1, 210000e6, 0.3),
+    ('CHS_114.3_10.0', 'CHS_114.3_10.0', 114.3e-3, 10.0e-3, 25.7, 32.8e-4, 450e-8, 3.70e-2, 78.7e-6, 109e-6, 450e-8, 3.70e-2, 78.7e-6, 109e-6, 899e-8, 157e-6, 0.359, 14.0, 210000e6, 0.3),
+    ('CHS_139.7_3.6', 'CHS_139.7_3.6', 139.7e-3, 3.6e-3, 12.1, 15.4e-4, 357e-8, 4.81e-2, 51.1e-6, 66.7e-6, 357e-8, 4.81e-2, 51.1e-6, 66.7e-6, 713e-8, 102e-6, 0.439, 36.3, 210000e6, 0.3),
+    ('CHS_139.7_4.0', 'CHS_139.7_4.0', 139.7e-3, 4.0e-3, 13.4, 17.1e-4, 393e-8, 4.80e-2, 56.2e-6, 73.7e-6, 393e-8, 4.80e-2, 56.2e-6, 73.7e-6, 786e-8, 112e-6, 0.439, 32.8, 210000e6, 0.3),
+    ('CHS_139.7_4.5', 'CHS_139.7_4.5', 139.7e-3, 4.5e-3, 15.0, 19.1e-4, 437e-8, 4.78e-2, 62.6e-6, 82.3e-6, 437e-8, 4.78e-2, 62.6e-6, 82.3e-6, 874e-8, 125e-6, 0.439, 29.3, 210000e6, 0.3),
+    ('CHS_139.7_5.0', 'CHS_139.7_5.0', 139.7e-3, 5.0e-3, 16.6, 21.2e-4, 481e-8, 4.77e-2, 68.8e-6, 90.8e-6, 481e-8, 4.77e-2, 68.8e-6, 90.8e-6, 961e-8, 138e-6, 0.439, 26.4, 210000e6, 0.3),
+    ('CHS_139.7_5.6', 'CHS_139.7_5.6', 139.7e-3, 5.6e-3, 18.5, 23.6e-4, 531e-8, 4.75e-2, 76.1e-6, 101e-6, 531e-8, 4.75e-2, 76.1e-6, 101e-6, 1060e-8, 152e-6, 0.439, 23.7, 210000e6, 0.3),
+    ('CHS_139.7_6.3', 'CHS_139.7_6.3', 139.7e-3, 6.3e-3, 20.7, 26.4e-4, 589e-8, 4.72e-2, 84.3e-6, 112e-6, 589e-8, 4.72e-2, 84.3e-6, 112e-6, 1180e-8, 169e-6, 0.439, 21.2, 210000e6, 0.3),
+    ('CHS_139.7_7.1', 'CHS_139.7_7.1', 139.7e-3, 7.1e-3, 23.2, 29.6e-4, 652e-8, 4.69e-2, 93.3e-6, 125e-6, 652e-8, 4.69e-2, 93.3e-6, 125e-6, 1300e-8, 187e-6, 0.439, 18.9, 210000e6, 0.3),
+    ('CHS_139.7_8.0', 'CHS_139.7_8.0', 139.7e-3, 8.0e-3, 26.0, 33.1e-4, 720e-8, 4.66e-2, 103e-6, 139e-6, 720e-8, 4.66e-2, 103e-6, 139e-6, 1440e-8, 206e-6, 0.439, 16.9, 210000e6, 0.3),
+    ('CHS_139.7_10.0', 'CHS_139.7_10.0', 139.7e-3, 10.0e-3, 32.0, 40.7e-4, 862e-8, 4.60e-2, 123e-6, 169e-6, 862e-8, 4.60e-2, 123e-6, 169e-6, 1720e-8, 247e-6, 0.439, 13.7, 210000e6, 0.3),
+    ('CHS_168.3_5.0', 'CHS_168.3_5.0', 168.3e-3, 5.0e-3, 20.1, 25.7e-4, 856e-8, 5.78e-2, 102e-6, 133e-6, 856e-8, 5.78e-2, 102e-6, 133e-6, 1710e-8, 203e-6, 0.529, 26.3, 210000e6, 0.3),
+    ('CHS_168.3_5.6', 'CHS_168.3_5.6', 168.3e-3, 5.6e-3, 22.5, 28.6e-4, 948e-8, 5.76e-2, 113e-6, 148e-6, 948e-8, 5.76e-2, 113e-6, 148e-6, 1900e-8, 225e-6, 0.529, 23.5, 210000e6, 0.3),
+    ('CHS_168.3_6.3', 'CHS_168.3_6.3', 168.3e-3, 6.3e-3, 25.2, 32.1e-4, 1050e-8, 5.73e-2, 125e-6, 165e-6, 1050e-8, 5.73e-2, 125e-6, 165e-6, 2110e-8, 250e-6, 0.529, 21.0, 210000e6, 0.3),
+    ('CHS_168.3_7.1', 'CHS_168.3_7.1', 168.3e-3, 7.1e-3, 28.2, 36.0e-4, 1170e-8, 5.70e-2, 139e-6, 185e-6, 1170e-8, 5.70e-2, 139e-6, 185e-6, 2340e-8, 278e-6, 0.529, 18.8, 210000e6, 0.3),
+    ('CHS_168.3_8.0', 'CHS_168.3_8.0', 168.3e-3, 8.0e-3, 31.6, 40.3e-4, 1300e-8, 5.67e-2, 154e-6, 206e-6, 1300e-8, 5.67e-2, 154e-6, 206e-6, 2600e-8, 308e-6, 0.529, 16.7, 210000e6, 0.3),
+    ('CHS_168.3_10.0', 'CHS_168.3_10.0', 168.3e-3, 10.0e-3, 39.0, 49.7e-4, 1560e-8, 5.61e-2, 186e-6, 251e-6, 1560e-8, 5.61e-2, 186e-6, 251e-6, 3130e-8, 372e-6, 0.529, 13.6, 210000e6, 0.3),
+    ('CHS_168.3_11.0', 'CHS_168.3_11.0', 168.3e-3, 11.0e-3, 42.7, 54.4e-4, 1690e-8, 5.57e-2, 201e-6, 273e-6, 1690e-8, 5.57e-2, 201e-6, 273e-6, 3380e-8, 402e-6, 0.529, 12.4, 210000e6, 0.3),
+    ('CHS_168.3_12.5', 'CHS_168.3_12.5', 168.3e-3, 12.5e-3, 48.0, 61.2e-4, 1870e-8, 5.53e-2, 222e-6, 304e-6, 1870e-8, 5.53e-2, 222e-6, 304e-6, 3740e-8, 444e-6, 0.529, 11.0, 210000e6, 0.3),
+    ('CHS_193.7_5.0', 'CHS_193.7_5.0', 193.7e-3, 5.0e-3, 23.3, 29.6e-4, 1320e-8, 6.67e-2, 136e-6, 178e-6, 1320e-8, 6.67e-2, 136e-6, 178e-6, 2640e-8, 273e-6, 0.609, 26.1, 210000e6, 0.3),
+    ('CHS_193.7_5.6', 'CHS_193.7_5.6', 193.7e-3, 5.6e-3, 26.0, 33.1e-4, 1460e-8, 6.65e-2, 151e-6, 198e-6, 1460e-8, 6.65e-2, 151e-6, 198e-6, 2930e-8, 303e-6, 0.609, 23.4, 210000e6, 0.3),
+    ('CHS_193.7_6.3', 'CHS_193.7_6.3', 193.7e-3, 6.3e-3, 29.1, 37.1e-4, 1630e-8, 6.63e-2, 168e-6, 221e-6, 1630e-8, 6.63e-2, 168e-6, 221e-6, 3260e-8, 337e-6, 0.609, 20.9, 210000e6, 0.3),
+    ('CHS_193.7_7.1', 'CHS_193.7_7.1', 193.7e-3, 7.1e-3, 32.7, 41.6e-4, 1810e-8, 6.60e-2, 187e-6, 247e-6, 1810e-8, 6.60e-2, 187e-6, 247e-6, 3630e-8, 375e-6, 0.609, 18.6, 210000e6, 0.3),
+    ('CHS_193.7_8.0', 'CHS_193.7_8.0', 193.7e-3, 8.0e-3, 36.6, 46.7e-4, 2020e-8, 6.57e-2, 208e-6, 276e-6, 2020e-8, 6.57e-2, 208e-6, 276e-6, 4030e-8, 416e-6, 0.609, 16.6, 210000e6, 0.3),
+    ('CHS_193.7_10.0', 'CHS_193.7_10.0', 193.7e-3, 10.0e-3, 45.3, 57.7e-4, 2440e-8, 6.50e-2, 252e-6, 338e-6, 2440e-8, 6.50e-2, 252e-6, 338e-6, 4880e-8, 504e-6, 0.609, 13.4, 210000e6, 0.3),
+    ('CHS_193.7_11.0', 'CHS_193.7_11.0', 193.7e-3, 11.0e-3, 49.6, 63.1e-4, 2640e-8, 6.47e-2, 273e-6, 368e-6, 2640e-8, 6.47e-2, 273e-6, 368e-6, 5290e-8, 546e-6, 0.609, 12.3, 210000e6, 0.3),
+    ('CHS_193.7_12.5', 'CHS_193.7_12.5', 193.7e-3, 12.5e-3, 55.9, 71.2e-4, 2930e-8, 6.42e-2, 303e-6, 411e-6, 2930e-8, 6.42e-2, 303e-6, 411e-6, 5870e-8, 606e-6, 0.609, 10.9, 210000e6, 0.3),
+    ('CHS_193.7_14.2', 'CHS_193.7_14.2', 193.7e-3, 14.2e-3, 62.9, 80.1e-4, 3240e-8, 6.37e-2, 335e-6, 458e-6, 3240e-8, 6.37e-2, 335e-6, 458e-6, 6490e-8, 670e-6, 0.609, 9.68, 210000e6, 0.3),
+    ('CHS_193.7_16.0', 'CHS_193.7_16.0', 193.7e-3, 16.0e-3, 70.1, 89.3e-4, 3550e-8, 6.31e-2, 367e-6, 507e-6, 3550e-8, 6.31e-2, 367e-6, 507e-6, 7110e-8, 734e-6, 0.609, 8.69, 210000e6, 0.3),
+    ('CHS_219.1_4.5', 'CHS_219.1_4.5', 219.1e-3, 4.5e-3, 23.8, 30.3e-4, 1750e-8, 7.59e-2, 159e-6, 207e-6, 1750e-8, 7.59e-2, 159e-6, 207e-6, 3490e-8, 319e-6, 0.688, 28.9, 210000e6, 0.3),
+    ('CHS_219.1_5.0', 'CHS_219.1_5.0', 219.1e-3, 5.0e-3, 26.4, 33.6e-4, 1930e-8, 7.57e-2, 176e-6, 229e-6, 1930e-8, 7.57e-2, 176e-6, 229e-6, 3860e-8, 352e-6, 0.688, 26.1, 210000e6, 0.3),
+    ('CHS_219.1_5.6', 'CHS_219.1_5.6', 219.1e-3, 5.6e-3, 29.5, 37.6e-4, 2140e-8, 7.55e-2, 195e-6, 255e-6, 2140e-8, 7.55e-2, 195e-6, 255e-6, 4280e-8, 391e-6, 0.688, 23.3, 210000e6, 0.3),
+    ('CHS_219.1_6.3', 'CHS_219.1_6.3', 219.1e-3, 6.3e-3, 33.1, 42.1e-4, 2390e-8, 7.53e-2, 218e-6, 285e-6, 2390e-8, 7.53e-2, 218e-6, 285e-6, 4770e-8, 436e-6, 0.688, 20.8, 210000e6, 0.3),
+    ('CHS_219.1_7.1', 'CHS_219.1_7.1', 219.1e-3, 7.1e-3, 37.1, 47.3e-4, 2660e-8, 7.50e-2, 243e-6, 319e-6, 2660e-8, 7.50e-2, 243e-6, 319e-6, 5320e-8, 486e-6, 0.688, 18.5, 210000e6, 0.3),
+    ('CHS_219.1_8.0', 'CHS_219.1_8.0', 219.1e-3, 8.0e-3, 41.6, 53.1e-4, 2960e-8, 7.47e-2, 270e-6, 357e-6, 2960e-8, 7.47e-2, 270e-6, 357e-6, 5920e-8, 540e-6, 0.688, 16.5, 210000e6, 0.3),
+    ('CHS_219.1_10.0', 'CHS_219.1_10.0', 219.1e-3, 10.0e-3, 51.6, 65.7e-4, 3600e-8, 7.40e-2, 328e-6, 438e-6, 3600e-8, 7.40e-2, 328e-6, 438e-6, 7200e-8, 657e-6, 0.688, 13.3, 210000e6, 0.3),
+    ('CHS_219.1_11.0', 'CHS_219.1_11.0', 219.1e-3, 11.0e-3, 56.5, 71.9e-4, 3900e-8, 7.37e-2, 356e-6, 477e-6, 3900e-8, 7.37e-2, 356e-6, 477e-6, 7810e-8, 713e-6, 0.688, 12.2, 210000e6, 0.3),
+    ('CHS_219.1_12.5', 'CHS_219.1_12.5', 219.1e-3, 12.5e-3, 63.7, 81.1e-4, 4340e-8, 7.32e-2, 397e-6, 534e-6, 4340e-8, 7.32e-2, 397e-6, 534e-6, 8690e-8, 793e-6, 0.688, 10.8, 210000e6, 0.3),
+    ('CHS_219.1_14.2', 'CHS_219.1_14.2', 219.1e-3, 14.2e-3, 71.8, 91.4e-4, 4820e-8, 7.26e-2, 440e-6, 597e-6, 4820e-8, 7.26e-2, 440e-6, 597e-6, 9640e-8, 880e-6, 0.688, 9.58, 210000e6, 0.3),
+    ('CHS_219.1_16.0', 'CHS_219.1_16.0', 219.1e-3, 16.0e-3, 80.1, 102e-4, 5300e-8, 7.20e-2, 483e-6, 661e-6, 5300e-8, 7.20e-2, 483e-6, 661e-6, 10600e-8, 967e-6, 0.688, 8.59, 210000e6, 0.3),
+    ('CHS_244.5_5.0', 'CHS_244.5_5.0', 244.5e-3, 5.0e-3, 29.5, 37.6e-4, 2700e-8, 8.47e-2, 221e-6, 287e-6, 2700e-8, 8.47e-2, 221e-6, 287e-6, 5400e-8, 441e-6, 0.768, 26.0, 210000e6, 0.3),
+    ('CHS_244.5_5.6', 'CHS_244.5_5.6', 244.5e-3, 5.6e-3, 33.0, 42.0e-4, 3000e-8, 8.45e-2, 245e-6, 320e-6, 3000e-8, 8.45e-2, 245e-6, 320e-6, 6000e-8, 491e-6, 0.768, 23.3, 210000e6, 0.3),
+    ('CHS_244.5_6.3', 'CHS_244.5_6.3', 244.5e-3, 6.3e-3, 37.0, 47.1e-4, 3350e-8, 8.42e-2, 274e-6, 358e-6, 3350e-8, 8.42e-2, 274e-6, 358e-6, 6690e-8, 547e-6, 0.768, 20.8, 210000e6, 0.3),
+    ('CHS_244.5_7.1', 'CHS_244.5_7.1', 244.5e-3, 7.1e-3, 41.6, 53.0e-4, 3730e-8, 8.40e-2, 305e-6, 400e-6, 3730e-8, 8.40e-2, 305e-6, 400e-6, 7470e-8, 611e-6, 0.768, 18.5, 210000e6, 0.3),
+    ('CHS_244.5_8.0', 'CHS_244.5_8.0', 244.5e-3, 8.0e-3, 46.7, 59.4e-4, 4160e-8, 8.37e-2, 340e-6, 448e-6, 4160e-8, 8.37e-2, 340e-6, 448e-6, 8320e-8, 681e-6, 0.768, 16.4, 210000e6, 0.3),
+    ('CHS_244.5_10.0', 'CHS_244.5_10.0', 244.5e-3, 10.0e-3, 57.8, 73.7e-4, 5070e-8, 8.30e-2, 415e-6, 550e-6, 5070e-8, 8.30e-2, 415e-6, 550e-6, 10100e-8, 830e-6, 0.768, 13.3, 210000e6, 0.3),
+    ('CHS_244.5_11.0', 'CHS_244.5_11.0', 244.5e-3, 11.0e-3, 63.3, 80.7e-4, 5510e-8, 8.26e-2, 451e-6, 600e-6, 5510e-8, 8.26e-2, 451e-6, 600e-6, 11000e-8, 902e-6, 0.768, 12.1, 210000e6, 0.3),
+    ('CHS_244.5_12.5', 'CHS_244.5_12.5', 244.5e-3, 12.5e-3, 71.5, 91.1e-4, 6150e-8, 8.21e-2, 503e-6, 673e-6, 6150e-8, 8.21e-2, 503e-6, 673e-6, 12300e-8, 1010e-6, 0.768, 10.7, 210000e6, 0.3),
+    ('CHS_244.5_14.2', 'CHS_244.5_14.2', 244.5e-3, 14.2e-3, 80.6, 103e-4, 6840e-8, 8.16e-2, 559e-6, 754e-6, 6840e-8, 8.16e-2, 559e-6, 754e-6, 13700e-8, 1120e-6, 0.768, 9.53, 210000e6, 0.3),
+    ('CHS_244.5_16.0', 'CHS_244.5_16.0', 244.5e-3, 16.0e-3, 90.2, 115e-4, 7530e-8, 8.10e-2, 616e-6, 837e-6, 7530e-8, 8.10e-2, 616e-6, 837e-6, 15100e-8, 1230e-6, 0.768, 8.51, 210000e6, 0.3),
+    ('CHS_273.0_5.0', 'CHS_273.0_5.0', 273.0e-3, 5.0e-3, 33.0, 42.1e-4, 3780e-8, 9.48e-2, 277e-6, 359e-6, 3780e-8, 9.48e-2, 277e-6, 359e-6, 7560e-8, 554e-6, 0.858, 26.0, 210000e6, 0.3),
+    ('CHS_273.0_5.6', 'CHS_273.0_5.6', 273.0e-3, 5.6e-3, 36.9, 47.0e-4, 4210e-8, 9.46e-2, 308e-6, 400e-6, 4210e-8, 9.46e-2, 308e-6, 400e-6, 8410e-8, 616e-6, 0.858, 23.3, 210000e6, 0.3),
+    ('CHS_273.0_6.3', 'CHS_273.0_6.3', 273.0e-3, 6.3e-3, 41.4, 52.8e-4, 4700e-8, 9.43e-2, 344e-6, 448e-6, 4700e-8, 9.43e-2, 344e-6, 448e-6, 9390e-8, 688e-6, 0.858, 20.7, 210000e6, 0.3),
+    ('CHS_273.0_7.1', 'CHS_273.0_7.1', 273.0e-3, 7.1e-3, 46.6, 59.3e-4, 5240e-8, 9.40e-2, 384e-6, 502e-6, 5240e-8, 9.40e-2, 384e-6, 502e-6, 10500e-8, 769e-6, 0.858, 18.4, 210000e6, 0.3),
+    ('CHS_273.0_8.0', 'CHS_273.0_8.0', 273.0e-3, 8.0e-3, 52.3, 66.6e-4, 5850e-8, 9.37e-2, 429e-6, 562e-6, 5850e-8, 9.37e-2, 429e-6, 562e-6, 11700e-8, 857e-6, 0.858, 16.4, 210000e6, 0.3),
+    ('CHS_273.0_10.0', 'CHS_273.0_10.0', 273.0e-3, 10.0e-3, 64.9, 82.6e-4, 7150e-8, 9.31e-2, 524e-6, 692e-6, 7150e-8, 9.31e-2, 524e-6, 692e-6, 14300e-8, 1050e-6, 0.858, 13.2, 210000e6, 0.3),
+    ('CHS_273.0_11.0', 'CHS_273.0_11.0', 273.0e-3, 11.0e-3, 71.1, 90.5e-4, 7780e-8, 9.27e-2, 570e-6, 756e-6, 7780e-8, 9.27e-2, 570e-6, 756e-6, 15600e-8, 1140e-6, 0.858, 12.1, 210000e6, 0.3),
+    ('CHS_273.0_12.5', 'CHS_273.0_12.5', 273.0e-3, 12.5e-3, 80.3, 102e-4, 8700e-8, 9.22e-2, 637e-6, 849e-6, 8700e-8, 9.22e-2, 637e-6, 849e-6, 17400e-8, 1270e-6, 0.858, 10.7, 210000e6, 0.3),
+    ('CHS_273.0_14.2', 'CHS_273.0_14.2', 273.0e-3, 14.2e-3, 90.6, 115e-4, 9700e-8, 9.16e-2, 710e-6, 952e-6, 9700e-8, 9.16e-2, 710e-6, 952e-6, 19400e-8, 1420e-6, 0.858, 9.47, 210000e6, 0.3),
+    ('CHS_273.0_16.0', 'CHS_273.0_16.0', 273.0e-3, 16.0e-3, 101, 129e-4, 10700e-8, 9.10e-2, 784e-6, 1060e-6, 10700e-8, 9.10e-2, 784e-6, 1060e-6, 21400e-8, 1570e-6, 0.858, 8.50, 210000e6, 0.3),
+    ('CHS_323.9_5.0', 'CHS_323.9_5.0', 323.9e-3, 5.0e-3, 39.3, 50.1e-4, 6370e-8, 11.3e-2, 393e-6, 509e-6, 6370e-8, 11.3e-2, 393e-6, 509e-6, 12700e-8, 787e-6, 1.02, 26.0, 210000e6, 0.3),
+    ('CHS_323.9_5.6', 'CHS_323.9_5.6', 323.9e-3, 5.6e-3, 44.0, 56.0e-4, 7090e-8, 11.3e-2, 438e-6, 567e-6, 7090e-8, 11.3e-2, 438e-6, 567e-6, 14200e-8, 876e-6, 1.02, 23.2, 210000e6, 0.3),
+    ('CHS_323.9_6.3', 'CHS_323.9_6.3', 323.9e-3, 6.3e-3, 49.3, 62.9e-4, 7930e-8, 11.2e-2, 490e-6, 636e-6, 7930e-8, 11.2e-2, 490e-6, 636e-6, 15900e-8, 979e-6, 1.02, 20.7, 210000e6, 0.3),
+    ('CHS_323.9_7.1', 'CHS_323.9_7.1', 323.9e-3, 7.1e-3, 55.5, 70.7e-4, 8870e-8, 11.2e-2, 548e-6, 713e-6, 8870e-8, 11.2e-2, 548e-6, 713e-6, 17700e-8, 1100e-6, 1.02, 18.4, 210000e6, 0.3),
+    ('CHS_323.9_8.0', 'CHS_323.9_8.0', 323.9e-3, 8.0e-3, 62.3, 79.4e-4, 9910e-8, 11.2e-2, 612e-6, 799e-6, 9910e-8, 11.2e-2, 612e-6, 799e-6, 19800e-8, 1220e-6, 1.02, 16.4, 210000e6, 0.3),
+    ('CHS_323.9_10.0', 'CHS_323.9_10.0', 323.9e-3, 10.0e-3, 77.4, 98.6e-4, 12200e-8, 11.1e-2, 751e-6, 986e-6, 12200e-8, 11.1e-2, 751e-6, 986e-6, 24300e-8, 1500e-6, 1.02, 13.2, 210000e6, 0.3),
+    ('CHS_323.9_11.0', 'CHS_323.9_11.0', 323.9e-3, 11.0e-3, 84.9, 108e-4, 13200e-8, 11.1e-2, 818e-6, 1080e-6, 13200e-8, 11.1e-2, 818e-6, 1080e-6, 26500e-8, 1640e-6, 1.02, 12.0, 210000e6, 0.3),
+    ('CHS_323.9_12.5', 'CHS_323.9_12.5', 323.9e-3, 12.5e-3, 96.0, 122e-4, 14800e-8, 11.0e-2, 917e-6, 1210e-6, 14800e-8, 11.0e-2, 917e-6, 1210e-6, 29700e-8, 1830e-6, 1.02, 10.6, 210000e6, 0.3),
+    ('CHS_323.9_14.2', 'CHS_323.9_14.2', 323.9e-3, 14.2e-3, 108, 138e-4, 16600e-8, 11.0e-2, 1020e-6, 1360e-6, 16600e-8, 11.0e-2, 1020e-6, 1360e-6, 33200e-8, 2050e-6, 1.02, 9.44, 210000e6, 0.3),
+    ('CHS_323.9_16.0', 'CHS_323.9_16.0', 323.9e-3, 16.0e-3, 121, 155e-4, 18400e-8, 10.9e-2, 1140e-6, 1520e-6, 18400e-8, 10.9e-2, 1140e-6, 1520e-6, 36800e-8, 2270e-6, 1.02, 8.43, 210000e6, 0.3),
+    ('CHS_355.6_6.3', 'CHS_355.6_6.3', 355.6e-3, 6.3e-3, 54.3, 69.1e-4, 10500e-8, 12.4e-2, 593e-6, 769e-6, 10500e-8, 12.4e-2, 593e-6, 769e-6, 21100e-8, 1190e-6, 1.12, 20.6, 210000e6, 0.3),
+    ('CHS_355.6_7.1', 'CHS_355.6_7.1', 355.6e-3, 7.1e-3, 61.0, 77.7e-4, 11800e-8, 12.3e-2, 664e-6, 862e-6, 11800e-8, 12.3e-2, 664e-6, 862e-6, 23600e-8, 1330e-6, 1.12, 18.4, 210000e6, 0.3),
+    ('CHS_355.6_8.0', 'CHS_355.6_8.0', 355.6e-3, 8.0e-3, 68.6, 87.4e-4, 13200e-8, 12.3e-2, 742e-6, 967e-6, 13200e-8, 12.3e-2, 742e-6, 967e-6, 26400e-8, 1480e-6, 1.12, 16.3, 210000e6, 0.3),
+    ('CHS_355.6_10.0', 'CHS_355.6_10.0', 355.6e-3, 10.0e-3, 85.2, 109e-4, 16200e-8, 12.2e-2, 912e-6, 1200e-6, 16200e-8, 12.2e-2, 912e-6, 1200e-6, 32400e-8, 1820e-6, 1.12, 13.1, 210000e6, 0.3),
+    ('CHS_355.6_11.0', 'CHS_355.6_11.0', 355.6e-3, 11.0e-3, 93.5, 119e-4, 17700e-8, 12.2e-2, 995e-6, 1310e-6, 17700e-8, 12.2e-2, 995e-6, 1310e-6, 35400e-8, 1990e-6, 1.12, 12.0, 210000e6, 0.3),
+    ('CHS_355.6_12.5', 'CHS_355.6_12.5', 355.6e-3, 12.5e-3, 106, 135e-4, 19900e-8, 12.1e-2, 1120e-6, 1470e-6, 19900e-8, 12.1e-2, 1120e-6, 1470e-6, 39700e-8, 2230e-6, 1.12, 10.6, 210000e6, 0.3),
+    ('CHS_355.6_14.2', 'CHS_355.6_14.2', 355.6e-3, 14.2e-3, 120, 152e-4, 22200e-8, 12.1e-2, 1250e-6, 1660e-6, 22200e-8, 12.1e-2, 1250e-6, 1660e-6, 44500e-8, 2500e-6, 1.12, 9.33, 210000e6, 0.3),
+    ('CHS_355.6_16.0', 'CHS_355.6_16.0', 355.6e-3, 16.0e-3, 134, 171e-4, 24700e-8, 12.0e-2, 1390e-6, 1850e-6, 24700e-8, 12.0e-2, 1390e-6, 1850e-6, 49300e-8, 2770e-6, 1.12, 8.36, 210000e6, 0.3),
+    ('CHS_406.4_10.0', 'CHS_406.4_10.0', 406.4e-3, 10.0e-3, 97.8, 125e-4, 24500e-8, 14.0e-2, 1200e-6, 1570e-6, 24500e-8, 14.0e-2, 1200e-6, 1570e-6, 49000e-8, 2410e-6, 1.28, 13.1, 210000e6, 0.3),
+    ('CHS_406.4_11.0', 'CHS_406.4_11.0', 406.4e-3, 11.0e-3, 107, 137e-4, 26700e-8, 14.0e-2, 1320e-6, 1720e-6, 26700e-8, 14.0e-2, 1320e-6, 1720e-6, 53400e-8, 2630e-6, 1.28, 12.0, 210000e6, 0.3),
+    ('CHS_406.4_12.5', 'CHS_406.4_12.5', 406.4e-3, 12.5e-3, 121, 155e-4, 30000e-8, 13.9e-2, 1480e-6, 1940e-6, 30000e-8, 13.9e-2, 1480e-6, 1940e-6, 60100e-8, 2960e-6, 1.28, 10.6, 210000e6, 0.3),
+    ('CHS_406.4_14.2', 'CHS_406.4_14.2', 406.4e-3, 14.2e-3, 137, 175e-4, 33700e-8, 13.9e-2, 1660e-6, 2180e-6, 33700e-8, 13.9e-2, 1660e-6, 2180e-6, 67400e-8, 3320e-6, 1.28, 9.34, 210000e6, 0.3),
+    ('CHS_406.4_16.0', 'CHS_406.4_16.0', 406.4e-3, 16.0e-3, 154, 196e-4, 37400e-8, 13.8e-2, 1840e-6, 2440e-6, 37400e-8, 13.8e-2, 1840e-6, 2440e-6, 74900e-8, 3690e-6, 1.28, 8.31, 210000e6, 0.3),
+    ('CHS_457.0_10.0', 'CHS_457.0_10.0', 457.0e-3, 10.0e-3, 110, 140e-4, 35100e-8, 15.8e-2, 1540e-6, 2000e-6, 35100e-8, 15.8e-2, 1540e-6, 2000e-6, 70200e-8, 3070e-6, 1.44, 13.1, 210000e6, 0.3),
+    ('CHS_457.0_11.0', 'CHS_457.0_11.0', 457.0e-3, 11.0e-3, 121, 154e-4, 38300e-8, 15.8e-2, 1680e-6, 2190e-6, 38300e-8, 15.8e-2, 1680e-6, 2190e-6, 76700e-8, 3360e-6, 1.44, 11.9, 210000e6, 0.3),
+    ('CHS_457.0_12.5', 'CHS_457.0_12.5', 457.0e-3, 12.5e-3, 137, 175e-4, 43100e-8, 15.7e-2, 1890e-6, 2470e-6, 43100e-8, 15.7e-2, 1890e-6, 2470e-6, 86300e-8, 3780e-6, 1.44, 10.5, 210000e6, 0.3),
+    ('CHS_457.0_14.2', 'CHS_457.0_14.2', 457.0e-3, 14.2e-3, 155, 198e-4, 48500e-8, 15.7e-2, 2120e-6, 2780e-6, 48500e-8, 15.7e-2, 2120e-6, 2780e-6, 96900e-8, 4240e-6, 1.44, 9.29, 210000e6, 0.3),
+    ('CHS_457.0_16.0', 'CHS_457.0_16.0', 457.0e-3, 16.0e-3, 174, 222e-4, 54000e-8, 15.6e-2, 2360e-6, 3110e-6, 54000e-8, 15.6e-2, 2360e-6, 3110e-6, 108000e-8, 4720e-6, 1.44, 8.28, 210000e6, 0.3),
+    ('CHS_508.0_10.0', 'CHS_508.0_10.0', 508.0e-3, 10.0e-3, 123, 156e-4, 48500e-8, 17.6e-2, 1910e-6, 2480e-6, 48500e-8, 17.6e-2, 1910e-6, 2480e-6, 97000e-8, 3820e-6, 1.60, 13.0, 210000e6, 0.3),
+    ('CHS_508.0_11.0', 'CHS_508.0_11.0', 508.0e-3, 11.0e-3, 135, 172e-4, 53100e-8, 17.6e-2, 2090e-6, 2720e-6, 53100e-8, 17.6e-2, 2090e-6, 2720e-6, 106000e-8, 4180e-6, 1.60, 11.9, 210000e6, 0.3),
+    ('CHS_508.0_12.5', 'CHS_508.0_12.5', 508.0e-3, 12.5e-3, 153, 195e-4, 59800e-8, 17.5e-2, 2350e-6, 3070e-6, 59800e-8, 17.5e-2, 2350e-6, 3070e-6, 120000e-8, 4700e-6, 1.60, 10.5, 210000e6, 0.3),
+    ('CHS_508.0_14.2', 'CHS_508.0_14.2', 508.0e-3, 14.2e-3, 173, 220e-4, 67200e-8, 17.5e-2, 2650e-6, 3460e-6, 67200e-8, 17.5e-2, 2650e-6, 3460e-6, 134000e-8, 5290e-6, 1.60, 9.25, 210000e6, 0.3),
+    ('CHS_508.0_16.0', 'CHS_508.0_16.0', 508.0e-3, 16.0e-3, 194, 247e-4, 74900e-8, 17.4e-2, 2950e-6, 3870e-6, 74900e-8, 17.4e-2, 2950e-6, 3870e-6, 150000e-8, 5900e-6, 1.60, 8.25, 210000e6, 0.3),
+    )
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR HE shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'P', 'h', 'b', 'tw', 'tf', 'r', 'A', 'hi', 'd', 'FI', 'Pmin', 'Pmax', 'AL', 'AG', 'Iz', 'Wzel', 'Wzpl', 'iz', 'Avy', 'Iy', 'Wyel', 'Wypl', 'iy', 'Ss', 'It', 'E', 'nu')
+
+rows= (
+    ('HE_100_AAdot', 'HE_100_AAdot', 12.2, 91e-3, 100e-3, 4.2e-3, 5.5e-3, 12e-3, 15.6e-4, 80e-3, 56e-3, 'M 10', 54e-3, 58e-3, 0.553, 45.17, 236.5e-8, 51.98e-6, 58.36e-6, 3.89e-2, 6.15e-4, 92.06e-8, 18.41e-6, 28.44e-6, 2.43e-2, 29.26e-3, 2.51e-8, 2.1e+11, 0.3),
+    ('HE_100_A', 'HE_100_A', 16.7, 96e-3, 100e-3, 5e-3, 8e-3, 12e-3, 21.2e-4, 80e-3, 56e-3, 'M 10', 54e-3, 58e-3, 0.561, 33.68, 349.2e-8, 72.76e-6, 83.01e-6, 4.06e-2, 7.56e-4, 133.8e-8, 26.76e-6, 41.14e-6, 2.51e-2, 35.06e-3, 5.24e-8, 2.1e+11, 0.3),
+    ('HE_100_B', 'HE_100_B', 20.4, 100e-3, 100e-3, 6e-3, 10e-3, 12e-3, 26e-4, 80e-3, 56e-3, 'M 10', 56e-3, 58e-3, 0.567, 27.76, 449.5e-8, 89.91e-6, 104.2e-6, 4.16e-2, 9.04e-4, 167.3e-8, 33.45e-6, 51.42e-6, 2.53e-2, 40.06e-3, 9.25e-8, 2.1e+11, 0.3),
+    ('HE_100_M', 'HE_100_M', 41.8, 120e-3, 106e-3, 12e-3, 20e-3, 12e-3, 53.2e-4, 80e-3, 56e-3, 'M 10', 62e-3, 64e-3, 0.619, 14.82, 1143e-8, 190.4e-6, 235.8e-6, 4.63e-2, 18.04e-4, 399.2e-8, 75.31e-6, 116.3e-6, 2.74e-2, 66.06e-3, 68.21e-8, 2.1e+11, 0.3),
+    ('HE_120_AAdot', 'HE_120_AAdot', 14.6, 109e-3, 120e-3, 4.2e-3, 5.5e-3, 12e-3, 18.6e-4, 98e-3, 74e-3, 'M 12', 58e-3, 68e-3, 0.669, 45.94, 413.4e-8, 75.85e-6, 84.12e-6, 4.72e-2, 6.9e-4, 158.8e-8, 26.47e-6, 40.62e-6, 2.93e-2, 29.26e-3, 2.78e-8, 2.1e+11, 0.3),
+    ('HE_120_A', 'HE_120_A', 19.9, 114e-3, 120e-3, 5e-3, 8e-3, 12e-3, 25.3e-4, 98e-3, 74e-3, 'M 12', 58e-3, 68e-3, 0.677, 34.06, 606.2e-8, 106.3e-6, 119.5e-6, 4.89e-2, 8.46e-4, 230.9e-8, 38.48e-6, 58.85e-6, 3.02e-2, 35.06e-3, 5.99e-8, 2.1e+11, 0.3),
+    ('HE_120_B', 'HE_120_B', 26.7, 120e-3, 120e-3, 6.5e-3, 11e-3, 12e-3, 34e-4, 98e-3, 74e-3, 'M 12', 60e-3, 68e-3, 0.686, 25.71, 864.4e-8, 144.1e-6, 165.2e-6, 5.04e-2, 10.96e-4, 317.5e-8, 52.92e-6, 80.97e-6, 3.06e-2, 42.56e-3, 13.84e-8, 2.1e+11, 0.3),
+    ('HE_120_M', 'HE_120_M', 52.1, 140e-3, 126e-3, 12.5e-3, 21e-3, 12e-3, 66.4e-4, 98e-3, 74e-3, 'M 12', 66e-3, 74e-3, 0.738, 14.16, 2018e-8, 288.2e-6, 350.6e-6, 5.51e-2, 21.15e-4, 702.8e-8, 111.6e-6, 171.6e-6, 3.25e-2, 68.56e-3, 91.66e-8, 2.1e+11, 0.3),
+    ('HE_140_AAdot', 'HE_140_AAdot', 18.1, 128e-3, 140e-3, 4.3e-3, 6e-3, 12e-3, 23e-4, 116e-3, 92e-3, 'M 16', 64e-3, 76e-3, 0.787, 43.53, 719.5e-8, 112.4e-6, 123.8e-6, 5.59e-2, 7.92e-4, 274.8e-8, 39.26e-6, 59.93e-6, 3.45e-2, 30.36e-3, 3.54e-8, 2.1e+11, 0.3),
+    ('HE_140_A', 'HE_140_A', 24.7, 133e-3, 140e-3, 5.5e-3, 8.5e-3, 12e-3, 31.4e-4, 116e-3, 92e-3, 'M 16', 64e-3, 76e-3, 0.794, 32.21, 1033e-8, 155.4e-6, 173.5e-6, 5.73e-2, 10.12e-4, 389.3e-8, 55.62e-6, 84.85e-6, 3.52e-2, 36.56e-3, 8.13e-8, 2.1e+11, 0.3),
+    ('HE_140_B', 'HE_140_B', 33.7, 140e-3, 140e-3, 7e-3, 12e-3, 12e-3, 43e-4, 116e-3, 92e-3, 'M 16', 66e-3, 76e-3, 0.805, 23.88, 1509e-8, 215.6e-6, 245.4e-6, 5.93e-2, 13.08e-4, 549.7e-8, 78.52e-6, 119.8e-6, 3.58e-2, 45.06e-3, 20.06e-8, 2.1e+11, 0.3),
+    ('HE_140_M', 'HE_140_M', 63.2, 160e-3, 146e-3, 13e-3, 22e-3, 12e-3, 80.6e-4, 116e-3, 92e-3, 'M 16', 72e-3, 82e-3, 0.857, 13.56, 3291e-8, 411.4e-6, 493.8e-6, 6.39e-2, 24.46e-4, 1144e-8, 156.8e-6, 240.5e-6, 3.77e-2, 71.06e-3, 120e-8, 2.1e+11, 0.3),
+    ('HE_160_AAdot', 'HE_160_AAdot', 23.8, 148e-3, 160e-3, 4.5e-3, 7e-3, 15e-3, 30.4e-4, 134e-3, 104e-3, 'M 20', 76e-3, 84e-3, 0.901, 37.81, 1283e-8, 173.4e-6, 190.4e-6, 6.50e-2, 10.38e-4, 478.7e-8, 59.84e-6, 91.36e-6, 3.97e-2, 36.07e-3, 6.33e-8, 2.1e+11, 0.3),
+    ('HE_160_A', 'HE_160_A', 30.4, 152e-3, 160e-3, 6e-3, 9e-3, 15e-3, 38.8e-4, 134e-3, 104e-3, 'M 20', 78e-3, 84e-3, 0.906, 29.78, 1673e-8, 220.1e-6, 245.1e-6, 6.57e-2, 13.21e-4, 615.6e-8, 76.95e-6, 117.6e-6, 3.98e-2, 41.57e-3, 12.19e-8, 2.1e+11, 0.3),
+    ('HE_160_B', 'HE_160_B', 42.6, 160e-3, 160e-3, 8e-3, 13e-3, 15e-3, 54.3e-4, 134e-3, 104e-3, 'M 20', 80e-3, 84e-3, 0.918, 21.56, 2492e-8, 311.5e-6, 354e-6, 6.78e-2, 17.59e-4, 889.2e-8, 111.2e-6, 170e-6, 4.05e-2, 51.57e-3, 31.24e-8, 2.1e+11, 0.3),
+    ('HE_160_M', 'HE_160_M', 76.2, 180e-3, 166e-3, 14e-3, 23e-3, 15e-3, 97.1e-4, 134e-3, 104e-3, 'M 20', 86e-3, 90e-3, 0.97, 12.74, 5098e-8, 566.5e-6, 674.6e-6, 7.25e-2, 30.81e-4, 1759e-8, 211.9e-6, 325.5e-6, 4.26e-2, 77.57e-3, 162.4e-8, 2.1e+11, 0.3),
+    ('HE_180_AAdot', 'HE_180_AAdot', 28.7, 167e-3, 180e-3, 5e-3, 7.5e-3, 15e-3, 36.5e-4, 152e-3, 122e-3, 'M 24', 84e-3, 92e-3, 1.018, 35.51, 1967e-8, 235.6e-6, 258.2e-6, 7.34e-2, 12.16e-4, 730e-8, 81.11e-6, 123.6e-6, 4.47e-2, 37.57e-3, 8.33e-8, 2.1e+11, 0.3),
+    ('HE_180_A', 'HE_180_A', 35.5, 171e-3, 180e-3, 6e-3, 9.5e-3, 15e-3, 45.3e-4, 152e-3, 122e-3, 'M 24', 86e-3, 92e-3, 1.024, 28.83, 2510e-8, 293.6e-6, 324.9e-6, 7.45e-2, 14.47e-4, 924.6e-8, 102.7e-6, 156.5e-6, 4.52e-2, 42.57e-3, 14.8e-8, 2.1e+11, 0.3),
+    ('HE_180_B', 'HE_180_B', 51.2, 180e-3, 180e-3, 8.5e-3, 14e-3, 15e-3, 65.3e-4, 152e-3, 122e-3, 'M 24', 88e-3, 92e-3, 1.037, 20.25, 3831e-8, 425.7e-6, 481.4e-6, 7.66e-2, 20.24e-4, 1363e-8, 151.4e-6, 231e-6, 4.57e-2, 54.07e-3, 42.16e-8, 2.1e+11, 0.3),
+    ('HE_180_M', 'HE_180_M', 88.9, 200e-3, 186e-3, 14.5e-3, 24e-3, 15e-3, 113.3e-4, 152e-3, 122e-3, 'M 24', 94e-3, 98e-3, 1.089, 12.25, 7483e-8, 748.3e-6, 883.4e-6, 8.13e-2, 34.65e-4, 2580e-8, 277.4e-6, 425.2e-6, 4.77e-2, 80.07e-3, 203.3e-8, 2.1e+11, 0.3),
+    ('HE_200_AAdot', 'HE_200_AAdot', 34.6, 186e-3, 200e-3, 5.5e-3, 8e-3, 18e-3, 44.1e-4, 170e-3, 134e-3, 'M 27', 96e-3, 100e-3, 1.13, 32.62, 2944e-8, 316.6e-6, 347.1e-6, 8.17e-2, 15.45e-4, 1068e-8, 106.8e-6, 163.2e-6, 4.92e-2, 42.59e-3, 12.69e-8, 2.1e+11, 0.3),
+    ('HE_200_A', 'HE_200_A', 42.3, 190e-3, 200e-3, 6.5e-3, 10e-3, 18e-3, 53.8e-4, 170e-3, 134e-3, 'M 27', 98e-3, 100e-3, 1.136, 26.89, 3692e-8, 388.6e-6, 429.5e-6, 8.28e-2, 18.08e-4, 1336e-8, 133.6e-6, 203.8e-6, 4.98e-2, 47.59e-3, 20.98e-8, 2.1e+11, 0.3),
+    ('HE_200_B', 'HE_200_B', 61.3, 200e-3, 200e-3, 9e-3, 15e-3, 18e-3, 78.1e-4, 170e-3, 134e-3, 'M 27', 100e-3, 100e-3, 1.151, 18.78, 5696e-8, 569.6e-6, 642.5e-6, 8.54e-2, 24.83e-4, 2003e-8, 200.3e-6, 305.8e-6, 5.07e-2, 60.09e-3, 59.28e-8, 2.1e+11, 0.3),
+    ('HE_200_M', 'HE_200_M', 103, 220e-3, 206e-3, 15e-3, 25e-3, 18e-3, 131.3e-4, 170e-3, 134e-3, 'M 27', 106e-3, 106e-3, 1.203, 11.67, 10640e-8, 967.4e-6, 1135e-6, 9e-2, 41.03e-4, 3651e-8, 354.5e-6, 543.2e-6, 5.27e-2, 86.09e-3, 259.4e-8, 2.1e+11, 0.3),
+    ('HE_220_AAdot', 'HE_220_AAdot', 40.4, 205e-3, 220e-3, 6e-3, 8.5e-3, 18e-3, 51.5e-4, 188e-3, 152e-3, 'M 27', 98e-3, 118e-3, 1.247, 30.87, 4170e-8, 406.9e-6, 445.5e-6, 9e-2, 17.63e-4, 1510e-8, 137.3e-6, 209.3e-6, 5.42e-2, 44.09e-3, 15.93e-8, 2.1e+11, 0.3),
+    ('HE_220_A', 'HE_220_A', 50.5, 210e-3, 220e-3, 7e-3, 11e-3, 18e-3, 64.3e-4, 188e-3, 152e-3, 'M 27', 98e-3, 118e-3, 1.255, 24.85, 5410e-8, 515.2e-6, 568.5e-6, 9.17e-2, 20.67e-4, 1955e-8, 177.7e-6, 270.6e-6, 5.51e-2, 50.09e-3, 28.46e-8, 2.1e+11, 0.3),
+    ('HE_220_B', 'HE_220_B', 71.5, 220e-3, 220e-3, 9.5e-3, 16e-3, 18e-3, 91e-4, 188e-3, 152e-3, 'M 27', 100e-3, 118e-3, 1.27, 17.77, 8091e-8, 735.5e-6, 827e-6, 9.43e-2, 27.92e-4, 2843e-8, 258.5e-6, 393.9e-6, 5.59e-2, 62.59e-3, 76.57e-8, 2.1e+11, 0.3),
+    ('HE_220_M', 'HE_220_M', 117, 240e-3, 226e-3, 15.5e-3, 26e-3, 18e-3, 149.4e-4, 188e-3, 152e-3, 'M 27', 108e-3, 124e-3, 1.322, 11.27, 14600e-8, 1217e-6, 1419e-6, 9.89e-2, 45.31e-4, 5012e-8, 443.5e-6, 678.6e-6, 5.79e-2, 88.59e-3, 315.3e-8, 2.1e+11, 0.3),
+    ('HE_240_AAdot', 'HE_240_AAdot', 47.4, 224e-3, 240e-3, 6.5e-3, 9e-3, 21e-3, 60.4e-4, 206e-3, 164e-3, 'M 27', 104e-3, 138e-3, 1.359, 28.67, 5835e-8, 521e-6, 570.6e-6, 9.83e-2, 21.54e-4, 2077e-8, 173.1e-6, 264.4e-6, 5.87e-2, 49.1e-3, 22.98e-8, 2.1e+11, 0.3),
+    ('HE_240_A', 'HE_240_A', 60.3, 230e-3, 240e-3, 7.5e-3, 12e-3, 21e-3, 76.8e-4, 206e-3, 164e-3, 'M 27', 104e-3, 138e-3, 1.369, 22.7, 7763e-8, 675.1e-6, 744.6e-6, 10.05e-2, 25.18e-4, 2769e-8, 230.7e-6, 351.7e-6, 6e-2, 56.1e-3, 41.55e-8, 2.1e+11, 0.3),
+    ('HE_240_B', 'HE_240_B', 83.2, 240e-3, 240e-3, 10e-3, 17e-3, 21e-3, 106e-4, 206e-3, 164e-3, 'M 27', 108e-3, 138e-3, 1.384, 16.63, 11260e-8, 938.3e-6, 1053e-6, 10.31e-2, 33.23e-4, 3923e-8, 326.9e-6, 498.4e-6, 6.08e-2, 68.6e-3, 102.7e-8, 2.1e+11, 0.3),
+    ('HE_240_M', 'HE_240_M', 157, 270e-3, 248e-3, 18e-3, 32e-3, 21e-3, 199.6e-4, 206e-3, 164e-3, 'M 27', 116e-3, 146e-3, 1.46, 9.318, 24290e-8, 1799e-6, 2117e-6, 11.03e-2, 60.07e-4, 8153e-8, 657.5e-6, 1006e-6, 6.39e-2, 106.6e-3, 627.9e-8, 2.1e+11, 0.3),
+    ('HE_260_AAdot', 'HE_260_AAdot', 54.1, 244e-3, 260e-3, 6.5e-3, 9.5e-3, 24e-3, 69e-4, 225e-3, 177e-3, 'M 27', 110e-3, 158e-3, 1.474, 27.22, 7981e-8, 654.1e-6, 714.5e-6, 10.76e-2, 24.75e-4, 2788e-8, 214.5e-6, 327.7e-6, 6.36e-2, 53.62e-3, 30.31e-8, 2.1e+11, 0.3),
+    ('HE_260_A', 'HE_260_A', 68.2, 250e-3, 260e-3, 7.5e-3, 12.5e-3, 24e-3, 86.8e-4, 225e-3, 177e-3, 'M 27', 110e-3, 158e-3, 1.484, 21.77, 10450e-8, 836.4e-6, 919.8e-6, 10.97e-2, 28.76e-4, 3668e-8, 282.1e-6, 430.2e-6, 6.5e-2, 60.62e-3, 52.37e-8, 2.1e+11, 0.3),
+    ('HE_260_B', 'HE_260_B', 93, 260e-3, 260e-3, 10e-3, 17.5e-3, 24e-3, 118.4e-4, 225e-3, 177e-3, 'M 27', 114e-3, 158e-3, 1.499, 16.12, 14920e-8, 1148e-6, 1283e-6, 11.22e-2, 37.59e-4, 5135e-8, 395e-6, 602.2e-6, 6.58e-2, 73.12e-3, 123.8e-8, 2.1e+11, 0.3),
+    ('HE_260_M', 'HE_260_M', 172, 290e-3, 268e-3, 18e-3, 32.5e-3, 24e-3, 219.6e-4, 225e-3, 177e-3, 'M 27', 122e-3, 166e-3, 1.575, 9.133, 31310e-8, 2159e-6, 2524e-6, 11.94e-2, 66.89e-4, 10450e-8, 779.7e-6, 1192e-6, 6.9e-2, 111.1e-3, 719e-8, 2.1e+11, 0.3),
+    ('HE_280_AAdot', 'HE_280_AAdot', 61.2, 264e-3, 280e-3, 7e-3, 10e-3, 24e-3, 78e-4, 244e-3, 196e-3, 'M 27', 110e-3, 178e-3, 1.593, 26.01, 10560e-8, 799.8e-6, 873.1e-6, 11.63e-2, 27.52e-4, 3664e-8, 261.7e-6, 399.4e-6, 6.85e-2, 55.12e-3, 36.22e-8, 2.1e+11, 0.3),
+    ('HE_280_A', 'HE_280_A', 76.4, 270e-3, 280e-3, 8e-3, 13e-3, 24e-3, 97.3e-4, 244e-3, 196e-3, 'M 27', 112e-3, 178e-3, 1.603, 20.99, 13670e-8, 1013e-6, 1112e-6, 11.86e-2, 31.74e-4, 4763e-8, 340.2e-6, 518.1e-6, 7e-2, 62.12e-3, 62.1e-8, 2.1e+11, 0.3),
+    ('HE_280_B', 'HE_280_B', 103, 280e-3, 280e-3, 10.5e-3, 18e-3, 24e-3, 131.4e-4, 244e-3, 196e-3, 'M 27', 114e-3, 178e-3, 1.618, 15.69, 19270e-8, 1376e-6, 1534e-6, 12.11e-2, 41.09e-4, 6595e-8, 471e-6, 717.6e-6, 7.09e-2, 74.62e-3, 143.7e-8, 2.1e+11, 0.3),
+    ('HE_280_M', 'HE_280_M', 189, 310e-3, 288e-3, 18.5e-3, 33e-3, 24e-3, 240.2e-4, 244e-3, 196e-3, 'M 27', 122e-3, 186e-3, 1.694, 8.984, 39550e-8, 2551e-6, 2966e-6, 12.83e-2, 72.03e-4, 13160e-8, 914.1e-6, 1397e-6, 7.4e-2, 112.6e-3, 807.3e-8, 2.1e+11, 0.3),
+    ('HE_300_AAdot', 'HE_300_AAdot', 69.8, 283e-3, 300e-3, 7.5e-3, 10.5e-3, 27e-3, 88.9e-4, 262e-3, 208e-3, 'M 27', 116e-3, 198e-3, 1.705, 24.42, 13800e-8, 975.6e-6, 1065e-6, 12.46e-2, 32.37e-4, 4734e-8, 315.6e-6, 482.3e-6, 7.3e-2, 60.13e-3, 49.35e-8, 2.1e+11, 0.3),
+    ('HE_300_A', 'HE_300_A', 88.3, 290e-3, 300e-3, 8.5e-3, 14e-3, 27e-3, 112.5e-4, 262e-3, 208e-3, 'M 27', 118e-3, 198e-3, 1.717, 19.43, 18260e-8, 1260e-6, 1383e-6, 12.74e-2, 37.28e-4, 6310e-8, 420.6e-6, 641.2e-6, 7.49e-2, 68.13e-3, 85.17e-8, 2.1e+11, 0.3),
+    ('HE_300_B', 'HE_300_B', 117, 300e-3, 300e-3, 11e-3, 19e-3, 27e-3, 149.1e-4, 262e-3, 208e-3, 'M 27', 120e-3, 198e-3, 1.732, 14.8, 25170e-8, 1678e-6, 1869e-6, 12.99e-2, 47.43e-4, 8563e-8, 570.9e-6, 870.1e-6, 7.58e-2, 80.63e-3, 185e-8, 2.1e+11, 0.3),
+    ('HE_300_M', 'HE_300_M', 238, 340e-3, 310e-3, 21e-3, 39e-3, 27e-3, 303.1e-4, 262e-3, 208e-3, 'M 27', 132e-3, 208e-3, 1.832, 7.699, 59200e-8, 3482e-6, 4078e-6, 13.98e-2, 90.53e-4, 19400e-8, 1252e-6, 1913e-6, 8e-2, 130.6e-3, 1408e-8, 2.1e+11, 0.3),
+    ('HE_320_AAdot', 'HE_320_AAdot', 74.2, 301e-3, 300e-3, 8e-3, 11e-3, 27e-3, 94.6e-4, 279e-3, 225e-3, 'M 27', 118e-3, 198e-3, 1.74, 23.43, 16450e-8, 1093e-6, 1196e-6, 13.19e-2, 35.4e-4, 4959e-8, 330.6e-6, 505.7e-6, 7.24e-2, 61.63e-3, 55.87e-8, 2.1e+11, 0.3),
+    ('HE_320_A', 'HE_320_A', 97.6, 310e-3, 300e-3, 9e-3, 15.5e-3, 27e-3, 124.4e-4, 279e-3, 225e-3, 'M 27', 118e-3, 198e-3, 1.756, 17.98, 22930e-8, 1479e-6, 1628e-6, 13.58e-2, 41.13e-4, 6985e-8, 465.7e-6, 709.7e-6, 7.49e-2, 71.63e-3, 108e-8, 2.1e+11, 0.3),
+    ('HE_320_B', 'HE_320_B', 127, 320e-3, 300e-3, 11.5e-3, 20.5e-3, 27e-3, 161.3e-4, 279e-3, 225e-3, 'M 27', 122e-3, 198e-3, 1.771, 13.98, 30820e-8, 1926e-6, 2149e-6, 13.82e-2, 51.77e-4, 9239e-8, 615.9e-6, 939.1e-6, 7.57e-2, 84.13e-3, 225.1e-8, 2.1e+11, 0.3),
+    ('HE_320_M', 'HE_320_M', 245, 359e-3, 309e-3, 21e-3, 40e-3, 27e-3, 312e-4, 279e-3, 225e-3, 'M 27', 132e-3, 204e-3, 1.866, 7.616, 68130e-8, 3796e-6, 4435e-6, 14.78e-2, 94.85e-4, 19710e-8, 1276e-6, 1951e-6, 7.95e-2, 132.6e-3, 1501e-8, 2.1e+11, 0.3),
+    ('HE_340_AAdot', 'HE_340_AAdot', 78.9, 320e-3, 300e-3, 8.5e-3, 11.5e-3, 27e-3, 100.5e-4, 297e-3, 243e-3, 'M 27', 118e-3, 198e-3, 1.777, 22.52, 19550e-8, 1222e-6, 1341e-6, 13.95e-2, 38.69e-4, 5185e-8, 345.6e-6, 529.3e-6, 7.18e-2, 63.13e-3, 63.07e-8, 2.1e+11, 0.3),
+    ('HE_340_A', 'HE_340_A', 105, 330e-3, 300e-3, 9.5e-3, 16.5e-3, 27e-3, 133.5e-4, 297e-3, 243e-3, 'M 27', 118e-3, 198e-3, 1.795, 17.13, 27690e-8, 1678e-6, 1850e-6, 14.4e-2, 44.95e-4, 7436e-8, 495.7e-6, 755.9e-6, 7.46e-2, 74.13e-3, 127.2e-8, 2.1e+11, 0.3),
+    ('HE_340_B', 'HE_340_B', 134, 340e-3, 300e-3, 12e-3, 21.5e-3, 27e-3, 170.9e-4, 297e-3, 243e-3, 'M 27', 122e-3, 198e-3, 1.81, 13.49, 36660e-8, 2156e-6, 2408e-6, 14.65e-2, 56.09e-4, 9690e-8, 646e-6, 985.7e-6, 7.53e-2, 86.63e-3, 257.2e-8, 2.1e+11, 0.3),
+    ('HE_340_M', 'HE_340_M', 248, 377e-3, 309e-3, 21e-3, 40e-3, 27e-3, 315.8e-4, 297e-3, 243e-3, 'M 27', 132e-3, 204e-3, 1.902, 7.67, 76370e-8, 4052e-6, 4718e-6, 15.55e-2, 98.63e-4, 19710e-8, 1276e-6, 1953e-6, 7.9e-2, 132.6e-3, 1506e-8, 2.1e+11, 0.3),
+    ('HE_360_AAdot', 'HE_360_AAdot', 83.7, 339e-3, 300e-3, 9e-3, 12e-3, 27e-3, 106.6e-4, 315e-3, 261e-3, 'M 27', 118e-3, 198e-3, 1.814, 21.67, 23040e-8, 1359e-6, 1495e-6, 14.7e-2, 42.17e-4, 5410e-8, 360.7e-6, 553e-6, 7.12e-2, 64.63e-3, 70.99e-8, 2.1e+11, 0.3),
+    ('HE_360_A', 'HE_360_A', 112, 350e-3, 300e-3, 10e-3, 17.5e-3, 27e-3, 142.8e-4, 315e-3, 261e-3, 'M 27', 120e-3, 198e-3, 1.834, 16.36, 33090e-8, 1891e-6, 2088e-6, 15.22e-2, 48.96e-4, 7887e-8, 525.8e-6, 802.3e-6, 7.43e-2, 76.63e-3, 148.8e-8, 2.1e+11, 0.3),
+    ('HE_360_B', 'HE_360_B', 142, 360e-3, 300e-3, 12.5e-3, 22.5e-3, 27e-3, 180.6e-4, 315e-3, 261e-3, 'M 27', 122e-3, 198e-3, 1.849, 13.04, 43190e-8, 2400e-6, 2683e-6, 15.46e-2, 60.6e-4, 10140e-8, 676.1e-6, 1032e-6, 7.49e-2, 89.13e-3, 292.5e-8, 2.1e+11, 0.3),
+    ('HE_360_M', 'HE_360_M', 250, 395e-3, 308e-3, 21e-3, 40e-3, 27e-3, 318.8e-4, 315e-3, 261e-3, 'M 27', 132e-3, 204e-3, 1.934, 7.73, 84870e-8, 4297e-6, 4989e-6, 16.32e-2, 102.4e-4, 19520e-8, 1268e-6, 1942e-6, 7.83e-2, 132.6e-3, 1507e-8, 2.1e+11, 0.3),
+    ('HE_400_AAdot', 'HE_400_AAdot', 92.4, 378e-3, 300e-3, 9.5e-3, 13e-3, 27e-3, 117.7e-4, 352e-3, 298e-3, 'M 27', 118e-3, 198e-3, 1.891, 20.46, 31250e-8, 1654e-6, 1824e-6, 16.3e-2, 47.95e-4, 5861e-8, 390.8e-6, 599.7e-6, 7.06e-2, 67.13e-3, 84.69e-8, 2.1e+11, 0.3),
+    ('HE_400_A', 'HE_400_A', 125, 390e-3, 300e-3, 11e-3, 19e-3, 27e-3, 159e-4, 352e-3, 298e-3, 'M 27', 120e-3, 198e-3, 1.912, 15.32, 45070e-8, 2311e-6, 2562e-6, 16.84e-2, 57.33e-4, 8564e-8, 570.9e-6, 872.9e-6, 7.34e-2, 80.63e-3, 189e-8, 2.1e+11, 0.3),
+    ('HE_400_B', 'HE_400_B', 155, 400e-3, 300e-3, 13.5e-3, 24e-3, 27e-3, 197.8e-4, 352e-3, 298e-3, 'M 27', 124e-3, 198e-3, 1.927, 12.41, 57680e-8, 2884e-6, 3232e-6, 17.08e-2, 69.98e-4, 10820e-8, 721.3e-6, 1104e-6, 7.4e-2, 93.13e-3, 355.7e-8, 2.1e+11, 0.3),
+    ('HE_400_M', 'HE_400_M', 256, 432e-3, 307e-3, 21e-3, 40e-3, 27e-3, 325.8e-4, 352e-3, 298e-3, 'M 27', 132e-3, 202e-3, 2.004, 7.835, 104100e-8, 4820e-6, 5571e-6, 17.88e-2, 110.2e-4, 19340e-8, 1260e-6, 1934e-6, 7.7e-2, 132.6e-3, 1515e-8, 2.1e+11, 0.3),
+    ('HE_450_AAdot', 'HE_450_AAdot', 99.7, 425e-3, 300e-3, 10e-3, 13.5e-3, 27e-3, 127.1e-4, 398e-3, 344e-3, 'M 27', 120e-3, 198e-3, 1.984, 19.89, 41890e-8, 1971e-6, 2183e-6, 18.16e-2, 54.7e-4, 6088e-8, 405.8e-6, 624.4e-6, 6.92e-2, 68.63e-3, 95.61e-8, 2.1e+11, 0.3),
+    ('HE_450_A', 'HE_450_A', 140, 440e-3, 300e-3, 11.5e-3, 21e-3, 27e-3, 178e-4, 398e-3, 344e-3, 'M 27', 122e-3, 198e-3, 2.011, 14.39, 63720e-8, 2896e-6, 3216e-6, 18.92e-2, 65.78e-4, 9465e-8, 631e-6, 965.5e-6, 7.29e-2, 85.13e-3, 243.8e-8, 2.1e+11, 0.3),
+    ('HE_450_B', 'HE_450_B', 171, 450e-3, 300e-3, 14e-3, 26e-3, 27e-3, 218e-4, 398e-3, 344e-3, 'M 27', 124e-3, 198e-3, 2.026, 11.84, 79890e-8, 3551e-6, 3982e-6, 19.14e-2, 79.66e-4, 11720e-8, 781.4e-6, 1198e-6, 7.33e-2, 97.63e-3, 440.5e-8, 2.1e+11, 0.3),
+    ('HE_450_M', 'HE_450_M', 263, 478e-3, 307e-3, 21e-3, 40e-3, 27e-3, 335.4e-4, 398e-3, 344e-3, 'M 27', 132e-3, 202e-3, 2.096, 7.959, 131500e-8, 5501e-6, 6331e-6, 19.8e-2, 119.8e-4, 19340e-8, 1260e-6, 1939e-6, 7.59e-2, 132.6e-3, 1529e-8, 2.1e+11, 0.3),
+    ('HE_500_AAdot', 'HE_500_AAdot', 107, 472e-3, 300e-3, 10.5e-3, 14e-3, 27e-3, 136.9e-4, 444e-3, 390e-3, 'M 27', 120e-3, 198e-3, 2.077, 19.33, 54640e-8, 2315e-6, 2576e-6, 19.98e-2, 61.91e-4, 6314e-8, 420.9e-6, 649.3e-6, 6.79e-2, 70.13e-3, 107.7e-8, 2.1e+11, 0.3),
+    ('HE_500_A', 'HE_500_A', 155, 490e-3, 300e-3, 12e-3, 23e-3, 27e-3, 197.5e-4, 444e-3, 390e-3, 'M 27', 122e-3, 198e-3, 2.11, 13.6, 86970e-8, 3550e-6, 3949e-6, 20.98e-2, 74.72e-4, 10370e-8, 691.1e-6, 1059e-6, 7.24e-2, 89.63e-3, 309.3e-8, 2.1e+11, 0.3),
+    ('HE_500_B', 'HE_500_B', 187, 500e-3, 300e-3, 14.5e-3, 28e-3, 27e-3, 238.6e-4, 444e-3, 390e-3, 'M 27', 124e-3, 198e-3, 2.125, 11.34, 107200e-8, 4287e-6, 4815e-6, 21.19e-2, 89.82e-4, 12620e-8, 841.6e-6, 1292e-6, 7.27e-2, 102.1e-3, 538.4e-8, 2.1e+11, 0.3),
+    ('HE_500_M', 'HE_500_M', 270, 524e-3, 306e-3, 21e-3, 40e-3, 27e-3, 344.3e-4, 444e-3, 390e-3, 'M 27', 132e-3, 202e-3, 2.184, 8.079, 161900e-8, 6180e-6, 7094e-6, 21.69e-2, 129.5e-4, 19150e-8, 1252e-6, 1932e-6, 7.46e-2, 132.6e-3, 1539e-8, 2.1e+11, 0.3),
+    ('HE_550_AAdot', 'HE_550_AAdot', 120, 522e-3, 300e-3, 11.5e-3, 15e-3, 27e-3, 152.8e-4, 492e-3, 438e-3, 'M 27', 122e-3, 198e-3, 2.175, 18.13, 72870e-8, 2792e-6, 3128e-6, 21.84e-2, 72.66e-4, 6767e-8, 451.1e-6, 698.6e-6, 6.65e-2, 73.13e-3, 133.7e-8, 2.1e+11, 0.3),
+    ('HE_550_A', 'HE_550_A', 166, 540e-3, 300e-3, 12.5e-3, 24e-3, 27e-3, 211.8e-4, 492e-3, 438e-3, 'M 27', 122e-3, 198e-3, 2.209, 13.29, 111900e-8, 4146e-6, 4622e-6, 22.99e-2, 83.72e-4, 10820e-8, 721.3e-6, 1107e-6, 7.15e-2, 92.13e-3, 351.5e-8, 2.1e+11, 0.3),
+    ('HE_550_B', 'HE_550_B', 199, 550e-3, 300e-3, 15e-3, 29e-3, 27e-3, 254.1e-4, 492e-3, 438e-3, 'M 27', 124e-3, 198e-3, 2.224, 11.15, 136700e-8, 4971e-6, 5591e-6, 23.2e-2, 100.1e-4, 13080e-8, 871.8e-6, 1341e-6, 7.17e-2, 104.6e-3, 600.3e-8, 2.1e+11, 0.3),
+    ('HE_550_M', 'HE_550_M', 278, 572e-3, 306e-3, 21e-3, 40e-3, 27e-3, 354.4e-4, 492e-3, 438e-3, 'M 27', 132e-3, 202e-3, 2.28, 8.195, 198000e-8, 6923e-6, 7933e-6, 23.64e-2, 139.6e-4, 19160e-8, 1252e-6, 1937e-6, 7.35e-2, 132.6e-3, 1554e-8, 2.1e+11, 0.3),
+    ('HE_600_AAdot', 'HE_600_AAdot', 129, 571e-3, 300e-3, 12e-3, 15.5e-3, 27e-3, 164.1e-4, 540e-3, 486e-3, 'M 27', 122e-3, 198e-3, 2.272, 17.64, 91900e-8, 3218e-6, 3623e-6, 23.66e-2, 81.29e-4, 6993e-8, 466.2e-6, 724.5e-6, 6.53e-2, 74.63e-3, 149.8e-8, 2.1e+11, 0.3),
+    ('HE_600_A', 'HE_600_A', 178, 590e-3, 300e-3, 13e-3, 25e-3, 27e-3, 226.5e-4, 540e-3, 486e-3, 'M 27', 122e-3, 198e-3, 2.308, 12.98, 141200e-8, 4787e-6, 5350e-6, 24.97e-2, 93.21e-4, 11270e-8, 751.4e-6, 1156e-6, 7.05e-2, 94.63e-3, 397.8e-8, 2.1e+11, 0.3),
+    ('HE_600_B', 'HE_600_B', 212, 600e-3, 300e-3, 15.5e-3, 30e-3, 27e-3, 270e-4, 540e-3, 486e-3, 'M 27', 126e-3, 198e-3, 2.323, 10.96, 171000e-8, 5701e-6, 6425e-6, 25.17e-2, 110.8e-4, 13530e-8, 902e-6, 1391e-6, 7.08e-2, 107.1e-3, 667.2e-8, 2.1e+11, 0.3),
+    ('HE_600_M', 'HE_600_M', 285, 620e-3, 305e-3, 21e-3, 40e-3, 27e-3, 363.7e-4, 540e-3, 486e-3, 'M 27', 132e-3, 200e-3, 2.372, 8.308, 237400e-8, 7660e-6, 8772e-6, 25.55e-2, 149.7e-4, 18980e-8, 1244e-6, 1930e-6, 7.22e-2, 132.6e-3, 1564e-8, 2.1e+11, 0.3),
+    ('HE_600_x_337dot', 'HE_600_x_337dot', 337, 632e-3, 310e-3, 25.5e-3, 46e-3, 27e-3, 429.2e-4, 540e-3, 486e-3, 'M 27', 138e-3, 202e-3, 2.407, 7.144, 283200e-8, 8961e-6, 10380e-6, 25.69e-2, 180.5e-4, 22940e-8, 1480e-6, 2310e-6, 7.31e-2, 149.1e-3, 2451e-8, 2.1e+11, 0.3),
+    ('HE_600_x_399dot', 'HE_600_x_399dot', 399, 648e-3, 315e-3, 30e-3, 54e-3, 27e-3, 508.5e-4, 540e-3, 486e-3, 'M 27', 142e-3, 208e-3, 2.45, 6.137, 344600e-8, 10640e-6, 12460e-6, 26.03e-2, 213.6e-4, 28280e-8, 1796e-6, 2814e-6, 7.46e-2, 169.6e-3, 3966e-8, 2.1e+11, 0.3),
+    ('HE_650_AAdot', 'HE_650_AAdot', 138, 620e-3, 300e-3, 12.5e-3, 16e-3, 27e-3, 175.8e-4, 588e-3, 534e-3, 'M 27', 122e-3, 198e-3, 2.369, 17.17, 113900e-8, 3676e-6, 4160e-6, 25.46e-2, 90.4e-4, 7221e-8, 481.4e-6, 750.7e-6, 6.41e-2, 76.13e-3, 167.5e-8, 2.1e+11, 0.3),
+    ('HE_650_A', 'HE_650_A', 190, 640e-3, 300e-3, 13.5e-3, 26e-3, 27e-3, 241.6e-4, 588e-3, 534e-3, 'M 27', 124e-3, 198e-3, 2.407, 12.69, 175200e-8, 5474e-6, 6136e-6, 26.93e-2, 103.2e-4, 11720e-8, 781.6e-6, 1205e-6, 6.97e-2, 97.13e-3, 448.3e-8, 2.1e+11, 0.3),
+    ('HE_650_B', 'HE_650_B', 225, 650e-3, 300e-3, 16e-3, 31e-3, 27e-3, 286.3e-4, 588e-3, 534e-3, 'M 27', 126e-3, 198e-3, 2.422, 10.77, 210600e-8, 6480e-6, 7320e-6, 27.12e-2, 122e-4, 13980e-8, 932.3e-6, 1441e-6, 6.99e-2, 109.6e-3, 739.2e-8, 2.1e+11, 0.3),
+    ('HE_650_M', 'HE_650_M', 293, 668e-3, 305e-3, 21e-3, 40e-3, 27e-3, 373.7e-4, 588e-3, 534e-3, 'M 27', 132e-3, 200e-3, 2.468, 8.411, 281700e-8, 8433e-6, 9657e-6, 27.45e-2, 159.7e-4, 18980e-8, 1245e-6, 1936e-6, 7.13e-2, 132.6e-3, 1579e-8, 2.1e+11, 0.3),
+    ('HE_650_x_343dot', 'HE_650_x_343dot', 343, 680e-3, 309e-3, 25e-3, 46e-3, 27e-3, 437.5e-4, 588e-3, 534e-3, 'M 27', 138e-3, 202e-3, 2.5, 7.278, 333700e-8, 9815e-6, 11350e-6, 27.62e-2, 189.6e-4, 22720e-8, 1470e-6, 2300e-6, 7.21e-2, 148.6e-3, 2442e-8, 2.1e+11, 0.3),
+    ('HE_650_x_407dot', 'HE_650_x_407dot', 407, 696e-3, 314e-3, 29.5e-3, 54e-3, 27e-3, 518.8e-4, 588e-3, 534e-3, 'M 27', 142e-3, 206e-3, 2.543, 6.243, 405400e-8, 11650e-6, 13620e-6, 27.95e-2, 224.8e-4, 28020e-8, 1785e-6, 2803e-6, 7.35e-2, 169.1e-3, 3958e-8, 2.1e+11, 0.3),
+    ('HE_700_AAdot', 'HE_700_AAdot', 150, 670e-3, 300e-3, 13e-3, 17e-3, 27e-3, 190.9e-4, 636e-3, 582e-3, 'M 27', 122e-3, 198e-3, 2.468, 16.46, 142700e-8, 4260e-6, 4840e-6, 27.34e-2, 100.3e-4, 7673e-8, 511.5e-6, 799.7e-6, 6.34e-2, 78.63e-3, 195.2e-8, 2.1e+11, 0.3),
+    ('HE_700_A', 'HE_700_A', 204, 690e-3, 300e-3, 14.5e-3, 27e-3, 27e-3, 260.5e-4, 636e-3, 582e-3, 'M 27', 124e-3, 198e-3, 2.505, 12.25, 215300e-8, 6241e-6, 7032e-6, 28.75e-2, 117e-4, 12180e-8, 811.9e-6, 1257e-6, 6.84e-2, 100.1e-3, 513.9e-8, 2.1e+11, 0.3),
+    ('HE_700_B', 'HE_700_B', 241, 700e-3, 300e-3, 17e-3, 32e-3, 27e-3, 306.4e-4, 636e-3, 582e-3, 'M 27', 126e-3, 198e-3, 2.52, 10.48, 256900e-8, 7340e-6, 8327e-6, 28.96e-2, 137.1e-4, 14440e-8, 962.7e-6, 1495e-6, 6.87e-2, 112.6e-3, 830.9e-8, 2.1e+11, 0.3),
+    ('HE_700_M', 'HE_700_M', 301, 716e-3, 304e-3, 21e-3, 40e-3, 27e-3, 383e-4, 636e-3, 582e-3, 'M 27', 132e-3, 200e-3, 2.56, 8.513, 329300e-8, 9198e-6, 10540e-6, 29.32e-2, 169.8e-4, 18800e-8, 1237e-6, 1929e-6, 7.01e-2, 132.6e-3, 1589e-8, 2.1e+11, 0.3),
+    ('HE_700_x_352dot', 'HE_700_x_352dot', 352, 728e-3, 308e-3, 25e-3, 46e-3, 27e-3, 448.6e-4, 636e-3, 582e-3, 'M 27', 138e-3, 200e-3, 2.592, 7.359, 389700e-8, 10710e-6, 12390e-6, 29.47e-2, 201.6e-4, 22510e-8, 1461e-6, 2293e-6, 7.08e-2, 148.6e-3, 2461e-8, 2.1e+11, 0.3),
+    ('HE_700_x_418dot', 'HE_700_x_418dot', 418, 744e-3, 313e-3, 29.5e-3, 54e-3, 27e-3, 531.9e-4, 636e-3, 582e-3, 'M 27', 142e-3, 206e-3, 2.635, 6.31, 472500e-8, 12700e-6, 14840e-6, 29.8e-2, 239e-4, 27760e-8, 1774e-6, 2797e-6, 7.22e-2, 169.1e-3, 3989e-8, 2.1e+11, 0.3),
+    ('HE_800_AAdot', 'HE_800_AAdot', 172, 770e-3, 300e-3, 14e-3, 18e-3, 30e-3, 218.5e-4, 734e-3, 674e-3, 'M 27', 130e-3, 198e-3, 2.66, 15.51, 208900e-8, 5426e-6, 6225e-6, 30.92e-2, 123.8e-4, 8134e-8, 542.2e-6, 856.6e-6, 6.1e-2, 85.15e-3, 256.8e-8, 2.1e+11, 0.3),
+    ('HE_800_A', 'HE_800_A', 224, 790e-3, 300e-3, 15e-3, 28e-3, 30e-3, 285.8e-4, 734e-3, 674e-3, 'M 27', 130e-3, 198e-3, 2.698, 12.03, 303400e-8, 7682e-6, 8699e-6, 32.58e-2, 138.8e-4, 12640e-8, 842.6e-6, 1312e-6, 6.65e-2, 106.1e-3, 596.9e-8, 2.1e+11, 0.3),
+    ('HE_800_B', 'HE_800_B', 262, 800e-3, 300e-3, 17.5e-3, 33e-3, 30e-3, 334.2e-4, 734e-3, 674e-3, 'M 27', 134e-3, 198e-3, 2.713, 10.34, 359100e-8, 8977e-6, 10230e-6, 32.78e-2, 161.8e-4, 14900e-8, 993.6e-6, 1553e-6, 6.68e-2, 118.6e-3, 946e-8, 2.1e+11, 0.3),
+    ('HE_800_M', 'HE_800_M', 317, 814e-3, 303e-3, 21e-3, 40e-3, 30e-3, 404.3e-4, 734e-3, 674e-3, 'M 27', 138e-3, 198e-3, 2.746, 8.655, 442600e-8, 10870e-6, 12490e-6, 33.09e-2, 194.3e-4, 18630e-8, 1230e-6, 1930e-6, 6.79e-2, 136.1e-3, 1646e-8, 2.1e+11, 0.3),
+    ('HE_800_x_373dot', 'HE_800_x_373dot', 373, 826e-3, 308e-3, 25e-3, 46e-3, 30e-3, 474.6e-4, 734e-3, 674e-3, 'M 27', 144e-3, 200e-3, 2.782, 7.469, 523900e-8, 12690e-6, 14700e-6, 33.23e-2, 230.3e-4, 22530e-8, 1463e-6, 2311e-6, 6.89e-2, 152.1e-3, 2554e-8, 2.1e+11, 0.3),
+    ('HE_800_x_444dot', 'HE_800_x_444dot', 444, 842e-3, 313e-3, 30e-3, 54e-3, 30e-3, 566e-4, 734e-3, 674e-3, 'M 27', 148e-3, 206e-3, 2.824, 6.357, 634500e-8, 15070e-6, 17640e-6, 33.48e-2, 276.5e-4, 27800e-8, 1776e-6, 2827e-6, 7.01e-2, 173.1e-3, 4180e-8, 2.1e+11, 0.3),
+    ('HE_900_AAdot', 'HE_900_AAdot', 198, 870e-3, 300e-3, 15e-3, 20e-3, 30e-3, 252.2e-4, 830e-3, 770e-3, 'M 27', 130e-3, 198e-3, 2.858, 14.44, 301100e-8, 6923e-6, 7999e-6, 34.55e-2, 147.2e-4, 9041e-8, 602.8e-6, 957.7e-6, 5.99e-2, 90.15e-3, 334.9e-8, 2.1e+11, 0.3),
+    ('HE_900_A', 'HE_900_A', 252, 890e-3, 300e-3, 16e-3, 30e-3, 30e-3, 320.5e-4, 830e-3, 770e-3, 'M 27', 132e-3, 198e-3, 2.896, 11.51, 422100e-8, 9485e-6, 10810e-6, 36.29e-2, 163.3e-4, 13550e-8, 903.2e-6, 1414e-6, 6.5e-2, 111.1e-3, 736.8e-8, 2.1e+11, 0.3),
+    ('HE_900_B', 'HE_900_B', 291, 900e-3, 300e-3, 18.5e-3, 35e-3, 30e-3, 371.3e-4, 830e-3, 770e-3, 'M 27', 134e-3, 198e-3, 2.911, 9.99, 494100e-8, 10980e-6, 12580e-6, 36.48e-2, 188.8e-4, 15820e-8, 1054e-6, 1658e-6, 6.53e-2, 123.6e-3, 1137e-8, 2.1e+11, 0.3),
+    ('HE_900_M', 'HE_900_M', 333, 910e-3, 302e-3, 21e-3, 40e-3, 30e-3, 423.6e-4, 830e-3, 770e-3, 'M 27', 138e-3, 198e-3, 2.934, 8.824, 570400e-8, 12540e-6, 14440e-6, 36.7e-2, 214.4e-4, 18450e-8, 1222e-6, 1929e-6, 6.6e-2, 136.1e-3, 1671e-8, 2.1e+11, 0.3),
+    ('HE_900_x_391dot', 'HE_900_x_391dot', 391, 922e-3, 307e-3, 25e-3, 46e-3, 30e-3, 497.7e-4, 830e-3, 770e-3, 'M 27', 144e-3, 200e-3, 2.97, 7.604, 674300e-8, 14630e-6, 16990e-6, 36.81e-2, 254.3e-4, 22320e-8, 1454e-6, 2312e-6, 6.7e-2, 152.1e-3, 2597e-8, 2.1e+11, 0.3),
+    ('HE_900_x_466dot', 'HE_900_x_466dot', 466, 938e-3, 312e-3, 30e-3, 54e-3, 30e-3, 593.7e-4, 830e-3, 770e-3, 'M 27', 148e-3, 204e-3, 3.012, 6.464, 814900e-8, 17380e-6, 20380e-6, 37.05e-2, 305.3e-4, 27560e-8, 1767e-6, 2832e-6, 6.81e-2, 173.1e-3, 4256e-8, 2.1e+11, 0.3),
+    ('HE_1000_AAdot', 'HE_1000_AAdot', 222, 970e-3, 300e-3, 16e-3, 21e-3, 30e-3, 282.2e-4, 928e-3, 868e-3, 'M 27', 132e-3, 198e-3, 3.056, 13.8, 406500e-8, 8380e-6, 9777e-6, 37.95e-2, 172.2e-4, 9501e-8, 633.4e-6, 1016e-6, 5.8e-2, 93.15e-3, 403.4e-8, 2.1e+11, 0.3),
+    ('HE_1000_x_249dot', 'HE_1000_x_249dot', 249, 980e-3, 300e-3, 16.5e-3, 26e-3, 30e-3, 316.8e-4, 928e-3, 868e-3, 'M 27', 134e-3, 194e-3, 3.08, 12.37, 481100e-8, 9818e-6, 11350e-6, 38.97e-2, 180.7e-4, 11750e-8, 784e-6, 1245e-6, 6.09e-2, 103.6e-3, 584.4e-8, 2.1e+11, 0.3),
+    ('HE_1000_A', 'HE_1000_A', 272, 990e-3, 300e-3, 16.5e-3, 31e-3, 30e-3, 346.8e-4, 928e-3, 868e-3, 'M 27', 132e-3, 198e-3, 3.095, 11.37, 553800e-8, 11190e-6, 12820e-6, 39.96e-2, 184.6e-4, 14000e-8, 933.6e-6, 1470e-6, 6.35e-2, 113.6e-3, 822.4e-8, 2.1e+11, 0.3),
+    ('HE_1000_B', 'HE_1000_B', 314, 1000e-3, 300e-3, 19e-3, 36e-3, 30e-3, 400e-4, 928e-3, 868e-3, 'M 27', 134e-3, 198e-3, 3.11, 9.905, 644700e-8, 12890e-6, 14860e-6, 40.15e-2, 212.5e-4, 16280e-8, 1085e-6, 1716e-6, 6.38e-2, 126.1e-3, 1254e-8, 2.1e+11, 0.3),
+    ('HE_1000_M', 'HE_1000_M', 349, 1008e-3, 302e-3, 21e-3, 40e-3, 30e-3, 444.2e-4, 928e-3, 868e-3, 'M 27', 138e-3, 198e-3, 3.13, 8.978, 722300e-8, 14330e-6, 16570e-6, 40.32e-2, 235e-4, 18460e-8, 1222e-6, 1940e-6, 6.45e-2, 136.1e-3, 1701e-8, 2.1e+11, 0.3),
+    ('HE_1000_x_393dot', 'HE_1000_x_393dot', 393, 1016e-3, 303e-3, 24.4e-3, 43.9e-3, 30e-3, 500.2e-4, 928e-3, 868e-3, 'M 27', 142e-3, 198e-3, 3.14, 8.01, 807700e-8, 15900e-6, 18540e-6, 40.18e-2, 271.3e-4, 20500e-8, 1353e-6, 2168e-6, 6.4e-2, 147.3e-3, 2332e-8, 2.1e+11, 0.3),
+    ('HE_1000_x_415dot', 'HE_1000_x_415dot', 415, 1020e-3, 304e-3, 26e-3, 46e-3, 30e-3, 528.7e-4, 928e-3, 868e-3, 'M 27', 144e-3, 198e-3, 3.15, 7.6, 853100e-8, 16728e-6, 19571e-6, 40.17e-2, 288.6e-4, 21710e-8, 1428e-6, 2298e-6, 6.41e-2, 153.1e-3, 2713e-8, 2.1e+11, 0.3),
+    ('HE_1000_x_438dot', 'HE_1000_x_438dot', 437, 1026e-3, 305e-3, 26.9e-3, 49e-3, 30e-3, 557.2e-4, 928e-3, 868e-3, 'M 27', 146e-3, 198e-3, 3.17, 7.24, 909800e-8, 17740e-6, 20770e-6, 40.41e-2, 300.9e-4, 23360e-8, 1532e-6, 2464e-6, 6.47e-2, 160.1e-3, 3200e-8, 2.1e+11, 0.3),
+    ('HE_1000_x_494dot', 'HE_1000_x_494dot', 494, 1036e-3, 309e-3, 31e-3, 54e-3, 30e-3, 629.1e-4, 928e-3, 868e-3, 'M 27', 148e-3, 204e-3, 3.19, 6.47, 1028000e-8, 19845e-6, 23413e-6, 40.42e-2, 344.5e-4, 26820e-8, 1736e-6, 2818e-6, 6.53e-2, 174.1e-3, 4433e-8, 2.1e+11, 0.3),
+    ('HE_1000_x_584dot', 'HE_1000_x_584dot', 584, 1056e-3, 314e-3, 36e-3, 64e-3, 30e-3, 743.7e-4, 928e-3, 868e-3, 'M 27', 154e-3, 208e-3, 3.24, 5.56, 1246100e-8, 23600e-6, 28039e-6, 40.93e-2, 403.2e-4, 33430e-8, 2130e-6, 3475e-6, 6.7e-2, 199.1e-3, 7230e-8, 2.1e+11, 0.3),
+    ('HL_920_x_345w', 'HL_920_x_345w', 345, 927e-3, 418e-3, 19.3e-3, 32e-3, 19e-3, 437.2e-4, 863e-3, 825e-3, 'M27', 126e-3, 312e-3, 3.45, 10.07, 645000e-8, 13920e-6, 15700e-6, 38.41e-2, 188e-4, 39010e-8, 1867e-6, 2880e-6, 9.45e-2, 105.6e-3, 1159e-8, 2.1e+11, 0.3),
+    ('HL_920_x_368w', 'HL_920_x_368w', 368, 931e-3, 419e-3, 20.3e-3, 34.3e-3, 19e-3, 465.6e-4, 862.4e-3, 824.4e-3, 'M27', 128e-3, 314e-3, 3.46, 9.48, 692200e-8, 14870e-6, 16790e-6, 38.56e-2, 198.2e-4, 42120e-8, 2010e-6, 3104e-6, 9.51e-2, 111.2e-3, 1408e-8, 2.1e+11, 0.3),
+    ('HL_920_x_390w', 'HL_920_x_390w', 390, 936e-3, 420e-3, 21.3e-3, 36.6e-3, 19e-3, 494.3e-4, 862.8e-3, 824.8e-3, 'M27', 128e-3, 314e-3, 3.48, 8.96, 741700e-8, 15850e-6, 17920e-6, 38.74e-2, 208.6e-4, 45270e-8, 2156e-6, 3331e-6, 9.57e-2, 116.8e-3, 1691e-8, 2.1e+11, 0.3),
+    ('HL_920_x_420w', 'HL_920_x_420w', 420, 943e-3, 422e-3, 22.5e-3, 39.9e-3, 19e-3, 534.1e-4, 863.2e-3, 825.2e-3, 'M27', 130e-3, 316e-3, 3.5, 8.34, 813300e-8, 17250e-6, 19530e-6, 39.02e-2, 221.5e-4, 50070e-8, 2373e-6, 3667e-6, 9.68e-2, 124.6e-3, 2151e-8, 2.1e+11, 0.3),
+    ('HL_920_x_449w', 'HL_920_x_449w', 449, 948e-3, 423e-3, 24e-3, 42.7e-3, 19e-3, 571.4e-4, 862.6e-3, 824.6e-3, 'M27', 130e-3, 318e-3, 3.51, 7.82, 874700e-8, 18450e-6, 20950e-6, 39.13e-2, 236.6e-4, 53970e-8, 2552e-6, 3949e-6, 9.72e-2, 131.7e-3, 2627e-8, 2.1e+11, 0.3),
+    ('HL_920_x_491w', 'HL_920_x_491w', 491, 957e-3, 422e-3, 25.9e-3, 47e-3, 19e-3, 623.3e-4, 863e-3, 825e-3, 'M27', 132e-3, 316e-3, 3.52, 7.19, 966300e-8, 20200e-6, 23000e-6, 39.37e-2, 256.6e-4, 59000e-8, 2796e-6, 4335e-6, 9.73e-2, 142.2e-3, 3441e-8, 2.1e+11, 0.3),
+    ('HL_920_x_537w', 'HL_920_x_537w', 537, 965e-3, 425e-3, 28.4e-3, 51.1e-3, 19e-3, 682.5e-4, 862.8e-3, 824.8e-3, 'M27', 136e-3, 320e-3, 3.54, 6.61, 1066000e-8, 22080e-6, 25270e-6, 39.51e-2, 282.1e-4, 65550e-8, 3085e-6, 4795e-6, 9.8e-2, 152.9e-3, 4447e-8, 2.1e+11, 0.3),
+    ('HL_920_x_588w', 'HL_920_x_588w', 588, 976e-3, 427e-3, 31e-3, 55.9e-3, 19e-3, 748.4e-4, 864.2e-3, 826.2e-3, 'M27', 138e-3, 322e-3, 3.57, 6.07, 1184000e-8, 24260e-6, 27880e-6, 39.78e-2, 309.6e-4, 72760e-8, 3408e-6, 5310e-6, 9.86e-2, 165.1e-3, 5808e-8, 2.1e+11, 0.3),
+    ('HL_920_x_656w', 'HL_920_x_656w', 656, 987e-3, 431e-3, 34.5e-3, 62e-3, 19e-3, 835.3e-4, 863e-3, 825e-3, 'M27', 144e-3, 320e-3, 3.6, 5.48, 1335000e-8, 27060e-6, 31270e-6, 39.98e-2, 345.8e-4, 83040e-8, 3853e-6, 6022e-6, 9.97e-2, 180.8e-3, 7950e-8, 2.1e+11, 0.3),
+    ('HL_920_x_725w', 'HL_920_x_725w', 725, 999e-3, 434e-3, 38.1e-3, 68.1e-3, 19e-3, 922.9e-4, 862.8e-3, 824.8e-3, 'M27', 148e-3, 323e-3, 3.63, 5, 1492000e-8, 29880e-6, 34740e-6, 40.21e-2, 383.6e-4, 93200e-8, 4295e-6, 6734e-6, 10.05e-2, 196.6e-3, 10570e-8, 2.1e+11, 0.3),
+    ('HL_920_x_787w', 'HL_920_x_787w', 787, 1011e-3, 437e-3, 40.9e-3, 73.9e-3, 19e-3, 1002e-4, 863.2e-3, 825.2e-3, 'M27', 152e-3, 326e-3, 3.66, 4.65, 1646000e-8, 32560e-6, 38010e-6, 40.53e-2, 414.5e-4, 103300e-8, 4728e-6, 7425e-6, 10.15e-2, 211e-3, 13430e-8, 2.1e+11, 0.3),
+    ('HL_920_x_970w', 'HL_920_x_970w', 970, 1043e-3, 446e-3, 50e-3, 89.9e-3, 19e-3, 1236.6e-4, 863.2e-3, 825.2e-3, 'M27', 160e-3, 334e-3, 3.74, 3.85, 2100000e-8, 40270e-6, 47660e-6, 41.21e-2, 513.8e-4, 133900e-8, 6002e-6, 9490e-6, 10.4e-2, 252.1e-3, 24320e-8, 2.1e+11, 0.3),
+    ('HL_1000_AAdot', 'HL_1000_AAdot', 296, 982e-3, 400e-3, 16.5e-3, 27e-3, 30e-3, 376.8e-4, 928e-3, 868e-3, 'M 27', 134e-3, 294e-3, 3.479, 11.76, 618700e-8, 12600e-6, 14220e-6, 40.52e-2, 181.5e-4, 28850e-8, 1443e-6, 2235e-6, 8.75e-2, 105.6e-3, 756.9e-8, 2.1e+11, 0.3),
+    ('HL_1000_Adot', 'HL_1000_Adot', 321, 990e-3, 400e-3, 16.5e-3, 31e-3, 30e-3, 408.8e-4, 928e-3, 868e-3, 'M 27', 134e-3, 294e-3, 3.495, 10.89, 696400e-8, 14070e-6, 15800e-6, 41.27e-2, 184.6e-4, 33120e-8, 1656e-6, 2555e-6, 9e-2, 113.6e-3, 1021e-8, 2.1e+11, 0.3),
+    ('HL_1000_Bdot', 'HL_1000_Bdot', 371, 1000e-3, 400e-3, 19e-3, 36e-3, 30e-3, 472e-4, 928e-3, 868e-3, 'M 27', 136e-3, 294e-3, 3.51, 9.474, 812100e-8, 16240e-6, 18330e-6, 41.48e-2, 212.5e-4, 38480e-8, 1924e-6, 2976e-6, 9.03e-2, 126.1e-3, 1565e-8, 2.1e+11, 0.3),
+    ('HL_1000_Mdot', 'HL_1000_Mdot', 412, 1008e-3, 402e-3, 21e-3, 40e-3, 30e-3, 524.2e-4, 928e-3, 868e-3, 'M 27', 142e-3, 290e-3, 3.53, 8.58, 909800e-8, 18050e-6, 20440e-6, 41.66e-2, 235e-4, 43410e-8, 2160e-6, 3348e-6, 9.1e-2, 136.1e-3, 2128e-8, 2.1e+11, 0.3),
+    ('HL_1000_x_443dot', 'HL_1000_x_443dot', 443, 1012e-3, 402e-3, 23.6e-3, 41.9e-3, 30e-3, 563.7e-4, 928e-3, 868e-3, 'M27', 142e-3, 296e-3, 3.53, 7.99, 966510e-8, 19101e-6, 21777e-6, 41.41e-2, 261.8e-4, 45500e-8, 2264e-6, 3529e-6, 8.98e-2, 142.5e-3, 2545e-8, 2.1e+11, 0.3),
+    ('HL_1000_x_483dot', 'HL_1000_x_483dot', 483, 1020e-3, 404e-3, 25.4e-3, 46e-3, 30e-3, 615.1e-4, 928e-3, 868e-3, 'M 27', 144e-3, 298e-3, 3.55, 7.36, 1067480e-8, 20931e-6, 23923e-6, 41.66e-2, 282.7e-4, 50710e-8, 2510e-6, 3919e-6, 9.08e-2, 152.5e-3, 3311e-8, 2.1e+11, 0.3),
+    ('HL_1000_x_539dot', 'HL_1000_x_539dot', 539, 1030e-3, 407e-3, 28.4e-3, 51.1e-3, 30e-3, 687.2e-4, 928e-3, 868e-3, 'M 27', 146e-3, 302e-3, 3.58, 6.64, 1202540e-8, 23350e-6, 26824e-6, 41.83e-2, 316.4e-4, 57630e-8, 2832e-6, 4436e-6, 9.16e-2, 165.7e-3, 4546e-8, 2.1e+11, 0.3),
+    ('HL_1000_x_554dot', 'HL_1000_x_554dot', 554, 1032e-3, 408e-3, 29.5e-3, 52e-3, 30e-3, 705.8e-4, 928e-3, 868e-3, 'M 27', 150e-3, 296e-3, 3.59, 6.47, 1232000e-8, 23880e-6, 27500e-6, 41.79e-2, 328e-4, 59100e-8, 2897e-6, 4547e-6, 9.15e-2, 168.6e-3, 4860e-8, 2.1e+11, 0.3),
+    ('HL_1000_x_591dot', 'HL_1000_x_591dot', 591, 1040e-3, 409e-3, 31e-3, 55.9e-3, 30e-3, 752.7e-4, 928e-3, 868e-3, 'M 27', 148e-3, 304e-3, 3.6, 6.1, 1331040e-8, 25597e-6, 29530e-6, 42.05e-2, 346.3e-4, 64010e-8, 3130e-6, 4916e-6, 9.22e-2, 177.9e-3, 5927e-8, 2.1e+11, 0.3),
+    ('HL_1000_x_642dot', 'HL_1000_x_642dot', 642, 1048e-3, 412e-3, 34e-3, 60e-3, 30e-3, 817.6e-4, 928e-3, 868e-3, 'M 27', 154e-3, 300e-3, 3.62, 5.65, 1451000e-8, 27680e-6, 32100e-6, 42.12e-2, 379.6e-4, 70280e-8, 3412e-6, 5379e-6, 9.27e-2, 189.1e-3, 7440e-8, 2.1e+11, 0.3),
+    ('HL_1000_x_748dot', 'HL_1000_x_748dot', 748, 1068e-3, 417e-3, 39e-3, 70e-3, 30e-3, 953.4e-4, 928e-3, 868e-3, 'M 27', 160e-3, 304e-3, 3.67, 4.91, 1732000e-8, 32430e-6, 37880e-6, 42.62e-2, 438.9e-4, 85111e-8, 4082e-6, 6459e-6, 9.45e-2, 214.1e-3, 11670e-8, 2.1e+11, 0.3),
+    ('HL_1000_x_883dot', 'HL_1000_x_883dot', 883, 1092e-3, 424e-3, 45.5e-3, 82e-3, 30e-3, 1125.3e-4, 928e-3, 868e-3, 'M 27', 166e-3, 312e-3, 3.74, 4.23, 2096000e-8, 38390e-6, 45260e-6, 43.16e-2, 516.5e-4, 105000e-8, 4952e-6, 7874e-6, 9.66e-2, 244.6e-3, 18750e-8, 2.1e+11, 0.3),
+    ('HL_1100_Adot', 'HL_1100_Adot', 343, 1090e-3, 400e-3, 18e-3, 31e-3, 20e-3, 436.5e-4, 1028e-3, 988e-3, 'M 27', 116e-3, 294e-3, 3.71, 10.83, 867400e-8, 15920e-6, 18060e-6, 44.58e-2, 206.5e-4, 33120e-8, 1656e-6, 2568e-6, 8.71e-2, 103.4e-3, 1037e-8, 2.1e+11, 0.3),
+    ('HL_1100_Bdot', 'HL_1100_Bdot', 390, 1100e-3, 400e-3, 20e-3, 36e-3, 20e-3, 497e-4, 1028e-3, 988e-3, 'M 27', 118e-3, 294e-3, 3.726, 9.549, 1005000e-8, 18280e-6, 20780e-6, 44.98e-2, 230.6e-4, 38480e-8, 1924e-6, 2988e-6, 8.8e-2, 115.4e-3, 1564e-8, 2.1e+11, 0.3),
+    ('HL_1100_Mdot', 'HL_1100_Mdot', 433, 1108e-3, 402e-3, 22e-3, 40e-3, 20e-3, 551.2e-4, 1028e-3, 988e-3, 'M 27', 122e-3, 290e-3, 3.746, 8.657, 1126000e-8, 20320e-6, 23160e-6, 45.19e-2, 254.4e-4, 43410e-8, 2160e-6, 3362e-6, 8.87e-2, 125.4e-3, 2130e-8, 2.1e+11, 0.3),
+    ('HL_1100_Rdot', 'HL_1100_Rdot', 499, 1118e-3, 405e-3, 26e-3, 45e-3, 20e-3, 635.2e-4, 1028e-3, 988e-3, 'M 27', 126e-3, 294e-3, 3.77, 7.56, 1294000e-8, 23150e-6, 26600e-6, 45.14e-2, 300.4e-4, 49980e-8, 2468e-6, 3870e-6, 8.87e-2, 139.4e-3, 3135e-8, 2.1e+11, 0.3),
+    )
@@ -0,0 +1,65 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR IPE shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'P', 'h', 'b', 'tw', 'tf', 'r', 'A', 'hi', 'd', 'FI', 'Pmin', 'Pmax', 'AL', 'AG', 'Iz', 'Wzel', 'Wzpl', 'iz', 'Avy', 'Iy', 'Wyel', 'Wypl', 'iy', 'Ss', 'It', 'E', 'nu')
+
+rows= (
+    ('IPE_A_100', 'IPE_A_100', 6.9, 98e-3, 55e-3, 3.6e-3, 4.7e-3, 7e-3, 8.78e-4, 88.6e-3, 74.6e-3, '-', 0e-3, 0e-3, 0.397, 57.57, 141.2e-8, 28.81e-6, 32.98e-6, 4.01e-2, 4.44e-4, 13.12e-8, 4.77e-6, 7.54e-6, 1.22e-2, 21.2e-3, 0.77e-8, 2.1e+11, 0.3),
+    ('IPE_100', 'IPE_100', 8.1, 100e-3, 55e-3, 4.1e-3, 5.7e-3, 7e-3, 10.32e-4, 88.6e-3, 74.6e-3, '-', 0e-3, 0e-3, 0.4, 49.33, 171e-8, 34.2e-6, 39.41e-6, 4.07e-2, 5.08e-4, 15.92e-8, 5.79e-6, 9.15e-6, 1.24e-2, 23.7e-3, 1.2e-8, 2.1e+11, 0.3),
+    ('IPE_A_120', 'IPE_A_120', 8.7, 117.6e-3, 64e-3, 3.8e-3, 5.1e-3, 7e-3, 11.03e-4, 107.4e-3, 93.4e-3, '-', 0e-3, 0e-3, 0.472, 54.47, 257.4e-8, 43.77e-6, 49.87e-6, 4.83e-2, 5.41e-4, 22.39e-8, 7e-6, 10.98e-6, 1.42e-2, 22.2e-3, 1.04e-8, 2.1e+11, 0.3),
+    ('IPE_120', 'IPE_120', 10.4, 120e-3, 64e-3, 4.4e-3, 6.3e-3, 7e-3, 13.21e-4, 107.4e-3, 93.4e-3, '-', 0e-3, 0e-3, 0.475, 45.82, 317.8e-8, 52.96e-6, 60.73e-6, 4.9e-2, 6.31e-4, 27.67e-8, 8.65e-6, 13.58e-6, 1.45e-2, 25.2e-3, 1.74e-8, 2.1e+11, 0.3),
+    ('IPE_A_140', 'IPE_A_140', 10.5, 137.4e-3, 73e-3, 3.8e-3, 5.6e-3, 7e-3, 13.39e-4, 126.2e-3, 112.2e-3, '-', 0e-3, 0e-3, 0.547, 52.05, 434.9e-8, 63.3e-6, 71.6e-6, 5.7e-2, 6.21e-4, 36.42e-8, 9.98e-6, 15.52e-6, 1.65e-2, 23.2e-3, 1.36e-8, 2.1e+11, 0.3),
+    ('IPE_140', 'IPE_140', 12.9, 140e-3, 73e-3, 4.7e-3, 6.9e-3, 7e-3, 16.43e-4, 126.2e-3, 112.2e-3, '-', 0e-3, 0e-3, 0.551, 42.7, 541.2e-8, 77.32e-6, 88.34e-6, 5.74e-2, 7.64e-4, 44.92e-8, 12.31e-6, 19.25e-6, 1.65e-2, 26.7e-3, 2.45e-8, 2.1e+11, 0.3),
+    ('IPE_A_160', 'IPE_A_160', 12.7, 157e-3, 82e-3, 4e-3, 5.9e-3, 9e-3, 16.18e-4, 145.2e-3, 127.2e-3, '-', 0e-3, 0e-3, 0.619, 48.7, 689.3e-8, 87.81e-6, 99.09e-6, 6.53e-2, 7.8e-4, 54.43e-8, 13.27e-6, 20.7e-6, 1.83e-2, 26.34e-3, 1.96e-8, 2.1e+11, 0.3),
+    ('IPE_160', 'IPE_160', 15.8, 160e-3, 82e-3, 5e-3, 7.4e-3, 9e-3, 20.09e-4, 145.2e-3, 127.2e-3, '-', 0e-3, 0e-3, 0.623, 39.47, 869.3e-8, 108.7e-6, 123.9e-6, 6.58e-2, 9.66e-4, 68.31e-8, 16.66e-6, 26.1e-6, 1.84e-2, 30.34e-3, 3.6e-8, 2.1e+11, 0.3),
+    ('IPE_A_180', 'IPE_A_180', 15.4, 177e-3, 91e-3, 4.3e-3, 6.5e-3, 9e-3, 19.58e-4, 164e-3, 146e-3, 'M10', 48e-3, 48e-3, 0.694, 45.15, 1063e-8, 120.1e-6, 135.3e-6, 7.37e-2, 9.2e-4, 81.89e-8, 18e-6, 27.96e-6, 2.05e-2, 27.84e-3, 2.7e-8, 2.1e+11, 0.3),
+    ('IPE_180', 'IPE_180', 18.8, 180e-3, 91e-3, 5.3e-3, 8e-3, 9e-3, 23.95e-4, 164e-3, 146e-3, 'M10', 48e-3, 48e-3, 0.698, 37.13, 1317e-8, 146.3e-6, 166.4e-6, 7.42e-2, 11.25e-4, 100.9e-8, 22.16e-6, 34.6e-6, 2.05e-2, 31.84e-3, 4.79e-8, 2.1e+11, 0.3),
+    ('IPE_O_180+', 'IPE_O_180+', 21.3, 182e-3, 92e-3, 6e-3, 9e-3, 9e-3, 27.1e-4, 164e-3, 146e-3, 'M10', 50e-3, 50e-3, 0.705, 33.12, 1505e-8, 165.4e-6, 189.1e-6, 7.45e-2, 12.7e-4, 117.3e-8, 25.5e-6, 39.91e-6, 2.08e-2, 34.54e-3, 6.76e-8, 2.1e+11, 0.3),
+    ('IPE_A_200', 'IPE_A_200', 18.4, 197e-3, 100e-3, 4.5e-3, 7e-3, 12e-3, 23.47e-4, 183e-3, 159e-3, 'M10', 54e-3, 58e-3, 0.764, 41.49, 1591e-8, 161.6e-6, 181.7e-6, 8.23e-2, 11.47e-4, 117.2e-8, 23.43e-6, 36.54e-6, 2.23e-2, 32.56e-3, 4.11e-8, 2.1e+11, 0.3),
+    ('IPE_200', 'IPE_200', 22.4, 200e-3, 100e-3, 5.6e-3, 8.5e-3, 12e-3, 28.48e-4, 183e-3, 159e-3, 'M10', 54e-3, 58e-3, 0.768, 34.36, 1943e-8, 194.3e-6, 220.6e-6, 8.26e-2, 14e-4, 142.4e-8, 28.47e-6, 44.61e-6, 2.24e-2, 36.66e-3, 6.98e-8, 2.1e+11, 0.3),
+    ('IPE_O_200+', 'IPE_O_200+', 25.1, 202e-3, 102e-3, 6.2e-3, 9.5e-3, 12e-3, 31.96e-4, 183e-3, 159e-3, 'M10', 56e-3, 60e-3, 0.779, 31.05, 2211e-8, 218.9e-6, 249.4e-6, 8.32e-2, 15.45e-4, 168.9e-8, 33.11e-6, 51.89e-6, 2.3e-2, 39.26e-3, 9.45e-8, 2.1e+11, 0.3),
+    ('IPE_A_220', 'IPE_A_220', 22.2, 217e-3, 110e-3, 5e-3, 7.7e-3, 12e-3, 28.26e-4, 201.6e-3, 177.6e-3, 'M12', 60e-3, 62e-3, 0.843, 38.02, 2317e-8, 213.5e-6, 240.2e-6, 9.05e-2, 13.55e-4, 171.4e-8, 31.17e-6, 48.49e-6, 2.46e-2, 34.46e-3, 5.69e-8, 2.1e+11, 0.3),
+    ('IPE_220', 'IPE_220', 26.2, 220e-3, 110e-3, 5.9e-3, 9.2e-3, 12e-3, 33.37e-4, 201.6e-3, 177.6e-3, 'M12', 60e-3, 62e-3, 0.848, 32.36, 2772e-8, 252e-6, 285.4e-6, 9.11e-2, 15.88e-4, 204.9e-8, 37.25e-6, 58.11e-6, 2.48e-2, 38.36e-3, 9.07e-8, 2.1e+11, 0.3),
+    ('IPE_O_220+', 'IPE_O_220+', 29.4, 222e-3, 112e-3, 6.6e-3, 10.2e-3, 12e-3, 37.39e-4, 201.6e-3, 177.6e-3, 'M10', 58e-3, 66e-3, 0.858, 29.24, 3134e-8, 282.3e-6, 321.1e-6, 9.16e-2, 17.66e-4, 239.8e-8, 42.83e-6, 66.91e-6, 2.53e-2, 41.06e-3, 12.27e-8, 2.1e+11, 0.3),
+    ('IPE_A_240', 'IPE_A_240', 26.2, 237e-3, 120e-3, 5.2e-3, 8.3e-3, 15e-3, 33.31e-4, 220.4e-3, 190.4e-3, 'M12', 64e-3, 68e-3, 0.918, 35.1, 3290e-8, 277.7e-6, 311.6e-6, 9.94e-2, 16.31e-4, 240.1e-8, 40.02e-6, 62.4e-6, 2.68e-2, 39.37e-3, 8.35e-8, 2.1e+11, 0.3),
+    ('IPE_240', 'IPE_240', 30.7, 240e-3, 120e-3, 6.2e-3, 9.8e-3, 15e-3, 39.12e-4, 220.4e-3, 190.4e-3, 'M12', 66e-3, 68e-3, 0.922, 30.02, 3892e-8, 324.3e-6, 366.6e-6, 9.97e-2, 19.14e-4, 283.6e-8, 47.27e-6, 73.92e-6, 2.69e-2, 43.37e-3, 12.88e-8, 2.1e+11, 0.3),
+    ('IPE_O_240+', 'IPE_O_240+', 34.3, 242e-3, 122e-3, 7e-3, 10.8e-3, 15e-3, 43.71e-4, 220.4e-3, 190.4e-3, 'M12', 66e-3, 70e-3, 0.932, 27.17, 4369e-8, 361.1e-6, 410.3e-6, 10e-2, 21.36e-4, 328.5e-8, 53.86e-6, 84.4e-6, 2.74e-2, 46.17e-3, 17.18e-8, 2.1e+11, 0.3),
+    ('IPE_A_270', 'IPE_A_270', 30.7, 267e-3, 135e-3, 5.5e-3, 8.7e-3, 15e-3, 39.15e-4, 249.6e-3, 219.6e-3, 'M16', 70e-3, 72e-3, 1.037, 33.75, 4917e-8, 368.3e-6, 412.5e-6, 11.21e-2, 18.75e-4, 358e-8, 53.03e-6, 82.34e-6, 3.02e-2, 40.47e-3, 10.3e-8, 2.1e+11, 0.3),
+    ('IPE_270', 'IPE_270', 36.1, 270e-3, 135e-3, 6.6e-3, 10.2e-3, 15e-3, 45.95e-4, 249.6e-3, 219.6e-3, 'M16', 72e-3, 72e-3, 1.041, 28.86, 5790e-8, 428.9e-6, 484e-6, 11.23e-2, 22.14e-4, 419.9e-8, 62.2e-6, 96.95e-6, 3.02e-2, 44.57e-3, 15.94e-8, 2.1e+11, 0.3),
+    ('IPE_O_270+', 'IPE_O_270+', 42.3, 274e-3, 136e-3, 7.5e-3, 12.2e-3, 15e-3, 53.84e-4, 249.6e-3, 219.6e-3, 'M16', 72e-3, 72e-3, 1.051, 24.88, 6947e-8, 507.1e-6, 574.6e-6, 11.36e-2, 25.23e-4, 513.5e-8, 75.51e-6, 117.7e-6, 3.09e-2, 49.47e-3, 24.9e-8, 2.1e+11, 0.3),
+    ('IPE_A_300', 'IPE_A_300', 36.5, 297e-3, 150e-3, 6.1e-3, 9.2e-3, 15e-3, 46.53e-4, 278.6e-3, 248.6e-3, 'M16', 72e-3, 86e-3, 1.156, 31.65, 7173e-8, 483.1e-6, 541.8e-6, 12.42e-2, 22.25e-4, 519e-8, 69.2e-6, 107.3e-6, 3.34e-2, 42.07e-3, 13.43e-8, 2.1e+11, 0.3),
+    ('IPE_300', 'IPE_300', 42.2, 300e-3, 150e-3, 7.1e-3, 10.7e-3, 15e-3, 53.81e-4, 278.6e-3, 248.6e-3, 'M16', 72e-3, 86e-3, 1.16, 27.46, 8356e-8, 557.1e-6, 628.4e-6, 12.46e-2, 25.68e-4, 603.8e-8, 80.5e-6, 125.2e-6, 3.35e-2, 46.07e-3, 20.12e-8, 2.1e+11, 0.3),
+    ('IPE_O_300+', 'IPE_O_300+', 49.3, 304e-3, 152e-3, 8e-3, 12.7e-3, 15e-3, 62.83e-4, 278.6e-3, 248.6e-3, 'M16', 74e-3, 88e-3, 1.174, 23.81, 9994e-8, 657.5e-6, 743.8e-6, 12.61e-2, 29.05e-4, 745.7e-8, 98.12e-6, 152.6e-6, 3.45e-2, 50.97e-3, 31.06e-8, 2.1e+11, 0.3),
+    ('IPE_A_330', 'IPE_A_330', 43, 327e-3, 160e-3, 6.5e-3, 10e-3, 18e-3, 54.74e-4, 307e-3, 271e-3, 'M16', 78e-3, 96e-3, 1.25, 29.09, 10230e-8, 625.7e-6, 701.9e-6, 13.67e-2, 26.99e-4, 685.2e-8, 85.64e-6, 133.3e-6, 3.54e-2, 47.59e-3, 19.57e-8, 2.1e+11, 0.3),
+    ('IPE_330', 'IPE_330', 49.1, 330e-3, 160e-3, 7.5e-3, 11.5e-3, 18e-3, 62.61e-4, 307e-3, 271e-3, 'M16', 78e-3, 96e-3, 1.254, 25.52, 11770e-8, 713.1e-6, 804.3e-6, 13.71e-2, 30.81e-4, 788.1e-8, 98.52e-6, 153.7e-6, 3.55e-2, 51.59e-3, 28.15e-8, 2.1e+11, 0.3),
+    ('IPE_O_330+', 'IPE_O_330+', 57, 334e-3, 162e-3, 8.5e-3, 13.5e-3, 18e-3, 72.62e-4, 307e-3, 271e-3, 'M16', 80e-3, 98e-3, 1.268, 22.24, 13910e-8, 833e-6, 942.8e-6, 13.84e-2, 34.88e-4, 960.4e-8, 118.6e-6, 185e-6, 3.64e-2, 56.59e-3, 42.15e-8, 2.1e+11, 0.3),
+    ('IPE_A_360', 'IPE_A_360', 50.2, 357.6e-3, 170e-3, 6.6e-3, 11.5e-3, 18e-3, 63.96e-4, 334.6e-3, 298.6e-3, 'M22', 86e-3, 88e-3, 1.351, 26.91, 14520e-8, 811.8e-6, 906.8e-6, 15.06e-2, 29.76e-4, 944.3e-8, 111.1e-6, 171.9e-6, 3.84e-2, 50.69e-3, 26.51e-8, 2.1e+11, 0.3),
+    ('IPE_360', 'IPE_360', 57.1, 360e-3, 170e-3, 8e-3, 12.7e-3, 18e-3, 72.73e-4, 334.6e-3, 298.6e-3, 'M22', 88e-3, 88e-3, 1.353, 23.7, 16270e-8, 903.6e-6, 1019e-6, 14.95e-2, 35.14e-4, 1043e-8, 122.8e-6, 191.1e-6, 3.79e-2, 54.49e-3, 37.32e-8, 2.1e+11, 0.3),
+    ('IPE_O_360+', 'IPE_O_360+', 66, 364e-3, 172e-3, 9.2e-3, 14.7e-3, 18e-3, 84.13e-4, 334.6e-3, 298.6e-3, 'M22', 90e-3, 90e-3, 1.367, 20.69, 19050e-8, 1047e-6, 1186e-6, 15.05e-2, 40.21e-4, 1251e-8, 145.5e-6, 226.9e-6, 3.86e-2, 59.69e-3, 55.76e-8, 2.1e+11, 0.3),
+    ('IPE_A_400', 'IPE_A_400', 57.4, 397e-3, 180e-3, 7e-3, 12e-3, 21e-3, 73.1e-4, 373e-3, 331e-3, 'M22', 94e-3, 98e-3, 1.464, 25.51, 20290e-8, 1022e-6, 1144e-6, 16.66e-2, 35.78e-4, 1171e-8, 130.1e-6, 202.1e-6, 4e-2, 55.6e-3, 34.79e-8, 2.1e+11, 0.3),
+    ('IPE_400', 'IPE_400', 66.3, 400e-3, 180e-3, 8.6e-3, 13.5e-3, 21e-3, 84.46e-4, 373e-3, 331e-3, 'M22', 96e-3, 98e-3, 1.467, 22.12, 23130e-8, 1156e-6, 1307e-6, 16.55e-2, 42.69e-4, 1318e-8, 146.4e-6, 229e-6, 3.95e-2, 60.2e-3, 51.08e-8, 2.1e+11, 0.3),
+    ('IPE_O_400+', 'IPE_O_400+', 75.7, 404e-3, 182e-3, 9.7e-3, 15.5e-3, 21e-3, 96.39e-4, 373e-3, 331e-3, 'M22', 96e-3, 100e-3, 1.481, 19.57, 26750e-8, 1324e-6, 1502e-6, 16.66e-2, 47.98e-4, 1564e-8, 171.9e-6, 269.1e-6, 4.03e-2, 65.3e-3, 73.1e-8, 2.1e+11, 0.3),
+    ('IPE_A_450', 'IPE_A_450', 67.2, 447e-3, 190e-3, 7.6e-3, 13.1e-3, 21e-3, 85.55e-4, 420.8e-3, 378.8e-3, 'M24', 100e-3, 102e-3, 1.603, 23.87, 29760e-8, 1331e-6, 1494e-6, 18.65e-2, 42.26e-4, 1502e-8, 158.1e-6, 245.7e-6, 4.19e-2, 58.4e-3, 45.67e-8, 2.1e+11, 0.3),
+    ('IPE_450', 'IPE_450', 77.6, 450e-3, 190e-3, 9.4e-3, 14.6e-3, 21e-3, 98.82e-4, 420.8e-3, 378.8e-3, 'M24', 100e-3, 102e-3, 1.605, 20.69, 33740e-8, 1500e-6, 1702e-6, 18.48e-2, 50.85e-4, 1676e-8, 176.4e-6, 276.4e-6, 4.12e-2, 63.2e-3, 66.87e-8, 2.1e+11, 0.3),
+    ('IPE_O_450+', 'IPE_O_450+', 92.4, 456e-3, 192e-3, 11e-3, 17.6e-3, 21e-3, 117.7e-4, 420.8e-3, 378.8e-3, 'M24', 102e-3, 104e-3, 1.622, 17.56, 40920e-8, 1795e-6, 2046e-6, 18.65e-2, 59.4e-4, 2085e-8, 217.2e-6, 341e-6, 4.21e-2, 70.8e-3, 109e-8, 2.1e+11, 0.3),
+    ('IPE_A_500', 'IPE_A_500', 79.4, 497e-3, 200e-3, 8.4e-3, 14.5e-3, 21e-3, 101.1e-4, 468e-3, 426e-3, 'M24', 100e-3, 112e-3, 1.741, 21.94, 42930e-8, 1728e-6, 1946e-6, 20.61e-2, 50.41e-4, 1939e-8, 193.9e-6, 301.6e-6, 4.38e-2, 62e-3, 62.78e-8, 2.1e+11, 0.3),
+    ('IPE_500', 'IPE_500', 90.7, 500e-3, 200e-3, 10.2e-3, 16e-3, 21e-3, 115.5e-4, 468e-3, 426e-3, 'M24', 102e-3, 112e-3, 1.744, 19.23, 48200e-8, 1928e-6, 2194e-6, 20.43e-2, 59.87e-4, 2142e-8, 214.2e-6, 335.9e-6, 4.31e-2, 66.8e-3, 89.29e-8, 2.1e+11, 0.3),
+    ('IPE_O_500+', 'IPE_O_500+', 107, 506e-3, 202e-3, 12e-3, 19e-3, 21e-3, 136.7e-4, 468e-3, 426e-3, 'M24', 104e-3, 114e-3, 1.76, 16.4, 57780e-8, 2284e-6, 2613e-6, 20.56e-2, 70.21e-4, 2622e-8, 259.6e-6, 408.5e-6, 4.38e-2, 74.6e-3, 143.5e-8, 2.1e+11, 0.3),
+    ('IPE_A_550', 'IPE_A_550', 92.1, 547e-3, 210e-3, 9e-3, 15.7e-3, 24e-3, 117.3e-4, 515.6e-3, 467.6e-3, 'M24', 106e-3, 122e-3, 1.875, 20.36, 59980e-8, 2193e-6, 2475e-6, 22.61e-2, 60.3e-4, 2432e-8, 231.6e-6, 361.5e-6, 4.55e-2, 68.52e-3, 86.53e-8, 2.1e+11, 0.3),
+    ('IPE_550', 'IPE_550', 106, 550e-3, 210e-3, 11.1e-3, 17.2e-3, 24e-3, 134.4e-4, 515.6e-3, 467.6e-3, 'M24', 110e-3, 122e-3, 1.877, 17.78, 67120e-8, 2441e-6, 2787e-6, 22.35e-2, 72.34e-4, 2668e-8, 254.1e-6, 400.5e-6, 4.45e-2, 73.62e-3, 123.2e-8, 2.1e+11, 0.3),
+    ('IPE_O_550+', 'IPE_O_550+', 123, 556e-3, 212e-3, 12.7e-3, 20.2e-3, 24e-3, 156.1e-4, 515.6e-3, 467.6e-3, 'M24', 110e-3, 122e-3, 1.893, 15.45, 79160e-8, 2847e-6, 3263e-6, 22.52e-2, 82.69e-4, 3224e-8, 304.2e-6, 480.5e-6, 4.55e-2, 81.22e-3, 187.5e-8, 2.1e+11, 0.3),
+    ('IPE_A_600', 'IPE_A_600', 108, 597e-3, 220e-3, 9.8e-3, 17.5e-3, 24e-3, 137e-4, 562e-3, 514e-3, 'M27', 114e-3, 118e-3, 2.013, 18.72, 82920e-8, 2778e-6, 3141e-6, 24.6e-2, 70.14e-4, 3116e-8, 283.3e-6, 442.1e-6, 4.77e-2, 72.92e-3, 118.8e-8, 2.1e+11, 0.3),
+    ('IPE_600', 'IPE_600', 122, 600e-3, 220e-3, 12e-3, 19e-3, 24e-3, 156e-4, 562e-3, 514e-3, 'M27', 116e-3, 118e-3, 2.015, 16.45, 92080e-8, 3069e-6, 3512e-6, 24.3e-2, 83.78e-4, 3387e-8, 307.9e-6, 485.6e-6, 4.66e-2, 78.12e-3, 165.4e-8, 2.1e+11, 0.3),
+    ('IPE_O_600+', 'IPE_O_600+', 154, 610e-3, 224e-3, 15e-3, 24e-3, 24e-3, 196.8e-4, 562e-3, 514e-3, 'M27', 118e-3, 122e-3, 2.045, 13.24, 118300e-8, 3879e-6, 4471e-6, 24.52e-2, 104.4e-4, 4521e-8, 403.6e-6, 640.1e-6, 4.79e-2, 91.12e-3, 318.1e-8, 2.1e+11, 0.3),
+    ('IPE_750x147', 'IPE_750x147', 147, 753e-3, 265e-3, 13.2e-3, 17e-3, 17e-3, 187.5e-4, 719e-3, 685e-3, 'M27', 104e-3, 164e-3, 2.51, 17.06, 166100e-8, 4411e-6, 5110e-6, 29.76e-2, 105.4e-4, 5289e-8, 399.2e-6, 630.8e-6, 5.31e-2, 67.12e-3, 161.5e-8, 2.1e+11, 0.3),
+    ('IPE_750x173+', 'IPE_750x173+', 173, 762e-3, 267e-3, 14.4e-3, 21.6e-3, 17e-3, 221.3e-4, 718.8e-3, 684.8e-3, 'M27', 104e-3, 166e-3, 2.534, 14.58, 205800e-8, 5402e-6, 6218e-6, 30.49e-2, 116.4e-4, 6873e-8, 514.9e-6, 809.9e-6, 5.57e-2, 77.52e-3, 273.6e-8, 2.1e+11, 0.3),
+    ('IPE_750x196+', 'IPE_750x196+', 196, 770e-3, 268e-3, 15.6e-3, 25.4e-3, 17e-3, 250.8e-4, 719.2e-3, 685.2e-3, 'M27', 106e-3, 166e-3, 2.552, 12.96, 240300e-8, 6241e-6, 7174e-6, 30.95e-2, 127.3e-4, 8175e-8, 610.1e-6, 958.8e-6, 5.71e-2, 86.32e-3, 408.9e-8, 2.1e+11, 0.3),
+    )
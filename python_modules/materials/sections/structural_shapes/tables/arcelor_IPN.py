@@ -0,0 +1,36 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR IPN shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'P', 'h', 'b', 'tw', 'tf', 'r1', 'r2', 'A', 'd', 'FI', 'Pmin', 'Pmax', 'AL', 'AG', 'Iz', 'Wzel', 'Wzpl', 'iz', 'Avy', 'Iy', 'Wyel', 'Wypl', 'iy', 'Ss', 'It', 'E', 'nu')
+
+rows= (
+    ('IPN_80', 'IPN_80', 5.9, 80e-3, 42e-3, 3.9e-3, 5.9e-3, 3.9e-3, 2.3e-3, 7.58e-4, 59e-3, '-', 0e-3, 0e-3, 0.304, 51.09, 77.8e-8, 19.5e-6, 22.8e-6, 3.2e-2, 3.41e-4, 6.29e-8, 3e-6, 5e-6, 0.91e-2, 21.6e-3, 0.87e-8, 2.1e+11, 0.3),
+    ('IPN_100', 'IPN_100', 8.3, 100e-3, 50e-3, 4.5e-3, 6.8e-3, 4.5e-3, 2.7e-3, 10.6e-4, 75.7e-3, '-', 0e-3, 0e-3, 0.37, 44.47, 171e-8, 34.2e-6, 39.8e-6, 4.01e-2, 4.85e-4, 12.2e-8, 4.88e-6, 8.1e-6, 1.07e-2, 25e-3, 1.6e-8, 2.1e+11, 0.3),
+    ('IPN_120', 'IPN_120', 11.1, 120e-3, 58e-3, 5.1e-3, 7.7e-3, 5.1e-3, 3.1e-3, 14.2e-4, 92.4e-3, '-', 0e-3, 0e-3, 0.439, 39.38, 328e-8, 54.7e-6, 63.6e-6, 4.81e-2, 6.63e-4, 21.5e-8, 7.41e-6, 12.4e-6, 1.23e-2, 28.4e-3, 2.71e-8, 2.1e+11, 0.3),
+    ('IPN_140', 'IPN_140', 14.3, 140e-3, 66e-3, 5.7e-3, 8.6e-3, 5.7e-3, 3.4e-3, 18.3e-4, 109.1e-3, '-', 0e-3, 0e-3, 0.502, 34.94, 573e-8, 81.9e-6, 95.4e-6, 5.61e-2, 8.65e-4, 35.2e-8, 10.7e-6, 17.9e-6, 1.4e-2, 31.8e-3, 4.32e-8, 2.1e+11, 0.3),
+    ('IPN_160', 'IPN_160', 17.9, 160e-3, 74e-3, 6.3e-3, 9.5e-3, 6.3e-3, 3.8e-3, 22.8e-4, 125.8e-3, '-', 0e-3, 0e-3, 0.575, 32.13, 935e-8, 117e-6, 136e-6, 6.4e-2, 10.83e-4, 54.7e-8, 14.8e-6, 24.9e-6, 1.55e-2, 35.2e-3, 6.57e-8, 2.1e+11, 0.3),
+    ('IPN_180', 'IPN_180', 21.9, 180e-3, 82e-3, 6.9e-3, 10.4e-3, 6.9e-3, 4.1e-3, 27.9e-4, 142.4e-3, '-', 0e-3, 0e-3, 0.64, 29.22, 1450e-8, 161e-6, 187e-6, 7.2e-2, 13.35e-4, 81.3e-8, 19.8e-6, 33.2e-6, 1.71e-2, 38.6e-3, 9.58e-8, 2.1e+11, 0.3),
+    ('IPN_200', 'IPN_200', 26.2, 200e-3, 90e-3, 7.5e-3, 11.3e-3, 7.5e-3, 4.5e-3, 33.4e-4, 159.1e-3, '-', 0e-3, 0e-3, 0.709, 27.04, 2140e-8, 214e-6, 250e-6, 8e-2, 16.03e-4, 117e-8, 26e-6, 43.5e-6, 1.87e-2, 42e-3, 13.5e-8, 2.1e+11, 0.3),
+    ('IPN_220', 'IPN_220', 31.1, 220e-3, 98e-3, 8.1e-3, 12.2e-3, 8.1e-3, 4.9e-3, 39.5e-4, 175.8e-3, 'M 10', 50e-3, 56e-3, 0.775, 24.99, 3060e-8, 278e-6, 324e-6, 8.8e-2, 19.06e-4, 162e-8, 33.1e-6, 55.7e-6, 2.02e-2, 45.4e-3, 18.6e-8, 2.1e+11, 0.3),
+    ('IPN_240', 'IPN_240', 36.2, 240e-3, 106e-3, 8.7e-3, 13.1e-3, 8.7e-3, 5.2e-3, 46.1e-4, 192.5e-3, 'M 10', 54e-3, 60e-3, 0.844, 23.32, 4250e-8, 354e-6, 412e-6, 9.59e-2, 22.33e-4, 221e-8, 41.7e-6, 70e-6, 2.2e-2, 48.9e-3, 25e-8, 2.1e+11, 0.3),
+    ('IPN_260', 'IPN_260', 41.9, 260e-3, 113e-3, 9.4e-3, 14.1e-3, 9.4e-3, 5.6e-3, 53.3e-4, 208.9e-3, 'M 12', 62e-3, 62e-3, 0.906, 21.65, 5740e-8, 442e-6, 514e-6, 10.4e-2, 26.08e-4, 288e-8, 51e-6, 85.9e-6, 2.32e-2, 52.6e-3, 33.5e-8, 2.1e+11, 0.3),
+    ('IPN_280', 'IPN_280', 47.9, 280e-3, 119e-3, 10.1e-3, 15.2e-3, 10.1e-3, 6.1e-3, 61e-4, 225.1e-3, 'M 12', 68e-3, 68e-3, 0.966, 20.17, 7590e-8, 542e-6, 632e-6, 11.1e-2, 30.18e-4, 364e-8, 61.2e-6, 103e-6, 2.45e-2, 56.4e-3, 44.2e-8, 2.1e+11, 0.3),
+    ('IPN_300', 'IPN_300', 54.2, 300e-3, 125e-3, 10.8e-3, 16.2e-3, 10.8e-3, 6.5e-3, 69e-4, 241.6e-3, 'M 12', 70e-3, 74e-3, 1.03, 19.02, 9800e-8, 653e-6, 762e-6, 11.9e-2, 34.58e-4, 451e-8, 72.2e-6, 121e-6, 2.56e-2, 60.1e-3, 56.8e-8, 2.1e+11, 0.3),
+    ('IPN_320', 'IPN_320', 61, 320e-3, 131e-3, 11.5e-3, 17.3e-3, 11.5e-3, 6.9e-3, 77.7e-4, 257.9e-3, 'M 12', 70e-3, 80e-3, 1.09, 17.87, 12510e-8, 782e-6, 914e-6, 12.7e-2, 39.26e-4, 555e-8, 84.7e-6, 143e-6, 2.67e-2, 63.9e-3, 72.5e-8, 2.1e+11, 0.3),
+    ('IPN_340', 'IPN_340', 68, 340e-3, 137e-3, 12.2e-3, 18.3e-3, 12.2e-3, 7.3e-3, 86.7e-4, 274.3e-3, 'M 12', 78e-3, 86e-3, 1.15, 16.9, 15700e-8, 923e-6, 1080e-6, 13.5e-2, 44.27e-4, 674e-8, 98.4e-6, 166e-6, 2.8e-2, 67.6e-3, 90.4e-8, 2.1e+11, 0.3),
+    ('IPN_360', 'IPN_360', 76.1, 360e-3, 143e-3, 13e-3, 19.5e-3, 13e-3, 7.8e-3, 97e-4, 290.2e-3, 'M 12', 78e-3, 92e-3, 1.21, 15.89, 19610e-8, 1090e-6, 1276e-6, 14.2e-2, 49.95e-4, 818e-8, 114e-6, 194e-6, 2.9e-2, 71.8e-3, 115e-8, 2.1e+11, 0.3),
+    ('IPN_380', 'IPN_380', 84, 380e-3, 149e-3, 13.7e-3, 20.5e-3, 13.7e-3, 8.2e-3, 107e-4, 306.7e-3, 'M 16', 84e-3, 86e-3, 1.27, 15.12, 24010e-8, 1260e-6, 1482e-6, 15e-2, 55.55e-4, 975e-8, 131e-6, 221e-6, 3.02e-2, 75.4e-3, 141e-8, 2.1e+11, 0.3),
+    ('IPN_400', 'IPN_400', 92.4, 400e-3, 155e-3, 14.4e-3, 21.6e-3, 14.4e-3, 8.6e-3, 118e-4, 322.9e-3, 'M 16', 86e-3, 92e-3, 1.33, 14.36, 29210e-8, 1460e-6, 1714e-6, 15.7e-2, 61.69e-4, 1160e-8, 149e-6, 253e-6, 3.13e-2, 79.3e-3, 170e-8, 2.1e+11, 0.3),
+    ('IPN_450', 'IPN_450', 115, 450e-3, 170e-3, 16.2e-3, 24.3e-3, 16.2e-3, 9.7e-3, 147e-4, 363.6e-3, 'M 16', 92e-3, 106e-3, 1.48, 12.83, 45850e-8, 2040e-6, 2400e-6, 17.7e-2, 77.79e-4, 1730e-8, 203e-6, 345e-6, 3.43e-2, 88.9e-3, 267e-8, 2.1e+11, 0.3),
+    ('IPN_500', 'IPN_500', 141, 500e-3, 185e-3, 18e-3, 27e-3, 18e-3, 10.8e-3, 179e-4, 404.3e-3, 'M 20', 102e-3, 110e-3, 1.63, 11.6, 68740e-8, 2750e-6, 3240e-6, 19.6e-2, 95.6e-4, 2480e-8, 268e-6, 456e-6, 3.72e-2, 98.5e-3, 402e-8, 2.1e+11, 0.3),
+    ('IPN_550', 'IPN_550', 166, 550e-3, 200e-3, 19e-3, 30e-3, 19e-3, 11.9e-3, 212e-4, 445.6e-3, 'M 22', 112e-3, 118e-3, 1.8, 10.8, 99180e-8, 3610e-6, 4240e-6, 21.6e-2, 111.3e-4, 3490e-8, 349e-6, 592e-6, 4.02e-2, 107.3e-3, 544e-8, 2.1e+11, 0.3),
+    ('IPN_600', 'IPN_600', 199, 600e-3, 215e-3, 21.6e-3, 32.4e-3, 21.6e-3, 13e-3, 254e-4, 485.8e-3, 'M 24', 126e-3, 128e-3, 1.97, 9.89, 138800e-8, 4627e-6, 5452e-6, 23.39e-2, 138e-4, 4674e-8, 435e-6, 752e-6, 4.29e-2, 117.6e-3, 787e-8, 2.1e+11, 0.3),
+    )
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR L shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'P', 'h', 'b', 't', 'r1', 'r2', 'A', 'zs', 'ys', 'v', 'u1', 'u2', 'AL', 'AG', 'Iy', 'Iz', 'Iyz', 'Wzel', 'Wyel', 'iz', 'iy', 'Iu', 'iu', 'Iv', 'iv', 'E', 'nu')
+
+rows= (
+    ('L20x20x3', 'L20x20x3', 0.882, 20e-3, 20e-3, 3e-3, 3.5e-3, 2e-3, 1.12e-4, 0.6e-3, 0.6e-3, 1.41e-2, 0.84e-2, 0.7e-2, 0.08, 87.4, 0.39e-8, 0.39e-8, -0.23e-8, 0.28e-6, 0.28e-6, 0.59e-2, 0.59e-2, 0.61e-8, 0.74e-2, 0.16e-8, 0.38e-2, 2.1e+11, 0.3),
+    ('L25x25x3', 'L25x25x3', 1.12, 25e-3, 25e-3, 3e-3, 3.5e-3, 2e-3, 1.42e-4, 0.72e-3, 0.72e-3, 1.77e-2, 1.02e-2, 0.88e-2, 0.1, 86.88, 0.8e-8, 0.8e-8, -0.47e-8, 0.45e-6, 0.45e-6, 0.75e-2, 0.75e-2, 1.26e-8, 0.94e-2, 0.33e-8, 0.48e-2, 2.1e+11, 0.3),
+    ('L25x25x4', 'L25x25x4', 1.45, 25e-3, 25e-3, 4e-3, 3.5e-3, 2e-3, 1.85e-4, 0.76e-3, 0.76e-3, 1.77e-2, 1.08e-2, 0.89e-2, 0.1, 66.67, 1.01e-8, 1.01e-8, -0.59e-8, 0.58e-6, 0.58e-6, 0.74e-2, 0.74e-2, 1.6e-8, 0.93e-2, 0.43e-8, 0.48e-2, 2.1e+11, 0.3),
+    ('L30x30x3', 'L30x30x3', 1.36, 30e-3, 30e-3, 3e-3, 5e-3, 2.5e-3, 1.74e-4, 0.84e-3, 0.84e-3, 2.12e-2, 1.18e-2, 1.05e-2, 0.12, 84.87, 1.4e-8, 1.4e-8, -0.83e-8, 0.65e-6, 0.65e-6, 0.9e-2, 0.9e-2, 2.23e-8, 1.13e-2, 0.58e-8, 0.58e-2, 2.1e+11, 0.3),
+    ('L30x30x4', 'L30x30x4', 1.78, 30e-3, 30e-3, 4e-3, 5e-3, 2.5e-3, 2.27e-4, 0.88e-3, 0.88e-3, 2.12e-2, 1.24e-2, 1.06e-2, 0.12, 65.02, 1.8e-8, 1.8e-8, -1.05e-8, 0.85e-6, 0.85e-6, 0.89e-2, 0.89e-2, 2.86e-8, 1.12e-2, 0.75e-8, 0.57e-2, 2.1e+11, 0.3),
+    ('L35x35x4', 'L35x35x4', 2.09, 35e-3, 35e-3, 4e-3, 5e-3, 2.5e-3, 2.67e-4, 1e-3, 1e-3, 2.47e-2, 1.42e-2, 1.24e-2, 0.14, 64.82, 2.95e-8, 2.95e-8, -1.73e-8, 1.18e-6, 1.18e-6, 1.05e-2, 1.05e-2, 4.69e-8, 1.33e-2, 1.22e-8, 0.68e-2, 2.1e+11, 0.3),
+    ('L40x40x4', 'L40x40x4', 2.42, 40e-3, 40e-3, 4e-3, 6e-3, 3e-3, 3.08e-4, 1.12e-3, 1.12e-3, 2.83e-2, 1.58e-2, 1.4e-2, 0.15, 64.07, 4.47e-8, 4.47e-8, -2.63e-8, 1.55e-6, 1.55e-6, 1.21e-2, 1.21e-2, 7.1e-8, 1.52e-2, 1.84e-8, 0.77e-2, 2.1e+11, 0.3),
+    ('L40x40x5', 'L40x40x5', 2.97, 40e-3, 40e-3, 5e-3, 6e-3, 3e-3, 3.79e-4, 1.16e-3, 1.16e-3, 2.83e-2, 1.64e-2, 1.41e-2, 0.15, 52.07, 5.43e-8, 5.43e-8, -3.18e-8, 1.91e-6, 1.91e-6, 1.2e-2, 1.2e-2, 8.61e-8, 1.51e-2, 2.25e-8, 0.77e-2, 2.1e+11, 0.3),
+    ('L45x45x4.5', 'L45x45x4.5', 3.06, 45e-3, 45e-3, 4.5e-3, 7e-3, 3.5e-3, 3.9e-4, 1.26e-3, 1.26e-3, 3.18e-2, 1.78e-2, 1.58e-2, 0.17, 56.83, 7.15e-8, 7.15e-8, -4.2e-8, 2.2e-6, 2.2e-6, 1.35e-2, 1.35e-2, 11.35e-8, 1.71e-2, 2.94e-8, 0.87e-2, 2.1e+11, 0.3),
+    ('L50x50x4', 'L50x50x4', 3.06, 50e-3, 50e-3, 4e-3, 7e-3, 3.5e-3, 3.89e-4, 1.36e-3, 1.36e-3, 3.54e-2, 1.92e-2, 1.75e-2, 0.19, 63.49, 8.97e-8, 8.97e-8, -5.28e-8, 2.46e-6, 2.46e-6, 1.52e-2, 1.52e-2, 14.25e-8, 1.91e-2, 3.69e-8, 0.97e-2, 2.1e+11, 0.3),
+    ('L50x50x5', 'L50x50x5', 3.77, 50e-3, 50e-3, 5e-3, 7e-3, 3.5e-3, 4.8e-4, 1.4e-3, 1.4e-3, 3.54e-2, 1.99e-2, 1.76e-2, 0.19, 51.46, 10.96e-8, 10.96e-8, -6.45e-8, 3.05e-6, 3.05e-6, 1.51e-2, 1.51e-2, 17.42e-8, 1.9e-2, 4.51e-8, 0.97e-2, 2.1e+11, 0.3),
+    ('L50x50x6', 'L50x50x6', 4.47, 50e-3, 50e-3, 6e-3, 7e-3, 3.5e-3, 5.69e-4, 1.45e-3, 1.45e-3, 3.54e-2, 2.04e-2, 1.77e-2, 0.19, 43.41, 12.84e-8, 12.84e-8, -7.53e-8, 3.61e-6, 3.61e-6, 1.5e-2, 1.5e-2, 20.37e-8, 1.89e-2, 5.31e-8, 0.97e-2, 2.1e+11, 0.3),
+    ('L60x60x5', 'L60x60x5', 4.57, 60e-3, 60e-3, 5e-3, 8e-3, 4e-3, 5.82e-4, 1.64e-3, 1.64e-3, 4.24e-2, 2.32e-2, 2.11e-2, 0.23, 51.04, 19.37e-8, 19.37e-8, -11.41e-8, 4.45e-6, 4.45e-6, 1.82e-2, 1.82e-2, 30.78e-8, 2.3e-2, 7.97e-8, 1.17e-2, 2.1e+11, 0.3),
+    ('L60x60x6', 'L60x60x6', 5.42, 60e-3, 60e-3, 6e-3, 8e-3, 4e-3, 6.91e-4, 1.69e-3, 1.69e-3, 4.24e-2, 2.39e-2, 2.11e-2, 0.23, 42.99, 22.79e-8, 22.79e-8, -13.41e-8, 5.29e-6, 5.29e-6, 1.82e-2, 1.82e-2, 36.21e-8, 2.29e-2, 9.38e-8, 1.17e-2, 2.1e+11, 0.3),
+    ('L60x60x8', 'L60x60x8', 7.09, 60e-3, 60e-3, 8e-3, 8e-3, 4e-3, 9.03e-4, 1.77e-3, 1.77e-3, 4.24e-2, 2.5e-2, 2.14e-2, 0.23, 32.89, 29.15e-8, 29.15e-8, -17.04e-8, 6.89e-6, 6.89e-6, 1.8e-2, 1.8e-2, 46.2e-8, 2.26e-2, 12.11e-8, 1.16e-2, 2.1e+11, 0.3),
+    ('L65x65x7', 'L65x65x7', 6.83, 65e-3, 65e-3, 7e-3, 9e-3, 4.5e-3, 8.7e-4, 1.85e-3, 1.85e-3, 4.6e-2, 2.61e-2, 2.29e-2, 0.25, 36.95, 33.43e-8, 33.43e-8, -19.65e-8, 7.18e-6, 7.18e-6, 1.96e-2, 1.96e-2, 53.09e-8, 2.47e-2, 13.78e-8, 1.26e-2, 2.1e+11, 0.3),
+    ('L70x70x6', 'L70x70x6', 6.38, 70e-3, 70e-3, 6e-3, 9e-3, 4.5e-3, 8.13e-4, 1.93e-3, 1.93e-3, 4.95e-2, 2.73e-2, 2.46e-2, 0.27, 42.68, 36.88e-8, 36.88e-8, -21.73e-8, 7.27e-6, 7.27e-6, 2.13e-2, 2.13e-2, 58.61e-8, 2.69e-2, 15.16e-8, 1.37e-2, 2.1e+11, 0.3),
+    ('L70x70x7', 'L70x70x7', 7.38, 70e-3, 70e-3, 7e-3, 9e-3, 4.5e-3, 9.4e-4, 1.97e-3, 1.97e-3, 4.95e-2, 2.79e-2, 2.47e-2, 0.27, 36.91, 42.3e-8, 42.3e-8, -24.9e-8, 8.41e-6, 8.41e-6, 2.12e-2, 2.12e-2, 67.19e-8, 2.67e-2, 17.4e-8, 1.36e-2, 2.1e+11, 0.3),
+    ('L75x75x6', 'L75x75x6', 6.85, 75e-3, 75e-3, 6e-3, 10e-3, 5e-3, 8.73e-4, 2.04e-3, 2.04e-3, 5.3e-2, 2.89e-2, 2.63e-2, 0.29, 42.44, 45.57e-8, 45.57e-8, -26.83e-8, 8.35e-6, 8.35e-6, 2.28e-2, 2.28e-2, 72.4e-8, 2.88e-2, 18.74e-8, 1.46e-2, 2.1e+11, 0.3),
+    ('L75x75x8', 'L75x75x8', 8.99, 75e-3, 75e-3, 8e-3, 10e-3, 5e-3, 11.4e-4, 2.13e-3, 2.13e-3, 5.3e-2, 3.01e-2, 2.65e-2, 0.29, 32.37, 58.87e-8, 58.87e-8, -34.62e-8, 10.96e-6, 10.96e-6, 2.27e-2, 2.27e-2, 93.49e-8, 2.86e-2, 24.25e-8, 1.45e-2, 2.1e+11, 0.3),
+    ('L80x80x8', 'L80x80x8', 9.63, 80e-3, 80e-3, 8e-3, 10e-3, 5e-3, 12.3e-4, 2.26e-3, 2.26e-3, 5.66e-2, 3.19e-2, 2.83e-2, 0.31, 32.34, 72.25e-8, 72.25e-8, -42.53e-8, 12.58e-6, 12.58e-6, 2.43e-2, 2.43e-2, 114.8e-8, 3.06e-2, 29.72e-8, 1.56e-2, 2.1e+11, 0.3),
+    ('L80x80x10', 'L80x80x10', 11.9, 80e-3, 80e-3, 10e-3, 10e-3, 5e-3, 15.1e-4, 2.34e-3, 2.34e-3, 5.66e-2, 3.3e-2, 2.85e-2, 0.31, 26.26, 87.5e-8, 87.5e-8, -51.27e-8, 15.45e-6, 15.45e-6, 2.41e-2, 2.41e-2, 138.8e-8, 3.03e-2, 36.23e-8, 1.55e-2, 2.1e+11, 0.3),
+    ('L90x90x7', 'L90x90x7', 9.61, 90e-3, 90e-3, 7e-3, 11e-3, 5.5e-3, 12.2e-4, 2.45e-3, 2.45e-3, 6.36e-2, 3.47e-2, 3.16e-2, 0.35, 36.48, 92.55e-8, 92.55e-8, -54.53e-8, 14.13e-6, 14.13e-6, 2.75e-2, 2.75e-2, 147.1e-8, 3.47e-2, 38.02e-8, 1.76e-2, 2.1e+11, 0.3),
+    ('L90x90x8', 'L90x90x8', 10.9, 90e-3, 90e-3, 8e-3, 11e-3, 5.5e-3, 13.9e-4, 2.5e-3, 2.5e-3, 6.36e-2, 3.53e-2, 3.17e-2, 0.35, 32.15, 104.4e-8, 104.4e-8, -61.51e-8, 16.05e-6, 16.05e-6, 2.74e-2, 2.74e-2, 165.9e-8, 3.46e-2, 42.87e-8, 1.76e-2, 2.1e+11, 0.3),
+    ('L90x90x9', 'L90x90x9', 12.2, 90e-3, 90e-3, 9e-3, 11e-3, 5.5e-3, 15.5e-4, 2.54e-3, 2.54e-3, 6.36e-2, 3.59e-2, 3.18e-2, 0.35, 28.77, 115.8e-8, 115.8e-8, -68.2e-8, 17.93e-6, 17.93e-6, 2.73e-2, 2.73e-2, 184e-8, 3.44e-2, 47.63e-8, 1.75e-2, 2.1e+11, 0.3),
+    ('L90x90x10', 'L90x90x10', 13.4, 90e-3, 90e-3, 10e-3, 11e-3, 5.5e-3, 17.1e-4, 2.58e-3, 2.58e-3, 6.36e-2, 3.65e-2, 3.19e-2, 0.35, 26.07, 126.9e-8, 126.9e-8, -74.6e-8, 19.77e-6, 19.77e-6, 2.72e-2, 2.72e-2, 201.5e-8, 3.43e-2, 52.32e-8, 1.75e-2, 2.1e+11, 0.3),
+    ('L100x100x8', 'L100x100x8', 12.2, 100e-3, 100e-3, 8e-3, 12e-3, 6e-3, 15.5e-4, 2.74e-3, 2.74e-3, 7.07e-2, 3.87e-2, 3.52e-2, 0.39, 32, 144.8e-8, 144.8e-8, -85.37e-8, 19.94e-6, 19.94e-6, 3.06e-2, 3.06e-2, 230.2e-8, 3.85e-2, 59.47e-8, 1.96e-2, 2.1e+11, 0.3),
+    ('L100x100x10', 'L100x100x10', 15, 100e-3, 100e-3, 10e-3, 12e-3, 6e-3, 19.2e-4, 2.82e-3, 2.82e-3, 7.07e-2, 3.99e-2, 3.54e-2, 0.39, 25.92, 176.7e-8, 176.7e-8, -104e-8, 24.62e-6, 24.62e-6, 3.04e-2, 3.04e-2, 280.7e-8, 3.83e-2, 72.65e-8, 1.95e-2, 2.1e+11, 0.3),
+    ('L100x100x12', 'L100x100x12', 17.8, 100e-3, 100e-3, 12e-3, 12e-3, 6e-3, 22.7e-4, 2.9e-3, 2.9e-3, 7.07e-2, 4.11e-2, 3.57e-2, 0.39, 21.86, 206.7e-8, 206.7e-8, -121.3e-8, 29.12e-6, 29.12e-6, 3.02e-2, 3.02e-2, 328e-8, 3.8e-2, 85.42e-8, 1.94e-2, 2.1e+11, 0.3),
+    ('L110x110x10', 'L110x110x10', 16.6, 110e-3, 110e-3, 10e-3, 13e-3, 6.5e-3, 21.2e-4, 3.06e-3, 3.06e-3, 7.78e-2, 4.33e-2, 3.88e-2, 0.429, 25.79, 238e-8, 238e-8, -140.3e-8, 29.99e-6, 29.99e-6, 3.35e-2, 3.35e-2, 378.2e-8, 4.23e-2, 97.72e-8, 2.15e-2, 2.1e+11, 0.3),
+    ('L110x110x12', 'L110x110x12', 19.7, 110e-3, 110e-3, 12e-3, 13e-3, 6.5e-3, 25.1e-4, 3.15e-3, 3.15e-3, 7.78e-2, 4.45e-2, 3.91e-2, 0.429, 21.73, 279.1e-8, 279.1e-8, -164.1e-8, 35.54e-6, 35.54e-6, 3.33e-2, 3.33e-2, 443.3e-8, 4.2e-2, 115e-8, 2.14e-2, 2.1e+11, 0.3),
+    ('L120x120x10', 'L120x120x10', 18.2, 120e-3, 120e-3, 10e-3, 13e-3, 6.5e-3, 23.2e-4, 3.31e-3, 3.31e-3, 8.49e-2, 4.69e-2, 4.24e-2, 0.469, 25.76, 312.9e-8, 312.9e-8, -184.6e-8, 36.03e-6, 36.03e-6, 3.67e-2, 3.67e-2, 497.6e-8, 4.63e-2, 128.3e-8, 2.35e-2, 2.1e+11, 0.3),
+    ('L120x120x11', 'L120x120x11', 19.9, 120e-3, 120e-3, 11e-3, 13e-3, 6.5e-3, 25.4e-4, 3.36e-3, 3.36e-3, 8.49e-2, 4.75e-2, 4.25e-2, 0.469, 23.54, 340.6e-8, 340.6e-8, -200.9e-8, 39.41e-6, 39.41e-6, 3.66e-2, 3.66e-2, 541.5e-8, 4.62e-2, 139.8e-8, 2.35e-2, 2.1e+11, 0.3),
+    ('L120x120x12', 'L120x120x12', 21.6, 120e-3, 120e-3, 12e-3, 13e-3, 6.5e-3, 27.5e-4, 3.4e-3, 3.4e-3, 8.49e-2, 4.8e-2, 4.26e-2, 0.469, 21.69, 367.7e-8, 367.7e-8, -216.6e-8, 42.73e-6, 42.73e-6, 3.65e-2, 3.65e-2, 584.3e-8, 4.61e-2, 151e-8, 2.34e-2, 2.1e+11, 0.3),
+    ('L120x120x13', 'L120x120x13', 23.3, 120e-3, 120e-3, 13e-3, 13e-3, 6.5e-3, 29.7e-4, 3.44e-3, 3.44e-3, 8.49e-2, 4.86e-2, 4.28e-2, 0.469, 20.12, 394e-8, 394e-8, -231.8e-8, 46.01e-6, 46.01e-6, 3.64e-2, 3.64e-2, 625.9e-8, 4.59e-2, 162.2e-8, 2.34e-2, 2.1e+11, 0.3),
+    ('L120x120x15', 'L120x120x15', 26.6, 120e-3, 120e-3, 15e-3, 13e-3, 6.5e-3, 33.9e-4, 3.51e-3, 3.51e-3, 8.49e-2, 4.97e-2, 4.31e-2, 0.469, 17.6, 444.9e-8, 444.9e-8, -260.7e-8, 52.43e-6, 52.43e-6, 3.62e-2, 3.62e-2, 705.6e-8, 4.56e-2, 184.2e-8, 2.33e-2, 2.1e+11, 0.3),
+    ('L130x130x12', 'L130x130x12', 23.6, 130e-3, 130e-3, 12e-3, 14e-3, 7e-3, 30e-4, 3.64e-3, 3.64e-3, 9.19e-2, 5.15e-2, 4.6e-2, 0.508, 21.59, 472.2e-8, 472.2e-8, -278.5e-8, 50.44e-6, 50.44e-6, 3.97e-2, 3.97e-2, 750.6e-8, 5e-2, 193.7e-8, 2.54e-2, 2.1e+11, 0.3),
+    ('L150x150x10', 'L150x150x10', 23, 150e-3, 150e-3, 10e-3, 16e-3, 8e-3, 29.3e-4, 4.03e-3, 4.03e-3, 10.61e-2, 5.71e-2, 5.28e-2, 0.586, 25.51, 624e-8, 624e-8, -368e-8, 56.91e-6, 56.91e-6, 4.62e-2, 4.62e-2, 992e-8, 5.82e-2, 256e-8, 2.96e-2, 2.1e+11, 0.3),
+    ('L150x150x12', 'L150x150x12', 27.3, 150e-3, 150e-3, 12e-3, 16e-3, 8e-3, 34.8e-4, 4.12e-3, 4.12e-3, 10.61e-2, 5.83e-2, 5.29e-2, 0.586, 21.44, 736.9e-8, 736.9e-8, -434.9e-8, 67.75e-6, 67.75e-6, 4.6e-2, 4.6e-2, 1172e-8, 5.8e-2, 302e-8, 2.94e-2, 2.1e+11, 0.3),
+    ('L150x150x14', 'L150x150x14', 31.6, 150e-3, 150e-3, 14e-3, 16e-3, 8e-3, 40.3e-4, 4.21e-3, 4.21e-3, 10.61e-2, 5.95e-2, 5.32e-2, 0.586, 18.53, 845.4e-8, 845.4e-8, -498.5e-8, 78.33e-6, 78.33e-6, 4.58e-2, 4.58e-2, 1344e-8, 5.77e-2, 346.9e-8, 2.93e-2, 2.1e+11, 0.3),
+    ('L150x150x15', 'L150x150x15', 33.8, 150e-3, 150e-3, 15e-3, 16e-3, 8e-3, 43e-4, 4.25e-3, 4.25e-3, 10.61e-2, 6.01e-2, 5.33e-2, 0.586, 17.36, 898.1e-8, 898.1e-8, -529.1e-8, 83.52e-6, 83.52e-6, 4.57e-2, 4.57e-2, 1427e-8, 5.76e-2, 368.9e-8, 2.93e-2, 2.1e+11, 0.3),
+    ('L150x150x18', 'L150x150x18', 40.1, 150e-3, 150e-3, 18e-3, 16e-3, 8e-3, 51e-4, 4.37e-3, 4.37e-3, 10.61e-2, 6.17e-2, 5.37e-2, 0.586, 14.63, 1050e-8, 1050e-8, -616.2e-8, 98.74e-6, 98.74e-6, 4.54e-2, 4.54e-2, 1666e-8, 5.71e-2, 433.8e-8, 2.92e-2, 2.1e+11, 0.3),
+    ('L160x160x14', 'L160x160x14', 33.9, 160e-3, 160e-3, 14e-3, 17e-3, 8.5e-3, 43.2e-4, 4.45e-3, 4.45e-3, 11.31e-2, 6.29e-2, 5.66e-2, 0.625, 18.46, 1034e-8, 1034e-8, -610e-8, 89.5e-6, 89.5e-6, 4.89e-2, 4.89e-2, 1644e-8, 6.17e-2, 423.8e-8, 3.13e-2, 2.1e+11, 0.3),
+    ('L160x160x15', 'L160x160x15', 36.2, 160e-3, 160e-3, 15e-3, 17e-3, 8.5e-3, 46.1e-4, 4.49e-3, 4.49e-3, 11.31e-2, 6.35e-2, 5.67e-2, 0.625, 17.3, 1099e-8, 1099e-8, -648e-8, 95.5e-6, 95.5e-6, 4.88e-2, 4.88e-2, 1747e-8, 6.16e-2, 450.8e-8, 3.13e-2, 2.1e+11, 0.3),
+    ('L160x160x16', 'L160x160x16', 38.4, 160e-3, 160e-3, 16e-3, 17e-3, 8.5e-3, 49e-4, 4.53e-3, 4.53e-3, 11.31e-2, 6.41e-2, 5.69e-2, 0.625, 16.28, 1163e-8, 1163e-8, -685.1e-8, 101.4e-6, 101.4e-6, 4.87e-2, 4.87e-2, 1848e-8, 6.14e-2, 477.6e-8, 3.12e-2, 2.1e+11, 0.3),
+    ('L160x160x17', 'L160x160x17', 40.7, 160e-3, 160e-3, 17e-3, 17e-3, 8.5e-3, 51.8e-4, 4.57e-3, 4.57e-3, 11.31e-2, 6.46e-2, 5.7e-2, 0.625, 15.37, 1225e-8, 1225e-8, -721.3e-8, 107.2e-6, 107.2e-6, 4.86e-2, 4.86e-2, 1947e-8, 6.13e-2, 504.1e-8, 3.12e-2, 2.1e+11, 0.3),
+    ('L180x180x13', 'L180x180x13', 35.7, 180e-3, 180e-3, 13e-3, 18e-3, 9e-3, 45.5e-4, 4.9e-3, 4.9e-3, 12.73e-2, 6.93e-2, 6.35e-2, 0.705, 19.74, 1396e-8, 1396e-8, -824.5e-8, 106.5e-6, 106.5e-6, 5.54e-2, 5.54e-2, 2221e-8, 6.99e-2, 571.6e-8, 3.55e-2, 2.1e+11, 0.3),
+    ('L180x180x14', 'L180x180x14', 38.3, 180e-3, 180e-3, 14e-3, 18e-3, 9e-3, 48.8e-4, 4.94e-3, 4.94e-3, 12.73e-2, 6.99e-2, 6.36e-2, 0.705, 18.4, 1493e-8, 1493e-8, -882e-8, 114.3e-6, 114.3e-6, 5.53e-2, 5.53e-2, 2375e-8, 6.98e-2, 611.3e-8, 3.54e-2, 2.1e+11, 0.3),
+    ('L180x180x15', 'L180x180x15', 40.9, 180e-3, 180e-3, 15e-3, 18e-3, 9e-3, 52.1e-4, 4.98e-3, 4.98e-3, 12.73e-2, 7.05e-2, 6.37e-2, 0.705, 17.23, 1589e-8, 1589e-8, -938e-8, 122e-6, 122e-6, 5.52e-2, 5.52e-2, 2527e-8, 6.96e-2, 650.5e-8, 3.53e-2, 2.1e+11, 0.3),
+    ('L180x180x16', 'L180x180x16', 43.5, 180e-3, 180e-3, 16e-3, 18e-3, 9e-3, 55.4e-4, 5.02e-3, 5.02e-3, 12.73e-2, 7.1e-2, 6.38e-2, 0.705, 16.2, 1682e-8, 1682e-8, -993e-8, 129.7e-6, 129.7e-6, 5.51e-2, 5.51e-2, 2675e-8, 6.95e-2, 689.4e-8, 3.53e-2, 2.1e+11, 0.3),
+    ('L180x180x17', 'L180x180x17', 46, 180e-3, 180e-3, 17e-3, 18e-3, 9e-3, 58.7e-4, 5.06e-3, 5.06e-3, 12.73e-2, 7.16e-2, 6.4e-2, 0.705, 15.3, 1775e-8, 1775e-8, -1047e-8, 137.2e-6, 137.2e-6, 5.5e-2, 5.5e-2, 2822e-8, 6.94e-2, 727.8e-8, 3.52e-2, 2.1e+11, 0.3),
+    ('L180x180x18', 'L180x180x18', 48.6, 180e-3, 180e-3, 18e-3, 18e-3, 9e-3, 61.9e-4, 5.1e-3, 5.1e-3, 12.73e-2, 7.22e-2, 6.41e-2, 0.705, 14.5, 1866e-8, 1866e-8, -1100e-8, 144.7e-6, 144.7e-6, 5.49e-2, 5.49e-2, 2965e-8, 6.92e-2, 766e-8, 3.52e-2, 2.1e+11, 0.3),
+    ('L180x180x19', 'L180x180x19', 51.1, 180e-3, 180e-3, 19e-3, 18e-3, 9e-3, 65.1e-4, 5.14e-3, 5.14e-3, 12.73e-2, 7.27e-2, 6.42e-2, 0.705, 13.78, 1955e-8, 1955e-8, -1151e-8, 152.1e-6, 152.1e-6, 5.48e-2, 5.48e-2, 3106e-8, 6.91e-2, 803.8e-8, 3.51e-2, 2.1e+11, 0.3),
+    ('L180x180x20', 'L180x180x20', 53.7, 180e-3, 180e-3, 20e-3, 18e-3, 9e-3, 68.4e-4, 5.18e-3, 5.18e-3, 12.73e-2, 7.33e-2, 6.44e-2, 0.705, 13.13, 2043e-8, 2043e-8, -1202e-8, 159.4e-6, 159.4e-6, 5.47e-2, 5.47e-2, 3244e-8, 6.89e-2, 841.3e-8, 3.51e-2, 2.1e+11, 0.3),
+    ('L200x200x15', 'L200x200x15', 45.6, 200e-3, 200e-3, 15e-3, 18e-3, 9e-3, 58.1e-4, 5.48e-3, 5.48e-3, 14.14e-2, 7.75e-2, 7.08e-2, 0.785, 17.2, 2209e-8, 2209e-8, -1306e-8, 152.2e-6, 152.2e-6, 6.17e-2, 6.17e-2, 3516e-8, 7.78e-2, 903e-8, 3.94e-2, 2.1e+11, 0.3),
+    ('L200x200x16', 'L200x200x16', 48.5, 200e-3, 200e-3, 16e-3, 18e-3, 9e-3, 61.8e-4, 5.52e-3, 5.52e-3, 14.14e-2, 7.81e-2, 7.09e-2, 0.785, 16.18, 2341e-8, 2341e-8, -1384e-8, 161.7e-6, 161.7e-6, 6.16e-2, 6.16e-2, 3726e-8, 7.77e-2, 957e-8, 3.94e-2, 2.1e+11, 0.3),
+    ('L200x200x17', 'L200x200x17', 51.4, 200e-3, 200e-3, 17e-3, 18e-3, 9e-3, 65.5e-4, 5.56e-3, 5.56e-3, 14.14e-2, 7.87e-2, 7.1e-2, 0.785, 15.27, 2472e-8, 2472e-8, -1461e-8, 171.2e-6, 171.2e-6, 6.14e-2, 6.14e-2, 3932e-8, 7.75e-2, 1011e-8, 3.93e-2, 2.1e+11, 0.3),
+    ('L200x200x18', 'L200x200x18', 54.3, 200e-3, 200e-3, 18e-3, 18e-3, 9e-3, 69.1e-4, 5.6e-3, 5.6e-3, 14.14e-2, 7.93e-2, 7.12e-2, 0.785, 14.46, 2600e-8, 2600e-8, -1536e-8, 180.6e-6, 180.6e-6, 6.13e-2, 6.13e-2, 4135e-8, 7.74e-2, 1064e-8, 3.92e-2, 2.1e+11, 0.3),
+    ('L200x200x19', 'L200x200x19', 57.1, 200e-3, 200e-3, 19e-3, 18e-3, 9e-3, 72.7e-4, 5.64e-3, 5.64e-3, 14.14e-2, 7.98e-2, 7.13e-2, 0.785, 13.74, 2726e-8, 2726e-8, -1609e-8, 189.9e-6, 189.9e-6, 6.12e-2, 6.12e-2, 4335e-8, 7.72e-2, 1117e-8, 3.92e-2, 2.1e+11, 0.3),
+    ('L200x200x20', 'L200x200x20', 59.9, 200e-3, 200e-3, 20e-3, 18e-3, 9e-3, 76.3e-4, 5.68e-3, 5.68e-3, 14.14e-2, 8.04e-2, 7.15e-2, 0.785, 13.09, 2851e-8, 2851e-8, -1681e-8, 199.1e-6, 199.1e-6, 6.11e-2, 6.11e-2, 4532e-8, 7.7e-2, 1169e-8, 3.91e-2, 2.1e+11, 0.3),
+    ('L200x200x21', 'L200x200x21', 62.8, 200e-3, 200e-3, 21e-3, 18e-3, 9e-3, 79.9e-4, 5.72e-3, 5.72e-3, 14.14e-2, 8.09e-2, 7.16e-2, 0.785, 12.5, 2973e-8, 2973e-8, -1752e-8, 208.2e-6, 208.2e-6, 6.1e-2, 6.1e-2, 4725e-8, 7.69e-2, 1221e-8, 3.91e-2, 2.1e+11, 0.3),
+    ('L200x200x22', 'L200x200x22', 65.6, 200e-3, 200e-3, 22e-3, 18e-3, 9e-3, 83.5e-4, 5.76e-3, 5.76e-3, 14.14e-2, 8.15e-2, 7.18e-2, 0.785, 11.97, 3094e-8, 3094e-8, -1821e-8, 217.3e-6, 217.3e-6, 6.09e-2, 6.09e-2, 4915e-8, 7.67e-2, 1273e-8, 3.9e-2, 2.1e+11, 0.3),
+    ('L200x200x23', 'L200x200x23', 68.3, 200e-3, 200e-3, 23e-3, 18e-3, 9e-3, 87.1e-4, 5.8e-3, 5.8e-3, 14.14e-2, 8.2e-2, 7.19e-2, 0.785, 11.48, 3213e-8, 3213e-8, -1889e-8, 226.3e-6, 226.3e-6, 6.08e-2, 6.08e-2, 5102e-8, 7.66e-2, 1324e-8, 3.9e-2, 2.1e+11, 0.3),
+    ('L200x200x24', 'L200x200x24', 71.1, 200e-3, 200e-3, 24e-3, 18e-3, 9e-3, 91e-4, 5.84e-3, 5.84e-3, 14.14e-2, 8.26e-2, 7.21e-2, 0.785, 11.03, 3331e-8, 3331e-8, -1955e-8, 235.2e-6, 235.2e-6, 6.06e-2, 6.06e-2, 5286e-8, 7.64e-2, 1375e-8, 3.9e-2, 2.1e+11, 0.3),
+    ('L200x200x25', 'L200x200x25', 73.9, 200e-3, 200e-3, 25e-3, 18e-3, 9e-3, 94.1e-4, 5.88e-3, 5.88e-3, 14.14e-2, 8.31e-2, 7.23e-2, 0.785, 10.62, 3446e-8, 3446e-8, -2020e-8, 244e-6, 244e-6, 6.05e-2, 6.05e-2, 5467e-8, 7.62e-2, 1426e-8, 3.89e-2, 2.1e+11, 0.3),
+    ('L200x200x26', 'L200x200x26', 76.6, 200e-3, 200e-3, 26e-3, 18e-3, 9e-3, 97.6e-4, 5.91e-3, 5.91e-3, 14.14e-2, 8.36e-2, 7.25e-2, 0.785, 10.24, 3560e-8, 3560e-8, -2084e-8, 252.7e-6, 252.7e-6, 6.04e-2, 6.04e-2, 5645e-8, 7.61e-2, 1476e-8, 3.89e-2, 2.1e+11, 0.3),
+    ('L250x250x20', 'L250x250x20', 75.6, 250e-3, 250e-3, 20e-3, 18e-3, 9e-3, 96.4e-4, 6.93e-3, 6.93e-3, 17.68e-2, 9.81e-2, 8.91e-2, 0.985, 13.02, 5743e-8, 5743e-8, -3401e-8, 317.9e-6, 317.9e-6, 7.72e-2, 7.72e-2, 9144e-8, 9.74e-2, 2341e-8, 4.93e-2, 2.1e+11, 0.3),
+    ('L250x250x21', 'L250x250x21', 79.2, 250e-3, 250e-3, 21e-3, 18e-3, 9e-3, 101e-4, 6.97e-3, 6.97e-3, 17.68e-2, 9.86e-2, 8.93e-2, 0.985, 12.43, 5997e-8, 5997e-8, -3550e-8, 332.7e-6, 332.7e-6, 7.71e-2, 7.71e-2, 9548e-8, 9.73e-2, 2447e-8, 4.92e-2, 2.1e+11, 0.3),
+    ('L250x250x22', 'L250x250x22', 82.8, 250e-3, 250e-3, 22e-3, 18e-3, 9e-3, 106e-4, 7.01e-3, 7.01e-3, 17.68e-2, 9.92e-2, 8.94e-2, 0.985, 11.89, 6249e-8, 6249e-8, -3697e-8, 347.4e-6, 347.4e-6, 7.7e-2, 7.7e-2, 9946e-8, 9.71e-2, 2551e-8, 4.92e-2, 2.1e+11, 0.3),
+    ('L250x250x23', 'L250x250x23', 86.4, 250e-3, 250e-3, 23e-3, 18e-3, 9e-3, 110e-4, 7.05e-3, 7.05e-3, 17.68e-2, 9.97e-2, 8.96e-2, 0.985, 11.4, 6497e-8, 6497e-8, -3842e-8, 362e-6, 362e-6, 7.68e-2, 7.68e-2, 10339e-8, 9.69e-2, 2655e-8, 4.91e-2, 2.1e+11, 0.3),
+    ('L250x250x24', 'L250x250x24', 90, 250e-3, 250e-3, 24e-3, 18e-3, 9e-3, 115e-4, 7.09e-3, 7.09e-3, 17.68e-2, 10.03e-2, 8.98e-2, 0.985, 10.95, 6743e-8, 6743e-8, -3984e-8, 376.5e-6, 376.5e-6, 7.67e-2, 7.67e-2, 10727e-8, 9.68e-2, 2759e-8, 4.91e-2, 2.1e+11, 0.3),
+    ('L250x250x25', 'L250x250x25', 93.5, 250e-3, 250e-3, 25e-3, 18e-3, 9e-3, 119e-4, 7.13e-3, 7.13e-3, 17.68e-2, 10.08e-2, 8.99e-2, 0.985, 10.53, 6986e-8, 6986e-8, -4124e-8, 390.9e-6, 390.9e-6, 7.66e-2, 7.66e-2, 11110e-8, 9.66e-2, 2861e-8, 4.9e-2, 2.1e+11, 0.3),
+    ('L250x250x26', 'L250x250x26', 97, 250e-3, 250e-3, 26e-3, 18e-3, 9e-3, 124e-4, 7.17e-3, 7.17e-3, 17.68e-2, 10.13e-2, 9.01e-2, 0.985, 10.15, 7226e-8, 7226e-8, -4262e-8, 405.2e-6, 405.2e-6, 7.65e-2, 7.65e-2, 11488e-8, 9.64e-2, 2963e-8, 4.9e-2, 2.1e+11, 0.3),
+    ('L250x250x27', 'L250x250x27', 101, 250e-3, 250e-3, 27e-3, 18e-3, 9e-3, 128e-4, 7.2e-3, 7.2e-3, 17.68e-2, 10.19e-2, 9.03e-2, 0.985, 9.79, 7463e-8, 7463e-8, -4398e-8, 419.3e-6, 419.3e-6, 7.63e-2, 7.63e-2, 11861e-8, 9.62e-2, 3065e-8, 4.89e-2, 2.1e+11, 0.3),
+    ('L250x250x28', 'L250x250x28', 104, 250e-3, 250e-3, 28e-3, 18e-3, 9e-3, 133e-4, 7.24e-3, 7.24e-3, 17.68e-2, 10.24e-2, 9.04e-2, 0.985, 9.47, 7697e-8, 7697e-8, -4532e-8, 433.4e-6, 433.4e-6, 7.62e-2, 7.62e-2, 12229e-8, 9.61e-2, 3166e-8, 4.89e-2, 2.1e+11, 0.3),
+    ('L250x250x35', 'L250x250x35', 128, 250e-3, 250e-3, 35e-3, 18e-3, 9e-3, 163e-4, 7.5e-3, 7.5e-3, 17.68e-2, 10.61e-2, 9.17e-2, 0.985, 7.69, 9264e-8, 9264e-8, -5405e-8, 529.4e-6, 529.4e-6, 7.54e-2, 7.54e-2, 14669e-8, 9.48e-2, 3859e-8, 4.86e-2, 2.1e+11, 0.3),
+    ('L203x203x19', 'L203x203x19', 57.9, 203e-3, 203e-3, 19e-3, 8e-3, 4e-3, 73.6e-4, 5.76e-3, 5.76e-3, 14.35e-2, 8.15e-2, 7.38e-2, 0.805, 13.94, 2881e-8, 2881e-8, -1707e-8, 198.2e-6, 198.2e-6, 6.26e-2, 6.26e-2, 4588e-8, 7.9e-2, 1174e-8, 3.99e-2, 2.1e+11, 0.3),
+    ('L203x203x22.2', 'L203x203x22.2', 67, 203e-3, 203e-3, 22.2e-3, 8e-3, 4e-3, 85e-4, 5.88e-3, 5.88e-3, 14.35e-2, 8.32e-2, 7.44e-2, 0.805, 12.03, 3293e-8, 3293e-8, -1943e-8, 228.4e-6, 228.4e-6, 6.21e-2, 6.21e-2, 5236e-8, 7.84e-2, 1350e-8, 3.98e-2, 2.1e+11, 0.3),
+    ('L203x203x25.4', 'L203x203x25.4', 75.9, 203e-3, 203e-3, 25.4e-3, 8e-3, 4e-3, 96.8e-4, 6e-3, 6e-3, 14.35e-2, 8.48e-2, 7.5e-2, 0.805, 10.6, 3686e-8, 3686e-8, -2164e-8, 257.7e-6, 257.7e-6, 6.17e-2, 6.17e-2, 5850e-8, 7.78e-2, 1522e-8, 3.97e-2, 2.1e+11, 0.3),
+    ('L203x203x28.6', 'L203x203x28.6', 84.7, 203e-3, 203e-3, 28.6e-3, 8e-3, 4e-3, 108e-4, 6.11e-3, 6.11e-3, 14.35e-2, 8.65e-2, 7.57e-2, 0.805, 9.5, 4062e-8, 4062e-8, -2370e-8, 286.3e-6, 286.3e-6, 6.13e-2, 6.13e-2, 6432e-8, 7.72e-2, 1692e-8, 3.96e-2, 2.1e+11, 0.3),
+    )
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR R shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'd', 'r', 'P', 'A', 'E', 'nu')
+
+rows= (
+    ('R10', "R10", 10e-3, 5e-3, 0.617, 0.785e-4, 210000e6, 0.3),
+    ('R12', "R12", 12e-3, 6e-3, 0.888, 1.13e-4, 210000e6, 0.3),
+    ('R14', "R14", 14e-3, 7e-3, 1.21, 1.54e-4, 210000e6, 0.3),
+    ('R16', "R16", 16e-3, 8e-3, 1.58, 2.01e-4, 210000e6, 0.3),
+    ('R18', "R18", 18e-3, 9e-3, 2, 2.54e-4, 210000e6, 0.3),
+    ('R20', "R20", 20e-3, 10e-3, 2.47, 3.14e-4, 210000e6, 0.3),
+    ('R22', "R22", 22e-3, 11e-3, 2.98, 3.8e-4, 210000e6, 0.3),
+    ('R22_25', "R22_25", 22.25e-3, 11.125e-3, 3.05, 3.89e-4, 210000e6, 0.3),
+    ('R23_6', "R23_6", 23.6e-3, 11.8e-3, 3.43, 4.37e-4, 210000e6, 0.3),
+    ('R24', "R24", 24e-3, 12e-3, 3.55, 4.52e-4, 210000e6, 0.3),
+    ('R24_5', "R24_5", 24.5e-3, 12.25e-3, 3.7, 4.71e-4, 210000e6, 0.3),
+    ('R25', "R25", 25e-3, 12.5e-3, 3.85, 4.91e-4, 210000e6, 0.3),
+    ('R26', "R26", 26e-3, 13e-3, 4.17, 5.31e-4, 210000e6, 0.3),
+    ('R26_7', "R26_7", 26.7e-3, 13.35e-3, 4.4, 5.6e-4, 210000e6, 0.3),
+    ('R27', "R27", 27e-3, 13.5e-3, 4.49, 5.73e-4, 210000e6, 0.3),
+    ('R28', "R28", 28e-3, 14e-3, 4.83, 6.16e-4, 210000e6, 0.3),
+    ('R29', "R29", 29e-3, 14.5e-3, 5.19, 6.61e-4, 210000e6, 0.3),
+    ('R29_5', "R29_5", 29.5e-3, 14.75e-3, 5.37, 6.83e-4, 210000e6, 0.3),
+    ('R29_7', "R29_7", 29.7e-3, 14.85e-3, 5.44, 6.93e-4, 210000e6, 0.3),
+    ('R30', "R30", 30e-3, 15e-3, 5.55, 7.07e-4, 210000e6, 0.3),
+    ('R31', "R31", 31e-3, 15.5e-3, 5.92, 7.55e-4, 210000e6, 0.3),
+    ('R32', "R32", 32e-3, 16e-3, 6.31, 8.04e-4, 210000e6, 0.3),
+    ('R34', "R34", 34e-3, 17e-3, 7.13, 9.08e-4, 210000e6, 0.3),
+    ('R34_4', "R34_4", 34.4e-3, 17.2e-3, 7.3, 9.29e-4, 210000e6, 0.3),
+    ('R35', "R35", 35e-3, 17.5e-3, 7.55, 9.62e-4, 210000e6, 0.3),
+    ('R35_7', "R35_7", 35.7e-3, 17.85e-3, 7.86, 10e-4, 210000e6, 0.3),
+    ('R36', "R36", 36e-3, 18e-3, 7.99, 10.2e-4, 210000e6, 0.3),
+    ('R37', "R37", 37e-3, 18.5e-3, 8.44, 10.8e-4, 210000e6, 0.3),
+    ('R38', "R38", 38e-3, 19e-3, 8.9, 11.3e-4, 210000e6, 0.3),
+    ('R39', "R39", 39e-3, 19.5e-3, 9.38, 11.9e-4, 210000e6, 0.3),
+    ('R39_2', "R39_2", 39.2e-3, 19.6e-3, 9.47, 12.1e-4, 210000e6, 0.3),
+    ('R40', "R40", 40e-3, 20e-3, 9.86, 12.6e-4, 210000e6, 0.3),
+    ('R42', "R42", 42e-3, 21e-3, 10.9, 13.9e-4, 210000e6, 0.3),
+    ('R44', "R44", 44e-3, 22e-3, 11.9, 15.2e-4, 210000e6, 0.3),
+    ('R45', "R45", 45e-3, 22.5e-3, 12.5, 15.9e-4, 210000e6, 0.3),
+    ('R46', "R46", 46e-3, 23e-3, 13, 16.6e-4, 210000e6, 0.3),
+    ('R47', "R47", 47e-3, 23.5e-3, 13.6, 17.3e-4, 210000e6, 0.3),
+    ('R48', "R48", 48e-3, 24e-3, 14.2, 18.1e-4, 210000e6, 0.3),
+    ('R49_2', "R49_2", 49.2e-3, 24.6e-3, 14.9, 19e-4, 210000e6, 0.3),
+    ('R50', "R50", 50e-3, 25e-3, 15.4, 19.6e-4, 210000e6, 0.3),
+    ('R51', "R51", 51e-3, 25.5e-3, 16, 20.4e-4, 210000e6, 0.3),
+    ('R52', "R52", 52e-3, 26e-3, 16.7, 21.2e-4, 210000e6, 0.3),
+    ('R53', "R53", 53e-3, 26.5e-3, 17.3, 22.1e-4, 210000e6, 0.3),
+    ('R54', "R54", 54e-3, 27e-3, 18, 22.9e-4, 210000e6, 0.3),
+    ('R55', "R55", 55e-3, 27.5e-3, 18.7, 23.8e-4, 210000e6, 0.3),
+    ('R55_8', "R55_8", 55.8e-3, 27.9e-3, 19.2, 24.5e-4, 210000e6, 0.3),
+    ('R56', "R56", 56e-3, 28e-3, 19.3, 24.6e-4, 210000e6, 0.3),
+    ('R57', "R57", 57e-3, 28.5e-3, 20, 25.5e-4, 210000e6, 0.3),
+    ('R58', "R58", 58e-3, 29e-3, 20.7, 26.4e-4, 210000e6, 0.3),
+    ('R59', "R59", 59e-3, 29.5e-3, 21.5, 27.3e-4, 210000e6, 0.3),
+    ('R60', "R60", 60e-3, 30e-3, 22.2, 28.3e-4, 210000e6, 0.3),
+    ('R62', "R62", 62e-3, 31e-3, 23.7, 30.2e-4, 210000e6, 0.3),
+    ('R63', "R63", 63e-3, 31.5e-3, 24.5, 31.2e-4, 210000e6, 0.3),
+    ('R65', "R65", 65e-3, 32.5e-3, 26, 33.2e-4, 210000e6, 0.3),
+    ('R70', "R70", 70e-3, 35e-3, 30.2, 38.5e-4, 210000e6, 0.3),
+    ('R75', "R75", 75e-3, 37.5e-3, 34.7, 44.2e-4, 210000e6, 0.3),
+    ('R80', "R80", 80e-3, 40e-3, 39.5, 50.3e-4, 210000e6, 0.3),
+    ('R85', "R85", 85e-3, 42.5e-3, 44.5, 56.7e-4, 210000e6, 0.3),
+    ('R90', "R90", 90e-3, 45e-3, 49.9, 63.6e-4, 210000e6, 0.3),
+    ('R95', "R95", 95e-3, 47.5e-3, 55.6, 70.9e-4, 210000e6, 0.3),
+    ('R100', "R100", 100e-3, 50e-3, 61.7, 78.5e-4, 210000e6, 0.3),
+    ('R105', "R105", 105e-3, 52.5e-3, 68, 86.6e-4, 210000e6, 0.3),
+    ('R110', "R110", 110e-3, 55e-3, 74.6, 95e-4, 210000e6, 0.3),
+    ('R120', "R120", 120e-3, 60e-3, 88.8, 113e-4, 210000e6, 0.3),
+    ('R130', "R130", 130e-3, 65e-3, 104, 133e-4, 210000e6, 0.3),
+    )
@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR RHS shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'b', 'h', 'e', 'P', 'A', 'Iz', 'Wzel', 'Wzpl', 'iz', 'Iy', 'Wyel', 'Wypl', 'iy', 'It', 'E', 'nu')
+
+rows= (
+    ('RHS50x30x2_5', '50x30x2_5', 30e-3, 50e-3, 2.5e-3, 2.817, 3.59e-4, 11.3e-8, 4.52e-6, 5.7e-6, 1.77e-2, 5.05e-8, 3.37e-6, 3.98e-6, 1.19e-2, 11.74e-8, 210000e6, 0.3),
+    ('RHS50x30x3', '50x30x3', 30e-3, 50e-3, 3e-3, 3.303, 4.21e-4, 12.83e-8, 5.13e-6, 6.57e-6, 1.75e-2, 5.7e-8, 3.8e-6, 4.58e-6, 1.16e-2, 13.53e-8, 210000e6, 0.3),
+    ('RHS50x30x4', '50x30x4', 30e-3, 50e-3, 4e-3, 4.198, 5.35e-4, 15.25e-8, 6.1e-6, 8.05e-6, 1.69e-2, 6.69e-8, 4.46e-6, 5.58e-6, 1.12e-2, 16.53e-8, 210000e6, 0.3),
+    ('RHS60x20x2_5', '60x20x2_5', 20e-3, 60e-3, 2.5e-3, 2.817, 3.59e-4, 13.8e-8, 4.6e-6, 6.18e-6, 1.96e-2, 2.31e-8, 2.31e-6, 2.75e-6, 0.8e-2, 6.96e-8, 210000e6, 0.3),
+    ('RHS60x20x3', '60x20x3', 20e-3, 60e-3, 3e-3, 3.303, 4.21e-4, 15.62e-8, 5.21e-6, 7.11e-6, 1.93e-2, 2.56e-8, 2.56e-6, 3.14e-6, 0.78e-2, 7.87e-8, 210000e6, 0.3),
+    ('RHS60x20x4', '60x20x4', 20e-3, 60e-3, 4e-3, 4.198, 5.35e-4, 18.42e-8, 6.14e-6, 8.68e-6, 1.86e-2, 2.9e-8, 2.9e-6, 3.75e-6, 0.74e-2, 9.24e-8, 210000e6, 0.3),
+    ('RHS60x40x2_5', '60x40x2_5', 40e-3, 60e-3, 2.5e-3, 3.602, 4.59e-4, 22.07e-8, 7.36e-6, 9.06e-6, 2.19e-2, 11.74e-8, 5.87e-6, 6.84e-6, 1.6e-2, 25.14e-8, 210000e6, 0.3),
+    ('RHS60x40x3', '60x40x3', 40e-3, 60e-3, 3e-3, 4.245, 5.41e-4, 25.38e-8, 8.46e-6, 10.53e-6, 2.17e-2, 13.44e-8, 6.72e-6, 7.94e-6, 1.58e-2, 29.28e-8, 210000e6, 0.3),
+    ('RHS60x40x4', '60x40x4', 40e-3, 60e-3, 4e-3, 5.454, 6.95e-4, 30.99e-8, 10.33e-6, 13.16e-6, 2.11e-2, 16.28e-8, 8.14e-6, 9.89e-6, 1.53e-2, 36.67e-8, 210000e6, 0.3),
+    ('RHS60x40x5', '60x40x5', 40e-3, 60e-3, 5e-3, 6.56, 8.36e-4, 35.33e-8, 11.78e-6, 15.38e-6, 2.06e-2, 18.43e-8, 9.21e-6, 11.52e-6, 1.48e-2, 42.85e-8, 210000e6, 0.3),
+    ('RHS70x30x2_5', '70x30x2_5', 30e-3, 70e-3, 2.5e-3, 3.602, 4.59e-4, 26.62e-8, 7.61e-6, 9.79e-6, 2.41e-2, 6.95e-8, 4.63e-6, 5.36e-6, 1.23e-2, 18.62e-8, 210000e6, 0.3),
+    ('RHS70x30x3', '70x30x3', 30e-3, 70e-3, 3e-3, 4.245, 5.41e-4, 30.57e-8, 8.74e-6, 11.38e-6, 2.38e-2, 7.9e-8, 5.26e-6, 6.2e-6, 1.21e-2, 21.53e-8, 210000e6, 0.3),
+    ('RHS70x30x4', '70x30x4', 30e-3, 70e-3, 4e-3, 5.454, 6.95e-4, 37.23e-8, 10.64e-6, 14.2e-6, 2.31e-2, 9.42e-8, 6.28e-6, 7.66e-6, 1.16e-2, 26.53e-8, 210000e6, 0.3),
+    ('RHS70x30x5', '70x30x5', 30e-3, 70e-3, 5e-3, 6.56, 8.36e-4, 42.3e-8, 12.08e-6, 16.56e-6, 2.25e-2, 10.49e-8, 6.99e-6, 8.84e-6, 1.12e-2, 30.45e-8, 210000e6, 0.3),
+    ('RHS70x50x2', '70x50x2', 50e-3, 70e-3, 2e-3, 3.562, 4.54e-4, 31.48e-8, 8.99e-6, 10.8e-6, 2.63e-2, 18.76e-8, 7.5e-6, 8.58e-6, 2.03e-2, 37.45e-8, 210000e6, 0.3),
+    ('RHS70x50x3', '70x50x3', 50e-3, 70e-3, 3e-3, 5.187, 6.61e-4, 44.05e-8, 12.59e-6, 15.4e-6, 2.58e-2, 26.1e-8, 10.44e-6, 12.21e-6, 1.99e-2, 53.62e-8, 210000e6, 0.3),
+    ('RHS70x50x4', '70x50x4', 50e-3, 70e-3, 4e-3, 6.71, 8.55e-4, 54.67e-8, 15.62e-6, 19.48e-6, 2.53e-2, 32.22e-8, 12.89e-6, 15.41e-6, 1.94e-2, 68.07e-8, 210000e6, 0.3),
+    ('RHS70x50x5', '70x50x5', 50e-3, 70e-3, 5e-3, 8.13, 10.36e-4, 63.46e-8, 18.13e-6, 23.06e-6, 2.48e-2, 37.2e-8, 14.88e-6, 18.2e-6, 1.9e-2, 80.77e-8, 210000e6, 0.3),
+    ('RHS80x40x2', '80x40x2', 40e-3, 80e-3, 2e-3, 3.562, 4.54e-4, 37.36e-8, 9.34e-6, 11.61e-6, 2.87e-2, 12.72e-8, 6.36e-6, 7.17e-6, 1.67e-2, 30.88e-8, 210000e6, 0.3),
+    ('RHS80x40x3', '80x40x3', 40e-3, 80e-3, 3e-3, 5.187, 6.61e-4, 52.25e-8, 13.06e-6, 16.54e-6, 2.81e-2, 17.56e-8, 8.78e-6, 10.16e-6, 1.63e-2, 43.88e-8, 210000e6, 0.3),
+    ('RHS80x40x4', '80x40x4', 40e-3, 80e-3, 4e-3, 6.71, 8.55e-4, 64.79e-8, 16.2e-6, 20.91e-6, 2.75e-2, 21.49e-8, 10.74e-6, 12.77e-6, 1.59e-2, 55.24e-8, 210000e6, 0.3),
+    ('RHS80x40x5', '80x40x5', 40e-3, 80e-3, 5e-3, 8.13, 10.36e-4, 75.11e-8, 18.78e-6, 24.74e-6, 2.69e-2, 24.59e-8, 12.3e-6, 15.02e-6, 1.54e-2, 64.97e-8, 210000e6, 0.3),
+    ('RHS80x60x2', '80x60x2', 60e-3, 80e-3, 2e-3, 4.19, 5.34e-4, 49.53e-8, 12.38e-6, 14.73e-6, 3.05e-2, 31.87e-8, 10.62e-6, 12.11e-6, 2.44e-2, 61.22e-8, 210000e6, 0.3),
+    ('RHS80x60x3', '80x60x3', 60e-3, 80e-3, 3e-3, 6.129, 7.81e-4, 70.05e-8, 17.51e-6, 21.16e-6, 3e-2, 44.89e-8, 14.96e-6, 17.37e-6, 2.4e-2, 88.35e-8, 210000e6, 0.3),
+    ('RHS80x60x4', '80x60x4', 60e-3, 80e-3, 4e-3, 7.966, 10.15e-4, 87.92e-8, 21.98e-6, 26.99e-6, 2.94e-2, 56.12e-8, 18.71e-6, 22.12e-6, 2.35e-2, 113.12e-8, 210000e6, 0.3),
+    ('RHS80x60x5', '80x60x5', 60e-3, 80e-3, 5e-3, 9.7, 12.36e-4, 103.28e-8, 25.82e-6, 32.24e-6, 2.89e-2, 65.66e-8, 21.89e-6, 26.38e-6, 2.31e-2, 135.53e-8, 210000e6, 0.3),
+    ('RHS80x70x2', '80x70x2', 70e-3, 80e-3, 2e-3, 4.504, 5.7e-4, 55.61e-8, 13.9e-6, 16.29e-6, 3.11e-2, 45.35e-8, 12.96e-6, 14.88e-6, 2.81e-2, 78.31e-8, 210000e6, 0.3),
+    ('RHS80x70x3', '80x70x3', 70e-3, 80e-3, 3e-3, 6.6, 8.4e-4, 78.94e-8, 19.74e-6, 23.47e-6, 3.06e-2, 64.26e-8, 18.36e-6, 21.43e-6, 2.76e-2, 113.44e-8, 210000e6, 0.3),
+    ('RHS80x70x4', '80x70x4', 70e-3, 80e-3, 4e-3, 8.594, 10.9e-4, 99.48e-8, 24.87e-6, 30.03e-6, 3.01e-2, 80.84e-8, 23.1e-6, 27.4e-6, 2.72e-2, 145.86e-8, 210000e6, 0.3),
+    ('RHS80x70x5', '80x70x5', 70e-3, 80e-3, 5e-3, 10.485, 13.4e-4, 117.36e-8, 29.34e-6, 35.99e-6, 2.96e-2, 95.21e-8, 27.2e-6, 32.81e-6, 2.67e-2, 175.54e-8, 210000e6, 0.3),
+    ('RHS90x50x2', '90x50x2', 50e-3, 90e-3, 2e-3, 4.19, 5.34e-4, 57.88e-8, 12.86e-6, 15.74e-6, 3.29e-2, 23.37e-8, 9.35e-6, 10.5e-6, 2.09e-2, 53.37e-8, 210000e6, 0.3),
+    ('RHS90x50x3', '90x50x3', 50e-3, 90e-3, 3e-3, 6.129, 7.81e-4, 81.85e-8, 18.19e-6, 22.6e-6, 3.24e-2, 32.74e-8, 13.1e-6, 15.03e-6, 2.05e-2, 76.67e-8, 210000e6, 0.3),
+    ('RHS90x50x4', '90x50x4', 50e-3, 90e-3, 4e-3, 7.966, 10.15e-4, 102.71e-8, 22.82e-6, 28.82e-6, 3.18e-2, 40.71e-8, 16.28e-6, 19.09e-6, 2e-2, 97.7e-8, 210000e6, 0.3),
+    ('RHS90x50x5', '90x50x5', 50e-3, 90e-3, 5e-3, 9.7, 12.36e-4, 120.6e-8, 26.8e-6, 34.41e-6, 3.12e-2, 47.37e-8, 18.95e-6, 22.7e-6, 1.96e-2, 116.47e-8, 210000e6, 0.3),
+    ('RHS90x60x2', '90x60x2', 60e-3, 90e-3, 2e-3, 4.504, 5.74e-4, 65.62e-8, 14.58e-6, 17.5e-6, 3.38e-2, 35.24e-8, 11.75e-6, 13.27e-6, 2.48e-2, 72.51e-8, 210000e6, 0.3),
+    ('RHS90x60x3', '90x60x3', 60e-3, 90e-3, 3e-3, 6.6, 8.41e-4, 93.21e-8, 20.71e-6, 25.21e-6, 3.33e-2, 49.77e-8, 16.59e-6, 19.08e-6, 2.43e-2, 104.81e-8, 210000e6, 0.3),
+    ('RHS90x60x4', '90x60x4', 60e-3, 90e-3, 4e-3, 8.594, 10.95e-4, 117.51e-8, 26.11e-6, 32.26e-6, 3.28e-2, 62.4e-8, 20.8e-6, 24.36e-6, 2.39e-2, 134.44e-8, 210000e6, 0.3),
+    ('RHS90x60x5', '90x60x5', 60e-3, 90e-3, 5e-3, 10.485, 13.36e-4, 138.68e-8, 30.82e-6, 38.66e-6, 3.22e-2, 73.24e-8, 24.41e-6, 29.13e-6, 2.34e-2, 161.39e-8, 210000e6, 0.3),
+    ('RHS90x70x2', '90x70x2', 70e-3, 90e-3, 2e-3, 4.818, 6.14e-4, 73.37e-8, 16.3e-6, 19.26e-6, 3.46e-2, 49.98e-8, 14.28e-6, 16.24e-6, 2.85e-2, 93.2e-8, 210000e6, 0.3),
+    ('RHS90x70x3', '90x70x3', 70e-3, 90e-3, 3e-3, 7.071, 9.01e-4, 104.57e-8, 23.24e-6, 27.82e-6, 3.41e-2, 71e-8, 20.29e-6, 23.44e-6, 2.81e-2, 135.25e-8, 210000e6, 0.3),
+    ('RHS90x70x4', '90x70x4', 70e-3, 90e-3, 4e-3, 9.222, 11.75e-4, 132.32e-8, 29.4e-6, 35.7e-6, 3.36e-2, 89.57e-8, 25.59e-6, 30.04e-6, 2.76e-2, 174.23e-8, 210000e6, 0.3),
+    ('RHS90x70x5', '90x70x5', 70e-3, 90e-3, 5e-3, 11.27, 14.36e-4, 156.77e-8, 34.84e-6, 42.91e-6, 3.3e-2, 105.8e-8, 30.23e-6, 36.06e-6, 2.71e-2, 210.13e-8, 210000e6, 0.3),
+    ('RHS90x70x6', '90x70x6', 70e-3, 90e-3, 6e-3, 13.214, 16.83e-4, 178.07e-8, 39.57e-6, 49.46e-6, 3.25e-2, 119.82e-8, 34.23e-6, 41.51e-6, 2.67e-2, 242.91e-8, 210000e6, 0.3),
+    ('RHS100x40x2', '100x40x2', 40e-3, 100e-3, 2e-3, 4.19, 5.34e-4, 65.38e-8, 13.08e-6, 16.54e-6, 3.5e-2, 15.61e-8, 7.81e-6, 8.69e-6, 1.71e-2, 41.47e-8, 210000e6, 0.3),
+    ('RHS100x40x3', '100x40x3', 40e-3, 100e-3, 3e-3, 6.129, 7.81e-4, 92.34e-8, 18.47e-6, 23.75e-6, 3.44e-2, 21.67e-8, 10.84e-6, 12.38e-6, 1.67e-2, 59.05e-8, 210000e6, 0.3),
+    ('RHS100x40x4', '100x40x4', 40e-3, 100e-3, 4e-3, 7.966, 10.15e-4, 115.7e-8, 23.14e-6, 30.26e-6, 3.38e-2, 26.69e-8, 13.35e-6, 15.65e-6, 1.62e-2, 74.53e-8, 210000e6, 0.3),
+    ('RHS100x40x5', '100x40x5', 40e-3, 100e-3, 5e-3, 9.7, 12.36e-4, 135.6e-8, 27.12e-6, 36.09e-6, 3.31e-2, 30.76e-8, 15.38e-6, 18.52e-6, 1.58e-2, 87.92e-8, 210000e6, 0.3),
+    ('RHS100x50x2', '100x50x2', 50e-3, 100e-3, 2e-3, 4.504, 5.74e-4, 74.98e-8, 15e-6, 18.5e-6, 3.62e-2, 25.67e-8, 10.27e-6, 11.46e-6, 2.12e-2, 61.59e-8, 210000e6, 0.3),
+    ('RHS100x50x3', '100x50x3', 50e-3, 100e-3, 3e-3, 6.6, 8.41e-4, 106.46e-8, 21.29e-6, 26.66e-6, 3.56e-2, 36.06e-8, 14.42e-6, 16.44e-6, 2.07e-2, 88.56e-8, 210000e6, 0.3),
+    ('RHS100x50x4', '100x50x4', 50e-3, 100e-3, 4e-3, 8.594, 10.95e-4, 134.14e-8, 26.83e-6, 34.1e-6, 3.5e-2, 44.95e-8, 17.98e-6, 20.93e-6, 2.03e-2, 112.99e-8, 210000e6, 0.3),
+    ('RHS100x50x5', '100x50x5', 50e-3, 100e-3, 5e-3, 10.485, 13.36e-4, 158.19e-8, 31.64e-6, 40.84e-6, 3.44e-2, 52.45e-8, 20.98e-6, 24.95e-6, 1.98e-2, 134.87e-8, 210000e6, 0.3),
+    ('RHS100x60x2', '100x60x2', 60e-3, 100e-3, 2e-3, 4.818, 6.14e-4, 84.59e-8, 16.92e-6, 20.46e-6, 3.71e-2, 38.6e-8, 12.87e-6, 14.43e-6, 2.51e-2, 84.08e-8, 210000e6, 0.3),
+    ('RHS100x60x3', '100x60x3', 60e-3, 100e-3, 3e-3, 7.071, 9.01e-4, 120.57e-8, 24.11e-6, 29.57e-6, 3.66e-2, 54.65e-8, 18.22e-6, 20.79e-6, 2.46e-2, 121.67e-8, 210000e6, 0.3),
+    ('RHS100x60x4', '100x60x4', 60e-3, 100e-3, 4e-3, 9.222, 11.75e-4, 152.58e-8, 30.52e-6, 37.94e-6, 3.6e-2, 68.68e-8, 22.89e-6, 26.6e-6, 2.42e-2, 156.27e-8, 210000e6, 0.3),
+    ('RHS100x60x5', '100x60x5', 60e-3, 100e-3, 5e-3, 11.27, 14.36e-4, 180.77e-8, 36.15e-6, 45.59e-6, 3.55e-2, 80.83e-8, 26.94e-6, 31.88e-6, 2.37e-2, 187.86e-8, 210000e6, 0.3),
+    ('RHS100x60x6', '100x60x6', 60e-3, 100e-3, 6e-3, 13.214, 16.83e-4, 205.3e-8, 41.06e-6, 52.54e-6, 3.49e-2, 91.2e-8, 30.4e-6, 36.64e-6, 2.33e-2, 216.44e-8, 210000e6, 0.3),
+    ('RHS100x80x2', '100x80x2', 80e-3, 100e-3, 2e-3, 5.446, 6.94e-4, 103.8e-8, 20.76e-6, 24.38e-6, 3.87e-2, 73.87e-8, 18.47e-6, 20.97e-6, 3.26e-2, 134.59e-8, 210000e6, 0.3),
+    ('RHS100x80x3', '100x80x3', 80e-3, 100e-3, 3e-3, 8.013, 10.21e-4, 148.81e-8, 29.76e-6, 35.39e-6, 3.82e-2, 105.64e-8, 26.41e-6, 30.4e-6, 3.22e-2, 196.12e-8, 210000e6, 0.3),
+    ('RHS100x80x4', '100x80x4', 80e-3, 100e-3, 4e-3, 10.478, 13.35e-4, 189.47e-8, 37.89e-6, 45.62e-6, 3.77e-2, 134.17e-8, 33.54e-6, 39.15e-6, 3.17e-2, 253.79e-8, 210000e6, 0.3),
+    ('RHS100x80x5', '100x80x5', 80e-3, 100e-3, 5e-3, 12.84, 16.36e-4, 225.94e-8, 45.19e-6, 55.09e-6, 3.72e-2, 159.61e-8, 39.9e-6, 47.24e-6, 3.12e-2, 307.55e-8, 210000e6, 0.3),
+    ('RHS100x80x6', '100x80x6', 80e-3, 100e-3, 6e-3, 15.098, 19.23e-4, 258.39e-8, 51.68e-6, 63.82e-6, 3.67e-2, 182.1e-8, 45.53e-6, 54.67e-6, 3.08e-2, 357.38e-8, 210000e6, 0.3),
+    ('RHS110x70x3', '110x70x3', 70e-3, 110e-3, 3e-3, 8.013, 10.21e-4, 169.62e-8, 30.84e-6, 37.43e-6, 4.08e-2, 84.48e-8, 24.14e-6, 27.46e-6, 2.88e-2, 180.67e-8, 210000e6, 0.3),
+    ('RHS110x70x4', '110x70x4', 70e-3, 110e-3, 4e-3, 10.478, 13.35e-4, 216.01e-8, 39.27e-6, 48.25e-6, 4.02e-2, 107.01e-8, 30.57e-6, 35.32e-6, 2.83e-2, 233.32e-8, 210000e6, 0.3),
+    ('RHS110x70x5', '110x70x5', 70e-3, 110e-3, 5e-3, 12.84, 16.36e-4, 257.62e-8, 46.84e-6, 58.27e-6, 3.97e-2, 126.96e-8, 36.28e-6, 42.56e-6, 2.79e-2, 282.14e-8, 210000e6, 0.3),
+    ('RHS110x70x6', '110x70x6', 70e-3, 110e-3, 6e-3, 15.098, 19.23e-4, 294.63e-8, 53.57e-6, 67.5e-6, 3.91e-2, 144.47e-8, 41.28e-6, 49.19e-6, 2.74e-2, 327.11e-8, 210000e6, 0.3),
+    ('RHS120x40x2', '120x40x2', 40e-3, 120e-3, 2e-3, 4.818, 6.14e-4, 104.07e-8, 17.34e-6, 22.28e-6, 4.12e-2, 18.5e-8, 9.25e-6, 10.21e-6, 1.74e-2, 52.32e-8, 210000e6, 0.3),
+    ('RHS120x40x3', '120x40x3', 40e-3, 120e-3, 3e-3, 7.071, 9.01e-4, 148.04e-8, 24.67e-6, 32.16e-6, 4.05e-2, 25.79e-8, 12.89e-6, 14.6e-6, 1.69e-2, 74.56e-8, 210000e6, 0.3),
+    ('RHS120x40x4', '120x40x4', 40e-3, 120e-3, 4e-3, 9.222, 11.75e-4, 186.89e-8, 31.15e-6, 41.21e-6, 3.99e-2, 31.9e-8, 15.95e-6, 18.53e-6, 1.65e-2, 94.23e-8, 210000e6, 0.3),
+    ('RHS120x40x5', '120x40x5', 40e-3, 120e-3, 5e-3, 11.27, 14.36e-4, 220.81e-8, 36.8e-6, 49.45e-6, 3.92e-2, 36.93e-8, 18.46e-6, 22.02e-6, 1.6e-2, 111.35e-8, 210000e6, 0.3),
+    ('RHS120x40x6', '120x40x6', 40e-3, 120e-3, 6e-3, 13.214, 16.83e-4, 249.97e-8, 41.66e-6, 56.89e-6, 3.85e-2, 40.97e-8, 20.49e-6, 25.08e-6, 1.56e-2, 125.97e-8, 210000e6, 0.3),
+    ('RHS120x60x2', '120x60x2', 60e-3, 120e-3, 2e-3, 5.446, 6.94e-4, 131.92e-8, 21.99e-6, 27e-6, 4.36e-2, 45.33e-8, 15.11e-6, 16.75e-6, 2.56e-2, 107.88e-8, 210000e6, 0.3),
+    ('RHS120x60x3', '120x60x3', 60e-3, 120e-3, 3e-3, 8.013, 10.21e-4, 189.12e-8, 31.52e-6, 39.18e-6, 4.3e-2, 64.4e-8, 21.47e-6, 24.21e-6, 2.51e-2, 156.34e-8, 210000e6, 0.3),
+    ('RHS120x60x4', '120x60x4', 60e-3, 120e-3, 4e-3, 10.478, 13.35e-4, 240.74e-8, 40.12e-6, 50.49e-6, 4.25e-2, 81.25e-8, 27.08e-6, 31.08e-6, 2.47e-2, 201.12e-8, 210000e6, 0.3),
+    ('RHS120x60x5', '120x60x5', 60e-3, 120e-3, 5e-3, 12.84, 16.36e-4, 286.97e-8, 47.83e-6, 60.95e-6, 4.19e-2, 95.99e-8, 32e-6, 37.38e-6, 2.42e-2, 242.23e-8, 210000e6, 0.3),
+    ('RHS120x60x6', '120x60x6', 60e-3, 120e-3, 6e-3, 15.098, 19.23e-4, 328.01e-8, 54.67e-6, 70.57e-6, 4.13e-2, 108.77e-8, 36.26e-6, 43.12e-6, 2.38e-2, 279.67e-8, 210000e6, 0.3),
+    ('RHS120x80x3', '120x80x3', 80e-3, 120e-3, 3e-3, 8.955, 11.41e-4, 230.2e-8, 38.37e-6, 46.2e-6, 4.49e-2, 123.43e-8, 30.86e-6, 35.02e-6, 3.29e-2, 255.47e-8, 210000e6, 0.3),
+    ('RHS120x80x4', '120x80x4', 80e-3, 120e-3, 4e-3, 11.734, 14.95e-4, 294.59e-8, 49.1e-6, 59.77e-6, 4.44e-2, 157.29e-8, 39.32e-6, 45.23e-6, 3.24e-2, 331.24e-8, 210000e6, 0.3),
+    ('RHS120x80x5', '120x80x5', 80e-3, 120e-3, 5e-3, 14.41, 18.36e-4, 353.14e-8, 58.86e-6, 72.45e-6, 4.39e-2, 187.78e-8, 46.94e-6, 54.74e-6, 3.2e-2, 402.27e-8, 210000e6, 0.3),
+    ('RHS120x80x6', '120x80x6', 80e-3, 120e-3, 6e-3, 16.982, 21.63e-4, 406.06e-8, 67.68e-6, 84.25e-6, 4.33e-2, 215.03e-8, 53.76e-6, 63.55e-6, 3.15e-2, 468.54e-8, 210000e6, 0.3),
+    ('RHS120x80x7', '120x80x7', 80e-3, 120e-3, 7e-3, 19.121, 24.36e-4, 438.27e-8, 73.04e-6, 92.65e-6, 4.24e-2, 232.45e-8, 58.11e-6, 69.98e-6, 3.09e-2, 529.42e-8, 210000e6, 0.3),
+    ('RHS120x100x3', '120x100x3', 100e-3, 120e-3, 3e-3, 9.897, 12.61e-4, 271.27e-8, 45.21e-6, 53.22e-6, 4.64e-2, 205.28e-8, 41.06e-6, 47.03e-6, 4.04e-2, 367.01e-8, 210000e6, 0.3),
+    ('RHS120x100x4', '120x100x4', 100e-3, 120e-3, 4e-3, 12.99, 16.55e-4, 348.43e-8, 58.07e-6, 69.05e-6, 4.59e-2, 263.24e-8, 52.65e-6, 60.98e-6, 3.99e-2, 477.84e-8, 210000e6, 0.3),
+    ('RHS120x100x5', '120x100x5', 100e-3, 120e-3, 5e-3, 15.98, 20.36e-4, 419.31e-8, 69.88e-6, 83.95e-6, 4.54e-2, 316.27e-8, 63.25e-6, 74.09e-6, 3.94e-2, 582.86e-8, 210000e6, 0.3),
+    ('RHS120x100x6', '120x100x6', 100e-3, 120e-3, 6e-3, 18.866, 24.03e-4, 484.11e-8, 80.68e-6, 97.93e-6, 4.49e-2, 364.56e-8, 72.91e-6, 86.38e-6, 3.89e-2, 682.04e-8, 210000e6, 0.3),
+    ('RHS120x100x7', '120x100x7', 100e-3, 120e-3, 7e-3, 21.319, 27.16e-4, 527.77e-8, 87.96e-6, 108.47e-6, 4.41e-2, 397.7e-8, 79.54e-6, 95.74e-6, 3.83e-2, 776.17e-8, 210000e6, 0.3),
+    ('RHS140x60x3', '140x60x3', 60e-3, 140e-3, 3e-3, 8.955, 11.41e-4, 278.08e-8, 39.73e-6, 49.98e-6, 4.94e-2, 74.16e-8, 24.72e-6, 27.63e-6, 2.55e-2, 191.92e-8, 210000e6, 0.3),
+    ('RHS140x60x4', '140x60x4', 60e-3, 140e-3, 4e-3, 11.734, 14.95e-4, 355.59e-8, 50.8e-6, 64.63e-6, 4.88e-2, 93.81e-8, 31.27e-6, 35.56e-6, 2.51e-2, 247.13e-8, 210000e6, 0.3),
+    ('RHS140x60x5', '140x60x5', 60e-3, 140e-3, 5e-3, 14.41, 18.36e-4, 425.89e-8, 60.84e-6, 78.3e-6, 4.82e-2, 111.16e-8, 37.05e-6, 42.88e-6, 2.46e-2, 297.97e-8, 210000e6, 0.3),
+    ('RHS140x60x6', '140x60x6', 60e-3, 140e-3, 6e-3, 16.982, 21.63e-4, 489.19e-8, 69.88e-6, 91.01e-6, 4.76e-2, 126.34e-8, 42.11e-6, 49.6e-6, 2.42e-2, 344.46e-8, 210000e6, 0.3),
+    ('RHS140x60x7', '140x60x7', 60e-3, 140e-3, 7e-3, 19.121, 24.36e-4, 524.93e-8, 74.99e-6, 99.79e-6, 4.64e-2, 135.69e-8, 45.23e-6, 54.44e-6, 2.36e-2, 384.95e-8, 210000e6, 0.3),
+    ('RHS140x80x3', '140x80x3', 80e-3, 140e-3, 3e-3, 9.897, 12.61e-4, 334.4e-8, 47.77e-6, 58.2e-6, 5.15e-2, 141.23e-8, 35.31e-6, 39.64e-6, 3.35e-2, 317.07e-8, 210000e6, 0.3),
+    ('RHS140x80x4', '140x80x4', 80e-3, 140e-3, 4e-3, 12.99, 16.55e-4, 429.6e-8, 61.37e-6, 75.51e-6, 5.1e-2, 180.42e-8, 45.1e-6, 51.31e-6, 3.3e-2, 411.6e-8, 210000e6, 0.3),
+    ('RHS140x80x5', '140x80x5', 80e-3, 140e-3, 5e-3, 15.98, 20.36e-4, 517.06e-8, 73.87e-6, 91.8e-6, 5.04e-2, 215.94e-8, 53.99e-6, 62.24e-6, 3.26e-2, 500.51e-8, 210000e6, 0.3),
+    ('RHS140x80x6', '140x80x6', 80e-3, 140e-3, 6e-3, 18.866, 24.03e-4, 597e-8, 85.29e-6, 107.09e-6, 4.98e-2, 247.96e-8, 61.99e-6, 72.43e-6, 3.21e-2, 583.8e-8, 210000e6, 0.3),
+    ('RHS140x80x7', '140x80x7', 80e-3, 140e-3, 7e-3, 21.319, 27.16e-4, 648.87e-8, 92.7e-6, 118.41e-6, 4.89e-2, 269.87e-8, 67.47e-6, 80.2e-6, 3.15e-2, 661.38e-8, 210000e6, 0.3),
+    ('RHS140x100x3', '140x100x3', 100e-3, 140e-3, 3e-3, 10.839, 13.81e-4, 390.71e-8, 55.82e-6, 66.42e-6, 5.32e-2, 233.52e-8, 46.7e-6, 52.85e-6, 4.11e-2, 459.63e-8, 210000e6, 0.3),
+    ('RHS140x100x4', '140x100x4', 100e-3, 140e-3, 4e-3, 14.246, 18.15e-4, 503.61e-8, 71.94e-6, 86.39e-6, 5.27e-2, 300.12e-8, 60.02e-6, 68.66e-6, 4.07e-2, 599.26e-8, 210000e6, 0.3),
+    ('RHS140x100x5', '140x100x5', 100e-3, 140e-3, 5e-3, 17.55, 22.36e-4, 608.23e-8, 86.89e-6, 105.3e-6, 5.22e-2, 361.44e-8, 72.29e-6, 83.59e-6, 4.02e-2, 732.06e-8, 210000e6, 0.3),
+    ('RHS140x100x6', '140x100x6', 100e-3, 140e-3, 6e-3, 20.75, 26.43e-4, 704.81e-8, 100.69e-6, 123.17e-6, 5.16e-2, 417.65e-8, 83.53e-6, 97.66e-6, 3.97e-2, 857.99e-8, 210000e6, 0.3),
+    ('RHS140x100x7', '140x100x7', 100e-3, 140e-3, 7e-3, 23.517, 29.96e-4, 772.81e-8, 110.4e-6, 137.03e-6, 5.08e-2, 458.36e-8, 91.67e-6, 108.76e-6, 3.91e-2, 978.81e-8, 210000e6, 0.3),
+    ('RHS150x50x3', '150x50x3', 50e-3, 150e-3, 3e-3, 8.955, 11.41e-4, 298.55e-8, 39.81e-6, 51.43e-6, 5.12e-2, 52.65e-8, 21.06e-6, 23.49e-6, 2.15e-2, 150.22e-8, 210000e6, 0.3),
+    ('RHS150x50x4', '150x50x4', 50e-3, 150e-3, 4e-3, 11.734, 14.95e-4, 381.39e-8, 50.85e-6, 66.47e-6, 5.05e-2, 66.16e-8, 26.47e-6, 30.13e-6, 2.1e-2, 192.14e-8, 210000e6, 0.3),
+    ('RHS150x50x5', '150x50x5', 50e-3, 150e-3, 5e-3, 14.41, 18.36e-4, 456.29e-8, 60.84e-6, 80.48e-6, 4.99e-2, 77.87e-8, 31.15e-6, 36.2e-6, 2.06e-2, 230.05e-8, 210000e6, 0.3),
+    ('RHS150x50x6', '150x50x6', 50e-3, 150e-3, 6e-3, 16.982, 21.63e-4, 523.47e-8, 69.8e-6, 93.48e-6, 4.92e-2, 87.89e-8, 35.16e-6, 41.72e-6, 2.02e-2, 263.99e-8, 210000e6, 0.3),
+    ('RHS150x50x7', '150x50x7', 50e-3, 150e-3, 7e-3, 19.121, 24.36e-4, 559.3e-8, 74.57e-6, 102.31e-6, 4.79e-2, 93.75e-8, 37.5e-6, 45.62e-6, 1.96e-2, 291.81e-8, 210000e6, 0.3),
+    ('RHS150x70x3', '150x70x3', 70e-3, 150e-3, 3e-3, 9.897, 12.61e-4, 363.39e-8, 48.45e-6, 60.25e-6, 5.37e-2, 111.43e-8, 31.84e-6, 35.5e-6, 2.97e-2, 276.37e-8, 210000e6, 0.3),
+    ('RHS150x70x4', '150x70x4', 70e-3, 150e-3, 4e-3, 12.99, 16.55e-4, 466.68e-8, 62.22e-6, 78.15e-6, 5.31e-2, 141.9e-8, 40.54e-6, 45.88e-6, 2.93e-2, 357.69e-8, 210000e6, 0.3),
+    ('RHS150x70x5', '150x70x5', 70e-3, 150e-3, 5e-3, 15.98, 20.36e-4, 561.45e-8, 74.86e-6, 94.98e-6, 5.25e-2, 169.3e-8, 48.37e-6, 55.56e-6, 2.88e-2, 433.62e-8, 210000e6, 0.3),
+    ('RHS150x70x6', '150x70x6', 70e-3, 150e-3, 6e-3, 18.866, 24.03e-4, 647.95e-8, 86.39e-6, 110.76e-6, 5.19e-2, 193.76e-8, 55.36e-6, 64.55e-6, 2.84e-2, 504.14e-8, 210000e6, 0.3),
+    ('RHS150x70x7', '150x70x7', 70e-3, 150e-3, 7e-3, 21.319, 27.16e-4, 702.56e-8, 93.67e-6, 122.33e-6, 5.09e-2, 210.29e-8, 60.08e-6, 71.38e-6, 2.78e-2, 568.52e-8, 210000e6, 0.3),
+    ('RHS150x100x4', '150x100x4', 100e-3, 150e-3, 4e-3, 14.874, 18.95e-4, 594.6e-8, 79.28e-6, 95.67e-6, 5.6e-2, 318.57e-8, 63.71e-6, 72.5e-6, 4.1e-2, 661.63e-8, 210000e6, 0.3),
+    ('RHS150x100x5', '150x100x5', 100e-3, 150e-3, 5e-3, 18.335, 23.36e-4, 719.2e-8, 95.89e-6, 116.73e-6, 5.55e-2, 384.02e-8, 76.8e-6, 88.34e-6, 4.05e-2, 808.68e-8, 210000e6, 0.3),
+    ('RHS150x100x6', '150x100x6', 100e-3, 150e-3, 6e-3, 21.692, 27.63e-4, 834.69e-8, 111.29e-6, 136.68e-6, 5.5e-2, 444.19e-8, 88.84e-6, 103.3e-6, 4.01e-2, 948.34e-8, 210000e6, 0.3),
+    ('RHS150x100x7', '150x100x7', 100e-3, 150e-3, 7e-3, 24.616, 31.36e-4, 917.44e-8, 122.33e-6, 152.36e-6, 5.41e-2, 488.68e-8, 97.74e-6, 115.27e-6, 3.95e-2, 1082.81e-8, 210000e6, 0.3),
+    ('RHS150x100x8', '150x100x8', 100e-3, 150e-3, 8e-3, 27.665, 35.24e-4, 1008.13e-8, 134.42e-6, 169.16e-6, 5.35e-2, 535.65e-8, 107.13e-6, 127.85e-6, 3.9e-2, 1205.89e-8, 210000e6, 0.3),
+    ('RHS150x120x4', '150x120x4', 120e-3, 150e-3, 4e-3, 16.13, 20.55e-4, 679.89e-8, 90.65e-6, 107.35e-6, 5.75e-2, 483.04e-8, 80.51e-6, 92.25e-6, 4.85e-2, 891.21e-8, 210000e6, 0.3),
+    ('RHS150x120x5', '150x120x5', 120e-3, 150e-3, 5e-3, 19.905, 25.36e-4, 824.37e-8, 109.92e-6, 131.23e-6, 5.7e-2, 584.72e-8, 97.45e-6, 112.7e-6, 4.8e-2, 1092.37e-8, 210000e6, 0.3),
+    ('RHS150x120x6', '150x120x6', 120e-3, 150e-3, 6e-3, 23.576, 30.03e-4, 959.17e-8, 127.89e-6, 153.96e-6, 5.65e-2, 679.23e-8, 113.2e-6, 132.13e-6, 4.76e-2, 1284.79e-8, 210000e6, 0.3),
+    ('RHS150x120x7', '150x120x7', 120e-3, 150e-3, 7e-3, 26.814, 34.16e-4, 1060.7e-8, 141.43e-6, 172.38e-6, 5.57e-2, 751.51e-8, 125.25e-6, 148.02e-6, 4.69e-2, 1472.84e-8, 210000e6, 0.3),
+    ('RHS150x120x8', '150x120x8', 120e-3, 150e-3, 8e-3, 30.177, 38.44e-4, 1169.61e-8, 155.95e-6, 191.88e-6, 5.52e-2, 827.66e-8, 137.94e-6, 164.69e-6, 4.64e-2, 1646.36e-8, 210000e6, 0.3),
+    ('RHS160x60x3', '160x60x3', 60e-3, 160e-3, 3e-3, 9.897, 12.61e-4, 389.86e-8, 48.73e-6, 61.99e-6, 5.56e-2, 83.91e-8, 27.97e-6, 31.05e-6, 2.58e-2, 228.15e-8, 210000e6, 0.3),
+    ('RHS160x60x4', '160x60x4', 60e-3, 160e-3, 4e-3, 12.99, 16.55e-4, 500.35e-8, 62.54e-6, 80.38e-6, 5.5e-2, 106.38e-8, 35.46e-6, 40.04e-6, 2.54e-2, 293.96e-8, 210000e6, 0.3),
+    ('RHS160x60x5', '160x60x5', 60e-3, 160e-3, 5e-3, 15.98, 20.36e-4, 601.52e-8, 75.19e-6, 97.66e-6, 5.44e-2, 126.33e-8, 42.11e-6, 48.38e-6, 2.49e-2, 354.68e-8, 210000e6, 0.3),
+    ('RHS160x60x6', '160x60x6', 60e-3, 160e-3, 6e-3, 18.866, 24.03e-4, 693.64e-8, 86.71e-6, 113.84e-6, 5.37e-2, 143.91e-8, 47.97e-6, 56.08e-6, 2.45e-2, 410.35e-8, 210000e6, 0.3),
+    ('RHS160x60x7', '160x60x7', 60e-3, 160e-3, 7e-3, 21.319, 27.16e-4, 749.81e-8, 93.73e-6, 125.55e-6, 5.25e-2, 155.47e-8, 51.82e-6, 61.86e-6, 2.39e-2, 459.52e-8, 210000e6, 0.3),
+    ('RHS160x80x3', '160x80x3', 80e-3, 160e-3, 3e-3, 10.839, 13.81e-4, 463.81e-8, 57.98e-6, 71.41e-6, 5.8e-2, 159.03e-8, 39.76e-6, 44.26e-6, 3.39e-2, 380.34e-8, 210000e6, 0.3),
+    ('RHS160x80x4', '160x80x4', 80e-3, 160e-3, 4e-3, 14.246, 18.15e-4, 597.71e-8, 74.71e-6, 92.86e-6, 5.74e-2, 203.54e-8, 50.89e-6, 57.39e-6, 3.35e-2, 494.1e-8, 210000e6, 0.3),
+    ('RHS160x80x5', '160x80x5', 80e-3, 160e-3, 5e-3, 17.55, 22.36e-4, 721.69e-8, 90.21e-6, 113.16e-6, 5.68e-2, 244.11e-8, 61.03e-6, 69.74e-6, 3.3e-2, 601.34e-8, 210000e6, 0.3),
+    ('RHS160x80x6', '160x80x6', 80e-3, 160e-3, 6e-3, 20.75, 26.43e-4, 836.01e-8, 104.5e-6, 132.32e-6, 5.62e-2, 280.89e-8, 70.22e-6, 81.31e-6, 3.26e-2, 702.06e-8, 210000e6, 0.3),
+    ('RHS160x80x7', '160x80x7', 80e-3, 160e-3, 7e-3, 23.517, 29.96e-4, 913.78e-8, 114.22e-6, 146.97e-6, 5.52e-2, 307.28e-8, 76.82e-6, 90.42e-6, 3.2e-2, 796.66e-8, 210000e6, 0.3),
+    ('RHS160x90x3', '160x90x3', 90e-3, 160e-3, 3e-3, 11.31, 14.41e-4, 500.79e-8, 62.6e-6, 76.12e-6, 5.9e-2, 206.79e-8, 45.95e-6, 51.31e-6, 3.79e-2, 465.4e-8, 210000e6, 0.3),
+    ('RHS160x90x4', '160x90x4', 90e-3, 160e-3, 4e-3, 14.874, 18.95e-4, 646.39e-8, 80.8e-6, 99.1e-6, 5.84e-2, 265.54e-8, 59.01e-6, 66.66e-6, 3.74e-2, 606.16e-8, 210000e6, 0.3),
+    ('RHS160x90x5', '160x90x5', 90e-3, 160e-3, 5e-3, 18.335, 23.36e-4, 781.77e-8, 97.72e-6, 120.91e-6, 5.79e-2, 319.52e-8, 71e-6, 81.16e-6, 3.7e-2, 739.7e-8, 210000e6, 0.3),
+    ('RHS160x90x6', '160x90x6', 90e-3, 160e-3, 6e-3, 21.692, 27.63e-4, 907.19e-8, 113.4e-6, 141.56e-6, 5.73e-2, 368.91e-8, 81.98e-6, 94.82e-6, 3.65e-2, 866.01e-8, 210000e6, 0.3),
+    ('RHS160x90x7', '160x90x7', 90e-3, 160e-3, 7e-3, 24.616, 31.36e-4, 995.77e-8, 124.47e-6, 157.68e-6, 5.64e-2, 405.31e-8, 90.07e-6, 105.75e-6, 3.6e-2, 986.57e-8, 210000e6, 0.3),
+    ('RHS160x120x4', '160x120x4', 120e-3, 160e-3, 4e-3, 16.758, 21.35e-4, 792.44e-8, 99.06e-6, 117.82e-6, 6.09e-2, 509.97e-8, 84.99e-6, 96.89e-6, 4.89e-2, 979.51e-8, 210000e6, 0.3),
+    ('RHS160x120x5', '160x120x5', 120e-3, 160e-3, 5e-3, 20.69, 26.36e-4, 962.02e-8, 120.25e-6, 144.16e-6, 6.04e-2, 617.81e-8, 102.97e-6, 118.45e-6, 4.84e-2, 1201.2e-8, 210000e6, 0.3),
+    ('RHS160x120x6', '160x120x6', 120e-3, 160e-3, 6e-3, 24.518, 31.23e-4, 1120.75e-8, 140.09e-6, 169.28e-6, 5.99e-2, 718.25e-8, 119.71e-6, 138.97e-6, 4.8e-2, 1413.54e-8, 210000e6, 0.3),
+    ('RHS160x120x7', '160x120x7', 120e-3, 160e-3, 7e-3, 27.913, 35.56e-4, 1241.74e-8, 155.22e-6, 189.81e-6, 5.91e-2, 796.26e-8, 132.71e-6, 155.93e-6, 4.73e-2, 1621.54e-8, 210000e6, 0.3),
+    ('RHS160x120x8', '160x120x8', 120e-3, 160e-3, 8e-3, 31.433, 40.04e-4, 1371.23e-8, 171.4e-6, 211.5e-6, 5.85e-2, 877.92e-8, 146.32e-6, 173.65e-6, 4.68e-2, 1813.87e-8, 210000e6, 0.3),
+    ('RHS170x80x3', '170x80x3', 80e-3, 170e-3, 3e-3, 11.31, 14.41e-4, 538.73e-8, 63.38e-6, 78.47e-6, 6.11e-2, 167.92e-8, 41.98e-6, 46.57e-6, 3.41e-2, 412.46e-8, 210000e6, 0.3),
+    ('RHS170x80x4', '170x80x4', 80e-3, 170e-3, 4e-3, 14.874, 18.95e-4, 695.18e-8, 81.79e-6, 102.14e-6, 6.06e-2, 215.11e-8, 53.78e-6, 60.43e-6, 3.37e-2, 535.98e-8, 210000e6, 0.3),
+    ('RHS170x80x5', '170x80x5', 80e-3, 170e-3, 5e-3, 18.335, 23.36e-4, 840.52e-8, 98.88e-6, 124.59e-6, 6e-2, 258.19e-8, 64.55e-6, 73.49e-6, 3.32e-2, 652.51e-8, 210000e6, 0.3),
+    ('RHS170x80x6', '170x80x6', 80e-3, 170e-3, 6e-3, 21.692, 27.63e-4, 975.04e-8, 114.71e-6, 145.84e-6, 5.94e-2, 297.35e-8, 74.34e-6, 85.75e-6, 3.28e-2, 762.06e-8, 210000e6, 0.3),
+    ('RHS170x80x7', '170x80x7', 80e-3, 170e-3, 7e-3, 24.616, 31.36e-4, 1068.36e-8, 125.69e-6, 162.3e-6, 5.84e-2, 325.99e-8, 81.5e-6, 95.53e-6, 3.22e-2, 865.26e-8, 210000e6, 0.3),
+    ('RHS170x100x3', '170x100x3', 100e-3, 170e-3, 3e-3, 12.252, 15.61e-4, 622.41e-8, 73.22e-6, 88.49e-6, 6.31e-2, 275.87e-8, 55.17e-6, 61.58e-6, 4.2e-2, 604.41e-8, 210000e6, 0.3),
+    ('RHS170x100x4', '170x100x4', 100e-3, 170e-3, 4e-3, 16.13, 20.55e-4, 805.42e-8, 94.76e-6, 115.42e-6, 6.26e-2, 355.45e-8, 71.09e-6, 80.18e-6, 4.16e-2, 789.02e-8, 210000e6, 0.3),
+    ('RHS170x100x5', '170x100x5', 100e-3, 170e-3, 5e-3, 19.905, 25.36e-4, 976.69e-8, 114.9e-6, 141.09e-6, 6.21e-2, 429.19e-8, 85.84e-6, 97.84e-6, 4.11e-2, 965.17e-8, 210000e6, 0.3),
+    ('RHS170x100x6', '170x100x6', 100e-3, 170e-3, 6e-3, 23.576, 30.03e-4, 1136.49e-8, 133.7e-6, 165.52e-6, 6.15e-2, 497.28e-8, 99.46e-6, 114.58e-6, 4.07e-2, 1132.83e-8, 210000e6, 0.3),
+    ('RHS170x100x7', '170x100x7', 100e-3, 170e-3, 7e-3, 26.814, 34.16e-4, 1254.46e-8, 147.58e-6, 185.12e-6, 6.06e-2, 549.34e-8, 109.87e-6, 128.29e-6, 4.01e-2, 1295.06e-8, 210000e6, 0.3),
+    ('RHS180x70x3', '180x70x3', 70e-3, 180e-3, 3e-3, 11.31, 14.41e-4, 573.85e-8, 63.76e-6, 80.51e-6, 6.31e-2, 131.64e-8, 37.61e-6, 41.53e-6, 3.02e-2, 350.79e-8, 210000e6, 0.3),
+    ('RHS180x70x4', '180x70x4', 70e-3, 180e-3, 4e-3, 14.874, 18.95e-4, 740.15e-8, 82.24e-6, 104.77e-6, 6.25e-2, 168.07e-8, 48.02e-6, 53.8e-6, 2.98e-2, 454.34e-8, 210000e6, 0.3),
+    ('RHS180x70x5', '180x70x5', 70e-3, 180e-3, 5e-3, 18.335, 23.36e-4, 894.45e-8, 99.38e-6, 127.77e-6, 6.19e-2, 201.05e-8, 57.44e-6, 65.31e-6, 2.93e-2, 551.24e-8, 210000e6, 0.3),
+    ('RHS180x70x6', '180x70x6', 70e-3, 180e-3, 6e-3, 21.692, 27.63e-4, 1037.02e-8, 115.22e-6, 149.51e-6, 6.13e-2, 230.74e-8, 65.92e-6, 76.07e-6, 2.89e-2, 641.51e-8, 210000e6, 0.3),
+    ('RHS180x70x7', '180x70x7', 70e-3, 180e-3, 7e-3, 24.616, 31.36e-4, 1133.8e-8, 125.98e-6, 166.22e-6, 6.01e-2, 252.13e-8, 72.04e-6, 84.61e-6, 2.84e-2, 724.86e-8, 210000e6, 0.3),
+    ('RHS180x90x3', '180x90x3', 90e-3, 180e-3, 3e-3, 12.252, 15.61e-4, 667.85e-8, 74.21e-6, 91.13e-6, 6.54e-2, 229.5e-8, 51e-6, 56.53e-6, 3.83e-2, 546.17e-8, 210000e6, 0.3),
+    ('RHS180x90x4', '180x90x4', 90e-3, 180e-3, 4e-3, 16.13, 20.55e-4, 864.08e-8, 96.01e-6, 118.85e-6, 6.48e-2, 295.14e-8, 65.59e-6, 73.54e-6, 3.79e-2, 711.75e-8, 210000e6, 0.3),
+    ('RHS180x90x5', '180x90x5', 90e-3, 180e-3, 5e-3, 19.905, 25.36e-4, 1047.62e-8, 116.4e-6, 145.27e-6, 6.43e-2, 355.68e-8, 79.04e-6, 89.66e-6, 3.75e-2, 869.09e-8, 210000e6, 0.3),
+    ('RHS180x90x6', '180x90x6', 90e-3, 180e-3, 6e-3, 23.576, 30.03e-4, 1218.75e-8, 135.42e-6, 170.39e-6, 6.37e-2, 411.31e-8, 91.4e-6, 104.9e-6, 3.7e-2, 1018.17e-8, 210000e6, 0.3),
+    ('RHS180x90x7', '180x90x7', 90e-3, 180e-3, 7e-3, 26.814, 34.16e-4, 1343.42e-8, 149.27e-6, 190.44e-6, 6.27e-2, 453.65e-8, 100.81e-6, 117.37e-6, 3.64e-2, 1161.11e-8, 210000e6, 0.3),
+    ('RHS180x100x4', '180x100x4', 100e-3, 180e-3, 4e-3, 16.758, 21.35e-4, 926.04e-8, 102.89e-6, 125.89e-6, 6.59e-2, 373.89e-8, 74.78e-6, 84.02e-6, 4.18e-2, 853.85e-8, 210000e6, 0.3),
+    ('RHS180x100x5', '180x100x5', 100e-3, 180e-3, 5e-3, 20.69, 26.36e-4, 1124.2e-8, 124.91e-6, 154.02e-6, 6.53e-2, 451.77e-8, 90.35e-6, 102.59e-6, 4.14e-2, 1044.79e-8, 210000e6, 0.3),
+    ('RHS180x100x6', '180x100x6', 100e-3, 180e-3, 6e-3, 24.518, 31.23e-4, 1309.61e-8, 145.51e-6, 180.83e-6, 6.48e-2, 523.83e-8, 104.77e-6, 120.22e-6, 4.1e-2, 1226.68e-8, 210000e6, 0.3),
+    ('RHS180x100x7', '180x100x7', 100e-3, 180e-3, 7e-3, 27.913, 35.56e-4, 1448.23e-8, 160.91e-6, 202.55e-6, 6.38e-2, 579.67e-8, 115.93e-6, 134.8e-6, 4.04e-2, 1402.99e-8, 210000e6, 0.3),
+    ('RHS180x100x8', '180x100x8', 100e-3, 180e-3, 8e-3, 31.433, 40.04e-4, 1598.49e-8, 177.61e-6, 225.62e-6, 6.32e-2, 637.47e-8, 127.49e-6, 149.93e-6, 3.99e-2, 1565.24e-8, 210000e6, 0.3),
+    ('RHS180x120x4', '180x120x4', 120e-3, 180e-3, 4e-3, 18.014, 22.95e-4, 1049.97e-8, 116.66e-6, 139.97e-6, 6.76e-2, 563.81e-8, 93.97e-6, 106.17e-6, 4.96e-2, 1160.17e-8, 210000e6, 0.3),
+    ('RHS180x120x5', '180x120x5', 120e-3, 180e-3, 5e-3, 22.26, 28.36e-4, 1277.37e-8, 141.93e-6, 171.52e-6, 6.71e-2, 683.97e-8, 114e-6, 129.95e-6, 4.91e-2, 1423.83e-8, 210000e6, 0.3),
+    ('RHS180x120x6', '180x120x6', 120e-3, 180e-3, 6e-3, 26.402, 33.63e-4, 1491.34e-8, 165.7e-6, 201.71e-6, 6.66e-2, 796.3e-8, 132.72e-6, 152.65e-6, 4.87e-2, 1676.88e-8, 210000e6, 0.3),
+    ('RHS180x120x7', '180x120x7', 120e-3, 180e-3, 7e-3, 30.111, 38.36e-4, 1657.85e-8, 184.21e-6, 226.77e-6, 6.57e-2, 885.76e-8, 147.63e-6, 171.75e-6, 4.81e-2, 1925.58e-8, 210000e6, 0.3),
+    ('RHS180x120x8', '180x120x8', 120e-3, 180e-3, 8e-3, 33.945, 43.24e-4, 1835.33e-8, 203.93e-6, 253.14e-6, 6.51e-2, 978.44e-8, 163.07e-6, 191.57e-6, 4.76e-2, 2156.35e-8, 210000e6, 0.3),
+    ('RHS180x140x4', '180x140x4', 140e-3, 180e-3, 4e-3, 19.27, 24.55e-4, 1173.89e-8, 130.43e-6, 154.05e-6, 6.92e-2, 799.63e-8, 114.23e-6, 129.91e-6, 5.71e-2, 1491.17e-8, 210000e6, 0.3),
+    ('RHS180x140x5', '180x140x5', 140e-3, 180e-3, 5e-3, 23.83, 30.36e-4, 1430.53e-8, 158.95e-6, 189.02e-6, 6.86e-2, 972.89e-8, 138.98e-6, 159.3e-6, 5.66e-2, 1833.66e-8, 210000e6, 0.3),
+    ('RHS180x140x6', '180x140x6', 140e-3, 180e-3, 6e-3, 28.286, 36.03e-4, 1673.07e-8, 185.9e-6, 222.59e-6, 6.81e-2, 1136.04e-8, 162.29e-6, 187.49e-6, 5.61e-2, 2163.94e-8, 210000e6, 0.3),
+    ('RHS180x140x7', '180x140x7', 140e-3, 180e-3, 7e-3, 32.309, 41.16e-4, 1867.46e-8, 207.5e-6, 250.99e-6, 6.74e-2, 1268.55e-8, 181.22e-6, 211.51e-6, 5.55e-2, 2491.16e-8, 210000e6, 0.3),
+    ('RHS180x140x8', '180x140x8', 140e-3, 180e-3, 8e-3, 36.457, 46.44e-4, 2072.18e-8, 230.24e-6, 280.66e-6, 6.68e-2, 1405.9e-8, 200.84e-6, 236.42e-6, 5.5e-2, 2796.55e-8, 210000e6, 0.3),
+    ('RHS200x70x3', '200x70x3', 70e-3, 200e-3, 3e-3, 12.252, 15.61e-4, 749.68e-8, 74.97e-6, 95.52e-6, 6.93e-2, 145.12e-8, 41.46e-6, 45.55e-6, 3.05e-2, 401.23e-8, 210000e6, 0.3),
+    ('RHS200x70x4', '200x70x4', 70e-3, 200e-3, 4e-3, 16.13, 20.55e-4, 969.18e-8, 96.92e-6, 124.52e-6, 6.87e-2, 185.51e-8, 53e-6, 59.08e-6, 3e-2, 519.82e-8, 210000e6, 0.3),
+    ('RHS200x70x5', '200x70x5', 70e-3, 200e-3, 5e-3, 19.905, 25.36e-4, 1174e-8, 117.4e-6, 152.12e-6, 6.8e-2, 222.21e-8, 63.49e-6, 71.81e-6, 2.96e-2, 630.89e-8, 210000e6, 0.3),
+    ('RHS200x70x6', '200x70x6', 70e-3, 200e-3, 6e-3, 23.576, 30.03e-4, 1364.48e-8, 136.45e-6, 178.35e-6, 6.74e-2, 255.38e-8, 72.97e-6, 83.75e-6, 2.92e-2, 734.49e-8, 210000e6, 0.3),
+    ('RHS200x70x7', '200x70x7', 70e-3, 200e-3, 7e-3, 26.814, 34.16e-4, 1498.53e-8, 149.85e-6, 198.97e-6, 6.62e-2, 280.03e-8, 80.01e-6, 93.43e-6, 2.86e-2, 830.6e-8, 210000e6, 0.3),
+    ('RHS200x80x4', '200x80x4', 80e-3, 200e-3, 4e-3, 16.758, 21.35e-4, 1046.02e-8, 104.6e-6, 132.36e-6, 7e-2, 249.8e-8, 62.45e-6, 69.55e-6, 3.42e-2, 663.6e-8, 210000e6, 0.3),
+    ('RHS200x80x5', '200x80x5', 80e-3, 200e-3, 5e-3, 20.69, 26.36e-4, 1269.09e-8, 126.91e-6, 161.87e-6, 6.94e-2, 300.44e-8, 75.11e-6, 84.74e-6, 3.38e-2, 808.38e-8, 210000e6, 0.3),
+    ('RHS200x80x6', '200x80x6', 80e-3, 200e-3, 6e-3, 24.518, 31.23e-4, 1477.42e-8, 147.74e-6, 189.99e-6, 6.88e-2, 346.74e-8, 86.69e-6, 99.07e-6, 3.33e-2, 944.77e-8, 210000e6, 0.3),
+    ('RHS200x80x7', '200x80x7', 80e-3, 200e-3, 7e-3, 27.913, 35.56e-4, 1628.96e-8, 162.9e-6, 212.48e-6, 6.77e-2, 382.12e-8, 95.53e-6, 110.86e-6, 3.28e-2, 1074e-8, 210000e6, 0.3),
+    ('RHS200x80x8', '200x80x8', 80e-3, 200e-3, 8e-3, 31.433, 40.04e-4, 1795.76e-8, 179.58e-6, 236.54e-6, 6.7e-2, 418.23e-8, 104.56e-6, 123.01e-6, 3.23e-2, 1191.77e-8, 210000e6, 0.3),
+    ('RHS200x100x4', '200x100x4', 100e-3, 200e-3, 4e-3, 18.014, 22.95e-4, 1199.71e-8, 119.97e-6, 148.04e-6, 7.23e-2, 410.78e-8, 82.16e-6, 91.7e-6, 4.23e-2, 985.38e-8, 210000e6, 0.3),
+    ('RHS200x100x5', '200x100x5', 100e-3, 200e-3, 5e-3, 22.26, 28.36e-4, 1459.25e-8, 145.93e-6, 181.37e-6, 7.17e-2, 496.94e-8, 99.39e-6, 112.09e-6, 4.19e-2, 1206.29e-8, 210000e6, 0.3),
+    ('RHS200x100x6', '200x100x6', 100e-3, 200e-3, 6e-3, 26.402, 33.63e-4, 1703.31e-8, 170.33e-6, 213.27e-6, 7.12e-2, 576.91e-8, 115.38e-6, 131.5e-6, 4.14e-2, 1417.03e-8, 210000e6, 0.3),
+    ('RHS200x100x7', '200x100x7', 100e-3, 200e-3, 7e-3, 30.111, 38.36e-4, 1889.81e-8, 188.98e-6, 239.5e-6, 7.02e-2, 640.33e-8, 128.07e-6, 147.82e-6, 4.09e-2, 1621.76e-8, 210000e6, 0.3),
+    ('RHS200x100x8', '200x100x8', 100e-3, 200e-3, 8e-3, 33.945, 43.24e-4, 2090.84e-8, 209.08e-6, 267.26e-6, 6.95e-2, 705.36e-8, 141.07e-6, 164.65e-6, 4.04e-2, 1810.72e-8, 210000e6, 0.3),
+    ('RHS200x120x4', '200x120x4', 120e-3, 200e-3, 4e-3, 19.27, 24.55e-4, 1353.39e-8, 135.34e-6, 163.72e-6, 7.43e-2, 617.66e-8, 102.94e-6, 115.45e-6, 5.02e-2, 1345.35e-8, 210000e6, 0.3),
+    ('RHS200x120x5', '200x120x5', 120e-3, 200e-3, 5e-3, 23.83, 30.36e-4, 1649.42e-8, 164.94e-6, 200.87e-6, 7.37e-2, 750.14e-8, 125.02e-6, 141.45e-6, 4.97e-2, 1652e-8, 210000e6, 0.3),
+    ('RHS200x120x6', '200x120x6', 120e-3, 200e-3, 6e-3, 28.286, 36.03e-4, 1929.2e-8, 192.92e-6, 236.55e-6, 7.32e-2, 874.35e-8, 145.72e-6, 166.33e-6, 4.93e-2, 1946.73e-8, 210000e6, 0.3),
+    ('RHS200x120x7', '200x120x7', 120e-3, 200e-3, 7e-3, 32.309, 41.16e-4, 2150.67e-8, 215.07e-6, 266.52e-6, 7.23e-2, 975.25e-8, 162.54e-6, 187.57e-6, 4.87e-2, 2236.96e-8, 210000e6, 0.3),
+    ('RHS200x120x8', '200x120x8', 120e-3, 200e-3, 8e-3, 36.457, 46.44e-4, 2385.92e-8, 238.59e-6, 297.98e-6, 7.17e-2, 1078.97e-8, 179.83e-6, 209.49e-6, 4.82e-2, 2507.04e-8, 210000e6, 0.3),
+    ('RHS200x150x5', '200x150x5', 150e-3, 200e-3, 5e-3, 26.185, 33.36e-4, 1934.67e-8, 193.47e-6, 230.12e-6, 7.62e-2, 1245.04e-8, 166e-6, 189.23e-6, 6.11e-2, 2391.38e-8, 210000e6, 0.3),
+    ('RHS200x150x6', '200x150x6', 150e-3, 200e-3, 6e-3, 31.112, 39.63e-4, 2268.03e-8, 226.8e-6, 271.47e-6, 7.56e-2, 1457.13e-8, 194.28e-6, 223.08e-6, 6.06e-2, 2826.19e-8, 210000e6, 0.3),
+    ('RHS200x150x7', '200x150x7', 150e-3, 200e-3, 7e-3, 35.606, 45.36e-4, 2541.96e-8, 254.2e-6, 307.05e-6, 7.49e-2, 1633.73e-8, 217.83e-6, 252.46e-6, 6e-2, 3258.9e-8, 210000e6, 0.3),
+    ('RHS200x150x8', '200x150x8', 150e-3, 200e-3, 8e-3, 40.225, 51.24e-4, 2828.55e-8, 282.85e-6, 344.06e-6, 7.43e-2, 1815.54e-8, 242.07e-6, 282.76e-6, 5.95e-2, 3664.86e-8, 210000e6, 0.3),
+    ('RHS220x80x4', '220x80x4', 80e-3, 220e-3, 4e-3, 18.014, 22.95e-4, 1332.62e-8, 121.15e-6, 154.51e-6, 7.62e-2, 272.92e-8, 68.23e-6, 75.63e-6, 3.45e-2, 749.97e-8, 210000e6, 0.3),
+    ('RHS220x80x5', '220x80x5', 80e-3, 220e-3, 5e-3, 22.26, 28.36e-4, 1619.86e-8, 147.26e-6, 189.23e-6, 7.56e-2, 328.61e-8, 82.15e-6, 92.24e-6, 3.4e-2, 913.84e-8, 210000e6, 0.3),
+    ('RHS220x80x6', '220x80x6', 80e-3, 220e-3, 6e-3, 26.402, 33.63e-4, 1889.42e-8, 171.77e-6, 222.42e-6, 7.5e-2, 379.67e-8, 94.92e-6, 107.95e-6, 3.36e-2, 1068.34e-8, 210000e6, 0.3),
+    ('RHS220x80x7', '220x80x7', 80e-3, 220e-3, 7e-3, 30.111, 38.36e-4, 2090.42e-8, 190.04e-6, 249.44e-6, 7.38e-2, 419.54e-8, 104.88e-6, 121.08e-6, 3.31e-2, 1215.08e-8, 210000e6, 0.3),
+    ('RHS220x80x8', '220x80x8', 80e-3, 220e-3, 8e-3, 33.945, 43.24e-4, 2309.95e-8, 210e-6, 278.18e-6, 7.31e-2, 459.88e-8, 114.97e-6, 134.53e-6, 3.26e-2, 1349.12e-8, 210000e6, 0.3),
+    ('RHS250x100x5', '250x100x5', 100e-3, 250e-3, 5e-3, 26.185, 33.36e-4, 2553.76e-8, 204.3e-6, 258.51e-6, 8.75e-2, 609.85e-8, 121.97e-6, 135.84e-6, 4.28e-2, 1620.11e-8, 210000e6, 0.3),
+    ('RHS250x100x6', '250x100x6', 100e-3, 250e-3, 6e-3, 31.112, 39.63e-4, 2992.34e-8, 239.39e-6, 304.85e-6, 8.69e-2, 709.63e-8, 141.93e-6, 159.7e-6, 4.23e-2, 1904.54e-8, 210000e6, 0.3),
+    ('RHS250x100x7', '250x100x7', 100e-3, 250e-3, 7e-3, 35.606, 45.36e-4, 3341.65e-8, 267.33e-6, 344.15e-6, 8.58e-2, 791.97e-8, 158.39e-6, 180.37e-6, 4.18e-2, 2181.58e-8, 210000e6, 0.3),
+    ('RHS250x100x8', '250x100x8', 100e-3, 250e-3, 8e-3, 40.225, 51.24e-4, 3714.08e-8, 297.13e-6, 385.37e-6, 8.51e-2, 875.06e-8, 175.01e-6, 201.45e-6, 4.13e-2, 2438.66e-8, 210000e6, 0.3),
+    ('RHS250x150x16', '250x150x16', 150e-3, 250e-3, 16e-3, 90.300, 115.0e-4, 8880.00e-8, 710.00e-6, 906.00e-6, 8.79e-2, 3870.0e-8, 516.00e-6, 625.00e-6, 5.80e-2, 8870.00e-8, 210000e6, 0.3),
+    )
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR SHS shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'b', 'h', 'e', 'P', 'A', 'Iz', 'Iy', 'Wzel', 'Wzpl', 'iz', 'iy', 'It', 'E', 'nu')
+
+rows= (
+    ('SHS50x50x2_5', 'SHS50x50x2.5', 0.05, 0.05, 2.5e-3, 3.54, 4.51e-4, 17.9e-8, 17.9e-8, 7.16e-6, 8.47e-6, 1.99e-2, 1.99e-2, 26.8e-8, 210000e6, 0.3),
+    ('SHS50x50x3', 'SHS50x50x3', 0.05, 0.05, 3e-3, 4.22, 5.37e-4, 20.8e-8, 20.8e-8, 8.34e-6, 9.95e-6, 1.97e-2, 1.97e-2, 31.1e-8, 210000e6, 0.3),
+    ('SHS50x50x4', 'SHS50x50x4', 0.05, 0.05, 4e-3, 5.52, 7.03e-4, 26.2e-8, 26.2e-8, 10.46e-6, 12.73e-6, 1.93e-2, 1.93e-2, 38.9e-8, 210000e6, 0.3),
+    ('SHS50x50x5', 'SHS50x50x5', 0.05, 0.05, 5e-3, 6.78, 8.64e-4, 30.8e-8, 30.8e-8, 12.3e-6, 15.25e-6, 1.89e-2, 1.89e-2, 45.6e-8, 210000e6, 0.3),
+    ('SHS60x60x2', 'SHS60x60x2', 0.06, 0.06, 2e-3, 3.6, 4.58e-4, 26e-8, 26e-8, 8.68e-6, 10.1e-6, 2.38e-2, 2.38e-2, 39e-8, 210000e6, 0.3),
+    ('SHS60x60x3', 'SHS60x60x3', 0.06, 0.06, 3e-3, 5.32, 6.78e-4, 37.1e-8, 37.1e-8, 12.38e-6, 14.63e-6, 2.34e-2, 2.34e-2, 55.6e-8, 210000e6, 0.3),
+    ('SHS60x60x4', 'SHS60x60x4', 0.06, 0.06, 4e-3, 7, 8.92e-4, 47.1e-8, 47.1e-8, 15.69e-6, 18.85e-6, 2.3e-2, 2.3e-2, 70.2e-8, 210000e6, 0.3),
+    ('SHS60x60x5', 'SHS60x60x5', 0.06, 0.06, 5e-3, 8.63, 10.99e-4, 55.9e-8, 55.9e-8, 18.64e-6, 22.75e-6, 2.26e-2, 2.26e-2, 83.2e-8, 210000e6, 0.3),
+    ('SHS70x70x2', 'SHS70x70x2', 0.07, 0.07, 2e-3, 4.34, 5.53e-4, 42e-8, 42e-8, 11.99e-6, 13.88e-6, 2.76e-2, 2.76e-2, 62.9e-8, 210000e6, 0.3),
+    ('SHS70x70x3', 'SHS70x70x3', 0.07, 0.07, 3e-3, 6.43, 8.2e-4, 60.3e-8, 60.3e-8, 17.22e-6, 20.21e-6, 2.71e-2, 2.71e-2, 90.2e-8, 210000e6, 0.3),
+    ('SHS70x70x4', 'SHS70x70x4', 0.07, 0.07, 4e-3, 8.48, 10.8e-4, 76.9e-8, 76.9e-8, 21.98e-6, 26.17e-6, 2.67e-2, 2.67e-2, 115e-8, 210000e6, 0.3),
+    ('SHS70x70x5', 'SHS70x70x5', 0.07, 0.07, 5e-3, 10.48, 13.35e-4, 92.1e-8, 92.1e-8, 26.31e-6, 31.75e-6, 2.63e-2, 2.63e-2, 137.3e-8, 210000e6, 0.3),
+    ('SHS75x75x2', 'SHS75x75x2', 0.075, 0.075, 2e-3, 4.54, 5.78e-4, 51.9e-8, 51.9e-8, 13.84e-6, 15.99e-6, 3e-2, 3e-2, 77.8e-8, 210000e6, 0.3),
+    ('SHS75x75x3', 'SHS75x75x3', 0.075, 0.075, 3e-3, 6.73, 8.57e-4, 74.8e-8, 74.8e-8, 19.94e-6, 23.34e-6, 2.95e-2, 2.95e-2, 112e-8, 210000e6, 0.3),
+    ('SHS75x75x4', 'SHS75x75x4', 0.075, 0.075, 4e-3, 8.87, 11.3e-4, 95.7e-8, 95.7e-8, 25.53e-6, 30.28e-6, 2.91e-2, 2.91e-2, 143.2e-8, 210000e6, 0.3),
+    ('SHS75x75x5', 'SHS75x75x5', 0.075, 0.075, 5e-3, 10.97, 13.97e-4, 114.9e-8, 114.9e-8, 30.64e-6, 36.81e-6, 2.87e-2, 2.87e-2, 171.5e-8, 210000e6, 0.3),
+    ('SHS80x80x2', 'SHS80x80x2', 0.08, 0.08, 2e-3, 4.83, 6.15e-4, 63.3e-8, 63.3e-8, 15.83e-6, 18.26e-6, 3.21e-2, 3.21e-2, 94.9e-8, 210000e6, 0.3),
+    ('SHS80x80x3', 'SHS80x80x3', 0.08, 0.08, 3e-3, 7.17, 9.14e-4, 91.4e-8, 91.4e-8, 22.86e-6, 26.69e-6, 3.16e-2, 3.16e-2, 137e-8, 210000e6, 0.3),
+    ('SHS80x80x4', 'SHS80x80x4', 0.08, 0.08, 4e-3, 9.47, 12.06e-4, 117.4e-8, 117.4e-8, 29.35e-6, 34.69e-6, 3.12e-2, 3.12e-2, 175.6e-8, 210000e6, 0.3),
+    ('SHS80x80x5', 'SHS80x80x5', 0.08, 0.08, 5e-3, 11.71, 14.92e-4, 141.3e-8, 141.3e-8, 35.31e-6, 42.25e-6, 3.08e-2, 3.08e-2, 210.9e-8, 210000e6, 0.3),
+    ('SHS80x80x6', 'SHS80x80x6', 0.08, 0.08, 6e-3, 13.9, 17.71e-4, 163.2e-8, 163.2e-8, 40.79e-6, 49.39e-6, 3.04e-2, 3.04e-2, 243.1e-8, 210000e6, 0.3),
+    ('SHS90x90x2', 'SHS90x90x2', 0.09, 0.09, 2e-3, 5.57, 7.1e-4, 90.9e-8, 90.9e-8, 20.2e-6, 23.24e-6, 3.58e-2, 3.58e-2, 136.3e-8, 210000e6, 0.3),
+    ('SHS90x90x3', 'SHS90x90x3', 0.09, 0.09, 3e-3, 8.28, 10.55e-4, 131.9e-8, 131.9e-8, 29.3e-6, 34.07e-6, 3.54e-2, 3.54e-2, 197.6e-8, 210000e6, 0.3),
+    ('SHS90x90x4', 'SHS90x90x4', 0.09, 0.09, 4e-3, 10.94, 13.94e-4, 170e-8, 170e-8, 37.77e-6, 44.41e-6, 3.49e-2, 3.49e-2, 254.4e-8, 210000e6, 0.3),
+    ('SHS90x90x5', 'SHS90x90x5', 0.09, 0.09, 5e-3, 13.56, 17.27e-4, 205.4e-8, 205.4e-8, 45.65e-6, 54.25e-6, 3.45e-2, 3.45e-2, 307.1e-8, 210000e6, 0.3),
+    ('SHS90x90x6', 'SHS90x90x6', 0.09, 0.09, 6e-3, 16.12, 20.54e-4, 238.3e-8, 238.3e-8, 52.95e-6, 63.61e-6, 3.41e-2, 3.41e-2, 355.6e-8, 210000e6, 0.3),
+    ('SHS100x100x3', 'SHS100x100x3', 0.1, 0.1, 3e-3, 9.02, 11.49e-4, 182.7e-8, 182.7e-8, 36.54e-6, 42.35e-6, 3.99e-2, 3.99e-2, 273.8e-8, 210000e6, 0.3),
+    ('SHS100x100x4', 'SHS100x100x4', 0.1, 0.1, 4e-3, 11.93, 15.2e-4, 236.3e-8, 236.3e-8, 47.27e-6, 55.33e-6, 3.94e-2, 3.94e-2, 353.9e-8, 210000e6, 0.3),
+    ('SHS100x100x5', 'SHS100x100x5', 0.1, 0.1, 5e-3, 14.79, 18.84e-4, 286.6e-8, 286.6e-8, 57.32e-6, 67.75e-6, 3.9e-2, 3.9e-2, 428.7e-8, 210000e6, 0.3),
+    ('SHS100x100x6', 'SHS100x100x6', 0.1, 0.1, 6e-3, 17.6, 22.42e-4, 333.6e-8, 333.6e-8, 66.72e-6, 79.63e-6, 3.86e-2, 3.86e-2, 498.4e-8, 210000e6, 0.3),
+    ('SHS100x100x7', 'SHS100x100x7', 0.1, 0.1, 7e-3, 20.36, 25.94e-4, 377.5e-8, 377.5e-8, 75.5e-6, 90.99e-6, 3.82e-2, 3.82e-2, 563e-8, 210000e6, 0.3),
+    ('SHS110x110x3', 'SHS110x110x3', 0.11, 0.11, 3e-3, 9.76, 12.43e-4, 245.2e-8, 245.2e-8, 44.58e-6, 51.53e-6, 4.44e-2, 4.44e-2, 367.5e-8, 210000e6, 0.3),
+    ('SHS110x110x4', 'SHS110x110x4', 0.11, 0.11, 4e-3, 12.92, 16.45e-4, 318.1e-8, 318.1e-8, 57.83e-6, 67.45e-6, 4.4e-2, 4.4e-2, 476.4e-8, 210000e6, 0.3),
+    ('SHS110x110x5', 'SHS110x110x5', 0.11, 0.11, 5e-3, 16.02, 20.41e-4, 386.8e-8, 386.8e-8, 70.32e-6, 82.75e-6, 4.35e-2, 4.35e-2, 578.8e-8, 210000e6, 0.3),
+    ('SHS110x110x6', 'SHS110x110x6', 0.11, 0.11, 6e-3, 19.08, 24.3e-4, 451.4e-8, 451.4e-8, 82.08e-6, 97.45e-6, 4.31e-2, 4.31e-2, 674.9e-8, 210000e6, 0.3),
+    ('SHS110x110x7', 'SHS110x110x7', 0.11, 0.11, 7e-3, 22.09, 28.13e-4, 512.3e-8, 512.3e-8, 93.14e-6, 111.57e-6, 4.27e-2, 4.27e-2, 764.9e-8, 210000e6, 0.3),
+    ('SHS120x120x3', 'SHS120x120x3', 0.12, 0.12, 3e-3, 10.87, 13.85e-4, 320.5e-8, 320.5e-8, 53.42e-6, 61.61e-6, 4.81e-2, 4.81e-2, 480.5e-8, 210000e6, 0.3),
+    ('SHS120x120x4', 'SHS120x120x4', 0.12, 0.12, 4e-3, 14.4, 18.34e-4, 416.7e-8, 416.7e-8, 69.46e-6, 80.77e-6, 4.77e-2, 4.77e-2, 624.4e-8, 210000e6, 0.3),
+    ('SHS120x120x5', 'SHS120x120x5', 0.12, 0.12, 5e-3, 17.87, 22.77e-4, 507.9e-8, 507.9e-8, 84.65e-6, 99.25e-6, 4.72e-2, 4.72e-2, 760.4e-8, 210000e6, 0.3),
+    ('SHS120x120x6', 'SHS120x120x6', 0.12, 0.12, 6e-3, 21.3, 27.13e-4, 594.3e-8, 594.3e-8, 99.04e-6, 117.07e-6, 4.68e-2, 4.68e-2, 888.9e-8, 210000e6, 0.3),
+    ('SHS120x120x7', 'SHS120x120x7', 0.12, 0.12, 7e-3, 24.67, 31.43e-4, 675.9e-8, 675.9e-8, 112.66e-6, 134.25e-6, 4.64e-2, 4.64e-2, 1010e-8, 210000e6, 0.3),
+    ('SHS125x125x3', 'SHS125x125x3', 0.125, 0.125, 3e-3, 11.24, 14.32e-4, 363.4e-8, 363.4e-8, 58.14e-6, 66.99e-6, 5.04e-2, 5.04e-2, 544.8e-8, 210000e6, 0.3),
+    ('SHS125x125x4', 'SHS125x125x4', 0.125, 0.125, 4e-3, 14.89, 18.97e-4, 472.9e-8, 472.9e-8, 75.67e-6, 87.88e-6, 4.99e-2, 4.99e-2, 708.6e-8, 210000e6, 0.3),
+    ('SHS125x125x5', 'SHS125x125x5', 0.125, 0.125, 5e-3, 18.49, 23.55e-4, 577e-8, 577e-8, 92.32e-6, 108.06e-6, 4.95e-2, 4.95e-2, 864e-8, 210000e6, 0.3),
+    ('SHS125x125x6', 'SHS125x125x6', 0.125, 0.125, 6e-3, 22.04, 28.07e-4, 675.8e-8, 675.8e-8, 108.12e-6, 127.56e-6, 4.91e-2, 4.91e-2, 1011.1e-8, 210000e6, 0.3),
+    ('SHS125x125x7', 'SHS125x125x7', 0.125, 0.125, 7e-3, 25.54, 32.53e-4, 769.4e-8, 769.4e-8, 123.11e-6, 146.37e-6, 4.86e-2, 4.86e-2, 1150.1e-8, 210000e6, 0.3),
+    ('SHS127x127x3', 'SHS127x127x3', 0.127, 0.127, 3e-3, 11.54, 14.7e-4, 381.5e-8, 381.5e-8, 60.09e-6, 69.21e-6, 5.1e-2, 5.1e-2, 572e-8, 210000e6, 0.3),
+    ('SHS127x127x4', 'SHS127x127x4', 0.127, 0.127, 4e-3, 15.28, 19.47e-4, 496.8e-8, 496.8e-8, 78.23e-6, 90.81e-6, 5.05e-2, 5.05e-2, 744.3e-8, 210000e6, 0.3),
+    ('SHS127x127x5', 'SHS127x127x5', 0.127, 0.127, 5e-3, 18.98, 24.18e-4, 606.3e-8, 606.3e-8, 95.48e-6, 111.69e-6, 5.01e-2, 5.01e-2, 907.9e-8, 210000e6, 0.3),
+    ('SHS127x127x6', 'SHS127x127x6', 0.127, 0.127, 6e-3, 22.63, 28.83e-4, 710.4e-8, 710.4e-8, 111.87e-6, 131.88e-6, 4.96e-2, 4.96e-2, 1062.9e-8, 210000e6, 0.3),
+    ('SHS127x127x7', 'SHS127x127x7', 0.127, 0.127, 7e-3, 26.23, 33.41e-4, 809.1e-8, 809.1e-8, 127.42e-6, 151.37e-6, 4.92e-2, 4.92e-2, 1209.6e-8, 210000e6, 0.3),
+    ('SHS135x135x3', 'SHS135x135x3', 0.135, 0.135, 3e-3, 11.98, 15.26e-4, 460.2e-8, 460.2e-8, 68.18e-6, 78.42e-6, 5.49e-2, 5.49e-2, 690e-8, 210000e6, 0.3),
+    ('SHS135x135x4', 'SHS135x135x4', 0.135, 0.135, 4e-3, 15.87, 20.22e-4, 600e-8, 600e-8, 88.9e-6, 103e-6, 5.45e-2, 5.45e-2, 899.2e-8, 210000e6, 0.3),
+    ('SHS135x135x5', 'SHS135x135x5', 0.135, 0.135, 5e-3, 19.72, 25.12e-4, 733.4e-8, 733.4e-8, 108.65e-6, 126.81e-6, 5.4e-2, 5.4e-2, 1098.5e-8, 210000e6, 0.3),
+    ('SHS135x135x6', 'SHS135x135x6', 0.135, 0.135, 6e-3, 23.52, 29.96e-4, 860.5e-8, 860.5e-8, 127.49e-6, 149.88e-6, 5.36e-2, 5.36e-2, 1288e-8, 210000e6, 0.3),
+    ('SHS135x135x7', 'SHS135x135x7', 0.135, 0.135, 7e-3, 27.26, 34.73e-4, 981.6e-8, 981.6e-8, 145.42e-6, 172.2e-6, 5.32e-2, 5.32e-2, 1468e-8, 210000e6, 0.3),
+    ('SHS140x140x4', 'SHS140x140x4', 0.14, 0.14, 4e-3, 16.86, 21.48e-4, 671.4e-8, 671.4e-8, 95.91e-6, 111.01e-6, 5.59e-2, 5.59e-2, 1006.2e-8, 210000e6, 0.3),
+    ('SHS140x140x5', 'SHS140x140x5', 0.14, 0.14, 5e-3, 20.95, 26.69e-4, 821.3e-8, 821.3e-8, 117.32e-6, 136.75e-6, 5.55e-2, 5.55e-2, 1230.2e-8, 210000e6, 0.3),
+    ('SHS140x140x6', 'SHS140x140x6', 0.14, 0.14, 6e-3, 25, 31.84e-4, 964.4e-8, 964.4e-8, 137.77e-6, 161.71e-6, 5.5e-2, 5.5e-2, 1443.7e-8, 210000e6, 0.3),
+    ('SHS140x140x7', 'SHS140x140x7', 0.14, 0.14, 7e-3, 28.99, 36.93e-4, 1100.9e-8, 1100.9e-8, 157.28e-6, 185.91e-6, 5.46e-2, 5.46e-2, 1646.8e-8, 210000e6, 0.3),
+    ('SHS140x140x8', 'SHS140x140x8', 0.14, 0.14, 8e-3, 32.93, 41.95e-4, 1231.2e-8, 1231.2e-8, 175.88e-6, 209.34e-6, 5.42e-2, 5.42e-2, 1840e-8, 210000e6, 0.3),
+    ('SHS150x150x4', 'SHS150x150x4', 0.15, 0.15, 4e-3, 18.14, 23.11e-4, 830.5e-8, 830.5e-8, 110.74e-6, 127.93e-6, 5.99e-2, 5.99e-2, 1244.9e-8, 210000e6, 0.3),
+    ('SHS150x150x5', 'SHS150x150x5', 0.15, 0.15, 5e-3, 22.55, 28.73e-4, 1017.4e-8, 1017.4e-8, 135.66e-6, 157.75e-6, 5.95e-2, 5.95e-2, 1524.3e-8, 210000e6, 0.3),
+    ('SHS150x150x6', 'SHS150x150x6', 0.15, 0.15, 6e-3, 26.92, 34.29e-4, 1196.5e-8, 1196.5e-8, 159.53e-6, 186.73e-6, 5.91e-2, 5.91e-2, 1791.6e-8, 210000e6, 0.3),
+    ('SHS150x150x7', 'SHS150x150x7', 0.15, 0.15, 7e-3, 31.23, 39.78e-4, 1367.9e-8, 1367.9e-8, 182.39e-6, 214.89e-6, 5.86e-2, 5.86e-2, 2046.9e-8, 210000e6, 0.3),
+    ('SHS150x150x8', 'SHS150x150x8', 0.15, 0.15, 8e-3, 35.5, 45.22e-4, 1531.9e-8, 1531.9e-8, 204.26e-6, 242.22e-6, 5.82e-2, 5.82e-2, 2290.6e-8, 210000e6, 0.3),
+    ('SHS160x160x4', 'SHS160x160x4', 0.16, 0.16, 4e-3, 19.33, 24.62e-4, 1013e-8, 1013e-8, 126.63e-6, 146.05e-6, 6.41e-2, 6.41e-2, 1518.6e-8, 210000e6, 0.3),
+    ('SHS160x160x5', 'SHS160x160x5', 0.16, 0.16, 5e-3, 24.03, 30.62e-4, 1242.6e-8, 1242.6e-8, 155.32e-6, 180.25e-6, 6.37e-2, 6.37e-2, 1861.9e-8, 210000e6, 0.3),
+    ('SHS160x160x6', 'SHS160x160x6', 0.16, 0.16, 6e-3, 28.69, 36.55e-4, 1463.1e-8, 1463.1e-8, 182.89e-6, 213.55e-6, 6.33e-2, 6.33e-2, 2191.4e-8, 210000e6, 0.3),
+    ('SHS160x160x7', 'SHS160x160x7', 0.16, 0.16, 7e-3, 33.3, 42.42e-4, 1674.9e-8, 1674.9e-8, 209.36e-6, 245.97e-6, 6.28e-2, 6.28e-2, 2507.1e-8, 210000e6, 0.3),
+    ('SHS160x160x8', 'SHS160x160x8', 0.16, 0.16, 8e-3, 37.86, 48.23e-4, 1878.2e-8, 1878.2e-8, 234.77e-6, 277.5e-6, 6.24e-2, 6.24e-2, 2809.4e-8, 210000e6, 0.3),
+    ('SHS175x175x5', 'SHS175x175x5', 0.175, 0.175, 5e-3, 26.39, 33.61e-4, 1639.1e-8, 1639.1e-8, 187.32e-6, 216.81e-6, 6.98e-2, 6.98e-2, 2456.5e-8, 210000e6, 0.3),
+    ('SHS175x175x6', 'SHS175x175x6', 0.175, 0.175, 6e-3, 31.52, 40.15e-4, 1933.2e-8, 1933.2e-8, 220.93e-6, 257.16e-6, 6.94e-2, 6.94e-2, 2896.1e-8, 210000e6, 0.3),
+    ('SHS175x175x7', 'SHS175x175x7', 0.175, 0.175, 7e-3, 36.6, 46.62e-4, 2216.6e-8, 2216.6e-8, 253.33e-6, 296.52e-6, 6.9e-2, 6.9e-2, 3319.1e-8, 210000e6, 0.3),
+    ('SHS175x175x8', 'SHS175x175x8', 0.175, 0.175, 8e-3, 41.63, 53.03e-4, 2489.7e-8, 2489.7e-8, 284.53e-6, 334.92e-6, 6.85e-2, 6.85e-2, 3726e-8, 210000e6, 0.3),
+    )
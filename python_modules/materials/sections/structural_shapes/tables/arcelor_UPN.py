@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+''' ARCELOR UPN shapes (see arcelor_metric_shapes.py). Each row
+contains the designation of the shape followed by the values of the
+fields.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+fields= ('nmb', 'P', 'h', 'b', 'tw', 'tf', 'r1', 'r2', 'A', 'd', 'FI', 'Pmin', 'Pmax', 'AL', 'AG', 'Iz', 'Wzel', 'Wzpl', 'iz', 'Avy', 'Iy', 'Wyel', 'Wypl', 'iy', 'Ss', 'It', 'Iw', 'zs', 'zm', 'E', 'nu')
+
+rows= (
+    ('UPN_80', 'UPN_80', 8.65, 80e-3, 45e-3, 6e-3, 8e-3, 8e-3, 4e-3, 11.02e-4, 47e-3, '-', None, None, 0.321, 37.1, 106e-8, 26.6e-6, 32.3e-6, 3.1e-2, 4.9e-4, 19.4e-8, 6.38e-6, 11.9e-6, 1.33e-2, 19.4e-3, 2.2e-8, 0.18e-16, 1.42e-2, 2.65e-2, 2.1e+11, 0.3),
+    ('UPN_100', 'UPN_100', 10.6, 100e-3, 50e-3, 6e-3, 8.5e-3, 8.5e-3, 4.5e-3, 13.5e-4, 64e-3, '-', None, None, 0.372, 35.1, 206e-8, 41.2e-6, 49e-6, 3.91e-2, 6.46e-4, 29.3e-8, 8.49e-6, 16.2e-6, 1.47e-2, 20.3e-3, 2.81e-8, 0.41e-16, 1.55e-2, 2.93e-2, 2.1e+11, 0.3),
+    ('UPN_120', 'UPN_120', 13.4, 120e-3, 55e-3, 7e-3, 9e-3, 9e-3, 4.5e-3, 17e-4, 82e-3, '-', None, None, 0.434, 32.52, 364e-8, 60.7e-6, 72.6e-6, 4.62e-2, 8.8e-4, 43.2e-8, 11.1e-6, 21.2e-6, 1.59e-2, 22.2e-3, 4.15e-8, 0.9e-16, 1.6e-2, 3.03e-2, 2.1e+11, 0.3),
+    ('UPN_140', 'UPN_140', 16, 140e-3, 60e-3, 7e-3, 10e-3, 10e-3, 5e-3, 20.4e-4, 98e-3, 'M 12', 33e-3, 37e-3, 0.489, 30.54, 605e-8, 86.4e-6, 103e-6, 5.45e-2, 10.41e-4, 62.7e-8, 14.8e-6, 28.3e-6, 1.75e-2, 23.9e-3, 5.68e-8, 1.8e-16, 1.75e-2, 3.37e-2, 2.1e+11, 0.3),
+    ('UPN_160', 'UPN_160', 18.8, 160e-3, 65e-3, 7.5e-3, 10.5e-3, 10.5e-3, 5.5e-3, 24e-4, 115e-3, 'M 12', 34e-3, 42e-3, 0.546, 28.98, 925e-8, 116e-6, 138e-6, 6.21e-2, 12.6e-4, 85.3e-8, 18.3e-6, 35.2e-6, 1.89e-2, 25.3e-3, 7.39e-8, 3.26e-16, 1.84e-2, 3.56e-2, 2.1e+11, 0.3),
+    ('UPN_180', 'UPN_180', 22, 180e-3, 70e-3, 8e-3, 11e-3, 11e-3, 5.5e-3, 28e-4, 133e-3, 'M 16', 38e-3, 41e-3, 0.611, 27.8, 1350e-8, 150e-6, 179e-6, 6.95e-2, 15.09e-4, 114e-8, 22.4e-6, 42.9e-6, 2.02e-2, 26.7e-3, 9.55e-8, 5.57e-16, 1.92e-2, 3.75e-2, 2.1e+11, 0.3),
+    ('UPN_200', 'UPN_200', 25.3, 200e-3, 75e-3, 8.5e-3, 11.5e-3, 11.5e-3, 6e-3, 32.2e-4, 151e-3, 'M 16', 39e-3, 46e-3, 0.661, 26.15, 1910e-8, 191e-6, 228e-6, 7.7e-2, 17.71e-4, 148e-8, 27e-6, 51.8e-6, 2.14e-2, 28.1e-3, 11.9e-8, 9.07e-16, 2.01e-2, 3.94e-2, 2.1e+11, 0.3),
+    ('UPN_220', 'UPN_220', 29.4, 220e-3, 80e-3, 9e-3, 12.5e-3, 12.5e-3, 6.5e-3, 37.4e-4, 167e-3, 'M 16', 40e-3, 51e-3, 0.718, 24.46, 2690e-8, 245e-6, 292e-6, 8.48e-2, 20.62e-4, 197e-8, 33.6e-6, 64.1e-6, 2.3e-2, 30.3e-3, 16e-8, 14.6e-16, 2.14e-2, 4.2e-2, 2.1e+11, 0.3),
+    ('UPN_240', 'UPN_240', 33.2, 240e-3, 85e-3, 9.5e-3, 13e-3, 13e-3, 6.5e-3, 42.3e-4, 184e-3, 'M 20', 46e-3, 50e-3, 0.775, 23.34, 3600e-8, 300e-6, 358e-6, 9.22e-2, 23.71e-4, 248e-8, 39.6e-6, 75.7e-6, 2.42e-2, 31.7e-3, 19.7e-8, 22.1e-16, 2.23e-2, 4.39e-2, 2.1e+11, 0.3),
+    ('UPN_260', 'UPN_260', 37.9, 260e-3, 90e-3, 10e-3, 14e-3, 14e-3, 7e-3, 48.3e-4, 200e-3, 'M 22', 50e-3, 52e-3, 0.834, 22, 4820e-8, 371e-6, 442e-6, 9.99e-2, 27.12e-4, 317e-8, 47.7e-6, 91.6e-6, 2.56e-2, 33.9e-3, 25.5e-8, 33.3e-16, 2.36e-2, 4.66e-2, 2.1e+11, 0.3),
+    ('UPN_280', 'UPN_280', 41.8, 280e-3, 95e-3, 10e-3, 15e-3, 15e-3, 7.5e-3, 53.3e-4, 216e-3, 'M 22', 52e-3, 57e-3, 0.89, 21.27, 6280e-8, 448e-6, 532e-6, 10.9e-2, 29.28e-4, 399e-8, 57.2e-6, 109e-6, 2.74e-2, 35.6e-3, 31e-8, 48.5e-16, 2.53e-2, 5.02e-2, 2.1e+11, 0.3),
+    ('UPN_300', 'UPN_300', 46.2, 300e-3, 100e-3, 10e-3, 16e-3, 16e-3, 8e-3, 58.8e-4, 232e-3, 'M 24', 55e-3, 59e-3, 0.95, 20.58, 8030e-8, 535e-6, 632e-6, 11.7e-2, 31.77e-4, 495e-8, 67.8e-6, 130e-6, 2.9e-2, 37.3e-3, 37.4e-8, 69.1e-16, 2.7e-2, 5.41e-2, 2.1e+11, 0.3),
+    ('UPN_320', 'UPN_320', 59.5, 320e-3, 100e-3, 14e-3, 17.5e-3, 17.5e-3, 8.75e-3, 75.8e-4, 246e-3, 'M 22', 58e-3, 62e-3, 0.982, 16.5, 10870e-8, 679e-6, 826e-6, 12.1e-2, 47.11e-4, 597e-8, 80.6e-6, 152e-6, 2.81e-2, 43e-3, 66.7e-8, 96.1e-16, 2.6e-2, 4.82e-2, 2.1e+11, 0.3),
+    ('UPN_350', 'UPN_350', 60.6, 350e-3, 100e-3, 14e-3, 16e-3, 16e-3, 8e-3, 77.3e-4, 282e-3, 'M 22', 56e-3, 62e-3, 1.047, 17.25, 12840e-8, 734e-6, 918e-6, 12.9e-2, 50.84e-4, 570e-8, 75e-6, 143e-6, 2.72e-2, 40.7e-3, 61.2e-8, 114e-16, 2.4e-2, 4.45e-2, 2.1e+11, 0.3),
+    ('UPN_380', 'UPN_380', 63.1, 380e-3, 102e-3, 13.5e-3, 16e-3, 16e-3, 8e-3, 80.4e-4, 313e-3, 'M 24', 59e-3, 60e-3, 1.11, 17.59, 15760e-8, 829e-6, 1014e-6, 14e-2, 53.23e-4, 615e-8, 78.7e-6, 148e-6, 2.77e-2, 40.3e-3, 59.1e-8, 146e-16, 2.38e-2, 4.58e-2, 2.1e+11, 0.3),
+    ('UPN_400', 'UPN_400', 71.8, 400e-3, 110e-3, 14e-3, 18e-3, 18e-3, 9e-3, 91.5e-4, 324e-3, 'M 27', 61e-3, 62e-3, 1.182, 16.46, 20350e-8, 1020e-6, 1240e-6, 14.9e-2, 58.55e-4, 846e-8, 102e-6, 190e-6, 3.04e-2, 44e-3, 81.6e-8, 221e-16, 2.65e-2, 5.11e-2, 2.1e+11, 0.3),
+    )
@@ -3,9 +3,12 @@ from __future__ import division
 
 import xc_base
 import geom
+import xc
+import numpy as np
 from model import predefined_spaces
 from materials import typical_materials
 from model.sets import sets_mng 
+from miscUtils import LogMessages as lmsg
 
 '''Generation of boundary conditions based on springs 
 '''
@@ -90,45 +93,62 @@ class ElasticFoundation(object):
     def __init__(self,wModulus,cRoz):
         self.wModulus= wModulus
         self.cRoz= cRoz
-    def createMaterials(self,preprocessor,name):
-        #elastic materials (los incializamos aquí para luego aplicar el módulo elástico que corresponda a cada nudo)
-        self.xSpringName= name + '_xSpring'
-        self.xSpring=typical_materials.defElasticMaterial(preprocessor,self.xSpringName,0.1)
-        self.ySpringName= name + '_ySpring'
-        self.ySpring=typical_materials.defElasticMaterial(preprocessor,self.ySpringName,0.1)
-        self.zSpringName= name + '_zSpring'
-        self.zSpring=typical_materials.defElasticMaterial(preprocessor,self.zSpringName,1)
     def generateSprings(self,xcSet):
-        '''Creates the springs at the nodes.'''
+        '''Creates the springs at the nodes (all of them are created
+           by a single call to the element handler, see
+           ElementHandler::newElasticBearings).'''
         self.foundationSet= xcSet #Set with elastic supported elements
-        self.springs= list() #spring elements.
-        self.foundationSet.resetTributaries()
-        self.foundationSet.computeTributaryAreas(False)
+        nodeTags= self.foundationSet.getIdNodeTags()
+        areas= self.foundationSet.getTributaryAreas(False)
+        if(len(nodeTags)!=len(areas)):
+            lmsg.error('number of tributary areas: '+str(len(areas))+' differs from the number of nodes: '+str(len(nodeTags))+' of the set: '+self.foundationSet.name)
+        tributaryAreas= dict(zip(nodeTags,areas))
         sNod= self.foundationSet.getNodes
         preprocessor= self.foundationSet.getPreprocessor
-        modelSpace= predefined_spaces.getStructuralMechanics3DSpace(preprocessor)
-        self.createMaterials(preprocessor,self.foundationSet.name)
-        idElem= preprocessor.getElementHandler.defaultTag
-        for n in sNod:
-            arTribNod=n.getTributaryArea()
-            self.xSpring.E= self.cRoz*self.wModulus*arTribNod
-            self.ySpring.E= self.cRoz*self.wModulus*arTribNod
-            self.zSpring.E= self.wModulus*arTribNod
-            nn= modelSpace.setBearing(n.tag,[self.xSpringName,self.ySpringName,self.zSpringName])
-            self.springs.append(preprocessor.getElementHandler.getElement(idElem))
-            idElem+= 1
+        nodeList= [n for n in sNod]
+        self.tributaryAreas= np.array([tributaryAreas[n.tag] for n in nodeList])
+        self.springPositions= np.array([[pos.x,pos.y,pos.z] for pos in (n.getInitialPos3d for n in nodeList)])
+        kz= self.wModulus*self.tributaryAreas
+        kxy= self.cRoz*kz
+        stiffness= xc.Matrix(np.column_stack((kxy,kxy,kz)).tolist())
+        elements= preprocessor.getElementHandler
+        self.springTags= elements.newElasticBearings(xc.ID([n.tag for n in nodeList]),stiffness)
+        self.springs= [elements.getElement(tag) for tag in self.springTags] #spring elements.
+
     def getCentroid(self):
         '''Returns the geometric baricenter of the springs.'''
-        dx= 0.0; dy= 0.0; dz= 0.0
-        A= 0.0
-        for e in self.springs:
-            n= e.getNodes[1]
-            a= n.getTributaryArea()
-            pos= n.getInitialPos3d
-            A+= a
-            dx+= a*pos[0]; dy+= a*pos[1]; dz+= a*pos[2]
-        dx/=A; dy/=A; dz/=A
-        return geom.Pos3d(dx,dy,dz)
+        c= np.dot(self.tributaryAreas,self.springPositions)/self.tributaryAreas.sum()
+        return geom.Pos3d(c[0],c[1],c[2])
+
+    def getReactionsAndPressures(self):
+        ''' Return the forces and the pressures on the soil in the free
+        nodes of the springs (those that belongs to both the spring and 
+        the foundation) as two arrays with a row for each spring 
+        [xForce,yForce,zForce], [xStress,yStress,zStress] and the 
+        resultant of the reactions reduced to the centroid of the springs
+        (the forces of all the springs are obtained in a single call, see
+        ElementHandler::getResistingForces).'''
+        numSprings= len(self.springs)
+        forces= np.zeros((numSprings,3))
+        moments= np.zeros((numSprings,3))
+        if(numSprings>0):
+            numDOFs= len(self.springs[0].getResistingForce())//2 # forces on the first node.
+            elements= self.foundationSet.getPreprocessor.getElementHandler
+            rf= np.array(list(elements.getResistingForces(self.springTags,numDOFs))).reshape(numSprings,numDOFs)
+            if(numDOFs==3):
+                forces[:,0:2]= rf[:,0:2]
+                moments[:,2]= rf[:,2]
+            else: # 6 DOFs.
+                forces= rf[:,0:3]
+                moments= rf[:,3:6]
+        pressures= forces/self.tributaryAreas[:,np.newaxis]
+        centroid= self.getCentroid()
+        c= np.array([centroid.x,centroid.y,centroid.z])
+        resF= forces.sum(axis=0)
+        resM= moments.sum(axis=0)+np.cross(self.springPositions-c,forces).sum(axis=0)
+        resultant= geom.SlidingVectorsSystem3d(centroid,geom.Vector3d(resF[0],resF[1],resF[2]),geom.Vector3d(resM[0],resM[1],resM[2]))
+        return forces, pressures, resultant
+
     def calcPressures(self):
         ''' Foundation pressures over the soil. Calculates pressures
          and forces in the free nodes of the springs
@@ -136,26 +156,31 @@ class ElasticFoundation(object):
          and stores these values as properties of those nodes:
          property 'soilPressure:' [xStress,yStress,zStress]
          property 'soilReaction:' [xForce,yForce,zForce]'''
-        self.svdReac= geom.SlidingVectorsSystem3d()
-        f3d= geom.Vector3d(0.0,0.0,0.0)
-        m3d= geom.Vector3d(0.0,0.0,0.0)
-        for e in self.springs:
+        forces, pressures, self.svdReac= self.getReactionsAndPressures()
+        for e, f, p in zip(self.springs,forces.tolist(),pressures.tolist()):
             n= e.getNodes[1]
-            rf= e.getResistingForce()
-            a= n.getTributaryArea()
-            if(len(rf)==6):
-                f3d= geom.Vector3d(rf[0],rf[1],0.0)
-                m3d= geom.Vector3d(0.0,0.0,rf[2])
-            else: #len(rf)==12
-                f3d= geom.Vector3d(rf[0],rf[1],rf[2])
-                m3d= geom.Vector3d(rf[3],rf[4],rf[5])
-            pos= n.getInitialPos3d
-            self.svdReac+= geom.SlidingVectorsSystem3d(pos,f3d,m3d)
-
-            #print "dispZ= ", n.getDisp[2]*1e3, "mm"
-            n.setProp('soilPressure',[f3d.x/a,f3d.y/a,f3d.z/a])
-            n.setProp('soilReaction',[f3d.x,f3d.y,f3d.z])
-        return self.svdReac.reduceTo(self.getCentroid())
+            n.setProp('soilPressure',p)
+            n.setProp('soilReaction',f)
+        return self.svdReac
+
+    def calcPressuresForLoadCombinations(self,loadCombinationNames,analysis):
+        ''' Solve the model for each of the load combinations and return
+        a dictionary that contains, for each of them, the reactions,
+        pressures and resultant computed by getReactionsAndPressures.
+
+        :param loadCombinationNames: names of the load combinations.
+        :param analysis: analysis to run for each load combination.
+        '''
+        retval= dict()
+        preprocessor= self.foundationSet.getPreprocessor
+        for name in loadCombinationNames:
+            preprocessor.resetLoadCase()
+            preprocessor.getLoadHandler.addToDomain(name)
+            result= analysis.analyze(1)
+            if(result!=0):
+                lmsg.error('Can\'t solve for load combination: '+name)
+            retval[name]= self.getReactionsAndPressures()
+        return retval
 
     def displayPressures(self, defDisplay, caption,fUnitConv,unitDescription,rgMinMax=None):
         '''Display foundation pressures.
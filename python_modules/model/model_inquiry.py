@@ -6,6 +6,8 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "ana.ortega@ciccp.es, l.pereztato@ciccp.es"
 
+import geom
+
 # Return the identificadores de las lineas de un conjunto.
 def getIdsLineasSet(preprocessor, setName):
   retvalIdsLineasSet= [] 
@@ -43,21 +45,10 @@ def getNodesInCoordinateRegion(xmin,xmax,ymin,ymax,zmin,zmax,xcSet):
   :param xcSet:   xc set of nodes to which restrict the search 
 
   '''
-  retval=list()
-  setNodes=xcSet.getNodes
-  for n in setNodes:
-    vCoord=n.getCoo
-    xNod=vCoord[0]
-    if xNod >= xmin:
-      if xNod <= xmax:
-        yNod=vCoord[1]
-        if yNod >= ymin:
-          if yNod <= ymax:
-            zNod=vCoord[2]
-            if zNod >= zmin:
-              if zNod <= zmax:
-                retval.append(n)
-  return retval
+  # search using the KD tree of the node container.
+  pMin= geom.Pos3d(xmin,ymin,zmin)
+  pMax= geom.Pos3d(xmax,ymax,zmax)
+  return [n for n in xcSet.getNodes.pickNodesInBox(pMin,pMax)]
 
 def get_attached_PhModElems(elemTag,setElPhMod):
   '''This function returns an ordered (by number of section) list with the 
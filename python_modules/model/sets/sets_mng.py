@@ -151,12 +151,10 @@ def set_included_in_orthoPrism(preprocessor,setInit,prismBase,prismAxis,setName)
     :param setName:      name of the set to be generated                   
     '''
     sElIni=setInit.getElements
-    if prismAxis in ['X','x']:
-        elem_inside_prism=[e for e in sElIni if prismBase.In(geom.Pos2d(e.getPosCentroid(True).y,e.getPosCentroid(True).z),0)]
-    elif prismAxis in ['Y','y']:
-        elem_inside_prism=[e for e in sElIni if prismBase.In(geom.Pos2d(e.getPosCentroid(True).x,e.getPosCentroid(True).z),0)]
-    elif prismAxis in ['Z','z']:
-        elem_inside_prism=[e for e in sElIni if prismBase.In(geom.Pos2d(e.getPosCentroid(True).x,e.getPosCentroid(True).y),0)]
+    elem_inside_prism=list()
+    if prismAxis in ['X','x','Y','y','Z','z']:
+        # search using the KD tree of the element container.
+        elem_inside_prism=sElIni.pickElemsInOrthoPrism(prismBase,prismAxis.upper(),0.0)
     else:
         lmsg.error("Wrong prisma axis. Available values: 'X', 'Y', 'Z' \n")
     s=lstElem_to_set(preprocessor,elem_inside_prism,setName)
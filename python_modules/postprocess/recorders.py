@@ -6,6 +6,9 @@ __license__= "GPL"
 __version__= "3.0"
 __email__= "l.pereztato@gmail.com"
 
+import numpy
+import xc
+from misc import matrixUtils as mu
 from postprocess import callback_controls
 from postprocess import def_vars_control
 
@@ -25,3 +28,61 @@ def installNodeDisplacementRecorder(recorderName, nodeSet):
   recorder.callbackRestart= "print \"Restart method called.\""
   return recorder
 
+
+def installNodeEnvelopeRecorder(nodeSet, response= 'disp', components= None):
+  '''Install a recorder that keeps the envelope (max, min and max. absolute
+     value) of a node response over the load combinations. The envelope
+     is updated natively on each commit (no Python code executed).
+
+  :param nodeSet: nodes to record (i.e. xcSet.getNodes).
+  :param response: response to record: disp, vel, accel or reaction.
+  :param components: indexes of the DOFs to record (all if None).
+  '''
+  preprocessor= nodeSet.owner.getPreprocessor
+  domain= preprocessor.getDomain
+  recorder= domain.newRecorder('node_comb_envelope_recorder',None)
+  recorder.setNodes(nodeSet.getTags())
+  recorder.response= response
+  if(components):
+    recorder.components= xc.ID(components)
+  return recorder
+
+def installElementEnvelopeRecorder(elemSet, response= 'force', components= None):
+  '''Install a recorder that keeps the envelope (max, min and max. absolute
+     value) of an element response over the load combinations. The envelope
+     is updated natively on each commit (no Python code executed).
+
+  :param elemSet: elements to record (i.e. xcSet.getElements).
+  :param response: element response to record (i.e. force or localForce).
+  :param components: indexes of the response components to record 
+                     (all if None).
+  '''
+  preprocessor= elemSet.owner.getPreprocessor
+  domain= preprocessor.getDomain
+  recorder= domain.newRecorder('element_comb_envelope_recorder',None)
+  recorder.setElements(elemSet.getTags())
+  recorder.response= response
+  if(components):
+    recorder.components= xc.ID(components)
+  return recorder
+
+def getEnvelopeArrays(recorder):
+  '''Return the values stored in an envelope recorder as
+     a dictionary of NumPy arrays (one row per node or element,
+     one column per component).
+
+  :param recorder: node or element envelope recorder.
+  '''
+  retval= dict()
+  if(hasattr(recorder,'getNodeTags')):
+    tags= recorder.getNodeTags
+  else:
+    tags= recorder.getElementTags
+  retval['tags']= numpy.array(list(tags))
+  retval['max']= mu.matrixToNumpyArray(recorder.getMaxValues)
+  retval['min']= mu.matrixToNumpyArray(recorder.getMinValues)
+  retval['absMax']= mu.matrixToNumpyArray(recorder.getAbsMaxValues)
+  retval['maxComb']= numpy.array(recorder.getMaxCombs)
+  retval['minComb']= numpy.array(recorder.getMinCombs)
+  retval['absMaxComb']= numpy.array(recorder.getAbsMaxCombs)
+  return retval
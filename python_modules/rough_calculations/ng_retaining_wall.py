@@ -494,7 +494,7 @@ class RetainingWall(retaining_wall_geometry.CantileverRetainingWallGeometry):
         self.stemSet.getElements.append(e)
         self.wallSet.getElements.append(e)
     # Springs on nodes.
-    self.foundationSet.computeTributaryLengths(False)
+    self.foundationSet.getTributaryLengths(False)
     self.fixedNodes= []
     elasticBearingNodes= self.foundationSet.getNodes
     kX= springMaterials[0] #Horizontal
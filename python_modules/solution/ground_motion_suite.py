@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+''' Time history analysis of a model under a suite of ground motion
+records, each one scaled by a list of factors (code based assessment
+with 7 to 40 records, incremental dynamic analysis,...).
+
+The model is described by an object (derived from DynamicModel) that
+knows how to build it (see parallel_runner). Each (record, scale factor)
+pair is analyzed in a fresh worker process that builds the model,
+applies the scaled record as an uniform excitation and integrates the
+equations of motion, keeping track of the peak drifts and internal
+forces. The results are collected in a table
+whose rows follow the order of the records and the scale factors,
+regardless of the number of workers.
+'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018,  LCPT AO_O "
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from solution import parallel_runner
+from miscUtils import LogMessages as lmsg
+
+class AccelerationRecord(object):
+    '''Ground acceleration record sampled at a constant time step.
+
+    :ivar name: name of the record.
+    :ivar accels: list of ground accelerations.
+    :ivar dt: time step.
+    '''
+    def __init__(self, name, accels, dt):
+        self.name= name
+        self.accels= list(accels)
+        self.dt= dt
+
+    def getNumberOfSteps(self):
+        '''Return the number of time steps of the record.'''
+        return len(self.accels)-1
+
+    def getDuration(self):
+        '''Return the duration of the record.'''
+        return self.getNumberOfSteps()*self.dt
+
+def readAccelerationRecord(fileName, dt, name= None, numHeaderLines= 0, factor= 1.0):
+    '''Read an acceleration record from a text file with the values
+       separated by blanks (one or more values per line).
+
+    :param fileName: name of the file.
+    :param dt: time step of the record.
+    :param name: name of the record (defaults to the file name).
+    :param numHeaderLines: number of lines to skip at the beginning of the file.
+    :param factor: factor to apply to the values (i.e. to convert them to m/s2).
+    '''
+    accels= list()
+    with open(fileName,'r') as f:
+        lines= f.readlines()[numHeaderLines:]
+    for l in lines:
+        accels.extend([factor*float(v) for v in l.split()])
+    if(not name):
+        name= fileName
+    return AccelerationRecord(name,accels,dt)
+
+class DynamicModel(object):
+    '''Base class for the models analyzed under a suite of ground motions.
+    The derived classes must redefine the build method and must be
+    picklable (see parallel_runner).
+
+    :ivar dof: degree of freedom excited by the ground motion.
+    :ivar collapseDrift: drift ratio that is considered as collapse.
+    '''
+    def __init__(self, dof= 0, collapseDrift= 0.1):
+        self.dof= dof
+        self.collapseDrift= collapseDrift
+
+    def build(self):
+        '''Build the model (without the seismic excitation) and return
+           the FE problem.'''
+        lmsg.error('build method must be redefined in derived classes.')
+        return None
+
+    def getStoreys(self, preprocessor):
+        '''Return a list of (bottomNode, topNode, height) tuples
+           that define the storeys used to compute the drifts.
+
+        :param preprocessor: preprocessor of the model.
+        '''
+        return list()
+
+    def getForceResponses(self, preprocessor):
+        '''Return a list of (label, function) tuples with the functions
+           that give the internal forces whose peak values are computed
+           (see moving_loads.getElementResponse).
+
+        :param preprocessor: preprocessor of the model.
+        '''
+        return list()
+
+    def getAnalysis(self, feProblem):
+        '''Return the transient analysis to use.
+
+        :param feProblem: XC finite element problem.
+        '''
+        solProc= predefined_solutions.SolutionProcedure()
+        return solProc.penaltyNewmarkNewtonRapshon(feProblem)
+
+def defUniformExcitation(preprocessor, record, scaleFactor, dof):
+    '''Define a load pattern with the scaled record as uniform excitation
+       and add it to the domain.
+
+    :param preprocessor: preprocessor of the model.
+    :param record: acceleration record.
+    :param scaleFactor: factor that multiplies the accelerations.
+    :param dof: degree of freedom excited by the ground motion.
+    '''
+    lPatterns= preprocessor.getLoadHandler.getLoadPatterns
+    ts= lPatterns.newTimeSeries("constant_ts","gmTs")
+    lPatterns.currentTimeSeries= "gmTs"
+    gm= lPatterns.newLoadPattern("uniform_excitation","gm")
+    mr= gm.motionRecord
+    hist= mr.history
+    accel= lPatterns.newTimeSeries("path_ts","gmAccel")
+    accel.path= xc.Vector(record.accels)
+    accel.setTimeIncr(record.dt)
+    hist.accel= accel
+    hist.delta= record.dt
+    gm.dof= dof
+    gm.factor= scaleFactor
+    lPatterns.addToDomain("gm")
+    return gm
+
+def analyzeRecord(model, record, scaleFactor):
+    '''Build the model, analyze it under the scaled record and return
+       a dictionary with the peak values of the responses.
+
+       The collapse flag is set if the analysis fails to converge
+       or if the drift exceeds the collapse drift of the model (the
+       analysis stops in both cases).
+
+    :param model: object derived from DynamicModel.
+    :param record: acceleration record.
+    :param scaleFactor: factor that multiplies the accelerations.
+    '''
+    feProblem= model.build()
+    preprocessor= feProblem.getPreprocessor
+    storeys= model.getStoreys(preprocessor)
+    forces= model.getForceResponses(preprocessor)
+    defUniformExcitation(preprocessor,record,scaleFactor,model.dof)
+    analysis= model.getAnalysis(feProblem)
+
+    storeyDrifts= [0.0]*len(storeys)
+    peakForces= [0.0]*len(forces)
+    collapse= False
+    numSteps= 0
+    for i in range(record.getNumberOfSteps()):
+        if(analysis.analyze(1,record.dt)!=0):
+            collapse= True
+            break
+        numSteps+= 1
+        for j, (bottom, top, h) in enumerate(storeys):
+            drift= abs(top.getDisp[model.dof]-bottom.getDisp[model.dof])/h
+            storeyDrifts[j]= max(storeyDrifts[j],drift)
+        for j, (label, f) in enumerate(forces):
+            peakForces[j]= max(peakForces[j],abs(f()))
+        if(storeyDrifts and max(storeyDrifts)>model.collapseDrift):
+            collapse= True
+            break
+    retval= {'record':record.name, 'scaleFactor':scaleFactor,
+             'collapse':collapse, 'numSteps':numSteps,
+             'maxDrift':max(storeyDrifts) if storeyDrifts else 0.0,
+             'storeyDrifts':storeyDrifts}
+    for (label, f), value in zip(forces,peakForces):
+        retval[label]= value
+    return retval
+
+def analyzeTask(task):
+    '''Analyze the (model, record, scaleFactor) tuple argument.'''
+    model, record, scaleFactor= task
+    return analyzeRecord(model,record,scaleFactor)
+
+class SuiteResults(object):
+    '''Results of the analysis of a model under a ground motion suite
+    (a row for each record and scale factor).
+
+    :ivar rows: list of dictionaries (see analyzeRecord).
+    '''
+    def __init__(self, rows):
+        self.rows= rows
+
+    def getColumn(self, key):
+        '''Return the values of the column whose key is passed
+           as parameter (i.e. 'maxDrift', 'collapse',...).'''
+        return [r[key] for r in self.rows]
+
+    def getRecordRows(self, recordName):
+        '''Return the rows of the record whose name is passed
+           as parameter sorted by scale factor.'''
+        retval= [r for r in self.rows if r['record']==recordName]
+        retval.sort(key= lambda r: r['scaleFactor'])
+        return retval
+
+    def getIDACurve(self, recordName, key= 'maxDrift'):
+        '''Return the scale factors and the values of the response
+           (the maximum drift by default) of the record whose name is
+           passed as parameter (incremental dynamic analysis curve).
+
+        :param recordName: name of the record.
+        :param key: name of the response.
+        '''
+        rows= self.getRecordRows(recordName)
+        return [r['scaleFactor'] for r in rows], [r[key] for r in rows]
+
+    def getCollapseFactor(self, recordName):
+        '''Return the smallest scale factor that produces the collapse
+           for the record argument (None if it doesn't collapse).'''
+        retval= None
+        for r in self.getRecordRows(recordName):
+            if(r['collapse']):
+                retval= r['scaleFactor']
+                break
+        return retval
+
+    def writeCSV(self, fileName, keys= None):
+        '''Write the results table in a CSV file.
+
+        :param fileName: name of the file.
+        :param keys: columns to write (defaults to all of them
+                     except the storey drifts).
+        '''
+        if(not keys):
+            keys= ['record','scaleFactor','collapse','numSteps','maxDrift']
+            if(self.rows):
+                keys+= sorted([k for k in self.rows[0] if k not in keys and k!='storeyDrifts'])
+        with open(fileName,'w') as f:
+            f.write(';'.join(keys)+'\n')
+            for r in self.rows:
+                f.write(';'.join([str(r[k]) for k in keys])+'\n')
+
+class GroundMotionSuite(object):
+    '''Analysis of a model under a set of acceleration records, each
+    one scaled by a set of factors, distributed among several worker
+    processes.
+
+    :ivar model: object derived from DynamicModel.
+    :ivar records: list of acceleration records.
+    :ivar scaleFactors: list of scale factors.
+    '''
+    def __init__(self, model, records, scaleFactors= [1.0]):
+        self.model= model
+        self.records= records
+        self.scaleFactors= scaleFactors
+
+    def getTasks(self):
+        '''Return the (model, record, scaleFactor) tuples to analyze.'''
+        return [(self.model,r,f) for r in self.records for f in self.scaleFactors]
+
+    def run(self, numWorkers= None):
+        '''Analyze the model for each record and scale factor and return
+           the results table.
+
+           Each analysis is made in a new process (the model is built from
+           scratch each time) so they don't interfere with each other;
+           the results don't depend on the number of workers.
+
+        :param numWorkers: number of worker processes (defaults to the
+                           number of processors of the machine).
+        '''
+        rows= parallel_runner.runTasks(analyzeTask,self.getTasks(),numWorkers,maxTasksPerWorker= 1)
+        return SuiteResults(rows)
@@ -0,0 +1,320 @@
+# -*- coding: utf-8 -*-
+''' Linear time history analysis by modal superposition.
+
+The eigenpairs obtained from a modal analysis are used to uncouple the
+equations of motion. Each modal equation:
+
+  q_n''+ 2*zeta_n*omega_n*q_n'+ omega_n**2*q_n= p_n(t)/M_n
+
+is integrated exactly for a piecewise linear excitation (see
+A. K. Chopra "Dynamics of structures", section 5.2) so the cost of each
+time step is a few multiplications for each mode, no matter the size of
+the model. The nodal and element responses are then obtained as the
+superposition of the modal responses.
+
+The generalized masses and modal loads are computed from the masses
+assigned to the nodes (like the modal participation factors), so the
+mass of the model must be lumped at the nodes.
+'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018,  LCPT AO_O "
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+import numpy
+import xc_base
+import geom
+import xc
+from miscUtils import LogMessages as lmsg
+
+def getModalIntegrationCoefficients(omega, zeta, dt):
+    '''Return the coefficients of the recurrence formulas that give the
+       exact solution of the modal equations for an excitation that
+       varies linearly inside each time step (Chopra, table 5.2.1).
+       The formulas are written for an unit modal mass.
+
+    :param omega: numpy array with the angular frequencies of the modes.
+    :param zeta: numpy array with the damping ratios of the modes (<1).
+    :param dt: time step.
+    '''
+    k= omega**2
+    sq= numpy.sqrt(1.0-zeta**2)
+    omegaD= omega*sq
+    e= numpy.exp(-zeta*omega*dt)
+    s= numpy.sin(omegaD*dt)
+    c= numpy.cos(omegaD*dt)
+    A= (2*zeta/(omega*dt)+e*(((1-2*zeta**2)/(omegaD*dt)-zeta/sq)*s-(1+2*zeta/(omega*dt))*c))/k
+    B= (1-2*zeta/(omega*dt)+e*((2*zeta**2-1)/(omegaD*dt)*s+2*zeta/(omega*dt)*c))/k
+    C= e*(zeta/sq*s+c)
+    D= e*s/omegaD
+    Ap= (-1/dt+e*((omega/sq+zeta/(dt*sq))*s+c/dt))/k
+    Bp= (1-e*(zeta/sq*s+c))/(k*dt)
+    Cp= -e*omega/sq*s
+    Dp= e*(c-zeta/sq*s)
+    return A, B, C, D, Ap, Bp, Cp, Dp
+
+def integrateModalEquations(omega, zeta, modalForces, dt):
+    '''Integrate the uncoupled modal equations (unit modal masses)
+       and return the modal coordinates, velocities and accelerations
+       as numpy arrays with a row for each mode and a column for
+       each time step. The initial conditions are zero.
+
+    :param omega: numpy array with the angular frequencies of the modes.
+    :param zeta: numpy array with the damping ratios of the modes (<1).
+    :param modalForces: numpy array with the modal forces (divided by
+                        the modal masses); a row for each mode and
+                        a column for each time step.
+    :param dt: time step.
+    '''
+    A, B, C, D, Ap, Bp, Cp, Dp= getModalIntegrationCoefficients(omega,zeta,dt)
+    numModes, numSteps= modalForces.shape
+    q= numpy.zeros((numModes,numSteps))
+    dq= numpy.zeros((numModes,numSteps))
+    for i in range(numSteps-1):
+        p0= modalForces[:,i]
+        p1= modalForces[:,i+1]
+        q[:,i+1]= A*p0+B*p1+C*q[:,i]+D*dq[:,i]
+        dq[:,i+1]= Ap*p0+Bp*p1+Cp*q[:,i]+Dp*dq[:,i]
+    ddq= modalForces-2*(zeta*omega)[:,None]*dq-(omega**2)[:,None]*q
+    return q, dq, ddq
+
+class ResponseHistories(object):
+    '''Time histories of a group of responses.
+
+    :ivar responseNames: names of the responses.
+    :ivar times: numpy array with the time of each step.
+    :ivar values: numpy array with a row for each step and a column
+                  for each response.
+    '''
+    def __init__(self, responseNames, times, values):
+        self.responseNames= responseNames
+        self.times= times
+        self.values= values
+
+    def getHistory(self, name):
+        '''Return the history of the response.'''
+        return self.values[:,self.responseNames.index(name)]
+
+    def getMaxValues(self):
+        '''Return the maximum value of each response.'''
+        return self.values.max(axis= 0)
+
+    def getMinValues(self):
+        '''Return the minimum value of each response.'''
+        return self.values.min(axis= 0)
+
+    def getMax(self, name):
+        '''Return the maximum value of the response and the
+           time when it's reached.'''
+        j= self.responseNames.index(name)
+        i= numpy.argmax(self.values[:,j])
+        return self.values[i,j], self.times[i]
+
+    def getMin(self, name):
+        '''Return the minimum value of the response and the
+           time when it's reached.'''
+        j= self.responseNames.index(name)
+        i= numpy.argmin(self.values[:,j])
+        return self.values[i,j], self.times[i]
+
+class ModalSuperposition(object):
+    '''Linear time history analysis by modal superposition.
+
+    :ivar nodes: nodes of the model.
+    :ivar omega: angular frequencies of the modes used.
+    :ivar zeta: damping ratios of the modes used.
+    :ivar eigenvectors: list with a numpy array for each node, a row
+                        for each node DOF and a column for each mode.
+    :ivar modalMasses: generalized mass of each mode.
+    :ivar dt: time step.
+    :ivar q: modal coordinates (a row for each mode and a column for
+             each time step).
+    '''
+    def __init__(self, nodes, modalAnalysis, numModes, dampingRatios= 0.05):
+        '''Constructor.
+
+        :param nodes: nodes of the model (all the nodes with mass must
+                      be included).
+        :param modalAnalysis: modal analysis already performed.
+        :param numModes: number of modes to use.
+        :param dampingRatios: damping ratio for all the modes or list
+                              with the damping ratio of each mode.
+        '''
+        self.nodes= [n for n in nodes]
+        self.nodeIndex= dict((n.tag,i) for i, n in enumerate(self.nodes))
+        omega= modalAnalysis.getAngularFrequencies()
+        if(numModes>len(omega)):
+            lmsg.error('Only '+str(len(omega))+' modes computed; '+str(numModes)+' requested.')
+            numModes= len(omega)
+        self.omega= numpy.array([omega[i] for i in range(numModes)])
+        self.zeta= numpy.ones(numModes)*dampingRatios
+        self.eigenvectors= list()
+        self.massEigenvectors= list()
+        for n in self.nodes:
+            phi= numpy.array([list(n.getEigenvector(j+1)) for j in range(numModes)]).T
+            self.eigenvectors.append(phi)
+            mPhi= numpy.array([list(n.mass*n.getEigenvector(j+1)) for j in range(numModes)]).T
+            self.massEigenvectors.append(mPhi)
+        self.modalMasses= sum((phi*mPhi).sum(axis= 0) for phi, mPhi in zip(self.eigenvectors,self.massEigenvectors))
+        self.dt= None
+        self.q= None
+        self.dq= None
+        self.ddq= None
+        self.groundAccel= None
+        self.groundDirection= None
+
+    def getNumModes(self):
+        '''Return the number of modes used.'''
+        return len(self.omega)
+
+    def getTimes(self):
+        '''Return the time of each step.'''
+        return numpy.arange(self.q.shape[1])*self.dt
+
+    def getGroundMotionParticipation(self, direction):
+        '''Return the product of each eigenvector by the mass matrix and
+           by the rigid body displacement of the supports (L_n).
+
+        :param direction: rigid body displacement of each node (i.e.
+                          [1,0,0] for a X translation in a 2D problem).
+        '''
+        r= numpy.array(direction, dtype= float)
+        return sum(numpy.dot(r,mPhi) for mPhi in self.massEigenvectors)
+
+    def solveGroundMotion(self, accelerations, dt, direction):
+        '''Compute the response to a ground acceleration record.
+
+        :param accelerations: ground accelerations at constant time steps.
+        :param dt: time step of the record.
+        :param direction: rigid body displacement of each node (i.e.
+                          [1,0,0] for a X translation in a 2D problem).
+        '''
+        ag= numpy.array(accelerations, dtype= float)
+        L= self.getGroundMotionParticipation(direction)
+        modalForces= -(L/self.modalMasses)[:,None]*ag[None,:]
+        self.groundAccel= ag
+        self.groundDirection= numpy.array(direction, dtype= float)
+        self.solve(modalForces,dt)
+
+    def getModalLoads(self, nodalLoads):
+        '''Return the projection of the nodal loads on each mode.
+
+        :param nodalLoads: list of (node, load vector) pairs.
+        '''
+        retval= numpy.zeros(self.getNumModes())
+        for n, load in nodalLoads:
+            i= self.nodeIndex[n.tag]
+            retval+= numpy.dot(numpy.array(list(load)),self.eigenvectors[i])
+        return retval
+
+    def getModalLoadsFromStaticDisplacements(self):
+        '''Return the projection on each mode of the loads that produce
+           the current displacements of the nodes (i.e. those obtained
+           by solving a linear static analysis for a load pattern). As
+           K*phi_n= omega_n**2*M*phi_n, the projection is
+           omega_n**2*phi_n^T*M*u so the element loads are taken into
+           account too.
+        '''
+        retval= numpy.zeros(self.getNumModes())
+        for n, mPhi in zip(self.nodes,self.massEigenvectors):
+            retval+= numpy.dot(numpy.array(list(n.getDisp)),mPhi)
+        return retval*self.omega**2
+
+    def solveLoadHistory(self, modalLoads, loadFactors, dt):
+        '''Compute the response to a load whose spatial distribution is
+           constant and whose magnitude varies with time.
+
+        :param modalLoads: projection of the load on each mode (see
+                           getModalLoads and getModalLoadsFromStaticDisplacements).
+        :param loadFactors: load factors at constant time steps.
+        :param dt: time step.
+        '''
+        f= numpy.array(loadFactors, dtype= float)
+        modalForces= (modalLoads/self.modalMasses)[:,None]*f[None,:]
+        self.groundAccel= None
+        self.groundDirection= None
+        self.solve(modalForces,dt)
+
+    def solve(self, modalForces, dt):
+        '''Integrate the modal equations.
+
+        :param modalForces: modal forces divided by the modal masses
+                            (a row for each mode and a column for each
+                            time step).
+        :param dt: time step.
+        '''
+        if(numpy.any(self.zeta>=1.0)):
+            lmsg.error('Damping ratios must be smaller than 1.')
+        self.dt= dt
+        self.q, self.dq, self.ddq= integrateModalEquations(self.omega,self.zeta,modalForces,dt)
+
+    def getNodeDispHistories(self, nodes, dof):
+        '''Return the histories of the displacements (relative to the
+           supports in the case of a ground motion) of the nodes along
+           the degree of freedom argument.
+
+        :param nodes: nodes to inquire.
+        :param dof: index of the degree of freedom.
+        '''
+        phi= numpy.array([self.eigenvectors[self.nodeIndex[n.tag]][dof,:] for n in nodes])
+        names= ['disp'+str(dof)+'_'+str(n.tag) for n in nodes]
+        return ResponseHistories(names,self.getTimes(),numpy.dot(phi,self.q).T)
+
+    def getNodeAccelHistories(self, nodes, dof):
+        '''Return the histories of the absolute accelerations of the
+           nodes along the degree of freedom argument.
+
+        :param nodes: nodes to inquire.
+        :param dof: index of the degree of freedom.
+        '''
+        phi= numpy.array([self.eigenvectors[self.nodeIndex[n.tag]][dof,:] for n in nodes])
+        values= numpy.dot(phi,self.ddq).T
+        if(self.groundAccel is not None):
+            values+= self.groundDirection[dof]*self.groundAccel[:,None]
+        names= ['accel'+str(dof)+'_'+str(n.tag) for n in nodes]
+        return ResponseHistories(names,self.getTimes(),values)
+
+    def computeModalResponses(self, preprocessor, analysis, responses, loadPatternName= 'modal_load'):
+        '''Compute the value of the responses for each mode. To do
+           that the model is solved under the nodal loads
+           omega_n**2*M*phi_n whose displacements are the eigenvector
+           phi_n. The current time series of the load pattern
+           container is used.
+
+        :param preprocessor: preprocessor of the problem.
+        :param analysis: linear static analysis to use.
+        :param responses: list of (name, function) pairs (see
+                          getElementResponse and getNodeDispResponse
+                          in actions.moving_loads).
+        :param loadPatternName: name of the auxiliary load pattern.
+        '''
+        self.responseNames= [r[0] for r in responses]
+        responseFunctions= [r[1] for r in responses]
+        self.modalResponses= numpy.zeros((len(responses),self.getNumModes()))
+        lPatterns= preprocessor.getLoadHandler.getLoadPatterns
+        lp= lPatterns.newLoadPattern('default',loadPatternName)
+        for j in range(self.getNumModes()):
+            preprocessor.resetLoadCase()
+            lp.clearLoads()
+            w2= self.omega[j]**2
+            for n, mPhi in zip(self.nodes,self.massEigenvectors):
+                if(numpy.any(mPhi[:,j]!=0.0)):
+                    lp.newNodalLoad(n.tag,xc.Vector(list(w2*mPhi[:,j])))
+            lPatterns.addToDomain(loadPatternName)
+            result= analysis.analyze(1)
+            if(result!=0):
+                lmsg.error('Can\'t solve mode: '+str(j+1))
+            for i, f in enumerate(responseFunctions):
+                self.modalResponses[i,j]= f()
+        lp.clearLoads()
+        preprocessor.resetLoadCase()
+        return self.modalResponses
+
+    def getResponseHistories(self):
+        '''Return the histories of the responses whose modal values
+           have been computed with computeModalResponses.'''
+        return ResponseHistories(self.responseNames,self.getTimes(),numpy.dot(self.modalResponses,self.q).T)
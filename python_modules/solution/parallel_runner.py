@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+''' Execution of independent analyses in worker processes.
+
+The XC objects can't be sent from one process to another, so the tasks
+must describe the model by a picklable object that knows how to build
+it (each worker builds its own copy) instead of the model itself. The
+function applied to the tasks must be defined at module level, since it
+is sent to the workers by name. The results are returned in the order
+of the tasks, regardless of the number of workers.
+'''
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018,  LCPT AO_O "
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+import multiprocessing
+
+class WorkerPool(object):
+    '''Pool of worker processes that can be used for several
+    sets of tasks (the workers keep their state between them).
+
+    :ivar numWorkers: number of worker processes.
+    :ivar pool: multiprocessing pool (None if the tasks run
+                in this process).
+    '''
+    def __init__(self, numWorkers= None, initializer= None, initargs= (), maxTasksPerWorker= None):
+        '''Constructor.
+
+        :param numWorkers: number of worker processes (defaults to the
+                           number of processors of the machine). If it's
+                           1 and maxTasksPerWorker is None the tasks run
+                           in this process.
+        :param initializer: function called once by each worker before
+                            running its tasks (i.e. to build its copy of
+                            the model).
+        :param initargs: arguments of the initializer.
+        :param maxTasksPerWorker: number of tasks run by a worker before
+                                  it's replaced by a new process (1 to run
+                                  each task in a fresh process).
+        '''
+        if(not numWorkers):
+            numWorkers= multiprocessing.cpu_count()
+        self.numWorkers= max(1,numWorkers)
+        self.pool= None
+        if((self.numWorkers>1) or maxTasksPerWorker):
+            self.pool= multiprocessing.Pool(processes= self.numWorkers, initializer= initializer, initargs= initargs, maxtasksperchild= maxTasksPerWorker)
+        elif(initializer):
+            initializer(*initargs)
+
+    def map(self, func, tasks):
+        '''Return the list of the results of func for each task.
+
+        :param func: function defined at module level.
+        :param tasks: list of picklable arguments of func.
+        '''
+        if(self.pool):
+            return self.pool.map(func,tasks,chunksize= 1)
+        return [func(t) for t in tasks]
+
+    def close(self):
+        '''Wait for the workers to finish.'''
+        if(self.pool):
+            self.pool.close()
+            self.pool.join()
+            self.pool= None
+
+def runTasks(func, tasks, numWorkers= None, initializer= None, initargs= (), maxTasksPerWorker= None):
+    '''Return the list of the results of func for each task, computed
+       by a pool of worker processes (see WorkerPool).
+
+    :param func: function defined at module level.
+    :param tasks: list of picklable arguments of func.
+    :param numWorkers: number of worker processes (limited to the
+                       number of tasks).
+    :param initializer: function called once by each worker.
+    :param initargs: arguments of the initializer.
+    :param maxTasksPerWorker: number of tasks run by a worker before
+                              it's replaced by a new process.
+    '''
+    if(not numWorkers):
+        numWorkers= multiprocessing.cpu_count()
+    pool= WorkerPool(max(1,min(numWorkers,len(tasks))),initializer,initargs,maxTasksPerWorker)
+    try:
+        retval= pool.map(func,tasks)
+    finally:
+        pool.close()
+    return retval
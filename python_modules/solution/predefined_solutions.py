@@ -263,6 +263,72 @@ class SolutionProcedure(object):
         self.analysis= self.solu.newAnalysis("modal_analysis","analysisAggregation","")
         return self.analysis
 
+    def sparseFrequencyAnalysis(self,prb,shift= 0.0):
+        ''' Frequency analysis using a sparse system of equations
+            (shift-invert Lanczos over a sparse factorization with
+            fill-reducing reordering). Its memory requirements don't
+            depend on the bandwidth so it's suitable for large models.
+
+        :param prb: XC finite element problem.
+        :param shift: the eigenvalues nearest to this value are
+                      computed first.
+        '''
+        self.solu= prb.getSoluProc
+        self.solCtrl= self.solu.getSoluControl
+        solModels= self.solCtrl.getModelWrapperContainer
+        self.sm= solModels.newModelWrapper("sm")
+        self.cHandler= self.sm.newConstraintHandler("transformation_constraint_handler")
+        self.numberer= self.sm.newNumberer("default_numberer")
+        self.numberer.useAlgorithm("rcm")
+        analysisAggregations= self.solCtrl.getAnalysisAggregationContainer
+        self.analysisAggregation= analysisAggregations.newAnalysisAggregation("analysisAggregation","sm")
+        self.solAlgo= self.analysisAggregation.newSolutionAlgorithm("frequency_soln_algo")
+        self.integ= self.analysisAggregation.newIntegrator("eigen_integrator",xc.Vector([1.0,1,1.0,1.0]))
+        self.soe= self.analysisAggregation.newSystemOfEqn("sym_arpack_soe")
+        self.soe.shift= shift
+        self.solver= self.soe.newSolver("sym_arpack_solver")
+        self.analysis= self.solu.newAnalysis("modal_analysis","analysisAggregation","")
+        return self.analysis
+
+    def sparseLinearBucklingAnalysis(self,prb,numModes,shift= 0.0):
+        ''' Linear buckling analysis using sparse systems of equations
+            both for the static analysis and for the eigenproblem
+            (see sparseFrequencyAnalysis).
+
+        :param prb: XC finite element problem.
+        :param numModes: number of buckling modes to compute.
+        :param shift: the eigenvalues nearest to this value are
+                      computed first.
+        '''
+        self.solu= prb.getSoluProc
+        self.solCtrl= self.solu.getSoluControl
+        solModels= self.solCtrl.getModelWrapperContainer
+        self.sm= solModels.newModelWrapper("sm")
+        self.cHandler= self.sm.newConstraintHandler("penalty_constraint_handler")
+        self.cHandler.alphaSP= 1.0e15
+        self.cHandler.alphaMP= 1.0e15
+        self.numberer= self.sm.newNumberer("default_numberer")
+        self.numberer.useAlgorithm("rcm")
+        analysisAggregations= self.solCtrl.getAnalysisAggregationContainer
+        self.analysisAggregation= analysisAggregations.newAnalysisAggregation("analysisAggregation","sm")
+        self.solAlgo= self.analysisAggregation.newSolutionAlgorithm("newton_raphson_soln_algo")
+        self.ctest= self.analysisAggregation.newConvergenceTest("norm_disp_incr_conv_test")
+        self.ctest.tol= self.convergenceTestTol
+        self.ctest.maxNumIter= self.maxNumIter
+        self.ctest.printFlag= self.printFlag
+        self.integ= self.analysisAggregation.newIntegrator("load_control_integrator",xc.Vector([]))
+        self.soe= self.analysisAggregation.newSystemOfEqn("sparse_gen_col_lin_soe")
+        self.solver= self.soe.newSolver("super_lu_solver")
+        buck= analysisAggregations.newAnalysisAggregation("buck","sm")
+        self.buckSolAlgo= buck.newSolutionAlgorithm("linear_buckling_soln_algo")
+        self.buckInteg= buck.newIntegrator("linear_buckling_integrator",xc.Vector([]))
+        self.buckSoe= buck.newSystemOfEqn("sym_arpack_soe")
+        self.buckSoe.shift= shift
+        self.buckSolver= self.buckSoe.newSolver("sym_arpack_solver")
+        self.analysis= self.solu.newAnalysis("linear_buckling_analysis","analysisAggregation","buck")
+        self.analysis.numModes= numModes
+        return self.analysis
+
 #Typical solution procedures.
 
 #Linear static analysis.
@@ -292,12 +358,21 @@ def frequency_analysis(prb):
     solution= SolutionProcedure()
     return solution.frequencyAnalysis(prb)
 
+def sparse_frequency_analysis(prb,shift= 0.0):
+    solution= SolutionProcedure()
+    return solution.sparseFrequencyAnalysis(prb,shift)
+
+def sparse_linear_buckling_analysis(prb,numModes,shift= 0.0):
+    solution= SolutionProcedure()
+    return solution.sparseLinearBucklingAnalysis(prb,numModes,shift)
+
 def resuelveComb(preprocessor,nmbComb,analysis,numSteps):
     preprocessor.resetLoadCase()
     preprocessor.getLoadHandler.addToDomain(nmbComb)
     analOk= analysis.analyze(numSteps)
     preprocessor.getLoadHandler.removeFromDomain(nmbComb)
     # print "Resuelta combinación: ",nmbComb,"\n"
+    return analOk
 
 def resuelveCombEstatLin(preprocessor,nmbComb,analysis,numSteps):
     print "DEPRECATED; use resuelveComb"
@@ -0,0 +1,327 @@
+# -*- coding: utf-8 -*-
+''' Monte Carlo sampling analysis of the limit-state functions of a
+model whose realizations are evaluated in parallel.
+
+The model is described by an object (derived from SamplingModel) that
+knows how to build it and how to evaluate the limit-state functions for
+a realization of the random variables (see parallel_runner). Each worker
+process builds its own copy of the model once and then evaluates the
+realizations it receives.
+
+The random numbers of the k-th realization are drawn from the stream
+(seed, k) of a Mersenne twister generator (xc.Mt19937RandGenerator), and
+the statistics are accumulated in the order of the realizations,
+checking the target coefficient of variation after each one (the
+realizations evaluated beyond it are discarded). So, for a given seed,
+the results don't depend on the batch size nor on the number of
+workers.
+
+Besides crude Monte Carlo, importance sampling is available: the
+realizations are drawn (in the standard normal space) from a normal
+density with the given centre (i.e. the design point obtained with
+FORM) and standard deviations, and each one is weighted with the ratio
+between the standard normal density and the sampling density.
+
+Scope: the random variables are independent and defined in Python
+(NormalVariable, LognormalVariable); the ReliabilityDomain of the
+problem (correlations and the other random variable types) is not used,
+and the C++ SamplingAnalysis is left as it was.
+'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018,  LCPT AO_O "
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+import copy
+import math
+import xc_base
+import geom
+import xc
+from solution import parallel_runner
+from miscUtils import LogMessages as lmsg
+
+class NormalVariable(object):
+    '''Normal random variable.
+
+    :ivar mean: mean value.
+    :ivar stdDev: standard deviation.
+    '''
+    def __init__(self, mean, stdDev):
+        self.mean= mean
+        self.stdDev= stdDev
+
+    def getValue(self, u):
+        '''Return the value that corresponds to the standard normal
+           value argument.'''
+        return self.mean+self.stdDev*u
+
+class LognormalVariable(object):
+    '''Lognormal random variable.
+
+    :ivar mean: mean value.
+    :ivar stdDev: standard deviation.
+    '''
+    def __init__(self, mean, stdDev):
+        self.mean= mean
+        self.stdDev= stdDev
+        self.zeta= math.sqrt(math.log(1.0+(stdDev/mean)**2))
+        self.lmbda= math.log(mean)-self.zeta**2/2.0
+
+    def getValue(self, u):
+        '''Return the value that corresponds to the standard normal
+           value argument.'''
+        return math.exp(self.lmbda+self.zeta*u)
+
+class SamplingModel(object):
+    '''Base class for the models whose limit-state functions are sampled.
+    The derived classes must redefine the build and evaluate methods and
+    must be picklable (see parallel_runner); build is called on a copy
+    of the object in each worker.
+
+    :ivar randomVariables: list of independent random variables
+                           (see NormalVariable and LognormalVariable).
+    :ivar numLimitStateFunctions: number of limit-state functions.
+    '''
+    def __init__(self, randomVariables, numLimitStateFunctions= 1):
+        self.randomVariables= randomVariables
+        self.numLimitStateFunctions= numLimitStateFunctions
+
+    def getNumberOfRandomVariables(self):
+        '''Return the number of random variables.'''
+        return len(self.randomVariables)
+
+    def getX(self, u):
+        '''Return the values of the random variables that correspond
+           to the standard normal values argument.'''
+        return [rv.getValue(ui) for rv, ui in zip(self.randomVariables,u)]
+
+    def build(self):
+        '''Build the finite element model (called once in each worker).'''
+        lmsg.error('build method must be redefined in derived classes.')
+
+    def evaluate(self, x):
+        '''Return the values of the limit-state functions (negative values
+           mean failure) for the values of the random variables argument,
+           or None if the analysis fails. The result must not depend on
+           the realizations evaluated before (i.e. reset the load case
+           before applying the loads).
+
+        :param x: values of the random variables.
+        '''
+        lmsg.error('evaluate method must be redefined in derived classes.')
+        return None
+
+    def getLimitStateValues(self, x):
+        '''Return the values of the limit-state functions; if the analysis
+           fails all of them are set to -1 (failure).'''
+        retval= self.evaluate(x)
+        if(retval is None):
+            retval= [-1.0]*self.numLimitStateFunctions
+        return list(retval)
+
+# Copy of the model built in the worker process.
+workerModel= None
+
+def initWorker(model):
+    '''Build the copy of the model of the worker process.'''
+    global workerModel
+    workerModel= copy.copy(model)
+    workerModel.build()
+
+def evaluateTask(x):
+    '''Evaluate the limit-state functions of the worker model.'''
+    return workerModel.getLimitStateValues(x)
+
+def getStdNormalInverseCDF(p):
+    '''Return the inverse of the standard normal cumulative distribution
+       function (obtained by bisection).'''
+    lower= -40.0; upper= 40.0
+    for i in range(200):
+        mid= (lower+upper)/2.0
+        if(0.5*math.erfc(-mid/math.sqrt(2.0))<p):
+            lower= mid
+        else:
+            upper= mid
+    return (lower+upper)/2.0
+
+def getCOVs(sumW, sumW2, n):
+    '''Return the coefficient of variation of the failure probability
+       estimates (infinite if there is no failure yet).
+
+    :param sumW: sum of the weights of the failures of each
+                 limit-state function (number of failures for
+                 crude Monte Carlo).
+    :param sumW2: sum of the squared weights of the failures of each
+                  limit-state function.
+    :param n: number of realizations.
+    '''
+    retval= list()
+    for sw, sw2 in zip(sumW,sumW2):
+        if(sw>0.0):
+            pf= sw/n
+            retval.append(math.sqrt(max(sw2/n-pf**2,0.0)/n)/pf)
+        else:
+            retval.append(float('inf'))
+    return retval
+
+class SamplingResults(object):
+    '''Results of a sampling analysis.
+
+    :ivar numSimulations: number of realizations used.
+    :ivar gValues: values of the limit-state functions for
+                   each realization.
+    :ivar weights: importance sampling weight of each realization
+                   (1 for crude Monte Carlo).
+    :ivar failureProbabilities: estimated failure probability of
+                                each limit-state function.
+    :ivar covs: coefficient of variation of each estimate.
+    '''
+    def __init__(self, gValues, weights, failureProbabilities, covs):
+        self.gValues= gValues
+        self.weights= weights
+        self.numSimulations= len(gValues)
+        self.failureProbabilities= failureProbabilities
+        self.covs= covs
+
+    def getMeanValues(self):
+        '''Return the (weighted) mean value of each limit-state function.'''
+        n= self.numSimulations
+        return [sum(w*g[j] for g, w in zip(self.gValues,self.weights))/n for j in range(len(self.failureProbabilities))]
+
+    def getStdDevs(self):
+        '''Return the (weighted) standard deviation of each limit-state
+           function.'''
+        n= self.numSimulations
+        retval= list()
+        for j, mean in enumerate(self.getMeanValues()):
+            retval.append(math.sqrt(sum(w*(g[j]-mean)**2 for g, w in zip(self.gValues,self.weights))/max(n-1,1)))
+        return retval
+
+    def getReliabilityIndexes(self):
+        '''Return the generalized reliability index of each limit-state
+           function (None if no failures have been found).'''
+        retval= list()
+        for pf in self.failureProbabilities:
+            if(pf>0.0):
+                retval.append(-getStdNormalInverseCDF(pf))
+            else:
+                retval.append(None)
+        return retval
+
+class SamplingAnalysis(object):
+    '''Estimation of the failure probability of the limit-state functions
+    of a model by Monte Carlo sampling. The realizations are generated
+    in batches whose limit-state functions are evaluated in parallel.
+
+    :ivar model: object derived from SamplingModel.
+    :ivar numSimulations: maximum number of realizations.
+    :ivar targetCOV: target coefficient of variation of the estimates
+                     (the analysis stops when all of them reach it).
+    :ivar seed: seed of the random numbers.
+    :ivar batchSize: number of realizations generated and sent to the
+                     workers together.
+    :ivar samplingCentre: centre of the importance sampling density in
+                          the standard normal space (i.e. the design
+                          point); crude Monte Carlo if None.
+    :ivar samplingStdDev: standard deviation (or list with the standard
+                          deviation of each variable) of the importance
+                          sampling density.
+    '''
+    def __init__(self, model, numSimulations, targetCOV= 0.05, seed= 1, batchSize= 100, samplingCentre= None, samplingStdDev= 1.0):
+        self.model= model
+        self.numSimulations= numSimulations
+        self.targetCOV= targetCOV
+        self.seed= seed
+        self.batchSize= batchSize
+        self.samplingCentre= samplingCentre
+        self.samplingStdDev= samplingStdDev
+        self.generator= xc.Mt19937RandGenerator(seed)
+
+    def getSamplingStdDevs(self):
+        '''Return the standard deviation of the importance sampling
+           density for each random variable.'''
+        numRV= self.model.getNumberOfRandomVariables()
+        if(isinstance(self.samplingStdDev,(int,float))):
+            return [float(self.samplingStdDev)]*numRV
+        return list(self.samplingStdDev)
+
+    def getStdNormalRealization(self, k):
+        '''Return the standard normal values of the k-th realization
+           and its weight (they depend only on the seed and k).
+
+        :param k: index of the realization (starting with 1).
+        '''
+        numRV= self.model.getNumberOfRandomVariables()
+        self.generator.setStream(self.seed,k)
+        self.generator.generate_nIndependentStdNormalNumbers(numRV,0)
+        z= self.generator.getGeneratedNumbers()
+        z= [z[i] for i in range(numRV)]
+        if(self.samplingCentre is None):
+            return z, 1.0
+        stdDevs= self.getSamplingStdDevs()
+        u= [c+s*zi for c, s, zi in zip(self.samplingCentre,stdDevs,z)]
+        # Standard normal density over sampling density.
+        logW= sum(0.5*(zi**2-ui**2)+math.log(s) for ui, zi, s in zip(u,z,stdDevs))
+        return u, math.exp(logW)
+
+    def getRealization(self, k):
+        '''Return the values of the random variables of the k-th
+           realization (they depend only on the seed and k).
+
+        :param k: index of the realization (starting with 1).
+        '''
+        u, w= self.getStdNormalRealization(k)
+        return self.model.getX(u)
+
+    def run(self, numWorkers= 1):
+        '''Evaluate the realizations until the target coefficient of
+           variation or the maximum number of realizations is reached
+           and return the results.
+
+        :param numWorkers: number of worker processes, each one with its
+                           own copy of the model (defaults to the number
+                           of processors; if 1 the model is built and
+                           evaluated in this process).
+        '''
+        if(self.numSimulations<1):
+            lmsg.error('the number of simulations must be greater than zero.')
+            return None
+        if(numWorkers):
+            numWorkers= min(numWorkers,self.numSimulations)
+        batchSize= max(1,self.batchSize)
+        pool= parallel_runner.WorkerPool(numWorkers,initWorker,(self.model,))
+        numLsf= self.model.numLimitStateFunctions
+        sumW= [0.0]*numLsf
+        sumW2= [0.0]*numLsf
+        gValues= list()
+        weights= list()
+        k= 1
+        finished= False
+        try:
+            while(not finished):
+                last= min(k+batchSize,self.numSimulations+1)
+                samples= [self.getStdNormalRealization(i) for i in range(k,last)]
+                batch= pool.map(evaluateTask,[self.model.getX(u) for u, w in samples])
+                # Statistics updated one realization at a time, so the stop
+                # criterion is checked exactly as in a serial run.
+                for g, (u, w) in zip(batch,samples):
+                    gValues.append(g)
+                    weights.append(w)
+                    for j in range(numLsf):
+                        if(g[j]<0.0):
+                            sumW[j]+= w
+                            sumW2[j]+= w*w
+                    n= len(gValues)
+                    covs= getCOVs(sumW,sumW2,n)
+                    if((n>=self.numSimulations) or ((n>2) and (max(covs)<=self.targetCOV))):
+                        finished= True
+                        break
+                k= last
+        finally:
+            pool.close()
+        n= len(gValues)
+        return SamplingResults(gValues,weights,[sw/n for sw in sumW],getCOVs(sumW,sumW2,n))
@@ -496,6 +496,8 @@
 #define RECORDER_TAGS_NodePropRecorder		115
 #define RECORDER_TAGS_ElementPropRecorder	215
 #define RECORDER_TAGS_EnvelopeData              16
+#define RECORDER_TAGS_NodeCombEnvelopeRecorder	17
+#define RECORDER_TAGS_ElementCombEnvelopeRecorder	18
 
 #define DATAHANDLER_TAGS_DataOutputStreamHandler		1
 #define DATAHANDLER_TAGS_DataOutputFileHandler		2
@@ -66,6 +66,10 @@ class ShellCrdTransf3dBase: public CommandEntity, public MovableObject
       {}
     ShellCrdTransf3dBase(const Vector &,const Vector &,const Vector &);
     virtual ShellCrdTransf3dBase *getCopy(void) const= 0;
+    //! @brief Return true if the transformation doesn't depend on the
+    //! displacement of the nodes.
+    inline virtual bool isLinear(void) const
+      { return false; }
 
     //! @brief Returns the transformation matrix.
     Matrix getTrfMatrix(void) const;
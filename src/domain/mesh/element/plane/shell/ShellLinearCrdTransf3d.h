@@ -48,6 +48,9 @@ class ShellLinearCrdTransf3d: public ShellCrdTransf3dBase
     ShellLinearCrdTransf3d(const Vector &,const Vector &,const Vector &);
     ShellLinearCrdTransf3d(const NodePtrs &t);
     virtual ShellCrdTransf3dBase *getCopy(void) const;
+    //! @brief Return true (displacement independent transformation).
+    inline virtual bool isLinear(void) const
+      { return true; }
 
     virtual int initialize(const NodePtrs &);
     virtual int update(void);
@@ -50,6 +50,7 @@
 #include <cmath>
 
 #include "ShellMITC4Base.h"
+#include "material/section/plate_section/ElasticPlateBase.h"
 #include "utility/matrix/ID.h"
 #include "utility/actor/actor/MovableVector.h"
 #include "preprocessor/multi_block_topology/matrices/ElemPtrArray3d.h"
@@ -252,6 +253,7 @@ void XC::ShellMITC4Base::setDomain(Domain *theDomain)
     //Ktt= dd(2,2);
 
     //basis vectors and local coordinates
+    tangentCache.invalidate();
     computeBasis(); 
     setupInicDisp();
   }
@@ -347,13 +349,61 @@ int XC::ShellMITC4Base::update(void)
     return QuadBase4N<SectionFDPhysicalProperties>::update();
   }
 
+//! @brief Return true if the tangent of all the sections doesn't depend
+//! on their deformation (elastic plate sections).
+bool XC::ShellMITC4Base::hasElasticSections(void) const
+  {
+    bool retval= true;
+    const size_t numSections= physicalProperties.size();
+    for(size_t i= 0;i<numSections;i++)
+      if(!dynamic_cast<const ElasticPlateBase *>(physicalProperties[i]))
+        {
+          retval= false;
+          break;
+        }
+    return retval;
+  }
+
+//! @brief Write in the stiffness cache the values the tangent stiffness
+//! matrix depends on (node coordinates, drilling stiffness and
+//! section tangents).
+void XC::ShellMITC4Base::setStiffnessCacheKey(void) const
+  {
+    tangentCache.clearKey();
+    tangentCache.appendToKey(Ktt);
+    for(int i= 0;i<4;i++)
+      tangentCache.appendToKey(theNodes[i]->getCrds());
+    const size_t numSections= physicalProperties.size();
+    for(size_t i= 0;i<numSections;i++)
+      tangentCache.appendToKey(physicalProperties[i]->getSectionTangent());
+  }
+
 //! @brief return stiffness matrix
 const XC::Matrix &XC::ShellMITC4Base::getTangentStiff(void) const
   {
     theCoordTransf->update();
 
-    const int tang_flag= 1; //get the tangent
-    formResidAndTangent(tang_flag); //do tangent and residual here
+    //The stiffness doesn't depend on displacements if the transformation
+    //is linear and the sections are elastic (their tangent doesn't depend
+    //on their state, so the key can be computed without forming the
+    //residual).
+    if(theCoordTransf->isLinear() && hasElasticSections())
+      {
+        setStiffnessCacheKey();
+        if(tangentCache.isValid())
+          stiff= tangentCache.getStiff();
+        else
+          {
+            computeBasis(); //The nodes may have been moved since the last call.
+            formResidAndTangent(1); //do tangent and residual here
+            tangentCache.store(stiff);
+          }
+      }
+    else
+      {
+        const int tang_flag= 1; //get the tangent
+        formResidAndTangent(tang_flag); //do tangent and residual here
+      }
     if(isDead())
       stiff*=dead_srf;
     return stiff;
@@ -1228,7 +1278,7 @@ void XC::ShellMITC4Base::formResidAndTangent(int tang_flag) const
   }
 
 //! @brief compute local coordinates and basis
-void XC::ShellMITC4Base::computeBasis(void)
+void XC::ShellMITC4Base::computeBasis(void) const
   {
     theCoordTransf->initialize(theNodes);
     theCoordTransf->setup_nodal_local_coordinates(xl);
@@ -36,6 +36,7 @@
 #include <utility/matrix/Vector.h>
 #include <utility/matrix/Matrix.h>
 #include "domain/mesh/element/utils/fvectors/FVectorShell.h"
+#include "domain/mesh/element/utils/StiffnessCache.h"
 
 class Polygon3d;
 
@@ -57,6 +58,7 @@ class ShellMITC4Base : public QuadBase4N<SectionFDPhysicalProperties>
     FVectorShell p0; //!< Reactions in the basic system due to element loads
 
     mutable Matrix Ki;
+    mutable StiffnessCache tangentCache; //!< Stiffness matrix computed in previous calls.
 
     std::vector<Vector> inicDisp; //!< Initial displacements.
 
@@ -77,6 +79,8 @@ class ShellMITC4Base : public QuadBase4N<SectionFDPhysicalProperties>
 
     void formInertiaTerms(int tangFlag) const;
     void formResidAndTangent(int tang_flag) const;
+    bool hasElasticSections(void) const;
+    void setStiffnessCacheKey(void) const;
     const Matrix calculateG(void) const;
     double *computeBdrill(int node, const double shp[3][4]) const;
     const Matrix& assembleB(const Matrix &Bmembrane, const Matrix &Bbend, const Matrix &Bshear) const;
@@ -142,7 +146,7 @@ class ShellMITC4Base : public QuadBase4N<SectionFDPhysicalProperties>
     virtual ShellCrdTransf3dBase *getCoordTransf(void);
     virtual const ShellCrdTransf3dBase *getCoordTransf(void) const;
 
-    void computeBasis(void);
+    void computeBasis(void) const;
     ParticlePos3d getLocalCoordinatesOfNode(const int &) const;
     ParticlePos3d getNaturalCoordinates(const Pos3d &) const;
 
@@ -82,6 +82,7 @@ XC::Matrix XC::ElasticBeam2d::kb(3,3);
 
 void XC::ElasticBeam2d::set_transf(const CrdTransf *trf)
   {
+    tangentCache.invalidate();
     if(theCoordTransf)
       {
         delete theCoordTransf;
@@ -230,6 +231,7 @@ void XC::ElasticBeam2d::setDomain(Domain *theDomain)
       }
     if(theCoordTransf)
       {
+        tangentCache.invalidate();
         if(theCoordTransf->initialize(theNodes[0], theNodes[1]) != 0)
           {
             std::cerr << "XC::ElasticBeam2d::setDomain -- Error initializing coordinate transformation\n";
@@ -332,6 +334,32 @@ const XC::Vector &XC::ElasticBeam2d::getVDirWeakAxisGlobalCoord(bool initialGeom
   }
 
 
+//! @brief Write in the stiffness cache the values the tangent stiffness
+//! matrix depends on (section mechanical properties and node coordinates,
+//! that determine the length and the local axes of the element).
+void XC::ElasticBeam2d::setStiffnessCacheKey(void) const
+  {
+    tangentCache.clearKey();
+    tangentCache.appendToKey(ctes_scc.E());
+    tangentCache.appendToKey(ctes_scc.A());
+    tangentCache.appendToKey(ctes_scc.I());
+    tangentCache.appendToKey(theNodes[0]->getCrds());
+    tangentCache.appendToKey(theNodes[1]->getCrds());
+  }
+
+//! @brief Return the stiffness matrix in the basic system.
+const XC::Matrix &XC::ElasticBeam2d::getBasicStiff(void) const
+  {
+    const double EA= ctes_scc.EA(); // EA
+    const double EI2= 2.0*ctes_scc.EI(); // 2EI
+    const double EI4= 2.0*EI2; // 4EI
+    const double L = theCoordTransf->getInitialLength();
+    kb(0,0)= EA/L;
+    kb(1,1)= kb(2,2)= EI4/L;
+    kb(2,1)= kb(1,2)= EI2/L;
+    return kb;
+  }
+
 const XC::Matrix &XC::ElasticBeam2d::getTangentStiff(void) const
   {
     const Vector &v= getSectionDeformation();
@@ -349,14 +377,21 @@ const XC::Matrix &XC::ElasticBeam2d::getTangentStiff(void) const
     q(1)+= q0[1];
     q(2)+= q0[2];
 
-    const double L = theCoordTransf->getInitialLength();
-    kb(0,0)= EA/L;
-    kb(1,1)= kb(2,2)= EI4/L;
-    kb(2,1)= kb(1,2)= EI2/L;
-
-    
     static Matrix retval;
-    retval= theCoordTransf->getGlobalStiffMatrix(kb,q);
+    if(theCoordTransf->isLinear()) //Stiffness doesn't depend on displacements.
+      {
+        setStiffnessCacheKey();
+        if(!tangentCache.isValid())
+          {
+            //The nodes may have been moved since the last call.
+            theCoordTransf->initialize(theNodes[0],theNodes[1]);
+            setStiffnessCacheKey();
+            tangentCache.store(theCoordTransf->getGlobalStiffMatrix(getBasicStiff(),q));
+          }
+        retval= tangentCache.getStiff();
+      }
+    else
+      retval= theCoordTransf->getGlobalStiffMatrix(getBasicStiff(),q);
     if(isDead())
       retval*=dead_srf;
     return retval;
@@ -65,6 +65,7 @@
 #include <utility/matrix/Vector.h>
 #include "domain/mesh/element/utils/fvectors/FVectorBeamColumn2d.h"
 #include "domain/mesh/element/utils/coordTransformation/CrdTransf2d.h"
+#include "domain/mesh/element/utils/StiffnessCache.h"
 
 namespace XC {
 class Channel;
@@ -93,8 +94,11 @@ class ElasticBeam2d: public ProtoBeam2d
     FVectorBeamColumn2d p0;  // Reactions in basic system
     
     CrdTransf2d *theCoordTransf; //!< Coordinate transformation.
+    mutable StiffnessCache tangentCache; //!< Stiffness matrix computed in previous calls.
 
     void set_transf(const CrdTransf *trf);
+    void setStiffnessCacheKey(void) const;
+    const Matrix &getBasicStiff(void) const;
   protected:
     DbTagData &getDbTagData(void) const;
     int sendData(CommParameters &cp);
@@ -80,6 +80,7 @@ XC::Matrix XC::ElasticBeam3d::kb(6,6);
 
 void XC::ElasticBeam3d::set_transf(const CrdTransf *trf)
   {
+    tangentCache.invalidate();
     if(theCoordTransf)
       {
         delete theCoordTransf;
@@ -241,6 +242,7 @@ void XC::ElasticBeam3d::setDomain(Domain *theDomain)
         exit(-1);
       }
 
+    tangentCache.invalidate();
     if(theCoordTransf->initialize(theNodes[0], theNodes[1]) != 0)
       {
         std::cerr << "XC::ElasticBeam3d::setDomain -- Error initializing coordinate transformation\n";
@@ -303,6 +305,46 @@ int XC::ElasticBeam3d::revertToStart()
 int XC::ElasticBeam3d::update(void)
   { return theCoordTransf->update(); }
 
+//! @brief Write in the stiffness cache the values the tangent stiffness
+//! matrix depends on (section mechanical properties, node coordinates and
+//! local axes).
+void XC::ElasticBeam3d::setStiffnessCacheKey(void) const
+  {
+    tangentCache.clearKey();
+    tangentCache.appendToKey(ctes_scc.E());
+    tangentCache.appendToKey(ctes_scc.A());
+    tangentCache.appendToKey(ctes_scc.Iz());
+    tangentCache.appendToKey(ctes_scc.Iy());
+    tangentCache.appendToKey(ctes_scc.Iyz());
+    tangentCache.appendToKey(ctes_scc.G());
+    tangentCache.appendToKey(ctes_scc.J());
+    tangentCache.appendToKey(theNodes[0]->getCrds());
+    tangentCache.appendToKey(theNodes[1]->getCrds());
+    //The node coordinates determine the local x axis, the local
+    //y axis depends also on the vector in the local xz plane.
+    tangentCache.appendToKey(theCoordTransf->getJ());
+  }
+
+//! @brief Return the stiffness matrix in the basic system.
+const XC::Matrix &XC::ElasticBeam3d::getBasicStiff(void) const
+  {
+    const double E= ctes_scc.E();
+    const double EA= ctes_scc.A()*E; // EA
+    const double EIz2= 2.0*ctes_scc.Iz()*E; // 2EIz
+    const double EIz4= 2.0*EIz2; // 4EIz
+    const double EIy2= 2.0*ctes_scc.Iy()*E; // 2EIy
+    const double EIy4= 2.0*EIy2; // 4EIy
+    const double GJ= ctes_scc.GJ(); // GJ
+    const double L = theCoordTransf->getInitialLength();
+    kb(0,0) = EA/L;
+    kb(1,1) = kb(2,2)= EIz4/L;
+    kb(2,1) = kb(1,2)= EIz2/L;
+    kb(3,3) = kb(4,4)= EIy4/L;
+    kb(4,3) = kb(3,4)= EIy2/L;
+    kb(5,5) = GJ/L;
+    return kb;
+  }
+
 //! @brief Return the tangent stiffness matrix expresada en coordenadas globales.
 const XC::Matrix &XC::ElasticBeam3d::getTangentStiff(void) const
   {
@@ -340,16 +382,21 @@ const XC::Matrix &XC::ElasticBeam3d::getTangentStiff(void) const
     q.My1()+= q0[3];
     q.My2()+= q0[4];
 
-    const double L = theCoordTransf->getInitialLength();
-    kb(0,0) = EA/L;
-    kb(1,1) = kb(2,2)= EIz4/L;
-    kb(2,1) = kb(1,2)= EIz2/L;
-    kb(3,3) = kb(4,4)= EIy4/L;
-    kb(4,3) = kb(3,4)= EIy2/L;
-    kb(5,5) = GJ/L;
-
     static Matrix retval;
-    retval= theCoordTransf->getGlobalStiffMatrix(kb,q);
+    if(theCoordTransf->isLinear()) //Stiffness doesn't depend on displacements.
+      {
+        setStiffnessCacheKey();
+        if(!tangentCache.isValid())
+          {
+            //The nodes may have been moved since the last call.
+            theCoordTransf->initialize(theNodes[0],theNodes[1]);
+            setStiffnessCacheKey();
+            tangentCache.store(theCoordTransf->getGlobalStiffMatrix(getBasicStiff(),q));
+          }
+        retval= tangentCache.getStiff();
+      }
+    else
+      retval= theCoordTransf->getGlobalStiffMatrix(getBasicStiff(),q);
     if(isDead())
       retval*=dead_srf;
 
@@ -65,6 +65,7 @@
 #include "domain/mesh/element/truss_beam_column/EsfBeamColumn3d.h"
 #include "domain/mesh/element/utils/fvectors/FVectorBeamColumn3d.h"
 #include "domain/mesh/element/utils/coordTransformation/CrdTransf3d.h"
+#include "domain/mesh/element/utils/StiffnessCache.h"
 
 namespace XC {
 class Channel;
@@ -86,6 +87,7 @@ class ElasticBeam3d : public ProtoBeam3d
     FVectorBeamColumn3d p0;  //!< Reactions in basic system (no torsion)
  
     CrdTransf3d *theCoordTransf; //!< Coordinate transformation.
+    mutable StiffnessCache tangentCache; //!< Stiffness matrix computed in previous calls.
 
     static Matrix K;
     static Vector P;
@@ -93,6 +95,8 @@ class ElasticBeam3d : public ProtoBeam3d
     static Matrix kb;
 
     void set_transf(const CrdTransf *trf);
+    void setStiffnessCacheKey(void) const;
+    const Matrix &getBasicStiff(void) const;
   protected:
     DbTagData &getDbTagData(void) const;
     int sendData(CommParameters &cp);
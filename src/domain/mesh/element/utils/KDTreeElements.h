@@ -30,6 +30,7 @@
 
 #include "xc_utils/src/geom/pos_vec/KDTreePos.h"
 #include "xc_utils/src/kdtree++/kdtree.hpp"
+#include <deque>
 
 class Pos3d;
 
@@ -69,6 +70,8 @@ class KDTreeElements: protected kd_tree::KDTree<3, ElemPos, std::pointer_to_bina
 
     const Element *getNearest(const Pos3d &pos) const;
     const Element *getNearest(const Pos3d &pos, const double &r) const;
+    std::deque<const Element *> getWithinBox(const Pos3d &, const Pos3d &) const;
+    std::deque<const Element *> getWithinRadius(const Pos3d &, const double &) const;
   };
 
 } // end of XC namespace 
@@ -0,0 +1,68 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//StiffnessCache.cc
+
+#include "StiffnessCache.h"
+#include "utility/matrix/Vector.h"
+
+//! @brief Constructor.
+XC::StiffnessCache::StiffnessCache(void)
+  : key(), newKey(), K(), valid(false) {}
+
+//! @brief Append the components of the vector to the key.
+void XC::StiffnessCache::appendToKey(const Vector &v)
+  {
+    const int sz= v.Size();
+    for(int i= 0;i<sz;i++)
+      newKey.push_back(v(i));
+  }
+
+//! @brief Append the components of the matrix to the key.
+void XC::StiffnessCache::appendToKey(const Matrix &m)
+  {
+    const int nRows= m.noRows();
+    const int nCols= m.noCols();
+    for(int i= 0;i<nRows;i++)
+      for(int j= 0;j<nCols;j++)
+        newKey.push_back(m(i,j));
+  }
+
+//! @brief Return true if the stored matrix has been computed from
+//! the same values that those of the current key.
+bool XC::StiffnessCache::isValid(void) const
+  { return (valid && (newKey==key)); }
+
+//! @brief Store the stiffness matrix computed from the values
+//! of the current key.
+void XC::StiffnessCache::store(const Matrix &m)
+  {
+    key= newKey;
+    K= m;
+    valid= true;
+  }
+
+//! @brief Mark the stored matrix as unusable.
+void XC::StiffnessCache::invalidate(void)
+  {
+    valid= false;
+    key.clear();
+  }
@@ -0,0 +1,73 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//StiffnessCache.h
+
+#ifndef StiffnessCache_h
+#define StiffnessCache_h
+
+#include <vector>
+#include "utility/matrix/Matrix.h"
+
+namespace XC {
+
+class Vector;
+
+//! @ingroup FEMisc
+//
+//! @brief Stores the stiffness matrix of an element together with
+//! the values it has been computed from (nodal coordinates, material
+//! parameters, local axes,...).
+//!
+//! While those values don't change the stored matrix can be returned
+//! instead of computing it again. Any change in any of them (exact
+//! comparison) invalidates the stored matrix. The values of the current
+//! state are written in a buffer that is reused from one call to the
+//! next, so checking the cache doesn't allocate memory.
+class StiffnessCache
+  {
+    std::vector<double> key; //!< values the stored matrix depends on.
+    std::vector<double> newKey; //!< values of the current state.
+    Matrix K; //!< stored stiffness matrix.
+    bool valid; //!< true if the stored matrix can be used.
+  public:
+    StiffnessCache(void);
+
+    //! @brief Start a new key (values of the current state).
+    inline void clearKey(void)
+      { newKey.clear(); }
+    //! @brief Append the value to the key.
+    inline void appendToKey(const double &d)
+      { newKey.push_back(d); }
+    void appendToKey(const Vector &);
+    void appendToKey(const Matrix &);
+
+    bool isValid(void) const;
+    void store(const Matrix &);
+    void invalidate(void);
+    //! @brief Return the stored stiffness matrix.
+    inline const Matrix &getStiff(void) const
+      { return K; }
+  };
+
+} // end of XC namespace
+
+#endif
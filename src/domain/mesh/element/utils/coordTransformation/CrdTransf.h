@@ -111,6 +111,11 @@ class CrdTransf: public TaggedObject, public MovableObject
 
     virtual int initialize(Node *node1Pointer, Node *node2Pointer) = 0;
     virtual int update(void) = 0;
+    //! @brief Return true if the transformation doesn't depend on the
+    //! displacement of the nodes (small displacements without
+    //! second order effects).
+    inline virtual bool isLinear(void) const
+      { return false; }
     virtual double getInitialLength(void) const= 0;
     virtual double getDeformedLength(void) const= 0;
     double getLength(bool initialGeometry= true) const;
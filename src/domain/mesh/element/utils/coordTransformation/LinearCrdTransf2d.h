@@ -79,6 +79,9 @@ class LinearCrdTransf2d: public SmallDispCrdTransf2d
     LinearCrdTransf2d(void);
     
     int update(void);
+    //! @brief Return true (displacement independent transformation).
+    inline bool isLinear(void) const
+      { return true; }
     
     int commitState(void);
     int revertToLastCommit(void);
@@ -81,6 +81,9 @@ class LinearCrdTransf3d: public SmallDispCrdTransf3d
     LinearCrdTransf3d(void);
     
     int update(void);
+    //! @brief Return true (displacement independent transformation).
+    inline bool isLinear(void) const
+      { return true; }
     
     int commitState(void);
     int revertToLastCommit(void);        
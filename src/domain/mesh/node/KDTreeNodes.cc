@@ -29,6 +29,8 @@
 #include "KDTreeNodes.h"
 #include "Node.h"
 #include "xc_utils/src/geom/pos_vec/Pos3d.h"
+#include <vector>
+#include <iterator>
 
 //! @brief Constructor.
 XC::NodePos::NodePos(const Node &n)
@@ -83,3 +85,39 @@ const XC::Node *XC::KDTreeNodes::getNearest(const Pos3d &pos, const double &r) c
       retval= found.first->getNodePtr();
     return retval;
   }
+
+//! @brief Returns the nodes inside the box defined
+//! by the two positions being passed as parameter (lower left and
+//! upper right corners).
+std::deque<const XC::Node *> XC::KDTreeNodes::getWithinBox(const Pos3d &pMin, const Pos3d &pMax) const
+  {
+    std::deque<const Node *> retval;
+    tree_type::_Region_ region(std::ptr_fun(NodePos::tac));
+    region._M_low_bounds[0]= pMin.x(); region._M_high_bounds[0]= pMax.x();
+    region._M_low_bounds[1]= pMin.y(); region._M_high_bounds[1]= pMax.y();
+    region._M_low_bounds[2]= pMin.z(); region._M_high_bounds[2]= pMax.z();
+    std::vector<NodePos> found;
+    find_within_range(region,std::back_inserter(found));
+    for(std::vector<NodePos>::const_iterator i= found.begin();i!=found.end();i++)
+      retval.push_back(i->getNodePtr());
+    return retval;
+  }
+
+//! @brief Returns the nodes whose distance to
+//! the position being passed as parameter is less or equal than r.
+std::deque<const XC::Node *> XC::KDTreeNodes::getWithinRadius(const Pos3d &center, const double &r) const
+  {
+    std::deque<const Node *> retval;
+    NodePos target(center);
+    std::vector<NodePos> found;
+    find_within_range(target,r,std::back_inserter(found));
+    const double r2= r*r;
+    for(std::vector<NodePos>::const_iterator i= found.begin();i!=found.end();i++)
+      {
+        const NodePos &p= *i;
+        const double d2= (p[0]-target[0])*(p[0]-target[0])+(p[1]-target[1])*(p[1]-target[1])+(p[2]-target[2])*(p[2]-target[2]);
+        if(d2<=r2)
+          retval.push_back(p.getNodePtr());
+      }
+    return retval;
+  }
@@ -30,6 +30,7 @@
 
 #include "xc_utils/src/geom/pos_vec/KDTreePos.h"
 #include "xc_utils/src/kdtree++/kdtree.hpp"
+#include <deque>
 
 class Pos3d;
 
@@ -68,6 +69,8 @@ class KDTreeNodes: protected kd_tree::KDTree<3, NodePos, std::pointer_to_binary_
 
     const Node *getNearest(const Pos3d &pos) const;
     const Node *getNearest(const Pos3d &pos, const double &r) const;
+    std::deque<const Node *> getWithinBox(const Pos3d &, const Pos3d &) const;
+    std::deque<const Node *> getWithinRadius(const Pos3d &, const double &) const;
   };
 
 } // end of XC namespace 
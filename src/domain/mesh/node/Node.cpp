@@ -772,6 +772,9 @@ void XC::Node::setPos(const Pos3d &p)
         Crd[1]= p.y();
         Crd[2]= p.z();
       }
+    Domain *dom= getDomain();
+    if(dom)
+      dom->domainChange(); // the geometry of the mesh has changed.
   }
 
 //! @brief Applies to the node position the transformation being passed as parameter.
@@ -2131,4 +2134,7 @@ void XC::Node::Mueve(const Vector3d &desplaz)
     Crd(0)+= desplaz.x();
     Crd(1)+= desplaz.y();
     Crd(2)+= desplaz.z();
+    Domain *dom= getDomain();
+    if(dom)
+      dom->domainChange(); // the geometry of the mesh has changed.
   }
@@ -669,6 +669,182 @@ void XC::FiberSectionBase::getInteractionDiagramPointsForTheta(NMyMzPointCloud &
       }
   }
 
+//! @brief Returns the section normal stresses resultant for the
+//! deformation plane that corresponds to the strain e in the domain
+//! being passed as parameter (0: domains 1 and 2, 1: domains 3 and 4,
+//! 2: domain 4a, 3: domain 5).
+Pos3d XC::FiberSectionBase::getNMyMz(Pivots &pivots,const Vector3d &K,const int &domain,const double &e)
+  {
+    Pos3d P1;
+    Pos3d P3;
+    switch(domain)
+      {
+      case 0:
+        P1= pivots.getAPivot();
+        P3= pivots.getBPoint(e);
+        break;
+      case 1:
+        P1= pivots.getBPivot();
+        P3= pivots.getAPoint(e);
+        break;
+      case 2:
+        P1= pivots.getBPivot();
+        P3= pivots.getDPoint(e);
+        break;
+      default:
+        P1= pivots.getCPivot();
+        P3= pivots.getDPoint(e);
+        break;
+      }
+    const Pos3d P2= P1+100.0*K;
+    return getNMyMz(DeformationPlane(P1,P2,P3));
+  }
+
+//! @brief Appends to the list the points of the domain between
+//! the strains e0 and e1 (whose points p0 and p1 are already computed).
+//! The interval is bisected while the point at its middle deviates
+//! from the chord more than tol and the interval is wider than minIncEps.
+void XC::FiberSectionBase::refineDomainPoints(NMyMzPointCloud &lista_esfuerzos,Pivots &pivots,const Vector3d &K,const int &domain,const double &e0,const Pos3d &p0,const double &e1,const Pos3d &p1,const double &minIncEps,const double &tol)
+  {
+    if(fabs(e1-e0)>minIncEps)
+      {
+        const double em= (e0+e1)/2.0;
+        const Pos3d pm= getNMyMz(pivots,K,domain,em);
+        if(dist(pm,p0+0.5*(p1-p0))>tol)
+          {
+            refineDomainPoints(lista_esfuerzos,pivots,K,domain,e0,p0,em,pm,minIncEps,tol);
+            lista_esfuerzos.append(pm);
+            refineDomainPoints(lista_esfuerzos,pivots,K,domain,em,pm,e1,p1,minIncEps,tol);
+          }
+      }
+  }
+
+//! @brief Appends to the list the points of the domain for strains
+//! from eStart to eEnd, sampling the strain more finely only
+//! where the curvature of the diagram demands it.
+void XC::FiberSectionBase::getAdaptiveDomainPoints(NMyMzPointCloud &lista_esfuerzos,Pivots &pivots,const Vector3d &K,const int &domain,const double &eStart,const double &eEnd,const double &minIncEps,const double &tol)
+  {
+    const size_t nDiv= 4; //Initial subdivision of the domain.
+    const double step= (eEnd-eStart)/nDiv;
+    double e0= eStart;
+    Pos3d p0= getNMyMz(pivots,K,domain,e0);
+    lista_esfuerzos.append(p0);
+    for(size_t i= 1;i<=nDiv;i++)
+      {
+        const double e1= eStart+i*step;
+        const Pos3d p1= getNMyMz(pivots,K,domain,e1);
+        refineDomainPoints(lista_esfuerzos,pivots,K,domain,e0,p0,e1,p1,minIncEps,tol);
+        lista_esfuerzos.append(p1);
+        e0= e1;
+        p0= p1;
+      }
+  }
+
+//! @brief Returns a coarse sample of the interaction diagram points
+//! for the angle \f$\theta\f$ (always the same strains on the same
+//! domains so the points obtained for different angles correspond).
+std::vector<Pos3d> XC::FiberSectionBase::getInteractionDiagramCoarsePointsForTheta(const InteractionDiagramData &diag_data,const FiberPtrDeque &fsC,const FiberPtrDeque &fsS,const double &theta)
+  {
+    std::vector<Pos3d> retval;
+    ComputePivots cp(diag_data.getPivotsUltimateStrains(),fibers,fsC,fsS,theta);
+    Pivots pivots(cp);
+    if(pivots.Ok())
+      {
+        const Vector3d K= cp.GetK();
+        const double eps_agot_A= diag_data.getPivotsUltimateStrains().getUltimateStrainAPivot();
+        const double eps_agot_B= diag_data.getPivotsUltimateStrains().getUltimateStrainBPivot();
+        const double eps_agot_C= diag_data.getPivotsUltimateStrains().getUltimateStrainCPivot();
+        const size_t nDiv= 4;
+        for(size_t i= 0;i<=nDiv;i++)
+          {
+            const double t= double(i)/nDiv;
+            retval.push_back(getNMyMz(pivots,K,0,eps_agot_A+t*(eps_agot_B-eps_agot_A)));
+            retval.push_back(getNMyMz(pivots,K,1,(1.0-t)*eps_agot_A));
+            retval.push_back(getNMyMz(pivots,K,3,t*eps_agot_C));
+          }
+      }
+    return retval;
+  }
+
+//! @brief Returns the points that define the interaction diagram
+//! of the section for an angle \f$\theta\f$ with respect to the z axis
+//! sampling the pivot strains adaptively (the strain step is refined
+//! only where the diagram deviates from its chords more than tol,
+//! and never below the strain increment of diag_data).
+void XC::FiberSectionBase::getAdaptiveInteractionDiagramPointsForTheta(NMyMzPointCloud &lista_esfuerzos,const InteractionDiagramData &diag_data,const FiberPtrDeque &fsC,const FiberPtrDeque &fsS,const double &theta,const double &tol)
+  {
+    ComputePivots cp(diag_data.getPivotsUltimateStrains(),fibers,fsC,fsS,theta);
+    Pivots pivots(cp);
+    if(pivots.Ok())
+      {
+        const Vector3d K= cp.GetK();
+        const double inc_eps= diag_data.getIncEps();
+        const double eps_agot_A= diag_data.getPivotsUltimateStrains().getUltimateStrainAPivot();
+        const double eps_agot_B= diag_data.getPivotsUltimateStrains().getUltimateStrainBPivot();
+        const double eps_agot_C= diag_data.getPivotsUltimateStrains().getUltimateStrainCPivot();
+        //Domains 1 and 2
+        getAdaptiveDomainPoints(lista_esfuerzos,pivots,K,0,eps_agot_A,eps_agot_B,inc_eps,tol);
+        //Domains 3 and 4
+        getAdaptiveDomainPoints(lista_esfuerzos,pivots,K,1,eps_agot_A,0.0,inc_eps,tol);
+        //Domain 4a
+        const Pos3d P1= pivots.getBPivot();
+        const DeformationPlane def_lim_4a= DeformationPlane(P1,P1+100.0*K,pivots.getAPoint(0.0));
+        const double eps_D4a= def_lim_4a.Strain(pivots.getPointDPosition());
+        if(eps_D4a>(eps_agot_A/200.0)) //Si el recorrido es positivo y "apreciable"
+          getAdaptiveDomainPoints(lista_esfuerzos,pivots,K,2,eps_D4a,0.0,inc_eps,tol);
+        //Domain 5
+        getAdaptiveDomainPoints(lista_esfuerzos,pivots,K,3,0.0,eps_agot_C,inc_eps,tol);
+      }
+  }
+
+//! @brief Appends to the list the points of the interaction diagram
+//! for angles between t0 and t1 (whose coarse samples s0 and s1 are
+//! already computed). The angle interval is bisected while the coarse
+//! sample at its middle deviates from the mean of s0 and s1 more than
+//! tol and the interval is wider than the angle increment of diag_data.
+void XC::FiberSectionBase::refineInteractionDiagramTheta(NMyMzPointCloud &lista_esfuerzos,const InteractionDiagramData &diag_data,const FiberPtrDeque &fsC,const FiberPtrDeque &fsS,const double &t0,const std::vector<Pos3d> &s0,const double &t1,const std::vector<Pos3d> &s1,const double &tol)
+  {
+    if((t1-t0)>diag_data.getIncTheta())
+      {
+        const double tm= (t0+t1)/2.0;
+        const std::vector<Pos3d> sm= getInteractionDiagramCoarsePointsForTheta(diag_data,fsC,fsS,tm);
+        const size_t sz= std::min(sm.size(),std::min(s0.size(),s1.size()));
+        double dev= 0.0;
+        for(size_t i= 0;i<sz;i++)
+          dev= std::max(dev,dist(sm[i],s0[i]+0.5*(s1[i]-s0[i])));
+        if(!sm.empty() && ((sz<sm.size()) || (dev>tol)))
+          {
+            refineInteractionDiagramTheta(lista_esfuerzos,diag_data,fsC,fsS,t0,s0,tm,sm,tol);
+            getAdaptiveInteractionDiagramPointsForTheta(lista_esfuerzos,diag_data,fsC,fsS,tm,tol);
+            refineInteractionDiagramTheta(lista_esfuerzos,diag_data,fsC,fsS,tm,sm,t1,s1,tol);
+          }
+      }
+  }
+
+//! @brief Returns the diagonal of the box that contains the points.
+static double get_bounding_box_size(const std::vector<Pos3d> &points)
+  {
+    double retval= 0.0;
+    if(!points.empty())
+      {
+        std::vector<Pos3d>::const_iterator i= points.begin();
+        double xmin= i->x(), xmax= xmin;
+        double ymin= i->y(), ymax= ymin;
+        double zmin= i->z(), zmax= zmin;
+        for(;i!=points.end();i++)
+          {
+            xmin= std::min(xmin,i->x()); xmax= std::max(xmax,i->x());
+            ymin= std::min(ymin,i->y()); ymax= std::max(ymax,i->y());
+            zmin= std::min(zmin,i->z()); zmax= std::max(zmax,i->z());
+          }
+        const double dx= xmax-xmin;
+        const double dy= ymax-ymin;
+        const double dz= zmax-zmin;
+        retval= sqrt(dx*dx+dy*dy+dz*dz);
+      }
+    return retval;
+  }
+
 //! @brief Returns the points that define the interaction diagram
 //! on the plane defined by the \f$\theta\f$ angle being passed as parameter.
 const XC::NMPointCloud &XC::FiberSectionBase::getInteractionDiagramPointsForPlane(const InteractionDiagramData &diag_data, const double &theta)
@@ -693,8 +869,20 @@ const XC::NMPointCloud &XC::FiberSectionBase::getInteractionDiagramPointsForPlan
         static NMyMzPointCloud tmp;
         tmp.clear();
         tmp.setUmbral(diag_data.getUmbral());
-        getInteractionDiagramPointsForTheta(tmp,diag_data,fsC,fsS,theta);
-        getInteractionDiagramPointsForTheta(tmp,diag_data,fsC,fsS,theta+M_PI); //theta+M_PI
+        if(diag_data.isAdaptive())
+          {
+            std::vector<Pos3d> coarse= getInteractionDiagramCoarsePointsForTheta(diag_data,fsC,fsS,theta);
+            const std::vector<Pos3d> coarsePi= getInteractionDiagramCoarsePointsForTheta(diag_data,fsC,fsS,theta+M_PI);
+            coarse.insert(coarse.end(),coarsePi.begin(),coarsePi.end());
+            const double tol= diag_data.getAdaptiveTolerance()*get_bounding_box_size(coarse);
+            getAdaptiveInteractionDiagramPointsForTheta(tmp,diag_data,fsC,fsS,theta,tol);
+            getAdaptiveInteractionDiagramPointsForTheta(tmp,diag_data,fsC,fsS,theta+M_PI,tol); //theta+M_PI
+          }
+        else
+          {
+            getInteractionDiagramPointsForTheta(tmp,diag_data,fsC,fsS,theta);
+            getInteractionDiagramPointsForTheta(tmp,diag_data,fsC,fsS,theta+M_PI); //theta+M_PI
+          }
         retval= tmp.getNM(theta);
         revertToStart();
       }
@@ -705,6 +893,14 @@ const XC::NMPointCloud &XC::FiberSectionBase::getInteractionDiagramPointsForPlan
   }
 
 //! @brief Returns the points that define the interaction diagram of the section.
+//!
+//! The angles are computed one after another on this section. They are
+//! not distributed among threads (each one with its own copy of the
+//! section) because the computation of the strains and stresses of the
+//! fibers (DeformationPlane, fiber materials,...) uses static scratch
+//! objects and is not reentrant. To reduce the computing time use the
+//! adaptive sampling (adaptiveTolerance) that concentrates the points
+//! where the diagram is curved.
 const XC::NMyMzPointCloud &XC::FiberSectionBase::getInteractionDiagramPoints(const InteractionDiagramData &diag_data)
   {
     static NMyMzPointCloud lista_esfuerzos;
@@ -724,8 +920,31 @@ const XC::NMyMzPointCloud &XC::FiberSectionBase::getInteractionDiagramPoints(con
                 << ", not found." << std::endl;
     if(!fsC.empty() && !fsS.empty())
       {
-        for(double theta= 0.0;theta<2*M_PI;theta+=diag_data.getIncTheta())
-          getInteractionDiagramPointsForTheta(lista_esfuerzos,diag_data,fsC,fsS,theta);
+        if(diag_data.isAdaptive())
+          {
+            //Coarse angle sampling, refined afterwards where needed.
+            const size_t nTheta= 8;
+            const double incTheta= 2*M_PI/nTheta;
+            std::vector<std::vector<Pos3d> > coarse(nTheta);
+            std::vector<Pos3d> all;
+            for(size_t i= 0;i<nTheta;i++)
+              {
+                coarse[i]= getInteractionDiagramCoarsePointsForTheta(diag_data,fsC,fsS,i*incTheta);
+                all.insert(all.end(),coarse[i].begin(),coarse[i].end());
+              }
+            const double tol= diag_data.getAdaptiveTolerance()*get_bounding_box_size(all);
+            for(size_t i= 0;i<nTheta;i++)
+              {
+                const double theta= i*incTheta;
+                getAdaptiveInteractionDiagramPointsForTheta(lista_esfuerzos,diag_data,fsC,fsS,theta,tol);
+                refineInteractionDiagramTheta(lista_esfuerzos,diag_data,fsC,fsS,theta,coarse[i],theta+incTheta,coarse[(i+1)%nTheta],tol);
+              }
+          }
+        else
+          {
+            for(double theta= 0.0;theta<2*M_PI;theta+=diag_data.getIncTheta())
+              getInteractionDiagramPointsForTheta(lista_esfuerzos,diag_data,fsC,fsS,theta);
+          }
         revertToStart();
       }
     else
@@ -930,3 +1149,123 @@ double XC::FiberSectionBase::getSPosHomogeneizada(const double &E0) const
 std::string XC::FiberSectionBase::getStrClaseEsfuerzo(const double &tol) const
   { return fibers.getStrClaseEsfuerzo(); }
 
+
+//! @brief Search the strain at the section origin that makes the
+//! axial force equal to the value being passed as parameter, keeping
+//! unchanged the curvature components of the deformation vector.
+//!
+//! Newton iteration on the first component of the deformation vector
+//! using the (0,0) term of the section tangent stiffness.
+//! @param e: trial generalized strains (on exit contains the solution).
+//! @param N: target axial force.
+//! @param tol: relative tolerance on the axial force.
+//! @param maxIter: maximum number of iterations.
+bool XC::FiberSectionBase::findAxialEquilibrium(Vector &e,const double &N,const double &tol,const int &maxIter)
+  {
+    bool retval= false;
+    const double forceTol= tol*std::max(fabs(N),1.0);
+    for(int iter= 0;iter<maxIter;iter++)
+      {
+        setTrialSectionDeformation(e);
+        const double r= getStressResultant()(0)-N;
+        if(fabs(r)<=forceTol)
+          {
+            retval= true;
+            break;
+          }
+        const double k= getSectionTangent()(0,0);
+        if(k<=0.0) //No axial stiffness left.
+          break;
+        const double de= -r/k;
+        e(0)+= de;
+        if(fabs(de)<=1e-14*std::max(fabs(e(0)),1.0))
+          {
+            setTrialSectionDeformation(e);
+            retval= (fabs(getStressResultant()(0)-N)<=forceTol);
+            break;
+          }
+      }
+    return retval;
+  }
+
+//! @brief Compute the moment-curvature diagram of the section under
+//! a constant axial force, without the need of a finite element model.
+//!
+//! The curvature is increased monotonically in the bending direction
+//! defined by theta; for each increment the axial strain that gives
+//! the prescribed axial force is found and the section state is
+//! committed, so path dependent materials follow the loading history.
+//! Each row of the returned list contains:
+//! [kappa, eps0, M, Mz, My, epsMin, epsMax, (epsMin, epsMax) for each
+//! fiber set in setNames, converged].
+//! @param N: axial force.
+//! @param theta: angle of the curvature vector with the z axis (bending
+//!        about z axis: theta= 0, bending about y axis: theta= pi/2).
+//! @param maxK: maximum curvature.
+//! @param numIncr: number of curvature increments.
+//! @param setNames: names of the fiber sets whose extreme strains will be
+//!        reported.
+//! @param tol: relative tolerance on the axial force.
+//! @param maxIter: maximum number of iterations for each increment.
+boost::python::list XC::FiberSectionBase::getMomentCurvatureDiagramPy(const double &N,const double &theta,const double &maxK,const int &numIncr,const boost::python::list &setNames,const double &tol,const int &maxIter)
+  {
+    boost::python::list retval;
+    const int order= getOrder();
+    const double c= cos(theta);
+    const double s= sin(theta);
+    if((order<3) && (fabs(s)>1e-6))
+      std::cerr << getClassName() << "::" << __FUNCTION__
+                << "; bending about the y axis ignored for a section"
+                << " of order: " << order << std::endl;
+    std::deque<const FiberSet *> sets;
+    const int numSets= boost::python::len(setNames);
+    for(int i= 0;i<numSets;i++)
+      {
+        const std::string name= boost::python::extract<std::string>(setNames[i]);
+        FiberSets::const_iterator iSet= fiber_sets.find(name);
+        if(iSet!=fiber_sets.end())
+          sets.push_back(&(iSet->second));
+        else
+          {
+            std::cerr << getClassName() << "::" << __FUNCTION__
+                      << "; fiber set: '" << name
+                      << "' not found." << std::endl;
+            sets.push_back(nullptr);
+          }
+      }
+    revertToStart();
+    Vector e(order);
+    const int nIncr= std::max(numIncr,1);
+    for(int i= 0;i<=nIncr;i++)
+      {
+        const double kappa= maxK*double(i)/nIncr;
+        e(1)= kappa*c;
+        if(order>2)
+          e(2)= kappa*s;
+        const bool converged= findAxialEquilibrium(e,N,tol,maxIter);
+        if(converged)
+          commitState();
+        const Vector &f= getStressResultant();
+        const double Mz= f(1);
+        const double My= (order>2 ? f(2) : 0.0);
+        boost::python::list row;
+        row.append(kappa);
+        row.append(e(0));
+        row.append(Mz*c+My*s);
+        row.append(Mz);
+        row.append(My);
+        row.append(fibers.getStrainMin());
+        row.append(fibers.getStrainMax());
+        for(std::deque<const FiberSet *>::const_iterator j= sets.begin();j!=sets.end();j++)
+          {
+            const FiberSet *ptrSet= *j;
+            row.append(ptrSet ? ptrSet->getStrainMin() : 0.0);
+            row.append(ptrSet ? ptrSet->getStrainMax() : 0.0);
+          }
+        row.append(converged);
+        retval.append(row);
+        if(!converged) //Section exhausted.
+          break;
+      }
+    return retval;
+  }
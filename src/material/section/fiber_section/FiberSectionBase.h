@@ -36,6 +36,7 @@
 #include <material/section/CrossSectionKR.h>
 
 class Polygon2d;
+class Vector3d;
 
 namespace XC {
 class Fiber;
@@ -46,6 +47,7 @@ class InteractionDiagram;
 class InteractionDiagram2d;
 class NMPointCloud;
 class NMyMzPointCloud;
+class Pivots;
 
 //! @ingroup MATSCC
 //!
@@ -83,6 +85,12 @@ class FiberSectionBase: public PrismaticBarCrossSection
     virtual double get_dist_to_neutral_axis(const double &,const double &) const;
     Pos3d Esf2Pos3d(void) const;
     Pos3d getNMyMz(const DeformationPlane &);
+    Pos3d getNMyMz(Pivots &,const Vector3d &,const int &,const double &);
+    void refineDomainPoints(NMyMzPointCloud &,Pivots &,const Vector3d &,const int &,const double &,const Pos3d &,const double &,const Pos3d &,const double &,const double &);
+    void getAdaptiveDomainPoints(NMyMzPointCloud &,Pivots &,const Vector3d &,const int &,const double &,const double &,const double &,const double &);
+    std::vector<Pos3d> getInteractionDiagramCoarsePointsForTheta(const InteractionDiagramData &,const FiberPtrDeque &,const FiberPtrDeque &,const double &);
+    void getAdaptiveInteractionDiagramPointsForTheta(NMyMzPointCloud &,const InteractionDiagramData &,const FiberPtrDeque &,const FiberPtrDeque &,const double &,const double &);
+    void refineInteractionDiagramTheta(NMyMzPointCloud &,const InteractionDiagramData &,const FiberPtrDeque &,const FiberPtrDeque &,const double &,const std::vector<Pos3d> &,const double &,const std::vector<Pos3d> &,const double &);
     void getInteractionDiagramPointsForTheta(NMyMzPointCloud &lista_esfuerzos,const InteractionDiagramData &,const FiberPtrDeque &,const FiberPtrDeque &,const double &);
     const NMyMzPointCloud &getInteractionDiagramPoints(const InteractionDiagramData &);
     const NMPointCloud &getInteractionDiagramPointsForPlane(const InteractionDiagramData &, const double &);
@@ -168,6 +176,9 @@ class FiberSectionBase: public PrismaticBarCrossSection
     InteractionDiagram2d GetInteractionDiagramForPlane(const InteractionDiagramData &,const double &);
     InteractionDiagram2d GetNMyInteractionDiagram(const InteractionDiagramData &);
     InteractionDiagram2d GetNMzInteractionDiagram(const InteractionDiagramData &);
+
+    bool findAxialEquilibrium(Vector &,const double &,const double &tol= 1e-6,const int &maxIter= 50);
+    boost::python::list getMomentCurvatureDiagramPy(const double &,const double &,const double &,const int &,const boost::python::list &,const double &,const int &);
   };
 } // end of XC namespace
 
@@ -1016,6 +1016,40 @@ void XC::FiberPtrDeque::SelMatTag(const int &matTag,FiberPtrDeque &retval,bool c
 		  << "; null pointer to fiber." << std::endl;
   }
 
+//! @brief Append to the container being passed as parameter the fibers
+//! of this one whose stress is greater than the threshold (i.e. with
+//! threshold= 0.0 the tensioned fibers).
+void XC::FiberPtrDeque::SelStressGreaterThan(const double &threshold,FiberPtrDeque &retval,bool clear) const
+  {
+    if(clear) retval.clear();
+    for(const_iterator i= begin();i!= end();i++)
+      if(*i)
+        {
+          if((*i)->getMaterial()->getStress()>threshold)
+            retval.push_back(*i);
+        }
+      else
+        std::cerr << getClassName() << "::" << __FUNCTION__
+		  << "; null pointer to fiber." << std::endl;
+  }
+
+//! @brief Append to the container being passed as parameter the fibers
+//! of this one whose stress is smaller than the threshold (i.e. with
+//! threshold= 0.0 the compressed fibers).
+void XC::FiberPtrDeque::SelStressSmallerThan(const double &threshold,FiberPtrDeque &retval,bool clear) const
+  {
+    if(clear) retval.clear();
+    for(const_iterator i= begin();i!= end();i++)
+      if(*i)
+        {
+          if((*i)->getMaterial()->getStress()<threshold)
+            retval.push_back(*i);
+        }
+      else
+        std::cerr << getClassName() << "::" << __FUNCTION__
+		  << "; null pointer to fiber." << std::endl;
+  }
+
 //! @brief Return the min strain.
 double XC::FiberPtrDeque::getStrainMin(void) const
   {
@@ -1135,6 +1169,138 @@ double XC::FiberPtrDeque::getStressMed(void) const
     return retval;
   }
 
+//! @brief Return the index of the fiber with the minimum strain.
+size_t XC::FiberPtrDeque::getFiberWithMinStrain(void) const
+  {
+    size_t retval= 0;
+    const size_t sz= size();
+    if(sz>0)
+      {
+        double epsMin= (*this)[0]->getMaterial()->getStrain();
+        for(size_t i= 1;i<sz;i++)
+          {
+            const double eps= (*this)[i]->getMaterial()->getStrain();
+            if(eps<epsMin)
+              { epsMin= eps; retval= i; }
+          }
+      }
+    return retval;
+  }
+
+//! @brief Return the index of the fiber with the maximum strain.
+size_t XC::FiberPtrDeque::getFiberWithMaxStrain(void) const
+  {
+    size_t retval= 0;
+    const size_t sz= size();
+    if(sz>0)
+      {
+        double epsMax= (*this)[0]->getMaterial()->getStrain();
+        for(size_t i= 1;i<sz;i++)
+          {
+            const double eps= (*this)[i]->getMaterial()->getStrain();
+            if(eps>epsMax)
+              { epsMax= eps; retval= i; }
+          }
+      }
+    return retval;
+  }
+
+//! @brief Return the index of the fiber with the minimum stress.
+size_t XC::FiberPtrDeque::getFiberWithMinStress(void) const
+  {
+    size_t retval= 0;
+    const size_t sz= size();
+    if(sz>0)
+      {
+        double sgMin= (*this)[0]->getMaterial()->getStress();
+        for(size_t i= 1;i<sz;i++)
+          {
+            const double sg= (*this)[i]->getMaterial()->getStress();
+            if(sg<sgMin)
+              { sgMin= sg; retval= i; }
+          }
+      }
+    return retval;
+  }
+
+//! @brief Return the index of the fiber with the maximum stress.
+size_t XC::FiberPtrDeque::getFiberWithMaxStress(void) const
+  {
+    size_t retval= 0;
+    const size_t sz= size();
+    if(sz>0)
+      {
+        double sgMax= (*this)[0]->getMaterial()->getStress();
+        for(size_t i= 1;i<sz;i++)
+          {
+            const double sg= (*this)[i]->getMaterial()->getStress();
+            if(sg>sgMax)
+              { sgMax= sg; retval= i; }
+          }
+      }
+    return retval;
+  }
+
+//! @brief Return a Python list with the strains of the fibers
+//! (same order as the fibers in the container).
+boost::python::list XC::FiberPtrDeque::getStrainsPy(void) const
+  {
+    boost::python::list retval;
+    for(const_iterator i= begin();i!= end();i++)
+      retval.append((*i)->getMaterial()->getStrain());
+    return retval;
+  }
+
+//! @brief Return a Python list with the stresses of the fibers
+//! (same order as the fibers in the container).
+boost::python::list XC::FiberPtrDeque::getStressesPy(void) const
+  {
+    boost::python::list retval;
+    for(const_iterator i= begin();i!= end();i++)
+      retval.append((*i)->getMaterial()->getStress());
+    return retval;
+  }
+
+//! @brief Return a Python list with the areas of the fibers
+//! (same order as the fibers in the container).
+boost::python::list XC::FiberPtrDeque::getAreasPy(void) const
+  {
+    boost::python::list retval;
+    for(const_iterator i= begin();i!= end();i++)
+      retval.append((*i)->getArea());
+    return retval;
+  }
+
+//! @brief Return a Python list with the local y coordinates of the fibers
+//! (same order as the fibers in the container).
+boost::python::list XC::FiberPtrDeque::getYsPy(void) const
+  {
+    boost::python::list retval;
+    for(const_iterator i= begin();i!= end();i++)
+      retval.append((*i)->getLocY());
+    return retval;
+  }
+
+//! @brief Return a Python list with the local z coordinates of the fibers
+//! (same order as the fibers in the container).
+boost::python::list XC::FiberPtrDeque::getZsPy(void) const
+  {
+    boost::python::list retval;
+    for(const_iterator i= begin();i!= end();i++)
+      retval.append((*i)->getLocZ());
+    return retval;
+  }
+
+//! @brief Return a Python list with the tags of the fiber materials
+//! (same order as the fibers in the container).
+boost::python::list XC::FiberPtrDeque::getMaterialTagsPy(void) const
+  {
+    boost::python::list retval;
+    for(const_iterator i= begin();i!= end();i++)
+      retval.append((*i)->getMaterial()->getTag());
+    return retval;
+  }
+
 XC::ClaseEsfuerzo XC::FiberPtrDeque::getClaseEsfuerzo(const double &tol) const
   {
     ClaseEsfuerzo retval= ERROR;
@@ -33,6 +33,7 @@
 #include "xc_utils/src/geom/GeomObj.h"
 #include "utility/actor/actor/MovableObject.h"
 #include <deque>
+#include <boost/python/list.hpp>
 
 class Ref3d3d;
 class Pos2d;
@@ -148,6 +149,16 @@ enum ClaseEsfuerzo {SIMPLE_TENSION,COMPOSED_TENSION,FLEXION_SIMPLE,FLEXION_COMPU
     double getStressMin(void) const;
     double getStressMax(void) const;
     double getStressMed(void) const;
+    size_t getFiberWithMinStrain(void) const;
+    size_t getFiberWithMaxStrain(void) const;
+    size_t getFiberWithMinStress(void) const;
+    size_t getFiberWithMaxStress(void) const;
+    boost::python::list getStrainsPy(void) const;
+    boost::python::list getStressesPy(void) const;
+    boost::python::list getAreasPy(void) const;
+    boost::python::list getYsPy(void) const;
+    boost::python::list getZsPy(void) const;
+    boost::python::list getMaterialTagsPy(void) const;
     DeformationPlane getDeformationPlane(void) const;
     const Vector &getDeformation(void) const;
     ClaseEsfuerzo getClaseEsfuerzo(const double &tol= 1e-4) const;
@@ -201,6 +212,8 @@ enum ClaseEsfuerzo {SIMPLE_TENSION,COMPOSED_TENSION,FLEXION_SIMPLE,FLEXION_COMPU
     Response *setResponse(const std::vector<std::string> &argv, Information &sectInfo);
 
     void SelMatTag(const int &matTag,FiberPtrDeque &,bool clear= true);
+    void SelStressGreaterThan(const double &,FiberPtrDeque &,bool clear= true) const;
+    void SelStressSmallerThan(const double &,FiberPtrDeque &,bool clear= true) const;
 
     //size_t IMaxProp(const std::string &nmb_prop) const;
     //size_t IMinProp(const std::string &nmb_prop) const;
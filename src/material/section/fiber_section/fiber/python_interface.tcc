@@ -111,6 +111,19 @@ class_<XC::FiberPtrDeque, bases<CommandEntity,fiber_ptrs_dq>, boost::noncopyable
   .def("getStressMin",&XC::FiberPtrDeque::getStressMin)
   .def("getStressMax",&XC::FiberPtrDeque::getStressMax)
   .def("getStressMed",&XC::FiberPtrDeque::getStressMed)
+  .def("getIFiberWithMinStrain",&XC::FiberPtrDeque::getFiberWithMinStrain,"Return the index of the fiber with the minimum strain.")
+  .def("getIFiberWithMaxStrain",&XC::FiberPtrDeque::getFiberWithMaxStrain,"Return the index of the fiber with the maximum strain.")
+  .def("getIFiberWithMinStress",&XC::FiberPtrDeque::getFiberWithMinStress,"Return the index of the fiber with the minimum stress.")
+  .def("getIFiberWithMaxStress",&XC::FiberPtrDeque::getFiberWithMaxStress,"Return the index of the fiber with the maximum stress.")
+  .def("getStrains",&XC::FiberPtrDeque::getStrainsPy,"Return a list with the strains of all the fibers.")
+  .def("getStresses",&XC::FiberPtrDeque::getStressesPy,"Return a list with the stresses of all the fibers.")
+  .def("getAreas",&XC::FiberPtrDeque::getAreasPy,"Return a list with the areas of all the fibers.")
+  .def("getYs",&XC::FiberPtrDeque::getYsPy,"Return a list with the local y coordinates of all the fibers.")
+  .def("getZs",&XC::FiberPtrDeque::getZsPy,"Return a list with the local z coordinates of all the fibers.")
+  .def("getMaterialTags",&XC::FiberPtrDeque::getMaterialTagsPy,"Return a list with the material tags of all the fibers.")
+  .def("selMatTag",&XC::FiberPtrDeque::SelMatTag,"selMatTag(matTag,destSet,clear): append to destSet the fibers made of the material identified by matTag.")
+  .def("selStressGreaterThan",&XC::FiberPtrDeque::SelStressGreaterThan,"selStressGreaterThan(threshold,destSet,clear): append to destSet the fibers whose stress is greater than threshold.")
+  .def("selStressSmallerThan",&XC::FiberPtrDeque::SelStressSmallerThan,"selStressSmallerThan(threshold,destSet,clear): append to destSet the fibers whose stress is smaller than threshold.")
   .def("getDeformationPlane",&XC::FiberPtrDeque::getDeformationPlane,"returns deformation plane.")
   .def("getDeformation",&XC::FiberPtrDeque::getDeformation,return_value_policy<copy_const_reference>(),"Returns generalized strain vector.")
   .def("isTensioned",&XC::FiberPtrDeque::isTensioned,"Return true if all the fibers are tensioned.")
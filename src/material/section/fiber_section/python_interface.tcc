@@ -67,6 +67,7 @@ class_<XC::FiberSectionBase, bases<XC::PrismaticBarCrossSection>, boost::noncopy
   .def("computeCovers",&XC::FiberSectionBase::computeCovers,"Return the concrete cover of the set of reinforcement fibers whose name is given as parameter. Syntax: computeCovers(reinforcementSetName)")
 .def("computeSpacement",&XC::FiberSectionBase::computeSpacement,"Return the spacing between bars in the set of reinforcement fibers whose name is given as parameter. Syntax: computeSpacement(reinforcementSetName)")
   .def("getStrClaseEsfuerzo",&XC::FiberSectionBase::getStrClaseEsfuerzo,"Return the type of load acting at the cross-section('flexion_compuesta',...). Syntax: getStrClaseEsfuerzo(tolerance)")
+  .def("getMomentCurvatureDiagram",&XC::FiberSectionBase::getMomentCurvatureDiagramPy,"Return the moment-curvature diagram of the section under constant axial force as a list of rows [kappa, eps0, M, Mz, My, epsMin, epsMax, (epsMin, epsMax) for each fiber set, converged]. Syntax: getMomentCurvatureDiagram(N, theta, maxK, numIncr, fiberSetNames, tol, maxIter)")
   ;
 
 class_<XC::FiberSection2d, bases<XC::FiberSectionBase>, boost::noncopyable >("FiberSection2d", no_init);
@@ -43,6 +43,7 @@ class InteractionDiagramData: public CommandEntity
     double umbral; //!< Minimal distance between diagram points.
     double inc_eps; //!< Strain step size.
     double inc_t; //!< Angle step size.
+    double adaptive_tol; //!< Relative tolerance for adaptive sampling (if zero, uniform sampling).
     PivotsUltimateStrains agot_pivots; //!< Ultimate strains at pivots.
     std::string concrete_set_name; //!< Concrete fibers set name.
     int concrete_tag; //!< Concrete material tag.
@@ -64,6 +65,12 @@ class InteractionDiagramData: public CommandEntity
       { return inc_t; }
     inline void setIncTheta(const double &v)
       { inc_t= v; }
+    inline const double &getAdaptiveTolerance(void) const
+      { return adaptive_tol; }
+    inline void setAdaptiveTolerance(const double &v)
+      { adaptive_tol= v; }
+    inline bool isAdaptive(void) const
+      { return (adaptive_tol>0.0); }
     inline const PivotsUltimateStrains &getPivotsUltimateStrains(void) const
       { return agot_pivots; }
     inline void setPivotsUltimateStrains(const PivotsUltimateStrains &v)
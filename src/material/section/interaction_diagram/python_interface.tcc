@@ -44,6 +44,7 @@ class_<XC::InteractionDiagramData, bases<CommandEntity>>("InteractionDiagramPara
   .add_property("umbral",make_function(&XC::InteractionDiagramData::getUmbral,return_value_policy<copy_const_reference>()),&XC::InteractionDiagramData::setUmbral)
   .add_property("incEps",make_function(&XC::InteractionDiagramData::getIncEps,return_value_policy<copy_const_reference>()),&XC::InteractionDiagramData::setIncEps)
   .add_property("incTheta",make_function(&XC::InteractionDiagramData::getIncTheta,return_value_policy<copy_const_reference>()),&XC::InteractionDiagramData::setIncTheta)
+  .add_property("adaptiveTolerance",make_function(&XC::InteractionDiagramData::getAdaptiveTolerance,return_value_policy<copy_const_reference>()),&XC::InteractionDiagramData::setAdaptiveTolerance,"Relative tolerance for the adaptive sampling of the diagram; if zero (default) the sampling is uniform, otherwise incEps and incTheta are the minimum steps.")
   .add_property("pivotsUltimateStrains",make_function(&XC::InteractionDiagramData::getPivotsUltimateStrains,return_internal_reference<>()),&XC::InteractionDiagramData::setPivotsUltimateStrains)
   .add_property("concreteSetName",make_function(&XC::InteractionDiagramData::getConcreteSetName,return_internal_reference<>()),&XC::InteractionDiagramData::setConcreteSetName)
   .add_property("concreteTag",make_function(&XC::InteractionDiagramData::getConcreteTag,return_value_policy<copy_const_reference>()),&XC::InteractionDiagramData::setConcreteTag)
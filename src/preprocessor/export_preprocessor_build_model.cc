@@ -23,6 +23,14 @@
 
 #include "python_interface.h"
 
+// Default value of the initialGeometry argument.
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(computeTributaryLengths_overloads, XC::SetBase::computeTributaryLengths, 0, 1)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(computeTributaryAreas_overloads, XC::SetBase::computeTributaryAreas, 0, 1)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(computeTributaryVolumes_overloads, XC::SetBase::computeTributaryVolumes, 0, 1)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(getTributaryLengths_overloads, XC::SetBase::getTributaryLengths, 0, 1)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(getTributaryAreas_overloads, XC::SetBase::getTributaryAreas, 0, 1)
+BOOST_PYTHON_MEMBER_FUNCTION_OVERLOADS(getTributaryVolumes_overloads, XC::SetBase::getTributaryVolumes, 0, 1)
+
 void export_preprocessor_build_model(void)
   {
     using namespace boost::python;
@@ -45,10 +53,15 @@ class_<XC::SetBase, bases<XC::EntMdlrBase>, boost::noncopyable >("SetBase", no_i
   .def("genMesh", &XC::SetBase::genMesh,"Triggers mesh generation.")
   .def("getNodeTags",&XC::SetBase::getNodeTags,"return set of node tags.")
   .def("getElementTags",&XC::SetBase::getElementTags,"return set of node tags.")
+  .def("getIdNodeTags",make_function(&XC::SetBase::getIdNodeTags, return_value_policy<copy_const_reference>()),"return the node tags sorted in an ID.")
   .def("resetTributaries",&XC::SetBase::resetTributaries)
-  .def("computeTributaryLengths",&XC::SetBase::computeTributaryLengths)
-  .def("computeTributaryAreas",&XC::SetBase::computeTributaryAreas)
-  .def("computeTributaryVolumes",&XC::SetBase::computeTributaryVolumes)
+  .def("computeTributaryLengths",&XC::SetBase::computeTributaryLengths,computeTributaryLengths_overloads(args("initialGeometry")))
+  .def("computeTributaryAreas",&XC::SetBase::computeTributaryAreas,computeTributaryAreas_overloads(args("initialGeometry")))
+  .def("computeTributaryVolumes",&XC::SetBase::computeTributaryVolumes,computeTributaryVolumes_overloads(args("initialGeometry")))
+  .def("getTributaryLengths",&XC::SetBase::getTributaryLengths,getTributaryLengths_overloads(args("initialGeometry"),"getTributaryLengths(initialGeometry= True) return the tributary lengths of the set nodes sorted by tag (with the initial geometry they are computed again only if the set or the mesh change).")[return_value_policy<copy_const_reference>()])
+  .def("getTributaryAreas",&XC::SetBase::getTributaryAreas,getTributaryAreas_overloads(args("initialGeometry"),"getTributaryAreas(initialGeometry= True) return the tributary areas of the set nodes sorted by tag (with the initial geometry they are computed again only if the set or the mesh change).")[return_value_policy<copy_const_reference>()])
+  .def("getTributaryVolumes",&XC::SetBase::getTributaryVolumes,getTributaryVolumes_overloads(args("initialGeometry"),"getTributaryVolumes(initialGeometry= True) return the tributary volumes of the set nodes sorted by tag (with the initial geometry they are computed again only if the set or the mesh change).")[return_value_policy<copy_const_reference>()])
+  .def("clearTributaryCache",&XC::SetBase::clearTributaryCache,"Forget the memoized tributary values (needed only if the node coordinates are modified directly).")
   .def("isNodeIn",isNodeIn,"True if sets contains node.")
   .def("isElementIn",isElementIn,"True if sets contains element.")
   .def("isPntIn",isPntIn,"True if sets contains point.")
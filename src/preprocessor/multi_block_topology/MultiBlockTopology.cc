@@ -119,40 +119,71 @@ const XC::Edge *XC::MultiBlockTopology::busca_edge_extremos(const PntMap::Indice
     return retval;
   }
 
+//! @brief Return the groups of homologous edges (edges that must have
+//! the same number of divisions to make the meshes of the surfaces
+//! conforming). Each edge belongs to exactly one group.
+std::deque<std::set<const XC::Edge *> > XC::MultiBlockTopology::getHomologousSidesGroups(void) const
+  {
+    std::deque<std::set<const Edge *> > retval;
+    std::set<const Edge *> visited;
+    const std::set<const Edge *> empty;
+    for(LineMap::const_iterator i=edges.begin();i!=edges.end();i++)
+      {
+        const Edge *lado= (*i).second;
+        if(visited.find(lado)==visited.end())
+          {
+            //Groups are disjoint so there is no need to pass
+            //the edges already visited.
+            std::set<const Edge *> group= lado->getHomologousSides(empty);
+            group.insert(lado);
+            visited.insert(group.begin(),group.end());
+            retval.push_back(group);
+          }
+      }
+    return retval;
+  }
+
+//! @brief Return the names of the edges of each group of homologous
+//! edges.
+boost::python::list XC::MultiBlockTopology::getHomologousSidesGroupsPy(void) const
+  {
+    boost::python::list retval;
+    const std::deque<std::set<const Edge *> > groups= getHomologousSidesGroups();
+    for(std::deque<std::set<const Edge *> >::const_iterator i= groups.begin();i!=groups.end();i++)
+      {
+        boost::python::list names;
+        for(std::set<const Edge *>::const_iterator j= (*i).begin();j!=(*i).end();j++)
+          names.append((*j)->getName());
+        retval.append(names);
+      }
+    return retval;
+  }
+
 //! @brief Conciliate number of divisions of the lines.
-void XC::MultiBlockTopology::conciliaNDivs(void)
+//!
+//! All the edges of each group of homologous edges get the
+//! maximum number of divisions of the group.
+//! @return number of groups of homologous edges.
+size_t XC::MultiBlockTopology::conciliaNDivs(void)
   {
+    size_t retval= 0;
     if(!faces.empty())
       {
-        std::set<const Edge *> tmp_edges;
-        for(LineMap::iterator i=edges.begin();i!=edges.end();i++)
-          tmp_edges.insert((*i).second);
-        const size_t max_num_iter= 1000; 
-        size_t conta= 0;
-        while(!tmp_edges.empty())
+        const std::deque<std::set<const Edge *> > groups= getHomologousSidesGroups();
+        for(std::deque<std::set<const Edge *> >::const_iterator i= groups.begin();i!=groups.end();i++)
           {
-            const Edge *lado= *tmp_edges.begin();
-	    std::set<const XC::Edge *> homologous;
-            homologous= lado->getHomologousSides(homologous);
-            homologous.insert(lado);
-            const size_t nd= calcula_ndiv_lados(homologous);
-            for(std::set<const Edge *>::const_iterator i= homologous.begin();i!=homologous.end();i++)
+            const size_t nd= calcula_ndiv_lados(*i);
+            for(std::set<const Edge *>::const_iterator j= (*i).begin();j!=(*i).end();j++)
               {
-                Edge *tmp= const_cast<Edge *>(*i);
+                Edge *tmp= const_cast<Edge *>(*j);
                 tmp->SetNDiv(nd);
-                tmp_edges.erase(tmp);
-              }
-            conta++;
-            if(conta>max_num_iter)
-              {
-		std::cerr << getClassName() << "::" << __FUNCTION__
-			  << "; too much iterations." << std::endl;
-                break;
               }
           }
+        retval= groups.size();
         for(SurfaceMap::iterator i=faces.begin();i!= faces.end();i++)
           (*i).second->ConciliaNDivIJ();        
       }
+    return retval;
   }
 
 //! @brief Search for the entity whose name is passed as a parameter.
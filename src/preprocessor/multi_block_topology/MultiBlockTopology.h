@@ -31,6 +31,8 @@
 
 #include "preprocessor/PreprocessorContainer.h"
 #include <map>
+#include <deque>
+#include <set>
 #include "boost/lexical_cast.hpp"
 #include "preprocessor/multi_block_topology/entities/PntMap.h"
 #include "preprocessor/multi_block_topology/entities/LineMap.h"
@@ -93,7 +95,9 @@ class MultiBlockTopology: public PreprocessorContainer
     Edge *busca_edge_extremos(const PntMap::Indice &,const PntMap::Indice &);
     const Edge *busca_edge_extremos(const PntMap::Indice &,const PntMap::Indice &) const;
     
-    void conciliaNDivs(void);
+    std::deque<std::set<const Edge *> > getHomologousSidesGroups(void) const;
+    boost::python::list getHomologousSidesGroupsPy(void) const;
+    size_t conciliaNDivs(void);
 
     void clearAll(void);
     //! @brief Destructor.
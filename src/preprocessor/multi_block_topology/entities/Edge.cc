@@ -39,6 +39,7 @@
 
 
 #include "boost/any.hpp"
+#include <deque>
 #include "domain/mesh/element/Element.h"
 
 //! @brief Constructor.
@@ -379,37 +380,34 @@ const std::string &XC::Edge::getConnectedSurfacesNames(void) const
     return retval;
   }
 
-//! @brief Return the homologous sides to that passed as a parameter.
+//! @brief Return the homologous sides to this one (the sides that must
+//! have the same number of divisions because they are opposite to each
+//! other in the faces that connect them). The sides contained in the
+//! argument are considered already visited and are not returned.
+//!
+//! The face/edge adjacency graph is traversed breadth first, so the cost
+//! is linear in the size of the group.
 std::set<const XC::Edge *> XC::Edge::getHomologousSides(const std::set<const XC::Edge *> &lh) const
   {
     std::set<const Edge *> retval;
-    std::set<const Edge *> new_adyacentes;
-
-    if(!surfaces_line.empty())
+    std::set<const Edge *> visited(lh);
+    visited.insert(this);
+    std::deque<const Edge *> pending(1,this);
+    while(!pending.empty())
       {
-        for(std::set<const Face *>::const_iterator i= surfaces_line.begin();i!=surfaces_line.end();i++)
+        const Edge *e= pending.front();
+        pending.pop_front();
+        const std::set<const Face *> &surfaces= e->surfaces_line;
+        for(std::set<const Face *>::const_iterator i= surfaces.begin();i!=surfaces.end();i++)
           {
-            const Edge *h= (*i)->get_lado_homologo(this);
-            if(h!=this)
+            const Edge *h= (*i)->get_lado_homologo(e);
+            if(h && visited.insert(h).second) //Not already visited.
               {
-                std::set<const Edge *>::const_iterator k= lh.find(h);
-                if(k==lh.end()) //Not already added
-                  new_adyacentes.insert(h);
+                retval.insert(h);
+                pending.push_back(h);
               }
           }
       }
-    for(std::set<const XC::Edge *>::const_iterator i= new_adyacentes.begin();i!=new_adyacentes.end();i++)
-      retval.insert(*i);
-    if(retval.size()>lh.size()) //There are new edges.
-      {
-        for(std::set<const Edge *>::const_iterator i= new_adyacentes.begin();i!=new_adyacentes.end();i++)
-          {
-            std::set<const Edge *> tmp= (*i)->getHomologousSides(retval); //Recursive call
-            for(std::set<const Edge *>::const_iterator j= tmp.begin();j!=tmp.end();j++)
-              if(this!=*j) retval.insert(*j);
-          }
-        new_adyacentes.erase(new_adyacentes.begin(),new_adyacentes.end());
-      }
     return retval;
   }
 
@@ -163,6 +163,21 @@ const XC::Node *XC::EntMdlr::getNearestNode(const Pos3d &p) const
     return this_no_const->getNearestNode(p);
   }
 
+//! @brief Return the tags of the nodes closest to the points
+//! of the list being passed as parameter (-1 if there is no node).
+boost::python::list XC::EntMdlr::getNearestNodeTagsPy(const boost::python::list &points) const
+  {
+    boost::python::list retval;
+    const size_t sz= len(points);
+    for(size_t i=0;i<sz;i++)
+      {
+        const Pos3d p= boost::python::extract<Pos3d>(points[i]);
+        const Node *n= getNearestNode(p);
+        retval.append(n ? n->getTag() : -1);
+      }
+    return retval;
+  }
+
 //! @brief Return the indexes of the node being passed as parameter.
 XC::ID XC::EntMdlr::getNodeIndices(const Node *n) const
   { return ttzNodes.getNodeIndices(n); }
@@ -205,6 +220,21 @@ const XC::Element *XC::EntMdlr::getNearestElement(const Pos3d &p) const
     return this_no_const->getNearestElement(p);
   }
 
+//! @brief Return the tags of the elements closest to the points
+//! of the list being passed as parameter (-1 if there is no element).
+boost::python::list XC::EntMdlr::getNearestElementTagsPy(const boost::python::list &points) const
+  {
+    boost::python::list retval;
+    const size_t sz= len(points);
+    for(size_t i=0;i<sz;i++)
+      {
+        const Pos3d p= boost::python::extract<Pos3d>(points[i]);
+        const Element *e= getNearestElement(p);
+        retval.append(e ? e->getTag() : -1);
+      }
+    return retval;
+  }
+
 //! @brief Returns a pointer to the node cuyo identifier is being passed as parameter.
 XC::Node *XC::EntMdlr::findNode(const int &tag)
   { return ttzNodes.findNode(tag); }
@@ -104,6 +104,7 @@ class EntMdlr: public SetEstruct
     virtual const Node *getNode(const size_t &i=1,const size_t &j=1,const size_t &k=1) const;
     Node *getNearestNode(const Pos3d &p);
     const Node *getNearestNode(const Pos3d &p) const;
+    boost::python::list getNearestNodeTagsPy(const boost::python::list &) const;
     ID getNodeIndices(const Node *) const;
     virtual Element *getElement(const size_t &i=1,const size_t &j=1,const size_t &k=1);
     virtual const Element *getElement(const size_t &i=1,const size_t &j=1,const size_t &k=1) const;
@@ -114,6 +115,7 @@ class EntMdlr: public SetEstruct
     const Element *findElement(const int &) const;
     Element *getNearestElement(const Pos3d &p);
     const Element *getNearestElement(const Pos3d &p) const;
+    boost::python::list getNearestElementTagsPy(const boost::python::list &) const;
 
     NodePtrArray3d &getTtzNodes(void)
       { return ttzNodes; }
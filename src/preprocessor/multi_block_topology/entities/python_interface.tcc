@@ -36,8 +36,10 @@ class_<XC::EntMdlr, bases<XC::SetEstruct>, boost::noncopyable >("EntMdlr", no_in
   .add_property("getVtkCellType", &XC::EntMdlr::getVtkCellType)
   .def("getNode",make_function(getNodeEntMdlr, return_internal_reference<>() ),"Returns (i,j,k) node.")
   .def("getNearestNode",make_function(getNearestNodeEntMdlr, return_internal_reference<>() ),"Returns nearest node.")
+  .def("getNearestNodeTags",&XC::EntMdlr::getNearestNodeTagsPy,"getNearestNodeTags([pos1,pos2,...]) returns the tags of the nearest nodes to each of the positions.")
   .def("getElement",make_function(getElementEntMdlr, return_internal_reference<>() ),"Returns (i,j,k) node.")
   .def("getNearestElement",make_function(getNearestElementEntMdlr, return_internal_reference<>() ),"Returns nearest element.")
+  .def("getNearestElementTags",&XC::EntMdlr::getNearestElementTagsPy,"getNearestElementTags([pos1,pos2,...]) returns the tags of the nearest elements to each of the positions.")
   .def("getSimpsonWeights", &XC::EntMdlr::getSimpsonWeights,"Returns weights for Simpson's rule integration.")
   .def("In", &XC::EntMdlr::In,"\n""In(geomObject,tolerance) \n""Return true if this object lies inside the geometric object.")
   .def("Out", &XC::EntMdlr::Out,"\n""Out(geomObject,tolerance) \n""Return true if this object lies outside the geometric object.")
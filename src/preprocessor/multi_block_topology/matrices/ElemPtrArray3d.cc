@@ -29,6 +29,7 @@
 #include "ElemPtrArray3d.h"
 #include "domain/mesh/element/Element.h"
 #include <boost/any.hpp>
+#include <cmath>
 
 
 #include "xc_utils/src/geom/pos_vec/Pos3d.h"
@@ -37,15 +38,56 @@
 
 //! @brief Default constructor.
 XC::ElemPtrArray3d::ElemPtrArray3d(const size_t n_layers,const ElemPtrArray &m)
-  : PtrArray3dBase<ElemPtrArray>(n_layers,m) {}
+  : PtrArray3dBase<ElemPtrArray>(n_layers,m), maxRadius(0.0), indexed(false) {}
 //! @brief Constructor.
 XC::ElemPtrArray3d::ElemPtrArray3d(const size_t n_layers,const size_t iRows,const size_t cols)
-  : PtrArray3dBase<ElemPtrArray>(n_layers)
+  : PtrArray3dBase<ElemPtrArray>(n_layers), maxRadius(0.0), indexed(false)
   {
     for(size_t i=0;i<n_layers;i++)
       (*this)[i]= ElemPtrArray(iRows,cols);
   }
 
+//! @brief Clear the array and its spatial index.
+void XC::ElemPtrArray3d::clearAll(void)
+  {
+    PtrArray3dBase<ElemPtrArray>::clearAll();
+    invalidateIndex();
+  }
+
+//! @brief Mark the spatial index as outdated (it will be rebuilt
+//! on the next query).
+void XC::ElemPtrArray3d::invalidateIndex(void)
+  {
+    kdtree.clear();
+    maxRadius= 0.0;
+    indexed= false;
+  }
+
+//! @brief Build the spatial index of the element centroids.
+void XC::ElemPtrArray3d::build_index(void) const
+  {
+    kdtree.clear();
+    maxRadius= 0.0;
+    const size_t numberOfLayers= getNumberOfLayers();
+    const size_t numberOfRows= getNumberOfRows();
+    const size_t numberOfColumns= getNumberOfColumns();
+    for(size_t i=1;i<=numberOfLayers;i++)
+      for(size_t j=1;j<=numberOfRows;j++)
+        for(size_t k=1;k<=numberOfColumns;k++)
+          {
+            const Element *ptrElem= (*this)(i,j,k);
+            if(ptrElem)
+              {
+                kdtree.insert(*ptrElem);
+                const Pos3d center= ptrElem->getCenterOfMassPosition(true);
+                const std::deque<Pos3d> positions= ptrElem->getPosNodes(true);
+                for(std::deque<Pos3d>::const_iterator l= positions.begin();l!=positions.end();l++)
+                  maxRadius= std::max(maxRadius,sqrt(dist2(center,*l)));
+              }
+          }
+    indexed= true;
+  }
+
 //! @brief Returns (if it exists) a pointer to the element
 //! identified by the tag being passed as parameter.
 XC::Element *XC::ElemPtrArray3d::findElement(const int &tag)
@@ -77,30 +119,34 @@ const XC::Element *XC::ElemPtrArray3d::findElement(const int &tag) const
   }
 
 //! @brief Returns the element closest to the point being passed as parameter.
+//!
+//! The element with the nearest centroid is obtained from a spatial
+//! index (built on the first call). Any element closer to the point
+//! than that one has its centroid at a distance not greater than
+//! that distance plus the maximum element radius, so only the
+//! elements inside that sphere need to be checked.
 XC::Element *XC::ElemPtrArray3d::getNearestElement(const Pos3d &p)
   {
-    Element *retval= nullptr, *ptrElem= nullptr;
-    const size_t numberOfLayers= getNumberOfLayers();
-    double d= DBL_MAX;
-    double tmp;
-    if(numberOfLayers>100)
-      std::clog << getClassName() << "::" << __FUNCTION__
-	        << "The element pointer array has"
-                << numberOfLayers << " layers "
-                << " is better to search by coordinates in the associated set."
-                << std::endl;
-    for(size_t i=1;i<=numberOfLayers;i++)
+    const Element *retval= nullptr;
+    if(!indexed)
+      build_index();
+    retval= kdtree.getNearest(p);
+    if(retval)
       {
-        ElemPtrArray &layer= operator()(i);
-        ptrElem= layer.getNearestElement(p);
-        tmp= ptrElem->getDist2(p);
-        if(tmp<d)
+        double d2= retval->getDist2(p);
+        const double r= sqrt(d2)+maxRadius;
+        const std::deque<const Element *> candidates= kdtree.getWithinRadius(p,r);
+        for(std::deque<const Element *>::const_iterator i= candidates.begin();i!=candidates.end();i++)
           {
-            d= tmp;
-            retval= ptrElem;
+            const double tmp= (*i)->getDist2(p);
+            if(tmp<d2)
+              {
+                d2= tmp;
+                retval= *i;
+              }
           }
       }
-    return retval;
+    return const_cast<Element *>(retval);
   }
 
 //! @brief Returns the element closest to the point being passed as parameter.
@@ -33,6 +33,7 @@
 #include "xc_utils/src/kernel/CommandEntity.h"
 #include "ElemPtrArray.h"
 #include "PtrArray3dBase.h"
+#include "domain/mesh/element/utils/KDTreeElements.h"
 
 
 namespace XC{
@@ -42,6 +43,11 @@ namespace XC{
 //! @brief Three-dimensional array of pointers to elements.
 class ElemPtrArray3d: public PtrArray3dBase<ElemPtrArray>
   {
+  private:
+    mutable KDTreeElements kdtree; //!< Spatial index of the element centroids (built on demand).
+    mutable double maxRadius; //!< Maximum distance from an element centroid to its nodes.
+    mutable bool indexed; //!< True if the spatial index is up to date.
+    void build_index(void) const;
   protected:
 
   public:
@@ -49,6 +55,9 @@ class ElemPtrArray3d: public PtrArray3dBase<ElemPtrArray>
     ElemPtrArray3d(const size_t n_layers= 0,const ElemPtrArray &m= ElemPtrArray());
     ElemPtrArray3d(const size_t ,const size_t ,const size_t );
 
+    void clearAll(void);
+    void invalidateIndex(void);
+
     Element *findElement(const int &);
     const Element *findElement(const int &) const;
     Element *getNearestElement(const Pos3d &p);
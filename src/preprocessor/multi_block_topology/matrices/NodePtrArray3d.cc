@@ -43,15 +43,48 @@
 
 //! @brief Default constructor.
 XC::NodePtrArray3d::NodePtrArray3d(const size_t n_layers)
-  : PtrArray3dBase<NodePtrArray>(n_layers) {}
+  : PtrArray3dBase<NodePtrArray>(n_layers), indexed(false) {}
 //! @brief Constructor.
 XC::NodePtrArray3d::NodePtrArray3d(const size_t n_layers,const size_t n_rows,const size_t cols)
-  : PtrArray3dBase<NodePtrArray>(n_layers)
+  : PtrArray3dBase<NodePtrArray>(n_layers), indexed(false)
   {
     for(size_t i=0;i<n_layers;i++)
       (*this)[i]= NodePtrArray(n_rows,cols);
   }
 
+//! @brief Clear the array and its spatial index.
+void XC::NodePtrArray3d::clearAll(void)
+  {
+    PtrArray3dBase<NodePtrArray>::clearAll();
+    invalidateIndex();
+  }
+
+//! @brief Mark the spatial index as outdated (it will be rebuilt
+//! on the next query).
+void XC::NodePtrArray3d::invalidateIndex(void)
+  {
+    kdtree.clear();
+    indexed= false;
+  }
+
+//! @brief Build the spatial index of the nodes.
+void XC::NodePtrArray3d::build_index(void) const
+  {
+    kdtree.clear();
+    const size_t numberOfLayers= getNumberOfLayers();
+    const size_t numberOfRows= getNumberOfRows();
+    const size_t numberOfColumns= getNumberOfColumns();
+    for(size_t i=1;i<=numberOfLayers;i++)
+      for(size_t j=1;j<=numberOfRows;j++)
+        for(size_t k=1;k<=numberOfColumns;k++)
+          {
+            const Node *ptrNod= (*this)(i,j,k);
+            if(ptrNod)
+              kdtree.insert(*ptrNod);
+          }
+    indexed= true;
+  }
+
 //! @brief Returns (if it exists) a pointer to the node
 //! which tag is being passed as parameter.
 XC::Node *XC::NodePtrArray3d::findNode(const int &tag)
@@ -75,30 +108,14 @@ const XC::Node *XC::NodePtrArray3d::getNearestNode(const Pos3d &p) const
   }
 
 //! @brief Returns the node closest to the point being passed as parameter.
+//!
+//! The query is answered by a spatial index that is built on the
+//! first call.
 XC::Node *XC::NodePtrArray3d::getNearestNode(const Pos3d &p)
   {
-    Node *retval= nullptr, *ptrNod= nullptr;
-    const size_t numberOfLayers= getNumberOfLayers();
-    double d= DBL_MAX;
-    double tmp= 0;
-    if(numberOfLayers>100)
-      std::clog << getClassName() << "::" << __FUNCTION__
-	        << "Node pointers array has "
-                << numberOfLayers << " layers "
-                << " is better to search by coordinates in the associated set."
-                << std::endl;
-    for(size_t i=1;i<=numberOfLayers;i++)
-      {
-        NodePtrArray &layer= operator()(i);
-        ptrNod= layer.getNearestNode(p);
-        tmp= ptrNod->getDist2(p);
-        if(tmp<d)
-          {
-            d= tmp;
-            retval= ptrNod;
-          }
-      }
-    return retval;
+    if(!indexed)
+      build_index();
+    return const_cast<Node *>(kdtree.getNearest(p));
   }
 
 //! @brief Returns the indexes of the node identified by the pointer
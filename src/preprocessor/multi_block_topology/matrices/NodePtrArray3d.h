@@ -35,6 +35,7 @@
 #include "NodePtrArray.h"
 #include "PtrArray3dBase.h"
 #include "utility/matrix/Vector.h"
+#include "domain/mesh/node/KDTreeNodes.h"
 
 
 class ExprAlgebra;
@@ -49,6 +50,10 @@ namespace XC{
 //! @brief Three-dimensional array of pointers to nodes.
 class NodePtrArray3d: public PtrArray3dBase<NodePtrArray>
   {
+  private:
+    mutable KDTreeNodes kdtree; //!< Spatial index of the nodes (built on demand).
+    mutable bool indexed; //!< True if the spatial index is up to date.
+    void build_index(void) const;
   protected:
 
   public:
@@ -56,6 +61,9 @@ class NodePtrArray3d: public PtrArray3dBase<NodePtrArray>
     NodePtrArray3d(const size_t n_layers= 0);
     NodePtrArray3d(const size_t ,const size_t ,const size_t );
 
+    void clearAll(void);
+    void invalidateIndex(void);
+
     Node *findNode(const int &tag);
     const Node *findNode(const int &tag) const;
     Node *getNearestNode(const Pos3d &p);
@@ -65,7 +65,8 @@ class_<XC::MultiBlockTopology, bases<XC::PreprocessorContainer>, boost::noncopya
   .add_property("get2DNets", make_function( getRefToFramework2d, return_internal_reference<>() ))
   .add_property("get3DNets", make_function( getRefToFramework3d, return_internal_reference<>() ))
   .add_property("getUniformGrids", make_function( getUniformGridsRef, return_internal_reference<>() ))
-  .def("conciliaNDivs", &XC::MultiBlockTopology::conciliaNDivs)
+  .def("conciliaNDivs", &XC::MultiBlockTopology::conciliaNDivs,"Conciliate the number of divisions of the lines; return the number of groups of homologous lines.")
+  .def("getHomologousSidesGroups", &XC::MultiBlockTopology::getHomologousSidesGroupsPy,"Return the names of the lines of each group of homologous lines (lines that must have the same number of divisions).")
   .def("getLineWithEndPoints",make_function( getLineWithEndPoints, return_internal_reference<>() ))
    ;
 
@@ -34,7 +34,15 @@
 #include "boost/any.hpp"
 
 #include "domain/mesh/node/Node.h"
+#include "domain/mesh/element/zeroLength/ZeroLength.h"
+#include "material/uniaxial/ElasticMaterial.h"
+#include "material/uniaxial/DqUniaxialMaterial.h"
+#include "preprocessor/prep_handlers/NodeHandler.h"
+#include "preprocessor/prep_handlers/BoundaryCondHandler.h"
+#include "utility/matrix/ID.h"
+#include "utility/matrix/Matrix.h"
 #include "utility/tagged/DefaultTag.h"
+#include <algorithm>
 
 void XC::ElementHandler::SeedElemHandler::free_mem(void)
   {
@@ -139,3 +147,96 @@ void XC::ElementHandler::new_element(Element *e)
     getPreprocessor()->UpdateSets(e);
   }
 
+
+//! @brief Creates, for each node of the list, a new node in the same
+//! position with all its DOFs fixed and a zero length element with
+//! elastic materials that joins it to the node (elastic bearing).
+//! Each element gets its own copies of the materials so the springs
+//! of all the nodes are created in one call.
+//! @param nodeTags: tags of the supported nodes.
+//! @param stiffness: stiffness of the springs; one row for each node and
+//! one column for each local direction of the element (zero means no spring
+//! in that direction).
+//! @return tags of the new elements (-1 if the node was not found).
+XC::ID XC::ElementHandler::newElasticBearings(const ID &nodeTags,const Matrix &stiffness)
+  {
+    const int numNodes= nodeTags.Size();
+    if(stiffness.noRows()!=numNodes)
+      {
+        std::cerr << getClassName() << "::" << __FUNCTION__
+	          << "; the number of rows of the stiffness matrix: "
+                  << stiffness.noRows()
+                  << " doesn't match the number of nodes: "
+                  << numNodes << std::endl;
+        return ID();
+      }
+    ID retval(numNodes);
+    Preprocessor *preprocessor= getPreprocessor();
+    NodeHandler &nodeHandler= preprocessor->getNodeHandler();
+    BoundaryCondHandler &constraints= preprocessor->getBoundaryCondHandler();
+    const int dim= nodeHandler.getDimEspacio();
+    const int numDirs= stiffness.noCols();
+    Vector x(3); x(0)= 1.0; //Default orientation.
+    Vector yp(3); yp(1)= 1.0;
+    for(int i= 0;i<numNodes;i++)
+      {
+        const int nodeTag= nodeTags(i);
+        retval(i)= -1;
+        Node *newNode= nodeHandler.duplicateNode(nodeTag);
+        if(newNode)
+          {
+            const int newNodeTag= newNode->getTag();
+            DqUniaxialMaterial materials;
+            ID directions(numDirs);
+            int numMats= 0;
+            for(int j= 0;j<numDirs;j++)
+              {
+                const double k= stiffness(i,j);
+                if(k!=0.0)
+                  {
+                    const ElasticMaterial spring(0,k);
+                    materials.push_back(&spring);
+                    directions(numMats)= j;
+                    numMats++;
+                  }
+              }
+            directions.resize(numMats);
+            ZeroLength *zl= new ZeroLength(0,dim,newNodeTag,nodeTag,x,yp,materials,directions);
+            Add(zl);
+            retval(i)= zl->getTag();
+            const int numDOFs= newNode->getNumberDOF();
+            for(int j= 0;j<numDOFs;j++)
+              constraints.newSPConstraint(newNodeTag,j,0.0);
+          }
+      }
+    return retval;
+  }
+
+//! @brief Return the first components of the resisting forces of the
+//! elements of the list (i.e. the forces on their first node) in a
+//! single vector: the numComponents values of the first element,
+//! followed by those of the second one and so on. Used to obtain the
+//! reactions of a large number of springs in one call.
+//! @param elemTags: tags of the elements.
+//! @param numComponents: number of components to return for each element.
+XC::Vector XC::ElementHandler::getResistingForces(const ID &elemTags,const int &numComponents)
+  {
+    const int numElements= elemTags.Size();
+    Vector retval(numElements*numComponents);
+    for(int i= 0;i<numElements;i++)
+      {
+        const Element *elem= getElement(elemTags(i));
+        if(elem)
+          {
+            const Vector &rf= elem->getResistingForce();
+            const int sz= std::min(numComponents,rf.Size());
+            for(int j= 0;j<sz;j++)
+              retval(i*numComponents+j)= rf(j);
+          }
+        else
+          std::cerr << getClassName() << "::" << __FUNCTION__
+	            << "; element identified by: "
+                    << elemTags(i) << " not found." << std::endl;
+      }
+    return retval;
+  }
@@ -30,8 +30,11 @@
 #define ELEMENTHANDLER_H
 
 #include "preprocessor/prep_handlers/ProtoElementHandler.h"
+#include "utility/matrix/ID.h"
+#include "utility/matrix/Vector.h"
 
 namespace XC {
+class Matrix;
 
 //!  @ingroup Ldrs
 //! 
@@ -73,6 +76,8 @@ class ElementHandler: public ProtoElementHandler
       { return seed_elem_handler.GetSeedElement(); }
 
     virtual void Add(Element *);
+    ID newElasticBearings(const ID &,const Matrix &);
+    Vector getResistingForces(const ID &,const int &);
 
     int getDefaultTag(void) const;
     void setDefaultTag(const int &tag);
@@ -85,6 +85,8 @@ class_<XC::ElementHandler, bases<XC::ProtoElementHandler>, boost::noncopyable >(
   .add_property("seedElemHandler", make_function( &XC::ElementHandler::getSeedElemHandler, return_internal_reference<>() ))
   .def("getElement", &XC::ElementHandler::getElement,return_internal_reference<>(),"Returns the element identified by the parameter.")
   .add_property("defaultTag", &XC::ElementHandler::getDefaultTag, &XC::ElementHandler::setDefaultTag)
+  .def("newElasticBearings", &XC::ElementHandler::newElasticBearings,"newElasticBearings(nodeTags, stiffness): create, for each node, a fixed node and a zero length element with elastic materials that joins them. The stiffness matrix has a row for each node and a column for each direction (zero: no spring). Return the tags of the new elements.")
+  .def("getResistingForces", &XC::ElementHandler::getResistingForces,"getResistingForces(elemTags, numComponents): return, in a single vector, the first numComponents components of the resisting force of each element of the list.")
    ;
 
 class_<XC::BoundaryCondHandler, bases<XC::PrepHandler>, boost::noncopyable >("BoundaryCondHandler", no_init)
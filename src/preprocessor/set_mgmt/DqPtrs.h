@@ -55,6 +55,7 @@ namespace XC {
 template <class T>
 class DqPtrs: public CommandEntity, protected std::deque<T *>
   {
+    size_t modificationStamp; //!< incremented each time the contents change.
   public:
     typedef typename std::deque<T *> lst_ptr;
     typedef typename lst_ptr::const_iterator const_iterator;
@@ -99,7 +100,14 @@ class DqPtrs: public CommandEntity, protected std::deque<T *>
     const ID &getTags(void) const;
     template <class InputIterator>
     void insert(iterator pos, InputIterator f, InputIterator l)
-      { lst_ptr::insert(pos,f,l); }
+      {
+        lst_ptr::insert(pos,f,l);
+        modificationStamp++;
+      }
+    //! @brief Return a number that changes each time the contents
+    //! of the container change (objects added or removed).
+    inline size_t getModificationStamp(void) const
+      { return modificationStamp; }
 
     
     int sendTags(int posSz,int posDbTag,DbTagData &dt,CommParameters &cp);
@@ -110,24 +118,24 @@ class DqPtrs: public CommandEntity, protected std::deque<T *>
 //! @brief Constructor.
 template <class T>
 DqPtrs<T>::DqPtrs(CommandEntity *owr)
-  : CommandEntity(owr),lst_ptr() {}
+  : CommandEntity(owr),lst_ptr(), modificationStamp(0) {}
 
 //! @brief Copy constructor.
 template <class T>
 DqPtrs<T>::DqPtrs(const DqPtrs<T> &other)
-  : CommandEntity(other), lst_ptr(other)
+  : CommandEntity(other), lst_ptr(other), modificationStamp(0)
   {}
 
 //! @brief Copy from deque container.
 template <class T>
 DqPtrs<T>::DqPtrs(const std::deque<T *> &ts)
-  : CommandEntity(), lst_ptr(ts)
+  : CommandEntity(), lst_ptr(ts), modificationStamp(0)
   {}
 
 //! @brief Copy from set container.
 template <class T>
 DqPtrs<T>::DqPtrs(const std::set<const T *> &st)
-  : CommandEntity(), lst_ptr()
+  : CommandEntity(), lst_ptr(), modificationStamp(0)
   {
     typename std::set<const T *>::const_iterator k;
     k= st.begin();
@@ -141,6 +149,7 @@ DqPtrs<T> &DqPtrs<T>::operator=(const DqPtrs &other)
   {
     CommandEntity::operator=(other);
     lst_ptr::operator=(other);
+    modificationStamp++;
     return *this;
   }
 
@@ -165,7 +174,10 @@ void DqPtrs<T>::extend(const DqPtrs &other)
 //! @brief Clears out the list of pointers.
 template<class T>
 void DqPtrs<T>::clear(void)
-  { lst_ptr::clear(); }
+  {
+    lst_ptr::clear();
+    modificationStamp++;
+  }
 
 //! @brief Clears out the list of pointers and erases the properties of the object (if any).
 template<class T>
@@ -207,6 +219,7 @@ bool DqPtrs<T>::push_back(T *t)
         if(find(begin(),end(),t) == end()) //It's a new element.
           {
             lst_ptr::push_back(t);
+            modificationStamp++;
             retval= true;
           }
       }
@@ -225,6 +238,7 @@ bool DqPtrs<T>::push_front(T *t)
         if(find(begin(),end(),t) == end()) //New element.
           {
             lst_ptr::push_front(t);
+            modificationStamp++;
             retval= true;
           }
       }
@@ -27,6 +27,10 @@
 
 #include "DqPtrsElem.h"
 #include "domain/mesh/element/Element.h"
+#include "domain/mesh/element/Element1D.h"
+#include "domain/mesh/element/plane/shell/ShellMITC4Base.h"
+#include "utility/matrix/Matrix.h"
+#include "utility/matrix/Vector.h"
 #include "domain/mesh/element/utils/NodePtrsWithIDs.h"
 #include "preprocessor/multi_block_topology/trf/TrfGeom.h"
 #include "xc_utils/src/geom/d1/Polyline3d.h"
@@ -34,6 +38,9 @@
 #include "domain/mesh/MeshEdges.h"
 #include <boost/algorithm/string/find.hpp>
 #include "xc_utils/src/geom/d3/BND3d.h"
+#include "xc_utils/src/geom/pos_vec/Pos3d.h"
+#include "xc_utils/src/geom/pos_vec/Pos2d.h"
+#include "xc_utils/src/geom/d2/2d_polygons/Polygon2d.h"
 
 //! @brief Constructor.
 XC::DqPtrsElem::DqPtrsElem(CommandEntity *owr)
@@ -248,6 +255,130 @@ XC::DqPtrsElem XC::DqPtrsElem::pickElemsInside(const GeomObj3d &geomObj, const d
     return retval;    
   }
 
+//! @brief Return the elements (centroids) inside the box defined by the positions
+//! being passed as parameters (lower left and upper right corners). The
+//! search is done using the KD tree of the container (initial geometry).
+XC::DqPtrsElem XC::DqPtrsElem::pickElemsInBox(const Pos3d &pMin, const Pos3d &pMax) const
+  { return DqPtrsElem(getWithinBox(pMin,pMax)); }
+
+//! @brief Return the elements (centroids) whose distance to the position being
+//! passed as parameter is less or equal than r. The search is done using
+//! the KD tree of the container (initial geometry).
+XC::DqPtrsElem XC::DqPtrsElem::pickElemsWithinRadius(const Pos3d &center, const double &r) const
+  { return DqPtrsElem(getWithinRadius(center,r)); }
+
+//! @brief Return the elements (centroids) inside the orthogonal prism defined by a 2D
+//! polygon and the direction of its axis. The search is done using
+//! the KD tree of the container (initial geometry).
+//!
+//! @param plg: 2D polygon that defines the base of the prism. The vertices
+//!             of the polygon are defined in global coordinates in the
+//!             following way:
+//!             - for X-axis-prism: (y,z)
+//!             - for Y-axis-prism: (x,z)
+//!             - for Z-axis-prism: (x,y)
+//! @param prismAxis: axis of the prism (X, Y or Z).
+//! @param tol: tolerance.
+XC::DqPtrsElem XC::DqPtrsElem::pickElemsInOrthoPrism(const Polygon2d &plg, const std::string &prismAxis, const double &tol) const
+  {
+    DqPtrsElem retval;
+    Pos3d pMin, pMax;
+    if(get_ortho_prism_bounds(plg,prismAxis,tol,pMin,pMax))
+      {
+        const std::deque<Element *> candidates= getWithinBox(pMin,pMax);
+        for(std::deque<Element *>::const_iterator i= candidates.begin();i!=candidates.end();i++)
+          {
+            Element *e= (*i);
+            assert(e);
+            if(plg.In(get_ortho_prism_projection(e->getCenterOfMassPosition(true),prismAxis),tol))
+              retval.push_back(e);
+          }
+      }
+    return retval;
+  }
+
+//! @brief Return the coordinates of the element centroids in a
+//! python list of [x,y,z] lists (in the same order than the
+//! elements of the container).
+//!
+//! @param initialGeometry: if true use the initial geometry.
+boost::python::list XC::DqPtrsElem::getCentroidsCoordinatesPy(bool initialGeometry) const
+  {
+    boost::python::list retval;
+    for(const_iterator i= begin();i!=end();i++)
+      {
+        const Element *e= (*i);
+        assert(e);
+        const Pos3d p= e->getCenterOfMassPosition(initialGeometry);
+        boost::python::list row;
+        row.append(p.x()); row.append(p.y()); row.append(p.z());
+        retval.append(row);
+      }
+    return retval;
+  }
+
+//! @brief Append a uniform load (in global coordinates) to each of
+//! the elements of the container. The i-th row of the matrix contains
+//! the load vector for the i-th element; rows with all its components
+//! equal to zero are ignored.
+void XC::DqPtrsElem::vector2dUniformLoadsGlobal(const Matrix &loads)
+  {
+    const size_t numRows= loads.noRows();
+    if(numRows!=size())
+      std::cerr << getClassName() << "::" << __FUNCTION__
+                << "; number of load vectors: " << numRows
+                << " doesn't match the number of elements: "
+                << size() << std::endl;
+    size_t iRow= 0;
+    for(iterator i= begin();(i!=end()) && (iRow<numRows);i++,iRow++)
+      {
+        const Vector v= loads.getRow(iRow);
+        if(v.Norm2()==0.0) continue;
+        Element1D *e= dynamic_cast<Element1D *>(*i);
+        if(e)
+          e->vector2dUniformLoadGlobal(v);
+        else
+          std::cerr << getClassName() << "::" << __FUNCTION__
+                    << "; element: " << (*i)->getTag()
+                    << " is not an 1D element." << std::endl;
+      }
+  }
+
+//! @brief Append a uniform load (in global coordinates) to each of
+//! the elements of the container. The i-th row of the matrix contains
+//! the load vector for the i-th element; rows with all its components
+//! equal to zero are ignored.
+void XC::DqPtrsElem::vector3dUniformLoadsGlobal(const Matrix &loads)
+  {
+    const size_t numRows= loads.noRows();
+    if(numRows!=size())
+      std::cerr << getClassName() << "::" << __FUNCTION__
+                << "; number of load vectors: " << numRows
+                << " doesn't match the number of elements: "
+                << size() << std::endl;
+    size_t iRow= 0;
+    for(iterator i= begin();(i!=end()) && (iRow<numRows);i++,iRow++)
+      {
+        const Vector v= loads.getRow(iRow);
+        if(v.Norm2()==0.0) continue;
+        Element *e= (*i);
+        Element1D *e1d= dynamic_cast<Element1D *>(e);
+        if(e1d)
+          e1d->vector3dUniformLoadGlobal(v);
+        else
+          {
+            ShellMITC4Base *shell= dynamic_cast<ShellMITC4Base *>(e);
+            if(shell)
+              shell->vector3dUniformLoadGlobal(v);
+            else
+              std::cerr << getClassName() << "::" << __FUNCTION__
+                        << "; element: " << e->getTag()
+                        << " of type: " << e->getClassName()
+                        << " can't receive uniform loads." << std::endl;
+          }
+      }
+  }
+
 //! @brief Return the names of the materials.
 std::set<std::string> XC::DqPtrsElem::getMaterialNames(void) const
   {
@@ -36,9 +36,11 @@
 class Polyline3d;
 class GeomObj3d;
 class BND3d;
+class Polygon2d;
 
 namespace XC {
 class TrfGeom;
+class Matrix;
 
 //!  @ingroup Set
 //! 
@@ -63,11 +65,18 @@ class DqPtrsElem: public DqPtrsKDTree<Element,KDTreeElements>
 
     void calc_resisting_force(void);
 
+    boost::python::list getCentroidsCoordinatesPy(bool initialGeometry= true) const;
+    void vector2dUniformLoadsGlobal(const Matrix &);
+    void vector3dUniformLoadsGlobal(const Matrix &);
+
     Element *findElement(const int &);
     const Element *findElement(const int &) const;
     BND3d Bnd(const double &) const;    
     std::deque<Polyline3d> getContours(const double &factor= 0.0) const;
     DqPtrsElem pickElemsInside(const GeomObj3d &, const double &tol= 0.0);
+    DqPtrsElem pickElemsInBox(const Pos3d &, const Pos3d &) const;
+    DqPtrsElem pickElemsWithinRadius(const Pos3d &, const double &) const;
+    DqPtrsElem pickElemsInOrthoPrism(const Polygon2d &, const std::string &, const double &tol= 0.0) const;
     std::set<std::string> getMaterialNames(void) const;
     boost::python::list getMaterialNamesPy(void) const;
     std::set<std::string> getTypes(void) const;
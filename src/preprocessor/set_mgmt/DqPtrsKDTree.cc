@@ -26,3 +26,65 @@
 //----------------------------------------------------------------------------
 
 #include "DqPtrsKDTree.h"
+#include "xc_utils/src/geom/pos_vec/Pos2d.h"
+#include "xc_utils/src/geom/pos_vec/Pos3d.h"
+#include "xc_utils/src/geom/d2/2d_polygons/Polygon2d.h"
+#include <cfloat>
+
+//! @brief Computes the bounds of the box that contains the orthogonal
+//! prism defined by a 2D polygon and the direction of its axis.
+//!
+//! @param plg: 2D polygon that defines the base of the prism. The vertices
+//!             of the polygon are defined in global coordinates in the
+//!             following way:
+//!             - for X-axis-prism: (y,z)
+//!             - for Y-axis-prism: (x,z)
+//!             - for Z-axis-prism: (x,y)
+//! @param prismAxis: axis of the prism (X, Y or Z).
+//! @param tol: tolerance.
+//! @param pMin: lower left corner of the box (return value).
+//! @param pMax: upper right corner of the box (return value).
+bool XC::get_ortho_prism_bounds(const Polygon2d &plg,const std::string &prismAxis,const double &tol,Pos3d &pMin,Pos3d &pMax)
+  {
+    bool retval= true;
+    const double aMin= plg.GetXMin()-tol, aMax= plg.GetXMax()+tol;
+    const double bMin= plg.GetYMin()-tol, bMax= plg.GetYMax()+tol;
+    if((prismAxis=="X") || (prismAxis=="x"))
+      {
+        pMin= Pos3d(-DBL_MAX,aMin,bMin);
+        pMax= Pos3d(DBL_MAX,aMax,bMax);
+      }
+    else if((prismAxis=="Y") || (prismAxis=="y"))
+      {
+        pMin= Pos3d(aMin,-DBL_MAX,bMin);
+        pMax= Pos3d(aMax,DBL_MAX,bMax);
+      }
+    else if((prismAxis=="Z") || (prismAxis=="z"))
+      {
+        pMin= Pos3d(aMin,bMin,-DBL_MAX);
+        pMax= Pos3d(aMax,bMax,DBL_MAX);
+      }
+    else
+      {
+        std::cerr << __FUNCTION__ << "; wrong prism axis: '"
+                  << prismAxis << "'. Available values: X, Y, Z."
+                  << std::endl;
+        retval= false;
+      }
+    return retval;
+  }
+
+//! @brief Returns the projection of the position on the plane
+//! normal to the prism axis:
+//! - for X-axis-prism: (y,z)
+//! - for Y-axis-prism: (x,z)
+//! - for Z-axis-prism: (x,y)
+Pos2d XC::get_ortho_prism_projection(const Pos3d &p,const std::string &prismAxis)
+  {
+    if((prismAxis=="X") || (prismAxis=="x"))
+      return Pos2d(p.y(),p.z());
+    else if((prismAxis=="Y") || (prismAxis=="y"))
+      return Pos2d(p.x(),p.z());
+    else
+      return Pos2d(p.x(),p.y());
+  }
@@ -33,12 +33,17 @@
 #include "DqPtrs.h"
 #include <set>
 
+class Pos2d;
 class Pos3d;
 class Vector3d;
+class Polygon2d;
 
 namespace XC {
 class TrfGeom;
 
+bool get_ortho_prism_bounds(const Polygon2d &,const std::string &,const double &,Pos3d &,Pos3d &);
+Pos2d get_ortho_prism_projection(const Pos3d &,const std::string &);
+
 //!  @ingroup Set
 //! 
 //!  @brief Container with a KDTree.
@@ -66,10 +71,13 @@ class DqPtrsKDTree: public DqPtrs<T>
     //void extend_cond(const DqPtrsKDTree &,const std::string &cond);
     bool push_back(T *);
     bool push_front(T *);
+    void clear(void);
     void clearAll(void);
 
     T *getNearest(const Pos3d &p);
     const T *getNearest(const Pos3d &p) const;
+    std::deque<T *> getWithinBox(const Pos3d &, const Pos3d &) const;
+    std::deque<T *> getWithinRadius(const Pos3d &, const double &) const;
   };
 
 //! @brief Creates the KD tree.
@@ -158,6 +166,14 @@ bool XC::DqPtrsKDTree<T,KDTree>::push_front(T *t)
     return retval;
 }
 
+//! @brief Clears out the list of pointers and the KD tree.
+template <class T,class KDTree>
+void DqPtrsKDTree<T,KDTree>::clear(void)
+  {
+    DqPtrs<T>::clear();
+    kdtree.clear();
+  }
+
 //! @brief Clears out the list of pointers and erases the properties of the object (if any).
 template <class T,class KDTree>
 void DqPtrsKDTree<T,KDTree>::clearAll(void)
@@ -181,6 +197,33 @@ const T *DqPtrsKDTree<T,KDTree>::getNearest(const Pos3d &p) const
     return this_no_const->getNearest(p);
   }
 
+//! @brief Returns the objects inside the box defined by the
+//! positions being passed as parameters (lower left and upper
+//! right corners) using the KD tree.
+template <class T,class KDTree>
+std::deque<T *> DqPtrsKDTree<T,KDTree>::getWithinBox(const Pos3d &pMin, const Pos3d &pMax) const
+  {
+    std::deque<T *> retval;
+    typedef std::deque<const T *> dq_const;
+    const dq_const tmp= kdtree.getWithinBox(pMin,pMax);
+    for(typename dq_const::const_iterator i= tmp.begin();i!=tmp.end();i++)
+      retval.push_back(const_cast<T *>(*i));
+    return retval;
+  }
+
+//! @brief Returns the objects whose distance to the position
+//! being passed as parameter is less or equal than r using the KD tree.
+template <class T,class KDTree>
+std::deque<T *> DqPtrsKDTree<T,KDTree>::getWithinRadius(const Pos3d &center, const double &r) const
+  {
+    std::deque<T *> retval;
+    typedef std::deque<const T *> dq_const;
+    const dq_const tmp= kdtree.getWithinRadius(center,r);
+    for(typename dq_const::const_iterator i= tmp.begin();i!=tmp.end();i++)
+      retval.push_back(const_cast<T *>(*i));
+    return retval;
+  }
+
 //! @brief Return the union of both containers.
 template <class T,class KDTree>
 DqPtrsKDTree<T,KDTree> operator+(const DqPtrsKDTree<T,KDTree> &a,const DqPtrsKDTree<T,KDTree> &b)
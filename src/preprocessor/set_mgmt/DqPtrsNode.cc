@@ -32,6 +32,8 @@
 #include "xc_utils/src/geom/pos_vec/Pos3d.h"
 #include "xc_utils/src/geom/pos_vec/Vector3d.h"
 #include "xc_utils/src/geom/d3/BND3d.h"
+#include "xc_utils/src/geom/pos_vec/Pos2d.h"
+#include "xc_utils/src/geom/d2/2d_polygons/Polygon2d.h"
 
 //! @brief Constructor.
 XC::DqPtrsNode::DqPtrsNode(CommandEntity *owr)
@@ -210,6 +212,48 @@ XC::DqPtrsNode XC::DqPtrsNode::pickNodesInside(const GeomObj3d &geomObj, const d
     return retval;    
   }
 
+//! @brief Return the nodes inside the box defined by the positions
+//! being passed as parameters (lower left and upper right corners). The
+//! search is done using the KD tree of the container (initial geometry).
+XC::DqPtrsNode XC::DqPtrsNode::pickNodesInBox(const Pos3d &pMin, const Pos3d &pMax) const
+  { return DqPtrsNode(getWithinBox(pMin,pMax)); }
+
+//! @brief Return the nodes whose distance to the position being
+//! passed as parameter is less or equal than r. The search is done using
+//! the KD tree of the container (initial geometry).
+XC::DqPtrsNode XC::DqPtrsNode::pickNodesWithinRadius(const Pos3d &center, const double &r) const
+  { return DqPtrsNode(getWithinRadius(center,r)); }
+
+//! @brief Return the nodes inside the orthogonal prism defined by a 2D
+//! polygon and the direction of its axis. The search is done using
+//! the KD tree of the container (initial geometry).
+//!
+//! @param plg: 2D polygon that defines the base of the prism. The vertices
+//!             of the polygon are defined in global coordinates in the
+//!             following way:
+//!             - for X-axis-prism: (y,z)
+//!             - for Y-axis-prism: (x,z)
+//!             - for Z-axis-prism: (x,y)
+//! @param prismAxis: axis of the prism (X, Y or Z).
+//! @param tol: tolerance.
+XC::DqPtrsNode XC::DqPtrsNode::pickNodesInOrthoPrism(const Polygon2d &plg, const std::string &prismAxis, const double &tol) const
+  {
+    DqPtrsNode retval;
+    Pos3d pMin, pMax;
+    if(get_ortho_prism_bounds(plg,prismAxis,tol,pMin,pMax))
+      {
+        const std::deque<Node *> candidates= getWithinBox(pMin,pMax);
+        for(std::deque<Node *>::const_iterator i= candidates.begin();i!=candidates.end();i++)
+          {
+            Node *n= (*i);
+            assert(n);
+            if(plg.In(get_ortho_prism_projection(n->getInitialPosition3d(),prismAxis),tol))
+              retval.push_back(n);
+          }
+      }
+    return retval;
+  }
+
 //! @brief Return the nodes current position boundary.
 //!
 //! @param factor: scale factor for the current position
@@ -38,6 +38,7 @@ class Vector3d;
 class ExprAlgebra;
 class GeomObj3d;
 class BND3d;
+class Polygon2d;
 
 namespace XC {
 class TrfGeom;
@@ -65,6 +66,9 @@ class DqPtrsNode: public DqPtrsKDTree<Node,KDTreeNodes>
     bool InNodeTags(const ID &) const;
     std::set<int> getTags(void) const;
     DqPtrsNode pickNodesInside(const GeomObj3d &, const double &tol= 0.0);
+    DqPtrsNode pickNodesInBox(const Pos3d &, const Pos3d &) const;
+    DqPtrsNode pickNodesWithinRadius(const Pos3d &, const double &) const;
+    DqPtrsNode pickNodesInOrthoPrism(const Polygon2d &, const std::string &, const double &tol= 0.0) const;
     BND3d Bnd(const double &) const;
     Pos3d getCentroid(const double &) const;
 
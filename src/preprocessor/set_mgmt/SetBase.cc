@@ -37,6 +37,8 @@
 #include "domain/domain/Domain.h"
 #include "domain/mesh/element/Element.h"
 #include "domain/mesh/node/Node.h"
+#include "domain/mesh/element/utils/NodePtrsWithIDs.h"
+#include "xc_utils/src/geom/pos_vec/Pos3d.h"
 
 //! @brief Constructor.
 XC::SetBase::SetBase(const std::string &nmb,Preprocessor *md)
@@ -84,14 +86,11 @@ const XC::ID &XC::SetBase::getIdNodeTags(void) const
   {
     static ID retval;
     const std::set<int> tmp= getNodeTags();
-    if(!tmp.empty())
-      {
-        const size_t sz= tmp.size();
-	retval.resize(sz);
-        size_t conta= 0;
-        for(std::set<int>::const_iterator i= tmp.begin();i!=tmp.end();i++,conta++)
-          retval[conta]= *i;
-      }
+    const size_t sz= tmp.size();
+    retval.resize(sz);
+    size_t conta= 0;
+    for(std::set<int>::const_iterator i= tmp.begin();i!=tmp.end();i++,conta++)
+      retval[conta]= *i;
     return retval;
   }
 
@@ -227,4 +226,135 @@ void XC::SetBase::computeTributaryVolumes(bool initialGeometry) const
       std::cerr << "domain not set." << std::endl;
   }
 
+//! @brief Return the pointers to the elements of the set.
+std::vector<const XC::Element *> XC::SetBase::getElementPtrs(void) const
+  {
+    std::vector<const Element *> retval;
+    const std::set<int> tmp= getElementTags();
+    const Domain *dom= getPreprocessor()->getDomain();
+    if(dom)
+      {
+        retval.reserve(tmp.size());
+        for(std::set<int>::const_iterator i= tmp.begin();i!=tmp.end();i++)
+          {
+            const int &tag_elem= *i;
+            const Element *elem= dom->getElement(tag_elem);
+            if(elem)
+              retval.push_back(elem);
+            else
+	      std::cerr << getClassName() << "::" << __FUNCTION__
+                        << " element identified by: "
+                        << tag_elem << " not found." << std::endl;
+          }
+      }
+    else
+      std::cerr << "domain not set." << std::endl;
+    return retval;
+  }
+
+//! @brief Compute the tributary lengths (dim= 1), areas (dim= 2)
+//! or volumes (dim= 3) of the element nodes.
+void XC::SetBase::computeTributaries(const Element *elem,const int &dim,bool initialGeometry)
+  {
+    if(dim==1)
+      elem->computeTributaryLengths(initialGeometry);
+    else if(dim==2)
+      elem->computeTributaryAreas(initialGeometry);
+    else
+      elem->computeTributaryVolumes(initialGeometry);
+  }
+
+//! @brief Return a number that changes each time the nodes or the
+//! elements of the set change. The nodes and elements of this kind of
+//! set change only when the mesh changes (see Domain::hasDomainChanged)
+//! so it returns always the same value.
+size_t XC::SetBase::getMembershipStamp(void) const
+  { return 0; }
+
+//! @brief Return the tributary lengths (dim= 1), areas (dim= 2)
+//! or volumes (dim= 3) of the set nodes (sorted by tag).
+//!
+//! The values are computed in a single pass over the set elements.
+//! Those of the initial geometry are stored until the nodes or the
+//! elements of the set (see getMembershipStamp) or the mesh (nodes
+//! and elements added, removed or moved, see Domain::hasDomainChanged)
+//! change, so the check is made in constant time. If the coordinates
+//! of the nodes are modified directly clearTributaryCache must be
+//! called. The values of the current geometry depend on the
+//! displacements so they are always computed. The tributary values of
+//! the nodes are updated too (see Node::getTributary).
+//!
+//! @param dim: dimension of the tributary magnitude.
+//! @param initialGeometry: if true use the initial geometry of the
+//! elements, otherwise use the current one.
+const XC::Vector &XC::SetBase::getTributaries(const int &dim,bool initialGeometry) const
+  {
+    TributaryCache &cache= tributaryCache[2*dim+(initialGeometry ? 1 : 0)];
+    const size_t setStamp= getMembershipStamp();
+    Domain *dom= const_cast<Domain *>(getPreprocessor()->getDomain());
+    const int domainStamp= (dom ? dom->hasDomainChanged() : -1);
+    if(!initialGeometry || (cache.domainStamp<0) || (cache.setStamp!=setStamp) || (cache.domainStamp!=domainStamp))
+      {
+        const std::vector<const Element *> elems= getElementPtrs();
+        cache.nodes.clear();
+        for(std::vector<const Element *>::const_iterator i= elems.begin();i!=elems.end();i++)
+          {
+            const NodePtrsWithIDs &elemNodes= (*i)->getNodePtrs();
+            for(NodePtrsWithIDs::const_iterator j= elemNodes.begin();j!=elemNodes.end();j++)
+              if(*j)
+                cache.nodes.push_back(*j);
+          }
+        for(std::vector<const Node *>::const_iterator j= cache.nodes.begin();j!=cache.nodes.end();j++)
+          (*j)->resetTributary();
+        for(std::vector<const Element *>::const_iterator i= elems.begin();i!=elems.end();i++)
+          computeTributaries(*i,dim,initialGeometry);
+        const size_t sz= cache.nodes.size();
+        cache.nodeValues.resize(sz);
+        std::map<int,double> nodeValues;
+        for(size_t j= 0;j<sz;j++)
+          {
+            cache.nodeValues[j]= cache.nodes[j]->getTributary();
+            nodeValues[cache.nodes[j]->getTag()]= cache.nodeValues[j];
+          }
+        // Nodes of the set (their tags sort the returned values).
+        const std::set<int> tags= getNodeTags();
+        cache.values.resize(tags.size());
+        size_t conta= 0;
+        for(std::set<int>::const_iterator i= tags.begin();i!=tags.end();i++,conta++)
+          {
+            std::map<int,double>::const_iterator k= nodeValues.find(*i);
+            cache.values[conta]= ((k!=nodeValues.end()) ? k->second : 0.0);
+          }
+        cache.setStamp= setStamp;
+        cache.domainStamp= domainStamp;
+      }
+    else // nothing changed, restore the values of the nodes.
+      {
+        const size_t sz= cache.nodes.size();
+        for(size_t j= 0;j<sz;j++)
+          {
+            cache.nodes[j]->resetTributary();
+            cache.nodes[j]->addTributary(cache.nodeValues[j]);
+          }
+      }
+    return cache.values;
+  }
+
+//! @brief Return the tributary lengths of the set nodes sorted by tag
+//! (see getTributaries).
+const XC::Vector &XC::SetBase::getTributaryLengths(bool initialGeometry) const
+  { return getTributaries(1,initialGeometry); }
+
+//! @brief Return the tributary areas of the set nodes sorted by tag
+//! (see getTributaries).
+const XC::Vector &XC::SetBase::getTributaryAreas(bool initialGeometry) const
+  { return getTributaries(2,initialGeometry); }
+
+//! @brief Return the tributary volumes of the set nodes sorted by tag
+//! (see getTributaries).
+const XC::Vector &XC::SetBase::getTributaryVolumes(bool initialGeometry) const
+  { return getTributaries(3,initialGeometry); }
 
+//! @brief Forget the memoized tributary values.
+void XC::SetBase::clearTributaryCache(void) const
+  { tributaryCache.clear(); }
@@ -36,9 +36,13 @@
 #include "preprocessor/EntMdlrBase.h"
 #include "preprocessor/MeshingParams.h"
 #include "utility/matrix/Vector.h"
+#include <map>
+#include <vector>
 
 namespace XC {
 class SFreedom_Constraint;
+class Element;
+class Node;
 class Face;
 class Body;
 class UniformGrid;
@@ -49,6 +53,24 @@ class UniformGrid;
 class SetBase: public EntMdlrBase
   {
     Vector color;
+
+    //! @brief Tributary lengths, areas or volumes computed for the
+    //! geometry of the set elements.
+    struct TributaryCache
+      {
+        size_t setStamp; //!< membership stamp of the set when the values were computed.
+        int domainStamp; //!< domain stamp when the values were computed.
+        std::vector<const Node *> nodes; //!< element nodes.
+        std::vector<double> nodeValues; //!< tributary values of the element nodes.
+        Vector values; //!< tributary values of the set nodes.
+        TributaryCache(void)
+          : setStamp(0), domainStamp(-1) {}
+      };
+    mutable std::map<int,TributaryCache> tributaryCache; //!< memoized tributary values.
+
+    std::vector<const Element *> getElementPtrs(void) const;
+    static void computeTributaries(const Element *,const int &,bool);
+    const Vector &getTributaries(const int &,bool) const;
   public:
     SetBase(const std::string &nmb="",Preprocessor *preprocessor= nullptr);
     inline virtual ~SetBase(void)
@@ -61,6 +83,7 @@ class SetBase: public EntMdlrBase
 
     virtual std::set<int> getNodeTags(void) const= 0;
     virtual std::set<int> getElementTags(void) const= 0;
+    virtual size_t getMembershipStamp(void) const;
     const ID &getIdNodeTags(void) const;
     const ID &getIdElementTags(void) const;
 
@@ -77,6 +100,10 @@ class SetBase: public EntMdlrBase
     void computeTributaryLengths(bool initialGeometry= true) const;
     void computeTributaryAreas(bool initialGeometry= true) const;
     void computeTributaryVolumes(bool initialGeometry= true) const;
+    const Vector &getTributaryLengths(bool initialGeometry= true) const;
+    const Vector &getTributaryAreas(bool initialGeometry= true) const;
+    const Vector &getTributaryVolumes(bool initialGeometry= true) const;
+    void clearTributaryCache(void) const;
 
     virtual size_t getNumberOfNodes(void) const= 0;
     virtual size_t getNumberOfElements(void) const= 0;
@@ -414,6 +414,11 @@ const XC::Node *XC::SetMeshComp::getNearestNode(const Pos3d &p) const
 std::set<int> XC::SetMeshComp::getElementTags(void) const
   { return elements.getTags(); }
 
+//! @brief Return a number that changes each time nodes or elements
+//! are added to (or removed from) the set.
+size_t XC::SetMeshComp::getMembershipStamp(void) const
+  { return nodes.getModificationStamp()+elements.getModificationStamp(); }
+
 //! @brief Returns the element closest to the point being passed as parameter.
 XC::Element *XC::SetMeshComp::getNearestElement(const Pos3d &p)
   { return elements.getNearest(p); }
@@ -186,6 +186,7 @@ class SetMeshComp: public SetBase
     std::set<int> getNodeTags(void) const;
     std::set<int> getElementTags(void) const;
     std::set<int> getConstraintTags(void) const;
+    size_t getMembershipStamp(void) const;
     Node *getNearestNode(const Pos3d &p);
     const Node *getNearestNode(const Pos3d &p) const;
 
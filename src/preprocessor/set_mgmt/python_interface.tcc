@@ -40,6 +40,10 @@ class_<XC::DqPtrsNode, bases<dq_ptrs_node> >("DqPtrsNode",no_init)
   .add_property("getNumDeadNodes", &XC::DqPtrsNode::getNumDeadNodes)
   .def("getNearestNode",make_function(getNearestNodeDqPtrs, return_internal_reference<>() ),"Returns nearest node.")
   .def("pickNodesInside",&XC::DqPtrsNode::pickNodesInside,"pickNodesInside(geomObj,tol) return the nodes inside the geometric object.")
+  .def("pickNodesInBox",&XC::DqPtrsNode::pickNodesInBox,"pickNodesInBox(pMin,pMax) return the nodes inside the box defined by the two corners (uses the container KD tree).")
+  .def("pickNodesWithinRadius",&XC::DqPtrsNode::pickNodesWithinRadius,"pickNodesWithinRadius(center,r) return the nodes whose distance to the center is not greater than r (uses the container KD tree).")
+  .def("pickNodesInOrthoPrism",&XC::DqPtrsNode::pickNodesInOrthoPrism,"pickNodesInOrthoPrism(polygon2d,prismAxis,tol) return the nodes inside the orthogonal prism defined by the 2D polygon and the axis ('X','Y' or 'Z') (uses the container KD tree).")
+  .def("clear",&XC::DqPtrsNode::clear,"Removes all items.")
   .def("getBnd", &XC::DqPtrsNode::Bnd, "Returns nodes boundary.")
   .def("getCentroid", &XC::DqPtrsNode::getCentroid, "Returns nodes centroid.")
   .def(self += self)
@@ -69,11 +73,18 @@ class_<XC::DqPtrsElem, bases<dq_ptrs_element> >("DqPtrsElem",no_init)
   .def("getBnd", &XC::DqPtrsElem::Bnd, "Returns elements boundary.")
   .def("getContours",&XC::DqPtrsElem::getContours,"Returns contour(s) from the element set in the form of closed 3D polylines.")
   .def("pickElemsInside",&XC::DqPtrsElem::pickElemsInside,"pickElemsInside(geomObj,tol) return the elements inside the geometric object.") 
+  .def("pickElemsInBox",&XC::DqPtrsElem::pickElemsInBox,"pickElemsInBox(pMin,pMax) return the elements whose centroid is inside the box defined by the two corners (uses the container KD tree).")
+  .def("pickElemsWithinRadius",&XC::DqPtrsElem::pickElemsWithinRadius,"pickElemsWithinRadius(center,r) return the elements whose centroid distance to the center is not greater than r (uses the container KD tree).")
+  .def("pickElemsInOrthoPrism",&XC::DqPtrsElem::pickElemsInOrthoPrism,"pickElemsInOrthoPrism(polygon2d,prismAxis,tol) return the elements whose centroid is inside the orthogonal prism defined by the 2D polygon and the axis ('X','Y' or 'Z') (uses the container KD tree).")
+  .def("clear",&XC::DqPtrsElem::clear,"Removes all items.")
   .def("pickElemsOfType",&XC::DqPtrsElem::pickElemsOfType,"pickElemsOfType(typeName) return the elements whose type containts the string.")
   .def("pickElemsOfDimension",&XC::DqPtrsElem::pickElemsOfDimension,"pickElemsOfDimension(dim) return the elements whose dimension equals the argument.")
   .def("getTypes",&XC::DqPtrsElem::getTypesPy,"getElementTypes() return a list with the element types in the container.")
   .def("getMaterials",&XC::DqPtrsElem::getMaterialNamesPy,"getElementMaterials() return a list with the names of the element materials in the container.")
   .def("pickElemsOfMaterial",&XC::DqPtrsElem::pickElemsOfMaterial,"pickElemsOfMaterial(materialName) return the elements that have that material.")
+  .def("getCentroidsCoordinates",&XC::DqPtrsElem::getCentroidsCoordinatesPy,"getCentroidsCoordinates(initialGeometry) return a list with the [x,y,z] coordinates of the element centroids.")
+  .def("vector2dUniformLoadsGlobal",&XC::DqPtrsElem::vector2dUniformLoadsGlobal,"vector2dUniformLoadsGlobal(loads) append to each element the uniform load in the corresponding row of the matrix (global coordinates).")
+  .def("vector3dUniformLoadsGlobal",&XC::DqPtrsElem::vector3dUniformLoadsGlobal,"vector3dUniformLoadsGlobal(loads) append to each element the uniform load in the corresponding row of the matrix (global coordinates).")
   .def(self += self)
   .def(self + self)
   .def(self - self)
@@ -24,6 +24,7 @@
 
 #include "FEProblem.h"
 #include "python_interface.h"
+#include "reliability/analysis/randomNumber/Mt19937RandGenerator.h"
 
 void export_utility(void);
 void export_material_base(void);
@@ -78,6 +79,9 @@ BOOST_PYTHON_MODULE(xc)
 
 #include "post_process/python_interface.tcc"
 
+//Expose random number generators (sampling analysis).
+#include "reliability/analysis/randomNumber/python_interface.tcc"
+
     XC::Domain *(XC::FEProblem::*getDomainRef)(void)= &XC::FEProblem::getDomain;
     XC::Preprocessor &(XC::FEProblem::*getPreprocessorRef)(void)= &XC::FEProblem::getPreprocessor;
     XC::ProcSolu &(XC::FEProblem::*getSoluProcRef)(void)= &XC::FEProblem::getSoluProc;
@@ -0,0 +1,84 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//Mt19937RandGenerator.cpp
+
+#include "reliability/analysis/randomNumber/Mt19937RandGenerator.h"
+#include <reliability/domain/distributions/NormalRV.h>
+
+//! @brief Constructor.
+XC::Mt19937RandGenerator::Mt19937RandGenerator(int s)
+  :RandomNumberGenerator(), generator(s), generatedNumbers(), seed(s) {}
+
+//! @brief Returns a uniform random number in the open interval (0,1).
+//!
+//! The conversion is done here (instead of using the standard
+//! distributions) so the sequence doesn't depend on the library
+//! implementation.
+double XC::Mt19937RandGenerator::getUniform(void)
+  { return (static_cast<double>(generator())+0.5)/4294967296.0; }
+
+//! @brief Generates n uniform random numbers between lower and upper.
+int XC::Mt19937RandGenerator::generate_nIndependentUniformNumbers(int n, double lower, double upper, int seedIn)
+  {
+    if(seedIn!=0)
+      {
+        generator.seed(seedIn);
+        seed= seedIn;
+      }
+    generatedNumbers.resize(n);
+    for(int j=0; j<n; j++)
+      generatedNumbers(j)= (upper-lower)*getUniform() + lower;
+    return 0;
+  }
+
+//! @brief Generates n standard normal random numbers.
+int XC::Mt19937RandGenerator::generate_nIndependentStdNormalNumbers(int n, int seedIn)
+  {
+    if(seedIn!=0)
+      {
+        generator.seed(seedIn);
+        seed= seedIn;
+      }
+    NormalRV aStdNormRV(1,0.0,1.0,0.0);
+    generatedNumbers.resize(n);
+    for(int j=0; j<n; j++)
+      generatedNumbers(j)= aStdNormRV.getInverseCDFvalue(getUniform());
+    return 0;
+  }
+
+//! @brief Returns the generated numbers.
+const XC::Vector &XC::Mt19937RandGenerator::getGeneratedNumbers(void) const
+  { return generatedNumbers; }
+
+//! @brief Returns the seed.
+int XC::Mt19937RandGenerator::getSeed()
+  { return seed; }
+
+//! @brief Seeds the generator from both the seed and the stream index
+//! so the streams corresponding to different indexes are independent.
+int XC::Mt19937RandGenerator::setStream(int s, int streamIndex)
+  {
+    seed= s;
+    std::seed_seq seq{s, streamIndex};
+    generator.seed(seq);
+    return 0;
+  }
@@ -0,0 +1,57 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//Mt19937RandGenerator.h
+
+#ifndef Mt19937RandGenerator_h
+#define Mt19937RandGenerator_h
+
+#include "reliability/analysis/randomNumber/RandomNumberGenerator.h"
+#include <random>
+
+namespace XC {
+//! @brief Random number generator based on the Mersenne twister
+//! (std::mt19937).
+//!
+//! Unlike CStdLibRandGenerator it doesn't use a global state and
+//! it supports independent streams (see setStream) so the numbers
+//! used in a realization depend only on the seed and the realization
+//! index.
+class Mt19937RandGenerator: public RandomNumberGenerator
+  {
+  private:
+    std::mt19937 generator;
+    Vector generatedNumbers;
+    int seed;
+
+    double getUniform(void);
+  public:
+    Mt19937RandGenerator(int seed= 1);
+
+    int generate_nIndependentStdNormalNumbers(int n, int seed=0);
+    int generate_nIndependentUniformNumbers(int n, double lower, double upper, int seed=0);
+    const Vector &getGeneratedNumbers(void) const;
+    int getSeed();
+    int setStream(int seed, int streamIndex);
+  };
+} // end of XC namespace
+
+#endif
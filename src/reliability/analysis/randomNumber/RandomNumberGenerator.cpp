@@ -62,6 +62,13 @@
 //! @brief Constructor.
 XC::RandomNumberGenerator::RandomNumberGenerator(){}
 
+//! @brief Selects the stream of random numbers identified by
+//! (seed, streamIndex), so that the numbers generated next don't
+//! depend on the ones generated before. Returns -1 if the generator
+//! doesn't support independent streams.
+int XC::RandomNumberGenerator::setStream(int seed, int streamIndex)
+  { return -1; }
+
 
 
 
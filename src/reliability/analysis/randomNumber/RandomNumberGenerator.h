@@ -68,11 +68,13 @@ class RandomNumberGenerator
   {
   public:
     RandomNumberGenerator();
+    virtual ~RandomNumberGenerator(void) {}
 
     virtual int generate_nIndependentStdNormalNumbers(int n, int seed=0) =0;
     virtual int generate_nIndependentUniformNumbers(int n, double lower, double upper, int seed=0) =0;
     virtual const Vector &getGeneratedNumbers() const=0;
     virtual int getSeed() =0;
+    virtual int setStream(int seed, int streamIndex);
   };
 } // end of XC namespace
 
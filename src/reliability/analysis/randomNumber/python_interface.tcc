@@ -0,0 +1,33 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//python_interface.tcc
+
+class_<XC::RandomNumberGenerator, boost::noncopyable >("RandomNumberGenerator", no_init)
+  .def("generate_nIndependentStdNormalNumbers", &XC::RandomNumberGenerator::generate_nIndependentStdNormalNumbers,"generate_nIndependentStdNormalNumbers(n, seed): generate n standard normal random numbers (if seed is not zero the generator is seeded with it first).")
+  .def("generate_nIndependentUniformNumbers", &XC::RandomNumberGenerator::generate_nIndependentUniformNumbers,"generate_nIndependentUniformNumbers(n, lower, upper, seed): generate n uniform random numbers between lower and upper (if seed is not zero the generator is seeded with it first).")
+  .def("getGeneratedNumbers", make_function(&XC::RandomNumberGenerator::getGeneratedNumbers, return_value_policy<copy_const_reference>() ),"Return the numbers generated by the last call.")
+  .add_property("seed", &XC::RandomNumberGenerator::getSeed,"Return the seed.")
+  .def("setStream", &XC::RandomNumberGenerator::setStream,"setStream(seed, streamIndex): select the stream of random numbers identified by (seed, streamIndex). Return -1 if the generator doesn't support independent streams.")
+  ;
+
+class_<XC::Mt19937RandGenerator, bases<XC::RandomNumberGenerator>, boost::noncopyable >("Mt19937RandGenerator", init<optional<int> >())
+  ;
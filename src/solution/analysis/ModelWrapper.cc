@@ -307,3 +307,26 @@ bool XC::ModelWrapper::CheckPointers(void)
       }
     return true;
   }
+
+//! @brief Staged construction: if true the DOFs of the dead nodes are
+//! masked by the analysis model instead of being constrained (i.e. by
+//! a node locker), so killing or reviving elements doesn't require
+//! renumbering the DOFs and resizing the system of equations.
+void XC::ModelWrapper::setMaskDeadNodes(const bool &b)
+  {
+    if(theModel)
+      theModel->setMaskDeadNodes(b);
+    else
+      std::cerr << getClassName() << "::" << __FUNCTION__
+                << "; analysis model not set." << std::endl;
+  }
+
+//! @brief Return true if the DOFs of the dead nodes are masked
+//! (staged construction).
+bool XC::ModelWrapper::getMaskDeadNodes(void) const
+  {
+    bool retval= false;
+    if(theModel)
+      retval= theModel->getMaskDeadNodes();
+    return retval;
+  }
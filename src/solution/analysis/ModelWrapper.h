@@ -121,6 +121,9 @@ class ModelWrapper: public CommandEntity
     DOF_Numberer &newNumberer(const std::string &);
     ConstraintHandler &newConstraintHandler(const std::string &);
 
+    void setMaskDeadNodes(const bool &);
+    bool getMaskDeadNodes(void) const;
+
     void clearAll(void);
   };
 
@@ -68,31 +68,45 @@
 #include <solution/analysis/analysis/StaticAnalysis.h>
 #include <solution/analysis/integrator/StaticIntegrator.h>
 #include <solution/system_of_eqn/linearSOE/LinearSOE.h>
+#include "domain/domain/Domain.h"
 #include <utility/matrix/Vector.h>
 #include <utility/Timer.h>
+#include <cmath>
+#include <algorithm>
 
 //! @brief Constructor
 XC::Linear::Linear(AnalysisAggregation *owr)
-  :EquiSolnAlgo(owr,EquiALGORITHM_TAGS_Linear) {}
+  :EquiSolnAlgo(owr,EquiALGORITHM_TAGS_Linear), factorOnce(false),
+   factoredDt(0.0), factoredSOE(nullptr), factoredMaskStamp(0), numFactorizations(0),
+   maxNumCorrections(0), correctionTol(1e-8), numCorrections(0) {}
 
 XC::SolutionAlgorithm *XC::Linear::getCopy(void) const
   { return new Linear(*this); }
 
-//! @brief Performs the linear solution algorithm.
-int XC::Linear::resuelve(void)
+//! @brief Return true if the tangent must be formed (and factored)
+//! again, i.e. if factorOnce is false, there is no previous factorization
+//! or the time increment or the masked DOFs (dead nodes in staged
+//! construction) have changed since it was obtained.
+//!
+//! @param theSOE: system of equations.
+//! @param dt: time increment of the current step.
+bool XC::Linear::tangentMustBeFormed(const LinearSOE *theSOE,const double &dt) const
   {
-    AnalysisModel *theAnalysisModel = getAnalysisModelPtr();
-    LinearSOE *theSOE = getLinearSOEPtr();
-    IncrementalIntegrator *theIncIntegrator= getIncrementalIntegratorPtr();
-
-    if((!theAnalysisModel) || (!theIncIntegrator) || (!theSOE))
+    bool retval= true;
+    const AnalysisModel *theModel= getAnalysisModelPtr();
+    const int maskStamp= (theModel ? theModel->getMaskStamp() : 0);
+    if(factorOnce && (theSOE==factoredSOE) && theSOE->isFactored() && (maskStamp==factoredMaskStamp))
       {
-        std::cerr << getClassName() << "::" << __FUNCTION__
-                  << "; WARNING undefined analysis model,"
-                  << " integrator or system of equations.\n";
-        return -5;
+        const double tol= 1e-8*std::max(std::abs(dt),std::abs(factoredDt));
+        retval= (std::abs(dt-factoredDt)>tol);
       }
+    return retval;
+  }
 
+//! @brief Form (and mark as not factored yet) the tangent matrix.
+int XC::Linear::formTangent(IncrementalIntegrator *theIncIntegrator)
+  {
+    factoredSOE= nullptr;
     if(theIncIntegrator->formTangent()<0) //Builds tangent stiffness matrix.
       {
         std::cerr << getClassName() << "::" << __FUNCTION__
@@ -100,7 +114,18 @@ int XC::Linear::resuelve(void)
                   << " failed in formTangent().\n";
         return -1;
       }
+    numFactorizations++;
+    return 0;
+  }
 
+//! @brief Form the unbalance, solve for the increment of the
+//! response and update the response with it.
+//!
+//! @param theIncIntegrator: integrator.
+//! @param theSOE: system of equations.
+//! @param dt: time increment of the current step.
+int XC::Linear::solveIncrement(IncrementalIntegrator *theIncIntegrator,LinearSOE *theSOE,const double &dt)
+  {
     if(theIncIntegrator->formUnbalance()<0) //Builds load vector.
       {
         std::cerr << getClassName() << "::" << __FUNCTION__
@@ -114,8 +139,16 @@ int XC::Linear::resuelve(void)
         std::cerr << getClassName() << "::" << __FUNCTION__
                   << "; WARNING the " << theSOE->getClassName()
                   << " failed in solve()\n";        
+        factoredSOE= nullptr;
         return -3;
       }
+    if(factorOnce && !factoredSOE)
+      {
+        factoredSOE= theSOE;
+        factoredDt= dt;
+        const AnalysisModel *theModel= getAnalysisModelPtr();
+        factoredMaskStamp= (theModel ? theModel->getMaskStamp() : 0);
+      }
 
     const Vector &deltaU = theSOE->getX(); //Gets the displacement vector.
 
@@ -128,6 +161,76 @@ int XC::Linear::resuelve(void)
     return 0;
   }
 
+//! @brief Correct the solution obtained with a reused factorization
+//! whose model has been modified since (resized members, killed
+//! elements, modified springs,...).
+//!
+//! The unbalance of the modified model is solved with the reused
+//! factorization until the norm of the correction is smaller than
+//! correctionTol times the norm of the increment of the step. If the
+//! corrections don't decrease or the maximum number of corrections is
+//! reached (the modification is too large) the tangent is formed and
+//! factored again and the unbalance is solved with it.
+//!
+//! @param theIncIntegrator: integrator.
+//! @param theSOE: system of equations.
+//! @param dt: time increment of the current step.
+int XC::Linear::correct(IncrementalIntegrator *theIncIntegrator,LinearSOE *theSOE,const double &dt)
+  {
+    Vector deltaU(theSOE->getX()); // increment of the step.
+    double prevNorm= deltaU.Norm();
+    for(int i= 0;i<maxNumCorrections;i++)
+      {
+        const int res= solveIncrement(theIncIntegrator,theSOE,dt);
+        if(res<0)
+          return res;
+        numCorrections++;
+        const Vector &dU= theSOE->getX();
+        deltaU+= dU;
+        const double norm= dU.Norm();
+        if(norm<=correctionTol*deltaU.Norm()) // converged.
+          return 0;
+        if(norm>=prevNorm) // diverging.
+          break;
+        prevNorm= norm;
+      }
+    // Modification too large: factor the tangent of the modified model.
+    const int res= formTangent(theIncIntegrator);
+    if(res<0)
+      return res;
+    return solveIncrement(theIncIntegrator,theSOE,dt);
+  }
+
+//! @brief Performs the linear solution algorithm.
+int XC::Linear::resuelve(void)
+  {
+    AnalysisModel *theAnalysisModel = getAnalysisModelPtr();
+    LinearSOE *theSOE = getLinearSOEPtr();
+    IncrementalIntegrator *theIncIntegrator= getIncrementalIntegratorPtr();
+
+    if((!theAnalysisModel) || (!theIncIntegrator) || (!theSOE))
+      {
+        std::cerr << getClassName() << "::" << __FUNCTION__
+                  << "; WARNING undefined analysis model,"
+                  << " integrator or system of equations.\n";
+        return -5;
+      }
+
+    const Domain *theDomain= get_domain_ptr();
+    const double dt= (theDomain ? theDomain->getTimeTracker().getDt() : 0.0);
+    const bool reused= !tangentMustBeFormed(theSOE,dt);
+    if(!reused)
+      {
+        const int res= formTangent(theIncIntegrator);
+        if(res<0)
+          return res;
+      }
+    int retval= solveIncrement(theIncIntegrator,theSOE,dt);
+    if((retval==0) && reused && (maxNumCorrections>0))
+      retval= correct(theIncIntegrator,theSOE,dt);
+    return retval;
+  }
+
 //! @brief Performs the linear solution algorithm.
 //!
 //! This method performs the linear solution algorithm:
@@ -146,6 +249,13 @@ int XC::Linear::resuelve(void)
 //! method stops at that routine, none of the subsequent operations are
 //! invoked. A \f$-5\f$ is returned if any one of the links has not been
 //! setup.
+//!
+//! If factorOnce is true the calls to formTangent() are skipped while
+//! the system of equations keeps the factorization obtained in a
+//! previous step with the same time increment. If maxNumCorrections
+//! is greater than zero, the solution obtained with a reused
+//! factorization is corrected to take into account the modifications
+//! of the model (see correct).
 int XC::Linear::solveCurrentStep(void)
   {
     // set up some pointers and check they are valid
@@ -153,6 +263,56 @@ int XC::Linear::solveCurrentStep(void)
     return resuelve();
   }
 
+//! @brief Forget the factored tangent so it is formed again
+//! in the next step (the model has changed).
+int XC::Linear::domainChanged(void)
+  {
+    factoredSOE= nullptr;
+    return EquiSolnAlgo::domainChanged();
+  }
+
+//! @brief Return true if the factored tangent is reused between steps.
+bool XC::Linear::getFactorOnce(void) const
+  { return factorOnce; }
+
+//! @brief If true, the tangent is formed and factored only when needed
+//! (first step, time increment change or domain change) and reused
+//! in the rest of the steps. Use it only with linear models.
+void XC::Linear::setFactorOnce(const bool &b)
+  {
+    factorOnce= b;
+    factoredSOE= nullptr;
+  }
+
+//! @brief Return the number of times the tangent has been formed.
+int XC::Linear::getNumFactorizations(void) const
+  { return numFactorizations; }
+
+//! @brief Return the maximum number of corrections made with a
+//! reused factorization before forming the tangent again.
+int XC::Linear::getMaxNumCorrections(void) const
+  { return maxNumCorrections; }
+
+//! @brief Set the maximum number of corrections made with a reused
+//! factorization before forming the tangent again (if zero the solution
+//! obtained with the reused factorization is not corrected).
+void XC::Linear::setMaxNumCorrections(const int &n)
+  { maxNumCorrections= n; }
+
+//! @brief Return the tolerance for the corrections (relative to
+//! the norm of the increment of the step).
+const double &XC::Linear::getCorrectionTol(void) const
+  { return correctionTol; }
+
+//! @brief Set the tolerance for the corrections (relative to
+//! the norm of the increment of the step).
+void XC::Linear::setCorrectionTol(const double &tol)
+  { correctionTol= tol; }
+
+//! @brief Return the number of corrections made with reused factorizations.
+int XC::Linear::getNumCorrections(void) const
+  { return numCorrections; }
+
 //! @brief Sets the convergence test to use in the analysis.
 int XC::Linear::setConvergenceTest(ConvergenceTest *theNewTest)
   { return 0; }
@@ -93,8 +93,37 @@ namespace XC {
 //! \f$U = U_{a} + \Delta U\f$.
 //! To start the iteration \f$U_a = U_{trial}\f$, i.e. the current trial
 //! response quantities are chosen as approximate solution quantities.
+//!
+//! If factorOnce is true the algorithm assumes that the (effective)
+//! tangent matrix doesn't change between steps (linear model with a
+//! constant time step), so it is formed and factored only once and
+//! the following steps only form the right hand side and make the
+//! forward and back substitution. The matrix is formed again
+//! if the time step changes, the domain changes, the DOFs masked by
+//! the analysis model change (staged construction) or the system of
+//! equations has lost its factorization.
+//!
+//! When the model is modified without changing the domain (members
+//! resized, elements killed, spring stiffness modified,...) the
+//! solution obtained with the reused factorization can be corrected
+//! iteratively (maxNumCorrections > 0) so the factorization of the
+//! reference model serves for small modifications of it. If the
+//! modification is too large, the tangent is formed and factored again.
 class Linear: public EquiSolnAlgo
   {
+    bool factorOnce; //!< if true, reuse the factored tangent when possible.
+    double factoredDt; //!< time increment used to form the factored tangent.
+    const LinearSOE *factoredSOE; //!< system that holds the factored tangent.
+    int factoredMaskStamp; //!< masked DOFs stamp of the factored tangent.
+    int numFactorizations; //!< number of times the tangent has been formed.
+    int maxNumCorrections; //!< maximum number of corrections with a reused factorization.
+    double correctionTol; //!< relative tolerance for the corrections.
+    int numCorrections; //!< number of corrections made.
+
+    bool tangentMustBeFormed(const LinearSOE *,const double &) const;
+    int formTangent(IncrementalIntegrator *);
+    int solveIncrement(IncrementalIntegrator *,LinearSOE *,const double &);
+    int correct(IncrementalIntegrator *,LinearSOE *,const double &);
     int resuelve();
   protected:
     friend class AnalysisAggregation;
@@ -105,6 +134,16 @@ class Linear: public EquiSolnAlgo
 
     int solveCurrentStep(void);
     int setConvergenceTest(ConvergenceTest *theNewTest);
+    int domainChanged(void);
+
+    bool getFactorOnce(void) const;
+    void setFactorOnce(const bool &);
+    int getNumFactorizations(void) const;
+    int getMaxNumCorrections(void) const;
+    void setMaxNumCorrections(const int &);
+    const double &getCorrectionTol(void) const;
+    void setCorrectionTol(const double &);
+    int getNumCorrections(void) const;
     
     virtual int sendSelf(CommParameters &);
     virtual int recvSelf(const CommParameters &);
@@ -33,7 +33,13 @@ class_<XC::Broyden, bases<XC::BFBRoydenBase>, boost::noncopyable >("Broyden", no
 
 class_<XC::KrylovNewton, bases<XC::EquiSolnAlgo>, boost::noncopyable >("KrylovNewton", no_init);
 
-class_<XC::Linear, bases<XC::EquiSolnAlgo>, boost::noncopyable >("Linear", no_init);
+class_<XC::Linear, bases<XC::EquiSolnAlgo>, boost::noncopyable >("Linear", no_init)
+  .add_property("factorOnce", &XC::Linear::getFactorOnce, &XC::Linear::setFactorOnce,"If true, form and factor the tangent only when the time increment or the domain changes (linear models only).")
+  .add_property("numFactorizations", &XC::Linear::getNumFactorizations,"Number of times the tangent has been formed.")
+  .add_property("maxNumCorrections", &XC::Linear::getMaxNumCorrections, &XC::Linear::setMaxNumCorrections,"Maximum number of corrections of the solution obtained with a reused factorization (0: don't correct).")
+  .add_property("correctionTol", make_function(&XC::Linear::getCorrectionTol, return_value_policy<copy_const_reference>()), &XC::Linear::setCorrectionTol,"Tolerance for the corrections (relative to the norm of the increment of the step).")
+  .add_property("numCorrections", &XC::Linear::getNumCorrections,"Number of corrections made with reused factorizations.")
+  ;
 
 class_<XC::NewtonBased, bases<XC::EquiSolnAlgo>, boost::noncopyable >("NewtonBased", no_init);
 
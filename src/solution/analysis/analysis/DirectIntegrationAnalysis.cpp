@@ -186,6 +186,8 @@ int XC::DirectIntegrationAnalysis::analyze(int numSteps, double dT)
 	        return -1;
               }	
           }
+        // staged construction: mask the DOFs of the dead nodes.
+        solution_method->getModelWrapperPtr()->getAnalysisModelPtr()->updateMaskedDOFs();
 
         if(solution_method->getTransientIntegratorPtr()->newStep(dT) < 0)
           {
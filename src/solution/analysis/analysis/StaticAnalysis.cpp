@@ -155,6 +155,8 @@ int XC::StaticAnalysis::check_domain_change(int num_step,int numSteps)
             return -1;
           }
       }
+    // staged construction: mask the DOFs of the dead nodes.
+    getAnalysisModelPtr()->updateMaskedDOFs();
     return result;
   }
 
@@ -62,6 +62,8 @@
 #include <solution/system_of_eqn/linearSOE/LinearSOE.h>
 #include <solution/analysis/model/AnalysisModel.h>
 #include <utility/matrix/Vector.h>
+#include <utility/matrix/Matrix.h>
+#include <utility/matrix/ID.h>
 #include <solution/analysis/model/dof_grp/DOF_Group.h>
 #include <solution/analysis/model/FE_EleIter.h>
 #include <solution/analysis/model/DOF_GrpIter.h>
@@ -124,6 +126,38 @@ int XC::IncrementalIntegrator::formTangent(int statFlag)
 		    << elePtr->getID();	    
 	  result = -3;
 	}
+    if(result==0)
+      result= formMaskedEquationsTangent();
+    return result;
+  }
+
+//! @brief Puts a unit value on the diagonal of the equations
+//! corresponding to the DOFs masked by the analysis model (dead
+//! nodes in staged construction). The elements don't contribute to
+//! those equations so their solution is zero.
+int XC::IncrementalIntegrator::formMaskedEquationsTangent(void)
+  {
+    int result= 0;
+    const AnalysisModel *mdl= getAnalysisModelPtr();
+    const std::vector<int> &masked= mdl->getMaskedEquations();
+    if(!masked.empty())
+      {
+        LinearSOE *theSOE= getLinearSOEPtr();
+        static Matrix one(1,1);
+        one(0,0)= 1.0;
+        static ID id(1);
+        for(std::vector<int>::const_iterator i= masked.begin();i!=masked.end();i++)
+          {
+            id(0)= *i;
+            if(theSOE->addA(one,id) < 0)
+              {
+	        std::cerr << getClassName() << "::" << __FUNCTION__
+		          << "; WARNING failed in addA for equation: "
+		          << *i << std::endl;
+	        result = -3;
+              }
+          }
+      }
     return result;
   }
 
@@ -102,6 +102,7 @@ class IncrementalIntegrator : public Integrator
     friend class IntegratorVectors;
     virtual int formNodalUnbalance(void);        
     virtual int formElementResidual(void);
+    int formMaskedEquationsTangent(void);
     int statusFlag;
 
     IncrementalIntegrator(AnalysisAggregation *,int classTag);
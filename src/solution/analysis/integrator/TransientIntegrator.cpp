@@ -149,6 +149,8 @@ int XC::TransientIntegrator::formTangent(int statFlag)
 	    result = -2;
 	  }
       }
+    if(result==0)
+      result= formMaskedEquationsTangent();
     return result;
   }
 
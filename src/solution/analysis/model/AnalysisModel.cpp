@@ -100,7 +100,7 @@ XC::AnalysisModel::AnalysisModel(ModelWrapper *owr)
    numFE_Ele(0), numDOF_Grp(0), numEqn(0),
    theFEs(this,256,"FEs"), theDOFGroups(this,256,"DOFs"), theFEiter(&theFEs), theDOFGroupiter(&theDOFGroups),
    theFEconst_iter(&theFEs), theDOFGroupconst_iter(&theDOFGroups),
-   myDOFGraph(*this), myGroupGraph(*this), updateGraphs(false) {}
+   myDOFGraph(*this), myGroupGraph(*this), updateGraphs(false), maskDeadNodes(false), maskStamp(0) {}
 
 //! @brief Constructor.
 //!
@@ -112,7 +112,7 @@ XC::AnalysisModel::AnalysisModel(int theClassTag,CommandEntity *owr)
    numFE_Ele(0), numDOF_Grp(0), numEqn(0),
    theFEs(this,1024,"FEs"), theDOFGroups(this,1024,"DOFs"),theFEiter(&theFEs), theDOFGroupiter(&theDOFGroups),
    theFEconst_iter(&theFEs), theDOFGroupconst_iter(&theDOFGroups),
-   myDOFGraph(*this), myGroupGraph(*this), updateGraphs(false) {}
+   myDOFGraph(*this), myGroupGraph(*this), updateGraphs(false), maskDeadNodes(false), maskStamp(0) {}
 
 //! @brief Copy constructor.
 XC::AnalysisModel::AnalysisModel(const AnalysisModel &other)
@@ -120,7 +120,7 @@ XC::AnalysisModel::AnalysisModel(const AnalysisModel &other)
    numFE_Ele(other.numFE_Ele), numDOF_Grp(other.numDOF_Grp), numEqn(other.numEqn),
    theFEs(other.theFEs), theDOFGroups(other.theDOFGroups),theFEiter(&theFEs), theDOFGroupiter(&theDOFGroups),
    theFEconst_iter(&theFEs), theDOFGroupconst_iter(&theDOFGroups),
-   myDOFGraph(*this), myGroupGraph(*this), updateGraphs(false) {}
+   myDOFGraph(*this), myGroupGraph(*this), updateGraphs(false), maskDeadNodes(other.maskDeadNodes), maskStamp(0) {}
 
 //! @brief Assignment operator.
 XC::AnalysisModel &XC::AnalysisModel::operator=(const AnalysisModel &other)
@@ -135,6 +135,9 @@ XC::AnalysisModel &XC::AnalysisModel::operator=(const AnalysisModel &other)
     myDOFGraph= DOF_Graph(*this);
     myGroupGraph= DOF_GroupGraph(*this);
     updateGraphs= false; //Update just finished
+    maskDeadNodes= other.maskDeadNodes;
+    maskedDOF_Groups.clear();
+    maskedEquations.clear();
     return *this;
   }
 
@@ -519,6 +522,66 @@ void XC::AnalysisModel::clearAll(void)
     numDOF_Grp= 0;
     numEqn= 0;    
     updateGraphs= true;
+    maskedDOF_Groups.clear();
+    maskedEquations.clear();
+  }
+
+//! @brief Mask the DOFs of the dead nodes and unmask those of the
+//! nodes that are alive again.
+//!
+//! Masked DOF groups receive negative equation numbers, so neither the
+//! elements nor the nodal loads contribute to their equations, but the
+//! numbering, the DOF graph and the size of the system of equations
+//! remain those of the whole model. The integrator puts a unit value on
+//! the diagonal of the masked equations, so the displacements of the dead
+//! nodes don't change (as if they were constrained by a node locker).
+//! Returns the number of masked DOF groups.
+int XC::AnalysisModel::updateMaskedDOFs(void)
+  {
+    if(!maskDeadNodes && maskedDOF_Groups.empty())
+      return 0;
+    bool changed= false;
+    DOF_GrpIter &theDOFGrps= getDOFGroups();
+    DOF_Group *dofPtr= nullptr;
+    while((dofPtr= theDOFGrps()) != nullptr)
+      {
+        const Node *nodePtr= dofPtr->getNodePtr();
+        if(!nodePtr || dynamic_cast<const TransformationDOF_Group *>(dofPtr))
+          continue; //Not a node or DOFs mapped by constraints.
+        const int tag= dofPtr->getTag();
+        const bool dead= maskDeadNodes && !nodePtr->isFree() && nodePtr->isDead();
+        std::map<int,ID>::iterator i= maskedDOF_Groups.find(tag);
+        if(dead && (i==maskedDOF_Groups.end())) //Mask it.
+          {
+            const ID id= dofPtr->getID();
+            maskedDOF_Groups[tag]= id;
+            dofPtr->setID(ID(ID::v_int(id.Size(),-1)));
+            changed= true;
+          }
+        else if(!dead && (i!=maskedDOF_Groups.end())) //Unmask it.
+          {
+            dofPtr->setID(i->second);
+            maskedDOF_Groups.erase(i);
+            changed= true;
+          }
+      }
+    if(changed)
+      {
+        maskStamp++; // the tangent must be formed again.
+        maskedEquations.clear();
+        for(std::map<int,ID>::const_iterator i= maskedDOF_Groups.begin();i!=maskedDOF_Groups.end();i++)
+          {
+            const ID &id= i->second;
+            for(int j= 0;j<id.Size();j++)
+              if(id(j)>=0)
+                maskedEquations.push_back(id(j));
+          }
+        FE_EleIter &theEles= getFEs();
+        FE_Element *elePtr= nullptr;
+        while((elePtr= theEles()) != nullptr)
+          elePtr->setID();
+      }
+    return maskedDOF_Groups.size();
   }
 
 
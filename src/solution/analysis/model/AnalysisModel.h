@@ -74,6 +74,9 @@
 #include "solution/analysis/model/FE_EleConstIter.h"
 #include "solution/analysis/model/DOF_GrpIter.h"
 #include "solution/analysis/model/DOF_GrpConstIter.h"
+#include "utility/matrix/ID.h"
+#include <map>
+#include <vector>
 
 namespace XC {
 class Domain;
@@ -148,6 +151,11 @@ class AnalysisModel: public MovableObject, public CommandEntity
     mutable DOF_GroupGraph myGroupGraph;
     mutable bool updateGraphs;
 
+    bool maskDeadNodes; //!< if true the DOFs of the dead nodes are masked instead of renumbering the model.
+    std::map<int,ID> maskedDOF_Groups; //!< equation numbers of the masked DOF groups.
+    std::vector<int> maskedEquations; //!< equations of the masked DOFs.
+    int maskStamp; //!< incremented each time the masked DOFs change.
+
     ModelWrapper *getModelWrapper(void);
     const ModelWrapper *getModelWrapper(void) const;
   protected:
@@ -196,6 +204,23 @@ class AnalysisModel: public MovableObject, public CommandEntity
     virtual FE_Element *createTransformationFE(const int &, Element *, const std::set<int> &,std::set<FE_Element *> &);
     virtual void clearAll(void);
 
+    // methods to deal with staged construction.
+    //! @brief Return true if the DOFs of the dead nodes are masked.
+    inline bool getMaskDeadNodes(void) const
+      { return maskDeadNodes; }
+    //! @brief Mask the DOFs of the dead nodes (staged construction) so
+    //! killing or reviving elements doesn't require renumbering.
+    inline void setMaskDeadNodes(const bool &b)
+      { maskDeadNodes= b; }
+    int updateMaskedDOFs(void);
+    //! @brief Return the equation numbers of the masked DOFs.
+    inline const std::vector<int> &getMaskedEquations(void) const
+      { return maskedEquations; }
+    //! @brief Return a number that changes each time the masked
+    //! DOFs change (the tangent matrix must be formed again).
+    inline int getMaskStamp(void) const
+      { return maskStamp; }
+
     // methods to access the FE_Elements and DOF_Groups and their numbers
     virtual int getNumDOF_Groups(void) const;
     virtual DOF_Group *getDOF_GroupPtr(int tag);
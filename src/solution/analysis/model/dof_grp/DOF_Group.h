@@ -135,6 +135,9 @@ class DOF_Group: public TaggedObject
     int inicID(const int &value);
 
     virtual int getNodeTag(void) const;
+    //! @brief Return a pointer to the node (nullptr if none).
+    inline const Node *getNodePtr(void) const
+      { return myNode; }
     //! @brief Returns the total number of DOFs in the DOF\_Group. 
     inline virtual int getNumDOF(void) const
       { return myID.Size(); }
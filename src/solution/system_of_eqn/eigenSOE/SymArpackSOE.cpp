@@ -43,6 +43,7 @@
 #include <solution/graph/graph/Vertex.h>
 #include <solution/graph/graph/VertexIter.h>
 #include <cmath>
+#include <cstring>
 #include <utility/matrix/Vector.h>
 
 //! @brief Constructor.
@@ -164,6 +165,7 @@ int XC::SymArpackSOE::setSize(Graph &theGraph)
 //    nblks = symFactorization(rowStartA, colA, size, LSPARSE);
     nblks = symFactorization(rowStartA.getDataPtr(), colA.getDataPtr(), size, LSPARSE,
 			     &xblk, &invp, &rowblks, &begblk, &first, &penv, &diag);
+    resize_mass_matrix_if_needed(size);
 
     // invoke setSize() on the XC::Solver
     EigenSolver *theSolvr = this->getSolver();
@@ -305,22 +307,59 @@ int XC::SymArpackSOE::addM(const Matrix &m, const ID &id, double fact)
     const int idSize = id.Size();
     if(idSize != m.noRows() && idSize != m.noCols())
       {
-        std::cerr << "BandArpackSOE::addA(); Matrix and ID not of similar sizes\n";
+        std::cerr << getClassName() << "::" << __FUNCTION__
+	          << "; matrix and ID not of similar sizes.\n";
         return -1;
       }
-    resize_mass_matrix_if_needed(idSize);      
+    if(fact == 0.0)
+      return 0;
+    resize_mass_matrix_if_needed(size);
 
+    // The mass matrix is stored using the original equation
+    // numbering (the one used by the eigenvectors); SymArpackSolver
+    // uses it to compute the M*x products.
     for(int i=0; i<idSize; i++)
-      for(int j=0; j<idSize; j++)
-        massMatrix(i,j)+= m(j,i);
+      {
+        const int row= id(i);
+        if(row < size && row >= 0)
+          for(int j=0; j<idSize; j++)
+            {
+              const int col= id(j);
+              if(col < size && col >= 0 && (m(i,j)!= 0.0))
+                massMatrix(row,col)+= m(i,j)*fact;
+            }
+      }
     //Added by LCPT ends.
 
-    return this->addA(m, id, -shift);
+    return this->addA(m, id, -shift*fact);
   }
 
 //! @brief Zeroes the matrix A.
+//!
+//! The structure of A (computed in setSize) is kept so only
+//! the numerical values are reset.
 void XC::SymArpackSOE::zeroA(void)
-  { factored = false; }
+  {
+    if(diag)
+      {
+        memset(diag, 0, size*sizeof(double));
+
+        const int profileSize= penv[size] - penv[0];
+        memset(penv[0], 0, profileSize*sizeof(double));
+
+        OFFDBLK *blkPtr= first;
+        int rLen= 0;
+        while(blkPtr)
+          {
+            if(blkPtr->beg == size)
+              break;
+            rLen= xblk[rowblks[blkPtr->beg]+1] - blkPtr->beg;
+            memset(blkPtr->nz, 0, rLen*sizeof(double));
+            blkPtr= blkPtr->next;
+          }
+      }
+    factored = false;
+  }
 
 //! @brief Zeroes the matrix M.
 void XC::SymArpackSOE::zeroM(void)
@@ -332,6 +371,11 @@ void XC::SymArpackSOE::zeroM(void)
 void XC::SymArpackSOE::identityM(void)
   {
     EigenSOE::identityM();
+    // A must store K-shift*M.
+    if(diag && (shift!=0.0))
+      for(int i= 0;i<size;i++)
+        diag[i]-= shift;
+    factored= false;
   }
 
 int XC::SymArpackSOE::sendSelf(CommParameters &cp)
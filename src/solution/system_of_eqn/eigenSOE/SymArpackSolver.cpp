@@ -70,7 +70,7 @@ extern "C" int dseupd_(bool *rvec, char *howmny, long int *select, double *d, do
 //! @brief Constructor.
 XC::SymArpackSolver::SymArpackSolver(int numE)
  :EigenSolver(EigenSOLVER_TAGS_SymArpackSolver, numE),
-theSOE(nullptr), factored(false)
+theSOE(nullptr)
   {
     // nothing to do.
   }
@@ -101,7 +101,7 @@ int XC::SymArpackSolver::solve(void)
       return 0;
 
 //        timer (FACTOR);
-    if(factored == false)
+    if(!theSOE->factored)
       {
         //factor the matrix
         //call the "C" function to do the numerical factorization.
@@ -112,7 +112,7 @@ int XC::SymArpackSolver::solve(void)
             std::cerr << "In XC::SymArpackSolver: error in factorization.\n";
             return -1;
           }
-        factored = true;
+        theSOE->factored = true;
       }
 
     int nev = numModes;
@@ -267,46 +267,26 @@ int XC::SymArpackSolver::getNCV(int n, int nev)
   }
 
 
+//! @brief Computes result= M*v where M is the matrix assembled in
+//! SymArpackSOE::addM (mass matrix or geometric stiffness in a linear
+//! buckling analysis). Both vectors use the reordered numbering.
 void XC::SymArpackSolver::myMv(int n, double *v, double *result)
   {
-    std::vector<double> tempX(n);
-    int *invp = theSOE->invp;
-    int i;
-
-    for(i=0; i<n; i++)
-      { tempX[i] = v[invp[i]]; }
-    for(i=0; i<n; i++)
-      { v[i] = tempX[i]; }
-
-    Vector x(v, n);
-    Vector y(result,n);
+    const int *invp = theSOE->invp;
+    std::vector<double> x(n), y(n,0.0);
 
-    y.Zero();
-    AnalysisModel *theAnalysisModel = theSOE->getAnalysisModelPtr();
-
-    // loop over the FE_Elements
-    FE_Element *elePtr;
-    FE_EleIter &theEles = theAnalysisModel->getFEs();
-    while((elePtr = theEles()) != 0)
-      {
-        const Vector &a = elePtr->getM_Force(x,1.0);
-        y.Assemble(a,elePtr->getID(),1.0);
-      }
+    for(int i=0; i<n; i++)
+      { x[i] = v[invp[i]]; }
 
-    // loop over the DOF_Groups
-    //Integrator *theIntegrator = 0;
-    DOF_Group *dofGroupPtr= nullptr;
-    DOF_GrpIter &theDofs = theAnalysisModel->getDOFGroups();
-    while ((dofGroupPtr= theDofs()) != 0)
-      {
-        const Vector &a = dofGroupPtr->getM_Force(x,1.0);
-        y.Assemble(a,dofGroupPtr->getID(),1.0);
-      }
+    // massMatrix uses the original numbering.
+    typedef EigenSOE::sparse_matrix sparse_matrix;
+    const sparse_matrix &M= theSOE->massMatrix;
+    for(sparse_matrix::const_iterator1 i1= M.begin1(); i1!=M.end1(); ++i1)
+      for(sparse_matrix::const_iterator2 i2= i1.begin(); i2!=i1.end(); ++i2)
+        y[i2.index1()]+= (*i2)*x[i2.index2()];
 
-    for(i=0; i<n; i++)
-      { tempX[invp[i]] = result[i]; }
-    for(i=0; i<n; i++)
-      { result[i] = tempX[i]; }
+    for(int i=0; i<n; i++)
+      { result[invp[i]] = y[i]; }
   }
 
 void XC::SymArpackSolver::myCopy(int n, double *v, double *result)
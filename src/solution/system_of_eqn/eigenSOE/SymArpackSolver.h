@@ -53,7 +53,6 @@ class SymArpackSolver : public EigenSolver
   {
   private:
     SymArpackSOE *theSOE;
-    bool factored;
 
     Vector value;
     Vector vector;
@@ -35,6 +35,8 @@
 XC::FactoredSOEBase::FactoredSOEBase(AnalysisAggregation *owr,int classTag,int N)
   : LinearSOEData(owr,classTag,N), factored(false){}
 
-
-
+//! @brief Return true if the system has been factored and the
+//! factorization has not been invalidated since (zeroA, setSize,...).
+bool XC::FactoredSOEBase::isFactored(void) const
+  { return factored; }
 
@@ -43,6 +43,8 @@ class FactoredSOEBase: public LinearSOEData
     bool factored; //!< True if the system is factored.
 
     FactoredSOEBase(AnalysisAggregation *,int classTag,int N= 0);
+  public:
+    bool isFactored(void) const;
   };
 } // end of XC namespace
 
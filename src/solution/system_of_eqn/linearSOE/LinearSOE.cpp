@@ -221,6 +221,12 @@ int XC::LinearSOE::solve(void)
 double XC::LinearSOE::getDeterminant(void)
   { return getSolver()->getDeterminant(); }
 
+//! @brief Return true if the matrix \f$A\f$ holds a factorization
+//! that the solver can reuse to solve for a new right hand side
+//! (default implementation returns false).
+bool XC::LinearSOE::isFactored(void) const
+  { return false; }
+
 
 //! @brief Returns a pointer to the solver.
 XC::LinearSOESolver *XC::LinearSOE::getSolver(void)
@@ -149,6 +149,7 @@ class LinearSOE : public SystemOfEqn
     //! @brief Return a const reference to the vector $b$.
     virtual const Vector &getB(void) const= 0;    
     virtual double getDeterminant(void);
+    virtual bool isFactored(void) const;
     //! @brief Return the 2-norm of the vector $x$.
     virtual double normRHS(void) const= 0;
 
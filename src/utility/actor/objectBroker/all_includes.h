@@ -253,6 +253,8 @@
 #include "utility/recorder/PropRecorder.h"
 #include "utility/recorder/NodePropRecorder.h"
 #include "utility/recorder/ElementPropRecorder.h"
+#include "utility/recorder/NodeCombEnvelopeRecorder.h"
+#include "utility/recorder/ElementCombEnvelopeRecorder.h"
 #include "utility/recorder/EnvelopeNodeRecorder.h"
 #include "utility/recorder/EnvelopeElementRecorder.h"
 #include "utility/recorder/response/Response.h"
@@ -0,0 +1,155 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//CombEnvelopeRecorder.cc
+
+#include <utility/recorder/CombEnvelopeRecorder.h>
+#include <domain/domain/Domain.h>
+#include <utility/matrix/Vector.h>
+#include <cfloat>
+#include <cmath>
+
+//! @brief Constructor.
+XC::CombEnvelopeRecorder::CombEnvelopeRecorder(int classTag,Domain *ptr_dom)
+  : DomainRecorderBase(classTag,ptr_dom), components(), maxValues(), minValues(),
+    absMaxValues(), initialized(false) {}
+
+//! @brief Returns the name of the current combination.
+std::string XC::CombEnvelopeRecorder::getCurrentCombinationName(void) const
+  {
+    std::string retval= "";
+    if(theDomain)
+      retval= theDomain->getCurrentCombinationName();
+    return retval;
+  }
+
+//! @brief Sets the indexes of the components to record (if empty
+//! all the components of the response are recorded).
+void XC::CombEnvelopeRecorder::setComponents(const ID &iComponents)
+  {
+    components= iComponents;
+    initialized= false;
+  }
+
+//! @brief Allocates the envelope containers.
+//! @param numObjs: number of objects (nodes, elements,...) to record.
+//! @param numComps: number of components to record on each object.
+void XC::CombEnvelopeRecorder::alloc(const size_t &numObjs,const size_t &numComps)
+  {
+    maxValues= Matrix(numObjs,numComps);
+    minValues= Matrix(numObjs,numComps);
+    absMaxValues= Matrix(numObjs,numComps);
+    const size_t sz= numObjs*numComps;
+    maxCombs= std::vector<std::string>(sz);
+    minCombs= std::vector<std::string>(sz);
+    absMaxCombs= std::vector<std::string>(sz);
+    for(size_t i= 0;i<numObjs;i++)
+      for(size_t j= 0;j<numComps;j++)
+        {
+          maxValues(i,j)= -DBL_MAX;
+          minValues(i,j)= DBL_MAX;
+          absMaxValues(i,j)= 0.0;
+        }
+    initialized= true;
+  }
+
+//! @brief Updates the envelope values for the object at row iRow.
+//! @param iRow: row corresponding to the object.
+//! @param v: response vector of the object.
+//! @param nmbComb: name of the current load combination.
+void XC::CombEnvelopeRecorder::update(const size_t &iRow,const Vector &v,const std::string &nmbComb)
+  {
+    const size_t numComps= maxValues.noCols();
+    const size_t nc= components.Size();
+    for(size_t j= 0;j<numComps;j++)
+      {
+        const int k= (nc>0 ? components(j) : static_cast<int>(j));
+        if(k>=v.Size())
+          {
+	    std::cerr << getClassName() << "::" << __FUNCTION__
+	              << "; component index: " << k
+                      << " out of range." << std::endl;
+            continue;
+          }
+        const double value= v(k);
+        const size_t iPos= iRow*numComps+j;
+        if(value>maxValues(iRow,j))
+          {
+            maxValues(iRow,j)= value;
+            maxCombs[iPos]= nmbComb;
+          }
+        if(value<minValues(iRow,j))
+          {
+            minValues(iRow,j)= value;
+            minCombs[iPos]= nmbComb;
+          }
+        const double absValue= std::abs(value);
+        if(absValue>absMaxValues(iRow,j))
+          {
+            absMaxValues(iRow,j)= absValue;
+            absMaxCombs[iPos]= nmbComb;
+          }
+      }
+  }
+
+//! @brief Returns the combination names in a python list
+//! of lists (one row per object).
+boost::python::list XC::CombEnvelopeRecorder::getCombsPy(const std::vector<std::string> &combs) const
+  {
+    boost::python::list retval;
+    const size_t numRows= maxValues.noRows();
+    const size_t numCols= maxValues.noCols();
+    for(size_t i= 0;i<numRows;i++)
+      {
+        boost::python::list row;
+        for(size_t j= 0;j<numCols;j++)
+          row.append(combs[i*numCols+j]);
+        retval.append(row);
+      }
+    return retval;
+  }
+
+//! @brief Returns the names of the combinations that produce
+//! the maximum values.
+boost::python::list XC::CombEnvelopeRecorder::getMaxCombsPy(void) const
+  { return getCombsPy(maxCombs); }
+
+//! @brief Returns the names of the combinations that produce
+//! the minimum values.
+boost::python::list XC::CombEnvelopeRecorder::getMinCombsPy(void) const
+  { return getCombsPy(minCombs); }
+
+//! @brief Returns the names of the combinations that produce
+//! the maximum absolute values.
+boost::python::list XC::CombEnvelopeRecorder::getAbsMaxCombsPy(void) const
+  { return getCombsPy(absMaxCombs); }
+
+//! @brief Clears the envelope (the values are allocated again
+//! on the next commit).
+void XC::CombEnvelopeRecorder::reset(void)
+  { initialized= false; }
+
+//! @brief Called when the domain is reverted to its initial state
+//! (i.e. preprocessor.resetLoadCase() before each combination). The
+//! envelope must survive from one combination to the next so nothing
+//! is done here (use reset to clear it).
+int XC::CombEnvelopeRecorder::restart(void)
+  { return 0; }
@@ -0,0 +1,83 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//CombEnvelopeRecorder.h
+                                                                        
+#ifndef CombEnvelopeRecorder_h
+#define CombEnvelopeRecorder_h
+
+#include <utility/recorder/DomainRecorderBase.h>
+#include <utility/matrix/Matrix.h>
+#include <utility/matrix/ID.h>
+#include <boost/python/list.hpp>
+#include <vector>
+
+namespace XC {
+class Vector;
+
+//! @ingroup Recorder
+//
+//! @brief Base class for the recorders that keep the envelope
+//! (maximum, minimum and maximum absolute value) of some response
+//! quantities over the load combinations.
+//!
+//! The values are updated on each commit without executing any
+//! Python code; for each extreme the name of the combination
+//! that produced it is stored too.
+class CombEnvelopeRecorder: public DomainRecorderBase
+  {
+  protected:
+    ID components; //!< Indexes of the components to record (all if empty).
+    Matrix maxValues; //!< Maximum values (one row per object).
+    Matrix minValues; //!< Minimum values (one row per object).
+    Matrix absMaxValues; //!< Maximum absolute values (one row per object).
+    std::vector<std::string> maxCombs; //!< Combinations that produce maximum values.
+    std::vector<std::string> minCombs; //!< Combinations that produce minimum values.
+    std::vector<std::string> absMaxCombs; //!< Combinations that produce maximum absolute values.
+    bool initialized; //!< True if the envelope containers are allocated.
+
+    void alloc(const size_t &,const size_t &);
+    void update(const size_t &,const Vector &,const std::string &);
+    boost::python::list getCombsPy(const std::vector<std::string> &) const;
+  public:
+    CombEnvelopeRecorder(int classTag, Domain *ptr_dom= nullptr);
+
+    std::string getCurrentCombinationName(void) const;
+
+    void setComponents(const ID &);
+    inline const ID &getComponents(void) const
+      { return components; }
+    inline const Matrix &getMaxValues(void) const
+      { return maxValues; }
+    inline const Matrix &getMinValues(void) const
+      { return minValues; }
+    inline const Matrix &getAbsMaxValues(void) const
+      { return absMaxValues; }
+    boost::python::list getMaxCombsPy(void) const;
+    boost::python::list getMinCombsPy(void) const;
+    boost::python::list getAbsMaxCombsPy(void) const;
+
+    void reset(void);
+    virtual int restart(void);
+  };
+} // end of XC namespace
+
+#endif
@@ -0,0 +1,160 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//ElementCombEnvelopeRecorder.cc
+
+#include <utility/recorder/ElementCombEnvelopeRecorder.h>
+#include <domain/domain/Domain.h>
+#include <domain/mesh/element/Element.h>
+#include "domain/mesh/element/utils/Information.h"
+#include <utility/recorder/response/Response.h>
+#include <utility/matrix/Vector.h>
+#include "xc_utils/src/utils/text/text_string.h"
+
+//! @brief Constructor.
+XC::ElementCombEnvelopeRecorder::ElementCombEnvelopeRecorder(Domain *ptr_dom)
+  :CombEnvelopeRecorder(RECORDER_TAGS_ElementCombEnvelopeRecorder,ptr_dom), responseArgs(1,"force") {}
+
+//! @brief Destructor.
+XC::ElementCombEnvelopeRecorder::~ElementCombEnvelopeRecorder(void)
+  { free_responses(); }
+
+//! @brief Deletes the response objects.
+void XC::ElementCombEnvelopeRecorder::free_responses(void)
+  {
+    for(std::vector<Response *>::iterator i= theResponses.begin();i!=theResponses.end();i++)
+      if(*i)
+        {
+          delete *i;
+          (*i)= nullptr;
+        }
+    theResponses.clear();
+  }
+
+//! @brief Asigns elements to recorder.
+void XC::ElementCombEnvelopeRecorder::setElements(const ID &iElements)
+  {
+    const int sz= iElements.Size();
+    if(sz)
+      {
+        for(int i= 0;i<sz;i++)
+          elements.push_back(theDomain->getElement(iElements(i)));
+        initialized= false;
+      }
+    else
+      std::cerr << "Error; " << getClassName() << "::" << __FUNCTION__
+                << " element list is empty." << std::endl;
+  }
+
+//! @brief Returns the tags of the recorded elements (in the same order
+//! than the rows of the envelope matrices).
+XC::ID XC::ElementCombEnvelopeRecorder::getElementTags(void) const
+  {
+    const size_t sz= elements.size();
+    ID retval(sz);
+    for(size_t i= 0;i<sz;i++)
+      {
+        const Element *e= elements[i];
+        retval[i]= (e ? e->getTag() : -1);
+      }
+    return retval;
+  }
+
+//! @brief Sets the response to record (arguments for Element::setResponse
+//! separated by spaces, i.e. "force" or "localForce").
+void XC::ElementCombEnvelopeRecorder::setResponse(const std::string &str)
+  {
+    std::deque<std::string> campos= separa_cadena(str," ");
+    responseArgs= std::vector<std::string>(campos.begin(),campos.end());
+    initialized= false;
+  }
+
+//! @brief Returns the arguments for Element::setResponse separated by spaces.
+std::string XC::ElementCombEnvelopeRecorder::getResponse(void) const
+  {
+    std::string retval;
+    for(std::vector<std::string>::const_iterator i= responseArgs.begin();i!=responseArgs.end();i++)
+      {
+        if(i!=responseArgs.begin())
+          retval+= " ";
+        retval+= *i;
+      }
+    return retval;
+  }
+
+//! @brief Creates the response objects and allocates the envelope containers.
+int XC::ElementCombEnvelopeRecorder::setup_responses(void)
+  {
+    free_responses();
+    const size_t sz= elements.size();
+    theResponses= std::vector<Response *>(sz,static_cast<Response *>(nullptr));
+    size_t numComps= components.Size();
+    Information eleInfo(1.0);
+    for(size_t i= 0;i<sz;i++)
+      {
+        Element *e= elements[i];
+        if(e)
+          {
+            theResponses[i]= e->setResponse(responseArgs,eleInfo);
+            if(!theResponses[i])
+	      std::cerr << getClassName() << "::" << __FUNCTION__
+	                << "; element: " << e->getTag()
+                        << " doesn't support response: '"
+                        << getResponse() << "'." << std::endl;
+            else if(numComps==0)
+              numComps= theResponses[i]->getInformation().getData().Size();
+          }
+      }
+    if(numComps==0)
+      {
+        std::cerr << getClassName() << "::" << __FUNCTION__
+                  << "; no components to record." << std::endl;
+        return -1;
+      }
+    alloc(sz,numComps);
+    return 0;
+  }
+
+//! @brief Updates the envelopes when commit is triggered.
+int XC::ElementCombEnvelopeRecorder::record(int commitTag, double timeStamp)
+  {
+    int retval= 0;
+    const size_t sz= elements.size();
+    if(sz==0)
+      return retval;
+    if(!initialized)
+      if(setup_responses()!=0)
+        return -1;
+    const std::string nmbComb= getCurrentCombinationName();
+    for(size_t i= 0;i<sz;i++)
+      {
+        Response *r= theResponses[i];
+        if(r)
+          {
+            const int res= r->getResponse();
+            if(res<0)
+              retval+= res;
+            else
+              update(i,r->getInformation().getData(),nmbComb);
+          }
+      }
+    return retval;
+  }
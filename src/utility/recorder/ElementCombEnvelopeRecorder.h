@@ -0,0 +1,63 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//ElementCombEnvelopeRecorder.h
+                                                                        
+#ifndef ElementCombEnvelopeRecorder_h
+#define ElementCombEnvelopeRecorder_h
+
+#include <utility/recorder/CombEnvelopeRecorder.h>
+#include <deque>
+
+namespace XC {
+class Element;
+class Response;
+
+//! @ingroup Recorder
+//
+//! @brief Records the envelope of an element response
+//! (the one obtained from Element::setResponse, i.e. "force",
+//! "localForce", "stresses",...) over the load combinations.
+class ElementCombEnvelopeRecorder: public CombEnvelopeRecorder
+  {
+  public:
+    typedef std::deque<Element *> dq_elements; //!< Pointers to elements.
+  private:
+    dq_elements elements; //!< Elements whose response is recorded.
+    std::vector<std::string> responseArgs; //!< Arguments for Element::setResponse.
+    std::vector<Response *> theResponses; //!< Response objects.
+
+    void free_responses(void);
+    int setup_responses(void);
+  public:
+    ElementCombEnvelopeRecorder(Domain *ptr_dom= nullptr);
+    ~ElementCombEnvelopeRecorder(void);
+
+    void setElements(const ID &);
+    ID getElementTags(void) const;
+    void setResponse(const std::string &);
+    std::string getResponse(void) const;
+
+    virtual int record(int,double);
+  };
+} // end of XC namespace
+
+#endif
@@ -0,0 +1,117 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//NodeCombEnvelopeRecorder.cc
+
+#include <utility/recorder/NodeCombEnvelopeRecorder.h>
+#include <domain/domain/Domain.h>
+#include <domain/mesh/node/Node.h>
+#include <utility/matrix/Vector.h>
+
+//! @brief Constructor.
+XC::NodeCombEnvelopeRecorder::NodeCombEnvelopeRecorder(Domain *ptr_dom)
+  :CombEnvelopeRecorder(RECORDER_TAGS_NodeCombEnvelopeRecorder,ptr_dom), response("disp") {}
+
+//! @brief Asigns nodes to recorder.
+void XC::NodeCombEnvelopeRecorder::setNodes(const ID &iNodes)
+  {
+    const int sz= iNodes.Size();
+    if(sz)
+      {
+        for(int i= 0;i<sz;i++)
+          nodes.push_back(theDomain->getNode(iNodes(i)));
+        initialized= false;
+      }
+    else
+      std::cerr << "Error; " << getClassName() << "::" << __FUNCTION__
+                << " node list is empty." << std::endl;
+  }
+
+//! @brief Returns the tags of the recorded nodes (in the same order
+//! than the rows of the envelope matrices).
+XC::ID XC::NodeCombEnvelopeRecorder::getNodeTags(void) const
+  {
+    const size_t sz= nodes.size();
+    ID retval(sz);
+    for(size_t i= 0;i<sz;i++)
+      {
+        const Node *n= nodes[i];
+        retval[i]= (n ? n->getTag() : -1);
+      }
+    return retval;
+  }
+
+//! @brief Sets the response to record (disp, vel, accel or reaction).
+void XC::NodeCombEnvelopeRecorder::setResponse(const std::string &str)
+  {
+    if((str=="disp") || (str=="vel") || (str=="accel") || (str=="reaction"))
+      {
+        response= str;
+        initialized= false;
+      }
+    else
+      std::cerr << getClassName() << "::" << __FUNCTION__
+                << "; unknown response: '" << str
+                << "' (must be disp, vel, accel or reaction)." << std::endl;
+  }
+
+//! @brief Returns the response vector of the node.
+const XC::Vector &XC::NodeCombEnvelopeRecorder::getNodeResponse(const Node &n) const
+  {
+    if(response=="vel")
+      return n.getVel();
+    else if(response=="accel")
+      return n.getAccel();
+    else if(response=="reaction")
+      return n.getReaction();
+    else
+      return n.getDisp();
+  }
+
+//! @brief Updates the envelopes when commit is triggered.
+int XC::NodeCombEnvelopeRecorder::record(int commitTag, double timeStamp)
+  {
+    const size_t sz= nodes.size();
+    if(sz==0)
+      return 0;
+    if(!initialized)
+      {
+        size_t numComps= components.Size();
+        if(numComps==0)
+          {
+            const Node *n= nodes.front();
+            if(n)
+              numComps= n->getNumberDOF();
+          }
+        alloc(sz,numComps);
+      }
+    const std::string nmbComb= getCurrentCombinationName();
+    for(size_t i= 0;i<sz;i++)
+      {
+        const Node *n= nodes[i];
+        if(n)
+          update(i,getNodeResponse(*n),nmbComb);
+        else
+	  std::cerr << getClassName() << "::" << __FUNCTION__
+	            << "; pointer is null." << std::endl;
+      }
+    return 0;
+  }
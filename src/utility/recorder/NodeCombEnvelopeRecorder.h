@@ -0,0 +1,60 @@
+//----------------------------------------------------------------------------
+//  XC program; finite element analysis code
+//  for structural analysis and design.
+//
+//  Copyright (C)  Luis Claudio Pérez Tato
+//
+//  XC is free software: you can redistribute it and/or modify 
+//  it under the terms of the GNU General Public License as published by
+//  the Free Software Foundation, either version 3 of the License, or 
+//  (at your option) any later version.
+//
+//  This software is distributed in the hope that it will be useful, but 
+//  WITHOUT ANY WARRANTY; without even the implied warranty of 
+//  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+//  GNU General Public License for more details. 
+//
+//
+// You should have received a copy of the GNU General Public License 
+// along with this program.
+// If not, see <http://www.gnu.org/licenses/>.
+//----------------------------------------------------------------------------
+//NodeCombEnvelopeRecorder.h
+                                                                        
+#ifndef NodeCombEnvelopeRecorder_h
+#define NodeCombEnvelopeRecorder_h
+
+#include <utility/recorder/CombEnvelopeRecorder.h>
+#include <deque>
+
+namespace XC {
+class Node;
+
+//! @ingroup Recorder
+//
+//! @brief Records the envelope of a node response quantity
+//! (displacement, velocity, acceleration or reaction) over
+//! the load combinations.
+class NodeCombEnvelopeRecorder: public CombEnvelopeRecorder
+  {
+  public:
+    typedef std::deque<Node *> dq_nodes; //!< Pointer to nodes.
+  private:
+    dq_nodes nodes; //!< Nodes whose response is recorded.
+    std::string response; //!< Response to record (disp, vel, accel or reaction).
+
+    const Vector &getNodeResponse(const Node &) const;
+  public:
+    NodeCombEnvelopeRecorder(Domain *ptr_dom= nullptr);
+
+    void setNodes(const ID &);
+    ID getNodeTags(void) const;
+    void setResponse(const std::string &);
+    inline const std::string &getResponse(void) const
+      { return response; }
+
+    virtual int record(int,double);
+  };
+} // end of XC namespace
+
+#endif
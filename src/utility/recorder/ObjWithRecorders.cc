@@ -64,6 +64,8 @@
 #include <utility/recorder/PatternRecorder.h>
 #include <utility/recorder/NodePropRecorder.h>
 #include <utility/recorder/ElementPropRecorder.h>
+#include <utility/recorder/NodeCombEnvelopeRecorder.h>
+#include <utility/recorder/ElementCombEnvelopeRecorder.h>
 
 
 #include "boost/any.hpp"
@@ -151,6 +153,16 @@ XC::Recorder *XC::ObjWithRecorders::newRecorder(const std::string &cod,DataOutpu
         ElementPropRecorder *tmp= new ElementPropRecorder(get_domain_ptr());
         retval= tmp;
       }
+    else if(cod == "node_comb_envelope_recorder")
+      {
+        NodeCombEnvelopeRecorder *tmp= new NodeCombEnvelopeRecorder(get_domain_ptr());
+        retval= tmp;
+      }
+    else if(cod == "element_comb_envelope_recorder")
+      {
+        ElementCombEnvelopeRecorder *tmp= new ElementCombEnvelopeRecorder(get_domain_ptr());
+        retval= tmp;
+      }
     else
       std::cerr << "Recorder type: '" << cod
                 << "' unknown." << std::endl;
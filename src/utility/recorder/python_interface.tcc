@@ -55,6 +55,30 @@ class_<XC::ElementPropRecorder, bases<XC::PropRecorder>, boost::noncopyable >("E
   .def("setElements",&XC::ElementPropRecorder::setElements,"Assigns elements to the recorder.")
   ;
 
+class_<XC::CombEnvelopeRecorder, bases<XC::DomainRecorderBase>, boost::noncopyable >("CombEnvelopeRecorder", no_init)
+  .add_property("components",make_function(&XC::CombEnvelopeRecorder::getComponents, return_internal_reference<>()),&XC::CombEnvelopeRecorder::setComponents,"Indexes of the response components to record (all if empty).")
+  .add_property("getCurrentCombinationName",&XC::CombEnvelopeRecorder::getCurrentCombinationName)
+  .add_property("getMaxValues",make_function(&XC::CombEnvelopeRecorder::getMaxValues, return_internal_reference<>()),"Returns the maximum values (one row per object, one column per component).")
+  .add_property("getMinValues",make_function(&XC::CombEnvelopeRecorder::getMinValues, return_internal_reference<>()),"Returns the minimum values (one row per object, one column per component).")
+  .add_property("getAbsMaxValues",make_function(&XC::CombEnvelopeRecorder::getAbsMaxValues, return_internal_reference<>()),"Returns the maximum absolute values (one row per object, one column per component).")
+  .add_property("getMaxCombs",&XC::CombEnvelopeRecorder::getMaxCombsPy,"Returns the names of the combinations that produce the maximum values.")
+  .add_property("getMinCombs",&XC::CombEnvelopeRecorder::getMinCombsPy,"Returns the names of the combinations that produce the minimum values.")
+  .add_property("getAbsMaxCombs",&XC::CombEnvelopeRecorder::getAbsMaxCombsPy,"Returns the names of the combinations that produce the maximum absolute values.")
+  .def("reset",&XC::CombEnvelopeRecorder::reset,"Clears the envelope (it's kept when the domain is reverted to its initial state between combinations).")
+  ;
+
+class_<XC::NodeCombEnvelopeRecorder, bases<XC::CombEnvelopeRecorder>, boost::noncopyable >("NodeCombEnvelopeRecorder", no_init)
+  .def("setNodes",&XC::NodeCombEnvelopeRecorder::setNodes,"Assigns nodes to the recorder.")
+  .add_property("getNodeTags",&XC::NodeCombEnvelopeRecorder::getNodeTags,"Returns the tags of the nodes (one for each row of the envelope matrices).")
+  .add_property("response",make_function(&XC::NodeCombEnvelopeRecorder::getResponse, return_value_policy<copy_const_reference>()),&XC::NodeCombEnvelopeRecorder::setResponse,"Response to record: disp, vel, accel or reaction.")
+  ;
+
+class_<XC::ElementCombEnvelopeRecorder, bases<XC::CombEnvelopeRecorder>, boost::noncopyable >("ElementCombEnvelopeRecorder", no_init)
+  .def("setElements",&XC::ElementCombEnvelopeRecorder::setElements,"Assigns elements to the recorder.")
+  .add_property("getElementTags",&XC::ElementCombEnvelopeRecorder::getElementTags,"Returns the tags of the elements (one for each row of the envelope matrices).")
+  .add_property("response",&XC::ElementCombEnvelopeRecorder::getResponse,&XC::ElementCombEnvelopeRecorder::setResponse,"Response to record (arguments for element setResponse, i.e. force or localForce).")
+  ;
+
 // class_<XC::YsVisual , bases<XC::Recorder>, boost::noncopyable >("YsVisual", no_init);
 
 // class_<XC::DamageRecorder, bases<XC::DomainRecorderBase>, boost::noncopyable >("DamageRecorder", no_init);
@@ -20,6 +20,9 @@ python tests/actions/test_windSIA.py
 python tests/actions/test_prestressing.py
 python tests/actions/test_peck_pressure_envelope.py
 python tests/actions/mononobe_okabe_test_01.py
+python tests/actions/test_earth_pressure_vectorized.py
+python tests/actions/test_moving_loads_influence_line.py
+python tests/actions/test_moving_loads_influence_surface.py
 
 #Combinations tests.
 echo "$BLEU" "Load combination tests." "$NORMAL"
@@ -35,6 +38,7 @@ python tests/combinations/test_combination06.py
 python tests/combinations/test_combination07.py
 python tests/combinations/test_davit_01.py
 python tests/combinations/test_davit_02.py
+python tests/combinations/test_dominated_combinations.py
 
 
 echo "$BLEU" "Elements tests." "$NORMAL"
@@ -80,6 +84,7 @@ python tests/elements/beam_column/cantilever3d_06.py
 python tests/elements/beam_column/cantilever3d_07.py
 python tests/elements/beam_column/cantilever3d_08.py
 python tests/elements/beam_column/cantilever3d_09.py
+python tests/elements/beam_column/elastic_beam3d_stiffness_cache_01.py
 python tests/elements/beam_column/cantilever3d_10.py
 echo "$BLEU" "    Force beam-column 2D tests." "$NORMAL"
 python tests/elements/beam_column/test_force_beam_column_2d_01.py
@@ -149,6 +154,8 @@ python tests/elements/shell/test_shell_mitc9_01.py
 python tests/elements/shell/test_shell_mitc9_02.py
 python tests/elements/shell/test_shell_mitc9_03.py
 python tests/elements/shell/test_area_tributaria_01.py
+python tests/elements/shell/test_tributary_area_cache_01.py
+python tests/elements/shell/shell_mitc4_stiffness_cache_01.py
 python tests/elements/shell/test_shell_mitc4_natural_coordinates_01.py
 python tests/elements/shell/test_transformInternalForces.py
 
@@ -165,9 +172,14 @@ python tests/elements/test_pot_bearing_02.py
 python tests/elements/test_pot_bearing_03.py
 python tests/elements/kill_elements_01.py
 python tests/elements/kill_elements_02.py
+python tests/elements/kill_elements_03.py
 
 echo "$BLEU" "Solver tests." "$NORMAL"
 python tests/solution/superlu_solver_test_01.py
+python tests/solution/linear_newmark_factor_once_test_01.py
+python tests/solution/ground_motion_suite_test_01.py
+python tests/solution/linear_reanalysis_test_01.py
+python tests/solution/sampling_analysis_test_01.py
 
 #Constraint handlers tests.
 echo "$BLEU" "  Constraint handler tests." "$NORMAL"
@@ -190,6 +202,7 @@ python tests/solution/eigenvalues/linear_buckling_column02.py
 python tests/solution/eigenvalues/linear_buckling_column03.py
 python tests/solution/eigenvalues/linear_buckling_column04.py
 python tests/solution/eigenvalues/linear_buckling_column05.py
+python tests/solution/eigenvalues/linear_buckling_column06.py
 python tests/solution/eigenvalues/test_string_under_tension.py
 python tests/solution/eigenvalues/modal_analysis_test_01.py
 python tests/solution/eigenvalues/modal_analysis_test_02.py
@@ -197,7 +210,9 @@ python tests/solution/eigenvalues/modal_analysis_test_03.py
 python tests/solution/eigenvalues/modal_analysis_test_04.py
 python tests/solution/eigenvalues/modal_analysis_test_05.py
 python tests/solution/eigenvalues/test_cqc_01.py
+python tests/solution/eigenvalues/modal_superposition_test_01.py
 python tests/solution/eigenvalues/test_band_arpackpp_solver_01.py
+python tests/solution/eigenvalues/test_sym_arpack_solver_01.py
 
 #Preprocessor tests
 echo "$BLEU" "Preprocessor tests." "$NORMAL"
@@ -237,9 +252,11 @@ python tests/preprocessor/cad/test_esquema2d.py
 python tests/preprocessor/cad/test_esquema3d.py
 python tests/preprocessor/cad/test_nearest_node_01.py
 python tests/preprocessor/cad/test_nearest_element_01.py
+python tests/preprocessor/cad/test_nearest_entities_indexed.py
 python tests/preprocessor/cad/split_linea_01.py
 python tests/preprocessor/cad/split_linea_02.py
 python tests/preprocessor/cad/split_linea_03.py
+python tests/preprocessor/cad/dxf_k_points_01.py
 echo "$BLEU" "  Meshing routines tests." "$NORMAL"
 python tests/preprocessor/test_surface_axes_01.py
 python tests/preprocessor/test_surface_meshing_01.py
@@ -247,6 +264,7 @@ python tests/preprocessor/test_surface_meshing_02.py
 python tests/preprocessor/test_surface_meshing_03.py
 python tests/preprocessor/test_surface_meshing_04.py
 python tests/preprocessor/test_surface_meshing_05.py
+python tests/preprocessor/test_concilia_ndivs.py
 echo "$BLEU" "  Sets handling tests." "$NORMAL"
 python tests/preprocessor/sets/test_exist_set.py
 python tests/preprocessor/sets/mueve_set.py
@@ -258,6 +276,7 @@ python tests/preprocessor/sets/test_resisting_svd01.py
 python tests/preprocessor/sets/test_get_contours_01.py
 python tests/preprocessor/sets/test_get_contours_02.py
 python tests/preprocessor/sets/test_pick_entities.py
+python tests/preprocessor/sets/test_pick_entities_kdtree.py
 python tests/preprocessor/sets/test_sets_and_grids.py
 python tests/preprocessor/sets/test_get_bnd_01.py
 echo "$BLEU" "  Preprocessor grid model tests." "$NORMAL"
@@ -271,6 +290,7 @@ python tests/constraints/test_elastic_bearing_01.py
 python tests/constraints/test_elastic_bearing_02.py
 python tests/constraints/test_elastic_bearing_03.py
 python tests/constraints/test_elastic_bearing_04.py
+python tests/constraints/test_elastic_foundation_01.py
 python tests/constraints/test_rigid_beam_01.py
 python tests/constraints/test_rigid_rod_01.py
 python tests/constraints/test_fulcrum_01.py
@@ -384,6 +404,7 @@ python tests/materials/steel_shapes/test_aisc_w_shapes.py
 python tests/materials/steel_shapes/test_aisc_hss_shapes.py
 python tests/materials/steel_shapes/test_steel_shape_01.py
 python tests/materials/steel_shapes/test_steel_shape_02.py
+python tests/materials/steel_shapes/test_shape_table_01.py
 
 #Cross sections. Fiber model.
 echo "$BLEU" "  Elastic section tests." "$NORMAL"
@@ -436,6 +457,9 @@ python tests/materials/fiber_section/test_interaction_diagram03.py
 python tests/materials/fiber_section/test_interaction_diagram04.py
 python tests/materials/fiber_section/test_interaction_diagram05.py
 python tests/materials/fiber_section/test_interaction_diagram06.py
+python tests/materials/fiber_section/test_interaction_diagram07.py
+python tests/materials/fiber_section/test_moment_curvature_01.py
+python tests/materials/fiber_section/test_fiber_set_arrays_01.py
 python tests/materials/fiber_section/test_shear_01.py
 python tests/materials/fiber_section/test_shear_02.py
 python tests/materials/fiber_section/plastic_hinge_on_IPE200.py
@@ -477,6 +501,7 @@ python tests/materials/ec3/test_cross_section_verification.py
 python tests/materials/ec3/test_beam_contrpnt.py
 python tests/materials/ec3/test_biax_bend_coeff.py
 python tests/materials/ec3/test_classif.py
+python tests/materials/ec3/test_member_sizing_01.py
 echo "$BLEU" "    SIA 262 tests." "$NORMAL"
 python tests/materials/sia262/sia262_concrete_01.py
 python tests/materials/sia262/shear_01.py
@@ -498,10 +523,12 @@ python tests/materials/prestressing/test_anchorageLoss_prestress_tendon_02.py
 python tests/materials/prestressing/test_anchorageLoss_prestress_tendon_03.py
 python tests/materials/prestressing/test_anchorageLoss_prestress_tendon_04.py
 python tests/materials/prestressing/test_loss_prestress_units_01.py
+python tests/materials/prestressing/test_prestress_tendon_family.py
 
 echo "$BLEU" "  Other materials tests." "$NORMAL"
 python tests/materials/test_elastomeric_bearing_stiffness.py
 python tests/materials/test_anchor_bolt01.py
+python tests/materials/test_anchor_group_checking_01.py
 python tests/materials/test_compound_section.py
 python tests/materials/ehe/test_creep_01.py
 python tests/materials/ehe/test_creep_02.py
@@ -563,6 +590,7 @@ python tests/rough_calculations/test_predim_diaphragm_wall.py
 #Postprocess tests
 echo "$BLEU" "Verifiying routines for post processing." "$NORMAL"
 python tests/postprocess/test_export_shell_internal_forces.py
+python tests/postprocess/test_comb_envelope_recorder.py
 echo "$BLEU" "  limit state checking." "$NORMAL"
 python tests/postprocess/limit_state_checking/test_shell_normal_stresses_uls_checking.py
 python tests/postprocess/limit_state_checking/test_shear_uls_checking.py
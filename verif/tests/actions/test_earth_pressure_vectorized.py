@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+''' Check that the vectorized computation of the earth pressures 
+    (getPressures) gives the same values as the point by point 
+    computation (getPressure) and that the loads applied in bulk to a
+    set of shells and beams (appendLoadToCurrentLoadPattern) give the
+    same reactions as the loads applied element by element. Home made
+    test.
+'''
+
+from __future__ import division
+import math
+import numpy
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from solution import predefined_solutions
+from materials import typical_materials
+from actions.earth_pressure import earth_pressure
+
+phi= math.radians(30)
+Ka= math.tan(math.pi/4.0-phi/2.0)**2 # Rankine active pressure coefficient.
+gammaSoil= 20e3 #N/m3
+zGround= 0.0
+zWater= -4.0
+gammaWater= 10e3 #N/m3
+H= 8 #m
+
+zCoo= numpy.linspace(-H-1.0,1.0,101)
+
+earthPressure= earth_pressure.EarthPressureModel(Ka, zGround, gammaSoil, zWater, gammaWater)
+uniformLoad= earth_pressure.UniformLoadOnBackfill(Ka,10e3)
+stripLoad= earth_pressure.StripLoadOnBackfill(qLoad= 20e3, zLoad= zGround, distWall= 1.0, stripWidth= 2.0)
+lineLoad= earth_pressure.LineVerticalLoadOnBackfill(qLoad= 50e3, zLoad= zGround, distWall= 1.5)
+horizontalLoad= earth_pressure.HorizontalLoadOnBackfill(soilIntFi= 30, qLoad= 10e3, zLoad= zGround, distWall= 1.0, widthLoadArea= 2.0)
+horizontalLoad.setup()
+mononobeOkabe= earth_pressure.MononobeOkabePressureDistribution(zGround= zGround, gamma_soil= gammaSoil, H= H, kv= 0.11/2.0, kh= 0.11, psi= math.radians(90), phi= phi, delta_ad= 0.0, beta= 0.0, Kas= Ka)
+
+err= 0.0
+for pressureModel in [earthPressure, uniformLoad, stripLoad, lineLoad, horizontalLoad, mononobeOkabe]:
+  pressures= pressureModel.getPressures(zCoo)
+  pressuresRef= numpy.array([pressureModel.getPressure(z) for z in zCoo])
+  err+= numpy.linalg.norm(pressures-pressuresRef)/max(numpy.linalg.norm(pressuresRef),1.0)
+
+# Retaining wall (shells) and a column (beams) on the same set.
+B= 2.0 # Wall width.
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+wallMaterial= typical_materials.defElasticMembranePlateSection(preprocessor, "wallMaterial",30e9,0.2,0.0,0.3)
+sectionProperties= xc.CrossSectionProperties3d()
+sectionProperties.A= 0.09; sectionProperties.E= 30e9; sectionProperties.G= 12.5e9
+sectionProperties.Iz= 6.75e-4; sectionProperties.Iy= 6.75e-4; sectionProperties.J= 1.1e-3
+columnSection= typical_materials.defElasticSectionFromMechProp3d(preprocessor, "columnSection",sectionProperties)
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([1,0,0]))
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= "lin"
+elements.defaultMaterial= "columnSection"
+nodes.defaultTag= 1
+columnNodes= [nodes.newNodeXYZ(2*B,0.0,z) for z in numpy.linspace(-H,0.0,9)]
+columnElements= [elements.newElement("ElasticBeam3d",xc.ID([nA.tag,nB.tag])) for nA, nB in zip(columnNodes[:-1],columnNodes[1:])]
+
+nodes.newSeedNode()
+seedElemHandler= preprocessor.getElementHandler.seedElemHandler
+seedElemHandler.defaultMaterial= "wallMaterial"
+elem= seedElemHandler.newElement("ShellMITC4",xc.ID([0,0,0,0]))
+points= preprocessor.getMultiBlockTopology.getPoints
+pt= points.newPntIDPos3d(1,geom.Pos3d(0.0,0.0,-H))
+pt= points.newPntIDPos3d(2,geom.Pos3d(B,0.0,-H))
+pt= points.newPntIDPos3d(3,geom.Pos3d(B,0.0,0.0))
+pt= points.newPntIDPos3d(4,geom.Pos3d(0.0,0.0,0.0))
+surfaces= preprocessor.getMultiBlockTopology.getSurfaces
+surfaces.defaultTag= 1
+s= surfaces.newQuadSurfacePts(1,2,3,4)
+s.nDivI= 2
+s.nDivJ= 8
+wall= preprocessor.getSets.getSet("f1")
+wall.genMesh(xc.meshDir.I)
+
+supportedNodes= [n for n in wall.getNodes if(abs(n.getInitialPos3d.z+H)<1e-6)]+[columnNodes[0]]
+for n in supportedNodes:
+  modelSpace.fixNode000_000(n.tag)
+
+retainingSet= preprocessor.getSets.defSet("retainingSet")
+for e in wall.getElements:
+  retainingSet.getElements.append(e)
+for e in columnElements:
+  retainingSet.getElements.append(e)
+
+def appendLoadElementByElement(pressureModel, xcSet, vDir, iCoo= 2, delta= 0.0):
+  ''' Append the earth thrust element by element (reference values).'''
+  tanDelta= math.tan(delta)
+  tanVector= xc.Vector([vDir[2],vDir[1],-vDir[0]])
+  for e in xcSet.getElements:
+    presElem= pressureModel.getPressure(e.getCooCentroid(False)[iCoo])
+    if(presElem!=0.0):
+      e.vector3dUniformLoadGlobal(presElem*(vDir+tanDelta*tanVector))
+
+lPatterns= preprocessor.getLoadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+vDir= xc.Vector([0.0,1.0,0.0])
+delta= math.radians(20)
+for name in ['bulk','ref']:
+  lPatterns.newLoadPattern("default",name)
+  lPatterns.currentLoadPattern= name
+  for pressureModel in [earthPressure, stripLoad]:
+    if(name=='bulk'):
+      pressureModel.appendLoadToCurrentLoadPattern(retainingSet,vDir,iCoo= 2,delta= delta)
+    else:
+      appendLoadElementByElement(pressureModel,retainingSet,vDir,iCoo= 2,delta= delta)
+
+def getReactions(loadPatternName):
+  ''' Solve the load pattern and return the reactions.'''
+  preprocessor.resetLoadCase()
+  lPatterns.addToDomain(loadPatternName)
+  analysis= predefined_solutions.simple_static_linear(feProblem)
+  result= analysis.analyze(1)
+  nodes.calculateNodalReactions(True,1e-7)
+  retval= numpy.array([[n.getReaction[i] for i in range(6)] for n in supportedNodes])
+  return result, retval
+
+resultBulk, reactionsBulk= getReactions('bulk')
+resultRef, reactionsRef= getReactions('ref')
+ratio1= numpy.max(numpy.abs(reactionsBulk-reactionsRef))/numpy.max(numpy.abs(reactionsRef))
+# Both the shells and the beams are loaded.
+wallLoaded= (numpy.max(numpy.abs(reactionsRef[:-1,1]))>0.0)
+columnLoaded= (abs(reactionsRef[-1,1])>0.0)
+
+'''
+print 'err= ', err
+print 'ratio1= ', ratio1
+print 'wallLoaded= ', wallLoaded, ' columnLoaded= ', columnLoaded
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (err<1e-12) and (resultBulk==0) and (resultRef==0) and (ratio1<1e-10) and wallLoaded and columnLoaded:
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
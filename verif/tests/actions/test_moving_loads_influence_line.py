@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+''' Influence lines of the mid-span bending moment and deflection of
+    a simply supported beam and envelope of a two-axle train moving
+    over it (home made test).'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+from actions import moving_loads
+
+E= 210e9 # Elastic modulus (Pa)
+A= 53.8e-4 # Cross section area (m2)
+I= 8356e-8 # Cross section moment of inertia (m4)
+L= 10.0 # Span (m)
+NumDiv= 10
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+nodes.defaultTag= 1
+for i in range(0,NumDiv+1):
+  nodes.newNodeXY(i*L/NumDiv,0.0)
+
+lin= modelSpace.newLinearCrdTransf("lin")
+sectionProperties= xc.CrossSectionProperties2d()
+sectionProperties.A= A; sectionProperties.E= E; sectionProperties.G= E/2.6
+sectionProperties.I= I
+section= typical_materials.defElasticSectionFromMechProp2d(preprocessor, "section",sectionProperties)
+
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= "lin"
+elements.defaultMaterial= "section"
+elements.defaultTag= 1
+for i in range(1,NumDiv+1):
+  elements.newElement("ElasticBeam2d",xc.ID([i,i+1]))
+
+modelSpace.fixNode00F(1)
+modelSpace.fixNodeF0F(NumDiv+1)
+
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+
+midNode= nodes.getNode(NumDiv//2+1)
+midElem= elements.getElement(NumDiv//2)
+responses= [('M',moving_loads.getElementResponse(midElem,'getM2')),
+            ('uy',moving_loads.getNodeDispResponse(midNode,1))]
+loadedNodes= [nodes.getNode(i) for i in range(1,NumDiv+2)]
+inflLine= moving_loads.InfluenceLine(loadedNodes,xc.Vector([0,-1,0]),responses,geom.Pos3d(0,0,0),geom.Vector3d(1,0,0))
+
+solProc= predefined_solutions.SolutionProcedure()
+analysis= solProc.simpleStaticLinear(feProblem)
+inflLine.compute(preprocessor,analysis,solutionAlgorithm= solProc.solAlgo)
+# All the unit loads are solved with the same factorization.
+numFactorizations= solProc.solAlgo.numFactorizations
+
+# Two axles train.
+P= 100e3
+a= 2.0
+train= moving_loads.getTrainMovingLoad([[0.0,P],[a,P]])
+envelope= inflLine.sweep(train,-a,L,int(L+a)+1)
+
+iM= inflLine.getResponseIndex('M')
+iU= inflLine.getResponseIndex('uy')
+MMax= max(abs(envelope.getMaxValues()[iM]),abs(envelope.getMinValues()[iM]))
+MMaxTeor= P*(L-a)/2.0
+uMax= abs(envelope.getMinValues()[iU])
+x= (L-a)/2.0
+uMaxTeor= 2*P*x*(3*L**2-4*x**2)/(48*E*I)
+ratio1= abs(MMax-MMaxTeor)/MMaxTeor
+ratio2= abs(uMax-uMaxTeor)/uMaxTeor
+(uMin, sCrit)= envelope.getMin('uy')
+ratio3= abs(sCrit-x)
+
+'''
+print 'MMax= ', MMax/1e3, ' kN m MMaxTeor= ', MMaxTeor/1e3, ' kN m ratio1= ', ratio1
+print 'uMax= ', uMax*1e3, ' mm uMaxTeor= ', uMaxTeor*1e3, ' mm ratio2= ', ratio2
+print 'sCrit= ', sCrit, ' ratio3= ', ratio3
+print 'numFactorizations= ', numFactorizations
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ratio1<1e-10) and (ratio2<1e-6) and (ratio3<1e-10) and (numFactorizations==1):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
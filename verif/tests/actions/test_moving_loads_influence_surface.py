@@ -0,0 +1,125 @@
+# -*- coding: utf-8 -*-
+''' Influence surface of the deflection at the center of a simply
+    supported square plate. The ordinates must match the deflections
+    produced by a unit load on the center (Maxwell's reciprocity
+    theorem) and the envelope of a wheel load moving over the center
+    line must be reached at the center (home made test).'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) , Ana Ortega (AO_O) "
+__copyright__= "Copyright 2018, LCPT, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@ciccp.es, ana.ortega@ciccp.es "
+
+import numpy
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+from actions import moving_loads
+
+E= 30e9 # Elastic modulus (Pa)
+nu= 0.2 # Poisson's ratio
+thickness= 0.2 # Plate thickness (m)
+L= 4.0 # Plate side (m)
+NumDiv= 8
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+nodes.newSeedNode()
+plate= typical_materials.defElasticMembranePlateSection(preprocessor, "plate",E,nu,0.0,thickness)
+
+seedElemHandler= preprocessor.getElementHandler.seedElemHandler
+seedElemHandler.defaultMaterial= "plate"
+seedElemHandler.defaultTag= 1
+elem= seedElemHandler.newElement("ShellMITC4",xc.ID([0,0,0,0]))
+
+points= preprocessor.getMultiBlockTopology.getPoints
+pt= points.newPntIDPos3d(1,geom.Pos3d(0.0,0.0,0.0))
+pt= points.newPntIDPos3d(2,geom.Pos3d(L,0.0,0.0))
+pt= points.newPntIDPos3d(3,geom.Pos3d(L,L,0.0))
+pt= points.newPntIDPos3d(4,geom.Pos3d(0.0,L,0.0))
+surfaces= preprocessor.getMultiBlockTopology.getSurfaces
+surfaces.defaultTag= 1
+s= surfaces.newQuadSurfacePts(1,2,3,4)
+s.nDivI= NumDiv
+s.nDivJ= NumDiv
+
+f1= preprocessor.getSets.getSet("f1")
+f1.genMesh(xc.meshDir.I)
+
+# Simply supported edges.
+tol= 1e-6
+loadedNodes= list()
+centerNode= None
+for n in f1.getNodes:
+  pos= n.getInitialPos3d
+  if((abs(pos.x)<tol) or (abs(pos.x-L)<tol) or (abs(pos.y)<tol) or (abs(pos.y-L)<tol)):
+    modelSpace.fixNode000_FFF(n.tag)
+  if((abs(pos.x-L/2.0)<tol) and (abs(pos.y-L/2.0)<tol)):
+    centerNode= n
+  loadedNodes.append(n)
+
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+
+unitLoad= xc.Vector([0,0,-1,0,0,0])
+responses= [('w',moving_loads.getNodeDispResponse(centerNode,2))]
+inflSurface= moving_loads.InfluenceSurface(loadedNodes,unitLoad,responses,prismAxis= 'Z')
+
+solProc= predefined_solutions.SolutionProcedure()
+analysis= solProc.simpleStaticLinear(feProblem)
+ordinates= inflSurface.compute(preprocessor,analysis,solutionAlgorithm= solProc.solAlgo)
+numFactorizations= solProc.solAlgo.numFactorizations
+iW= inflSurface.getResponseIndex('w')
+
+# Deflections under a unit load on the center of the plate.
+lp0= lPatterns.newLoadPattern("default","0")
+lp0.newNodalLoad(centerNode.tag,unitLoad)
+lPatterns.addToDomain("0")
+result= analysis.analyze(1)
+w= numpy.array([n.getDisp[2] for n in loadedNodes])
+wCenter= centerNode.getDisp[2]
+ratio1= numpy.max(numpy.abs(ordinates[:,iW]-w))/abs(wCenter)
+
+# Linear interpolation between two neighbour nodes.
+h= L/NumDiv
+pA= [L/2.0,L/2.0]; pB= [L/2.0+h,L/2.0]
+eta= inflSurface.getOrdinates([pA,pB,[(pA[0]+pB[0])/2.0,pA[1]]])[:,iW]
+ratio2= abs(eta[2]-(eta[0]+eta[1])/2.0)/abs(wCenter)
+ratio3= abs(eta[0]-wCenter)/abs(wCenter)
+
+# Wheel load moving along the center line of the plate.
+P= 50e3
+wheel= moving_loads.MovingLoad([[0.0,0.0]],[P])
+envelope= inflSurface.sweep(wheel,geom.Pos2d(0.0,L/2.0),geom.Pos2d(L,L/2.0),2*NumDiv+1)
+(wMin, pCrit)= envelope.getMin('w')
+ratio4= abs(wMin-P*wCenter)/abs(P*wCenter)
+ratio5= abs(pCrit[0]-L/2.0)+abs(pCrit[1]-L/2.0)
+
+'''
+print 'wCenter= ', wCenter
+print 'ratio1= ', ratio1
+print 'ratio2= ', ratio2
+print 'ratio3= ', ratio3
+print 'wMin= ', wMin, ' pCrit= ', pCrit
+print 'ratio4= ', ratio4
+print 'ratio5= ', ratio5
+print 'numFactorizations= ', numFactorizations
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (result==0) and (ratio1<1e-8) and (ratio2<1e-10) and (ratio3<1e-10) and (ratio4<1e-10) and (ratio5<1e-10) and (numFactorizations==1):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+''' Removal of the load combinations that can't govern (home made test).'''
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+from actions import combinations as combs
+
+combContainer= combs.CombContainer()
+combContainer.ULS.perm.add('ELU01', '1.35*G')
+combContainer.ULS.perm.add('ELU02', '1.35*G+1.5*Q')
+combContainer.ULS.perm.add('ELU03', '1.35*G+0.75*Q') # between ELU01 and ELU02
+combContainer.ULS.perm.add('ELU04', '1.00*G+1.50*Q')
+combContainer.ULS.perm.add('ELU05', '1.2*G+1.5*Q') # between ELU02 and ELU04
+combContainer.ULS.acc.add('ELUA01', '1.0*G+1.0*A')
+
+removed= combContainer.ULS.pruneDominatedCombinations()
+ok1= (removed=={'Persistent or transient situations.':['ELU03','ELU05']})
+ok2= (sorted(combContainer.ULS.getNames())==['ELU01','ELU02','ELU04','ELUA01'])
+
+# Results of the elementary load cases (one component only).
+nonGoverning= combContainer.ULS.perm.getNonGoverningCombinations(['G','Q'],[[10.0],[5.0]])
+ok3= (nonGoverning==['ELU04'])
+
+# Products, parentheses and numbers without decimals.
+def sameFactors(expr, factors):
+  retval= combs.CombinationRecord('test',expr).getFactors()
+  return (sorted(retval.keys())==sorted(factors.keys())) and all(abs(retval[k]-factors[k])<1e-12 for k in factors)
+ok4= sameFactors('1.35*(G+Q)',{'G':1.35,'Q':1.35})
+ok4= ok4 and sameFactors('1.5*Q*0.6',{'Q':0.9})
+ok4= ok4 and sameFactors('1.*G',{'G':1.0})
+ok4= ok4 and sameFactors('1.35*G-(Q1+Q2)/2',{'G':1.35,'Q1':-0.5,'Q2':-0.5})
+
+# The factors of the combinations written in that way are taken
+# into account when pruning (ELU13 governs the minimum).
+situation= combs.SituationCombs('Persistent or transient situations.')
+situation.add('ELU11', '1.35*(G+Q)')
+situation.add('ELU12', '1.*G+1.5*Q*0.6')
+situation.add('ELU13', '1.*G')
+nonGoverning2= situation.getNonGoverningCombinations(['G','Q'],[[10.0],[5.0]])
+ok5= (nonGoverning2==['ELU12'])
+
+# Expressions that can't be parsed and load cases without results
+# raise an error.
+ok6= True
+for expr in ['1.35*G+', 'G*Q', '1.35*G $ 1.5*Q', '(G+Q']:
+  try:
+    combs.CombinationRecord('wrong',expr).getFactors()
+    ok6= False
+  except ValueError:
+    pass
+try:
+  situation.getNonGoverningCombinations(['G'],[[10.0]])
+  ok6= False
+except ValueError:
+  pass
+
+'''
+print 'removed= ', removed
+print 'nonGoverning= ', nonGoverning
+print 'ok4= ', ok4
+print 'nonGoverning2= ', nonGoverning2
+print 'ok6= ', ok6
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ok1 and ok2 and ok3 and ok4 and ok5 and ok6):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,121 @@
+# -*- coding: utf-8 -*-
+''' Reactions and soil pressures under a slab resting on a Winkler
+    elastic foundation for several load combinations (home made test).'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2018, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+from model.boundary_cond import spring_bound_cond
+
+E= 30e9 # Elastic modulus (Pa)
+nu= 0.2 # Poisson's ratio
+thickness= 0.5 # Slab thickness (m)
+Lx= 4.0 # Slab dimensions (m)
+Ly= 3.0
+q= 10e3 # Uniform load (N/m2)
+P= 100e3 # Point load (N)
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+nodes.newSeedNode()
+slabSection= typical_materials.defElasticMembranePlateSection(preprocessor, "slabSection",E,nu,0.0,thickness)
+seedElemHandler= preprocessor.getElementHandler.seedElemHandler
+seedElemHandler.defaultMaterial= "slabSection"
+seedElemHandler.defaultTag= 1
+elem= seedElemHandler.newElement("ShellMITC4",xc.ID([0,0,0,0]))
+
+points= preprocessor.getMultiBlockTopology.getPoints
+pt= points.newPntIDPos3d(1,geom.Pos3d(0.0,0.0,0.0))
+pt= points.newPntIDPos3d(2,geom.Pos3d(Lx,0.0,0.0))
+pt= points.newPntIDPos3d(3,geom.Pos3d(Lx,Ly,0.0))
+pt= points.newPntIDPos3d(4,geom.Pos3d(0.0,Ly,0.0))
+surfaces= preprocessor.getMultiBlockTopology.getSurfaces
+surfaces.defaultTag= 1
+s= surfaces.newQuadSurfacePts(1,2,3,4)
+s.nDivI= 8
+s.nDivJ= 6
+
+slab= preprocessor.getSets.getSet("f1")
+slab.genMesh(xc.meshDir.I)
+slabNodes= [n for n in slab.getNodes]
+
+# Winkler foundation.
+foundation= spring_bound_cond.ElasticFoundation(wModulus= 20e6,cRoz= 0.2)
+foundation.generateSprings(slab)
+
+# Loads definition
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+lpA= lPatterns.newLoadPattern("default","A")
+for n in slabNodes:
+  lpA.newNodalLoad(n.tag,xc.Vector([0,0,-q*n.getTributaryArea(),0,0,0]))
+loadedNode= slab.getNearestNode(geom.Pos3d(Lx/4.0,Ly/3.0,0.0))
+lpB= lPatterns.newLoadPattern("default","B")
+lpB.newNodalLoad(loadedNode.tag,xc.Vector([0,0,-P,0,0,0]))
+combs= loadHandler.getLoadCombinations
+comb= combs.newLoadCombination("ELU01","1.00*A")
+comb= combs.newLoadCombination("ELU02","1.35*A + 1.50*B")
+
+analysis= predefined_solutions.simple_static_linear(feProblem)
+results= foundation.calcPressuresForLoadCombinations(['ELU01','ELU02'],analysis)
+
+# Check equilibrium.
+import numpy as np
+areas= foundation.tributaryAreas
+c= np.dot(areas,foundation.springPositions)/areas.sum()
+W1= q*Lx*Ly
+(forces, pressures, resultant)= results['ELU01']
+ratio1= abs(resultant.getResultant().z-W1)/W1
+ratio2= abs(np.dot(pressures[:,2],areas)-W1)/W1
+W2= 1.35*W1+1.5*P
+(forces, pressures, resultant)= results['ELU02']
+ratio3= abs(resultant.getResultant().z-W2)/W2
+pos= loadedNode.getInitialPos3d
+loadMoment= np.cross(np.array([pos.x,pos.y,pos.z])-c,np.array([0.0,0.0,-1.5*P]))
+reactionMoment= np.cross(foundation.springPositions-c,forces).sum(axis=0)
+ratio4= np.linalg.norm(reactionMoment+loadMoment)/np.linalg.norm(loadMoment)
+# Pressures are greater below the point load.
+iLoaded= [e.getNodes[1].tag for e in foundation.springs].index(loadedNode.tag)
+ratio5= pressures[iLoaded,2]-pressures[:,2].mean()
+# Vertical stiffness of each spring (last combination solved: ELU02).
+uz= np.array([abs(e.getNodes[1].getDisp[2]) for e in foundation.springs])
+ratio6= np.max(np.abs(np.abs(forces[:,2])-foundation.wModulus*areas*uz))/np.max(np.abs(forces[:,2]))
+# The forces obtained in a single call are those of each spring.
+springForces= np.array([[e.getResistingForce()[i] for i in range(3)] for e in foundation.springs])
+forcesOk= (springForces==forces).all()
+# One spring for each node with all the DOFs of its new node fixed.
+numSpringsOk= (len(foundation.springs)==len(slabNodes)) and (preprocessor.getBoundaryCondHandler.getNumSPs==6*len(slabNodes))
+
+''' 
+print 'ratio1= ', ratio1
+print 'ratio2= ', ratio2
+print 'ratio3= ', ratio3
+print 'ratio4= ', ratio4
+print 'ratio5= ', ratio5
+print 'ratio6= ', ratio6
+print 'numSpringsOk= ', numSpringsOk
+print 'forcesOk= ', forcesOk
+   '''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ratio1<1e-8) & (ratio2<1e-8) & (ratio3<1e-8) & (ratio4<1e-6) & (ratio5>0.0) & (ratio6<1e-8) & numSpringsOk & forcesOk:
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+''' Check that the stiffness matrix stored by the elastic beam elements
+    is updated when the section properties or the node
+    coordinates change. Home made test.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2018, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+
+# Material properties
+E= 2.1e6*9.81/1e-4 # Elastic modulus (Pa)
+nu= 0.3 # Poisson's ratio
+G= E/(2*(1+nu)) # Shear modulus
+
+# Cross section properties (IPE-80)
+A= 7.64e-4 # Cross section area (m2)
+Iy= 80.1e-8 # Cross section moment of inertia (m4)
+Iz= 8.49e-8 # Cross section moment of inertia (m4)
+J= 0.721e-8 # Cross section torsion constant (m4)
+
+# Geometry
+L= 1.5 # Bar length (m)
+
+# Load
+F= 1.5e3 # Load magnitude (kN)
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+# Problem type
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+nodes.defaultTag= 1 #First node number.
+nodes.newNodeXYZ(0,0.0,0.0)
+nodes.newNodeXYZ(L,0.0,0.0)
+
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,0]))
+
+# Materials
+sectionProperties= xc.CrossSectionProperties3d()
+sectionProperties.A= A; sectionProperties.E= E; sectionProperties.G= G;
+sectionProperties.Iz= Iz; sectionProperties.Iy= Iy; sectionProperties.J= J
+section= typical_materials.defElasticSectionFromMechProp3d(preprocessor, "section",sectionProperties)
+
+# Elements definition
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= "lin"
+elements.defaultMaterial= "section"
+elements.defaultTag= 1 #Tag for the next element.
+beam3d= elements.newElement("ElasticBeam3d",xc.ID([1,2]));
+
+modelSpace.fixNode000_000(1)
+
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+#Load modulation.
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+lp0= lPatterns.newLoadPattern("default","0")
+lp0.newNodalLoad(2,xc.Vector([0,-F,0,0,0,0]))
+#We add the load case to domain.
+lPatterns.addToDomain("0")
+
+dom= preprocessor.getDomain
+analisis= predefined_solutions.simple_static_linear(feProblem)
+
+def computeDeflection():
+  ''' Solve the problem from the initial state and return the
+      deflection of the free end.'''
+  dom.revertToStart()
+  result= analisis.analyze(1)
+  return nodes.getNode(2).getDisp[1]
+
+delta1= computeDeflection()
+delta2= computeDeflection() # Same stiffness.
+
+# Double the elastic modulus.
+newProperties= beam3d.sectionProperties
+newProperties.E= 2*E
+beam3d.sectionProperties= newProperties
+delta3= computeDeflection()
+
+# Move the free end (twice the length).
+trfs= preprocessor.getMultiBlockTopology.getGeometricTransformations
+scaling= trfs.newTransformation("scaling")
+scaling.setScaleFactor(2.0)
+preprocessor.getSets.getSet("total").transforms(scaling)
+delta4= computeDeflection()
+
+deltateor= (-F*L**3/(3*E*Iy))
+ratio1= abs(delta1-deltateor)/abs(deltateor)
+ratio2= abs(delta2-delta1)/abs(deltateor)
+ratio3= abs(delta3-deltateor/2.0)/abs(deltateor)
+ratio4= abs(delta4-4.0*deltateor)/abs(4.0*deltateor)
+
+'''
+print 'delta1= ', delta1, ' deltateor= ', deltateor, ' ratio1= ', ratio1
+print 'delta2= ', delta2, ' ratio2= ', ratio2
+print 'delta3= ', delta3, ' ratio3= ', ratio3
+print 'delta4= ', delta4, ' ratio4= ', ratio4
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ratio1<1e-5) & (ratio2<1e-12) & (ratio3<1e-5) & (ratio4<1e-5):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
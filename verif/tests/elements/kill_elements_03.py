@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+''' Staged construction: the DOFs of the dead nodes are masked by the
+    analysis model (ModelWrapper.maskDeadNodes) instead of being
+    constrained with a node locker (freezeDeadNodes), so the same
+    analysis is used for both stages without renumbering. The
+    displacements and reactions must be the same with both methods
+    and, when the factorization is reused (factorOnce), the tangent
+    must be formed again only when the masked DOFs change (not in
+    the following steps of the same stage). Home made test.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2018, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from solution import predefined_solutions
+from materials import typical_materials
+
+E= 2.1e9 # Young modulus of the steel.
+nu= 0.3 # Poisson's ratio.
+h= .1 # Thickness.
+L= 1.0 # Side length.
+I= 1/12.0*L*h**3 # Cross section moment of inertia (m4)
+dens= 1.33 # Density kg/m2.
+F= 1000 # Force
+
+class StagedModel(object):
+  ''' Two plates (same model as kill_elements_02.py) built dead and
+      revived in the second stage.'''
+  def __init__(self):
+    self.feProblem= xc.FEProblem()
+    preprocessor=  self.feProblem.getPreprocessor
+    self.nodes= preprocessor.getNodeHandler
+    modelSpace= predefined_spaces.StructuralMechanics3D(self.nodes)
+    self.nodes.defaultTag= 1 #First node number.
+    for z in [0.0,L]:
+      self.nodes.newNodeXYZ(0,0,z)
+      self.nodes.newNodeXYZ(L,0,z)
+      self.nodes.newNodeXYZ(L,L,z)
+      self.nodes.newNodeXYZ(0,L,z)
+    memb1= typical_materials.defElasticMembranePlateSection(preprocessor, "memb1",E,nu,dens,h)
+    elements= preprocessor.getElementHandler
+    elements.defaultMaterial= "memb1"
+    elem= elements.newElement("ShellMITC4",xc.ID([1,2,3,4]))
+    elem= elements.newElement("ShellMITC4",xc.ID([5,6,7,8]))
+    for tag in [1,4,5,8]:
+      modelSpace.fixNode000_000(tag)
+    self.setTotal= preprocessor.getSets.getSet("total")
+    self.setTotal.killElements() # deactivate the elements
+    self.mesh= self.feProblem.getDomain.getMesh
+    self.mesh.setDeadSRF(0.0)
+    lPatterns= preprocessor.getLoadHandler.getLoadPatterns
+    ts= lPatterns.newTimeSeries("constant_ts","ts")
+    lPatterns.currentTimeSeries= "ts"
+    lp0= lPatterns.newLoadPattern("default","0")
+    for tag in [2,3,6,7]:
+      lp0.newNodalLoad(tag,xc.Vector([F,0,F,0,0,0]))
+    lPatterns.addToDomain("0")
+
+  def getResults(self):
+    ''' Return the displacements and the reactions of the nodes.'''
+    self.nodes.calculateNodalReactions(True,1e-7)
+    retval= list()
+    for tag in range(1,9):
+      n= self.nodes.getNode(tag)
+      retval.extend([n.getDisp[i] for i in range(6)])
+      retval.extend([n.getReaction[i] for i in range(6)])
+    return retval
+
+# Dead nodes constrained by a node locker (renumbering between stages).
+frozen= StagedModel()
+frozen.mesh.freezeDeadNodes("bloquea") # Constraint inactive nodes.
+result= predefined_solutions.simple_static_linear(frozen.feProblem).analyze(1)
+frozenResults= [frozen.getResults()]
+frozen.setTotal.aliveElements()
+frozen.mesh.meltAliveNodes("bloquea") # Reactivate inactive nodes.
+analysis= predefined_solutions.simple_static_linear(frozen.feProblem)
+result+= analysis.analyze(1)
+frozenResults.append(frozen.getResults())
+result+= analysis.analyze(1) # Another step of the second stage.
+frozenResults.append(frozen.getResults())
+
+def analyzeMasked(factorOnce):
+  ''' Solve both stages with the DOFs of the dead nodes masked
+      using the same analysis.'''
+  model= StagedModel()
+  solution= predefined_solutions.SolutionProcedure()
+  analysis= solution.simpleStaticLinear(model.feProblem)
+  solution.sm.maskDeadNodes= True # Staged construction.
+  solution.solAlgo.factorOnce= factorOnce
+  res= analysis.analyze(1)
+  results= [model.getResults()]
+  model.setTotal.aliveElements()
+  res+= analysis.analyze(1) # Same analysis, no renumbering.
+  results.append(model.getResults())
+  res+= analysis.analyze(1) # Another step of the second stage.
+  results.append(model.getResults())
+  return res, results, solution.solAlgo.numFactorizations
+
+def getMaxDifference(valuesA, valuesB):
+  ''' Return the maximum difference between the values of
+      each step relative to the maximum value.'''
+  retval= 0.0
+  for stageA, stageB in zip(valuesA,valuesB):
+    maxValue= max([abs(v) for v in stageA])
+    retval= max(retval,max([abs(a-b) for a, b in zip(stageA,stageB)])/maxValue)
+  return retval
+
+resultMasked, maskedResults, numFactorizations= analyzeMasked(False)
+resultOnce, onceResults, numFactorizationsOnce= analyzeMasked(True)
+
+ratio1= getMaxDifference(maskedResults,frozenResults)
+ratio2= getMaxDifference(onceResults,frozenResults)
+# With factorOnce the tangent is formed again only when the masked
+# DOFs change (first step of each stage).
+factorizationsOk= (numFactorizations==3) and (numFactorizationsOnce==2)
+
+'''
+print "ratio1= ",ratio1
+print "ratio2= ",ratio2
+print "numFactorizations= ",numFactorizations, numFactorizationsOnce
+   '''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (result==0) and (resultMasked==0) and (resultOnce==0) and (ratio1<1e-10) and (ratio2<1e-10) and factorizationsOk:
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
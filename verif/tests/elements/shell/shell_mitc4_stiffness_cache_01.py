@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+''' Check that the stiffness matrix stored by the ShellMITC4 elements
+    is reused when the model doesn't change and computed again when
+    the nodes are moved: the deflection of the moved model must be
+    the same as the deflection of a model built with the new
+    geometry. Home made test.'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2018, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+
+E= 30e9 # Elastic modulus (Pa)
+nu= 0.2 # Poisson's ratio
+thickness= 0.2 # Plate thickness (m)
+L= 4.0 # Cantilever length (m)
+b= 1.0 # Cantilever width (m)
+P= 10e3 # Tip load (N)
+tol= 1e-6
+
+class PlateStrip(object):
+  ''' Cantilever plate strip loaded on its free edge.'''
+  def __init__(self, length, width):
+    self.feProblem= xc.FEProblem()
+    self.preprocessor=  self.feProblem.getPreprocessor
+    nodes= self.preprocessor.getNodeHandler
+    modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+    nodes.newSeedNode()
+    plate= typical_materials.defElasticMembranePlateSection(self.preprocessor, "plate",E,nu,0.0,thickness)
+    seedElemHandler= self.preprocessor.getElementHandler.seedElemHandler
+    seedElemHandler.defaultMaterial= "plate"
+    seedElemHandler.defaultTag= 1
+    elem= seedElemHandler.newElement("ShellMITC4",xc.ID([0,0,0,0]))
+    points= self.preprocessor.getMultiBlockTopology.getPoints
+    pt= points.newPntIDPos3d(1,geom.Pos3d(0.0,0.0,0.0))
+    pt= points.newPntIDPos3d(2,geom.Pos3d(length,0.0,0.0))
+    pt= points.newPntIDPos3d(3,geom.Pos3d(length,width,0.0))
+    pt= points.newPntIDPos3d(4,geom.Pos3d(0.0,width,0.0))
+    surfaces= self.preprocessor.getMultiBlockTopology.getSurfaces
+    surfaces.defaultTag= 1
+    s= surfaces.newQuadSurfacePts(1,2,3,4)
+    s.nDivI= 8
+    s.nDivJ= 2
+    f1= self.preprocessor.getSets.getSet("f1")
+    f1.genMesh(xc.meshDir.I)
+    self.tipNodes= list()
+    for n in f1.getNodes:
+      pos= n.getInitialPos3d
+      if(abs(pos.x)<tol):
+        modelSpace.fixNode000_000(n.tag)
+      elif(abs(pos.x-length)<tol):
+        self.tipNodes.append(n)
+    lPatterns= self.preprocessor.getLoadHandler.getLoadPatterns
+    ts= lPatterns.newTimeSeries("constant_ts","ts")
+    lPatterns.currentTimeSeries= "ts"
+    lp0= lPatterns.newLoadPattern("default","0")
+    for n in self.tipNodes:
+      lp0.newNodalLoad(n.tag,xc.Vector([0,0,-P/len(self.tipNodes),0,0,0]))
+    lPatterns.addToDomain("0")
+    self.analysis= predefined_solutions.simple_static_linear(self.feProblem)
+
+  def computeDeflection(self):
+    ''' Solve the problem from the initial state and return the
+        mean deflection of the free edge.'''
+    self.preprocessor.getDomain.revertToStart()
+    self.result= self.analysis.analyze(1)
+    return sum([n.getDisp[2] for n in self.tipNodes])/len(self.tipNodes)
+
+strip= PlateStrip(L,b)
+w1= strip.computeDeflection()
+w2= strip.computeDeflection() # Same stiffness.
+
+# Move the nodes (twice the length and the width).
+trfs= strip.preprocessor.getMultiBlockTopology.getGeometricTransformations
+scaling= trfs.newTransformation("scaling")
+scaling.setScaleFactor(2.0)
+strip.preprocessor.getSets.getSet("total").transforms(scaling)
+w3= strip.computeDeflection()
+
+# Model built with the new geometry.
+wRef= PlateStrip(2*L,2*b).computeDeflection()
+# Thin plate: the deflection is nearly four times the initial one.
+wTeor= -P*L**3/(3*E*b*thickness**3/12.0)
+
+ratio1= abs(w1-wTeor)/abs(wTeor)
+ratio2= abs(w2-w1)/abs(w1)
+ratio3= abs(w3-wRef)/abs(wRef)
+ratio4= abs(w3-4*w1)/abs(4*w1)
+
+'''
+print 'w1= ', w1, ' wTeor= ', wTeor, ' ratio1= ', ratio1
+print 'w2= ', w2, ' ratio2= ', ratio2
+print 'w3= ', w3, ' wRef= ', wRef, ' ratio3= ', ratio3
+print 'ratio4= ', ratio4
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (strip.result==0) and (ratio1<0.1) and (ratio2<1e-12) and (ratio3<1e-10) and (ratio4<0.05):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+''' Tributary areas of the nodes of a set of shell elements obtained as
+a vector. The values are computed again only when the nodes or the
+elements of the set or the mesh change (or when the cache is cleared).
+Home made test.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2015, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+NumDivI= 4
+NumDivJ= 4
+CooMaxX= 10
+CooMaxY= 2
+E= 2.1e11 # Elastic modulus.
+nu= 0.3 # Poisson's ratio
+thickness= 0.1 # Thickness.
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+nodes.newSeedNode()
+# Define materials
+nmb1= typical_materials.defElasticMembranePlateSection(preprocessor, "memb1",E,nu,0.0,thickness)
+
+seedElemHandler= preprocessor.getElementHandler.seedElemHandler
+seedElemHandler.defaultMaterial= "memb1"
+seedElemHandler.defaultTag= 1
+elem= seedElemHandler.newElement("ShellMITC4",xc.ID([0,0,0,0]))
+
+points= preprocessor.getMultiBlockTopology.getPoints
+pt= points.newPntIDPos3d(1,geom.Pos3d(0.0,0.0,0.0))
+pt= points.newPntIDPos3d(2,geom.Pos3d(CooMaxX,0.0,0.0))
+pt= points.newPntIDPos3d(3,geom.Pos3d(CooMaxX,CooMaxY,0.0))
+pt= points.newPntIDPos3d(4,geom.Pos3d(0.0,CooMaxY,0.0))
+surfaces= preprocessor.getMultiBlockTopology.getSurfaces
+surfaces.defaultTag= 1
+s= surfaces.newQuadSurfacePts(1,2,3,4)
+s.nDivI= NumDivI
+s.nDivJ= NumDivJ
+
+f1= preprocessor.getSets.getSet("f1")
+f1.genMesh(xc.meshDir.I)
+
+# Tributary areas of the set nodes sorted by tag.
+areas= f1.getTributaryAreas(True)
+tags= f1.getIdNodeTags()
+A= CooMaxX*CooMaxY
+ratio1= abs(sum(areas)-A)/A
+cornerArea= A/NumDivI/NumDivJ/4.0
+ratio2= abs(min(areas)-cornerArea)/cornerArea
+ratio3= abs(max(areas)-4*cornerArea)/cornerArea
+# The tributary areas of the nodes are updated too.
+ratio4= max([abs(nodes.getNode(t).getTributaryArea()-a) for t, a in zip(tags,areas)])
+
+# Same geometry: the memoized values are restored in the nodes.
+f1.resetTributaries()
+areas= f1.getTributaryAreas(True)
+ratio5= max([abs(nodes.getNode(t).getTributaryArea()-a) for t, a in zip(tags,areas)])
+
+# The geometry changes: the values are computed again.
+trfs= preprocessor.getMultiBlockTopology.getGeometricTransformations
+scaling= trfs.newTransformation("scaling")
+scaling.setScaleFactor(2.0)
+preprocessor.getSets.getSet("total").transforms(scaling)
+areas= f1.getTributaryAreas() # initialGeometry= True by default.
+ratio6= abs(sum(areas)-4*A)/A
+
+# The coordinates are modified directly: the memoized values are
+# returned until the cache is cleared.
+for n in f1.getNodes:
+  crd= n.getCoo
+  crd*= 0.5
+areasBefore= f1.getTributaryAreas()
+f1.clearTributaryCache()
+areasAfter= f1.getTributaryAreas()
+ratio8= abs(sum(areasBefore)-4*A)/A
+ratio9= abs(sum(areasAfter)-A)/A
+
+# Same elements, the nodes are added to the set afterwards: the
+# values must follow the new node tags.
+shells= preprocessor.getSets.defSet("shells")
+for e in f1.getElements:
+  shells.getElements.append(e)
+areasNoNodes= shells.getTributaryAreas(True)
+shells.fillDownwards()
+areas7= shells.getTributaryAreas(True)
+tags7= shells.getIdNodeTags()
+ratio7= max([abs(nodes.getNode(t).getTributaryArea()-a) for t, a in zip(tags7,areas7)])
+sizesOk= (len(areasNoNodes)==0) and (len(areas7)==len(tags7)) and (len(tags7)==(NumDivI+1)*(NumDivJ+1))
+
+'''
+print 'ratio1= ', ratio1
+print 'ratio2= ', ratio2
+print 'ratio3= ', ratio3
+print 'ratio4= ', ratio4
+print 'ratio5= ', ratio5
+print 'ratio6= ', ratio6
+print 'ratio7= ', ratio7
+print 'sizesOk= ', sizesOk
+print 'ratio8= ', ratio8
+print 'ratio9= ', ratio9
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (len(areas)==(NumDivI+1)*(NumDivJ+1)) and (ratio1<1e-10) and (ratio2<1e-10) and (ratio3<1e-10) and (ratio4<1e-12) and (ratio5<1e-12) and (ratio6<1e-10) and sizesOk and (ratio7<1e-12) and (ratio8<1e-10) and (ratio9<1e-10):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+''' Automatic sizing of the columns and the beam of a portal frame
+using the IPE shapes of the Arcelor catalogue (the class 4 shapes must
+be discarded). Home made test.'''
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2014, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+from materials.ec3 import EC3_materials
+from materials.ec3 import EC3_member_sizing
+from materials.sections.structural_shapes import arcelor_metric_shapes
+
+steel= EC3_materials.S275JR
+H= 4.0 # Column height.
+L= 8.0 # Beam span.
+NumDiv= 4 # Number of elements of the beam.
+w= 20e3 # Uniform load on the beam.
+F= 30e3 # Horizontal load.
+
+# Flexural buckling reduction factors of the whole catalogue against
+# the value computed for a single shape.
+HE= EC3_member_sizing.ShapeCatalogue(arcelor_metric_shapes.HE,EC3_materials.HEShape)
+chiY= EC3_member_sizing.getBucklingReductionFactors(HE,EC3_materials.S355JR,4.335,'c',HE.Iy)
+HEB340= arcelor_metric_shapes.HEShape(EC3_materials.S355JR,'HE_340_B')
+chiYTeor= HEB340.getBucklingReductionFactorY(4.335,'c',1)
+ratio1= abs(chiY[HE.getIndex('HE_340_B')]-chiYTeor)/chiYTeor
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+nodes.defaultTag= 1
+nodes.newNodeXY(0,0)
+for i in range(0,NumDiv+1):
+  nodes.newNodeXY(i*L/NumDiv,H)
+nodes.newNodeXY(L,0)
+
+lin= modelSpace.newLinearCrdTransf("lin")
+section= typical_materials.defElasticSection2d(preprocessor, "section",1e-3,steel.E,1e-6)
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= "lin"
+elements.defaultMaterial= "section"
+elements.defaultTag= 1
+columns= [elements.newElement("ElasticBeam2d",xc.ID([1,2])),elements.newElement("ElasticBeam2d",xc.ID([NumDiv+3,NumDiv+2]))]
+beams= list()
+for i in range(2,NumDiv+2):
+  beams.append(elements.newElement("ElasticBeam2d",xc.ID([i,i+1])))
+
+modelSpace.fixNode000(1)
+modelSpace.fixNode000(NumDiv+3)
+
+# Loads definition
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+lp0= lPatterns.newLoadPattern("default","0")
+eleLoad= lp0.newElementalLoad("beam2d_uniform_load")
+eleLoad.elementTags= xc.ID([e.tag for e in beams])
+eleLoad.transComponent= -w
+lp1= lPatterns.newLoadPattern("default","1")
+eleLoad= lp1.newElementalLoad("beam2d_uniform_load")
+eleLoad.elementTags= xc.ID([e.tag for e in beams])
+eleLoad.transComponent= -0.7*w
+lp1.newNodalLoad(2,xc.Vector([F,0,0]))
+
+# Member sizing.
+IPE= EC3_member_sizing.ShapeCatalogue(arcelor_metric_shapes.IPE,EC3_materials.IPEShape)
+groups= [EC3_member_sizing.MemberGroup('columns',columns,LeqY= H,LeqZ= 2*H),
+         EC3_member_sizing.MemberGroup('beam',beams,LeqY= L/2.0,LeqZ= L)]
+analysis= predefined_solutions.simple_static_linear(feProblem)
+sizing= EC3_member_sizing.SteelMemberSizing(preprocessor,steel,IPE,groups,['0','1'],analysis)
+converged= sizing.run()
+shapes= sizing.getShapeNames()
+efficiencies= sizing.getEfficiencies()
+feasible= (max(efficiencies.values())<=1.0)
+# The sections of the elements are those of the chosen shapes.
+ratio2= abs(beams[0].sectionProperties.I-arcelor_metric_shapes.IPE[shapes['beam']]['Iz'])/beams[0].sectionProperties.I
+# Slender webs under compression: IPE 600 is a class 4 section
+# (c/t= 514/12 > 42*epsilon) and is never chosen.
+sectionClasses= IPE.getSectionClasses(steel,True)
+ipe600Index= IPE.getIndex('IPE_600')
+class4Discarded= (sectionClasses[ipe600Index]==4) and (groups[0].getEfficiencies(IPE,steel)[ipe600Index]==float('inf'))
+chosenClassesOk= all(sectionClasses[IPE.getIndex(name)]<4 for name in shapes.values())
+
+'''
+print 'ratio1= ', ratio1
+print 'shapes: ', shapes
+print 'efficiencies: ', efficiencies
+print 'number of analyses: ', sizing.numAnalyses
+print 'weight: ', sizing.getTotalWeight(), ' kg'
+print 'ratio2= ', ratio2
+print 'class4Discarded= ', class4Discarded
+print 'chosenClassesOk= ', chosenClassesOk
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ratio1<1e-10) and converged and feasible and (ratio2<1e-12) and (sizing.numAnalyses>1) and class4Discarded and chosenClassesOk:
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
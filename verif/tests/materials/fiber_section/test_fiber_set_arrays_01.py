@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+''' Check that the bulk queries of the fiber sets (arrays of strains,
+    stresses, positions,... extreme values and tension/compression
+    partitions) give the same results that a loop over the fibers.
+    Home made test.'''
+
+from __future__ import division
+import xc_base
+import geom
+import xc
+import numpy
+from misc import scc3d_testing_bench
+from solution import predefined_solutions
+
+from materials.ehe import EHE_materials
+from materials.sections.fiber_section import fiber_sets
+from model import predefined_spaces
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2014, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+MzDato= 55.949206e3 # Bending moment.
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+# Materials definition
+reinfMatTag= EHE_materials.B500S.defDiagD(preprocessor)
+concr= EHE_materials.HA25
+concr.alfacc=0.85
+concreteTag= concr.defDiagD(preprocessor)
+
+import os
+pth= os.path.dirname(__file__)
+if(not pth):
+  pth= "."
+execfile(pth+"/concrete_section_01.py")
+secHA= preprocessor.getMaterialHandler.newMaterial("fiber_section_3d","secHA")
+fiberSectionRepr= secHA.getFiberSectionRepr()
+fiberSectionRepr.setGeomNamed("concreteSectionGeom01")
+secHA.setupFibers()
+
+scc3d_testing_bench.sectionModel(preprocessor, "secHA")
+
+# Constraints
+modelSpace= predefined_spaces.getStructuralMechanics3DSpace(preprocessor)
+modelSpace.fixNode000_000(1)
+modelSpace.fixNodeF00_00F(2)
+
+# Loads definition
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+lp0= lPatterns.newLoadPattern("default","0")
+lp0.newNodalLoad(2,xc.Vector([0,0,0,0,0,MzDato]))
+lPatterns.addToDomain("0")
+
+# Solution procedure
+analisis= predefined_solutions.simple_newton_raphson(feProblem)
+analOk= analisis.analyze(1)
+
+elements= preprocessor.getElementHandler
+scc= elements.getElement(1).getSection()
+fibers= scc.getFibers()
+setsRC= fiber_sets.fiberSectionSetupRCSets(scc,EHE_materials.HA25.matTagD,'concrete',EHE_materials.B500S.matTagD,"reinforcement")
+
+# Material selection.
+nConcr= 0
+nReinf= 0
+for f in fibers:
+  tag= f.getMaterial().tag
+  if(tag==EHE_materials.HA25.matTagD):
+    nConcr+= 1
+  elif(tag==EHE_materials.B500S.matTagD):
+    nReinf+= 1
+ok1= (nConcr==setsRC.concrFibers.fSet.getNumFibers()) and (nReinf==setsRC.reinfFibers.fSet.getNumFibers()) and (nReinf>0)
+
+# Arrays.
+arrays= fiber_sets.getFiberSetArrays(fibers)
+strains= [f.getMaterial().getStrain() for f in fibers]
+stresses= [f.getMaterial().getStress() for f in fibers]
+ys= [f.getLocY() for f in fibers]
+zs= [f.getLocZ() for f in fibers]
+tags= [f.getMaterial().tag for f in fibers]
+err= numpy.linalg.norm(arrays['strain']-numpy.array(strains))
+err+= numpy.linalg.norm(arrays['stress']-numpy.array(stresses))/1e6
+err+= numpy.linalg.norm(arrays['y']-numpy.array(ys))
+err+= numpy.linalg.norm(arrays['z']-numpy.array(zs))
+ok2= (err<1e-12) and (list(arrays['matTag'])==tags)
+ratio1= abs(arrays['area'].sum()-fibers.getArea(1.0))/fibers.getArea(1.0)
+
+# Extremes.
+fMin= setsRC.concrFibers.getFiberWithMinStrain()
+fMax= setsRC.reinfFibers.getFiberWithMaxStrain()
+concrStrains= setsRC.concrFibers.getArrays()['strain']
+ratio2= abs(fMin.getMaterial().getStrain()-concrStrains.min())
+ratio3= abs(fMax.getMaterial().getStrain()-setsRC.reinfFibers.fSet.getStrainMax())
+
+# Tension/compression partition.
+tensionFibers= setsRC.reselTensionFibers(scc,"tensionFibers")
+compressionFibers= fiber_sets.reselCompressionFibers(scc,"reinforcement","compressionFibers")
+nTension= 0
+nCompression= 0
+for f in setsRC.reinfFibers.fSet:
+  sg= f.getMaterial().getStress()
+  if(sg>0.0):
+    nTension+= 1
+  elif(sg<0.0):
+    nCompression+= 1
+ok3= (nTension==tensionFibers.getNumFibers()) and (nCompression==compressionFibers.getNumFibers()) and (nTension>0) and (nCompression>0)
+iMaxArea= fiber_sets.getIMaxPropFiber(tensionFibers,"getArea")
+ratio4= abs(tensionFibers[iMaxArea].getArea()-max(tensionFibers.getAreas()))
+
+'''
+print "ok1= ", ok1
+print "ok2= ", ok2, " err= ", err
+print "ratio1= ", ratio1
+print "ratio2= ", ratio2
+print "ratio3= ", ratio3
+print "nTension= ", nTension, " nCompression= ", nCompression
+print "ok3= ", ok3
+print "ratio4= ", ratio4
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if(ok1 and ok2 and ok3 and (ratio1<1e-12) and (ratio2<1e-15) and (ratio3<1e-15) and (ratio4<1e-15)):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+''' Moment-curvature diagram of a rectangular fiber section with an
+    elastic-perfectly plastic material computed directly on the
+    section (no finite element model). Home made test.'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2018, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import math
+import xc_base
+import geom
+import xc
+from materials.sections import section_properties
+from materials.sections import momentCurvatureDiagram
+from materials import typical_materials
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+
+# Rectangular cross-section definition
+b= 10 # Cross section width  [cm]
+h= 20 # Cross section depth [cm]
+scc10x20= section_properties.RectangularSection('scc10x20',b,h)
+scc10x20.nDivIJ= 32 # number of cells in IJ direction  
+scc10x20.nDivJK= 32 # number of cells in JK direction
+
+fy= 2600 # Yield stress of the material expressed in kp/cm2.
+E= 2.1e6 # Young modulus of the material en kp/cm2.
+
+# Materials definition
+epp= typical_materials.defElasticPPMaterial(preprocessor, "epp",E,fy,-fy)
+
+# Section geometry
+geomRectang= preprocessor.getMaterialHandler.newSectionGeometry("geomRectang")
+reg= scc10x20.getRegion(gm=geomRectang,nmbMat="epp")
+rectang= preprocessor.getMaterialHandler.newMaterial("fiber_section_3d","rectang")
+fiberSectionRepr= rectang.getFiberSectionRepr()
+fiberSectionRepr.setGeomNamed("geomRectang")
+rectang.setupFibers()
+
+# Bending about z axis without axial force.
+Me= scc10x20.getYieldMomentZ(fy)
+Mp= scc10x20.getPlasticMomentZ(fy)
+EI= E*scc10x20.Iz()
+kappaY= Me/EI
+diagZ= momentCurvatureDiagram.getSectionMomentCurvatureDiagram(rectang,0.0,20*kappaY,40)
+ratio1= abs(diagZ.M[1]-EI*diagZ.kappa[1])/(EI*diagZ.kappa[1]) # Elastic range.
+MpTeor= Mp*(1-(1/3.0)*(kappaY/diagZ.kappa[-1])**2)
+ratio2= abs(diagZ.M[-1]-MpTeor)/MpTeor # Plastic range.
+(kappaYield, MYield)= diagZ.getCrackingPoint(fy/E)
+ratio3= abs(kappaYield-kappaY)/kappaY
+ratio4= abs(MYield-Me)/Me
+
+# Bending about y axis under compression.
+N= -0.3*fy*scc10x20.A()
+EIy= E*scc10x20.Iy()
+diags= momentCurvatureDiagram.getMomentCurvatureDiagrams(preprocessor,['rectang'],[0.0,N],1e-5,10,theta= math.pi/2.0)
+diagY= diags[('rectang',N)]
+ratio5= abs(diagY.eps0[1]-N/(E*scc10x20.A()))/abs(N/(E*scc10x20.A()))
+ratio6= abs(diagY.M[1]-EIy*diagY.kappa[1])/(EIy*diagY.kappa[1])
+ratio7= abs(diagY.Mz[1])/abs(diagY.My[1])
+
+'''
+print 'ratio1= ', ratio1
+print 'M= ', diagZ.M[-1], ' MpTeor= ', MpTeor, ' ratio2= ', ratio2
+print 'kappaYield= ', kappaYield, ' kappaY= ', kappaY, ' ratio3= ', ratio3
+print 'MYield= ', MYield, ' Me= ', Me, ' ratio4= ', ratio4
+print 'ratio5= ', ratio5
+print 'ratio6= ', ratio6
+print 'ratio7= ', ratio7
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ratio1<1e-2) and (ratio2<1e-2) and (ratio3<1e-2) and (ratio4<1e-2) and (ratio5<1e-6) and (ratio6<1e-2) and (ratio7<1e-6) and diagZ.converged and (len(diags)==2):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
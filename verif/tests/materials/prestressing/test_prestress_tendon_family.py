@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+'''Test for checking the calculation of the losses of prestress of a
+family of tendons all at once. The results must be equal to those
+obtained tendon by tendon (see test_anchorageLoss_prestress_tendon_01.py).
+'''
+from __future__ import division
+__author__= "Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018, AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "ana.ortega@xcengineering.xyz"
+
+
+import numpy as np
+import math
+from materials.prestressing import prestressed_concrete as presconc
+from model.geometry import geom_utils
+
+#Geometry
+lBeam=20e3    #beam span [mm]
+eEnds=0         #eccentricity of cables at both ends of the beam
+eMidspan=[-558,-400,-250]   #eccentricity of cables at midspan
+angl_Parab_XZ=math.pi/4 #angle between the vertical plane that contains the
+                        #parabola and the plane XZ
+#Material
+Ep=195e3       #elastic modulus of prestressing steel [MPa]
+Ecm=34e3       #elastic modulus of concrete [MPa]
+#Prestressing process
+mu=0.25        #coefficient of friction between the cables and their sheating
+k=0.0017*1e-3  #wobble coefficient per millimeter length of cable
+sigmap0max=1239 #Initial stress of cable [MPa]
+deltaL=5            #anchorage draw-in (provided by manufacturer) [mm]
+sigmaCp=8.0    #stress in concrete at the level of the tendons [MPa]
+
+# Interpolation
+n_points_rough=5    #number of points provided to the interpolation algorithm
+n_points_fine=[101,81,121]   #number of points interpolated
+
+def getTendon(eMid,nPntsFine):
+    a,b,c=geom_utils.fit_parabola(x=np.array([0,lBeam/2.0,lBeam]), y=np.array([eEnds,eMid,eEnds]))
+    x_parab_rough,y_parab_rough,z_parab_rough=geom_utils.eq_points_parabola(0,lBeam,n_points_rough,a,b,c,angl_Parab_XZ)
+    tendon=presconc.PrestressTendon([])
+    tendon.roughCoordMtr=np.array([x_parab_rough,y_parab_rough,z_parab_rough])
+    tendon.pntsInterpTendon(nPntsFine,smoothness=1,kgrade=3)
+    return tendon
+
+# Tendon by tendon.
+individualTendons= list()
+for e, n in zip(eMidspan,n_points_fine):
+    tendon= getTendon(e,n)
+    tendon.calcLossFriction(coefFric=mu,k=k,sigmaP0_extr1=sigmap0max,sigmaP0_extr2=sigmap0max)
+    tendon.calcLossAnchor(Ep=Ep,anc_slip_extr1=deltaL,anc_slip_extr2=0.0)
+    individualTendons.append(tendon)
+
+# All at once.
+family= presconc.PrestressTendonFamily([getTendon(e,n) for e, n in zip(eMidspan,n_points_fine)])
+family.setupGeometry()
+family.calcLossFriction(coefFric=mu,k=k,sigmaP0_extr1=sigmap0max,sigmaP0_extr2=sigmap0max)
+family.calcLossAnchor(Ep=Ep,anc_slip_extr1=deltaL,anc_slip_extr2=0.0)
+family.calcLossElasticShortening(Ep=Ep,Ecm=Ecm,sigmaCp=sigmaCp)
+
+ratio1= 0.0 # friction losses.
+ratio2= 0.0 # length affected by the anchorage slip.
+ratio3= 0.0 # anchorage losses.
+for i, (t1, t2) in enumerate(zip(individualTendons,family.tendons)):
+    ratio1= max(ratio1,np.abs(t1.lossFriction-t2.lossFriction).max()/sigmap0max)
+    l1= t1.projXYcoordZeroAnchLoss[0]
+    l2= t2.projXYcoordZeroAnchLoss[0]
+    ratio2= max(ratio2,abs(l1-l2)/l1)
+    ratio3= max(ratio3,abs(t1.lossAnch[0]-family.getTendonValues(family.lossAnch,i)[0])/t1.lossAnch[0])
+
+n= len(eMidspan)
+lossElastShortTeor= (n-1)/(2.0*n)*Ep/Ecm*sigmaCp
+ratio4= np.abs(family.lossElastShort-lossElastShortTeor).max()/lossElastShortTeor
+ratio5= abs(len(family.getElementStresses(family.stressAfterLossElastShort))-(sum(n_points_fine)-n))
+
+'''
+print 'ratio1= ', ratio1
+print 'ratio2= ', ratio2
+print 'ratio3= ', ratio3
+print 'ratio4= ', ratio4
+print 'ratio5= ', ratio5
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ratio1<1e-10) and (ratio2<1e-2) and (ratio3<1e-2) and (ratio4<1e-10) and (ratio5==0):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+''' Check the shape catalogues loaded on demand and the
+range queries answered with their property indexes.'''
+
+from materials.sections.structural_shapes import aisc_metric_shapes
+from materials.sections.structural_shapes import arcelor_metric_shapes
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2018, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+IPE= arcelor_metric_shapes.IPE
+# The table is not read until it's needed.
+notLoaded= not IPE.isLoaded()
+ipe300= IPE['IPE_300']
+loaded= IPE.isLoaded()
+ratio1= abs(ipe300['G']-ipe300['E']/(2*(1+ipe300['nu'])))/ipe300['G']
+ratio2= abs(ipe300['alpha']-ipe300['Avy']/ipe300['A'])
+
+# All the IPE with Wzpl >= 600 cm3 sorted by weight.
+WzplMin= 600e-6
+candidates= IPE.getShapesInRange('Wzpl', minValue= WzplMin)
+bruteForce= sorted([n for n in IPE if IPE[n]['Wzpl']>=WzplMin], key= lambda n: IPE[n]['P'])
+lightest= IPE.getLightestShape('Wzpl', WzplMin)
+
+# Closed interval of the AISC W shapes.
+W= aisc_metric_shapes.W
+Amin= 100e-4; Amax= 150e-4
+wInRange= W.getShapesInRange('A', minValue= Amin, maxValue= Amax, sortBy= None)
+wBruteForce= sorted([n for n in W if Amin<=W[n]['A']<=Amax], key= lambda n: (W[n]['A'],n))
+
+# A new shape must appear in the queries.
+HE= arcelor_metric_shapes.HE
+numHE= len(HE)
+fake= dict(HE['HE_400_B'])
+fake['Wzpl']= 1.0
+HE['HE_FAKE']= fake
+fakeFound= (HE.getShapesInRange('Wzpl', minValue= 0.5)==['HE_FAKE'])
+del HE['HE_FAKE']
+fakeRemoved= (HE.getShapesInRange('Wzpl', minValue= 0.5)==[]) and (len(HE)==numHE)
+
+'''
+print "notLoaded= ", notLoaded
+print "loaded= ", loaded
+print "ratio1= ", ratio1
+print "ratio2= ", ratio2
+print "candidates= ", candidates
+print "lightest= ", lightest
+print "len(wInRange)= ", len(wInRange)
+print "fakeFound= ", fakeFound
+print "fakeRemoved= ", fakeRemoved
+'''
+
+cumple= notLoaded and loaded and (ratio1<1e-12) and (ratio2<1e-12)
+cumple= cumple and (candidates==bruteForce) and (lightest=='IPE_300')
+cumple= cumple and (len(wInRange)>0) and (wInRange==wBruteForce)
+cumple= cumple and fakeFound and fakeRemoved
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if cumple:
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
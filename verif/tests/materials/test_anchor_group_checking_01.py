@@ -0,0 +1,116 @@
+# -*- coding: utf-8 -*-
+''' Checking of the anchor groups of several base plates under several
+load combinations at once according to EOTA TR029. The results are
+compared with those obtained with the functions that check a single
+anchor and with the closed form values for a group of four anchors.
+Home made test. '''
+
+from __future__ import division
+
+from materials.eota import EOTA_TR029_limit_state_checking as tr029
+from materials.eota import EOTA_TR029_anchor_group_checking as agc
+import math
+import geom
+import numpy
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2014, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+gammaMs= 1.4 # Partial safety factor for steel.
+gammaMsV= 1.25 # Partial safety factor for steel in shear.
+gammaMc= 2.1 # Partial safety factor for concrete.
+d= 25e-3 # Bar diameter.
+As= math.pi*(d/2.0)**2 # Bar area.
+fuk= 550e6 # Characteristic steel ultimate tensile strength (Pa).
+hEf= 210e-3 # Effective anchor depth.
+tauRk= 7.5e6 # Characteristic bond strength.
+tauRkUcr= 7.5e6 # Characteristic bond strength for non-cracked concrete.
+fckCube= 25e6 # Concrete compression strength measured on cubes.
+k1= 10.1 # Non-cracked concrete.
+
+# Single anchor 0.135 m from the edge of the support (see test_anchor_bolt01.py).
+single= agc.AnchorGroupLayout([geom.Pos2d(0,0)],d,As,fuk,hEf,tauRk,tauRkUcr,fckCube)
+# Four anchors far from the edges.
+s= 0.2
+four= agc.AnchorGroupLayout([geom.Pos2d(-s/2,-s/2),geom.Pos2d(s/2,-s/2),geom.Pos2d(s/2,s/2),geom.Pos2d(-s/2,s/2)],d,As,fuk,hEf,tauRk,tauRkUcr,fckCube)
+
+contours= [[-0.135,0.865,-1.0,1.0],[-2.0,2.0,-2.0,2.0]]
+h= [274e-3,1.0]
+checker= agc.AnchorGroupChecker([single,four],[0,1],contours,h,gammaMs= gammaMs, gammaMsV= gammaMsV, gammaMc= gammaMc)
+
+# Combinations: pure tension, bending about y and tension+shear.
+N= [[20e3,0.0,20e3],[100e3,0.0,100e3]]
+Vx= [[0.0,0.0,5e3],[0.0,0.0,10e3]]
+Vy= [[0.0]*3,[0.0]*3]
+Mx= [[0.0]*3,[0.0]*3]
+My= [[0.0,0.0,0.0],[0.0,20e3,0.0]]
+results= checker.check(N,Vx,Vy,Mx,My)
+
+# Single anchor resistances computed with the scalar functions.
+posAnc= geom.Pos2d(.135,0)
+contour= geom.Polygon2d()
+for x, y in [(0,-1),(1,-1),(1,1),(0,1)]:
+  contour.appendVertex(geom.Pos2d(x,y))
+C= contour.getRecubrimiento(posAnc)
+NRds= tr029.axialResistanceSteelFailure(As,fuk)/gammaMs
+plg= tr029.getA0pN(d,posAnc,hEf,tauRkUcr)
+A0pN= plg.getArea(); plg.clipUsingPolygon(contour)
+NRdp= tr029.axialInitialResistancePullOut(d,hEf,tauRk)/gammaMc*tr029.getFactor1N(C,tr029.getCcrNp(d,hEf,tauRkUcr))*tr029.getFactor2pN(A0pN,plg.getArea())
+plg= tr029.getA0cN(posAnc,hEf)
+A0cN= plg.getArea(); plg.clipUsingPolygon(contour)
+N0Rdc= tr029.axialInitialResistanceConeFailure(k1,fckCube,hEf)/gammaMc
+NRdc= N0Rdc*tr029.getFactor1N(C,tr029.getScrN(hEf)/2)*tr029.getFactor2cN(A0cN,plg.getArea())
+CcrSp= tr029.getCcrSpHiltiHY150(h[0],hEf)
+plg= tr029.getA0spN(posAnc,CcrSp)
+A0spN= plg.getArea(); plg.clipUsingPolygon(contour)
+NRdSp= N0Rdc*tr029.getFactor1N(C,CcrSp)*tr029.getFactor2spN(A0spN,plg.getArea())
+
+ratio1= 0.0
+for mode, NRd in zip(['steel tension','pull-out','concrete cone','splitting'],[NRds,NRdp,NRdc,NRdSp]):
+  ratio1= max(ratio1,abs(results.getModeUtilization(mode)[0,0]-20e3/NRd)/(20e3/NRd))
+
+# Four anchors group.
+scrN= tr029.getScrN(hEf)
+NRds= tr029.axialResistanceSteelFailure(As,fuk)/gammaMs
+NRdc1= N0Rdc*(scrN+s)**2/scrN**2 # Concentric tension.
+NRdc2= N0Rdc*scrN*(scrN+s)/scrN**2 # Two anchors in tension.
+VRds= tr029.shearResistanceWithoutLeverArm(As,fuk)/gammaMsV
+ratio2= abs(results.getModeUtilization('steel tension')[1,0]-25e3/NRds)/(25e3/NRds)
+ratio3= abs(results.getModeUtilization('concrete cone')[1,0]-100e3/NRdc1)/(100e3/NRdc1)
+Nt= 20e3*(s/2)/(4*(s/2)**2) # Tension in the anchors due to the moment.
+ratio4= abs(results.getModeUtilization('steel tension')[1,1]-Nt/NRds)/(Nt/NRds)
+ratio5= abs(results.getModeUtilization('concrete cone')[1,1]-2*Nt/NRdc2)/(2*Nt/NRdc2)
+ratio6= abs(results.getModeUtilization('steel shear')[1,2]-10e3/4/VRds)/(10e3/4/VRds)
+
+# The results don't depend on the other plates and combinations.
+ratio7= 0.0
+for i, (layout, cnt, hi) in enumerate(zip([single,four],contours,h)):
+  ch= agc.AnchorGroupChecker([layout],[0],[cnt],[hi],gammaMs= gammaMs, gammaMsV= gammaMsV, gammaMc= gammaMc)
+  for j in range(0,3):
+    r= ch.check(N[i][j],Vx[i][j],Vy[i][j],Mx[i][j],My[i][j])
+    ratio7= max(ratio7,numpy.max(numpy.abs(r.utilization[0,0]-results.utilization[i,j])))
+
+util, modes, combs= results.getGoverning()
+ratio8= numpy.max(numpy.abs(util-numpy.max(numpy.max(results.utilization,axis= 2),axis= 1)))
+
+'''
+print 'ratio1= ', ratio1
+print 'ratio2= ', ratio2
+print 'ratio3= ', ratio3
+print 'ratio4= ', ratio4
+print 'ratio5= ', ratio5
+print 'ratio6= ', ratio6
+print 'ratio7= ', ratio7
+print 'governing: ', util, modes, combs
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ratio1<1e-10) and (ratio2<1e-10) and (ratio3<1e-10) and (ratio4<1e-10) and (ratio5<1e-10) and (ratio6<1e-10) and (ratio7<1e-12) and (ratio8<1e-12):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+'''Envelope recorders over load combinations. The envelope must keep the
+extreme values of the previous combinations when the load case is reset
+before each one. Home made test.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2015, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+from postprocess import recorders
+
+# Material properties
+E= 2.1e6*9.81/1e-4 # Elastic modulus (Pa)
+nu= 0.3 # Poisson's ratio
+G= E/(2*(1+nu)) # Shear modulus
+
+# Cross section properties (IPE-80)
+A= 7.64e-4 # Cross section area (m2)
+Iz= 80.1e-8 # Cross section moment of inertia (m4)
+
+# Geometry
+L= 1.5 # Bar length (m)
+
+# Load
+F= 1.5e3 # Load magnitude (N)
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+# Problem type
+modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+nodes.defaultTag= 1 #First node number.
+nodes.newNodeXY(0,0.0)
+nodes.newNodeXY(L,0.0)
+
+lin= modelSpace.newLinearCrdTransf("lin")
+# Materials
+sectionProperties= xc.CrossSectionProperties2d()
+sectionProperties.A= A; sectionProperties.E= E; sectionProperties.G= G;
+sectionProperties.I= Iz; 
+section= typical_materials.defElasticSectionFromMechProp2d(preprocessor, "section",sectionProperties)
+
+# Elements definition
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= "lin"
+elements.defaultMaterial= "section"
+elements.defaultTag= 1 #Tag for the next element.
+beam2d= elements.newElement("ElasticBeam2d",xc.ID([1,2]));
+
+modelSpace.fixNode000(1)
+
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+#Load modulation.
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+lpA= lPatterns.newLoadPattern("default","A")
+lpA.newNodalLoad(2,xc.Vector([F,0,0])) # Axial load.
+lpB= lPatterns.newLoadPattern("default","B")
+lpB.newNodalLoad(2,xc.Vector([0,F,0])) # Transverse load.
+
+combs= loadHandler.getLoadCombinations
+combs.newLoadCombination("C1","1.0*A+1.5*B")
+combs.newLoadCombination("C2","-1.0*A+0.5*B")
+combs.newLoadCombination("C3","2.0*A-1.0*B")
+
+# Recorders
+xcTotalSet= preprocessor.getSets.getSet("total")
+nodeRecorder= recorders.installNodeEnvelopeRecorder(xcTotalSet.getNodes, response= 'disp', components= [0,1])
+elemRecorder= recorders.installElementEnvelopeRecorder(xcTotalSet.getElements, response= 'force')
+
+# Solution
+analisis= predefined_solutions.simple_static_linear(feProblem)
+results= list()
+for comb in ['C1','C2','C3']:
+  results.append(predefined_solutions.resuelveComb(preprocessor,comb,analisis,1))
+
+nodeEnvelope= recorders.getEnvelopeArrays(nodeRecorder)
+elemEnvelope= recorders.getEnvelopeArrays(elemRecorder)
+
+row= list(nodeEnvelope['tags']).index(2) # Row corresponding to node 2.
+uMaxTeor= 2.0*F*L/(E*A)
+uMinTeor= -F*L/(E*A)
+vMaxTeor= 1.5*F*L**3/(3*E*Iz)
+vMinTeor= -F*L**3/(3*E*Iz)
+ratio1= abs(nodeEnvelope['max'][row][0]-uMaxTeor)/uMaxTeor
+ratio2= abs(nodeEnvelope['min'][row][0]-uMinTeor)/abs(uMinTeor)
+ratio3= abs(nodeEnvelope['max'][row][1]-vMaxTeor)/vMaxTeor
+ratio4= abs(nodeEnvelope['min'][row][1]-vMinTeor)/abs(vMinTeor)
+combsOk= (nodeEnvelope['maxComb'][row][0]=='C3') and (nodeEnvelope['minComb'][row][0]=='C2') and (nodeEnvelope['maxComb'][row][1]=='C1') and (nodeEnvelope['absMaxComb'][row][1]=='C1')
+# Axial force at the back end of the element.
+NMaxTeor= 2.0*F
+ratio5= abs(elemEnvelope['absMax'][0][0]-NMaxTeor)/NMaxTeor
+combsOk= combsOk and (elemEnvelope['absMaxComb'][0][0]=='C3')
+
+# Clear the envelope explicitly.
+nodeRecorder.reset()
+results.append(predefined_solutions.resuelveComb(preprocessor,'C2',analisis,1))
+nodeEnvelope= recorders.getEnvelopeArrays(nodeRecorder)
+ratio6= abs(nodeEnvelope['max'][row][0]-uMinTeor)/abs(uMinTeor)
+combsOk= combsOk and (nodeEnvelope['maxComb'][row][0]=='C2')
+
+'''
+print 'uMax= ', nodeEnvelope['max'][row][0], ' uMaxTeor= ', uMaxTeor, ' ratio1= ', ratio1
+print 'uMin= ', nodeEnvelope['min'][row][0], ' uMinTeor= ', uMinTeor, ' ratio2= ', ratio2
+print 'vMax= ', nodeEnvelope['max'][row][1], ' vMaxTeor= ', vMaxTeor, ' ratio3= ', ratio3
+print 'vMin= ', nodeEnvelope['min'][row][1], ' vMinTeor= ', vMinTeor, ' ratio4= ', ratio4
+print 'NMax= ', elemEnvelope['absMax'][0][0], ' NMaxTeor= ', NMaxTeor, ' ratio5= ', ratio5
+print 'uMax after reset= ', nodeEnvelope['max'][row][0], ' ratio6= ', ratio6
+print 'combinations: ', nodeEnvelope['maxComb'], nodeEnvelope['minComb'], elemEnvelope['absMaxComb']
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if((ratio1<1e-10) & (ratio2<1e-10) & (ratio3<1e-10) & (ratio4<1e-10) & (ratio5<1e-10) & (ratio6<1e-10) & combsOk & (max(results)==0)):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
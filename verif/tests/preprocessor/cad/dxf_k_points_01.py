@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+''' The k-points obtained by melting close DXF points with a KD-tree and
+    the nearest k-point indexes must be the same as those obtained with
+    the previous algorithm (a search with cdist for each point). Home
+    made test.'''
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AOO)"
+__copyright__= "Copyright 2015, LCPT and AOO"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com" "anaOrtegaOrt@gmail.com"
+
+import random
+from scipy.spatial.distance import cdist
+from scipy.spatial import cKDTree
+from import_export import DxfReader
+
+threshold= 0.01
+
+# Points of the entities: clusters of points closer than the threshold
+# around the nodes of a grid (as the ends of the lines that meet at a
+# vertex) and some isolated points.
+random.seed(1234)
+points= list()
+for i in range(6):
+  for j in range(6):
+    for k in range(3):
+      numPoints= random.randint(1,4)
+      for n in range(numPoints):
+        points.append([i+random.uniform(-0.002,0.002),j+random.uniform(-0.002,0.002),k+random.uniform(-0.002,0.002)])
+for n in range(50):
+  points.append([random.uniform(0,5),random.uniform(0,5),random.uniform(0,2)])
+random.shuffle(points)
+
+# Previous algorithm.
+def getKPointsCdist(points, threshold):
+  retval= [points[0]]
+  for p in points:
+    nearestPoint= retval[cdist([p], retval).argmin()]
+    dist= cdist([p],[nearestPoint])[0][0]
+    if(dist>threshold):
+      retval.append(p)
+  return retval
+
+kPointsRef= getKPointsCdist(points,threshold)
+kPoints= DxfReader.getKPoints(points,threshold)
+ok1= (kPoints==kPointsRef)
+
+# Nearest k-point of each point.
+tree= cKDTree(kPoints)
+indexesRef= [int(cdist([p], kPointsRef).argmin()) for p in points]
+indexes= DxfReader.getIndexNearestPoints(tree,points)
+ok2= (indexes==indexesRef)
+
+# No k-points at all.
+ok3= (DxfReader.getKPoints([],threshold)==[])
+ok4= (DxfReader.getIndexNearestPoints(None,[[0.0,0.0,0.0],[1.0,0.0,0.0]])==[-1,-1])
+
+'''
+print 'number of points: ', len(points)
+print 'number of k-points: ', len(kPoints), len(kPointsRef)
+print 'ok1= ', ok1
+print 'ok2= ', ok2
+print 'ok3= ', ok3
+print 'ok4= ', ok4
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ok1 and ok2 and ok3 and ok4):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
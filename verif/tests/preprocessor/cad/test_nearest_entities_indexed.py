@@ -0,0 +1,75 @@
+# -*- coding: utf-8 -*-
+''' Nearest node and nearest element queries on a meshed surface
+    (single and batch forms). Home made test.'''
+
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+import math
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+
+CooMax= 10.0
+NumDiv= 20
+h= CooMax/NumDiv
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+nodes.newSeedNode()
+memb1= typical_materials.defElasticMembranePlateSection(preprocessor, "memb1",2.1e10,0.3,0.0,0.2)
+seedElemHandler= preprocessor.getElementHandler.seedElemHandler
+seedElemHandler.defaultMaterial= "memb1"
+elem= seedElemHandler.newElement("ShellMITC4",xc.ID([0,0,0,0]))
+
+points= preprocessor.getMultiBlockTopology.getPoints
+pt1= points.newPntFromPos3d(geom.Pos3d(0.0,0.0,0.0))
+pt2= points.newPntFromPos3d(geom.Pos3d(CooMax,0.0,0.0))
+pt3= points.newPntFromPos3d(geom.Pos3d(CooMax,CooMax,0.0))
+pt4= points.newPntFromPos3d(geom.Pos3d(0.0,CooMax,0.0))
+surfaces= preprocessor.getMultiBlockTopology.getSurfaces
+s= surfaces.newQuadSurfacePts(pt1.tag,pt2.tag,pt3.tag,pt4.tag)
+s.nDivI= NumDiv
+s.nDivJ= NumDiv
+s.genMesh(xc.meshDir.I)
+
+queryPoints= [geom.Pos3d(0.13+0.371*i,0.21+0.389*i,0.05) for i in range(0,25)]
+
+err= 0.0
+# Nearest nodes.
+nodeTags= s.getNearestNodeTags(queryPoints)
+for p, tag in zip(queryPoints,nodeTags):
+  n= s.getNearestNode(p)
+  pos= n.getInitialPos3d
+  err+= (n.tag-tag)**2
+  err+= (pos.x-round(p.x/h)*h)**2+(pos.y-round(p.y/h)*h)**2
+
+# Nearest elements.
+elemTags= s.getNearestElementTags(queryPoints)
+for p, tag in zip(queryPoints,elemTags):
+  e= s.getNearestElement(p)
+  c= e.getPosCentroid(True)
+  err+= (e.tag-tag)**2
+  err+= (c.x-(math.floor(p.x/h)+0.5)*h)**2+(c.y-(math.floor(p.y/h)+0.5)*h)**2
+err= math.sqrt(err)
+
+'''
+print 'err= ', err
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if(err<1e-10):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+'''Selection of nodes and elements using the KD tree of the set
+   containers (box, radius and orthogonal prism). Home made test.'''
+
+import xc_base
+import geom
+import xc
+from model import predefined_spaces
+from materials import typical_materials
+from miscUtils import LogMessages as lmsg
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor   
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics3D(nodes)
+nod0= nodes.newNodeXYZ(0.0,0.0,0.0)
+nod1= nodes.newNodeXYZ(0.5,0.5,0.5)
+nod2= nodes.newNodeXYZ(2.0,2.0,2.0)
+nod3= nodes.newNodeXYZ(3.0,3.0,3.0)
+
+# Geometric transformations
+lin= modelSpace.newLinearCrdTransf("lin",xc.Vector([0,1,1]))
+
+# Materials
+section= typical_materials.defElasticSection3d(preprocessor, "section",1,1,1,1,1,1)
+
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= "lin" # Coord. transformation.
+elements.defaultMaterial= "section"
+ele0= elements.newElement("ElasticBeam3d",xc.ID([nod0.tag,nod1.tag]))
+ele1= elements.newElement("ElasticBeam3d",xc.ID([nod2.tag,nod3.tag]))
+
+xcTotalSet= preprocessor.getSets.getSet('total')
+
+# Box.
+pMin= geom.Pos3d(-1.0,-1.0,-1.0)
+pMax= geom.Pos3d(1.0,1.0,1.0)
+nNodesBox= len(xcTotalSet.nodes.pickNodesInBox(pMin,pMax))
+nElementsBox= len(xcTotalSet.elements.pickElemsInBox(pMin,pMax))
+
+# Radius.
+center= geom.Pos3d(3.0,3.0,3.0)
+nNodesRadius= len(xcTotalSet.nodes.pickNodesWithinRadius(center,1.5))
+nElementsRadius= len(xcTotalSet.elements.pickElemsWithinRadius(center,1.5))
+
+# Orthogonal prism.
+prismBase= geom.Polygon2d()
+prismBase.appendVertex(geom.Pos2d(-1.0,-1.0))
+prismBase.appendVertex(geom.Pos2d(1.0,-1.0))
+prismBase.appendVertex(geom.Pos2d(1.0,1.0))
+prismBase.appendVertex(geom.Pos2d(-1.0,1.0))
+nNodesPrism= len(xcTotalSet.nodes.pickNodesInOrthoPrism(prismBase,'Z',0.0))
+nElementsPrism= len(xcTotalSet.elements.pickElemsInOrthoPrism(prismBase,'Z',0.0))
+
+# The KD tree must be emptied with the container.
+auxNodes= xcTotalSet.nodes.pickNodesInBox(pMin,pMax)
+auxNodes.clear()
+nNodesCleared= len(auxNodes.pickNodesInBox(pMin,pMax))
+
+ratio= (nNodesBox-2)**2+(nElementsBox-1)**2+(nNodesRadius-1)**2+(nElementsRadius-1)**2+(nNodesPrism-2)**2+(nElementsPrism-1)**2+nNodesCleared**2
+
+'''
+print nNodesBox, ' nodes inside box.'
+print nElementsBox, ' element(s) inside box.'
+print nNodesRadius, ' nodes inside sphere.'
+print nElementsRadius, ' element(s) inside sphere.'
+print nNodesPrism, ' nodes inside prism.'
+print nElementsPrism, ' element(s) inside prism.'
+print nNodesCleared, ' nodes after clear.'
+'''
+
+import os
+fname= os.path.basename(__file__)
+if (abs(ratio)<1e-15):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+''' Conciliation of the number of divisions of the lines of a grid
+    of quad surfaces (home made test).'''
+
+__author__= "Luis C. Pérez Tato (LCPT) and Ana Ortega (AO_O)"
+__copyright__= "Copyright 2018, LCPT and AO_O"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com ana.ortega.ort@gmail.com"
+
+import xc_base
+import geom
+import xc
+
+NumDivX= 30
+NumDivY= 20
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+points= preprocessor.getMultiBlockTopology.getPoints
+pts= dict()
+for i in range(0,NumDivX+1):
+  for j in range(0,NumDivY+1):
+    pts[(i,j)]= points.newPntFromPos3d(geom.Pos3d(i,j,0))
+
+surfaces= preprocessor.getMultiBlockTopology.getSurfaces
+quads= dict()
+for i in range(0,NumDivX):
+  for j in range(0,NumDivY):
+    s= surfaces.newQuadSurfacePts(pts[(i,j)].tag,pts[(i+1,j)].tag,pts[(i+1,j+1)].tag,pts[(i,j+1)].tag)
+    quads[(i,j)]= s
+
+for key in quads:
+  quads[key].nDivI= 1
+  quads[key].nDivJ= 1
+for i in range(0,NumDivX):
+  quads[(i,0)].nDivI= i+1
+for j in range(0,NumDivY):
+  quads[(0,j)].nDivJ= j+2
+
+numGroups= preprocessor.getMultiBlockTopology.conciliaNDivs()
+groups= preprocessor.getMultiBlockTopology.getHomologousSidesGroups()
+
+ok= (numGroups==NumDivX+NumDivY) and (len(groups)==numGroups)
+for key in quads:
+  s= quads[key]
+  ok= ok and (s.nDivI==key[0]+1) and (s.nDivJ==key[1]+2)
+
+'''
+print 'numGroups= ', numGroups
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if ok:
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
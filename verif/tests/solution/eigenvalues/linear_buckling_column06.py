@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# Tomado del example B46 del SOLVIA Verification Manual
+''' Linear buckling analysis of a column using the sparse shift-invert
+    eigen solver (sym_arpack_soe). The analysis is repeated with a
+    shift between the first two eigenvalues; the mode nearest the
+    shift must be the second one.'''
+from __future__ import division
+import xc_base
+import geom
+import xc
+
+from model import predefined_spaces
+from solution import predefined_solutions
+from materials import typical_materials
+import math
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2018, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+L= 4.0 # Column length in meters
+b= 0.2 # Cross section width in meters
+h= 0.2 # Cross section depth in meters
+A= b*h # Cross section area en m2
+I= 1/12.0*b*h**3 # Moment of inertia in m4
+E=30E9 # Elastic modulus en N/m2
+P= -100 # Carga vertical sobre la columna.
+
+NumDiv= 4
+
+def bucklingAnalysis(numModes, shift= 0.0):
+  ''' Compute the buckling modes of the column and return the result
+      of the analysis, the eigenvalues and the displacement of its top.
+
+  :param numModes: number of buckling modes to compute.
+  :param shift: the eigenvalues of the sym_arpack_soe nearest
+                to this value are computed.
+  '''
+  feProblem= xc.FEProblem()
+  preprocessor=  feProblem.getPreprocessor
+  nodes= preprocessor.getNodeHandler
+
+  # Problem type
+  modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+  # Materials definition
+  scc= typical_materials.defElasticSection2d(preprocessor, "scc",A,E,I)
+
+
+  nodes.newSeedNode()
+  # Geometric transformation(s)
+  lin= modelSpace.newPDeltaCrdTransf("lin")
+
+
+  # Seed element definition
+  seedElemHandler= preprocessor.getElementHandler.seedElemHandler
+  seedElemHandler.defaultMaterial= "scc"
+  seedElemHandler.defaultTransformation= "lin"
+  seedElemHandler.defaultTag= 1 #Number for the next element will be 1.
+  beam2d= seedElemHandler.newElement("ElasticBeam2d",xc.ID([0,0]))
+  beam2d.h= h
+  beam2d.rho= 0.0
+
+  points= preprocessor.getMultiBlockTopology.getPoints
+  pt= points.newPntIDPos3d(1,geom.Pos3d(0.0,0.0,0.0))
+  pt= points.newPntIDPos3d(2,geom.Pos3d(0.0,L,0.0))
+  lines= preprocessor.getMultiBlockTopology.getLines
+  lines.defaultTag= 1
+  l= lines.newLine(1,2)
+  l.nDiv= NumDiv
+
+
+  setTotal= preprocessor.getSets.getSet("total")
+  setTotal.genMesh(xc.meshDir.I)
+  # Constraints
+  constraints= preprocessor.getBoundaryCondHandler
+
+  #
+  spc= constraints.newSPConstraint(1,0,0.0) # Node 2,gdl 0 # Back end node.
+  spc= constraints.newSPConstraint(1,1,0.0) # Node 2,gdl 1
+  spc= constraints.newSPConstraint(2,0,0.0) # Node 2,gdl 0 # Front end node.
+
+  # Loads definition
+  loadHandler= preprocessor.getLoadHandler
+
+  lPatterns= loadHandler.getLoadPatterns
+
+  #Load modulation.
+  ts= lPatterns.newTimeSeries("constant_ts","ts")
+  lPatterns.currentTimeSeries= "ts"
+  #Load case definition
+  lp0= lPatterns.newLoadPattern("default","0")
+  lp0.newNodalLoad(2,xc.Vector([0,P,0]))
+
+  #We add the load case to domain.
+  lPatterns.addToDomain("0")
+
+
+  # Solution procedure
+  analysis= predefined_solutions.sparse_linear_buckling_analysis(feProblem,numModes,shift)
+  analOk= analysis.analyze(2)
+  eigenvalues= [analysis.getEigenvalue(i) for i in range(1,numModes+1)]
+  return analOk, eigenvalues, nodes.getNode(2).getDisp[1]
+
+analOk, eigenvalues, deltay= bucklingAnalysis(2)
+eig1= eigenvalues[0]
+eig2= eigenvalues[1]
+
+deltayTeor= P*L/(E*A)
+ratio1= deltay/deltayTeor
+blCalc= eig1*P
+blTeor= -1*math.pi**2*E*I/(L**2)
+ratio2= (blCalc-blTeor)/blTeor
+
+# The system of equations solves the eigenproblem with
+# gamma= 1-1/lambda (see LinearBucklingEigenAnalysis::getEigenvalue)
+# so the shift is placed between the gammas of the first two modes,
+# nearer the second one: the mode nearest the shift is the second.
+# The tolerance of ratio3 takes into account the loss of precision
+# of lambda= 1/(1-gamma) when gamma is near 1.
+gamma1= 1.0-1.0/eig1
+gamma2= 1.0-1.0/eig2
+shift= gamma1+0.75*(gamma2-gamma1)
+analOkShift, shiftedEigenvalues, deltayShift= bucklingAnalysis(1,shift)
+ratio3= abs(shiftedEigenvalues[0]-eig2)/eig2
+
+''' 
+print "deltay= ",(deltay)
+print "deltayTeor= ",(deltayTeor)
+print "eig1= ",(eig1)
+print "ratio1= ",(ratio1)
+print "blCalc= ",(blCalc/1e6)," MN \n"
+print "blTeor= ",(blTeor/1e6)," MN \n"
+print "ratio2= ",(ratio2)
+print "eig2= ",eig2," shift= ",shift
+print "shiftedEigenvalues= ",shiftedEigenvalues
+print "ratio3= ",(ratio3)
+   '''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (analOk==0) & (analOkShift==0) & (abs(ratio1-1.0)<1e-5) & (abs(ratio2)<0.06) & (ratio3<1e-6):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
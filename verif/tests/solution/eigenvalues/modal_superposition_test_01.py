@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+''' Modal superposition time history analysis of the five storey shear
+building of modal_analysis_test_04.py under a constant ground
+acceleration. Once the free vibrations are damped out, the response must
+match the static response to the inertia forces. Home made test. '''
+from __future__ import division
+import xc_base
+import geom
+import xc
+
+from model import predefined_spaces
+from solution import predefined_solutions
+from materials import typical_materials
+from solution import modal_superposition
+import math
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2014, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+storeyMass= 134.4e3
+nodeMassMatrix= xc.Matrix([[storeyMass,0,0],
+                            [0,storeyMass,0],
+                            [0,0,0]])
+Ehorm= 200000*1e5 # Concrete elastic modulus.
+
+Bbaja= 0.45 # Columns size.
+Ibaja= 1/12.0*Bbaja**4 # Cross section moment of inertia.
+Hbaja= 4 # Altura de la planta baja.
+B1a= 0.40 # Columns size.
+I1a= 1/12.0*B1a**4 # Cross section moment of inertia.
+H= 3 # Altura del resto de plantas.
+B3a= 0.35 # Columns size.
+I3a= 1/12.0*B3a**4 # Cross section moment of inertia.
+
+
+kPlBaja= 20*12*Ehorm*Ibaja/(Hbaja**3)
+kPl1a= 20*12*Ehorm*I1a/(H**3)
+kPl2a= kPl1a
+kPl3a= 20*12*Ehorm*I3a/(H**3)
+kPl4a= kPl3a
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+nodes.defaultTag= 0; 
+nod= nodes.newNodeXY(0,0) 
+nod.mass= nodeMassMatrix
+nod.setProp("gdlsCoartados",xc.ID([0,1,2]))
+nod= nodes.newNodeXY(0,4)
+nod.mass= nodeMassMatrix
+nod.setProp("gdlsCoartados",xc.ID([1,2]))
+nod= nodes.newNodeXY(0,4+3)
+nod.mass= nodeMassMatrix
+nod.setProp("gdlsCoartados",xc.ID([1,2]))
+nod= nodes.newNodeXY(0,4+3+3)
+nod.mass= nodeMassMatrix
+nod.setProp("gdlsCoartados",xc.ID([1,2]))
+nod= nodes.newNodeXY(0,4+3+3+3)
+nod.mass= nodeMassMatrix
+nod.setProp("gdlsCoartados",xc.ID([1,2]))
+nod= nodes.newNodeXY(0,4+3+3+3+3)
+nod.mass= nodeMassMatrix
+nod.setProp("gdlsCoartados",xc.ID([1,2]))
+setTotal= preprocessor.getSets.getSet("total")
+nodes= setTotal.getNodes
+for n in nodes:
+  n.fix(n.getProp("gdlsCoartados"),xc.Vector([0,0,0]))
+
+# Materials definition
+sccPlBaja= typical_materials.defElasticSection2d(preprocessor, "sccPlBaja",20*Bbaja*Bbaja,Ehorm,20*Ibaja)
+sccPl1a= typical_materials.defElasticSection2d(preprocessor, "sccPl1a",20*B1a*B1a,Ehorm,20*I1a) 
+sccPl2a= typical_materials.defElasticSection2d(preprocessor, "sccPl2a",20*B1a*B1a,Ehorm,20*I1a) 
+sccPl3a= typical_materials.defElasticSection2d(preprocessor, "sccPl3a",20*B3a*B3a,Ehorm,20*I3a) 
+sccPl4a= typical_materials.defElasticSection2d(preprocessor, "sccPl4a",20*B3a*B3a,Ehorm,20*I3a)
+
+# Geometric transformation(s)
+lin= modelSpace.newLinearCrdTransf("lin")
+
+# Elements definition
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= "lin"
+elements.defaultMaterial= "sccPlBaja"
+elements.defaultTag= 1 #Tag for next element.
+beam2d= elements.newElement("ElasticBeam2d",xc.ID([0,1]))
+beam2d.h= Bbaja
+elements.defaultMaterial= "sccPl1a" 
+beam2d= elements.newElement("ElasticBeam2d",xc.ID([1,2]))
+beam2d.h= B1a
+elements.defaultMaterial= "sccPl2a" 
+beam2d= elements.newElement("ElasticBeam2d",xc.ID([2,3]))
+beam2d.h= B1a
+elements.defaultMaterial= "sccPl3a" 
+beam2d= elements.newElement("ElasticBeam2d",xc.ID([3,4]))
+beam2d.h= B3a
+elements.defaultMaterial= "sccPl4a" 
+beam2d= elements.newElement("ElasticBeam2d",xc.ID([4,5]))
+beam2d.h= B3a
+
+
+
+# Solution procedure
+solu= feProblem.getSoluProc
+solCtrl= solu.getSoluControl
+solModels= solCtrl.getModelWrapperContainer
+sm= solModels.newModelWrapper("sm")
+cHandler= sm.newConstraintHandler("transformation_constraint_handler")
+numberer= sm.newNumberer("default_numberer")
+numberer.useAlgorithm("rcm")
+analysisAggregations= solCtrl.getAnalysisAggregationContainer
+analysisAggregation= analysisAggregations.newAnalysisAggregation("analysisAggregation","sm")
+solAlgo= analysisAggregation.newSolutionAlgorithm("frequency_soln_algo")
+integ= analysisAggregation.newIntegrator("eigen_integrator",xc.Vector([1.0,1,1.0,1.0]))
+soe= analysisAggregation.newSystemOfEqn("band_arpack_soe")
+soe.shift= 0.0
+solver= soe.newSolver("band_arpack_solver")
+solver.tol= 1e-3
+solver.maxNumIter= 5
+#soe= buck.newSystemOfEqn("band_arpackpp_soe")
+#solver= soe.newSolver("band_arpackpp_solver")
+
+analysis= solu.newAnalysis("modal_analysis","analysisAggregation","")
+analOk= analysis.analyze(4)
+
+# Time history.
+ag= 1.0 # Ground acceleration (m/s2).
+dt= 0.01 # Time step.
+duration= 20.0
+zeta= 0.2
+accelerations= [ag]*(int(duration/dt)+1)
+msp= modal_superposition.ModalSuperposition(setTotal.getNodes,analysis,4,zeta)
+msp.solveGroundMotion(accelerations,dt,[1,0,0])
+nodes= preprocessor.getNodeHandler
+topNode= nodes.getNode(5)
+topDisp= msp.getNodeDispHistories([topNode],0)
+uTop= topDisp.values[-1,0]
+
+# Static response to the inertia forces.
+storeyStiffnesses= [kPlBaja,kPl1a,kPl2a,kPl3a,kPl4a]
+uTopTeor= 0.0
+for i, k in enumerate(storeyStiffnesses):
+  uTopTeor-= (5-i)*storeyMass*ag/k
+
+# Element responses (base shear).
+smStatic= solModels.newModelWrapper("smStatic")
+cHandlerStatic= smStatic.newConstraintHandler("transformation_constraint_handler")
+numbererStatic= smStatic.newNumberer("default_numberer")
+numbererStatic.useAlgorithm("rcm")
+analysisAggregationStatic= analysisAggregations.newAnalysisAggregation("analysisAggregationStatic","smStatic")
+solAlgoStatic= analysisAggregationStatic.newSolutionAlgorithm("linear_soln_algo")
+integStatic= analysisAggregationStatic.newIntegrator("load_control_integrator",xc.Vector([]))
+soeStatic= analysisAggregationStatic.newSystemOfEqn("band_gen_lin_soe")
+solverStatic= soeStatic.newSolver("band_gen_lin_lapack_solver")
+staticAnalysis= solu.newAnalysis("static_analysis","analysisAggregationStatic","")
+
+lPatterns= preprocessor.getLoadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+elements= preprocessor.getElementHandler
+baseColumn= elements.getElement(1)
+def baseShear():
+  baseColumn.getResistingForce()
+  return baseColumn.getV1
+msp.computeModalResponses(preprocessor,staticAnalysis,[('V',baseShear)])
+VBase= abs(msp.getResponseHistories().getHistory('V')[-1])
+VBaseTeor= 5*storeyMass*ag
+
+ratio1= abs(uTop-uTopTeor)/abs(uTopTeor)
+ratio2= abs(VBase-VBaseTeor)/VBaseTeor
+ratio3= abs(topDisp.getMinValues()[0]/uTopTeor)
+
+'''
+print "uTop= ", uTop*1e3, " mm uTopTeor= ", uTopTeor*1e3, " mm ratio1= ", ratio1
+print "VBase= ", VBase/1e3, " kN VBaseTeor= ", VBaseTeor/1e3, " kN ratio2= ", ratio2
+print "dynamic amplification: ", ratio3
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if((ratio1<1e-2) & (ratio2<1e-2) & (ratio3>1.0) & (ratio3<2.0)):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+# Tomado del example A47 del SOLVIA Verification Manual
+''' Eigenmodes of a cantilever computed using the sparse
+    shift-invert eigen solver (sym_arpack_soe). The modes are computed
+    again with a shift between the second and the third eigenvalues;
+    the modes nearest the shift must be the same.'''
+import xc_base
+import geom
+import xc
+
+from model import predefined_spaces
+from solution import predefined_solutions
+from materials import typical_materials
+import math
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2018, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+L= 1 # Cantilever length in meters
+b= 0.05 # Cross section width in meters
+h= 0.10 # Cross section depth in meters
+A= b*h # Cross section area en m2
+I= 1/12.0*b*h**3 # Moment of inertia in m4
+theta= math.radians(30)
+E=2.0E11 # Elastic modulus in N/m2
+dens= 7800 # Steel density in kg/m3
+m= A*dens
+
+NumDiv= 10
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+
+# Define materials
+scc= typical_materials.defElasticSection2d(preprocessor, "scc",A,E,I)
+
+
+nodes.newSeedNode()
+
+# Geometric transformation(s)
+lin= modelSpace.newLinearCrdTransf("lin")
+
+# Seed element definition
+seedElemHandler= preprocessor.getElementHandler.seedElemHandler
+seedElemHandler.defaultMaterial= "scc"
+seedElemHandler.defaultTransformation= "lin"
+seedElemHandler.defaultTag= 1 #Number for the next element will be 1.
+beam2d= seedElemHandler.newElement("ElasticBeam2d",xc.ID([0,0]))
+beam2d.h= h
+beam2d.rho= m
+
+
+points= preprocessor.getMultiBlockTopology.getPoints
+pt= points.newPntIDPos3d(1,geom.Pos3d(0.0,0.0,0.0))
+pt= points.newPntIDPos3d(2,geom.Pos3d(L*math.cos(theta),L*math.sin(theta),0.0))
+lines= preprocessor.getMultiBlockTopology.getLines
+lines.defaultTag= 1
+l= lines.newLine(1,2)
+l.nDiv= NumDiv
+
+
+# Constraints
+constraints= preprocessor.getBoundaryCondHandler
+
+#
+spc= constraints.newSPConstraint(1,0,0.0) # Node 2,gdl 0
+spc= constraints.newSPConstraint(1,1,0.0) # Node 2,gdl 1
+spc= constraints.newSPConstraint(1,2,0.0) # Node 2,gdl 2
+
+
+setTotal= preprocessor.getSets.getSet("total")
+setTotal.genMesh(xc.meshDir.I)
+
+# Solution procedure
+solution= predefined_solutions.SolutionProcedure()
+analysis= solution.sparseFrequencyAnalysis(feProblem)
+analOk= analysis.analyze(3)
+eig1= analysis.getEigenvalue(1)
+eig2= analysis.getEigenvalue(2)
+eig3= analysis.getEigenvalue(3)
+
+f1= math.sqrt(eig1)/(2*math.pi)
+f2= math.sqrt(eig2)/(2*math.pi)
+
+lambdaA= 1.87510407
+lambdaB= 4.69409113
+f1teor= lambdaA**2/(2*math.pi*L**2)*math.sqrt(E*I/m)
+f2teor= lambdaB**2/(2*math.pi*L**2)*math.sqrt(E*I/m)
+ratio1= abs(f1-f1teor)/f1teor
+ratio2= abs(f2-f2teor)/f2teor
+
+# Shift between the second and the third eigenvalues: the two
+# eigenvalues nearest the shift are the second and the third ones.
+solution.soe.shift= (eig2+eig3)/2.0
+analOk+= analysis.analyze(2)
+shiftedEigs= sorted([analysis.getEigenvalue(1),analysis.getEigenvalue(2)])
+ratio3= abs(shiftedEigs[0]-eig2)/eig2
+ratio4= abs(shiftedEigs[1]-eig3)/eig3
+
+''' 
+print "f1= ",f1," f1teor= ",f1teor," ratio1= ",ratio1
+print "f2= ",f2," f2teor= ",f2teor," ratio2= ",ratio2
+print "shift= ",solution.soe.shift," shiftedEigs= ",shiftedEigs
+print "ratio3= ",ratio3," ratio4= ",ratio4
+   '''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (analOk==0) & (abs(ratio1)<5e-3) & (abs(ratio2)<1e-2) & (ratio3<1e-8) & (ratio4<1e-8):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+''' Analysis of an undamped single degree of freedom system under a suite
+of two ground motion records (a harmonic one and a step), each one scaled
+by three factors. The peak drifts must match the closed-form solutions
+and only the step record scaled by 5 must produce the collapse. Home
+made test. '''
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2014, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from solution import ground_motion_suite
+from model import predefined_spaces
+from materials import typical_materials
+import math
+
+m= 1.0 # Mass.
+T= 1.0 # Natural period.
+omega= 2*math.pi/T
+k= m*omega**2 # Spring stiffness.
+L= 1.0 # Bar length.
+A= 1.0 # Bar area.
+
+class SDOFModel(ground_motion_suite.DynamicModel):
+    ''' Mass connected to the ground by a truss.'''
+    def build(self):
+        feProblem= xc.FEProblem()
+        preprocessor=  feProblem.getPreprocessor
+        nodes= preprocessor.getNodeHandler
+        modelSpace= predefined_spaces.SolidMechanics2D(nodes)
+        nodes.defaultTag= 1
+        nod1= nodes.newNodeXY(0.0,0.0)
+        nod2= nodes.newNodeXY(L,0.0)
+        nod2.mass= xc.Matrix([[m,0],[0,m]])
+        elast= typical_materials.defElasticMaterial(preprocessor, "elast",k*L/A)
+        elements= preprocessor.getElementHandler
+        elements.defaultMaterial= "elast"
+        elements.dimElem= 2
+        elements.defaultTag= 1
+        truss= elements.newElement("Truss",xc.ID([nod1.tag,nod2.tag]))
+        truss.area= A
+        constraints= preprocessor.getBoundaryCondHandler
+        constraints.newSPConstraint(nod1.tag,0,0.0)
+        constraints.newSPConstraint(nod1.tag,1,0.0)
+        constraints.newSPConstraint(nod2.tag,1,0.0)
+        return feProblem
+    def getStoreys(self, preprocessor):
+        nodes= preprocessor.getNodeHandler
+        return [(nodes.getNode(1),nodes.getNode(2),L)]
+    def getForceResponses(self, preprocessor):
+        truss= preprocessor.getElementHandler.getElement(1)
+        return [('N',lambda: truss.getN())]
+    def getAnalysis(self, feProblem):
+        solProc= predefined_solutions.SolutionProcedure()
+        return solProc.plainLinearNewmark(feProblem)
+
+dt= T/200.0
+ag= 1.0
+numSteps= 200
+Omega= 2*omega # Frequency of the harmonic record.
+sine= ground_motion_suite.AccelerationRecord('sine',[ag*math.sin(Omega*i*dt) for i in range(numSteps+1)],dt)
+step= ground_motion_suite.AccelerationRecord('step',[0.0]+[ag]*numSteps,dt)
+suite= ground_motion_suite.GroundMotionSuite(SDOFModel(dof= 0, collapseDrift= 0.2),[sine,step],[1.0,2.0,5.0])
+results= suite.run(2)
+sineRows= results.getRecordRows('sine')
+stepRows= results.getRecordRows('step')
+
+# Harmonic record, starting at rest:
+# u(t)= ag/(omega**2-Omega**2)*(Omega/omega*sin(omega*t)-sin(Omega*t))
+# with Omega= 2*omega the peak is reached at t= T/3 and its
+# value is sqrt(3)/2*ag/omega**2.
+driftSineTeor= math.sqrt(3)/2.0*ag/omega**2/L
+ratio1= abs(sineRows[0]['maxDrift']-driftSineTeor)/driftSineTeor
+# Step record: u_max= 2*ag/omega**2.
+driftStepTeor= 2*ag/omega**2/L
+ratio2= abs(stepRows[0]['maxDrift']-driftStepTeor)/driftStepTeor
+# Linear response (IDA curve).
+factors, drifts= results.getIDACurve('sine')
+ratio3= abs(drifts[1]-2*drifts[0])/drifts[0]
+# Peak axial force.
+ratio4= abs(sineRows[0]['N']-k*L*sineRows[0]['maxDrift'])/sineRows[0]['N']
+# Collapse: 5*driftStepTeor > 0.2 > 5*driftSineTeor.
+collapseOk= (results.getCollapseFactor('step')==5.0) and (results.getCollapseFactor('sine') is None) and (results.getColumn('collapse')==[False,False,False,False,False,True])
+
+'''
+print 'sine drift: ', sineRows[0]['maxDrift'], ' driftSineTeor= ', driftSineTeor, ' ratio1= ', ratio1
+print 'step drift: ', stepRows[0]['maxDrift'], ' driftStepTeor= ', driftStepTeor, ' ratio2= ', ratio2
+print 'IDA curve: ', factors, drifts, ' ratio3= ', ratio3
+print 'ratio4= ', ratio4
+print 'collapse factors: ', results.getCollapseFactor('step'), results.getCollapseFactor('sine')
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (ratio1<1e-2) and (ratio2<1e-2) and (ratio3<1e-8) and (ratio4<1e-8) and collapseOk:
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,91 @@
+# -*- coding: utf-8 -*-
+''' Undamped single degree of freedom system under a ramp load solved
+with the linear algorithm and the Newmark integrator, forming and
+factoring the tangent only when the time step changes (factorOnce).
+Home made test. '''
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2014, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+import math
+
+m= 1.0 # Mass.
+T= 1.0 # Natural period.
+omega= 2*math.pi/T
+k= m*omega**2 # Spring stiffness.
+L= 1.0 # Bar length.
+A= 1.0 # Bar area.
+P= 1.0 # Load increment per time unit.
+
+# Problem type
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+
+modelSpace= predefined_spaces.SolidMechanics2D(nodes)
+nod1= nodes.newNodeXY(0.0,0.0)
+nod2= nodes.newNodeXY(L,0.0)
+nod2.mass= xc.Matrix([[m,0],[0,m]])
+
+# Materials definition
+elast= typical_materials.defElasticMaterial(preprocessor, "elast",k*L/A)
+
+# Elements definition
+elements= preprocessor.getElementHandler
+elements.defaultMaterial= "elast"
+elements.dimElem= 2 # Dimension of element space
+elements.defaultTag= 1 #Tag for the next element.
+truss= elements.newElement("Truss",xc.ID([nod1.tag,nod2.tag]));
+truss.area= A
+
+# Constraints
+constraints= preprocessor.getBoundaryCondHandler
+spc1= constraints.newSPConstraint(nod1.tag,0,0.0)
+spc2= constraints.newSPConstraint(nod1.tag,1,0.0)
+spc3= constraints.newSPConstraint(nod2.tag,1,0.0)
+
+# Loads definition
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("linear_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+lp0= lPatterns.newLoadPattern("default","0")
+lp0.newNodalLoad(nod2.tag,xc.Vector([P,0]))
+lPatterns.addToDomain("0")
+
+# Solution
+solProc= predefined_solutions.SolutionProcedure()
+analysis= solProc.plainLinearNewmark(feProblem)
+solProc.solAlgo.factorOnce= True
+dt= T/200.0
+result= analysis.analyze(150,dt) # Up to t= 0.75 T.
+result+= analysis.analyze(100,dt/2.0) # Up to t= 1.25 T (time step changes).
+
+t= 150*dt+100*dt/2.0
+u= nod2.getDisp[0]
+uTeor= P/k*(t-math.sin(omega*t)/omega)
+ratio1= abs(u-uTeor)/uTeor
+numFactorizations= solProc.solAlgo.numFactorizations
+
+'''
+print 'u= ', u, ' uTeor= ', uTeor, ' ratio1= ', ratio1
+print 'numFactorizations= ', numFactorizations
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (result==0) and (ratio1<1e-3) and (numFactorizations==2):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
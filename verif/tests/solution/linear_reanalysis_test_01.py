@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+''' Reanalysis of a cantilever whose members are modified after the
+first analysis. The linear algorithm reuses the factorization of the
+original model (factorOnce) and corrects the solution iteratively
+when the modification is small; when it is large the tangent is formed
+and factored again. Home made test. '''
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2014, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from model import predefined_spaces
+from materials import typical_materials
+
+E= 2.1e11 # Elastic modulus (Pa)
+A= 53.8e-4 # Cross section area (m2)
+I= 8356e-8 # Cross section moment of inertia (m4)
+L= 5.0 # Cantilever length (m)
+P= -10e3 # Tip load (N)
+NumDiv= 10
+
+def getTipDeflection(inertias):
+    ''' Tip deflection of the cantilever with piecewise constant
+        moment of inertia.'''
+    retval= 0.0
+    le= L/NumDiv
+    for i, Ii in enumerate(inertias):
+        a= L-i*le; b= L-(i+1)*le
+        retval+= (a**3-b**3)/3.0/(E*Ii)
+    return P*retval
+
+feProblem= xc.FEProblem()
+preprocessor=  feProblem.getPreprocessor
+nodes= preprocessor.getNodeHandler
+modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+nodes.defaultTag= 1
+for i in range(0,NumDiv+1):
+  nodes.newNodeXY(i*L/NumDiv,0.0)
+
+lin= modelSpace.newLinearCrdTransf("lin")
+sectionProperties= xc.CrossSectionProperties2d()
+sectionProperties.A= A; sectionProperties.E= E; sectionProperties.G= E/2.6
+sectionProperties.I= I
+section= typical_materials.defElasticSectionFromMechProp2d(preprocessor, "section",sectionProperties)
+
+elements= preprocessor.getElementHandler
+elements.defaultTransformation= "lin"
+elements.defaultMaterial= "section"
+elements.defaultTag= 1
+beams= list()
+for i in range(1,NumDiv+1):
+  beams.append(elements.newElement("ElasticBeam2d",xc.ID([i,i+1])))
+
+modelSpace.fixNode000(1)
+
+loadHandler= preprocessor.getLoadHandler
+lPatterns= loadHandler.getLoadPatterns
+ts= lPatterns.newTimeSeries("constant_ts","ts")
+lPatterns.currentTimeSeries= "ts"
+lp0= lPatterns.newLoadPattern("default","0")
+lp0.newNodalLoad(NumDiv+1,xc.Vector([0,P,0]))
+lPatterns.addToDomain("0")
+
+tipNode= nodes.getNode(NumDiv+1)
+inertias= [I]*NumDiv
+
+def setInertia(i, value):
+  ''' Modify the moment of inertia of the i-th element.'''
+  inertias[i]= value
+  sp= beams[i].sectionProperties
+  sp.I= value
+  beams[i].sectionProperties= sp
+
+solProc= predefined_solutions.SolutionProcedure()
+analysis= solProc.simpleStaticLinear(feProblem)
+solProc.solAlgo.factorOnce= True
+solProc.solAlgo.maxNumCorrections= 20
+solProc.solAlgo.correctionTol= 1e-10
+
+# Reference analysis.
+result= analysis.analyze(1)
+ratio1= abs(tipNode.getDisp[1]-getTipDeflection(inertias))/abs(getTipDeflection(inertias))
+
+# Small modification: corrections with the reference factorization.
+setInertia(0,1.1*I)
+result+= analysis.analyze(1)
+ratio2= abs(tipNode.getDisp[1]-getTipDeflection(inertias))/abs(getTipDeflection(inertias))
+numFactorizations2= solProc.solAlgo.numFactorizations
+numCorrections2= solProc.solAlgo.numCorrections
+
+# Large modification: the tangent is factored again.
+for i in range(0,NumDiv//2):
+  setInertia(i,100*I)
+result+= analysis.analyze(1)
+ratio3= abs(tipNode.getDisp[1]-getTipDeflection(inertias))/abs(getTipDeflection(inertias))
+numFactorizations3= solProc.solAlgo.numFactorizations
+
+'''
+print 'ratio1= ', ratio1
+print 'ratio2= ', ratio2, ' numFactorizations: ', numFactorizations2, ' numCorrections: ', numCorrections2
+print 'ratio3= ', ratio3, ' numFactorizations: ', numFactorizations3
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if (result==0) and (ratio1<1e-10) and (ratio2<1e-8) and (ratio3<1e-10) and (numFactorizations2==1) and (numCorrections2>0) and (numFactorizations3==2):
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+''' Monte Carlo estimation of the failure probabilities of a cantilever
+loaded by two normal random loads (limit states: tip deflection and
+moment at the fixed end). Both responses are linear in the loads, so the
+exact failure probabilities are known. The results must be the same (bit
+for bit) for any batch size and number of worker processes. Importance
+sampling around the design point must reach the target coefficient of
+variation with less realizations than crude Monte Carlo. Home made test. '''
+from __future__ import division
+
+__author__= "Luis C. Pérez Tato (LCPT)"
+__copyright__= "Copyright 2014, LCPT"
+__license__= "GPL"
+__version__= "3.0"
+__email__= "l.pereztato@gmail.com"
+
+import math
+import xc_base
+import geom
+import xc
+from solution import predefined_solutions
+from solution import sampling_analysis
+from model import predefined_spaces
+from materials import typical_materials
+
+E= 2.1e11 # Elastic modulus (Pa)
+A= 53.8e-4 # Cross section area (m2)
+I= 8356e-8 # Cross section moment of inertia (m4)
+L= 5.0 # Cantilever length (m)
+NumDiv= 4
+P1= sampling_analysis.NormalVariable(10e3,2e3) # Tip load (N).
+P2= sampling_analysis.NormalVariable(20e3,5e3) # Mid span load (N).
+
+# Tip deflection and fixed end moment for unit loads.
+c1= L**3/(3.0*E*I)
+a= L/2.0
+c2= a**2*(3.0*L-a)/(6.0*E*I)
+uMean= c1*P1.mean+c2*P2.mean
+uStdDev= math.sqrt((c1*P1.stdDev)**2+(c2*P2.stdDev)**2)
+MMean= L*P1.mean+a*P2.mean
+MStdDev= math.sqrt((L*P1.stdDev)**2+(a*P2.stdDev)**2)
+beta1= 1.645; beta2= 1.282
+uLim= uMean+beta1*uStdDev
+MLim= MMean+beta2*MStdDev
+pf1Teor= 0.5*math.erfc(beta1/math.sqrt(2.0))
+pf2Teor= 0.5*math.erfc(beta2/math.sqrt(2.0))
+
+class CantileverModel(sampling_analysis.SamplingModel):
+  ''' Cantilever with a random load on its tip and another one
+      on its mid span.'''
+  def build(self):
+    self.feProblem= xc.FEProblem()
+    preprocessor=  self.feProblem.getPreprocessor
+    nodes= preprocessor.getNodeHandler
+    modelSpace= predefined_spaces.StructuralMechanics2D(nodes)
+    nodes.defaultTag= 1
+    for i in range(0,NumDiv+1):
+      nodes.newNodeXY(i*L/NumDiv,0.0)
+    lin= modelSpace.newLinearCrdTransf("lin")
+    sectionProperties= xc.CrossSectionProperties2d()
+    sectionProperties.A= A; sectionProperties.E= E; sectionProperties.G= E/2.6
+    sectionProperties.I= I
+    section= typical_materials.defElasticSectionFromMechProp2d(preprocessor, "section",sectionProperties)
+    elements= preprocessor.getElementHandler
+    elements.defaultTransformation= "lin"
+    elements.defaultMaterial= "section"
+    elements.defaultTag= 1
+    for i in range(1,NumDiv+1):
+      elements.newElement("ElasticBeam2d",xc.ID([i,i+1]))
+    modelSpace.fixNode000(1)
+    lPatterns= preprocessor.getLoadHandler.getLoadPatterns
+    ts= lPatterns.newTimeSeries("constant_ts","ts")
+    lPatterns.currentTimeSeries= "ts"
+    self.loadPattern= lPatterns.newLoadPattern("default","0")
+    lPatterns.addToDomain("0")
+    self.solProc= predefined_solutions.SolutionProcedure()
+    self.analysis= self.solProc.simpleStaticLinear(self.feProblem)
+    self.solProc.solAlgo.factorOnce= True
+    self.tipNode= nodes.getNode(NumDiv+1)
+    self.midNode= nodes.getNode(NumDiv//2+1)
+    self.firstElement= elements.getElement(1)
+
+  def evaluate(self, x):
+    self.loadPattern.clearLoads()
+    self.loadPattern.newNodalLoad(self.tipNode.tag,xc.Vector([0,-x[0],0]))
+    self.loadPattern.newNodalLoad(self.midNode.tag,xc.Vector([0,-x[1],0]))
+    self.feProblem.getDomain.revertToStart()
+    if(self.analysis.analyze(1)!=0):
+      return None
+    self.firstElement.getResistingForce()
+    return [uLim-abs(self.tipNode.getDisp[1]), MLim-abs(self.firstElement.getM1)]
+
+model= CantileverModel([P1,P2], numLimitStateFunctions= 2)
+results= list()
+for batchSize, numWorkers in [(1,1),(7,2),(64,3)]:
+  sampling= sampling_analysis.SamplingAnalysis(model,numSimulations= 5000,targetCOV= 0.15,seed= 1234,batchSize= batchSize)
+  results.append(sampling.run(numWorkers))
+
+# Same results whatever the batch size and the number of workers.
+ref= results[0]
+sameResults= True
+for r in results[1:]:
+  sameResults= sameResults and (r.numSimulations==ref.numSimulations) and (r.failureProbabilities==ref.failureProbabilities)
+  sameResults= sameResults and (r.gValues==ref.gValues) and (r.covs==ref.covs)
+# The analysis stops when the target coefficient of variation is reached.
+stopped= (ref.numSimulations<5000) and (max(ref.covs)<=0.15)
+# The estimates must agree with the exact failure probabilities.
+pf1, pf2= ref.failureProbabilities
+ratio1= abs(pf1-pf1Teor)/pf1Teor/ref.covs[0]
+ratio2= abs(pf2-pf2Teor)/pf2Teor/ref.covs[1]
+# A shorter analysis evaluates the same first realizations.
+short= sampling_analysis.SamplingAnalysis(model,numSimulations= 50,targetCOV= 0.0,seed= 1234,batchSize= 16).run(2)
+sameRealizations= (short.numSimulations==50)
+sameRealizations= sameRealizations and (short.gValues==ref.gValues[:50])
+
+# Importance sampling centred on the design point of the tip deflection
+# limit state (the responses are linear in the standard normal space).
+designPoint= [beta1*c1*P1.stdDev/uStdDev, beta1*c2*P2.stdDev/uStdDev]
+importance= sampling_analysis.SamplingAnalysis(model,numSimulations= 5000,targetCOV= 0.05,seed= 1234,batchSize= 64,samplingCentre= designPoint).run(2)
+isStopped= (importance.numSimulations<5000) and (max(importance.covs)<=0.05)
+pf1IS, pf2IS= importance.failureProbabilities
+ratio3= abs(pf1IS-pf1Teor)/pf1Teor/importance.covs[0]
+ratio4= abs(pf2IS-pf2Teor)/pf2Teor/importance.covs[1]
+# Crude Monte Carlo with the same number of realizations doesn't
+# reach the target.
+crude= sampling_analysis.SamplingAnalysis(model,numSimulations= importance.numSimulations,targetCOV= 0.05,seed= 1234,batchSize= 64).run(2)
+isBetter= (max(crude.covs)>0.05)
+
+'''
+print 'numSimulations= ', [r.numSimulations for r in results]
+print 'pf1= ', pf1, ' pf1Teor= ', pf1Teor, ' ratio1= ', ratio1
+print 'pf2= ', pf2, ' pf2Teor= ', pf2Teor, ' ratio2= ', ratio2
+print 'covs= ', ref.covs
+print 'sameResults= ', sameResults
+print 'stopped= ', stopped
+print 'sameRealizations= ', sameRealizations
+print 'importance sampling: ', importance.numSimulations, ' realizations, pf= ', importance.failureProbabilities, ' covs= ', importance.covs
+print 'ratio3= ', ratio3, ' ratio4= ', ratio4
+print 'crude Monte Carlo covs= ', crude.covs
+'''
+
+import os
+from miscUtils import LogMessages as lmsg
+fname= os.path.basename(__file__)
+if sameResults and stopped and (ratio1<4.0) and (ratio2<4.0) and sameRealizations and isStopped and (ratio3<4.0) and (ratio4<4.0) and isBetter:
+  print "test ",fname,": ok."
+else:
+  lmsg.error(fname+' ERROR.')